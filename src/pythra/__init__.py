@@ -1,5 +1,21 @@
-from .pythra import *
+from . import pythra as _pythra
 from .pythra import __version__ as ver
 
 # --- Package Version (Optional) ---
-__version__ = ver  # Example version
\ No newline at end of file
+__version__ = ver  # Example version
+
+# Re-export the toolkit lazily: `from .pythra import *` would resolve (and so
+# import) every name in `__all__`, Qt included. Names resolve on first access.
+__all__ = list(_pythra.__all__)
+
+
+def __getattr__(name):
+    if name in _pythra._LAZY_EXPORTS:
+        value = getattr(_pythra, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_pythra._LAZY_EXPORTS))
@@ -3,6 +3,11 @@
  *
  * It uses Pointer Events to handle mouse and touch统一. It disambiguates between
  * taps, double taps, long presses, and panning gestures.
+ *
+ * Pan updates are coalesced: at most one PanUpdate message per animation frame
+ * (or per `throttleMs`, when set) carries the latest dx/dy. Because dx/dy are
+ * measured from the pan start, that one message includes all movement since the
+ * previous one. The last update is always flushed before PanEnd.
  */
 export class PythraGestureDetector {
     constructor(elementId, options) {
@@ -22,12 +27,19 @@ export class PythraGestureDetector {
         this.panStartPoint = { x: 0, y: 0 };
         this.panThreshold = 5; // Pixels to move before a pan is detected
 
+        // --- Pan update coalescing ---
+        this.throttleMs = this.options.throttleMs || 0;
+        this.pendingPan = null;
+        this.lastSentAt = 0;
+        this.flushHandle = null;
+
         // --- Bind Handlers ---
         this.handlePointerDown = this.handlePointerDown.bind(this);
         this.handlePointerMove = this.handlePointerMove.bind(this);
         this.handlePointerUp = this.handlePointerUp.bind(this);
         this.fireTap = this.fireTap.bind(this);
         this.fireLongPress = this.fireLongPress.bind(this);
+        this.flushPan = this.flushPan.bind(this);
 
         // Attach the entry-point event listener
         this.element.addEventListener('pointerdown', this.handlePointerDown);
@@ -46,7 +58,7 @@ export class PythraGestureDetector {
             this.tapTimeout = null;
             this.lastTapTime = 0;
             if (this.options.onDoubleTapName) {
-                window.pywebview.on_gesture_event(this.options.onDoubleTapName, {});
+                this.emit(this.options.onDoubleTapName, 'gesture', {});
             }
             return;
         }
@@ -68,6 +80,8 @@ export class PythraGestureDetector {
         document.addEventListener('pointermove', this.handlePointerMove);
         document.addEventListener('pointerup', this.handlePointerUp);
         document.addEventListener('pointercancel', this.handlePointerUp); // Treat cancel like up
+        // A release outside the window never reaches us; end the gesture when focus goes.
+        window.addEventListener('blur', this.handlePointerUp);
     }
 
     handlePointerMove(event) {
@@ -76,7 +90,8 @@ export class PythraGestureDetector {
             const dx = event.clientX - this.panStartPoint.x;
             const dy = event.clientY - this.panStartPoint.y;
             if (this.options.onPanUpdateName) {
-                window.pywebview.on_gesture_event(this.options.onPanUpdateName, { dx, dy });
+                this.pendingPan = { dx, dy };
+                this.scheduleFlush();
             }
         } else {
             // --- Check if a Pan has Started ---
@@ -91,7 +106,7 @@ export class PythraGestureDetector {
                 this.longPressTimeout = null;
                 
                 if (this.options.onPanStartName) {
-                    window.pywebview.on_gesture_event(this.options.onPanStartName, {});
+                    this.emit(this.options.onPanStartName, 'gesture', {});
                 }
             }
         }
@@ -102,6 +117,7 @@ export class PythraGestureDetector {
         document.removeEventListener('pointermove', this.handlePointerMove);
         document.removeEventListener('pointerup', this.handlePointerUp);
         document.removeEventListener('pointercancel', this.handlePointerUp);
+        window.removeEventListener('blur', this.handlePointerUp);
 
         // Always clear a pending long press if pointer is lifted
         clearTimeout(this.longPressTimeout);
@@ -110,17 +126,48 @@ export class PythraGestureDetector {
         if (this.isPanning) {
             // --- End Panning ---
             this.isPanning = false;
+            // Deliver the final position before PanEnd, never after it.
+            this.cancelFlush();
+            this.flushPan();
             if (this.options.onPanEndName) {
-                window.pywebview.on_gesture_event(this.options.onPanEndName, );
+                this.emit(this.options.onPanEndName, 'gesture', {});
             }
         }
     }
 
+    /**
+     * Queues one flush of the latest pan update: on the next animation frame, or
+     * once `throttleMs` has passed since the previous message.
+     */
+    scheduleFlush() {
+        if (this.flushHandle) return;
+        const wait = this.throttleMs - (performance.now() - this.lastSentAt);
+        this.flushHandle = wait > 0
+            ? { timer: setTimeout(this.flushPan, wait) }
+            : { frame: requestAnimationFrame(this.flushPan) };
+    }
+
+    cancelFlush() {
+        if (!this.flushHandle) return;
+        if (this.flushHandle.timer !== undefined) clearTimeout(this.flushHandle.timer);
+        else cancelAnimationFrame(this.flushHandle.frame);
+        this.flushHandle = null;
+    }
+
+    flushPan() {
+        this.flushHandle = null;
+        if (!this.pendingPan) return;
+        const details = this.pendingPan;
+        this.pendingPan = null;
+        this.lastSentAt = performance.now();
+        this.emit(this.options.onPanUpdateName, 'pan_update', details);
+    }
+
     fireTap() {
         if (this.tapTimeout) { // Ensure it wasn't cancelled
             this.tapTimeout = null;
             if (this.options.onTapName) {
-                window.pywebview.on_gesture_event(this.options.onTapName, {});
+                this.emit(this.options.onTapName, 'tap', {});
             }
         }
     }
@@ -134,15 +181,25 @@ export class PythraGestureDetector {
         if (this.longPressTimeout) {
             this.longPressTimeout = null;
             if (this.options.onLongPressName) {
-                window.pywebview.on_gesture_event(this.options.onLongPressName, {});
+                this.emit(this.options.onLongPressName, 'gesture', {});
             }
         }
     }
 
+    /**
+     * Sends one gesture event: through the page's batched queue when it is
+     * there (see patch_applier.js), otherwise straight to `on_gesture_event`.
+     */
+    emit(name, kind, details) {
+        if (window.pythraDispatch) window.pythraDispatch(name, kind, [details]);
+        else window.pywebview.on_gesture_event(name, details);
+    }
+
     destroy() {
         if (!this.element) return;
         this.element.removeEventListener('pointerdown', this.handlePointerDown);
-        this.handlePointerUp(); // Ensure document listeners are cleaned up
+        this.handlePointerUp(); // Ensure document listeners are cleaned up (and any pan is ended)
+        this.cancelFlush();
         clearTimeout(this.tapTimeout);
         clearTimeout(this.longPressTimeout);
     }
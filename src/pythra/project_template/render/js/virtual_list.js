@@ -3,10 +3,151 @@
  *
  * This engine creates its own SimpleBar instance to avoid race conditions.
  * It handles pre-rendered initial items (HTML and CSS) for an instant first paint.
- * It asynchronously fetches additional items from Python as the user scrolls.
+ * It asynchronously fetches additional items from Python as the user scrolls,
+ * batching every missing index (visible range + overscan + prefetch in the
+ * scroll direction) into one `build_list_items` bridge call.
  * Most importantly, it dynamically attaches event listeners to both pre-rendered
  * and asynchronously loaded content to ensure full interactivity.
+ *
+ * Item positions come from an extent index: `FixedExtents` (plain arithmetic)
+ * when every row is `itemExtent` tall, or `ExtentIndex` (a Fenwick tree) when
+ * `variableExtent` is set, so that finding the row at a scroll offset stays
+ * O(log n) while row heights are corrected one at a time.
+ */
+
+/** Every item is `extent` tall. */
+class FixedExtents {
+    constructor(count, extent) {
+        this.count = count;
+        this.extent = extent;
+    }
+
+    extentOf(index) { return this.extent; }
+
+    /** Top of `index` (the sum of every extent before it). */
+    offsetOf(index) { return index * this.extent; }
+
+    /** Index of the item covering `offset`, clamped to the list. */
+    indexAt(offset) {
+        return Math.max(0, Math.min(this.count - 1, Math.floor(offset / this.extent)));
+    }
+
+    total() { return this.count * this.extent; }
+
+    set(index, extent) { return 0; }
+}
+
+/**
+ * Per-item extents in a Fenwick (binary indexed) tree: `set`, `offsetOf` and
+ * `indexAt` are all O(log n). Items start at the `estimate` until Python
+ * (`itemExtentBuilder`) or the page (`measureItems`) reports their real size.
+ */
+class ExtentIndex {
+    constructor(count, estimate) {
+        this.count = count;
+        this.sizes = new Float64Array(count).fill(estimate);
+        this.tree = new Float64Array(count + 1);
+        // O(n) build: push each node's sum into its parent.
+        for (let i = 1; i <= count; i++) {
+            this.tree[i] += estimate;
+            const parent = i + (i & -i);
+            if (parent <= count) this.tree[parent] += this.tree[i];
+        }
+        this.totalSize = count * estimate;
+        this.topBit = 1;
+        while (this.topBit * 2 <= count) this.topBit *= 2;
+    }
+
+    extentOf(index) { return this.sizes[index]; }
+
+    offsetOf(index) {
+        let sum = 0;
+        for (let i = index; i > 0; i -= i & -i) sum += this.tree[i];
+        return sum;
+    }
+
+    indexAt(offset) {
+        // Descend the tree, skipping every whole node that ends at or before `offset`.
+        let pos = 0;
+        let remaining = offset;
+        for (let step = this.topBit; step > 0; step >>= 1) {
+            const next = pos + step;
+            if (next <= this.count && this.tree[next] <= remaining) {
+                pos = next;
+                remaining -= this.tree[next];
+            }
+        }
+        return Math.max(0, Math.min(this.count - 1, pos));
+    }
+
+    total() { return this.totalSize; }
+
+    /** Records the real extent of `index` and returns how much it changed by. */
+    set(index, extent) {
+        const delta = extent - this.sizes[index];
+        if (!delta) return 0;
+        this.sizes[index] = extent;
+        for (let i = index + 1; i <= this.count; i += i & -i) this.tree[i] += delta;
+        this.totalSize += delta;
+        return delta;
+    }
+}
+
+/**
+ * Item HTML by index with least-recently-used eviction once more than
+ * `capacity` items are cached (no limit when `capacity` is not positive).
+ * `get` counts hits and misses; `has` is a silent lookup for prefetching.
  */
+class ItemCache {
+    constructor(capacity) {
+        this.capacity = capacity > 0 ? capacity : Infinity;
+        this.entries = new Map();
+        this.hits = 0;
+        this.misses = 0;
+        this.evictions = 0;
+    }
+
+    has(index) { return this.entries.has(index); }
+
+    get(index) {
+        const html = this.entries.get(index);
+        if (html === undefined) {
+            this.misses++;
+            return undefined;
+        }
+        this.hits++;
+        // Re-insert to mark as most recently used (a Map iterates in insertion order).
+        this.entries.delete(index);
+        this.entries.set(index, html);
+        return html;
+    }
+
+    set(index, html) {
+        this.entries.delete(index);
+        this.entries.set(index, html);
+        while (this.entries.size > this.capacity) {
+            this.entries.delete(this.entries.keys().next().value);
+            this.evictions++;
+        }
+    }
+
+    delete(index) { this.entries.delete(index); }
+
+    clear() { this.entries.clear(); }
+
+    stats() {
+        const lookups = this.hits + this.misses;
+        return {
+            size: this.entries.size,
+            capacity: this.capacity === Infinity ? null : this.capacity,
+            hits: this.hits,
+            misses: this.misses,
+            evictions: this.evictions,
+            hitRate: lookups ? this.hits / lookups : 0,
+        };
+    }
+}
+
 export class PythraVirtualList {
     constructor(elementId, options) {
         this.container = document.getElementById(elementId);
@@ -22,27 +163,47 @@ export class PythraVirtualList {
         this.scrollEl = this.simplebar.getScrollElement();
         this.contentEl = this.simplebar.getContentElement();
         
-        this.itemCache = {}; // Cache will ONLY store HTML strings.
+        // Cache will ONLY store HTML strings, bounded by `cacheSize`.
+        this.itemCache = new ItemCache(this.options.cacheSize);
         this.visibleItemElements = [];
 
+        // Batched fetching: indices waiting to be sent, and indices already sent.
+        this.overscan = this.options.overscan ?? 3;
+        this.prefetch = this.options.prefetch ?? 10;
+        this.batchSize = this.options.batchSize ?? 50;
+        this.pendingIndices = new Set();
+        this.inFlight = new Set();
+        this.wanted = { start: 0, end: -1 };
+        this.lastScrollTop = 0;
+        this.scrollDirection = 1;
+
+        // Variable extents: `itemExtent` is only the estimate for unseen rows.
+        this.variableExtent = !!(this.options.variableExtent || this.options.measureItems);
+        this.measureItems = !!this.options.measureItems;
+        this.extents = this.variableExtent
+            ? new ExtentIndex(this.options.itemCount, this.options.itemExtent)
+            : new FixedExtents(this.options.itemCount, this.options.itemExtent);
+        // First visible index at the last render; size corrections above it move
+        // the scroll position by the same amount so the content stays put.
+        this.anchorIndex = 0;
+        this.unmeasured = new Map();
+        this.measureScheduled = false;
+
+        // Item CSS goes into the list's own <style>, so rewriting it never
+        // resets the shared #dynamic-styles sheet.
+        this.styleEl = document.createElement('style');
+        this.styleEl.id = `${elementId}_vlist_styles`;
+        document.head.appendChild(this.styleEl);
+        this.appliedCss = new Set();
+
         // Process the initialItems object from Python.
         if (this.options.initialItems) {
-            const initialCss = new Set();
             for (const index in this.options.initialItems) {
                 const itemData = this.options.initialItems[index];
-                // 1. Store ONLY the HTML string in the cache.
-                this.itemCache[index] = itemData.html;
-                // 2. Collect all unique CSS rules.
-                if (itemData.css) {
-                    initialCss.add(itemData.css);
-                }
-            }
-            // 3. Inject all collected CSS into the dynamic stylesheet in one go.
-            if (initialCss.size > 0) {
-                const styleSheet = document.getElementById('dynamic-styles');
-                if (styleSheet) {
-                    styleSheet.textContent += `\n${[...initialCss].join('\n')}`;
-                }
+                // Store ONLY the HTML string in the cache; CSS is applied once.
+                this.itemCache.set(Number(index), itemData.html);
+                this.addCss(itemData.css);
+                if (itemData.extent != null) this.extents.set(Number(index), itemData.extent);
             }
         }
 
@@ -52,9 +213,11 @@ export class PythraVirtualList {
         this.sizer.style.top = '0';
         this.sizer.style.left = '0';
         this.sizer.style.width = '1px';
-        this.sizer.style.height = `${this.options.itemCount * this.options.itemExtent}px`;
+        this.sizer.style.height = `${this.extents.total()}px`;
         this.contentEl.appendChild(this.sizer);
         this.contentEl.style.position = 'relative';
+        // We do our own anchoring; the browser's would fight it.
+        if (this.variableExtent) this.scrollEl.style.overflowAnchor = 'none';
 
         this.render = this.render.bind(this);
         this.scrollEl.addEventListener('scroll', this.render);
@@ -90,19 +253,164 @@ export class PythraVirtualList {
         });
     }
 
+    addCss(css) {
+        if (!css || this.appliedCss.has(css)) return;
+        this.appliedCss.add(css);
+        this.styleEl.appendChild(document.createTextNode(`\n${css}`));
+    }
+
+    /**
+     * Queues an index for the next batch, unless it is cached or already requested.
+     */
+    requestItem(index) {
+        if (this.itemCache.has(index) || this.inFlight.has(index)) return;
+        this.pendingIndices.add(index);
+    }
+
+    /**
+     * Sends queued indices to Python in one `build_list_items` call. Only one
+     * batch is in flight at a time; indices that left the wanted window
+     * (visible + overscan + prefetch) while queued are dropped, which is how
+     * requests for items that were flung past get cancelled.
+     */
+    flushRequests() {
+        if (this.inFlight.size > 0 || this.pendingIndices.size === 0) return;
+        if (!(window.pywebview && this.options.itemBuilderName)) {
+            this.pendingIndices.clear();
+            return;
+        }
+
+        const { start, end } = this.wanted;
+        const batch = [];
+        for (const index of this.pendingIndices) {
+            if (index >= start && index <= end && batch.length < this.batchSize) batch.push(index);
+        }
+        this.pendingIndices.clear();
+        if (batch.length === 0) return;
+
+        batch.forEach(index => this.inFlight.add(index));
+        window.pywebview.build_list_items(this.options.itemBuilderName, batch)
+            .then(response => {
+                this.addCss(response.css);
+                this.forgetItems(response.evicted);
+                this.applyExtents(response.extents);
+                for (const index of batch) {
+                    const html = response.items[index];
+                    if (html === undefined) continue;
+                    this.itemCache.set(index, html);
+                    const el = this.visibleItemElements.find(e => e.dataset.index === String(index));
+                    if (el) {
+                        el.innerHTML = html;
+                        // Attach event listeners to the newly created DOM nodes.
+                        this.attachEventListeners(el);
+                        if (this.measureItems) this.unmeasured.set(el, index);
+                    }
+                }
+            })
+            .catch(e => {
+                console.error(`Error building virtual items ${batch[0]}..${batch[batch.length - 1]}:`, e);
+                // Cache the error so the render below does not retry in a loop.
+                for (const index of batch) {
+                    this.itemCache.set(index, '<div>Error</div>');
+                    const el = this.visibleItemElements.find(e => e.dataset.index === String(index));
+                    if (el) el.innerHTML = '<div>Error</div>';
+                }
+            })
+            .finally(() => {
+                batch.forEach(index => this.inFlight.delete(index));
+                // Pick up whatever the user scrolled to while this batch was building.
+                this.render();
+            });
+    }
+
+    /**
+     * Drops items whose callbacks Python released when it trimmed its window of
+     * live items (see `maxLiveItems`), so they are rebuilt if shown again.
+     */
+    forgetItems(indices) {
+        if (!indices) return;
+        for (const index of indices) {
+            this.itemCache.delete(Number(index));
+            const el = this.visibleItemElements.find(e => e.dataset.index === String(index));
+            if (el) el.dataset.index = '-1';
+        }
+    }
+
+    /**
+     * Records real item extents (`{index: px}`) and keeps the first visible
+     * item anchored: whatever the rows above it grew or shrank by is added to
+     * `scrollTop`, so correcting an estimate never makes the content jump.
+     * Returns true if any extent changed.
+     */
+    applyExtents(extents) {
+        if (!this.variableExtent || !extents) return false;
+        let changed = false;
+        let shift = 0;
+        for (const key in extents) {
+            const index = Number(key);
+            if (!(index >= 0 && index < this.options.itemCount)) continue;
+            const delta = this.extents.set(index, Number(extents[key]));
+            if (!delta) continue;
+            changed = true;
+            if (index < this.anchorIndex) shift += delta;
+        }
+        if (!changed) return false;
+        this.sizer.style.height = `${this.extents.total()}px`;
+        if (shift) {
+            // Not a user scroll: keep the scroll direction as it was.
+            this.lastScrollTop += shift;
+            this.scrollEl.scrollTop += shift;
+        }
+        return true;
+    }
+
+    /**
+     * In `measureItems` mode, reads the rendered height of items whose content
+     * was just set (batched into one animation frame) and feeds it back into
+     * the extent index.
+     */
+    scheduleMeasure() {
+        if (this.measureScheduled || this.unmeasured.size === 0) return;
+        this.measureScheduled = true;
+        requestAnimationFrame(() => {
+            this.measureScheduled = false;
+            const measured = {};
+            for (const [el, index] of this.unmeasured) {
+                if (el.dataset.index !== String(index)) continue;
+                const height = el.offsetHeight;
+                if (height > 0) measured[index] = height;
+            }
+            this.unmeasured.clear();
+            if (this.applyExtents(measured)) this.render();
+        });
+    }
+
     render() {
         const scrollTop = this.scrollEl.scrollTop;
         const viewportHeight = this.scrollEl.clientHeight;
+        if (scrollTop !== this.lastScrollTop) {
+            this.scrollDirection = scrollTop > this.lastScrollTop ? 1 : -1;
+            this.lastScrollTop = scrollTop;
+        }
+
+        const lastIndex = this.options.itemCount - 1;
+        const firstVisible = this.extents.indexAt(scrollTop);
+        const lastVisible = this.extents.indexAt(scrollTop + viewportHeight);
+        this.anchorIndex = firstVisible;
+        const startIndex = Math.max(0, firstVisible - this.overscan);
+        const endIndex = Math.min(lastIndex, lastVisible + this.overscan);
 
-        const startIndex = Math.max(0, Math.floor(scrollTop / this.options.itemExtent));
-        const endIndex = Math.min(
-            this.options.itemCount - 1,
-            Math.ceil((scrollTop + viewportHeight) / this.options.itemExtent)
-        );
+        // Prefetch further ahead in the direction of travel only.
+        this.wanted = this.scrollDirection > 0
+            ? { start: startIndex, end: Math.min(lastIndex, endIndex + this.prefetch) }
+            : { start: Math.max(0, startIndex - this.prefetch), end: endIndex };
         
         const itemsToRender = [];
+        let top = this.extents.offsetOf(startIndex);
         for (let i = startIndex; i <= endIndex; i++) {
-            itemsToRender.push({ index: i, top: i * this.options.itemExtent });
+            const extent = this.extents.extentOf(i);
+            itemsToRender.push({ index: i, top, extent });
+            top += extent;
         }
         
         for (let i = 0; i < itemsToRender.length; i++) {
@@ -113,58 +421,47 @@ export class PythraVirtualList {
                 el = document.createElement('div');
                 el.style.position = 'absolute';
                 el.style.width = '100%';
-                el.style.height = `${this.options.itemExtent}px`;
                 el.style.left = '0';
                 this.contentEl.appendChild(el);
                 this.visibleItemElements.push(el);
             }
 
             el.style.transform = `translateY(${item.top}px)`;
+            // Measured items size themselves; otherwise the slot is the known extent.
+            if (!this.measureItems) el.style.height = `${item.extent}px`;
             
             if (el.dataset.index !== String(item.index)) {
                 el.dataset.index = item.index;
                 
-                if (this.itemCache[item.index]) {
+                const html = this.itemCache.get(item.index);
+                if (html !== undefined) {
                     // Item was pre-rendered or fetched before.
-                    el.innerHTML = this.itemCache[item.index];
+                    el.innerHTML = html;
                     // IMPORTANT: We must re-attach listeners every time we set innerHTML.
                     this.attachEventListeners(el);
+                    if (this.measureItems) this.unmeasured.set(el, item.index);
                 } else {
-                    // Item needs to be fetched from Python.
+                    // Item needs to be fetched from Python (in the next batch).
                     el.innerHTML = '<div>Loading...</div>';
-                    if (window.pywebview && this.options.itemBuilderName) {
-                        window.pywebview.build_list_item(this.options.itemBuilderName, item.index)
-                            .then(response => {
-                                const { html, css } = response;
-                                this.itemCache[item.index] = html;
-
-                                if (css) {
-                                    const styleSheet = document.getElementById('dynamic-styles');
-                                    if (styleSheet && !styleSheet.textContent.includes(css)) {
-                                        styleSheet.textContent += `\n${css}`;
-                                    }
-                                }
-                                
-                                if (el.dataset.index === String(item.index)) {
-                                    el.innerHTML = html;
-                                    // Attach event listeners to the newly created DOM nodes.
-                                    this.attachEventListeners(el);
-                                }
-                            })
-                            .catch(e => {
-                                console.error(`Error building virtual item ${item.index}:`, e);
-                                if (el.dataset.index === String(item.index)) {
-                                    el.innerHTML = '<div>Error</div>';
-                                }
-                            });
-                    }
                 }
             }
         }
         
         for (let i = itemsToRender.length; i < this.visibleItemElements.length; i++) {
             this.visibleItemElements[i].style.transform = 'translateY(-9999px)';
+            this.visibleItemElements[i].dataset.index = '-1';
         }
+
+        // Queue everything in the wanted window that is missing, nearest first.
+        const { start, end } = this.wanted;
+        for (let i = startIndex; i <= endIndex; i++) this.requestItem(i);
+        if (this.scrollDirection > 0) {
+            for (let i = endIndex + 1; i <= end; i++) this.requestItem(i);
+        } else {
+            for (let i = startIndex - 1; i >= start; i--) this.requestItem(i);
+        }
+        this.flushRequests();
+        if (this.measureItems) this.scheduleMeasure();
     }
 
     /**
@@ -173,8 +470,9 @@ export class PythraVirtualList {
      */
     refresh() {
         console.log(`Refreshing ALL visible items for #${this.container.id}`);
-        // 1. Clear the entire HTML cache.
-        this.itemCache = {};
+        // 1. Clear the entire HTML cache and any queued requests.
+        this.itemCache.clear();
+        this.pendingIndices.clear();
         
         // 2. Mark all currently visible DOM elements as "dirty" by resetting their data-index.
         this.visibleItemElements.forEach(el => {
@@ -195,9 +493,7 @@ export class PythraVirtualList {
 
         indices.forEach(index => {
             // 1. Invalidate the cache for this specific item.
-            if (this.itemCache[index]) {
-                delete this.itemCache[index];
-            }
+            this.itemCache.delete(Number(index));
             
             // 2. Find if this item is currently visible in the DOM.
             const visibleElement = this.visibleItemElements.find(el => el.dataset.index === String(index));
@@ -214,9 +510,30 @@ export class PythraVirtualList {
     
     // --- END OF NEW LOGIC ---
 
+    /** Cache size and hit/miss counts, for tuning `cacheSize`. */
+    cacheStats() {
+        return this.itemCache.stats();
+    }
+
+    /** Sends `cacheStats()` to Python (see `VirtualListController.requestCacheStats`). */
+    reportCacheStats() {
+        if (window.pywebview && this.options.itemBuilderName) {
+            window.pywebview.on_list_cache_stats(this.options.itemBuilderName, this.cacheStats());
+        }
+    }
+
+    /** Alias used by `VirtualListController.refresh()`. */
+    refreshAll() {
+        this.refresh();
+    }
+
     destroy() {
+        this.scrollEl.removeEventListener('scroll', this.render);
+        if (this.styleEl) this.styleEl.remove();
         if (this.simplebar && typeof this.simplebar.unMount === 'function') {
             this.simplebar.unMount();
         }
     }
-}
\ No newline at end of file
+}
+
+window.PythraVirtualList = PythraVirtualList;
\ No newline at end of file
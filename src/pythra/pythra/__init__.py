@@ -7,154 +7,320 @@ This package provides a Flutter-inspired UI framework for desktop applications
 using Python, rendering via HTML/CSS/JS in a webview (like PySide6 QtWebEngine).
 """
 
-# --- Core Framework Classes ---
-from .core import Framework
-from .config import Config  # Expose configuration access
+from importlib import import_module
+from typing import TYPE_CHECKING
 
-# --- Base Widget and State Management ---
-from .base import Widget
+# Static analysers and IDEs see the eager imports; at runtime each name is
+# loaded from its submodule on first access (PEP 562, see `__getattr__` below),
+# so `import pythra` does not pull in Qt until `Framework` is actually used.
+if TYPE_CHECKING:
+    # --- Core Framework Classes ---
+    from .core import Framework
+    from .config import Config  # Expose configuration access
 
-# Assuming Key class is defined in base.py or reconciler.py
-# If in reconciler.py, change the import below:
-# from .reconciler import Key
-from .base import Key  # Prefer placing Key in base.py as it's fundamental
-from .state import State, StatefulWidget, StatelessWidget
-from .icons import Icons, IconData
-from .controllers import (
-    TextEditingController,
-    SliderController,
-    VirtualListController,
-    DropdownController,
-)
-from .events import TapDetails, PanUpdateDetails
-from .drived_widgets.dropdown.dropdown import DerivedDropdown
-from .drived_widgets.dropdown.controller import DerivedDropdownController
-from .drived_widgets.dropdown.style import DerivedDropdownTheme
-from .navigation import Navigator, NavigatorState, PageRoute
+    # --- Base Widget and State Management ---
+    from .base import Widget
 
+    # Assuming Key class is defined in base.py or reconciler.py
+    # If in reconciler.py, change the import below:
+    # from .reconciler import Key
+    from .base import Key  # Prefer placing Key in base.py as it's fundamental
+    from .state import State, StatefulWidget, StatelessWidget
+    from .icons import Icons, IconData
+    from .controllers import (
+        TextEditingController,
+        SliderController,
+        VirtualListController,
+        DropdownController,
+    )
+    from .events import TapDetails, PanUpdateDetails
+    from .background import in_background
+    from .drived_widgets.dropdown.dropdown import DerivedDropdown
+    from .drived_widgets.dropdown.controller import DerivedDropdownController
+    from .drived_widgets.dropdown.style import DerivedDropdownTheme
+    from .navigation import Navigator, NavigatorState, PageRoute
 
-# --- Styling Utilities and Constants ---
-# Import common styling classes and enums/constants
-from .styles import (
-    EdgeInsets,
-    Alignment,
-    TextAlign,
-    BoxConstraints,
-    Colors,
-    Offset,
-    BoxShadow,
-    ClipBehavior,
-    ImageFit,
-    MainAxisSize,
-    Axis,
-    MainAxisAlignment,
-    CrossAxisAlignment,
-    TextStyle,
-    BorderStyle,
-    BorderRadius,
-    BorderSide,
-    ButtonStyle,
-    ScrollPhysics,
-    Overflow,
-    StackFit,
-    TextDirection,
-    TextBaseline,
-    VerticalDirection,
-    BoxFit,
-    BoxDecoration,
-    BoxDecoration,
-    InputDecoration,
-    ScrollbarTheme,
-    SliderTheme,
-    CheckboxTheme,
-    SwitchTheme,
-    RadioTheme,
-    DropdownTheme,
-    GradientBorderTheme,
-    GradientTheme,
-)
 
-from .drawing import (
-    PathCommandWidget,
-    MoveTo,
-    LineTo,
-    ClosePath,
-    ArcTo,
-    QuadraticCurveTo,
-    create_rounded_polygon_path,
-    RoundedPolygon,
-    PolygonClipper,
-)
+    # --- Styling Utilities and Constants ---
+    # Import common styling classes and enums/constants
+    from .styles import (
+        EdgeInsets,
+        Alignment,
+        TextAlign,
+        BoxConstraints,
+        Colors,
+        Offset,
+        BoxShadow,
+        ClipBehavior,
+        ImageFit,
+        MainAxisSize,
+        Axis,
+        MainAxisAlignment,
+        CrossAxisAlignment,
+        TextStyle,
+        BorderStyle,
+        BorderRadius,
+        BorderSide,
+        ButtonStyle,
+        ScrollPhysics,
+        Overflow,
+        StackFit,
+        TextDirection,
+        TextBaseline,
+        VerticalDirection,
+        BoxFit,
+        BoxDecoration,
+        BoxDecoration,
+        InputDecoration,
+        ScrollbarTheme,
+        SliderTheme,
+        CheckboxTheme,
+        SwitchTheme,
+        RadioTheme,
+        DropdownTheme,
+        GradientBorderTheme,
+        GradientTheme,
+    )
+
+    from .drawing import (
+        PathCommandWidget,
+        MoveTo,
+        LineTo,
+        ClosePath,
+        ArcTo,
+        QuadraticCurveTo,
+        create_rounded_polygon_path,
+        RoundedPolygon,
+        PolygonClipper,
+    )
+
+    # --- Widget Implementations ---
+    # Expose common widgets directly. Users can import less common ones
+    # specifically from framework.widgets if needed.
+    from .widgets import (
+        Container,
+        Text,
+        TextButton,
+        ElevatedButton,
+        IconButton,
+        FloatingActionButton,
+        SingleChildScrollView,
+        GlobalScrollbarStyle,
+        Scrollbar,
+        Column,
+        Row,
+        AssetImage,
+        AssetIcon,
+        NetworkImage,
+        Image,
+        Icon,
+        # _VirtualListViewState,
+        VirtualListView,
+        ListView,
+        GridView,
+        Stack,
+        Positioned,
+        Expanded,
+        Spacer,
+        SizedBox,
+        AppBar,
+        BottomNavigationBarItem,
+        BottomNavigationBar,
+        # MyMainScreen,
+        # _MyMainScreenState,
+        Scaffold,
+        TextField,
+        Divider,
+        Drawer,
+        EndDrawer,
+        BottomSheet,
+        SnackBarAction,
+        SnackBar,
+        Center,
+        Placeholder,
+        Padding,
+        Align,
+        AspectRatio,
+        FittedBox,
+        FractionallySizedBox,
+        Flex,
+        Wrap,
+        Dialog,
+        # MyScreenState,
+        ClipPath,
+        ListTile,
+        Slider,
+        # _MySettingsPageState,
+        Checkbox,
+        Switch,
+        Radio,
+        # MyFormState,
+        Dropdown,
+        # MyFormState,
+        GestureDetector,
+        # DraggableBoxState,
+        GradientBorderContainer,
+        GradientClipPathBorder,
+        # Add any other core widgets you want easily accessible...
+    )
+
+# --- Lazy exports: public name -> submodule that defines it ---
+_LAZY_EXPORTS = {
+    # .core
+    "Framework": ".core",
+    # .config
+    "Config": ".config",
+    # .base
+    "Widget": ".base",
+    "Key": ".base",
+    # .state
+    "State": ".state",
+    "StatefulWidget": ".state",
+    "StatelessWidget": ".state",
+    # .icons
+    "Icons": ".icons",
+    "IconData": ".icons",
+    # .controllers
+    "TextEditingController": ".controllers",
+    "SliderController": ".controllers",
+    "VirtualListController": ".controllers",
+    "DropdownController": ".controllers",
+    # .events
+    "TapDetails": ".events",
+    "PanUpdateDetails": ".events",
+    # .background
+    "in_background": ".background",
+    # .drived_widgets.dropdown.dropdown
+    "DerivedDropdown": ".drived_widgets.dropdown.dropdown",
+    # .drived_widgets.dropdown.controller
+    "DerivedDropdownController": ".drived_widgets.dropdown.controller",
+    # .drived_widgets.dropdown.style
+    "DerivedDropdownTheme": ".drived_widgets.dropdown.style",
+    # .navigation
+    "Navigator": ".navigation",
+    "NavigatorState": ".navigation",
+    "PageRoute": ".navigation",
+    # .styles
+    "EdgeInsets": ".styles",
+    "Alignment": ".styles",
+    "TextAlign": ".styles",
+    "BoxConstraints": ".styles",
+    "Colors": ".styles",
+    "Offset": ".styles",
+    "BoxShadow": ".styles",
+    "ClipBehavior": ".styles",
+    "ImageFit": ".styles",
+    "MainAxisSize": ".styles",
+    "Axis": ".styles",
+    "MainAxisAlignment": ".styles",
+    "CrossAxisAlignment": ".styles",
+    "TextStyle": ".styles",
+    "BorderStyle": ".styles",
+    "BorderRadius": ".styles",
+    "BorderSide": ".styles",
+    "ButtonStyle": ".styles",
+    "ScrollPhysics": ".styles",
+    "Overflow": ".styles",
+    "StackFit": ".styles",
+    "TextDirection": ".styles",
+    "TextBaseline": ".styles",
+    "VerticalDirection": ".styles",
+    "BoxFit": ".styles",
+    "BoxDecoration": ".styles",
+    "InputDecoration": ".styles",
+    "ScrollbarTheme": ".styles",
+    "SliderTheme": ".styles",
+    "CheckboxTheme": ".styles",
+    "SwitchTheme": ".styles",
+    "RadioTheme": ".styles",
+    "DropdownTheme": ".styles",
+    "GradientBorderTheme": ".styles",
+    "GradientTheme": ".styles",
+    # .drawing
+    "PathCommandWidget": ".drawing",
+    "MoveTo": ".drawing",
+    "LineTo": ".drawing",
+    "ClosePath": ".drawing",
+    "ArcTo": ".drawing",
+    "QuadraticCurveTo": ".drawing",
+    "create_rounded_polygon_path": ".drawing",
+    "RoundedPolygon": ".drawing",
+    "PolygonClipper": ".drawing",
+    # .widgets
+    "Container": ".widgets",
+    "Text": ".widgets",
+    "TextButton": ".widgets",
+    "ElevatedButton": ".widgets",
+    "IconButton": ".widgets",
+    "FloatingActionButton": ".widgets",
+    "SingleChildScrollView": ".widgets",
+    "GlobalScrollbarStyle": ".widgets",
+    "Scrollbar": ".widgets",
+    "Column": ".widgets",
+    "Row": ".widgets",
+    "AssetImage": ".widgets",
+    "AssetIcon": ".widgets",
+    "NetworkImage": ".widgets",
+    "Image": ".widgets",
+    "Icon": ".widgets",
+    "VirtualListView": ".widgets",
+    "ListView": ".widgets",
+    "GridView": ".widgets",
+    "Stack": ".widgets",
+    "Positioned": ".widgets",
+    "Expanded": ".widgets",
+    "Spacer": ".widgets",
+    "SizedBox": ".widgets",
+    "AppBar": ".widgets",
+    "BottomNavigationBarItem": ".widgets",
+    "BottomNavigationBar": ".widgets",
+    "Scaffold": ".widgets",
+    "TextField": ".widgets",
+    "Divider": ".widgets",
+    "Drawer": ".widgets",
+    "EndDrawer": ".widgets",
+    "BottomSheet": ".widgets",
+    "SnackBarAction": ".widgets",
+    "SnackBar": ".widgets",
+    "Center": ".widgets",
+    "Placeholder": ".widgets",
+    "Padding": ".widgets",
+    "Align": ".widgets",
+    "AspectRatio": ".widgets",
+    "FittedBox": ".widgets",
+    "FractionallySizedBox": ".widgets",
+    "Flex": ".widgets",
+    "Wrap": ".widgets",
+    "Dialog": ".widgets",
+    "ClipPath": ".widgets",
+    "ListTile": ".widgets",
+    "Slider": ".widgets",
+    "Checkbox": ".widgets",
+    "Switch": ".widgets",
+    "Radio": ".widgets",
+    "Dropdown": ".widgets",
+    "GestureDetector": ".widgets",
+    "GradientBorderContainer": ".widgets",
+    "GradientClipPathBorder": ".widgets",
+}
+
+
+def __getattr__(name):
+    """
+    Imports the submodule behind `name` on first access and caches the
+    attribute in the package namespace, so later lookups skip this hook.
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_EXPORTS))
 
-# --- Widget Implementations ---
-# Expose common widgets directly. Users can import less common ones
-# specifically from framework.widgets if needed.
-from .widgets import (
-    Container,
-    Text,
-    TextButton,
-    ElevatedButton,
-    IconButton,
-    FloatingActionButton,
-    SingleChildScrollView,
-    GlobalScrollbarStyle,
-    Scrollbar,
-    Column,
-    Row,
-    AssetImage,
-    AssetIcon,
-    NetworkImage,
-    Image,
-    Icon,
-    # _VirtualListViewState,
-    VirtualListView,
-    ListView,
-    GridView,
-    Stack,
-    Positioned,
-    Expanded,
-    Spacer,
-    SizedBox,
-    AppBar,
-    BottomNavigationBarItem,
-    BottomNavigationBar,
-    # MyMainScreen,
-    # _MyMainScreenState,
-    Scaffold,
-    TextField,
-    Divider,
-    Drawer,
-    EndDrawer,
-    BottomSheet,
-    SnackBarAction,
-    SnackBar,
-    Center,
-    Placeholder,
-    Padding,
-    Align,
-    AspectRatio,
-    FittedBox,
-    FractionallySizedBox,
-    Flex,
-    Wrap,
-    Dialog,
-    # MyScreenState,
-    ClipPath,
-    ListTile,
-    Slider,
-    # _MySettingsPageState,
-    Checkbox,
-    Switch,
-    Radio,
-    # MyFormState,
-    Dropdown,
-    # MyFormState,
-    GestureDetector,
-    # DraggableBoxState,
-    GradientBorderContainer,
-    GradientClipPathBorder,
-    # Add any other core widgets you want easily accessible...
-)
 
 # --- Define __all__ for explicit export control ---
 # This list controls what `from framework import *` imports,
@@ -285,6 +451,8 @@ __all__ = [
     "DerivedDropdownController",
     "TapDetails",
     "PanUpdateDetails",
+    # --- Background work ---
+    "in_background",
 ]
 
 
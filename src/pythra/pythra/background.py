@@ -0,0 +1,242 @@
+# =============================================================================
+# PYTHRA BACKGROUND WORK - Async Handlers, Worker Pools and GUI-Thread Marshalling
+# =============================================================================
+
+"""
+PyThra Background Work
+
+Every `Api` slot runs its callback on the Qt GUI thread, so a handler that
+queries a database or scans a music folder freezes rendering until it returns.
+This module gives handlers two ways out:
+
+- **`async def` handlers.** When a callback returns a coroutine, the `Api`
+  hands it to `AsyncLoop`, an asyncio event loop driven by Qt timers on the
+  GUI thread. Code between `await`s runs on the GUI thread (so it can touch
+  state and call `setState()` freely), while the awaits themselves
+  (`asyncio.sleep`, sockets, `loop.run_in_executor`) never block the UI.
+- **`@in_background` handlers.** The decorated function runs on a shared
+  thread pool (or, with `executor="process"`, a process pool) and the caller
+  gets a `concurrent.futures.Future` back immediately.
+
+`setState()` called from a worker thread is marshalled back to the GUI thread
+by `GuiDispatcher` and lands in the next reconciliation frame, merged with any
+other pending updates (see `scheduler.py`).
+
+```python
+class LibraryState(State):
+    async def refresh(self):
+        self.songs = await fetch_songs()      # the UI keeps painting meanwhile
+        self.setState()
+
+    @in_background
+    def rescan(self):
+        self.songs = scan_music_folder()      # runs on a worker thread
+        self.setState()                       # safe: marshalled to the GUI thread
+```
+
+```python
+# config.yaml
+background_workers: 4       # thread pool size for @in_background (default: Python's)
+async_pump_ms: 8            # how often pending coroutines are polled
+```
+"""
+
+import asyncio
+import functools
+import importlib
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Coroutine, Optional, Set
+
+from PySide6.QtCore import QObject, QTimer, Signal, Slot
+
+
+# =============================================================================
+# GUI THREAD DISPATCHER - Runs callables on the thread that owns the UI
+# =============================================================================
+
+class GuiDispatcher(QObject):
+    """
+    Runs callables on the thread that created it (the GUI thread).
+
+    `call()` from that thread runs the callable at once; from any other thread
+    it is posted through a queued Qt signal and runs on the next event-loop turn.
+    """
+
+    _posted = Signal(object)
+
+    def __init__(self):
+        super().__init__()
+        self._thread_id = threading.get_ident()
+        # Connected across threads, the signal is queued to this object's thread.
+        self._posted.connect(self._run)
+
+    def on_gui_thread(self) -> bool:
+        return threading.get_ident() == self._thread_id
+
+    def call(self, fn: Callable[..., Any], *args: Any) -> None:
+        if self.on_gui_thread():
+            fn(*args)
+        else:
+            self._posted.emit(functools.partial(fn, *args))
+
+    @Slot(object)
+    def _run(self, fn: Callable[[], Any]) -> None:
+        try:
+            fn()
+        except Exception as e:
+            print(f"❌ PyThra Background | Error in marshalled call {fn!r}: {e}")
+
+
+# =============================================================================
+# ASYNC LOOP - An asyncio event loop pumped by Qt timers
+# =============================================================================
+
+class AsyncLoop:
+    """
+    Runs coroutines on the GUI thread without blocking Qt.
+
+    While tasks are pending, a Qt timer runs one asyncio iteration every
+    `pump_ms` (ready callbacks plus a zero-timeout I/O poll); when the last
+    task finishes the timer stops, so an idle app pays nothing.
+    """
+
+    def __init__(
+        self,
+        pump_ms: int = 8,
+        timer: Callable[[int, Callable[[], None]], Any] = QTimer.singleShot,
+    ):
+        self.pump_ms = pump_ms
+        self._timer = timer
+        self._loop = asyncio.new_event_loop()
+        self._tasks: Set[asyncio.Task] = set()
+        self._scheduled = False
+
+    @property
+    def loop(self) -> asyncio.AbstractEventLoop:
+        return self._loop
+
+    @property
+    def pending(self) -> int:
+        return len(self._tasks)
+
+    def create_task(self, coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+        """Schedules `coro`; its first step runs on the next event-loop turn."""
+        task = self._loop.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._task_done)
+        self._schedule(0)
+        return task
+
+    def _schedule(self, delay_ms: int) -> None:
+        if self._scheduled:
+            return
+        self._scheduled = True
+        self._timer(delay_ms, self.pump)
+
+    def pump(self) -> None:
+        """Runs exactly one iteration of the asyncio loop."""
+        self._scheduled = False
+        if self._loop.is_closed() or self._loop.is_running():
+            return
+        # stop() before run_forever() = poll I/O once, run what is ready, return.
+        self._loop.call_soon(self._loop.stop)
+        self._loop.run_forever()
+        if self._tasks:
+            self._schedule(self.pump_ms)
+
+    def _task_done(self, task: asyncio.Task) -> None:
+        self._tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            print(f"❌ PyThra Background | Async handler failed: {task.exception()!r}")
+
+    def close(self) -> None:
+        """Cancels pending tasks and closes the loop."""
+        for task in list(self._tasks):
+            task.cancel()
+        if self._tasks and not self._loop.is_running():
+            # Let the cancellations unwind.
+            self._loop.run_until_complete(asyncio.gather(*self._tasks, return_exceptions=True))
+        self._loop.close()
+
+
+# =============================================================================
+# WORKER POOLS - @in_background
+# =============================================================================
+
+_pools = {}
+_pool_lock = threading.Lock()
+_max_workers: Optional[int] = None
+
+
+def configure(max_workers: Optional[int] = None) -> None:
+    """Sets the worker count used when the pools are first created."""
+    global _max_workers
+    _max_workers = max_workers
+
+
+def get_executor(kind: str = "thread"):
+    """Returns the shared `"thread"` or `"process"` pool, creating it on first use."""
+    if kind not in ("thread", "process"):
+        raise ValueError(f"in_background executor must be 'thread' or 'process', got {kind!r}.")
+    with _pool_lock:
+        pool = _pools.get(kind)
+        if pool is None:
+            if kind == "thread":
+                pool = ThreadPoolExecutor(max_workers=_max_workers, thread_name_prefix="pythra-bg")
+            else:
+                pool = ProcessPoolExecutor(max_workers=_max_workers)
+            _pools[kind] = pool
+        return pool
+
+
+def shutdown() -> None:
+    """Stops the pools without waiting for running work (used on app exit)."""
+    with _pool_lock:
+        for pool in _pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        _pools.clear()
+
+
+def _run_by_reference(module: str, qualname: str, args, kwargs):
+    """Process-pool entry point: finds the decorated function by name and calls the original."""
+    target: Any = importlib.import_module(module)
+    for part in qualname.split("."):
+        target = getattr(target, part)
+    return target.__wrapped__(*args, **kwargs)
+
+
+def _report_failure(name: str, future: Future) -> None:
+    if not future.cancelled() and future.exception() is not None:
+        print(f"❌ PyThra Background | {name} failed: {future.exception()!r}")
+
+
+def in_background(func: Optional[Callable] = None, *, executor: str = "thread"):
+    """
+    Runs the decorated function on a worker pool; calling it returns a
+    `concurrent.futures.Future` right away.
+
+    `executor="thread"` (the default) suits I/O and most handlers, including
+    State methods. `executor="process"` sidesteps the GIL for CPU-heavy work,
+    but only for module-level functions whose arguments and result pickle.
+    Exceptions are printed (and kept on the Future).
+    """
+    if executor not in ("thread", "process"):
+        raise ValueError(f"in_background executor must be 'thread' or 'process', got {executor!r}.")
+
+    def decorate(fn: Callable) -> Callable[..., Future]:
+        @functools.wraps(fn)
+        def submit(*args, **kwargs) -> Future:
+            if executor == "process":
+                # The module attribute is this wrapper, so ship a reference, not `fn`.
+                future = get_executor("process").submit(
+                    _run_by_reference, fn.__module__, fn.__qualname__, args, kwargs)
+            else:
+                future = get_executor("thread").submit(fn, *args, **kwargs)
+            future.add_done_callback(functools.partial(_report_failure, fn.__qualname__))
+            return future
+
+        submit.in_background = executor
+        return submit
+
+    return decorate(func) if func is not None else decorate
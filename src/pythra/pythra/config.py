@@ -43,7 +43,29 @@ DEFAULT_CONFIG = {
     # === FILE LOCATIONS ===
     'render_dir': 'render',                   # Folder for HTML, CSS, JavaScript files
     'assets_dir': 'assets',             # Folder for images, fonts, other static files
+    'page_scheme': 'file',              # 'file' = write render/index.html and load it from disk, 'pythra' = serve the page from memory over pythra://
     
+    # === RECONCILER SETTINGS ===
+    'reconciler_identity_mode': 'uuid', # 'positional' = unkeyed widgets match by type + position
+    'patch_protocol': 'json',           # 'json' = send patch data to applyPatches(), 'script' = legacy per-patch JS
+    'max_fps': 60,                      # Max UI update cycles per second; setState bursts are coalesced (0 = no cap)
+    
+    # === PROFILING SETTINGS === (or set PYTHRA_PROFILE=1 in the environment)
+    'profiling_enabled': False,         # True = time each phase of sampled UI update cycles
+    'profiling_mode': 'phases',         # 'phases' = timings only, 'cprofile' = also write .prof files
+    'profiling_sample_every': 1,        # Measure 1 in N update cycles
+    'profiling_buffer_size': 120,       # How many recent samples to keep in memory
+    'profiling_output_dir': 'profiles', # Where 'cprofile' mode writes its .prof files
+    
+    # === STYLE SETTINGS ===
+    'style_registry_max_size': 4096,    # Sweep never-rendered shared style classes above this many
+
+    # === ICON FONT SETTINGS ===
+    'icon_font_mode': 'embed',          # 'embed' = inline the font in styles.css, 'serve' = load it from the asset server
+    'icon_font_subset': 'auto',         # Keep only the icons your code references (needs: pip install fonttools);
+                                        # 'auto' = unless it picks icons at runtime, True = always, False = never
+    'icon_font_extra_icons': [],        # Icons picked at runtime, e.g. ['home_rounded'] for getattr(Icons, name)
+
     # === NETWORK SETTINGS ===
     'assets_server_port': 8008,         # Port number for serving your app's files (8008 is usually free)
 }
@@ -13,7 +13,7 @@
 #
 # =============================================================================
 
-from typing import Any, List, Optional, Callable
+from typing import Any, Dict, List, Optional, Callable
 import json
 import weakref
 
@@ -108,6 +108,8 @@ class TextEditingController:
     def __init__(self, text: str = ""):
         self._text = text
         self._listeners: List[Callable[[], None]] = []
+        # Text the page reported and is already showing; None once set from code.
+        self._client_text: Optional[str] = None
 
     @property
     def text(self) -> str:
@@ -117,6 +119,17 @@ class TextEditingController:
     @text.setter
     def text(self, new_value: str):
         """Sets the text value and notifies all listeners of the change."""
+        self._client_text = None
+        if self._text != new_value:
+            self._text = new_value
+            self._notify_listeners()
+
+    def _set_from_client(self, new_value: str):
+        """
+        Applies text typed in the page (the TextField's input callback). The
+        page already shows it, so the rebuild does not send it back.
+        """
+        self._client_text = new_value
         if self._text != new_value:
             self._text = new_value
             self._notify_listeners()
@@ -348,6 +361,15 @@ class VirtualListController:
         if self._state:
             self._state.refresh_js(indices=[index]) # Pass a specific index
 
+    def requestCacheStats(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Asks the page for the list's item-cache statistics. `callback` is called
+        later with a dict of `size`, `capacity`, `hits`, `misses`, `evictions`
+        and `hitRate`, which helps pick a `cacheSize` for the list.
+        """
+        if self._state:
+            self._state.request_cache_stats_js(callback)
+
 
 
 
@@ -1,11 +1,7 @@
 # pythra/core.py
 
 # --- ADDED THESE IMPORTS AT THE TOP OF THE FILE ---
-import cProfile
-import pstats
-import io
 import logging
-import base64 
 # --- END OF IMPORTS ---
 
 import os
@@ -27,6 +23,8 @@ from PySide6.QtCore import QTimer
 # Framework imports
 from .config import Config
 from .server import AssetServer
+from .icon_fonts import ICON_FONT_URL_PREFIX, IconFontBuilder, scan_icon_usage
+from .page_resources import PAGE_ORIGIN, PageResources
 from .api import Api
 from .window import webwidget
 
@@ -34,6 +32,13 @@ from .window import webwidget
 from .base import Widget, Key
 from .state import State, StatefulWidget, StatelessWidget
 from .reconciler import Reconciler, Patch, ReconciliationResult
+from .profiling import CycleProfiler
+from .css_manager import StylesheetManager
+from .patch_protocol import serialize_patches
+from .scheduler import FrameScheduler, dirty_ancestor_keys, topmost_dirty_states
+from . import background
+from .background import AsyncLoop, GuiDispatcher
+from .style_registry import style_registry
 from .widgets import *  # Import all widgets for class lookups if needed
 from .package_manager import PackageManager
 from .package_system import PackageType
@@ -52,8 +57,9 @@ try:
 
     def _dumps(obj: Any) -> str:
         """Fast dumps using orjson, returns str."""
-        # orjson.dumps returns bytes
-        return _orjson.dumps(obj).decode('utf-8')
+        # orjson.dumps returns bytes. Int keys (e.g. a virtual list's
+        # initialItems) become strings, as they do with json.dumps.
+        return _orjson.dumps(obj, option=_orjson.OPT_NON_STR_KEYS).decode('utf-8')
 except Exception:
     def _dumps(obj: Any) -> str:
         """Fallback to stdlib json.dumps with compact separators."""
@@ -76,6 +82,7 @@ class Framework:
     """
 
     _instance = None  # Stores the single Framework instance
+    _dirty_ancestor_keys = frozenset()  # Widgets above a dirty State this cycle (never memoized)
     
     @classmethod
     def instance(cls):
@@ -175,15 +182,37 @@ class Framework:
         # STEP 5: Start the Asset Server
         # This serves your static files (images, CSS, JS) to the web browser
         package_asset_dirs = self.package_manager.get_asset_server_dirs()
+        # Subset icon fonts and their cached CSS (see _generate_embedded_font_css)
+        self.icon_font_cache_dir = self.project_root / '.pythra' / 'fonts'
+        if self.config.get('icon_font_mode', 'embed') == 'serve':
+            package_asset_dirs = {**package_asset_dirs, ICON_FONT_URL_PREFIX: str(self.icon_font_cache_dir)}
         self.asset_server = AssetServer(
             directory=str(self.assets_dir),  # Main assets directory
             port=self.config.get("assets_server_port"),  # Port from config
-            extra_serve_dirs=package_asset_dirs  # Plugin asset directories
+            extra_serve_dirs=package_asset_dirs,  # Plugin asset directories
+            immutable_prefixes=[ICON_FONT_URL_PREFIX],  # Font subsets are named by content hash
         )
 
+        # With `page_scheme: pythra` the page, its scripts and the project assets
+        # are served from memory over pythra:// instead of render/ + the AssetServer
+        self.page_scheme = self.config.get('page_scheme', 'file')
+        if self.page_scheme == 'pythra' and not webwidget.SCHEME_AVAILABLE:
+            print("⚠️ PyThra Framework | pythra:// is not available; loading the page from render/ instead.")
+            self.page_scheme = 'file'
+        self.page_resources = PageResources()
+        self.page_resources.mount('', self.render_dir)
+        self.page_resources.mount('assets', self.assets_dir)
+        for prefix, directory in package_asset_dirs.items():
+            self.page_resources.mount(prefix, directory)
+        self._scheme_handler = None
+
         # STEP 6: Initialize core components
         self.api = webwidget.Api()  # Handles JavaScript <-> Python communication
-        self.reconciler = Reconciler()  # Manages UI updates efficiently
+        self.reconciler = Reconciler(  # Manages UI updates efficiently
+            identity_mode=self.config.get('reconciler_identity_mode', 'uuid')
+        )
+        self.profiler = CycleProfiler.from_config(self.config)  # Opt-in update-cycle timings
+        self.css_manager = StylesheetManager()  # One refcounted rule per shared CSS class
         self.root_widget: Optional[Widget] = None  # Your main UI widget
         self.window = None  # The application window
         self.id = "main_window_id"  # Unique ID for the main window
@@ -195,6 +224,15 @@ class Framework:
         # These handle when your UI needs to be updated
         self._reconciliation_requested: bool = False
         self._pending_state_updates: Set[State] = set()
+        # Coalesces setState bursts into at most one update cycle per frame
+        self.frame_scheduler = FrameScheduler(self._process_reconciliation, max_fps=self.config.get('max_fps', 60))
+        self.api.batch_updates = self.frame_scheduler.hold
+        # Background work: setState from worker threads is marshalled back to the
+        # GUI thread, and `async def` handlers run on a Qt-pumped asyncio loop.
+        self.gui_dispatcher = GuiDispatcher()
+        self.async_loop = AsyncLoop(pump_ms=self.config.get('async_pump_ms', 8))
+        self.api.run_coroutine = self.async_loop.create_task
+        background.configure(max_workers=self.config.get('background_workers'))
 
         self._loaded_js_engines: Set[str] = set() # Tracks JS engines already sent to the browser
 
@@ -334,8 +372,7 @@ class Framework:
 
         # 3. Update framework state from the result
         self.reconciler.context_maps["main"] = result.new_rendered_map
-        for cb_id, cb_func in result.registered_callbacks.items():
-            self.api.register_callback(cb_id, cb_func)
+        self.api.register_owned_callbacks(result.registered_callbacks, result.callback_owners)
 
         # 4. Analyze required JS engines for optimization
         required_engines = self._analyze_required_js_engines(built_tree_root, result)
@@ -346,7 +383,7 @@ class Framework:
         # 5. Generate initial HTML, CSS, and JS with optimized loading
         root_key = initial_tree_to_reconcile.get_unique_id() if initial_tree_to_reconcile else None
         html_content = self._generate_html_from_map(root_key, result.new_rendered_map)
-        css_rules = self._generate_css_from_details(result.active_css_details)
+        css_rules = self.css_manager.reset(result.new_rendered_map)
         js_script = self._generate_initial_js_script(result, required_engines)
 
         # 6. Write files
@@ -400,6 +437,11 @@ class Framework:
         # Now `run` just calls the new helper method
         self._perform_initial_render(self.root_widget, title)
 
+        page_url = None
+        if self.page_scheme == 'pythra':
+            self._scheme_handler = webwidget.install_scheme_handler(self.page_resources)
+            page_url = webwidget.PAGE_URL
+
         self.window = webwidget.create_window(
             title,
             self.id,
@@ -410,6 +452,7 @@ class Framework:
             frameless=frameless,
             maximized = maximized,
             fixed_size = fixed_size,
+            url=page_url,
         )
 
         # If any plugins or states queued injections while the window was not
@@ -435,6 +478,8 @@ class Framework:
         # self.asset_server.stop()
         self.window.close_window() if self.window else debug_print("unable to close window: window is None")
         self.asset_server.stop()
+        self.async_loop.close()
+        background.shutdown()
 
     def minimize(self):
         self.window.minimize() if self.window else debug_print("unable to close window: window is None")
@@ -658,46 +703,74 @@ class Framework:
                 self._check_widget_for_clip_path(child, required_engines)
 
     def request_reconciliation(self, state_instance: State):
-        """Called by State.setState to schedule a UI update."""
-        self._pending_state_updates.add(state_instance)
+        """
+        Called by State.setState to schedule a UI update. Any number of calls
+        between two frames share one cycle; see `scheduler.py`.
 
-        if not self._reconciliation_requested:
-            self._reconciliation_requested = True
-            QTimer.singleShot(0, self._process_reconciliation)
+        Calls from worker threads (`@in_background` handlers) are marshalled to
+        the GUI thread first and join the next frame like any other update.
+        """
+        dispatcher = getattr(self, 'gui_dispatcher', None)
+        if dispatcher is not None and not dispatcher.on_gui_thread():
+            dispatcher.call(self.request_reconciliation, state_instance)
+            return
+        self._pending_state_updates.add(state_instance)
+        self._reconciliation_requested = True
+        self.frame_scheduler.request()
 
 
     def _process_reconciliation(self):
         """
         Performs a targeted, high-performance reconciliation cycle for only the
         widgets whose state has changed.
-        """
-        profiler = cProfile.Profile()
-        profiler.enable()
 
+        Phase timings (build, reconcile, css, patch_script, evaluate_js) are
+        recorded by `self.profiler` when profiling is enabled; see `profiling.py`.
+        """
         self._reconciliation_requested = False
         if not self.window:
             print("Error: Window not available for reconciliation.")
             return
 
+        try:
+            with self.profiler.cycle() as sample:
+                self._run_reconciliation_cycle(sample)
+        finally:
+            self._dirty_ancestor_keys = frozenset()
+
+    def _run_reconciliation_cycle(self, sample):
         print("\n🔄 PyThra Framework | Processing Smart UI Update Cycle...")
         start_time = time.time()
 
         main_context_map = self.reconciler.get_map_for_context("main")
+        # Take the dirty set up front: setState calls made during this cycle
+        # (e.g. from didUpdateWidget) land in a fresh set for the next frame.
+        pending_states, self._pending_state_updates = self._pending_state_updates, set()
+        # A dirty ancestor rebuilds its dirty descendants anyway, as long as
+        # no memoized StatelessWidget between them is reused (see _memoized_stateless_children).
+        dirty_states = topmost_dirty_states(pending_states, main_context_map)
+        self._dirty_ancestor_keys = dirty_ancestor_keys(pending_states, main_context_map)
+        if len(dirty_states) < len(pending_states):
+            debug_print(f"🧩 PyThra Framework | Collapsed {len(pending_states)} dirty states into {len(dirty_states)} top-most")
         all_patches = []
         all_new_callbacks = {}
-        all_active_css_details = {}
+        all_callback_owners = {}
+        all_stale_callbacks = {}
+        all_removed_keys = set()
         
         # --- NEW: Track required engines for this entire update cycle ---
         all_required_engines_this_cycle = set()
 
-        for state_instance in self._pending_state_updates:
+        for state_instance in dirty_states:
             widget_to_rebuild = state_instance.get_widget()
             if not widget_to_rebuild:
                 print(f"Warning: Widget for state {state_instance} lost. Skipping update.")
                 continue
 
             widget_key = widget_to_rebuild.get_unique_id()
-            old_widget_data = main_context_map.get(widget_key)
+            # Usually the main map; a widget inside a VirtualListView item lives in that list's context.
+            context_map = self._context_map_for(widget_key)
+            old_widget_data = context_map.get(widget_key)
 
             parent_html_id = "root-container"
             if old_widget_data:
@@ -708,27 +781,55 @@ class Framework:
 
             print(f"🔧 PyThra Framework | Updating: {widget_to_rebuild.__class__.__name__} (ID: {widget_key.__str_key__()[:8]}...)")
 
-            new_subtree = self._build_widget_tree(widget_to_rebuild)
-            subtree_result = self.reconciler.reconcile(
-                previous_map=main_context_map,
-                new_widget_root=new_subtree,
-                parent_html_id=parent_html_id,
-                old_root_key=widget_key,
-                is_partial_reconciliation=True
-            )
+            with sample.phase("build"):
+                new_subtree = self._build_widget_tree(widget_to_rebuild)
+            with sample.phase("reconcile"):
+                subtree_result = self.reconciler.reconcile(
+                    previous_map=context_map,
+                    new_widget_root=new_subtree,
+                    parent_html_id=parent_html_id,
+                    old_root_key=widget_key,
+                    is_partial_reconciliation=True
+                )
 
             all_patches.extend(subtree_result.patches)
             all_new_callbacks.update(subtree_result.registered_callbacks)
-            all_active_css_details.update(subtree_result.active_css_details)
-            main_context_map.update(subtree_result.new_rendered_map)
+            for cb_id, owners in subtree_result.callback_owners.items():
+                all_callback_owners.setdefault(cb_id, set()).update(owners)
+            all_stale_callbacks.update(subtree_result.stale_callbacks)
+            # Nodes the reconciler removed (REMOVE/REPLACE) drop their style
+            # references and leave the map, so neither grows without bound.
+            removed_keys = self._collect_removed_keys(context_map, subtree_result)
+            context_map.update(subtree_result.new_rendered_map)
+            if context_map is not main_context_map:
+                # Nest new nodes' callbacks under their parents, so evicting the item releases them.
+                for key, entry in subtree_result.new_rendered_map.items():
+                    if entry.get("parent_key") is not None:
+                        self.api.link_owner(key, entry["parent_key"])
+            self.css_manager.update_entries(subtree_result.new_rendered_map)
+            self.css_manager.release_entries(removed_keys)
+            for key in removed_keys:
+                entry = context_map.pop(key, None)
+                # Only nodes in a list's own context are disposed: they belong to
+                # an item, which is rebuilt from itemBuilder. A main-tree widget
+                # can come back (e.g. a cached Navigator page) with the same State.
+                if context_map is not main_context_map:
+                    self._dispose_removed_entry(entry)
+            all_removed_keys.update(removed_keys)
             
             # --- NEW: Analyze this subtree and aggregate required engines ---
             required_in_subtree = self._analyze_required_js_engines(new_subtree, subtree_result)
             all_required_engines_this_cycle.update(required_in_subtree)
             # --- END NEW ---
 
-        for cb_id, cb_func in all_new_callbacks.items():
-            self.api.register_callback(cb_id, cb_func)
+        # Register first, then release: a callback name that moved from a removed
+        # widget to its replacement keeps its new owner and survives, and a name
+        # shared with widgets still on screen keeps their claims.
+        self.api.register_owned_callbacks(all_new_callbacks, all_callback_owners)
+        released = self.api.release_stale_callbacks(all_stale_callbacks)
+        released += self.api.release_owners(all_removed_keys)
+        if released:
+            debug_print(f"🧹 PyThra Framework | Released {released} callbacks {self.api.callback_registry_stats()}")
 
         # --- NEW: DYNAMIC JS ENGINE INJECTION LOGIC ---
         js_injection_script = ""
@@ -740,49 +841,36 @@ class Framework:
             self._loaded_js_engines.update(newly_required_engines)
         # --- END OF NEW LOGIC ---
 
-        new_css_keys = set(all_active_css_details.keys())
-        css_update_script = ""
-        if not hasattr(self, '_last_css_keys') or self._last_css_keys != new_css_keys:
-            print("🎨 PyThra Framework | CSS styles changed - Updating stylesheet...")
-            full_css_details = {
-                data['props']['css_class']: (type(data['widget_instance']).generate_css_rule, data['widget_instance'].style_key)
-                for data in main_context_map.values()
-                if 'css_class' in data['props'] and hasattr(data['widget_instance'], 'style_key')
-            }
-            css_rules = self._generate_css_from_details(full_css_details)
-            css_update_script = self._generate_css_update_script(css_rules)
-            self._last_css_keys = new_css_keys
-        else:
-            print("✅ PyThra Framework | CSS styles unchanged - Skipping regeneration")
+        with sample.phase("css"):
+            css_delta = self.css_manager.flush()
+            css_update_script = ""
+            if css_delta:
+                print(f"🎨 PyThra Framework | CSS styles changed - +{len(css_delta.added)} / -{len(css_delta.removed)} rules")
+                css_update_script = self._generate_css_delta_script(css_delta)
+                self._collect_unused_styles(css_delta.removed)
+            else:
+                print("✅ PyThra Framework | CSS styles unchanged - Skipping regeneration")
 
-        dom_patch_script = self._generate_dom_patch_script(all_patches, js_initializers=[])
+        with sample.phase("patch_script"):
+            dom_patch_script = self._generate_dom_patch_script(all_patches, js_initializers=[])
 
-        # --- CRITICAL: Prepend the JS injection script to the DOM patches ---
-        combined_script = (js_injection_script + "\n" + css_update_script + "\n" + dom_patch_script).strip()
+            # --- CRITICAL: Prepend the JS injection script to the DOM patches ---
+            combined_script = (js_injection_script + "\n" + css_update_script + "\n" + dom_patch_script).strip()
 
         if combined_script:
             print(f"🛠️  PyThra Framework | Applying {len(all_patches)} UI changes to app...")
             debug_print(f"📝 PyThra Framework | Patch Details: {[f'{p.action}({p.html_id[:8]}...)' for p in all_patches]}")
-            self.window.evaluate_js(self.id, combined_script)
+            with sample.phase("evaluate_js"):
+                self.window.evaluate_js(self.id, combined_script)
         else:
             print("✨ PyThra Framework | UI is up-to-date - No changes needed")
 
-        self._pending_state_updates.clear()
-
         end_time = time.time()
         cycle_duration = end_time - start_time
         fps = 1.0 / cycle_duration if cycle_duration > 0 else float('inf')
 
         print(f"🎉 PyThra Framework | UI Update Complete! at (⏱️ {cycle_duration:.4f}s) ({(cycle_duration * 1000):.2f}ms) ({fps:.2f} FPS)")
         
-        profiler.disable()
-        s = io.StringIO()
-        ps = pstats.Stats(profiler, stream=s).sort_stats('cumulative')
-        ps.print_stats(20)
-        print("\n--- cProfile Report ---")
-        print(s.getvalue())
-        print("--- End of Report ---\n")
-        
     # --- Widget Tree Building ---
     def _build_widget_tree(self, widget: Optional[Widget]) -> Optional[Widget]:
         """
@@ -822,6 +910,14 @@ class Framework:
         # --- THIS IS THE FIX ---
         # Handle StatelessWidget and StatefulWidget with the same pattern.
         if isinstance(widget, StatelessWidget):
+            # 0. Memoization: reuse the previous subtree when shouldRebuild() says so.
+            #    The reconciler sees `_reused_build` and skips diffing this subtree.
+            widget._reused_build = False
+            previous_children = self._memoized_stateless_children(widget)
+            if previous_children is not None:
+                widget._children = previous_children
+                widget._reused_build = True
+                return widget
             # 1. Build the child widget from the StatelessWidget.
             built_child = widget.build()
             # 2. Recursively process the built child to build its own subtree.
@@ -864,6 +960,25 @@ class Framework:
                 widget._children = new_children
             return widget
 
+    def _memoized_stateless_children(self, widget: StatelessWidget) -> Optional[List[Widget]]:
+        """
+        Returns the previously built children of `widget` if its last rendered
+        instance can be reused (see `StatelessWidget.shouldRebuild`), else None.
+        A subtree holding a dirty State is always rebuilt, since the cycle
+        relies on this rebuild to reach it.
+        """
+        if widget.get_unique_id() in self._dirty_ancestor_keys:
+            return None
+        old_data = self.reconciler.get_map_for_context("main").get(widget.get_unique_id())
+        if not old_data:
+            return None
+        old_widget = old_data.get("widget_instance")
+        if type(old_widget) is not type(widget) or not old_widget.get_children():
+            return None
+        if widget.shouldRebuild(old_widget):
+            return None
+        return old_widget.get_children()
+
     # --- HTML and CSS Generation ---
 
     # --- ADD THIS NEW METHOD ---
@@ -937,39 +1052,68 @@ class Framework:
 
         return stub
 
-    def _generate_css_from_details(
-        self, css_details: Dict[str, Tuple[Callable, Any]]
-    ) -> str:
-        """Generates CSS rules directly from the details collected by the Reconciler."""
-        all_rules = []
-        for css_class, (generator_func, style_key) in css_details.items():
-            try:
-                rule = generator_func(style_key, css_class)
-                if rule:
-                    all_rules.append(rule)
-                    # print("Rule: ",rule)
-            except Exception as e:
-                import traceback
-
-                print(f"💥 ERROR generating CSS for class '{css_class}': {e}")
-                traceback.print_exc()
-
-        print(f"🪄  PyThra Framework | Generated CSS for {len(all_rules)} active shared classes.")
-        # print(f"Rules: {all_rules}")
-        return "\n".join(all_rules)
-
     # --- Script Generation and File Writing ---
 
-    def _generate_css_update_script(self, css_rules: str) -> str:
-        """Generates JS to update the <style id="dynamic-styles"> tag."""
-        escaped_css = _dumps(css_rules).replace("`", "\\`")
-        return f"""
-            var styleSheet = document.getElementById('dynamic-styles');
-            var newCss = {escaped_css};
-            if (styleSheet.textContent !== newCss) {{
-                 styleSheet.textContent = newCss;
-            }}
+    def _collect_unused_styles(self, removed_classes: List[str]) -> None:
+        """
+        Evicts classes that lost their last reference from the widgets'
+        shared_styles tables and the rule cache. Once the tables outgrow
+        `style_registry_max_size`, also sweeps classes that were minted but never
+        rendered (e.g. intermediate animation frames).
+        """
+        collected = style_registry.collect(removed_classes)
+        if style_registry.size() > self.config.get("style_registry_max_size", 4096):
+            collected += style_registry.sweep(self.css_manager.live_classes)
+        self.css_manager.forget(removed_classes)
+        if collected:
+            debug_print(f"🧹 PyThra Framework | Collected {collected} unused style classes {style_registry.metrics()}")
+
+    def style_metrics(self) -> Dict[str, Any]:
+        """Live/collected shared style classes plus live stylesheet rules, for debugging."""
+        metrics = style_registry.metrics()
+        metrics["stylesheet_rules"] = len(self.css_manager.live_classes)
+        return metrics
+
+    def _generate_css_delta_script(self, delta) -> str:
+        """Generates JS that inserts/deletes only the changed rules in <style id="dynamic-styles">."""
+        payload = _dumps({"add": delta.added, "remove": delta.removed})
+        return f"window.pythraApplyCssDelta({payload});"
+
+    def _context_map_for(self, widget_key) -> Dict:
+        """The rendered map (main, or a widget's own context such as a virtual list) holding `widget_key`."""
+        main_context_map = self.reconciler.get_map_for_context("main")
+        if widget_key in main_context_map:
+            return main_context_map
+        for context_map in self.reconciler.context_maps.values():
+            if widget_key in context_map:
+                return context_map
+        return main_context_map
+
+    @staticmethod
+    def _dispose_removed_entry(entry: Optional[Dict]) -> None:
+        """Runs State.dispose() for a StatefulWidget that left the tree for good."""
+        widget = entry.get("widget_instance") if entry else None
+        if isinstance(widget, StatefulWidget):
+            state = widget.get_state()
+            if state:
+                state.dispose()
+    @staticmethod
+    def _collect_removed_keys(rendered_map: Dict, result: ReconciliationResult) -> Set:
         """
+        Expands the reconciler's removed roots into every rendered-map key under
+        them, skipping nodes that survived into the new map (e.g. keyed moves).
+        """
+        survivors = result.new_rendered_map
+        keys = set()
+        stack = list(result.removed_keys)
+        while stack:
+            key = stack.pop()
+            entry = rendered_map.get(key)
+            if entry is None or key in keys or key in survivors:
+                continue
+            keys.add(key)
+            stack.extend(entry.get("children_keys", []))
+        return keys
 
     def _build_path_from_commands(self, commands_data: List[Dict]) -> str:
         """
@@ -1020,6 +1164,21 @@ class Framework:
             return "<non-serializable>"
 
     def _generate_dom_patch_script(self, patches: List[Patch], js_initializers=None) -> str:
+        """
+        Converts the list of Patch objects from the reconciler into the script sent to
+        the page. With `patch_protocol: 'json'` (the default) this is a single
+        `window.applyPatches(<batch>)` call carrying data only; `'script'` falls back
+        to the legacy generator that writes one JS block per patch.
+        """
+        config = getattr(self, 'config', None)
+        if config is not None and config.get('patch_protocol', 'json') == 'script':
+            return self._generate_dom_patch_script_legacy(patches, js_initializers)
+        batch = serialize_patches(patches)
+        if not batch:
+            return ""
+        return f"window.applyPatches({_dumps(batch)});"
+
+    def _generate_dom_patch_script_legacy(self, patches: List[Patch], js_initializers=None) -> str:
         """Converts the list of Patch objects from the reconciler into executable JavaScript."""
         js_commands = []
         old_id = None
@@ -1278,7 +1437,7 @@ class Framework:
                 command_js = f'var el = document.getElementById("{target_id}"); if(el) el.remove();'
             elif action == "UPDATE":
                 # Pass the element's ID to the prop updater, not the element itself
-                prop_update_js = self._generate_prop_update_js(target_id, data["props"])
+                prop_update_js = self._generate_prop_update_js(target_id, data["props"], context=data.get("context"))
                 if prop_update_js:
                     command_js = f"""
                         var elToUpdate = document.getElementById("{target_id}");
@@ -1433,12 +1592,17 @@ class Framework:
         return "\n".join(js_commands)
 
     def _generate_prop_update_js(
-        self, target_id: str, props: Dict, is_insert: bool = False
+        self, target_id: str, props: Dict, is_insert: bool = False, context: Optional[Dict] = None
     ) -> str:
-        """Generates specific JS commands for updating element properties."""
+        """
+        Generates specific JS commands for updating element properties. For UPDATE
+        patches `props` holds only the changed keys; `context` holds unchanged
+        props (css_class, isDragEnded) used to decide where a value goes.
+        """
         js_prop_updates = []
         style_updates = {}
         element_var = "insertedEl" if is_insert else "elToUpdate"
+        view = {**context, **props} if context else props
 
         # --- Special handling for TextField value to prevent cursor jumping ---
         # if props.get('onChangedName'): # A good heuristic for input-like elements
@@ -1491,7 +1655,7 @@ class Framework:
             elif key == "tooltip":
                 js_prop_updates.append(f"{element_var}.title = {_dumps(value)};")
             
-            elif key == "value" and "textfield" in props.get(
+            elif key == "value" and "textfield" in view.get(
                 "css_class", ""
             ):
                 # This is a value update for a TextField. Target the inner input.
@@ -1517,7 +1681,7 @@ class Framework:
                 """)
                 # --- END OF LOGGING ---
 
-            elif key == "errorText" and "textfield-root-container" in props.get(
+            elif key == "errorText" and "textfield-root-container" in view.get(
                 "css_class", ""
             ):
                 # This is an errorText update for a TextField. Target the helper div.
@@ -1526,6 +1690,15 @@ class Framework:
                     f"var helperEl = document.getElementById('{helper_id}'); if(helperEl) helperEl.textContent = {_dumps(str(value))};"
                 )
 
+            elif key in ("commitOn", "debounceMs") and "textfield-root-container" in view.get(
+                "css_class", ""
+            ):
+                # The input reads data-commit-on / data-debounce-ms on every keystroke.
+                dataset_value = (value or "change") if key == "commitOn" else str(value or 0)
+                js_prop_updates.append(
+                    f"var fieldEl = document.getElementById('{target_id}_input'); if(fieldEl) fieldEl.dataset.{key} = {_dumps(dataset_value)};"
+                )
+
             # elif key == 'value' and 'onChangedName' in props: # Check if it's a TextField
             #         input_element = f"document.getElementById('{target_id}_input')" if not is_insert else f"{element_var}.querySelector('.textfield-input')"
             #         js_prop_updates.append(f"var inputEl = {input_element}; if(inputEl && inputEl.value !== {json.dumps(value)}) {{ inputEl.value = {json.dumps(value)}; }}")
@@ -1557,14 +1730,14 @@ class Framework:
                     ["-" + c.lower() if c.isupper() else c for c in style_key]
                 ).lstrip("")
                 # print("css_prop_kebab: ", css_prop_kebab, f"{_dumps(style_value)}")
-                if css_prop_kebab == "--slider-percentage" and props.get("isDragEnded"):
-                    print("drag css", props["isDragEnded"])
+                if css_prop_kebab == "--slider-percentage" and view.get("isDragEnded"):
+                    print("drag css", view["isDragEnded"])
                     js_prop_updates.append(
                         f"try {{ {element_var}.style.setProperty('{css_prop_kebab}', {_dumps(style_value)}); }} catch (e) {{ console.warn('Failed to set CSS property {css_prop_kebab}:', e); }}"
                     )
-                elif css_prop_kebab == "--slider-percentage" and not props.get("isDragEnded"):
-                    print("drag css", props.get("isDragEnded"))
-                elif css_prop_kebab != "--slider-percentage" and "isDragEnded" not in props:
+                elif css_prop_kebab == "--slider-percentage" and not view.get("isDragEnded"):
+                    print("drag css", view.get("isDragEnded"))
+                elif css_prop_kebab != "--slider-percentage" and "isDragEnded" not in view:
                     js_prop_updates.append(
                         f"try {{ {element_var}.style.setProperty('{css_prop_kebab}', {_dumps(style_value)}); }} catch (e) {{ console.warn('Failed to set CSS property {css_prop_kebab}:', e); }}"
                     )
@@ -1629,6 +1802,8 @@ class Framework:
                     if not os.path.isabs(module_path):
                         module_path = os.path.join(self.project_root, module_path)
                     path_js = module_path
+                    # pythra:// only serves absolute paths it has been told about.
+                    self.page_resources.allow_root(os.path.dirname(module_path))
                     imports.add(f"import {{ {engine_name} }} from '{path_js}';")
                     
                     options_json = _dumps(options)
@@ -1909,63 +2084,55 @@ class Framework:
 
     def _generate_embedded_font_css(self) -> str:
         """
-        Reads TTF files from assets/fonts, converts to Base64, and returns CSS.
-        This eliminates FOUT (Flash of Unstyled Text) by embedding fonts directly.
+        Returns the @font-face CSS for the icon fonts.
+        Fonts are inlined (or, with `icon_font_mode: serve`, served from the
+        same place as the page: the AssetServer, or pythra:// with
+        `page_scheme: pythra`) so icons render without FOUT (Flash of Unstyled Text).
+        Each font is subset to the icons the app references and the result is
+        cached on disk, keyed by the font's hash (see icon_fonts.py). With
+        `icon_font_subset: auto`, code that picks icons at runtime
+        (`getattr(Icons, name)`, `IconData(...)`) keeps the full fonts.
         """
         if self._cached_font_css:
             return self._cached_font_css
 
         print("🔤 PyThra Framework | Embedding fonts into CSS for instant rendering...")
-        
-        # Map the Font Name to the Filename
-        fonts_to_load = [
-            ("Material Symbols Outlined", "MaterialSymbolsOutlined.ttf"),
-            ("Material Symbols Rounded", "MaterialSymbolsRounded.ttf"),
-            ("Material Symbols Sharp", "MaterialSymbolsSharp.ttf"),
-        ]
-
-        css_rules = []
-        fonts_dir = self.assets_dir / "fonts"
-
-        for font_family, filename in fonts_to_load:
-            file_path = fonts_dir / filename
-            
-            # 1. Try to load file and converting to Base64
-            if file_path.exists():
-                try:
-                    with open(file_path, "rb") as f:
-                        # Read binary, encode to b64 bytes, decode to utf-8 string
-                        b64_str = base64.b64encode(f.read()).decode("utf-8")
-                    
-                    rule = f"""
-                    @font-face {{
-                        font-family: '{font_family}';
-                        font-style: normal;
-                        font-weight: 100 700;
-                        font-display: block; /* Hides text until icon is ready */
-                        src: url(data:font/truetype;charset=utf-8;base64,{b64_str}) format('truetype');
-                    }}
-                    """
-                    css_rules.append(rule)
-                    # print(f"   ✅ Embedded {filename}")
-                except Exception as e:
-                    print(f"   ⚠️ Error embedding {filename}: {e}")
-                    # Fallback logic below will trigger
-            else:
-                # 2. Fallback: Use Localhost URL if file is missing
-                print(f"   ⚠️ Font file missing: {filename}. Falling back to network URL.")
-                port = self.config.get('assets_server_port')
-                rule = f"""
-                @font-face {{
-                   font-family: '{font_family}';
-                   font-style: normal;
-                   font-weight: 100 700;
-                   src: url(http://localhost:{port}/fonts/{filename}) format('truetype');
-                }}
-                """
-                css_rules.append(rule)
 
-        self._cached_font_css = "\n".join(css_rules)
+        references = None
+        subset = self.config.get('icon_font_subset', 'auto')
+        if subset not in ('auto', True, False):
+            raise ValueError(f"icon_font_subset must be 'auto', true or false, got {subset!r}")
+        if subset:
+            # The app's own code plus PyThra's widgets (e.g. the dropdown arrow).
+            scan = scan_icon_usage(
+                [self.project_root, Path(__file__).parent],
+                extra_icons=self.config.get('icon_font_extra_icons') or (),
+                cache_path=self.icon_font_cache_dir / 'icon-scan.json',
+            )
+            dynamic = ", ".join(str(path) for path in scan.dynamic_files[:3])
+            if scan.dynamic_files and subset == 'auto':
+                print(f"⚠️ PyThra Framework | Icons are picked at runtime in {dynamic}; using the full icon fonts. "
+                      "List those icons in icon_font_extra_icons and set icon_font_subset: true to subset.")
+            else:
+                if scan.dynamic_files:
+                    print(f"⚠️ PyThra Framework | Icons are picked at runtime in {dynamic}; "
+                          "any not listed in icon_font_extra_icons will render blank.")
+                references = scan.references
+
+        base_url = assets_url = None  # The AssetServer on localhost
+        if self.page_scheme == 'pythra':
+            # page_resources mounts the font cache at ICON_FONT_URL_PREFIX and assets/ at 'assets'.
+            base_url, assets_url = PAGE_ORIGIN, f"{PAGE_ORIGIN}/assets"
+        builder = IconFontBuilder(
+            fonts_dir=self.assets_dir / "fonts",
+            cache_dir=self.icon_font_cache_dir,
+            mode=self.config.get('icon_font_mode', 'embed'),
+            subset=references is not None,
+            port=self.config.get('assets_server_port'),
+            base_url=base_url,
+            assets_url=assets_url,
+        )
+        self._cached_font_css = builder.build_css(references)
         return self._cached_font_css
 
     def _write_initial_files(
@@ -2055,6 +2222,12 @@ class Framework:
             </head>\n<body>\n    <div id=\"root-container\">{html_content}</div>\n    <div id=\"overlay-container\"></div>\n\n    <!-- ADD SIMPLEBAR JS -->\n    <script src=\"./js/scroll-bar/simplebar.min.js\"></script>\n    <!-- ADD THE NEW SLIDER JS ENGINE -->\n    {initial_js}\n</body>\n</html>"""
         )
 
+        if self.page_scheme == 'pythra':
+            # Served from memory by the pythra:// handler; nothing goes to render/.
+            self.page_resources.put('index.html', html_output)
+            self.page_resources.put('styles.css', css_output)
+            return
+
         try:
             # If we've written initial files before and cached content matches, skip writes
             if self._initial_files_written:
@@ -2102,11 +2275,24 @@ class Framework:
         except Exception as e:
             print(f"Error preparing initial files: {e}")
 
+    _PATCH_APPLIER_PATH = Path(__file__).parent / "render_template" / "js" / "patch_applier.js"
+
+    def _get_patch_applier_js(self) -> str:
+        """The resident `applyPatches` interpreter, read once from the package."""
+        content = self._js_file_content_cache.get(str(self._PATCH_APPLIER_PATH))
+        if content is None:
+            content = self._PATCH_APPLIER_PATH.read_text(encoding='utf-8')
+            self._js_file_content_cache[str(self._PATCH_APPLIER_PATH)] = content
+        return content
+
     def _get_js_includes(self):
         """Generates standard script includes for QWebChannel and event handling."""
         return f"""
         <script src="qwebchannel.js"></script>
         <script>
+{self._get_patch_applier_js()}
+        </script>
+        <script>
             // Suppress inset-area deprecation warnings
             (function() {{
                 const originalWarn = console.warn;
@@ -2127,6 +2313,33 @@ class Framework:
                     console.log("PyWebChannel connected.");
                 }});
             }});
+            // Incremental stylesheet updates: one tracked group of rules per shared class.
+            window.pythraApplyCssDelta = function(delta) {{
+                const sheet = document.getElementById('dynamic-styles').sheet;
+                let live = window._pythraCssRules;
+                if (!live) {{
+                    // First delta: index the rules that came with the initial page by class name.
+                    live = window._pythraCssRules = {{}};
+                    for (const rule of sheet.cssRules) {{
+                        for (const m of (rule.selectorText || '').matchAll(/\\.([\\w-]+)/g)) {{
+                            (live[m[1]] = live[m[1]] || []).push(rule);
+                        }}
+                    }}
+                }}
+                for (const cls of delta.remove || []) {{
+                    for (const rule of live[cls] || []) {{
+                        const index = Array.prototype.indexOf.call(sheet.cssRules, rule);
+                        if (index >= 0) sheet.deleteRule(index);
+                    }}
+                    delete live[cls];
+                }}
+                for (const [cls, text] of Object.entries(delta.add || {{}})) {{
+                    const scratch = new CSSStyleSheet();
+                    try {{ scratch.replaceSync(text); }} catch (e) {{ console.warn('Bad CSS for', cls, e); continue; }}
+                    live[cls] = Array.from(scratch.cssRules, (rule) =>
+                        sheet.cssRules[sheet.insertRule(rule.cssText, sheet.cssRules.length)]);
+                }}
+            }};
             function handleClick(name) {{ if(window.pywebview) window.pywebview.on_pressed_str(name, ()=>{{}}); }}
             function handleClickWithArgs(callback_name, ...args) {{
                 if (window.pywebview) {{
@@ -2141,11 +2354,17 @@ class Framework:
                 }}
             }}
             function handleItemTap(name, index) {{ if(window.pywebview) window.pywebview.on_item_tap(name, index, ()=>{{}}); }}
-            function handleInput(name, value) {{
-                if(window.pywebview) {{
+            function handleInput(name, value, el) {{
+                // TextFields pass their element so its debounce / commitOn settings apply.
+                if (el && window.pythraInput) {{
+                    window.pythraInput(name, el, 'input');
+                }} else if(window.pywebview) {{
                     window.pywebview.on_input_changed(name, value, ()=>{{}});
                 }}
             }}
+            function commitInput(name, el, trigger) {{
+                if (window.pythraInput) window.pythraInput(name, el, trigger);
+            }}
         </script>
         """
 
@@ -0,0 +1,176 @@
+# =============================================================================
+# PYTHRA STYLESHEET MANAGER - Incremental Updates for Shared CSS Classes
+# =============================================================================
+
+"""
+PyThra Incremental Stylesheet Manager
+
+Widgets such as `Container` and `Text` share one generated CSS class per unique
+`style_key` (e.g. `shared-container-3`). Instead of regenerating the whole
+`<style id="dynamic-styles">` block whenever that set changes, this manager:
+
+- keeps exactly one rule per shared class,
+- reference-counts each class by the rendered-map entries that use it,
+- caches the rule string generated for each `(css_class, style_key)`, and
+- hands the framework a delta (classes to add / classes to drop) that the
+  browser applies with `CSSStyleSheet.insertRule` / `deleteRule`.
+
+```python
+manager = StylesheetManager()
+css_text = manager.reset(initial_rendered_map)   # full text for the first page
+manager.update_entries(subtree_result.new_rendered_map)
+manager.release_entries(stale_keys)
+delta = manager.flush()                           # CssDelta(added={...}, removed=[...])
+```
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Tuple
+
+
+CssDetails = Dict[str, Tuple[Callable, Any]]
+
+
+def css_details_for_entry(entry: Dict[str, Any]) -> CssDetails:
+    """
+    The shared classes (and their rule generators) a rendered-map entry needs.
+    Mirrors `Reconciler._collect_details` so both agree on what is "active".
+    """
+    widget = entry.get("widget_instance")
+    if widget is None:
+        return {}
+    widget_type = type(widget)
+    generator = getattr(widget_type, "generate_css_rule", None)
+    if generator is None or not hasattr(widget, "style_key"):
+        return {}
+    classes = set((entry.get("props") or {}).get("css_class", "").split())
+    if hasattr(widget, "get_required_css_classes"):
+        classes.update(widget.get_required_css_classes())
+    style_key = widget.style_key
+    return {css_class: (generator, style_key) for css_class in classes if css_class}
+
+
+@dataclass
+class CssDelta:
+    """Rules to insert (class -> rule text) and classes whose rules should be deleted."""
+    added: Dict[str, str] = field(default_factory=dict)
+    removed: List[str] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed)
+
+
+class StylesheetManager:
+    def __init__(self):
+        self._refcounts: Dict[str, int] = {}
+        self._details: CssDetails = {}
+        # Which classes each rendered-map key currently holds a reference to.
+        self._entry_classes: Dict[Any, FrozenSet[str]] = {}
+        # Classes whose rule is currently in the live stylesheet.
+        self._live: Dict[str, str] = {}
+        # css_class -> {style_key: generated rule text}
+        self._rule_cache: Dict[str, Dict[Any, str]] = {}
+
+    # --- Rule generation ---
+
+    def rule_for(self, css_class: str, generator: Callable, style_key: Any) -> str:
+        """Generates (or returns the cached) rule text for one shared class."""
+        per_class = self._rule_cache.setdefault(css_class, {})
+        rule = per_class.get(style_key)
+        if rule is None:
+            try:
+                rule = generator(style_key, css_class) or ""
+            except Exception as e:
+                import traceback
+
+                print(f"💥 ERROR generating CSS for class '{css_class}': {e}")
+                traceback.print_exc()
+                rule = ""
+            per_class[style_key] = rule
+        return rule
+
+    def forget(self, css_classes: Iterable[str]) -> None:
+        """Drops cached rule text for classes that were garbage-collected."""
+        for css_class in css_classes:
+            if css_class not in self._refcounts:
+                self._rule_cache.pop(css_class, None)
+
+    # --- Reference counting ---
+
+    def reset(self, rendered_map: Dict[Any, Dict[str, Any]]) -> str:
+        """
+        Rebuilds all bookkeeping from a complete rendered map (initial render)
+        and returns the full stylesheet text. The returned rules count as live.
+        """
+        self._refcounts.clear()
+        self._details.clear()
+        self._entry_classes.clear()
+        self._live.clear()
+        self.update_entries(rendered_map)
+        for css_class, (generator, style_key) in self._details.items():
+            rule = self.rule_for(css_class, generator, style_key)
+            if rule:
+                self._live[css_class] = rule
+        return "\n".join(self._live.values())
+
+    def update_entries(self, entries: Dict[Any, Dict[str, Any]]) -> None:
+        """Acquires/releases references for entries that were inserted or updated."""
+        for key, entry in entries.items():
+            details = css_details_for_entry(entry)
+            new_classes = frozenset(details)
+            old_classes = self._entry_classes.get(key, frozenset())
+            if new_classes == old_classes:
+                continue
+            for css_class in new_classes - old_classes:
+                self._refcounts[css_class] = self._refcounts.get(css_class, 0) + 1
+                self._details[css_class] = details[css_class]
+            self._release(old_classes - new_classes)
+            if new_classes:
+                self._entry_classes[key] = new_classes
+            else:
+                self._entry_classes.pop(key, None)
+
+    def release_entries(self, keys: Iterable[Any]) -> None:
+        """Drops the references held by entries that left the rendered map."""
+        for key in keys:
+            self._release(self._entry_classes.pop(key, frozenset()))
+
+    def _release(self, classes: Iterable[str]) -> None:
+        for css_class in classes:
+            count = self._refcounts.get(css_class, 0) - 1
+            if count > 0:
+                self._refcounts[css_class] = count
+            else:
+                self._refcounts.pop(css_class, None)
+
+    # --- Deltas ---
+
+    def flush(self) -> CssDelta:
+        """
+        Compares referenced classes with the live stylesheet and returns the
+        minimal delta, marking it as applied.
+        """
+        delta = CssDelta()
+        for css_class in self._refcounts:
+            if css_class in self._live:
+                continue
+            generator, style_key = self._details[css_class]
+            rule = self.rule_for(css_class, generator, style_key)
+            if rule:
+                delta.added[css_class] = rule
+                self._live[css_class] = rule
+        for css_class in [c for c in self._live if c not in self._refcounts]:
+            del self._live[css_class]
+            delta.removed.append(css_class)
+        for css_class in [c for c in self._details if c not in self._refcounts]:
+            del self._details[css_class]
+        return delta
+
+    # --- Introspection ---
+
+    def refcount(self, css_class: str) -> int:
+        return self._refcounts.get(css_class, 0)
+
+    @property
+    def live_classes(self) -> FrozenSet[str]:
+        return frozenset(self._live)
@@ -10,7 +10,6 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from pythra.pythra.styles import *
 from pythra.pythra.widgets import *
 from pythra.pythra.state import *
-from pythra.pythra import Framework 
 from .controller import DerivedDropdownController
 from .style import DerivedDropdownTheme
 from typing import Callable, List, Optional
@@ -467,6 +466,8 @@ class MyForm(StatefulWidget):
 
 
 if __name__ == "__main__":
+    from pythra.pythra import Framework
+
     # It's crucial to instantiate the Framework *before* any widgets are created.
     app = Framework.instance()
 
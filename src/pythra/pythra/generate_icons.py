@@ -1,50 +1,37 @@
 # generate_icons.py
+#
+# Rebuilds the icon codepoint table from the Material Symbols `codepoints.txt`.
+# `Icons` (pythra/icons/__init__.py) resolves attributes from this table lazily,
+# so nothing per-icon is generated any more.
+
+import os
+
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
 # Path to the codepoints file you downloaded
-CODEPOINTS_FILE = "C:\\Users\\SMILETECH COMPUTERS\\Documents\\pythra_0.0.2_new_state\\pythra\\codepoints.txt"
-# Path where you want to save the generated Python file
-OUTPUT_FILE = "pythra/icons.py"
+CODEPOINTS_FILE = os.path.join(_HERE, "codepoints.txt")
+# Path where the compact table is written
+OUTPUT_FILE = os.path.join(_HERE, "icons", "_codepoints.py")
 
 def generate():
-    icon_names = []
+    entries = []
     with open(CODEPOINTS_FILE, 'r') as f:
         for line in f:
             parts = line.strip().split()
             if parts:
-                icon_names.append(parts[0])
+                name, codepoint = parts[0], parts[1]
+                int(codepoint, 16)  # Fail early on a malformed line.
+                entries.append(f"{name} {codepoint}")
 
     with open(OUTPUT_FILE, 'w') as f:
-        f.write("# pythra/icons.py\n")
-        f.write("# This file is auto-generated. Do not edit manually.\n\n")
-        f.write("from dataclasses import dataclass\n\n")
-        f.write("@dataclass(frozen=True)\n")
-        f.write("class IconData:\n")
-        f.write('    """An immutable data class representing an icon from a font."""\n')
-        f.write("    name: str\n")
-        f.write("    fontFamily: str\n\n")
-        f.write("class Icons:\n")
-        f.write('    """A helper class containing static references to all Material Symbols."""\n')
-
-        # Generate for all three styles
-        styles = {
-            "outlined": "Material Symbols Outlined",
-            "rounded": "Material Symbols Rounded",
-            "sharp": "Material Symbols Sharp"
-        }
-
-        for style_suffix, font_family in styles.items():
-            for name in icon_names:
-                # Python identifiers can't start with a number.
-                var_name = f"_{name}" if name[0].isdigit() else name
-                f.write(f"    {var_name}_{style_suffix} = IconData(name=\"{name}\", fontFamily=\"{font_family}\")\n")
-            f.write("\n")
-
-        # Create default versions (e.g., Icons.home points to Icons.home_outlined)
-        for name in icon_names:
-            var_name = f"_{name}" if name[0].isdigit() else name
-            f.write(f"    {var_name} = {var_name}_outlined\n")
+        f.write("# This file is auto-generated by generate_icons.py from codepoints.txt. Do not edit manually.\n")
+        f.write("# One \"name codepoint\" pair per line; parsed on first icon access (see icons/__init__.py).\n\n")
+        f.write('CODEPOINTS = """\\\n')
+        f.write("\n".join(entries) + "\n")
+        f.write('"""\n')
 
-        print(f"Successfully generated {len(icon_names) * 4} icon references in {OUTPUT_FILE}")
+    # Each name is reachable as <name>, <name>_outlined, <name>_rounded and <name>_sharp.
+    print(f"Successfully wrote {len(entries)} codepoints ({len(entries) * 4} icon references) to {OUTPUT_FILE}")
 
 if __name__ == "__main__":
-    generate()
\ No newline at end of file
+    generate()
@@ -0,0 +1,383 @@
+# pythra/icon_fonts.py
+
+"""
+Icon font subsetting and caching.
+
+The Material Symbols fonts are several MB each, and inlining all three as
+base64 made `styles.css` tens of MB that the webview had to parse before the
+first paint. This module shrinks and caches that work:
+
+- `scan_icon_usage()` finds every `Icons.<name>` in the app's source (and
+  PyThra's own widgets), so we know which glyphs are actually used, and flags
+  files that pick icons at runtime (`getattr(Icons, ...)`, `IconData(...)`),
+  which a scan cannot follow. Per-file results are cached by mtime and size,
+  so a warm start only re-reads the files that changed;
+- `subset_icon_font()` keeps only those glyphs, the letters that spell their
+  names and the ligatures that map one to the other (needs `fontTools`; without
+  it the full font is used);
+- `IconFontBuilder` writes the resulting `@font-face` CSS (embed mode) or the
+  subset TTF (serve mode) to an on-disk cache keyed by a hash of the font and
+  the icon set, so warm starts just read one small file. Entries left over
+  from earlier icon sets, fonts or settings are deleted after each build.
+
+Config keys (see config.py): `icon_font_mode`, `icon_font_subset` (`'auto'`
+subsets unless the scan finds runtime icon picks) and `icon_font_extra_icons`
+for icons chosen at runtime (e.g. `getattr(Icons, name)`), which a source scan
+cannot see.
+"""
+
+import base64
+import hashlib
+import io
+import json
+import os
+import re
+from pathlib import Path
+from typing import Dict, Iterable, List, NamedTuple, Optional, Set
+
+try:
+    from fontTools import subset as _ft_subset
+    from fontTools.ttLib import TTFont
+    from fontTools.ttLib.tables import otTables
+    FONTTOOLS_AVAILABLE = True
+except ImportError:
+    FONTTOOLS_AVAILABLE = False
+
+from .icons import _codepoints, _resolve
+
+# (font-family, file name in assets/fonts)
+ICON_FONTS = (
+    ("Material Symbols Outlined", "MaterialSymbolsOutlined.ttf"),
+    ("Material Symbols Rounded", "MaterialSymbolsRounded.ttf"),
+    ("Material Symbols Sharp", "MaterialSymbolsSharp.ttf"),
+)
+
+# URL prefix the AssetServer (and the pythra:// page) maps to the cache directory in serve mode.
+ICON_FONT_URL_PREFIX = "_pythra/fonts"
+# Cached CSS and subset fonts: `<font stem>-<cache key>.css/.ttf`, plus interrupted writes.
+_CACHE_ENTRY = re.compile(r"^(?P<stem>.+)-[0-9a-f]{16}\.(css|ttf)(\.tmp)?$")
+
+# Bump when the subsetting or the CSS template changes, to invalidate old caches.
+_CACHE_VERSION = "1"
+
+_ICON_REFERENCE = re.compile(r"\bIcons\.([A-Za-z_][A-Za-z0-9_]*)")
+# Icons whose name is only known at runtime, so the scan cannot see them.
+_DYNAMIC_ICON_ACCESS = re.compile(r"\bgetattr\(\s*Icons\s*,|\bIconData\(")
+# PyThra itself builds IconData from names (the registry) and documents
+# getattr(Icons, ...); neither is an app pick, so its files are never flagged.
+_PACKAGE_DIR = Path(__file__).resolve().parent
+_SKIP_DIRS = {"render", "assets", "build", "dist", "tests", "node_modules", "venv", "env", "site-packages", "__pycache__"}
+
+_warned_missing_fonttools = False
+
+
+class IconScan(NamedTuple):
+    """What `scan_icon_usage` found."""
+    references: Dict[str, Set[str]]  # {font_family: {icon_name, ...}}
+    dynamic_files: List[Path]        # Files that pick icons at runtime
+
+
+def scan_icon_references(paths: Iterable[Path], extra_icons: Iterable[str] = ()) -> Dict[str, Set[str]]:
+    """
+    Finds the icons used by the `.py` files under `paths`.
+
+    Returns a `{font_family: {icon_name, ...}}` mapping. `Icons.<attr>` is
+    resolved exactly as `Icons` does at runtime, so `Icons.home_rounded` counts
+    as `home` in the Rounded font. Unknown attributes are ignored. `extra_icons`
+    are attribute names (e.g. `"settings_sharp"`) added as if they were found.
+    """
+    return scan_icon_usage(paths, extra_icons).references
+
+
+def scan_icon_usage(
+    paths: Iterable[Path], extra_icons: Iterable[str] = (), cache_path: Optional[Path] = None
+) -> IconScan:
+    """
+    `scan_icon_references`, plus the files that pick icons at runtime.
+
+    With `cache_path`, each file's findings are stored there keyed by its
+    mtime and size, and only new or changed files are read again.
+    """
+    cache = _load_scan_cache(cache_path)
+    fresh: Dict[str, list] = {}
+    attrs = set(extra_icons)
+    dynamic_files: List[Path] = []
+    for root in paths:
+        root = Path(root)
+        files = [root] if root.is_file() else _python_files(root)
+        for file_path in files:
+            try:
+                stat = file_path.stat()
+            except OSError:
+                continue
+            key = str(file_path)
+            entry = cache.get(key)
+            if not entry or entry[0] != stat.st_mtime_ns or entry[1] != stat.st_size:
+                try:
+                    source = file_path.read_text(encoding="utf-8", errors="ignore")
+                except OSError:
+                    continue
+                dynamic = (
+                    _PACKAGE_DIR not in file_path.resolve().parents
+                    and _DYNAMIC_ICON_ACCESS.search(source) is not None
+                )
+                entry = [stat.st_mtime_ns, stat.st_size, sorted(set(_ICON_REFERENCE.findall(source))), dynamic]
+            fresh[key] = entry
+            attrs.update(entry[2])
+            if entry[3]:
+                dynamic_files.append(file_path)
+    if cache_path is not None and fresh != cache:
+        _write_atomic(Path(cache_path), json.dumps({"version": _CACHE_VERSION, "files": fresh}).encode("utf-8"))
+
+    references: Dict[str, Set[str]] = {family: set() for family, _ in ICON_FONTS}
+    for attr in attrs:
+        icon = _resolve(attr)
+        if icon is not None:
+            references.setdefault(icon.fontFamily, set()).add(icon.name)
+    return IconScan(references, dynamic_files)
+
+
+def _load_scan_cache(cache_path: Optional[Path]) -> Dict[str, list]:
+    if cache_path is None:
+        return {}
+    try:
+        data = json.loads(Path(cache_path).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _CACHE_VERSION:
+        return {}
+    return data.get("files") or {}
+
+
+def _python_files(root: Path):
+    for dirpath, dirnames, filenames in os.walk(root):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS and not d.startswith(".")]
+        for filename in filenames:
+            if filename.endswith(".py"):
+                yield Path(dirpath) / filename
+
+
+def subset_icon_font(font_data: bytes, icon_names: Iterable[str]) -> Optional[bytes]:
+    """
+    Returns a TrueType font holding only `icon_names`, or None without fontTools.
+
+    Icons render as ligatures (the text "home" becomes the home glyph), so the
+    subset keeps each icon's glyph, the characters of its name and the
+    ligature rules between them. Every other ligature is removed first; left in
+    place, the subsetter's closure would pull the whole font back in through
+    the shared letters.
+    """
+    global _warned_missing_fonttools
+    if not FONTTOOLS_AVAILABLE:
+        if not _warned_missing_fonttools:
+            print("Warning: fontTools package not available, icon fonts are not subset. Install with: pip install fonttools")
+            _warned_missing_fonttools = True
+        return None
+
+    names = sorted(set(icon_names))
+    font = TTFont(io.BytesIO(font_data))
+    cmap = font.getBestCmap() or {}
+    table = _codepoints()
+    # The ligature output and the icon's codepoint both map to its glyph.
+    keep_glyphs = set()
+    for name in names:
+        for glyph in (_ligature_glyph(font, cmap, name), cmap.get(table.get(name))):
+            if glyph is not None:
+                keep_glyphs.add(glyph)
+    _prune_ligatures(font, keep_glyphs)
+
+    unicodes = {ord(char) for name in names for char in name}
+    unicodes.update(code for code, glyph in cmap.items() if glyph in keep_glyphs)
+
+    options = _ft_subset.Options()
+    options.layout_features = ["*"]
+    options.name_IDs = ["*"]
+    options.notdef_outline = True
+    subsetter = _ft_subset.Subsetter(options)
+    subsetter.populate(unicodes=unicodes, glyphs=keep_glyphs)
+    subsetter.subset(font)
+
+    out = io.BytesIO()
+    font.save(out)
+    return out.getvalue()
+
+
+def _ligature_lookups(font):
+    """Yields the LigatureSubst subtables of the font's GSUB table."""
+    if "GSUB" not in font or font["GSUB"].table.LookupList is None:
+        return
+    for lookup in font["GSUB"].table.LookupList.Lookup:
+        for subtable in lookup.SubTable:
+            if lookup.LookupType == 7:  # Extension lookups wrap the real subtable.
+                subtable = subtable.ExtSubTable
+            if isinstance(subtable, otTables.LigatureSubst):
+                yield subtable
+
+
+def _ligature_glyph(font, cmap: Dict[int, str], name: str) -> Optional[str]:
+    """The glyph the ligature for `name` produces."""
+    components = [cmap.get(ord(char)) for char in name]
+    if None in components:
+        return None
+    first, rest = components[0], components[1:]
+    for subtable in _ligature_lookups(font):
+        for ligature in subtable.ligatures.get(first, ()):
+            if ligature.Component == rest:
+                return ligature.LigGlyph
+    return None
+
+
+def _prune_ligatures(font, keep_glyphs: Set[str]) -> None:
+    for subtable in _ligature_lookups(font):
+        pruned = {}
+        for first, ligatures in subtable.ligatures.items():
+            kept = [ligature for ligature in ligatures if ligature.LigGlyph in keep_glyphs]
+            if kept:
+                pruned[first] = kept
+        subtable.ligatures = pruned
+
+
+class IconFontBuilder:
+    """
+    Produces the `@font-face` rules for the icon fonts, through an on-disk cache.
+
+    Args:
+        fonts_dir: Where the TTFs live (the project's `assets/fonts`).
+        cache_dir: Where cached CSS (embed mode) and subset fonts (serve mode) go.
+        mode: `'embed'` inlines the font as base64; `'serve'` points at a file
+              served from `cache_dir` under ICON_FONT_URL_PREFIX.
+        subset: Subset each font to the referenced icons (needs fontTools).
+        port: The AssetServer port, the default for the two URLs below.
+        base_url: Where the page's resources are served from, for serve mode
+              (`http://localhost:<port>`, or `pythra://app` with `page_scheme: pythra`).
+        assets_url: Where the project's assets are served from, for missing fonts.
+    """
+
+    def __init__(self, fonts_dir: Path, cache_dir: Path, mode: str = "embed", subset: bool = True, port: int = 8008,
+                 base_url: Optional[str] = None, assets_url: Optional[str] = None):
+        if mode not in ("embed", "serve"):
+            raise ValueError(f"icon_font_mode must be 'embed' or 'serve', got {mode!r}")
+        self.fonts_dir = Path(fonts_dir)
+        self.cache_dir = Path(cache_dir)
+        self.mode = mode
+        self.subset = subset
+        self.port = port
+        self.base_url = base_url or f"http://localhost:{port}"
+        self.assets_url = assets_url or self.base_url
+        # Cache entries the last build used; everything else is pruned.
+        self._used_entries: Set[str] = set()
+
+    def build_css(self, references: Optional[Dict[str, Set[str]]] = None) -> str:
+        """
+        Returns the CSS for every icon font. With `references` (as returned by
+        `scan_icon_references`) and subsetting on, each font only carries the
+        icons listed for its family.
+        """
+        rules = []
+        self._used_entries = set()
+        for font_family, filename in ICON_FONTS:
+            names = references.get(font_family, set()) if references is not None and self.subset else None
+            rules.append(self.font_face_css(font_family, filename, names))
+        self.prune_cache(self._used_entries)
+        return "\n".join(rules)
+
+    def prune_cache(self, keep: Iterable[str]) -> int:
+        """
+        Deletes the icon fonts' cached CSS and subset fonts whose names are not
+        in `keep`, e.g. subsets for an icon set the app no longer uses. Other
+        files in the cache directory (the icon scan) are left alone. Returns
+        how many files were deleted.
+        """
+        keep = set(keep)
+        stems = {Path(filename).stem for _, filename in ICON_FONTS}
+        try:
+            entries = list(os.scandir(self.cache_dir))
+        except OSError:
+            return 0
+        removed = 0
+        for entry in entries:
+            match = _CACHE_ENTRY.match(entry.name)
+            if not match or match.group("stem") not in stems or entry.name in keep:
+                continue
+            try:
+                os.remove(entry.path)
+                removed += 1
+            except OSError:
+                pass
+        if removed:
+            print(f"🧹 PyThra Framework | Removed {removed} stale icon font cache file(s)")
+        return removed
+
+    def font_face_css(self, font_family: str, filename: str, icon_names: Optional[Set[str]] = None) -> str:
+        file_path = self.fonts_dir / filename
+        if not file_path.exists():
+            # Fallback: Use Localhost URL if file is missing
+            print(f"   ⚠️ Font file missing: {filename}. Falling back to network URL.")
+            return self._rule(font_family, f"{self.assets_url}/fonts/{filename}", display=False)
+
+        font_data = file_path.read_bytes()
+        key = self._cache_key(font_data, icon_names)
+        stem = Path(filename).stem
+        css_path = self.cache_dir / f"{stem}-{key}.css"
+        font_name = f"{stem}-{key}.ttf"
+        self._used_entries.update((css_path.name, font_name))
+        if self.mode == "embed" or (self.cache_dir / font_name).exists():
+            try:
+                return css_path.read_text(encoding="utf-8")
+            except OSError:
+                pass
+
+        data = font_data
+        if icon_names is not None:
+            try:
+                data = subset_icon_font(font_data, icon_names) or font_data
+            except Exception as e:
+                print(f"   ⚠️ Could not subset {filename}, using the full font: {e}")
+
+        if self.mode == "serve":
+            self._write(self.cache_dir / font_name, data)
+            url = f"{self.base_url}/{ICON_FONT_URL_PREFIX}/{font_name}"
+        else:
+            url = f"data:font/truetype;charset=utf-8;base64,{base64.b64encode(data).decode('utf-8')}"
+
+        rule = self._rule(font_family, url)
+        self._write(css_path, rule.encode("utf-8"))
+        print(f"🔤 PyThra Framework | {filename}: {len(font_data) // 1024} KiB -> {len(data) // 1024} KiB "
+              f"({'all icons' if data is font_data else f'{len(icon_names)} icons'}, {self.mode})")
+        return rule
+
+    def _cache_key(self, font_data: bytes, icon_names: Optional[Set[str]]) -> str:
+        digest = hashlib.sha256(font_data)
+        subset_id = "\n".join(sorted(icon_names)) if icon_names is not None else "*"
+        # A subset made without fontTools is the full font; keep the two apart.
+        tools = "fonttools" if FONTTOOLS_AVAILABLE else "none"
+        # The cached CSS holds the font's URL, so its base is part of the key.
+        url_base = self.base_url if self.mode == "serve" else ""
+        digest.update(f"\0{_CACHE_VERSION}\0{self.mode}\0{url_base}\0{tools}\0{subset_id}".encode("utf-8"))
+        return digest.hexdigest()[:16]
+
+    def _write(self, path: Path, data: bytes) -> None:
+        _write_atomic(path, data)
+
+    @staticmethod
+    def _rule(font_family: str, url: str, display: bool = True) -> str:
+        font_display = "\n    font-display: block; /* Hides text until icon is ready */" if display else ""
+        return (
+            "@font-face {\n"
+            f"    font-family: '{font_family}';\n"
+            "    font-style: normal;\n"
+            f"    font-weight: 100 700;{font_display}\n"
+            f"    src: url({url}) format('truetype');\n"
+            "}\n"
+        )
+
+
+def _write_atomic(path: Path, data: bytes) -> None:
+    # Write-then-rename so a crash never leaves a truncated cache entry.
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = path.with_name(path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+    except OSError as e:
+        print(f"   ⚠️ Could not write font cache {path}: {e}")
@@ -1,11 +1,102 @@
-from .icons_sharp import IconsSharp
-from .icons_rounded import IconsRounded
-from .icons_outlined import IconsOutlined
-from .icons_outlined_1 import IconsOutlined1
-from .icons_sharp_1 import IconsSharp1
-from .icons_rounded_1 import IconsRounded1
+# pythra/icons/__init__.py
+
+"""
+Material Symbols icons, resolved lazily.
+
+`Icons.home`, `Icons.home_rounded`, `Icons.home_sharp` and `Icons._3d_rotation_outlined`
+are not stored anywhere up front: the first access looks the name up in the
+compact codepoint table (`_codepoints.py`, generated from `codepoints.txt`),
+creates the `IconData` and caches it on the class, so later accesses are plain
+attribute reads. Importing the package therefore costs one string constant
+instead of ~15k dataclass instances.
+
+Name rules (unchanged from the old generated classes):
+- `<name>_outlined`, `<name>_rounded`, `<name>_sharp` pick the style;
+- a bare `<name>` is the outlined icon;
+- names starting with a digit take a leading underscore (`_10k`), and
+  Python keywords a trailing one (`class_`, `try_`).
+"""
+
+import keyword
+from typing import Dict, Iterator, List, Optional
+
 from .base import *
+from ._codepoints import CODEPOINTS
+
+# Suffix -> font family. Sharp and rounded variants are tried before the bare
+# name, matching the precedence of the old IconsSharp/IconsRounded bases.
+_STYLES = {
+    "sharp": "Material Symbols Sharp",
+    "rounded": "Material Symbols Rounded",
+    "outlined": "Material Symbols Outlined",
+}
+_DEFAULT_FAMILY = _STYLES["outlined"]
+
+_table: Optional[Dict[str, int]] = None
+
+
+def _codepoints() -> Dict[str, int]:
+    """Parses the codepoint table on first use."""
+    global _table
+    if _table is None:
+        _table = {name: int(code, 16) for name, code in (line.split() for line in CODEPOINTS.splitlines())}
+    return _table
+
+
+def _icon_name(identifier: str) -> str:
+    """Maps a Python identifier back to the icon name (`_10k` -> `10k`, `class_` -> `class`)."""
+    if identifier[:1] == "_" and identifier[1:2].isdigit():
+        identifier = identifier[1:]
+    elif identifier.endswith("_") and keyword.iskeyword(identifier[:-1]):
+        identifier = identifier[:-1]
+    return identifier
+
+
+def _identifier(name: str) -> str:
+    if name[0].isdigit():
+        return f"_{name}"
+    return f"{name}_" if keyword.iskeyword(name) else name
+
+
+def _resolve(attr: str) -> Optional[IconData]:
+    table = _codepoints()
+    base, _, style = attr.rpartition("_")
+    if base and style in ("sharp", "rounded"):
+        name = _icon_name(base)
+        if name in table:
+            return IconData(name=name, fontFamily=_STYLES[style], codePoint=table[name])
+    name = _icon_name(attr)
+    if name in table:
+        return IconData(name=name, fontFamily=_DEFAULT_FAMILY, codePoint=table[name])
+    if base and style == "outlined":
+        name = _icon_name(base)
+        if name in table:
+            return IconData(name=name, fontFamily=_DEFAULT_FAMILY, codePoint=table[name])
+    return None
+
+
+def icon_names() -> Iterator[str]:
+    """Every icon name in the table (e.g. `home`, `10k`)."""
+    return iter(_codepoints())
+
+
+class _IconsMeta(type):
+    def __getattr__(cls, attr: str) -> IconData:
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        icon = _resolve(attr)
+        if icon is None:
+            raise AttributeError(f"Icons has no icon named {attr!r}")
+        # Cache on the class: the next access never reaches __getattr__.
+        setattr(cls, attr, icon)
+        return icon
+
+    def __dir__(cls) -> List[str]:
+        names = [_identifier(name) for name in _codepoints()]
+        styled = [f"{name}_{style}" for name in names for style in _STYLES]
+        return sorted(set(super().__dir__()) | set(names) | set(styled))
+
 
-class Icons(IconsSharp, IconsRounded, IconsOutlined, IconsSharp1, IconsRounded1, IconsOutlined1):
-    """Unified access to all icons."""
+class Icons(metaclass=_IconsMeta):
+    """Unified access to all icons, e.g. `Icons.home` or `Icons.settings_rounded`."""
     pass
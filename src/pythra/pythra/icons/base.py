@@ -1,10 +1,13 @@
-# pythra/icons.py
-# This file is auto-generated. Do not edit manually.
+# pythra/icons/base.py
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Optional
 
 @dataclass(frozen=True)
 class IconData:
     """An immutable data class representing an icon from a font."""
     name: str
-    fontFamily: str
\ No newline at end of file
+    fontFamily: str
+    # The glyph's codepoint in the font, when known. Not part of equality, so
+    # IconData(name=..., fontFamily=...) built by hand still compares equal.
+    codePoint: Optional[int] = field(default=None, compare=False, repr=False)
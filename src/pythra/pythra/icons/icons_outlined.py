@@ -1,4148 +0,0 @@
-from .base import IconData
-
-
-class IconsOutlined:
-    """A helper class containing static references to outlined Material Symbols."""
-    
-    jamboard_kiosk_outlined = IconData(name="jamboard_kiosk", fontFamily="Material Symbols Outlined")
-    javascript_outlined = IconData(name="javascript", fontFamily="Material Symbols Outlined")
-    join_outlined = IconData(name="join", fontFamily="Material Symbols Outlined")
-    join_full_outlined = IconData(name="join_full", fontFamily="Material Symbols Outlined")
-    join_inner_outlined = IconData(name="join_inner", fontFamily="Material Symbols Outlined")
-    join_left_outlined = IconData(name="join_left", fontFamily="Material Symbols Outlined")
-    join_right_outlined = IconData(name="join_right", fontFamily="Material Symbols Outlined")
-    joystick_outlined = IconData(name="joystick", fontFamily="Material Symbols Outlined")
-    jump_to_element_outlined = IconData(name="jump_to_element", fontFamily="Material Symbols Outlined")
-    kayaking_outlined = IconData(name="kayaking", fontFamily="Material Symbols Outlined")
-    kebab_dining_outlined = IconData(name="kebab_dining", fontFamily="Material Symbols Outlined")
-    keep_outlined = IconData(name="keep", fontFamily="Material Symbols Outlined")
-    keep_off_outlined = IconData(name="keep_off", fontFamily="Material Symbols Outlined")
-    keep_pin_outlined = IconData(name="keep_pin", fontFamily="Material Symbols Outlined")
-    keep_public_outlined = IconData(name="keep_public", fontFamily="Material Symbols Outlined")
-    kettle_outlined = IconData(name="kettle", fontFamily="Material Symbols Outlined")
-    key_outlined = IconData(name="key", fontFamily="Material Symbols Outlined")
-    key_off_outlined = IconData(name="key_off", fontFamily="Material Symbols Outlined")
-    key_vertical_outlined = IconData(name="key_vertical", fontFamily="Material Symbols Outlined")
-    key_visualizer_outlined = IconData(name="key_visualizer", fontFamily="Material Symbols Outlined")
-    keyboard_outlined = IconData(name="keyboard", fontFamily="Material Symbols Outlined")
-    keyboard_alt_outlined = IconData(name="keyboard_alt", fontFamily="Material Symbols Outlined")
-    keyboard_arrow_down_outlined = IconData(name="keyboard_arrow_down", fontFamily="Material Symbols Outlined")
-    keyboard_arrow_left_outlined = IconData(name="keyboard_arrow_left", fontFamily="Material Symbols Outlined")
-    keyboard_arrow_right_outlined = IconData(name="keyboard_arrow_right", fontFamily="Material Symbols Outlined")
-    keyboard_arrow_up_outlined = IconData(name="keyboard_arrow_up", fontFamily="Material Symbols Outlined")
-    keyboard_backspace_outlined = IconData(name="keyboard_backspace", fontFamily="Material Symbols Outlined")
-    keyboard_capslock_outlined = IconData(name="keyboard_capslock", fontFamily="Material Symbols Outlined")
-    keyboard_capslock_badge_outlined = IconData(name="keyboard_capslock_badge", fontFamily="Material Symbols Outlined")
-    keyboard_command_key_outlined = IconData(name="keyboard_command_key", fontFamily="Material Symbols Outlined")
-    keyboard_control_key_outlined = IconData(name="keyboard_control_key", fontFamily="Material Symbols Outlined")
-    keyboard_double_arrow_down_outlined = IconData(name="keyboard_double_arrow_down", fontFamily="Material Symbols Outlined")
-    keyboard_double_arrow_left_outlined = IconData(name="keyboard_double_arrow_left", fontFamily="Material Symbols Outlined")
-    keyboard_double_arrow_right_outlined = IconData(name="keyboard_double_arrow_right", fontFamily="Material Symbols Outlined")
-    keyboard_double_arrow_up_outlined = IconData(name="keyboard_double_arrow_up", fontFamily="Material Symbols Outlined")
-    keyboard_external_input_outlined = IconData(name="keyboard_external_input", fontFamily="Material Symbols Outlined")
-    keyboard_full_outlined = IconData(name="keyboard_full", fontFamily="Material Symbols Outlined")
-    keyboard_hide_outlined = IconData(name="keyboard_hide", fontFamily="Material Symbols Outlined")
-    keyboard_keys_outlined = IconData(name="keyboard_keys", fontFamily="Material Symbols Outlined")
-    keyboard_lock_outlined = IconData(name="keyboard_lock", fontFamily="Material Symbols Outlined")
-    keyboard_lock_off_outlined = IconData(name="keyboard_lock_off", fontFamily="Material Symbols Outlined")
-    keyboard_off_outlined = IconData(name="keyboard_off", fontFamily="Material Symbols Outlined")
-    keyboard_onscreen_outlined = IconData(name="keyboard_onscreen", fontFamily="Material Symbols Outlined")
-    keyboard_option_key_outlined = IconData(name="keyboard_option_key", fontFamily="Material Symbols Outlined")
-    keyboard_previous_language_outlined = IconData(name="keyboard_previous_language", fontFamily="Material Symbols Outlined")
-    keyboard_return_outlined = IconData(name="keyboard_return", fontFamily="Material Symbols Outlined")
-    keyboard_tab_outlined = IconData(name="keyboard_tab", fontFamily="Material Symbols Outlined")
-    keyboard_tab_rtl_outlined = IconData(name="keyboard_tab_rtl", fontFamily="Material Symbols Outlined")
-    keyboard_voice_outlined = IconData(name="keyboard_voice", fontFamily="Material Symbols Outlined")
-    kid_star_outlined = IconData(name="kid_star", fontFamily="Material Symbols Outlined")
-    king_bed_outlined = IconData(name="king_bed", fontFamily="Material Symbols Outlined")
-    kitchen_outlined = IconData(name="kitchen", fontFamily="Material Symbols Outlined")
-    kitesurfing_outlined = IconData(name="kitesurfing", fontFamily="Material Symbols Outlined")
-    lab_panel_outlined = IconData(name="lab_panel", fontFamily="Material Symbols Outlined")
-    lab_profile_outlined = IconData(name="lab_profile", fontFamily="Material Symbols Outlined")
-    lab_research_outlined = IconData(name="lab_research", fontFamily="Material Symbols Outlined")
-    label_outlined = IconData(name="label", fontFamily="Material Symbols Outlined")
-    label_important_outlined = IconData(name="label_important", fontFamily="Material Symbols Outlined")
-    label_important_outline_outlined = IconData(name="label_important_outline", fontFamily="Material Symbols Outlined")
-    label_off_outlined = IconData(name="label_off", fontFamily="Material Symbols Outlined")
-    label_outline_outlined = IconData(name="label_outline", fontFamily="Material Symbols Outlined")
-    labs_outlined = IconData(name="labs", fontFamily="Material Symbols Outlined")
-    lan_outlined = IconData(name="lan", fontFamily="Material Symbols Outlined")
-    landscape_outlined = IconData(name="landscape", fontFamily="Material Symbols Outlined")
-    landscape_2_outlined = IconData(name="landscape_2", fontFamily="Material Symbols Outlined")
-    landscape_2_edit_outlined = IconData(name="landscape_2_edit", fontFamily="Material Symbols Outlined")
-    landscape_2_off_outlined = IconData(name="landscape_2_off", fontFamily="Material Symbols Outlined")
-    landslide_outlined = IconData(name="landslide", fontFamily="Material Symbols Outlined")
-    language_outlined = IconData(name="language", fontFamily="Material Symbols Outlined")
-    language_chinese_array_outlined = IconData(name="language_chinese_array", fontFamily="Material Symbols Outlined")
-    language_chinese_cangjie_outlined = IconData(name="language_chinese_cangjie", fontFamily="Material Symbols Outlined")
-    language_chinese_dayi_outlined = IconData(name="language_chinese_dayi", fontFamily="Material Symbols Outlined")
-    language_chinese_pinyin_outlined = IconData(name="language_chinese_pinyin", fontFamily="Material Symbols Outlined")
-    language_chinese_quick_outlined = IconData(name="language_chinese_quick", fontFamily="Material Symbols Outlined")
-    language_chinese_wubi_outlined = IconData(name="language_chinese_wubi", fontFamily="Material Symbols Outlined")
-    language_french_outlined = IconData(name="language_french", fontFamily="Material Symbols Outlined")
-    language_gb_english_outlined = IconData(name="language_gb_english", fontFamily="Material Symbols Outlined")
-    language_international_outlined = IconData(name="language_international", fontFamily="Material Symbols Outlined")
-    language_japanese_kana_outlined = IconData(name="language_japanese_kana", fontFamily="Material Symbols Outlined")
-    language_korean_latin_outlined = IconData(name="language_korean_latin", fontFamily="Material Symbols Outlined")
-    language_pinyin_outlined = IconData(name="language_pinyin", fontFamily="Material Symbols Outlined")
-    language_spanish_outlined = IconData(name="language_spanish", fontFamily="Material Symbols Outlined")
-    language_us_outlined = IconData(name="language_us", fontFamily="Material Symbols Outlined")
-    language_us_colemak_outlined = IconData(name="language_us_colemak", fontFamily="Material Symbols Outlined")
-    language_us_dvorak_outlined = IconData(name="language_us_dvorak", fontFamily="Material Symbols Outlined")
-    laps_outlined = IconData(name="laps", fontFamily="Material Symbols Outlined")
-    laptop_outlined = IconData(name="laptop", fontFamily="Material Symbols Outlined")
-    laptop_car_outlined = IconData(name="laptop_car", fontFamily="Material Symbols Outlined")
-    laptop_chromebook_outlined = IconData(name="laptop_chromebook", fontFamily="Material Symbols Outlined")
-    laptop_mac_outlined = IconData(name="laptop_mac", fontFamily="Material Symbols Outlined")
-    laptop_windows_outlined = IconData(name="laptop_windows", fontFamily="Material Symbols Outlined")
-    lasso_select_outlined = IconData(name="lasso_select", fontFamily="Material Symbols Outlined")
-    last_page_outlined = IconData(name="last_page", fontFamily="Material Symbols Outlined")
-    launch_outlined = IconData(name="launch", fontFamily="Material Symbols Outlined")
-    laundry_outlined = IconData(name="laundry", fontFamily="Material Symbols Outlined")
-    layers_outlined = IconData(name="layers", fontFamily="Material Symbols Outlined")
-    layers_clear_outlined = IconData(name="layers_clear", fontFamily="Material Symbols Outlined")
-    lda_outlined = IconData(name="lda", fontFamily="Material Symbols Outlined")
-    leaderboard_outlined = IconData(name="leaderboard", fontFamily="Material Symbols Outlined")
-    leak_add_outlined = IconData(name="leak_add", fontFamily="Material Symbols Outlined")
-    leak_remove_outlined = IconData(name="leak_remove", fontFamily="Material Symbols Outlined")
-    left_click_outlined = IconData(name="left_click", fontFamily="Material Symbols Outlined")
-    left_panel_close_outlined = IconData(name="left_panel_close", fontFamily="Material Symbols Outlined")
-    left_panel_open_outlined = IconData(name="left_panel_open", fontFamily="Material Symbols Outlined")
-    legend_toggle_outlined = IconData(name="legend_toggle", fontFamily="Material Symbols Outlined")
-    lens_outlined = IconData(name="lens", fontFamily="Material Symbols Outlined")
-    lens_blur_outlined = IconData(name="lens_blur", fontFamily="Material Symbols Outlined")
-    letter_switch_outlined = IconData(name="letter_switch", fontFamily="Material Symbols Outlined")
-    library_add_outlined = IconData(name="library_add", fontFamily="Material Symbols Outlined")
-    library_add_check_outlined = IconData(name="library_add_check", fontFamily="Material Symbols Outlined")
-    library_books_outlined = IconData(name="library_books", fontFamily="Material Symbols Outlined")
-    library_music_outlined = IconData(name="library_music", fontFamily="Material Symbols Outlined")
-    license_outlined = IconData(name="license", fontFamily="Material Symbols Outlined")
-    lift_to_talk_outlined = IconData(name="lift_to_talk", fontFamily="Material Symbols Outlined")
-    light_outlined = IconData(name="light", fontFamily="Material Symbols Outlined")
-    light_group_outlined = IconData(name="light_group", fontFamily="Material Symbols Outlined")
-    light_mode_outlined = IconData(name="light_mode", fontFamily="Material Symbols Outlined")
-    light_off_outlined = IconData(name="light_off", fontFamily="Material Symbols Outlined")
-    lightbulb_outlined = IconData(name="lightbulb", fontFamily="Material Symbols Outlined")
-    lightbulb_2_outlined = IconData(name="lightbulb_2", fontFamily="Material Symbols Outlined")
-    lightbulb_circle_outlined = IconData(name="lightbulb_circle", fontFamily="Material Symbols Outlined")
-    lightbulb_outline_outlined = IconData(name="lightbulb_outline", fontFamily="Material Symbols Outlined")
-    lightning_stand_outlined = IconData(name="lightning_stand", fontFamily="Material Symbols Outlined")
-    line_axis_outlined = IconData(name="line_axis", fontFamily="Material Symbols Outlined")
-    line_curve_outlined = IconData(name="line_curve", fontFamily="Material Symbols Outlined")
-    line_end_outlined = IconData(name="line_end", fontFamily="Material Symbols Outlined")
-    line_end_arrow_outlined = IconData(name="line_end_arrow", fontFamily="Material Symbols Outlined")
-    line_end_arrow_notch_outlined = IconData(name="line_end_arrow_notch", fontFamily="Material Symbols Outlined")
-    line_end_circle_outlined = IconData(name="line_end_circle", fontFamily="Material Symbols Outlined")
-    line_end_diamond_outlined = IconData(name="line_end_diamond", fontFamily="Material Symbols Outlined")
-    line_end_square_outlined = IconData(name="line_end_square", fontFamily="Material Symbols Outlined")
-    line_start_outlined = IconData(name="line_start", fontFamily="Material Symbols Outlined")
-    line_start_arrow_outlined = IconData(name="line_start_arrow", fontFamily="Material Symbols Outlined")
-    line_start_arrow_notch_outlined = IconData(name="line_start_arrow_notch", fontFamily="Material Symbols Outlined")
-    line_start_circle_outlined = IconData(name="line_start_circle", fontFamily="Material Symbols Outlined")
-    line_start_diamond_outlined = IconData(name="line_start_diamond", fontFamily="Material Symbols Outlined")
-    line_start_square_outlined = IconData(name="line_start_square", fontFamily="Material Symbols Outlined")
-    line_style_outlined = IconData(name="line_style", fontFamily="Material Symbols Outlined")
-    line_weight_outlined = IconData(name="line_weight", fontFamily="Material Symbols Outlined")
-    linear_scale_outlined = IconData(name="linear_scale", fontFamily="Material Symbols Outlined")
-    link_outlined = IconData(name="link", fontFamily="Material Symbols Outlined")
-    link_off_outlined = IconData(name="link_off", fontFamily="Material Symbols Outlined")
-    linked_camera_outlined = IconData(name="linked_camera", fontFamily="Material Symbols Outlined")
-    linked_services_outlined = IconData(name="linked_services", fontFamily="Material Symbols Outlined")
-    liquor_outlined = IconData(name="liquor", fontFamily="Material Symbols Outlined")
-    list_outlined = IconData(name="list", fontFamily="Material Symbols Outlined")
-    list_alt_outlined = IconData(name="list_alt", fontFamily="Material Symbols Outlined")
-    list_alt_add_outlined = IconData(name="list_alt_add", fontFamily="Material Symbols Outlined")
-    list_alt_check_outlined = IconData(name="list_alt_check", fontFamily="Material Symbols Outlined")
-    lists_outlined = IconData(name="lists", fontFamily="Material Symbols Outlined")
-    live_help_outlined = IconData(name="live_help", fontFamily="Material Symbols Outlined")
-    live_tv_outlined = IconData(name="live_tv", fontFamily="Material Symbols Outlined")
-    living_outlined = IconData(name="living", fontFamily="Material Symbols Outlined")
-    local_activity_outlined = IconData(name="local_activity", fontFamily="Material Symbols Outlined")
-    local_airport_outlined = IconData(name="local_airport", fontFamily="Material Symbols Outlined")
-    local_atm_outlined = IconData(name="local_atm", fontFamily="Material Symbols Outlined")
-    local_bar_outlined = IconData(name="local_bar", fontFamily="Material Symbols Outlined")
-    local_cafe_outlined = IconData(name="local_cafe", fontFamily="Material Symbols Outlined")
-    local_car_wash_outlined = IconData(name="local_car_wash", fontFamily="Material Symbols Outlined")
-    local_convenience_store_outlined = IconData(name="local_convenience_store", fontFamily="Material Symbols Outlined")
-    local_dining_outlined = IconData(name="local_dining", fontFamily="Material Symbols Outlined")
-    local_drink_outlined = IconData(name="local_drink", fontFamily="Material Symbols Outlined")
-    local_fire_department_outlined = IconData(name="local_fire_department", fontFamily="Material Symbols Outlined")
-    local_florist_outlined = IconData(name="local_florist", fontFamily="Material Symbols Outlined")
-    local_gas_station_outlined = IconData(name="local_gas_station", fontFamily="Material Symbols Outlined")
-    local_grocery_store_outlined = IconData(name="local_grocery_store", fontFamily="Material Symbols Outlined")
-    local_hospital_outlined = IconData(name="local_hospital", fontFamily="Material Symbols Outlined")
-    local_hotel_outlined = IconData(name="local_hotel", fontFamily="Material Symbols Outlined")
-    local_laundry_service_outlined = IconData(name="local_laundry_service", fontFamily="Material Symbols Outlined")
-    local_library_outlined = IconData(name="local_library", fontFamily="Material Symbols Outlined")
-    local_mall_outlined = IconData(name="local_mall", fontFamily="Material Symbols Outlined")
-    local_movies_outlined = IconData(name="local_movies", fontFamily="Material Symbols Outlined")
-    local_offer_outlined = IconData(name="local_offer", fontFamily="Material Symbols Outlined")
-    local_parking_outlined = IconData(name="local_parking", fontFamily="Material Symbols Outlined")
-    local_pharmacy_outlined = IconData(name="local_pharmacy", fontFamily="Material Symbols Outlined")
-    local_phone_outlined = IconData(name="local_phone", fontFamily="Material Symbols Outlined")
-    local_pizza_outlined = IconData(name="local_pizza", fontFamily="Material Symbols Outlined")
-    local_play_outlined = IconData(name="local_play", fontFamily="Material Symbols Outlined")
-    local_police_outlined = IconData(name="local_police", fontFamily="Material Symbols Outlined")
-    local_post_office_outlined = IconData(name="local_post_office", fontFamily="Material Symbols Outlined")
-    local_printshop_outlined = IconData(name="local_printshop", fontFamily="Material Symbols Outlined")
-    local_see_outlined = IconData(name="local_see", fontFamily="Material Symbols Outlined")
-    local_shipping_outlined = IconData(name="local_shipping", fontFamily="Material Symbols Outlined")
-    local_taxi_outlined = IconData(name="local_taxi", fontFamily="Material Symbols Outlined")
-    location_automation_outlined = IconData(name="location_automation", fontFamily="Material Symbols Outlined")
-    location_away_outlined = IconData(name="location_away", fontFamily="Material Symbols Outlined")
-    location_chip_outlined = IconData(name="location_chip", fontFamily="Material Symbols Outlined")
-    location_city_outlined = IconData(name="location_city", fontFamily="Material Symbols Outlined")
-    location_disabled_outlined = IconData(name="location_disabled", fontFamily="Material Symbols Outlined")
-    location_home_outlined = IconData(name="location_home", fontFamily="Material Symbols Outlined")
-    location_off_outlined = IconData(name="location_off", fontFamily="Material Symbols Outlined")
-    location_on_outlined = IconData(name="location_on", fontFamily="Material Symbols Outlined")
-    location_pin_outlined = IconData(name="location_pin", fontFamily="Material Symbols Outlined")
-    location_searching_outlined = IconData(name="location_searching", fontFamily="Material Symbols Outlined")
-    locator_tag_outlined = IconData(name="locator_tag", fontFamily="Material Symbols Outlined")
-    lock_outlined = IconData(name="lock", fontFamily="Material Symbols Outlined")
-    lock_clock_outlined = IconData(name="lock_clock", fontFamily="Material Symbols Outlined")
-    lock_open_outlined = IconData(name="lock_open", fontFamily="Material Symbols Outlined")
-    lock_open_circle_outlined = IconData(name="lock_open_circle", fontFamily="Material Symbols Outlined")
-    lock_open_right_outlined = IconData(name="lock_open_right", fontFamily="Material Symbols Outlined")
-    lock_outline_outlined = IconData(name="lock_outline", fontFamily="Material Symbols Outlined")
-    lock_person_outlined = IconData(name="lock_person", fontFamily="Material Symbols Outlined")
-    lock_reset_outlined = IconData(name="lock_reset", fontFamily="Material Symbols Outlined")
-    login_outlined = IconData(name="login", fontFamily="Material Symbols Outlined")
-    logo_dev_outlined = IconData(name="logo_dev", fontFamily="Material Symbols Outlined")
-    logout_outlined = IconData(name="logout", fontFamily="Material Symbols Outlined")
-    looks_outlined = IconData(name="looks", fontFamily="Material Symbols Outlined")
-    looks_3_outlined = IconData(name="looks_3", fontFamily="Material Symbols Outlined")
-    looks_4_outlined = IconData(name="looks_4", fontFamily="Material Symbols Outlined")
-    looks_5_outlined = IconData(name="looks_5", fontFamily="Material Symbols Outlined")
-    looks_6_outlined = IconData(name="looks_6", fontFamily="Material Symbols Outlined")
-    looks_one_outlined = IconData(name="looks_one", fontFamily="Material Symbols Outlined")
-    looks_two_outlined = IconData(name="looks_two", fontFamily="Material Symbols Outlined")
-    loop_outlined = IconData(name="loop", fontFamily="Material Symbols Outlined")
-    loupe_outlined = IconData(name="loupe", fontFamily="Material Symbols Outlined")
-    low_density_outlined = IconData(name="low_density", fontFamily="Material Symbols Outlined")
-    low_priority_outlined = IconData(name="low_priority", fontFamily="Material Symbols Outlined")
-    lowercase_outlined = IconData(name="lowercase", fontFamily="Material Symbols Outlined")
-    loyalty_outlined = IconData(name="loyalty", fontFamily="Material Symbols Outlined")
-    lte_mobiledata_outlined = IconData(name="lte_mobiledata", fontFamily="Material Symbols Outlined")
-    lte_mobiledata_badge_outlined = IconData(name="lte_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    lte_plus_mobiledata_outlined = IconData(name="lte_plus_mobiledata", fontFamily="Material Symbols Outlined")
-    lte_plus_mobiledata_badge_outlined = IconData(name="lte_plus_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    luggage_outlined = IconData(name="luggage", fontFamily="Material Symbols Outlined")
-    lunch_dining_outlined = IconData(name="lunch_dining", fontFamily="Material Symbols Outlined")
-    lyrics_outlined = IconData(name="lyrics", fontFamily="Material Symbols Outlined")
-    macro_auto_outlined = IconData(name="macro_auto", fontFamily="Material Symbols Outlined")
-    macro_off_outlined = IconData(name="macro_off", fontFamily="Material Symbols Outlined")
-    magic_button_outlined = IconData(name="magic_button", fontFamily="Material Symbols Outlined")
-    magic_exchange_outlined = IconData(name="magic_exchange", fontFamily="Material Symbols Outlined")
-    magic_tether_outlined = IconData(name="magic_tether", fontFamily="Material Symbols Outlined")
-    magnification_large_outlined = IconData(name="magnification_large", fontFamily="Material Symbols Outlined")
-    magnification_small_outlined = IconData(name="magnification_small", fontFamily="Material Symbols Outlined")
-    magnify_docked_outlined = IconData(name="magnify_docked", fontFamily="Material Symbols Outlined")
-    magnify_fullscreen_outlined = IconData(name="magnify_fullscreen", fontFamily="Material Symbols Outlined")
-    mail_outlined = IconData(name="mail", fontFamily="Material Symbols Outlined")
-    mail_lock_outlined = IconData(name="mail_lock", fontFamily="Material Symbols Outlined")
-    mail_off_outlined = IconData(name="mail_off", fontFamily="Material Symbols Outlined")
-    mail_outline_outlined = IconData(name="mail_outline", fontFamily="Material Symbols Outlined")
-    male_outlined = IconData(name="male", fontFamily="Material Symbols Outlined")
-    man_outlined = IconData(name="man", fontFamily="Material Symbols Outlined")
-    man_2_outlined = IconData(name="man_2", fontFamily="Material Symbols Outlined")
-    man_3_outlined = IconData(name="man_3", fontFamily="Material Symbols Outlined")
-    man_4_outlined = IconData(name="man_4", fontFamily="Material Symbols Outlined")
-    manage_accounts_outlined = IconData(name="manage_accounts", fontFamily="Material Symbols Outlined")
-    manage_history_outlined = IconData(name="manage_history", fontFamily="Material Symbols Outlined")
-    manage_search_outlined = IconData(name="manage_search", fontFamily="Material Symbols Outlined")
-    manga_outlined = IconData(name="manga", fontFamily="Material Symbols Outlined")
-    manufacturing_outlined = IconData(name="manufacturing", fontFamily="Material Symbols Outlined")
-    map_outlined = IconData(name="map", fontFamily="Material Symbols Outlined")
-    map_search_outlined = IconData(name="map_search", fontFamily="Material Symbols Outlined")
-    maps_home_work_outlined = IconData(name="maps_home_work", fontFamily="Material Symbols Outlined")
-    maps_ugc_outlined = IconData(name="maps_ugc", fontFamily="Material Symbols Outlined")
-    margin_outlined = IconData(name="margin", fontFamily="Material Symbols Outlined")
-    mark_as_unread_outlined = IconData(name="mark_as_unread", fontFamily="Material Symbols Outlined")
-    mark_chat_read_outlined = IconData(name="mark_chat_read", fontFamily="Material Symbols Outlined")
-    mark_chat_unread_outlined = IconData(name="mark_chat_unread", fontFamily="Material Symbols Outlined")
-    mark_email_read_outlined = IconData(name="mark_email_read", fontFamily="Material Symbols Outlined")
-    mark_email_unread_outlined = IconData(name="mark_email_unread", fontFamily="Material Symbols Outlined")
-    mark_unread_chat_alt_outlined = IconData(name="mark_unread_chat_alt", fontFamily="Material Symbols Outlined")
-    markdown_outlined = IconData(name="markdown", fontFamily="Material Symbols Outlined")
-    markdown_copy_outlined = IconData(name="markdown_copy", fontFamily="Material Symbols Outlined")
-    markdown_paste_outlined = IconData(name="markdown_paste", fontFamily="Material Symbols Outlined")
-    markunread_outlined = IconData(name="markunread", fontFamily="Material Symbols Outlined")
-    markunread_mailbox_outlined = IconData(name="markunread_mailbox", fontFamily="Material Symbols Outlined")
-    masked_transitions_outlined = IconData(name="masked_transitions", fontFamily="Material Symbols Outlined")
-    masked_transitions_add_outlined = IconData(name="masked_transitions_add", fontFamily="Material Symbols Outlined")
-    masks_outlined = IconData(name="masks", fontFamily="Material Symbols Outlined")
-    match_case_outlined = IconData(name="match_case", fontFamily="Material Symbols Outlined")
-    match_case_off_outlined = IconData(name="match_case_off", fontFamily="Material Symbols Outlined")
-    match_word_outlined = IconData(name="match_word", fontFamily="Material Symbols Outlined")
-    matter_outlined = IconData(name="matter", fontFamily="Material Symbols Outlined")
-    maximize_outlined = IconData(name="maximize", fontFamily="Material Symbols Outlined")
-    measuring_tape_outlined = IconData(name="measuring_tape", fontFamily="Material Symbols Outlined")
-    media_bluetooth_off_outlined = IconData(name="media_bluetooth_off", fontFamily="Material Symbols Outlined")
-    media_bluetooth_on_outlined = IconData(name="media_bluetooth_on", fontFamily="Material Symbols Outlined")
-    media_link_outlined = IconData(name="media_link", fontFamily="Material Symbols Outlined")
-    media_output_outlined = IconData(name="media_output", fontFamily="Material Symbols Outlined")
-    media_output_off_outlined = IconData(name="media_output_off", fontFamily="Material Symbols Outlined")
-    mediation_outlined = IconData(name="mediation", fontFamily="Material Symbols Outlined")
-    medical_information_outlined = IconData(name="medical_information", fontFamily="Material Symbols Outlined")
-    medical_mask_outlined = IconData(name="medical_mask", fontFamily="Material Symbols Outlined")
-    medical_services_outlined = IconData(name="medical_services", fontFamily="Material Symbols Outlined")
-    medication_outlined = IconData(name="medication", fontFamily="Material Symbols Outlined")
-    medication_liquid_outlined = IconData(name="medication_liquid", fontFamily="Material Symbols Outlined")
-    meeting_room_outlined = IconData(name="meeting_room", fontFamily="Material Symbols Outlined")
-    memory_outlined = IconData(name="memory", fontFamily="Material Symbols Outlined")
-    memory_alt_outlined = IconData(name="memory_alt", fontFamily="Material Symbols Outlined")
-    menstrual_health_outlined = IconData(name="menstrual_health", fontFamily="Material Symbols Outlined")
-    menu_outlined = IconData(name="menu", fontFamily="Material Symbols Outlined")
-    menu_book_outlined = IconData(name="menu_book", fontFamily="Material Symbols Outlined")
-    menu_open_outlined = IconData(name="menu_open", fontFamily="Material Symbols Outlined")
-    merge_outlined = IconData(name="merge", fontFamily="Material Symbols Outlined")
-    merge_type_outlined = IconData(name="merge_type", fontFamily="Material Symbols Outlined")
-    message_outlined = IconData(name="message", fontFamily="Material Symbols Outlined")
-    metabolism_outlined = IconData(name="metabolism", fontFamily="Material Symbols Outlined")
-    metro_outlined = IconData(name="metro", fontFamily="Material Symbols Outlined")
-    mfg_nest_yale_lock_outlined = IconData(name="mfg_nest_yale_lock", fontFamily="Material Symbols Outlined")
-    mic_outlined = IconData(name="mic", fontFamily="Material Symbols Outlined")
-    mic_alert_outlined = IconData(name="mic_alert", fontFamily="Material Symbols Outlined")
-    mic_double_outlined = IconData(name="mic_double", fontFamily="Material Symbols Outlined")
-    mic_external_off_outlined = IconData(name="mic_external_off", fontFamily="Material Symbols Outlined")
-    mic_external_on_outlined = IconData(name="mic_external_on", fontFamily="Material Symbols Outlined")
-    mic_none_outlined = IconData(name="mic_none", fontFamily="Material Symbols Outlined")
-    mic_off_outlined = IconData(name="mic_off", fontFamily="Material Symbols Outlined")
-    microbiology_outlined = IconData(name="microbiology", fontFamily="Material Symbols Outlined")
-    microwave_outlined = IconData(name="microwave", fontFamily="Material Symbols Outlined")
-    microwave_gen_outlined = IconData(name="microwave_gen", fontFamily="Material Symbols Outlined")
-    military_tech_outlined = IconData(name="military_tech", fontFamily="Material Symbols Outlined")
-    mimo_outlined = IconData(name="mimo", fontFamily="Material Symbols Outlined")
-    mimo_disconnect_outlined = IconData(name="mimo_disconnect", fontFamily="Material Symbols Outlined")
-    mindfulness_outlined = IconData(name="mindfulness", fontFamily="Material Symbols Outlined")
-    minimize_outlined = IconData(name="minimize", fontFamily="Material Symbols Outlined")
-    minor_crash_outlined = IconData(name="minor_crash", fontFamily="Material Symbols Outlined")
-    mintmark_outlined = IconData(name="mintmark", fontFamily="Material Symbols Outlined")
-    missed_video_call_outlined = IconData(name="missed_video_call", fontFamily="Material Symbols Outlined")
-    missed_video_call_filled_outlined = IconData(name="missed_video_call_filled", fontFamily="Material Symbols Outlined")
-    missing_controller_outlined = IconData(name="missing_controller", fontFamily="Material Symbols Outlined")
-    mist_outlined = IconData(name="mist", fontFamily="Material Symbols Outlined")
-    mitre_outlined = IconData(name="mitre", fontFamily="Material Symbols Outlined")
-    mixture_med_outlined = IconData(name="mixture_med", fontFamily="Material Symbols Outlined")
-    mms_outlined = IconData(name="mms", fontFamily="Material Symbols Outlined")
-    mobile_friendly_outlined = IconData(name="mobile_friendly", fontFamily="Material Symbols Outlined")
-    mobile_hand_outlined = IconData(name="mobile_hand", fontFamily="Material Symbols Outlined")
-    mobile_hand_left_outlined = IconData(name="mobile_hand_left", fontFamily="Material Symbols Outlined")
-    mobile_hand_left_off_outlined = IconData(name="mobile_hand_left_off", fontFamily="Material Symbols Outlined")
-    mobile_hand_off_outlined = IconData(name="mobile_hand_off", fontFamily="Material Symbols Outlined")
-    mobile_loupe_outlined = IconData(name="mobile_loupe", fontFamily="Material Symbols Outlined")
-    mobile_off_outlined = IconData(name="mobile_off", fontFamily="Material Symbols Outlined")
-    mobile_screen_share_outlined = IconData(name="mobile_screen_share", fontFamily="Material Symbols Outlined")
-    mobile_screensaver_outlined = IconData(name="mobile_screensaver", fontFamily="Material Symbols Outlined")
-    mobile_sound_2_outlined = IconData(name="mobile_sound_2", fontFamily="Material Symbols Outlined")
-    mobile_speaker_outlined = IconData(name="mobile_speaker", fontFamily="Material Symbols Outlined")
-    mobiledata_off_outlined = IconData(name="mobiledata_off", fontFamily="Material Symbols Outlined")
-    mode_outlined = IconData(name="mode", fontFamily="Material Symbols Outlined")
-    mode_comment_outlined = IconData(name="mode_comment", fontFamily="Material Symbols Outlined")
-    mode_cool_outlined = IconData(name="mode_cool", fontFamily="Material Symbols Outlined")
-    mode_cool_off_outlined = IconData(name="mode_cool_off", fontFamily="Material Symbols Outlined")
-    mode_dual_outlined = IconData(name="mode_dual", fontFamily="Material Symbols Outlined")
-    mode_edit_outlined = IconData(name="mode_edit", fontFamily="Material Symbols Outlined")
-    mode_edit_outline_outlined = IconData(name="mode_edit_outline", fontFamily="Material Symbols Outlined")
-    mode_fan_outlined = IconData(name="mode_fan", fontFamily="Material Symbols Outlined")
-    mode_fan_off_outlined = IconData(name="mode_fan_off", fontFamily="Material Symbols Outlined")
-    mode_heat_outlined = IconData(name="mode_heat", fontFamily="Material Symbols Outlined")
-    mode_heat_cool_outlined = IconData(name="mode_heat_cool", fontFamily="Material Symbols Outlined")
-    mode_heat_off_outlined = IconData(name="mode_heat_off", fontFamily="Material Symbols Outlined")
-    mode_night_outlined = IconData(name="mode_night", fontFamily="Material Symbols Outlined")
-    mode_of_travel_outlined = IconData(name="mode_of_travel", fontFamily="Material Symbols Outlined")
-    mode_off_on_outlined = IconData(name="mode_off_on", fontFamily="Material Symbols Outlined")
-    mode_standby_outlined = IconData(name="mode_standby", fontFamily="Material Symbols Outlined")
-    model_training_outlined = IconData(name="model_training", fontFamily="Material Symbols Outlined")
-    modeling_outlined = IconData(name="modeling", fontFamily="Material Symbols Outlined")
-    monetization_on_outlined = IconData(name="monetization_on", fontFamily="Material Symbols Outlined")
-    money_outlined = IconData(name="money", fontFamily="Material Symbols Outlined")
-    money_bag_outlined = IconData(name="money_bag", fontFamily="Material Symbols Outlined")
-    money_off_outlined = IconData(name="money_off", fontFamily="Material Symbols Outlined")
-    money_off_csred_outlined = IconData(name="money_off_csred", fontFamily="Material Symbols Outlined")
-    monitor_outlined = IconData(name="monitor", fontFamily="Material Symbols Outlined")
-    monitor_heart_outlined = IconData(name="monitor_heart", fontFamily="Material Symbols Outlined")
-    monitor_weight_outlined = IconData(name="monitor_weight", fontFamily="Material Symbols Outlined")
-    monitor_weight_gain_outlined = IconData(name="monitor_weight_gain", fontFamily="Material Symbols Outlined")
-    monitor_weight_loss_outlined = IconData(name="monitor_weight_loss", fontFamily="Material Symbols Outlined")
-    monitoring_outlined = IconData(name="monitoring", fontFamily="Material Symbols Outlined")
-    monochrome_photos_outlined = IconData(name="monochrome_photos", fontFamily="Material Symbols Outlined")
-    monorail_outlined = IconData(name="monorail", fontFamily="Material Symbols Outlined")
-    mood_outlined = IconData(name="mood", fontFamily="Material Symbols Outlined")
-    mood_bad_outlined = IconData(name="mood_bad", fontFamily="Material Symbols Outlined")
-    moon_stars_outlined = IconData(name="moon_stars", fontFamily="Material Symbols Outlined")
-    mop_outlined = IconData(name="mop", fontFamily="Material Symbols Outlined")
-    moped_outlined = IconData(name="moped", fontFamily="Material Symbols Outlined")
-    more_outlined = IconData(name="more", fontFamily="Material Symbols Outlined")
-    more_down_outlined = IconData(name="more_down", fontFamily="Material Symbols Outlined")
-    more_horiz_outlined = IconData(name="more_horiz", fontFamily="Material Symbols Outlined")
-    more_time_outlined = IconData(name="more_time", fontFamily="Material Symbols Outlined")
-    more_up_outlined = IconData(name="more_up", fontFamily="Material Symbols Outlined")
-    more_vert_outlined = IconData(name="more_vert", fontFamily="Material Symbols Outlined")
-    mosque_outlined = IconData(name="mosque", fontFamily="Material Symbols Outlined")
-    motion_blur_outlined = IconData(name="motion_blur", fontFamily="Material Symbols Outlined")
-    motion_mode_outlined = IconData(name="motion_mode", fontFamily="Material Symbols Outlined")
-    motion_photos_auto_outlined = IconData(name="motion_photos_auto", fontFamily="Material Symbols Outlined")
-    motion_photos_off_outlined = IconData(name="motion_photos_off", fontFamily="Material Symbols Outlined")
-    motion_photos_on_outlined = IconData(name="motion_photos_on", fontFamily="Material Symbols Outlined")
-    motion_photos_pause_outlined = IconData(name="motion_photos_pause", fontFamily="Material Symbols Outlined")
-    motion_photos_paused_outlined = IconData(name="motion_photos_paused", fontFamily="Material Symbols Outlined")
-    motion_play_outlined = IconData(name="motion_play", fontFamily="Material Symbols Outlined")
-    motion_sensor_active_outlined = IconData(name="motion_sensor_active", fontFamily="Material Symbols Outlined")
-    motion_sensor_alert_outlined = IconData(name="motion_sensor_alert", fontFamily="Material Symbols Outlined")
-    motion_sensor_idle_outlined = IconData(name="motion_sensor_idle", fontFamily="Material Symbols Outlined")
-    motion_sensor_urgent_outlined = IconData(name="motion_sensor_urgent", fontFamily="Material Symbols Outlined")
-    motorcycle_outlined = IconData(name="motorcycle", fontFamily="Material Symbols Outlined")
-    mountain_flag_outlined = IconData(name="mountain_flag", fontFamily="Material Symbols Outlined")
-    mouse_outlined = IconData(name="mouse", fontFamily="Material Symbols Outlined")
-    mouse_lock_outlined = IconData(name="mouse_lock", fontFamily="Material Symbols Outlined")
-    mouse_lock_off_outlined = IconData(name="mouse_lock_off", fontFamily="Material Symbols Outlined")
-    move_outlined = IconData(name="move", fontFamily="Material Symbols Outlined")
-    move_down_outlined = IconData(name="move_down", fontFamily="Material Symbols Outlined")
-    move_group_outlined = IconData(name="move_group", fontFamily="Material Symbols Outlined")
-    move_item_outlined = IconData(name="move_item", fontFamily="Material Symbols Outlined")
-    move_location_outlined = IconData(name="move_location", fontFamily="Material Symbols Outlined")
-    move_selection_down_outlined = IconData(name="move_selection_down", fontFamily="Material Symbols Outlined")
-    move_selection_left_outlined = IconData(name="move_selection_left", fontFamily="Material Symbols Outlined")
-    move_selection_right_outlined = IconData(name="move_selection_right", fontFamily="Material Symbols Outlined")
-    move_selection_up_outlined = IconData(name="move_selection_up", fontFamily="Material Symbols Outlined")
-    move_to_inbox_outlined = IconData(name="move_to_inbox", fontFamily="Material Symbols Outlined")
-    move_up_outlined = IconData(name="move_up", fontFamily="Material Symbols Outlined")
-    moved_location_outlined = IconData(name="moved_location", fontFamily="Material Symbols Outlined")
-    movie_outlined = IconData(name="movie", fontFamily="Material Symbols Outlined")
-    movie_creation_outlined = IconData(name="movie_creation", fontFamily="Material Symbols Outlined")
-    movie_edit_outlined = IconData(name="movie_edit", fontFamily="Material Symbols Outlined")
-    movie_filter_outlined = IconData(name="movie_filter", fontFamily="Material Symbols Outlined")
-    movie_info_outlined = IconData(name="movie_info", fontFamily="Material Symbols Outlined")
-    movie_off_outlined = IconData(name="movie_off", fontFamily="Material Symbols Outlined")
-    moving_outlined = IconData(name="moving", fontFamily="Material Symbols Outlined")
-    moving_beds_outlined = IconData(name="moving_beds", fontFamily="Material Symbols Outlined")
-    moving_ministry_outlined = IconData(name="moving_ministry", fontFamily="Material Symbols Outlined")
-    mp_outlined = IconData(name="mp", fontFamily="Material Symbols Outlined")
-    multicooker_outlined = IconData(name="multicooker", fontFamily="Material Symbols Outlined")
-    multiline_chart_outlined = IconData(name="multiline_chart", fontFamily="Material Symbols Outlined")
-    multimodal_hand_eye_outlined = IconData(name="multimodal_hand_eye", fontFamily="Material Symbols Outlined")
-    multiple_airports_outlined = IconData(name="multiple_airports", fontFamily="Material Symbols Outlined")
-    multiple_stop_outlined = IconData(name="multiple_stop", fontFamily="Material Symbols Outlined")
-    museum_outlined = IconData(name="museum", fontFamily="Material Symbols Outlined")
-    music_cast_outlined = IconData(name="music_cast", fontFamily="Material Symbols Outlined")
-    music_note_outlined = IconData(name="music_note", fontFamily="Material Symbols Outlined")
-    music_note_add_outlined = IconData(name="music_note_add", fontFamily="Material Symbols Outlined")
-    music_off_outlined = IconData(name="music_off", fontFamily="Material Symbols Outlined")
-    music_video_outlined = IconData(name="music_video", fontFamily="Material Symbols Outlined")
-    my_location_outlined = IconData(name="my_location", fontFamily="Material Symbols Outlined")
-    mystery_outlined = IconData(name="mystery", fontFamily="Material Symbols Outlined")
-    nat_outlined = IconData(name="nat", fontFamily="Material Symbols Outlined")
-    nature_outlined = IconData(name="nature", fontFamily="Material Symbols Outlined")
-    nature_people_outlined = IconData(name="nature_people", fontFamily="Material Symbols Outlined")
-    navigate_before_outlined = IconData(name="navigate_before", fontFamily="Material Symbols Outlined")
-    navigate_next_outlined = IconData(name="navigate_next", fontFamily="Material Symbols Outlined")
-    navigation_outlined = IconData(name="navigation", fontFamily="Material Symbols Outlined")
-    near_me_outlined = IconData(name="near_me", fontFamily="Material Symbols Outlined")
-    near_me_disabled_outlined = IconData(name="near_me_disabled", fontFamily="Material Symbols Outlined")
-    nearby_outlined = IconData(name="nearby", fontFamily="Material Symbols Outlined")
-    nearby_error_outlined = IconData(name="nearby_error", fontFamily="Material Symbols Outlined")
-    nearby_off_outlined = IconData(name="nearby_off", fontFamily="Material Symbols Outlined")
-    nephrology_outlined = IconData(name="nephrology", fontFamily="Material Symbols Outlined")
-    nest_audio_outlined = IconData(name="nest_audio", fontFamily="Material Symbols Outlined")
-    nest_cam_floodlight_outlined = IconData(name="nest_cam_floodlight", fontFamily="Material Symbols Outlined")
-    nest_cam_indoor_outlined = IconData(name="nest_cam_indoor", fontFamily="Material Symbols Outlined")
-    nest_cam_iq_outlined = IconData(name="nest_cam_iq", fontFamily="Material Symbols Outlined")
-    nest_cam_iq_outdoor_outlined = IconData(name="nest_cam_iq_outdoor", fontFamily="Material Symbols Outlined")
-    nest_cam_magnet_mount_outlined = IconData(name="nest_cam_magnet_mount", fontFamily="Material Symbols Outlined")
-    nest_cam_outdoor_outlined = IconData(name="nest_cam_outdoor", fontFamily="Material Symbols Outlined")
-    nest_cam_stand_outlined = IconData(name="nest_cam_stand", fontFamily="Material Symbols Outlined")
-    nest_cam_wall_mount_outlined = IconData(name="nest_cam_wall_mount", fontFamily="Material Symbols Outlined")
-    nest_cam_wired_stand_outlined = IconData(name="nest_cam_wired_stand", fontFamily="Material Symbols Outlined")
-    nest_clock_farsight_analog_outlined = IconData(name="nest_clock_farsight_analog", fontFamily="Material Symbols Outlined")
-    nest_clock_farsight_digital_outlined = IconData(name="nest_clock_farsight_digital", fontFamily="Material Symbols Outlined")
-    nest_connect_outlined = IconData(name="nest_connect", fontFamily="Material Symbols Outlined")
-    nest_detect_outlined = IconData(name="nest_detect", fontFamily="Material Symbols Outlined")
-    nest_display_outlined = IconData(name="nest_display", fontFamily="Material Symbols Outlined")
-    nest_display_max_outlined = IconData(name="nest_display_max", fontFamily="Material Symbols Outlined")
-    nest_doorbell_visitor_outlined = IconData(name="nest_doorbell_visitor", fontFamily="Material Symbols Outlined")
-    nest_eco_leaf_outlined = IconData(name="nest_eco_leaf", fontFamily="Material Symbols Outlined")
-    nest_farsight_weather_outlined = IconData(name="nest_farsight_weather", fontFamily="Material Symbols Outlined")
-    nest_found_savings_outlined = IconData(name="nest_found_savings", fontFamily="Material Symbols Outlined")
-    nest_gale_wifi_outlined = IconData(name="nest_gale_wifi", fontFamily="Material Symbols Outlined")
-    nest_heat_link_e_outlined = IconData(name="nest_heat_link_e", fontFamily="Material Symbols Outlined")
-    nest_heat_link_gen_3_outlined = IconData(name="nest_heat_link_gen_3", fontFamily="Material Symbols Outlined")
-    nest_hello_doorbell_outlined = IconData(name="nest_hello_doorbell", fontFamily="Material Symbols Outlined")
-    nest_locator_tag_outlined = IconData(name="nest_locator_tag", fontFamily="Material Symbols Outlined")
-    nest_mini_outlined = IconData(name="nest_mini", fontFamily="Material Symbols Outlined")
-    nest_multi_room_outlined = IconData(name="nest_multi_room", fontFamily="Material Symbols Outlined")
-    nest_protect_outlined = IconData(name="nest_protect", fontFamily="Material Symbols Outlined")
-    nest_remote_outlined = IconData(name="nest_remote", fontFamily="Material Symbols Outlined")
-    nest_remote_comfort_sensor_outlined = IconData(name="nest_remote_comfort_sensor", fontFamily="Material Symbols Outlined")
-    nest_secure_alarm_outlined = IconData(name="nest_secure_alarm", fontFamily="Material Symbols Outlined")
-    nest_sunblock_outlined = IconData(name="nest_sunblock", fontFamily="Material Symbols Outlined")
-    nest_tag_outlined = IconData(name="nest_tag", fontFamily="Material Symbols Outlined")
-    nest_thermostat_outlined = IconData(name="nest_thermostat", fontFamily="Material Symbols Outlined")
-    nest_thermostat_e_eu_outlined = IconData(name="nest_thermostat_e_eu", fontFamily="Material Symbols Outlined")
-    nest_thermostat_gen_3_outlined = IconData(name="nest_thermostat_gen_3", fontFamily="Material Symbols Outlined")
-    nest_thermostat_sensor_outlined = IconData(name="nest_thermostat_sensor", fontFamily="Material Symbols Outlined")
-    nest_thermostat_sensor_eu_outlined = IconData(name="nest_thermostat_sensor_eu", fontFamily="Material Symbols Outlined")
-    nest_thermostat_zirconium_eu_outlined = IconData(name="nest_thermostat_zirconium_eu", fontFamily="Material Symbols Outlined")
-    nest_true_radiant_outlined = IconData(name="nest_true_radiant", fontFamily="Material Symbols Outlined")
-    nest_wake_on_approach_outlined = IconData(name="nest_wake_on_approach", fontFamily="Material Symbols Outlined")
-    nest_wake_on_press_outlined = IconData(name="nest_wake_on_press", fontFamily="Material Symbols Outlined")
-    nest_wifi_gale_outlined = IconData(name="nest_wifi_gale", fontFamily="Material Symbols Outlined")
-    nest_wifi_mistral_outlined = IconData(name="nest_wifi_mistral", fontFamily="Material Symbols Outlined")
-    nest_wifi_point_outlined = IconData(name="nest_wifi_point", fontFamily="Material Symbols Outlined")
-    nest_wifi_point_vento_outlined = IconData(name="nest_wifi_point_vento", fontFamily="Material Symbols Outlined")
-    nest_wifi_pro_outlined = IconData(name="nest_wifi_pro", fontFamily="Material Symbols Outlined")
-    nest_wifi_pro_2_outlined = IconData(name="nest_wifi_pro_2", fontFamily="Material Symbols Outlined")
-    nest_wifi_router_outlined = IconData(name="nest_wifi_router", fontFamily="Material Symbols Outlined")
-    network_cell_outlined = IconData(name="network_cell", fontFamily="Material Symbols Outlined")
-    network_check_outlined = IconData(name="network_check", fontFamily="Material Symbols Outlined")
-    network_intel_node_outlined = IconData(name="network_intel_node", fontFamily="Material Symbols Outlined")
-    network_intelligence_outlined = IconData(name="network_intelligence", fontFamily="Material Symbols Outlined")
-    network_intelligence_history_outlined = IconData(name="network_intelligence_history", fontFamily="Material Symbols Outlined")
-    network_intelligence_update_outlined = IconData(name="network_intelligence_update", fontFamily="Material Symbols Outlined")
-    network_locked_outlined = IconData(name="network_locked", fontFamily="Material Symbols Outlined")
-    network_manage_outlined = IconData(name="network_manage", fontFamily="Material Symbols Outlined")
-    network_node_outlined = IconData(name="network_node", fontFamily="Material Symbols Outlined")
-    network_ping_outlined = IconData(name="network_ping", fontFamily="Material Symbols Outlined")
-    network_wifi_outlined = IconData(name="network_wifi", fontFamily="Material Symbols Outlined")
-    network_wifi_1_bar_outlined = IconData(name="network_wifi_1_bar", fontFamily="Material Symbols Outlined")
-    network_wifi_1_bar_locked_outlined = IconData(name="network_wifi_1_bar_locked", fontFamily="Material Symbols Outlined")
-    network_wifi_2_bar_outlined = IconData(name="network_wifi_2_bar", fontFamily="Material Symbols Outlined")
-    network_wifi_2_bar_locked_outlined = IconData(name="network_wifi_2_bar_locked", fontFamily="Material Symbols Outlined")
-    network_wifi_3_bar_outlined = IconData(name="network_wifi_3_bar", fontFamily="Material Symbols Outlined")
-    network_wifi_3_bar_locked_outlined = IconData(name="network_wifi_3_bar_locked", fontFamily="Material Symbols Outlined")
-    network_wifi_locked_outlined = IconData(name="network_wifi_locked", fontFamily="Material Symbols Outlined")
-    neurology_outlined = IconData(name="neurology", fontFamily="Material Symbols Outlined")
-    new_label_outlined = IconData(name="new_label", fontFamily="Material Symbols Outlined")
-    new_releases_outlined = IconData(name="new_releases", fontFamily="Material Symbols Outlined")
-    new_window_outlined = IconData(name="new_window", fontFamily="Material Symbols Outlined")
-    news_outlined = IconData(name="news", fontFamily="Material Symbols Outlined")
-    newsmode_outlined = IconData(name="newsmode", fontFamily="Material Symbols Outlined")
-    newspaper_outlined = IconData(name="newspaper", fontFamily="Material Symbols Outlined")
-    newsstand_outlined = IconData(name="newsstand", fontFamily="Material Symbols Outlined")
-    next_plan_outlined = IconData(name="next_plan", fontFamily="Material Symbols Outlined")
-    next_week_outlined = IconData(name="next_week", fontFamily="Material Symbols Outlined")
-    nfc_outlined = IconData(name="nfc", fontFamily="Material Symbols Outlined")
-    nfc_off_outlined = IconData(name="nfc_off", fontFamily="Material Symbols Outlined")
-    night_shelter_outlined = IconData(name="night_shelter", fontFamily="Material Symbols Outlined")
-    night_sight_auto_outlined = IconData(name="night_sight_auto", fontFamily="Material Symbols Outlined")
-    night_sight_auto_off_outlined = IconData(name="night_sight_auto_off", fontFamily="Material Symbols Outlined")
-    night_sight_max_outlined = IconData(name="night_sight_max", fontFamily="Material Symbols Outlined")
-    nightlife_outlined = IconData(name="nightlife", fontFamily="Material Symbols Outlined")
-    nightlight_outlined = IconData(name="nightlight", fontFamily="Material Symbols Outlined")
-    nightlight_round_outlined = IconData(name="nightlight_round", fontFamily="Material Symbols Outlined")
-    nights_stay_outlined = IconData(name="nights_stay", fontFamily="Material Symbols Outlined")
-    no_accounts_outlined = IconData(name="no_accounts", fontFamily="Material Symbols Outlined")
-    no_adult_content_outlined = IconData(name="no_adult_content", fontFamily="Material Symbols Outlined")
-    no_backpack_outlined = IconData(name="no_backpack", fontFamily="Material Symbols Outlined")
-    no_crash_outlined = IconData(name="no_crash", fontFamily="Material Symbols Outlined")
-    no_drinks_outlined = IconData(name="no_drinks", fontFamily="Material Symbols Outlined")
-    no_encryption_outlined = IconData(name="no_encryption", fontFamily="Material Symbols Outlined")
-    no_encryption_gmailerrorred_outlined = IconData(name="no_encryption_gmailerrorred", fontFamily="Material Symbols Outlined")
-    no_flash_outlined = IconData(name="no_flash", fontFamily="Material Symbols Outlined")
-    no_food_outlined = IconData(name="no_food", fontFamily="Material Symbols Outlined")
-    no_luggage_outlined = IconData(name="no_luggage", fontFamily="Material Symbols Outlined")
-    no_meals_outlined = IconData(name="no_meals", fontFamily="Material Symbols Outlined")
-    no_meeting_room_outlined = IconData(name="no_meeting_room", fontFamily="Material Symbols Outlined")
-    no_photography_outlined = IconData(name="no_photography", fontFamily="Material Symbols Outlined")
-    no_sim_outlined = IconData(name="no_sim", fontFamily="Material Symbols Outlined")
-    no_sound_outlined = IconData(name="no_sound", fontFamily="Material Symbols Outlined")
-    no_stroller_outlined = IconData(name="no_stroller", fontFamily="Material Symbols Outlined")
-    no_transfer_outlined = IconData(name="no_transfer", fontFamily="Material Symbols Outlined")
-    noise_aware_outlined = IconData(name="noise_aware", fontFamily="Material Symbols Outlined")
-    noise_control_off_outlined = IconData(name="noise_control_off", fontFamily="Material Symbols Outlined")
-    noise_control_on_outlined = IconData(name="noise_control_on", fontFamily="Material Symbols Outlined")
-    nordic_walking_outlined = IconData(name="nordic_walking", fontFamily="Material Symbols Outlined")
-    north_outlined = IconData(name="north", fontFamily="Material Symbols Outlined")
-    north_east_outlined = IconData(name="north_east", fontFamily="Material Symbols Outlined")
-    north_west_outlined = IconData(name="north_west", fontFamily="Material Symbols Outlined")
-    not_accessible_outlined = IconData(name="not_accessible", fontFamily="Material Symbols Outlined")
-    not_accessible_forward_outlined = IconData(name="not_accessible_forward", fontFamily="Material Symbols Outlined")
-    not_interested_outlined = IconData(name="not_interested", fontFamily="Material Symbols Outlined")
-    not_listed_location_outlined = IconData(name="not_listed_location", fontFamily="Material Symbols Outlined")
-    not_started_outlined = IconData(name="not_started", fontFamily="Material Symbols Outlined")
-    note_outlined = IconData(name="note", fontFamily="Material Symbols Outlined")
-    note_add_outlined = IconData(name="note_add", fontFamily="Material Symbols Outlined")
-    note_alt_outlined = IconData(name="note_alt", fontFamily="Material Symbols Outlined")
-    note_stack_outlined = IconData(name="note_stack", fontFamily="Material Symbols Outlined")
-    note_stack_add_outlined = IconData(name="note_stack_add", fontFamily="Material Symbols Outlined")
-    notes_outlined = IconData(name="notes", fontFamily="Material Symbols Outlined")
-    notification_add_outlined = IconData(name="notification_add", fontFamily="Material Symbols Outlined")
-    notification_important_outlined = IconData(name="notification_important", fontFamily="Material Symbols Outlined")
-    notification_multiple_outlined = IconData(name="notification_multiple", fontFamily="Material Symbols Outlined")
-    notification_settings_outlined = IconData(name="notification_settings", fontFamily="Material Symbols Outlined")
-    notification_sound_outlined = IconData(name="notification_sound", fontFamily="Material Symbols Outlined")
-    notifications_outlined = IconData(name="notifications", fontFamily="Material Symbols Outlined")
-    notifications_active_outlined = IconData(name="notifications_active", fontFamily="Material Symbols Outlined")
-    notifications_none_outlined = IconData(name="notifications_none", fontFamily="Material Symbols Outlined")
-    notifications_off_outlined = IconData(name="notifications_off", fontFamily="Material Symbols Outlined")
-    notifications_paused_outlined = IconData(name="notifications_paused", fontFamily="Material Symbols Outlined")
-    notifications_unread_outlined = IconData(name="notifications_unread", fontFamily="Material Symbols Outlined")
-    numbers_outlined = IconData(name="numbers", fontFamily="Material Symbols Outlined")
-    nutrition_outlined = IconData(name="nutrition", fontFamily="Material Symbols Outlined")
-    ods_outlined = IconData(name="ods", fontFamily="Material Symbols Outlined")
-    odt_outlined = IconData(name="odt", fontFamily="Material Symbols Outlined")
-    offline_bolt_outlined = IconData(name="offline_bolt", fontFamily="Material Symbols Outlined")
-    offline_pin_outlined = IconData(name="offline_pin", fontFamily="Material Symbols Outlined")
-    offline_pin_off_outlined = IconData(name="offline_pin_off", fontFamily="Material Symbols Outlined")
-    offline_share_outlined = IconData(name="offline_share", fontFamily="Material Symbols Outlined")
-    oil_barrel_outlined = IconData(name="oil_barrel", fontFamily="Material Symbols Outlined")
-    on_device_training_outlined = IconData(name="on_device_training", fontFamily="Material Symbols Outlined")
-    on_hub_device_outlined = IconData(name="on_hub_device", fontFamily="Material Symbols Outlined")
-    oncology_outlined = IconData(name="oncology", fontFamily="Material Symbols Outlined")
-    ondemand_video_outlined = IconData(name="ondemand_video", fontFamily="Material Symbols Outlined")
-    online_prediction_outlined = IconData(name="online_prediction", fontFamily="Material Symbols Outlined")
-    onsen_outlined = IconData(name="onsen", fontFamily="Material Symbols Outlined")
-    opacity_outlined = IconData(name="opacity", fontFamily="Material Symbols Outlined")
-    open_in_browser_outlined = IconData(name="open_in_browser", fontFamily="Material Symbols Outlined")
-    open_in_full_outlined = IconData(name="open_in_full", fontFamily="Material Symbols Outlined")
-    open_in_new_outlined = IconData(name="open_in_new", fontFamily="Material Symbols Outlined")
-    open_in_new_down_outlined = IconData(name="open_in_new_down", fontFamily="Material Symbols Outlined")
-    open_in_new_off_outlined = IconData(name="open_in_new_off", fontFamily="Material Symbols Outlined")
-    open_in_phone_outlined = IconData(name="open_in_phone", fontFamily="Material Symbols Outlined")
-    open_jam_outlined = IconData(name="open_jam", fontFamily="Material Symbols Outlined")
-    open_run_outlined = IconData(name="open_run", fontFamily="Material Symbols Outlined")
-    open_with_outlined = IconData(name="open_with", fontFamily="Material Symbols Outlined")
-    ophthalmology_outlined = IconData(name="ophthalmology", fontFamily="Material Symbols Outlined")
-    oral_disease_outlined = IconData(name="oral_disease", fontFamily="Material Symbols Outlined")
-    orbit_outlined = IconData(name="orbit", fontFamily="Material Symbols Outlined")
-    order_approve_outlined = IconData(name="order_approve", fontFamily="Material Symbols Outlined")
-    order_play_outlined = IconData(name="order_play", fontFamily="Material Symbols Outlined")
-    orders_outlined = IconData(name="orders", fontFamily="Material Symbols Outlined")
-    orthopedics_outlined = IconData(name="orthopedics", fontFamily="Material Symbols Outlined")
-    other_admission_outlined = IconData(name="other_admission", fontFamily="Material Symbols Outlined")
-    other_houses_outlined = IconData(name="other_houses", fontFamily="Material Symbols Outlined")
-    outbound_outlined = IconData(name="outbound", fontFamily="Material Symbols Outlined")
-    outbox_outlined = IconData(name="outbox", fontFamily="Material Symbols Outlined")
-    outbox_alt_outlined = IconData(name="outbox_alt", fontFamily="Material Symbols Outlined")
-    outdoor_garden_outlined = IconData(name="outdoor_garden", fontFamily="Material Symbols Outlined")
-    outdoor_grill_outlined = IconData(name="outdoor_grill", fontFamily="Material Symbols Outlined")
-    outgoing_mail_outlined = IconData(name="outgoing_mail", fontFamily="Material Symbols Outlined")
-    outlet_outlined = IconData(name="outlet", fontFamily="Material Symbols Outlined")
-    outlined_flag_outlined = IconData(name="outlined_flag", fontFamily="Material Symbols Outlined")
-    outpatient_outlined = IconData(name="outpatient", fontFamily="Material Symbols Outlined")
-    outpatient_med_outlined = IconData(name="outpatient_med", fontFamily="Material Symbols Outlined")
-    output_outlined = IconData(name="output", fontFamily="Material Symbols Outlined")
-    output_circle_outlined = IconData(name="output_circle", fontFamily="Material Symbols Outlined")
-    oven_outlined = IconData(name="oven", fontFamily="Material Symbols Outlined")
-    oven_gen_outlined = IconData(name="oven_gen", fontFamily="Material Symbols Outlined")
-    overview_outlined = IconData(name="overview", fontFamily="Material Symbols Outlined")
-    overview_key_outlined = IconData(name="overview_key", fontFamily="Material Symbols Outlined")
-    owl_outlined = IconData(name="owl", fontFamily="Material Symbols Outlined")
-    oxygen_saturation_outlined = IconData(name="oxygen_saturation", fontFamily="Material Symbols Outlined")
-    p2p_outlined = IconData(name="p2p", fontFamily="Material Symbols Outlined")
-    pace_outlined = IconData(name="pace", fontFamily="Material Symbols Outlined")
-    pacemaker_outlined = IconData(name="pacemaker", fontFamily="Material Symbols Outlined")
-    package_outlined = IconData(name="package", fontFamily="Material Symbols Outlined")
-    package_2_outlined = IconData(name="package_2", fontFamily="Material Symbols Outlined")
-    padding_outlined = IconData(name="padding", fontFamily="Material Symbols Outlined")
-    page_control_outlined = IconData(name="page_control", fontFamily="Material Symbols Outlined")
-    page_footer_outlined = IconData(name="page_footer", fontFamily="Material Symbols Outlined")
-    page_header_outlined = IconData(name="page_header", fontFamily="Material Symbols Outlined")
-    page_info_outlined = IconData(name="page_info", fontFamily="Material Symbols Outlined")
-    pageless_outlined = IconData(name="pageless", fontFamily="Material Symbols Outlined")
-    pages_outlined = IconData(name="pages", fontFamily="Material Symbols Outlined")
-    pageview_outlined = IconData(name="pageview", fontFamily="Material Symbols Outlined")
-    paid_outlined = IconData(name="paid", fontFamily="Material Symbols Outlined")
-    palette_outlined = IconData(name="palette", fontFamily="Material Symbols Outlined")
-    pallet_outlined = IconData(name="pallet", fontFamily="Material Symbols Outlined")
-    pan_tool_outlined = IconData(name="pan_tool", fontFamily="Material Symbols Outlined")
-    pan_tool_alt_outlined = IconData(name="pan_tool_alt", fontFamily="Material Symbols Outlined")
-    pan_zoom_outlined = IconData(name="pan_zoom", fontFamily="Material Symbols Outlined")
-    panorama_outlined = IconData(name="panorama", fontFamily="Material Symbols Outlined")
-    panorama_fish_eye_outlined = IconData(name="panorama_fish_eye", fontFamily="Material Symbols Outlined")
-    panorama_horizontal_outlined = IconData(name="panorama_horizontal", fontFamily="Material Symbols Outlined")
-    panorama_photosphere_outlined = IconData(name="panorama_photosphere", fontFamily="Material Symbols Outlined")
-    panorama_vertical_outlined = IconData(name="panorama_vertical", fontFamily="Material Symbols Outlined")
-    panorama_wide_angle_outlined = IconData(name="panorama_wide_angle", fontFamily="Material Symbols Outlined")
-    paragliding_outlined = IconData(name="paragliding", fontFamily="Material Symbols Outlined")
-    park_outlined = IconData(name="park", fontFamily="Material Symbols Outlined")
-    partly_cloudy_day_outlined = IconData(name="partly_cloudy_day", fontFamily="Material Symbols Outlined")
-    partly_cloudy_night_outlined = IconData(name="partly_cloudy_night", fontFamily="Material Symbols Outlined")
-    partner_exchange_outlined = IconData(name="partner_exchange", fontFamily="Material Symbols Outlined")
-    partner_reports_outlined = IconData(name="partner_reports", fontFamily="Material Symbols Outlined")
-    party_mode_outlined = IconData(name="party_mode", fontFamily="Material Symbols Outlined")
-    passkey_outlined = IconData(name="passkey", fontFamily="Material Symbols Outlined")
-    password_outlined = IconData(name="password", fontFamily="Material Symbols Outlined")
-    password_2_outlined = IconData(name="password_2", fontFamily="Material Symbols Outlined")
-    password_2_off_outlined = IconData(name="password_2_off", fontFamily="Material Symbols Outlined")
-    patient_list_outlined = IconData(name="patient_list", fontFamily="Material Symbols Outlined")
-    pattern_outlined = IconData(name="pattern", fontFamily="Material Symbols Outlined")
-    pause_outlined = IconData(name="pause", fontFamily="Material Symbols Outlined")
-    pause_circle_outlined = IconData(name="pause_circle", fontFamily="Material Symbols Outlined")
-    pause_circle_filled_outlined = IconData(name="pause_circle_filled", fontFamily="Material Symbols Outlined")
-    pause_circle_outline_outlined = IconData(name="pause_circle_outline", fontFamily="Material Symbols Outlined")
-    pause_presentation_outlined = IconData(name="pause_presentation", fontFamily="Material Symbols Outlined")
-    payment_outlined = IconData(name="payment", fontFamily="Material Symbols Outlined")
-    payments_outlined = IconData(name="payments", fontFamily="Material Symbols Outlined")
-    pedal_bike_outlined = IconData(name="pedal_bike", fontFamily="Material Symbols Outlined")
-    pediatrics_outlined = IconData(name="pediatrics", fontFamily="Material Symbols Outlined")
-    pen_size_1_outlined = IconData(name="pen_size_1", fontFamily="Material Symbols Outlined")
-    pen_size_2_outlined = IconData(name="pen_size_2", fontFamily="Material Symbols Outlined")
-    pen_size_3_outlined = IconData(name="pen_size_3", fontFamily="Material Symbols Outlined")
-    pen_size_4_outlined = IconData(name="pen_size_4", fontFamily="Material Symbols Outlined")
-    pen_size_5_outlined = IconData(name="pen_size_5", fontFamily="Material Symbols Outlined")
-    pending_outlined = IconData(name="pending", fontFamily="Material Symbols Outlined")
-    pending_actions_outlined = IconData(name="pending_actions", fontFamily="Material Symbols Outlined")
-    pentagon_outlined = IconData(name="pentagon", fontFamily="Material Symbols Outlined")
-    people_outlined = IconData(name="people", fontFamily="Material Symbols Outlined")
-    people_alt_outlined = IconData(name="people_alt", fontFamily="Material Symbols Outlined")
-    people_outline_outlined = IconData(name="people_outline", fontFamily="Material Symbols Outlined")
-    percent_outlined = IconData(name="percent", fontFamily="Material Symbols Outlined")
-    performance_max_outlined = IconData(name="performance_max", fontFamily="Material Symbols Outlined")
-    pergola_outlined = IconData(name="pergola", fontFamily="Material Symbols Outlined")
-    perm_camera_mic_outlined = IconData(name="perm_camera_mic", fontFamily="Material Symbols Outlined")
-    perm_contact_calendar_outlined = IconData(name="perm_contact_calendar", fontFamily="Material Symbols Outlined")
-    perm_data_setting_outlined = IconData(name="perm_data_setting", fontFamily="Material Symbols Outlined")
-    perm_device_information_outlined = IconData(name="perm_device_information", fontFamily="Material Symbols Outlined")
-    perm_identity_outlined = IconData(name="perm_identity", fontFamily="Material Symbols Outlined")
-    perm_media_outlined = IconData(name="perm_media", fontFamily="Material Symbols Outlined")
-    perm_phone_msg_outlined = IconData(name="perm_phone_msg", fontFamily="Material Symbols Outlined")
-    perm_scan_wifi_outlined = IconData(name="perm_scan_wifi", fontFamily="Material Symbols Outlined")
-    person_outlined = IconData(name="person", fontFamily="Material Symbols Outlined")
-    person_2_outlined = IconData(name="person_2", fontFamily="Material Symbols Outlined")
-    person_3_outlined = IconData(name="person_3", fontFamily="Material Symbols Outlined")
-    person_4_outlined = IconData(name="person_4", fontFamily="Material Symbols Outlined")
-    person_add_outlined = IconData(name="person_add", fontFamily="Material Symbols Outlined")
-    person_add_alt_outlined = IconData(name="person_add_alt", fontFamily="Material Symbols Outlined")
-    person_add_disabled_outlined = IconData(name="person_add_disabled", fontFamily="Material Symbols Outlined")
-    person_alert_outlined = IconData(name="person_alert", fontFamily="Material Symbols Outlined")
-    person_apron_outlined = IconData(name="person_apron", fontFamily="Material Symbols Outlined")
-    person_book_outlined = IconData(name="person_book", fontFamily="Material Symbols Outlined")
-    person_cancel_outlined = IconData(name="person_cancel", fontFamily="Material Symbols Outlined")
-    person_celebrate_outlined = IconData(name="person_celebrate", fontFamily="Material Symbols Outlined")
-    person_check_outlined = IconData(name="person_check", fontFamily="Material Symbols Outlined")
-    person_edit_outlined = IconData(name="person_edit", fontFamily="Material Symbols Outlined")
-    person_filled_outlined = IconData(name="person_filled", fontFamily="Material Symbols Outlined")
-    person_off_outlined = IconData(name="person_off", fontFamily="Material Symbols Outlined")
-    person_outline_outlined = IconData(name="person_outline", fontFamily="Material Symbols Outlined")
-    person_pin_outlined = IconData(name="person_pin", fontFamily="Material Symbols Outlined")
-    person_pin_circle_outlined = IconData(name="person_pin_circle", fontFamily="Material Symbols Outlined")
-    person_play_outlined = IconData(name="person_play", fontFamily="Material Symbols Outlined")
-    person_raised_hand_outlined = IconData(name="person_raised_hand", fontFamily="Material Symbols Outlined")
-    person_remove_outlined = IconData(name="person_remove", fontFamily="Material Symbols Outlined")
-    person_search_outlined = IconData(name="person_search", fontFamily="Material Symbols Outlined")
-    person_shield_outlined = IconData(name="person_shield", fontFamily="Material Symbols Outlined")
-    personal_bag_outlined = IconData(name="personal_bag", fontFamily="Material Symbols Outlined")
-    personal_bag_off_outlined = IconData(name="personal_bag_off", fontFamily="Material Symbols Outlined")
-    personal_bag_question_outlined = IconData(name="personal_bag_question", fontFamily="Material Symbols Outlined")
-    personal_injury_outlined = IconData(name="personal_injury", fontFamily="Material Symbols Outlined")
-    personal_places_outlined = IconData(name="personal_places", fontFamily="Material Symbols Outlined")
-    personal_video_outlined = IconData(name="personal_video", fontFamily="Material Symbols Outlined")
-    pest_control_outlined = IconData(name="pest_control", fontFamily="Material Symbols Outlined")
-    pest_control_rodent_outlined = IconData(name="pest_control_rodent", fontFamily="Material Symbols Outlined")
-    pet_supplies_outlined = IconData(name="pet_supplies", fontFamily="Material Symbols Outlined")
-    pets_outlined = IconData(name="pets", fontFamily="Material Symbols Outlined")
-    phishing_outlined = IconData(name="phishing", fontFamily="Material Symbols Outlined")
-    phone_outlined = IconData(name="phone", fontFamily="Material Symbols Outlined")
-    phone_alt_outlined = IconData(name="phone_alt", fontFamily="Material Symbols Outlined")
-    phone_android_outlined = IconData(name="phone_android", fontFamily="Material Symbols Outlined")
-    phone_bluetooth_speaker_outlined = IconData(name="phone_bluetooth_speaker", fontFamily="Material Symbols Outlined")
-    phone_callback_outlined = IconData(name="phone_callback", fontFamily="Material Symbols Outlined")
-    phone_disabled_outlined = IconData(name="phone_disabled", fontFamily="Material Symbols Outlined")
-    phone_enabled_outlined = IconData(name="phone_enabled", fontFamily="Material Symbols Outlined")
-    phone_forwarded_outlined = IconData(name="phone_forwarded", fontFamily="Material Symbols Outlined")
-    phone_in_talk_outlined = IconData(name="phone_in_talk", fontFamily="Material Symbols Outlined")
-    phone_iphone_outlined = IconData(name="phone_iphone", fontFamily="Material Symbols Outlined")
-    phone_locked_outlined = IconData(name="phone_locked", fontFamily="Material Symbols Outlined")
-    phone_missed_outlined = IconData(name="phone_missed", fontFamily="Material Symbols Outlined")
-    phone_paused_outlined = IconData(name="phone_paused", fontFamily="Material Symbols Outlined")
-    phonelink_outlined = IconData(name="phonelink", fontFamily="Material Symbols Outlined")
-    phonelink_erase_outlined = IconData(name="phonelink_erase", fontFamily="Material Symbols Outlined")
-    phonelink_lock_outlined = IconData(name="phonelink_lock", fontFamily="Material Symbols Outlined")
-    phonelink_off_outlined = IconData(name="phonelink_off", fontFamily="Material Symbols Outlined")
-    phonelink_ring_outlined = IconData(name="phonelink_ring", fontFamily="Material Symbols Outlined")
-    phonelink_ring_off_outlined = IconData(name="phonelink_ring_off", fontFamily="Material Symbols Outlined")
-    phonelink_setup_outlined = IconData(name="phonelink_setup", fontFamily="Material Symbols Outlined")
-    photo_outlined = IconData(name="photo", fontFamily="Material Symbols Outlined")
-    photo_album_outlined = IconData(name="photo_album", fontFamily="Material Symbols Outlined")
-    photo_auto_merge_outlined = IconData(name="photo_auto_merge", fontFamily="Material Symbols Outlined")
-    photo_camera_outlined = IconData(name="photo_camera", fontFamily="Material Symbols Outlined")
-    photo_camera_back_outlined = IconData(name="photo_camera_back", fontFamily="Material Symbols Outlined")
-    photo_camera_front_outlined = IconData(name="photo_camera_front", fontFamily="Material Symbols Outlined")
-    photo_filter_outlined = IconData(name="photo_filter", fontFamily="Material Symbols Outlined")
-    photo_frame_outlined = IconData(name="photo_frame", fontFamily="Material Symbols Outlined")
-    photo_library_outlined = IconData(name="photo_library", fontFamily="Material Symbols Outlined")
-    photo_prints_outlined = IconData(name="photo_prints", fontFamily="Material Symbols Outlined")
-    photo_size_select_actual_outlined = IconData(name="photo_size_select_actual", fontFamily="Material Symbols Outlined")
-    photo_size_select_large_outlined = IconData(name="photo_size_select_large", fontFamily="Material Symbols Outlined")
-    photo_size_select_small_outlined = IconData(name="photo_size_select_small", fontFamily="Material Symbols Outlined")
-    php_outlined = IconData(name="php", fontFamily="Material Symbols Outlined")
-    physical_therapy_outlined = IconData(name="physical_therapy", fontFamily="Material Symbols Outlined")
-    piano_outlined = IconData(name="piano", fontFamily="Material Symbols Outlined")
-    piano_off_outlined = IconData(name="piano_off", fontFamily="Material Symbols Outlined")
-    picture_as_pdf_outlined = IconData(name="picture_as_pdf", fontFamily="Material Symbols Outlined")
-    picture_in_picture_outlined = IconData(name="picture_in_picture", fontFamily="Material Symbols Outlined")
-    picture_in_picture_alt_outlined = IconData(name="picture_in_picture_alt", fontFamily="Material Symbols Outlined")
-    picture_in_picture_center_outlined = IconData(name="picture_in_picture_center", fontFamily="Material Symbols Outlined")
-    picture_in_picture_large_outlined = IconData(name="picture_in_picture_large", fontFamily="Material Symbols Outlined")
-    picture_in_picture_medium_outlined = IconData(name="picture_in_picture_medium", fontFamily="Material Symbols Outlined")
-    picture_in_picture_mobile_outlined = IconData(name="picture_in_picture_mobile", fontFamily="Material Symbols Outlined")
-    picture_in_picture_off_outlined = IconData(name="picture_in_picture_off", fontFamily="Material Symbols Outlined")
-    picture_in_picture_small_outlined = IconData(name="picture_in_picture_small", fontFamily="Material Symbols Outlined")
-    pie_chart_outlined = IconData(name="pie_chart", fontFamily="Material Symbols Outlined")
-    pie_chart_filled_outlined = IconData(name="pie_chart_filled", fontFamily="Material Symbols Outlined")
-    pie_chart_outline_outlined = IconData(name="pie_chart_outline", fontFamily="Material Symbols Outlined")
-    pie_chart_outlined_outlined = IconData(name="pie_chart_outlined", fontFamily="Material Symbols Outlined")
-    pill_outlined = IconData(name="pill", fontFamily="Material Symbols Outlined")
-    pill_off_outlined = IconData(name="pill_off", fontFamily="Material Symbols Outlined")
-    pin_outlined = IconData(name="pin", fontFamily="Material Symbols Outlined")
-    pin_drop_outlined = IconData(name="pin_drop", fontFamily="Material Symbols Outlined")
-    pin_end_outlined = IconData(name="pin_end", fontFamily="Material Symbols Outlined")
-    pin_invoke_outlined = IconData(name="pin_invoke", fontFamily="Material Symbols Outlined")
-    pinboard_outlined = IconData(name="pinboard", fontFamily="Material Symbols Outlined")
-    pinboard_unread_outlined = IconData(name="pinboard_unread", fontFamily="Material Symbols Outlined")
-    pinch_outlined = IconData(name="pinch", fontFamily="Material Symbols Outlined")
-    pinch_zoom_in_outlined = IconData(name="pinch_zoom_in", fontFamily="Material Symbols Outlined")
-    pinch_zoom_out_outlined = IconData(name="pinch_zoom_out", fontFamily="Material Symbols Outlined")
-    pip_outlined = IconData(name="pip", fontFamily="Material Symbols Outlined")
-    pip_exit_outlined = IconData(name="pip_exit", fontFamily="Material Symbols Outlined")
-    pivot_table_chart_outlined = IconData(name="pivot_table_chart", fontFamily="Material Symbols Outlined")
-    place_outlined = IconData(name="place", fontFamily="Material Symbols Outlined")
-    place_item_outlined = IconData(name="place_item", fontFamily="Material Symbols Outlined")
-    plagiarism_outlined = IconData(name="plagiarism", fontFamily="Material Symbols Outlined")
-    planet_outlined = IconData(name="planet", fontFamily="Material Symbols Outlined")
-    planner_banner_ad_pt_outlined = IconData(name="planner_banner_ad_pt", fontFamily="Material Symbols Outlined")
-    planner_review_outlined = IconData(name="planner_review", fontFamily="Material Symbols Outlined")
-    play_arrow_outlined = IconData(name="play_arrow", fontFamily="Material Symbols Outlined")
-    play_circle_outlined = IconData(name="play_circle", fontFamily="Material Symbols Outlined")
-    play_disabled_outlined = IconData(name="play_disabled", fontFamily="Material Symbols Outlined")
-    play_for_work_outlined = IconData(name="play_for_work", fontFamily="Material Symbols Outlined")
-    play_lesson_outlined = IconData(name="play_lesson", fontFamily="Material Symbols Outlined")
-    play_music_outlined = IconData(name="play_music", fontFamily="Material Symbols Outlined")
-    play_pause_outlined = IconData(name="play_pause", fontFamily="Material Symbols Outlined")
-    play_shapes_outlined = IconData(name="play_shapes", fontFamily="Material Symbols Outlined")
-    playing_cards_outlined = IconData(name="playing_cards", fontFamily="Material Symbols Outlined")
-    playlist_add_outlined = IconData(name="playlist_add", fontFamily="Material Symbols Outlined")
-    playlist_add_check_outlined = IconData(name="playlist_add_check", fontFamily="Material Symbols Outlined")
-    playlist_add_check_circle_outlined = IconData(name="playlist_add_check_circle", fontFamily="Material Symbols Outlined")
-    playlist_add_circle_outlined = IconData(name="playlist_add_circle", fontFamily="Material Symbols Outlined")
-    playlist_play_outlined = IconData(name="playlist_play", fontFamily="Material Symbols Outlined")
-    playlist_remove_outlined = IconData(name="playlist_remove", fontFamily="Material Symbols Outlined")
-    plug_connect_outlined = IconData(name="plug_connect", fontFamily="Material Symbols Outlined")
-    plumbing_outlined = IconData(name="plumbing", fontFamily="Material Symbols Outlined")
-    plus_one_outlined = IconData(name="plus_one", fontFamily="Material Symbols Outlined")
-    podcasts_outlined = IconData(name="podcasts", fontFamily="Material Symbols Outlined")
-    podiatry_outlined = IconData(name="podiatry", fontFamily="Material Symbols Outlined")
-    podium_outlined = IconData(name="podium", fontFamily="Material Symbols Outlined")
-    point_of_sale_outlined = IconData(name="point_of_sale", fontFamily="Material Symbols Outlined")
-    point_scan_outlined = IconData(name="point_scan", fontFamily="Material Symbols Outlined")
-    poker_chip_outlined = IconData(name="poker_chip", fontFamily="Material Symbols Outlined")
-    policy_outlined = IconData(name="policy", fontFamily="Material Symbols Outlined")
-    policy_alert_outlined = IconData(name="policy_alert", fontFamily="Material Symbols Outlined")
-    poll_outlined = IconData(name="poll", fontFamily="Material Symbols Outlined")
-    polyline_outlined = IconData(name="polyline", fontFamily="Material Symbols Outlined")
-    polymer_outlined = IconData(name="polymer", fontFamily="Material Symbols Outlined")
-    pool_outlined = IconData(name="pool", fontFamily="Material Symbols Outlined")
-    portable_wifi_off_outlined = IconData(name="portable_wifi_off", fontFamily="Material Symbols Outlined")
-    portrait_outlined = IconData(name="portrait", fontFamily="Material Symbols Outlined")
-    position_bottom_left_outlined = IconData(name="position_bottom_left", fontFamily="Material Symbols Outlined")
-    position_bottom_right_outlined = IconData(name="position_bottom_right", fontFamily="Material Symbols Outlined")
-    position_top_right_outlined = IconData(name="position_top_right", fontFamily="Material Symbols Outlined")
-    post_outlined = IconData(name="post", fontFamily="Material Symbols Outlined")
-    post_add_outlined = IconData(name="post_add", fontFamily="Material Symbols Outlined")
-    potted_plant_outlined = IconData(name="potted_plant", fontFamily="Material Symbols Outlined")
-    power_outlined = IconData(name="power", fontFamily="Material Symbols Outlined")
-    power_input_outlined = IconData(name="power_input", fontFamily="Material Symbols Outlined")
-    power_off_outlined = IconData(name="power_off", fontFamily="Material Symbols Outlined")
-    power_rounded_outlined = IconData(name="power_rounded", fontFamily="Material Symbols Outlined")
-    power_settings_circle_outlined = IconData(name="power_settings_circle", fontFamily="Material Symbols Outlined")
-    power_settings_new_outlined = IconData(name="power_settings_new", fontFamily="Material Symbols Outlined")
-    prayer_times_outlined = IconData(name="prayer_times", fontFamily="Material Symbols Outlined")
-    precision_manufacturing_outlined = IconData(name="precision_manufacturing", fontFamily="Material Symbols Outlined")
-    pregnancy_outlined = IconData(name="pregnancy", fontFamily="Material Symbols Outlined")
-    pregnant_woman_outlined = IconData(name="pregnant_woman", fontFamily="Material Symbols Outlined")
-    preliminary_outlined = IconData(name="preliminary", fontFamily="Material Symbols Outlined")
-    prescriptions_outlined = IconData(name="prescriptions", fontFamily="Material Symbols Outlined")
-    present_to_all_outlined = IconData(name="present_to_all", fontFamily="Material Symbols Outlined")
-    preview_outlined = IconData(name="preview", fontFamily="Material Symbols Outlined")
-    preview_off_outlined = IconData(name="preview_off", fontFamily="Material Symbols Outlined")
-    price_change_outlined = IconData(name="price_change", fontFamily="Material Symbols Outlined")
-    price_check_outlined = IconData(name="price_check", fontFamily="Material Symbols Outlined")
-    print_outlined = IconData(name="print", fontFamily="Material Symbols Outlined")
-    print_add_outlined = IconData(name="print_add", fontFamily="Material Symbols Outlined")
-    print_connect_outlined = IconData(name="print_connect", fontFamily="Material Symbols Outlined")
-    print_disabled_outlined = IconData(name="print_disabled", fontFamily="Material Symbols Outlined")
-    print_error_outlined = IconData(name="print_error", fontFamily="Material Symbols Outlined")
-    print_lock_outlined = IconData(name="print_lock", fontFamily="Material Symbols Outlined")
-    priority_outlined = IconData(name="priority", fontFamily="Material Symbols Outlined")
-    priority_high_outlined = IconData(name="priority_high", fontFamily="Material Symbols Outlined")
-    privacy_outlined = IconData(name="privacy", fontFamily="Material Symbols Outlined")
-    privacy_tip_outlined = IconData(name="privacy_tip", fontFamily="Material Symbols Outlined")
-    private_connectivity_outlined = IconData(name="private_connectivity", fontFamily="Material Symbols Outlined")
-    problem_outlined = IconData(name="problem", fontFamily="Material Symbols Outlined")
-    procedure_outlined = IconData(name="procedure", fontFamily="Material Symbols Outlined")
-    process_chart_outlined = IconData(name="process_chart", fontFamily="Material Symbols Outlined")
-    production_quantity_limits_outlined = IconData(name="production_quantity_limits", fontFamily="Material Symbols Outlined")
-    productivity_outlined = IconData(name="productivity", fontFamily="Material Symbols Outlined")
-    progress_activity_outlined = IconData(name="progress_activity", fontFamily="Material Symbols Outlined")
-    prompt_suggestion_outlined = IconData(name="prompt_suggestion", fontFamily="Material Symbols Outlined")
-    propane_outlined = IconData(name="propane", fontFamily="Material Symbols Outlined")
-    propane_tank_outlined = IconData(name="propane_tank", fontFamily="Material Symbols Outlined")
-    psychiatry_outlined = IconData(name="psychiatry", fontFamily="Material Symbols Outlined")
-    psychology_outlined = IconData(name="psychology", fontFamily="Material Symbols Outlined")
-    psychology_alt_outlined = IconData(name="psychology_alt", fontFamily="Material Symbols Outlined")
-    public_outlined = IconData(name="public", fontFamily="Material Symbols Outlined")
-    public_off_outlined = IconData(name="public_off", fontFamily="Material Symbols Outlined")
-    publish_outlined = IconData(name="publish", fontFamily="Material Symbols Outlined")
-    published_with_changes_outlined = IconData(name="published_with_changes", fontFamily="Material Symbols Outlined")
-    pulmonology_outlined = IconData(name="pulmonology", fontFamily="Material Symbols Outlined")
-    pulse_alert_outlined = IconData(name="pulse_alert", fontFamily="Material Symbols Outlined")
-    punch_clock_outlined = IconData(name="punch_clock", fontFamily="Material Symbols Outlined")
-    push_pin_outlined = IconData(name="push_pin", fontFamily="Material Symbols Outlined")
-    qr_code_outlined = IconData(name="qr_code", fontFamily="Material Symbols Outlined")
-    qr_code_2_outlined = IconData(name="qr_code_2", fontFamily="Material Symbols Outlined")
-    qr_code_2_add_outlined = IconData(name="qr_code_2_add", fontFamily="Material Symbols Outlined")
-    qr_code_scanner_outlined = IconData(name="qr_code_scanner", fontFamily="Material Symbols Outlined")
-    query_builder_outlined = IconData(name="query_builder", fontFamily="Material Symbols Outlined")
-    query_stats_outlined = IconData(name="query_stats", fontFamily="Material Symbols Outlined")
-    question_answer_outlined = IconData(name="question_answer", fontFamily="Material Symbols Outlined")
-    question_exchange_outlined = IconData(name="question_exchange", fontFamily="Material Symbols Outlined")
-    question_mark_outlined = IconData(name="question_mark", fontFamily="Material Symbols Outlined")
-    queue_outlined = IconData(name="queue", fontFamily="Material Symbols Outlined")
-    queue_music_outlined = IconData(name="queue_music", fontFamily="Material Symbols Outlined")
-    queue_play_next_outlined = IconData(name="queue_play_next", fontFamily="Material Symbols Outlined")
-    quick_phrases_outlined = IconData(name="quick_phrases", fontFamily="Material Symbols Outlined")
-    quick_reference_outlined = IconData(name="quick_reference", fontFamily="Material Symbols Outlined")
-    quick_reference_all_outlined = IconData(name="quick_reference_all", fontFamily="Material Symbols Outlined")
-    quick_reorder_outlined = IconData(name="quick_reorder", fontFamily="Material Symbols Outlined")
-    quickreply_outlined = IconData(name="quickreply", fontFamily="Material Symbols Outlined")
-    quiet_time_outlined = IconData(name="quiet_time", fontFamily="Material Symbols Outlined")
-    quiet_time_active_outlined = IconData(name="quiet_time_active", fontFamily="Material Symbols Outlined")
-    quiz_outlined = IconData(name="quiz", fontFamily="Material Symbols Outlined")
-    r_mobiledata_outlined = IconData(name="r_mobiledata", fontFamily="Material Symbols Outlined")
-    radar_outlined = IconData(name="radar", fontFamily="Material Symbols Outlined")
-    radio_outlined = IconData(name="radio", fontFamily="Material Symbols Outlined")
-    radio_button_checked_outlined = IconData(name="radio_button_checked", fontFamily="Material Symbols Outlined")
-    radio_button_partial_outlined = IconData(name="radio_button_partial", fontFamily="Material Symbols Outlined")
-    radio_button_unchecked_outlined = IconData(name="radio_button_unchecked", fontFamily="Material Symbols Outlined")
-    radiology_outlined = IconData(name="radiology", fontFamily="Material Symbols Outlined")
-    railway_alert_outlined = IconData(name="railway_alert", fontFamily="Material Symbols Outlined")
-    railway_alert_2_outlined = IconData(name="railway_alert_2", fontFamily="Material Symbols Outlined")
-    rainy_outlined = IconData(name="rainy", fontFamily="Material Symbols Outlined")
-    rainy_heavy_outlined = IconData(name="rainy_heavy", fontFamily="Material Symbols Outlined")
-    rainy_light_outlined = IconData(name="rainy_light", fontFamily="Material Symbols Outlined")
-    rainy_snow_outlined = IconData(name="rainy_snow", fontFamily="Material Symbols Outlined")
-    ramen_dining_outlined = IconData(name="ramen_dining", fontFamily="Material Symbols Outlined")
-    ramp_left_outlined = IconData(name="ramp_left", fontFamily="Material Symbols Outlined")
-    ramp_right_outlined = IconData(name="ramp_right", fontFamily="Material Symbols Outlined")
-    range_hood_outlined = IconData(name="range_hood", fontFamily="Material Symbols Outlined")
-    rate_review_outlined = IconData(name="rate_review", fontFamily="Material Symbols Outlined")
-    rate_review_rtl_outlined = IconData(name="rate_review_rtl", fontFamily="Material Symbols Outlined")
-    raven_outlined = IconData(name="raven", fontFamily="Material Symbols Outlined")
-    raw_off_outlined = IconData(name="raw_off", fontFamily="Material Symbols Outlined")
-    raw_on_outlined = IconData(name="raw_on", fontFamily="Material Symbols Outlined")
-    read_more_outlined = IconData(name="read_more", fontFamily="Material Symbols Outlined")
-    readiness_score_outlined = IconData(name="readiness_score", fontFamily="Material Symbols Outlined")
-    real_estate_agent_outlined = IconData(name="real_estate_agent", fontFamily="Material Symbols Outlined")
-    rear_camera_outlined = IconData(name="rear_camera", fontFamily="Material Symbols Outlined")
-    rebase_outlined = IconData(name="rebase", fontFamily="Material Symbols Outlined")
-    rebase_edit_outlined = IconData(name="rebase_edit", fontFamily="Material Symbols Outlined")
-    receipt_outlined = IconData(name="receipt", fontFamily="Material Symbols Outlined")
-    receipt_long_outlined = IconData(name="receipt_long", fontFamily="Material Symbols Outlined")
-    receipt_long_off_outlined = IconData(name="receipt_long_off", fontFamily="Material Symbols Outlined")
-    recent_actors_outlined = IconData(name="recent_actors", fontFamily="Material Symbols Outlined")
-    recent_patient_outlined = IconData(name="recent_patient", fontFamily="Material Symbols Outlined")
-    recenter_outlined = IconData(name="recenter", fontFamily="Material Symbols Outlined")
-    recommend_outlined = IconData(name="recommend", fontFamily="Material Symbols Outlined")
-    record_voice_over_outlined = IconData(name="record_voice_over", fontFamily="Material Symbols Outlined")
-    rectangle_outlined = IconData(name="rectangle", fontFamily="Material Symbols Outlined")
-    recycling_outlined = IconData(name="recycling", fontFamily="Material Symbols Outlined")
-    redeem_outlined = IconData(name="redeem", fontFamily="Material Symbols Outlined")
-    redo_outlined = IconData(name="redo", fontFamily="Material Symbols Outlined")
-    reduce_capacity_outlined = IconData(name="reduce_capacity", fontFamily="Material Symbols Outlined")
-    refresh_outlined = IconData(name="refresh", fontFamily="Material Symbols Outlined")
-    regular_expression_outlined = IconData(name="regular_expression", fontFamily="Material Symbols Outlined")
-    relax_outlined = IconData(name="relax", fontFamily="Material Symbols Outlined")
-    release_alert_outlined = IconData(name="release_alert", fontFamily="Material Symbols Outlined")
-    remember_me_outlined = IconData(name="remember_me", fontFamily="Material Symbols Outlined")
-    reminder_outlined = IconData(name="reminder", fontFamily="Material Symbols Outlined")
-    reminders_alt_outlined = IconData(name="reminders_alt", fontFamily="Material Symbols Outlined")
-    remote_gen_outlined = IconData(name="remote_gen", fontFamily="Material Symbols Outlined")
-    remove_outlined = IconData(name="remove", fontFamily="Material Symbols Outlined")
-    remove_circle_outlined = IconData(name="remove_circle", fontFamily="Material Symbols Outlined")
-    remove_circle_outline_outlined = IconData(name="remove_circle_outline", fontFamily="Material Symbols Outlined")
-    remove_done_outlined = IconData(name="remove_done", fontFamily="Material Symbols Outlined")
-    remove_from_queue_outlined = IconData(name="remove_from_queue", fontFamily="Material Symbols Outlined")
-    remove_moderator_outlined = IconData(name="remove_moderator", fontFamily="Material Symbols Outlined")
-    remove_red_eye_outlined = IconData(name="remove_red_eye", fontFamily="Material Symbols Outlined")
-    remove_road_outlined = IconData(name="remove_road", fontFamily="Material Symbols Outlined")
-    remove_selection_outlined = IconData(name="remove_selection", fontFamily="Material Symbols Outlined")
-    remove_shopping_cart_outlined = IconData(name="remove_shopping_cart", fontFamily="Material Symbols Outlined")
-    reopen_window_outlined = IconData(name="reopen_window", fontFamily="Material Symbols Outlined")
-    reorder_outlined = IconData(name="reorder", fontFamily="Material Symbols Outlined")
-    repartition_outlined = IconData(name="repartition", fontFamily="Material Symbols Outlined")
-    repeat_outlined = IconData(name="repeat", fontFamily="Material Symbols Outlined")
-    repeat_on_outlined = IconData(name="repeat_on", fontFamily="Material Symbols Outlined")
-    repeat_one_outlined = IconData(name="repeat_one", fontFamily="Material Symbols Outlined")
-    repeat_one_on_outlined = IconData(name="repeat_one_on", fontFamily="Material Symbols Outlined")
-    replace_audio_outlined = IconData(name="replace_audio", fontFamily="Material Symbols Outlined")
-    replace_image_outlined = IconData(name="replace_image", fontFamily="Material Symbols Outlined")
-    replace_video_outlined = IconData(name="replace_video", fontFamily="Material Symbols Outlined")
-    replay_outlined = IconData(name="replay", fontFamily="Material Symbols Outlined")
-    replay_10_outlined = IconData(name="replay_10", fontFamily="Material Symbols Outlined")
-    replay_30_outlined = IconData(name="replay_30", fontFamily="Material Symbols Outlined")
-    replay_5_outlined = IconData(name="replay_5", fontFamily="Material Symbols Outlined")
-    replay_circle_filled_outlined = IconData(name="replay_circle_filled", fontFamily="Material Symbols Outlined")
-    reply_outlined = IconData(name="reply", fontFamily="Material Symbols Outlined")
-    reply_all_outlined = IconData(name="reply_all", fontFamily="Material Symbols Outlined")
-    report_outlined = IconData(name="report", fontFamily="Material Symbols Outlined")
-    report_gmailerrorred_outlined = IconData(name="report_gmailerrorred", fontFamily="Material Symbols Outlined")
-    report_off_outlined = IconData(name="report_off", fontFamily="Material Symbols Outlined")
-    report_problem_outlined = IconData(name="report_problem", fontFamily="Material Symbols Outlined")
-    request_page_outlined = IconData(name="request_page", fontFamily="Material Symbols Outlined")
-    request_quote_outlined = IconData(name="request_quote", fontFamily="Material Symbols Outlined")
-    reset_brightness_outlined = IconData(name="reset_brightness", fontFamily="Material Symbols Outlined")
-    reset_focus_outlined = IconData(name="reset_focus", fontFamily="Material Symbols Outlined")
-    reset_image_outlined = IconData(name="reset_image", fontFamily="Material Symbols Outlined")
-    reset_iso_outlined = IconData(name="reset_iso", fontFamily="Material Symbols Outlined")
-    reset_settings_outlined = IconData(name="reset_settings", fontFamily="Material Symbols Outlined")
-    reset_shadow_outlined = IconData(name="reset_shadow", fontFamily="Material Symbols Outlined")
-    reset_shutter_speed_outlined = IconData(name="reset_shutter_speed", fontFamily="Material Symbols Outlined")
-    reset_tv_outlined = IconData(name="reset_tv", fontFamily="Material Symbols Outlined")
-    reset_white_balance_outlined = IconData(name="reset_white_balance", fontFamily="Material Symbols Outlined")
-    reset_wrench_outlined = IconData(name="reset_wrench", fontFamily="Material Symbols Outlined")
-    resize_outlined = IconData(name="resize", fontFamily="Material Symbols Outlined")
-    respiratory_rate_outlined = IconData(name="respiratory_rate", fontFamily="Material Symbols Outlined")
-    responsive_layout_outlined = IconData(name="responsive_layout", fontFamily="Material Symbols Outlined")
-    restart_alt_outlined = IconData(name="restart_alt", fontFamily="Material Symbols Outlined")
-    restaurant_outlined = IconData(name="restaurant", fontFamily="Material Symbols Outlined")
-    restaurant_menu_outlined = IconData(name="restaurant_menu", fontFamily="Material Symbols Outlined")
-    restore_outlined = IconData(name="restore", fontFamily="Material Symbols Outlined")
-    restore_from_trash_outlined = IconData(name="restore_from_trash", fontFamily="Material Symbols Outlined")
-    restore_page_outlined = IconData(name="restore_page", fontFamily="Material Symbols Outlined")
-    resume_outlined = IconData(name="resume", fontFamily="Material Symbols Outlined")
-    reviews_outlined = IconData(name="reviews", fontFamily="Material Symbols Outlined")
-    rewarded_ads_outlined = IconData(name="rewarded_ads", fontFamily="Material Symbols Outlined")
-    rheumatology_outlined = IconData(name="rheumatology", fontFamily="Material Symbols Outlined")
-    rib_cage_outlined = IconData(name="rib_cage", fontFamily="Material Symbols Outlined")
-    rice_bowl_outlined = IconData(name="rice_bowl", fontFamily="Material Symbols Outlined")
-    right_click_outlined = IconData(name="right_click", fontFamily="Material Symbols Outlined")
-    right_panel_close_outlined = IconData(name="right_panel_close", fontFamily="Material Symbols Outlined")
-    right_panel_open_outlined = IconData(name="right_panel_open", fontFamily="Material Symbols Outlined")
-    ring_volume_outlined = IconData(name="ring_volume", fontFamily="Material Symbols Outlined")
-    ring_volume_filled_outlined = IconData(name="ring_volume_filled", fontFamily="Material Symbols Outlined")
-    ripples_outlined = IconData(name="ripples", fontFamily="Material Symbols Outlined")
-    road_outlined = IconData(name="road", fontFamily="Material Symbols Outlined")
-    robot_outlined = IconData(name="robot", fontFamily="Material Symbols Outlined")
-    robot_2_outlined = IconData(name="robot_2", fontFamily="Material Symbols Outlined")
-    rocket_outlined = IconData(name="rocket", fontFamily="Material Symbols Outlined")
-    rocket_launch_outlined = IconData(name="rocket_launch", fontFamily="Material Symbols Outlined")
-    roller_shades_outlined = IconData(name="roller_shades", fontFamily="Material Symbols Outlined")
-    roller_shades_closed_outlined = IconData(name="roller_shades_closed", fontFamily="Material Symbols Outlined")
-    roller_skating_outlined = IconData(name="roller_skating", fontFamily="Material Symbols Outlined")
-    roofing_outlined = IconData(name="roofing", fontFamily="Material Symbols Outlined")
-    room_outlined = IconData(name="room", fontFamily="Material Symbols Outlined")
-    room_preferences_outlined = IconData(name="room_preferences", fontFamily="Material Symbols Outlined")
-    room_service_outlined = IconData(name="room_service", fontFamily="Material Symbols Outlined")
-    rotate_90_degrees_ccw_outlined = IconData(name="rotate_90_degrees_ccw", fontFamily="Material Symbols Outlined")
-    rotate_90_degrees_cw_outlined = IconData(name="rotate_90_degrees_cw", fontFamily="Material Symbols Outlined")
-    rotate_auto_outlined = IconData(name="rotate_auto", fontFamily="Material Symbols Outlined")
-    rotate_left_outlined = IconData(name="rotate_left", fontFamily="Material Symbols Outlined")
-    rotate_right_outlined = IconData(name="rotate_right", fontFamily="Material Symbols Outlined")
-    roundabout_left_outlined = IconData(name="roundabout_left", fontFamily="Material Symbols Outlined")
-    roundabout_right_outlined = IconData(name="roundabout_right", fontFamily="Material Symbols Outlined")
-    rounded_corner_outlined = IconData(name="rounded_corner", fontFamily="Material Symbols Outlined")
-    route_outlined = IconData(name="route", fontFamily="Material Symbols Outlined")
-    router_outlined = IconData(name="router", fontFamily="Material Symbols Outlined")
-    router_off_outlined = IconData(name="router_off", fontFamily="Material Symbols Outlined")
-    routine_outlined = IconData(name="routine", fontFamily="Material Symbols Outlined")
-    rowing_outlined = IconData(name="rowing", fontFamily="Material Symbols Outlined")
-    rss_feed_outlined = IconData(name="rss_feed", fontFamily="Material Symbols Outlined")
-    rsvp_outlined = IconData(name="rsvp", fontFamily="Material Symbols Outlined")
-    rtt_outlined = IconData(name="rtt", fontFamily="Material Symbols Outlined")
-    rubric_outlined = IconData(name="rubric", fontFamily="Material Symbols Outlined")
-    rule_outlined = IconData(name="rule", fontFamily="Material Symbols Outlined")
-    rule_folder_outlined = IconData(name="rule_folder", fontFamily="Material Symbols Outlined")
-    rule_settings_outlined = IconData(name="rule_settings", fontFamily="Material Symbols Outlined")
-    run_circle_outlined = IconData(name="run_circle", fontFamily="Material Symbols Outlined")
-    running_with_errors_outlined = IconData(name="running_with_errors", fontFamily="Material Symbols Outlined")
-    rv_hookup_outlined = IconData(name="rv_hookup", fontFamily="Material Symbols Outlined")
-    safety_check_outlined = IconData(name="safety_check", fontFamily="Material Symbols Outlined")
-    safety_check_off_outlined = IconData(name="safety_check_off", fontFamily="Material Symbols Outlined")
-    safety_divider_outlined = IconData(name="safety_divider", fontFamily="Material Symbols Outlined")
-    sailing_outlined = IconData(name="sailing", fontFamily="Material Symbols Outlined")
-    salinity_outlined = IconData(name="salinity", fontFamily="Material Symbols Outlined")
-    sanitizer_outlined = IconData(name="sanitizer", fontFamily="Material Symbols Outlined")
-    satellite_outlined = IconData(name="satellite", fontFamily="Material Symbols Outlined")
-    satellite_alt_outlined = IconData(name="satellite_alt", fontFamily="Material Symbols Outlined")
-    sauna_outlined = IconData(name="sauna", fontFamily="Material Symbols Outlined")
-    save_outlined = IconData(name="save", fontFamily="Material Symbols Outlined")
-    save_alt_outlined = IconData(name="save_alt", fontFamily="Material Symbols Outlined")
-    save_as_outlined = IconData(name="save_as", fontFamily="Material Symbols Outlined")
-    save_clock_outlined = IconData(name="save_clock", fontFamily="Material Symbols Outlined")
-    saved_search_outlined = IconData(name="saved_search", fontFamily="Material Symbols Outlined")
-    savings_outlined = IconData(name="savings", fontFamily="Material Symbols Outlined")
-    scale_outlined = IconData(name="scale", fontFamily="Material Symbols Outlined")
-    scan_outlined = IconData(name="scan", fontFamily="Material Symbols Outlined")
-    scan_delete_outlined = IconData(name="scan_delete", fontFamily="Material Symbols Outlined")
-    scanner_outlined = IconData(name="scanner", fontFamily="Material Symbols Outlined")
-    scatter_plot_outlined = IconData(name="scatter_plot", fontFamily="Material Symbols Outlined")
-    scene_outlined = IconData(name="scene", fontFamily="Material Symbols Outlined")
-    schedule_outlined = IconData(name="schedule", fontFamily="Material Symbols Outlined")
-    schedule_send_outlined = IconData(name="schedule_send", fontFamily="Material Symbols Outlined")
-    schema_outlined = IconData(name="schema", fontFamily="Material Symbols Outlined")
-    school_outlined = IconData(name="school", fontFamily="Material Symbols Outlined")
-    science_outlined = IconData(name="science", fontFamily="Material Symbols Outlined")
-    science_off_outlined = IconData(name="science_off", fontFamily="Material Symbols Outlined")
-    scooter_outlined = IconData(name="scooter", fontFamily="Material Symbols Outlined")
-    score_outlined = IconData(name="score", fontFamily="Material Symbols Outlined")
-    scoreboard_outlined = IconData(name="scoreboard", fontFamily="Material Symbols Outlined")
-    screen_lock_landscape_outlined = IconData(name="screen_lock_landscape", fontFamily="Material Symbols Outlined")
-    screen_lock_portrait_outlined = IconData(name="screen_lock_portrait", fontFamily="Material Symbols Outlined")
-    screen_lock_rotation_outlined = IconData(name="screen_lock_rotation", fontFamily="Material Symbols Outlined")
-    screen_record_outlined = IconData(name="screen_record", fontFamily="Material Symbols Outlined")
-    screen_rotation_outlined = IconData(name="screen_rotation", fontFamily="Material Symbols Outlined")
-    screen_rotation_alt_outlined = IconData(name="screen_rotation_alt", fontFamily="Material Symbols Outlined")
-    screen_rotation_up_outlined = IconData(name="screen_rotation_up", fontFamily="Material Symbols Outlined")
-    screen_search_desktop_outlined = IconData(name="screen_search_desktop", fontFamily="Material Symbols Outlined")
-    screen_share_outlined = IconData(name="screen_share", fontFamily="Material Symbols Outlined")
-    screenshot_outlined = IconData(name="screenshot", fontFamily="Material Symbols Outlined")
-    screenshot_frame_outlined = IconData(name="screenshot_frame", fontFamily="Material Symbols Outlined")
-    screenshot_frame_2_outlined = IconData(name="screenshot_frame_2", fontFamily="Material Symbols Outlined")
-    screenshot_keyboard_outlined = IconData(name="screenshot_keyboard", fontFamily="Material Symbols Outlined")
-    screenshot_monitor_outlined = IconData(name="screenshot_monitor", fontFamily="Material Symbols Outlined")
-    screenshot_region_outlined = IconData(name="screenshot_region", fontFamily="Material Symbols Outlined")
-    screenshot_tablet_outlined = IconData(name="screenshot_tablet", fontFamily="Material Symbols Outlined")
-    script_outlined = IconData(name="script", fontFamily="Material Symbols Outlined")
-    scrollable_header_outlined = IconData(name="scrollable_header", fontFamily="Material Symbols Outlined")
-    scuba_diving_outlined = IconData(name="scuba_diving", fontFamily="Material Symbols Outlined")
-    sd_outlined = IconData(name="sd", fontFamily="Material Symbols Outlined")
-    sd_card_outlined = IconData(name="sd_card", fontFamily="Material Symbols Outlined")
-    sd_card_alert_outlined = IconData(name="sd_card_alert", fontFamily="Material Symbols Outlined")
-    sd_storage_outlined = IconData(name="sd_storage", fontFamily="Material Symbols Outlined")
-    sdk_outlined = IconData(name="sdk", fontFamily="Material Symbols Outlined")
-    search_outlined = IconData(name="search", fontFamily="Material Symbols Outlined")
-    search_activity_outlined = IconData(name="search_activity", fontFamily="Material Symbols Outlined")
-    search_check_outlined = IconData(name="search_check", fontFamily="Material Symbols Outlined")
-    search_check_2_outlined = IconData(name="search_check_2", fontFamily="Material Symbols Outlined")
-    search_hands_free_outlined = IconData(name="search_hands_free", fontFamily="Material Symbols Outlined")
-    search_insights_outlined = IconData(name="search_insights", fontFamily="Material Symbols Outlined")
-    search_off_outlined = IconData(name="search_off", fontFamily="Material Symbols Outlined")
-    seat_cool_left_outlined = IconData(name="seat_cool_left", fontFamily="Material Symbols Outlined")
-    seat_cool_right_outlined = IconData(name="seat_cool_right", fontFamily="Material Symbols Outlined")
-    seat_heat_left_outlined = IconData(name="seat_heat_left", fontFamily="Material Symbols Outlined")
-    seat_heat_right_outlined = IconData(name="seat_heat_right", fontFamily="Material Symbols Outlined")
-    seat_vent_left_outlined = IconData(name="seat_vent_left", fontFamily="Material Symbols Outlined")
-    seat_vent_right_outlined = IconData(name="seat_vent_right", fontFamily="Material Symbols Outlined")
-    security_outlined = IconData(name="security", fontFamily="Material Symbols Outlined")
-    security_key_outlined = IconData(name="security_key", fontFamily="Material Symbols Outlined")
-    security_update_outlined = IconData(name="security_update", fontFamily="Material Symbols Outlined")
-    security_update_good_outlined = IconData(name="security_update_good", fontFamily="Material Symbols Outlined")
-    security_update_warning_outlined = IconData(name="security_update_warning", fontFamily="Material Symbols Outlined")
-    segment_outlined = IconData(name="segment", fontFamily="Material Symbols Outlined")
-    select_outlined = IconData(name="select", fontFamily="Material Symbols Outlined")
-    select_all_outlined = IconData(name="select_all", fontFamily="Material Symbols Outlined")
-    select_check_box_outlined = IconData(name="select_check_box", fontFamily="Material Symbols Outlined")
-    select_to_speak_outlined = IconData(name="select_to_speak", fontFamily="Material Symbols Outlined")
-    select_window_outlined = IconData(name="select_window", fontFamily="Material Symbols Outlined")
-    select_window_2_outlined = IconData(name="select_window_2", fontFamily="Material Symbols Outlined")
-    select_window_off_outlined = IconData(name="select_window_off", fontFamily="Material Symbols Outlined")
-    self_care_outlined = IconData(name="self_care", fontFamily="Material Symbols Outlined")
-    self_improvement_outlined = IconData(name="self_improvement", fontFamily="Material Symbols Outlined")
-    sell_outlined = IconData(name="sell", fontFamily="Material Symbols Outlined")
-    send_outlined = IconData(name="send", fontFamily="Material Symbols Outlined")
-    send_and_archive_outlined = IconData(name="send_and_archive", fontFamily="Material Symbols Outlined")
-    send_money_outlined = IconData(name="send_money", fontFamily="Material Symbols Outlined")
-    send_time_extension_outlined = IconData(name="send_time_extension", fontFamily="Material Symbols Outlined")
-    send_to_mobile_outlined = IconData(name="send_to_mobile", fontFamily="Material Symbols Outlined")
-    sensor_door_outlined = IconData(name="sensor_door", fontFamily="Material Symbols Outlined")
-    sensor_occupied_outlined = IconData(name="sensor_occupied", fontFamily="Material Symbols Outlined")
-    sensor_window_outlined = IconData(name="sensor_window", fontFamily="Material Symbols Outlined")
-    sensors_outlined = IconData(name="sensors", fontFamily="Material Symbols Outlined")
-    sensors_krx_outlined = IconData(name="sensors_krx", fontFamily="Material Symbols Outlined")
-    sensors_krx_off_outlined = IconData(name="sensors_krx_off", fontFamily="Material Symbols Outlined")
-    sensors_off_outlined = IconData(name="sensors_off", fontFamily="Material Symbols Outlined")
-    sentiment_calm_outlined = IconData(name="sentiment_calm", fontFamily="Material Symbols Outlined")
-    sentiment_content_outlined = IconData(name="sentiment_content", fontFamily="Material Symbols Outlined")
-    sentiment_dissatisfied_outlined = IconData(name="sentiment_dissatisfied", fontFamily="Material Symbols Outlined")
-    sentiment_excited_outlined = IconData(name="sentiment_excited", fontFamily="Material Symbols Outlined")
-    sentiment_extremely_dissatisfied_outlined = IconData(name="sentiment_extremely_dissatisfied", fontFamily="Material Symbols Outlined")
-    sentiment_frustrated_outlined = IconData(name="sentiment_frustrated", fontFamily="Material Symbols Outlined")
-    sentiment_neutral_outlined = IconData(name="sentiment_neutral", fontFamily="Material Symbols Outlined")
-    sentiment_sad_outlined = IconData(name="sentiment_sad", fontFamily="Material Symbols Outlined")
-    sentiment_satisfied_outlined = IconData(name="sentiment_satisfied", fontFamily="Material Symbols Outlined")
-    sentiment_satisfied_alt_outlined = IconData(name="sentiment_satisfied_alt", fontFamily="Material Symbols Outlined")
-    sentiment_stressed_outlined = IconData(name="sentiment_stressed", fontFamily="Material Symbols Outlined")
-    sentiment_very_dissatisfied_outlined = IconData(name="sentiment_very_dissatisfied", fontFamily="Material Symbols Outlined")
-    sentiment_very_satisfied_outlined = IconData(name="sentiment_very_satisfied", fontFamily="Material Symbols Outlined")
-    sentiment_worried_outlined = IconData(name="sentiment_worried", fontFamily="Material Symbols Outlined")
-    serif_outlined = IconData(name="serif", fontFamily="Material Symbols Outlined")
-    server_person_outlined = IconData(name="server_person", fontFamily="Material Symbols Outlined")
-    service_toolbox_outlined = IconData(name="service_toolbox", fontFamily="Material Symbols Outlined")
-    set_meal_outlined = IconData(name="set_meal", fontFamily="Material Symbols Outlined")
-    settings_outlined = IconData(name="settings", fontFamily="Material Symbols Outlined")
-    settings_accessibility_outlined = IconData(name="settings_accessibility", fontFamily="Material Symbols Outlined")
-    settings_account_box_outlined = IconData(name="settings_account_box", fontFamily="Material Symbols Outlined")
-    settings_alert_outlined = IconData(name="settings_alert", fontFamily="Material Symbols Outlined")
-    settings_applications_outlined = IconData(name="settings_applications", fontFamily="Material Symbols Outlined")
-    settings_b_roll_outlined = IconData(name="settings_b_roll", fontFamily="Material Symbols Outlined")
-    settings_backup_restore_outlined = IconData(name="settings_backup_restore", fontFamily="Material Symbols Outlined")
-    settings_bluetooth_outlined = IconData(name="settings_bluetooth", fontFamily="Material Symbols Outlined")
-    settings_brightness_outlined = IconData(name="settings_brightness", fontFamily="Material Symbols Outlined")
-    settings_cell_outlined = IconData(name="settings_cell", fontFamily="Material Symbols Outlined")
-    settings_cinematic_blur_outlined = IconData(name="settings_cinematic_blur", fontFamily="Material Symbols Outlined")
-    settings_ethernet_outlined = IconData(name="settings_ethernet", fontFamily="Material Symbols Outlined")
-    settings_heart_outlined = IconData(name="settings_heart", fontFamily="Material Symbols Outlined")
-    settings_input_antenna_outlined = IconData(name="settings_input_antenna", fontFamily="Material Symbols Outlined")
-    settings_input_component_outlined = IconData(name="settings_input_component", fontFamily="Material Symbols Outlined")
-    settings_input_composite_outlined = IconData(name="settings_input_composite", fontFamily="Material Symbols Outlined")
-    settings_input_hdmi_outlined = IconData(name="settings_input_hdmi", fontFamily="Material Symbols Outlined")
-    settings_input_svideo_outlined = IconData(name="settings_input_svideo", fontFamily="Material Symbols Outlined")
-    settings_motion_mode_outlined = IconData(name="settings_motion_mode", fontFamily="Material Symbols Outlined")
-    settings_night_sight_outlined = IconData(name="settings_night_sight", fontFamily="Material Symbols Outlined")
-    settings_overscan_outlined = IconData(name="settings_overscan", fontFamily="Material Symbols Outlined")
-    settings_panorama_outlined = IconData(name="settings_panorama", fontFamily="Material Symbols Outlined")
-    settings_phone_outlined = IconData(name="settings_phone", fontFamily="Material Symbols Outlined")
-    settings_photo_camera_outlined = IconData(name="settings_photo_camera", fontFamily="Material Symbols Outlined")
-    settings_power_outlined = IconData(name="settings_power", fontFamily="Material Symbols Outlined")
-    settings_remote_outlined = IconData(name="settings_remote", fontFamily="Material Symbols Outlined")
-    settings_slow_motion_outlined = IconData(name="settings_slow_motion", fontFamily="Material Symbols Outlined")
-    settings_suggest_outlined = IconData(name="settings_suggest", fontFamily="Material Symbols Outlined")
-    settings_system_daydream_outlined = IconData(name="settings_system_daydream", fontFamily="Material Symbols Outlined")
-    settings_timelapse_outlined = IconData(name="settings_timelapse", fontFamily="Material Symbols Outlined")
-    settings_video_camera_outlined = IconData(name="settings_video_camera", fontFamily="Material Symbols Outlined")
-    settings_voice_outlined = IconData(name="settings_voice", fontFamily="Material Symbols Outlined")
-    settop_component_outlined = IconData(name="settop_component", fontFamily="Material Symbols Outlined")
-    severe_cold_outlined = IconData(name="severe_cold", fontFamily="Material Symbols Outlined")
-    shadow_outlined = IconData(name="shadow", fontFamily="Material Symbols Outlined")
-    shadow_add_outlined = IconData(name="shadow_add", fontFamily="Material Symbols Outlined")
-    shadow_minus_outlined = IconData(name="shadow_minus", fontFamily="Material Symbols Outlined")
-    shape_line_outlined = IconData(name="shape_line", fontFamily="Material Symbols Outlined")
-    shape_recognition_outlined = IconData(name="shape_recognition", fontFamily="Material Symbols Outlined")
-    shapes_outlined = IconData(name="shapes", fontFamily="Material Symbols Outlined")
-    share_outlined = IconData(name="share", fontFamily="Material Symbols Outlined")
-    share_eta_outlined = IconData(name="share_eta", fontFamily="Material Symbols Outlined")
-    share_location_outlined = IconData(name="share_location", fontFamily="Material Symbols Outlined")
-    share_off_outlined = IconData(name="share_off", fontFamily="Material Symbols Outlined")
-    share_reviews_outlined = IconData(name="share_reviews", fontFamily="Material Symbols Outlined")
-    share_windows_outlined = IconData(name="share_windows", fontFamily="Material Symbols Outlined")
-    sheets_rtl_outlined = IconData(name="sheets_rtl", fontFamily="Material Symbols Outlined")
-    shelf_auto_hide_outlined = IconData(name="shelf_auto_hide", fontFamily="Material Symbols Outlined")
-    shelf_position_outlined = IconData(name="shelf_position", fontFamily="Material Symbols Outlined")
-    shelves_outlined = IconData(name="shelves", fontFamily="Material Symbols Outlined")
-    shield_outlined = IconData(name="shield", fontFamily="Material Symbols Outlined")
-    shield_lock_outlined = IconData(name="shield_lock", fontFamily="Material Symbols Outlined")
-    shield_locked_outlined = IconData(name="shield_locked", fontFamily="Material Symbols Outlined")
-    shield_moon_outlined = IconData(name="shield_moon", fontFamily="Material Symbols Outlined")
-    shield_person_outlined = IconData(name="shield_person", fontFamily="Material Symbols Outlined")
-    shield_question_outlined = IconData(name="shield_question", fontFamily="Material Symbols Outlined")
-    shield_watch_outlined = IconData(name="shield_watch", fontFamily="Material Symbols Outlined")
-    shield_with_heart_outlined = IconData(name="shield_with_heart", fontFamily="Material Symbols Outlined")
-    shield_with_house_outlined = IconData(name="shield_with_house", fontFamily="Material Symbols Outlined")
-    shift_outlined = IconData(name="shift", fontFamily="Material Symbols Outlined")
-    shift_lock_outlined = IconData(name="shift_lock", fontFamily="Material Symbols Outlined")
-    shift_lock_off_outlined = IconData(name="shift_lock_off", fontFamily="Material Symbols Outlined")
-    shop_outlined = IconData(name="shop", fontFamily="Material Symbols Outlined")
-    shop_2_outlined = IconData(name="shop_2", fontFamily="Material Symbols Outlined")
-    shop_two_outlined = IconData(name="shop_two", fontFamily="Material Symbols Outlined")
-    shopping_bag_outlined = IconData(name="shopping_bag", fontFamily="Material Symbols Outlined")
-    shopping_bag_speed_outlined = IconData(name="shopping_bag_speed", fontFamily="Material Symbols Outlined")
-    shopping_basket_outlined = IconData(name="shopping_basket", fontFamily="Material Symbols Outlined")
-    shopping_cart_outlined = IconData(name="shopping_cart", fontFamily="Material Symbols Outlined")
-    shopping_cart_checkout_outlined = IconData(name="shopping_cart_checkout", fontFamily="Material Symbols Outlined")
-    shopping_cart_off_outlined = IconData(name="shopping_cart_off", fontFamily="Material Symbols Outlined")
-    shoppingmode_outlined = IconData(name="shoppingmode", fontFamily="Material Symbols Outlined")
-    short_stay_outlined = IconData(name="short_stay", fontFamily="Material Symbols Outlined")
-    short_text_outlined = IconData(name="short_text", fontFamily="Material Symbols Outlined")
-    shortcut_outlined = IconData(name="shortcut", fontFamily="Material Symbols Outlined")
-    show_chart_outlined = IconData(name="show_chart", fontFamily="Material Symbols Outlined")
-    shower_outlined = IconData(name="shower", fontFamily="Material Symbols Outlined")
-    shuffle_outlined = IconData(name="shuffle", fontFamily="Material Symbols Outlined")
-    shuffle_on_outlined = IconData(name="shuffle_on", fontFamily="Material Symbols Outlined")
-    shutter_speed_outlined = IconData(name="shutter_speed", fontFamily="Material Symbols Outlined")
-    shutter_speed_add_outlined = IconData(name="shutter_speed_add", fontFamily="Material Symbols Outlined")
-    shutter_speed_minus_outlined = IconData(name="shutter_speed_minus", fontFamily="Material Symbols Outlined")
-    sick_outlined = IconData(name="sick", fontFamily="Material Symbols Outlined")
-    side_navigation_outlined = IconData(name="side_navigation", fontFamily="Material Symbols Outlined")
-    sign_language_outlined = IconData(name="sign_language", fontFamily="Material Symbols Outlined")
-    signal_cellular_0_bar_outlined = IconData(name="signal_cellular_0_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_1_bar_outlined = IconData(name="signal_cellular_1_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_2_bar_outlined = IconData(name="signal_cellular_2_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_3_bar_outlined = IconData(name="signal_cellular_3_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_4_bar_outlined = IconData(name="signal_cellular_4_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_add_outlined = IconData(name="signal_cellular_add", fontFamily="Material Symbols Outlined")
-    signal_cellular_alt_outlined = IconData(name="signal_cellular_alt", fontFamily="Material Symbols Outlined")
-    signal_cellular_alt_1_bar_outlined = IconData(name="signal_cellular_alt_1_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_alt_2_bar_outlined = IconData(name="signal_cellular_alt_2_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_connected_no_internet_0_bar_outlined = IconData(name="signal_cellular_connected_no_internet_0_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_connected_no_internet_4_bar_outlined = IconData(name="signal_cellular_connected_no_internet_4_bar", fontFamily="Material Symbols Outlined")
-    signal_cellular_no_sim_outlined = IconData(name="signal_cellular_no_sim", fontFamily="Material Symbols Outlined")
-    signal_cellular_nodata_outlined = IconData(name="signal_cellular_nodata", fontFamily="Material Symbols Outlined")
-    signal_cellular_null_outlined = IconData(name="signal_cellular_null", fontFamily="Material Symbols Outlined")
-    signal_cellular_off_outlined = IconData(name="signal_cellular_off", fontFamily="Material Symbols Outlined")
-    signal_cellular_pause_outlined = IconData(name="signal_cellular_pause", fontFamily="Material Symbols Outlined")
-    signal_disconnected_outlined = IconData(name="signal_disconnected", fontFamily="Material Symbols Outlined")
-    signal_wifi_0_bar_outlined = IconData(name="signal_wifi_0_bar", fontFamily="Material Symbols Outlined")
-    signal_wifi_4_bar_outlined = IconData(name="signal_wifi_4_bar", fontFamily="Material Symbols Outlined")
-    signal_wifi_4_bar_lock_outlined = IconData(name="signal_wifi_4_bar_lock", fontFamily="Material Symbols Outlined")
-    signal_wifi_bad_outlined = IconData(name="signal_wifi_bad", fontFamily="Material Symbols Outlined")
-    signal_wifi_connected_no_internet_4_outlined = IconData(name="signal_wifi_connected_no_internet_4", fontFamily="Material Symbols Outlined")
-    signal_wifi_off_outlined = IconData(name="signal_wifi_off", fontFamily="Material Symbols Outlined")
-    signal_wifi_statusbar_4_bar_outlined = IconData(name="signal_wifi_statusbar_4_bar", fontFamily="Material Symbols Outlined")
-    signal_wifi_statusbar_not_connected_outlined = IconData(name="signal_wifi_statusbar_not_connected", fontFamily="Material Symbols Outlined")
-    signal_wifi_statusbar_null_outlined = IconData(name="signal_wifi_statusbar_null", fontFamily="Material Symbols Outlined")
-    signature_outlined = IconData(name="signature", fontFamily="Material Symbols Outlined")
-    signpost_outlined = IconData(name="signpost", fontFamily="Material Symbols Outlined")
-    sim_card_outlined = IconData(name="sim_card", fontFamily="Material Symbols Outlined")
-    sim_card_alert_outlined = IconData(name="sim_card_alert", fontFamily="Material Symbols Outlined")
-    sim_card_download_outlined = IconData(name="sim_card_download", fontFamily="Material Symbols Outlined")
-    simulation_outlined = IconData(name="simulation", fontFamily="Material Symbols Outlined")
-    single_bed_outlined = IconData(name="single_bed", fontFamily="Material Symbols Outlined")
-    sip_outlined = IconData(name="sip", fontFamily="Material Symbols Outlined")
-    siren_outlined = IconData(name="siren", fontFamily="Material Symbols Outlined")
-    siren_check_outlined = IconData(name="siren_check", fontFamily="Material Symbols Outlined")
-    siren_open_outlined = IconData(name="siren_open", fontFamily="Material Symbols Outlined")
-    siren_question_outlined = IconData(name="siren_question", fontFamily="Material Symbols Outlined")
-    skateboarding_outlined = IconData(name="skateboarding", fontFamily="Material Symbols Outlined")
-    skeleton_outlined = IconData(name="skeleton", fontFamily="Material Symbols Outlined")
-    skillet_outlined = IconData(name="skillet", fontFamily="Material Symbols Outlined")
-    skillet_cooktop_outlined = IconData(name="skillet_cooktop", fontFamily="Material Symbols Outlined")
-    skip_next_outlined = IconData(name="skip_next", fontFamily="Material Symbols Outlined")
-    skip_previous_outlined = IconData(name="skip_previous", fontFamily="Material Symbols Outlined")
-    skull_outlined = IconData(name="skull", fontFamily="Material Symbols Outlined")
-    skull_list_outlined = IconData(name="skull_list", fontFamily="Material Symbols Outlined")
-    slab_serif_outlined = IconData(name="slab_serif", fontFamily="Material Symbols Outlined")
-    sledding_outlined = IconData(name="sledding", fontFamily="Material Symbols Outlined")
-    sleep_outlined = IconData(name="sleep", fontFamily="Material Symbols Outlined")
-    sleep_score_outlined = IconData(name="sleep_score", fontFamily="Material Symbols Outlined")
-    slide_library_outlined = IconData(name="slide_library", fontFamily="Material Symbols Outlined")
-    sliders_outlined = IconData(name="sliders", fontFamily="Material Symbols Outlined")
-    slideshow_outlined = IconData(name="slideshow", fontFamily="Material Symbols Outlined")
-    slow_motion_video_outlined = IconData(name="slow_motion_video", fontFamily="Material Symbols Outlined")
-    smart_button_outlined = IconData(name="smart_button", fontFamily="Material Symbols Outlined")
-    smart_card_reader_outlined = IconData(name="smart_card_reader", fontFamily="Material Symbols Outlined")
-    smart_card_reader_off_outlined = IconData(name="smart_card_reader_off", fontFamily="Material Symbols Outlined")
-    smart_display_outlined = IconData(name="smart_display", fontFamily="Material Symbols Outlined")
-    smart_outlet_outlined = IconData(name="smart_outlet", fontFamily="Material Symbols Outlined")
-    smart_screen_outlined = IconData(name="smart_screen", fontFamily="Material Symbols Outlined")
-    smart_toy_outlined = IconData(name="smart_toy", fontFamily="Material Symbols Outlined")
-    smartphone_outlined = IconData(name="smartphone", fontFamily="Material Symbols Outlined")
-    smartphone_camera_outlined = IconData(name="smartphone_camera", fontFamily="Material Symbols Outlined")
-    smb_share_outlined = IconData(name="smb_share", fontFamily="Material Symbols Outlined")
-    smoke_free_outlined = IconData(name="smoke_free", fontFamily="Material Symbols Outlined")
-    smoking_rooms_outlined = IconData(name="smoking_rooms", fontFamily="Material Symbols Outlined")
-    sms_outlined = IconData(name="sms", fontFamily="Material Symbols Outlined")
-    sms_failed_outlined = IconData(name="sms_failed", fontFamily="Material Symbols Outlined")
-    snippet_folder_outlined = IconData(name="snippet_folder", fontFamily="Material Symbols Outlined")
-    snooze_outlined = IconData(name="snooze", fontFamily="Material Symbols Outlined")
-    snowboarding_outlined = IconData(name="snowboarding", fontFamily="Material Symbols Outlined")
-    snowing_outlined = IconData(name="snowing", fontFamily="Material Symbols Outlined")
-    snowing_heavy_outlined = IconData(name="snowing_heavy", fontFamily="Material Symbols Outlined")
-    snowmobile_outlined = IconData(name="snowmobile", fontFamily="Material Symbols Outlined")
-    snowshoeing_outlined = IconData(name="snowshoeing", fontFamily="Material Symbols Outlined")
-    soap_outlined = IconData(name="soap", fontFamily="Material Symbols Outlined")
-    social_distance_outlined = IconData(name="social_distance", fontFamily="Material Symbols Outlined")
-    social_leaderboard_outlined = IconData(name="social_leaderboard", fontFamily="Material Symbols Outlined")
-    solar_power_outlined = IconData(name="solar_power", fontFamily="Material Symbols Outlined")
-    sort_outlined = IconData(name="sort", fontFamily="Material Symbols Outlined")
-    sort_by_alpha_outlined = IconData(name="sort_by_alpha", fontFamily="Material Symbols Outlined")
-    sos_outlined = IconData(name="sos", fontFamily="Material Symbols Outlined")
-    sound_detection_dog_barking_outlined = IconData(name="sound_detection_dog_barking", fontFamily="Material Symbols Outlined")
-    sound_detection_glass_break_outlined = IconData(name="sound_detection_glass_break", fontFamily="Material Symbols Outlined")
-    sound_detection_loud_sound_outlined = IconData(name="sound_detection_loud_sound", fontFamily="Material Symbols Outlined")
-    sound_sampler_outlined = IconData(name="sound_sampler", fontFamily="Material Symbols Outlined")
-    soup_kitchen_outlined = IconData(name="soup_kitchen", fontFamily="Material Symbols Outlined")
-    source_outlined = IconData(name="source", fontFamily="Material Symbols Outlined")
-    source_environment_outlined = IconData(name="source_environment", fontFamily="Material Symbols Outlined")
-    source_notes_outlined = IconData(name="source_notes", fontFamily="Material Symbols Outlined")
-    south_outlined = IconData(name="south", fontFamily="Material Symbols Outlined")
-    south_america_outlined = IconData(name="south_america", fontFamily="Material Symbols Outlined")
-    south_east_outlined = IconData(name="south_east", fontFamily="Material Symbols Outlined")
-    south_west_outlined = IconData(name="south_west", fontFamily="Material Symbols Outlined")
-    spa_outlined = IconData(name="spa", fontFamily="Material Symbols Outlined")
-    space_bar_outlined = IconData(name="space_bar", fontFamily="Material Symbols Outlined")
-    space_dashboard_outlined = IconData(name="space_dashboard", fontFamily="Material Symbols Outlined")
-    spatial_audio_outlined = IconData(name="spatial_audio", fontFamily="Material Symbols Outlined")
-    spatial_audio_off_outlined = IconData(name="spatial_audio_off", fontFamily="Material Symbols Outlined")
-    spatial_speaker_outlined = IconData(name="spatial_speaker", fontFamily="Material Symbols Outlined")
-    spatial_tracking_outlined = IconData(name="spatial_tracking", fontFamily="Material Symbols Outlined")
-    speaker_outlined = IconData(name="speaker", fontFamily="Material Symbols Outlined")
-    speaker_group_outlined = IconData(name="speaker_group", fontFamily="Material Symbols Outlined")
-    speaker_notes_outlined = IconData(name="speaker_notes", fontFamily="Material Symbols Outlined")
-    speaker_notes_off_outlined = IconData(name="speaker_notes_off", fontFamily="Material Symbols Outlined")
-    speaker_phone_outlined = IconData(name="speaker_phone", fontFamily="Material Symbols Outlined")
-    special_character_outlined = IconData(name="special_character", fontFamily="Material Symbols Outlined")
-    specific_gravity_outlined = IconData(name="specific_gravity", fontFamily="Material Symbols Outlined")
-    speech_to_text_outlined = IconData(name="speech_to_text", fontFamily="Material Symbols Outlined")
-    speed_outlined = IconData(name="speed", fontFamily="Material Symbols Outlined")
-    speed_0_25_outlined = IconData(name="speed_0_25", fontFamily="Material Symbols Outlined")
-    speed_0_2x_outlined = IconData(name="speed_0_2x", fontFamily="Material Symbols Outlined")
-    speed_0_5_outlined = IconData(name="speed_0_5", fontFamily="Material Symbols Outlined")
-    speed_0_5x_outlined = IconData(name="speed_0_5x", fontFamily="Material Symbols Outlined")
-    speed_0_75_outlined = IconData(name="speed_0_75", fontFamily="Material Symbols Outlined")
-    speed_0_7x_outlined = IconData(name="speed_0_7x", fontFamily="Material Symbols Outlined")
-    speed_1_2_outlined = IconData(name="speed_1_2", fontFamily="Material Symbols Outlined")
-    speed_1_25_outlined = IconData(name="speed_1_25", fontFamily="Material Symbols Outlined")
-    speed_1_2x_outlined = IconData(name="speed_1_2x", fontFamily="Material Symbols Outlined")
-    speed_1_5_outlined = IconData(name="speed_1_5", fontFamily="Material Symbols Outlined")
-    speed_1_5x_outlined = IconData(name="speed_1_5x", fontFamily="Material Symbols Outlined")
-    speed_1_75_outlined = IconData(name="speed_1_75", fontFamily="Material Symbols Outlined")
-    speed_1_7x_outlined = IconData(name="speed_1_7x", fontFamily="Material Symbols Outlined")
-    speed_2x_outlined = IconData(name="speed_2x", fontFamily="Material Symbols Outlined")
-    speed_camera_outlined = IconData(name="speed_camera", fontFamily="Material Symbols Outlined")
-    spellcheck_outlined = IconData(name="spellcheck", fontFamily="Material Symbols Outlined")
-    split_scene_outlined = IconData(name="split_scene", fontFamily="Material Symbols Outlined")
-    split_scene_down_outlined = IconData(name="split_scene_down", fontFamily="Material Symbols Outlined")
-    split_scene_left_outlined = IconData(name="split_scene_left", fontFamily="Material Symbols Outlined")
-    split_scene_right_outlined = IconData(name="split_scene_right", fontFamily="Material Symbols Outlined")
-    split_scene_up_outlined = IconData(name="split_scene_up", fontFamily="Material Symbols Outlined")
-    splitscreen_outlined = IconData(name="splitscreen", fontFamily="Material Symbols Outlined")
-    splitscreen_add_outlined = IconData(name="splitscreen_add", fontFamily="Material Symbols Outlined")
-    splitscreen_bottom_outlined = IconData(name="splitscreen_bottom", fontFamily="Material Symbols Outlined")
-    splitscreen_landscape_outlined = IconData(name="splitscreen_landscape", fontFamily="Material Symbols Outlined")
-    splitscreen_left_outlined = IconData(name="splitscreen_left", fontFamily="Material Symbols Outlined")
-    splitscreen_portrait_outlined = IconData(name="splitscreen_portrait", fontFamily="Material Symbols Outlined")
-    splitscreen_right_outlined = IconData(name="splitscreen_right", fontFamily="Material Symbols Outlined")
-    splitscreen_top_outlined = IconData(name="splitscreen_top", fontFamily="Material Symbols Outlined")
-    splitscreen_vertical_add_outlined = IconData(name="splitscreen_vertical_add", fontFamily="Material Symbols Outlined")
-    spo2_outlined = IconData(name="spo2", fontFamily="Material Symbols Outlined")
-    spoke_outlined = IconData(name="spoke", fontFamily="Material Symbols Outlined")
-    sports_outlined = IconData(name="sports", fontFamily="Material Symbols Outlined")
-    sports_and_outdoors_outlined = IconData(name="sports_and_outdoors", fontFamily="Material Symbols Outlined")
-    sports_bar_outlined = IconData(name="sports_bar", fontFamily="Material Symbols Outlined")
-    sports_baseball_outlined = IconData(name="sports_baseball", fontFamily="Material Symbols Outlined")
-    sports_basketball_outlined = IconData(name="sports_basketball", fontFamily="Material Symbols Outlined")
-    sports_cricket_outlined = IconData(name="sports_cricket", fontFamily="Material Symbols Outlined")
-    sports_esports_outlined = IconData(name="sports_esports", fontFamily="Material Symbols Outlined")
-    sports_football_outlined = IconData(name="sports_football", fontFamily="Material Symbols Outlined")
-    sports_golf_outlined = IconData(name="sports_golf", fontFamily="Material Symbols Outlined")
-    sports_gymnastics_outlined = IconData(name="sports_gymnastics", fontFamily="Material Symbols Outlined")
-    sports_handball_outlined = IconData(name="sports_handball", fontFamily="Material Symbols Outlined")
-    sports_hockey_outlined = IconData(name="sports_hockey", fontFamily="Material Symbols Outlined")
-    sports_kabaddi_outlined = IconData(name="sports_kabaddi", fontFamily="Material Symbols Outlined")
-    sports_martial_arts_outlined = IconData(name="sports_martial_arts", fontFamily="Material Symbols Outlined")
-    sports_mma_outlined = IconData(name="sports_mma", fontFamily="Material Symbols Outlined")
-    sports_motorsports_outlined = IconData(name="sports_motorsports", fontFamily="Material Symbols Outlined")
-    sports_rugby_outlined = IconData(name="sports_rugby", fontFamily="Material Symbols Outlined")
-    sports_score_outlined = IconData(name="sports_score", fontFamily="Material Symbols Outlined")
-    sports_soccer_outlined = IconData(name="sports_soccer", fontFamily="Material Symbols Outlined")
-    sports_tennis_outlined = IconData(name="sports_tennis", fontFamily="Material Symbols Outlined")
-    sports_volleyball_outlined = IconData(name="sports_volleyball", fontFamily="Material Symbols Outlined")
-    sprinkler_outlined = IconData(name="sprinkler", fontFamily="Material Symbols Outlined")
-    sprint_outlined = IconData(name="sprint", fontFamily="Material Symbols Outlined")
-    square_outlined = IconData(name="square", fontFamily="Material Symbols Outlined")
-    square_dot_outlined = IconData(name="square_dot", fontFamily="Material Symbols Outlined")
-    square_foot_outlined = IconData(name="square_foot", fontFamily="Material Symbols Outlined")
-    ssid_chart_outlined = IconData(name="ssid_chart", fontFamily="Material Symbols Outlined")
-    stack_outlined = IconData(name="stack", fontFamily="Material Symbols Outlined")
-    stack_group_outlined = IconData(name="stack_group", fontFamily="Material Symbols Outlined")
-    stack_hexagon_outlined = IconData(name="stack_hexagon", fontFamily="Material Symbols Outlined")
-    stack_off_outlined = IconData(name="stack_off", fontFamily="Material Symbols Outlined")
-    stack_star_outlined = IconData(name="stack_star", fontFamily="Material Symbols Outlined")
-    stacked_bar_chart_outlined = IconData(name="stacked_bar_chart", fontFamily="Material Symbols Outlined")
-    stacked_email_outlined = IconData(name="stacked_email", fontFamily="Material Symbols Outlined")
-    stacked_inbox_outlined = IconData(name="stacked_inbox", fontFamily="Material Symbols Outlined")
-    stacked_line_chart_outlined = IconData(name="stacked_line_chart", fontFamily="Material Symbols Outlined")
-    stacks_outlined = IconData(name="stacks", fontFamily="Material Symbols Outlined")
-    stadia_controller_outlined = IconData(name="stadia_controller", fontFamily="Material Symbols Outlined")
-    stadium_outlined = IconData(name="stadium", fontFamily="Material Symbols Outlined")
-    stairs_outlined = IconData(name="stairs", fontFamily="Material Symbols Outlined")
-    stairs_2_outlined = IconData(name="stairs_2", fontFamily="Material Symbols Outlined")
-    star_outlined = IconData(name="star", fontFamily="Material Symbols Outlined")
-    star_border_outlined = IconData(name="star_border", fontFamily="Material Symbols Outlined")
-    star_border_purple500_outlined = IconData(name="star_border_purple500", fontFamily="Material Symbols Outlined")
-    star_half_outlined = IconData(name="star_half", fontFamily="Material Symbols Outlined")
-    star_outline_outlined = IconData(name="star_outline", fontFamily="Material Symbols Outlined")
-    star_purple500_outlined = IconData(name="star_purple500", fontFamily="Material Symbols Outlined")
-    star_rate_outlined = IconData(name="star_rate", fontFamily="Material Symbols Outlined")
-    star_rate_half_outlined = IconData(name="star_rate_half", fontFamily="Material Symbols Outlined")
-    star_shine_outlined = IconData(name="star_shine", fontFamily="Material Symbols Outlined")
-    stars_outlined = IconData(name="stars", fontFamily="Material Symbols Outlined")
-    stars_2_outlined = IconData(name="stars_2", fontFamily="Material Symbols Outlined")
-    start_outlined = IconData(name="start", fontFamily="Material Symbols Outlined")
-    stat_0_outlined = IconData(name="stat_0", fontFamily="Material Symbols Outlined")
-    stat_1_outlined = IconData(name="stat_1", fontFamily="Material Symbols Outlined")
-    stat_2_outlined = IconData(name="stat_2", fontFamily="Material Symbols Outlined")
-    stat_3_outlined = IconData(name="stat_3", fontFamily="Material Symbols Outlined")
-    stat_minus_1_outlined = IconData(name="stat_minus_1", fontFamily="Material Symbols Outlined")
-    stat_minus_2_outlined = IconData(name="stat_minus_2", fontFamily="Material Symbols Outlined")
-    stat_minus_3_outlined = IconData(name="stat_minus_3", fontFamily="Material Symbols Outlined")
-    stay_current_landscape_outlined = IconData(name="stay_current_landscape", fontFamily="Material Symbols Outlined")
-    stay_current_portrait_outlined = IconData(name="stay_current_portrait", fontFamily="Material Symbols Outlined")
-    stay_primary_landscape_outlined = IconData(name="stay_primary_landscape", fontFamily="Material Symbols Outlined")
-    stay_primary_portrait_outlined = IconData(name="stay_primary_portrait", fontFamily="Material Symbols Outlined")
-    steering_wheel_heat_outlined = IconData(name="steering_wheel_heat", fontFamily="Material Symbols Outlined")
-    step_outlined = IconData(name="step", fontFamily="Material Symbols Outlined")
-    step_into_outlined = IconData(name="step_into", fontFamily="Material Symbols Outlined")
-    step_out_outlined = IconData(name="step_out", fontFamily="Material Symbols Outlined")
-    step_over_outlined = IconData(name="step_over", fontFamily="Material Symbols Outlined")
-    steppers_outlined = IconData(name="steppers", fontFamily="Material Symbols Outlined")
-    steps_outlined = IconData(name="steps", fontFamily="Material Symbols Outlined")
-    stethoscope_outlined = IconData(name="stethoscope", fontFamily="Material Symbols Outlined")
-    stethoscope_arrow_outlined = IconData(name="stethoscope_arrow", fontFamily="Material Symbols Outlined")
-    stethoscope_check_outlined = IconData(name="stethoscope_check", fontFamily="Material Symbols Outlined")
-    sticky_note_outlined = IconData(name="sticky_note", fontFamily="Material Symbols Outlined")
-    sticky_note_2_outlined = IconData(name="sticky_note_2", fontFamily="Material Symbols Outlined")
-    stock_media_outlined = IconData(name="stock_media", fontFamily="Material Symbols Outlined")
-    stockpot_outlined = IconData(name="stockpot", fontFamily="Material Symbols Outlined")
-    stop_outlined = IconData(name="stop", fontFamily="Material Symbols Outlined")
-    stop_circle_outlined = IconData(name="stop_circle", fontFamily="Material Symbols Outlined")
-    stop_screen_share_outlined = IconData(name="stop_screen_share", fontFamily="Material Symbols Outlined")
-    storage_outlined = IconData(name="storage", fontFamily="Material Symbols Outlined")
-    store_outlined = IconData(name="store", fontFamily="Material Symbols Outlined")
-    store_mall_directory_outlined = IconData(name="store_mall_directory", fontFamily="Material Symbols Outlined")
-    storefront_outlined = IconData(name="storefront", fontFamily="Material Symbols Outlined")
-    storm_outlined = IconData(name="storm", fontFamily="Material Symbols Outlined")
-    straight_outlined = IconData(name="straight", fontFamily="Material Symbols Outlined")
-    straighten_outlined = IconData(name="straighten", fontFamily="Material Symbols Outlined")
-    strategy_outlined = IconData(name="strategy", fontFamily="Material Symbols Outlined")
-    stream_outlined = IconData(name="stream", fontFamily="Material Symbols Outlined")
-    stream_apps_outlined = IconData(name="stream_apps", fontFamily="Material Symbols Outlined")
-    streetview_outlined = IconData(name="streetview", fontFamily="Material Symbols Outlined")
-    stress_management_outlined = IconData(name="stress_management", fontFamily="Material Symbols Outlined")
-    strikethrough_s_outlined = IconData(name="strikethrough_s", fontFamily="Material Symbols Outlined")
-    stroke_full_outlined = IconData(name="stroke_full", fontFamily="Material Symbols Outlined")
-    stroke_partial_outlined = IconData(name="stroke_partial", fontFamily="Material Symbols Outlined")
-    stroller_outlined = IconData(name="stroller", fontFamily="Material Symbols Outlined")
-    style_outlined = IconData(name="style", fontFamily="Material Symbols Outlined")
-    styler_outlined = IconData(name="styler", fontFamily="Material Symbols Outlined")
-    stylus_outlined = IconData(name="stylus", fontFamily="Material Symbols Outlined")
-    stylus_brush_outlined = IconData(name="stylus_brush", fontFamily="Material Symbols Outlined")
-    stylus_fountain_pen_outlined = IconData(name="stylus_fountain_pen", fontFamily="Material Symbols Outlined")
-    stylus_highlighter_outlined = IconData(name="stylus_highlighter", fontFamily="Material Symbols Outlined")
-    stylus_laser_pointer_outlined = IconData(name="stylus_laser_pointer", fontFamily="Material Symbols Outlined")
-    stylus_note_outlined = IconData(name="stylus_note", fontFamily="Material Symbols Outlined")
-    stylus_pen_outlined = IconData(name="stylus_pen", fontFamily="Material Symbols Outlined")
-    stylus_pencil_outlined = IconData(name="stylus_pencil", fontFamily="Material Symbols Outlined")
-    subdirectory_arrow_left_outlined = IconData(name="subdirectory_arrow_left", fontFamily="Material Symbols Outlined")
-    subdirectory_arrow_right_outlined = IconData(name="subdirectory_arrow_right", fontFamily="Material Symbols Outlined")
-    subheader_outlined = IconData(name="subheader", fontFamily="Material Symbols Outlined")
-    subject_outlined = IconData(name="subject", fontFamily="Material Symbols Outlined")
-    subscript_outlined = IconData(name="subscript", fontFamily="Material Symbols Outlined")
-    subscriptions_outlined = IconData(name="subscriptions", fontFamily="Material Symbols Outlined")
-    subtitles_outlined = IconData(name="subtitles", fontFamily="Material Symbols Outlined")
-    subtitles_gear_outlined = IconData(name="subtitles_gear", fontFamily="Material Symbols Outlined")
-    subtitles_off_outlined = IconData(name="subtitles_off", fontFamily="Material Symbols Outlined")
-    subway_outlined = IconData(name="subway", fontFamily="Material Symbols Outlined")
-    summarize_outlined = IconData(name="summarize", fontFamily="Material Symbols Outlined")
-    sunny_outlined = IconData(name="sunny", fontFamily="Material Symbols Outlined")
-    sunny_snowing_outlined = IconData(name="sunny_snowing", fontFamily="Material Symbols Outlined")
-    superscript_outlined = IconData(name="superscript", fontFamily="Material Symbols Outlined")
-    supervised_user_circle_outlined = IconData(name="supervised_user_circle", fontFamily="Material Symbols Outlined")
-    supervised_user_circle_off_outlined = IconData(name="supervised_user_circle_off", fontFamily="Material Symbols Outlined")
-    supervisor_account_outlined = IconData(name="supervisor_account", fontFamily="Material Symbols Outlined")
-    support_outlined = IconData(name="support", fontFamily="Material Symbols Outlined")
-    support_agent_outlined = IconData(name="support_agent", fontFamily="Material Symbols Outlined")
-    surfing_outlined = IconData(name="surfing", fontFamily="Material Symbols Outlined")
-    surgical_outlined = IconData(name="surgical", fontFamily="Material Symbols Outlined")
-    surround_sound_outlined = IconData(name="surround_sound", fontFamily="Material Symbols Outlined")
-    swap_calls_outlined = IconData(name="swap_calls", fontFamily="Material Symbols Outlined")
-    swap_driving_apps_outlined = IconData(name="swap_driving_apps", fontFamily="Material Symbols Outlined")
-    swap_driving_apps_wheel_outlined = IconData(name="swap_driving_apps_wheel", fontFamily="Material Symbols Outlined")
-    swap_horiz_outlined = IconData(name="swap_horiz", fontFamily="Material Symbols Outlined")
-    swap_horizontal_circle_outlined = IconData(name="swap_horizontal_circle", fontFamily="Material Symbols Outlined")
-    swap_vert_outlined = IconData(name="swap_vert", fontFamily="Material Symbols Outlined")
-    swap_vertical_circle_outlined = IconData(name="swap_vertical_circle", fontFamily="Material Symbols Outlined")
-    sweep_outlined = IconData(name="sweep", fontFamily="Material Symbols Outlined")
-    swipe_outlined = IconData(name="swipe", fontFamily="Material Symbols Outlined")
-    swipe_down_outlined = IconData(name="swipe_down", fontFamily="Material Symbols Outlined")
-    swipe_down_alt_outlined = IconData(name="swipe_down_alt", fontFamily="Material Symbols Outlined")
-    swipe_left_outlined = IconData(name="swipe_left", fontFamily="Material Symbols Outlined")
-    swipe_left_alt_outlined = IconData(name="swipe_left_alt", fontFamily="Material Symbols Outlined")
-    swipe_right_outlined = IconData(name="swipe_right", fontFamily="Material Symbols Outlined")
-    swipe_right_alt_outlined = IconData(name="swipe_right_alt", fontFamily="Material Symbols Outlined")
-    swipe_up_outlined = IconData(name="swipe_up", fontFamily="Material Symbols Outlined")
-    swipe_up_alt_outlined = IconData(name="swipe_up_alt", fontFamily="Material Symbols Outlined")
-    swipe_vertical_outlined = IconData(name="swipe_vertical", fontFamily="Material Symbols Outlined")
-    switch_outlined = IconData(name="switch", fontFamily="Material Symbols Outlined")
-    switch_access_outlined = IconData(name="switch_access", fontFamily="Material Symbols Outlined")
-    switch_access_2_outlined = IconData(name="switch_access_2", fontFamily="Material Symbols Outlined")
-    switch_access_3_outlined = IconData(name="switch_access_3", fontFamily="Material Symbols Outlined")
-    switch_access_shortcut_outlined = IconData(name="switch_access_shortcut", fontFamily="Material Symbols Outlined")
-    switch_access_shortcut_add_outlined = IconData(name="switch_access_shortcut_add", fontFamily="Material Symbols Outlined")
-    switch_account_outlined = IconData(name="switch_account", fontFamily="Material Symbols Outlined")
-    switch_camera_outlined = IconData(name="switch_camera", fontFamily="Material Symbols Outlined")
-    switch_left_outlined = IconData(name="switch_left", fontFamily="Material Symbols Outlined")
-    switch_right_outlined = IconData(name="switch_right", fontFamily="Material Symbols Outlined")
-    switch_video_outlined = IconData(name="switch_video", fontFamily="Material Symbols Outlined")
-    switches_outlined = IconData(name="switches", fontFamily="Material Symbols Outlined")
-    sword_rose_outlined = IconData(name="sword_rose", fontFamily="Material Symbols Outlined")
-    swords_outlined = IconData(name="swords", fontFamily="Material Symbols Outlined")
-    symptoms_outlined = IconData(name="symptoms", fontFamily="Material Symbols Outlined")
-    synagogue_outlined = IconData(name="synagogue", fontFamily="Material Symbols Outlined")
-    sync_outlined = IconData(name="sync", fontFamily="Material Symbols Outlined")
-    sync_alt_outlined = IconData(name="sync_alt", fontFamily="Material Symbols Outlined")
-    sync_arrow_down_outlined = IconData(name="sync_arrow_down", fontFamily="Material Symbols Outlined")
-    sync_arrow_up_outlined = IconData(name="sync_arrow_up", fontFamily="Material Symbols Outlined")
-    sync_desktop_outlined = IconData(name="sync_desktop", fontFamily="Material Symbols Outlined")
-    sync_disabled_outlined = IconData(name="sync_disabled", fontFamily="Material Symbols Outlined")
-    sync_lock_outlined = IconData(name="sync_lock", fontFamily="Material Symbols Outlined")
-    sync_problem_outlined = IconData(name="sync_problem", fontFamily="Material Symbols Outlined")
-    sync_saved_locally_outlined = IconData(name="sync_saved_locally", fontFamily="Material Symbols Outlined")
-    syringe_outlined = IconData(name="syringe", fontFamily="Material Symbols Outlined")
-    system_security_update_outlined = IconData(name="system_security_update", fontFamily="Material Symbols Outlined")
-    system_security_update_good_outlined = IconData(name="system_security_update_good", fontFamily="Material Symbols Outlined")
-    system_security_update_warning_outlined = IconData(name="system_security_update_warning", fontFamily="Material Symbols Outlined")
-    system_update_outlined = IconData(name="system_update", fontFamily="Material Symbols Outlined")
-    system_update_alt_outlined = IconData(name="system_update_alt", fontFamily="Material Symbols Outlined")
-    tab_outlined = IconData(name="tab", fontFamily="Material Symbols Outlined")
-    tab_close_outlined = IconData(name="tab_close", fontFamily="Material Symbols Outlined")
-    tab_close_inactive_outlined = IconData(name="tab_close_inactive", fontFamily="Material Symbols Outlined")
-    tab_close_right_outlined = IconData(name="tab_close_right", fontFamily="Material Symbols Outlined")
-    tab_duplicate_outlined = IconData(name="tab_duplicate", fontFamily="Material Symbols Outlined")
-    tab_group_outlined = IconData(name="tab_group", fontFamily="Material Symbols Outlined")
-    tab_inactive_outlined = IconData(name="tab_inactive", fontFamily="Material Symbols Outlined")
-    tab_move_outlined = IconData(name="tab_move", fontFamily="Material Symbols Outlined")
-    tab_new_right_outlined = IconData(name="tab_new_right", fontFamily="Material Symbols Outlined")
-    tab_recent_outlined = IconData(name="tab_recent", fontFamily="Material Symbols Outlined")
-    tab_search_outlined = IconData(name="tab_search", fontFamily="Material Symbols Outlined")
-    tab_unselected_outlined = IconData(name="tab_unselected", fontFamily="Material Symbols Outlined")
-    table_outlined = IconData(name="table", fontFamily="Material Symbols Outlined")
-    table_bar_outlined = IconData(name="table_bar", fontFamily="Material Symbols Outlined")
-    table_chart_outlined = IconData(name="table_chart", fontFamily="Material Symbols Outlined")
-    table_chart_view_outlined = IconData(name="table_chart_view", fontFamily="Material Symbols Outlined")
-    table_convert_outlined = IconData(name="table_convert", fontFamily="Material Symbols Outlined")
-    table_edit_outlined = IconData(name="table_edit", fontFamily="Material Symbols Outlined")
-    table_eye_outlined = IconData(name="table_eye", fontFamily="Material Symbols Outlined")
-    table_lamp_outlined = IconData(name="table_lamp", fontFamily="Material Symbols Outlined")
-    table_restaurant_outlined = IconData(name="table_restaurant", fontFamily="Material Symbols Outlined")
-    table_rows_outlined = IconData(name="table_rows", fontFamily="Material Symbols Outlined")
-    table_rows_narrow_outlined = IconData(name="table_rows_narrow", fontFamily="Material Symbols Outlined")
-    table_view_outlined = IconData(name="table_view", fontFamily="Material Symbols Outlined")
-    tablet_outlined = IconData(name="tablet", fontFamily="Material Symbols Outlined")
-    tablet_android_outlined = IconData(name="tablet_android", fontFamily="Material Symbols Outlined")
-    tablet_camera_outlined = IconData(name="tablet_camera", fontFamily="Material Symbols Outlined")
-    tablet_mac_outlined = IconData(name="tablet_mac", fontFamily="Material Symbols Outlined")
-    tabs_outlined = IconData(name="tabs", fontFamily="Material Symbols Outlined")
-    tactic_outlined = IconData(name="tactic", fontFamily="Material Symbols Outlined")
-    tag_outlined = IconData(name="tag", fontFamily="Material Symbols Outlined")
-    tag_faces_outlined = IconData(name="tag_faces", fontFamily="Material Symbols Outlined")
-    takeout_dining_outlined = IconData(name="takeout_dining", fontFamily="Material Symbols Outlined")
-    tamper_detection_off_outlined = IconData(name="tamper_detection_off", fontFamily="Material Symbols Outlined")
-    tamper_detection_on_outlined = IconData(name="tamper_detection_on", fontFamily="Material Symbols Outlined")
-    tap_and_play_outlined = IconData(name="tap_and_play", fontFamily="Material Symbols Outlined")
-    tapas_outlined = IconData(name="tapas", fontFamily="Material Symbols Outlined")
-    target_outlined = IconData(name="target", fontFamily="Material Symbols Outlined")
-    task_outlined = IconData(name="task", fontFamily="Material Symbols Outlined")
-    task_alt_outlined = IconData(name="task_alt", fontFamily="Material Symbols Outlined")
-    taunt_outlined = IconData(name="taunt", fontFamily="Material Symbols Outlined")
-    taxi_alert_outlined = IconData(name="taxi_alert", fontFamily="Material Symbols Outlined")
-    team_dashboard_outlined = IconData(name="team_dashboard", fontFamily="Material Symbols Outlined")
-    temp_preferences_custom_outlined = IconData(name="temp_preferences_custom", fontFamily="Material Symbols Outlined")
-    temp_preferences_eco_outlined = IconData(name="temp_preferences_eco", fontFamily="Material Symbols Outlined")
-    temple_buddhist_outlined = IconData(name="temple_buddhist", fontFamily="Material Symbols Outlined")
-    temple_hindu_outlined = IconData(name="temple_hindu", fontFamily="Material Symbols Outlined")
-    tenancy_outlined = IconData(name="tenancy", fontFamily="Material Symbols Outlined")
-    terminal_outlined = IconData(name="terminal", fontFamily="Material Symbols Outlined")
-    terrain_outlined = IconData(name="terrain", fontFamily="Material Symbols Outlined")
-    text_ad_outlined = IconData(name="text_ad", fontFamily="Material Symbols Outlined")
-    text_compare_outlined = IconData(name="text_compare", fontFamily="Material Symbols Outlined")
-    text_decrease_outlined = IconData(name="text_decrease", fontFamily="Material Symbols Outlined")
-    text_fields_outlined = IconData(name="text_fields", fontFamily="Material Symbols Outlined")
-    text_fields_alt_outlined = IconData(name="text_fields_alt", fontFamily="Material Symbols Outlined")
-    text_format_outlined = IconData(name="text_format", fontFamily="Material Symbols Outlined")
-    text_increase_outlined = IconData(name="text_increase", fontFamily="Material Symbols Outlined")
-    text_rotate_up_outlined = IconData(name="text_rotate_up", fontFamily="Material Symbols Outlined")
-    text_rotate_vertical_outlined = IconData(name="text_rotate_vertical", fontFamily="Material Symbols Outlined")
-    text_rotation_angledown_outlined = IconData(name="text_rotation_angledown", fontFamily="Material Symbols Outlined")
-    text_rotation_angleup_outlined = IconData(name="text_rotation_angleup", fontFamily="Material Symbols Outlined")
-    text_rotation_down_outlined = IconData(name="text_rotation_down", fontFamily="Material Symbols Outlined")
-    text_rotation_none_outlined = IconData(name="text_rotation_none", fontFamily="Material Symbols Outlined")
-    text_select_end_outlined = IconData(name="text_select_end", fontFamily="Material Symbols Outlined")
-    text_select_jump_to_beginning_outlined = IconData(name="text_select_jump_to_beginning", fontFamily="Material Symbols Outlined")
-    text_select_jump_to_end_outlined = IconData(name="text_select_jump_to_end", fontFamily="Material Symbols Outlined")
-    text_select_move_back_character_outlined = IconData(name="text_select_move_back_character", fontFamily="Material Symbols Outlined")
-    text_select_move_back_word_outlined = IconData(name="text_select_move_back_word", fontFamily="Material Symbols Outlined")
-    text_select_move_down_outlined = IconData(name="text_select_move_down", fontFamily="Material Symbols Outlined")
-    text_select_move_forward_character_outlined = IconData(name="text_select_move_forward_character", fontFamily="Material Symbols Outlined")
-    text_select_move_forward_word_outlined = IconData(name="text_select_move_forward_word", fontFamily="Material Symbols Outlined")
-    text_select_move_up_outlined = IconData(name="text_select_move_up", fontFamily="Material Symbols Outlined")
-    text_select_start_outlined = IconData(name="text_select_start", fontFamily="Material Symbols Outlined")
-    text_snippet_outlined = IconData(name="text_snippet", fontFamily="Material Symbols Outlined")
-    text_to_speech_outlined = IconData(name="text_to_speech", fontFamily="Material Symbols Outlined")
-    text_up_outlined = IconData(name="text_up", fontFamily="Material Symbols Outlined")
-    textsms_outlined = IconData(name="textsms", fontFamily="Material Symbols Outlined")
-    texture_outlined = IconData(name="texture", fontFamily="Material Symbols Outlined")
-    texture_add_outlined = IconData(name="texture_add", fontFamily="Material Symbols Outlined")
-    texture_minus_outlined = IconData(name="texture_minus", fontFamily="Material Symbols Outlined")
-    theater_comedy_outlined = IconData(name="theater_comedy", fontFamily="Material Symbols Outlined")
-    theaters_outlined = IconData(name="theaters", fontFamily="Material Symbols Outlined")
-    thermometer_outlined = IconData(name="thermometer", fontFamily="Material Symbols Outlined")
-    thermometer_add_outlined = IconData(name="thermometer_add", fontFamily="Material Symbols Outlined")
-    thermometer_gain_outlined = IconData(name="thermometer_gain", fontFamily="Material Symbols Outlined")
-    thermometer_loss_outlined = IconData(name="thermometer_loss", fontFamily="Material Symbols Outlined")
-    thermometer_minus_outlined = IconData(name="thermometer_minus", fontFamily="Material Symbols Outlined")
-    thermostat_outlined = IconData(name="thermostat", fontFamily="Material Symbols Outlined")
-    thermostat_arrow_down_outlined = IconData(name="thermostat_arrow_down", fontFamily="Material Symbols Outlined")
-    thermostat_arrow_up_outlined = IconData(name="thermostat_arrow_up", fontFamily="Material Symbols Outlined")
-    thermostat_auto_outlined = IconData(name="thermostat_auto", fontFamily="Material Symbols Outlined")
-    thermostat_carbon_outlined = IconData(name="thermostat_carbon", fontFamily="Material Symbols Outlined")
-    things_to_do_outlined = IconData(name="things_to_do", fontFamily="Material Symbols Outlined")
-    thread_unread_outlined = IconData(name="thread_unread", fontFamily="Material Symbols Outlined")
-    threat_intelligence_outlined = IconData(name="threat_intelligence", fontFamily="Material Symbols Outlined")
-    thumb_down_outlined = IconData(name="thumb_down", fontFamily="Material Symbols Outlined")
-    thumb_down_alt_outlined = IconData(name="thumb_down_alt", fontFamily="Material Symbols Outlined")
-    thumb_down_filled_outlined = IconData(name="thumb_down_filled", fontFamily="Material Symbols Outlined")
-    thumb_down_off_outlined = IconData(name="thumb_down_off", fontFamily="Material Symbols Outlined")
-    thumb_down_off_alt_outlined = IconData(name="thumb_down_off_alt", fontFamily="Material Symbols Outlined")
-    thumb_up_outlined = IconData(name="thumb_up", fontFamily="Material Symbols Outlined")
-    thumb_up_alt_outlined = IconData(name="thumb_up_alt", fontFamily="Material Symbols Outlined")
-    thumb_up_filled_outlined = IconData(name="thumb_up_filled", fontFamily="Material Symbols Outlined")
-    thumb_up_off_outlined = IconData(name="thumb_up_off", fontFamily="Material Symbols Outlined")
-    thumb_up_off_alt_outlined = IconData(name="thumb_up_off_alt", fontFamily="Material Symbols Outlined")
-    thumbnail_bar_outlined = IconData(name="thumbnail_bar", fontFamily="Material Symbols Outlined")
-    thumbs_up_down_outlined = IconData(name="thumbs_up_down", fontFamily="Material Symbols Outlined")
-    thunderstorm_outlined = IconData(name="thunderstorm", fontFamily="Material Symbols Outlined")
-    tibia_outlined = IconData(name="tibia", fontFamily="Material Symbols Outlined")
-    tibia_alt_outlined = IconData(name="tibia_alt", fontFamily="Material Symbols Outlined")
-    tile_large_outlined = IconData(name="tile_large", fontFamily="Material Symbols Outlined")
-    tile_medium_outlined = IconData(name="tile_medium", fontFamily="Material Symbols Outlined")
-    tile_small_outlined = IconData(name="tile_small", fontFamily="Material Symbols Outlined")
-    time_auto_outlined = IconData(name="time_auto", fontFamily="Material Symbols Outlined")
-    time_to_leave_outlined = IconData(name="time_to_leave", fontFamily="Material Symbols Outlined")
-    timelapse_outlined = IconData(name="timelapse", fontFamily="Material Symbols Outlined")
-    timeline_outlined = IconData(name="timeline", fontFamily="Material Symbols Outlined")
-    timer_outlined = IconData(name="timer", fontFamily="Material Symbols Outlined")
-    timer_10_outlined = IconData(name="timer_10", fontFamily="Material Symbols Outlined")
-    timer_10_alt_1_outlined = IconData(name="timer_10_alt_1", fontFamily="Material Symbols Outlined")
-    timer_10_select_outlined = IconData(name="timer_10_select", fontFamily="Material Symbols Outlined")
-    timer_3_outlined = IconData(name="timer_3", fontFamily="Material Symbols Outlined")
-    timer_3_alt_1_outlined = IconData(name="timer_3_alt_1", fontFamily="Material Symbols Outlined")
-    timer_3_select_outlined = IconData(name="timer_3_select", fontFamily="Material Symbols Outlined")
-    timer_5_outlined = IconData(name="timer_5", fontFamily="Material Symbols Outlined")
-    timer_5_shutter_outlined = IconData(name="timer_5_shutter", fontFamily="Material Symbols Outlined")
-    timer_arrow_down_outlined = IconData(name="timer_arrow_down", fontFamily="Material Symbols Outlined")
-    timer_arrow_up_outlined = IconData(name="timer_arrow_up", fontFamily="Material Symbols Outlined")
-    timer_off_outlined = IconData(name="timer_off", fontFamily="Material Symbols Outlined")
-    timer_pause_outlined = IconData(name="timer_pause", fontFamily="Material Symbols Outlined")
-    timer_play_outlined = IconData(name="timer_play", fontFamily="Material Symbols Outlined")
-    tips_and_updates_outlined = IconData(name="tips_and_updates", fontFamily="Material Symbols Outlined")
-    tire_repair_outlined = IconData(name="tire_repair", fontFamily="Material Symbols Outlined")
-    title_outlined = IconData(name="title", fontFamily="Material Symbols Outlined")
-    titlecase_outlined = IconData(name="titlecase", fontFamily="Material Symbols Outlined")
-    toast_outlined = IconData(name="toast", fontFamily="Material Symbols Outlined")
-    toc_outlined = IconData(name="toc", fontFamily="Material Symbols Outlined")
-    today_outlined = IconData(name="today", fontFamily="Material Symbols Outlined")
-    toggle_off_outlined = IconData(name="toggle_off", fontFamily="Material Symbols Outlined")
-    toggle_on_outlined = IconData(name="toggle_on", fontFamily="Material Symbols Outlined")
-    token_outlined = IconData(name="token", fontFamily="Material Symbols Outlined")
-    toll_outlined = IconData(name="toll", fontFamily="Material Symbols Outlined")
-    tonality_outlined = IconData(name="tonality", fontFamily="Material Symbols Outlined")
-    toolbar_outlined = IconData(name="toolbar", fontFamily="Material Symbols Outlined")
-    tools_flat_head_outlined = IconData(name="tools_flat_head", fontFamily="Material Symbols Outlined")
-    tools_installation_kit_outlined = IconData(name="tools_installation_kit", fontFamily="Material Symbols Outlined")
-    tools_ladder_outlined = IconData(name="tools_ladder", fontFamily="Material Symbols Outlined")
-    tools_level_outlined = IconData(name="tools_level", fontFamily="Material Symbols Outlined")
-    tools_phillips_outlined = IconData(name="tools_phillips", fontFamily="Material Symbols Outlined")
-    tools_pliers_wire_stripper_outlined = IconData(name="tools_pliers_wire_stripper", fontFamily="Material Symbols Outlined")
-    tools_power_drill_outlined = IconData(name="tools_power_drill", fontFamily="Material Symbols Outlined")
-    tools_wrench_outlined = IconData(name="tools_wrench", fontFamily="Material Symbols Outlined")
-    tooltip_outlined = IconData(name="tooltip", fontFamily="Material Symbols Outlined")
-    tooltip_2_outlined = IconData(name="tooltip_2", fontFamily="Material Symbols Outlined")
-    top_panel_close_outlined = IconData(name="top_panel_close", fontFamily="Material Symbols Outlined")
-    top_panel_open_outlined = IconData(name="top_panel_open", fontFamily="Material Symbols Outlined")
-    topic_outlined = IconData(name="topic", fontFamily="Material Symbols Outlined")
-    tornado_outlined = IconData(name="tornado", fontFamily="Material Symbols Outlined")
-    total_dissolved_solids_outlined = IconData(name="total_dissolved_solids", fontFamily="Material Symbols Outlined")
-    touch_app_outlined = IconData(name="touch_app", fontFamily="Material Symbols Outlined")
-    touch_double_outlined = IconData(name="touch_double", fontFamily="Material Symbols Outlined")
-    touch_long_outlined = IconData(name="touch_long", fontFamily="Material Symbols Outlined")
-    touch_triple_outlined = IconData(name="touch_triple", fontFamily="Material Symbols Outlined")
-    touchpad_mouse_outlined = IconData(name="touchpad_mouse", fontFamily="Material Symbols Outlined")
-    touchpad_mouse_off_outlined = IconData(name="touchpad_mouse_off", fontFamily="Material Symbols Outlined")
-    tour_outlined = IconData(name="tour", fontFamily="Material Symbols Outlined")
-    toys_outlined = IconData(name="toys", fontFamily="Material Symbols Outlined")
-    toys_and_games_outlined = IconData(name="toys_and_games", fontFamily="Material Symbols Outlined")
-    toys_fan_outlined = IconData(name="toys_fan", fontFamily="Material Symbols Outlined")
-    track_changes_outlined = IconData(name="track_changes", fontFamily="Material Symbols Outlined")
-    trackpad_input_outlined = IconData(name="trackpad_input", fontFamily="Material Symbols Outlined")
-    trackpad_input_2_outlined = IconData(name="trackpad_input_2", fontFamily="Material Symbols Outlined")
-    trackpad_input_3_outlined = IconData(name="trackpad_input_3", fontFamily="Material Symbols Outlined")
-    traffic_outlined = IconData(name="traffic", fontFamily="Material Symbols Outlined")
-    traffic_jam_outlined = IconData(name="traffic_jam", fontFamily="Material Symbols Outlined")
-    trail_length_outlined = IconData(name="trail_length", fontFamily="Material Symbols Outlined")
-    trail_length_medium_outlined = IconData(name="trail_length_medium", fontFamily="Material Symbols Outlined")
-    trail_length_short_outlined = IconData(name="trail_length_short", fontFamily="Material Symbols Outlined")
-    train_outlined = IconData(name="train", fontFamily="Material Symbols Outlined")
-    tram_outlined = IconData(name="tram", fontFamily="Material Symbols Outlined")
-    transcribe_outlined = IconData(name="transcribe", fontFamily="Material Symbols Outlined")
-    transfer_within_a_station_outlined = IconData(name="transfer_within_a_station", fontFamily="Material Symbols Outlined")
-    transform_outlined = IconData(name="transform", fontFamily="Material Symbols Outlined")
-    transgender_outlined = IconData(name="transgender", fontFamily="Material Symbols Outlined")
-    transit_enterexit_outlined = IconData(name="transit_enterexit", fontFamily="Material Symbols Outlined")
-    transit_ticket_outlined = IconData(name="transit_ticket", fontFamily="Material Symbols Outlined")
-    transition_chop_outlined = IconData(name="transition_chop", fontFamily="Material Symbols Outlined")
-    transition_dissolve_outlined = IconData(name="transition_dissolve", fontFamily="Material Symbols Outlined")
-    transition_fade_outlined = IconData(name="transition_fade", fontFamily="Material Symbols Outlined")
-    transition_push_outlined = IconData(name="transition_push", fontFamily="Material Symbols Outlined")
-    transition_slide_outlined = IconData(name="transition_slide", fontFamily="Material Symbols Outlined")
-    translate_outlined = IconData(name="translate", fontFamily="Material Symbols Outlined")
-    transportation_outlined = IconData(name="transportation", fontFamily="Material Symbols Outlined")
-    travel_outlined = IconData(name="travel", fontFamily="Material Symbols Outlined")
-    travel_explore_outlined = IconData(name="travel_explore", fontFamily="Material Symbols Outlined")
-    travel_luggage_and_bags_outlined = IconData(name="travel_luggage_and_bags", fontFamily="Material Symbols Outlined")
-    trending_down_outlined = IconData(name="trending_down", fontFamily="Material Symbols Outlined")
-    trending_flat_outlined = IconData(name="trending_flat", fontFamily="Material Symbols Outlined")
-    trending_up_outlined = IconData(name="trending_up", fontFamily="Material Symbols Outlined")
-    trip_outlined = IconData(name="trip", fontFamily="Material Symbols Outlined")
-    trip_origin_outlined = IconData(name="trip_origin", fontFamily="Material Symbols Outlined")
-    trolley_outlined = IconData(name="trolley", fontFamily="Material Symbols Outlined")
-    trolley_cable_car_outlined = IconData(name="trolley_cable_car", fontFamily="Material Symbols Outlined")
-    trophy_outlined = IconData(name="trophy", fontFamily="Material Symbols Outlined")
-    troubleshoot_outlined = IconData(name="troubleshoot", fontFamily="Material Symbols Outlined")
-    try_outlined = IconData(name="try", fontFamily="Material Symbols Outlined")
-    tsunami_outlined = IconData(name="tsunami", fontFamily="Material Symbols Outlined")
-    tsv_outlined = IconData(name="tsv", fontFamily="Material Symbols Outlined")
-    tty_outlined = IconData(name="tty", fontFamily="Material Symbols Outlined")
-    tune_outlined = IconData(name="tune", fontFamily="Material Symbols Outlined")
-    tungsten_outlined = IconData(name="tungsten", fontFamily="Material Symbols Outlined")
-    turn_left_outlined = IconData(name="turn_left", fontFamily="Material Symbols Outlined")
-    turn_right_outlined = IconData(name="turn_right", fontFamily="Material Symbols Outlined")
-    turn_sharp_left_outlined = IconData(name="turn_sharp_left", fontFamily="Material Symbols Outlined")
-    turn_sharp_right_outlined = IconData(name="turn_sharp_right", fontFamily="Material Symbols Outlined")
-    turn_slight_left_outlined = IconData(name="turn_slight_left", fontFamily="Material Symbols Outlined")
-    turn_slight_right_outlined = IconData(name="turn_slight_right", fontFamily="Material Symbols Outlined")
-    turned_in_outlined = IconData(name="turned_in", fontFamily="Material Symbols Outlined")
-    turned_in_not_outlined = IconData(name="turned_in_not", fontFamily="Material Symbols Outlined")
-    tv_outlined = IconData(name="tv", fontFamily="Material Symbols Outlined")
-    tv_displays_outlined = IconData(name="tv_displays", fontFamily="Material Symbols Outlined")
-    tv_gen_outlined = IconData(name="tv_gen", fontFamily="Material Symbols Outlined")
-    tv_guide_outlined = IconData(name="tv_guide", fontFamily="Material Symbols Outlined")
-    tv_next_outlined = IconData(name="tv_next", fontFamily="Material Symbols Outlined")
-    tv_off_outlined = IconData(name="tv_off", fontFamily="Material Symbols Outlined")
-    tv_options_edit_channels_outlined = IconData(name="tv_options_edit_channels", fontFamily="Material Symbols Outlined")
-    tv_options_input_settings_outlined = IconData(name="tv_options_input_settings", fontFamily="Material Symbols Outlined")
-    tv_remote_outlined = IconData(name="tv_remote", fontFamily="Material Symbols Outlined")
-    tv_signin_outlined = IconData(name="tv_signin", fontFamily="Material Symbols Outlined")
-    tv_with_assistant_outlined = IconData(name="tv_with_assistant", fontFamily="Material Symbols Outlined")
-    two_pager_outlined = IconData(name="two_pager", fontFamily="Material Symbols Outlined")
-    two_pager_store_outlined = IconData(name="two_pager_store", fontFamily="Material Symbols Outlined")
-    two_wheeler_outlined = IconData(name="two_wheeler", fontFamily="Material Symbols Outlined")
-    type_specimen_outlined = IconData(name="type_specimen", fontFamily="Material Symbols Outlined")
-    u_turn_left_outlined = IconData(name="u_turn_left", fontFamily="Material Symbols Outlined")
-    u_turn_right_outlined = IconData(name="u_turn_right", fontFamily="Material Symbols Outlined")
-    ulna_radius_outlined = IconData(name="ulna_radius", fontFamily="Material Symbols Outlined")
-    ulna_radius_alt_outlined = IconData(name="ulna_radius_alt", fontFamily="Material Symbols Outlined")
-    umbrella_outlined = IconData(name="umbrella", fontFamily="Material Symbols Outlined")
-    unarchive_outlined = IconData(name="unarchive", fontFamily="Material Symbols Outlined")
-    undo_outlined = IconData(name="undo", fontFamily="Material Symbols Outlined")
-    unfold_less_outlined = IconData(name="unfold_less", fontFamily="Material Symbols Outlined")
-    unfold_less_double_outlined = IconData(name="unfold_less_double", fontFamily="Material Symbols Outlined")
-    unfold_more_outlined = IconData(name="unfold_more", fontFamily="Material Symbols Outlined")
-    unfold_more_double_outlined = IconData(name="unfold_more_double", fontFamily="Material Symbols Outlined")
-    ungroup_outlined = IconData(name="ungroup", fontFamily="Material Symbols Outlined")
-    universal_currency_outlined = IconData(name="universal_currency", fontFamily="Material Symbols Outlined")
-    universal_currency_alt_outlined = IconData(name="universal_currency_alt", fontFamily="Material Symbols Outlined")
-    universal_local_outlined = IconData(name="universal_local", fontFamily="Material Symbols Outlined")
-    unknown_2_outlined = IconData(name="unknown_2", fontFamily="Material Symbols Outlined")
-    unknown_5_outlined = IconData(name="unknown_5", fontFamily="Material Symbols Outlined")
-    unknown_7_outlined = IconData(name="unknown_7", fontFamily="Material Symbols Outlined")
-    unknown_document_outlined = IconData(name="unknown_document", fontFamily="Material Symbols Outlined")
-    unknown_med_outlined = IconData(name="unknown_med", fontFamily="Material Symbols Outlined")
-    unlicense_outlined = IconData(name="unlicense", fontFamily="Material Symbols Outlined")
-    unpaved_road_outlined = IconData(name="unpaved_road", fontFamily="Material Symbols Outlined")
-    unpin_outlined = IconData(name="unpin", fontFamily="Material Symbols Outlined")
-    unpublished_outlined = IconData(name="unpublished", fontFamily="Material Symbols Outlined")
-    unsubscribe_outlined = IconData(name="unsubscribe", fontFamily="Material Symbols Outlined")
-    upcoming_outlined = IconData(name="upcoming", fontFamily="Material Symbols Outlined")
-    update_outlined = IconData(name="update", fontFamily="Material Symbols Outlined")
-    update_disabled_outlined = IconData(name="update_disabled", fontFamily="Material Symbols Outlined")
-    upgrade_outlined = IconData(name="upgrade", fontFamily="Material Symbols Outlined")
-    upi_pay_outlined = IconData(name="upi_pay", fontFamily="Material Symbols Outlined")
-    upload_outlined = IconData(name="upload", fontFamily="Material Symbols Outlined")
-    upload_2_outlined = IconData(name="upload_2", fontFamily="Material Symbols Outlined")
-    upload_file_outlined = IconData(name="upload_file", fontFamily="Material Symbols Outlined")
-    uppercase_outlined = IconData(name="uppercase", fontFamily="Material Symbols Outlined")
-    urology_outlined = IconData(name="urology", fontFamily="Material Symbols Outlined")
-    usb_outlined = IconData(name="usb", fontFamily="Material Symbols Outlined")
-    usb_off_outlined = IconData(name="usb_off", fontFamily="Material Symbols Outlined")
-    user_attributes_outlined = IconData(name="user_attributes", fontFamily="Material Symbols Outlined")
-    vaccines_outlined = IconData(name="vaccines", fontFamily="Material Symbols Outlined")
-    vacuum_outlined = IconData(name="vacuum", fontFamily="Material Symbols Outlined")
-    valve_outlined = IconData(name="valve", fontFamily="Material Symbols Outlined")
-    vape_free_outlined = IconData(name="vape_free", fontFamily="Material Symbols Outlined")
-    vaping_rooms_outlined = IconData(name="vaping_rooms", fontFamily="Material Symbols Outlined")
-    variable_add_outlined = IconData(name="variable_add", fontFamily="Material Symbols Outlined")
-    variable_insert_outlined = IconData(name="variable_insert", fontFamily="Material Symbols Outlined")
-    variable_remove_outlined = IconData(name="variable_remove", fontFamily="Material Symbols Outlined")
-    variables_outlined = IconData(name="variables", fontFamily="Material Symbols Outlined")
-    ventilator_outlined = IconData(name="ventilator", fontFamily="Material Symbols Outlined")
-    verified_outlined = IconData(name="verified", fontFamily="Material Symbols Outlined")
-    verified_off_outlined = IconData(name="verified_off", fontFamily="Material Symbols Outlined")
-    verified_user_outlined = IconData(name="verified_user", fontFamily="Material Symbols Outlined")
-    vertical_align_bottom_outlined = IconData(name="vertical_align_bottom", fontFamily="Material Symbols Outlined")
-    vertical_align_center_outlined = IconData(name="vertical_align_center", fontFamily="Material Symbols Outlined")
-    vertical_align_top_outlined = IconData(name="vertical_align_top", fontFamily="Material Symbols Outlined")
-    vertical_distribute_outlined = IconData(name="vertical_distribute", fontFamily="Material Symbols Outlined")
-    vertical_shades_outlined = IconData(name="vertical_shades", fontFamily="Material Symbols Outlined")
-    vertical_shades_closed_outlined = IconData(name="vertical_shades_closed", fontFamily="Material Symbols Outlined")
-    vertical_split_outlined = IconData(name="vertical_split", fontFamily="Material Symbols Outlined")
-    vibration_outlined = IconData(name="vibration", fontFamily="Material Symbols Outlined")
-    video_call_outlined = IconData(name="video_call", fontFamily="Material Symbols Outlined")
-    video_camera_back_outlined = IconData(name="video_camera_back", fontFamily="Material Symbols Outlined")
-    video_camera_back_add_outlined = IconData(name="video_camera_back_add", fontFamily="Material Symbols Outlined")
-    video_camera_front_outlined = IconData(name="video_camera_front", fontFamily="Material Symbols Outlined")
-    video_camera_front_off_outlined = IconData(name="video_camera_front_off", fontFamily="Material Symbols Outlined")
-    video_chat_outlined = IconData(name="video_chat", fontFamily="Material Symbols Outlined")
-    video_file_outlined = IconData(name="video_file", fontFamily="Material Symbols Outlined")
-    video_label_outlined = IconData(name="video_label", fontFamily="Material Symbols Outlined")
-    video_library_outlined = IconData(name="video_library", fontFamily="Material Symbols Outlined")
-    video_search_outlined = IconData(name="video_search", fontFamily="Material Symbols Outlined")
-    video_settings_outlined = IconData(name="video_settings", fontFamily="Material Symbols Outlined")
-    video_stable_outlined = IconData(name="video_stable", fontFamily="Material Symbols Outlined")
-    videocam_outlined = IconData(name="videocam", fontFamily="Material Symbols Outlined")
-    videocam_alert_outlined = IconData(name="videocam_alert", fontFamily="Material Symbols Outlined")
-    videocam_off_outlined = IconData(name="videocam_off", fontFamily="Material Symbols Outlined")
-    videogame_asset_outlined = IconData(name="videogame_asset", fontFamily="Material Symbols Outlined")
-    videogame_asset_off_outlined = IconData(name="videogame_asset_off", fontFamily="Material Symbols Outlined")
-    view_agenda_outlined = IconData(name="view_agenda", fontFamily="Material Symbols Outlined")
-    view_apps_outlined = IconData(name="view_apps", fontFamily="Material Symbols Outlined")
-    view_array_outlined = IconData(name="view_array", fontFamily="Material Symbols Outlined")
-    view_carousel_outlined = IconData(name="view_carousel", fontFamily="Material Symbols Outlined")
-    view_column_outlined = IconData(name="view_column", fontFamily="Material Symbols Outlined")
-    view_column_2_outlined = IconData(name="view_column_2", fontFamily="Material Symbols Outlined")
-    view_comfy_outlined = IconData(name="view_comfy", fontFamily="Material Symbols Outlined")
-    view_comfy_alt_outlined = IconData(name="view_comfy_alt", fontFamily="Material Symbols Outlined")
-    view_compact_outlined = IconData(name="view_compact", fontFamily="Material Symbols Outlined")
-    view_compact_alt_outlined = IconData(name="view_compact_alt", fontFamily="Material Symbols Outlined")
-    view_cozy_outlined = IconData(name="view_cozy", fontFamily="Material Symbols Outlined")
-    view_day_outlined = IconData(name="view_day", fontFamily="Material Symbols Outlined")
-    view_headline_outlined = IconData(name="view_headline", fontFamily="Material Symbols Outlined")
-    view_in_ar_outlined = IconData(name="view_in_ar", fontFamily="Material Symbols Outlined")
-    view_in_ar_new_outlined = IconData(name="view_in_ar_new", fontFamily="Material Symbols Outlined")
-    view_in_ar_off_outlined = IconData(name="view_in_ar_off", fontFamily="Material Symbols Outlined")
-    view_kanban_outlined = IconData(name="view_kanban", fontFamily="Material Symbols Outlined")
-    view_list_outlined = IconData(name="view_list", fontFamily="Material Symbols Outlined")
-    view_module_outlined = IconData(name="view_module", fontFamily="Material Symbols Outlined")
-    view_object_track_outlined = IconData(name="view_object_track", fontFamily="Material Symbols Outlined")
-    view_quilt_outlined = IconData(name="view_quilt", fontFamily="Material Symbols Outlined")
-    view_real_size_outlined = IconData(name="view_real_size", fontFamily="Material Symbols Outlined")
-    view_sidebar_outlined = IconData(name="view_sidebar", fontFamily="Material Symbols Outlined")
-    view_stream_outlined = IconData(name="view_stream", fontFamily="Material Symbols Outlined")
-    view_timeline_outlined = IconData(name="view_timeline", fontFamily="Material Symbols Outlined")
-    view_week_outlined = IconData(name="view_week", fontFamily="Material Symbols Outlined")
-    vignette_outlined = IconData(name="vignette", fontFamily="Material Symbols Outlined")
-    villa_outlined = IconData(name="villa", fontFamily="Material Symbols Outlined")
-    visibility_outlined = IconData(name="visibility", fontFamily="Material Symbols Outlined")
-    visibility_lock_outlined = IconData(name="visibility_lock", fontFamily="Material Symbols Outlined")
-    visibility_off_outlined = IconData(name="visibility_off", fontFamily="Material Symbols Outlined")
-    vital_signs_outlined = IconData(name="vital_signs", fontFamily="Material Symbols Outlined")
-    vitals_outlined = IconData(name="vitals", fontFamily="Material Symbols Outlined")
-    vo2_max_outlined = IconData(name="vo2_max", fontFamily="Material Symbols Outlined")
-    voice_chat_outlined = IconData(name="voice_chat", fontFamily="Material Symbols Outlined")
-    voice_over_off_outlined = IconData(name="voice_over_off", fontFamily="Material Symbols Outlined")
-    voice_selection_outlined = IconData(name="voice_selection", fontFamily="Material Symbols Outlined")
-    voice_selection_off_outlined = IconData(name="voice_selection_off", fontFamily="Material Symbols Outlined")
-    voicemail_outlined = IconData(name="voicemail", fontFamily="Material Symbols Outlined")
-    voicemail_2_outlined = IconData(name="voicemail_2", fontFamily="Material Symbols Outlined")
-    volcano_outlined = IconData(name="volcano", fontFamily="Material Symbols Outlined")
-    volume_down_outlined = IconData(name="volume_down", fontFamily="Material Symbols Outlined")
-    volume_down_alt_outlined = IconData(name="volume_down_alt", fontFamily="Material Symbols Outlined")
-    volume_mute_outlined = IconData(name="volume_mute", fontFamily="Material Symbols Outlined")
-    volume_off_outlined = IconData(name="volume_off", fontFamily="Material Symbols Outlined")
-    volume_up_outlined = IconData(name="volume_up", fontFamily="Material Symbols Outlined")
-    volunteer_activism_outlined = IconData(name="volunteer_activism", fontFamily="Material Symbols Outlined")
-    voting_chip_outlined = IconData(name="voting_chip", fontFamily="Material Symbols Outlined")
-    vpn_key_outlined = IconData(name="vpn_key", fontFamily="Material Symbols Outlined")
-    vpn_key_alert_outlined = IconData(name="vpn_key_alert", fontFamily="Material Symbols Outlined")
-    vpn_key_off_outlined = IconData(name="vpn_key_off", fontFamily="Material Symbols Outlined")
-    vpn_lock_outlined = IconData(name="vpn_lock", fontFamily="Material Symbols Outlined")
-    vpn_lock_2_outlined = IconData(name="vpn_lock_2", fontFamily="Material Symbols Outlined")
-    vr180_create2d_outlined = IconData(name="vr180_create2d", fontFamily="Material Symbols Outlined")
-    vr180_create2d_off_outlined = IconData(name="vr180_create2d_off", fontFamily="Material Symbols Outlined")
-    vrpano_outlined = IconData(name="vrpano", fontFamily="Material Symbols Outlined")
-    wall_art_outlined = IconData(name="wall_art", fontFamily="Material Symbols Outlined")
-    wall_lamp_outlined = IconData(name="wall_lamp", fontFamily="Material Symbols Outlined")
-    wallet_outlined = IconData(name="wallet", fontFamily="Material Symbols Outlined")
-    wallpaper_outlined = IconData(name="wallpaper", fontFamily="Material Symbols Outlined")
-    wallpaper_slideshow_outlined = IconData(name="wallpaper_slideshow", fontFamily="Material Symbols Outlined")
-    wand_shine_outlined = IconData(name="wand_shine", fontFamily="Material Symbols Outlined")
-    wand_stars_outlined = IconData(name="wand_stars", fontFamily="Material Symbols Outlined")
-    ward_outlined = IconData(name="ward", fontFamily="Material Symbols Outlined")
-    warehouse_outlined = IconData(name="warehouse", fontFamily="Material Symbols Outlined")
-    warning_outlined = IconData(name="warning", fontFamily="Material Symbols Outlined")
-    warning_amber_outlined = IconData(name="warning_amber", fontFamily="Material Symbols Outlined")
-    warning_off_outlined = IconData(name="warning_off", fontFamily="Material Symbols Outlined")
-    wash_outlined = IconData(name="wash", fontFamily="Material Symbols Outlined")
-    watch_outlined = IconData(name="watch", fontFamily="Material Symbols Outlined")
-    watch_button_press_outlined = IconData(name="watch_button_press", fontFamily="Material Symbols Outlined")
-    watch_check_outlined = IconData(name="watch_check", fontFamily="Material Symbols Outlined")
-    watch_later_outlined = IconData(name="watch_later", fontFamily="Material Symbols Outlined")
-    watch_off_outlined = IconData(name="watch_off", fontFamily="Material Symbols Outlined")
-    watch_screentime_outlined = IconData(name="watch_screentime", fontFamily="Material Symbols Outlined")
-    watch_vibration_outlined = IconData(name="watch_vibration", fontFamily="Material Symbols Outlined")
-    watch_wake_outlined = IconData(name="watch_wake", fontFamily="Material Symbols Outlined")
-    water_outlined = IconData(name="water", fontFamily="Material Symbols Outlined")
-    water_bottle_outlined = IconData(name="water_bottle", fontFamily="Material Symbols Outlined")
-    water_bottle_large_outlined = IconData(name="water_bottle_large", fontFamily="Material Symbols Outlined")
-    water_damage_outlined = IconData(name="water_damage", fontFamily="Material Symbols Outlined")
-    water_do_outlined = IconData(name="water_do", fontFamily="Material Symbols Outlined")
-    water_drop_outlined = IconData(name="water_drop", fontFamily="Material Symbols Outlined")
-    water_ec_outlined = IconData(name="water_ec", fontFamily="Material Symbols Outlined")
-    water_full_outlined = IconData(name="water_full", fontFamily="Material Symbols Outlined")
-    water_heater_outlined = IconData(name="water_heater", fontFamily="Material Symbols Outlined")
-    water_lock_outlined = IconData(name="water_lock", fontFamily="Material Symbols Outlined")
-    water_loss_outlined = IconData(name="water_loss", fontFamily="Material Symbols Outlined")
-    water_lux_outlined = IconData(name="water_lux", fontFamily="Material Symbols Outlined")
-    water_medium_outlined = IconData(name="water_medium", fontFamily="Material Symbols Outlined")
-    water_orp_outlined = IconData(name="water_orp", fontFamily="Material Symbols Outlined")
-    water_ph_outlined = IconData(name="water_ph", fontFamily="Material Symbols Outlined")
-    water_pump_outlined = IconData(name="water_pump", fontFamily="Material Symbols Outlined")
-    water_voc_outlined = IconData(name="water_voc", fontFamily="Material Symbols Outlined")
-    waterfall_chart_outlined = IconData(name="waterfall_chart", fontFamily="Material Symbols Outlined")
-    waves_outlined = IconData(name="waves", fontFamily="Material Symbols Outlined")
-    waving_hand_outlined = IconData(name="waving_hand", fontFamily="Material Symbols Outlined")
-    wb_auto_outlined = IconData(name="wb_auto", fontFamily="Material Symbols Outlined")
-    wb_cloudy_outlined = IconData(name="wb_cloudy", fontFamily="Material Symbols Outlined")
-    wb_incandescent_outlined = IconData(name="wb_incandescent", fontFamily="Material Symbols Outlined")
-    wb_iridescent_outlined = IconData(name="wb_iridescent", fontFamily="Material Symbols Outlined")
-    wb_shade_outlined = IconData(name="wb_shade", fontFamily="Material Symbols Outlined")
-    wb_sunny_outlined = IconData(name="wb_sunny", fontFamily="Material Symbols Outlined")
-    wb_twilight_outlined = IconData(name="wb_twilight", fontFamily="Material Symbols Outlined")
-    wc_outlined = IconData(name="wc", fontFamily="Material Symbols Outlined")
-    weather_hail_outlined = IconData(name="weather_hail", fontFamily="Material Symbols Outlined")
-    weather_mix_outlined = IconData(name="weather_mix", fontFamily="Material Symbols Outlined")
-    weather_snowy_outlined = IconData(name="weather_snowy", fontFamily="Material Symbols Outlined")
-    web_outlined = IconData(name="web", fontFamily="Material Symbols Outlined")
-    web_asset_outlined = IconData(name="web_asset", fontFamily="Material Symbols Outlined")
-    web_asset_off_outlined = IconData(name="web_asset_off", fontFamily="Material Symbols Outlined")
-    web_stories_outlined = IconData(name="web_stories", fontFamily="Material Symbols Outlined")
-    web_traffic_outlined = IconData(name="web_traffic", fontFamily="Material Symbols Outlined")
-    webhook_outlined = IconData(name="webhook", fontFamily="Material Symbols Outlined")
-    weekend_outlined = IconData(name="weekend", fontFamily="Material Symbols Outlined")
-    weight_outlined = IconData(name="weight", fontFamily="Material Symbols Outlined")
-    west_outlined = IconData(name="west", fontFamily="Material Symbols Outlined")
-    whatshot_outlined = IconData(name="whatshot", fontFamily="Material Symbols Outlined")
-    wheelchair_pickup_outlined = IconData(name="wheelchair_pickup", fontFamily="Material Symbols Outlined")
-    where_to_vote_outlined = IconData(name="where_to_vote", fontFamily="Material Symbols Outlined")
-    widget_medium_outlined = IconData(name="widget_medium", fontFamily="Material Symbols Outlined")
-    widget_small_outlined = IconData(name="widget_small", fontFamily="Material Symbols Outlined")
-    widget_width_outlined = IconData(name="widget_width", fontFamily="Material Symbols Outlined")
-    widgets_outlined = IconData(name="widgets", fontFamily="Material Symbols Outlined")
-    width_outlined = IconData(name="width", fontFamily="Material Symbols Outlined")
-    width_full_outlined = IconData(name="width_full", fontFamily="Material Symbols Outlined")
-    width_normal_outlined = IconData(name="width_normal", fontFamily="Material Symbols Outlined")
-    width_wide_outlined = IconData(name="width_wide", fontFamily="Material Symbols Outlined")
-    wifi_outlined = IconData(name="wifi", fontFamily="Material Symbols Outlined")
-    wifi_1_bar_outlined = IconData(name="wifi_1_bar", fontFamily="Material Symbols Outlined")
-    wifi_2_bar_outlined = IconData(name="wifi_2_bar", fontFamily="Material Symbols Outlined")
-    wifi_add_outlined = IconData(name="wifi_add", fontFamily="Material Symbols Outlined")
-    wifi_calling_outlined = IconData(name="wifi_calling", fontFamily="Material Symbols Outlined")
-    wifi_calling_1_outlined = IconData(name="wifi_calling_1", fontFamily="Material Symbols Outlined")
-    wifi_calling_2_outlined = IconData(name="wifi_calling_2", fontFamily="Material Symbols Outlined")
-    wifi_calling_3_outlined = IconData(name="wifi_calling_3", fontFamily="Material Symbols Outlined")
-    wifi_calling_bar_1_outlined = IconData(name="wifi_calling_bar_1", fontFamily="Material Symbols Outlined")
-    wifi_calling_bar_2_outlined = IconData(name="wifi_calling_bar_2", fontFamily="Material Symbols Outlined")
-    wifi_calling_bar_3_outlined = IconData(name="wifi_calling_bar_3", fontFamily="Material Symbols Outlined")
-    wifi_channel_outlined = IconData(name="wifi_channel", fontFamily="Material Symbols Outlined")
-    wifi_find_outlined = IconData(name="wifi_find", fontFamily="Material Symbols Outlined")
-    wifi_home_outlined = IconData(name="wifi_home", fontFamily="Material Symbols Outlined")
-    wifi_lock_outlined = IconData(name="wifi_lock", fontFamily="Material Symbols Outlined")
-    wifi_notification_outlined = IconData(name="wifi_notification", fontFamily="Material Symbols Outlined")
-    wifi_off_outlined = IconData(name="wifi_off", fontFamily="Material Symbols Outlined")
-    wifi_password_outlined = IconData(name="wifi_password", fontFamily="Material Symbols Outlined")
-    wifi_protected_setup_outlined = IconData(name="wifi_protected_setup", fontFamily="Material Symbols Outlined")
-    wifi_proxy_outlined = IconData(name="wifi_proxy", fontFamily="Material Symbols Outlined")
-    wifi_tethering_outlined = IconData(name="wifi_tethering", fontFamily="Material Symbols Outlined")
-    wifi_tethering_error_outlined = IconData(name="wifi_tethering_error", fontFamily="Material Symbols Outlined")
-    wifi_tethering_off_outlined = IconData(name="wifi_tethering_off", fontFamily="Material Symbols Outlined")
-    wind_power_outlined = IconData(name="wind_power", fontFamily="Material Symbols Outlined")
-    window_outlined = IconData(name="window", fontFamily="Material Symbols Outlined")
-    window_closed_outlined = IconData(name="window_closed", fontFamily="Material Symbols Outlined")
-    window_open_outlined = IconData(name="window_open", fontFamily="Material Symbols Outlined")
-    window_sensor_outlined = IconData(name="window_sensor", fontFamily="Material Symbols Outlined")
-    windshield_defrost_front_outlined = IconData(name="windshield_defrost_front", fontFamily="Material Symbols Outlined")
-    windshield_defrost_rear_outlined = IconData(name="windshield_defrost_rear", fontFamily="Material Symbols Outlined")
-    windshield_heat_front_outlined = IconData(name="windshield_heat_front", fontFamily="Material Symbols Outlined")
-    wine_bar_outlined = IconData(name="wine_bar", fontFamily="Material Symbols Outlined")
-    woman_outlined = IconData(name="woman", fontFamily="Material Symbols Outlined")
-    woman_2_outlined = IconData(name="woman_2", fontFamily="Material Symbols Outlined")
-    work_outlined = IconData(name="work", fontFamily="Material Symbols Outlined")
-    work_alert_outlined = IconData(name="work_alert", fontFamily="Material Symbols Outlined")
-    work_history_outlined = IconData(name="work_history", fontFamily="Material Symbols Outlined")
-    work_off_outlined = IconData(name="work_off", fontFamily="Material Symbols Outlined")
-    work_outline_outlined = IconData(name="work_outline", fontFamily="Material Symbols Outlined")
-    work_update_outlined = IconData(name="work_update", fontFamily="Material Symbols Outlined")
-    workflow_outlined = IconData(name="workflow", fontFamily="Material Symbols Outlined")
-    workspace_premium_outlined = IconData(name="workspace_premium", fontFamily="Material Symbols Outlined")
-    workspaces_outlined = IconData(name="workspaces", fontFamily="Material Symbols Outlined")
-    workspaces_outline_outlined = IconData(name="workspaces_outline", fontFamily="Material Symbols Outlined")
-    wounds_injuries_outlined = IconData(name="wounds_injuries", fontFamily="Material Symbols Outlined")
-    wrap_text_outlined = IconData(name="wrap_text", fontFamily="Material Symbols Outlined")
-    wrist_outlined = IconData(name="wrist", fontFamily="Material Symbols Outlined")
-    wrong_location_outlined = IconData(name="wrong_location", fontFamily="Material Symbols Outlined")
-    wysiwyg_outlined = IconData(name="wysiwyg", fontFamily="Material Symbols Outlined")
-    yard_outlined = IconData(name="yard", fontFamily="Material Symbols Outlined")
-    your_trips_outlined = IconData(name="your_trips", fontFamily="Material Symbols Outlined")
-    youtube_activity_outlined = IconData(name="youtube_activity", fontFamily="Material Symbols Outlined")
-    youtube_searched_for_outlined = IconData(name="youtube_searched_for", fontFamily="Material Symbols Outlined")
-    zone_person_alert_outlined = IconData(name="zone_person_alert", fontFamily="Material Symbols Outlined")
-    zone_person_idle_outlined = IconData(name="zone_person_idle", fontFamily="Material Symbols Outlined")
-    zone_person_urgent_outlined = IconData(name="zone_person_urgent", fontFamily="Material Symbols Outlined")
-    zoom_in_outlined = IconData(name="zoom_in", fontFamily="Material Symbols Outlined")
-    zoom_in_map_outlined = IconData(name="zoom_in_map", fontFamily="Material Symbols Outlined")
-    zoom_out_outlined = IconData(name="zoom_out", fontFamily="Material Symbols Outlined")
-    zoom_out_map_outlined = IconData(name="zoom_out_map", fontFamily="Material Symbols Outlined")
-
-    
-    jamboard_kiosk = jamboard_kiosk_outlined
-    javascript = javascript_outlined
-    join = join_outlined
-    join_full = join_full_outlined
-    join_inner = join_inner_outlined
-    join_left = join_left_outlined
-    join_right = join_right_outlined
-    joystick = joystick_outlined
-    jump_to_element = jump_to_element_outlined
-    kayaking = kayaking_outlined
-    kebab_dining = kebab_dining_outlined
-    keep = keep_outlined
-    keep_off = keep_off_outlined
-    keep_pin = keep_pin_outlined
-    keep_public = keep_public_outlined
-    kettle = kettle_outlined
-    key = key_outlined
-    key_off = key_off_outlined
-    key_vertical = key_vertical_outlined
-    key_visualizer = key_visualizer_outlined
-    keyboard = keyboard_outlined
-    keyboard_alt = keyboard_alt_outlined
-    keyboard_arrow_down = keyboard_arrow_down_outlined
-    keyboard_arrow_left = keyboard_arrow_left_outlined
-    keyboard_arrow_right = keyboard_arrow_right_outlined
-    keyboard_arrow_up = keyboard_arrow_up_outlined
-    keyboard_backspace = keyboard_backspace_outlined
-    keyboard_capslock = keyboard_capslock_outlined
-    keyboard_capslock_badge = keyboard_capslock_badge_outlined
-    keyboard_command_key = keyboard_command_key_outlined
-    keyboard_control_key = keyboard_control_key_outlined
-    keyboard_double_arrow_down = keyboard_double_arrow_down_outlined
-    keyboard_double_arrow_left = keyboard_double_arrow_left_outlined
-    keyboard_double_arrow_right = keyboard_double_arrow_right_outlined
-    keyboard_double_arrow_up = keyboard_double_arrow_up_outlined
-    keyboard_external_input = keyboard_external_input_outlined
-    keyboard_full = keyboard_full_outlined
-    keyboard_hide = keyboard_hide_outlined
-    keyboard_keys = keyboard_keys_outlined
-    keyboard_lock = keyboard_lock_outlined
-    keyboard_lock_off = keyboard_lock_off_outlined
-    keyboard_off = keyboard_off_outlined
-    keyboard_onscreen = keyboard_onscreen_outlined
-    keyboard_option_key = keyboard_option_key_outlined
-    keyboard_previous_language = keyboard_previous_language_outlined
-    keyboard_return = keyboard_return_outlined
-    keyboard_tab = keyboard_tab_outlined
-    keyboard_tab_rtl = keyboard_tab_rtl_outlined
-    keyboard_voice = keyboard_voice_outlined
-    kid_star = kid_star_outlined
-    king_bed = king_bed_outlined
-    kitchen = kitchen_outlined
-    kitesurfing = kitesurfing_outlined
-    lab_panel = lab_panel_outlined
-    lab_profile = lab_profile_outlined
-    lab_research = lab_research_outlined
-    label = label_outlined
-    label_important = label_important_outlined
-    label_important_outline = label_important_outline_outlined
-    label_off = label_off_outlined
-    label_outline = label_outline_outlined
-    labs = labs_outlined
-    lan = lan_outlined
-    landscape = landscape_outlined
-    landscape_2 = landscape_2_outlined
-    landscape_2_edit = landscape_2_edit_outlined
-    landscape_2_off = landscape_2_off_outlined
-    landslide = landslide_outlined
-    language = language_outlined
-    language_chinese_array = language_chinese_array_outlined
-    language_chinese_cangjie = language_chinese_cangjie_outlined
-    language_chinese_dayi = language_chinese_dayi_outlined
-    language_chinese_pinyin = language_chinese_pinyin_outlined
-    language_chinese_quick = language_chinese_quick_outlined
-    language_chinese_wubi = language_chinese_wubi_outlined
-    language_french = language_french_outlined
-    language_gb_english = language_gb_english_outlined
-    language_international = language_international_outlined
-    language_japanese_kana = language_japanese_kana_outlined
-    language_korean_latin = language_korean_latin_outlined
-    language_pinyin = language_pinyin_outlined
-    language_spanish = language_spanish_outlined
-    language_us = language_us_outlined
-    language_us_colemak = language_us_colemak_outlined
-    language_us_dvorak = language_us_dvorak_outlined
-    laps = laps_outlined
-    laptop = laptop_outlined
-    laptop_car = laptop_car_outlined
-    laptop_chromebook = laptop_chromebook_outlined
-    laptop_mac = laptop_mac_outlined
-    laptop_windows = laptop_windows_outlined
-    lasso_select = lasso_select_outlined
-    last_page = last_page_outlined
-    launch = launch_outlined
-    laundry = laundry_outlined
-    layers = layers_outlined
-    layers_clear = layers_clear_outlined
-    lda = lda_outlined
-    leaderboard = leaderboard_outlined
-    leak_add = leak_add_outlined
-    leak_remove = leak_remove_outlined
-    left_click = left_click_outlined
-    left_panel_close = left_panel_close_outlined
-    left_panel_open = left_panel_open_outlined
-    legend_toggle = legend_toggle_outlined
-    lens = lens_outlined
-    lens_blur = lens_blur_outlined
-    letter_switch = letter_switch_outlined
-    library_add = library_add_outlined
-    library_add_check = library_add_check_outlined
-    library_books = library_books_outlined
-    library_music = library_music_outlined
-    license = license_outlined
-    lift_to_talk = lift_to_talk_outlined
-    light = light_outlined
-    light_group = light_group_outlined
-    light_mode = light_mode_outlined
-    light_off = light_off_outlined
-    lightbulb = lightbulb_outlined
-    lightbulb_2 = lightbulb_2_outlined
-    lightbulb_circle = lightbulb_circle_outlined
-    lightbulb_outline = lightbulb_outline_outlined
-    lightning_stand = lightning_stand_outlined
-    line_axis = line_axis_outlined
-    line_curve = line_curve_outlined
-    line_end = line_end_outlined
-    line_end_arrow = line_end_arrow_outlined
-    line_end_arrow_notch = line_end_arrow_notch_outlined
-    line_end_circle = line_end_circle_outlined
-    line_end_diamond = line_end_diamond_outlined
-    line_end_square = line_end_square_outlined
-    line_start = line_start_outlined
-    line_start_arrow = line_start_arrow_outlined
-    line_start_arrow_notch = line_start_arrow_notch_outlined
-    line_start_circle = line_start_circle_outlined
-    line_start_diamond = line_start_diamond_outlined
-    line_start_square = line_start_square_outlined
-    line_style = line_style_outlined
-    line_weight = line_weight_outlined
-    linear_scale = linear_scale_outlined
-    link = link_outlined
-    link_off = link_off_outlined
-    linked_camera = linked_camera_outlined
-    linked_services = linked_services_outlined
-    liquor = liquor_outlined
-    list = list_outlined
-    list_alt = list_alt_outlined
-    list_alt_add = list_alt_add_outlined
-    list_alt_check = list_alt_check_outlined
-    lists = lists_outlined
-    live_help = live_help_outlined
-    live_tv = live_tv_outlined
-    living = living_outlined
-    local_activity = local_activity_outlined
-    local_airport = local_airport_outlined
-    local_atm = local_atm_outlined
-    local_bar = local_bar_outlined
-    local_cafe = local_cafe_outlined
-    local_car_wash = local_car_wash_outlined
-    local_convenience_store = local_convenience_store_outlined
-    local_dining = local_dining_outlined
-    local_drink = local_drink_outlined
-    local_fire_department = local_fire_department_outlined
-    local_florist = local_florist_outlined
-    local_gas_station = local_gas_station_outlined
-    local_grocery_store = local_grocery_store_outlined
-    local_hospital = local_hospital_outlined
-    local_hotel = local_hotel_outlined
-    local_laundry_service = local_laundry_service_outlined
-    local_library = local_library_outlined
-    local_mall = local_mall_outlined
-    local_movies = local_movies_outlined
-    local_offer = local_offer_outlined
-    local_parking = local_parking_outlined
-    local_pharmacy = local_pharmacy_outlined
-    local_phone = local_phone_outlined
-    local_pizza = local_pizza_outlined
-    local_play = local_play_outlined
-    local_police = local_police_outlined
-    local_post_office = local_post_office_outlined
-    local_printshop = local_printshop_outlined
-    local_see = local_see_outlined
-    local_shipping = local_shipping_outlined
-    local_taxi = local_taxi_outlined
-    location_automation = location_automation_outlined
-    location_away = location_away_outlined
-    location_chip = location_chip_outlined
-    location_city = location_city_outlined
-    location_disabled = location_disabled_outlined
-    location_home = location_home_outlined
-    location_off = location_off_outlined
-    location_on = location_on_outlined
-    location_pin = location_pin_outlined
-    location_searching = location_searching_outlined
-    locator_tag = locator_tag_outlined
-    lock = lock_outlined
-    lock_clock = lock_clock_outlined
-    lock_open = lock_open_outlined
-    lock_open_circle = lock_open_circle_outlined
-    lock_open_right = lock_open_right_outlined
-    lock_outline = lock_outline_outlined
-    lock_person = lock_person_outlined
-    lock_reset = lock_reset_outlined
-    login = login_outlined
-    logo_dev = logo_dev_outlined
-    logout = logout_outlined
-    looks = looks_outlined
-    looks_3 = looks_3_outlined
-    looks_4 = looks_4_outlined
-    looks_5 = looks_5_outlined
-    looks_6 = looks_6_outlined
-    looks_one = looks_one_outlined
-    looks_two = looks_two_outlined
-    loop = loop_outlined
-    loupe = loupe_outlined
-    low_density = low_density_outlined
-    low_priority = low_priority_outlined
-    lowercase = lowercase_outlined
-    loyalty = loyalty_outlined
-    lte_mobiledata = lte_mobiledata_outlined
-    lte_mobiledata_badge = lte_mobiledata_badge_outlined
-    lte_plus_mobiledata = lte_plus_mobiledata_outlined
-    lte_plus_mobiledata_badge = lte_plus_mobiledata_badge_outlined
-    luggage = luggage_outlined
-    lunch_dining = lunch_dining_outlined
-    lyrics = lyrics_outlined
-    macro_auto = macro_auto_outlined
-    macro_off = macro_off_outlined
-    magic_button = magic_button_outlined
-    magic_exchange = magic_exchange_outlined
-    magic_tether = magic_tether_outlined
-    magnification_large = magnification_large_outlined
-    magnification_small = magnification_small_outlined
-    magnify_docked = magnify_docked_outlined
-    magnify_fullscreen = magnify_fullscreen_outlined
-    mail = mail_outlined
-    mail_lock = mail_lock_outlined
-    mail_off = mail_off_outlined
-    mail_outline = mail_outline_outlined
-    male = male_outlined
-    man = man_outlined
-    man_2 = man_2_outlined
-    man_3 = man_3_outlined
-    man_4 = man_4_outlined
-    manage_accounts = manage_accounts_outlined
-    manage_history = manage_history_outlined
-    manage_search = manage_search_outlined
-    manga = manga_outlined
-    manufacturing = manufacturing_outlined
-    map = map_outlined
-    map_search = map_search_outlined
-    maps_home_work = maps_home_work_outlined
-    maps_ugc = maps_ugc_outlined
-    margin = margin_outlined
-    mark_as_unread = mark_as_unread_outlined
-    mark_chat_read = mark_chat_read_outlined
-    mark_chat_unread = mark_chat_unread_outlined
-    mark_email_read = mark_email_read_outlined
-    mark_email_unread = mark_email_unread_outlined
-    mark_unread_chat_alt = mark_unread_chat_alt_outlined
-    markdown = markdown_outlined
-    markdown_copy = markdown_copy_outlined
-    markdown_paste = markdown_paste_outlined
-    markunread = markunread_outlined
-    markunread_mailbox = markunread_mailbox_outlined
-    masked_transitions = masked_transitions_outlined
-    masked_transitions_add = masked_transitions_add_outlined
-    masks = masks_outlined
-    match_case = match_case_outlined
-    match_case_off = match_case_off_outlined
-    match_word = match_word_outlined
-    matter = matter_outlined
-    maximize = maximize_outlined
-    measuring_tape = measuring_tape_outlined
-    media_bluetooth_off = media_bluetooth_off_outlined
-    media_bluetooth_on = media_bluetooth_on_outlined
-    media_link = media_link_outlined
-    media_output = media_output_outlined
-    media_output_off = media_output_off_outlined
-    mediation = mediation_outlined
-    medical_information = medical_information_outlined
-    medical_mask = medical_mask_outlined
-    medical_services = medical_services_outlined
-    medication = medication_outlined
-    medication_liquid = medication_liquid_outlined
-    meeting_room = meeting_room_outlined
-    memory = memory_outlined
-    memory_alt = memory_alt_outlined
-    menstrual_health = menstrual_health_outlined
-    menu = menu_outlined
-    menu_book = menu_book_outlined
-    menu_open = menu_open_outlined
-    merge = merge_outlined
-    merge_type = merge_type_outlined
-    message = message_outlined
-    metabolism = metabolism_outlined
-    metro = metro_outlined
-    mfg_nest_yale_lock = mfg_nest_yale_lock_outlined
-    mic = mic_outlined
-    mic_alert = mic_alert_outlined
-    mic_double = mic_double_outlined
-    mic_external_off = mic_external_off_outlined
-    mic_external_on = mic_external_on_outlined
-    mic_none = mic_none_outlined
-    mic_off = mic_off_outlined
-    microbiology = microbiology_outlined
-    microwave = microwave_outlined
-    microwave_gen = microwave_gen_outlined
-    military_tech = military_tech_outlined
-    mimo = mimo_outlined
-    mimo_disconnect = mimo_disconnect_outlined
-    mindfulness = mindfulness_outlined
-    minimize = minimize_outlined
-    minor_crash = minor_crash_outlined
-    mintmark = mintmark_outlined
-    missed_video_call = missed_video_call_outlined
-    missed_video_call_filled = missed_video_call_filled_outlined
-    missing_controller = missing_controller_outlined
-    mist = mist_outlined
-    mitre = mitre_outlined
-    mixture_med = mixture_med_outlined
-    mms = mms_outlined
-    mobile_friendly = mobile_friendly_outlined
-    mobile_hand = mobile_hand_outlined
-    mobile_hand_left = mobile_hand_left_outlined
-    mobile_hand_left_off = mobile_hand_left_off_outlined
-    mobile_hand_off = mobile_hand_off_outlined
-    mobile_loupe = mobile_loupe_outlined
-    mobile_off = mobile_off_outlined
-    mobile_screen_share = mobile_screen_share_outlined
-    mobile_screensaver = mobile_screensaver_outlined
-    mobile_sound_2 = mobile_sound_2_outlined
-    mobile_speaker = mobile_speaker_outlined
-    mobiledata_off = mobiledata_off_outlined
-    mode = mode_outlined
-    mode_comment = mode_comment_outlined
-    mode_cool = mode_cool_outlined
-    mode_cool_off = mode_cool_off_outlined
-    mode_dual = mode_dual_outlined
-    mode_edit = mode_edit_outlined
-    mode_edit_outline = mode_edit_outline_outlined
-    mode_fan = mode_fan_outlined
-    mode_fan_off = mode_fan_off_outlined
-    mode_heat = mode_heat_outlined
-    mode_heat_cool = mode_heat_cool_outlined
-    mode_heat_off = mode_heat_off_outlined
-    mode_night = mode_night_outlined
-    mode_of_travel = mode_of_travel_outlined
-    mode_off_on = mode_off_on_outlined
-    mode_standby = mode_standby_outlined
-    model_training = model_training_outlined
-    modeling = modeling_outlined
-    monetization_on = monetization_on_outlined
-    money = money_outlined
-    money_bag = money_bag_outlined
-    money_off = money_off_outlined
-    money_off_csred = money_off_csred_outlined
-    monitor = monitor_outlined
-    monitor_heart = monitor_heart_outlined
-    monitor_weight = monitor_weight_outlined
-    monitor_weight_gain = monitor_weight_gain_outlined
-    monitor_weight_loss = monitor_weight_loss_outlined
-    monitoring = monitoring_outlined
-    monochrome_photos = monochrome_photos_outlined
-    monorail = monorail_outlined
-    mood = mood_outlined
-    mood_bad = mood_bad_outlined
-    moon_stars = moon_stars_outlined
-    mop = mop_outlined
-    moped = moped_outlined
-    more = more_outlined
-    more_down = more_down_outlined
-    more_horiz = more_horiz_outlined
-    more_time = more_time_outlined
-    more_up = more_up_outlined
-    more_vert = more_vert_outlined
-    mosque = mosque_outlined
-    motion_blur = motion_blur_outlined
-    motion_mode = motion_mode_outlined
-    motion_photos_auto = motion_photos_auto_outlined
-    motion_photos_off = motion_photos_off_outlined
-    motion_photos_on = motion_photos_on_outlined
-    motion_photos_pause = motion_photos_pause_outlined
-    motion_photos_paused = motion_photos_paused_outlined
-    motion_play = motion_play_outlined
-    motion_sensor_active = motion_sensor_active_outlined
-    motion_sensor_alert = motion_sensor_alert_outlined
-    motion_sensor_idle = motion_sensor_idle_outlined
-    motion_sensor_urgent = motion_sensor_urgent_outlined
-    motorcycle = motorcycle_outlined
-    mountain_flag = mountain_flag_outlined
-    mouse = mouse_outlined
-    mouse_lock = mouse_lock_outlined
-    mouse_lock_off = mouse_lock_off_outlined
-    move = move_outlined
-    move_down = move_down_outlined
-    move_group = move_group_outlined
-    move_item = move_item_outlined
-    move_location = move_location_outlined
-    move_selection_down = move_selection_down_outlined
-    move_selection_left = move_selection_left_outlined
-    move_selection_right = move_selection_right_outlined
-    move_selection_up = move_selection_up_outlined
-    move_to_inbox = move_to_inbox_outlined
-    move_up = move_up_outlined
-    moved_location = moved_location_outlined
-    movie = movie_outlined
-    movie_creation = movie_creation_outlined
-    movie_edit = movie_edit_outlined
-    movie_filter = movie_filter_outlined
-    movie_info = movie_info_outlined
-    movie_off = movie_off_outlined
-    moving = moving_outlined
-    moving_beds = moving_beds_outlined
-    moving_ministry = moving_ministry_outlined
-    mp = mp_outlined
-    multicooker = multicooker_outlined
-    multiline_chart = multiline_chart_outlined
-    multimodal_hand_eye = multimodal_hand_eye_outlined
-    multiple_airports = multiple_airports_outlined
-    multiple_stop = multiple_stop_outlined
-    museum = museum_outlined
-    music_cast = music_cast_outlined
-    music_note = music_note_outlined
-    music_note_add = music_note_add_outlined
-    music_off = music_off_outlined
-    music_video = music_video_outlined
-    my_location = my_location_outlined
-    mystery = mystery_outlined
-    nat = nat_outlined
-    nature = nature_outlined
-    nature_people = nature_people_outlined
-    navigate_before = navigate_before_outlined
-    navigate_next = navigate_next_outlined
-    navigation = navigation_outlined
-    near_me = near_me_outlined
-    near_me_disabled = near_me_disabled_outlined
-    nearby = nearby_outlined
-    nearby_error = nearby_error_outlined
-    nearby_off = nearby_off_outlined
-    nephrology = nephrology_outlined
-    nest_audio = nest_audio_outlined
-    nest_cam_floodlight = nest_cam_floodlight_outlined
-    nest_cam_indoor = nest_cam_indoor_outlined
-    nest_cam_iq = nest_cam_iq_outlined
-    nest_cam_iq_outdoor = nest_cam_iq_outdoor_outlined
-    nest_cam_magnet_mount = nest_cam_magnet_mount_outlined
-    nest_cam_outdoor = nest_cam_outdoor_outlined
-    nest_cam_stand = nest_cam_stand_outlined
-    nest_cam_wall_mount = nest_cam_wall_mount_outlined
-    nest_cam_wired_stand = nest_cam_wired_stand_outlined
-    nest_clock_farsight_analog = nest_clock_farsight_analog_outlined
-    nest_clock_farsight_digital = nest_clock_farsight_digital_outlined
-    nest_connect = nest_connect_outlined
-    nest_detect = nest_detect_outlined
-    nest_display = nest_display_outlined
-    nest_display_max = nest_display_max_outlined
-    nest_doorbell_visitor = nest_doorbell_visitor_outlined
-    nest_eco_leaf = nest_eco_leaf_outlined
-    nest_farsight_weather = nest_farsight_weather_outlined
-    nest_found_savings = nest_found_savings_outlined
-    nest_gale_wifi = nest_gale_wifi_outlined
-    nest_heat_link_e = nest_heat_link_e_outlined
-    nest_heat_link_gen_3 = nest_heat_link_gen_3_outlined
-    nest_hello_doorbell = nest_hello_doorbell_outlined
-    nest_locator_tag = nest_locator_tag_outlined
-    nest_mini = nest_mini_outlined
-    nest_multi_room = nest_multi_room_outlined
-    nest_protect = nest_protect_outlined
-    nest_remote = nest_remote_outlined
-    nest_remote_comfort_sensor = nest_remote_comfort_sensor_outlined
-    nest_secure_alarm = nest_secure_alarm_outlined
-    nest_sunblock = nest_sunblock_outlined
-    nest_tag = nest_tag_outlined
-    nest_thermostat = nest_thermostat_outlined
-    nest_thermostat_e_eu = nest_thermostat_e_eu_outlined
-    nest_thermostat_gen_3 = nest_thermostat_gen_3_outlined
-    nest_thermostat_sensor = nest_thermostat_sensor_outlined
-    nest_thermostat_sensor_eu = nest_thermostat_sensor_eu_outlined
-    nest_thermostat_zirconium_eu = nest_thermostat_zirconium_eu_outlined
-    nest_true_radiant = nest_true_radiant_outlined
-    nest_wake_on_approach = nest_wake_on_approach_outlined
-    nest_wake_on_press = nest_wake_on_press_outlined
-    nest_wifi_gale = nest_wifi_gale_outlined
-    nest_wifi_mistral = nest_wifi_mistral_outlined
-    nest_wifi_point = nest_wifi_point_outlined
-    nest_wifi_point_vento = nest_wifi_point_vento_outlined
-    nest_wifi_pro = nest_wifi_pro_outlined
-    nest_wifi_pro_2 = nest_wifi_pro_2_outlined
-    nest_wifi_router = nest_wifi_router_outlined
-    network_cell = network_cell_outlined
-    network_check = network_check_outlined
-    network_intel_node = network_intel_node_outlined
-    network_intelligence = network_intelligence_outlined
-    network_intelligence_history = network_intelligence_history_outlined
-    network_intelligence_update = network_intelligence_update_outlined
-    network_locked = network_locked_outlined
-    network_manage = network_manage_outlined
-    network_node = network_node_outlined
-    network_ping = network_ping_outlined
-    network_wifi = network_wifi_outlined
-    network_wifi_1_bar = network_wifi_1_bar_outlined
-    network_wifi_1_bar_locked = network_wifi_1_bar_locked_outlined
-    network_wifi_2_bar = network_wifi_2_bar_outlined
-    network_wifi_2_bar_locked = network_wifi_2_bar_locked_outlined
-    network_wifi_3_bar = network_wifi_3_bar_outlined
-    network_wifi_3_bar_locked = network_wifi_3_bar_locked_outlined
-    network_wifi_locked = network_wifi_locked_outlined
-    neurology = neurology_outlined
-    new_label = new_label_outlined
-    new_releases = new_releases_outlined
-    new_window = new_window_outlined
-    news = news_outlined
-    newsmode = newsmode_outlined
-    newspaper = newspaper_outlined
-    newsstand = newsstand_outlined
-    next_plan = next_plan_outlined
-    next_week = next_week_outlined
-    nfc = nfc_outlined
-    nfc_off = nfc_off_outlined
-    night_shelter = night_shelter_outlined
-    night_sight_auto = night_sight_auto_outlined
-    night_sight_auto_off = night_sight_auto_off_outlined
-    night_sight_max = night_sight_max_outlined
-    nightlife = nightlife_outlined
-    nightlight = nightlight_outlined
-    nightlight_round = nightlight_round_outlined
-    nights_stay = nights_stay_outlined
-    no_accounts = no_accounts_outlined
-    no_adult_content = no_adult_content_outlined
-    no_backpack = no_backpack_outlined
-    no_crash = no_crash_outlined
-    no_drinks = no_drinks_outlined
-    no_encryption = no_encryption_outlined
-    no_encryption_gmailerrorred = no_encryption_gmailerrorred_outlined
-    no_flash = no_flash_outlined
-    no_food = no_food_outlined
-    no_luggage = no_luggage_outlined
-    no_meals = no_meals_outlined
-    no_meeting_room = no_meeting_room_outlined
-    no_photography = no_photography_outlined
-    no_sim = no_sim_outlined
-    no_sound = no_sound_outlined
-    no_stroller = no_stroller_outlined
-    no_transfer = no_transfer_outlined
-    noise_aware = noise_aware_outlined
-    noise_control_off = noise_control_off_outlined
-    noise_control_on = noise_control_on_outlined
-    nordic_walking = nordic_walking_outlined
-    north = north_outlined
-    north_east = north_east_outlined
-    north_west = north_west_outlined
-    not_accessible = not_accessible_outlined
-    not_accessible_forward = not_accessible_forward_outlined
-    not_interested = not_interested_outlined
-    not_listed_location = not_listed_location_outlined
-    not_started = not_started_outlined
-    note = note_outlined
-    note_add = note_add_outlined
-    note_alt = note_alt_outlined
-    note_stack = note_stack_outlined
-    note_stack_add = note_stack_add_outlined
-    notes = notes_outlined
-    notification_add = notification_add_outlined
-    notification_important = notification_important_outlined
-    notification_multiple = notification_multiple_outlined
-    notification_settings = notification_settings_outlined
-    notification_sound = notification_sound_outlined
-    notifications = notifications_outlined
-    notifications_active = notifications_active_outlined
-    notifications_none = notifications_none_outlined
-    notifications_off = notifications_off_outlined
-    notifications_paused = notifications_paused_outlined
-    notifications_unread = notifications_unread_outlined
-    numbers = numbers_outlined
-    nutrition = nutrition_outlined
-    ods = ods_outlined
-    odt = odt_outlined
-    offline_bolt = offline_bolt_outlined
-    offline_pin = offline_pin_outlined
-    offline_pin_off = offline_pin_off_outlined
-    offline_share = offline_share_outlined
-    oil_barrel = oil_barrel_outlined
-    on_device_training = on_device_training_outlined
-    on_hub_device = on_hub_device_outlined
-    oncology = oncology_outlined
-    ondemand_video = ondemand_video_outlined
-    online_prediction = online_prediction_outlined
-    onsen = onsen_outlined
-    opacity = opacity_outlined
-    open_in_browser = open_in_browser_outlined
-    open_in_full = open_in_full_outlined
-    open_in_new = open_in_new_outlined
-    open_in_new_down = open_in_new_down_outlined
-    open_in_new_off = open_in_new_off_outlined
-    open_in_phone = open_in_phone_outlined
-    open_jam = open_jam_outlined
-    open_run = open_run_outlined
-    open_with = open_with_outlined
-    ophthalmology = ophthalmology_outlined
-    oral_disease = oral_disease_outlined
-    orbit = orbit_outlined
-    order_approve = order_approve_outlined
-    order_play = order_play_outlined
-    orders = orders_outlined
-    orthopedics = orthopedics_outlined
-    other_admission = other_admission_outlined
-    other_houses = other_houses_outlined
-    outbound = outbound_outlined
-    outbox = outbox_outlined
-    outbox_alt = outbox_alt_outlined
-    outdoor_garden = outdoor_garden_outlined
-    outdoor_grill = outdoor_grill_outlined
-    outgoing_mail = outgoing_mail_outlined
-    outlet = outlet_outlined
-    outlined_flag = outlined_flag_outlined
-    outpatient = outpatient_outlined
-    outpatient_med = outpatient_med_outlined
-    output = output_outlined
-    output_circle = output_circle_outlined
-    oven = oven_outlined
-    oven_gen = oven_gen_outlined
-    overview = overview_outlined
-    overview_key = overview_key_outlined
-    owl = owl_outlined
-    oxygen_saturation = oxygen_saturation_outlined
-    p2p = p2p_outlined
-    pace = pace_outlined
-    pacemaker = pacemaker_outlined
-    package = package_outlined
-    package_2 = package_2_outlined
-    padding = padding_outlined
-    page_control = page_control_outlined
-    page_footer = page_footer_outlined
-    page_header = page_header_outlined
-    page_info = page_info_outlined
-    pageless = pageless_outlined
-    pages = pages_outlined
-    pageview = pageview_outlined
-    paid = paid_outlined
-    palette = palette_outlined
-    pallet = pallet_outlined
-    pan_tool = pan_tool_outlined
-    pan_tool_alt = pan_tool_alt_outlined
-    pan_zoom = pan_zoom_outlined
-    panorama = panorama_outlined
-    panorama_fish_eye = panorama_fish_eye_outlined
-    panorama_horizontal = panorama_horizontal_outlined
-    panorama_photosphere = panorama_photosphere_outlined
-    panorama_vertical = panorama_vertical_outlined
-    panorama_wide_angle = panorama_wide_angle_outlined
-    paragliding = paragliding_outlined
-    park = park_outlined
-    partly_cloudy_day = partly_cloudy_day_outlined
-    partly_cloudy_night = partly_cloudy_night_outlined
-    partner_exchange = partner_exchange_outlined
-    partner_reports = partner_reports_outlined
-    party_mode = party_mode_outlined
-    passkey = passkey_outlined
-    password = password_outlined
-    password_2 = password_2_outlined
-    password_2_off = password_2_off_outlined
-    patient_list = patient_list_outlined
-    pattern = pattern_outlined
-    pause = pause_outlined
-    pause_circle = pause_circle_outlined
-    pause_circle_filled = pause_circle_filled_outlined
-    pause_circle_outline = pause_circle_outline_outlined
-    pause_presentation = pause_presentation_outlined
-    payment = payment_outlined
-    payments = payments_outlined
-    pedal_bike = pedal_bike_outlined
-    pediatrics = pediatrics_outlined
-    pen_size_1 = pen_size_1_outlined
-    pen_size_2 = pen_size_2_outlined
-    pen_size_3 = pen_size_3_outlined
-    pen_size_4 = pen_size_4_outlined
-    pen_size_5 = pen_size_5_outlined
-    pending = pending_outlined
-    pending_actions = pending_actions_outlined
-    pentagon = pentagon_outlined
-    people = people_outlined
-    people_alt = people_alt_outlined
-    people_outline = people_outline_outlined
-    percent = percent_outlined
-    performance_max = performance_max_outlined
-    pergola = pergola_outlined
-    perm_camera_mic = perm_camera_mic_outlined
-    perm_contact_calendar = perm_contact_calendar_outlined
-    perm_data_setting = perm_data_setting_outlined
-    perm_device_information = perm_device_information_outlined
-    perm_identity = perm_identity_outlined
-    perm_media = perm_media_outlined
-    perm_phone_msg = perm_phone_msg_outlined
-    perm_scan_wifi = perm_scan_wifi_outlined
-    person = person_outlined
-    person_2 = person_2_outlined
-    person_3 = person_3_outlined
-    person_4 = person_4_outlined
-    person_add = person_add_outlined
-    person_add_alt = person_add_alt_outlined
-    person_add_disabled = person_add_disabled_outlined
-    person_alert = person_alert_outlined
-    person_apron = person_apron_outlined
-    person_book = person_book_outlined
-    person_cancel = person_cancel_outlined
-    person_celebrate = person_celebrate_outlined
-    person_check = person_check_outlined
-    person_edit = person_edit_outlined
-    person_filled = person_filled_outlined
-    person_off = person_off_outlined
-    person_outline = person_outline_outlined
-    person_pin = person_pin_outlined
-    person_pin_circle = person_pin_circle_outlined
-    person_play = person_play_outlined
-    person_raised_hand = person_raised_hand_outlined
-    person_remove = person_remove_outlined
-    person_search = person_search_outlined
-    person_shield = person_shield_outlined
-    personal_bag = personal_bag_outlined
-    personal_bag_off = personal_bag_off_outlined
-    personal_bag_question = personal_bag_question_outlined
-    personal_injury = personal_injury_outlined
-    personal_places = personal_places_outlined
-    personal_video = personal_video_outlined
-    pest_control = pest_control_outlined
-    pest_control_rodent = pest_control_rodent_outlined
-    pet_supplies = pet_supplies_outlined
-    pets = pets_outlined
-    phishing = phishing_outlined
-    phone = phone_outlined
-    phone_alt = phone_alt_outlined
-    phone_android = phone_android_outlined
-    phone_bluetooth_speaker = phone_bluetooth_speaker_outlined
-    phone_callback = phone_callback_outlined
-    phone_disabled = phone_disabled_outlined
-    phone_enabled = phone_enabled_outlined
-    phone_forwarded = phone_forwarded_outlined
-    phone_in_talk = phone_in_talk_outlined
-    phone_iphone = phone_iphone_outlined
-    phone_locked = phone_locked_outlined
-    phone_missed = phone_missed_outlined
-    phone_paused = phone_paused_outlined
-    phonelink = phonelink_outlined
-    phonelink_erase = phonelink_erase_outlined
-    phonelink_lock = phonelink_lock_outlined
-    phonelink_off = phonelink_off_outlined
-    phonelink_ring = phonelink_ring_outlined
-    phonelink_ring_off = phonelink_ring_off_outlined
-    phonelink_setup = phonelink_setup_outlined
-    photo = photo_outlined
-    photo_album = photo_album_outlined
-    photo_auto_merge = photo_auto_merge_outlined
-    photo_camera = photo_camera_outlined
-    photo_camera_back = photo_camera_back_outlined
-    photo_camera_front = photo_camera_front_outlined
-    photo_filter = photo_filter_outlined
-    photo_frame = photo_frame_outlined
-    photo_library = photo_library_outlined
-    photo_prints = photo_prints_outlined
-    photo_size_select_actual = photo_size_select_actual_outlined
-    photo_size_select_large = photo_size_select_large_outlined
-    photo_size_select_small = photo_size_select_small_outlined
-    php = php_outlined
-    physical_therapy = physical_therapy_outlined
-    piano = piano_outlined
-    piano_off = piano_off_outlined
-    picture_as_pdf = picture_as_pdf_outlined
-    picture_in_picture = picture_in_picture_outlined
-    picture_in_picture_alt = picture_in_picture_alt_outlined
-    picture_in_picture_center = picture_in_picture_center_outlined
-    picture_in_picture_large = picture_in_picture_large_outlined
-    picture_in_picture_medium = picture_in_picture_medium_outlined
-    picture_in_picture_mobile = picture_in_picture_mobile_outlined
-    picture_in_picture_off = picture_in_picture_off_outlined
-    picture_in_picture_small = picture_in_picture_small_outlined
-    pie_chart = pie_chart_outlined
-    pie_chart_filled = pie_chart_filled_outlined
-    pie_chart_outline = pie_chart_outline_outlined
-    pie_chart_outlined = pie_chart_outlined_outlined
-    pill = pill_outlined
-    pill_off = pill_off_outlined
-    pin = pin_outlined
-    pin_drop = pin_drop_outlined
-    pin_end = pin_end_outlined
-    pin_invoke = pin_invoke_outlined
-    pinboard = pinboard_outlined
-    pinboard_unread = pinboard_unread_outlined
-    pinch = pinch_outlined
-    pinch_zoom_in = pinch_zoom_in_outlined
-    pinch_zoom_out = pinch_zoom_out_outlined
-    pip = pip_outlined
-    pip_exit = pip_exit_outlined
-    pivot_table_chart = pivot_table_chart_outlined
-    place = place_outlined
-    place_item = place_item_outlined
-    plagiarism = plagiarism_outlined
-    planet = planet_outlined
-    planner_banner_ad_pt = planner_banner_ad_pt_outlined
-    planner_review = planner_review_outlined
-    play_arrow = play_arrow_outlined
-    play_circle = play_circle_outlined
-    play_disabled = play_disabled_outlined
-    play_for_work = play_for_work_outlined
-    play_lesson = play_lesson_outlined
-    play_music = play_music_outlined
-    play_pause = play_pause_outlined
-    play_shapes = play_shapes_outlined
-    playing_cards = playing_cards_outlined
-    playlist_add = playlist_add_outlined
-    playlist_add_check = playlist_add_check_outlined
-    playlist_add_check_circle = playlist_add_check_circle_outlined
-    playlist_add_circle = playlist_add_circle_outlined
-    playlist_play = playlist_play_outlined
-    playlist_remove = playlist_remove_outlined
-    plug_connect = plug_connect_outlined
-    plumbing = plumbing_outlined
-    plus_one = plus_one_outlined
-    podcasts = podcasts_outlined
-    podiatry = podiatry_outlined
-    podium = podium_outlined
-    point_of_sale = point_of_sale_outlined
-    point_scan = point_scan_outlined
-    poker_chip = poker_chip_outlined
-    policy = policy_outlined
-    policy_alert = policy_alert_outlined
-    poll = poll_outlined
-    polyline = polyline_outlined
-    polymer = polymer_outlined
-    pool = pool_outlined
-    portable_wifi_off = portable_wifi_off_outlined
-    portrait = portrait_outlined
-    position_bottom_left = position_bottom_left_outlined
-    position_bottom_right = position_bottom_right_outlined
-    position_top_right = position_top_right_outlined
-    post = post_outlined
-    post_add = post_add_outlined
-    potted_plant = potted_plant_outlined
-    power = power_outlined
-    power_input = power_input_outlined
-    power_off = power_off_outlined
-    power_rounded = power_rounded_outlined
-    power_settings_circle = power_settings_circle_outlined
-    power_settings_new = power_settings_new_outlined
-    prayer_times = prayer_times_outlined
-    precision_manufacturing = precision_manufacturing_outlined
-    pregnancy = pregnancy_outlined
-    pregnant_woman = pregnant_woman_outlined
-    preliminary = preliminary_outlined
-    prescriptions = prescriptions_outlined
-    present_to_all = present_to_all_outlined
-    preview = preview_outlined
-    preview_off = preview_off_outlined
-    price_change = price_change_outlined
-    price_check = price_check_outlined
-    print = print_outlined
-    print_add = print_add_outlined
-    print_connect = print_connect_outlined
-    print_disabled = print_disabled_outlined
-    print_error = print_error_outlined
-    print_lock = print_lock_outlined
-    priority = priority_outlined
-    priority_high = priority_high_outlined
-    privacy = privacy_outlined
-    privacy_tip = privacy_tip_outlined
-    private_connectivity = private_connectivity_outlined
-    problem = problem_outlined
-    procedure = procedure_outlined
-    process_chart = process_chart_outlined
-    production_quantity_limits = production_quantity_limits_outlined
-    productivity = productivity_outlined
-    progress_activity = progress_activity_outlined
-    prompt_suggestion = prompt_suggestion_outlined
-    propane = propane_outlined
-    propane_tank = propane_tank_outlined
-    psychiatry = psychiatry_outlined
-    psychology = psychology_outlined
-    psychology_alt = psychology_alt_outlined
-    public = public_outlined
-    public_off = public_off_outlined
-    publish = publish_outlined
-    published_with_changes = published_with_changes_outlined
-    pulmonology = pulmonology_outlined
-    pulse_alert = pulse_alert_outlined
-    punch_clock = punch_clock_outlined
-    push_pin = push_pin_outlined
-    qr_code = qr_code_outlined
-    qr_code_2 = qr_code_2_outlined
-    qr_code_2_add = qr_code_2_add_outlined
-    qr_code_scanner = qr_code_scanner_outlined
-    query_builder = query_builder_outlined
-    query_stats = query_stats_outlined
-    question_answer = question_answer_outlined
-    question_exchange = question_exchange_outlined
-    question_mark = question_mark_outlined
-    queue = queue_outlined
-    queue_music = queue_music_outlined
-    queue_play_next = queue_play_next_outlined
-    quick_phrases = quick_phrases_outlined
-    quick_reference = quick_reference_outlined
-    quick_reference_all = quick_reference_all_outlined
-    quick_reorder = quick_reorder_outlined
-    quickreply = quickreply_outlined
-    quiet_time = quiet_time_outlined
-    quiet_time_active = quiet_time_active_outlined
-    quiz = quiz_outlined
-    r_mobiledata = r_mobiledata_outlined
-    radar = radar_outlined
-    radio = radio_outlined
-    radio_button_checked = radio_button_checked_outlined
-    radio_button_partial = radio_button_partial_outlined
-    radio_button_unchecked = radio_button_unchecked_outlined
-    radiology = radiology_outlined
-    railway_alert = railway_alert_outlined
-    railway_alert_2 = railway_alert_2_outlined
-    rainy = rainy_outlined
-    rainy_heavy = rainy_heavy_outlined
-    rainy_light = rainy_light_outlined
-    rainy_snow = rainy_snow_outlined
-    ramen_dining = ramen_dining_outlined
-    ramp_left = ramp_left_outlined
-    ramp_right = ramp_right_outlined
-    range_hood = range_hood_outlined
-    rate_review = rate_review_outlined
-    rate_review_rtl = rate_review_rtl_outlined
-    raven = raven_outlined
-    raw_off = raw_off_outlined
-    raw_on = raw_on_outlined
-    read_more = read_more_outlined
-    readiness_score = readiness_score_outlined
-    real_estate_agent = real_estate_agent_outlined
-    rear_camera = rear_camera_outlined
-    rebase = rebase_outlined
-    rebase_edit = rebase_edit_outlined
-    receipt = receipt_outlined
-    receipt_long = receipt_long_outlined
-    receipt_long_off = receipt_long_off_outlined
-    recent_actors = recent_actors_outlined
-    recent_patient = recent_patient_outlined
-    recenter = recenter_outlined
-    recommend = recommend_outlined
-    record_voice_over = record_voice_over_outlined
-    rectangle = rectangle_outlined
-    recycling = recycling_outlined
-    redeem = redeem_outlined
-    redo = redo_outlined
-    reduce_capacity = reduce_capacity_outlined
-    refresh = refresh_outlined
-    regular_expression = regular_expression_outlined
-    relax = relax_outlined
-    release_alert = release_alert_outlined
-    remember_me = remember_me_outlined
-    reminder = reminder_outlined
-    reminders_alt = reminders_alt_outlined
-    remote_gen = remote_gen_outlined
-    remove = remove_outlined
-    remove_circle = remove_circle_outlined
-    remove_circle_outline = remove_circle_outline_outlined
-    remove_done = remove_done_outlined
-    remove_from_queue = remove_from_queue_outlined
-    remove_moderator = remove_moderator_outlined
-    remove_red_eye = remove_red_eye_outlined
-    remove_road = remove_road_outlined
-    remove_selection = remove_selection_outlined
-    remove_shopping_cart = remove_shopping_cart_outlined
-    reopen_window = reopen_window_outlined
-    reorder = reorder_outlined
-    repartition = repartition_outlined
-    repeat = repeat_outlined
-    repeat_on = repeat_on_outlined
-    repeat_one = repeat_one_outlined
-    repeat_one_on = repeat_one_on_outlined
-    replace_audio = replace_audio_outlined
-    replace_image = replace_image_outlined
-    replace_video = replace_video_outlined
-    replay = replay_outlined
-    replay_10 = replay_10_outlined
-    replay_30 = replay_30_outlined
-    replay_5 = replay_5_outlined
-    replay_circle_filled = replay_circle_filled_outlined
-    reply = reply_outlined
-    reply_all = reply_all_outlined
-    report = report_outlined
-    report_gmailerrorred = report_gmailerrorred_outlined
-    report_off = report_off_outlined
-    report_problem = report_problem_outlined
-    request_page = request_page_outlined
-    request_quote = request_quote_outlined
-    reset_brightness = reset_brightness_outlined
-    reset_focus = reset_focus_outlined
-    reset_image = reset_image_outlined
-    reset_iso = reset_iso_outlined
-    reset_settings = reset_settings_outlined
-    reset_shadow = reset_shadow_outlined
-    reset_shutter_speed = reset_shutter_speed_outlined
-    reset_tv = reset_tv_outlined
-    reset_white_balance = reset_white_balance_outlined
-    reset_wrench = reset_wrench_outlined
-    resize = resize_outlined
-    respiratory_rate = respiratory_rate_outlined
-    responsive_layout = responsive_layout_outlined
-    restart_alt = restart_alt_outlined
-    restaurant = restaurant_outlined
-    restaurant_menu = restaurant_menu_outlined
-    restore = restore_outlined
-    restore_from_trash = restore_from_trash_outlined
-    restore_page = restore_page_outlined
-    resume = resume_outlined
-    reviews = reviews_outlined
-    rewarded_ads = rewarded_ads_outlined
-    rheumatology = rheumatology_outlined
-    rib_cage = rib_cage_outlined
-    rice_bowl = rice_bowl_outlined
-    right_click = right_click_outlined
-    right_panel_close = right_panel_close_outlined
-    right_panel_open = right_panel_open_outlined
-    ring_volume = ring_volume_outlined
-    ring_volume_filled = ring_volume_filled_outlined
-    ripples = ripples_outlined
-    road = road_outlined
-    robot = robot_outlined
-    robot_2 = robot_2_outlined
-    rocket = rocket_outlined
-    rocket_launch = rocket_launch_outlined
-    roller_shades = roller_shades_outlined
-    roller_shades_closed = roller_shades_closed_outlined
-    roller_skating = roller_skating_outlined
-    roofing = roofing_outlined
-    room = room_outlined
-    room_preferences = room_preferences_outlined
-    room_service = room_service_outlined
-    rotate_90_degrees_ccw = rotate_90_degrees_ccw_outlined
-    rotate_90_degrees_cw = rotate_90_degrees_cw_outlined
-    rotate_auto = rotate_auto_outlined
-    rotate_left = rotate_left_outlined
-    rotate_right = rotate_right_outlined
-    roundabout_left = roundabout_left_outlined
-    roundabout_right = roundabout_right_outlined
-    rounded_corner = rounded_corner_outlined
-    route = route_outlined
-    router = router_outlined
-    router_off = router_off_outlined
-    routine = routine_outlined
-    rowing = rowing_outlined
-    rss_feed = rss_feed_outlined
-    rsvp = rsvp_outlined
-    rtt = rtt_outlined
-    rubric = rubric_outlined
-    rule = rule_outlined
-    rule_folder = rule_folder_outlined
-    rule_settings = rule_settings_outlined
-    run_circle = run_circle_outlined
-    running_with_errors = running_with_errors_outlined
-    rv_hookup = rv_hookup_outlined
-    safety_check = safety_check_outlined
-    safety_check_off = safety_check_off_outlined
-    safety_divider = safety_divider_outlined
-    sailing = sailing_outlined
-    salinity = salinity_outlined
-    sanitizer = sanitizer_outlined
-    satellite = satellite_outlined
-    satellite_alt = satellite_alt_outlined
-    sauna = sauna_outlined
-    save = save_outlined
-    save_alt = save_alt_outlined
-    save_as = save_as_outlined
-    save_clock = save_clock_outlined
-    saved_search = saved_search_outlined
-    savings = savings_outlined
-    scale = scale_outlined
-    scan = scan_outlined
-    scan_delete = scan_delete_outlined
-    scanner = scanner_outlined
-    scatter_plot = scatter_plot_outlined
-    scene = scene_outlined
-    schedule = schedule_outlined
-    schedule_send = schedule_send_outlined
-    schema = schema_outlined
-    school = school_outlined
-    science = science_outlined
-    science_off = science_off_outlined
-    scooter = scooter_outlined
-    score = score_outlined
-    scoreboard = scoreboard_outlined
-    screen_lock_landscape = screen_lock_landscape_outlined
-    screen_lock_portrait = screen_lock_portrait_outlined
-    screen_lock_rotation = screen_lock_rotation_outlined
-    screen_record = screen_record_outlined
-    screen_rotation = screen_rotation_outlined
-    screen_rotation_alt = screen_rotation_alt_outlined
-    screen_rotation_up = screen_rotation_up_outlined
-    screen_search_desktop = screen_search_desktop_outlined
-    screen_share = screen_share_outlined
-    screenshot = screenshot_outlined
-    screenshot_frame = screenshot_frame_outlined
-    screenshot_frame_2 = screenshot_frame_2_outlined
-    screenshot_keyboard = screenshot_keyboard_outlined
-    screenshot_monitor = screenshot_monitor_outlined
-    screenshot_region = screenshot_region_outlined
-    screenshot_tablet = screenshot_tablet_outlined
-    script = script_outlined
-    scrollable_header = scrollable_header_outlined
-    scuba_diving = scuba_diving_outlined
-    sd = sd_outlined
-    sd_card = sd_card_outlined
-    sd_card_alert = sd_card_alert_outlined
-    sd_storage = sd_storage_outlined
-    sdk = sdk_outlined
-    search = search_outlined
-    search_activity = search_activity_outlined
-    search_check = search_check_outlined
-    search_check_2 = search_check_2_outlined
-    search_hands_free = search_hands_free_outlined
-    search_insights = search_insights_outlined
-    search_off = search_off_outlined
-    seat_cool_left = seat_cool_left_outlined
-    seat_cool_right = seat_cool_right_outlined
-    seat_heat_left = seat_heat_left_outlined
-    seat_heat_right = seat_heat_right_outlined
-    seat_vent_left = seat_vent_left_outlined
-    seat_vent_right = seat_vent_right_outlined
-    security = security_outlined
-    security_key = security_key_outlined
-    security_update = security_update_outlined
-    security_update_good = security_update_good_outlined
-    security_update_warning = security_update_warning_outlined
-    segment = segment_outlined
-    select = select_outlined
-    select_all = select_all_outlined
-    select_check_box = select_check_box_outlined
-    select_to_speak = select_to_speak_outlined
-    select_window = select_window_outlined
-    select_window_2 = select_window_2_outlined
-    select_window_off = select_window_off_outlined
-    self_care = self_care_outlined
-    self_improvement = self_improvement_outlined
-    sell = sell_outlined
-    send = send_outlined
-    send_and_archive = send_and_archive_outlined
-    send_money = send_money_outlined
-    send_time_extension = send_time_extension_outlined
-    send_to_mobile = send_to_mobile_outlined
-    sensor_door = sensor_door_outlined
-    sensor_occupied = sensor_occupied_outlined
-    sensor_window = sensor_window_outlined
-    sensors = sensors_outlined
-    sensors_krx = sensors_krx_outlined
-    sensors_krx_off = sensors_krx_off_outlined
-    sensors_off = sensors_off_outlined
-    sentiment_calm = sentiment_calm_outlined
-    sentiment_content = sentiment_content_outlined
-    sentiment_dissatisfied = sentiment_dissatisfied_outlined
-    sentiment_excited = sentiment_excited_outlined
-    sentiment_extremely_dissatisfied = sentiment_extremely_dissatisfied_outlined
-    sentiment_frustrated = sentiment_frustrated_outlined
-    sentiment_neutral = sentiment_neutral_outlined
-    sentiment_sad = sentiment_sad_outlined
-    sentiment_satisfied = sentiment_satisfied_outlined
-    sentiment_satisfied_alt = sentiment_satisfied_alt_outlined
-    sentiment_stressed = sentiment_stressed_outlined
-    sentiment_very_dissatisfied = sentiment_very_dissatisfied_outlined
-    sentiment_very_satisfied = sentiment_very_satisfied_outlined
-    sentiment_worried = sentiment_worried_outlined
-    serif = serif_outlined
-    server_person = server_person_outlined
-    service_toolbox = service_toolbox_outlined
-    set_meal = set_meal_outlined
-    settings = settings_outlined
-    settings_accessibility = settings_accessibility_outlined
-    settings_account_box = settings_account_box_outlined
-    settings_alert = settings_alert_outlined
-    settings_applications = settings_applications_outlined
-    settings_b_roll = settings_b_roll_outlined
-    settings_backup_restore = settings_backup_restore_outlined
-    settings_bluetooth = settings_bluetooth_outlined
-    settings_brightness = settings_brightness_outlined
-    settings_cell = settings_cell_outlined
-    settings_cinematic_blur = settings_cinematic_blur_outlined
-    settings_ethernet = settings_ethernet_outlined
-    settings_heart = settings_heart_outlined
-    settings_input_antenna = settings_input_antenna_outlined
-    settings_input_component = settings_input_component_outlined
-    settings_input_composite = settings_input_composite_outlined
-    settings_input_hdmi = settings_input_hdmi_outlined
-    settings_input_svideo = settings_input_svideo_outlined
-    settings_motion_mode = settings_motion_mode_outlined
-    settings_night_sight = settings_night_sight_outlined
-    settings_overscan = settings_overscan_outlined
-    settings_panorama = settings_panorama_outlined
-    settings_phone = settings_phone_outlined
-    settings_photo_camera = settings_photo_camera_outlined
-    settings_power = settings_power_outlined
-    settings_remote = settings_remote_outlined
-    settings_slow_motion = settings_slow_motion_outlined
-    settings_suggest = settings_suggest_outlined
-    settings_system_daydream = settings_system_daydream_outlined
-    settings_timelapse = settings_timelapse_outlined
-    settings_video_camera = settings_video_camera_outlined
-    settings_voice = settings_voice_outlined
-    settop_component = settop_component_outlined
-    severe_cold = severe_cold_outlined
-    shadow = shadow_outlined
-    shadow_add = shadow_add_outlined
-    shadow_minus = shadow_minus_outlined
-    shape_line = shape_line_outlined
-    shape_recognition = shape_recognition_outlined
-    shapes = shapes_outlined
-    share = share_outlined
-    share_eta = share_eta_outlined
-    share_location = share_location_outlined
-    share_off = share_off_outlined
-    share_reviews = share_reviews_outlined
-    share_windows = share_windows_outlined
-    sheets_rtl = sheets_rtl_outlined
-    shelf_auto_hide = shelf_auto_hide_outlined
-    shelf_position = shelf_position_outlined
-    shelves = shelves_outlined
-    shield = shield_outlined
-    shield_lock = shield_lock_outlined
-    shield_locked = shield_locked_outlined
-    shield_moon = shield_moon_outlined
-    shield_person = shield_person_outlined
-    shield_question = shield_question_outlined
-    shield_watch = shield_watch_outlined
-    shield_with_heart = shield_with_heart_outlined
-    shield_with_house = shield_with_house_outlined
-    shift = shift_outlined
-    shift_lock = shift_lock_outlined
-    shift_lock_off = shift_lock_off_outlined
-    shop = shop_outlined
-    shop_2 = shop_2_outlined
-    shop_two = shop_two_outlined
-    shopping_bag = shopping_bag_outlined
-    shopping_bag_speed = shopping_bag_speed_outlined
-    shopping_basket = shopping_basket_outlined
-    shopping_cart = shopping_cart_outlined
-    shopping_cart_checkout = shopping_cart_checkout_outlined
-    shopping_cart_off = shopping_cart_off_outlined
-    shoppingmode = shoppingmode_outlined
-    short_stay = short_stay_outlined
-    short_text = short_text_outlined
-    shortcut = shortcut_outlined
-    show_chart = show_chart_outlined
-    shower = shower_outlined
-    shuffle = shuffle_outlined
-    shuffle_on = shuffle_on_outlined
-    shutter_speed = shutter_speed_outlined
-    shutter_speed_add = shutter_speed_add_outlined
-    shutter_speed_minus = shutter_speed_minus_outlined
-    sick = sick_outlined
-    side_navigation = side_navigation_outlined
-    sign_language = sign_language_outlined
-    signal_cellular_0_bar = signal_cellular_0_bar_outlined
-    signal_cellular_1_bar = signal_cellular_1_bar_outlined
-    signal_cellular_2_bar = signal_cellular_2_bar_outlined
-    signal_cellular_3_bar = signal_cellular_3_bar_outlined
-    signal_cellular_4_bar = signal_cellular_4_bar_outlined
-    signal_cellular_add = signal_cellular_add_outlined
-    signal_cellular_alt = signal_cellular_alt_outlined
-    signal_cellular_alt_1_bar = signal_cellular_alt_1_bar_outlined
-    signal_cellular_alt_2_bar = signal_cellular_alt_2_bar_outlined
-    signal_cellular_connected_no_internet_0_bar = signal_cellular_connected_no_internet_0_bar_outlined
-    signal_cellular_connected_no_internet_4_bar = signal_cellular_connected_no_internet_4_bar_outlined
-    signal_cellular_no_sim = signal_cellular_no_sim_outlined
-    signal_cellular_nodata = signal_cellular_nodata_outlined
-    signal_cellular_null = signal_cellular_null_outlined
-    signal_cellular_off = signal_cellular_off_outlined
-    signal_cellular_pause = signal_cellular_pause_outlined
-    signal_disconnected = signal_disconnected_outlined
-    signal_wifi_0_bar = signal_wifi_0_bar_outlined
-    signal_wifi_4_bar = signal_wifi_4_bar_outlined
-    signal_wifi_4_bar_lock = signal_wifi_4_bar_lock_outlined
-    signal_wifi_bad = signal_wifi_bad_outlined
-    signal_wifi_connected_no_internet_4 = signal_wifi_connected_no_internet_4_outlined
-    signal_wifi_off = signal_wifi_off_outlined
-    signal_wifi_statusbar_4_bar = signal_wifi_statusbar_4_bar_outlined
-    signal_wifi_statusbar_not_connected = signal_wifi_statusbar_not_connected_outlined
-    signal_wifi_statusbar_null = signal_wifi_statusbar_null_outlined
-    signature = signature_outlined
-    signpost = signpost_outlined
-    sim_card = sim_card_outlined
-    sim_card_alert = sim_card_alert_outlined
-    sim_card_download = sim_card_download_outlined
-    simulation = simulation_outlined
-    single_bed = single_bed_outlined
-    sip = sip_outlined
-    siren = siren_outlined
-    siren_check = siren_check_outlined
-    siren_open = siren_open_outlined
-    siren_question = siren_question_outlined
-    skateboarding = skateboarding_outlined
-    skeleton = skeleton_outlined
-    skillet = skillet_outlined
-    skillet_cooktop = skillet_cooktop_outlined
-    skip_next = skip_next_outlined
-    skip_previous = skip_previous_outlined
-    skull = skull_outlined
-    skull_list = skull_list_outlined
-    slab_serif = slab_serif_outlined
-    sledding = sledding_outlined
-    sleep = sleep_outlined
-    sleep_score = sleep_score_outlined
-    slide_library = slide_library_outlined
-    sliders = sliders_outlined
-    slideshow = slideshow_outlined
-    slow_motion_video = slow_motion_video_outlined
-    smart_button = smart_button_outlined
-    smart_card_reader = smart_card_reader_outlined
-    smart_card_reader_off = smart_card_reader_off_outlined
-    smart_display = smart_display_outlined
-    smart_outlet = smart_outlet_outlined
-    smart_screen = smart_screen_outlined
-    smart_toy = smart_toy_outlined
-    smartphone = smartphone_outlined
-    smartphone_camera = smartphone_camera_outlined
-    smb_share = smb_share_outlined
-    smoke_free = smoke_free_outlined
-    smoking_rooms = smoking_rooms_outlined
-    sms = sms_outlined
-    sms_failed = sms_failed_outlined
-    snippet_folder = snippet_folder_outlined
-    snooze = snooze_outlined
-    snowboarding = snowboarding_outlined
-    snowing = snowing_outlined
-    snowing_heavy = snowing_heavy_outlined
-    snowmobile = snowmobile_outlined
-    snowshoeing = snowshoeing_outlined
-    soap = soap_outlined
-    social_distance = social_distance_outlined
-    social_leaderboard = social_leaderboard_outlined
-    solar_power = solar_power_outlined
-    sort = sort_outlined
-    sort_by_alpha = sort_by_alpha_outlined
-    sos = sos_outlined
-    sound_detection_dog_barking = sound_detection_dog_barking_outlined
-    sound_detection_glass_break = sound_detection_glass_break_outlined
-    sound_detection_loud_sound = sound_detection_loud_sound_outlined
-    sound_sampler = sound_sampler_outlined
-    soup_kitchen = soup_kitchen_outlined
-    source = source_outlined
-    source_environment = source_environment_outlined
-    source_notes = source_notes_outlined
-    south = south_outlined
-    south_america = south_america_outlined
-    south_east = south_east_outlined
-    south_west = south_west_outlined
-    spa = spa_outlined
-    space_bar = space_bar_outlined
-    space_dashboard = space_dashboard_outlined
-    spatial_audio = spatial_audio_outlined
-    spatial_audio_off = spatial_audio_off_outlined
-    spatial_speaker = spatial_speaker_outlined
-    spatial_tracking = spatial_tracking_outlined
-    speaker = speaker_outlined
-    speaker_group = speaker_group_outlined
-    speaker_notes = speaker_notes_outlined
-    speaker_notes_off = speaker_notes_off_outlined
-    speaker_phone = speaker_phone_outlined
-    special_character = special_character_outlined
-    specific_gravity = specific_gravity_outlined
-    speech_to_text = speech_to_text_outlined
-    speed = speed_outlined
-    speed_0_25 = speed_0_25_outlined
-    speed_0_2x = speed_0_2x_outlined
-    speed_0_5 = speed_0_5_outlined
-    speed_0_5x = speed_0_5x_outlined
-    speed_0_75 = speed_0_75_outlined
-    speed_0_7x = speed_0_7x_outlined
-    speed_1_2 = speed_1_2_outlined
-    speed_1_25 = speed_1_25_outlined
-    speed_1_2x = speed_1_2x_outlined
-    speed_1_5 = speed_1_5_outlined
-    speed_1_5x = speed_1_5x_outlined
-    speed_1_75 = speed_1_75_outlined
-    speed_1_7x = speed_1_7x_outlined
-    speed_2x = speed_2x_outlined
-    speed_camera = speed_camera_outlined
-    spellcheck = spellcheck_outlined
-    split_scene = split_scene_outlined
-    split_scene_down = split_scene_down_outlined
-    split_scene_left = split_scene_left_outlined
-    split_scene_right = split_scene_right_outlined
-    split_scene_up = split_scene_up_outlined
-    splitscreen = splitscreen_outlined
-    splitscreen_add = splitscreen_add_outlined
-    splitscreen_bottom = splitscreen_bottom_outlined
-    splitscreen_landscape = splitscreen_landscape_outlined
-    splitscreen_left = splitscreen_left_outlined
-    splitscreen_portrait = splitscreen_portrait_outlined
-    splitscreen_right = splitscreen_right_outlined
-    splitscreen_top = splitscreen_top_outlined
-    splitscreen_vertical_add = splitscreen_vertical_add_outlined
-    spo2 = spo2_outlined
-    spoke = spoke_outlined
-    sports = sports_outlined
-    sports_and_outdoors = sports_and_outdoors_outlined
-    sports_bar = sports_bar_outlined
-    sports_baseball = sports_baseball_outlined
-    sports_basketball = sports_basketball_outlined
-    sports_cricket = sports_cricket_outlined
-    sports_esports = sports_esports_outlined
-    sports_football = sports_football_outlined
-    sports_golf = sports_golf_outlined
-    sports_gymnastics = sports_gymnastics_outlined
-    sports_handball = sports_handball_outlined
-    sports_hockey = sports_hockey_outlined
-    sports_kabaddi = sports_kabaddi_outlined
-    sports_martial_arts = sports_martial_arts_outlined
-    sports_mma = sports_mma_outlined
-    sports_motorsports = sports_motorsports_outlined
-    sports_rugby = sports_rugby_outlined
-    sports_score = sports_score_outlined
-    sports_soccer = sports_soccer_outlined
-    sports_tennis = sports_tennis_outlined
-    sports_volleyball = sports_volleyball_outlined
-    sprinkler = sprinkler_outlined
-    sprint = sprint_outlined
-    square = square_outlined
-    square_dot = square_dot_outlined
-    square_foot = square_foot_outlined
-    ssid_chart = ssid_chart_outlined
-    stack = stack_outlined
-    stack_group = stack_group_outlined
-    stack_hexagon = stack_hexagon_outlined
-    stack_off = stack_off_outlined
-    stack_star = stack_star_outlined
-    stacked_bar_chart = stacked_bar_chart_outlined
-    stacked_email = stacked_email_outlined
-    stacked_inbox = stacked_inbox_outlined
-    stacked_line_chart = stacked_line_chart_outlined
-    stacks = stacks_outlined
-    stadia_controller = stadia_controller_outlined
-    stadium = stadium_outlined
-    stairs = stairs_outlined
-    stairs_2 = stairs_2_outlined
-    star = star_outlined
-    star_border = star_border_outlined
-    star_border_purple500 = star_border_purple500_outlined
-    star_half = star_half_outlined
-    star_outline = star_outline_outlined
-    star_purple500 = star_purple500_outlined
-    star_rate = star_rate_outlined
-    star_rate_half = star_rate_half_outlined
-    star_shine = star_shine_outlined
-    stars = stars_outlined
-    stars_2 = stars_2_outlined
-    start = start_outlined
-    stat_0 = stat_0_outlined
-    stat_1 = stat_1_outlined
-    stat_2 = stat_2_outlined
-    stat_3 = stat_3_outlined
-    stat_minus_1 = stat_minus_1_outlined
-    stat_minus_2 = stat_minus_2_outlined
-    stat_minus_3 = stat_minus_3_outlined
-    stay_current_landscape = stay_current_landscape_outlined
-    stay_current_portrait = stay_current_portrait_outlined
-    stay_primary_landscape = stay_primary_landscape_outlined
-    stay_primary_portrait = stay_primary_portrait_outlined
-    steering_wheel_heat = steering_wheel_heat_outlined
-    step = step_outlined
-    step_into = step_into_outlined
-    step_out = step_out_outlined
-    step_over = step_over_outlined
-    steppers = steppers_outlined
-    steps = steps_outlined
-    stethoscope = stethoscope_outlined
-    stethoscope_arrow = stethoscope_arrow_outlined
-    stethoscope_check = stethoscope_check_outlined
-    sticky_note = sticky_note_outlined
-    sticky_note_2 = sticky_note_2_outlined
-    stock_media = stock_media_outlined
-    stockpot = stockpot_outlined
-    stop = stop_outlined
-    stop_circle = stop_circle_outlined
-    stop_screen_share = stop_screen_share_outlined
-    storage = storage_outlined
-    store = store_outlined
-    store_mall_directory = store_mall_directory_outlined
-    storefront = storefront_outlined
-    storm = storm_outlined
-    straight = straight_outlined
-    straighten = straighten_outlined
-    strategy = strategy_outlined
-    stream = stream_outlined
-    stream_apps = stream_apps_outlined
-    streetview = streetview_outlined
-    stress_management = stress_management_outlined
-    strikethrough_s = strikethrough_s_outlined
-    stroke_full = stroke_full_outlined
-    stroke_partial = stroke_partial_outlined
-    stroller = stroller_outlined
-    style = style_outlined
-    styler = styler_outlined
-    stylus = stylus_outlined
-    stylus_brush = stylus_brush_outlined
-    stylus_fountain_pen = stylus_fountain_pen_outlined
-    stylus_highlighter = stylus_highlighter_outlined
-    stylus_laser_pointer = stylus_laser_pointer_outlined
-    stylus_note = stylus_note_outlined
-    stylus_pen = stylus_pen_outlined
-    stylus_pencil = stylus_pencil_outlined
-    subdirectory_arrow_left = subdirectory_arrow_left_outlined
-    subdirectory_arrow_right = subdirectory_arrow_right_outlined
-    subheader = subheader_outlined
-    subject = subject_outlined
-    subscript = subscript_outlined
-    subscriptions = subscriptions_outlined
-    subtitles = subtitles_outlined
-    subtitles_gear = subtitles_gear_outlined
-    subtitles_off = subtitles_off_outlined
-    subway = subway_outlined
-    summarize = summarize_outlined
-    sunny = sunny_outlined
-    sunny_snowing = sunny_snowing_outlined
-    superscript = superscript_outlined
-    supervised_user_circle = supervised_user_circle_outlined
-    supervised_user_circle_off = supervised_user_circle_off_outlined
-    supervisor_account = supervisor_account_outlined
-    support = support_outlined
-    support_agent = support_agent_outlined
-    surfing = surfing_outlined
-    surgical = surgical_outlined
-    surround_sound = surround_sound_outlined
-    swap_calls = swap_calls_outlined
-    swap_driving_apps = swap_driving_apps_outlined
-    swap_driving_apps_wheel = swap_driving_apps_wheel_outlined
-    swap_horiz = swap_horiz_outlined
-    swap_horizontal_circle = swap_horizontal_circle_outlined
-    swap_vert = swap_vert_outlined
-    swap_vertical_circle = swap_vertical_circle_outlined
-    sweep = sweep_outlined
-    swipe = swipe_outlined
-    swipe_down = swipe_down_outlined
-    swipe_down_alt = swipe_down_alt_outlined
-    swipe_left = swipe_left_outlined
-    swipe_left_alt = swipe_left_alt_outlined
-    swipe_right = swipe_right_outlined
-    swipe_right_alt = swipe_right_alt_outlined
-    swipe_up = swipe_up_outlined
-    swipe_up_alt = swipe_up_alt_outlined
-    swipe_vertical = swipe_vertical_outlined
-    switch = switch_outlined
-    switch_access = switch_access_outlined
-    switch_access_2 = switch_access_2_outlined
-    switch_access_3 = switch_access_3_outlined
-    switch_access_shortcut = switch_access_shortcut_outlined
-    switch_access_shortcut_add = switch_access_shortcut_add_outlined
-    switch_account = switch_account_outlined
-    switch_camera = switch_camera_outlined
-    switch_left = switch_left_outlined
-    switch_right = switch_right_outlined
-    switch_video = switch_video_outlined
-    switches = switches_outlined
-    sword_rose = sword_rose_outlined
-    swords = swords_outlined
-    symptoms = symptoms_outlined
-    synagogue = synagogue_outlined
-    sync = sync_outlined
-    sync_alt = sync_alt_outlined
-    sync_arrow_down = sync_arrow_down_outlined
-    sync_arrow_up = sync_arrow_up_outlined
-    sync_desktop = sync_desktop_outlined
-    sync_disabled = sync_disabled_outlined
-    sync_lock = sync_lock_outlined
-    sync_problem = sync_problem_outlined
-    sync_saved_locally = sync_saved_locally_outlined
-    syringe = syringe_outlined
-    system_security_update = system_security_update_outlined
-    system_security_update_good = system_security_update_good_outlined
-    system_security_update_warning = system_security_update_warning_outlined
-    system_update = system_update_outlined
-    system_update_alt = system_update_alt_outlined
-    tab = tab_outlined
-    tab_close = tab_close_outlined
-    tab_close_inactive = tab_close_inactive_outlined
-    tab_close_right = tab_close_right_outlined
-    tab_duplicate = tab_duplicate_outlined
-    tab_group = tab_group_outlined
-    tab_inactive = tab_inactive_outlined
-    tab_move = tab_move_outlined
-    tab_new_right = tab_new_right_outlined
-    tab_recent = tab_recent_outlined
-    tab_search = tab_search_outlined
-    tab_unselected = tab_unselected_outlined
-    table = table_outlined
-    table_bar = table_bar_outlined
-    table_chart = table_chart_outlined
-    table_chart_view = table_chart_view_outlined
-    table_convert = table_convert_outlined
-    table_edit = table_edit_outlined
-    table_eye = table_eye_outlined
-    table_lamp = table_lamp_outlined
-    table_restaurant = table_restaurant_outlined
-    table_rows = table_rows_outlined
-    table_rows_narrow = table_rows_narrow_outlined
-    table_view = table_view_outlined
-    tablet = tablet_outlined
-    tablet_android = tablet_android_outlined
-    tablet_camera = tablet_camera_outlined
-    tablet_mac = tablet_mac_outlined
-    tabs = tabs_outlined
-    tactic = tactic_outlined
-    tag = tag_outlined
-    tag_faces = tag_faces_outlined
-    takeout_dining = takeout_dining_outlined
-    tamper_detection_off = tamper_detection_off_outlined
-    tamper_detection_on = tamper_detection_on_outlined
-    tap_and_play = tap_and_play_outlined
-    tapas = tapas_outlined
-    target = target_outlined
-    task = task_outlined
-    task_alt = task_alt_outlined
-    taunt = taunt_outlined
-    taxi_alert = taxi_alert_outlined
-    team_dashboard = team_dashboard_outlined
-    temp_preferences_custom = temp_preferences_custom_outlined
-    temp_preferences_eco = temp_preferences_eco_outlined
-    temple_buddhist = temple_buddhist_outlined
-    temple_hindu = temple_hindu_outlined
-    tenancy = tenancy_outlined
-    terminal = terminal_outlined
-    terrain = terrain_outlined
-    text_ad = text_ad_outlined
-    text_compare = text_compare_outlined
-    text_decrease = text_decrease_outlined
-    text_fields = text_fields_outlined
-    text_fields_alt = text_fields_alt_outlined
-    text_format = text_format_outlined
-    text_increase = text_increase_outlined
-    text_rotate_up = text_rotate_up_outlined
-    text_rotate_vertical = text_rotate_vertical_outlined
-    text_rotation_angledown = text_rotation_angledown_outlined
-    text_rotation_angleup = text_rotation_angleup_outlined
-    text_rotation_down = text_rotation_down_outlined
-    text_rotation_none = text_rotation_none_outlined
-    text_select_end = text_select_end_outlined
-    text_select_jump_to_beginning = text_select_jump_to_beginning_outlined
-    text_select_jump_to_end = text_select_jump_to_end_outlined
-    text_select_move_back_character = text_select_move_back_character_outlined
-    text_select_move_back_word = text_select_move_back_word_outlined
-    text_select_move_down = text_select_move_down_outlined
-    text_select_move_forward_character = text_select_move_forward_character_outlined
-    text_select_move_forward_word = text_select_move_forward_word_outlined
-    text_select_move_up = text_select_move_up_outlined
-    text_select_start = text_select_start_outlined
-    text_snippet = text_snippet_outlined
-    text_to_speech = text_to_speech_outlined
-    text_up = text_up_outlined
-    textsms = textsms_outlined
-    texture = texture_outlined
-    texture_add = texture_add_outlined
-    texture_minus = texture_minus_outlined
-    theater_comedy = theater_comedy_outlined
-    theaters = theaters_outlined
-    thermometer = thermometer_outlined
-    thermometer_add = thermometer_add_outlined
-    thermometer_gain = thermometer_gain_outlined
-    thermometer_loss = thermometer_loss_outlined
-    thermometer_minus = thermometer_minus_outlined
-    thermostat = thermostat_outlined
-    thermostat_arrow_down = thermostat_arrow_down_outlined
-    thermostat_arrow_up = thermostat_arrow_up_outlined
-    thermostat_auto = thermostat_auto_outlined
-    thermostat_carbon = thermostat_carbon_outlined
-    things_to_do = things_to_do_outlined
-    thread_unread = thread_unread_outlined
-    threat_intelligence = threat_intelligence_outlined
-    thumb_down = thumb_down_outlined
-    thumb_down_alt = thumb_down_alt_outlined
-    thumb_down_filled = thumb_down_filled_outlined
-    thumb_down_off = thumb_down_off_outlined
-    thumb_down_off_alt = thumb_down_off_alt_outlined
-    thumb_up = thumb_up_outlined
-    thumb_up_alt = thumb_up_alt_outlined
-    thumb_up_filled = thumb_up_filled_outlined
-    thumb_up_off = thumb_up_off_outlined
-    thumb_up_off_alt = thumb_up_off_alt_outlined
-    thumbnail_bar = thumbnail_bar_outlined
-    thumbs_up_down = thumbs_up_down_outlined
-    thunderstorm = thunderstorm_outlined
-    tibia = tibia_outlined
-    tibia_alt = tibia_alt_outlined
-    tile_large = tile_large_outlined
-    tile_medium = tile_medium_outlined
-    tile_small = tile_small_outlined
-    time_auto = time_auto_outlined
-    time_to_leave = time_to_leave_outlined
-    timelapse = timelapse_outlined
-    timeline = timeline_outlined
-    timer = timer_outlined
-    timer_10 = timer_10_outlined
-    timer_10_alt_1 = timer_10_alt_1_outlined
-    timer_10_select = timer_10_select_outlined
-    timer_3 = timer_3_outlined
-    timer_3_alt_1 = timer_3_alt_1_outlined
-    timer_3_select = timer_3_select_outlined
-    timer_5 = timer_5_outlined
-    timer_5_shutter = timer_5_shutter_outlined
-    timer_arrow_down = timer_arrow_down_outlined
-    timer_arrow_up = timer_arrow_up_outlined
-    timer_off = timer_off_outlined
-    timer_pause = timer_pause_outlined
-    timer_play = timer_play_outlined
-    tips_and_updates = tips_and_updates_outlined
-    tire_repair = tire_repair_outlined
-    title = title_outlined
-    titlecase = titlecase_outlined
-    toast = toast_outlined
-    toc = toc_outlined
-    today = today_outlined
-    toggle_off = toggle_off_outlined
-    toggle_on = toggle_on_outlined
-    token = token_outlined
-    toll = toll_outlined
-    tonality = tonality_outlined
-    toolbar = toolbar_outlined
-    tools_flat_head = tools_flat_head_outlined
-    tools_installation_kit = tools_installation_kit_outlined
-    tools_ladder = tools_ladder_outlined
-    tools_level = tools_level_outlined
-    tools_phillips = tools_phillips_outlined
-    tools_pliers_wire_stripper = tools_pliers_wire_stripper_outlined
-    tools_power_drill = tools_power_drill_outlined
-    tools_wrench = tools_wrench_outlined
-    tooltip = tooltip_outlined
-    tooltip_2 = tooltip_2_outlined
-    top_panel_close = top_panel_close_outlined
-    top_panel_open = top_panel_open_outlined
-    topic = topic_outlined
-    tornado = tornado_outlined
-    total_dissolved_solids = total_dissolved_solids_outlined
-    touch_app = touch_app_outlined
-    touch_double = touch_double_outlined
-    touch_long = touch_long_outlined
-    touch_triple = touch_triple_outlined
-    touchpad_mouse = touchpad_mouse_outlined
-    touchpad_mouse_off = touchpad_mouse_off_outlined
-    tour = tour_outlined
-    toys = toys_outlined
-    toys_and_games = toys_and_games_outlined
-    toys_fan = toys_fan_outlined
-    track_changes = track_changes_outlined
-    trackpad_input = trackpad_input_outlined
-    trackpad_input_2 = trackpad_input_2_outlined
-    trackpad_input_3 = trackpad_input_3_outlined
-    traffic = traffic_outlined
-    traffic_jam = traffic_jam_outlined
-    trail_length = trail_length_outlined
-    trail_length_medium = trail_length_medium_outlined
-    trail_length_short = trail_length_short_outlined
-    train = train_outlined
-    tram = tram_outlined
-    transcribe = transcribe_outlined
-    transfer_within_a_station = transfer_within_a_station_outlined
-    transform = transform_outlined
-    transgender = transgender_outlined
-    transit_enterexit = transit_enterexit_outlined
-    transit_ticket = transit_ticket_outlined
-    transition_chop = transition_chop_outlined
-    transition_dissolve = transition_dissolve_outlined
-    transition_fade = transition_fade_outlined
-    transition_push = transition_push_outlined
-    transition_slide = transition_slide_outlined
-    translate = translate_outlined
-    transportation = transportation_outlined
-    travel = travel_outlined
-    travel_explore = travel_explore_outlined
-    travel_luggage_and_bags = travel_luggage_and_bags_outlined
-    trending_down = trending_down_outlined
-    trending_flat = trending_flat_outlined
-    trending_up = trending_up_outlined
-    trip = trip_outlined
-    trip_origin = trip_origin_outlined
-    trolley = trolley_outlined
-    trolley_cable_car = trolley_cable_car_outlined
-    trophy = trophy_outlined
-    troubleshoot = troubleshoot_outlined
-    try_ = try_outlined
-    tsunami = tsunami_outlined
-    tsv = tsv_outlined
-    tty = tty_outlined
-    tune = tune_outlined
-    tungsten = tungsten_outlined
-    turn_left = turn_left_outlined
-    turn_right = turn_right_outlined
-    turn_sharp_left = turn_sharp_left_outlined
-    turn_sharp_right = turn_sharp_right_outlined
-    turn_slight_left = turn_slight_left_outlined
-    turn_slight_right = turn_slight_right_outlined
-    turned_in = turned_in_outlined
-    turned_in_not = turned_in_not_outlined
-    tv = tv_outlined
-    tv_displays = tv_displays_outlined
-    tv_gen = tv_gen_outlined
-    tv_guide = tv_guide_outlined
-    tv_next = tv_next_outlined
-    tv_off = tv_off_outlined
-    tv_options_edit_channels = tv_options_edit_channels_outlined
-    tv_options_input_settings = tv_options_input_settings_outlined
-    tv_remote = tv_remote_outlined
-    tv_signin = tv_signin_outlined
-    tv_with_assistant = tv_with_assistant_outlined
-    two_pager = two_pager_outlined
-    two_pager_store = two_pager_store_outlined
-    two_wheeler = two_wheeler_outlined
-    type_specimen = type_specimen_outlined
-    u_turn_left = u_turn_left_outlined
-    u_turn_right = u_turn_right_outlined
-    ulna_radius = ulna_radius_outlined
-    ulna_radius_alt = ulna_radius_alt_outlined
-    umbrella = umbrella_outlined
-    unarchive = unarchive_outlined
-    undo = undo_outlined
-    unfold_less = unfold_less_outlined
-    unfold_less_double = unfold_less_double_outlined
-    unfold_more = unfold_more_outlined
-    unfold_more_double = unfold_more_double_outlined
-    ungroup = ungroup_outlined
-    universal_currency = universal_currency_outlined
-    universal_currency_alt = universal_currency_alt_outlined
-    universal_local = universal_local_outlined
-    unknown_2 = unknown_2_outlined
-    unknown_5 = unknown_5_outlined
-    unknown_7 = unknown_7_outlined
-    unknown_document = unknown_document_outlined
-    unknown_med = unknown_med_outlined
-    unlicense = unlicense_outlined
-    unpaved_road = unpaved_road_outlined
-    unpin = unpin_outlined
-    unpublished = unpublished_outlined
-    unsubscribe = unsubscribe_outlined
-    upcoming = upcoming_outlined
-    update = update_outlined
-    update_disabled = update_disabled_outlined
-    upgrade = upgrade_outlined
-    upi_pay = upi_pay_outlined
-    upload = upload_outlined
-    upload_2 = upload_2_outlined
-    upload_file = upload_file_outlined
-    uppercase = uppercase_outlined
-    urology = urology_outlined
-    usb = usb_outlined
-    usb_off = usb_off_outlined
-    user_attributes = user_attributes_outlined
-    vaccines = vaccines_outlined
-    vacuum = vacuum_outlined
-    valve = valve_outlined
-    vape_free = vape_free_outlined
-    vaping_rooms = vaping_rooms_outlined
-    variable_add = variable_add_outlined
-    variable_insert = variable_insert_outlined
-    variable_remove = variable_remove_outlined
-    variables = variables_outlined
-    ventilator = ventilator_outlined
-    verified = verified_outlined
-    verified_off = verified_off_outlined
-    verified_user = verified_user_outlined
-    vertical_align_bottom = vertical_align_bottom_outlined
-    vertical_align_center = vertical_align_center_outlined
-    vertical_align_top = vertical_align_top_outlined
-    vertical_distribute = vertical_distribute_outlined
-    vertical_shades = vertical_shades_outlined
-    vertical_shades_closed = vertical_shades_closed_outlined
-    vertical_split = vertical_split_outlined
-    vibration = vibration_outlined
-    video_call = video_call_outlined
-    video_camera_back = video_camera_back_outlined
-    video_camera_back_add = video_camera_back_add_outlined
-    video_camera_front = video_camera_front_outlined
-    video_camera_front_off = video_camera_front_off_outlined
-    video_chat = video_chat_outlined
-    video_file = video_file_outlined
-    video_label = video_label_outlined
-    video_library = video_library_outlined
-    video_search = video_search_outlined
-    video_settings = video_settings_outlined
-    video_stable = video_stable_outlined
-    videocam = videocam_outlined
-    videocam_alert = videocam_alert_outlined
-    videocam_off = videocam_off_outlined
-    videogame_asset = videogame_asset_outlined
-    videogame_asset_off = videogame_asset_off_outlined
-    view_agenda = view_agenda_outlined
-    view_apps = view_apps_outlined
-    view_array = view_array_outlined
-    view_carousel = view_carousel_outlined
-    view_column = view_column_outlined
-    view_column_2 = view_column_2_outlined
-    view_comfy = view_comfy_outlined
-    view_comfy_alt = view_comfy_alt_outlined
-    view_compact = view_compact_outlined
-    view_compact_alt = view_compact_alt_outlined
-    view_cozy = view_cozy_outlined
-    view_day = view_day_outlined
-    view_headline = view_headline_outlined
-    view_in_ar = view_in_ar_outlined
-    view_in_ar_new = view_in_ar_new_outlined
-    view_in_ar_off = view_in_ar_off_outlined
-    view_kanban = view_kanban_outlined
-    view_list = view_list_outlined
-    view_module = view_module_outlined
-    view_object_track = view_object_track_outlined
-    view_quilt = view_quilt_outlined
-    view_real_size = view_real_size_outlined
-    view_sidebar = view_sidebar_outlined
-    view_stream = view_stream_outlined
-    view_timeline = view_timeline_outlined
-    view_week = view_week_outlined
-    vignette = vignette_outlined
-    villa = villa_outlined
-    visibility = visibility_outlined
-    visibility_lock = visibility_lock_outlined
-    visibility_off = visibility_off_outlined
-    vital_signs = vital_signs_outlined
-    vitals = vitals_outlined
-    vo2_max = vo2_max_outlined
-    voice_chat = voice_chat_outlined
-    voice_over_off = voice_over_off_outlined
-    voice_selection = voice_selection_outlined
-    voice_selection_off = voice_selection_off_outlined
-    voicemail = voicemail_outlined
-    voicemail_2 = voicemail_2_outlined
-    volcano = volcano_outlined
-    volume_down = volume_down_outlined
-    volume_down_alt = volume_down_alt_outlined
-    volume_mute = volume_mute_outlined
-    volume_off = volume_off_outlined
-    volume_up = volume_up_outlined
-    volunteer_activism = volunteer_activism_outlined
-    voting_chip = voting_chip_outlined
-    vpn_key = vpn_key_outlined
-    vpn_key_alert = vpn_key_alert_outlined
-    vpn_key_off = vpn_key_off_outlined
-    vpn_lock = vpn_lock_outlined
-    vpn_lock_2 = vpn_lock_2_outlined
-    vr180_create2d = vr180_create2d_outlined
-    vr180_create2d_off = vr180_create2d_off_outlined
-    vrpano = vrpano_outlined
-    wall_art = wall_art_outlined
-    wall_lamp = wall_lamp_outlined
-    wallet = wallet_outlined
-    wallpaper = wallpaper_outlined
-    wallpaper_slideshow = wallpaper_slideshow_outlined
-    wand_shine = wand_shine_outlined
-    wand_stars = wand_stars_outlined
-    ward = ward_outlined
-    warehouse = warehouse_outlined
-    warning = warning_outlined
-    warning_amber = warning_amber_outlined
-    warning_off = warning_off_outlined
-    wash = wash_outlined
-    watch = watch_outlined
-    watch_button_press = watch_button_press_outlined
-    watch_check = watch_check_outlined
-    watch_later = watch_later_outlined
-    watch_off = watch_off_outlined
-    watch_screentime = watch_screentime_outlined
-    watch_vibration = watch_vibration_outlined
-    watch_wake = watch_wake_outlined
-    water = water_outlined
-    water_bottle = water_bottle_outlined
-    water_bottle_large = water_bottle_large_outlined
-    water_damage = water_damage_outlined
-    water_do = water_do_outlined
-    water_drop = water_drop_outlined
-    water_ec = water_ec_outlined
-    water_full = water_full_outlined
-    water_heater = water_heater_outlined
-    water_lock = water_lock_outlined
-    water_loss = water_loss_outlined
-    water_lux = water_lux_outlined
-    water_medium = water_medium_outlined
-    water_orp = water_orp_outlined
-    water_ph = water_ph_outlined
-    water_pump = water_pump_outlined
-    water_voc = water_voc_outlined
-    waterfall_chart = waterfall_chart_outlined
-    waves = waves_outlined
-    waving_hand = waving_hand_outlined
-    wb_auto = wb_auto_outlined
-    wb_cloudy = wb_cloudy_outlined
-    wb_incandescent = wb_incandescent_outlined
-    wb_iridescent = wb_iridescent_outlined
-    wb_shade = wb_shade_outlined
-    wb_sunny = wb_sunny_outlined
-    wb_twilight = wb_twilight_outlined
-    wc = wc_outlined
-    weather_hail = weather_hail_outlined
-    weather_mix = weather_mix_outlined
-    weather_snowy = weather_snowy_outlined
-    web = web_outlined
-    web_asset = web_asset_outlined
-    web_asset_off = web_asset_off_outlined
-    web_stories = web_stories_outlined
-    web_traffic = web_traffic_outlined
-    webhook = webhook_outlined
-    weekend = weekend_outlined
-    weight = weight_outlined
-    west = west_outlined
-    whatshot = whatshot_outlined
-    wheelchair_pickup = wheelchair_pickup_outlined
-    where_to_vote = where_to_vote_outlined
-    widget_medium = widget_medium_outlined
-    widget_small = widget_small_outlined
-    widget_width = widget_width_outlined
-    widgets = widgets_outlined
-    width = width_outlined
-    width_full = width_full_outlined
-    width_normal = width_normal_outlined
-    width_wide = width_wide_outlined
-    wifi = wifi_outlined
-    wifi_1_bar = wifi_1_bar_outlined
-    wifi_2_bar = wifi_2_bar_outlined
-    wifi_add = wifi_add_outlined
-    wifi_calling = wifi_calling_outlined
-    wifi_calling_1 = wifi_calling_1_outlined
-    wifi_calling_2 = wifi_calling_2_outlined
-    wifi_calling_3 = wifi_calling_3_outlined
-    wifi_calling_bar_1 = wifi_calling_bar_1_outlined
-    wifi_calling_bar_2 = wifi_calling_bar_2_outlined
-    wifi_calling_bar_3 = wifi_calling_bar_3_outlined
-    wifi_channel = wifi_channel_outlined
-    wifi_find = wifi_find_outlined
-    wifi_home = wifi_home_outlined
-    wifi_lock = wifi_lock_outlined
-    wifi_notification = wifi_notification_outlined
-    wifi_off = wifi_off_outlined
-    wifi_password = wifi_password_outlined
-    wifi_protected_setup = wifi_protected_setup_outlined
-    wifi_proxy = wifi_proxy_outlined
-    wifi_tethering = wifi_tethering_outlined
-    wifi_tethering_error = wifi_tethering_error_outlined
-    wifi_tethering_off = wifi_tethering_off_outlined
-    wind_power = wind_power_outlined
-    window = window_outlined
-    window_closed = window_closed_outlined
-    window_open = window_open_outlined
-    window_sensor = window_sensor_outlined
-    windshield_defrost_front = windshield_defrost_front_outlined
-    windshield_defrost_rear = windshield_defrost_rear_outlined
-    windshield_heat_front = windshield_heat_front_outlined
-    wine_bar = wine_bar_outlined
-    woman = woman_outlined
-    woman_2 = woman_2_outlined
-    work = work_outlined
-    work_alert = work_alert_outlined
-    work_history = work_history_outlined
-    work_off = work_off_outlined
-    work_outline = work_outline_outlined
-    work_update = work_update_outlined
-    workflow = workflow_outlined
-    workspace_premium = workspace_premium_outlined
-    workspaces = workspaces_outlined
-    workspaces_outline = workspaces_outline_outlined
-    wounds_injuries = wounds_injuries_outlined
-    wrap_text = wrap_text_outlined
-    wrist = wrist_outlined
-    wrong_location = wrong_location_outlined
-    wysiwyg = wysiwyg_outlined
-    yard = yard_outlined
-    your_trips = your_trips_outlined
-    youtube_activity = youtube_activity_outlined
-    youtube_searched_for = youtube_searched_for_outlined
-    zone_person_alert = zone_person_alert_outlined
-    zone_person_idle = zone_person_idle_outlined
-    zone_person_urgent = zone_person_urgent_outlined
-    zoom_in = zoom_in_outlined
-    zoom_in_map = zoom_in_map_outlined
-    zoom_out = zoom_out_outlined
-    zoom_out_map = zoom_out_map_outlined
@@ -1,3668 +0,0 @@
-from .base import IconData
-
-class IconsOutlined1:
-    """A helper class containing static references to outlined Material Symbols."""
-
-    _10k_outlined = IconData(name="10k", fontFamily="Material Symbols Outlined")
-    _10mp_outlined = IconData(name="10mp", fontFamily="Material Symbols Outlined")
-    _11mp_outlined = IconData(name="11mp", fontFamily="Material Symbols Outlined")
-    _123_outlined = IconData(name="123", fontFamily="Material Symbols Outlined")
-    _12mp_outlined = IconData(name="12mp", fontFamily="Material Symbols Outlined")
-    _13mp_outlined = IconData(name="13mp", fontFamily="Material Symbols Outlined")
-    _14mp_outlined = IconData(name="14mp", fontFamily="Material Symbols Outlined")
-    _15mp_outlined = IconData(name="15mp", fontFamily="Material Symbols Outlined")
-    _16mp_outlined = IconData(name="16mp", fontFamily="Material Symbols Outlined")
-    _17mp_outlined = IconData(name="17mp", fontFamily="Material Symbols Outlined")
-    _18_up_rating_outlined = IconData(name="18_up_rating", fontFamily="Material Symbols Outlined")
-    _18mp_outlined = IconData(name="18mp", fontFamily="Material Symbols Outlined")
-    _19mp_outlined = IconData(name="19mp", fontFamily="Material Symbols Outlined")
-    _1k_outlined = IconData(name="1k", fontFamily="Material Symbols Outlined")
-    _1k_plus_outlined = IconData(name="1k_plus", fontFamily="Material Symbols Outlined")
-    _1x_mobiledata_outlined = IconData(name="1x_mobiledata", fontFamily="Material Symbols Outlined")
-    _1x_mobiledata_badge_outlined = IconData(name="1x_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    _20mp_outlined = IconData(name="20mp", fontFamily="Material Symbols Outlined")
-    _21mp_outlined = IconData(name="21mp", fontFamily="Material Symbols Outlined")
-    _22mp_outlined = IconData(name="22mp", fontFamily="Material Symbols Outlined")
-    _23mp_outlined = IconData(name="23mp", fontFamily="Material Symbols Outlined")
-    _24fps_select_outlined = IconData(name="24fps_select", fontFamily="Material Symbols Outlined")
-    _24mp_outlined = IconData(name="24mp", fontFamily="Material Symbols Outlined")
-    _2d_outlined = IconData(name="2d", fontFamily="Material Symbols Outlined")
-    _2k_outlined = IconData(name="2k", fontFamily="Material Symbols Outlined")
-    _2k_plus_outlined = IconData(name="2k_plus", fontFamily="Material Symbols Outlined")
-    _2mp_outlined = IconData(name="2mp", fontFamily="Material Symbols Outlined")
-    _30fps_outlined = IconData(name="30fps", fontFamily="Material Symbols Outlined")
-    _30fps_select_outlined = IconData(name="30fps_select", fontFamily="Material Symbols Outlined")
-    _360_outlined = IconData(name="360", fontFamily="Material Symbols Outlined")
-    _3d_outlined = IconData(name="3d", fontFamily="Material Symbols Outlined")
-    _3d_rotation_outlined = IconData(name="3d_rotation", fontFamily="Material Symbols Outlined")
-    _3g_mobiledata_outlined = IconData(name="3g_mobiledata", fontFamily="Material Symbols Outlined")
-    _3g_mobiledata_badge_outlined = IconData(name="3g_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    _3k_outlined = IconData(name="3k", fontFamily="Material Symbols Outlined")
-    _3k_plus_outlined = IconData(name="3k_plus", fontFamily="Material Symbols Outlined")
-    _3mp_outlined = IconData(name="3mp", fontFamily="Material Symbols Outlined")
-    _3p_outlined = IconData(name="3p", fontFamily="Material Symbols Outlined")
-    _4g_mobiledata_outlined = IconData(name="4g_mobiledata", fontFamily="Material Symbols Outlined")
-    _4g_mobiledata_badge_outlined = IconData(name="4g_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    _4g_plus_mobiledata_outlined = IconData(name="4g_plus_mobiledata", fontFamily="Material Symbols Outlined")
-    _4k_outlined = IconData(name="4k", fontFamily="Material Symbols Outlined")
-    _4k_plus_outlined = IconData(name="4k_plus", fontFamily="Material Symbols Outlined")
-    _4mp_outlined = IconData(name="4mp", fontFamily="Material Symbols Outlined")
-    _50mp_outlined = IconData(name="50mp", fontFamily="Material Symbols Outlined")
-    _5g_outlined = IconData(name="5g", fontFamily="Material Symbols Outlined")
-    _5g_mobiledata_badge_outlined = IconData(name="5g_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    _5k_outlined = IconData(name="5k", fontFamily="Material Symbols Outlined")
-    _5k_plus_outlined = IconData(name="5k_plus", fontFamily="Material Symbols Outlined")
-    _5mp_outlined = IconData(name="5mp", fontFamily="Material Symbols Outlined")
-    _60fps_outlined = IconData(name="60fps", fontFamily="Material Symbols Outlined")
-    _60fps_select_outlined = IconData(name="60fps_select", fontFamily="Material Symbols Outlined")
-    _6_ft_apart_outlined = IconData(name="6_ft_apart", fontFamily="Material Symbols Outlined")
-    _6k_outlined = IconData(name="6k", fontFamily="Material Symbols Outlined")
-    _6k_plus_outlined = IconData(name="6k_plus", fontFamily="Material Symbols Outlined")
-    _6mp_outlined = IconData(name="6mp", fontFamily="Material Symbols Outlined")
-    _7k_outlined = IconData(name="7k", fontFamily="Material Symbols Outlined")
-    _7k_plus_outlined = IconData(name="7k_plus", fontFamily="Material Symbols Outlined")
-    _7mp_outlined = IconData(name="7mp", fontFamily="Material Symbols Outlined")
-    _8k_outlined = IconData(name="8k", fontFamily="Material Symbols Outlined")
-    _8k_plus_outlined = IconData(name="8k_plus", fontFamily="Material Symbols Outlined")
-    _8mp_outlined = IconData(name="8mp", fontFamily="Material Symbols Outlined")
-    _9k_outlined = IconData(name="9k", fontFamily="Material Symbols Outlined")
-    _9k_plus_outlined = IconData(name="9k_plus", fontFamily="Material Symbols Outlined")
-    _9mp_outlined = IconData(name="9mp", fontFamily="Material Symbols Outlined")
-    abc_outlined = IconData(name="abc", fontFamily="Material Symbols Outlined")
-    ac_unit_outlined = IconData(name="ac_unit", fontFamily="Material Symbols Outlined")
-    access_alarm_outlined = IconData(name="access_alarm", fontFamily="Material Symbols Outlined")
-    access_alarms_outlined = IconData(name="access_alarms", fontFamily="Material Symbols Outlined")
-    access_time_outlined = IconData(name="access_time", fontFamily="Material Symbols Outlined")
-    access_time_filled_outlined = IconData(name="access_time_filled", fontFamily="Material Symbols Outlined")
-    accessibility_outlined = IconData(name="accessibility", fontFamily="Material Symbols Outlined")
-    accessibility_new_outlined = IconData(name="accessibility_new", fontFamily="Material Symbols Outlined")
-    accessible_outlined = IconData(name="accessible", fontFamily="Material Symbols Outlined")
-    accessible_forward_outlined = IconData(name="accessible_forward", fontFamily="Material Symbols Outlined")
-    accessible_menu_outlined = IconData(name="accessible_menu", fontFamily="Material Symbols Outlined")
-    account_balance_outlined = IconData(name="account_balance", fontFamily="Material Symbols Outlined")
-    account_balance_wallet_outlined = IconData(name="account_balance_wallet", fontFamily="Material Symbols Outlined")
-    account_box_outlined = IconData(name="account_box", fontFamily="Material Symbols Outlined")
-    account_child_outlined = IconData(name="account_child", fontFamily="Material Symbols Outlined")
-    account_child_invert_outlined = IconData(name="account_child_invert", fontFamily="Material Symbols Outlined")
-    account_circle_outlined = IconData(name="account_circle", fontFamily="Material Symbols Outlined")
-    account_circle_filled_outlined = IconData(name="account_circle_filled", fontFamily="Material Symbols Outlined")
-    account_circle_off_outlined = IconData(name="account_circle_off", fontFamily="Material Symbols Outlined")
-    account_tree_outlined = IconData(name="account_tree", fontFamily="Material Symbols Outlined")
-    action_key_outlined = IconData(name="action_key", fontFamily="Material Symbols Outlined")
-    activity_zone_outlined = IconData(name="activity_zone", fontFamily="Material Symbols Outlined")
-    acute_outlined = IconData(name="acute", fontFamily="Material Symbols Outlined")
-    ad_outlined = IconData(name="ad", fontFamily="Material Symbols Outlined")
-    ad_group_outlined = IconData(name="ad_group", fontFamily="Material Symbols Outlined")
-    ad_group_off_outlined = IconData(name="ad_group_off", fontFamily="Material Symbols Outlined")
-    ad_off_outlined = IconData(name="ad_off", fontFamily="Material Symbols Outlined")
-    ad_units_outlined = IconData(name="ad_units", fontFamily="Material Symbols Outlined")
-    adaptive_audio_mic_outlined = IconData(name="adaptive_audio_mic", fontFamily="Material Symbols Outlined")
-    adaptive_audio_mic_off_outlined = IconData(name="adaptive_audio_mic_off", fontFamily="Material Symbols Outlined")
-    adb_outlined = IconData(name="adb", fontFamily="Material Symbols Outlined")
-    add_outlined = IconData(name="add", fontFamily="Material Symbols Outlined")
-    add_2_outlined = IconData(name="add_2", fontFamily="Material Symbols Outlined")
-    add_a_photo_outlined = IconData(name="add_a_photo", fontFamily="Material Symbols Outlined")
-    add_ad_outlined = IconData(name="add_ad", fontFamily="Material Symbols Outlined")
-    add_alarm_outlined = IconData(name="add_alarm", fontFamily="Material Symbols Outlined")
-    add_alert_outlined = IconData(name="add_alert", fontFamily="Material Symbols Outlined")
-    add_box_outlined = IconData(name="add_box", fontFamily="Material Symbols Outlined")
-    add_business_outlined = IconData(name="add_business", fontFamily="Material Symbols Outlined")
-    add_call_outlined = IconData(name="add_call", fontFamily="Material Symbols Outlined")
-    add_card_outlined = IconData(name="add_card", fontFamily="Material Symbols Outlined")
-    add_chart_outlined = IconData(name="add_chart", fontFamily="Material Symbols Outlined")
-    add_circle_outlined = IconData(name="add_circle", fontFamily="Material Symbols Outlined")
-    add_circle_outline_outlined = IconData(name="add_circle_outline", fontFamily="Material Symbols Outlined")
-    add_column_left_outlined = IconData(name="add_column_left", fontFamily="Material Symbols Outlined")
-    add_column_right_outlined = IconData(name="add_column_right", fontFamily="Material Symbols Outlined")
-    add_comment_outlined = IconData(name="add_comment", fontFamily="Material Symbols Outlined")
-    add_diamond_outlined = IconData(name="add_diamond", fontFamily="Material Symbols Outlined")
-    add_home_outlined = IconData(name="add_home", fontFamily="Material Symbols Outlined")
-    add_home_work_outlined = IconData(name="add_home_work", fontFamily="Material Symbols Outlined")
-    add_ic_call_outlined = IconData(name="add_ic_call", fontFamily="Material Symbols Outlined")
-    add_link_outlined = IconData(name="add_link", fontFamily="Material Symbols Outlined")
-    add_location_outlined = IconData(name="add_location", fontFamily="Material Symbols Outlined")
-    add_location_alt_outlined = IconData(name="add_location_alt", fontFamily="Material Symbols Outlined")
-    add_moderator_outlined = IconData(name="add_moderator", fontFamily="Material Symbols Outlined")
-    add_notes_outlined = IconData(name="add_notes", fontFamily="Material Symbols Outlined")
-    add_photo_alternate_outlined = IconData(name="add_photo_alternate", fontFamily="Material Symbols Outlined")
-    add_reaction_outlined = IconData(name="add_reaction", fontFamily="Material Symbols Outlined")
-    add_road_outlined = IconData(name="add_road", fontFamily="Material Symbols Outlined")
-    add_row_above_outlined = IconData(name="add_row_above", fontFamily="Material Symbols Outlined")
-    add_row_below_outlined = IconData(name="add_row_below", fontFamily="Material Symbols Outlined")
-    add_shopping_cart_outlined = IconData(name="add_shopping_cart", fontFamily="Material Symbols Outlined")
-    add_task_outlined = IconData(name="add_task", fontFamily="Material Symbols Outlined")
-    add_to_drive_outlined = IconData(name="add_to_drive", fontFamily="Material Symbols Outlined")
-    add_to_home_screen_outlined = IconData(name="add_to_home_screen", fontFamily="Material Symbols Outlined")
-    add_to_photos_outlined = IconData(name="add_to_photos", fontFamily="Material Symbols Outlined")
-    add_to_queue_outlined = IconData(name="add_to_queue", fontFamily="Material Symbols Outlined")
-    add_triangle_outlined = IconData(name="add_triangle", fontFamily="Material Symbols Outlined")
-    addchart_outlined = IconData(name="addchart", fontFamily="Material Symbols Outlined")
-    adf_scanner_outlined = IconData(name="adf_scanner", fontFamily="Material Symbols Outlined")
-    adjust_outlined = IconData(name="adjust", fontFamily="Material Symbols Outlined")
-    admin_meds_outlined = IconData(name="admin_meds", fontFamily="Material Symbols Outlined")
-    admin_panel_settings_outlined = IconData(name="admin_panel_settings", fontFamily="Material Symbols Outlined")
-    ads_click_outlined = IconData(name="ads_click", fontFamily="Material Symbols Outlined")
-    agender_outlined = IconData(name="agender", fontFamily="Material Symbols Outlined")
-    agriculture_outlined = IconData(name="agriculture", fontFamily="Material Symbols Outlined")
-    air_outlined = IconData(name="air", fontFamily="Material Symbols Outlined")
-    air_freshener_outlined = IconData(name="air_freshener", fontFamily="Material Symbols Outlined")
-    air_purifier_outlined = IconData(name="air_purifier", fontFamily="Material Symbols Outlined")
-    air_purifier_gen_outlined = IconData(name="air_purifier_gen", fontFamily="Material Symbols Outlined")
-    airline_seat_flat_outlined = IconData(name="airline_seat_flat", fontFamily="Material Symbols Outlined")
-    airline_seat_flat_angled_outlined = IconData(name="airline_seat_flat_angled", fontFamily="Material Symbols Outlined")
-    airline_seat_individual_suite_outlined = IconData(name="airline_seat_individual_suite", fontFamily="Material Symbols Outlined")
-    airline_seat_legroom_extra_outlined = IconData(name="airline_seat_legroom_extra", fontFamily="Material Symbols Outlined")
-    airline_seat_legroom_normal_outlined = IconData(name="airline_seat_legroom_normal", fontFamily="Material Symbols Outlined")
-    airline_seat_legroom_reduced_outlined = IconData(name="airline_seat_legroom_reduced", fontFamily="Material Symbols Outlined")
-    airline_seat_recline_extra_outlined = IconData(name="airline_seat_recline_extra", fontFamily="Material Symbols Outlined")
-    airline_seat_recline_normal_outlined = IconData(name="airline_seat_recline_normal", fontFamily="Material Symbols Outlined")
-    airline_stops_outlined = IconData(name="airline_stops", fontFamily="Material Symbols Outlined")
-    airlines_outlined = IconData(name="airlines", fontFamily="Material Symbols Outlined")
-    airplane_ticket_outlined = IconData(name="airplane_ticket", fontFamily="Material Symbols Outlined")
-    airplanemode_active_outlined = IconData(name="airplanemode_active", fontFamily="Material Symbols Outlined")
-    airplanemode_inactive_outlined = IconData(name="airplanemode_inactive", fontFamily="Material Symbols Outlined")
-    airplay_outlined = IconData(name="airplay", fontFamily="Material Symbols Outlined")
-    airport_shuttle_outlined = IconData(name="airport_shuttle", fontFamily="Material Symbols Outlined")
-    airware_outlined = IconData(name="airware", fontFamily="Material Symbols Outlined")
-    airwave_outlined = IconData(name="airwave", fontFamily="Material Symbols Outlined")
-    alarm_outlined = IconData(name="alarm", fontFamily="Material Symbols Outlined")
-    alarm_add_outlined = IconData(name="alarm_add", fontFamily="Material Symbols Outlined")
-    alarm_off_outlined = IconData(name="alarm_off", fontFamily="Material Symbols Outlined")
-    alarm_on_outlined = IconData(name="alarm_on", fontFamily="Material Symbols Outlined")
-    alarm_pause_outlined = IconData(name="alarm_pause", fontFamily="Material Symbols Outlined")
-    alarm_smart_wake_outlined = IconData(name="alarm_smart_wake", fontFamily="Material Symbols Outlined")
-    album_outlined = IconData(name="album", fontFamily="Material Symbols Outlined")
-    align_center_outlined = IconData(name="align_center", fontFamily="Material Symbols Outlined")
-    align_end_outlined = IconData(name="align_end", fontFamily="Material Symbols Outlined")
-    align_flex_center_outlined = IconData(name="align_flex_center", fontFamily="Material Symbols Outlined")
-    align_flex_end_outlined = IconData(name="align_flex_end", fontFamily="Material Symbols Outlined")
-    align_flex_start_outlined = IconData(name="align_flex_start", fontFamily="Material Symbols Outlined")
-    align_horizontal_center_outlined = IconData(name="align_horizontal_center", fontFamily="Material Symbols Outlined")
-    align_horizontal_left_outlined = IconData(name="align_horizontal_left", fontFamily="Material Symbols Outlined")
-    align_horizontal_right_outlined = IconData(name="align_horizontal_right", fontFamily="Material Symbols Outlined")
-    align_items_stretch_outlined = IconData(name="align_items_stretch", fontFamily="Material Symbols Outlined")
-    align_justify_center_outlined = IconData(name="align_justify_center", fontFamily="Material Symbols Outlined")
-    align_justify_flex_end_outlined = IconData(name="align_justify_flex_end", fontFamily="Material Symbols Outlined")
-    align_justify_flex_start_outlined = IconData(name="align_justify_flex_start", fontFamily="Material Symbols Outlined")
-    align_justify_space_around_outlined = IconData(name="align_justify_space_around", fontFamily="Material Symbols Outlined")
-    align_justify_space_between_outlined = IconData(name="align_justify_space_between", fontFamily="Material Symbols Outlined")
-    align_justify_space_even_outlined = IconData(name="align_justify_space_even", fontFamily="Material Symbols Outlined")
-    align_justify_stretch_outlined = IconData(name="align_justify_stretch", fontFamily="Material Symbols Outlined")
-    align_self_stretch_outlined = IconData(name="align_self_stretch", fontFamily="Material Symbols Outlined")
-    align_space_around_outlined = IconData(name="align_space_around", fontFamily="Material Symbols Outlined")
-    align_space_between_outlined = IconData(name="align_space_between", fontFamily="Material Symbols Outlined")
-    align_space_even_outlined = IconData(name="align_space_even", fontFamily="Material Symbols Outlined")
-    align_start_outlined = IconData(name="align_start", fontFamily="Material Symbols Outlined")
-    align_stretch_outlined = IconData(name="align_stretch", fontFamily="Material Symbols Outlined")
-    align_vertical_bottom_outlined = IconData(name="align_vertical_bottom", fontFamily="Material Symbols Outlined")
-    align_vertical_center_outlined = IconData(name="align_vertical_center", fontFamily="Material Symbols Outlined")
-    align_vertical_top_outlined = IconData(name="align_vertical_top", fontFamily="Material Symbols Outlined")
-    all_inbox_outlined = IconData(name="all_inbox", fontFamily="Material Symbols Outlined")
-    all_inclusive_outlined = IconData(name="all_inclusive", fontFamily="Material Symbols Outlined")
-    all_match_outlined = IconData(name="all_match", fontFamily="Material Symbols Outlined")
-    all_out_outlined = IconData(name="all_out", fontFamily="Material Symbols Outlined")
-    allergies_outlined = IconData(name="allergies", fontFamily="Material Symbols Outlined")
-    allergy_outlined = IconData(name="allergy", fontFamily="Material Symbols Outlined")
-    alt_route_outlined = IconData(name="alt_route", fontFamily="Material Symbols Outlined")
-    alternate_email_outlined = IconData(name="alternate_email", fontFamily="Material Symbols Outlined")
-    altitude_outlined = IconData(name="altitude", fontFamily="Material Symbols Outlined")
-    ambient_screen_outlined = IconData(name="ambient_screen", fontFamily="Material Symbols Outlined")
-    ambulance_outlined = IconData(name="ambulance", fontFamily="Material Symbols Outlined")
-    amend_outlined = IconData(name="amend", fontFamily="Material Symbols Outlined")
-    amp_stories_outlined = IconData(name="amp_stories", fontFamily="Material Symbols Outlined")
-    analytics_outlined = IconData(name="analytics", fontFamily="Material Symbols Outlined")
-    anchor_outlined = IconData(name="anchor", fontFamily="Material Symbols Outlined")
-    android_outlined = IconData(name="android", fontFamily="Material Symbols Outlined")
-    animated_images_outlined = IconData(name="animated_images", fontFamily="Material Symbols Outlined")
-    animation_outlined = IconData(name="animation", fontFamily="Material Symbols Outlined")
-    announcement_outlined = IconData(name="announcement", fontFamily="Material Symbols Outlined")
-    aod_outlined = IconData(name="aod", fontFamily="Material Symbols Outlined")
-    aod_tablet_outlined = IconData(name="aod_tablet", fontFamily="Material Symbols Outlined")
-    aod_watch_outlined = IconData(name="aod_watch", fontFamily="Material Symbols Outlined")
-    apartment_outlined = IconData(name="apartment", fontFamily="Material Symbols Outlined")
-    api_outlined = IconData(name="api", fontFamily="Material Symbols Outlined")
-    apk_document_outlined = IconData(name="apk_document", fontFamily="Material Symbols Outlined")
-    apk_install_outlined = IconData(name="apk_install", fontFamily="Material Symbols Outlined")
-    app_badging_outlined = IconData(name="app_badging", fontFamily="Material Symbols Outlined")
-    app_blocking_outlined = IconData(name="app_blocking", fontFamily="Material Symbols Outlined")
-    app_promo_outlined = IconData(name="app_promo", fontFamily="Material Symbols Outlined")
-    app_registration_outlined = IconData(name="app_registration", fontFamily="Material Symbols Outlined")
-    app_settings_alt_outlined = IconData(name="app_settings_alt", fontFamily="Material Symbols Outlined")
-    app_shortcut_outlined = IconData(name="app_shortcut", fontFamily="Material Symbols Outlined")
-    apparel_outlined = IconData(name="apparel", fontFamily="Material Symbols Outlined")
-    approval_outlined = IconData(name="approval", fontFamily="Material Symbols Outlined")
-    approval_delegation_outlined = IconData(name="approval_delegation", fontFamily="Material Symbols Outlined")
-    apps_outlined = IconData(name="apps", fontFamily="Material Symbols Outlined")
-    apps_outage_outlined = IconData(name="apps_outage", fontFamily="Material Symbols Outlined")
-    aq_outlined = IconData(name="aq", fontFamily="Material Symbols Outlined")
-    aq_indoor_outlined = IconData(name="aq_indoor", fontFamily="Material Symbols Outlined")
-    ar_on_you_outlined = IconData(name="ar_on_you", fontFamily="Material Symbols Outlined")
-    ar_stickers_outlined = IconData(name="ar_stickers", fontFamily="Material Symbols Outlined")
-    architecture_outlined = IconData(name="architecture", fontFamily="Material Symbols Outlined")
-    archive_outlined = IconData(name="archive", fontFamily="Material Symbols Outlined")
-    area_chart_outlined = IconData(name="area_chart", fontFamily="Material Symbols Outlined")
-    arming_countdown_outlined = IconData(name="arming_countdown", fontFamily="Material Symbols Outlined")
-    arrow_and_edge_outlined = IconData(name="arrow_and_edge", fontFamily="Material Symbols Outlined")
-    arrow_back_outlined = IconData(name="arrow_back", fontFamily="Material Symbols Outlined")
-    arrow_back_2_outlined = IconData(name="arrow_back_2", fontFamily="Material Symbols Outlined")
-    arrow_back_ios_outlined = IconData(name="arrow_back_ios", fontFamily="Material Symbols Outlined")
-    arrow_back_ios_new_outlined = IconData(name="arrow_back_ios_new", fontFamily="Material Symbols Outlined")
-    arrow_circle_down_outlined = IconData(name="arrow_circle_down", fontFamily="Material Symbols Outlined")
-    arrow_circle_left_outlined = IconData(name="arrow_circle_left", fontFamily="Material Symbols Outlined")
-    arrow_circle_right_outlined = IconData(name="arrow_circle_right", fontFamily="Material Symbols Outlined")
-    arrow_circle_up_outlined = IconData(name="arrow_circle_up", fontFamily="Material Symbols Outlined")
-    arrow_cool_down_outlined = IconData(name="arrow_cool_down", fontFamily="Material Symbols Outlined")
-    arrow_downward_outlined = IconData(name="arrow_downward", fontFamily="Material Symbols Outlined")
-    arrow_downward_alt_outlined = IconData(name="arrow_downward_alt", fontFamily="Material Symbols Outlined")
-    arrow_drop_down_outlined = IconData(name="arrow_drop_down", fontFamily="Material Symbols Outlined")
-    arrow_drop_down_circle_outlined = IconData(name="arrow_drop_down_circle", fontFamily="Material Symbols Outlined")
-    arrow_drop_up_outlined = IconData(name="arrow_drop_up", fontFamily="Material Symbols Outlined")
-    arrow_forward_outlined = IconData(name="arrow_forward", fontFamily="Material Symbols Outlined")
-    arrow_forward_ios_outlined = IconData(name="arrow_forward_ios", fontFamily="Material Symbols Outlined")
-    arrow_insert_outlined = IconData(name="arrow_insert", fontFamily="Material Symbols Outlined")
-    arrow_left_outlined = IconData(name="arrow_left", fontFamily="Material Symbols Outlined")
-    arrow_left_alt_outlined = IconData(name="arrow_left_alt", fontFamily="Material Symbols Outlined")
-    arrow_menu_close_outlined = IconData(name="arrow_menu_close", fontFamily="Material Symbols Outlined")
-    arrow_menu_open_outlined = IconData(name="arrow_menu_open", fontFamily="Material Symbols Outlined")
-    arrow_or_edge_outlined = IconData(name="arrow_or_edge", fontFamily="Material Symbols Outlined")
-    arrow_outward_outlined = IconData(name="arrow_outward", fontFamily="Material Symbols Outlined")
-    arrow_range_outlined = IconData(name="arrow_range", fontFamily="Material Symbols Outlined")
-    arrow_right_outlined = IconData(name="arrow_right", fontFamily="Material Symbols Outlined")
-    arrow_right_alt_outlined = IconData(name="arrow_right_alt", fontFamily="Material Symbols Outlined")
-    arrow_selector_tool_outlined = IconData(name="arrow_selector_tool", fontFamily="Material Symbols Outlined")
-    arrow_split_outlined = IconData(name="arrow_split", fontFamily="Material Symbols Outlined")
-    arrow_top_left_outlined = IconData(name="arrow_top_left", fontFamily="Material Symbols Outlined")
-    arrow_top_right_outlined = IconData(name="arrow_top_right", fontFamily="Material Symbols Outlined")
-    arrow_upload_progress_outlined = IconData(name="arrow_upload_progress", fontFamily="Material Symbols Outlined")
-    arrow_upload_ready_outlined = IconData(name="arrow_upload_ready", fontFamily="Material Symbols Outlined")
-    arrow_upward_outlined = IconData(name="arrow_upward", fontFamily="Material Symbols Outlined")
-    arrow_upward_alt_outlined = IconData(name="arrow_upward_alt", fontFamily="Material Symbols Outlined")
-    arrow_warm_up_outlined = IconData(name="arrow_warm_up", fontFamily="Material Symbols Outlined")
-    arrows_input_outlined = IconData(name="arrows_input", fontFamily="Material Symbols Outlined")
-    arrows_more_down_outlined = IconData(name="arrows_more_down", fontFamily="Material Symbols Outlined")
-    arrows_more_up_outlined = IconData(name="arrows_more_up", fontFamily="Material Symbols Outlined")
-    arrows_output_outlined = IconData(name="arrows_output", fontFamily="Material Symbols Outlined")
-    arrows_outward_outlined = IconData(name="arrows_outward", fontFamily="Material Symbols Outlined")
-    art_track_outlined = IconData(name="art_track", fontFamily="Material Symbols Outlined")
-    article_outlined = IconData(name="article", fontFamily="Material Symbols Outlined")
-    article_person_outlined = IconData(name="article_person", fontFamily="Material Symbols Outlined")
-    article_shortcut_outlined = IconData(name="article_shortcut", fontFamily="Material Symbols Outlined")
-    artist_outlined = IconData(name="artist", fontFamily="Material Symbols Outlined")
-    aspect_ratio_outlined = IconData(name="aspect_ratio", fontFamily="Material Symbols Outlined")
-    assessment_outlined = IconData(name="assessment", fontFamily="Material Symbols Outlined")
-    assignment_outlined = IconData(name="assignment", fontFamily="Material Symbols Outlined")
-    assignment_add_outlined = IconData(name="assignment_add", fontFamily="Material Symbols Outlined")
-    assignment_ind_outlined = IconData(name="assignment_ind", fontFamily="Material Symbols Outlined")
-    assignment_late_outlined = IconData(name="assignment_late", fontFamily="Material Symbols Outlined")
-    assignment_return_outlined = IconData(name="assignment_return", fontFamily="Material Symbols Outlined")
-    assignment_returned_outlined = IconData(name="assignment_returned", fontFamily="Material Symbols Outlined")
-    assignment_turned_in_outlined = IconData(name="assignment_turned_in", fontFamily="Material Symbols Outlined")
-    assist_walker_outlined = IconData(name="assist_walker", fontFamily="Material Symbols Outlined")
-    assistant_outlined = IconData(name="assistant", fontFamily="Material Symbols Outlined")
-    assistant_device_outlined = IconData(name="assistant_device", fontFamily="Material Symbols Outlined")
-    assistant_direction_outlined = IconData(name="assistant_direction", fontFamily="Material Symbols Outlined")
-    assistant_navigation_outlined = IconData(name="assistant_navigation", fontFamily="Material Symbols Outlined")
-    assistant_on_hub_outlined = IconData(name="assistant_on_hub", fontFamily="Material Symbols Outlined")
-    assistant_photo_outlined = IconData(name="assistant_photo", fontFamily="Material Symbols Outlined")
-    assured_workload_outlined = IconData(name="assured_workload", fontFamily="Material Symbols Outlined")
-    asterisk_outlined = IconData(name="asterisk", fontFamily="Material Symbols Outlined")
-    astrophotography_auto_outlined = IconData(name="astrophotography_auto", fontFamily="Material Symbols Outlined")
-    astrophotography_off_outlined = IconData(name="astrophotography_off", fontFamily="Material Symbols Outlined")
-    atm_outlined = IconData(name="atm", fontFamily="Material Symbols Outlined")
-    atr_outlined = IconData(name="atr", fontFamily="Material Symbols Outlined")
-    attach_email_outlined = IconData(name="attach_email", fontFamily="Material Symbols Outlined")
-    attach_file_outlined = IconData(name="attach_file", fontFamily="Material Symbols Outlined")
-    attach_file_add_outlined = IconData(name="attach_file_add", fontFamily="Material Symbols Outlined")
-    attach_file_off_outlined = IconData(name="attach_file_off", fontFamily="Material Symbols Outlined")
-    attach_money_outlined = IconData(name="attach_money", fontFamily="Material Symbols Outlined")
-    attachment_outlined = IconData(name="attachment", fontFamily="Material Symbols Outlined")
-    attractions_outlined = IconData(name="attractions", fontFamily="Material Symbols Outlined")
-    attribution_outlined = IconData(name="attribution", fontFamily="Material Symbols Outlined")
-    audio_description_outlined = IconData(name="audio_description", fontFamily="Material Symbols Outlined")
-    audio_file_outlined = IconData(name="audio_file", fontFamily="Material Symbols Outlined")
-    audio_video_receiver_outlined = IconData(name="audio_video_receiver", fontFamily="Material Symbols Outlined")
-    audiotrack_outlined = IconData(name="audiotrack", fontFamily="Material Symbols Outlined")
-    auto_activity_zone_outlined = IconData(name="auto_activity_zone", fontFamily="Material Symbols Outlined")
-    auto_awesome_outlined = IconData(name="auto_awesome", fontFamily="Material Symbols Outlined")
-    auto_awesome_mosaic_outlined = IconData(name="auto_awesome_mosaic", fontFamily="Material Symbols Outlined")
-    auto_awesome_motion_outlined = IconData(name="auto_awesome_motion", fontFamily="Material Symbols Outlined")
-    auto_delete_outlined = IconData(name="auto_delete", fontFamily="Material Symbols Outlined")
-    auto_detect_voice_outlined = IconData(name="auto_detect_voice", fontFamily="Material Symbols Outlined")
-    auto_draw_solid_outlined = IconData(name="auto_draw_solid", fontFamily="Material Symbols Outlined")
-    auto_fix_outlined = IconData(name="auto_fix", fontFamily="Material Symbols Outlined")
-    auto_fix_high_outlined = IconData(name="auto_fix_high", fontFamily="Material Symbols Outlined")
-    auto_fix_normal_outlined = IconData(name="auto_fix_normal", fontFamily="Material Symbols Outlined")
-    auto_fix_off_outlined = IconData(name="auto_fix_off", fontFamily="Material Symbols Outlined")
-    auto_graph_outlined = IconData(name="auto_graph", fontFamily="Material Symbols Outlined")
-    auto_label_outlined = IconData(name="auto_label", fontFamily="Material Symbols Outlined")
-    auto_meeting_room_outlined = IconData(name="auto_meeting_room", fontFamily="Material Symbols Outlined")
-    auto_mode_outlined = IconData(name="auto_mode", fontFamily="Material Symbols Outlined")
-    auto_read_pause_outlined = IconData(name="auto_read_pause", fontFamily="Material Symbols Outlined")
-    auto_read_play_outlined = IconData(name="auto_read_play", fontFamily="Material Symbols Outlined")
-    auto_schedule_outlined = IconData(name="auto_schedule", fontFamily="Material Symbols Outlined")
-    auto_stories_outlined = IconData(name="auto_stories", fontFamily="Material Symbols Outlined")
-    auto_timer_outlined = IconData(name="auto_timer", fontFamily="Material Symbols Outlined")
-    auto_towing_outlined = IconData(name="auto_towing", fontFamily="Material Symbols Outlined")
-    auto_transmission_outlined = IconData(name="auto_transmission", fontFamily="Material Symbols Outlined")
-    auto_videocam_outlined = IconData(name="auto_videocam", fontFamily="Material Symbols Outlined")
-    autofps_select_outlined = IconData(name="autofps_select", fontFamily="Material Symbols Outlined")
-    automation_outlined = IconData(name="automation", fontFamily="Material Symbols Outlined")
-    autopause_outlined = IconData(name="autopause", fontFamily="Material Symbols Outlined")
-    autopay_outlined = IconData(name="autopay", fontFamily="Material Symbols Outlined")
-    autoplay_outlined = IconData(name="autoplay", fontFamily="Material Symbols Outlined")
-    autorenew_outlined = IconData(name="autorenew", fontFamily="Material Symbols Outlined")
-    autostop_outlined = IconData(name="autostop", fontFamily="Material Symbols Outlined")
-    av1_outlined = IconData(name="av1", fontFamily="Material Symbols Outlined")
-    av_timer_outlined = IconData(name="av_timer", fontFamily="Material Symbols Outlined")
-    avc_outlined = IconData(name="avc", fontFamily="Material Symbols Outlined")
-    avg_pace_outlined = IconData(name="avg_pace", fontFamily="Material Symbols Outlined")
-    avg_time_outlined = IconData(name="avg_time", fontFamily="Material Symbols Outlined")
-    award_star_outlined = IconData(name="award_star", fontFamily="Material Symbols Outlined")
-    azm_outlined = IconData(name="azm", fontFamily="Material Symbols Outlined")
-    baby_changing_station_outlined = IconData(name="baby_changing_station", fontFamily="Material Symbols Outlined")
-    back_hand_outlined = IconData(name="back_hand", fontFamily="Material Symbols Outlined")
-    back_to_tab_outlined = IconData(name="back_to_tab", fontFamily="Material Symbols Outlined")
-    background_dot_large_outlined = IconData(name="background_dot_large", fontFamily="Material Symbols Outlined")
-    background_dot_small_outlined = IconData(name="background_dot_small", fontFamily="Material Symbols Outlined")
-    background_grid_small_outlined = IconData(name="background_grid_small", fontFamily="Material Symbols Outlined")
-    background_replace_outlined = IconData(name="background_replace", fontFamily="Material Symbols Outlined")
-    backlight_high_outlined = IconData(name="backlight_high", fontFamily="Material Symbols Outlined")
-    backlight_high_off_outlined = IconData(name="backlight_high_off", fontFamily="Material Symbols Outlined")
-    backlight_low_outlined = IconData(name="backlight_low", fontFamily="Material Symbols Outlined")
-    backpack_outlined = IconData(name="backpack", fontFamily="Material Symbols Outlined")
-    backspace_outlined = IconData(name="backspace", fontFamily="Material Symbols Outlined")
-    backup_outlined = IconData(name="backup", fontFamily="Material Symbols Outlined")
-    backup_table_outlined = IconData(name="backup_table", fontFamily="Material Symbols Outlined")
-    badge_outlined = IconData(name="badge", fontFamily="Material Symbols Outlined")
-    badge_critical_battery_outlined = IconData(name="badge_critical_battery", fontFamily="Material Symbols Outlined")
-    bakery_dining_outlined = IconData(name="bakery_dining", fontFamily="Material Symbols Outlined")
-    balance_outlined = IconData(name="balance", fontFamily="Material Symbols Outlined")
-    balcony_outlined = IconData(name="balcony", fontFamily="Material Symbols Outlined")
-    ballot_outlined = IconData(name="ballot", fontFamily="Material Symbols Outlined")
-    bar_chart_outlined = IconData(name="bar_chart", fontFamily="Material Symbols Outlined")
-    bar_chart_4_bars_outlined = IconData(name="bar_chart_4_bars", fontFamily="Material Symbols Outlined")
-    bar_chart_off_outlined = IconData(name="bar_chart_off", fontFamily="Material Symbols Outlined")
-    barcode_outlined = IconData(name="barcode", fontFamily="Material Symbols Outlined")
-    barcode_reader_outlined = IconData(name="barcode_reader", fontFamily="Material Symbols Outlined")
-    barcode_scanner_outlined = IconData(name="barcode_scanner", fontFamily="Material Symbols Outlined")
-    barefoot_outlined = IconData(name="barefoot", fontFamily="Material Symbols Outlined")
-    batch_prediction_outlined = IconData(name="batch_prediction", fontFamily="Material Symbols Outlined")
-    bath_outdoor_outlined = IconData(name="bath_outdoor", fontFamily="Material Symbols Outlined")
-    bath_private_outlined = IconData(name="bath_private", fontFamily="Material Symbols Outlined")
-    bath_public_large_outlined = IconData(name="bath_public_large", fontFamily="Material Symbols Outlined")
-    bathroom_outlined = IconData(name="bathroom", fontFamily="Material Symbols Outlined")
-    bathtub_outlined = IconData(name="bathtub", fontFamily="Material Symbols Outlined")
-    battery_0_bar_outlined = IconData(name="battery_0_bar", fontFamily="Material Symbols Outlined")
-    battery_1_bar_outlined = IconData(name="battery_1_bar", fontFamily="Material Symbols Outlined")
-    battery_20_outlined = IconData(name="battery_20", fontFamily="Material Symbols Outlined")
-    battery_2_bar_outlined = IconData(name="battery_2_bar", fontFamily="Material Symbols Outlined")
-    battery_30_outlined = IconData(name="battery_30", fontFamily="Material Symbols Outlined")
-    battery_3_bar_outlined = IconData(name="battery_3_bar", fontFamily="Material Symbols Outlined")
-    battery_4_bar_outlined = IconData(name="battery_4_bar", fontFamily="Material Symbols Outlined")
-    battery_50_outlined = IconData(name="battery_50", fontFamily="Material Symbols Outlined")
-    battery_5_bar_outlined = IconData(name="battery_5_bar", fontFamily="Material Symbols Outlined")
-    battery_60_outlined = IconData(name="battery_60", fontFamily="Material Symbols Outlined")
-    battery_6_bar_outlined = IconData(name="battery_6_bar", fontFamily="Material Symbols Outlined")
-    battery_80_outlined = IconData(name="battery_80", fontFamily="Material Symbols Outlined")
-    battery_90_outlined = IconData(name="battery_90", fontFamily="Material Symbols Outlined")
-    battery_alert_outlined = IconData(name="battery_alert", fontFamily="Material Symbols Outlined")
-    battery_android_0_outlined = IconData(name="battery_android_0", fontFamily="Material Symbols Outlined")
-    battery_android_1_outlined = IconData(name="battery_android_1", fontFamily="Material Symbols Outlined")
-    battery_android_2_outlined = IconData(name="battery_android_2", fontFamily="Material Symbols Outlined")
-    battery_android_3_outlined = IconData(name="battery_android_3", fontFamily="Material Symbols Outlined")
-    battery_android_4_outlined = IconData(name="battery_android_4", fontFamily="Material Symbols Outlined")
-    battery_android_5_outlined = IconData(name="battery_android_5", fontFamily="Material Symbols Outlined")
-    battery_android_6_outlined = IconData(name="battery_android_6", fontFamily="Material Symbols Outlined")
-    battery_android_alert_outlined = IconData(name="battery_android_alert", fontFamily="Material Symbols Outlined")
-    battery_android_bolt_outlined = IconData(name="battery_android_bolt", fontFamily="Material Symbols Outlined")
-    battery_android_full_outlined = IconData(name="battery_android_full", fontFamily="Material Symbols Outlined")
-    battery_android_plus_outlined = IconData(name="battery_android_plus", fontFamily="Material Symbols Outlined")
-    battery_android_question_outlined = IconData(name="battery_android_question", fontFamily="Material Symbols Outlined")
-    battery_android_share_outlined = IconData(name="battery_android_share", fontFamily="Material Symbols Outlined")
-    battery_android_shield_outlined = IconData(name="battery_android_shield", fontFamily="Material Symbols Outlined")
-    battery_change_outlined = IconData(name="battery_change", fontFamily="Material Symbols Outlined")
-    battery_charging_20_outlined = IconData(name="battery_charging_20", fontFamily="Material Symbols Outlined")
-    battery_charging_30_outlined = IconData(name="battery_charging_30", fontFamily="Material Symbols Outlined")
-    battery_charging_50_outlined = IconData(name="battery_charging_50", fontFamily="Material Symbols Outlined")
-    battery_charging_60_outlined = IconData(name="battery_charging_60", fontFamily="Material Symbols Outlined")
-    battery_charging_80_outlined = IconData(name="battery_charging_80", fontFamily="Material Symbols Outlined")
-    battery_charging_90_outlined = IconData(name="battery_charging_90", fontFamily="Material Symbols Outlined")
-    battery_charging_full_outlined = IconData(name="battery_charging_full", fontFamily="Material Symbols Outlined")
-    battery_error_outlined = IconData(name="battery_error", fontFamily="Material Symbols Outlined")
-    battery_full_outlined = IconData(name="battery_full", fontFamily="Material Symbols Outlined")
-    battery_full_alt_outlined = IconData(name="battery_full_alt", fontFamily="Material Symbols Outlined")
-    battery_horiz_000_outlined = IconData(name="battery_horiz_000", fontFamily="Material Symbols Outlined")
-    battery_horiz_050_outlined = IconData(name="battery_horiz_050", fontFamily="Material Symbols Outlined")
-    battery_horiz_075_outlined = IconData(name="battery_horiz_075", fontFamily="Material Symbols Outlined")
-    battery_low_outlined = IconData(name="battery_low", fontFamily="Material Symbols Outlined")
-    battery_plus_outlined = IconData(name="battery_plus", fontFamily="Material Symbols Outlined")
-    battery_profile_outlined = IconData(name="battery_profile", fontFamily="Material Symbols Outlined")
-    battery_saver_outlined = IconData(name="battery_saver", fontFamily="Material Symbols Outlined")
-    battery_share_outlined = IconData(name="battery_share", fontFamily="Material Symbols Outlined")
-    battery_status_good_outlined = IconData(name="battery_status_good", fontFamily="Material Symbols Outlined")
-    battery_std_outlined = IconData(name="battery_std", fontFamily="Material Symbols Outlined")
-    battery_unknown_outlined = IconData(name="battery_unknown", fontFamily="Material Symbols Outlined")
-    battery_vert_005_outlined = IconData(name="battery_vert_005", fontFamily="Material Symbols Outlined")
-    battery_vert_020_outlined = IconData(name="battery_vert_020", fontFamily="Material Symbols Outlined")
-    battery_vert_050_outlined = IconData(name="battery_vert_050", fontFamily="Material Symbols Outlined")
-    battery_very_low_outlined = IconData(name="battery_very_low", fontFamily="Material Symbols Outlined")
-    beach_access_outlined = IconData(name="beach_access", fontFamily="Material Symbols Outlined")
-    bed_outlined = IconData(name="bed", fontFamily="Material Symbols Outlined")
-    bedroom_baby_outlined = IconData(name="bedroom_baby", fontFamily="Material Symbols Outlined")
-    bedroom_child_outlined = IconData(name="bedroom_child", fontFamily="Material Symbols Outlined")
-    bedroom_parent_outlined = IconData(name="bedroom_parent", fontFamily="Material Symbols Outlined")
-    bedtime_outlined = IconData(name="bedtime", fontFamily="Material Symbols Outlined")
-    bedtime_off_outlined = IconData(name="bedtime_off", fontFamily="Material Symbols Outlined")
-    beenhere_outlined = IconData(name="beenhere", fontFamily="Material Symbols Outlined")
-    bento_outlined = IconData(name="bento", fontFamily="Material Symbols Outlined")
-    bia_outlined = IconData(name="bia", fontFamily="Material Symbols Outlined")
-    bid_landscape_outlined = IconData(name="bid_landscape", fontFamily="Material Symbols Outlined")
-    bid_landscape_disabled_outlined = IconData(name="bid_landscape_disabled", fontFamily="Material Symbols Outlined")
-    bigtop_updates_outlined = IconData(name="bigtop_updates", fontFamily="Material Symbols Outlined")
-    bike_dock_outlined = IconData(name="bike_dock", fontFamily="Material Symbols Outlined")
-    bike_lane_outlined = IconData(name="bike_lane", fontFamily="Material Symbols Outlined")
-    bike_scooter_outlined = IconData(name="bike_scooter", fontFamily="Material Symbols Outlined")
-    biotech_outlined = IconData(name="biotech", fontFamily="Material Symbols Outlined")
-    blanket_outlined = IconData(name="blanket", fontFamily="Material Symbols Outlined")
-    blender_outlined = IconData(name="blender", fontFamily="Material Symbols Outlined")
-    blind_outlined = IconData(name="blind", fontFamily="Material Symbols Outlined")
-    blinds_outlined = IconData(name="blinds", fontFamily="Material Symbols Outlined")
-    blinds_closed_outlined = IconData(name="blinds_closed", fontFamily="Material Symbols Outlined")
-    block_outlined = IconData(name="block", fontFamily="Material Symbols Outlined")
-    blood_pressure_outlined = IconData(name="blood_pressure", fontFamily="Material Symbols Outlined")
-    bloodtype_outlined = IconData(name="bloodtype", fontFamily="Material Symbols Outlined")
-    bluetooth_outlined = IconData(name="bluetooth", fontFamily="Material Symbols Outlined")
-    bluetooth_audio_outlined = IconData(name="bluetooth_audio", fontFamily="Material Symbols Outlined")
-    bluetooth_connected_outlined = IconData(name="bluetooth_connected", fontFamily="Material Symbols Outlined")
-    bluetooth_disabled_outlined = IconData(name="bluetooth_disabled", fontFamily="Material Symbols Outlined")
-    bluetooth_drive_outlined = IconData(name="bluetooth_drive", fontFamily="Material Symbols Outlined")
-    bluetooth_searching_outlined = IconData(name="bluetooth_searching", fontFamily="Material Symbols Outlined")
-    blur_circular_outlined = IconData(name="blur_circular", fontFamily="Material Symbols Outlined")
-    blur_linear_outlined = IconData(name="blur_linear", fontFamily="Material Symbols Outlined")
-    blur_medium_outlined = IconData(name="blur_medium", fontFamily="Material Symbols Outlined")
-    blur_off_outlined = IconData(name="blur_off", fontFamily="Material Symbols Outlined")
-    blur_on_outlined = IconData(name="blur_on", fontFamily="Material Symbols Outlined")
-    blur_short_outlined = IconData(name="blur_short", fontFamily="Material Symbols Outlined")
-    boat_bus_outlined = IconData(name="boat_bus", fontFamily="Material Symbols Outlined")
-    boat_railway_outlined = IconData(name="boat_railway", fontFamily="Material Symbols Outlined")
-    body_fat_outlined = IconData(name="body_fat", fontFamily="Material Symbols Outlined")
-    body_system_outlined = IconData(name="body_system", fontFamily="Material Symbols Outlined")
-    bolt_outlined = IconData(name="bolt", fontFamily="Material Symbols Outlined")
-    bomb_outlined = IconData(name="bomb", fontFamily="Material Symbols Outlined")
-    book_outlined = IconData(name="book", fontFamily="Material Symbols Outlined")
-    book_2_outlined = IconData(name="book_2", fontFamily="Material Symbols Outlined")
-    book_3_outlined = IconData(name="book_3", fontFamily="Material Symbols Outlined")
-    book_4_outlined = IconData(name="book_4", fontFamily="Material Symbols Outlined")
-    book_5_outlined = IconData(name="book_5", fontFamily="Material Symbols Outlined")
-    book_6_outlined = IconData(name="book_6", fontFamily="Material Symbols Outlined")
-    book_online_outlined = IconData(name="book_online", fontFamily="Material Symbols Outlined")
-    book_ribbon_outlined = IconData(name="book_ribbon", fontFamily="Material Symbols Outlined")
-    bookmark_outlined = IconData(name="bookmark", fontFamily="Material Symbols Outlined")
-    bookmark_add_outlined = IconData(name="bookmark_add", fontFamily="Material Symbols Outlined")
-    bookmark_added_outlined = IconData(name="bookmark_added", fontFamily="Material Symbols Outlined")
-    bookmark_bag_outlined = IconData(name="bookmark_bag", fontFamily="Material Symbols Outlined")
-    bookmark_border_outlined = IconData(name="bookmark_border", fontFamily="Material Symbols Outlined")
-    bookmark_check_outlined = IconData(name="bookmark_check", fontFamily="Material Symbols Outlined")
-    bookmark_flag_outlined = IconData(name="bookmark_flag", fontFamily="Material Symbols Outlined")
-    bookmark_heart_outlined = IconData(name="bookmark_heart", fontFamily="Material Symbols Outlined")
-    bookmark_manager_outlined = IconData(name="bookmark_manager", fontFamily="Material Symbols Outlined")
-    bookmark_remove_outlined = IconData(name="bookmark_remove", fontFamily="Material Symbols Outlined")
-    bookmark_star_outlined = IconData(name="bookmark_star", fontFamily="Material Symbols Outlined")
-    bookmarks_outlined = IconData(name="bookmarks", fontFamily="Material Symbols Outlined")
-    books_movies_and_music_outlined = IconData(name="books_movies_and_music", fontFamily="Material Symbols Outlined")
-    border_all_outlined = IconData(name="border_all", fontFamily="Material Symbols Outlined")
-    border_bottom_outlined = IconData(name="border_bottom", fontFamily="Material Symbols Outlined")
-    border_clear_outlined = IconData(name="border_clear", fontFamily="Material Symbols Outlined")
-    border_color_outlined = IconData(name="border_color", fontFamily="Material Symbols Outlined")
-    border_horizontal_outlined = IconData(name="border_horizontal", fontFamily="Material Symbols Outlined")
-    border_inner_outlined = IconData(name="border_inner", fontFamily="Material Symbols Outlined")
-    border_left_outlined = IconData(name="border_left", fontFamily="Material Symbols Outlined")
-    border_outer_outlined = IconData(name="border_outer", fontFamily="Material Symbols Outlined")
-    border_right_outlined = IconData(name="border_right", fontFamily="Material Symbols Outlined")
-    border_style_outlined = IconData(name="border_style", fontFamily="Material Symbols Outlined")
-    border_top_outlined = IconData(name="border_top", fontFamily="Material Symbols Outlined")
-    border_vertical_outlined = IconData(name="border_vertical", fontFamily="Material Symbols Outlined")
-    borg_outlined = IconData(name="borg", fontFamily="Material Symbols Outlined")
-    bottom_app_bar_outlined = IconData(name="bottom_app_bar", fontFamily="Material Symbols Outlined")
-    bottom_drawer_outlined = IconData(name="bottom_drawer", fontFamily="Material Symbols Outlined")
-    bottom_navigation_outlined = IconData(name="bottom_navigation", fontFamily="Material Symbols Outlined")
-    bottom_panel_close_outlined = IconData(name="bottom_panel_close", fontFamily="Material Symbols Outlined")
-    bottom_panel_open_outlined = IconData(name="bottom_panel_open", fontFamily="Material Symbols Outlined")
-    bottom_right_click_outlined = IconData(name="bottom_right_click", fontFamily="Material Symbols Outlined")
-    bottom_sheets_outlined = IconData(name="bottom_sheets", fontFamily="Material Symbols Outlined")
-    box_outlined = IconData(name="box", fontFamily="Material Symbols Outlined")
-    box_add_outlined = IconData(name="box_add", fontFamily="Material Symbols Outlined")
-    box_edit_outlined = IconData(name="box_edit", fontFamily="Material Symbols Outlined")
-    boy_outlined = IconData(name="boy", fontFamily="Material Symbols Outlined")
-    brand_awareness_outlined = IconData(name="brand_awareness", fontFamily="Material Symbols Outlined")
-    brand_family_outlined = IconData(name="brand_family", fontFamily="Material Symbols Outlined")
-    branding_watermark_outlined = IconData(name="branding_watermark", fontFamily="Material Symbols Outlined")
-    breakfast_dining_outlined = IconData(name="breakfast_dining", fontFamily="Material Symbols Outlined")
-    breaking_news_outlined = IconData(name="breaking_news", fontFamily="Material Symbols Outlined")
-    breaking_news_alt_1_outlined = IconData(name="breaking_news_alt_1", fontFamily="Material Symbols Outlined")
-    breastfeeding_outlined = IconData(name="breastfeeding", fontFamily="Material Symbols Outlined")
-    brick_outlined = IconData(name="brick", fontFamily="Material Symbols Outlined")
-    brightness_1_outlined = IconData(name="brightness_1", fontFamily="Material Symbols Outlined")
-    brightness_2_outlined = IconData(name="brightness_2", fontFamily="Material Symbols Outlined")
-    brightness_3_outlined = IconData(name="brightness_3", fontFamily="Material Symbols Outlined")
-    brightness_4_outlined = IconData(name="brightness_4", fontFamily="Material Symbols Outlined")
-    brightness_5_outlined = IconData(name="brightness_5", fontFamily="Material Symbols Outlined")
-    brightness_6_outlined = IconData(name="brightness_6", fontFamily="Material Symbols Outlined")
-    brightness_7_outlined = IconData(name="brightness_7", fontFamily="Material Symbols Outlined")
-    brightness_alert_outlined = IconData(name="brightness_alert", fontFamily="Material Symbols Outlined")
-    brightness_auto_outlined = IconData(name="brightness_auto", fontFamily="Material Symbols Outlined")
-    brightness_empty_outlined = IconData(name="brightness_empty", fontFamily="Material Symbols Outlined")
-    brightness_high_outlined = IconData(name="brightness_high", fontFamily="Material Symbols Outlined")
-    brightness_low_outlined = IconData(name="brightness_low", fontFamily="Material Symbols Outlined")
-    brightness_medium_outlined = IconData(name="brightness_medium", fontFamily="Material Symbols Outlined")
-    bring_your_own_ip_outlined = IconData(name="bring_your_own_ip", fontFamily="Material Symbols Outlined")
-    broadcast_on_home_outlined = IconData(name="broadcast_on_home", fontFamily="Material Symbols Outlined")
-    broadcast_on_personal_outlined = IconData(name="broadcast_on_personal", fontFamily="Material Symbols Outlined")
-    broken_image_outlined = IconData(name="broken_image", fontFamily="Material Symbols Outlined")
-    browse_outlined = IconData(name="browse", fontFamily="Material Symbols Outlined")
-    browse_activity_outlined = IconData(name="browse_activity", fontFamily="Material Symbols Outlined")
-    browse_gallery_outlined = IconData(name="browse_gallery", fontFamily="Material Symbols Outlined")
-    browser_not_supported_outlined = IconData(name="browser_not_supported", fontFamily="Material Symbols Outlined")
-    browser_updated_outlined = IconData(name="browser_updated", fontFamily="Material Symbols Outlined")
-    brunch_dining_outlined = IconData(name="brunch_dining", fontFamily="Material Symbols Outlined")
-    brush_outlined = IconData(name="brush", fontFamily="Material Symbols Outlined")
-    bubble_outlined = IconData(name="bubble", fontFamily="Material Symbols Outlined")
-    bubble_chart_outlined = IconData(name="bubble_chart", fontFamily="Material Symbols Outlined")
-    bubbles_outlined = IconData(name="bubbles", fontFamily="Material Symbols Outlined")
-    bug_report_outlined = IconData(name="bug_report", fontFamily="Material Symbols Outlined")
-    build_outlined = IconData(name="build", fontFamily="Material Symbols Outlined")
-    build_circle_outlined = IconData(name="build_circle", fontFamily="Material Symbols Outlined")
-    bungalow_outlined = IconData(name="bungalow", fontFamily="Material Symbols Outlined")
-    burst_mode_outlined = IconData(name="burst_mode", fontFamily="Material Symbols Outlined")
-    bus_alert_outlined = IconData(name="bus_alert", fontFamily="Material Symbols Outlined")
-    bus_railway_outlined = IconData(name="bus_railway", fontFamily="Material Symbols Outlined")
-    business_outlined = IconData(name="business", fontFamily="Material Symbols Outlined")
-    business_center_outlined = IconData(name="business_center", fontFamily="Material Symbols Outlined")
-    business_chip_outlined = IconData(name="business_chip", fontFamily="Material Symbols Outlined")
-    business_messages_outlined = IconData(name="business_messages", fontFamily="Material Symbols Outlined")
-    buttons_alt_outlined = IconData(name="buttons_alt", fontFamily="Material Symbols Outlined")
-    cabin_outlined = IconData(name="cabin", fontFamily="Material Symbols Outlined")
-    cable_outlined = IconData(name="cable", fontFamily="Material Symbols Outlined")
-    cable_car_outlined = IconData(name="cable_car", fontFamily="Material Symbols Outlined")
-    cached_outlined = IconData(name="cached", fontFamily="Material Symbols Outlined")
-    cadence_outlined = IconData(name="cadence", fontFamily="Material Symbols Outlined")
-    cake_outlined = IconData(name="cake", fontFamily="Material Symbols Outlined")
-    cake_add_outlined = IconData(name="cake_add", fontFamily="Material Symbols Outlined")
-    calculate_outlined = IconData(name="calculate", fontFamily="Material Symbols Outlined")
-    calendar_add_on_outlined = IconData(name="calendar_add_on", fontFamily="Material Symbols Outlined")
-    calendar_apps_script_outlined = IconData(name="calendar_apps_script", fontFamily="Material Symbols Outlined")
-    calendar_clock_outlined = IconData(name="calendar_clock", fontFamily="Material Symbols Outlined")
-    calendar_month_outlined = IconData(name="calendar_month", fontFamily="Material Symbols Outlined")
-    calendar_today_outlined = IconData(name="calendar_today", fontFamily="Material Symbols Outlined")
-    calendar_view_day_outlined = IconData(name="calendar_view_day", fontFamily="Material Symbols Outlined")
-    calendar_view_month_outlined = IconData(name="calendar_view_month", fontFamily="Material Symbols Outlined")
-    calendar_view_week_outlined = IconData(name="calendar_view_week", fontFamily="Material Symbols Outlined")
-    call_outlined = IconData(name="call", fontFamily="Material Symbols Outlined")
-    call_end_outlined = IconData(name="call_end", fontFamily="Material Symbols Outlined")
-    call_end_alt_outlined = IconData(name="call_end_alt", fontFamily="Material Symbols Outlined")
-    call_log_outlined = IconData(name="call_log", fontFamily="Material Symbols Outlined")
-    call_made_outlined = IconData(name="call_made", fontFamily="Material Symbols Outlined")
-    call_merge_outlined = IconData(name="call_merge", fontFamily="Material Symbols Outlined")
-    call_missed_outlined = IconData(name="call_missed", fontFamily="Material Symbols Outlined")
-    call_missed_outgoing_outlined = IconData(name="call_missed_outgoing", fontFamily="Material Symbols Outlined")
-    call_quality_outlined = IconData(name="call_quality", fontFamily="Material Symbols Outlined")
-    call_received_outlined = IconData(name="call_received", fontFamily="Material Symbols Outlined")
-    call_split_outlined = IconData(name="call_split", fontFamily="Material Symbols Outlined")
-    call_to_action_outlined = IconData(name="call_to_action", fontFamily="Material Symbols Outlined")
-    camera_outlined = IconData(name="camera", fontFamily="Material Symbols Outlined")
-    camera_alt_outlined = IconData(name="camera_alt", fontFamily="Material Symbols Outlined")
-    camera_enhance_outlined = IconData(name="camera_enhance", fontFamily="Material Symbols Outlined")
-    camera_front_outlined = IconData(name="camera_front", fontFamily="Material Symbols Outlined")
-    camera_indoor_outlined = IconData(name="camera_indoor", fontFamily="Material Symbols Outlined")
-    camera_outdoor_outlined = IconData(name="camera_outdoor", fontFamily="Material Symbols Outlined")
-    camera_rear_outlined = IconData(name="camera_rear", fontFamily="Material Symbols Outlined")
-    camera_roll_outlined = IconData(name="camera_roll", fontFamily="Material Symbols Outlined")
-    camera_video_outlined = IconData(name="camera_video", fontFamily="Material Symbols Outlined")
-    cameraswitch_outlined = IconData(name="cameraswitch", fontFamily="Material Symbols Outlined")
-    campaign_outlined = IconData(name="campaign", fontFamily="Material Symbols Outlined")
-    camping_outlined = IconData(name="camping", fontFamily="Material Symbols Outlined")
-    cancel_outlined = IconData(name="cancel", fontFamily="Material Symbols Outlined")
-    cancel_presentation_outlined = IconData(name="cancel_presentation", fontFamily="Material Symbols Outlined")
-    cancel_schedule_send_outlined = IconData(name="cancel_schedule_send", fontFamily="Material Symbols Outlined")
-    candle_outlined = IconData(name="candle", fontFamily="Material Symbols Outlined")
-    candlestick_chart_outlined = IconData(name="candlestick_chart", fontFamily="Material Symbols Outlined")
-    cannabis_outlined = IconData(name="cannabis", fontFamily="Material Symbols Outlined")
-    captive_portal_outlined = IconData(name="captive_portal", fontFamily="Material Symbols Outlined")
-    capture_outlined = IconData(name="capture", fontFamily="Material Symbols Outlined")
-    car_crash_outlined = IconData(name="car_crash", fontFamily="Material Symbols Outlined")
-    car_defrost_left_outlined = IconData(name="car_defrost_left", fontFamily="Material Symbols Outlined")
-    car_defrost_low_left_outlined = IconData(name="car_defrost_low_left", fontFamily="Material Symbols Outlined")
-    car_defrost_low_right_outlined = IconData(name="car_defrost_low_right", fontFamily="Material Symbols Outlined")
-    car_defrost_mid_low_left_outlined = IconData(name="car_defrost_mid_low_left", fontFamily="Material Symbols Outlined")
-    car_defrost_mid_right_outlined = IconData(name="car_defrost_mid_right", fontFamily="Material Symbols Outlined")
-    car_defrost_right_outlined = IconData(name="car_defrost_right", fontFamily="Material Symbols Outlined")
-    car_fan_low_left_outlined = IconData(name="car_fan_low_left", fontFamily="Material Symbols Outlined")
-    car_fan_low_mid_left_outlined = IconData(name="car_fan_low_mid_left", fontFamily="Material Symbols Outlined")
-    car_fan_low_right_outlined = IconData(name="car_fan_low_right", fontFamily="Material Symbols Outlined")
-    car_fan_mid_left_outlined = IconData(name="car_fan_mid_left", fontFamily="Material Symbols Outlined")
-    car_fan_mid_low_right_outlined = IconData(name="car_fan_mid_low_right", fontFamily="Material Symbols Outlined")
-    car_fan_mid_right_outlined = IconData(name="car_fan_mid_right", fontFamily="Material Symbols Outlined")
-    car_fan_recirculate_outlined = IconData(name="car_fan_recirculate", fontFamily="Material Symbols Outlined")
-    car_gear_outlined = IconData(name="car_gear", fontFamily="Material Symbols Outlined")
-    car_lock_outlined = IconData(name="car_lock", fontFamily="Material Symbols Outlined")
-    car_mirror_heat_outlined = IconData(name="car_mirror_heat", fontFamily="Material Symbols Outlined")
-    car_rental_outlined = IconData(name="car_rental", fontFamily="Material Symbols Outlined")
-    car_repair_outlined = IconData(name="car_repair", fontFamily="Material Symbols Outlined")
-    car_tag_outlined = IconData(name="car_tag", fontFamily="Material Symbols Outlined")
-    card_giftcard_outlined = IconData(name="card_giftcard", fontFamily="Material Symbols Outlined")
-    card_membership_outlined = IconData(name="card_membership", fontFamily="Material Symbols Outlined")
-    card_travel_outlined = IconData(name="card_travel", fontFamily="Material Symbols Outlined")
-    cardio_load_outlined = IconData(name="cardio_load", fontFamily="Material Symbols Outlined")
-    cardiology_outlined = IconData(name="cardiology", fontFamily="Material Symbols Outlined")
-    cards_outlined = IconData(name="cards", fontFamily="Material Symbols Outlined")
-    cards_star_outlined = IconData(name="cards_star", fontFamily="Material Symbols Outlined")
-    carpenter_outlined = IconData(name="carpenter", fontFamily="Material Symbols Outlined")
-    carry_on_bag_outlined = IconData(name="carry_on_bag", fontFamily="Material Symbols Outlined")
-    carry_on_bag_checked_outlined = IconData(name="carry_on_bag_checked", fontFamily="Material Symbols Outlined")
-    carry_on_bag_inactive_outlined = IconData(name="carry_on_bag_inactive", fontFamily="Material Symbols Outlined")
-    carry_on_bag_question_outlined = IconData(name="carry_on_bag_question", fontFamily="Material Symbols Outlined")
-    cases_outlined = IconData(name="cases", fontFamily="Material Symbols Outlined")
-    casino_outlined = IconData(name="casino", fontFamily="Material Symbols Outlined")
-    cast_outlined = IconData(name="cast", fontFamily="Material Symbols Outlined")
-    cast_connected_outlined = IconData(name="cast_connected", fontFamily="Material Symbols Outlined")
-    cast_for_education_outlined = IconData(name="cast_for_education", fontFamily="Material Symbols Outlined")
-    cast_pause_outlined = IconData(name="cast_pause", fontFamily="Material Symbols Outlined")
-    cast_warning_outlined = IconData(name="cast_warning", fontFamily="Material Symbols Outlined")
-    castle_outlined = IconData(name="castle", fontFamily="Material Symbols Outlined")
-    category_outlined = IconData(name="category", fontFamily="Material Symbols Outlined")
-    category_search_outlined = IconData(name="category_search", fontFamily="Material Symbols Outlined")
-    celebration_outlined = IconData(name="celebration", fontFamily="Material Symbols Outlined")
-    cell_merge_outlined = IconData(name="cell_merge", fontFamily="Material Symbols Outlined")
-    cell_tower_outlined = IconData(name="cell_tower", fontFamily="Material Symbols Outlined")
-    cell_wifi_outlined = IconData(name="cell_wifi", fontFamily="Material Symbols Outlined")
-    center_focus_strong_outlined = IconData(name="center_focus_strong", fontFamily="Material Symbols Outlined")
-    center_focus_weak_outlined = IconData(name="center_focus_weak", fontFamily="Material Symbols Outlined")
-    chair_outlined = IconData(name="chair", fontFamily="Material Symbols Outlined")
-    chair_alt_outlined = IconData(name="chair_alt", fontFamily="Material Symbols Outlined")
-    chalet_outlined = IconData(name="chalet", fontFamily="Material Symbols Outlined")
-    change_circle_outlined = IconData(name="change_circle", fontFamily="Material Symbols Outlined")
-    change_history_outlined = IconData(name="change_history", fontFamily="Material Symbols Outlined")
-    charger_outlined = IconData(name="charger", fontFamily="Material Symbols Outlined")
-    charging_station_outlined = IconData(name="charging_station", fontFamily="Material Symbols Outlined")
-    chart_data_outlined = IconData(name="chart_data", fontFamily="Material Symbols Outlined")
-    chat_outlined = IconData(name="chat", fontFamily="Material Symbols Outlined")
-    chat_add_on_outlined = IconData(name="chat_add_on", fontFamily="Material Symbols Outlined")
-    chat_apps_script_outlined = IconData(name="chat_apps_script", fontFamily="Material Symbols Outlined")
-    chat_bubble_outlined = IconData(name="chat_bubble", fontFamily="Material Symbols Outlined")
-    chat_bubble_outline_outlined = IconData(name="chat_bubble_outline", fontFamily="Material Symbols Outlined")
-    chat_error_outlined = IconData(name="chat_error", fontFamily="Material Symbols Outlined")
-    chat_info_outlined = IconData(name="chat_info", fontFamily="Material Symbols Outlined")
-    chat_paste_go_outlined = IconData(name="chat_paste_go", fontFamily="Material Symbols Outlined")
-    chat_paste_go_2_outlined = IconData(name="chat_paste_go_2", fontFamily="Material Symbols Outlined")
-    check_outlined = IconData(name="check", fontFamily="Material Symbols Outlined")
-    check_box_outlined = IconData(name="check_box", fontFamily="Material Symbols Outlined")
-    check_box_outline_blank_outlined = IconData(name="check_box_outline_blank", fontFamily="Material Symbols Outlined")
-    check_circle_outlined = IconData(name="check_circle", fontFamily="Material Symbols Outlined")
-    check_circle_filled_outlined = IconData(name="check_circle_filled", fontFamily="Material Symbols Outlined")
-    check_circle_outline_outlined = IconData(name="check_circle_outline", fontFamily="Material Symbols Outlined")
-    check_in_out_outlined = IconData(name="check_in_out", fontFamily="Material Symbols Outlined")
-    check_indeterminate_small_outlined = IconData(name="check_indeterminate_small", fontFamily="Material Symbols Outlined")
-    check_small_outlined = IconData(name="check_small", fontFamily="Material Symbols Outlined")
-    checkbook_outlined = IconData(name="checkbook", fontFamily="Material Symbols Outlined")
-    checked_bag_outlined = IconData(name="checked_bag", fontFamily="Material Symbols Outlined")
-    checked_bag_question_outlined = IconData(name="checked_bag_question", fontFamily="Material Symbols Outlined")
-    checklist_outlined = IconData(name="checklist", fontFamily="Material Symbols Outlined")
-    checklist_rtl_outlined = IconData(name="checklist_rtl", fontFamily="Material Symbols Outlined")
-    checkroom_outlined = IconData(name="checkroom", fontFamily="Material Symbols Outlined")
-    cheer_outlined = IconData(name="cheer", fontFamily="Material Symbols Outlined")
-    chef_hat_outlined = IconData(name="chef_hat", fontFamily="Material Symbols Outlined")
-    chess_outlined = IconData(name="chess", fontFamily="Material Symbols Outlined")
-    chess_pawn_outlined = IconData(name="chess_pawn", fontFamily="Material Symbols Outlined")
-    chevron_backward_outlined = IconData(name="chevron_backward", fontFamily="Material Symbols Outlined")
-    chevron_forward_outlined = IconData(name="chevron_forward", fontFamily="Material Symbols Outlined")
-    chevron_left_outlined = IconData(name="chevron_left", fontFamily="Material Symbols Outlined")
-    chevron_right_outlined = IconData(name="chevron_right", fontFamily="Material Symbols Outlined")
-    child_care_outlined = IconData(name="child_care", fontFamily="Material Symbols Outlined")
-    child_friendly_outlined = IconData(name="child_friendly", fontFamily="Material Symbols Outlined")
-    chip_extraction_outlined = IconData(name="chip_extraction", fontFamily="Material Symbols Outlined")
-    chips_outlined = IconData(name="chips", fontFamily="Material Symbols Outlined")
-    chrome_reader_mode_outlined = IconData(name="chrome_reader_mode", fontFamily="Material Symbols Outlined")
-    chromecast_2_outlined = IconData(name="chromecast_2", fontFamily="Material Symbols Outlined")
-    chromecast_device_outlined = IconData(name="chromecast_device", fontFamily="Material Symbols Outlined")
-    chronic_outlined = IconData(name="chronic", fontFamily="Material Symbols Outlined")
-    church_outlined = IconData(name="church", fontFamily="Material Symbols Outlined")
-    cinematic_blur_outlined = IconData(name="cinematic_blur", fontFamily="Material Symbols Outlined")
-    circle_outlined = IconData(name="circle", fontFamily="Material Symbols Outlined")
-    circle_notifications_outlined = IconData(name="circle_notifications", fontFamily="Material Symbols Outlined")
-    circles_outlined = IconData(name="circles", fontFamily="Material Symbols Outlined")
-    circles_ext_outlined = IconData(name="circles_ext", fontFamily="Material Symbols Outlined")
-    clarify_outlined = IconData(name="clarify", fontFamily="Material Symbols Outlined")
-    class_outlined = IconData(name="class", fontFamily="Material Symbols Outlined")
-    clean_hands_outlined = IconData(name="clean_hands", fontFamily="Material Symbols Outlined")
-    cleaning_outlined = IconData(name="cleaning", fontFamily="Material Symbols Outlined")
-    cleaning_bucket_outlined = IconData(name="cleaning_bucket", fontFamily="Material Symbols Outlined")
-    cleaning_services_outlined = IconData(name="cleaning_services", fontFamily="Material Symbols Outlined")
-    clear_outlined = IconData(name="clear", fontFamily="Material Symbols Outlined")
-    clear_all_outlined = IconData(name="clear_all", fontFamily="Material Symbols Outlined")
-    clear_day_outlined = IconData(name="clear_day", fontFamily="Material Symbols Outlined")
-    clear_night_outlined = IconData(name="clear_night", fontFamily="Material Symbols Outlined")
-    climate_mini_split_outlined = IconData(name="climate_mini_split", fontFamily="Material Symbols Outlined")
-    clinical_notes_outlined = IconData(name="clinical_notes", fontFamily="Material Symbols Outlined")
-    clock_arrow_down_outlined = IconData(name="clock_arrow_down", fontFamily="Material Symbols Outlined")
-    clock_arrow_up_outlined = IconData(name="clock_arrow_up", fontFamily="Material Symbols Outlined")
-    clock_loader_10_outlined = IconData(name="clock_loader_10", fontFamily="Material Symbols Outlined")
-    clock_loader_20_outlined = IconData(name="clock_loader_20", fontFamily="Material Symbols Outlined")
-    clock_loader_40_outlined = IconData(name="clock_loader_40", fontFamily="Material Symbols Outlined")
-    clock_loader_60_outlined = IconData(name="clock_loader_60", fontFamily="Material Symbols Outlined")
-    clock_loader_80_outlined = IconData(name="clock_loader_80", fontFamily="Material Symbols Outlined")
-    clock_loader_90_outlined = IconData(name="clock_loader_90", fontFamily="Material Symbols Outlined")
-    close_outlined = IconData(name="close", fontFamily="Material Symbols Outlined")
-    close_fullscreen_outlined = IconData(name="close_fullscreen", fontFamily="Material Symbols Outlined")
-    close_small_outlined = IconData(name="close_small", fontFamily="Material Symbols Outlined")
-    closed_caption_outlined = IconData(name="closed_caption", fontFamily="Material Symbols Outlined")
-    closed_caption_add_outlined = IconData(name="closed_caption_add", fontFamily="Material Symbols Outlined")
-    closed_caption_disabled_outlined = IconData(name="closed_caption_disabled", fontFamily="Material Symbols Outlined")
-    closed_caption_off_outlined = IconData(name="closed_caption_off", fontFamily="Material Symbols Outlined")
-    cloud_outlined = IconData(name="cloud", fontFamily="Material Symbols Outlined")
-    cloud_alert_outlined = IconData(name="cloud_alert", fontFamily="Material Symbols Outlined")
-    cloud_circle_outlined = IconData(name="cloud_circle", fontFamily="Material Symbols Outlined")
-    cloud_done_outlined = IconData(name="cloud_done", fontFamily="Material Symbols Outlined")
-    cloud_download_outlined = IconData(name="cloud_download", fontFamily="Material Symbols Outlined")
-    cloud_lock_outlined = IconData(name="cloud_lock", fontFamily="Material Symbols Outlined")
-    cloud_off_outlined = IconData(name="cloud_off", fontFamily="Material Symbols Outlined")
-    cloud_queue_outlined = IconData(name="cloud_queue", fontFamily="Material Symbols Outlined")
-    cloud_sync_outlined = IconData(name="cloud_sync", fontFamily="Material Symbols Outlined")
-    cloud_upload_outlined = IconData(name="cloud_upload", fontFamily="Material Symbols Outlined")
-    cloudy_outlined = IconData(name="cloudy", fontFamily="Material Symbols Outlined")
-    cloudy_filled_outlined = IconData(name="cloudy_filled", fontFamily="Material Symbols Outlined")
-    cloudy_snowing_outlined = IconData(name="cloudy_snowing", fontFamily="Material Symbols Outlined")
-    co2_outlined = IconData(name="co2", fontFamily="Material Symbols Outlined")
-    co_present_outlined = IconData(name="co_present", fontFamily="Material Symbols Outlined")
-    code_outlined = IconData(name="code", fontFamily="Material Symbols Outlined")
-    code_blocks_outlined = IconData(name="code_blocks", fontFamily="Material Symbols Outlined")
-    code_off_outlined = IconData(name="code_off", fontFamily="Material Symbols Outlined")
-    coffee_outlined = IconData(name="coffee", fontFamily="Material Symbols Outlined")
-    coffee_maker_outlined = IconData(name="coffee_maker", fontFamily="Material Symbols Outlined")
-    cognition_outlined = IconData(name="cognition", fontFamily="Material Symbols Outlined")
-    cognition_2_outlined = IconData(name="cognition_2", fontFamily="Material Symbols Outlined")
-    collapse_all_outlined = IconData(name="collapse_all", fontFamily="Material Symbols Outlined")
-    collapse_content_outlined = IconData(name="collapse_content", fontFamily="Material Symbols Outlined")
-    collections_outlined = IconData(name="collections", fontFamily="Material Symbols Outlined")
-    collections_bookmark_outlined = IconData(name="collections_bookmark", fontFamily="Material Symbols Outlined")
-    color_lens_outlined = IconData(name="color_lens", fontFamily="Material Symbols Outlined")
-    colorize_outlined = IconData(name="colorize", fontFamily="Material Symbols Outlined")
-    colors_outlined = IconData(name="colors", fontFamily="Material Symbols Outlined")
-    combine_columns_outlined = IconData(name="combine_columns", fontFamily="Material Symbols Outlined")
-    comedy_mask_outlined = IconData(name="comedy_mask", fontFamily="Material Symbols Outlined")
-    comic_bubble_outlined = IconData(name="comic_bubble", fontFamily="Material Symbols Outlined")
-    comment_outlined = IconData(name="comment", fontFamily="Material Symbols Outlined")
-    comment_bank_outlined = IconData(name="comment_bank", fontFamily="Material Symbols Outlined")
-    comments_disabled_outlined = IconData(name="comments_disabled", fontFamily="Material Symbols Outlined")
-    commit_outlined = IconData(name="commit", fontFamily="Material Symbols Outlined")
-    communication_outlined = IconData(name="communication", fontFamily="Material Symbols Outlined")
-    communities_outlined = IconData(name="communities", fontFamily="Material Symbols Outlined")
-    communities_filled_outlined = IconData(name="communities_filled", fontFamily="Material Symbols Outlined")
-    commute_outlined = IconData(name="commute", fontFamily="Material Symbols Outlined")
-    compare_outlined = IconData(name="compare", fontFamily="Material Symbols Outlined")
-    compare_arrows_outlined = IconData(name="compare_arrows", fontFamily="Material Symbols Outlined")
-    compass_calibration_outlined = IconData(name="compass_calibration", fontFamily="Material Symbols Outlined")
-    component_exchange_outlined = IconData(name="component_exchange", fontFamily="Material Symbols Outlined")
-    compost_outlined = IconData(name="compost", fontFamily="Material Symbols Outlined")
-    compress_outlined = IconData(name="compress", fontFamily="Material Symbols Outlined")
-    computer_outlined = IconData(name="computer", fontFamily="Material Symbols Outlined")
-    computer_arrow_up_outlined = IconData(name="computer_arrow_up", fontFamily="Material Symbols Outlined")
-    computer_cancel_outlined = IconData(name="computer_cancel", fontFamily="Material Symbols Outlined")
-    concierge_outlined = IconData(name="concierge", fontFamily="Material Symbols Outlined")
-    conditions_outlined = IconData(name="conditions", fontFamily="Material Symbols Outlined")
-    confirmation_number_outlined = IconData(name="confirmation_number", fontFamily="Material Symbols Outlined")
-    congenital_outlined = IconData(name="congenital", fontFamily="Material Symbols Outlined")
-    connect_without_contact_outlined = IconData(name="connect_without_contact", fontFamily="Material Symbols Outlined")
-    connected_tv_outlined = IconData(name="connected_tv", fontFamily="Material Symbols Outlined")
-    connecting_airports_outlined = IconData(name="connecting_airports", fontFamily="Material Symbols Outlined")
-    construction_outlined = IconData(name="construction", fontFamily="Material Symbols Outlined")
-    contact_emergency_outlined = IconData(name="contact_emergency", fontFamily="Material Symbols Outlined")
-    contact_mail_outlined = IconData(name="contact_mail", fontFamily="Material Symbols Outlined")
-    contact_page_outlined = IconData(name="contact_page", fontFamily="Material Symbols Outlined")
-    contact_phone_outlined = IconData(name="contact_phone", fontFamily="Material Symbols Outlined")
-    contact_phone_filled_outlined = IconData(name="contact_phone_filled", fontFamily="Material Symbols Outlined")
-    contact_support_outlined = IconData(name="contact_support", fontFamily="Material Symbols Outlined")
-    contactless_outlined = IconData(name="contactless", fontFamily="Material Symbols Outlined")
-    contactless_off_outlined = IconData(name="contactless_off", fontFamily="Material Symbols Outlined")
-    contacts_outlined = IconData(name="contacts", fontFamily="Material Symbols Outlined")
-    contacts_product_outlined = IconData(name="contacts_product", fontFamily="Material Symbols Outlined")
-    content_copy_outlined = IconData(name="content_copy", fontFamily="Material Symbols Outlined")
-    content_cut_outlined = IconData(name="content_cut", fontFamily="Material Symbols Outlined")
-    content_paste_outlined = IconData(name="content_paste", fontFamily="Material Symbols Outlined")
-    content_paste_go_outlined = IconData(name="content_paste_go", fontFamily="Material Symbols Outlined")
-    content_paste_off_outlined = IconData(name="content_paste_off", fontFamily="Material Symbols Outlined")
-    content_paste_search_outlined = IconData(name="content_paste_search", fontFamily="Material Symbols Outlined")
-    contextual_token_outlined = IconData(name="contextual_token", fontFamily="Material Symbols Outlined")
-    contextual_token_add_outlined = IconData(name="contextual_token_add", fontFamily="Material Symbols Outlined")
-    contract_outlined = IconData(name="contract", fontFamily="Material Symbols Outlined")
-    contract_delete_outlined = IconData(name="contract_delete", fontFamily="Material Symbols Outlined")
-    contract_edit_outlined = IconData(name="contract_edit", fontFamily="Material Symbols Outlined")
-    contrast_outlined = IconData(name="contrast", fontFamily="Material Symbols Outlined")
-    contrast_circle_outlined = IconData(name="contrast_circle", fontFamily="Material Symbols Outlined")
-    contrast_rtl_off_outlined = IconData(name="contrast_rtl_off", fontFamily="Material Symbols Outlined")
-    contrast_square_outlined = IconData(name="contrast_square", fontFamily="Material Symbols Outlined")
-    control_camera_outlined = IconData(name="control_camera", fontFamily="Material Symbols Outlined")
-    control_point_outlined = IconData(name="control_point", fontFamily="Material Symbols Outlined")
-    control_point_duplicate_outlined = IconData(name="control_point_duplicate", fontFamily="Material Symbols Outlined")
-    controller_gen_outlined = IconData(name="controller_gen", fontFamily="Material Symbols Outlined")
-    conversion_path_outlined = IconData(name="conversion_path", fontFamily="Material Symbols Outlined")
-    conversion_path_off_outlined = IconData(name="conversion_path_off", fontFamily="Material Symbols Outlined")
-    convert_to_text_outlined = IconData(name="convert_to_text", fontFamily="Material Symbols Outlined")
-    conveyor_belt_outlined = IconData(name="conveyor_belt", fontFamily="Material Symbols Outlined")
-    cookie_outlined = IconData(name="cookie", fontFamily="Material Symbols Outlined")
-    cookie_off_outlined = IconData(name="cookie_off", fontFamily="Material Symbols Outlined")
-    cooking_outlined = IconData(name="cooking", fontFamily="Material Symbols Outlined")
-    cool_to_dry_outlined = IconData(name="cool_to_dry", fontFamily="Material Symbols Outlined")
-    copy_all_outlined = IconData(name="copy_all", fontFamily="Material Symbols Outlined")
-    copyright_outlined = IconData(name="copyright", fontFamily="Material Symbols Outlined")
-    coronavirus_outlined = IconData(name="coronavirus", fontFamily="Material Symbols Outlined")
-    corporate_fare_outlined = IconData(name="corporate_fare", fontFamily="Material Symbols Outlined")
-    cottage_outlined = IconData(name="cottage", fontFamily="Material Symbols Outlined")
-    counter_0_outlined = IconData(name="counter_0", fontFamily="Material Symbols Outlined")
-    counter_1_outlined = IconData(name="counter_1", fontFamily="Material Symbols Outlined")
-    counter_2_outlined = IconData(name="counter_2", fontFamily="Material Symbols Outlined")
-    counter_3_outlined = IconData(name="counter_3", fontFamily="Material Symbols Outlined")
-    counter_4_outlined = IconData(name="counter_4", fontFamily="Material Symbols Outlined")
-    counter_5_outlined = IconData(name="counter_5", fontFamily="Material Symbols Outlined")
-    counter_6_outlined = IconData(name="counter_6", fontFamily="Material Symbols Outlined")
-    counter_7_outlined = IconData(name="counter_7", fontFamily="Material Symbols Outlined")
-    counter_8_outlined = IconData(name="counter_8", fontFamily="Material Symbols Outlined")
-    counter_9_outlined = IconData(name="counter_9", fontFamily="Material Symbols Outlined")
-    countertops_outlined = IconData(name="countertops", fontFamily="Material Symbols Outlined")
-    create_outlined = IconData(name="create", fontFamily="Material Symbols Outlined")
-    create_new_folder_outlined = IconData(name="create_new_folder", fontFamily="Material Symbols Outlined")
-    credit_card_outlined = IconData(name="credit_card", fontFamily="Material Symbols Outlined")
-    credit_card_clock_outlined = IconData(name="credit_card_clock", fontFamily="Material Symbols Outlined")
-    credit_card_gear_outlined = IconData(name="credit_card_gear", fontFamily="Material Symbols Outlined")
-    credit_card_heart_outlined = IconData(name="credit_card_heart", fontFamily="Material Symbols Outlined")
-    credit_card_off_outlined = IconData(name="credit_card_off", fontFamily="Material Symbols Outlined")
-    credit_score_outlined = IconData(name="credit_score", fontFamily="Material Symbols Outlined")
-    crib_outlined = IconData(name="crib", fontFamily="Material Symbols Outlined")
-    crisis_alert_outlined = IconData(name="crisis_alert", fontFamily="Material Symbols Outlined")
-    crop_outlined = IconData(name="crop", fontFamily="Material Symbols Outlined")
-    crop_16_9_outlined = IconData(name="crop_16_9", fontFamily="Material Symbols Outlined")
-    crop_3_2_outlined = IconData(name="crop_3_2", fontFamily="Material Symbols Outlined")
-    crop_5_4_outlined = IconData(name="crop_5_4", fontFamily="Material Symbols Outlined")
-    crop_7_5_outlined = IconData(name="crop_7_5", fontFamily="Material Symbols Outlined")
-    crop_9_16_outlined = IconData(name="crop_9_16", fontFamily="Material Symbols Outlined")
-    crop_din_outlined = IconData(name="crop_din", fontFamily="Material Symbols Outlined")
-    crop_free_outlined = IconData(name="crop_free", fontFamily="Material Symbols Outlined")
-    crop_landscape_outlined = IconData(name="crop_landscape", fontFamily="Material Symbols Outlined")
-    crop_original_outlined = IconData(name="crop_original", fontFamily="Material Symbols Outlined")
-    crop_portrait_outlined = IconData(name="crop_portrait", fontFamily="Material Symbols Outlined")
-    crop_rotate_outlined = IconData(name="crop_rotate", fontFamily="Material Symbols Outlined")
-    crop_square_outlined = IconData(name="crop_square", fontFamily="Material Symbols Outlined")
-    crossword_outlined = IconData(name="crossword", fontFamily="Material Symbols Outlined")
-    crowdsource_outlined = IconData(name="crowdsource", fontFamily="Material Symbols Outlined")
-    crown_outlined = IconData(name="crown", fontFamily="Material Symbols Outlined")
-    cruelty_free_outlined = IconData(name="cruelty_free", fontFamily="Material Symbols Outlined")
-    css_outlined = IconData(name="css", fontFamily="Material Symbols Outlined")
-    csv_outlined = IconData(name="csv", fontFamily="Material Symbols Outlined")
-    currency_bitcoin_outlined = IconData(name="currency_bitcoin", fontFamily="Material Symbols Outlined")
-    currency_exchange_outlined = IconData(name="currency_exchange", fontFamily="Material Symbols Outlined")
-    currency_franc_outlined = IconData(name="currency_franc", fontFamily="Material Symbols Outlined")
-    currency_lira_outlined = IconData(name="currency_lira", fontFamily="Material Symbols Outlined")
-    currency_pound_outlined = IconData(name="currency_pound", fontFamily="Material Symbols Outlined")
-    currency_ruble_outlined = IconData(name="currency_ruble", fontFamily="Material Symbols Outlined")
-    currency_rupee_outlined = IconData(name="currency_rupee", fontFamily="Material Symbols Outlined")
-    currency_rupee_circle_outlined = IconData(name="currency_rupee_circle", fontFamily="Material Symbols Outlined")
-    currency_yen_outlined = IconData(name="currency_yen", fontFamily="Material Symbols Outlined")
-    currency_yuan_outlined = IconData(name="currency_yuan", fontFamily="Material Symbols Outlined")
-    curtains_outlined = IconData(name="curtains", fontFamily="Material Symbols Outlined")
-    curtains_closed_outlined = IconData(name="curtains_closed", fontFamily="Material Symbols Outlined")
-    custom_typography_outlined = IconData(name="custom_typography", fontFamily="Material Symbols Outlined")
-    cut_outlined = IconData(name="cut", fontFamily="Material Symbols Outlined")
-    cycle_outlined = IconData(name="cycle", fontFamily="Material Symbols Outlined")
-    cyclone_outlined = IconData(name="cyclone", fontFamily="Material Symbols Outlined")
-    dangerous_outlined = IconData(name="dangerous", fontFamily="Material Symbols Outlined")
-    dark_mode_outlined = IconData(name="dark_mode", fontFamily="Material Symbols Outlined")
-    dashboard_outlined = IconData(name="dashboard", fontFamily="Material Symbols Outlined")
-    dashboard_2_outlined = IconData(name="dashboard_2", fontFamily="Material Symbols Outlined")
-    dashboard_customize_outlined = IconData(name="dashboard_customize", fontFamily="Material Symbols Outlined")
-    data_alert_outlined = IconData(name="data_alert", fontFamily="Material Symbols Outlined")
-    data_array_outlined = IconData(name="data_array", fontFamily="Material Symbols Outlined")
-    data_check_outlined = IconData(name="data_check", fontFamily="Material Symbols Outlined")
-    data_exploration_outlined = IconData(name="data_exploration", fontFamily="Material Symbols Outlined")
-    data_info_alert_outlined = IconData(name="data_info_alert", fontFamily="Material Symbols Outlined")
-    data_loss_prevention_outlined = IconData(name="data_loss_prevention", fontFamily="Material Symbols Outlined")
-    data_object_outlined = IconData(name="data_object", fontFamily="Material Symbols Outlined")
-    data_saver_off_outlined = IconData(name="data_saver_off", fontFamily="Material Symbols Outlined")
-    data_saver_on_outlined = IconData(name="data_saver_on", fontFamily="Material Symbols Outlined")
-    data_table_outlined = IconData(name="data_table", fontFamily="Material Symbols Outlined")
-    data_thresholding_outlined = IconData(name="data_thresholding", fontFamily="Material Symbols Outlined")
-    data_usage_outlined = IconData(name="data_usage", fontFamily="Material Symbols Outlined")
-    database_outlined = IconData(name="database", fontFamily="Material Symbols Outlined")
-    database_off_outlined = IconData(name="database_off", fontFamily="Material Symbols Outlined")
-    database_search_outlined = IconData(name="database_search", fontFamily="Material Symbols Outlined")
-    database_upload_outlined = IconData(name="database_upload", fontFamily="Material Symbols Outlined")
-    dataset_outlined = IconData(name="dataset", fontFamily="Material Symbols Outlined")
-    dataset_linked_outlined = IconData(name="dataset_linked", fontFamily="Material Symbols Outlined")
-    date_range_outlined = IconData(name="date_range", fontFamily="Material Symbols Outlined")
-    deblur_outlined = IconData(name="deblur", fontFamily="Material Symbols Outlined")
-    deceased_outlined = IconData(name="deceased", fontFamily="Material Symbols Outlined")
-    decimal_decrease_outlined = IconData(name="decimal_decrease", fontFamily="Material Symbols Outlined")
-    decimal_increase_outlined = IconData(name="decimal_increase", fontFamily="Material Symbols Outlined")
-    deck_outlined = IconData(name="deck", fontFamily="Material Symbols Outlined")
-    dehaze_outlined = IconData(name="dehaze", fontFamily="Material Symbols Outlined")
-    delete_outlined = IconData(name="delete", fontFamily="Material Symbols Outlined")
-    delete_forever_outlined = IconData(name="delete_forever", fontFamily="Material Symbols Outlined")
-    delete_history_outlined = IconData(name="delete_history", fontFamily="Material Symbols Outlined")
-    delete_outline_outlined = IconData(name="delete_outline", fontFamily="Material Symbols Outlined")
-    delete_sweep_outlined = IconData(name="delete_sweep", fontFamily="Material Symbols Outlined")
-    delivery_dining_outlined = IconData(name="delivery_dining", fontFamily="Material Symbols Outlined")
-    delivery_truck_bolt_outlined = IconData(name="delivery_truck_bolt", fontFamily="Material Symbols Outlined")
-    delivery_truck_speed_outlined = IconData(name="delivery_truck_speed", fontFamily="Material Symbols Outlined")
-    demography_outlined = IconData(name="demography", fontFamily="Material Symbols Outlined")
-    density_large_outlined = IconData(name="density_large", fontFamily="Material Symbols Outlined")
-    density_medium_outlined = IconData(name="density_medium", fontFamily="Material Symbols Outlined")
-    density_small_outlined = IconData(name="density_small", fontFamily="Material Symbols Outlined")
-    dentistry_outlined = IconData(name="dentistry", fontFamily="Material Symbols Outlined")
-    departure_board_outlined = IconData(name="departure_board", fontFamily="Material Symbols Outlined")
-    deployed_code_outlined = IconData(name="deployed_code", fontFamily="Material Symbols Outlined")
-    deployed_code_account_outlined = IconData(name="deployed_code_account", fontFamily="Material Symbols Outlined")
-    deployed_code_alert_outlined = IconData(name="deployed_code_alert", fontFamily="Material Symbols Outlined")
-    deployed_code_history_outlined = IconData(name="deployed_code_history", fontFamily="Material Symbols Outlined")
-    deployed_code_update_outlined = IconData(name="deployed_code_update", fontFamily="Material Symbols Outlined")
-    dermatology_outlined = IconData(name="dermatology", fontFamily="Material Symbols Outlined")
-    description_outlined = IconData(name="description", fontFamily="Material Symbols Outlined")
-    deselect_outlined = IconData(name="deselect", fontFamily="Material Symbols Outlined")
-    design_services_outlined = IconData(name="design_services", fontFamily="Material Symbols Outlined")
-    desk_outlined = IconData(name="desk", fontFamily="Material Symbols Outlined")
-    deskphone_outlined = IconData(name="deskphone", fontFamily="Material Symbols Outlined")
-    desktop_access_disabled_outlined = IconData(name="desktop_access_disabled", fontFamily="Material Symbols Outlined")
-    desktop_cloud_outlined = IconData(name="desktop_cloud", fontFamily="Material Symbols Outlined")
-    desktop_cloud_stack_outlined = IconData(name="desktop_cloud_stack", fontFamily="Material Symbols Outlined")
-    desktop_landscape_outlined = IconData(name="desktop_landscape", fontFamily="Material Symbols Outlined")
-    desktop_landscape_add_outlined = IconData(name="desktop_landscape_add", fontFamily="Material Symbols Outlined")
-    desktop_mac_outlined = IconData(name="desktop_mac", fontFamily="Material Symbols Outlined")
-    desktop_portrait_outlined = IconData(name="desktop_portrait", fontFamily="Material Symbols Outlined")
-    desktop_windows_outlined = IconData(name="desktop_windows", fontFamily="Material Symbols Outlined")
-    destruction_outlined = IconData(name="destruction", fontFamily="Material Symbols Outlined")
-    details_outlined = IconData(name="details", fontFamily="Material Symbols Outlined")
-    detection_and_zone_outlined = IconData(name="detection_and_zone", fontFamily="Material Symbols Outlined")
-    detector_outlined = IconData(name="detector", fontFamily="Material Symbols Outlined")
-    detector_alarm_outlined = IconData(name="detector_alarm", fontFamily="Material Symbols Outlined")
-    detector_battery_outlined = IconData(name="detector_battery", fontFamily="Material Symbols Outlined")
-    detector_co_outlined = IconData(name="detector_co", fontFamily="Material Symbols Outlined")
-    detector_offline_outlined = IconData(name="detector_offline", fontFamily="Material Symbols Outlined")
-    detector_smoke_outlined = IconData(name="detector_smoke", fontFamily="Material Symbols Outlined")
-    detector_status_outlined = IconData(name="detector_status", fontFamily="Material Symbols Outlined")
-    developer_board_outlined = IconData(name="developer_board", fontFamily="Material Symbols Outlined")
-    developer_board_off_outlined = IconData(name="developer_board_off", fontFamily="Material Symbols Outlined")
-    developer_guide_outlined = IconData(name="developer_guide", fontFamily="Material Symbols Outlined")
-    developer_mode_outlined = IconData(name="developer_mode", fontFamily="Material Symbols Outlined")
-    developer_mode_tv_outlined = IconData(name="developer_mode_tv", fontFamily="Material Symbols Outlined")
-    device_band_outlined = IconData(name="device_band", fontFamily="Material Symbols Outlined")
-    device_hub_outlined = IconData(name="device_hub", fontFamily="Material Symbols Outlined")
-    device_reset_outlined = IconData(name="device_reset", fontFamily="Material Symbols Outlined")
-    device_thermostat_outlined = IconData(name="device_thermostat", fontFamily="Material Symbols Outlined")
-    device_unknown_outlined = IconData(name="device_unknown", fontFamily="Material Symbols Outlined")
-    devices_outlined = IconData(name="devices", fontFamily="Material Symbols Outlined")
-    devices_fold_outlined = IconData(name="devices_fold", fontFamily="Material Symbols Outlined")
-    devices_fold_2_outlined = IconData(name="devices_fold_2", fontFamily="Material Symbols Outlined")
-    devices_off_outlined = IconData(name="devices_off", fontFamily="Material Symbols Outlined")
-    devices_other_outlined = IconData(name="devices_other", fontFamily="Material Symbols Outlined")
-    devices_wearables_outlined = IconData(name="devices_wearables", fontFamily="Material Symbols Outlined")
-    dew_point_outlined = IconData(name="dew_point", fontFamily="Material Symbols Outlined")
-    diagnosis_outlined = IconData(name="diagnosis", fontFamily="Material Symbols Outlined")
-    diagonal_line_outlined = IconData(name="diagonal_line", fontFamily="Material Symbols Outlined")
-    dialer_sip_outlined = IconData(name="dialer_sip", fontFamily="Material Symbols Outlined")
-    dialogs_outlined = IconData(name="dialogs", fontFamily="Material Symbols Outlined")
-    dialpad_outlined = IconData(name="dialpad", fontFamily="Material Symbols Outlined")
-    diamond_outlined = IconData(name="diamond", fontFamily="Material Symbols Outlined")
-    dictionary_outlined = IconData(name="dictionary", fontFamily="Material Symbols Outlined")
-    difference_outlined = IconData(name="difference", fontFamily="Material Symbols Outlined")
-    digital_out_of_home_outlined = IconData(name="digital_out_of_home", fontFamily="Material Symbols Outlined")
-    digital_wellbeing_outlined = IconData(name="digital_wellbeing", fontFamily="Material Symbols Outlined")
-    dining_outlined = IconData(name="dining", fontFamily="Material Symbols Outlined")
-    dinner_dining_outlined = IconData(name="dinner_dining", fontFamily="Material Symbols Outlined")
-    directions_outlined = IconData(name="directions", fontFamily="Material Symbols Outlined")
-    directions_alt_outlined = IconData(name="directions_alt", fontFamily="Material Symbols Outlined")
-    directions_alt_off_outlined = IconData(name="directions_alt_off", fontFamily="Material Symbols Outlined")
-    directions_bike_outlined = IconData(name="directions_bike", fontFamily="Material Symbols Outlined")
-    directions_boat_outlined = IconData(name="directions_boat", fontFamily="Material Symbols Outlined")
-    directions_boat_filled_outlined = IconData(name="directions_boat_filled", fontFamily="Material Symbols Outlined")
-    directions_bus_outlined = IconData(name="directions_bus", fontFamily="Material Symbols Outlined")
-    directions_bus_filled_outlined = IconData(name="directions_bus_filled", fontFamily="Material Symbols Outlined")
-    directions_car_outlined = IconData(name="directions_car", fontFamily="Material Symbols Outlined")
-    directions_car_filled_outlined = IconData(name="directions_car_filled", fontFamily="Material Symbols Outlined")
-    directions_off_outlined = IconData(name="directions_off", fontFamily="Material Symbols Outlined")
-    directions_railway_outlined = IconData(name="directions_railway", fontFamily="Material Symbols Outlined")
-    directions_railway_2_outlined = IconData(name="directions_railway_2", fontFamily="Material Symbols Outlined")
-    directions_railway_filled_outlined = IconData(name="directions_railway_filled", fontFamily="Material Symbols Outlined")
-    directions_run_outlined = IconData(name="directions_run", fontFamily="Material Symbols Outlined")
-    directions_subway_outlined = IconData(name="directions_subway", fontFamily="Material Symbols Outlined")
-    directions_subway_filled_outlined = IconData(name="directions_subway_filled", fontFamily="Material Symbols Outlined")
-    directions_transit_outlined = IconData(name="directions_transit", fontFamily="Material Symbols Outlined")
-    directions_transit_filled_outlined = IconData(name="directions_transit_filled", fontFamily="Material Symbols Outlined")
-    directions_walk_outlined = IconData(name="directions_walk", fontFamily="Material Symbols Outlined")
-    directory_sync_outlined = IconData(name="directory_sync", fontFamily="Material Symbols Outlined")
-    dirty_lens_outlined = IconData(name="dirty_lens", fontFamily="Material Symbols Outlined")
-    disabled_by_default_outlined = IconData(name="disabled_by_default", fontFamily="Material Symbols Outlined")
-    disabled_visible_outlined = IconData(name="disabled_visible", fontFamily="Material Symbols Outlined")
-    disc_full_outlined = IconData(name="disc_full", fontFamily="Material Symbols Outlined")
-    discover_tune_outlined = IconData(name="discover_tune", fontFamily="Material Symbols Outlined")
-    dishwasher_outlined = IconData(name="dishwasher", fontFamily="Material Symbols Outlined")
-    dishwasher_gen_outlined = IconData(name="dishwasher_gen", fontFamily="Material Symbols Outlined")
-    display_external_input_outlined = IconData(name="display_external_input", fontFamily="Material Symbols Outlined")
-    display_settings_outlined = IconData(name="display_settings", fontFamily="Material Symbols Outlined")
-    distance_outlined = IconData(name="distance", fontFamily="Material Symbols Outlined")
-    diversity_1_outlined = IconData(name="diversity_1", fontFamily="Material Symbols Outlined")
-    diversity_2_outlined = IconData(name="diversity_2", fontFamily="Material Symbols Outlined")
-    diversity_3_outlined = IconData(name="diversity_3", fontFamily="Material Symbols Outlined")
-    diversity_4_outlined = IconData(name="diversity_4", fontFamily="Material Symbols Outlined")
-    dns_outlined = IconData(name="dns", fontFamily="Material Symbols Outlined")
-    do_disturb_outlined = IconData(name="do_disturb", fontFamily="Material Symbols Outlined")
-    do_disturb_alt_outlined = IconData(name="do_disturb_alt", fontFamily="Material Symbols Outlined")
-    do_disturb_off_outlined = IconData(name="do_disturb_off", fontFamily="Material Symbols Outlined")
-    do_disturb_on_outlined = IconData(name="do_disturb_on", fontFamily="Material Symbols Outlined")
-    do_not_disturb_outlined = IconData(name="do_not_disturb", fontFamily="Material Symbols Outlined")
-    do_not_disturb_alt_outlined = IconData(name="do_not_disturb_alt", fontFamily="Material Symbols Outlined")
-    do_not_disturb_off_outlined = IconData(name="do_not_disturb_off", fontFamily="Material Symbols Outlined")
-    do_not_disturb_on_outlined = IconData(name="do_not_disturb_on", fontFamily="Material Symbols Outlined")
-    do_not_disturb_on_total_silence_outlined = IconData(name="do_not_disturb_on_total_silence", fontFamily="Material Symbols Outlined")
-    do_not_step_outlined = IconData(name="do_not_step", fontFamily="Material Symbols Outlined")
-    do_not_touch_outlined = IconData(name="do_not_touch", fontFamily="Material Symbols Outlined")
-    dock_outlined = IconData(name="dock", fontFamily="Material Symbols Outlined")
-    dock_to_bottom_outlined = IconData(name="dock_to_bottom", fontFamily="Material Symbols Outlined")
-    dock_to_left_outlined = IconData(name="dock_to_left", fontFamily="Material Symbols Outlined")
-    dock_to_right_outlined = IconData(name="dock_to_right", fontFamily="Material Symbols Outlined")
-    docs_outlined = IconData(name="docs", fontFamily="Material Symbols Outlined")
-    docs_add_on_outlined = IconData(name="docs_add_on", fontFamily="Material Symbols Outlined")
-    docs_apps_script_outlined = IconData(name="docs_apps_script", fontFamily="Material Symbols Outlined")
-    document_scanner_outlined = IconData(name="document_scanner", fontFamily="Material Symbols Outlined")
-    document_search_outlined = IconData(name="document_search", fontFamily="Material Symbols Outlined")
-    domain_outlined = IconData(name="domain", fontFamily="Material Symbols Outlined")
-    domain_add_outlined = IconData(name="domain_add", fontFamily="Material Symbols Outlined")
-    domain_disabled_outlined = IconData(name="domain_disabled", fontFamily="Material Symbols Outlined")
-    domain_verification_outlined = IconData(name="domain_verification", fontFamily="Material Symbols Outlined")
-    domain_verification_off_outlined = IconData(name="domain_verification_off", fontFamily="Material Symbols Outlined")
-    domino_mask_outlined = IconData(name="domino_mask", fontFamily="Material Symbols Outlined")
-    done_outlined = IconData(name="done", fontFamily="Material Symbols Outlined")
-    done_all_outlined = IconData(name="done_all", fontFamily="Material Symbols Outlined")
-    done_outline_outlined = IconData(name="done_outline", fontFamily="Material Symbols Outlined")
-    donut_large_outlined = IconData(name="donut_large", fontFamily="Material Symbols Outlined")
-    donut_small_outlined = IconData(name="donut_small", fontFamily="Material Symbols Outlined")
-    door_back_outlined = IconData(name="door_back", fontFamily="Material Symbols Outlined")
-    door_front_outlined = IconData(name="door_front", fontFamily="Material Symbols Outlined")
-    door_open_outlined = IconData(name="door_open", fontFamily="Material Symbols Outlined")
-    door_sensor_outlined = IconData(name="door_sensor", fontFamily="Material Symbols Outlined")
-    door_sliding_outlined = IconData(name="door_sliding", fontFamily="Material Symbols Outlined")
-    doorbell_outlined = IconData(name="doorbell", fontFamily="Material Symbols Outlined")
-    doorbell_3p_outlined = IconData(name="doorbell_3p", fontFamily="Material Symbols Outlined")
-    doorbell_chime_outlined = IconData(name="doorbell_chime", fontFamily="Material Symbols Outlined")
-    double_arrow_outlined = IconData(name="double_arrow", fontFamily="Material Symbols Outlined")
-    downhill_skiing_outlined = IconData(name="downhill_skiing", fontFamily="Material Symbols Outlined")
-    download_outlined = IconData(name="download", fontFamily="Material Symbols Outlined")
-    download_2_outlined = IconData(name="download_2", fontFamily="Material Symbols Outlined")
-    download_done_outlined = IconData(name="download_done", fontFamily="Material Symbols Outlined")
-    download_for_offline_outlined = IconData(name="download_for_offline", fontFamily="Material Symbols Outlined")
-    downloading_outlined = IconData(name="downloading", fontFamily="Material Symbols Outlined")
-    draft_outlined = IconData(name="draft", fontFamily="Material Symbols Outlined")
-    draft_orders_outlined = IconData(name="draft_orders", fontFamily="Material Symbols Outlined")
-    drafts_outlined = IconData(name="drafts", fontFamily="Material Symbols Outlined")
-    drag_click_outlined = IconData(name="drag_click", fontFamily="Material Symbols Outlined")
-    drag_handle_outlined = IconData(name="drag_handle", fontFamily="Material Symbols Outlined")
-    drag_indicator_outlined = IconData(name="drag_indicator", fontFamily="Material Symbols Outlined")
-    drag_pan_outlined = IconData(name="drag_pan", fontFamily="Material Symbols Outlined")
-    draw_outlined = IconData(name="draw", fontFamily="Material Symbols Outlined")
-    draw_abstract_outlined = IconData(name="draw_abstract", fontFamily="Material Symbols Outlined")
-    draw_collage_outlined = IconData(name="draw_collage", fontFamily="Material Symbols Outlined")
-    drawing_recognition_outlined = IconData(name="drawing_recognition", fontFamily="Material Symbols Outlined")
-    dresser_outlined = IconData(name="dresser", fontFamily="Material Symbols Outlined")
-    drive_eta_outlined = IconData(name="drive_eta", fontFamily="Material Symbols Outlined")
-    drive_export_outlined = IconData(name="drive_export", fontFamily="Material Symbols Outlined")
-    drive_file_move_outlined = IconData(name="drive_file_move", fontFamily="Material Symbols Outlined")
-    drive_file_move_outline_outlined = IconData(name="drive_file_move_outline", fontFamily="Material Symbols Outlined")
-    drive_file_move_rtl_outlined = IconData(name="drive_file_move_rtl", fontFamily="Material Symbols Outlined")
-    drive_file_rename_outline_outlined = IconData(name="drive_file_rename_outline", fontFamily="Material Symbols Outlined")
-    drive_folder_upload_outlined = IconData(name="drive_folder_upload", fontFamily="Material Symbols Outlined")
-    drive_fusiontable_outlined = IconData(name="drive_fusiontable", fontFamily="Material Symbols Outlined")
-    dropdown_outlined = IconData(name="dropdown", fontFamily="Material Symbols Outlined")
-    dropper_eye_outlined = IconData(name="dropper_eye", fontFamily="Material Symbols Outlined")
-    dry_outlined = IconData(name="dry", fontFamily="Material Symbols Outlined")
-    dry_cleaning_outlined = IconData(name="dry_cleaning", fontFamily="Material Symbols Outlined")
-    dual_screen_outlined = IconData(name="dual_screen", fontFamily="Material Symbols Outlined")
-    duo_outlined = IconData(name="duo", fontFamily="Material Symbols Outlined")
-    dvr_outlined = IconData(name="dvr", fontFamily="Material Symbols Outlined")
-    dynamic_feed_outlined = IconData(name="dynamic_feed", fontFamily="Material Symbols Outlined")
-    dynamic_form_outlined = IconData(name="dynamic_form", fontFamily="Material Symbols Outlined")
-    e911_avatar_outlined = IconData(name="e911_avatar", fontFamily="Material Symbols Outlined")
-    e911_emergency_outlined = IconData(name="e911_emergency", fontFamily="Material Symbols Outlined")
-    e_mobiledata_outlined = IconData(name="e_mobiledata", fontFamily="Material Symbols Outlined")
-    e_mobiledata_badge_outlined = IconData(name="e_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    ear_sound_outlined = IconData(name="ear_sound", fontFamily="Material Symbols Outlined")
-    earbud_case_outlined = IconData(name="earbud_case", fontFamily="Material Symbols Outlined")
-    earbud_left_outlined = IconData(name="earbud_left", fontFamily="Material Symbols Outlined")
-    earbud_right_outlined = IconData(name="earbud_right", fontFamily="Material Symbols Outlined")
-    earbuds_outlined = IconData(name="earbuds", fontFamily="Material Symbols Outlined")
-    earbuds_2_outlined = IconData(name="earbuds_2", fontFamily="Material Symbols Outlined")
-    earbuds_battery_outlined = IconData(name="earbuds_battery", fontFamily="Material Symbols Outlined")
-    early_on_outlined = IconData(name="early_on", fontFamily="Material Symbols Outlined")
-    earthquake_outlined = IconData(name="earthquake", fontFamily="Material Symbols Outlined")
-    east_outlined = IconData(name="east", fontFamily="Material Symbols Outlined")
-    ecg_outlined = IconData(name="ecg", fontFamily="Material Symbols Outlined")
-    ecg_heart_outlined = IconData(name="ecg_heart", fontFamily="Material Symbols Outlined")
-    eco_outlined = IconData(name="eco", fontFamily="Material Symbols Outlined")
-    eda_outlined = IconData(name="eda", fontFamily="Material Symbols Outlined")
-    edgesensor_high_outlined = IconData(name="edgesensor_high", fontFamily="Material Symbols Outlined")
-    edgesensor_low_outlined = IconData(name="edgesensor_low", fontFamily="Material Symbols Outlined")
-    edit_outlined = IconData(name="edit", fontFamily="Material Symbols Outlined")
-    edit_arrow_down_outlined = IconData(name="edit_arrow_down", fontFamily="Material Symbols Outlined")
-    edit_arrow_up_outlined = IconData(name="edit_arrow_up", fontFamily="Material Symbols Outlined")
-    edit_attributes_outlined = IconData(name="edit_attributes", fontFamily="Material Symbols Outlined")
-    edit_audio_outlined = IconData(name="edit_audio", fontFamily="Material Symbols Outlined")
-    edit_calendar_outlined = IconData(name="edit_calendar", fontFamily="Material Symbols Outlined")
-    edit_document_outlined = IconData(name="edit_document", fontFamily="Material Symbols Outlined")
-    edit_location_outlined = IconData(name="edit_location", fontFamily="Material Symbols Outlined")
-    edit_location_alt_outlined = IconData(name="edit_location_alt", fontFamily="Material Symbols Outlined")
-    edit_note_outlined = IconData(name="edit_note", fontFamily="Material Symbols Outlined")
-    edit_notifications_outlined = IconData(name="edit_notifications", fontFamily="Material Symbols Outlined")
-    edit_off_outlined = IconData(name="edit_off", fontFamily="Material Symbols Outlined")
-    edit_road_outlined = IconData(name="edit_road", fontFamily="Material Symbols Outlined")
-    edit_square_outlined = IconData(name="edit_square", fontFamily="Material Symbols Outlined")
-    editor_choice_outlined = IconData(name="editor_choice", fontFamily="Material Symbols Outlined")
-    egg_outlined = IconData(name="egg", fontFamily="Material Symbols Outlined")
-    egg_alt_outlined = IconData(name="egg_alt", fontFamily="Material Symbols Outlined")
-    eject_outlined = IconData(name="eject", fontFamily="Material Symbols Outlined")
-    elderly_outlined = IconData(name="elderly", fontFamily="Material Symbols Outlined")
-    elderly_woman_outlined = IconData(name="elderly_woman", fontFamily="Material Symbols Outlined")
-    electric_bike_outlined = IconData(name="electric_bike", fontFamily="Material Symbols Outlined")
-    electric_bolt_outlined = IconData(name="electric_bolt", fontFamily="Material Symbols Outlined")
-    electric_car_outlined = IconData(name="electric_car", fontFamily="Material Symbols Outlined")
-    electric_meter_outlined = IconData(name="electric_meter", fontFamily="Material Symbols Outlined")
-    electric_moped_outlined = IconData(name="electric_moped", fontFamily="Material Symbols Outlined")
-    electric_rickshaw_outlined = IconData(name="electric_rickshaw", fontFamily="Material Symbols Outlined")
-    electric_scooter_outlined = IconData(name="electric_scooter", fontFamily="Material Symbols Outlined")
-    electrical_services_outlined = IconData(name="electrical_services", fontFamily="Material Symbols Outlined")
-    elevation_outlined = IconData(name="elevation", fontFamily="Material Symbols Outlined")
-    elevator_outlined = IconData(name="elevator", fontFamily="Material Symbols Outlined")
-    email_outlined = IconData(name="email", fontFamily="Material Symbols Outlined")
-    emergency_outlined = IconData(name="emergency", fontFamily="Material Symbols Outlined")
-    emergency_heat_outlined = IconData(name="emergency_heat", fontFamily="Material Symbols Outlined")
-    emergency_heat_2_outlined = IconData(name="emergency_heat_2", fontFamily="Material Symbols Outlined")
-    emergency_home_outlined = IconData(name="emergency_home", fontFamily="Material Symbols Outlined")
-    emergency_recording_outlined = IconData(name="emergency_recording", fontFamily="Material Symbols Outlined")
-    emergency_share_outlined = IconData(name="emergency_share", fontFamily="Material Symbols Outlined")
-    emergency_share_off_outlined = IconData(name="emergency_share_off", fontFamily="Material Symbols Outlined")
-    emoji_emotions_outlined = IconData(name="emoji_emotions", fontFamily="Material Symbols Outlined")
-    emoji_events_outlined = IconData(name="emoji_events", fontFamily="Material Symbols Outlined")
-    emoji_flags_outlined = IconData(name="emoji_flags", fontFamily="Material Symbols Outlined")
-    emoji_food_beverage_outlined = IconData(name="emoji_food_beverage", fontFamily="Material Symbols Outlined")
-    emoji_language_outlined = IconData(name="emoji_language", fontFamily="Material Symbols Outlined")
-    emoji_nature_outlined = IconData(name="emoji_nature", fontFamily="Material Symbols Outlined")
-    emoji_objects_outlined = IconData(name="emoji_objects", fontFamily="Material Symbols Outlined")
-    emoji_people_outlined = IconData(name="emoji_people", fontFamily="Material Symbols Outlined")
-    emoji_symbols_outlined = IconData(name="emoji_symbols", fontFamily="Material Symbols Outlined")
-    emoji_transportation_outlined = IconData(name="emoji_transportation", fontFamily="Material Symbols Outlined")
-    emoticon_outlined = IconData(name="emoticon", fontFamily="Material Symbols Outlined")
-    empty_dashboard_outlined = IconData(name="empty_dashboard", fontFamily="Material Symbols Outlined")
-    enable_outlined = IconData(name="enable", fontFamily="Material Symbols Outlined")
-    encrypted_outlined = IconData(name="encrypted", fontFamily="Material Symbols Outlined")
-    encrypted_add_outlined = IconData(name="encrypted_add", fontFamily="Material Symbols Outlined")
-    encrypted_add_circle_outlined = IconData(name="encrypted_add_circle", fontFamily="Material Symbols Outlined")
-    encrypted_minus_circle_outlined = IconData(name="encrypted_minus_circle", fontFamily="Material Symbols Outlined")
-    encrypted_off_outlined = IconData(name="encrypted_off", fontFamily="Material Symbols Outlined")
-    endocrinology_outlined = IconData(name="endocrinology", fontFamily="Material Symbols Outlined")
-    energy_outlined = IconData(name="energy", fontFamily="Material Symbols Outlined")
-    energy_program_saving_outlined = IconData(name="energy_program_saving", fontFamily="Material Symbols Outlined")
-    energy_program_time_used_outlined = IconData(name="energy_program_time_used", fontFamily="Material Symbols Outlined")
-    energy_savings_leaf_outlined = IconData(name="energy_savings_leaf", fontFamily="Material Symbols Outlined")
-    engineering_outlined = IconData(name="engineering", fontFamily="Material Symbols Outlined")
-    enhanced_encryption_outlined = IconData(name="enhanced_encryption", fontFamily="Material Symbols Outlined")
-    ent_outlined = IconData(name="ent", fontFamily="Material Symbols Outlined")
-    enterprise_outlined = IconData(name="enterprise", fontFamily="Material Symbols Outlined")
-    enterprise_off_outlined = IconData(name="enterprise_off", fontFamily="Material Symbols Outlined")
-    equal_outlined = IconData(name="equal", fontFamily="Material Symbols Outlined")
-    equalizer_outlined = IconData(name="equalizer", fontFamily="Material Symbols Outlined")
-    eraser_size_1_outlined = IconData(name="eraser_size_1", fontFamily="Material Symbols Outlined")
-    eraser_size_2_outlined = IconData(name="eraser_size_2", fontFamily="Material Symbols Outlined")
-    eraser_size_3_outlined = IconData(name="eraser_size_3", fontFamily="Material Symbols Outlined")
-    eraser_size_4_outlined = IconData(name="eraser_size_4", fontFamily="Material Symbols Outlined")
-    eraser_size_5_outlined = IconData(name="eraser_size_5", fontFamily="Material Symbols Outlined")
-    error_outlined = IconData(name="error", fontFamily="Material Symbols Outlined")
-    error_circle_rounded_outlined = IconData(name="error_circle_rounded", fontFamily="Material Symbols Outlined")
-    error_med_outlined = IconData(name="error_med", fontFamily="Material Symbols Outlined")
-    error_outline_outlined = IconData(name="error_outline", fontFamily="Material Symbols Outlined")
-    escalator_outlined = IconData(name="escalator", fontFamily="Material Symbols Outlined")
-    escalator_warning_outlined = IconData(name="escalator_warning", fontFamily="Material Symbols Outlined")
-    euro_outlined = IconData(name="euro", fontFamily="Material Symbols Outlined")
-    euro_symbol_outlined = IconData(name="euro_symbol", fontFamily="Material Symbols Outlined")
-    ev_charger_outlined = IconData(name="ev_charger", fontFamily="Material Symbols Outlined")
-    ev_mobiledata_badge_outlined = IconData(name="ev_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    ev_shadow_outlined = IconData(name="ev_shadow", fontFamily="Material Symbols Outlined")
-    ev_shadow_add_outlined = IconData(name="ev_shadow_add", fontFamily="Material Symbols Outlined")
-    ev_shadow_minus_outlined = IconData(name="ev_shadow_minus", fontFamily="Material Symbols Outlined")
-    ev_station_outlined = IconData(name="ev_station", fontFamily="Material Symbols Outlined")
-    event_outlined = IconData(name="event", fontFamily="Material Symbols Outlined")
-    event_available_outlined = IconData(name="event_available", fontFamily="Material Symbols Outlined")
-    event_busy_outlined = IconData(name="event_busy", fontFamily="Material Symbols Outlined")
-    event_list_outlined = IconData(name="event_list", fontFamily="Material Symbols Outlined")
-    event_note_outlined = IconData(name="event_note", fontFamily="Material Symbols Outlined")
-    event_repeat_outlined = IconData(name="event_repeat", fontFamily="Material Symbols Outlined")
-    event_seat_outlined = IconData(name="event_seat", fontFamily="Material Symbols Outlined")
-    event_upcoming_outlined = IconData(name="event_upcoming", fontFamily="Material Symbols Outlined")
-    exclamation_outlined = IconData(name="exclamation", fontFamily="Material Symbols Outlined")
-    exercise_outlined = IconData(name="exercise", fontFamily="Material Symbols Outlined")
-    exit_to_app_outlined = IconData(name="exit_to_app", fontFamily="Material Symbols Outlined")
-    expand_outlined = IconData(name="expand", fontFamily="Material Symbols Outlined")
-    expand_all_outlined = IconData(name="expand_all", fontFamily="Material Symbols Outlined")
-    expand_circle_down_outlined = IconData(name="expand_circle_down", fontFamily="Material Symbols Outlined")
-    expand_circle_right_outlined = IconData(name="expand_circle_right", fontFamily="Material Symbols Outlined")
-    expand_circle_up_outlined = IconData(name="expand_circle_up", fontFamily="Material Symbols Outlined")
-    expand_content_outlined = IconData(name="expand_content", fontFamily="Material Symbols Outlined")
-    expand_less_outlined = IconData(name="expand_less", fontFamily="Material Symbols Outlined")
-    expand_more_outlined = IconData(name="expand_more", fontFamily="Material Symbols Outlined")
-    expansion_panels_outlined = IconData(name="expansion_panels", fontFamily="Material Symbols Outlined")
-    expension_panels_outlined = IconData(name="expension_panels", fontFamily="Material Symbols Outlined")
-    experiment_outlined = IconData(name="experiment", fontFamily="Material Symbols Outlined")
-    explicit_outlined = IconData(name="explicit", fontFamily="Material Symbols Outlined")
-    explore_outlined = IconData(name="explore", fontFamily="Material Symbols Outlined")
-    explore_nearby_outlined = IconData(name="explore_nearby", fontFamily="Material Symbols Outlined")
-    explore_off_outlined = IconData(name="explore_off", fontFamily="Material Symbols Outlined")
-    explosion_outlined = IconData(name="explosion", fontFamily="Material Symbols Outlined")
-    export_notes_outlined = IconData(name="export_notes", fontFamily="Material Symbols Outlined")
-    exposure_outlined = IconData(name="exposure", fontFamily="Material Symbols Outlined")
-    exposure_neg_1_outlined = IconData(name="exposure_neg_1", fontFamily="Material Symbols Outlined")
-    exposure_neg_2_outlined = IconData(name="exposure_neg_2", fontFamily="Material Symbols Outlined")
-    exposure_plus_1_outlined = IconData(name="exposure_plus_1", fontFamily="Material Symbols Outlined")
-    exposure_plus_2_outlined = IconData(name="exposure_plus_2", fontFamily="Material Symbols Outlined")
-    exposure_zero_outlined = IconData(name="exposure_zero", fontFamily="Material Symbols Outlined")
-    extension_outlined = IconData(name="extension", fontFamily="Material Symbols Outlined")
-    extension_off_outlined = IconData(name="extension_off", fontFamily="Material Symbols Outlined")
-    eye_tracking_outlined = IconData(name="eye_tracking", fontFamily="Material Symbols Outlined")
-    eyeglasses_outlined = IconData(name="eyeglasses", fontFamily="Material Symbols Outlined")
-    face_outlined = IconData(name="face", fontFamily="Material Symbols Outlined")
-    face_2_outlined = IconData(name="face_2", fontFamily="Material Symbols Outlined")
-    face_3_outlined = IconData(name="face_3", fontFamily="Material Symbols Outlined")
-    face_4_outlined = IconData(name="face_4", fontFamily="Material Symbols Outlined")
-    face_5_outlined = IconData(name="face_5", fontFamily="Material Symbols Outlined")
-    face_6_outlined = IconData(name="face_6", fontFamily="Material Symbols Outlined")
-    face_down_outlined = IconData(name="face_down", fontFamily="Material Symbols Outlined")
-    face_left_outlined = IconData(name="face_left", fontFamily="Material Symbols Outlined")
-    face_nod_outlined = IconData(name="face_nod", fontFamily="Material Symbols Outlined")
-    face_retouching_natural_outlined = IconData(name="face_retouching_natural", fontFamily="Material Symbols Outlined")
-    face_retouching_off_outlined = IconData(name="face_retouching_off", fontFamily="Material Symbols Outlined")
-    face_right_outlined = IconData(name="face_right", fontFamily="Material Symbols Outlined")
-    face_shake_outlined = IconData(name="face_shake", fontFamily="Material Symbols Outlined")
-    face_unlock_outlined = IconData(name="face_unlock", fontFamily="Material Symbols Outlined")
-    face_up_outlined = IconData(name="face_up", fontFamily="Material Symbols Outlined")
-    fact_check_outlined = IconData(name="fact_check", fontFamily="Material Symbols Outlined")
-    factory_outlined = IconData(name="factory", fontFamily="Material Symbols Outlined")
-    falling_outlined = IconData(name="falling", fontFamily="Material Symbols Outlined")
-    familiar_face_and_zone_outlined = IconData(name="familiar_face_and_zone", fontFamily="Material Symbols Outlined")
-    family_history_outlined = IconData(name="family_history", fontFamily="Material Symbols Outlined")
-    family_home_outlined = IconData(name="family_home", fontFamily="Material Symbols Outlined")
-    family_link_outlined = IconData(name="family_link", fontFamily="Material Symbols Outlined")
-    family_restroom_outlined = IconData(name="family_restroom", fontFamily="Material Symbols Outlined")
-    family_star_outlined = IconData(name="family_star", fontFamily="Material Symbols Outlined")
-    fan_focus_outlined = IconData(name="fan_focus", fontFamily="Material Symbols Outlined")
-    fan_indirect_outlined = IconData(name="fan_indirect", fontFamily="Material Symbols Outlined")
-    farsight_digital_outlined = IconData(name="farsight_digital", fontFamily="Material Symbols Outlined")
-    fast_forward_outlined = IconData(name="fast_forward", fontFamily="Material Symbols Outlined")
-    fast_rewind_outlined = IconData(name="fast_rewind", fontFamily="Material Symbols Outlined")
-    fastfood_outlined = IconData(name="fastfood", fontFamily="Material Symbols Outlined")
-    faucet_outlined = IconData(name="faucet", fontFamily="Material Symbols Outlined")
-    favorite_outlined = IconData(name="favorite", fontFamily="Material Symbols Outlined")
-    favorite_border_outlined = IconData(name="favorite_border", fontFamily="Material Symbols Outlined")
-    fax_outlined = IconData(name="fax", fontFamily="Material Symbols Outlined")
-    feature_search_outlined = IconData(name="feature_search", fontFamily="Material Symbols Outlined")
-    featured_play_list_outlined = IconData(name="featured_play_list", fontFamily="Material Symbols Outlined")
-    featured_seasonal_and_gifts_outlined = IconData(name="featured_seasonal_and_gifts", fontFamily="Material Symbols Outlined")
-    featured_video_outlined = IconData(name="featured_video", fontFamily="Material Symbols Outlined")
-    feed_outlined = IconData(name="feed", fontFamily="Material Symbols Outlined")
-    feedback_outlined = IconData(name="feedback", fontFamily="Material Symbols Outlined")
-    female_outlined = IconData(name="female", fontFamily="Material Symbols Outlined")
-    femur_outlined = IconData(name="femur", fontFamily="Material Symbols Outlined")
-    femur_alt_outlined = IconData(name="femur_alt", fontFamily="Material Symbols Outlined")
-    fence_outlined = IconData(name="fence", fontFamily="Material Symbols Outlined")
-    fertile_outlined = IconData(name="fertile", fontFamily="Material Symbols Outlined")
-    festival_outlined = IconData(name="festival", fontFamily="Material Symbols Outlined")
-    fiber_dvr_outlined = IconData(name="fiber_dvr", fontFamily="Material Symbols Outlined")
-    fiber_manual_record_outlined = IconData(name="fiber_manual_record", fontFamily="Material Symbols Outlined")
-    fiber_new_outlined = IconData(name="fiber_new", fontFamily="Material Symbols Outlined")
-    fiber_pin_outlined = IconData(name="fiber_pin", fontFamily="Material Symbols Outlined")
-    fiber_smart_record_outlined = IconData(name="fiber_smart_record", fontFamily="Material Symbols Outlined")
-    file_copy_outlined = IconData(name="file_copy", fontFamily="Material Symbols Outlined")
-    file_copy_off_outlined = IconData(name="file_copy_off", fontFamily="Material Symbols Outlined")
-    file_download_outlined = IconData(name="file_download", fontFamily="Material Symbols Outlined")
-    file_download_done_outlined = IconData(name="file_download_done", fontFamily="Material Symbols Outlined")
-    file_download_off_outlined = IconData(name="file_download_off", fontFamily="Material Symbols Outlined")
-    file_export_outlined = IconData(name="file_export", fontFamily="Material Symbols Outlined")
-    file_json_outlined = IconData(name="file_json", fontFamily="Material Symbols Outlined")
-    file_map_outlined = IconData(name="file_map", fontFamily="Material Symbols Outlined")
-    file_map_stack_outlined = IconData(name="file_map_stack", fontFamily="Material Symbols Outlined")
-    file_open_outlined = IconData(name="file_open", fontFamily="Material Symbols Outlined")
-    file_png_outlined = IconData(name="file_png", fontFamily="Material Symbols Outlined")
-    file_present_outlined = IconData(name="file_present", fontFamily="Material Symbols Outlined")
-    file_save_outlined = IconData(name="file_save", fontFamily="Material Symbols Outlined")
-    file_save_off_outlined = IconData(name="file_save_off", fontFamily="Material Symbols Outlined")
-    file_upload_outlined = IconData(name="file_upload", fontFamily="Material Symbols Outlined")
-    file_upload_off_outlined = IconData(name="file_upload_off", fontFamily="Material Symbols Outlined")
-    files_outlined = IconData(name="files", fontFamily="Material Symbols Outlined")
-    filter_outlined = IconData(name="filter", fontFamily="Material Symbols Outlined")
-    filter_1_outlined = IconData(name="filter_1", fontFamily="Material Symbols Outlined")
-    filter_2_outlined = IconData(name="filter_2", fontFamily="Material Symbols Outlined")
-    filter_3_outlined = IconData(name="filter_3", fontFamily="Material Symbols Outlined")
-    filter_4_outlined = IconData(name="filter_4", fontFamily="Material Symbols Outlined")
-    filter_5_outlined = IconData(name="filter_5", fontFamily="Material Symbols Outlined")
-    filter_6_outlined = IconData(name="filter_6", fontFamily="Material Symbols Outlined")
-    filter_7_outlined = IconData(name="filter_7", fontFamily="Material Symbols Outlined")
-    filter_8_outlined = IconData(name="filter_8", fontFamily="Material Symbols Outlined")
-    filter_9_outlined = IconData(name="filter_9", fontFamily="Material Symbols Outlined")
-    filter_9_plus_outlined = IconData(name="filter_9_plus", fontFamily="Material Symbols Outlined")
-    filter_alt_outlined = IconData(name="filter_alt", fontFamily="Material Symbols Outlined")
-    filter_alt_off_outlined = IconData(name="filter_alt_off", fontFamily="Material Symbols Outlined")
-    filter_arrow_right_outlined = IconData(name="filter_arrow_right", fontFamily="Material Symbols Outlined")
-    filter_b_and_w_outlined = IconData(name="filter_b_and_w", fontFamily="Material Symbols Outlined")
-    filter_center_focus_outlined = IconData(name="filter_center_focus", fontFamily="Material Symbols Outlined")
-    filter_drama_outlined = IconData(name="filter_drama", fontFamily="Material Symbols Outlined")
-    filter_frames_outlined = IconData(name="filter_frames", fontFamily="Material Symbols Outlined")
-    filter_hdr_outlined = IconData(name="filter_hdr", fontFamily="Material Symbols Outlined")
-    filter_list_outlined = IconData(name="filter_list", fontFamily="Material Symbols Outlined")
-    filter_list_alt_outlined = IconData(name="filter_list_alt", fontFamily="Material Symbols Outlined")
-    filter_list_off_outlined = IconData(name="filter_list_off", fontFamily="Material Symbols Outlined")
-    filter_none_outlined = IconData(name="filter_none", fontFamily="Material Symbols Outlined")
-    filter_retrolux_outlined = IconData(name="filter_retrolux", fontFamily="Material Symbols Outlined")
-    filter_tilt_shift_outlined = IconData(name="filter_tilt_shift", fontFamily="Material Symbols Outlined")
-    filter_vintage_outlined = IconData(name="filter_vintage", fontFamily="Material Symbols Outlined")
-    finance_outlined = IconData(name="finance", fontFamily="Material Symbols Outlined")
-    finance_chip_outlined = IconData(name="finance_chip", fontFamily="Material Symbols Outlined")
-    finance_mode_outlined = IconData(name="finance_mode", fontFamily="Material Symbols Outlined")
-    find_in_page_outlined = IconData(name="find_in_page", fontFamily="Material Symbols Outlined")
-    find_replace_outlined = IconData(name="find_replace", fontFamily="Material Symbols Outlined")
-    fingerprint_outlined = IconData(name="fingerprint", fontFamily="Material Symbols Outlined")
-    fingerprint_off_outlined = IconData(name="fingerprint_off", fontFamily="Material Symbols Outlined")
-    fire_extinguisher_outlined = IconData(name="fire_extinguisher", fontFamily="Material Symbols Outlined")
-    fire_hydrant_outlined = IconData(name="fire_hydrant", fontFamily="Material Symbols Outlined")
-    fire_truck_outlined = IconData(name="fire_truck", fontFamily="Material Symbols Outlined")
-    fireplace_outlined = IconData(name="fireplace", fontFamily="Material Symbols Outlined")
-    first_page_outlined = IconData(name="first_page", fontFamily="Material Symbols Outlined")
-    fit_page_outlined = IconData(name="fit_page", fontFamily="Material Symbols Outlined")
-    fit_page_height_outlined = IconData(name="fit_page_height", fontFamily="Material Symbols Outlined")
-    fit_page_width_outlined = IconData(name="fit_page_width", fontFamily="Material Symbols Outlined")
-    fit_screen_outlined = IconData(name="fit_screen", fontFamily="Material Symbols Outlined")
-    fit_width_outlined = IconData(name="fit_width", fontFamily="Material Symbols Outlined")
-    fitness_center_outlined = IconData(name="fitness_center", fontFamily="Material Symbols Outlined")
-    fitness_tracker_outlined = IconData(name="fitness_tracker", fontFamily="Material Symbols Outlined")
-    flag_outlined = IconData(name="flag", fontFamily="Material Symbols Outlined")
-    flag_2_outlined = IconData(name="flag_2", fontFamily="Material Symbols Outlined")
-    flag_check_outlined = IconData(name="flag_check", fontFamily="Material Symbols Outlined")
-    flag_circle_outlined = IconData(name="flag_circle", fontFamily="Material Symbols Outlined")
-    flag_filled_outlined = IconData(name="flag_filled", fontFamily="Material Symbols Outlined")
-    flaky_outlined = IconData(name="flaky", fontFamily="Material Symbols Outlined")
-    flare_outlined = IconData(name="flare", fontFamily="Material Symbols Outlined")
-    flash_auto_outlined = IconData(name="flash_auto", fontFamily="Material Symbols Outlined")
-    flash_off_outlined = IconData(name="flash_off", fontFamily="Material Symbols Outlined")
-    flash_on_outlined = IconData(name="flash_on", fontFamily="Material Symbols Outlined")
-    flashlight_off_outlined = IconData(name="flashlight_off", fontFamily="Material Symbols Outlined")
-    flashlight_on_outlined = IconData(name="flashlight_on", fontFamily="Material Symbols Outlined")
-    flatware_outlined = IconData(name="flatware", fontFamily="Material Symbols Outlined")
-    flex_direction_outlined = IconData(name="flex_direction", fontFamily="Material Symbols Outlined")
-    flex_no_wrap_outlined = IconData(name="flex_no_wrap", fontFamily="Material Symbols Outlined")
-    flex_wrap_outlined = IconData(name="flex_wrap", fontFamily="Material Symbols Outlined")
-    flight_outlined = IconData(name="flight", fontFamily="Material Symbols Outlined")
-    flight_class_outlined = IconData(name="flight_class", fontFamily="Material Symbols Outlined")
-    flight_land_outlined = IconData(name="flight_land", fontFamily="Material Symbols Outlined")
-    flight_takeoff_outlined = IconData(name="flight_takeoff", fontFamily="Material Symbols Outlined")
-    flights_and_hotels_outlined = IconData(name="flights_and_hotels", fontFamily="Material Symbols Outlined")
-    flightsmode_outlined = IconData(name="flightsmode", fontFamily="Material Symbols Outlined")
-    flip_outlined = IconData(name="flip", fontFamily="Material Symbols Outlined")
-    flip_camera_android_outlined = IconData(name="flip_camera_android", fontFamily="Material Symbols Outlined")
-    flip_camera_ios_outlined = IconData(name="flip_camera_ios", fontFamily="Material Symbols Outlined")
-    flip_to_back_outlined = IconData(name="flip_to_back", fontFamily="Material Symbols Outlined")
-    flip_to_front_outlined = IconData(name="flip_to_front", fontFamily="Material Symbols Outlined")
-    float_landscape_2_outlined = IconData(name="float_landscape_2", fontFamily="Material Symbols Outlined")
-    float_portrait_2_outlined = IconData(name="float_portrait_2", fontFamily="Material Symbols Outlined")
-    flood_outlined = IconData(name="flood", fontFamily="Material Symbols Outlined")
-    floor_outlined = IconData(name="floor", fontFamily="Material Symbols Outlined")
-    floor_lamp_outlined = IconData(name="floor_lamp", fontFamily="Material Symbols Outlined")
-    flourescent_outlined = IconData(name="flourescent", fontFamily="Material Symbols Outlined")
-    flowchart_outlined = IconData(name="flowchart", fontFamily="Material Symbols Outlined")
-    flowsheet_outlined = IconData(name="flowsheet", fontFamily="Material Symbols Outlined")
-    fluid_outlined = IconData(name="fluid", fontFamily="Material Symbols Outlined")
-    fluid_balance_outlined = IconData(name="fluid_balance", fontFamily="Material Symbols Outlined")
-    fluid_med_outlined = IconData(name="fluid_med", fontFamily="Material Symbols Outlined")
-    fluorescent_outlined = IconData(name="fluorescent", fontFamily="Material Symbols Outlined")
-    flutter_outlined = IconData(name="flutter", fontFamily="Material Symbols Outlined")
-    flutter_dash_outlined = IconData(name="flutter_dash", fontFamily="Material Symbols Outlined")
-    flyover_outlined = IconData(name="flyover", fontFamily="Material Symbols Outlined")
-    fmd_bad_outlined = IconData(name="fmd_bad", fontFamily="Material Symbols Outlined")
-    fmd_good_outlined = IconData(name="fmd_good", fontFamily="Material Symbols Outlined")
-    foggy_outlined = IconData(name="foggy", fontFamily="Material Symbols Outlined")
-    folded_hands_outlined = IconData(name="folded_hands", fontFamily="Material Symbols Outlined")
-    folder_outlined = IconData(name="folder", fontFamily="Material Symbols Outlined")
-    folder_check_outlined = IconData(name="folder_check", fontFamily="Material Symbols Outlined")
-    folder_check_2_outlined = IconData(name="folder_check_2", fontFamily="Material Symbols Outlined")
-    folder_code_outlined = IconData(name="folder_code", fontFamily="Material Symbols Outlined")
-    folder_copy_outlined = IconData(name="folder_copy", fontFamily="Material Symbols Outlined")
-    folder_data_outlined = IconData(name="folder_data", fontFamily="Material Symbols Outlined")
-    folder_delete_outlined = IconData(name="folder_delete", fontFamily="Material Symbols Outlined")
-    folder_eye_outlined = IconData(name="folder_eye", fontFamily="Material Symbols Outlined")
-    folder_info_outlined = IconData(name="folder_info", fontFamily="Material Symbols Outlined")
-    folder_limited_outlined = IconData(name="folder_limited", fontFamily="Material Symbols Outlined")
-    folder_managed_outlined = IconData(name="folder_managed", fontFamily="Material Symbols Outlined")
-    folder_match_outlined = IconData(name="folder_match", fontFamily="Material Symbols Outlined")
-    folder_off_outlined = IconData(name="folder_off", fontFamily="Material Symbols Outlined")
-    folder_open_outlined = IconData(name="folder_open", fontFamily="Material Symbols Outlined")
-    folder_shared_outlined = IconData(name="folder_shared", fontFamily="Material Symbols Outlined")
-    folder_special_outlined = IconData(name="folder_special", fontFamily="Material Symbols Outlined")
-    folder_supervised_outlined = IconData(name="folder_supervised", fontFamily="Material Symbols Outlined")
-    folder_zip_outlined = IconData(name="folder_zip", fontFamily="Material Symbols Outlined")
-    follow_the_signs_outlined = IconData(name="follow_the_signs", fontFamily="Material Symbols Outlined")
-    font_download_outlined = IconData(name="font_download", fontFamily="Material Symbols Outlined")
-    font_download_off_outlined = IconData(name="font_download_off", fontFamily="Material Symbols Outlined")
-    food_bank_outlined = IconData(name="food_bank", fontFamily="Material Symbols Outlined")
-    foot_bones_outlined = IconData(name="foot_bones", fontFamily="Material Symbols Outlined")
-    footprint_outlined = IconData(name="footprint", fontFamily="Material Symbols Outlined")
-    for_you_outlined = IconData(name="for_you", fontFamily="Material Symbols Outlined")
-    forest_outlined = IconData(name="forest", fontFamily="Material Symbols Outlined")
-    fork_left_outlined = IconData(name="fork_left", fontFamily="Material Symbols Outlined")
-    fork_right_outlined = IconData(name="fork_right", fontFamily="Material Symbols Outlined")
-    fork_spoon_outlined = IconData(name="fork_spoon", fontFamily="Material Symbols Outlined")
-    forklift_outlined = IconData(name="forklift", fontFamily="Material Symbols Outlined")
-    format_align_center_outlined = IconData(name="format_align_center", fontFamily="Material Symbols Outlined")
-    format_align_justify_outlined = IconData(name="format_align_justify", fontFamily="Material Symbols Outlined")
-    format_align_left_outlined = IconData(name="format_align_left", fontFamily="Material Symbols Outlined")
-    format_align_right_outlined = IconData(name="format_align_right", fontFamily="Material Symbols Outlined")
-    format_bold_outlined = IconData(name="format_bold", fontFamily="Material Symbols Outlined")
-    format_clear_outlined = IconData(name="format_clear", fontFamily="Material Symbols Outlined")
-    format_color_fill_outlined = IconData(name="format_color_fill", fontFamily="Material Symbols Outlined")
-    format_color_reset_outlined = IconData(name="format_color_reset", fontFamily="Material Symbols Outlined")
-    format_color_text_outlined = IconData(name="format_color_text", fontFamily="Material Symbols Outlined")
-    format_h1_outlined = IconData(name="format_h1", fontFamily="Material Symbols Outlined")
-    format_h2_outlined = IconData(name="format_h2", fontFamily="Material Symbols Outlined")
-    format_h3_outlined = IconData(name="format_h3", fontFamily="Material Symbols Outlined")
-    format_h4_outlined = IconData(name="format_h4", fontFamily="Material Symbols Outlined")
-    format_h5_outlined = IconData(name="format_h5", fontFamily="Material Symbols Outlined")
-    format_h6_outlined = IconData(name="format_h6", fontFamily="Material Symbols Outlined")
-    format_image_left_outlined = IconData(name="format_image_left", fontFamily="Material Symbols Outlined")
-    format_image_right_outlined = IconData(name="format_image_right", fontFamily="Material Symbols Outlined")
-    format_indent_decrease_outlined = IconData(name="format_indent_decrease", fontFamily="Material Symbols Outlined")
-    format_indent_increase_outlined = IconData(name="format_indent_increase", fontFamily="Material Symbols Outlined")
-    format_ink_highlighter_outlined = IconData(name="format_ink_highlighter", fontFamily="Material Symbols Outlined")
-    format_italic_outlined = IconData(name="format_italic", fontFamily="Material Symbols Outlined")
-    format_letter_spacing_outlined = IconData(name="format_letter_spacing", fontFamily="Material Symbols Outlined")
-    format_letter_spacing_2_outlined = IconData(name="format_letter_spacing_2", fontFamily="Material Symbols Outlined")
-    format_letter_spacing_standard_outlined = IconData(name="format_letter_spacing_standard", fontFamily="Material Symbols Outlined")
-    format_letter_spacing_wide_outlined = IconData(name="format_letter_spacing_wide", fontFamily="Material Symbols Outlined")
-    format_letter_spacing_wider_outlined = IconData(name="format_letter_spacing_wider", fontFamily="Material Symbols Outlined")
-    format_line_spacing_outlined = IconData(name="format_line_spacing", fontFamily="Material Symbols Outlined")
-    format_list_bulleted_outlined = IconData(name="format_list_bulleted", fontFamily="Material Symbols Outlined")
-    format_list_bulleted_add_outlined = IconData(name="format_list_bulleted_add", fontFamily="Material Symbols Outlined")
-    format_list_numbered_outlined = IconData(name="format_list_numbered", fontFamily="Material Symbols Outlined")
-    format_list_numbered_rtl_outlined = IconData(name="format_list_numbered_rtl", fontFamily="Material Symbols Outlined")
-    format_overline_outlined = IconData(name="format_overline", fontFamily="Material Symbols Outlined")
-    format_paint_outlined = IconData(name="format_paint", fontFamily="Material Symbols Outlined")
-    format_paragraph_outlined = IconData(name="format_paragraph", fontFamily="Material Symbols Outlined")
-    format_quote_outlined = IconData(name="format_quote", fontFamily="Material Symbols Outlined")
-    format_quote_off_outlined = IconData(name="format_quote_off", fontFamily="Material Symbols Outlined")
-    format_shapes_outlined = IconData(name="format_shapes", fontFamily="Material Symbols Outlined")
-    format_size_outlined = IconData(name="format_size", fontFamily="Material Symbols Outlined")
-    format_strikethrough_outlined = IconData(name="format_strikethrough", fontFamily="Material Symbols Outlined")
-    format_text_clip_outlined = IconData(name="format_text_clip", fontFamily="Material Symbols Outlined")
-    format_text_overflow_outlined = IconData(name="format_text_overflow", fontFamily="Material Symbols Outlined")
-    format_text_wrap_outlined = IconData(name="format_text_wrap", fontFamily="Material Symbols Outlined")
-    format_textdirection_l_to_r_outlined = IconData(name="format_textdirection_l_to_r", fontFamily="Material Symbols Outlined")
-    format_textdirection_r_to_l_outlined = IconData(name="format_textdirection_r_to_l", fontFamily="Material Symbols Outlined")
-    format_textdirection_vertical_outlined = IconData(name="format_textdirection_vertical", fontFamily="Material Symbols Outlined")
-    format_underlined_outlined = IconData(name="format_underlined", fontFamily="Material Symbols Outlined")
-    format_underlined_squiggle_outlined = IconData(name="format_underlined_squiggle", fontFamily="Material Symbols Outlined")
-    forms_add_on_outlined = IconData(name="forms_add_on", fontFamily="Material Symbols Outlined")
-    forms_apps_script_outlined = IconData(name="forms_apps_script", fontFamily="Material Symbols Outlined")
-    fort_outlined = IconData(name="fort", fontFamily="Material Symbols Outlined")
-    forum_outlined = IconData(name="forum", fontFamily="Material Symbols Outlined")
-    forward_outlined = IconData(name="forward", fontFamily="Material Symbols Outlined")
-    forward_10_outlined = IconData(name="forward_10", fontFamily="Material Symbols Outlined")
-    forward_30_outlined = IconData(name="forward_30", fontFamily="Material Symbols Outlined")
-    forward_5_outlined = IconData(name="forward_5", fontFamily="Material Symbols Outlined")
-    forward_circle_outlined = IconData(name="forward_circle", fontFamily="Material Symbols Outlined")
-    forward_media_outlined = IconData(name="forward_media", fontFamily="Material Symbols Outlined")
-    forward_to_inbox_outlined = IconData(name="forward_to_inbox", fontFamily="Material Symbols Outlined")
-    foundation_outlined = IconData(name="foundation", fontFamily="Material Symbols Outlined")
-    fragrance_outlined = IconData(name="fragrance", fontFamily="Material Symbols Outlined")
-    frame_inspect_outlined = IconData(name="frame_inspect", fontFamily="Material Symbols Outlined")
-    frame_person_outlined = IconData(name="frame_person", fontFamily="Material Symbols Outlined")
-    frame_person_mic_outlined = IconData(name="frame_person_mic", fontFamily="Material Symbols Outlined")
-    frame_person_off_outlined = IconData(name="frame_person_off", fontFamily="Material Symbols Outlined")
-    frame_reload_outlined = IconData(name="frame_reload", fontFamily="Material Symbols Outlined")
-    frame_source_outlined = IconData(name="frame_source", fontFamily="Material Symbols Outlined")
-    free_breakfast_outlined = IconData(name="free_breakfast", fontFamily="Material Symbols Outlined")
-    free_cancellation_outlined = IconData(name="free_cancellation", fontFamily="Material Symbols Outlined")
-    front_hand_outlined = IconData(name="front_hand", fontFamily="Material Symbols Outlined")
-    front_loader_outlined = IconData(name="front_loader", fontFamily="Material Symbols Outlined")
-    full_coverage_outlined = IconData(name="full_coverage", fontFamily="Material Symbols Outlined")
-    full_hd_outlined = IconData(name="full_hd", fontFamily="Material Symbols Outlined")
-    full_stacked_bar_chart_outlined = IconData(name="full_stacked_bar_chart", fontFamily="Material Symbols Outlined")
-    fullscreen_outlined = IconData(name="fullscreen", fontFamily="Material Symbols Outlined")
-    fullscreen_exit_outlined = IconData(name="fullscreen_exit", fontFamily="Material Symbols Outlined")
-    fullscreen_portrait_outlined = IconData(name="fullscreen_portrait", fontFamily="Material Symbols Outlined")
-    function_outlined = IconData(name="function", fontFamily="Material Symbols Outlined")
-    functions_outlined = IconData(name="functions", fontFamily="Material Symbols Outlined")
-    funicular_outlined = IconData(name="funicular", fontFamily="Material Symbols Outlined")
-    g_mobiledata_outlined = IconData(name="g_mobiledata", fontFamily="Material Symbols Outlined")
-    g_mobiledata_badge_outlined = IconData(name="g_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    g_translate_outlined = IconData(name="g_translate", fontFamily="Material Symbols Outlined")
-    gallery_thumbnail_outlined = IconData(name="gallery_thumbnail", fontFamily="Material Symbols Outlined")
-    gamepad_outlined = IconData(name="gamepad", fontFamily="Material Symbols Outlined")
-    games_outlined = IconData(name="games", fontFamily="Material Symbols Outlined")
-    garage_outlined = IconData(name="garage", fontFamily="Material Symbols Outlined")
-    garage_door_outlined = IconData(name="garage_door", fontFamily="Material Symbols Outlined")
-    garage_home_outlined = IconData(name="garage_home", fontFamily="Material Symbols Outlined")
-    garden_cart_outlined = IconData(name="garden_cart", fontFamily="Material Symbols Outlined")
-    gas_meter_outlined = IconData(name="gas_meter", fontFamily="Material Symbols Outlined")
-    gastroenterology_outlined = IconData(name="gastroenterology", fontFamily="Material Symbols Outlined")
-    gate_outlined = IconData(name="gate", fontFamily="Material Symbols Outlined")
-    gavel_outlined = IconData(name="gavel", fontFamily="Material Symbols Outlined")
-    general_device_outlined = IconData(name="general_device", fontFamily="Material Symbols Outlined")
-    generating_tokens_outlined = IconData(name="generating_tokens", fontFamily="Material Symbols Outlined")
-    genetics_outlined = IconData(name="genetics", fontFamily="Material Symbols Outlined")
-    genres_outlined = IconData(name="genres", fontFamily="Material Symbols Outlined")
-    gesture_outlined = IconData(name="gesture", fontFamily="Material Symbols Outlined")
-    gesture_select_outlined = IconData(name="gesture_select", fontFamily="Material Symbols Outlined")
-    get_app_outlined = IconData(name="get_app", fontFamily="Material Symbols Outlined")
-    gif_outlined = IconData(name="gif", fontFamily="Material Symbols Outlined")
-    gif_2_outlined = IconData(name="gif_2", fontFamily="Material Symbols Outlined")
-    gif_box_outlined = IconData(name="gif_box", fontFamily="Material Symbols Outlined")
-    girl_outlined = IconData(name="girl", fontFamily="Material Symbols Outlined")
-    gite_outlined = IconData(name="gite", fontFamily="Material Symbols Outlined")
-    glass_cup_outlined = IconData(name="glass_cup", fontFamily="Material Symbols Outlined")
-    globe_outlined = IconData(name="globe", fontFamily="Material Symbols Outlined")
-    globe_asia_outlined = IconData(name="globe_asia", fontFamily="Material Symbols Outlined")
-    globe_book_outlined = IconData(name="globe_book", fontFamily="Material Symbols Outlined")
-    globe_location_pin_outlined = IconData(name="globe_location_pin", fontFamily="Material Symbols Outlined")
-    globe_uk_outlined = IconData(name="globe_uk", fontFamily="Material Symbols Outlined")
-    glucose_outlined = IconData(name="glucose", fontFamily="Material Symbols Outlined")
-    glyphs_outlined = IconData(name="glyphs", fontFamily="Material Symbols Outlined")
-    go_to_line_outlined = IconData(name="go_to_line", fontFamily="Material Symbols Outlined")
-    golf_course_outlined = IconData(name="golf_course", fontFamily="Material Symbols Outlined")
-    gondola_lift_outlined = IconData(name="gondola_lift", fontFamily="Material Symbols Outlined")
-    google_home_devices_outlined = IconData(name="google_home_devices", fontFamily="Material Symbols Outlined")
-    google_plus_reshare_outlined = IconData(name="google_plus_reshare", fontFamily="Material Symbols Outlined")
-    google_tv_remote_outlined = IconData(name="google_tv_remote", fontFamily="Material Symbols Outlined")
-    google_wifi_outlined = IconData(name="google_wifi", fontFamily="Material Symbols Outlined")
-    gpp_bad_outlined = IconData(name="gpp_bad", fontFamily="Material Symbols Outlined")
-    gpp_good_outlined = IconData(name="gpp_good", fontFamily="Material Symbols Outlined")
-    gpp_maybe_outlined = IconData(name="gpp_maybe", fontFamily="Material Symbols Outlined")
-    gps_fixed_outlined = IconData(name="gps_fixed", fontFamily="Material Symbols Outlined")
-    gps_not_fixed_outlined = IconData(name="gps_not_fixed", fontFamily="Material Symbols Outlined")
-    gps_off_outlined = IconData(name="gps_off", fontFamily="Material Symbols Outlined")
-    grade_outlined = IconData(name="grade", fontFamily="Material Symbols Outlined")
-    gradient_outlined = IconData(name="gradient", fontFamily="Material Symbols Outlined")
-    grading_outlined = IconData(name="grading", fontFamily="Material Symbols Outlined")
-    grain_outlined = IconData(name="grain", fontFamily="Material Symbols Outlined")
-    graph_1_outlined = IconData(name="graph_1", fontFamily="Material Symbols Outlined")
-    graph_2_outlined = IconData(name="graph_2", fontFamily="Material Symbols Outlined")
-    graph_3_outlined = IconData(name="graph_3", fontFamily="Material Symbols Outlined")
-    graph_4_outlined = IconData(name="graph_4", fontFamily="Material Symbols Outlined")
-    graph_5_outlined = IconData(name="graph_5", fontFamily="Material Symbols Outlined")
-    graph_6_outlined = IconData(name="graph_6", fontFamily="Material Symbols Outlined")
-    graph_7_outlined = IconData(name="graph_7", fontFamily="Material Symbols Outlined")
-    graphic_eq_outlined = IconData(name="graphic_eq", fontFamily="Material Symbols Outlined")
-    grass_outlined = IconData(name="grass", fontFamily="Material Symbols Outlined")
-    grid_3x3_outlined = IconData(name="grid_3x3", fontFamily="Material Symbols Outlined")
-    grid_3x3_off_outlined = IconData(name="grid_3x3_off", fontFamily="Material Symbols Outlined")
-    grid_4x4_outlined = IconData(name="grid_4x4", fontFamily="Material Symbols Outlined")
-    grid_goldenratio_outlined = IconData(name="grid_goldenratio", fontFamily="Material Symbols Outlined")
-    grid_guides_outlined = IconData(name="grid_guides", fontFamily="Material Symbols Outlined")
-    grid_off_outlined = IconData(name="grid_off", fontFamily="Material Symbols Outlined")
-    grid_on_outlined = IconData(name="grid_on", fontFamily="Material Symbols Outlined")
-    grid_view_outlined = IconData(name="grid_view", fontFamily="Material Symbols Outlined")
-    grocery_outlined = IconData(name="grocery", fontFamily="Material Symbols Outlined")
-    group_outlined = IconData(name="group", fontFamily="Material Symbols Outlined")
-    group_add_outlined = IconData(name="group_add", fontFamily="Material Symbols Outlined")
-    group_off_outlined = IconData(name="group_off", fontFamily="Material Symbols Outlined")
-    group_remove_outlined = IconData(name="group_remove", fontFamily="Material Symbols Outlined")
-    group_search_outlined = IconData(name="group_search", fontFamily="Material Symbols Outlined")
-    group_work_outlined = IconData(name="group_work", fontFamily="Material Symbols Outlined")
-    grouped_bar_chart_outlined = IconData(name="grouped_bar_chart", fontFamily="Material Symbols Outlined")
-    groups_outlined = IconData(name="groups", fontFamily="Material Symbols Outlined")
-    groups_2_outlined = IconData(name="groups_2", fontFamily="Material Symbols Outlined")
-    groups_3_outlined = IconData(name="groups_3", fontFamily="Material Symbols Outlined")
-    guardian_outlined = IconData(name="guardian", fontFamily="Material Symbols Outlined")
-    gynecology_outlined = IconData(name="gynecology", fontFamily="Material Symbols Outlined")
-    h_mobiledata_outlined = IconData(name="h_mobiledata", fontFamily="Material Symbols Outlined")
-    h_mobiledata_badge_outlined = IconData(name="h_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    h_plus_mobiledata_outlined = IconData(name="h_plus_mobiledata", fontFamily="Material Symbols Outlined")
-    h_plus_mobiledata_badge_outlined = IconData(name="h_plus_mobiledata_badge", fontFamily="Material Symbols Outlined")
-    hail_outlined = IconData(name="hail", fontFamily="Material Symbols Outlined")
-    hallway_outlined = IconData(name="hallway", fontFamily="Material Symbols Outlined")
-    hand_bones_outlined = IconData(name="hand_bones", fontFamily="Material Symbols Outlined")
-    hand_gesture_outlined = IconData(name="hand_gesture", fontFamily="Material Symbols Outlined")
-    hand_gesture_off_outlined = IconData(name="hand_gesture_off", fontFamily="Material Symbols Outlined")
-    handheld_controller_outlined = IconData(name="handheld_controller", fontFamily="Material Symbols Outlined")
-    handshake_outlined = IconData(name="handshake", fontFamily="Material Symbols Outlined")
-    handwriting_recognition_outlined = IconData(name="handwriting_recognition", fontFamily="Material Symbols Outlined")
-    handyman_outlined = IconData(name="handyman", fontFamily="Material Symbols Outlined")
-    hangout_video_outlined = IconData(name="hangout_video", fontFamily="Material Symbols Outlined")
-    hangout_video_off_outlined = IconData(name="hangout_video_off", fontFamily="Material Symbols Outlined")
-    hard_disk_outlined = IconData(name="hard_disk", fontFamily="Material Symbols Outlined")
-    hard_drive_outlined = IconData(name="hard_drive", fontFamily="Material Symbols Outlined")
-    hard_drive_2_outlined = IconData(name="hard_drive_2", fontFamily="Material Symbols Outlined")
-    hardware_outlined = IconData(name="hardware", fontFamily="Material Symbols Outlined")
-    hd_outlined = IconData(name="hd", fontFamily="Material Symbols Outlined")
-    hdr_auto_outlined = IconData(name="hdr_auto", fontFamily="Material Symbols Outlined")
-    hdr_auto_select_outlined = IconData(name="hdr_auto_select", fontFamily="Material Symbols Outlined")
-    hdr_enhanced_select_outlined = IconData(name="hdr_enhanced_select", fontFamily="Material Symbols Outlined")
-    hdr_off_outlined = IconData(name="hdr_off", fontFamily="Material Symbols Outlined")
-    hdr_off_select_outlined = IconData(name="hdr_off_select", fontFamily="Material Symbols Outlined")
-    hdr_on_outlined = IconData(name="hdr_on", fontFamily="Material Symbols Outlined")
-    hdr_on_select_outlined = IconData(name="hdr_on_select", fontFamily="Material Symbols Outlined")
-    hdr_plus_outlined = IconData(name="hdr_plus", fontFamily="Material Symbols Outlined")
-    hdr_plus_off_outlined = IconData(name="hdr_plus_off", fontFamily="Material Symbols Outlined")
-    hdr_strong_outlined = IconData(name="hdr_strong", fontFamily="Material Symbols Outlined")
-    hdr_weak_outlined = IconData(name="hdr_weak", fontFamily="Material Symbols Outlined")
-    head_mounted_device_outlined = IconData(name="head_mounted_device", fontFamily="Material Symbols Outlined")
-    headphones_outlined = IconData(name="headphones", fontFamily="Material Symbols Outlined")
-    headphones_battery_outlined = IconData(name="headphones_battery", fontFamily="Material Symbols Outlined")
-    headset_outlined = IconData(name="headset", fontFamily="Material Symbols Outlined")
-    headset_mic_outlined = IconData(name="headset_mic", fontFamily="Material Symbols Outlined")
-    headset_off_outlined = IconData(name="headset_off", fontFamily="Material Symbols Outlined")
-    healing_outlined = IconData(name="healing", fontFamily="Material Symbols Outlined")
-    health_and_beauty_outlined = IconData(name="health_and_beauty", fontFamily="Material Symbols Outlined")
-    health_and_safety_outlined = IconData(name="health_and_safety", fontFamily="Material Symbols Outlined")
-    health_metrics_outlined = IconData(name="health_metrics", fontFamily="Material Symbols Outlined")
-    heap_snapshot_large_outlined = IconData(name="heap_snapshot_large", fontFamily="Material Symbols Outlined")
-    heap_snapshot_multiple_outlined = IconData(name="heap_snapshot_multiple", fontFamily="Material Symbols Outlined")
-    heap_snapshot_thumbnail_outlined = IconData(name="heap_snapshot_thumbnail", fontFamily="Material Symbols Outlined")
-    hearing_outlined = IconData(name="hearing", fontFamily="Material Symbols Outlined")
-    hearing_aid_outlined = IconData(name="hearing_aid", fontFamily="Material Symbols Outlined")
-    hearing_aid_disabled_outlined = IconData(name="hearing_aid_disabled", fontFamily="Material Symbols Outlined")
-    hearing_disabled_outlined = IconData(name="hearing_disabled", fontFamily="Material Symbols Outlined")
-    heart_broken_outlined = IconData(name="heart_broken", fontFamily="Material Symbols Outlined")
-    heart_check_outlined = IconData(name="heart_check", fontFamily="Material Symbols Outlined")
-    heart_minus_outlined = IconData(name="heart_minus", fontFamily="Material Symbols Outlined")
-    heart_plus_outlined = IconData(name="heart_plus", fontFamily="Material Symbols Outlined")
-    heat_outlined = IconData(name="heat", fontFamily="Material Symbols Outlined")
-    heat_pump_outlined = IconData(name="heat_pump", fontFamily="Material Symbols Outlined")
-    heat_pump_balance_outlined = IconData(name="heat_pump_balance", fontFamily="Material Symbols Outlined")
-    height_outlined = IconData(name="height", fontFamily="Material Symbols Outlined")
-    helicopter_outlined = IconData(name="helicopter", fontFamily="Material Symbols Outlined")
-    help_outlined = IconData(name="help", fontFamily="Material Symbols Outlined")
-    help_center_outlined = IconData(name="help_center", fontFamily="Material Symbols Outlined")
-    help_clinic_outlined = IconData(name="help_clinic", fontFamily="Material Symbols Outlined")
-    help_outline_outlined = IconData(name="help_outline", fontFamily="Material Symbols Outlined")
-    hematology_outlined = IconData(name="hematology", fontFamily="Material Symbols Outlined")
-    hevc_outlined = IconData(name="hevc", fontFamily="Material Symbols Outlined")
-    hexagon_outlined = IconData(name="hexagon", fontFamily="Material Symbols Outlined")
-    hide_outlined = IconData(name="hide", fontFamily="Material Symbols Outlined")
-    hide_image_outlined = IconData(name="hide_image", fontFamily="Material Symbols Outlined")
-    hide_source_outlined = IconData(name="hide_source", fontFamily="Material Symbols Outlined")
-    high_density_outlined = IconData(name="high_density", fontFamily="Material Symbols Outlined")
-    high_quality_outlined = IconData(name="high_quality", fontFamily="Material Symbols Outlined")
-    high_res_outlined = IconData(name="high_res", fontFamily="Material Symbols Outlined")
-    highlight_outlined = IconData(name="highlight", fontFamily="Material Symbols Outlined")
-    highlight_alt_outlined = IconData(name="highlight_alt", fontFamily="Material Symbols Outlined")
-    highlight_keyboard_focus_outlined = IconData(name="highlight_keyboard_focus", fontFamily="Material Symbols Outlined")
-    highlight_mouse_cursor_outlined = IconData(name="highlight_mouse_cursor", fontFamily="Material Symbols Outlined")
-    highlight_off_outlined = IconData(name="highlight_off", fontFamily="Material Symbols Outlined")
-    highlight_text_cursor_outlined = IconData(name="highlight_text_cursor", fontFamily="Material Symbols Outlined")
-    highlighter_size_1_outlined = IconData(name="highlighter_size_1", fontFamily="Material Symbols Outlined")
-    highlighter_size_2_outlined = IconData(name="highlighter_size_2", fontFamily="Material Symbols Outlined")
-    highlighter_size_3_outlined = IconData(name="highlighter_size_3", fontFamily="Material Symbols Outlined")
-    highlighter_size_4_outlined = IconData(name="highlighter_size_4", fontFamily="Material Symbols Outlined")
-    highlighter_size_5_outlined = IconData(name="highlighter_size_5", fontFamily="Material Symbols Outlined")
-    hiking_outlined = IconData(name="hiking", fontFamily="Material Symbols Outlined")
-    history_outlined = IconData(name="history", fontFamily="Material Symbols Outlined")
-    history_2_outlined = IconData(name="history_2", fontFamily="Material Symbols Outlined")
-    history_edu_outlined = IconData(name="history_edu", fontFamily="Material Symbols Outlined")
-    history_off_outlined = IconData(name="history_off", fontFamily="Material Symbols Outlined")
-    history_toggle_off_outlined = IconData(name="history_toggle_off", fontFamily="Material Symbols Outlined")
-    hive_outlined = IconData(name="hive", fontFamily="Material Symbols Outlined")
-    hls_outlined = IconData(name="hls", fontFamily="Material Symbols Outlined")
-    hls_off_outlined = IconData(name="hls_off", fontFamily="Material Symbols Outlined")
-    holiday_village_outlined = IconData(name="holiday_village", fontFamily="Material Symbols Outlined")
-    home_outlined = IconData(name="home", fontFamily="Material Symbols Outlined")
-    home_and_garden_outlined = IconData(name="home_and_garden", fontFamily="Material Symbols Outlined")
-    home_app_logo_outlined = IconData(name="home_app_logo", fontFamily="Material Symbols Outlined")
-    home_filled_outlined = IconData(name="home_filled", fontFamily="Material Symbols Outlined")
-    home_health_outlined = IconData(name="home_health", fontFamily="Material Symbols Outlined")
-    home_improvement_and_tools_outlined = IconData(name="home_improvement_and_tools", fontFamily="Material Symbols Outlined")
-    home_iot_device_outlined = IconData(name="home_iot_device", fontFamily="Material Symbols Outlined")
-    home_max_outlined = IconData(name="home_max", fontFamily="Material Symbols Outlined")
-    home_max_dots_outlined = IconData(name="home_max_dots", fontFamily="Material Symbols Outlined")
-    home_mini_outlined = IconData(name="home_mini", fontFamily="Material Symbols Outlined")
-    home_pin_outlined = IconData(name="home_pin", fontFamily="Material Symbols Outlined")
-    home_repair_service_outlined = IconData(name="home_repair_service", fontFamily="Material Symbols Outlined")
-    home_speaker_outlined = IconData(name="home_speaker", fontFamily="Material Symbols Outlined")
-    home_storage_outlined = IconData(name="home_storage", fontFamily="Material Symbols Outlined")
-    home_work_outlined = IconData(name="home_work", fontFamily="Material Symbols Outlined")
-    horizontal_distribute_outlined = IconData(name="horizontal_distribute", fontFamily="Material Symbols Outlined")
-    horizontal_rule_outlined = IconData(name="horizontal_rule", fontFamily="Material Symbols Outlined")
-    horizontal_split_outlined = IconData(name="horizontal_split", fontFamily="Material Symbols Outlined")
-    host_outlined = IconData(name="host", fontFamily="Material Symbols Outlined")
-    hot_tub_outlined = IconData(name="hot_tub", fontFamily="Material Symbols Outlined")
-    hotel_outlined = IconData(name="hotel", fontFamily="Material Symbols Outlined")
-    hotel_class_outlined = IconData(name="hotel_class", fontFamily="Material Symbols Outlined")
-    hourglass_outlined = IconData(name="hourglass", fontFamily="Material Symbols Outlined")
-    hourglass_arrow_down_outlined = IconData(name="hourglass_arrow_down", fontFamily="Material Symbols Outlined")
-    hourglass_arrow_up_outlined = IconData(name="hourglass_arrow_up", fontFamily="Material Symbols Outlined")
-    hourglass_bottom_outlined = IconData(name="hourglass_bottom", fontFamily="Material Symbols Outlined")
-    hourglass_disabled_outlined = IconData(name="hourglass_disabled", fontFamily="Material Symbols Outlined")
-    hourglass_empty_outlined = IconData(name="hourglass_empty", fontFamily="Material Symbols Outlined")
-    hourglass_full_outlined = IconData(name="hourglass_full", fontFamily="Material Symbols Outlined")
-    hourglass_pause_outlined = IconData(name="hourglass_pause", fontFamily="Material Symbols Outlined")
-    hourglass_top_outlined = IconData(name="hourglass_top", fontFamily="Material Symbols Outlined")
-    house_outlined = IconData(name="house", fontFamily="Material Symbols Outlined")
-    house_siding_outlined = IconData(name="house_siding", fontFamily="Material Symbols Outlined")
-    house_with_shield_outlined = IconData(name="house_with_shield", fontFamily="Material Symbols Outlined")
-    houseboat_outlined = IconData(name="houseboat", fontFamily="Material Symbols Outlined")
-    household_supplies_outlined = IconData(name="household_supplies", fontFamily="Material Symbols Outlined")
-    hov_outlined = IconData(name="hov", fontFamily="Material Symbols Outlined")
-    how_to_reg_outlined = IconData(name="how_to_reg", fontFamily="Material Symbols Outlined")
-    how_to_vote_outlined = IconData(name="how_to_vote", fontFamily="Material Symbols Outlined")
-    hr_resting_outlined = IconData(name="hr_resting", fontFamily="Material Symbols Outlined")
-    html_outlined = IconData(name="html", fontFamily="Material Symbols Outlined")
-    http_outlined = IconData(name="http", fontFamily="Material Symbols Outlined")
-    https_outlined = IconData(name="https", fontFamily="Material Symbols Outlined")
-    hub_outlined = IconData(name="hub", fontFamily="Material Symbols Outlined")
-    humerus_outlined = IconData(name="humerus", fontFamily="Material Symbols Outlined")
-    humerus_alt_outlined = IconData(name="humerus_alt", fontFamily="Material Symbols Outlined")
-    humidity_high_outlined = IconData(name="humidity_high", fontFamily="Material Symbols Outlined")
-    humidity_indoor_outlined = IconData(name="humidity_indoor", fontFamily="Material Symbols Outlined")
-    humidity_low_outlined = IconData(name="humidity_low", fontFamily="Material Symbols Outlined")
-    humidity_mid_outlined = IconData(name="humidity_mid", fontFamily="Material Symbols Outlined")
-    humidity_percentage_outlined = IconData(name="humidity_percentage", fontFamily="Material Symbols Outlined")
-    hvac_outlined = IconData(name="hvac", fontFamily="Material Symbols Outlined")
-    hvac_max_defrost_outlined = IconData(name="hvac_max_defrost", fontFamily="Material Symbols Outlined")
-    ice_skating_outlined = IconData(name="ice_skating", fontFamily="Material Symbols Outlined")
-    icecream_outlined = IconData(name="icecream", fontFamily="Material Symbols Outlined")
-    id_card_outlined = IconData(name="id_card", fontFamily="Material Symbols Outlined")
-    identity_aware_proxy_outlined = IconData(name="identity_aware_proxy", fontFamily="Material Symbols Outlined")
-    identity_platform_outlined = IconData(name="identity_platform", fontFamily="Material Symbols Outlined")
-    ifl_outlined = IconData(name="ifl", fontFamily="Material Symbols Outlined")
-    iframe_outlined = IconData(name="iframe", fontFamily="Material Symbols Outlined")
-    iframe_off_outlined = IconData(name="iframe_off", fontFamily="Material Symbols Outlined")
-    image_outlined = IconData(name="image", fontFamily="Material Symbols Outlined")
-    image_arrow_up_outlined = IconData(name="image_arrow_up", fontFamily="Material Symbols Outlined")
-    image_aspect_ratio_outlined = IconData(name="image_aspect_ratio", fontFamily="Material Symbols Outlined")
-    image_not_supported_outlined = IconData(name="image_not_supported", fontFamily="Material Symbols Outlined")
-    image_search_outlined = IconData(name="image_search", fontFamily="Material Symbols Outlined")
-    imagesearch_roller_outlined = IconData(name="imagesearch_roller", fontFamily="Material Symbols Outlined")
-    imagesmode_outlined = IconData(name="imagesmode", fontFamily="Material Symbols Outlined")
-    immunology_outlined = IconData(name="immunology", fontFamily="Material Symbols Outlined")
-    import_contacts_outlined = IconData(name="import_contacts", fontFamily="Material Symbols Outlined")
-    import_export_outlined = IconData(name="import_export", fontFamily="Material Symbols Outlined")
-    important_devices_outlined = IconData(name="important_devices", fontFamily="Material Symbols Outlined")
-    in_home_mode_outlined = IconData(name="in_home_mode", fontFamily="Material Symbols Outlined")
-    inactive_order_outlined = IconData(name="inactive_order", fontFamily="Material Symbols Outlined")
-    inbox_outlined = IconData(name="inbox", fontFamily="Material Symbols Outlined")
-    inbox_customize_outlined = IconData(name="inbox_customize", fontFamily="Material Symbols Outlined")
-    inbox_text_outlined = IconData(name="inbox_text", fontFamily="Material Symbols Outlined")
-    inbox_text_asterisk_outlined = IconData(name="inbox_text_asterisk", fontFamily="Material Symbols Outlined")
-    inbox_text_person_outlined = IconData(name="inbox_text_person", fontFamily="Material Symbols Outlined")
-    inbox_text_share_outlined = IconData(name="inbox_text_share", fontFamily="Material Symbols Outlined")
-    incomplete_circle_outlined = IconData(name="incomplete_circle", fontFamily="Material Symbols Outlined")
-    indeterminate_check_box_outlined = IconData(name="indeterminate_check_box", fontFamily="Material Symbols Outlined")
-    indeterminate_question_box_outlined = IconData(name="indeterminate_question_box", fontFamily="Material Symbols Outlined")
-    info_outlined = IconData(name="info", fontFamily="Material Symbols Outlined")
-    info_i_outlined = IconData(name="info_i", fontFamily="Material Symbols Outlined")
-    infrared_outlined = IconData(name="infrared", fontFamily="Material Symbols Outlined")
-    ink_eraser_outlined = IconData(name="ink_eraser", fontFamily="Material Symbols Outlined")
-    ink_eraser_off_outlined = IconData(name="ink_eraser_off", fontFamily="Material Symbols Outlined")
-    ink_highlighter_outlined = IconData(name="ink_highlighter", fontFamily="Material Symbols Outlined")
-    ink_highlighter_move_outlined = IconData(name="ink_highlighter_move", fontFamily="Material Symbols Outlined")
-    ink_marker_outlined = IconData(name="ink_marker", fontFamily="Material Symbols Outlined")
-    ink_pen_outlined = IconData(name="ink_pen", fontFamily="Material Symbols Outlined")
-    ink_selection_outlined = IconData(name="ink_selection", fontFamily="Material Symbols Outlined")
-    inpatient_outlined = IconData(name="inpatient", fontFamily="Material Symbols Outlined")
-    input_outlined = IconData(name="input", fontFamily="Material Symbols Outlined")
-    input_circle_outlined = IconData(name="input_circle", fontFamily="Material Symbols Outlined")
-    insert_chart_outlined = IconData(name="insert_chart", fontFamily="Material Symbols Outlined")
-    insert_chart_filled_outlined = IconData(name="insert_chart_filled", fontFamily="Material Symbols Outlined")
-    insert_chart_outlined_outlined = IconData(name="insert_chart_outlined", fontFamily="Material Symbols Outlined")
-    insert_comment_outlined = IconData(name="insert_comment", fontFamily="Material Symbols Outlined")
-    insert_drive_file_outlined = IconData(name="insert_drive_file", fontFamily="Material Symbols Outlined")
-    insert_emoticon_outlined = IconData(name="insert_emoticon", fontFamily="Material Symbols Outlined")
-    insert_invitation_outlined = IconData(name="insert_invitation", fontFamily="Material Symbols Outlined")
-    insert_link_outlined = IconData(name="insert_link", fontFamily="Material Symbols Outlined")
-    insert_page_break_outlined = IconData(name="insert_page_break", fontFamily="Material Symbols Outlined")
-    insert_photo_outlined = IconData(name="insert_photo", fontFamily="Material Symbols Outlined")
-    insert_text_outlined = IconData(name="insert_text", fontFamily="Material Symbols Outlined")
-    insights_outlined = IconData(name="insights", fontFamily="Material Symbols Outlined")
-    install_desktop_outlined = IconData(name="install_desktop", fontFamily="Material Symbols Outlined")
-    install_mobile_outlined = IconData(name="install_mobile", fontFamily="Material Symbols Outlined")
-    instant_mix_outlined = IconData(name="instant_mix", fontFamily="Material Symbols Outlined")
-    integration_instructions_outlined = IconData(name="integration_instructions", fontFamily="Material Symbols Outlined")
-    interactive_space_outlined = IconData(name="interactive_space", fontFamily="Material Symbols Outlined")
-    interests_outlined = IconData(name="interests", fontFamily="Material Symbols Outlined")
-    interpreter_mode_outlined = IconData(name="interpreter_mode", fontFamily="Material Symbols Outlined")
-    inventory_outlined = IconData(name="inventory", fontFamily="Material Symbols Outlined")
-    inventory_2_outlined = IconData(name="inventory_2", fontFamily="Material Symbols Outlined")
-    invert_colors_outlined = IconData(name="invert_colors", fontFamily="Material Symbols Outlined")
-    invert_colors_off_outlined = IconData(name="invert_colors_off", fontFamily="Material Symbols Outlined")
-    ios_outlined = IconData(name="ios", fontFamily="Material Symbols Outlined")
-    ios_share_outlined = IconData(name="ios_share", fontFamily="Material Symbols Outlined")
-    iron_outlined = IconData(name="iron", fontFamily="Material Symbols Outlined")
-    iso_outlined = IconData(name="iso", fontFamily="Material Symbols Outlined")
-
-    _10k = _10k_outlined
-    _10mp = _10mp_outlined
-    _11mp = _11mp_outlined
-    _123 = _123_outlined
-    _12mp = _12mp_outlined
-    _13mp = _13mp_outlined
-    _14mp = _14mp_outlined
-    _15mp = _15mp_outlined
-    _16mp = _16mp_outlined
-    _17mp = _17mp_outlined
-    _18_up_rating = _18_up_rating_outlined
-    _18mp = _18mp_outlined
-    _19mp = _19mp_outlined
-    _1k = _1k_outlined
-    _1k_plus = _1k_plus_outlined
-    _1x_mobiledata = _1x_mobiledata_outlined
-    _1x_mobiledata_badge = _1x_mobiledata_badge_outlined
-    _20mp = _20mp_outlined
-    _21mp = _21mp_outlined
-    _22mp = _22mp_outlined
-    _23mp = _23mp_outlined
-    _24fps_select = _24fps_select_outlined
-    _24mp = _24mp_outlined
-    _2d = _2d_outlined
-    _2k = _2k_outlined
-    _2k_plus = _2k_plus_outlined
-    _2mp = _2mp_outlined
-    _30fps = _30fps_outlined
-    _30fps_select = _30fps_select_outlined
-    _360 = _360_outlined
-    _3d = _3d_outlined
-    _3d_rotation = _3d_rotation_outlined
-    _3g_mobiledata = _3g_mobiledata_outlined
-    _3g_mobiledata_badge = _3g_mobiledata_badge_outlined
-    _3k = _3k_outlined
-    _3k_plus = _3k_plus_outlined
-    _3mp = _3mp_outlined
-    _3p = _3p_outlined
-    _4g_mobiledata = _4g_mobiledata_outlined
-    _4g_mobiledata_badge = _4g_mobiledata_badge_outlined
-    _4g_plus_mobiledata = _4g_plus_mobiledata_outlined
-    _4k = _4k_outlined
-    _4k_plus = _4k_plus_outlined
-    _4mp = _4mp_outlined
-    _50mp = _50mp_outlined
-    _5g = _5g_outlined
-    _5g_mobiledata_badge = _5g_mobiledata_badge_outlined
-    _5k = _5k_outlined
-    _5k_plus = _5k_plus_outlined
-    _5mp = _5mp_outlined
-    _60fps = _60fps_outlined
-    _60fps_select = _60fps_select_outlined
-    _6_ft_apart = _6_ft_apart_outlined
-    _6k = _6k_outlined
-    _6k_plus = _6k_plus_outlined
-    _6mp = _6mp_outlined
-    _7k = _7k_outlined
-    _7k_plus = _7k_plus_outlined
-    _7mp = _7mp_outlined
-    _8k = _8k_outlined
-    _8k_plus = _8k_plus_outlined
-    _8mp = _8mp_outlined
-    _9k = _9k_outlined
-    _9k_plus = _9k_plus_outlined
-    _9mp = _9mp_outlined
-    abc = abc_outlined
-    ac_unit = ac_unit_outlined
-    access_alarm = access_alarm_outlined
-    access_alarms = access_alarms_outlined
-    access_time = access_time_outlined
-    access_time_filled = access_time_filled_outlined
-    accessibility = accessibility_outlined
-    accessibility_new = accessibility_new_outlined
-    accessible = accessible_outlined
-    accessible_forward = accessible_forward_outlined
-    accessible_menu = accessible_menu_outlined
-    account_balance = account_balance_outlined
-    account_balance_wallet = account_balance_wallet_outlined
-    account_box = account_box_outlined
-    account_child = account_child_outlined
-    account_child_invert = account_child_invert_outlined
-    account_circle = account_circle_outlined
-    account_circle_filled = account_circle_filled_outlined
-    account_circle_off = account_circle_off_outlined
-    account_tree = account_tree_outlined
-    action_key = action_key_outlined
-    activity_zone = activity_zone_outlined
-    acute = acute_outlined
-    ad = ad_outlined
-    ad_group = ad_group_outlined
-    ad_group_off = ad_group_off_outlined
-    ad_off = ad_off_outlined
-    ad_units = ad_units_outlined
-    adaptive_audio_mic = adaptive_audio_mic_outlined
-    adaptive_audio_mic_off = adaptive_audio_mic_off_outlined
-    adb = adb_outlined
-    add = add_outlined
-    add_2 = add_2_outlined
-    add_a_photo = add_a_photo_outlined
-    add_ad = add_ad_outlined
-    add_alarm = add_alarm_outlined
-    add_alert = add_alert_outlined
-    add_box = add_box_outlined
-    add_business = add_business_outlined
-    add_call = add_call_outlined
-    add_card = add_card_outlined
-    add_chart = add_chart_outlined
-    add_circle = add_circle_outlined
-    add_circle_outline = add_circle_outline_outlined
-    add_column_left = add_column_left_outlined
-    add_column_right = add_column_right_outlined
-    add_comment = add_comment_outlined
-    add_diamond = add_diamond_outlined
-    add_home = add_home_outlined
-    add_home_work = add_home_work_outlined
-    add_ic_call = add_ic_call_outlined
-    add_link = add_link_outlined
-    add_location = add_location_outlined
-    add_location_alt = add_location_alt_outlined
-    add_moderator = add_moderator_outlined
-    add_notes = add_notes_outlined
-    add_photo_alternate = add_photo_alternate_outlined
-    add_reaction = add_reaction_outlined
-    add_road = add_road_outlined
-    add_row_above = add_row_above_outlined
-    add_row_below = add_row_below_outlined
-    add_shopping_cart = add_shopping_cart_outlined
-    add_task = add_task_outlined
-    add_to_drive = add_to_drive_outlined
-    add_to_home_screen = add_to_home_screen_outlined
-    add_to_photos = add_to_photos_outlined
-    add_to_queue = add_to_queue_outlined
-    add_triangle = add_triangle_outlined
-    addchart = addchart_outlined
-    adf_scanner = adf_scanner_outlined
-    adjust = adjust_outlined
-    admin_meds = admin_meds_outlined
-    admin_panel_settings = admin_panel_settings_outlined
-    ads_click = ads_click_outlined
-    agender = agender_outlined
-    agriculture = agriculture_outlined
-    air = air_outlined
-    air_freshener = air_freshener_outlined
-    air_purifier = air_purifier_outlined
-    air_purifier_gen = air_purifier_gen_outlined
-    airline_seat_flat = airline_seat_flat_outlined
-    airline_seat_flat_angled = airline_seat_flat_angled_outlined
-    airline_seat_individual_suite = airline_seat_individual_suite_outlined
-    airline_seat_legroom_extra = airline_seat_legroom_extra_outlined
-    airline_seat_legroom_normal = airline_seat_legroom_normal_outlined
-    airline_seat_legroom_reduced = airline_seat_legroom_reduced_outlined
-    airline_seat_recline_extra = airline_seat_recline_extra_outlined
-    airline_seat_recline_normal = airline_seat_recline_normal_outlined
-    airline_stops = airline_stops_outlined
-    airlines = airlines_outlined
-    airplane_ticket = airplane_ticket_outlined
-    airplanemode_active = airplanemode_active_outlined
-    airplanemode_inactive = airplanemode_inactive_outlined
-    airplay = airplay_outlined
-    airport_shuttle = airport_shuttle_outlined
-    airware = airware_outlined
-    airwave = airwave_outlined
-    alarm = alarm_outlined
-    alarm_add = alarm_add_outlined
-    alarm_off = alarm_off_outlined
-    alarm_on = alarm_on_outlined
-    alarm_pause = alarm_pause_outlined
-    alarm_smart_wake = alarm_smart_wake_outlined
-    album = album_outlined
-    align_center = align_center_outlined
-    align_end = align_end_outlined
-    align_flex_center = align_flex_center_outlined
-    align_flex_end = align_flex_end_outlined
-    align_flex_start = align_flex_start_outlined
-    align_horizontal_center = align_horizontal_center_outlined
-    align_horizontal_left = align_horizontal_left_outlined
-    align_horizontal_right = align_horizontal_right_outlined
-    align_items_stretch = align_items_stretch_outlined
-    align_justify_center = align_justify_center_outlined
-    align_justify_flex_end = align_justify_flex_end_outlined
-    align_justify_flex_start = align_justify_flex_start_outlined
-    align_justify_space_around = align_justify_space_around_outlined
-    align_justify_space_between = align_justify_space_between_outlined
-    align_justify_space_even = align_justify_space_even_outlined
-    align_justify_stretch = align_justify_stretch_outlined
-    align_self_stretch = align_self_stretch_outlined
-    align_space_around = align_space_around_outlined
-    align_space_between = align_space_between_outlined
-    align_space_even = align_space_even_outlined
-    align_start = align_start_outlined
-    align_stretch = align_stretch_outlined
-    align_vertical_bottom = align_vertical_bottom_outlined
-    align_vertical_center = align_vertical_center_outlined
-    align_vertical_top = align_vertical_top_outlined
-    all_inbox = all_inbox_outlined
-    all_inclusive = all_inclusive_outlined
-    all_match = all_match_outlined
-    all_out = all_out_outlined
-    allergies = allergies_outlined
-    allergy = allergy_outlined
-    alt_route = alt_route_outlined
-    alternate_email = alternate_email_outlined
-    altitude = altitude_outlined
-    ambient_screen = ambient_screen_outlined
-    ambulance = ambulance_outlined
-    amend = amend_outlined
-    amp_stories = amp_stories_outlined
-    analytics = analytics_outlined
-    anchor = anchor_outlined
-    android = android_outlined
-    animated_images = animated_images_outlined
-    animation = animation_outlined
-    announcement = announcement_outlined
-    aod = aod_outlined
-    aod_tablet = aod_tablet_outlined
-    aod_watch = aod_watch_outlined
-    apartment = apartment_outlined
-    api = api_outlined
-    apk_document = apk_document_outlined
-    apk_install = apk_install_outlined
-    app_badging = app_badging_outlined
-    app_blocking = app_blocking_outlined
-    app_promo = app_promo_outlined
-    app_registration = app_registration_outlined
-    app_settings_alt = app_settings_alt_outlined
-    app_shortcut = app_shortcut_outlined
-    apparel = apparel_outlined
-    approval = approval_outlined
-    approval_delegation = approval_delegation_outlined
-    apps = apps_outlined
-    apps_outage = apps_outage_outlined
-    aq = aq_outlined
-    aq_indoor = aq_indoor_outlined
-    ar_on_you = ar_on_you_outlined
-    ar_stickers = ar_stickers_outlined
-    architecture = architecture_outlined
-    archive = archive_outlined
-    area_chart = area_chart_outlined
-    arming_countdown = arming_countdown_outlined
-    arrow_and_edge = arrow_and_edge_outlined
-    arrow_back = arrow_back_outlined
-    arrow_back_2 = arrow_back_2_outlined
-    arrow_back_ios = arrow_back_ios_outlined
-    arrow_back_ios_new = arrow_back_ios_new_outlined
-    arrow_circle_down = arrow_circle_down_outlined
-    arrow_circle_left = arrow_circle_left_outlined
-    arrow_circle_right = arrow_circle_right_outlined
-    arrow_circle_up = arrow_circle_up_outlined
-    arrow_cool_down = arrow_cool_down_outlined
-    arrow_downward = arrow_downward_outlined
-    arrow_downward_alt = arrow_downward_alt_outlined
-    arrow_drop_down = arrow_drop_down_outlined
-    arrow_drop_down_circle = arrow_drop_down_circle_outlined
-    arrow_drop_up = arrow_drop_up_outlined
-    arrow_forward = arrow_forward_outlined
-    arrow_forward_ios = arrow_forward_ios_outlined
-    arrow_insert = arrow_insert_outlined
-    arrow_left = arrow_left_outlined
-    arrow_left_alt = arrow_left_alt_outlined
-    arrow_menu_close = arrow_menu_close_outlined
-    arrow_menu_open = arrow_menu_open_outlined
-    arrow_or_edge = arrow_or_edge_outlined
-    arrow_outward = arrow_outward_outlined
-    arrow_range = arrow_range_outlined
-    arrow_right = arrow_right_outlined
-    arrow_right_alt = arrow_right_alt_outlined
-    arrow_selector_tool = arrow_selector_tool_outlined
-    arrow_split = arrow_split_outlined
-    arrow_top_left = arrow_top_left_outlined
-    arrow_top_right = arrow_top_right_outlined
-    arrow_upload_progress = arrow_upload_progress_outlined
-    arrow_upload_ready = arrow_upload_ready_outlined
-    arrow_upward = arrow_upward_outlined
-    arrow_upward_alt = arrow_upward_alt_outlined
-    arrow_warm_up = arrow_warm_up_outlined
-    arrows_input = arrows_input_outlined
-    arrows_more_down = arrows_more_down_outlined
-    arrows_more_up = arrows_more_up_outlined
-    arrows_output = arrows_output_outlined
-    arrows_outward = arrows_outward_outlined
-    art_track = art_track_outlined
-    article = article_outlined
-    article_person = article_person_outlined
-    article_shortcut = article_shortcut_outlined
-    artist = artist_outlined
-    aspect_ratio = aspect_ratio_outlined
-    assessment = assessment_outlined
-    assignment = assignment_outlined
-    assignment_add = assignment_add_outlined
-    assignment_ind = assignment_ind_outlined
-    assignment_late = assignment_late_outlined
-    assignment_return = assignment_return_outlined
-    assignment_returned = assignment_returned_outlined
-    assignment_turned_in = assignment_turned_in_outlined
-    assist_walker = assist_walker_outlined
-    assistant = assistant_outlined
-    assistant_device = assistant_device_outlined
-    assistant_direction = assistant_direction_outlined
-    assistant_navigation = assistant_navigation_outlined
-    assistant_on_hub = assistant_on_hub_outlined
-    assistant_photo = assistant_photo_outlined
-    assured_workload = assured_workload_outlined
-    asterisk = asterisk_outlined
-    astrophotography_auto = astrophotography_auto_outlined
-    astrophotography_off = astrophotography_off_outlined
-    atm = atm_outlined
-    atr = atr_outlined
-    attach_email = attach_email_outlined
-    attach_file = attach_file_outlined
-    attach_file_add = attach_file_add_outlined
-    attach_file_off = attach_file_off_outlined
-    attach_money = attach_money_outlined
-    attachment = attachment_outlined
-    attractions = attractions_outlined
-    attribution = attribution_outlined
-    audio_description = audio_description_outlined
-    audio_file = audio_file_outlined
-    audio_video_receiver = audio_video_receiver_outlined
-    audiotrack = audiotrack_outlined
-    auto_activity_zone = auto_activity_zone_outlined
-    auto_awesome = auto_awesome_outlined
-    auto_awesome_mosaic = auto_awesome_mosaic_outlined
-    auto_awesome_motion = auto_awesome_motion_outlined
-    auto_delete = auto_delete_outlined
-    auto_detect_voice = auto_detect_voice_outlined
-    auto_draw_solid = auto_draw_solid_outlined
-    auto_fix = auto_fix_outlined
-    auto_fix_high = auto_fix_high_outlined
-    auto_fix_normal = auto_fix_normal_outlined
-    auto_fix_off = auto_fix_off_outlined
-    auto_graph = auto_graph_outlined
-    auto_label = auto_label_outlined
-    auto_meeting_room = auto_meeting_room_outlined
-    auto_mode = auto_mode_outlined
-    auto_read_pause = auto_read_pause_outlined
-    auto_read_play = auto_read_play_outlined
-    auto_schedule = auto_schedule_outlined
-    auto_stories = auto_stories_outlined
-    auto_timer = auto_timer_outlined
-    auto_towing = auto_towing_outlined
-    auto_transmission = auto_transmission_outlined
-    auto_videocam = auto_videocam_outlined
-    autofps_select = autofps_select_outlined
-    automation = automation_outlined
-    autopause = autopause_outlined
-    autopay = autopay_outlined
-    autoplay = autoplay_outlined
-    autorenew = autorenew_outlined
-    autostop = autostop_outlined
-    av1 = av1_outlined
-    av_timer = av_timer_outlined
-    avc = avc_outlined
-    avg_pace = avg_pace_outlined
-    avg_time = avg_time_outlined
-    award_star = award_star_outlined
-    azm = azm_outlined
-    baby_changing_station = baby_changing_station_outlined
-    back_hand = back_hand_outlined
-    back_to_tab = back_to_tab_outlined
-    background_dot_large = background_dot_large_outlined
-    background_dot_small = background_dot_small_outlined
-    background_grid_small = background_grid_small_outlined
-    background_replace = background_replace_outlined
-    backlight_high = backlight_high_outlined
-    backlight_high_off = backlight_high_off_outlined
-    backlight_low = backlight_low_outlined
-    backpack = backpack_outlined
-    backspace = backspace_outlined
-    backup = backup_outlined
-    backup_table = backup_table_outlined
-    badge = badge_outlined
-    badge_critical_battery = badge_critical_battery_outlined
-    bakery_dining = bakery_dining_outlined
-    balance = balance_outlined
-    balcony = balcony_outlined
-    ballot = ballot_outlined
-    bar_chart = bar_chart_outlined
-    bar_chart_4_bars = bar_chart_4_bars_outlined
-    bar_chart_off = bar_chart_off_outlined
-    barcode = barcode_outlined
-    barcode_reader = barcode_reader_outlined
-    barcode_scanner = barcode_scanner_outlined
-    barefoot = barefoot_outlined
-    batch_prediction = batch_prediction_outlined
-    bath_outdoor = bath_outdoor_outlined
-    bath_private = bath_private_outlined
-    bath_public_large = bath_public_large_outlined
-    bathroom = bathroom_outlined
-    bathtub = bathtub_outlined
-    battery_0_bar = battery_0_bar_outlined
-    battery_1_bar = battery_1_bar_outlined
-    battery_20 = battery_20_outlined
-    battery_2_bar = battery_2_bar_outlined
-    battery_30 = battery_30_outlined
-    battery_3_bar = battery_3_bar_outlined
-    battery_4_bar = battery_4_bar_outlined
-    battery_50 = battery_50_outlined
-    battery_5_bar = battery_5_bar_outlined
-    battery_60 = battery_60_outlined
-    battery_6_bar = battery_6_bar_outlined
-    battery_80 = battery_80_outlined
-    battery_90 = battery_90_outlined
-    battery_alert = battery_alert_outlined
-    battery_android_0 = battery_android_0_outlined
-    battery_android_1 = battery_android_1_outlined
-    battery_android_2 = battery_android_2_outlined
-    battery_android_3 = battery_android_3_outlined
-    battery_android_4 = battery_android_4_outlined
-    battery_android_5 = battery_android_5_outlined
-    battery_android_6 = battery_android_6_outlined
-    battery_android_alert = battery_android_alert_outlined
-    battery_android_bolt = battery_android_bolt_outlined
-    battery_android_full = battery_android_full_outlined
-    battery_android_plus = battery_android_plus_outlined
-    battery_android_question = battery_android_question_outlined
-    battery_android_share = battery_android_share_outlined
-    battery_android_shield = battery_android_shield_outlined
-    battery_change = battery_change_outlined
-    battery_charging_20 = battery_charging_20_outlined
-    battery_charging_30 = battery_charging_30_outlined
-    battery_charging_50 = battery_charging_50_outlined
-    battery_charging_60 = battery_charging_60_outlined
-    battery_charging_80 = battery_charging_80_outlined
-    battery_charging_90 = battery_charging_90_outlined
-    battery_charging_full = battery_charging_full_outlined
-    battery_error = battery_error_outlined
-    battery_full = battery_full_outlined
-    battery_full_alt = battery_full_alt_outlined
-    battery_horiz_000 = battery_horiz_000_outlined
-    battery_horiz_050 = battery_horiz_050_outlined
-    battery_horiz_075 = battery_horiz_075_outlined
-    battery_low = battery_low_outlined
-    battery_plus = battery_plus_outlined
-    battery_profile = battery_profile_outlined
-    battery_saver = battery_saver_outlined
-    battery_share = battery_share_outlined
-    battery_status_good = battery_status_good_outlined
-    battery_std = battery_std_outlined
-    battery_unknown = battery_unknown_outlined
-    battery_vert_005 = battery_vert_005_outlined
-    battery_vert_020 = battery_vert_020_outlined
-    battery_vert_050 = battery_vert_050_outlined
-    battery_very_low = battery_very_low_outlined
-    beach_access = beach_access_outlined
-    bed = bed_outlined
-    bedroom_baby = bedroom_baby_outlined
-    bedroom_child = bedroom_child_outlined
-    bedroom_parent = bedroom_parent_outlined
-    bedtime = bedtime_outlined
-    bedtime_off = bedtime_off_outlined
-    beenhere = beenhere_outlined
-    bento = bento_outlined
-    bia = bia_outlined
-    bid_landscape = bid_landscape_outlined
-    bid_landscape_disabled = bid_landscape_disabled_outlined
-    bigtop_updates = bigtop_updates_outlined
-    bike_dock = bike_dock_outlined
-    bike_lane = bike_lane_outlined
-    bike_scooter = bike_scooter_outlined
-    biotech = biotech_outlined
-    blanket = blanket_outlined
-    blender = blender_outlined
-    blind = blind_outlined
-    blinds = blinds_outlined
-    blinds_closed = blinds_closed_outlined
-    block = block_outlined
-    blood_pressure = blood_pressure_outlined
-    bloodtype = bloodtype_outlined
-    bluetooth = bluetooth_outlined
-    bluetooth_audio = bluetooth_audio_outlined
-    bluetooth_connected = bluetooth_connected_outlined
-    bluetooth_disabled = bluetooth_disabled_outlined
-    bluetooth_drive = bluetooth_drive_outlined
-    bluetooth_searching = bluetooth_searching_outlined
-    blur_circular = blur_circular_outlined
-    blur_linear = blur_linear_outlined
-    blur_medium = blur_medium_outlined
-    blur_off = blur_off_outlined
-    blur_on = blur_on_outlined
-    blur_short = blur_short_outlined
-    boat_bus = boat_bus_outlined
-    boat_railway = boat_railway_outlined
-    body_fat = body_fat_outlined
-    body_system = body_system_outlined
-    bolt = bolt_outlined
-    bomb = bomb_outlined
-    book = book_outlined
-    book_2 = book_2_outlined
-    book_3 = book_3_outlined
-    book_4 = book_4_outlined
-    book_5 = book_5_outlined
-    book_6 = book_6_outlined
-    book_online = book_online_outlined
-    book_ribbon = book_ribbon_outlined
-    bookmark = bookmark_outlined
-    bookmark_add = bookmark_add_outlined
-    bookmark_added = bookmark_added_outlined
-    bookmark_bag = bookmark_bag_outlined
-    bookmark_border = bookmark_border_outlined
-    bookmark_check = bookmark_check_outlined
-    bookmark_flag = bookmark_flag_outlined
-    bookmark_heart = bookmark_heart_outlined
-    bookmark_manager = bookmark_manager_outlined
-    bookmark_remove = bookmark_remove_outlined
-    bookmark_star = bookmark_star_outlined
-    bookmarks = bookmarks_outlined
-    books_movies_and_music = books_movies_and_music_outlined
-    border_all = border_all_outlined
-    border_bottom = border_bottom_outlined
-    border_clear = border_clear_outlined
-    border_color = border_color_outlined
-    border_horizontal = border_horizontal_outlined
-    border_inner = border_inner_outlined
-    border_left = border_left_outlined
-    border_outer = border_outer_outlined
-    border_right = border_right_outlined
-    border_style = border_style_outlined
-    border_top = border_top_outlined
-    border_vertical = border_vertical_outlined
-    borg = borg_outlined
-    bottom_app_bar = bottom_app_bar_outlined
-    bottom_drawer = bottom_drawer_outlined
-    bottom_navigation = bottom_navigation_outlined
-    bottom_panel_close = bottom_panel_close_outlined
-    bottom_panel_open = bottom_panel_open_outlined
-    bottom_right_click = bottom_right_click_outlined
-    bottom_sheets = bottom_sheets_outlined
-    box = box_outlined
-    box_add = box_add_outlined
-    box_edit = box_edit_outlined
-    boy = boy_outlined
-    brand_awareness = brand_awareness_outlined
-    brand_family = brand_family_outlined
-    branding_watermark = branding_watermark_outlined
-    breakfast_dining = breakfast_dining_outlined
-    breaking_news = breaking_news_outlined
-    breaking_news_alt_1 = breaking_news_alt_1_outlined
-    breastfeeding = breastfeeding_outlined
-    brick = brick_outlined
-    brightness_1 = brightness_1_outlined
-    brightness_2 = brightness_2_outlined
-    brightness_3 = brightness_3_outlined
-    brightness_4 = brightness_4_outlined
-    brightness_5 = brightness_5_outlined
-    brightness_6 = brightness_6_outlined
-    brightness_7 = brightness_7_outlined
-    brightness_alert = brightness_alert_outlined
-    brightness_auto = brightness_auto_outlined
-    brightness_empty = brightness_empty_outlined
-    brightness_high = brightness_high_outlined
-    brightness_low = brightness_low_outlined
-    brightness_medium = brightness_medium_outlined
-    bring_your_own_ip = bring_your_own_ip_outlined
-    broadcast_on_home = broadcast_on_home_outlined
-    broadcast_on_personal = broadcast_on_personal_outlined
-    broken_image = broken_image_outlined
-    browse = browse_outlined
-    browse_activity = browse_activity_outlined
-    browse_gallery = browse_gallery_outlined
-    browser_not_supported = browser_not_supported_outlined
-    browser_updated = browser_updated_outlined
-    brunch_dining = brunch_dining_outlined
-    brush = brush_outlined
-    bubble = bubble_outlined
-    bubble_chart = bubble_chart_outlined
-    bubbles = bubbles_outlined
-    bug_report = bug_report_outlined
-    build = build_outlined
-    build_circle = build_circle_outlined
-    bungalow = bungalow_outlined
-    burst_mode = burst_mode_outlined
-    bus_alert = bus_alert_outlined
-    bus_railway = bus_railway_outlined
-    business = business_outlined
-    business_center = business_center_outlined
-    business_chip = business_chip_outlined
-    business_messages = business_messages_outlined
-    buttons_alt = buttons_alt_outlined
-    cabin = cabin_outlined
-    cable = cable_outlined
-    cable_car = cable_car_outlined
-    cached = cached_outlined
-    cadence = cadence_outlined
-    cake = cake_outlined
-    cake_add = cake_add_outlined
-    calculate = calculate_outlined
-    calendar_add_on = calendar_add_on_outlined
-    calendar_apps_script = calendar_apps_script_outlined
-    calendar_clock = calendar_clock_outlined
-    calendar_month = calendar_month_outlined
-    calendar_today = calendar_today_outlined
-    calendar_view_day = calendar_view_day_outlined
-    calendar_view_month = calendar_view_month_outlined
-    calendar_view_week = calendar_view_week_outlined
-    call = call_outlined
-    call_end = call_end_outlined
-    call_end_alt = call_end_alt_outlined
-    call_log = call_log_outlined
-    call_made = call_made_outlined
-    call_merge = call_merge_outlined
-    call_missed = call_missed_outlined
-    call_missed_outgoing = call_missed_outgoing_outlined
-    call_quality = call_quality_outlined
-    call_received = call_received_outlined
-    call_split = call_split_outlined
-    call_to_action = call_to_action_outlined
-    camera = camera_outlined
-    camera_alt = camera_alt_outlined
-    camera_enhance = camera_enhance_outlined
-    camera_front = camera_front_outlined
-    camera_indoor = camera_indoor_outlined
-    camera_outdoor = camera_outdoor_outlined
-    camera_rear = camera_rear_outlined
-    camera_roll = camera_roll_outlined
-    camera_video = camera_video_outlined
-    cameraswitch = cameraswitch_outlined
-    campaign = campaign_outlined
-    camping = camping_outlined
-    cancel = cancel_outlined
-    cancel_presentation = cancel_presentation_outlined
-    cancel_schedule_send = cancel_schedule_send_outlined
-    candle = candle_outlined
-    candlestick_chart = candlestick_chart_outlined
-    cannabis = cannabis_outlined
-    captive_portal = captive_portal_outlined
-    capture = capture_outlined
-    car_crash = car_crash_outlined
-    car_defrost_left = car_defrost_left_outlined
-    car_defrost_low_left = car_defrost_low_left_outlined
-    car_defrost_low_right = car_defrost_low_right_outlined
-    car_defrost_mid_low_left = car_defrost_mid_low_left_outlined
-    car_defrost_mid_right = car_defrost_mid_right_outlined
-    car_defrost_right = car_defrost_right_outlined
-    car_fan_low_left = car_fan_low_left_outlined
-    car_fan_low_mid_left = car_fan_low_mid_left_outlined
-    car_fan_low_right = car_fan_low_right_outlined
-    car_fan_mid_left = car_fan_mid_left_outlined
-    car_fan_mid_low_right = car_fan_mid_low_right_outlined
-    car_fan_mid_right = car_fan_mid_right_outlined
-    car_fan_recirculate = car_fan_recirculate_outlined
-    car_gear = car_gear_outlined
-    car_lock = car_lock_outlined
-    car_mirror_heat = car_mirror_heat_outlined
-    car_rental = car_rental_outlined
-    car_repair = car_repair_outlined
-    car_tag = car_tag_outlined
-    card_giftcard = card_giftcard_outlined
-    card_membership = card_membership_outlined
-    card_travel = card_travel_outlined
-    cardio_load = cardio_load_outlined
-    cardiology = cardiology_outlined
-    cards = cards_outlined
-    cards_star = cards_star_outlined
-    carpenter = carpenter_outlined
-    carry_on_bag = carry_on_bag_outlined
-    carry_on_bag_checked = carry_on_bag_checked_outlined
-    carry_on_bag_inactive = carry_on_bag_inactive_outlined
-    carry_on_bag_question = carry_on_bag_question_outlined
-    cases = cases_outlined
-    casino = casino_outlined
-    cast = cast_outlined
-    cast_connected = cast_connected_outlined
-    cast_for_education = cast_for_education_outlined
-    cast_pause = cast_pause_outlined
-    cast_warning = cast_warning_outlined
-    castle = castle_outlined
-    category = category_outlined
-    category_search = category_search_outlined
-    celebration = celebration_outlined
-    cell_merge = cell_merge_outlined
-    cell_tower = cell_tower_outlined
-    cell_wifi = cell_wifi_outlined
-    center_focus_strong = center_focus_strong_outlined
-    center_focus_weak = center_focus_weak_outlined
-    chair = chair_outlined
-    chair_alt = chair_alt_outlined
-    chalet = chalet_outlined
-    change_circle = change_circle_outlined
-    change_history = change_history_outlined
-    charger = charger_outlined
-    charging_station = charging_station_outlined
-    chart_data = chart_data_outlined
-    chat = chat_outlined
-    chat_add_on = chat_add_on_outlined
-    chat_apps_script = chat_apps_script_outlined
-    chat_bubble = chat_bubble_outlined
-    chat_bubble_outline = chat_bubble_outline_outlined
-    chat_error = chat_error_outlined
-    chat_info = chat_info_outlined
-    chat_paste_go = chat_paste_go_outlined
-    chat_paste_go_2 = chat_paste_go_2_outlined
-    check = check_outlined
-    check_box = check_box_outlined
-    check_box_outline_blank = check_box_outline_blank_outlined
-    check_circle = check_circle_outlined
-    check_circle_filled = check_circle_filled_outlined
-    check_circle_outline = check_circle_outline_outlined
-    check_in_out = check_in_out_outlined
-    check_indeterminate_small = check_indeterminate_small_outlined
-    check_small = check_small_outlined
-    checkbook = checkbook_outlined
-    checked_bag = checked_bag_outlined
-    checked_bag_question = checked_bag_question_outlined
-    checklist = checklist_outlined
-    checklist_rtl = checklist_rtl_outlined
-    checkroom = checkroom_outlined
-    cheer = cheer_outlined
-    chef_hat = chef_hat_outlined
-    chess = chess_outlined
-    chess_pawn = chess_pawn_outlined
-    chevron_backward = chevron_backward_outlined
-    chevron_forward = chevron_forward_outlined
-    chevron_left = chevron_left_outlined
-    chevron_right = chevron_right_outlined
-    child_care = child_care_outlined
-    child_friendly = child_friendly_outlined
-    chip_extraction = chip_extraction_outlined
-    chips = chips_outlined
-    chrome_reader_mode = chrome_reader_mode_outlined
-    chromecast_2 = chromecast_2_outlined
-    chromecast_device = chromecast_device_outlined
-    chronic = chronic_outlined
-    church = church_outlined
-    cinematic_blur = cinematic_blur_outlined
-    circle = circle_outlined
-    circle_notifications = circle_notifications_outlined
-    circles = circles_outlined
-    circles_ext = circles_ext_outlined
-    clarify = clarify_outlined
-    class_ = class_outlined
-    clean_hands = clean_hands_outlined
-    cleaning = cleaning_outlined
-    cleaning_bucket = cleaning_bucket_outlined
-    cleaning_services = cleaning_services_outlined
-    clear = clear_outlined
-    clear_all = clear_all_outlined
-    clear_day = clear_day_outlined
-    clear_night = clear_night_outlined
-    climate_mini_split = climate_mini_split_outlined
-    clinical_notes = clinical_notes_outlined
-    clock_arrow_down = clock_arrow_down_outlined
-    clock_arrow_up = clock_arrow_up_outlined
-    clock_loader_10 = clock_loader_10_outlined
-    clock_loader_20 = clock_loader_20_outlined
-    clock_loader_40 = clock_loader_40_outlined
-    clock_loader_60 = clock_loader_60_outlined
-    clock_loader_80 = clock_loader_80_outlined
-    clock_loader_90 = clock_loader_90_outlined
-    close = close_outlined
-    close_fullscreen = close_fullscreen_outlined
-    close_small = close_small_outlined
-    closed_caption = closed_caption_outlined
-    closed_caption_add = closed_caption_add_outlined
-    closed_caption_disabled = closed_caption_disabled_outlined
-    closed_caption_off = closed_caption_off_outlined
-    cloud = cloud_outlined
-    cloud_alert = cloud_alert_outlined
-    cloud_circle = cloud_circle_outlined
-    cloud_done = cloud_done_outlined
-    cloud_download = cloud_download_outlined
-    cloud_lock = cloud_lock_outlined
-    cloud_off = cloud_off_outlined
-    cloud_queue = cloud_queue_outlined
-    cloud_sync = cloud_sync_outlined
-    cloud_upload = cloud_upload_outlined
-    cloudy = cloudy_outlined
-    cloudy_filled = cloudy_filled_outlined
-    cloudy_snowing = cloudy_snowing_outlined
-    co2 = co2_outlined
-    co_present = co_present_outlined
-    code = code_outlined
-    code_blocks = code_blocks_outlined
-    code_off = code_off_outlined
-    coffee = coffee_outlined
-    coffee_maker = coffee_maker_outlined
-    cognition = cognition_outlined
-    cognition_2 = cognition_2_outlined
-    collapse_all = collapse_all_outlined
-    collapse_content = collapse_content_outlined
-    collections = collections_outlined
-    collections_bookmark = collections_bookmark_outlined
-    color_lens = color_lens_outlined
-    colorize = colorize_outlined
-    colors = colors_outlined
-    combine_columns = combine_columns_outlined
-    comedy_mask = comedy_mask_outlined
-    comic_bubble = comic_bubble_outlined
-    comment = comment_outlined
-    comment_bank = comment_bank_outlined
-    comments_disabled = comments_disabled_outlined
-    commit = commit_outlined
-    communication = communication_outlined
-    communities = communities_outlined
-    communities_filled = communities_filled_outlined
-    commute = commute_outlined
-    compare = compare_outlined
-    compare_arrows = compare_arrows_outlined
-    compass_calibration = compass_calibration_outlined
-    component_exchange = component_exchange_outlined
-    compost = compost_outlined
-    compress = compress_outlined
-    computer = computer_outlined
-    computer_arrow_up = computer_arrow_up_outlined
-    computer_cancel = computer_cancel_outlined
-    concierge = concierge_outlined
-    conditions = conditions_outlined
-    confirmation_number = confirmation_number_outlined
-    congenital = congenital_outlined
-    connect_without_contact = connect_without_contact_outlined
-    connected_tv = connected_tv_outlined
-    connecting_airports = connecting_airports_outlined
-    construction = construction_outlined
-    contact_emergency = contact_emergency_outlined
-    contact_mail = contact_mail_outlined
-    contact_page = contact_page_outlined
-    contact_phone = contact_phone_outlined
-    contact_phone_filled = contact_phone_filled_outlined
-    contact_support = contact_support_outlined
-    contactless = contactless_outlined
-    contactless_off = contactless_off_outlined
-    contacts = contacts_outlined
-    contacts_product = contacts_product_outlined
-    content_copy = content_copy_outlined
-    content_cut = content_cut_outlined
-    content_paste = content_paste_outlined
-    content_paste_go = content_paste_go_outlined
-    content_paste_off = content_paste_off_outlined
-    content_paste_search = content_paste_search_outlined
-    contextual_token = contextual_token_outlined
-    contextual_token_add = contextual_token_add_outlined
-    contract = contract_outlined
-    contract_delete = contract_delete_outlined
-    contract_edit = contract_edit_outlined
-    contrast = contrast_outlined
-    contrast_circle = contrast_circle_outlined
-    contrast_rtl_off = contrast_rtl_off_outlined
-    contrast_square = contrast_square_outlined
-    control_camera = control_camera_outlined
-    control_point = control_point_outlined
-    control_point_duplicate = control_point_duplicate_outlined
-    controller_gen = controller_gen_outlined
-    conversion_path = conversion_path_outlined
-    conversion_path_off = conversion_path_off_outlined
-    convert_to_text = convert_to_text_outlined
-    conveyor_belt = conveyor_belt_outlined
-    cookie = cookie_outlined
-    cookie_off = cookie_off_outlined
-    cooking = cooking_outlined
-    cool_to_dry = cool_to_dry_outlined
-    copy_all = copy_all_outlined
-    copyright = copyright_outlined
-    coronavirus = coronavirus_outlined
-    corporate_fare = corporate_fare_outlined
-    cottage = cottage_outlined
-    counter_0 = counter_0_outlined
-    counter_1 = counter_1_outlined
-    counter_2 = counter_2_outlined
-    counter_3 = counter_3_outlined
-    counter_4 = counter_4_outlined
-    counter_5 = counter_5_outlined
-    counter_6 = counter_6_outlined
-    counter_7 = counter_7_outlined
-    counter_8 = counter_8_outlined
-    counter_9 = counter_9_outlined
-    countertops = countertops_outlined
-    create = create_outlined
-    create_new_folder = create_new_folder_outlined
-    credit_card = credit_card_outlined
-    credit_card_clock = credit_card_clock_outlined
-    credit_card_gear = credit_card_gear_outlined
-    credit_card_heart = credit_card_heart_outlined
-    credit_card_off = credit_card_off_outlined
-    credit_score = credit_score_outlined
-    crib = crib_outlined
-    crisis_alert = crisis_alert_outlined
-    crop = crop_outlined
-    crop_16_9 = crop_16_9_outlined
-    crop_3_2 = crop_3_2_outlined
-    crop_5_4 = crop_5_4_outlined
-    crop_7_5 = crop_7_5_outlined
-    crop_9_16 = crop_9_16_outlined
-    crop_din = crop_din_outlined
-    crop_free = crop_free_outlined
-    crop_landscape = crop_landscape_outlined
-    crop_original = crop_original_outlined
-    crop_portrait = crop_portrait_outlined
-    crop_rotate = crop_rotate_outlined
-    crop_square = crop_square_outlined
-    crossword = crossword_outlined
-    crowdsource = crowdsource_outlined
-    crown = crown_outlined
-    cruelty_free = cruelty_free_outlined
-    css = css_outlined
-    csv = csv_outlined
-    currency_bitcoin = currency_bitcoin_outlined
-    currency_exchange = currency_exchange_outlined
-    currency_franc = currency_franc_outlined
-    currency_lira = currency_lira_outlined
-    currency_pound = currency_pound_outlined
-    currency_ruble = currency_ruble_outlined
-    currency_rupee = currency_rupee_outlined
-    currency_rupee_circle = currency_rupee_circle_outlined
-    currency_yen = currency_yen_outlined
-    currency_yuan = currency_yuan_outlined
-    curtains = curtains_outlined
-    curtains_closed = curtains_closed_outlined
-    custom_typography = custom_typography_outlined
-    cut = cut_outlined
-    cycle = cycle_outlined
-    cyclone = cyclone_outlined
-    dangerous = dangerous_outlined
-    dark_mode = dark_mode_outlined
-    dashboard = dashboard_outlined
-    dashboard_2 = dashboard_2_outlined
-    dashboard_customize = dashboard_customize_outlined
-    data_alert = data_alert_outlined
-    data_array = data_array_outlined
-    data_check = data_check_outlined
-    data_exploration = data_exploration_outlined
-    data_info_alert = data_info_alert_outlined
-    data_loss_prevention = data_loss_prevention_outlined
-    data_object = data_object_outlined
-    data_saver_off = data_saver_off_outlined
-    data_saver_on = data_saver_on_outlined
-    data_table = data_table_outlined
-    data_thresholding = data_thresholding_outlined
-    data_usage = data_usage_outlined
-    database = database_outlined
-    database_off = database_off_outlined
-    database_search = database_search_outlined
-    database_upload = database_upload_outlined
-    dataset = dataset_outlined
-    dataset_linked = dataset_linked_outlined
-    date_range = date_range_outlined
-    deblur = deblur_outlined
-    deceased = deceased_outlined
-    decimal_decrease = decimal_decrease_outlined
-    decimal_increase = decimal_increase_outlined
-    deck = deck_outlined
-    dehaze = dehaze_outlined
-    delete = delete_outlined
-    delete_forever = delete_forever_outlined
-    delete_history = delete_history_outlined
-    delete_outline = delete_outline_outlined
-    delete_sweep = delete_sweep_outlined
-    delivery_dining = delivery_dining_outlined
-    delivery_truck_bolt = delivery_truck_bolt_outlined
-    delivery_truck_speed = delivery_truck_speed_outlined
-    demography = demography_outlined
-    density_large = density_large_outlined
-    density_medium = density_medium_outlined
-    density_small = density_small_outlined
-    dentistry = dentistry_outlined
-    departure_board = departure_board_outlined
-    deployed_code = deployed_code_outlined
-    deployed_code_account = deployed_code_account_outlined
-    deployed_code_alert = deployed_code_alert_outlined
-    deployed_code_history = deployed_code_history_outlined
-    deployed_code_update = deployed_code_update_outlined
-    dermatology = dermatology_outlined
-    description = description_outlined
-    deselect = deselect_outlined
-    design_services = design_services_outlined
-    desk = desk_outlined
-    deskphone = deskphone_outlined
-    desktop_access_disabled = desktop_access_disabled_outlined
-    desktop_cloud = desktop_cloud_outlined
-    desktop_cloud_stack = desktop_cloud_stack_outlined
-    desktop_landscape = desktop_landscape_outlined
-    desktop_landscape_add = desktop_landscape_add_outlined
-    desktop_mac = desktop_mac_outlined
-    desktop_portrait = desktop_portrait_outlined
-    desktop_windows = desktop_windows_outlined
-    destruction = destruction_outlined
-    details = details_outlined
-    detection_and_zone = detection_and_zone_outlined
-    detector = detector_outlined
-    detector_alarm = detector_alarm_outlined
-    detector_battery = detector_battery_outlined
-    detector_co = detector_co_outlined
-    detector_offline = detector_offline_outlined
-    detector_smoke = detector_smoke_outlined
-    detector_status = detector_status_outlined
-    developer_board = developer_board_outlined
-    developer_board_off = developer_board_off_outlined
-    developer_guide = developer_guide_outlined
-    developer_mode = developer_mode_outlined
-    developer_mode_tv = developer_mode_tv_outlined
-    device_band = device_band_outlined
-    device_hub = device_hub_outlined
-    device_reset = device_reset_outlined
-    device_thermostat = device_thermostat_outlined
-    device_unknown = device_unknown_outlined
-    devices = devices_outlined
-    devices_fold = devices_fold_outlined
-    devices_fold_2 = devices_fold_2_outlined
-    devices_off = devices_off_outlined
-    devices_other = devices_other_outlined
-    devices_wearables = devices_wearables_outlined
-    dew_point = dew_point_outlined
-    diagnosis = diagnosis_outlined
-    diagonal_line = diagonal_line_outlined
-    dialer_sip = dialer_sip_outlined
-    dialogs = dialogs_outlined
-    dialpad = dialpad_outlined
-    diamond = diamond_outlined
-    dictionary = dictionary_outlined
-    difference = difference_outlined
-    digital_out_of_home = digital_out_of_home_outlined
-    digital_wellbeing = digital_wellbeing_outlined
-    dining = dining_outlined
-    dinner_dining = dinner_dining_outlined
-    directions = directions_outlined
-    directions_alt = directions_alt_outlined
-    directions_alt_off = directions_alt_off_outlined
-    directions_bike = directions_bike_outlined
-    directions_boat = directions_boat_outlined
-    directions_boat_filled = directions_boat_filled_outlined
-    directions_bus = directions_bus_outlined
-    directions_bus_filled = directions_bus_filled_outlined
-    directions_car = directions_car_outlined
-    directions_car_filled = directions_car_filled_outlined
-    directions_off = directions_off_outlined
-    directions_railway = directions_railway_outlined
-    directions_railway_2 = directions_railway_2_outlined
-    directions_railway_filled = directions_railway_filled_outlined
-    directions_run = directions_run_outlined
-    directions_subway = directions_subway_outlined
-    directions_subway_filled = directions_subway_filled_outlined
-    directions_transit = directions_transit_outlined
-    directions_transit_filled = directions_transit_filled_outlined
-    directions_walk = directions_walk_outlined
-    directory_sync = directory_sync_outlined
-    dirty_lens = dirty_lens_outlined
-    disabled_by_default = disabled_by_default_outlined
-    disabled_visible = disabled_visible_outlined
-    disc_full = disc_full_outlined
-    discover_tune = discover_tune_outlined
-    dishwasher = dishwasher_outlined
-    dishwasher_gen = dishwasher_gen_outlined
-    display_external_input = display_external_input_outlined
-    display_settings = display_settings_outlined
-    distance = distance_outlined
-    diversity_1 = diversity_1_outlined
-    diversity_2 = diversity_2_outlined
-    diversity_3 = diversity_3_outlined
-    diversity_4 = diversity_4_outlined
-    dns = dns_outlined
-    do_disturb = do_disturb_outlined
-    do_disturb_alt = do_disturb_alt_outlined
-    do_disturb_off = do_disturb_off_outlined
-    do_disturb_on = do_disturb_on_outlined
-    do_not_disturb = do_not_disturb_outlined
-    do_not_disturb_alt = do_not_disturb_alt_outlined
-    do_not_disturb_off = do_not_disturb_off_outlined
-    do_not_disturb_on = do_not_disturb_on_outlined
-    do_not_disturb_on_total_silence = do_not_disturb_on_total_silence_outlined
-    do_not_step = do_not_step_outlined
-    do_not_touch = do_not_touch_outlined
-    dock = dock_outlined
-    dock_to_bottom = dock_to_bottom_outlined
-    dock_to_left = dock_to_left_outlined
-    dock_to_right = dock_to_right_outlined
-    docs = docs_outlined
-    docs_add_on = docs_add_on_outlined
-    docs_apps_script = docs_apps_script_outlined
-    document_scanner = document_scanner_outlined
-    document_search = document_search_outlined
-    domain = domain_outlined
-    domain_add = domain_add_outlined
-    domain_disabled = domain_disabled_outlined
-    domain_verification = domain_verification_outlined
-    domain_verification_off = domain_verification_off_outlined
-    domino_mask = domino_mask_outlined
-    done = done_outlined
-    done_all = done_all_outlined
-    done_outline = done_outline_outlined
-    donut_large = donut_large_outlined
-    donut_small = donut_small_outlined
-    door_back = door_back_outlined
-    door_front = door_front_outlined
-    door_open = door_open_outlined
-    door_sensor = door_sensor_outlined
-    door_sliding = door_sliding_outlined
-    doorbell = doorbell_outlined
-    doorbell_3p = doorbell_3p_outlined
-    doorbell_chime = doorbell_chime_outlined
-    double_arrow = double_arrow_outlined
-    downhill_skiing = downhill_skiing_outlined
-    download = download_outlined
-    download_2 = download_2_outlined
-    download_done = download_done_outlined
-    download_for_offline = download_for_offline_outlined
-    downloading = downloading_outlined
-    draft = draft_outlined
-    draft_orders = draft_orders_outlined
-    drafts = drafts_outlined
-    drag_click = drag_click_outlined
-    drag_handle = drag_handle_outlined
-    drag_indicator = drag_indicator_outlined
-    drag_pan = drag_pan_outlined
-    draw = draw_outlined
-    draw_abstract = draw_abstract_outlined
-    draw_collage = draw_collage_outlined
-    drawing_recognition = drawing_recognition_outlined
-    dresser = dresser_outlined
-    drive_eta = drive_eta_outlined
-    drive_export = drive_export_outlined
-    drive_file_move = drive_file_move_outlined
-    drive_file_move_outline = drive_file_move_outline_outlined
-    drive_file_move_rtl = drive_file_move_rtl_outlined
-    drive_file_rename_outline = drive_file_rename_outline_outlined
-    drive_folder_upload = drive_folder_upload_outlined
-    drive_fusiontable = drive_fusiontable_outlined
-    dropdown = dropdown_outlined
-    dropper_eye = dropper_eye_outlined
-    dry = dry_outlined
-    dry_cleaning = dry_cleaning_outlined
-    dual_screen = dual_screen_outlined
-    duo = duo_outlined
-    dvr = dvr_outlined
-    dynamic_feed = dynamic_feed_outlined
-    dynamic_form = dynamic_form_outlined
-    e911_avatar = e911_avatar_outlined
-    e911_emergency = e911_emergency_outlined
-    e_mobiledata = e_mobiledata_outlined
-    e_mobiledata_badge = e_mobiledata_badge_outlined
-    ear_sound = ear_sound_outlined
-    earbud_case = earbud_case_outlined
-    earbud_left = earbud_left_outlined
-    earbud_right = earbud_right_outlined
-    earbuds = earbuds_outlined
-    earbuds_2 = earbuds_2_outlined
-    earbuds_battery = earbuds_battery_outlined
-    early_on = early_on_outlined
-    earthquake = earthquake_outlined
-    east = east_outlined
-    ecg = ecg_outlined
-    ecg_heart = ecg_heart_outlined
-    eco = eco_outlined
-    eda = eda_outlined
-    edgesensor_high = edgesensor_high_outlined
-    edgesensor_low = edgesensor_low_outlined
-    edit = edit_outlined
-    edit_arrow_down = edit_arrow_down_outlined
-    edit_arrow_up = edit_arrow_up_outlined
-    edit_attributes = edit_attributes_outlined
-    edit_audio = edit_audio_outlined
-    edit_calendar = edit_calendar_outlined
-    edit_document = edit_document_outlined
-    edit_location = edit_location_outlined
-    edit_location_alt = edit_location_alt_outlined
-    edit_note = edit_note_outlined
-    edit_notifications = edit_notifications_outlined
-    edit_off = edit_off_outlined
-    edit_road = edit_road_outlined
-    edit_square = edit_square_outlined
-    editor_choice = editor_choice_outlined
-    egg = egg_outlined
-    egg_alt = egg_alt_outlined
-    eject = eject_outlined
-    elderly = elderly_outlined
-    elderly_woman = elderly_woman_outlined
-    electric_bike = electric_bike_outlined
-    electric_bolt = electric_bolt_outlined
-    electric_car = electric_car_outlined
-    electric_meter = electric_meter_outlined
-    electric_moped = electric_moped_outlined
-    electric_rickshaw = electric_rickshaw_outlined
-    electric_scooter = electric_scooter_outlined
-    electrical_services = electrical_services_outlined
-    elevation = elevation_outlined
-    elevator = elevator_outlined
-    email = email_outlined
-    emergency = emergency_outlined
-    emergency_heat = emergency_heat_outlined
-    emergency_heat_2 = emergency_heat_2_outlined
-    emergency_home = emergency_home_outlined
-    emergency_recording = emergency_recording_outlined
-    emergency_share = emergency_share_outlined
-    emergency_share_off = emergency_share_off_outlined
-    emoji_emotions = emoji_emotions_outlined
-    emoji_events = emoji_events_outlined
-    emoji_flags = emoji_flags_outlined
-    emoji_food_beverage = emoji_food_beverage_outlined
-    emoji_language = emoji_language_outlined
-    emoji_nature = emoji_nature_outlined
-    emoji_objects = emoji_objects_outlined
-    emoji_people = emoji_people_outlined
-    emoji_symbols = emoji_symbols_outlined
-    emoji_transportation = emoji_transportation_outlined
-    emoticon = emoticon_outlined
-    empty_dashboard = empty_dashboard_outlined
-    enable = enable_outlined
-    encrypted = encrypted_outlined
-    encrypted_add = encrypted_add_outlined
-    encrypted_add_circle = encrypted_add_circle_outlined
-    encrypted_minus_circle = encrypted_minus_circle_outlined
-    encrypted_off = encrypted_off_outlined
-    endocrinology = endocrinology_outlined
-    energy = energy_outlined
-    energy_program_saving = energy_program_saving_outlined
-    energy_program_time_used = energy_program_time_used_outlined
-    energy_savings_leaf = energy_savings_leaf_outlined
-    engineering = engineering_outlined
-    enhanced_encryption = enhanced_encryption_outlined
-    ent = ent_outlined
-    enterprise = enterprise_outlined
-    enterprise_off = enterprise_off_outlined
-    equal = equal_outlined
-    equalizer = equalizer_outlined
-    eraser_size_1 = eraser_size_1_outlined
-    eraser_size_2 = eraser_size_2_outlined
-    eraser_size_3 = eraser_size_3_outlined
-    eraser_size_4 = eraser_size_4_outlined
-    eraser_size_5 = eraser_size_5_outlined
-    error = error_outlined
-    error_circle_rounded = error_circle_rounded_outlined
-    error_med = error_med_outlined
-    error_outline = error_outline_outlined
-    escalator = escalator_outlined
-    escalator_warning = escalator_warning_outlined
-    euro = euro_outlined
-    euro_symbol = euro_symbol_outlined
-    ev_charger = ev_charger_outlined
-    ev_mobiledata_badge = ev_mobiledata_badge_outlined
-    ev_shadow = ev_shadow_outlined
-    ev_shadow_add = ev_shadow_add_outlined
-    ev_shadow_minus = ev_shadow_minus_outlined
-    ev_station = ev_station_outlined
-    event = event_outlined
-    event_available = event_available_outlined
-    event_busy = event_busy_outlined
-    event_list = event_list_outlined
-    event_note = event_note_outlined
-    event_repeat = event_repeat_outlined
-    event_seat = event_seat_outlined
-    event_upcoming = event_upcoming_outlined
-    exclamation = exclamation_outlined
-    exercise = exercise_outlined
-    exit_to_app = exit_to_app_outlined
-    expand = expand_outlined
-    expand_all = expand_all_outlined
-    expand_circle_down = expand_circle_down_outlined
-    expand_circle_right = expand_circle_right_outlined
-    expand_circle_up = expand_circle_up_outlined
-    expand_content = expand_content_outlined
-    expand_less = expand_less_outlined
-    expand_more = expand_more_outlined
-    expansion_panels = expansion_panels_outlined
-    expension_panels = expension_panels_outlined
-    experiment = experiment_outlined
-    explicit = explicit_outlined
-    explore = explore_outlined
-    explore_nearby = explore_nearby_outlined
-    explore_off = explore_off_outlined
-    explosion = explosion_outlined
-    export_notes = export_notes_outlined
-    exposure = exposure_outlined
-    exposure_neg_1 = exposure_neg_1_outlined
-    exposure_neg_2 = exposure_neg_2_outlined
-    exposure_plus_1 = exposure_plus_1_outlined
-    exposure_plus_2 = exposure_plus_2_outlined
-    exposure_zero = exposure_zero_outlined
-    extension = extension_outlined
-    extension_off = extension_off_outlined
-    eye_tracking = eye_tracking_outlined
-    eyeglasses = eyeglasses_outlined
-    face = face_outlined
-    face_2 = face_2_outlined
-    face_3 = face_3_outlined
-    face_4 = face_4_outlined
-    face_5 = face_5_outlined
-    face_6 = face_6_outlined
-    face_down = face_down_outlined
-    face_left = face_left_outlined
-    face_nod = face_nod_outlined
-    face_retouching_natural = face_retouching_natural_outlined
-    face_retouching_off = face_retouching_off_outlined
-    face_right = face_right_outlined
-    face_shake = face_shake_outlined
-    face_unlock = face_unlock_outlined
-    face_up = face_up_outlined
-    fact_check = fact_check_outlined
-    factory = factory_outlined
-    falling = falling_outlined
-    familiar_face_and_zone = familiar_face_and_zone_outlined
-    family_history = family_history_outlined
-    family_home = family_home_outlined
-    family_link = family_link_outlined
-    family_restroom = family_restroom_outlined
-    family_star = family_star_outlined
-    fan_focus = fan_focus_outlined
-    fan_indirect = fan_indirect_outlined
-    farsight_digital = farsight_digital_outlined
-    fast_forward = fast_forward_outlined
-    fast_rewind = fast_rewind_outlined
-    fastfood = fastfood_outlined
-    faucet = faucet_outlined
-    favorite = favorite_outlined
-    favorite_border = favorite_border_outlined
-    fax = fax_outlined
-    feature_search = feature_search_outlined
-    featured_play_list = featured_play_list_outlined
-    featured_seasonal_and_gifts = featured_seasonal_and_gifts_outlined
-    featured_video = featured_video_outlined
-    feed = feed_outlined
-    feedback = feedback_outlined
-    female = female_outlined
-    femur = femur_outlined
-    femur_alt = femur_alt_outlined
-    fence = fence_outlined
-    fertile = fertile_outlined
-    festival = festival_outlined
-    fiber_dvr = fiber_dvr_outlined
-    fiber_manual_record = fiber_manual_record_outlined
-    fiber_new = fiber_new_outlined
-    fiber_pin = fiber_pin_outlined
-    fiber_smart_record = fiber_smart_record_outlined
-    file_copy = file_copy_outlined
-    file_copy_off = file_copy_off_outlined
-    file_download = file_download_outlined
-    file_download_done = file_download_done_outlined
-    file_download_off = file_download_off_outlined
-    file_export = file_export_outlined
-    file_json = file_json_outlined
-    file_map = file_map_outlined
-    file_map_stack = file_map_stack_outlined
-    file_open = file_open_outlined
-    file_png = file_png_outlined
-    file_present = file_present_outlined
-    file_save = file_save_outlined
-    file_save_off = file_save_off_outlined
-    file_upload = file_upload_outlined
-    file_upload_off = file_upload_off_outlined
-    files = files_outlined
-    filter = filter_outlined
-    filter_1 = filter_1_outlined
-    filter_2 = filter_2_outlined
-    filter_3 = filter_3_outlined
-    filter_4 = filter_4_outlined
-    filter_5 = filter_5_outlined
-    filter_6 = filter_6_outlined
-    filter_7 = filter_7_outlined
-    filter_8 = filter_8_outlined
-    filter_9 = filter_9_outlined
-    filter_9_plus = filter_9_plus_outlined
-    filter_alt = filter_alt_outlined
-    filter_alt_off = filter_alt_off_outlined
-    filter_arrow_right = filter_arrow_right_outlined
-    filter_b_and_w = filter_b_and_w_outlined
-    filter_center_focus = filter_center_focus_outlined
-    filter_drama = filter_drama_outlined
-    filter_frames = filter_frames_outlined
-    filter_hdr = filter_hdr_outlined
-    filter_list = filter_list_outlined
-    filter_list_alt = filter_list_alt_outlined
-    filter_list_off = filter_list_off_outlined
-    filter_none = filter_none_outlined
-    filter_retrolux = filter_retrolux_outlined
-    filter_tilt_shift = filter_tilt_shift_outlined
-    filter_vintage = filter_vintage_outlined
-    finance = finance_outlined
-    finance_chip = finance_chip_outlined
-    finance_mode = finance_mode_outlined
-    find_in_page = find_in_page_outlined
-    find_replace = find_replace_outlined
-    fingerprint = fingerprint_outlined
-    fingerprint_off = fingerprint_off_outlined
-    fire_extinguisher = fire_extinguisher_outlined
-    fire_hydrant = fire_hydrant_outlined
-    fire_truck = fire_truck_outlined
-    fireplace = fireplace_outlined
-    first_page = first_page_outlined
-    fit_page = fit_page_outlined
-    fit_page_height = fit_page_height_outlined
-    fit_page_width = fit_page_width_outlined
-    fit_screen = fit_screen_outlined
-    fit_width = fit_width_outlined
-    fitness_center = fitness_center_outlined
-    fitness_tracker = fitness_tracker_outlined
-    flag = flag_outlined
-    flag_2 = flag_2_outlined
-    flag_check = flag_check_outlined
-    flag_circle = flag_circle_outlined
-    flag_filled = flag_filled_outlined
-    flaky = flaky_outlined
-    flare = flare_outlined
-    flash_auto = flash_auto_outlined
-    flash_off = flash_off_outlined
-    flash_on = flash_on_outlined
-    flashlight_off = flashlight_off_outlined
-    flashlight_on = flashlight_on_outlined
-    flatware = flatware_outlined
-    flex_direction = flex_direction_outlined
-    flex_no_wrap = flex_no_wrap_outlined
-    flex_wrap = flex_wrap_outlined
-    flight = flight_outlined
-    flight_class = flight_class_outlined
-    flight_land = flight_land_outlined
-    flight_takeoff = flight_takeoff_outlined
-    flights_and_hotels = flights_and_hotels_outlined
-    flightsmode = flightsmode_outlined
-    flip = flip_outlined
-    flip_camera_android = flip_camera_android_outlined
-    flip_camera_ios = flip_camera_ios_outlined
-    flip_to_back = flip_to_back_outlined
-    flip_to_front = flip_to_front_outlined
-    float_landscape_2 = float_landscape_2_outlined
-    float_portrait_2 = float_portrait_2_outlined
-    flood = flood_outlined
-    floor = floor_outlined
-    floor_lamp = floor_lamp_outlined
-    flourescent = flourescent_outlined
-    flowchart = flowchart_outlined
-    flowsheet = flowsheet_outlined
-    fluid = fluid_outlined
-    fluid_balance = fluid_balance_outlined
-    fluid_med = fluid_med_outlined
-    fluorescent = fluorescent_outlined
-    flutter = flutter_outlined
-    flutter_dash = flutter_dash_outlined
-    flyover = flyover_outlined
-    fmd_bad = fmd_bad_outlined
-    fmd_good = fmd_good_outlined
-    foggy = foggy_outlined
-    folded_hands = folded_hands_outlined
-    folder = folder_outlined
-    folder_check = folder_check_outlined
-    folder_check_2 = folder_check_2_outlined
-    folder_code = folder_code_outlined
-    folder_copy = folder_copy_outlined
-    folder_data = folder_data_outlined
-    folder_delete = folder_delete_outlined
-    folder_eye = folder_eye_outlined
-    folder_info = folder_info_outlined
-    folder_limited = folder_limited_outlined
-    folder_managed = folder_managed_outlined
-    folder_match = folder_match_outlined
-    folder_off = folder_off_outlined
-    folder_open = folder_open_outlined
-    folder_shared = folder_shared_outlined
-    folder_special = folder_special_outlined
-    folder_supervised = folder_supervised_outlined
-    folder_zip = folder_zip_outlined
-    follow_the_signs = follow_the_signs_outlined
-    font_download = font_download_outlined
-    font_download_off = font_download_off_outlined
-    food_bank = food_bank_outlined
-    foot_bones = foot_bones_outlined
-    footprint = footprint_outlined
-    for_you = for_you_outlined
-    forest = forest_outlined
-    fork_left = fork_left_outlined
-    fork_right = fork_right_outlined
-    fork_spoon = fork_spoon_outlined
-    forklift = forklift_outlined
-    format_align_center = format_align_center_outlined
-    format_align_justify = format_align_justify_outlined
-    format_align_left = format_align_left_outlined
-    format_align_right = format_align_right_outlined
-    format_bold = format_bold_outlined
-    format_clear = format_clear_outlined
-    format_color_fill = format_color_fill_outlined
-    format_color_reset = format_color_reset_outlined
-    format_color_text = format_color_text_outlined
-    format_h1 = format_h1_outlined
-    format_h2 = format_h2_outlined
-    format_h3 = format_h3_outlined
-    format_h4 = format_h4_outlined
-    format_h5 = format_h5_outlined
-    format_h6 = format_h6_outlined
-    format_image_left = format_image_left_outlined
-    format_image_right = format_image_right_outlined
-    format_indent_decrease = format_indent_decrease_outlined
-    format_indent_increase = format_indent_increase_outlined
-    format_ink_highlighter = format_ink_highlighter_outlined
-    format_italic = format_italic_outlined
-    format_letter_spacing = format_letter_spacing_outlined
-    format_letter_spacing_2 = format_letter_spacing_2_outlined
-    format_letter_spacing_standard = format_letter_spacing_standard_outlined
-    format_letter_spacing_wide = format_letter_spacing_wide_outlined
-    format_letter_spacing_wider = format_letter_spacing_wider_outlined
-    format_line_spacing = format_line_spacing_outlined
-    format_list_bulleted = format_list_bulleted_outlined
-    format_list_bulleted_add = format_list_bulleted_add_outlined
-    format_list_numbered = format_list_numbered_outlined
-    format_list_numbered_rtl = format_list_numbered_rtl_outlined
-    format_overline = format_overline_outlined
-    format_paint = format_paint_outlined
-    format_paragraph = format_paragraph_outlined
-    format_quote = format_quote_outlined
-    format_quote_off = format_quote_off_outlined
-    format_shapes = format_shapes_outlined
-    format_size = format_size_outlined
-    format_strikethrough = format_strikethrough_outlined
-    format_text_clip = format_text_clip_outlined
-    format_text_overflow = format_text_overflow_outlined
-    format_text_wrap = format_text_wrap_outlined
-    format_textdirection_l_to_r = format_textdirection_l_to_r_outlined
-    format_textdirection_r_to_l = format_textdirection_r_to_l_outlined
-    format_textdirection_vertical = format_textdirection_vertical_outlined
-    format_underlined = format_underlined_outlined
-    format_underlined_squiggle = format_underlined_squiggle_outlined
-    forms_add_on = forms_add_on_outlined
-    forms_apps_script = forms_apps_script_outlined
-    fort = fort_outlined
-    forum = forum_outlined
-    forward = forward_outlined
-    forward_10 = forward_10_outlined
-    forward_30 = forward_30_outlined
-    forward_5 = forward_5_outlined
-    forward_circle = forward_circle_outlined
-    forward_media = forward_media_outlined
-    forward_to_inbox = forward_to_inbox_outlined
-    foundation = foundation_outlined
-    fragrance = fragrance_outlined
-    frame_inspect = frame_inspect_outlined
-    frame_person = frame_person_outlined
-    frame_person_mic = frame_person_mic_outlined
-    frame_person_off = frame_person_off_outlined
-    frame_reload = frame_reload_outlined
-    frame_source = frame_source_outlined
-    free_breakfast = free_breakfast_outlined
-    free_cancellation = free_cancellation_outlined
-    front_hand = front_hand_outlined
-    front_loader = front_loader_outlined
-    full_coverage = full_coverage_outlined
-    full_hd = full_hd_outlined
-    full_stacked_bar_chart = full_stacked_bar_chart_outlined
-    fullscreen = fullscreen_outlined
-    fullscreen_exit = fullscreen_exit_outlined
-    fullscreen_portrait = fullscreen_portrait_outlined
-    function = function_outlined
-    functions = functions_outlined
-    funicular = funicular_outlined
-    g_mobiledata = g_mobiledata_outlined
-    g_mobiledata_badge = g_mobiledata_badge_outlined
-    g_translate = g_translate_outlined
-    gallery_thumbnail = gallery_thumbnail_outlined
-    gamepad = gamepad_outlined
-    games = games_outlined
-    garage = garage_outlined
-    garage_door = garage_door_outlined
-    garage_home = garage_home_outlined
-    garden_cart = garden_cart_outlined
-    gas_meter = gas_meter_outlined
-    gastroenterology = gastroenterology_outlined
-    gate = gate_outlined
-    gavel = gavel_outlined
-    general_device = general_device_outlined
-    generating_tokens = generating_tokens_outlined
-    genetics = genetics_outlined
-    genres = genres_outlined
-    gesture = gesture_outlined
-    gesture_select = gesture_select_outlined
-    get_app = get_app_outlined
-    gif = gif_outlined
-    gif_2 = gif_2_outlined
-    gif_box = gif_box_outlined
-    girl = girl_outlined
-    gite = gite_outlined
-    glass_cup = glass_cup_outlined
-    globe = globe_outlined
-    globe_asia = globe_asia_outlined
-    globe_book = globe_book_outlined
-    globe_location_pin = globe_location_pin_outlined
-    globe_uk = globe_uk_outlined
-    glucose = glucose_outlined
-    glyphs = glyphs_outlined
-    go_to_line = go_to_line_outlined
-    golf_course = golf_course_outlined
-    gondola_lift = gondola_lift_outlined
-    google_home_devices = google_home_devices_outlined
-    google_plus_reshare = google_plus_reshare_outlined
-    google_tv_remote = google_tv_remote_outlined
-    google_wifi = google_wifi_outlined
-    gpp_bad = gpp_bad_outlined
-    gpp_good = gpp_good_outlined
-    gpp_maybe = gpp_maybe_outlined
-    gps_fixed = gps_fixed_outlined
-    gps_not_fixed = gps_not_fixed_outlined
-    gps_off = gps_off_outlined
-    grade = grade_outlined
-    gradient = gradient_outlined
-    grading = grading_outlined
-    grain = grain_outlined
-    graph_1 = graph_1_outlined
-    graph_2 = graph_2_outlined
-    graph_3 = graph_3_outlined
-    graph_4 = graph_4_outlined
-    graph_5 = graph_5_outlined
-    graph_6 = graph_6_outlined
-    graph_7 = graph_7_outlined
-    graphic_eq = graphic_eq_outlined
-    grass = grass_outlined
-    grid_3x3 = grid_3x3_outlined
-    grid_3x3_off = grid_3x3_off_outlined
-    grid_4x4 = grid_4x4_outlined
-    grid_goldenratio = grid_goldenratio_outlined
-    grid_guides = grid_guides_outlined
-    grid_off = grid_off_outlined
-    grid_on = grid_on_outlined
-    grid_view = grid_view_outlined
-    grocery = grocery_outlined
-    group = group_outlined
-    group_add = group_add_outlined
-    group_off = group_off_outlined
-    group_remove = group_remove_outlined
-    group_search = group_search_outlined
-    group_work = group_work_outlined
-    grouped_bar_chart = grouped_bar_chart_outlined
-    groups = groups_outlined
-    groups_2 = groups_2_outlined
-    groups_3 = groups_3_outlined
-    guardian = guardian_outlined
-    gynecology = gynecology_outlined
-    h_mobiledata = h_mobiledata_outlined
-    h_mobiledata_badge = h_mobiledata_badge_outlined
-    h_plus_mobiledata = h_plus_mobiledata_outlined
-    h_plus_mobiledata_badge = h_plus_mobiledata_badge_outlined
-    hail = hail_outlined
-    hallway = hallway_outlined
-    hand_bones = hand_bones_outlined
-    hand_gesture = hand_gesture_outlined
-    hand_gesture_off = hand_gesture_off_outlined
-    handheld_controller = handheld_controller_outlined
-    handshake = handshake_outlined
-    handwriting_recognition = handwriting_recognition_outlined
-    handyman = handyman_outlined
-    hangout_video = hangout_video_outlined
-    hangout_video_off = hangout_video_off_outlined
-    hard_disk = hard_disk_outlined
-    hard_drive = hard_drive_outlined
-    hard_drive_2 = hard_drive_2_outlined
-    hardware = hardware_outlined
-    hd = hd_outlined
-    hdr_auto = hdr_auto_outlined
-    hdr_auto_select = hdr_auto_select_outlined
-    hdr_enhanced_select = hdr_enhanced_select_outlined
-    hdr_off = hdr_off_outlined
-    hdr_off_select = hdr_off_select_outlined
-    hdr_on = hdr_on_outlined
-    hdr_on_select = hdr_on_select_outlined
-    hdr_plus = hdr_plus_outlined
-    hdr_plus_off = hdr_plus_off_outlined
-    hdr_strong = hdr_strong_outlined
-    hdr_weak = hdr_weak_outlined
-    head_mounted_device = head_mounted_device_outlined
-    headphones = headphones_outlined
-    headphones_battery = headphones_battery_outlined
-    headset = headset_outlined
-    headset_mic = headset_mic_outlined
-    headset_off = headset_off_outlined
-    healing = healing_outlined
-    health_and_beauty = health_and_beauty_outlined
-    health_and_safety = health_and_safety_outlined
-    health_metrics = health_metrics_outlined
-    heap_snapshot_large = heap_snapshot_large_outlined
-    heap_snapshot_multiple = heap_snapshot_multiple_outlined
-    heap_snapshot_thumbnail = heap_snapshot_thumbnail_outlined
-    hearing = hearing_outlined
-    hearing_aid = hearing_aid_outlined
-    hearing_aid_disabled = hearing_aid_disabled_outlined
-    hearing_disabled = hearing_disabled_outlined
-    heart_broken = heart_broken_outlined
-    heart_check = heart_check_outlined
-    heart_minus = heart_minus_outlined
-    heart_plus = heart_plus_outlined
-    heat = heat_outlined
-    heat_pump = heat_pump_outlined
-    heat_pump_balance = heat_pump_balance_outlined
-    height = height_outlined
-    helicopter = helicopter_outlined
-    help = help_outlined
-    help_center = help_center_outlined
-    help_clinic = help_clinic_outlined
-    help_outline = help_outline_outlined
-    hematology = hematology_outlined
-    hevc = hevc_outlined
-    hexagon = hexagon_outlined
-    hide = hide_outlined
-    hide_image = hide_image_outlined
-    hide_source = hide_source_outlined
-    high_density = high_density_outlined
-    high_quality = high_quality_outlined
-    high_res = high_res_outlined
-    highlight = highlight_outlined
-    highlight_alt = highlight_alt_outlined
-    highlight_keyboard_focus = highlight_keyboard_focus_outlined
-    highlight_mouse_cursor = highlight_mouse_cursor_outlined
-    highlight_off = highlight_off_outlined
-    highlight_text_cursor = highlight_text_cursor_outlined
-    highlighter_size_1 = highlighter_size_1_outlined
-    highlighter_size_2 = highlighter_size_2_outlined
-    highlighter_size_3 = highlighter_size_3_outlined
-    highlighter_size_4 = highlighter_size_4_outlined
-    highlighter_size_5 = highlighter_size_5_outlined
-    hiking = hiking_outlined
-    history = history_outlined
-    history_2 = history_2_outlined
-    history_edu = history_edu_outlined
-    history_off = history_off_outlined
-    history_toggle_off = history_toggle_off_outlined
-    hive = hive_outlined
-    hls = hls_outlined
-    hls_off = hls_off_outlined
-    holiday_village = holiday_village_outlined
-    home = home_outlined
-    home_and_garden = home_and_garden_outlined
-    home_app_logo = home_app_logo_outlined
-    home_filled = home_filled_outlined
-    home_health = home_health_outlined
-    home_improvement_and_tools = home_improvement_and_tools_outlined
-    home_iot_device = home_iot_device_outlined
-    home_max = home_max_outlined
-    home_max_dots = home_max_dots_outlined
-    home_mini = home_mini_outlined
-    home_pin = home_pin_outlined
-    home_repair_service = home_repair_service_outlined
-    home_speaker = home_speaker_outlined
-    home_storage = home_storage_outlined
-    home_work = home_work_outlined
-    horizontal_distribute = horizontal_distribute_outlined
-    horizontal_rule = horizontal_rule_outlined
-    horizontal_split = horizontal_split_outlined
-    host = host_outlined
-    hot_tub = hot_tub_outlined
-    hotel = hotel_outlined
-    hotel_class = hotel_class_outlined
-    hourglass = hourglass_outlined
-    hourglass_arrow_down = hourglass_arrow_down_outlined
-    hourglass_arrow_up = hourglass_arrow_up_outlined
-    hourglass_bottom = hourglass_bottom_outlined
-    hourglass_disabled = hourglass_disabled_outlined
-    hourglass_empty = hourglass_empty_outlined
-    hourglass_full = hourglass_full_outlined
-    hourglass_pause = hourglass_pause_outlined
-    hourglass_top = hourglass_top_outlined
-    house = house_outlined
-    house_siding = house_siding_outlined
-    house_with_shield = house_with_shield_outlined
-    houseboat = houseboat_outlined
-    household_supplies = household_supplies_outlined
-    hov = hov_outlined
-    how_to_reg = how_to_reg_outlined
-    how_to_vote = how_to_vote_outlined
-    hr_resting = hr_resting_outlined
-    html = html_outlined
-    http = http_outlined
-    https = https_outlined
-    hub = hub_outlined
-    humerus = humerus_outlined
-    humerus_alt = humerus_alt_outlined
-    humidity_high = humidity_high_outlined
-    humidity_indoor = humidity_indoor_outlined
-    humidity_low = humidity_low_outlined
-    humidity_mid = humidity_mid_outlined
-    humidity_percentage = humidity_percentage_outlined
-    hvac = hvac_outlined
-    hvac_max_defrost = hvac_max_defrost_outlined
-    ice_skating = ice_skating_outlined
-    icecream = icecream_outlined
-    id_card = id_card_outlined
-    identity_aware_proxy = identity_aware_proxy_outlined
-    identity_platform = identity_platform_outlined
-    ifl = ifl_outlined
-    iframe = iframe_outlined
-    iframe_off = iframe_off_outlined
-    image = image_outlined
-    image_arrow_up = image_arrow_up_outlined
-    image_aspect_ratio = image_aspect_ratio_outlined
-    image_not_supported = image_not_supported_outlined
-    image_search = image_search_outlined
-    imagesearch_roller = imagesearch_roller_outlined
-    imagesmode = imagesmode_outlined
-    immunology = immunology_outlined
-    import_contacts = import_contacts_outlined
-    import_export = import_export_outlined
-    important_devices = important_devices_outlined
-    in_home_mode = in_home_mode_outlined
-    inactive_order = inactive_order_outlined
-    inbox = inbox_outlined
-    inbox_customize = inbox_customize_outlined
-    inbox_text = inbox_text_outlined
-    inbox_text_asterisk = inbox_text_asterisk_outlined
-    inbox_text_person = inbox_text_person_outlined
-    inbox_text_share = inbox_text_share_outlined
-    incomplete_circle = incomplete_circle_outlined
-    indeterminate_check_box = indeterminate_check_box_outlined
-    indeterminate_question_box = indeterminate_question_box_outlined
-    info = info_outlined
-    info_i = info_i_outlined
-    infrared = infrared_outlined
-    ink_eraser = ink_eraser_outlined
-    ink_eraser_off = ink_eraser_off_outlined
-    ink_highlighter = ink_highlighter_outlined
-    ink_highlighter_move = ink_highlighter_move_outlined
-    ink_marker = ink_marker_outlined
-    ink_pen = ink_pen_outlined
-    ink_selection = ink_selection_outlined
-    inpatient = inpatient_outlined
-    input = input_outlined
-    input_circle = input_circle_outlined
-    insert_chart = insert_chart_outlined
-    insert_chart_filled = insert_chart_filled_outlined
-    insert_chart_outlined = insert_chart_outlined_outlined
-    insert_comment = insert_comment_outlined
-    insert_drive_file = insert_drive_file_outlined
-    insert_emoticon = insert_emoticon_outlined
-    insert_invitation = insert_invitation_outlined
-    insert_link = insert_link_outlined
-    insert_page_break = insert_page_break_outlined
-    insert_photo = insert_photo_outlined
-    insert_text = insert_text_outlined
-    insights = insights_outlined
-    install_desktop = install_desktop_outlined
-    install_mobile = install_mobile_outlined
-    instant_mix = instant_mix_outlined
-    integration_instructions = integration_instructions_outlined
-    interactive_space = interactive_space_outlined
-    interests = interests_outlined
-    interpreter_mode = interpreter_mode_outlined
-    inventory = inventory_outlined
-    inventory_2 = inventory_2_outlined
-    invert_colors = invert_colors_outlined
-    invert_colors_off = invert_colors_off_outlined
-    ios = ios_outlined
-    ios_share = ios_share_outlined
-    iron = iron_outlined
-    iso = iso_outlined
\ No newline at end of file
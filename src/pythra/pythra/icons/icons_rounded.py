@@ -1,2075 +0,0 @@
-from .base import IconData
-
-class IconsRounded:
-    """A helper class containing static references to rounded Material Symbols."""
-    
-    jamboard_kiosk_rounded = IconData(name="jamboard_kiosk", fontFamily="Material Symbols Rounded")
-    javascript_rounded = IconData(name="javascript", fontFamily="Material Symbols Rounded")
-    join_rounded = IconData(name="join", fontFamily="Material Symbols Rounded")
-    join_full_rounded = IconData(name="join_full", fontFamily="Material Symbols Rounded")
-    join_inner_rounded = IconData(name="join_inner", fontFamily="Material Symbols Rounded")
-    join_left_rounded = IconData(name="join_left", fontFamily="Material Symbols Rounded")
-    join_right_rounded = IconData(name="join_right", fontFamily="Material Symbols Rounded")
-    joystick_rounded = IconData(name="joystick", fontFamily="Material Symbols Rounded")
-    jump_to_element_rounded = IconData(name="jump_to_element", fontFamily="Material Symbols Rounded")
-    kayaking_rounded = IconData(name="kayaking", fontFamily="Material Symbols Rounded")
-    kebab_dining_rounded = IconData(name="kebab_dining", fontFamily="Material Symbols Rounded")
-    keep_rounded = IconData(name="keep", fontFamily="Material Symbols Rounded")
-    keep_off_rounded = IconData(name="keep_off", fontFamily="Material Symbols Rounded")
-    keep_pin_rounded = IconData(name="keep_pin", fontFamily="Material Symbols Rounded")
-    keep_public_rounded = IconData(name="keep_public", fontFamily="Material Symbols Rounded")
-    kettle_rounded = IconData(name="kettle", fontFamily="Material Symbols Rounded")
-    key_rounded = IconData(name="key", fontFamily="Material Symbols Rounded")
-    key_off_rounded = IconData(name="key_off", fontFamily="Material Symbols Rounded")
-    key_vertical_rounded = IconData(name="key_vertical", fontFamily="Material Symbols Rounded")
-    key_visualizer_rounded = IconData(name="key_visualizer", fontFamily="Material Symbols Rounded")
-    keyboard_rounded = IconData(name="keyboard", fontFamily="Material Symbols Rounded")
-    keyboard_alt_rounded = IconData(name="keyboard_alt", fontFamily="Material Symbols Rounded")
-    keyboard_arrow_down_rounded = IconData(name="keyboard_arrow_down", fontFamily="Material Symbols Rounded")
-    keyboard_arrow_left_rounded = IconData(name="keyboard_arrow_left", fontFamily="Material Symbols Rounded")
-    keyboard_arrow_right_rounded = IconData(name="keyboard_arrow_right", fontFamily="Material Symbols Rounded")
-    keyboard_arrow_up_rounded = IconData(name="keyboard_arrow_up", fontFamily="Material Symbols Rounded")
-    keyboard_backspace_rounded = IconData(name="keyboard_backspace", fontFamily="Material Symbols Rounded")
-    keyboard_capslock_rounded = IconData(name="keyboard_capslock", fontFamily="Material Symbols Rounded")
-    keyboard_capslock_badge_rounded = IconData(name="keyboard_capslock_badge", fontFamily="Material Symbols Rounded")
-    keyboard_command_key_rounded = IconData(name="keyboard_command_key", fontFamily="Material Symbols Rounded")
-    keyboard_control_key_rounded = IconData(name="keyboard_control_key", fontFamily="Material Symbols Rounded")
-    keyboard_double_arrow_down_rounded = IconData(name="keyboard_double_arrow_down", fontFamily="Material Symbols Rounded")
-    keyboard_double_arrow_left_rounded = IconData(name="keyboard_double_arrow_left", fontFamily="Material Symbols Rounded")
-    keyboard_double_arrow_right_rounded = IconData(name="keyboard_double_arrow_right", fontFamily="Material Symbols Rounded")
-    keyboard_double_arrow_up_rounded = IconData(name="keyboard_double_arrow_up", fontFamily="Material Symbols Rounded")
-    keyboard_external_input_rounded = IconData(name="keyboard_external_input", fontFamily="Material Symbols Rounded")
-    keyboard_full_rounded = IconData(name="keyboard_full", fontFamily="Material Symbols Rounded")
-    keyboard_hide_rounded = IconData(name="keyboard_hide", fontFamily="Material Symbols Rounded")
-    keyboard_keys_rounded = IconData(name="keyboard_keys", fontFamily="Material Symbols Rounded")
-    keyboard_lock_rounded = IconData(name="keyboard_lock", fontFamily="Material Symbols Rounded")
-    keyboard_lock_off_rounded = IconData(name="keyboard_lock_off", fontFamily="Material Symbols Rounded")
-    keyboard_off_rounded = IconData(name="keyboard_off", fontFamily="Material Symbols Rounded")
-    keyboard_onscreen_rounded = IconData(name="keyboard_onscreen", fontFamily="Material Symbols Rounded")
-    keyboard_option_key_rounded = IconData(name="keyboard_option_key", fontFamily="Material Symbols Rounded")
-    keyboard_previous_language_rounded = IconData(name="keyboard_previous_language", fontFamily="Material Symbols Rounded")
-    keyboard_return_rounded = IconData(name="keyboard_return", fontFamily="Material Symbols Rounded")
-    keyboard_tab_rounded = IconData(name="keyboard_tab", fontFamily="Material Symbols Rounded")
-    keyboard_tab_rtl_rounded = IconData(name="keyboard_tab_rtl", fontFamily="Material Symbols Rounded")
-    keyboard_voice_rounded = IconData(name="keyboard_voice", fontFamily="Material Symbols Rounded")
-    kid_star_rounded = IconData(name="kid_star", fontFamily="Material Symbols Rounded")
-    king_bed_rounded = IconData(name="king_bed", fontFamily="Material Symbols Rounded")
-    kitchen_rounded = IconData(name="kitchen", fontFamily="Material Symbols Rounded")
-    kitesurfing_rounded = IconData(name="kitesurfing", fontFamily="Material Symbols Rounded")
-    lab_panel_rounded = IconData(name="lab_panel", fontFamily="Material Symbols Rounded")
-    lab_profile_rounded = IconData(name="lab_profile", fontFamily="Material Symbols Rounded")
-    lab_research_rounded = IconData(name="lab_research", fontFamily="Material Symbols Rounded")
-    label_rounded = IconData(name="label", fontFamily="Material Symbols Rounded")
-    label_important_rounded = IconData(name="label_important", fontFamily="Material Symbols Rounded")
-    label_important_outline_rounded = IconData(name="label_important_outline", fontFamily="Material Symbols Rounded")
-    label_off_rounded = IconData(name="label_off", fontFamily="Material Symbols Rounded")
-    label_outline_rounded = IconData(name="label_outline", fontFamily="Material Symbols Rounded")
-    labs_rounded = IconData(name="labs", fontFamily="Material Symbols Rounded")
-    lan_rounded = IconData(name="lan", fontFamily="Material Symbols Rounded")
-    landscape_rounded = IconData(name="landscape", fontFamily="Material Symbols Rounded")
-    landscape_2_rounded = IconData(name="landscape_2", fontFamily="Material Symbols Rounded")
-    landscape_2_edit_rounded = IconData(name="landscape_2_edit", fontFamily="Material Symbols Rounded")
-    landscape_2_off_rounded = IconData(name="landscape_2_off", fontFamily="Material Symbols Rounded")
-    landslide_rounded = IconData(name="landslide", fontFamily="Material Symbols Rounded")
-    language_rounded = IconData(name="language", fontFamily="Material Symbols Rounded")
-    language_chinese_array_rounded = IconData(name="language_chinese_array", fontFamily="Material Symbols Rounded")
-    language_chinese_cangjie_rounded = IconData(name="language_chinese_cangjie", fontFamily="Material Symbols Rounded")
-    language_chinese_dayi_rounded = IconData(name="language_chinese_dayi", fontFamily="Material Symbols Rounded")
-    language_chinese_pinyin_rounded = IconData(name="language_chinese_pinyin", fontFamily="Material Symbols Rounded")
-    language_chinese_quick_rounded = IconData(name="language_chinese_quick", fontFamily="Material Symbols Rounded")
-    language_chinese_wubi_rounded = IconData(name="language_chinese_wubi", fontFamily="Material Symbols Rounded")
-    language_french_rounded = IconData(name="language_french", fontFamily="Material Symbols Rounded")
-    language_gb_english_rounded = IconData(name="language_gb_english", fontFamily="Material Symbols Rounded")
-    language_international_rounded = IconData(name="language_international", fontFamily="Material Symbols Rounded")
-    language_japanese_kana_rounded = IconData(name="language_japanese_kana", fontFamily="Material Symbols Rounded")
-    language_korean_latin_rounded = IconData(name="language_korean_latin", fontFamily="Material Symbols Rounded")
-    language_pinyin_rounded = IconData(name="language_pinyin", fontFamily="Material Symbols Rounded")
-    language_spanish_rounded = IconData(name="language_spanish", fontFamily="Material Symbols Rounded")
-    language_us_rounded = IconData(name="language_us", fontFamily="Material Symbols Rounded")
-    language_us_colemak_rounded = IconData(name="language_us_colemak", fontFamily="Material Symbols Rounded")
-    language_us_dvorak_rounded = IconData(name="language_us_dvorak", fontFamily="Material Symbols Rounded")
-    laps_rounded = IconData(name="laps", fontFamily="Material Symbols Rounded")
-    laptop_rounded = IconData(name="laptop", fontFamily="Material Symbols Rounded")
-    laptop_car_rounded = IconData(name="laptop_car", fontFamily="Material Symbols Rounded")
-    laptop_chromebook_rounded = IconData(name="laptop_chromebook", fontFamily="Material Symbols Rounded")
-    laptop_mac_rounded = IconData(name="laptop_mac", fontFamily="Material Symbols Rounded")
-    laptop_windows_rounded = IconData(name="laptop_windows", fontFamily="Material Symbols Rounded")
-    lasso_select_rounded = IconData(name="lasso_select", fontFamily="Material Symbols Rounded")
-    last_page_rounded = IconData(name="last_page", fontFamily="Material Symbols Rounded")
-    launch_rounded = IconData(name="launch", fontFamily="Material Symbols Rounded")
-    laundry_rounded = IconData(name="laundry", fontFamily="Material Symbols Rounded")
-    layers_rounded = IconData(name="layers", fontFamily="Material Symbols Rounded")
-    layers_clear_rounded = IconData(name="layers_clear", fontFamily="Material Symbols Rounded")
-    lda_rounded = IconData(name="lda", fontFamily="Material Symbols Rounded")
-    leaderboard_rounded = IconData(name="leaderboard", fontFamily="Material Symbols Rounded")
-    leak_add_rounded = IconData(name="leak_add", fontFamily="Material Symbols Rounded")
-    leak_remove_rounded = IconData(name="leak_remove", fontFamily="Material Symbols Rounded")
-    left_click_rounded = IconData(name="left_click", fontFamily="Material Symbols Rounded")
-    left_panel_close_rounded = IconData(name="left_panel_close", fontFamily="Material Symbols Rounded")
-    left_panel_open_rounded = IconData(name="left_panel_open", fontFamily="Material Symbols Rounded")
-    legend_toggle_rounded = IconData(name="legend_toggle", fontFamily="Material Symbols Rounded")
-    lens_rounded = IconData(name="lens", fontFamily="Material Symbols Rounded")
-    lens_blur_rounded = IconData(name="lens_blur", fontFamily="Material Symbols Rounded")
-    letter_switch_rounded = IconData(name="letter_switch", fontFamily="Material Symbols Rounded")
-    library_add_rounded = IconData(name="library_add", fontFamily="Material Symbols Rounded")
-    library_add_check_rounded = IconData(name="library_add_check", fontFamily="Material Symbols Rounded")
-    library_books_rounded = IconData(name="library_books", fontFamily="Material Symbols Rounded")
-    library_music_rounded = IconData(name="library_music", fontFamily="Material Symbols Rounded")
-    license_rounded = IconData(name="license", fontFamily="Material Symbols Rounded")
-    lift_to_talk_rounded = IconData(name="lift_to_talk", fontFamily="Material Symbols Rounded")
-    light_rounded = IconData(name="light", fontFamily="Material Symbols Rounded")
-    light_group_rounded = IconData(name="light_group", fontFamily="Material Symbols Rounded")
-    light_mode_rounded = IconData(name="light_mode", fontFamily="Material Symbols Rounded")
-    light_off_rounded = IconData(name="light_off", fontFamily="Material Symbols Rounded")
-    lightbulb_rounded = IconData(name="lightbulb", fontFamily="Material Symbols Rounded")
-    lightbulb_2_rounded = IconData(name="lightbulb_2", fontFamily="Material Symbols Rounded")
-    lightbulb_circle_rounded = IconData(name="lightbulb_circle", fontFamily="Material Symbols Rounded")
-    lightbulb_outline_rounded = IconData(name="lightbulb_outline", fontFamily="Material Symbols Rounded")
-    lightning_stand_rounded = IconData(name="lightning_stand", fontFamily="Material Symbols Rounded")
-    line_axis_rounded = IconData(name="line_axis", fontFamily="Material Symbols Rounded")
-    line_curve_rounded = IconData(name="line_curve", fontFamily="Material Symbols Rounded")
-    line_end_rounded = IconData(name="line_end", fontFamily="Material Symbols Rounded")
-    line_end_arrow_rounded = IconData(name="line_end_arrow", fontFamily="Material Symbols Rounded")
-    line_end_arrow_notch_rounded = IconData(name="line_end_arrow_notch", fontFamily="Material Symbols Rounded")
-    line_end_circle_rounded = IconData(name="line_end_circle", fontFamily="Material Symbols Rounded")
-    line_end_diamond_rounded = IconData(name="line_end_diamond", fontFamily="Material Symbols Rounded")
-    line_end_square_rounded = IconData(name="line_end_square", fontFamily="Material Symbols Rounded")
-    line_start_rounded = IconData(name="line_start", fontFamily="Material Symbols Rounded")
-    line_start_arrow_rounded = IconData(name="line_start_arrow", fontFamily="Material Symbols Rounded")
-    line_start_arrow_notch_rounded = IconData(name="line_start_arrow_notch", fontFamily="Material Symbols Rounded")
-    line_start_circle_rounded = IconData(name="line_start_circle", fontFamily="Material Symbols Rounded")
-    line_start_diamond_rounded = IconData(name="line_start_diamond", fontFamily="Material Symbols Rounded")
-    line_start_square_rounded = IconData(name="line_start_square", fontFamily="Material Symbols Rounded")
-    line_style_rounded = IconData(name="line_style", fontFamily="Material Symbols Rounded")
-    line_weight_rounded = IconData(name="line_weight", fontFamily="Material Symbols Rounded")
-    linear_scale_rounded = IconData(name="linear_scale", fontFamily="Material Symbols Rounded")
-    link_rounded = IconData(name="link", fontFamily="Material Symbols Rounded")
-    link_off_rounded = IconData(name="link_off", fontFamily="Material Symbols Rounded")
-    linked_camera_rounded = IconData(name="linked_camera", fontFamily="Material Symbols Rounded")
-    linked_services_rounded = IconData(name="linked_services", fontFamily="Material Symbols Rounded")
-    liquor_rounded = IconData(name="liquor", fontFamily="Material Symbols Rounded")
-    list_rounded = IconData(name="list", fontFamily="Material Symbols Rounded")
-    list_alt_rounded = IconData(name="list_alt", fontFamily="Material Symbols Rounded")
-    list_alt_add_rounded = IconData(name="list_alt_add", fontFamily="Material Symbols Rounded")
-    list_alt_check_rounded = IconData(name="list_alt_check", fontFamily="Material Symbols Rounded")
-    lists_rounded = IconData(name="lists", fontFamily="Material Symbols Rounded")
-    live_help_rounded = IconData(name="live_help", fontFamily="Material Symbols Rounded")
-    live_tv_rounded = IconData(name="live_tv", fontFamily="Material Symbols Rounded")
-    living_rounded = IconData(name="living", fontFamily="Material Symbols Rounded")
-    local_activity_rounded = IconData(name="local_activity", fontFamily="Material Symbols Rounded")
-    local_airport_rounded = IconData(name="local_airport", fontFamily="Material Symbols Rounded")
-    local_atm_rounded = IconData(name="local_atm", fontFamily="Material Symbols Rounded")
-    local_bar_rounded = IconData(name="local_bar", fontFamily="Material Symbols Rounded")
-    local_cafe_rounded = IconData(name="local_cafe", fontFamily="Material Symbols Rounded")
-    local_car_wash_rounded = IconData(name="local_car_wash", fontFamily="Material Symbols Rounded")
-    local_convenience_store_rounded = IconData(name="local_convenience_store", fontFamily="Material Symbols Rounded")
-    local_dining_rounded = IconData(name="local_dining", fontFamily="Material Symbols Rounded")
-    local_drink_rounded = IconData(name="local_drink", fontFamily="Material Symbols Rounded")
-    local_fire_department_rounded = IconData(name="local_fire_department", fontFamily="Material Symbols Rounded")
-    local_florist_rounded = IconData(name="local_florist", fontFamily="Material Symbols Rounded")
-    local_gas_station_rounded = IconData(name="local_gas_station", fontFamily="Material Symbols Rounded")
-    local_grocery_store_rounded = IconData(name="local_grocery_store", fontFamily="Material Symbols Rounded")
-    local_hospital_rounded = IconData(name="local_hospital", fontFamily="Material Symbols Rounded")
-    local_hotel_rounded = IconData(name="local_hotel", fontFamily="Material Symbols Rounded")
-    local_laundry_service_rounded = IconData(name="local_laundry_service", fontFamily="Material Symbols Rounded")
-    local_library_rounded = IconData(name="local_library", fontFamily="Material Symbols Rounded")
-    local_mall_rounded = IconData(name="local_mall", fontFamily="Material Symbols Rounded")
-    local_movies_rounded = IconData(name="local_movies", fontFamily="Material Symbols Rounded")
-    local_offer_rounded = IconData(name="local_offer", fontFamily="Material Symbols Rounded")
-    local_parking_rounded = IconData(name="local_parking", fontFamily="Material Symbols Rounded")
-    local_pharmacy_rounded = IconData(name="local_pharmacy", fontFamily="Material Symbols Rounded")
-    local_phone_rounded = IconData(name="local_phone", fontFamily="Material Symbols Rounded")
-    local_pizza_rounded = IconData(name="local_pizza", fontFamily="Material Symbols Rounded")
-    local_play_rounded = IconData(name="local_play", fontFamily="Material Symbols Rounded")
-    local_police_rounded = IconData(name="local_police", fontFamily="Material Symbols Rounded")
-    local_post_office_rounded = IconData(name="local_post_office", fontFamily="Material Symbols Rounded")
-    local_printshop_rounded = IconData(name="local_printshop", fontFamily="Material Symbols Rounded")
-    local_see_rounded = IconData(name="local_see", fontFamily="Material Symbols Rounded")
-    local_shipping_rounded = IconData(name="local_shipping", fontFamily="Material Symbols Rounded")
-    local_taxi_rounded = IconData(name="local_taxi", fontFamily="Material Symbols Rounded")
-    location_automation_rounded = IconData(name="location_automation", fontFamily="Material Symbols Rounded")
-    location_away_rounded = IconData(name="location_away", fontFamily="Material Symbols Rounded")
-    location_chip_rounded = IconData(name="location_chip", fontFamily="Material Symbols Rounded")
-    location_city_rounded = IconData(name="location_city", fontFamily="Material Symbols Rounded")
-    location_disabled_rounded = IconData(name="location_disabled", fontFamily="Material Symbols Rounded")
-    location_home_rounded = IconData(name="location_home", fontFamily="Material Symbols Rounded")
-    location_off_rounded = IconData(name="location_off", fontFamily="Material Symbols Rounded")
-    location_on_rounded = IconData(name="location_on", fontFamily="Material Symbols Rounded")
-    location_pin_rounded = IconData(name="location_pin", fontFamily="Material Symbols Rounded")
-    location_searching_rounded = IconData(name="location_searching", fontFamily="Material Symbols Rounded")
-    locator_tag_rounded = IconData(name="locator_tag", fontFamily="Material Symbols Rounded")
-    lock_rounded = IconData(name="lock", fontFamily="Material Symbols Rounded")
-    lock_clock_rounded = IconData(name="lock_clock", fontFamily="Material Symbols Rounded")
-    lock_open_rounded = IconData(name="lock_open", fontFamily="Material Symbols Rounded")
-    lock_open_circle_rounded = IconData(name="lock_open_circle", fontFamily="Material Symbols Rounded")
-    lock_open_right_rounded = IconData(name="lock_open_right", fontFamily="Material Symbols Rounded")
-    lock_outline_rounded = IconData(name="lock_outline", fontFamily="Material Symbols Rounded")
-    lock_person_rounded = IconData(name="lock_person", fontFamily="Material Symbols Rounded")
-    lock_reset_rounded = IconData(name="lock_reset", fontFamily="Material Symbols Rounded")
-    login_rounded = IconData(name="login", fontFamily="Material Symbols Rounded")
-    logo_dev_rounded = IconData(name="logo_dev", fontFamily="Material Symbols Rounded")
-    logout_rounded = IconData(name="logout", fontFamily="Material Symbols Rounded")
-    looks_rounded = IconData(name="looks", fontFamily="Material Symbols Rounded")
-    looks_3_rounded = IconData(name="looks_3", fontFamily="Material Symbols Rounded")
-    looks_4_rounded = IconData(name="looks_4", fontFamily="Material Symbols Rounded")
-    looks_5_rounded = IconData(name="looks_5", fontFamily="Material Symbols Rounded")
-    looks_6_rounded = IconData(name="looks_6", fontFamily="Material Symbols Rounded")
-    looks_one_rounded = IconData(name="looks_one", fontFamily="Material Symbols Rounded")
-    looks_two_rounded = IconData(name="looks_two", fontFamily="Material Symbols Rounded")
-    loop_rounded = IconData(name="loop", fontFamily="Material Symbols Rounded")
-    loupe_rounded = IconData(name="loupe", fontFamily="Material Symbols Rounded")
-    low_density_rounded = IconData(name="low_density", fontFamily="Material Symbols Rounded")
-    low_priority_rounded = IconData(name="low_priority", fontFamily="Material Symbols Rounded")
-    lowercase_rounded = IconData(name="lowercase", fontFamily="Material Symbols Rounded")
-    loyalty_rounded = IconData(name="loyalty", fontFamily="Material Symbols Rounded")
-    lte_mobiledata_rounded = IconData(name="lte_mobiledata", fontFamily="Material Symbols Rounded")
-    lte_mobiledata_badge_rounded = IconData(name="lte_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    lte_plus_mobiledata_rounded = IconData(name="lte_plus_mobiledata", fontFamily="Material Symbols Rounded")
-    lte_plus_mobiledata_badge_rounded = IconData(name="lte_plus_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    luggage_rounded = IconData(name="luggage", fontFamily="Material Symbols Rounded")
-    lunch_dining_rounded = IconData(name="lunch_dining", fontFamily="Material Symbols Rounded")
-    lyrics_rounded = IconData(name="lyrics", fontFamily="Material Symbols Rounded")
-    macro_auto_rounded = IconData(name="macro_auto", fontFamily="Material Symbols Rounded")
-    macro_off_rounded = IconData(name="macro_off", fontFamily="Material Symbols Rounded")
-    magic_button_rounded = IconData(name="magic_button", fontFamily="Material Symbols Rounded")
-    magic_exchange_rounded = IconData(name="magic_exchange", fontFamily="Material Symbols Rounded")
-    magic_tether_rounded = IconData(name="magic_tether", fontFamily="Material Symbols Rounded")
-    magnification_large_rounded = IconData(name="magnification_large", fontFamily="Material Symbols Rounded")
-    magnification_small_rounded = IconData(name="magnification_small", fontFamily="Material Symbols Rounded")
-    magnify_docked_rounded = IconData(name="magnify_docked", fontFamily="Material Symbols Rounded")
-    magnify_fullscreen_rounded = IconData(name="magnify_fullscreen", fontFamily="Material Symbols Rounded")
-    mail_rounded = IconData(name="mail", fontFamily="Material Symbols Rounded")
-    mail_lock_rounded = IconData(name="mail_lock", fontFamily="Material Symbols Rounded")
-    mail_off_rounded = IconData(name="mail_off", fontFamily="Material Symbols Rounded")
-    mail_outline_rounded = IconData(name="mail_outline", fontFamily="Material Symbols Rounded")
-    male_rounded = IconData(name="male", fontFamily="Material Symbols Rounded")
-    man_rounded = IconData(name="man", fontFamily="Material Symbols Rounded")
-    man_2_rounded = IconData(name="man_2", fontFamily="Material Symbols Rounded")
-    man_3_rounded = IconData(name="man_3", fontFamily="Material Symbols Rounded")
-    man_4_rounded = IconData(name="man_4", fontFamily="Material Symbols Rounded")
-    manage_accounts_rounded = IconData(name="manage_accounts", fontFamily="Material Symbols Rounded")
-    manage_history_rounded = IconData(name="manage_history", fontFamily="Material Symbols Rounded")
-    manage_search_rounded = IconData(name="manage_search", fontFamily="Material Symbols Rounded")
-    manga_rounded = IconData(name="manga", fontFamily="Material Symbols Rounded")
-    manufacturing_rounded = IconData(name="manufacturing", fontFamily="Material Symbols Rounded")
-    map_rounded = IconData(name="map", fontFamily="Material Symbols Rounded")
-    map_search_rounded = IconData(name="map_search", fontFamily="Material Symbols Rounded")
-    maps_home_work_rounded = IconData(name="maps_home_work", fontFamily="Material Symbols Rounded")
-    maps_ugc_rounded = IconData(name="maps_ugc", fontFamily="Material Symbols Rounded")
-    margin_rounded = IconData(name="margin", fontFamily="Material Symbols Rounded")
-    mark_as_unread_rounded = IconData(name="mark_as_unread", fontFamily="Material Symbols Rounded")
-    mark_chat_read_rounded = IconData(name="mark_chat_read", fontFamily="Material Symbols Rounded")
-    mark_chat_unread_rounded = IconData(name="mark_chat_unread", fontFamily="Material Symbols Rounded")
-    mark_email_read_rounded = IconData(name="mark_email_read", fontFamily="Material Symbols Rounded")
-    mark_email_unread_rounded = IconData(name="mark_email_unread", fontFamily="Material Symbols Rounded")
-    mark_unread_chat_alt_rounded = IconData(name="mark_unread_chat_alt", fontFamily="Material Symbols Rounded")
-    markdown_rounded = IconData(name="markdown", fontFamily="Material Symbols Rounded")
-    markdown_copy_rounded = IconData(name="markdown_copy", fontFamily="Material Symbols Rounded")
-    markdown_paste_rounded = IconData(name="markdown_paste", fontFamily="Material Symbols Rounded")
-    markunread_rounded = IconData(name="markunread", fontFamily="Material Symbols Rounded")
-    markunread_mailbox_rounded = IconData(name="markunread_mailbox", fontFamily="Material Symbols Rounded")
-    masked_transitions_rounded = IconData(name="masked_transitions", fontFamily="Material Symbols Rounded")
-    masked_transitions_add_rounded = IconData(name="masked_transitions_add", fontFamily="Material Symbols Rounded")
-    masks_rounded = IconData(name="masks", fontFamily="Material Symbols Rounded")
-    match_case_rounded = IconData(name="match_case", fontFamily="Material Symbols Rounded")
-    match_case_off_rounded = IconData(name="match_case_off", fontFamily="Material Symbols Rounded")
-    match_word_rounded = IconData(name="match_word", fontFamily="Material Symbols Rounded")
-    matter_rounded = IconData(name="matter", fontFamily="Material Symbols Rounded")
-    maximize_rounded = IconData(name="maximize", fontFamily="Material Symbols Rounded")
-    measuring_tape_rounded = IconData(name="measuring_tape", fontFamily="Material Symbols Rounded")
-    media_bluetooth_off_rounded = IconData(name="media_bluetooth_off", fontFamily="Material Symbols Rounded")
-    media_bluetooth_on_rounded = IconData(name="media_bluetooth_on", fontFamily="Material Symbols Rounded")
-    media_link_rounded = IconData(name="media_link", fontFamily="Material Symbols Rounded")
-    media_output_rounded = IconData(name="media_output", fontFamily="Material Symbols Rounded")
-    media_output_off_rounded = IconData(name="media_output_off", fontFamily="Material Symbols Rounded")
-    mediation_rounded = IconData(name="mediation", fontFamily="Material Symbols Rounded")
-    medical_information_rounded = IconData(name="medical_information", fontFamily="Material Symbols Rounded")
-    medical_mask_rounded = IconData(name="medical_mask", fontFamily="Material Symbols Rounded")
-    medical_services_rounded = IconData(name="medical_services", fontFamily="Material Symbols Rounded")
-    medication_rounded = IconData(name="medication", fontFamily="Material Symbols Rounded")
-    medication_liquid_rounded = IconData(name="medication_liquid", fontFamily="Material Symbols Rounded")
-    meeting_room_rounded = IconData(name="meeting_room", fontFamily="Material Symbols Rounded")
-    memory_rounded = IconData(name="memory", fontFamily="Material Symbols Rounded")
-    memory_alt_rounded = IconData(name="memory_alt", fontFamily="Material Symbols Rounded")
-    menstrual_health_rounded = IconData(name="menstrual_health", fontFamily="Material Symbols Rounded")
-    menu_rounded = IconData(name="menu", fontFamily="Material Symbols Rounded")
-    menu_book_rounded = IconData(name="menu_book", fontFamily="Material Symbols Rounded")
-    menu_open_rounded = IconData(name="menu_open", fontFamily="Material Symbols Rounded")
-    merge_rounded = IconData(name="merge", fontFamily="Material Symbols Rounded")
-    merge_type_rounded = IconData(name="merge_type", fontFamily="Material Symbols Rounded")
-    message_rounded = IconData(name="message", fontFamily="Material Symbols Rounded")
-    metabolism_rounded = IconData(name="metabolism", fontFamily="Material Symbols Rounded")
-    metro_rounded = IconData(name="metro", fontFamily="Material Symbols Rounded")
-    mfg_nest_yale_lock_rounded = IconData(name="mfg_nest_yale_lock", fontFamily="Material Symbols Rounded")
-    mic_rounded = IconData(name="mic", fontFamily="Material Symbols Rounded")
-    mic_alert_rounded = IconData(name="mic_alert", fontFamily="Material Symbols Rounded")
-    mic_double_rounded = IconData(name="mic_double", fontFamily="Material Symbols Rounded")
-    mic_external_off_rounded = IconData(name="mic_external_off", fontFamily="Material Symbols Rounded")
-    mic_external_on_rounded = IconData(name="mic_external_on", fontFamily="Material Symbols Rounded")
-    mic_none_rounded = IconData(name="mic_none", fontFamily="Material Symbols Rounded")
-    mic_off_rounded = IconData(name="mic_off", fontFamily="Material Symbols Rounded")
-    microbiology_rounded = IconData(name="microbiology", fontFamily="Material Symbols Rounded")
-    microwave_rounded = IconData(name="microwave", fontFamily="Material Symbols Rounded")
-    microwave_gen_rounded = IconData(name="microwave_gen", fontFamily="Material Symbols Rounded")
-    military_tech_rounded = IconData(name="military_tech", fontFamily="Material Symbols Rounded")
-    mimo_rounded = IconData(name="mimo", fontFamily="Material Symbols Rounded")
-    mimo_disconnect_rounded = IconData(name="mimo_disconnect", fontFamily="Material Symbols Rounded")
-    mindfulness_rounded = IconData(name="mindfulness", fontFamily="Material Symbols Rounded")
-    minimize_rounded = IconData(name="minimize", fontFamily="Material Symbols Rounded")
-    minor_crash_rounded = IconData(name="minor_crash", fontFamily="Material Symbols Rounded")
-    mintmark_rounded = IconData(name="mintmark", fontFamily="Material Symbols Rounded")
-    missed_video_call_rounded = IconData(name="missed_video_call", fontFamily="Material Symbols Rounded")
-    missed_video_call_filled_rounded = IconData(name="missed_video_call_filled", fontFamily="Material Symbols Rounded")
-    missing_controller_rounded = IconData(name="missing_controller", fontFamily="Material Symbols Rounded")
-    mist_rounded = IconData(name="mist", fontFamily="Material Symbols Rounded")
-    mitre_rounded = IconData(name="mitre", fontFamily="Material Symbols Rounded")
-    mixture_med_rounded = IconData(name="mixture_med", fontFamily="Material Symbols Rounded")
-    mms_rounded = IconData(name="mms", fontFamily="Material Symbols Rounded")
-    mobile_friendly_rounded = IconData(name="mobile_friendly", fontFamily="Material Symbols Rounded")
-    mobile_hand_rounded = IconData(name="mobile_hand", fontFamily="Material Symbols Rounded")
-    mobile_hand_left_rounded = IconData(name="mobile_hand_left", fontFamily="Material Symbols Rounded")
-    mobile_hand_left_off_rounded = IconData(name="mobile_hand_left_off", fontFamily="Material Symbols Rounded")
-    mobile_hand_off_rounded = IconData(name="mobile_hand_off", fontFamily="Material Symbols Rounded")
-    mobile_loupe_rounded = IconData(name="mobile_loupe", fontFamily="Material Symbols Rounded")
-    mobile_off_rounded = IconData(name="mobile_off", fontFamily="Material Symbols Rounded")
-    mobile_screen_share_rounded = IconData(name="mobile_screen_share", fontFamily="Material Symbols Rounded")
-    mobile_screensaver_rounded = IconData(name="mobile_screensaver", fontFamily="Material Symbols Rounded")
-    mobile_sound_2_rounded = IconData(name="mobile_sound_2", fontFamily="Material Symbols Rounded")
-    mobile_speaker_rounded = IconData(name="mobile_speaker", fontFamily="Material Symbols Rounded")
-    mobiledata_off_rounded = IconData(name="mobiledata_off", fontFamily="Material Symbols Rounded")
-    mode_rounded = IconData(name="mode", fontFamily="Material Symbols Rounded")
-    mode_comment_rounded = IconData(name="mode_comment", fontFamily="Material Symbols Rounded")
-    mode_cool_rounded = IconData(name="mode_cool", fontFamily="Material Symbols Rounded")
-    mode_cool_off_rounded = IconData(name="mode_cool_off", fontFamily="Material Symbols Rounded")
-    mode_dual_rounded = IconData(name="mode_dual", fontFamily="Material Symbols Rounded")
-    mode_edit_rounded = IconData(name="mode_edit", fontFamily="Material Symbols Rounded")
-    mode_edit_outline_rounded = IconData(name="mode_edit_outline", fontFamily="Material Symbols Rounded")
-    mode_fan_rounded = IconData(name="mode_fan", fontFamily="Material Symbols Rounded")
-    mode_fan_off_rounded = IconData(name="mode_fan_off", fontFamily="Material Symbols Rounded")
-    mode_heat_rounded = IconData(name="mode_heat", fontFamily="Material Symbols Rounded")
-    mode_heat_cool_rounded = IconData(name="mode_heat_cool", fontFamily="Material Symbols Rounded")
-    mode_heat_off_rounded = IconData(name="mode_heat_off", fontFamily="Material Symbols Rounded")
-    mode_night_rounded = IconData(name="mode_night", fontFamily="Material Symbols Rounded")
-    mode_of_travel_rounded = IconData(name="mode_of_travel", fontFamily="Material Symbols Rounded")
-    mode_off_on_rounded = IconData(name="mode_off_on", fontFamily="Material Symbols Rounded")
-    mode_standby_rounded = IconData(name="mode_standby", fontFamily="Material Symbols Rounded")
-    model_training_rounded = IconData(name="model_training", fontFamily="Material Symbols Rounded")
-    modeling_rounded = IconData(name="modeling", fontFamily="Material Symbols Rounded")
-    monetization_on_rounded = IconData(name="monetization_on", fontFamily="Material Symbols Rounded")
-    money_rounded = IconData(name="money", fontFamily="Material Symbols Rounded")
-    money_bag_rounded = IconData(name="money_bag", fontFamily="Material Symbols Rounded")
-    money_off_rounded = IconData(name="money_off", fontFamily="Material Symbols Rounded")
-    money_off_csred_rounded = IconData(name="money_off_csred", fontFamily="Material Symbols Rounded")
-    monitor_rounded = IconData(name="monitor", fontFamily="Material Symbols Rounded")
-    monitor_heart_rounded = IconData(name="monitor_heart", fontFamily="Material Symbols Rounded")
-    monitor_weight_rounded = IconData(name="monitor_weight", fontFamily="Material Symbols Rounded")
-    monitor_weight_gain_rounded = IconData(name="monitor_weight_gain", fontFamily="Material Symbols Rounded")
-    monitor_weight_loss_rounded = IconData(name="monitor_weight_loss", fontFamily="Material Symbols Rounded")
-    monitoring_rounded = IconData(name="monitoring", fontFamily="Material Symbols Rounded")
-    monochrome_photos_rounded = IconData(name="monochrome_photos", fontFamily="Material Symbols Rounded")
-    monorail_rounded = IconData(name="monorail", fontFamily="Material Symbols Rounded")
-    mood_rounded = IconData(name="mood", fontFamily="Material Symbols Rounded")
-    mood_bad_rounded = IconData(name="mood_bad", fontFamily="Material Symbols Rounded")
-    moon_stars_rounded = IconData(name="moon_stars", fontFamily="Material Symbols Rounded")
-    mop_rounded = IconData(name="mop", fontFamily="Material Symbols Rounded")
-    moped_rounded = IconData(name="moped", fontFamily="Material Symbols Rounded")
-    more_rounded = IconData(name="more", fontFamily="Material Symbols Rounded")
-    more_down_rounded = IconData(name="more_down", fontFamily="Material Symbols Rounded")
-    more_horiz_rounded = IconData(name="more_horiz", fontFamily="Material Symbols Rounded")
-    more_time_rounded = IconData(name="more_time", fontFamily="Material Symbols Rounded")
-    more_up_rounded = IconData(name="more_up", fontFamily="Material Symbols Rounded")
-    more_vert_rounded = IconData(name="more_vert", fontFamily="Material Symbols Rounded")
-    mosque_rounded = IconData(name="mosque", fontFamily="Material Symbols Rounded")
-    motion_blur_rounded = IconData(name="motion_blur", fontFamily="Material Symbols Rounded")
-    motion_mode_rounded = IconData(name="motion_mode", fontFamily="Material Symbols Rounded")
-    motion_photos_auto_rounded = IconData(name="motion_photos_auto", fontFamily="Material Symbols Rounded")
-    motion_photos_off_rounded = IconData(name="motion_photos_off", fontFamily="Material Symbols Rounded")
-    motion_photos_on_rounded = IconData(name="motion_photos_on", fontFamily="Material Symbols Rounded")
-    motion_photos_pause_rounded = IconData(name="motion_photos_pause", fontFamily="Material Symbols Rounded")
-    motion_photos_paused_rounded = IconData(name="motion_photos_paused", fontFamily="Material Symbols Rounded")
-    motion_play_rounded = IconData(name="motion_play", fontFamily="Material Symbols Rounded")
-    motion_sensor_active_rounded = IconData(name="motion_sensor_active", fontFamily="Material Symbols Rounded")
-    motion_sensor_alert_rounded = IconData(name="motion_sensor_alert", fontFamily="Material Symbols Rounded")
-    motion_sensor_idle_rounded = IconData(name="motion_sensor_idle", fontFamily="Material Symbols Rounded")
-    motion_sensor_urgent_rounded = IconData(name="motion_sensor_urgent", fontFamily="Material Symbols Rounded")
-    motorcycle_rounded = IconData(name="motorcycle", fontFamily="Material Symbols Rounded")
-    mountain_flag_rounded = IconData(name="mountain_flag", fontFamily="Material Symbols Rounded")
-    mouse_rounded = IconData(name="mouse", fontFamily="Material Symbols Rounded")
-    mouse_lock_rounded = IconData(name="mouse_lock", fontFamily="Material Symbols Rounded")
-    mouse_lock_off_rounded = IconData(name="mouse_lock_off", fontFamily="Material Symbols Rounded")
-    move_rounded = IconData(name="move", fontFamily="Material Symbols Rounded")
-    move_down_rounded = IconData(name="move_down", fontFamily="Material Symbols Rounded")
-    move_group_rounded = IconData(name="move_group", fontFamily="Material Symbols Rounded")
-    move_item_rounded = IconData(name="move_item", fontFamily="Material Symbols Rounded")
-    move_location_rounded = IconData(name="move_location", fontFamily="Material Symbols Rounded")
-    move_selection_down_rounded = IconData(name="move_selection_down", fontFamily="Material Symbols Rounded")
-    move_selection_left_rounded = IconData(name="move_selection_left", fontFamily="Material Symbols Rounded")
-    move_selection_right_rounded = IconData(name="move_selection_right", fontFamily="Material Symbols Rounded")
-    move_selection_up_rounded = IconData(name="move_selection_up", fontFamily="Material Symbols Rounded")
-    move_to_inbox_rounded = IconData(name="move_to_inbox", fontFamily="Material Symbols Rounded")
-    move_up_rounded = IconData(name="move_up", fontFamily="Material Symbols Rounded")
-    moved_location_rounded = IconData(name="moved_location", fontFamily="Material Symbols Rounded")
-    movie_rounded = IconData(name="movie", fontFamily="Material Symbols Rounded")
-    movie_creation_rounded = IconData(name="movie_creation", fontFamily="Material Symbols Rounded")
-    movie_edit_rounded = IconData(name="movie_edit", fontFamily="Material Symbols Rounded")
-    movie_filter_rounded = IconData(name="movie_filter", fontFamily="Material Symbols Rounded")
-    movie_info_rounded = IconData(name="movie_info", fontFamily="Material Symbols Rounded")
-    movie_off_rounded = IconData(name="movie_off", fontFamily="Material Symbols Rounded")
-    moving_rounded = IconData(name="moving", fontFamily="Material Symbols Rounded")
-    moving_beds_rounded = IconData(name="moving_beds", fontFamily="Material Symbols Rounded")
-    moving_ministry_rounded = IconData(name="moving_ministry", fontFamily="Material Symbols Rounded")
-    mp_rounded = IconData(name="mp", fontFamily="Material Symbols Rounded")
-    multicooker_rounded = IconData(name="multicooker", fontFamily="Material Symbols Rounded")
-    multiline_chart_rounded = IconData(name="multiline_chart", fontFamily="Material Symbols Rounded")
-    multimodal_hand_eye_rounded = IconData(name="multimodal_hand_eye", fontFamily="Material Symbols Rounded")
-    multiple_airports_rounded = IconData(name="multiple_airports", fontFamily="Material Symbols Rounded")
-    multiple_stop_rounded = IconData(name="multiple_stop", fontFamily="Material Symbols Rounded")
-    museum_rounded = IconData(name="museum", fontFamily="Material Symbols Rounded")
-    music_cast_rounded = IconData(name="music_cast", fontFamily="Material Symbols Rounded")
-    music_note_rounded = IconData(name="music_note", fontFamily="Material Symbols Rounded")
-    music_note_add_rounded = IconData(name="music_note_add", fontFamily="Material Symbols Rounded")
-    music_off_rounded = IconData(name="music_off", fontFamily="Material Symbols Rounded")
-    music_video_rounded = IconData(name="music_video", fontFamily="Material Symbols Rounded")
-    my_location_rounded = IconData(name="my_location", fontFamily="Material Symbols Rounded")
-    mystery_rounded = IconData(name="mystery", fontFamily="Material Symbols Rounded")
-    nat_rounded = IconData(name="nat", fontFamily="Material Symbols Rounded")
-    nature_rounded = IconData(name="nature", fontFamily="Material Symbols Rounded")
-    nature_people_rounded = IconData(name="nature_people", fontFamily="Material Symbols Rounded")
-    navigate_before_rounded = IconData(name="navigate_before", fontFamily="Material Symbols Rounded")
-    navigate_next_rounded = IconData(name="navigate_next", fontFamily="Material Symbols Rounded")
-    navigation_rounded = IconData(name="navigation", fontFamily="Material Symbols Rounded")
-    near_me_rounded = IconData(name="near_me", fontFamily="Material Symbols Rounded")
-    near_me_disabled_rounded = IconData(name="near_me_disabled", fontFamily="Material Symbols Rounded")
-    nearby_rounded = IconData(name="nearby", fontFamily="Material Symbols Rounded")
-    nearby_error_rounded = IconData(name="nearby_error", fontFamily="Material Symbols Rounded")
-    nearby_off_rounded = IconData(name="nearby_off", fontFamily="Material Symbols Rounded")
-    nephrology_rounded = IconData(name="nephrology", fontFamily="Material Symbols Rounded")
-    nest_audio_rounded = IconData(name="nest_audio", fontFamily="Material Symbols Rounded")
-    nest_cam_floodlight_rounded = IconData(name="nest_cam_floodlight", fontFamily="Material Symbols Rounded")
-    nest_cam_indoor_rounded = IconData(name="nest_cam_indoor", fontFamily="Material Symbols Rounded")
-    nest_cam_iq_rounded = IconData(name="nest_cam_iq", fontFamily="Material Symbols Rounded")
-    nest_cam_iq_outdoor_rounded = IconData(name="nest_cam_iq_outdoor", fontFamily="Material Symbols Rounded")
-    nest_cam_magnet_mount_rounded = IconData(name="nest_cam_magnet_mount", fontFamily="Material Symbols Rounded")
-    nest_cam_outdoor_rounded = IconData(name="nest_cam_outdoor", fontFamily="Material Symbols Rounded")
-    nest_cam_stand_rounded = IconData(name="nest_cam_stand", fontFamily="Material Symbols Rounded")
-    nest_cam_wall_mount_rounded = IconData(name="nest_cam_wall_mount", fontFamily="Material Symbols Rounded")
-    nest_cam_wired_stand_rounded = IconData(name="nest_cam_wired_stand", fontFamily="Material Symbols Rounded")
-    nest_clock_farsight_analog_rounded = IconData(name="nest_clock_farsight_analog", fontFamily="Material Symbols Rounded")
-    nest_clock_farsight_digital_rounded = IconData(name="nest_clock_farsight_digital", fontFamily="Material Symbols Rounded")
-    nest_connect_rounded = IconData(name="nest_connect", fontFamily="Material Symbols Rounded")
-    nest_detect_rounded = IconData(name="nest_detect", fontFamily="Material Symbols Rounded")
-    nest_display_rounded = IconData(name="nest_display", fontFamily="Material Symbols Rounded")
-    nest_display_max_rounded = IconData(name="nest_display_max", fontFamily="Material Symbols Rounded")
-    nest_doorbell_visitor_rounded = IconData(name="nest_doorbell_visitor", fontFamily="Material Symbols Rounded")
-    nest_eco_leaf_rounded = IconData(name="nest_eco_leaf", fontFamily="Material Symbols Rounded")
-    nest_farsight_weather_rounded = IconData(name="nest_farsight_weather", fontFamily="Material Symbols Rounded")
-    nest_found_savings_rounded = IconData(name="nest_found_savings", fontFamily="Material Symbols Rounded")
-    nest_gale_wifi_rounded = IconData(name="nest_gale_wifi", fontFamily="Material Symbols Rounded")
-    nest_heat_link_e_rounded = IconData(name="nest_heat_link_e", fontFamily="Material Symbols Rounded")
-    nest_heat_link_gen_3_rounded = IconData(name="nest_heat_link_gen_3", fontFamily="Material Symbols Rounded")
-    nest_hello_doorbell_rounded = IconData(name="nest_hello_doorbell", fontFamily="Material Symbols Rounded")
-    nest_locator_tag_rounded = IconData(name="nest_locator_tag", fontFamily="Material Symbols Rounded")
-    nest_mini_rounded = IconData(name="nest_mini", fontFamily="Material Symbols Rounded")
-    nest_multi_room_rounded = IconData(name="nest_multi_room", fontFamily="Material Symbols Rounded")
-    nest_protect_rounded = IconData(name="nest_protect", fontFamily="Material Symbols Rounded")
-    nest_remote_rounded = IconData(name="nest_remote", fontFamily="Material Symbols Rounded")
-    nest_remote_comfort_sensor_rounded = IconData(name="nest_remote_comfort_sensor", fontFamily="Material Symbols Rounded")
-    nest_secure_alarm_rounded = IconData(name="nest_secure_alarm", fontFamily="Material Symbols Rounded")
-    nest_sunblock_rounded = IconData(name="nest_sunblock", fontFamily="Material Symbols Rounded")
-    nest_tag_rounded = IconData(name="nest_tag", fontFamily="Material Symbols Rounded")
-    nest_thermostat_rounded = IconData(name="nest_thermostat", fontFamily="Material Symbols Rounded")
-    nest_thermostat_e_eu_rounded = IconData(name="nest_thermostat_e_eu", fontFamily="Material Symbols Rounded")
-    nest_thermostat_gen_3_rounded = IconData(name="nest_thermostat_gen_3", fontFamily="Material Symbols Rounded")
-    nest_thermostat_sensor_rounded = IconData(name="nest_thermostat_sensor", fontFamily="Material Symbols Rounded")
-    nest_thermostat_sensor_eu_rounded = IconData(name="nest_thermostat_sensor_eu", fontFamily="Material Symbols Rounded")
-    nest_thermostat_zirconium_eu_rounded = IconData(name="nest_thermostat_zirconium_eu", fontFamily="Material Symbols Rounded")
-    nest_true_radiant_rounded = IconData(name="nest_true_radiant", fontFamily="Material Symbols Rounded")
-    nest_wake_on_approach_rounded = IconData(name="nest_wake_on_approach", fontFamily="Material Symbols Rounded")
-    nest_wake_on_press_rounded = IconData(name="nest_wake_on_press", fontFamily="Material Symbols Rounded")
-    nest_wifi_gale_rounded = IconData(name="nest_wifi_gale", fontFamily="Material Symbols Rounded")
-    nest_wifi_mistral_rounded = IconData(name="nest_wifi_mistral", fontFamily="Material Symbols Rounded")
-    nest_wifi_point_rounded = IconData(name="nest_wifi_point", fontFamily="Material Symbols Rounded")
-    nest_wifi_point_vento_rounded = IconData(name="nest_wifi_point_vento", fontFamily="Material Symbols Rounded")
-    nest_wifi_pro_rounded = IconData(name="nest_wifi_pro", fontFamily="Material Symbols Rounded")
-    nest_wifi_pro_2_rounded = IconData(name="nest_wifi_pro_2", fontFamily="Material Symbols Rounded")
-    nest_wifi_router_rounded = IconData(name="nest_wifi_router", fontFamily="Material Symbols Rounded")
-    network_cell_rounded = IconData(name="network_cell", fontFamily="Material Symbols Rounded")
-    network_check_rounded = IconData(name="network_check", fontFamily="Material Symbols Rounded")
-    network_intel_node_rounded = IconData(name="network_intel_node", fontFamily="Material Symbols Rounded")
-    network_intelligence_rounded = IconData(name="network_intelligence", fontFamily="Material Symbols Rounded")
-    network_intelligence_history_rounded = IconData(name="network_intelligence_history", fontFamily="Material Symbols Rounded")
-    network_intelligence_update_rounded = IconData(name="network_intelligence_update", fontFamily="Material Symbols Rounded")
-    network_locked_rounded = IconData(name="network_locked", fontFamily="Material Symbols Rounded")
-    network_manage_rounded = IconData(name="network_manage", fontFamily="Material Symbols Rounded")
-    network_node_rounded = IconData(name="network_node", fontFamily="Material Symbols Rounded")
-    network_ping_rounded = IconData(name="network_ping", fontFamily="Material Symbols Rounded")
-    network_wifi_rounded = IconData(name="network_wifi", fontFamily="Material Symbols Rounded")
-    network_wifi_1_bar_rounded = IconData(name="network_wifi_1_bar", fontFamily="Material Symbols Rounded")
-    network_wifi_1_bar_locked_rounded = IconData(name="network_wifi_1_bar_locked", fontFamily="Material Symbols Rounded")
-    network_wifi_2_bar_rounded = IconData(name="network_wifi_2_bar", fontFamily="Material Symbols Rounded")
-    network_wifi_2_bar_locked_rounded = IconData(name="network_wifi_2_bar_locked", fontFamily="Material Symbols Rounded")
-    network_wifi_3_bar_rounded = IconData(name="network_wifi_3_bar", fontFamily="Material Symbols Rounded")
-    network_wifi_3_bar_locked_rounded = IconData(name="network_wifi_3_bar_locked", fontFamily="Material Symbols Rounded")
-    network_wifi_locked_rounded = IconData(name="network_wifi_locked", fontFamily="Material Symbols Rounded")
-    neurology_rounded = IconData(name="neurology", fontFamily="Material Symbols Rounded")
-    new_label_rounded = IconData(name="new_label", fontFamily="Material Symbols Rounded")
-    new_releases_rounded = IconData(name="new_releases", fontFamily="Material Symbols Rounded")
-    new_window_rounded = IconData(name="new_window", fontFamily="Material Symbols Rounded")
-    news_rounded = IconData(name="news", fontFamily="Material Symbols Rounded")
-    newsmode_rounded = IconData(name="newsmode", fontFamily="Material Symbols Rounded")
-    newspaper_rounded = IconData(name="newspaper", fontFamily="Material Symbols Rounded")
-    newsstand_rounded = IconData(name="newsstand", fontFamily="Material Symbols Rounded")
-    next_plan_rounded = IconData(name="next_plan", fontFamily="Material Symbols Rounded")
-    next_week_rounded = IconData(name="next_week", fontFamily="Material Symbols Rounded")
-    nfc_rounded = IconData(name="nfc", fontFamily="Material Symbols Rounded")
-    nfc_off_rounded = IconData(name="nfc_off", fontFamily="Material Symbols Rounded")
-    night_shelter_rounded = IconData(name="night_shelter", fontFamily="Material Symbols Rounded")
-    night_sight_auto_rounded = IconData(name="night_sight_auto", fontFamily="Material Symbols Rounded")
-    night_sight_auto_off_rounded = IconData(name="night_sight_auto_off", fontFamily="Material Symbols Rounded")
-    night_sight_max_rounded = IconData(name="night_sight_max", fontFamily="Material Symbols Rounded")
-    nightlife_rounded = IconData(name="nightlife", fontFamily="Material Symbols Rounded")
-    nightlight_rounded = IconData(name="nightlight", fontFamily="Material Symbols Rounded")
-    nightlight_round_rounded = IconData(name="nightlight_round", fontFamily="Material Symbols Rounded")
-    nights_stay_rounded = IconData(name="nights_stay", fontFamily="Material Symbols Rounded")
-    no_accounts_rounded = IconData(name="no_accounts", fontFamily="Material Symbols Rounded")
-    no_adult_content_rounded = IconData(name="no_adult_content", fontFamily="Material Symbols Rounded")
-    no_backpack_rounded = IconData(name="no_backpack", fontFamily="Material Symbols Rounded")
-    no_crash_rounded = IconData(name="no_crash", fontFamily="Material Symbols Rounded")
-    no_drinks_rounded = IconData(name="no_drinks", fontFamily="Material Symbols Rounded")
-    no_encryption_rounded = IconData(name="no_encryption", fontFamily="Material Symbols Rounded")
-    no_encryption_gmailerrorred_rounded = IconData(name="no_encryption_gmailerrorred", fontFamily="Material Symbols Rounded")
-    no_flash_rounded = IconData(name="no_flash", fontFamily="Material Symbols Rounded")
-    no_food_rounded = IconData(name="no_food", fontFamily="Material Symbols Rounded")
-    no_luggage_rounded = IconData(name="no_luggage", fontFamily="Material Symbols Rounded")
-    no_meals_rounded = IconData(name="no_meals", fontFamily="Material Symbols Rounded")
-    no_meeting_room_rounded = IconData(name="no_meeting_room", fontFamily="Material Symbols Rounded")
-    no_photography_rounded = IconData(name="no_photography", fontFamily="Material Symbols Rounded")
-    no_sim_rounded = IconData(name="no_sim", fontFamily="Material Symbols Rounded")
-    no_sound_rounded = IconData(name="no_sound", fontFamily="Material Symbols Rounded")
-    no_stroller_rounded = IconData(name="no_stroller", fontFamily="Material Symbols Rounded")
-    no_transfer_rounded = IconData(name="no_transfer", fontFamily="Material Symbols Rounded")
-    noise_aware_rounded = IconData(name="noise_aware", fontFamily="Material Symbols Rounded")
-    noise_control_off_rounded = IconData(name="noise_control_off", fontFamily="Material Symbols Rounded")
-    noise_control_on_rounded = IconData(name="noise_control_on", fontFamily="Material Symbols Rounded")
-    nordic_walking_rounded = IconData(name="nordic_walking", fontFamily="Material Symbols Rounded")
-    north_rounded = IconData(name="north", fontFamily="Material Symbols Rounded")
-    north_east_rounded = IconData(name="north_east", fontFamily="Material Symbols Rounded")
-    north_west_rounded = IconData(name="north_west", fontFamily="Material Symbols Rounded")
-    not_accessible_rounded = IconData(name="not_accessible", fontFamily="Material Symbols Rounded")
-    not_accessible_forward_rounded = IconData(name="not_accessible_forward", fontFamily="Material Symbols Rounded")
-    not_interested_rounded = IconData(name="not_interested", fontFamily="Material Symbols Rounded")
-    not_listed_location_rounded = IconData(name="not_listed_location", fontFamily="Material Symbols Rounded")
-    not_started_rounded = IconData(name="not_started", fontFamily="Material Symbols Rounded")
-    note_rounded = IconData(name="note", fontFamily="Material Symbols Rounded")
-    note_add_rounded = IconData(name="note_add", fontFamily="Material Symbols Rounded")
-    note_alt_rounded = IconData(name="note_alt", fontFamily="Material Symbols Rounded")
-    note_stack_rounded = IconData(name="note_stack", fontFamily="Material Symbols Rounded")
-    note_stack_add_rounded = IconData(name="note_stack_add", fontFamily="Material Symbols Rounded")
-    notes_rounded = IconData(name="notes", fontFamily="Material Symbols Rounded")
-    notification_add_rounded = IconData(name="notification_add", fontFamily="Material Symbols Rounded")
-    notification_important_rounded = IconData(name="notification_important", fontFamily="Material Symbols Rounded")
-    notification_multiple_rounded = IconData(name="notification_multiple", fontFamily="Material Symbols Rounded")
-    notification_settings_rounded = IconData(name="notification_settings", fontFamily="Material Symbols Rounded")
-    notification_sound_rounded = IconData(name="notification_sound", fontFamily="Material Symbols Rounded")
-    notifications_rounded = IconData(name="notifications", fontFamily="Material Symbols Rounded")
-    notifications_active_rounded = IconData(name="notifications_active", fontFamily="Material Symbols Rounded")
-    notifications_none_rounded = IconData(name="notifications_none", fontFamily="Material Symbols Rounded")
-    notifications_off_rounded = IconData(name="notifications_off", fontFamily="Material Symbols Rounded")
-    notifications_paused_rounded = IconData(name="notifications_paused", fontFamily="Material Symbols Rounded")
-    notifications_unread_rounded = IconData(name="notifications_unread", fontFamily="Material Symbols Rounded")
-    numbers_rounded = IconData(name="numbers", fontFamily="Material Symbols Rounded")
-    nutrition_rounded = IconData(name="nutrition", fontFamily="Material Symbols Rounded")
-    ods_rounded = IconData(name="ods", fontFamily="Material Symbols Rounded")
-    odt_rounded = IconData(name="odt", fontFamily="Material Symbols Rounded")
-    offline_bolt_rounded = IconData(name="offline_bolt", fontFamily="Material Symbols Rounded")
-    offline_pin_rounded = IconData(name="offline_pin", fontFamily="Material Symbols Rounded")
-    offline_pin_off_rounded = IconData(name="offline_pin_off", fontFamily="Material Symbols Rounded")
-    offline_share_rounded = IconData(name="offline_share", fontFamily="Material Symbols Rounded")
-    oil_barrel_rounded = IconData(name="oil_barrel", fontFamily="Material Symbols Rounded")
-    on_device_training_rounded = IconData(name="on_device_training", fontFamily="Material Symbols Rounded")
-    on_hub_device_rounded = IconData(name="on_hub_device", fontFamily="Material Symbols Rounded")
-    oncology_rounded = IconData(name="oncology", fontFamily="Material Symbols Rounded")
-    ondemand_video_rounded = IconData(name="ondemand_video", fontFamily="Material Symbols Rounded")
-    online_prediction_rounded = IconData(name="online_prediction", fontFamily="Material Symbols Rounded")
-    onsen_rounded = IconData(name="onsen", fontFamily="Material Symbols Rounded")
-    opacity_rounded = IconData(name="opacity", fontFamily="Material Symbols Rounded")
-    open_in_browser_rounded = IconData(name="open_in_browser", fontFamily="Material Symbols Rounded")
-    open_in_full_rounded = IconData(name="open_in_full", fontFamily="Material Symbols Rounded")
-    open_in_new_rounded = IconData(name="open_in_new", fontFamily="Material Symbols Rounded")
-    open_in_new_down_rounded = IconData(name="open_in_new_down", fontFamily="Material Symbols Rounded")
-    open_in_new_off_rounded = IconData(name="open_in_new_off", fontFamily="Material Symbols Rounded")
-    open_in_phone_rounded = IconData(name="open_in_phone", fontFamily="Material Symbols Rounded")
-    open_jam_rounded = IconData(name="open_jam", fontFamily="Material Symbols Rounded")
-    open_run_rounded = IconData(name="open_run", fontFamily="Material Symbols Rounded")
-    open_with_rounded = IconData(name="open_with", fontFamily="Material Symbols Rounded")
-    ophthalmology_rounded = IconData(name="ophthalmology", fontFamily="Material Symbols Rounded")
-    oral_disease_rounded = IconData(name="oral_disease", fontFamily="Material Symbols Rounded")
-    orbit_rounded = IconData(name="orbit", fontFamily="Material Symbols Rounded")
-    order_approve_rounded = IconData(name="order_approve", fontFamily="Material Symbols Rounded")
-    order_play_rounded = IconData(name="order_play", fontFamily="Material Symbols Rounded")
-    orders_rounded = IconData(name="orders", fontFamily="Material Symbols Rounded")
-    orthopedics_rounded = IconData(name="orthopedics", fontFamily="Material Symbols Rounded")
-    other_admission_rounded = IconData(name="other_admission", fontFamily="Material Symbols Rounded")
-    other_houses_rounded = IconData(name="other_houses", fontFamily="Material Symbols Rounded")
-    outbound_rounded = IconData(name="outbound", fontFamily="Material Symbols Rounded")
-    outbox_rounded = IconData(name="outbox", fontFamily="Material Symbols Rounded")
-    outbox_alt_rounded = IconData(name="outbox_alt", fontFamily="Material Symbols Rounded")
-    outdoor_garden_rounded = IconData(name="outdoor_garden", fontFamily="Material Symbols Rounded")
-    outdoor_grill_rounded = IconData(name="outdoor_grill", fontFamily="Material Symbols Rounded")
-    outgoing_mail_rounded = IconData(name="outgoing_mail", fontFamily="Material Symbols Rounded")
-    outlet_rounded = IconData(name="outlet", fontFamily="Material Symbols Rounded")
-    outlined_flag_rounded = IconData(name="outlined_flag", fontFamily="Material Symbols Rounded")
-    outpatient_rounded = IconData(name="outpatient", fontFamily="Material Symbols Rounded")
-    outpatient_med_rounded = IconData(name="outpatient_med", fontFamily="Material Symbols Rounded")
-    output_rounded = IconData(name="output", fontFamily="Material Symbols Rounded")
-    output_circle_rounded = IconData(name="output_circle", fontFamily="Material Symbols Rounded")
-    oven_rounded = IconData(name="oven", fontFamily="Material Symbols Rounded")
-    oven_gen_rounded = IconData(name="oven_gen", fontFamily="Material Symbols Rounded")
-    overview_rounded = IconData(name="overview", fontFamily="Material Symbols Rounded")
-    overview_key_rounded = IconData(name="overview_key", fontFamily="Material Symbols Rounded")
-    owl_rounded = IconData(name="owl", fontFamily="Material Symbols Rounded")
-    oxygen_saturation_rounded = IconData(name="oxygen_saturation", fontFamily="Material Symbols Rounded")
-    p2p_rounded = IconData(name="p2p", fontFamily="Material Symbols Rounded")
-    pace_rounded = IconData(name="pace", fontFamily="Material Symbols Rounded")
-    pacemaker_rounded = IconData(name="pacemaker", fontFamily="Material Symbols Rounded")
-    package_rounded = IconData(name="package", fontFamily="Material Symbols Rounded")
-    package_2_rounded = IconData(name="package_2", fontFamily="Material Symbols Rounded")
-    padding_rounded = IconData(name="padding", fontFamily="Material Symbols Rounded")
-    page_control_rounded = IconData(name="page_control", fontFamily="Material Symbols Rounded")
-    page_footer_rounded = IconData(name="page_footer", fontFamily="Material Symbols Rounded")
-    page_header_rounded = IconData(name="page_header", fontFamily="Material Symbols Rounded")
-    page_info_rounded = IconData(name="page_info", fontFamily="Material Symbols Rounded")
-    pageless_rounded = IconData(name="pageless", fontFamily="Material Symbols Rounded")
-    pages_rounded = IconData(name="pages", fontFamily="Material Symbols Rounded")
-    pageview_rounded = IconData(name="pageview", fontFamily="Material Symbols Rounded")
-    paid_rounded = IconData(name="paid", fontFamily="Material Symbols Rounded")
-    palette_rounded = IconData(name="palette", fontFamily="Material Symbols Rounded")
-    pallet_rounded = IconData(name="pallet", fontFamily="Material Symbols Rounded")
-    pan_tool_rounded = IconData(name="pan_tool", fontFamily="Material Symbols Rounded")
-    pan_tool_alt_rounded = IconData(name="pan_tool_alt", fontFamily="Material Symbols Rounded")
-    pan_zoom_rounded = IconData(name="pan_zoom", fontFamily="Material Symbols Rounded")
-    panorama_rounded = IconData(name="panorama", fontFamily="Material Symbols Rounded")
-    panorama_fish_eye_rounded = IconData(name="panorama_fish_eye", fontFamily="Material Symbols Rounded")
-    panorama_horizontal_rounded = IconData(name="panorama_horizontal", fontFamily="Material Symbols Rounded")
-    panorama_photosphere_rounded = IconData(name="panorama_photosphere", fontFamily="Material Symbols Rounded")
-    panorama_vertical_rounded = IconData(name="panorama_vertical", fontFamily="Material Symbols Rounded")
-    panorama_wide_angle_rounded = IconData(name="panorama_wide_angle", fontFamily="Material Symbols Rounded")
-    paragliding_rounded = IconData(name="paragliding", fontFamily="Material Symbols Rounded")
-    park_rounded = IconData(name="park", fontFamily="Material Symbols Rounded")
-    partly_cloudy_day_rounded = IconData(name="partly_cloudy_day", fontFamily="Material Symbols Rounded")
-    partly_cloudy_night_rounded = IconData(name="partly_cloudy_night", fontFamily="Material Symbols Rounded")
-    partner_exchange_rounded = IconData(name="partner_exchange", fontFamily="Material Symbols Rounded")
-    partner_reports_rounded = IconData(name="partner_reports", fontFamily="Material Symbols Rounded")
-    party_mode_rounded = IconData(name="party_mode", fontFamily="Material Symbols Rounded")
-    passkey_rounded = IconData(name="passkey", fontFamily="Material Symbols Rounded")
-    password_rounded = IconData(name="password", fontFamily="Material Symbols Rounded")
-    password_2_rounded = IconData(name="password_2", fontFamily="Material Symbols Rounded")
-    password_2_off_rounded = IconData(name="password_2_off", fontFamily="Material Symbols Rounded")
-    patient_list_rounded = IconData(name="patient_list", fontFamily="Material Symbols Rounded")
-    pattern_rounded = IconData(name="pattern", fontFamily="Material Symbols Rounded")
-    pause_rounded = IconData(name="pause", fontFamily="Material Symbols Rounded")
-    pause_circle_rounded = IconData(name="pause_circle", fontFamily="Material Symbols Rounded")
-    pause_circle_filled_rounded = IconData(name="pause_circle_filled", fontFamily="Material Symbols Rounded")
-    pause_circle_outline_rounded = IconData(name="pause_circle_outline", fontFamily="Material Symbols Rounded")
-    pause_presentation_rounded = IconData(name="pause_presentation", fontFamily="Material Symbols Rounded")
-    payment_rounded = IconData(name="payment", fontFamily="Material Symbols Rounded")
-    payments_rounded = IconData(name="payments", fontFamily="Material Symbols Rounded")
-    pedal_bike_rounded = IconData(name="pedal_bike", fontFamily="Material Symbols Rounded")
-    pediatrics_rounded = IconData(name="pediatrics", fontFamily="Material Symbols Rounded")
-    pen_size_1_rounded = IconData(name="pen_size_1", fontFamily="Material Symbols Rounded")
-    pen_size_2_rounded = IconData(name="pen_size_2", fontFamily="Material Symbols Rounded")
-    pen_size_3_rounded = IconData(name="pen_size_3", fontFamily="Material Symbols Rounded")
-    pen_size_4_rounded = IconData(name="pen_size_4", fontFamily="Material Symbols Rounded")
-    pen_size_5_rounded = IconData(name="pen_size_5", fontFamily="Material Symbols Rounded")
-    pending_rounded = IconData(name="pending", fontFamily="Material Symbols Rounded")
-    pending_actions_rounded = IconData(name="pending_actions", fontFamily="Material Symbols Rounded")
-    pentagon_rounded = IconData(name="pentagon", fontFamily="Material Symbols Rounded")
-    people_rounded = IconData(name="people", fontFamily="Material Symbols Rounded")
-    people_alt_rounded = IconData(name="people_alt", fontFamily="Material Symbols Rounded")
-    people_outline_rounded = IconData(name="people_outline", fontFamily="Material Symbols Rounded")
-    percent_rounded = IconData(name="percent", fontFamily="Material Symbols Rounded")
-    performance_max_rounded = IconData(name="performance_max", fontFamily="Material Symbols Rounded")
-    pergola_rounded = IconData(name="pergola", fontFamily="Material Symbols Rounded")
-    perm_camera_mic_rounded = IconData(name="perm_camera_mic", fontFamily="Material Symbols Rounded")
-    perm_contact_calendar_rounded = IconData(name="perm_contact_calendar", fontFamily="Material Symbols Rounded")
-    perm_data_setting_rounded = IconData(name="perm_data_setting", fontFamily="Material Symbols Rounded")
-    perm_device_information_rounded = IconData(name="perm_device_information", fontFamily="Material Symbols Rounded")
-    perm_identity_rounded = IconData(name="perm_identity", fontFamily="Material Symbols Rounded")
-    perm_media_rounded = IconData(name="perm_media", fontFamily="Material Symbols Rounded")
-    perm_phone_msg_rounded = IconData(name="perm_phone_msg", fontFamily="Material Symbols Rounded")
-    perm_scan_wifi_rounded = IconData(name="perm_scan_wifi", fontFamily="Material Symbols Rounded")
-    person_rounded = IconData(name="person", fontFamily="Material Symbols Rounded")
-    person_2_rounded = IconData(name="person_2", fontFamily="Material Symbols Rounded")
-    person_3_rounded = IconData(name="person_3", fontFamily="Material Symbols Rounded")
-    person_4_rounded = IconData(name="person_4", fontFamily="Material Symbols Rounded")
-    person_add_rounded = IconData(name="person_add", fontFamily="Material Symbols Rounded")
-    person_add_alt_rounded = IconData(name="person_add_alt", fontFamily="Material Symbols Rounded")
-    person_add_disabled_rounded = IconData(name="person_add_disabled", fontFamily="Material Symbols Rounded")
-    person_alert_rounded = IconData(name="person_alert", fontFamily="Material Symbols Rounded")
-    person_apron_rounded = IconData(name="person_apron", fontFamily="Material Symbols Rounded")
-    person_book_rounded = IconData(name="person_book", fontFamily="Material Symbols Rounded")
-    person_cancel_rounded = IconData(name="person_cancel", fontFamily="Material Symbols Rounded")
-    person_celebrate_rounded = IconData(name="person_celebrate", fontFamily="Material Symbols Rounded")
-    person_check_rounded = IconData(name="person_check", fontFamily="Material Symbols Rounded")
-    person_edit_rounded = IconData(name="person_edit", fontFamily="Material Symbols Rounded")
-    person_filled_rounded = IconData(name="person_filled", fontFamily="Material Symbols Rounded")
-    person_off_rounded = IconData(name="person_off", fontFamily="Material Symbols Rounded")
-    person_outline_rounded = IconData(name="person_outline", fontFamily="Material Symbols Rounded")
-    person_pin_rounded = IconData(name="person_pin", fontFamily="Material Symbols Rounded")
-    person_pin_circle_rounded = IconData(name="person_pin_circle", fontFamily="Material Symbols Rounded")
-    person_play_rounded = IconData(name="person_play", fontFamily="Material Symbols Rounded")
-    person_raised_hand_rounded = IconData(name="person_raised_hand", fontFamily="Material Symbols Rounded")
-    person_remove_rounded = IconData(name="person_remove", fontFamily="Material Symbols Rounded")
-    person_search_rounded = IconData(name="person_search", fontFamily="Material Symbols Rounded")
-    person_shield_rounded = IconData(name="person_shield", fontFamily="Material Symbols Rounded")
-    personal_bag_rounded = IconData(name="personal_bag", fontFamily="Material Symbols Rounded")
-    personal_bag_off_rounded = IconData(name="personal_bag_off", fontFamily="Material Symbols Rounded")
-    personal_bag_question_rounded = IconData(name="personal_bag_question", fontFamily="Material Symbols Rounded")
-    personal_injury_rounded = IconData(name="personal_injury", fontFamily="Material Symbols Rounded")
-    personal_places_rounded = IconData(name="personal_places", fontFamily="Material Symbols Rounded")
-    personal_video_rounded = IconData(name="personal_video", fontFamily="Material Symbols Rounded")
-    pest_control_rounded = IconData(name="pest_control", fontFamily="Material Symbols Rounded")
-    pest_control_rodent_rounded = IconData(name="pest_control_rodent", fontFamily="Material Symbols Rounded")
-    pet_supplies_rounded = IconData(name="pet_supplies", fontFamily="Material Symbols Rounded")
-    pets_rounded = IconData(name="pets", fontFamily="Material Symbols Rounded")
-    phishing_rounded = IconData(name="phishing", fontFamily="Material Symbols Rounded")
-    phone_rounded = IconData(name="phone", fontFamily="Material Symbols Rounded")
-    phone_alt_rounded = IconData(name="phone_alt", fontFamily="Material Symbols Rounded")
-    phone_android_rounded = IconData(name="phone_android", fontFamily="Material Symbols Rounded")
-    phone_bluetooth_speaker_rounded = IconData(name="phone_bluetooth_speaker", fontFamily="Material Symbols Rounded")
-    phone_callback_rounded = IconData(name="phone_callback", fontFamily="Material Symbols Rounded")
-    phone_disabled_rounded = IconData(name="phone_disabled", fontFamily="Material Symbols Rounded")
-    phone_enabled_rounded = IconData(name="phone_enabled", fontFamily="Material Symbols Rounded")
-    phone_forwarded_rounded = IconData(name="phone_forwarded", fontFamily="Material Symbols Rounded")
-    phone_in_talk_rounded = IconData(name="phone_in_talk", fontFamily="Material Symbols Rounded")
-    phone_iphone_rounded = IconData(name="phone_iphone", fontFamily="Material Symbols Rounded")
-    phone_locked_rounded = IconData(name="phone_locked", fontFamily="Material Symbols Rounded")
-    phone_missed_rounded = IconData(name="phone_missed", fontFamily="Material Symbols Rounded")
-    phone_paused_rounded = IconData(name="phone_paused", fontFamily="Material Symbols Rounded")
-    phonelink_rounded = IconData(name="phonelink", fontFamily="Material Symbols Rounded")
-    phonelink_erase_rounded = IconData(name="phonelink_erase", fontFamily="Material Symbols Rounded")
-    phonelink_lock_rounded = IconData(name="phonelink_lock", fontFamily="Material Symbols Rounded")
-    phonelink_off_rounded = IconData(name="phonelink_off", fontFamily="Material Symbols Rounded")
-    phonelink_ring_rounded = IconData(name="phonelink_ring", fontFamily="Material Symbols Rounded")
-    phonelink_ring_off_rounded = IconData(name="phonelink_ring_off", fontFamily="Material Symbols Rounded")
-    phonelink_setup_rounded = IconData(name="phonelink_setup", fontFamily="Material Symbols Rounded")
-    photo_rounded = IconData(name="photo", fontFamily="Material Symbols Rounded")
-    photo_album_rounded = IconData(name="photo_album", fontFamily="Material Symbols Rounded")
-    photo_auto_merge_rounded = IconData(name="photo_auto_merge", fontFamily="Material Symbols Rounded")
-    photo_camera_rounded = IconData(name="photo_camera", fontFamily="Material Symbols Rounded")
-    photo_camera_back_rounded = IconData(name="photo_camera_back", fontFamily="Material Symbols Rounded")
-    photo_camera_front_rounded = IconData(name="photo_camera_front", fontFamily="Material Symbols Rounded")
-    photo_filter_rounded = IconData(name="photo_filter", fontFamily="Material Symbols Rounded")
-    photo_frame_rounded = IconData(name="photo_frame", fontFamily="Material Symbols Rounded")
-    photo_library_rounded = IconData(name="photo_library", fontFamily="Material Symbols Rounded")
-    photo_prints_rounded = IconData(name="photo_prints", fontFamily="Material Symbols Rounded")
-    photo_size_select_actual_rounded = IconData(name="photo_size_select_actual", fontFamily="Material Symbols Rounded")
-    photo_size_select_large_rounded = IconData(name="photo_size_select_large", fontFamily="Material Symbols Rounded")
-    photo_size_select_small_rounded = IconData(name="photo_size_select_small", fontFamily="Material Symbols Rounded")
-    php_rounded = IconData(name="php", fontFamily="Material Symbols Rounded")
-    physical_therapy_rounded = IconData(name="physical_therapy", fontFamily="Material Symbols Rounded")
-    piano_rounded = IconData(name="piano", fontFamily="Material Symbols Rounded")
-    piano_off_rounded = IconData(name="piano_off", fontFamily="Material Symbols Rounded")
-    picture_as_pdf_rounded = IconData(name="picture_as_pdf", fontFamily="Material Symbols Rounded")
-    picture_in_picture_rounded = IconData(name="picture_in_picture", fontFamily="Material Symbols Rounded")
-    picture_in_picture_alt_rounded = IconData(name="picture_in_picture_alt", fontFamily="Material Symbols Rounded")
-    picture_in_picture_center_rounded = IconData(name="picture_in_picture_center", fontFamily="Material Symbols Rounded")
-    picture_in_picture_large_rounded = IconData(name="picture_in_picture_large", fontFamily="Material Symbols Rounded")
-    picture_in_picture_medium_rounded = IconData(name="picture_in_picture_medium", fontFamily="Material Symbols Rounded")
-    picture_in_picture_mobile_rounded = IconData(name="picture_in_picture_mobile", fontFamily="Material Symbols Rounded")
-    picture_in_picture_off_rounded = IconData(name="picture_in_picture_off", fontFamily="Material Symbols Rounded")
-    picture_in_picture_small_rounded = IconData(name="picture_in_picture_small", fontFamily="Material Symbols Rounded")
-    pie_chart_rounded = IconData(name="pie_chart", fontFamily="Material Symbols Rounded")
-    pie_chart_filled_rounded = IconData(name="pie_chart_filled", fontFamily="Material Symbols Rounded")
-    pie_chart_outline_rounded = IconData(name="pie_chart_outline", fontFamily="Material Symbols Rounded")
-    pie_chart_outlined_rounded = IconData(name="pie_chart_outlined", fontFamily="Material Symbols Rounded")
-    pill_rounded = IconData(name="pill", fontFamily="Material Symbols Rounded")
-    pill_off_rounded = IconData(name="pill_off", fontFamily="Material Symbols Rounded")
-    pin_rounded = IconData(name="pin", fontFamily="Material Symbols Rounded")
-    pin_drop_rounded = IconData(name="pin_drop", fontFamily="Material Symbols Rounded")
-    pin_end_rounded = IconData(name="pin_end", fontFamily="Material Symbols Rounded")
-    pin_invoke_rounded = IconData(name="pin_invoke", fontFamily="Material Symbols Rounded")
-    pinboard_rounded = IconData(name="pinboard", fontFamily="Material Symbols Rounded")
-    pinboard_unread_rounded = IconData(name="pinboard_unread", fontFamily="Material Symbols Rounded")
-    pinch_rounded = IconData(name="pinch", fontFamily="Material Symbols Rounded")
-    pinch_zoom_in_rounded = IconData(name="pinch_zoom_in", fontFamily="Material Symbols Rounded")
-    pinch_zoom_out_rounded = IconData(name="pinch_zoom_out", fontFamily="Material Symbols Rounded")
-    pip_rounded = IconData(name="pip", fontFamily="Material Symbols Rounded")
-    pip_exit_rounded = IconData(name="pip_exit", fontFamily="Material Symbols Rounded")
-    pivot_table_chart_rounded = IconData(name="pivot_table_chart", fontFamily="Material Symbols Rounded")
-    place_rounded = IconData(name="place", fontFamily="Material Symbols Rounded")
-    place_item_rounded = IconData(name="place_item", fontFamily="Material Symbols Rounded")
-    plagiarism_rounded = IconData(name="plagiarism", fontFamily="Material Symbols Rounded")
-    planet_rounded = IconData(name="planet", fontFamily="Material Symbols Rounded")
-    planner_banner_ad_pt_rounded = IconData(name="planner_banner_ad_pt", fontFamily="Material Symbols Rounded")
-    planner_review_rounded = IconData(name="planner_review", fontFamily="Material Symbols Rounded")
-    play_arrow_rounded = IconData(name="play_arrow", fontFamily="Material Symbols Rounded")
-    play_circle_rounded = IconData(name="play_circle", fontFamily="Material Symbols Rounded")
-    play_disabled_rounded = IconData(name="play_disabled", fontFamily="Material Symbols Rounded")
-    play_for_work_rounded = IconData(name="play_for_work", fontFamily="Material Symbols Rounded")
-    play_lesson_rounded = IconData(name="play_lesson", fontFamily="Material Symbols Rounded")
-    play_music_rounded = IconData(name="play_music", fontFamily="Material Symbols Rounded")
-    play_pause_rounded = IconData(name="play_pause", fontFamily="Material Symbols Rounded")
-    play_shapes_rounded = IconData(name="play_shapes", fontFamily="Material Symbols Rounded")
-    playing_cards_rounded = IconData(name="playing_cards", fontFamily="Material Symbols Rounded")
-    playlist_add_rounded = IconData(name="playlist_add", fontFamily="Material Symbols Rounded")
-    playlist_add_check_rounded = IconData(name="playlist_add_check", fontFamily="Material Symbols Rounded")
-    playlist_add_check_circle_rounded = IconData(name="playlist_add_check_circle", fontFamily="Material Symbols Rounded")
-    playlist_add_circle_rounded = IconData(name="playlist_add_circle", fontFamily="Material Symbols Rounded")
-    playlist_play_rounded = IconData(name="playlist_play", fontFamily="Material Symbols Rounded")
-    playlist_remove_rounded = IconData(name="playlist_remove", fontFamily="Material Symbols Rounded")
-    plug_connect_rounded = IconData(name="plug_connect", fontFamily="Material Symbols Rounded")
-    plumbing_rounded = IconData(name="plumbing", fontFamily="Material Symbols Rounded")
-    plus_one_rounded = IconData(name="plus_one", fontFamily="Material Symbols Rounded")
-    podcasts_rounded = IconData(name="podcasts", fontFamily="Material Symbols Rounded")
-    podiatry_rounded = IconData(name="podiatry", fontFamily="Material Symbols Rounded")
-    podium_rounded = IconData(name="podium", fontFamily="Material Symbols Rounded")
-    point_of_sale_rounded = IconData(name="point_of_sale", fontFamily="Material Symbols Rounded")
-    point_scan_rounded = IconData(name="point_scan", fontFamily="Material Symbols Rounded")
-    poker_chip_rounded = IconData(name="poker_chip", fontFamily="Material Symbols Rounded")
-    policy_rounded = IconData(name="policy", fontFamily="Material Symbols Rounded")
-    policy_alert_rounded = IconData(name="policy_alert", fontFamily="Material Symbols Rounded")
-    poll_rounded = IconData(name="poll", fontFamily="Material Symbols Rounded")
-    polyline_rounded = IconData(name="polyline", fontFamily="Material Symbols Rounded")
-    polymer_rounded = IconData(name="polymer", fontFamily="Material Symbols Rounded")
-    pool_rounded = IconData(name="pool", fontFamily="Material Symbols Rounded")
-    portable_wifi_off_rounded = IconData(name="portable_wifi_off", fontFamily="Material Symbols Rounded")
-    portrait_rounded = IconData(name="portrait", fontFamily="Material Symbols Rounded")
-    position_bottom_left_rounded = IconData(name="position_bottom_left", fontFamily="Material Symbols Rounded")
-    position_bottom_right_rounded = IconData(name="position_bottom_right", fontFamily="Material Symbols Rounded")
-    position_top_right_rounded = IconData(name="position_top_right", fontFamily="Material Symbols Rounded")
-    post_rounded = IconData(name="post", fontFamily="Material Symbols Rounded")
-    post_add_rounded = IconData(name="post_add", fontFamily="Material Symbols Rounded")
-    potted_plant_rounded = IconData(name="potted_plant", fontFamily="Material Symbols Rounded")
-    power_rounded = IconData(name="power", fontFamily="Material Symbols Rounded")
-    power_input_rounded = IconData(name="power_input", fontFamily="Material Symbols Rounded")
-    power_off_rounded = IconData(name="power_off", fontFamily="Material Symbols Rounded")
-    power_rounded_rounded = IconData(name="power_rounded", fontFamily="Material Symbols Rounded")
-    power_settings_circle_rounded = IconData(name="power_settings_circle", fontFamily="Material Symbols Rounded")
-    power_settings_new_rounded = IconData(name="power_settings_new", fontFamily="Material Symbols Rounded")
-    prayer_times_rounded = IconData(name="prayer_times", fontFamily="Material Symbols Rounded")
-    precision_manufacturing_rounded = IconData(name="precision_manufacturing", fontFamily="Material Symbols Rounded")
-    pregnancy_rounded = IconData(name="pregnancy", fontFamily="Material Symbols Rounded")
-    pregnant_woman_rounded = IconData(name="pregnant_woman", fontFamily="Material Symbols Rounded")
-    preliminary_rounded = IconData(name="preliminary", fontFamily="Material Symbols Rounded")
-    prescriptions_rounded = IconData(name="prescriptions", fontFamily="Material Symbols Rounded")
-    present_to_all_rounded = IconData(name="present_to_all", fontFamily="Material Symbols Rounded")
-    preview_rounded = IconData(name="preview", fontFamily="Material Symbols Rounded")
-    preview_off_rounded = IconData(name="preview_off", fontFamily="Material Symbols Rounded")
-    price_change_rounded = IconData(name="price_change", fontFamily="Material Symbols Rounded")
-    price_check_rounded = IconData(name="price_check", fontFamily="Material Symbols Rounded")
-    print_rounded = IconData(name="print", fontFamily="Material Symbols Rounded")
-    print_add_rounded = IconData(name="print_add", fontFamily="Material Symbols Rounded")
-    print_connect_rounded = IconData(name="print_connect", fontFamily="Material Symbols Rounded")
-    print_disabled_rounded = IconData(name="print_disabled", fontFamily="Material Symbols Rounded")
-    print_error_rounded = IconData(name="print_error", fontFamily="Material Symbols Rounded")
-    print_lock_rounded = IconData(name="print_lock", fontFamily="Material Symbols Rounded")
-    priority_rounded = IconData(name="priority", fontFamily="Material Symbols Rounded")
-    priority_high_rounded = IconData(name="priority_high", fontFamily="Material Symbols Rounded")
-    privacy_rounded = IconData(name="privacy", fontFamily="Material Symbols Rounded")
-    privacy_tip_rounded = IconData(name="privacy_tip", fontFamily="Material Symbols Rounded")
-    private_connectivity_rounded = IconData(name="private_connectivity", fontFamily="Material Symbols Rounded")
-    problem_rounded = IconData(name="problem", fontFamily="Material Symbols Rounded")
-    procedure_rounded = IconData(name="procedure", fontFamily="Material Symbols Rounded")
-    process_chart_rounded = IconData(name="process_chart", fontFamily="Material Symbols Rounded")
-    production_quantity_limits_rounded = IconData(name="production_quantity_limits", fontFamily="Material Symbols Rounded")
-    productivity_rounded = IconData(name="productivity", fontFamily="Material Symbols Rounded")
-    progress_activity_rounded = IconData(name="progress_activity", fontFamily="Material Symbols Rounded")
-    prompt_suggestion_rounded = IconData(name="prompt_suggestion", fontFamily="Material Symbols Rounded")
-    propane_rounded = IconData(name="propane", fontFamily="Material Symbols Rounded")
-    propane_tank_rounded = IconData(name="propane_tank", fontFamily="Material Symbols Rounded")
-    psychiatry_rounded = IconData(name="psychiatry", fontFamily="Material Symbols Rounded")
-    psychology_rounded = IconData(name="psychology", fontFamily="Material Symbols Rounded")
-    psychology_alt_rounded = IconData(name="psychology_alt", fontFamily="Material Symbols Rounded")
-    public_rounded = IconData(name="public", fontFamily="Material Symbols Rounded")
-    public_off_rounded = IconData(name="public_off", fontFamily="Material Symbols Rounded")
-    publish_rounded = IconData(name="publish", fontFamily="Material Symbols Rounded")
-    published_with_changes_rounded = IconData(name="published_with_changes", fontFamily="Material Symbols Rounded")
-    pulmonology_rounded = IconData(name="pulmonology", fontFamily="Material Symbols Rounded")
-    pulse_alert_rounded = IconData(name="pulse_alert", fontFamily="Material Symbols Rounded")
-    punch_clock_rounded = IconData(name="punch_clock", fontFamily="Material Symbols Rounded")
-    push_pin_rounded = IconData(name="push_pin", fontFamily="Material Symbols Rounded")
-    qr_code_rounded = IconData(name="qr_code", fontFamily="Material Symbols Rounded")
-    qr_code_2_rounded = IconData(name="qr_code_2", fontFamily="Material Symbols Rounded")
-    qr_code_2_add_rounded = IconData(name="qr_code_2_add", fontFamily="Material Symbols Rounded")
-    qr_code_scanner_rounded = IconData(name="qr_code_scanner", fontFamily="Material Symbols Rounded")
-    query_builder_rounded = IconData(name="query_builder", fontFamily="Material Symbols Rounded")
-    query_stats_rounded = IconData(name="query_stats", fontFamily="Material Symbols Rounded")
-    question_answer_rounded = IconData(name="question_answer", fontFamily="Material Symbols Rounded")
-    question_exchange_rounded = IconData(name="question_exchange", fontFamily="Material Symbols Rounded")
-    question_mark_rounded = IconData(name="question_mark", fontFamily="Material Symbols Rounded")
-    queue_rounded = IconData(name="queue", fontFamily="Material Symbols Rounded")
-    queue_music_rounded = IconData(name="queue_music", fontFamily="Material Symbols Rounded")
-    queue_play_next_rounded = IconData(name="queue_play_next", fontFamily="Material Symbols Rounded")
-    quick_phrases_rounded = IconData(name="quick_phrases", fontFamily="Material Symbols Rounded")
-    quick_reference_rounded = IconData(name="quick_reference", fontFamily="Material Symbols Rounded")
-    quick_reference_all_rounded = IconData(name="quick_reference_all", fontFamily="Material Symbols Rounded")
-    quick_reorder_rounded = IconData(name="quick_reorder", fontFamily="Material Symbols Rounded")
-    quickreply_rounded = IconData(name="quickreply", fontFamily="Material Symbols Rounded")
-    quiet_time_rounded = IconData(name="quiet_time", fontFamily="Material Symbols Rounded")
-    quiet_time_active_rounded = IconData(name="quiet_time_active", fontFamily="Material Symbols Rounded")
-    quiz_rounded = IconData(name="quiz", fontFamily="Material Symbols Rounded")
-    r_mobiledata_rounded = IconData(name="r_mobiledata", fontFamily="Material Symbols Rounded")
-    radar_rounded = IconData(name="radar", fontFamily="Material Symbols Rounded")
-    radio_rounded = IconData(name="radio", fontFamily="Material Symbols Rounded")
-    radio_button_checked_rounded = IconData(name="radio_button_checked", fontFamily="Material Symbols Rounded")
-    radio_button_partial_rounded = IconData(name="radio_button_partial", fontFamily="Material Symbols Rounded")
-    radio_button_unchecked_rounded = IconData(name="radio_button_unchecked", fontFamily="Material Symbols Rounded")
-    radiology_rounded = IconData(name="radiology", fontFamily="Material Symbols Rounded")
-    railway_alert_rounded = IconData(name="railway_alert", fontFamily="Material Symbols Rounded")
-    railway_alert_2_rounded = IconData(name="railway_alert_2", fontFamily="Material Symbols Rounded")
-    rainy_rounded = IconData(name="rainy", fontFamily="Material Symbols Rounded")
-    rainy_heavy_rounded = IconData(name="rainy_heavy", fontFamily="Material Symbols Rounded")
-    rainy_light_rounded = IconData(name="rainy_light", fontFamily="Material Symbols Rounded")
-    rainy_snow_rounded = IconData(name="rainy_snow", fontFamily="Material Symbols Rounded")
-    ramen_dining_rounded = IconData(name="ramen_dining", fontFamily="Material Symbols Rounded")
-    ramp_left_rounded = IconData(name="ramp_left", fontFamily="Material Symbols Rounded")
-    ramp_right_rounded = IconData(name="ramp_right", fontFamily="Material Symbols Rounded")
-    range_hood_rounded = IconData(name="range_hood", fontFamily="Material Symbols Rounded")
-    rate_review_rounded = IconData(name="rate_review", fontFamily="Material Symbols Rounded")
-    rate_review_rtl_rounded = IconData(name="rate_review_rtl", fontFamily="Material Symbols Rounded")
-    raven_rounded = IconData(name="raven", fontFamily="Material Symbols Rounded")
-    raw_off_rounded = IconData(name="raw_off", fontFamily="Material Symbols Rounded")
-    raw_on_rounded = IconData(name="raw_on", fontFamily="Material Symbols Rounded")
-    read_more_rounded = IconData(name="read_more", fontFamily="Material Symbols Rounded")
-    readiness_score_rounded = IconData(name="readiness_score", fontFamily="Material Symbols Rounded")
-    real_estate_agent_rounded = IconData(name="real_estate_agent", fontFamily="Material Symbols Rounded")
-    rear_camera_rounded = IconData(name="rear_camera", fontFamily="Material Symbols Rounded")
-    rebase_rounded = IconData(name="rebase", fontFamily="Material Symbols Rounded")
-    rebase_edit_rounded = IconData(name="rebase_edit", fontFamily="Material Symbols Rounded")
-    receipt_rounded = IconData(name="receipt", fontFamily="Material Symbols Rounded")
-    receipt_long_rounded = IconData(name="receipt_long", fontFamily="Material Symbols Rounded")
-    receipt_long_off_rounded = IconData(name="receipt_long_off", fontFamily="Material Symbols Rounded")
-    recent_actors_rounded = IconData(name="recent_actors", fontFamily="Material Symbols Rounded")
-    recent_patient_rounded = IconData(name="recent_patient", fontFamily="Material Symbols Rounded")
-    recenter_rounded = IconData(name="recenter", fontFamily="Material Symbols Rounded")
-    recommend_rounded = IconData(name="recommend", fontFamily="Material Symbols Rounded")
-    record_voice_over_rounded = IconData(name="record_voice_over", fontFamily="Material Symbols Rounded")
-    rectangle_rounded = IconData(name="rectangle", fontFamily="Material Symbols Rounded")
-    recycling_rounded = IconData(name="recycling", fontFamily="Material Symbols Rounded")
-    redeem_rounded = IconData(name="redeem", fontFamily="Material Symbols Rounded")
-    redo_rounded = IconData(name="redo", fontFamily="Material Symbols Rounded")
-    reduce_capacity_rounded = IconData(name="reduce_capacity", fontFamily="Material Symbols Rounded")
-    refresh_rounded = IconData(name="refresh", fontFamily="Material Symbols Rounded")
-    regular_expression_rounded = IconData(name="regular_expression", fontFamily="Material Symbols Rounded")
-    relax_rounded = IconData(name="relax", fontFamily="Material Symbols Rounded")
-    release_alert_rounded = IconData(name="release_alert", fontFamily="Material Symbols Rounded")
-    remember_me_rounded = IconData(name="remember_me", fontFamily="Material Symbols Rounded")
-    reminder_rounded = IconData(name="reminder", fontFamily="Material Symbols Rounded")
-    reminders_alt_rounded = IconData(name="reminders_alt", fontFamily="Material Symbols Rounded")
-    remote_gen_rounded = IconData(name="remote_gen", fontFamily="Material Symbols Rounded")
-    remove_rounded = IconData(name="remove", fontFamily="Material Symbols Rounded")
-    remove_circle_rounded = IconData(name="remove_circle", fontFamily="Material Symbols Rounded")
-    remove_circle_outline_rounded = IconData(name="remove_circle_outline", fontFamily="Material Symbols Rounded")
-    remove_done_rounded = IconData(name="remove_done", fontFamily="Material Symbols Rounded")
-    remove_from_queue_rounded = IconData(name="remove_from_queue", fontFamily="Material Symbols Rounded")
-    remove_moderator_rounded = IconData(name="remove_moderator", fontFamily="Material Symbols Rounded")
-    remove_red_eye_rounded = IconData(name="remove_red_eye", fontFamily="Material Symbols Rounded")
-    remove_road_rounded = IconData(name="remove_road", fontFamily="Material Symbols Rounded")
-    remove_selection_rounded = IconData(name="remove_selection", fontFamily="Material Symbols Rounded")
-    remove_shopping_cart_rounded = IconData(name="remove_shopping_cart", fontFamily="Material Symbols Rounded")
-    reopen_window_rounded = IconData(name="reopen_window", fontFamily="Material Symbols Rounded")
-    reorder_rounded = IconData(name="reorder", fontFamily="Material Symbols Rounded")
-    repartition_rounded = IconData(name="repartition", fontFamily="Material Symbols Rounded")
-    repeat_rounded = IconData(name="repeat", fontFamily="Material Symbols Rounded")
-    repeat_on_rounded = IconData(name="repeat_on", fontFamily="Material Symbols Rounded")
-    repeat_one_rounded = IconData(name="repeat_one", fontFamily="Material Symbols Rounded")
-    repeat_one_on_rounded = IconData(name="repeat_one_on", fontFamily="Material Symbols Rounded")
-    replace_audio_rounded = IconData(name="replace_audio", fontFamily="Material Symbols Rounded")
-    replace_image_rounded = IconData(name="replace_image", fontFamily="Material Symbols Rounded")
-    replace_video_rounded = IconData(name="replace_video", fontFamily="Material Symbols Rounded")
-    replay_rounded = IconData(name="replay", fontFamily="Material Symbols Rounded")
-    replay_10_rounded = IconData(name="replay_10", fontFamily="Material Symbols Rounded")
-    replay_30_rounded = IconData(name="replay_30", fontFamily="Material Symbols Rounded")
-    replay_5_rounded = IconData(name="replay_5", fontFamily="Material Symbols Rounded")
-    replay_circle_filled_rounded = IconData(name="replay_circle_filled", fontFamily="Material Symbols Rounded")
-    reply_rounded = IconData(name="reply", fontFamily="Material Symbols Rounded")
-    reply_all_rounded = IconData(name="reply_all", fontFamily="Material Symbols Rounded")
-    report_rounded = IconData(name="report", fontFamily="Material Symbols Rounded")
-    report_gmailerrorred_rounded = IconData(name="report_gmailerrorred", fontFamily="Material Symbols Rounded")
-    report_off_rounded = IconData(name="report_off", fontFamily="Material Symbols Rounded")
-    report_problem_rounded = IconData(name="report_problem", fontFamily="Material Symbols Rounded")
-    request_page_rounded = IconData(name="request_page", fontFamily="Material Symbols Rounded")
-    request_quote_rounded = IconData(name="request_quote", fontFamily="Material Symbols Rounded")
-    reset_brightness_rounded = IconData(name="reset_brightness", fontFamily="Material Symbols Rounded")
-    reset_focus_rounded = IconData(name="reset_focus", fontFamily="Material Symbols Rounded")
-    reset_image_rounded = IconData(name="reset_image", fontFamily="Material Symbols Rounded")
-    reset_iso_rounded = IconData(name="reset_iso", fontFamily="Material Symbols Rounded")
-    reset_settings_rounded = IconData(name="reset_settings", fontFamily="Material Symbols Rounded")
-    reset_shadow_rounded = IconData(name="reset_shadow", fontFamily="Material Symbols Rounded")
-    reset_shutter_speed_rounded = IconData(name="reset_shutter_speed", fontFamily="Material Symbols Rounded")
-    reset_tv_rounded = IconData(name="reset_tv", fontFamily="Material Symbols Rounded")
-    reset_white_balance_rounded = IconData(name="reset_white_balance", fontFamily="Material Symbols Rounded")
-    reset_wrench_rounded = IconData(name="reset_wrench", fontFamily="Material Symbols Rounded")
-    resize_rounded = IconData(name="resize", fontFamily="Material Symbols Rounded")
-    respiratory_rate_rounded = IconData(name="respiratory_rate", fontFamily="Material Symbols Rounded")
-    responsive_layout_rounded = IconData(name="responsive_layout", fontFamily="Material Symbols Rounded")
-    restart_alt_rounded = IconData(name="restart_alt", fontFamily="Material Symbols Rounded")
-    restaurant_rounded = IconData(name="restaurant", fontFamily="Material Symbols Rounded")
-    restaurant_menu_rounded = IconData(name="restaurant_menu", fontFamily="Material Symbols Rounded")
-    restore_rounded = IconData(name="restore", fontFamily="Material Symbols Rounded")
-    restore_from_trash_rounded = IconData(name="restore_from_trash", fontFamily="Material Symbols Rounded")
-    restore_page_rounded = IconData(name="restore_page", fontFamily="Material Symbols Rounded")
-    resume_rounded = IconData(name="resume", fontFamily="Material Symbols Rounded")
-    reviews_rounded = IconData(name="reviews", fontFamily="Material Symbols Rounded")
-    rewarded_ads_rounded = IconData(name="rewarded_ads", fontFamily="Material Symbols Rounded")
-    rheumatology_rounded = IconData(name="rheumatology", fontFamily="Material Symbols Rounded")
-    rib_cage_rounded = IconData(name="rib_cage", fontFamily="Material Symbols Rounded")
-    rice_bowl_rounded = IconData(name="rice_bowl", fontFamily="Material Symbols Rounded")
-    right_click_rounded = IconData(name="right_click", fontFamily="Material Symbols Rounded")
-    right_panel_close_rounded = IconData(name="right_panel_close", fontFamily="Material Symbols Rounded")
-    right_panel_open_rounded = IconData(name="right_panel_open", fontFamily="Material Symbols Rounded")
-    ring_volume_rounded = IconData(name="ring_volume", fontFamily="Material Symbols Rounded")
-    ring_volume_filled_rounded = IconData(name="ring_volume_filled", fontFamily="Material Symbols Rounded")
-    ripples_rounded = IconData(name="ripples", fontFamily="Material Symbols Rounded")
-    road_rounded = IconData(name="road", fontFamily="Material Symbols Rounded")
-    robot_rounded = IconData(name="robot", fontFamily="Material Symbols Rounded")
-    robot_2_rounded = IconData(name="robot_2", fontFamily="Material Symbols Rounded")
-    rocket_rounded = IconData(name="rocket", fontFamily="Material Symbols Rounded")
-    rocket_launch_rounded = IconData(name="rocket_launch", fontFamily="Material Symbols Rounded")
-    roller_shades_rounded = IconData(name="roller_shades", fontFamily="Material Symbols Rounded")
-    roller_shades_closed_rounded = IconData(name="roller_shades_closed", fontFamily="Material Symbols Rounded")
-    roller_skating_rounded = IconData(name="roller_skating", fontFamily="Material Symbols Rounded")
-    roofing_rounded = IconData(name="roofing", fontFamily="Material Symbols Rounded")
-    room_rounded = IconData(name="room", fontFamily="Material Symbols Rounded")
-    room_preferences_rounded = IconData(name="room_preferences", fontFamily="Material Symbols Rounded")
-    room_service_rounded = IconData(name="room_service", fontFamily="Material Symbols Rounded")
-    rotate_90_degrees_ccw_rounded = IconData(name="rotate_90_degrees_ccw", fontFamily="Material Symbols Rounded")
-    rotate_90_degrees_cw_rounded = IconData(name="rotate_90_degrees_cw", fontFamily="Material Symbols Rounded")
-    rotate_auto_rounded = IconData(name="rotate_auto", fontFamily="Material Symbols Rounded")
-    rotate_left_rounded = IconData(name="rotate_left", fontFamily="Material Symbols Rounded")
-    rotate_right_rounded = IconData(name="rotate_right", fontFamily="Material Symbols Rounded")
-    roundabout_left_rounded = IconData(name="roundabout_left", fontFamily="Material Symbols Rounded")
-    roundabout_right_rounded = IconData(name="roundabout_right", fontFamily="Material Symbols Rounded")
-    rounded_corner_rounded = IconData(name="rounded_corner", fontFamily="Material Symbols Rounded")
-    route_rounded = IconData(name="route", fontFamily="Material Symbols Rounded")
-    router_rounded = IconData(name="router", fontFamily="Material Symbols Rounded")
-    router_off_rounded = IconData(name="router_off", fontFamily="Material Symbols Rounded")
-    routine_rounded = IconData(name="routine", fontFamily="Material Symbols Rounded")
-    rowing_rounded = IconData(name="rowing", fontFamily="Material Symbols Rounded")
-    rss_feed_rounded = IconData(name="rss_feed", fontFamily="Material Symbols Rounded")
-    rsvp_rounded = IconData(name="rsvp", fontFamily="Material Symbols Rounded")
-    rtt_rounded = IconData(name="rtt", fontFamily="Material Symbols Rounded")
-    rubric_rounded = IconData(name="rubric", fontFamily="Material Symbols Rounded")
-    rule_rounded = IconData(name="rule", fontFamily="Material Symbols Rounded")
-    rule_folder_rounded = IconData(name="rule_folder", fontFamily="Material Symbols Rounded")
-    rule_settings_rounded = IconData(name="rule_settings", fontFamily="Material Symbols Rounded")
-    run_circle_rounded = IconData(name="run_circle", fontFamily="Material Symbols Rounded")
-    running_with_errors_rounded = IconData(name="running_with_errors", fontFamily="Material Symbols Rounded")
-    rv_hookup_rounded = IconData(name="rv_hookup", fontFamily="Material Symbols Rounded")
-    safety_check_rounded = IconData(name="safety_check", fontFamily="Material Symbols Rounded")
-    safety_check_off_rounded = IconData(name="safety_check_off", fontFamily="Material Symbols Rounded")
-    safety_divider_rounded = IconData(name="safety_divider", fontFamily="Material Symbols Rounded")
-    sailing_rounded = IconData(name="sailing", fontFamily="Material Symbols Rounded")
-    salinity_rounded = IconData(name="salinity", fontFamily="Material Symbols Rounded")
-    sanitizer_rounded = IconData(name="sanitizer", fontFamily="Material Symbols Rounded")
-    satellite_rounded = IconData(name="satellite", fontFamily="Material Symbols Rounded")
-    satellite_alt_rounded = IconData(name="satellite_alt", fontFamily="Material Symbols Rounded")
-    sauna_rounded = IconData(name="sauna", fontFamily="Material Symbols Rounded")
-    save_rounded = IconData(name="save", fontFamily="Material Symbols Rounded")
-    save_alt_rounded = IconData(name="save_alt", fontFamily="Material Symbols Rounded")
-    save_as_rounded = IconData(name="save_as", fontFamily="Material Symbols Rounded")
-    save_clock_rounded = IconData(name="save_clock", fontFamily="Material Symbols Rounded")
-    saved_search_rounded = IconData(name="saved_search", fontFamily="Material Symbols Rounded")
-    savings_rounded = IconData(name="savings", fontFamily="Material Symbols Rounded")
-    scale_rounded = IconData(name="scale", fontFamily="Material Symbols Rounded")
-    scan_rounded = IconData(name="scan", fontFamily="Material Symbols Rounded")
-    scan_delete_rounded = IconData(name="scan_delete", fontFamily="Material Symbols Rounded")
-    scanner_rounded = IconData(name="scanner", fontFamily="Material Symbols Rounded")
-    scatter_plot_rounded = IconData(name="scatter_plot", fontFamily="Material Symbols Rounded")
-    scene_rounded = IconData(name="scene", fontFamily="Material Symbols Rounded")
-    schedule_rounded = IconData(name="schedule", fontFamily="Material Symbols Rounded")
-    schedule_send_rounded = IconData(name="schedule_send", fontFamily="Material Symbols Rounded")
-    schema_rounded = IconData(name="schema", fontFamily="Material Symbols Rounded")
-    school_rounded = IconData(name="school", fontFamily="Material Symbols Rounded")
-    science_rounded = IconData(name="science", fontFamily="Material Symbols Rounded")
-    science_off_rounded = IconData(name="science_off", fontFamily="Material Symbols Rounded")
-    scooter_rounded = IconData(name="scooter", fontFamily="Material Symbols Rounded")
-    score_rounded = IconData(name="score", fontFamily="Material Symbols Rounded")
-    scoreboard_rounded = IconData(name="scoreboard", fontFamily="Material Symbols Rounded")
-    screen_lock_landscape_rounded = IconData(name="screen_lock_landscape", fontFamily="Material Symbols Rounded")
-    screen_lock_portrait_rounded = IconData(name="screen_lock_portrait", fontFamily="Material Symbols Rounded")
-    screen_lock_rotation_rounded = IconData(name="screen_lock_rotation", fontFamily="Material Symbols Rounded")
-    screen_record_rounded = IconData(name="screen_record", fontFamily="Material Symbols Rounded")
-    screen_rotation_rounded = IconData(name="screen_rotation", fontFamily="Material Symbols Rounded")
-    screen_rotation_alt_rounded = IconData(name="screen_rotation_alt", fontFamily="Material Symbols Rounded")
-    screen_rotation_up_rounded = IconData(name="screen_rotation_up", fontFamily="Material Symbols Rounded")
-    screen_search_desktop_rounded = IconData(name="screen_search_desktop", fontFamily="Material Symbols Rounded")
-    screen_share_rounded = IconData(name="screen_share", fontFamily="Material Symbols Rounded")
-    screenshot_rounded = IconData(name="screenshot", fontFamily="Material Symbols Rounded")
-    screenshot_frame_rounded = IconData(name="screenshot_frame", fontFamily="Material Symbols Rounded")
-    screenshot_frame_2_rounded = IconData(name="screenshot_frame_2", fontFamily="Material Symbols Rounded")
-    screenshot_keyboard_rounded = IconData(name="screenshot_keyboard", fontFamily="Material Symbols Rounded")
-    screenshot_monitor_rounded = IconData(name="screenshot_monitor", fontFamily="Material Symbols Rounded")
-    screenshot_region_rounded = IconData(name="screenshot_region", fontFamily="Material Symbols Rounded")
-    screenshot_tablet_rounded = IconData(name="screenshot_tablet", fontFamily="Material Symbols Rounded")
-    script_rounded = IconData(name="script", fontFamily="Material Symbols Rounded")
-    scrollable_header_rounded = IconData(name="scrollable_header", fontFamily="Material Symbols Rounded")
-    scuba_diving_rounded = IconData(name="scuba_diving", fontFamily="Material Symbols Rounded")
-    sd_rounded = IconData(name="sd", fontFamily="Material Symbols Rounded")
-    sd_card_rounded = IconData(name="sd_card", fontFamily="Material Symbols Rounded")
-    sd_card_alert_rounded = IconData(name="sd_card_alert", fontFamily="Material Symbols Rounded")
-    sd_storage_rounded = IconData(name="sd_storage", fontFamily="Material Symbols Rounded")
-    sdk_rounded = IconData(name="sdk", fontFamily="Material Symbols Rounded")
-    search_rounded = IconData(name="search", fontFamily="Material Symbols Rounded")
-    search_activity_rounded = IconData(name="search_activity", fontFamily="Material Symbols Rounded")
-    search_check_rounded = IconData(name="search_check", fontFamily="Material Symbols Rounded")
-    search_check_2_rounded = IconData(name="search_check_2", fontFamily="Material Symbols Rounded")
-    search_hands_free_rounded = IconData(name="search_hands_free", fontFamily="Material Symbols Rounded")
-    search_insights_rounded = IconData(name="search_insights", fontFamily="Material Symbols Rounded")
-    search_off_rounded = IconData(name="search_off", fontFamily="Material Symbols Rounded")
-    seat_cool_left_rounded = IconData(name="seat_cool_left", fontFamily="Material Symbols Rounded")
-    seat_cool_right_rounded = IconData(name="seat_cool_right", fontFamily="Material Symbols Rounded")
-    seat_heat_left_rounded = IconData(name="seat_heat_left", fontFamily="Material Symbols Rounded")
-    seat_heat_right_rounded = IconData(name="seat_heat_right", fontFamily="Material Symbols Rounded")
-    seat_vent_left_rounded = IconData(name="seat_vent_left", fontFamily="Material Symbols Rounded")
-    seat_vent_right_rounded = IconData(name="seat_vent_right", fontFamily="Material Symbols Rounded")
-    security_rounded = IconData(name="security", fontFamily="Material Symbols Rounded")
-    security_key_rounded = IconData(name="security_key", fontFamily="Material Symbols Rounded")
-    security_update_rounded = IconData(name="security_update", fontFamily="Material Symbols Rounded")
-    security_update_good_rounded = IconData(name="security_update_good", fontFamily="Material Symbols Rounded")
-    security_update_warning_rounded = IconData(name="security_update_warning", fontFamily="Material Symbols Rounded")
-    segment_rounded = IconData(name="segment", fontFamily="Material Symbols Rounded")
-    select_rounded = IconData(name="select", fontFamily="Material Symbols Rounded")
-    select_all_rounded = IconData(name="select_all", fontFamily="Material Symbols Rounded")
-    select_check_box_rounded = IconData(name="select_check_box", fontFamily="Material Symbols Rounded")
-    select_to_speak_rounded = IconData(name="select_to_speak", fontFamily="Material Symbols Rounded")
-    select_window_rounded = IconData(name="select_window", fontFamily="Material Symbols Rounded")
-    select_window_2_rounded = IconData(name="select_window_2", fontFamily="Material Symbols Rounded")
-    select_window_off_rounded = IconData(name="select_window_off", fontFamily="Material Symbols Rounded")
-    self_care_rounded = IconData(name="self_care", fontFamily="Material Symbols Rounded")
-    self_improvement_rounded = IconData(name="self_improvement", fontFamily="Material Symbols Rounded")
-    sell_rounded = IconData(name="sell", fontFamily="Material Symbols Rounded")
-    send_rounded = IconData(name="send", fontFamily="Material Symbols Rounded")
-    send_and_archive_rounded = IconData(name="send_and_archive", fontFamily="Material Symbols Rounded")
-    send_money_rounded = IconData(name="send_money", fontFamily="Material Symbols Rounded")
-    send_time_extension_rounded = IconData(name="send_time_extension", fontFamily="Material Symbols Rounded")
-    send_to_mobile_rounded = IconData(name="send_to_mobile", fontFamily="Material Symbols Rounded")
-    sensor_door_rounded = IconData(name="sensor_door", fontFamily="Material Symbols Rounded")
-    sensor_occupied_rounded = IconData(name="sensor_occupied", fontFamily="Material Symbols Rounded")
-    sensor_window_rounded = IconData(name="sensor_window", fontFamily="Material Symbols Rounded")
-    sensors_rounded = IconData(name="sensors", fontFamily="Material Symbols Rounded")
-    sensors_krx_rounded = IconData(name="sensors_krx", fontFamily="Material Symbols Rounded")
-    sensors_krx_off_rounded = IconData(name="sensors_krx_off", fontFamily="Material Symbols Rounded")
-    sensors_off_rounded = IconData(name="sensors_off", fontFamily="Material Symbols Rounded")
-    sentiment_calm_rounded = IconData(name="sentiment_calm", fontFamily="Material Symbols Rounded")
-    sentiment_content_rounded = IconData(name="sentiment_content", fontFamily="Material Symbols Rounded")
-    sentiment_dissatisfied_rounded = IconData(name="sentiment_dissatisfied", fontFamily="Material Symbols Rounded")
-    sentiment_excited_rounded = IconData(name="sentiment_excited", fontFamily="Material Symbols Rounded")
-    sentiment_extremely_dissatisfied_rounded = IconData(name="sentiment_extremely_dissatisfied", fontFamily="Material Symbols Rounded")
-    sentiment_frustrated_rounded = IconData(name="sentiment_frustrated", fontFamily="Material Symbols Rounded")
-    sentiment_neutral_rounded = IconData(name="sentiment_neutral", fontFamily="Material Symbols Rounded")
-    sentiment_sad_rounded = IconData(name="sentiment_sad", fontFamily="Material Symbols Rounded")
-    sentiment_satisfied_rounded = IconData(name="sentiment_satisfied", fontFamily="Material Symbols Rounded")
-    sentiment_satisfied_alt_rounded = IconData(name="sentiment_satisfied_alt", fontFamily="Material Symbols Rounded")
-    sentiment_stressed_rounded = IconData(name="sentiment_stressed", fontFamily="Material Symbols Rounded")
-    sentiment_very_dissatisfied_rounded = IconData(name="sentiment_very_dissatisfied", fontFamily="Material Symbols Rounded")
-    sentiment_very_satisfied_rounded = IconData(name="sentiment_very_satisfied", fontFamily="Material Symbols Rounded")
-    sentiment_worried_rounded = IconData(name="sentiment_worried", fontFamily="Material Symbols Rounded")
-    serif_rounded = IconData(name="serif", fontFamily="Material Symbols Rounded")
-    server_person_rounded = IconData(name="server_person", fontFamily="Material Symbols Rounded")
-    service_toolbox_rounded = IconData(name="service_toolbox", fontFamily="Material Symbols Rounded")
-    set_meal_rounded = IconData(name="set_meal", fontFamily="Material Symbols Rounded")
-    settings_rounded = IconData(name="settings", fontFamily="Material Symbols Rounded")
-    settings_accessibility_rounded = IconData(name="settings_accessibility", fontFamily="Material Symbols Rounded")
-    settings_account_box_rounded = IconData(name="settings_account_box", fontFamily="Material Symbols Rounded")
-    settings_alert_rounded = IconData(name="settings_alert", fontFamily="Material Symbols Rounded")
-    settings_applications_rounded = IconData(name="settings_applications", fontFamily="Material Symbols Rounded")
-    settings_b_roll_rounded = IconData(name="settings_b_roll", fontFamily="Material Symbols Rounded")
-    settings_backup_restore_rounded = IconData(name="settings_backup_restore", fontFamily="Material Symbols Rounded")
-    settings_bluetooth_rounded = IconData(name="settings_bluetooth", fontFamily="Material Symbols Rounded")
-    settings_brightness_rounded = IconData(name="settings_brightness", fontFamily="Material Symbols Rounded")
-    settings_cell_rounded = IconData(name="settings_cell", fontFamily="Material Symbols Rounded")
-    settings_cinematic_blur_rounded = IconData(name="settings_cinematic_blur", fontFamily="Material Symbols Rounded")
-    settings_ethernet_rounded = IconData(name="settings_ethernet", fontFamily="Material Symbols Rounded")
-    settings_heart_rounded = IconData(name="settings_heart", fontFamily="Material Symbols Rounded")
-    settings_input_antenna_rounded = IconData(name="settings_input_antenna", fontFamily="Material Symbols Rounded")
-    settings_input_component_rounded = IconData(name="settings_input_component", fontFamily="Material Symbols Rounded")
-    settings_input_composite_rounded = IconData(name="settings_input_composite", fontFamily="Material Symbols Rounded")
-    settings_input_hdmi_rounded = IconData(name="settings_input_hdmi", fontFamily="Material Symbols Rounded")
-    settings_input_svideo_rounded = IconData(name="settings_input_svideo", fontFamily="Material Symbols Rounded")
-    settings_motion_mode_rounded = IconData(name="settings_motion_mode", fontFamily="Material Symbols Rounded")
-    settings_night_sight_rounded = IconData(name="settings_night_sight", fontFamily="Material Symbols Rounded")
-    settings_overscan_rounded = IconData(name="settings_overscan", fontFamily="Material Symbols Rounded")
-    settings_panorama_rounded = IconData(name="settings_panorama", fontFamily="Material Symbols Rounded")
-    settings_phone_rounded = IconData(name="settings_phone", fontFamily="Material Symbols Rounded")
-    settings_photo_camera_rounded = IconData(name="settings_photo_camera", fontFamily="Material Symbols Rounded")
-    settings_power_rounded = IconData(name="settings_power", fontFamily="Material Symbols Rounded")
-    settings_remote_rounded = IconData(name="settings_remote", fontFamily="Material Symbols Rounded")
-    settings_slow_motion_rounded = IconData(name="settings_slow_motion", fontFamily="Material Symbols Rounded")
-    settings_suggest_rounded = IconData(name="settings_suggest", fontFamily="Material Symbols Rounded")
-    settings_system_daydream_rounded = IconData(name="settings_system_daydream", fontFamily="Material Symbols Rounded")
-    settings_timelapse_rounded = IconData(name="settings_timelapse", fontFamily="Material Symbols Rounded")
-    settings_video_camera_rounded = IconData(name="settings_video_camera", fontFamily="Material Symbols Rounded")
-    settings_voice_rounded = IconData(name="settings_voice", fontFamily="Material Symbols Rounded")
-    settop_component_rounded = IconData(name="settop_component", fontFamily="Material Symbols Rounded")
-    severe_cold_rounded = IconData(name="severe_cold", fontFamily="Material Symbols Rounded")
-    shadow_rounded = IconData(name="shadow", fontFamily="Material Symbols Rounded")
-    shadow_add_rounded = IconData(name="shadow_add", fontFamily="Material Symbols Rounded")
-    shadow_minus_rounded = IconData(name="shadow_minus", fontFamily="Material Symbols Rounded")
-    shape_line_rounded = IconData(name="shape_line", fontFamily="Material Symbols Rounded")
-    shape_recognition_rounded = IconData(name="shape_recognition", fontFamily="Material Symbols Rounded")
-    shapes_rounded = IconData(name="shapes", fontFamily="Material Symbols Rounded")
-    share_rounded = IconData(name="share", fontFamily="Material Symbols Rounded")
-    share_eta_rounded = IconData(name="share_eta", fontFamily="Material Symbols Rounded")
-    share_location_rounded = IconData(name="share_location", fontFamily="Material Symbols Rounded")
-    share_off_rounded = IconData(name="share_off", fontFamily="Material Symbols Rounded")
-    share_reviews_rounded = IconData(name="share_reviews", fontFamily="Material Symbols Rounded")
-    share_windows_rounded = IconData(name="share_windows", fontFamily="Material Symbols Rounded")
-    sheets_rtl_rounded = IconData(name="sheets_rtl", fontFamily="Material Symbols Rounded")
-    shelf_auto_hide_rounded = IconData(name="shelf_auto_hide", fontFamily="Material Symbols Rounded")
-    shelf_position_rounded = IconData(name="shelf_position", fontFamily="Material Symbols Rounded")
-    shelves_rounded = IconData(name="shelves", fontFamily="Material Symbols Rounded")
-    shield_rounded = IconData(name="shield", fontFamily="Material Symbols Rounded")
-    shield_lock_rounded = IconData(name="shield_lock", fontFamily="Material Symbols Rounded")
-    shield_locked_rounded = IconData(name="shield_locked", fontFamily="Material Symbols Rounded")
-    shield_moon_rounded = IconData(name="shield_moon", fontFamily="Material Symbols Rounded")
-    shield_person_rounded = IconData(name="shield_person", fontFamily="Material Symbols Rounded")
-    shield_question_rounded = IconData(name="shield_question", fontFamily="Material Symbols Rounded")
-    shield_watch_rounded = IconData(name="shield_watch", fontFamily="Material Symbols Rounded")
-    shield_with_heart_rounded = IconData(name="shield_with_heart", fontFamily="Material Symbols Rounded")
-    shield_with_house_rounded = IconData(name="shield_with_house", fontFamily="Material Symbols Rounded")
-    shift_rounded = IconData(name="shift", fontFamily="Material Symbols Rounded")
-    shift_lock_rounded = IconData(name="shift_lock", fontFamily="Material Symbols Rounded")
-    shift_lock_off_rounded = IconData(name="shift_lock_off", fontFamily="Material Symbols Rounded")
-    shop_rounded = IconData(name="shop", fontFamily="Material Symbols Rounded")
-    shop_2_rounded = IconData(name="shop_2", fontFamily="Material Symbols Rounded")
-    shop_two_rounded = IconData(name="shop_two", fontFamily="Material Symbols Rounded")
-    shopping_bag_rounded = IconData(name="shopping_bag", fontFamily="Material Symbols Rounded")
-    shopping_bag_speed_rounded = IconData(name="shopping_bag_speed", fontFamily="Material Symbols Rounded")
-    shopping_basket_rounded = IconData(name="shopping_basket", fontFamily="Material Symbols Rounded")
-    shopping_cart_rounded = IconData(name="shopping_cart", fontFamily="Material Symbols Rounded")
-    shopping_cart_checkout_rounded = IconData(name="shopping_cart_checkout", fontFamily="Material Symbols Rounded")
-    shopping_cart_off_rounded = IconData(name="shopping_cart_off", fontFamily="Material Symbols Rounded")
-    shoppingmode_rounded = IconData(name="shoppingmode", fontFamily="Material Symbols Rounded")
-    short_stay_rounded = IconData(name="short_stay", fontFamily="Material Symbols Rounded")
-    short_text_rounded = IconData(name="short_text", fontFamily="Material Symbols Rounded")
-    shortcut_rounded = IconData(name="shortcut", fontFamily="Material Symbols Rounded")
-    show_chart_rounded = IconData(name="show_chart", fontFamily="Material Symbols Rounded")
-    shower_rounded = IconData(name="shower", fontFamily="Material Symbols Rounded")
-    shuffle_rounded = IconData(name="shuffle", fontFamily="Material Symbols Rounded")
-    shuffle_on_rounded = IconData(name="shuffle_on", fontFamily="Material Symbols Rounded")
-    shutter_speed_rounded = IconData(name="shutter_speed", fontFamily="Material Symbols Rounded")
-    shutter_speed_add_rounded = IconData(name="shutter_speed_add", fontFamily="Material Symbols Rounded")
-    shutter_speed_minus_rounded = IconData(name="shutter_speed_minus", fontFamily="Material Symbols Rounded")
-    sick_rounded = IconData(name="sick", fontFamily="Material Symbols Rounded")
-    side_navigation_rounded = IconData(name="side_navigation", fontFamily="Material Symbols Rounded")
-    sign_language_rounded = IconData(name="sign_language", fontFamily="Material Symbols Rounded")
-    signal_cellular_0_bar_rounded = IconData(name="signal_cellular_0_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_1_bar_rounded = IconData(name="signal_cellular_1_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_2_bar_rounded = IconData(name="signal_cellular_2_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_3_bar_rounded = IconData(name="signal_cellular_3_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_4_bar_rounded = IconData(name="signal_cellular_4_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_add_rounded = IconData(name="signal_cellular_add", fontFamily="Material Symbols Rounded")
-    signal_cellular_alt_rounded = IconData(name="signal_cellular_alt", fontFamily="Material Symbols Rounded")
-    signal_cellular_alt_1_bar_rounded = IconData(name="signal_cellular_alt_1_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_alt_2_bar_rounded = IconData(name="signal_cellular_alt_2_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_connected_no_internet_0_bar_rounded = IconData(name="signal_cellular_connected_no_internet_0_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_connected_no_internet_4_bar_rounded = IconData(name="signal_cellular_connected_no_internet_4_bar", fontFamily="Material Symbols Rounded")
-    signal_cellular_no_sim_rounded = IconData(name="signal_cellular_no_sim", fontFamily="Material Symbols Rounded")
-    signal_cellular_nodata_rounded = IconData(name="signal_cellular_nodata", fontFamily="Material Symbols Rounded")
-    signal_cellular_null_rounded = IconData(name="signal_cellular_null", fontFamily="Material Symbols Rounded")
-    signal_cellular_off_rounded = IconData(name="signal_cellular_off", fontFamily="Material Symbols Rounded")
-    signal_cellular_pause_rounded = IconData(name="signal_cellular_pause", fontFamily="Material Symbols Rounded")
-    signal_disconnected_rounded = IconData(name="signal_disconnected", fontFamily="Material Symbols Rounded")
-    signal_wifi_0_bar_rounded = IconData(name="signal_wifi_0_bar", fontFamily="Material Symbols Rounded")
-    signal_wifi_4_bar_rounded = IconData(name="signal_wifi_4_bar", fontFamily="Material Symbols Rounded")
-    signal_wifi_4_bar_lock_rounded = IconData(name="signal_wifi_4_bar_lock", fontFamily="Material Symbols Rounded")
-    signal_wifi_bad_rounded = IconData(name="signal_wifi_bad", fontFamily="Material Symbols Rounded")
-    signal_wifi_connected_no_internet_4_rounded = IconData(name="signal_wifi_connected_no_internet_4", fontFamily="Material Symbols Rounded")
-    signal_wifi_off_rounded = IconData(name="signal_wifi_off", fontFamily="Material Symbols Rounded")
-    signal_wifi_statusbar_4_bar_rounded = IconData(name="signal_wifi_statusbar_4_bar", fontFamily="Material Symbols Rounded")
-    signal_wifi_statusbar_not_connected_rounded = IconData(name="signal_wifi_statusbar_not_connected", fontFamily="Material Symbols Rounded")
-    signal_wifi_statusbar_null_rounded = IconData(name="signal_wifi_statusbar_null", fontFamily="Material Symbols Rounded")
-    signature_rounded = IconData(name="signature", fontFamily="Material Symbols Rounded")
-    signpost_rounded = IconData(name="signpost", fontFamily="Material Symbols Rounded")
-    sim_card_rounded = IconData(name="sim_card", fontFamily="Material Symbols Rounded")
-    sim_card_alert_rounded = IconData(name="sim_card_alert", fontFamily="Material Symbols Rounded")
-    sim_card_download_rounded = IconData(name="sim_card_download", fontFamily="Material Symbols Rounded")
-    simulation_rounded = IconData(name="simulation", fontFamily="Material Symbols Rounded")
-    single_bed_rounded = IconData(name="single_bed", fontFamily="Material Symbols Rounded")
-    sip_rounded = IconData(name="sip", fontFamily="Material Symbols Rounded")
-    siren_rounded = IconData(name="siren", fontFamily="Material Symbols Rounded")
-    siren_check_rounded = IconData(name="siren_check", fontFamily="Material Symbols Rounded")
-    siren_open_rounded = IconData(name="siren_open", fontFamily="Material Symbols Rounded")
-    siren_question_rounded = IconData(name="siren_question", fontFamily="Material Symbols Rounded")
-    skateboarding_rounded = IconData(name="skateboarding", fontFamily="Material Symbols Rounded")
-    skeleton_rounded = IconData(name="skeleton", fontFamily="Material Symbols Rounded")
-    skillet_rounded = IconData(name="skillet", fontFamily="Material Symbols Rounded")
-    skillet_cooktop_rounded = IconData(name="skillet_cooktop", fontFamily="Material Symbols Rounded")
-    skip_next_rounded = IconData(name="skip_next", fontFamily="Material Symbols Rounded")
-    skip_previous_rounded = IconData(name="skip_previous", fontFamily="Material Symbols Rounded")
-    skull_rounded = IconData(name="skull", fontFamily="Material Symbols Rounded")
-    skull_list_rounded = IconData(name="skull_list", fontFamily="Material Symbols Rounded")
-    slab_serif_rounded = IconData(name="slab_serif", fontFamily="Material Symbols Rounded")
-    sledding_rounded = IconData(name="sledding", fontFamily="Material Symbols Rounded")
-    sleep_rounded = IconData(name="sleep", fontFamily="Material Symbols Rounded")
-    sleep_score_rounded = IconData(name="sleep_score", fontFamily="Material Symbols Rounded")
-    slide_library_rounded = IconData(name="slide_library", fontFamily="Material Symbols Rounded")
-    sliders_rounded = IconData(name="sliders", fontFamily="Material Symbols Rounded")
-    slideshow_rounded = IconData(name="slideshow", fontFamily="Material Symbols Rounded")
-    slow_motion_video_rounded = IconData(name="slow_motion_video", fontFamily="Material Symbols Rounded")
-    smart_button_rounded = IconData(name="smart_button", fontFamily="Material Symbols Rounded")
-    smart_card_reader_rounded = IconData(name="smart_card_reader", fontFamily="Material Symbols Rounded")
-    smart_card_reader_off_rounded = IconData(name="smart_card_reader_off", fontFamily="Material Symbols Rounded")
-    smart_display_rounded = IconData(name="smart_display", fontFamily="Material Symbols Rounded")
-    smart_outlet_rounded = IconData(name="smart_outlet", fontFamily="Material Symbols Rounded")
-    smart_screen_rounded = IconData(name="smart_screen", fontFamily="Material Symbols Rounded")
-    smart_toy_rounded = IconData(name="smart_toy", fontFamily="Material Symbols Rounded")
-    smartphone_rounded = IconData(name="smartphone", fontFamily="Material Symbols Rounded")
-    smartphone_camera_rounded = IconData(name="smartphone_camera", fontFamily="Material Symbols Rounded")
-    smb_share_rounded = IconData(name="smb_share", fontFamily="Material Symbols Rounded")
-    smoke_free_rounded = IconData(name="smoke_free", fontFamily="Material Symbols Rounded")
-    smoking_rooms_rounded = IconData(name="smoking_rooms", fontFamily="Material Symbols Rounded")
-    sms_rounded = IconData(name="sms", fontFamily="Material Symbols Rounded")
-    sms_failed_rounded = IconData(name="sms_failed", fontFamily="Material Symbols Rounded")
-    snippet_folder_rounded = IconData(name="snippet_folder", fontFamily="Material Symbols Rounded")
-    snooze_rounded = IconData(name="snooze", fontFamily="Material Symbols Rounded")
-    snowboarding_rounded = IconData(name="snowboarding", fontFamily="Material Symbols Rounded")
-    snowing_rounded = IconData(name="snowing", fontFamily="Material Symbols Rounded")
-    snowing_heavy_rounded = IconData(name="snowing_heavy", fontFamily="Material Symbols Rounded")
-    snowmobile_rounded = IconData(name="snowmobile", fontFamily="Material Symbols Rounded")
-    snowshoeing_rounded = IconData(name="snowshoeing", fontFamily="Material Symbols Rounded")
-    soap_rounded = IconData(name="soap", fontFamily="Material Symbols Rounded")
-    social_distance_rounded = IconData(name="social_distance", fontFamily="Material Symbols Rounded")
-    social_leaderboard_rounded = IconData(name="social_leaderboard", fontFamily="Material Symbols Rounded")
-    solar_power_rounded = IconData(name="solar_power", fontFamily="Material Symbols Rounded")
-    sort_rounded = IconData(name="sort", fontFamily="Material Symbols Rounded")
-    sort_by_alpha_rounded = IconData(name="sort_by_alpha", fontFamily="Material Symbols Rounded")
-    sos_rounded = IconData(name="sos", fontFamily="Material Symbols Rounded")
-    sound_detection_dog_barking_rounded = IconData(name="sound_detection_dog_barking", fontFamily="Material Symbols Rounded")
-    sound_detection_glass_break_rounded = IconData(name="sound_detection_glass_break", fontFamily="Material Symbols Rounded")
-    sound_detection_loud_sound_rounded = IconData(name="sound_detection_loud_sound", fontFamily="Material Symbols Rounded")
-    sound_sampler_rounded = IconData(name="sound_sampler", fontFamily="Material Symbols Rounded")
-    soup_kitchen_rounded = IconData(name="soup_kitchen", fontFamily="Material Symbols Rounded")
-    source_rounded = IconData(name="source", fontFamily="Material Symbols Rounded")
-    source_environment_rounded = IconData(name="source_environment", fontFamily="Material Symbols Rounded")
-    source_notes_rounded = IconData(name="source_notes", fontFamily="Material Symbols Rounded")
-    south_rounded = IconData(name="south", fontFamily="Material Symbols Rounded")
-    south_america_rounded = IconData(name="south_america", fontFamily="Material Symbols Rounded")
-    south_east_rounded = IconData(name="south_east", fontFamily="Material Symbols Rounded")
-    south_west_rounded = IconData(name="south_west", fontFamily="Material Symbols Rounded")
-    spa_rounded = IconData(name="spa", fontFamily="Material Symbols Rounded")
-    space_bar_rounded = IconData(name="space_bar", fontFamily="Material Symbols Rounded")
-    space_dashboard_rounded = IconData(name="space_dashboard", fontFamily="Material Symbols Rounded")
-    spatial_audio_rounded = IconData(name="spatial_audio", fontFamily="Material Symbols Rounded")
-    spatial_audio_off_rounded = IconData(name="spatial_audio_off", fontFamily="Material Symbols Rounded")
-    spatial_speaker_rounded = IconData(name="spatial_speaker", fontFamily="Material Symbols Rounded")
-    spatial_tracking_rounded = IconData(name="spatial_tracking", fontFamily="Material Symbols Rounded")
-    speaker_rounded = IconData(name="speaker", fontFamily="Material Symbols Rounded")
-    speaker_group_rounded = IconData(name="speaker_group", fontFamily="Material Symbols Rounded")
-    speaker_notes_rounded = IconData(name="speaker_notes", fontFamily="Material Symbols Rounded")
-    speaker_notes_off_rounded = IconData(name="speaker_notes_off", fontFamily="Material Symbols Rounded")
-    speaker_phone_rounded = IconData(name="speaker_phone", fontFamily="Material Symbols Rounded")
-    special_character_rounded = IconData(name="special_character", fontFamily="Material Symbols Rounded")
-    specific_gravity_rounded = IconData(name="specific_gravity", fontFamily="Material Symbols Rounded")
-    speech_to_text_rounded = IconData(name="speech_to_text", fontFamily="Material Symbols Rounded")
-    speed_rounded = IconData(name="speed", fontFamily="Material Symbols Rounded")
-    speed_0_25_rounded = IconData(name="speed_0_25", fontFamily="Material Symbols Rounded")
-    speed_0_2x_rounded = IconData(name="speed_0_2x", fontFamily="Material Symbols Rounded")
-    speed_0_5_rounded = IconData(name="speed_0_5", fontFamily="Material Symbols Rounded")
-    speed_0_5x_rounded = IconData(name="speed_0_5x", fontFamily="Material Symbols Rounded")
-    speed_0_75_rounded = IconData(name="speed_0_75", fontFamily="Material Symbols Rounded")
-    speed_0_7x_rounded = IconData(name="speed_0_7x", fontFamily="Material Symbols Rounded")
-    speed_1_2_rounded = IconData(name="speed_1_2", fontFamily="Material Symbols Rounded")
-    speed_1_25_rounded = IconData(name="speed_1_25", fontFamily="Material Symbols Rounded")
-    speed_1_2x_rounded = IconData(name="speed_1_2x", fontFamily="Material Symbols Rounded")
-    speed_1_5_rounded = IconData(name="speed_1_5", fontFamily="Material Symbols Rounded")
-    speed_1_5x_rounded = IconData(name="speed_1_5x", fontFamily="Material Symbols Rounded")
-    speed_1_75_rounded = IconData(name="speed_1_75", fontFamily="Material Symbols Rounded")
-    speed_1_7x_rounded = IconData(name="speed_1_7x", fontFamily="Material Symbols Rounded")
-    speed_2x_rounded = IconData(name="speed_2x", fontFamily="Material Symbols Rounded")
-    speed_camera_rounded = IconData(name="speed_camera", fontFamily="Material Symbols Rounded")
-    spellcheck_rounded = IconData(name="spellcheck", fontFamily="Material Symbols Rounded")
-    split_scene_rounded = IconData(name="split_scene", fontFamily="Material Symbols Rounded")
-    split_scene_down_rounded = IconData(name="split_scene_down", fontFamily="Material Symbols Rounded")
-    split_scene_left_rounded = IconData(name="split_scene_left", fontFamily="Material Symbols Rounded")
-    split_scene_right_rounded = IconData(name="split_scene_right", fontFamily="Material Symbols Rounded")
-    split_scene_up_rounded = IconData(name="split_scene_up", fontFamily="Material Symbols Rounded")
-    splitscreen_rounded = IconData(name="splitscreen", fontFamily="Material Symbols Rounded")
-    splitscreen_add_rounded = IconData(name="splitscreen_add", fontFamily="Material Symbols Rounded")
-    splitscreen_bottom_rounded = IconData(name="splitscreen_bottom", fontFamily="Material Symbols Rounded")
-    splitscreen_landscape_rounded = IconData(name="splitscreen_landscape", fontFamily="Material Symbols Rounded")
-    splitscreen_left_rounded = IconData(name="splitscreen_left", fontFamily="Material Symbols Rounded")
-    splitscreen_portrait_rounded = IconData(name="splitscreen_portrait", fontFamily="Material Symbols Rounded")
-    splitscreen_right_rounded = IconData(name="splitscreen_right", fontFamily="Material Symbols Rounded")
-    splitscreen_top_rounded = IconData(name="splitscreen_top", fontFamily="Material Symbols Rounded")
-    splitscreen_vertical_add_rounded = IconData(name="splitscreen_vertical_add", fontFamily="Material Symbols Rounded")
-    spo2_rounded = IconData(name="spo2", fontFamily="Material Symbols Rounded")
-    spoke_rounded = IconData(name="spoke", fontFamily="Material Symbols Rounded")
-    sports_rounded = IconData(name="sports", fontFamily="Material Symbols Rounded")
-    sports_and_outdoors_rounded = IconData(name="sports_and_outdoors", fontFamily="Material Symbols Rounded")
-    sports_bar_rounded = IconData(name="sports_bar", fontFamily="Material Symbols Rounded")
-    sports_baseball_rounded = IconData(name="sports_baseball", fontFamily="Material Symbols Rounded")
-    sports_basketball_rounded = IconData(name="sports_basketball", fontFamily="Material Symbols Rounded")
-    sports_cricket_rounded = IconData(name="sports_cricket", fontFamily="Material Symbols Rounded")
-    sports_esports_rounded = IconData(name="sports_esports", fontFamily="Material Symbols Rounded")
-    sports_football_rounded = IconData(name="sports_football", fontFamily="Material Symbols Rounded")
-    sports_golf_rounded = IconData(name="sports_golf", fontFamily="Material Symbols Rounded")
-    sports_gymnastics_rounded = IconData(name="sports_gymnastics", fontFamily="Material Symbols Rounded")
-    sports_handball_rounded = IconData(name="sports_handball", fontFamily="Material Symbols Rounded")
-    sports_hockey_rounded = IconData(name="sports_hockey", fontFamily="Material Symbols Rounded")
-    sports_kabaddi_rounded = IconData(name="sports_kabaddi", fontFamily="Material Symbols Rounded")
-    sports_martial_arts_rounded = IconData(name="sports_martial_arts", fontFamily="Material Symbols Rounded")
-    sports_mma_rounded = IconData(name="sports_mma", fontFamily="Material Symbols Rounded")
-    sports_motorsports_rounded = IconData(name="sports_motorsports", fontFamily="Material Symbols Rounded")
-    sports_rugby_rounded = IconData(name="sports_rugby", fontFamily="Material Symbols Rounded")
-    sports_score_rounded = IconData(name="sports_score", fontFamily="Material Symbols Rounded")
-    sports_soccer_rounded = IconData(name="sports_soccer", fontFamily="Material Symbols Rounded")
-    sports_tennis_rounded = IconData(name="sports_tennis", fontFamily="Material Symbols Rounded")
-    sports_volleyball_rounded = IconData(name="sports_volleyball", fontFamily="Material Symbols Rounded")
-    sprinkler_rounded = IconData(name="sprinkler", fontFamily="Material Symbols Rounded")
-    sprint_rounded = IconData(name="sprint", fontFamily="Material Symbols Rounded")
-    square_rounded = IconData(name="square", fontFamily="Material Symbols Rounded")
-    square_dot_rounded = IconData(name="square_dot", fontFamily="Material Symbols Rounded")
-    square_foot_rounded = IconData(name="square_foot", fontFamily="Material Symbols Rounded")
-    ssid_chart_rounded = IconData(name="ssid_chart", fontFamily="Material Symbols Rounded")
-    stack_rounded = IconData(name="stack", fontFamily="Material Symbols Rounded")
-    stack_group_rounded = IconData(name="stack_group", fontFamily="Material Symbols Rounded")
-    stack_hexagon_rounded = IconData(name="stack_hexagon", fontFamily="Material Symbols Rounded")
-    stack_off_rounded = IconData(name="stack_off", fontFamily="Material Symbols Rounded")
-    stack_star_rounded = IconData(name="stack_star", fontFamily="Material Symbols Rounded")
-    stacked_bar_chart_rounded = IconData(name="stacked_bar_chart", fontFamily="Material Symbols Rounded")
-    stacked_email_rounded = IconData(name="stacked_email", fontFamily="Material Symbols Rounded")
-    stacked_inbox_rounded = IconData(name="stacked_inbox", fontFamily="Material Symbols Rounded")
-    stacked_line_chart_rounded = IconData(name="stacked_line_chart", fontFamily="Material Symbols Rounded")
-    stacks_rounded = IconData(name="stacks", fontFamily="Material Symbols Rounded")
-    stadia_controller_rounded = IconData(name="stadia_controller", fontFamily="Material Symbols Rounded")
-    stadium_rounded = IconData(name="stadium", fontFamily="Material Symbols Rounded")
-    stairs_rounded = IconData(name="stairs", fontFamily="Material Symbols Rounded")
-    stairs_2_rounded = IconData(name="stairs_2", fontFamily="Material Symbols Rounded")
-    star_rounded = IconData(name="star", fontFamily="Material Symbols Rounded")
-    star_border_rounded = IconData(name="star_border", fontFamily="Material Symbols Rounded")
-    star_border_purple500_rounded = IconData(name="star_border_purple500", fontFamily="Material Symbols Rounded")
-    star_half_rounded = IconData(name="star_half", fontFamily="Material Symbols Rounded")
-    star_outline_rounded = IconData(name="star_outline", fontFamily="Material Symbols Rounded")
-    star_purple500_rounded = IconData(name="star_purple500", fontFamily="Material Symbols Rounded")
-    star_rate_rounded = IconData(name="star_rate", fontFamily="Material Symbols Rounded")
-    star_rate_half_rounded = IconData(name="star_rate_half", fontFamily="Material Symbols Rounded")
-    star_shine_rounded = IconData(name="star_shine", fontFamily="Material Symbols Rounded")
-    stars_rounded = IconData(name="stars", fontFamily="Material Symbols Rounded")
-    stars_2_rounded = IconData(name="stars_2", fontFamily="Material Symbols Rounded")
-    start_rounded = IconData(name="start", fontFamily="Material Symbols Rounded")
-    stat_0_rounded = IconData(name="stat_0", fontFamily="Material Symbols Rounded")
-    stat_1_rounded = IconData(name="stat_1", fontFamily="Material Symbols Rounded")
-    stat_2_rounded = IconData(name="stat_2", fontFamily="Material Symbols Rounded")
-    stat_3_rounded = IconData(name="stat_3", fontFamily="Material Symbols Rounded")
-    stat_minus_1_rounded = IconData(name="stat_minus_1", fontFamily="Material Symbols Rounded")
-    stat_minus_2_rounded = IconData(name="stat_minus_2", fontFamily="Material Symbols Rounded")
-    stat_minus_3_rounded = IconData(name="stat_minus_3", fontFamily="Material Symbols Rounded")
-    stay_current_landscape_rounded = IconData(name="stay_current_landscape", fontFamily="Material Symbols Rounded")
-    stay_current_portrait_rounded = IconData(name="stay_current_portrait", fontFamily="Material Symbols Rounded")
-    stay_primary_landscape_rounded = IconData(name="stay_primary_landscape", fontFamily="Material Symbols Rounded")
-    stay_primary_portrait_rounded = IconData(name="stay_primary_portrait", fontFamily="Material Symbols Rounded")
-    steering_wheel_heat_rounded = IconData(name="steering_wheel_heat", fontFamily="Material Symbols Rounded")
-    step_rounded = IconData(name="step", fontFamily="Material Symbols Rounded")
-    step_into_rounded = IconData(name="step_into", fontFamily="Material Symbols Rounded")
-    step_out_rounded = IconData(name="step_out", fontFamily="Material Symbols Rounded")
-    step_over_rounded = IconData(name="step_over", fontFamily="Material Symbols Rounded")
-    steppers_rounded = IconData(name="steppers", fontFamily="Material Symbols Rounded")
-    steps_rounded = IconData(name="steps", fontFamily="Material Symbols Rounded")
-    stethoscope_rounded = IconData(name="stethoscope", fontFamily="Material Symbols Rounded")
-    stethoscope_arrow_rounded = IconData(name="stethoscope_arrow", fontFamily="Material Symbols Rounded")
-    stethoscope_check_rounded = IconData(name="stethoscope_check", fontFamily="Material Symbols Rounded")
-    sticky_note_rounded = IconData(name="sticky_note", fontFamily="Material Symbols Rounded")
-    sticky_note_2_rounded = IconData(name="sticky_note_2", fontFamily="Material Symbols Rounded")
-    stock_media_rounded = IconData(name="stock_media", fontFamily="Material Symbols Rounded")
-    stockpot_rounded = IconData(name="stockpot", fontFamily="Material Symbols Rounded")
-    stop_rounded = IconData(name="stop", fontFamily="Material Symbols Rounded")
-    stop_circle_rounded = IconData(name="stop_circle", fontFamily="Material Symbols Rounded")
-    stop_screen_share_rounded = IconData(name="stop_screen_share", fontFamily="Material Symbols Rounded")
-    storage_rounded = IconData(name="storage", fontFamily="Material Symbols Rounded")
-    store_rounded = IconData(name="store", fontFamily="Material Symbols Rounded")
-    store_mall_directory_rounded = IconData(name="store_mall_directory", fontFamily="Material Symbols Rounded")
-    storefront_rounded = IconData(name="storefront", fontFamily="Material Symbols Rounded")
-    storm_rounded = IconData(name="storm", fontFamily="Material Symbols Rounded")
-    straight_rounded = IconData(name="straight", fontFamily="Material Symbols Rounded")
-    straighten_rounded = IconData(name="straighten", fontFamily="Material Symbols Rounded")
-    strategy_rounded = IconData(name="strategy", fontFamily="Material Symbols Rounded")
-    stream_rounded = IconData(name="stream", fontFamily="Material Symbols Rounded")
-    stream_apps_rounded = IconData(name="stream_apps", fontFamily="Material Symbols Rounded")
-    streetview_rounded = IconData(name="streetview", fontFamily="Material Symbols Rounded")
-    stress_management_rounded = IconData(name="stress_management", fontFamily="Material Symbols Rounded")
-    strikethrough_s_rounded = IconData(name="strikethrough_s", fontFamily="Material Symbols Rounded")
-    stroke_full_rounded = IconData(name="stroke_full", fontFamily="Material Symbols Rounded")
-    stroke_partial_rounded = IconData(name="stroke_partial", fontFamily="Material Symbols Rounded")
-    stroller_rounded = IconData(name="stroller", fontFamily="Material Symbols Rounded")
-    style_rounded = IconData(name="style", fontFamily="Material Symbols Rounded")
-    styler_rounded = IconData(name="styler", fontFamily="Material Symbols Rounded")
-    stylus_rounded = IconData(name="stylus", fontFamily="Material Symbols Rounded")
-    stylus_brush_rounded = IconData(name="stylus_brush", fontFamily="Material Symbols Rounded")
-    stylus_fountain_pen_rounded = IconData(name="stylus_fountain_pen", fontFamily="Material Symbols Rounded")
-    stylus_highlighter_rounded = IconData(name="stylus_highlighter", fontFamily="Material Symbols Rounded")
-    stylus_laser_pointer_rounded = IconData(name="stylus_laser_pointer", fontFamily="Material Symbols Rounded")
-    stylus_note_rounded = IconData(name="stylus_note", fontFamily="Material Symbols Rounded")
-    stylus_pen_rounded = IconData(name="stylus_pen", fontFamily="Material Symbols Rounded")
-    stylus_pencil_rounded = IconData(name="stylus_pencil", fontFamily="Material Symbols Rounded")
-    subdirectory_arrow_left_rounded = IconData(name="subdirectory_arrow_left", fontFamily="Material Symbols Rounded")
-    subdirectory_arrow_right_rounded = IconData(name="subdirectory_arrow_right", fontFamily="Material Symbols Rounded")
-    subheader_rounded = IconData(name="subheader", fontFamily="Material Symbols Rounded")
-    subject_rounded = IconData(name="subject", fontFamily="Material Symbols Rounded")
-    subscript_rounded = IconData(name="subscript", fontFamily="Material Symbols Rounded")
-    subscriptions_rounded = IconData(name="subscriptions", fontFamily="Material Symbols Rounded")
-    subtitles_rounded = IconData(name="subtitles", fontFamily="Material Symbols Rounded")
-    subtitles_gear_rounded = IconData(name="subtitles_gear", fontFamily="Material Symbols Rounded")
-    subtitles_off_rounded = IconData(name="subtitles_off", fontFamily="Material Symbols Rounded")
-    subway_rounded = IconData(name="subway", fontFamily="Material Symbols Rounded")
-    summarize_rounded = IconData(name="summarize", fontFamily="Material Symbols Rounded")
-    sunny_rounded = IconData(name="sunny", fontFamily="Material Symbols Rounded")
-    sunny_snowing_rounded = IconData(name="sunny_snowing", fontFamily="Material Symbols Rounded")
-    superscript_rounded = IconData(name="superscript", fontFamily="Material Symbols Rounded")
-    supervised_user_circle_rounded = IconData(name="supervised_user_circle", fontFamily="Material Symbols Rounded")
-    supervised_user_circle_off_rounded = IconData(name="supervised_user_circle_off", fontFamily="Material Symbols Rounded")
-    supervisor_account_rounded = IconData(name="supervisor_account", fontFamily="Material Symbols Rounded")
-    support_rounded = IconData(name="support", fontFamily="Material Symbols Rounded")
-    support_agent_rounded = IconData(name="support_agent", fontFamily="Material Symbols Rounded")
-    surfing_rounded = IconData(name="surfing", fontFamily="Material Symbols Rounded")
-    surgical_rounded = IconData(name="surgical", fontFamily="Material Symbols Rounded")
-    surround_sound_rounded = IconData(name="surround_sound", fontFamily="Material Symbols Rounded")
-    swap_calls_rounded = IconData(name="swap_calls", fontFamily="Material Symbols Rounded")
-    swap_driving_apps_rounded = IconData(name="swap_driving_apps", fontFamily="Material Symbols Rounded")
-    swap_driving_apps_wheel_rounded = IconData(name="swap_driving_apps_wheel", fontFamily="Material Symbols Rounded")
-    swap_horiz_rounded = IconData(name="swap_horiz", fontFamily="Material Symbols Rounded")
-    swap_horizontal_circle_rounded = IconData(name="swap_horizontal_circle", fontFamily="Material Symbols Rounded")
-    swap_vert_rounded = IconData(name="swap_vert", fontFamily="Material Symbols Rounded")
-    swap_vertical_circle_rounded = IconData(name="swap_vertical_circle", fontFamily="Material Symbols Rounded")
-    sweep_rounded = IconData(name="sweep", fontFamily="Material Symbols Rounded")
-    swipe_rounded = IconData(name="swipe", fontFamily="Material Symbols Rounded")
-    swipe_down_rounded = IconData(name="swipe_down", fontFamily="Material Symbols Rounded")
-    swipe_down_alt_rounded = IconData(name="swipe_down_alt", fontFamily="Material Symbols Rounded")
-    swipe_left_rounded = IconData(name="swipe_left", fontFamily="Material Symbols Rounded")
-    swipe_left_alt_rounded = IconData(name="swipe_left_alt", fontFamily="Material Symbols Rounded")
-    swipe_right_rounded = IconData(name="swipe_right", fontFamily="Material Symbols Rounded")
-    swipe_right_alt_rounded = IconData(name="swipe_right_alt", fontFamily="Material Symbols Rounded")
-    swipe_up_rounded = IconData(name="swipe_up", fontFamily="Material Symbols Rounded")
-    swipe_up_alt_rounded = IconData(name="swipe_up_alt", fontFamily="Material Symbols Rounded")
-    swipe_vertical_rounded = IconData(name="swipe_vertical", fontFamily="Material Symbols Rounded")
-    switch_rounded = IconData(name="switch", fontFamily="Material Symbols Rounded")
-    switch_access_rounded = IconData(name="switch_access", fontFamily="Material Symbols Rounded")
-    switch_access_2_rounded = IconData(name="switch_access_2", fontFamily="Material Symbols Rounded")
-    switch_access_3_rounded = IconData(name="switch_access_3", fontFamily="Material Symbols Rounded")
-    switch_access_shortcut_rounded = IconData(name="switch_access_shortcut", fontFamily="Material Symbols Rounded")
-    switch_access_shortcut_add_rounded = IconData(name="switch_access_shortcut_add", fontFamily="Material Symbols Rounded")
-    switch_account_rounded = IconData(name="switch_account", fontFamily="Material Symbols Rounded")
-    switch_camera_rounded = IconData(name="switch_camera", fontFamily="Material Symbols Rounded")
-    switch_left_rounded = IconData(name="switch_left", fontFamily="Material Symbols Rounded")
-    switch_right_rounded = IconData(name="switch_right", fontFamily="Material Symbols Rounded")
-    switch_video_rounded = IconData(name="switch_video", fontFamily="Material Symbols Rounded")
-    switches_rounded = IconData(name="switches", fontFamily="Material Symbols Rounded")
-    sword_rose_rounded = IconData(name="sword_rose", fontFamily="Material Symbols Rounded")
-    swords_rounded = IconData(name="swords", fontFamily="Material Symbols Rounded")
-    symptoms_rounded = IconData(name="symptoms", fontFamily="Material Symbols Rounded")
-    synagogue_rounded = IconData(name="synagogue", fontFamily="Material Symbols Rounded")
-    sync_rounded = IconData(name="sync", fontFamily="Material Symbols Rounded")
-    sync_alt_rounded = IconData(name="sync_alt", fontFamily="Material Symbols Rounded")
-    sync_arrow_down_rounded = IconData(name="sync_arrow_down", fontFamily="Material Symbols Rounded")
-    sync_arrow_up_rounded = IconData(name="sync_arrow_up", fontFamily="Material Symbols Rounded")
-    sync_desktop_rounded = IconData(name="sync_desktop", fontFamily="Material Symbols Rounded")
-    sync_disabled_rounded = IconData(name="sync_disabled", fontFamily="Material Symbols Rounded")
-    sync_lock_rounded = IconData(name="sync_lock", fontFamily="Material Symbols Rounded")
-    sync_problem_rounded = IconData(name="sync_problem", fontFamily="Material Symbols Rounded")
-    sync_saved_locally_rounded = IconData(name="sync_saved_locally", fontFamily="Material Symbols Rounded")
-    syringe_rounded = IconData(name="syringe", fontFamily="Material Symbols Rounded")
-    system_security_update_rounded = IconData(name="system_security_update", fontFamily="Material Symbols Rounded")
-    system_security_update_good_rounded = IconData(name="system_security_update_good", fontFamily="Material Symbols Rounded")
-    system_security_update_warning_rounded = IconData(name="system_security_update_warning", fontFamily="Material Symbols Rounded")
-    system_update_rounded = IconData(name="system_update", fontFamily="Material Symbols Rounded")
-    system_update_alt_rounded = IconData(name="system_update_alt", fontFamily="Material Symbols Rounded")
-    tab_rounded = IconData(name="tab", fontFamily="Material Symbols Rounded")
-    tab_close_rounded = IconData(name="tab_close", fontFamily="Material Symbols Rounded")
-    tab_close_inactive_rounded = IconData(name="tab_close_inactive", fontFamily="Material Symbols Rounded")
-    tab_close_right_rounded = IconData(name="tab_close_right", fontFamily="Material Symbols Rounded")
-    tab_duplicate_rounded = IconData(name="tab_duplicate", fontFamily="Material Symbols Rounded")
-    tab_group_rounded = IconData(name="tab_group", fontFamily="Material Symbols Rounded")
-    tab_inactive_rounded = IconData(name="tab_inactive", fontFamily="Material Symbols Rounded")
-    tab_move_rounded = IconData(name="tab_move", fontFamily="Material Symbols Rounded")
-    tab_new_right_rounded = IconData(name="tab_new_right", fontFamily="Material Symbols Rounded")
-    tab_recent_rounded = IconData(name="tab_recent", fontFamily="Material Symbols Rounded")
-    tab_search_rounded = IconData(name="tab_search", fontFamily="Material Symbols Rounded")
-    tab_unselected_rounded = IconData(name="tab_unselected", fontFamily="Material Symbols Rounded")
-    table_rounded = IconData(name="table", fontFamily="Material Symbols Rounded")
-    table_bar_rounded = IconData(name="table_bar", fontFamily="Material Symbols Rounded")
-    table_chart_rounded = IconData(name="table_chart", fontFamily="Material Symbols Rounded")
-    table_chart_view_rounded = IconData(name="table_chart_view", fontFamily="Material Symbols Rounded")
-    table_convert_rounded = IconData(name="table_convert", fontFamily="Material Symbols Rounded")
-    table_edit_rounded = IconData(name="table_edit", fontFamily="Material Symbols Rounded")
-    table_eye_rounded = IconData(name="table_eye", fontFamily="Material Symbols Rounded")
-    table_lamp_rounded = IconData(name="table_lamp", fontFamily="Material Symbols Rounded")
-    table_restaurant_rounded = IconData(name="table_restaurant", fontFamily="Material Symbols Rounded")
-    table_rows_rounded = IconData(name="table_rows", fontFamily="Material Symbols Rounded")
-    table_rows_narrow_rounded = IconData(name="table_rows_narrow", fontFamily="Material Symbols Rounded")
-    table_view_rounded = IconData(name="table_view", fontFamily="Material Symbols Rounded")
-    tablet_rounded = IconData(name="tablet", fontFamily="Material Symbols Rounded")
-    tablet_android_rounded = IconData(name="tablet_android", fontFamily="Material Symbols Rounded")
-    tablet_camera_rounded = IconData(name="tablet_camera", fontFamily="Material Symbols Rounded")
-    tablet_mac_rounded = IconData(name="tablet_mac", fontFamily="Material Symbols Rounded")
-    tabs_rounded = IconData(name="tabs", fontFamily="Material Symbols Rounded")
-    tactic_rounded = IconData(name="tactic", fontFamily="Material Symbols Rounded")
-    tag_rounded = IconData(name="tag", fontFamily="Material Symbols Rounded")
-    tag_faces_rounded = IconData(name="tag_faces", fontFamily="Material Symbols Rounded")
-    takeout_dining_rounded = IconData(name="takeout_dining", fontFamily="Material Symbols Rounded")
-    tamper_detection_off_rounded = IconData(name="tamper_detection_off", fontFamily="Material Symbols Rounded")
-    tamper_detection_on_rounded = IconData(name="tamper_detection_on", fontFamily="Material Symbols Rounded")
-    tap_and_play_rounded = IconData(name="tap_and_play", fontFamily="Material Symbols Rounded")
-    tapas_rounded = IconData(name="tapas", fontFamily="Material Symbols Rounded")
-    target_rounded = IconData(name="target", fontFamily="Material Symbols Rounded")
-    task_rounded = IconData(name="task", fontFamily="Material Symbols Rounded")
-    task_alt_rounded = IconData(name="task_alt", fontFamily="Material Symbols Rounded")
-    taunt_rounded = IconData(name="taunt", fontFamily="Material Symbols Rounded")
-    taxi_alert_rounded = IconData(name="taxi_alert", fontFamily="Material Symbols Rounded")
-    team_dashboard_rounded = IconData(name="team_dashboard", fontFamily="Material Symbols Rounded")
-    temp_preferences_custom_rounded = IconData(name="temp_preferences_custom", fontFamily="Material Symbols Rounded")
-    temp_preferences_eco_rounded = IconData(name="temp_preferences_eco", fontFamily="Material Symbols Rounded")
-    temple_buddhist_rounded = IconData(name="temple_buddhist", fontFamily="Material Symbols Rounded")
-    temple_hindu_rounded = IconData(name="temple_hindu", fontFamily="Material Symbols Rounded")
-    tenancy_rounded = IconData(name="tenancy", fontFamily="Material Symbols Rounded")
-    terminal_rounded = IconData(name="terminal", fontFamily="Material Symbols Rounded")
-    terrain_rounded = IconData(name="terrain", fontFamily="Material Symbols Rounded")
-    text_ad_rounded = IconData(name="text_ad", fontFamily="Material Symbols Rounded")
-    text_compare_rounded = IconData(name="text_compare", fontFamily="Material Symbols Rounded")
-    text_decrease_rounded = IconData(name="text_decrease", fontFamily="Material Symbols Rounded")
-    text_fields_rounded = IconData(name="text_fields", fontFamily="Material Symbols Rounded")
-    text_fields_alt_rounded = IconData(name="text_fields_alt", fontFamily="Material Symbols Rounded")
-    text_format_rounded = IconData(name="text_format", fontFamily="Material Symbols Rounded")
-    text_increase_rounded = IconData(name="text_increase", fontFamily="Material Symbols Rounded")
-    text_rotate_up_rounded = IconData(name="text_rotate_up", fontFamily="Material Symbols Rounded")
-    text_rotate_vertical_rounded = IconData(name="text_rotate_vertical", fontFamily="Material Symbols Rounded")
-    text_rotation_angledown_rounded = IconData(name="text_rotation_angledown", fontFamily="Material Symbols Rounded")
-    text_rotation_angleup_rounded = IconData(name="text_rotation_angleup", fontFamily="Material Symbols Rounded")
-    text_rotation_down_rounded = IconData(name="text_rotation_down", fontFamily="Material Symbols Rounded")
-    text_rotation_none_rounded = IconData(name="text_rotation_none", fontFamily="Material Symbols Rounded")
-    text_select_end_rounded = IconData(name="text_select_end", fontFamily="Material Symbols Rounded")
-    text_select_jump_to_beginning_rounded = IconData(name="text_select_jump_to_beginning", fontFamily="Material Symbols Rounded")
-    text_select_jump_to_end_rounded = IconData(name="text_select_jump_to_end", fontFamily="Material Symbols Rounded")
-    text_select_move_back_character_rounded = IconData(name="text_select_move_back_character", fontFamily="Material Symbols Rounded")
-    text_select_move_back_word_rounded = IconData(name="text_select_move_back_word", fontFamily="Material Symbols Rounded")
-    text_select_move_down_rounded = IconData(name="text_select_move_down", fontFamily="Material Symbols Rounded")
-    text_select_move_forward_character_rounded = IconData(name="text_select_move_forward_character", fontFamily="Material Symbols Rounded")
-    text_select_move_forward_word_rounded = IconData(name="text_select_move_forward_word", fontFamily="Material Symbols Rounded")
-    text_select_move_up_rounded = IconData(name="text_select_move_up", fontFamily="Material Symbols Rounded")
-    text_select_start_rounded = IconData(name="text_select_start", fontFamily="Material Symbols Rounded")
-    text_snippet_rounded = IconData(name="text_snippet", fontFamily="Material Symbols Rounded")
-    text_to_speech_rounded = IconData(name="text_to_speech", fontFamily="Material Symbols Rounded")
-    text_up_rounded = IconData(name="text_up", fontFamily="Material Symbols Rounded")
-    textsms_rounded = IconData(name="textsms", fontFamily="Material Symbols Rounded")
-    texture_rounded = IconData(name="texture", fontFamily="Material Symbols Rounded")
-    texture_add_rounded = IconData(name="texture_add", fontFamily="Material Symbols Rounded")
-    texture_minus_rounded = IconData(name="texture_minus", fontFamily="Material Symbols Rounded")
-    theater_comedy_rounded = IconData(name="theater_comedy", fontFamily="Material Symbols Rounded")
-    theaters_rounded = IconData(name="theaters", fontFamily="Material Symbols Rounded")
-    thermometer_rounded = IconData(name="thermometer", fontFamily="Material Symbols Rounded")
-    thermometer_add_rounded = IconData(name="thermometer_add", fontFamily="Material Symbols Rounded")
-    thermometer_gain_rounded = IconData(name="thermometer_gain", fontFamily="Material Symbols Rounded")
-    thermometer_loss_rounded = IconData(name="thermometer_loss", fontFamily="Material Symbols Rounded")
-    thermometer_minus_rounded = IconData(name="thermometer_minus", fontFamily="Material Symbols Rounded")
-    thermostat_rounded = IconData(name="thermostat", fontFamily="Material Symbols Rounded")
-    thermostat_arrow_down_rounded = IconData(name="thermostat_arrow_down", fontFamily="Material Symbols Rounded")
-    thermostat_arrow_up_rounded = IconData(name="thermostat_arrow_up", fontFamily="Material Symbols Rounded")
-    thermostat_auto_rounded = IconData(name="thermostat_auto", fontFamily="Material Symbols Rounded")
-    thermostat_carbon_rounded = IconData(name="thermostat_carbon", fontFamily="Material Symbols Rounded")
-    things_to_do_rounded = IconData(name="things_to_do", fontFamily="Material Symbols Rounded")
-    thread_unread_rounded = IconData(name="thread_unread", fontFamily="Material Symbols Rounded")
-    threat_intelligence_rounded = IconData(name="threat_intelligence", fontFamily="Material Symbols Rounded")
-    thumb_down_rounded = IconData(name="thumb_down", fontFamily="Material Symbols Rounded")
-    thumb_down_alt_rounded = IconData(name="thumb_down_alt", fontFamily="Material Symbols Rounded")
-    thumb_down_filled_rounded = IconData(name="thumb_down_filled", fontFamily="Material Symbols Rounded")
-    thumb_down_off_rounded = IconData(name="thumb_down_off", fontFamily="Material Symbols Rounded")
-    thumb_down_off_alt_rounded = IconData(name="thumb_down_off_alt", fontFamily="Material Symbols Rounded")
-    thumb_up_rounded = IconData(name="thumb_up", fontFamily="Material Symbols Rounded")
-    thumb_up_alt_rounded = IconData(name="thumb_up_alt", fontFamily="Material Symbols Rounded")
-    thumb_up_filled_rounded = IconData(name="thumb_up_filled", fontFamily="Material Symbols Rounded")
-    thumb_up_off_rounded = IconData(name="thumb_up_off", fontFamily="Material Symbols Rounded")
-    thumb_up_off_alt_rounded = IconData(name="thumb_up_off_alt", fontFamily="Material Symbols Rounded")
-    thumbnail_bar_rounded = IconData(name="thumbnail_bar", fontFamily="Material Symbols Rounded")
-    thumbs_up_down_rounded = IconData(name="thumbs_up_down", fontFamily="Material Symbols Rounded")
-    thunderstorm_rounded = IconData(name="thunderstorm", fontFamily="Material Symbols Rounded")
-    tibia_rounded = IconData(name="tibia", fontFamily="Material Symbols Rounded")
-    tibia_alt_rounded = IconData(name="tibia_alt", fontFamily="Material Symbols Rounded")
-    tile_large_rounded = IconData(name="tile_large", fontFamily="Material Symbols Rounded")
-    tile_medium_rounded = IconData(name="tile_medium", fontFamily="Material Symbols Rounded")
-    tile_small_rounded = IconData(name="tile_small", fontFamily="Material Symbols Rounded")
-    time_auto_rounded = IconData(name="time_auto", fontFamily="Material Symbols Rounded")
-    time_to_leave_rounded = IconData(name="time_to_leave", fontFamily="Material Symbols Rounded")
-    timelapse_rounded = IconData(name="timelapse", fontFamily="Material Symbols Rounded")
-    timeline_rounded = IconData(name="timeline", fontFamily="Material Symbols Rounded")
-    timer_rounded = IconData(name="timer", fontFamily="Material Symbols Rounded")
-    timer_10_rounded = IconData(name="timer_10", fontFamily="Material Symbols Rounded")
-    timer_10_alt_1_rounded = IconData(name="timer_10_alt_1", fontFamily="Material Symbols Rounded")
-    timer_10_select_rounded = IconData(name="timer_10_select", fontFamily="Material Symbols Rounded")
-    timer_3_rounded = IconData(name="timer_3", fontFamily="Material Symbols Rounded")
-    timer_3_alt_1_rounded = IconData(name="timer_3_alt_1", fontFamily="Material Symbols Rounded")
-    timer_3_select_rounded = IconData(name="timer_3_select", fontFamily="Material Symbols Rounded")
-    timer_5_rounded = IconData(name="timer_5", fontFamily="Material Symbols Rounded")
-    timer_5_shutter_rounded = IconData(name="timer_5_shutter", fontFamily="Material Symbols Rounded")
-    timer_arrow_down_rounded = IconData(name="timer_arrow_down", fontFamily="Material Symbols Rounded")
-    timer_arrow_up_rounded = IconData(name="timer_arrow_up", fontFamily="Material Symbols Rounded")
-    timer_off_rounded = IconData(name="timer_off", fontFamily="Material Symbols Rounded")
-    timer_pause_rounded = IconData(name="timer_pause", fontFamily="Material Symbols Rounded")
-    timer_play_rounded = IconData(name="timer_play", fontFamily="Material Symbols Rounded")
-    tips_and_updates_rounded = IconData(name="tips_and_updates", fontFamily="Material Symbols Rounded")
-    tire_repair_rounded = IconData(name="tire_repair", fontFamily="Material Symbols Rounded")
-    title_rounded = IconData(name="title", fontFamily="Material Symbols Rounded")
-    titlecase_rounded = IconData(name="titlecase", fontFamily="Material Symbols Rounded")
-    toast_rounded = IconData(name="toast", fontFamily="Material Symbols Rounded")
-    toc_rounded = IconData(name="toc", fontFamily="Material Symbols Rounded")
-    today_rounded = IconData(name="today", fontFamily="Material Symbols Rounded")
-    toggle_off_rounded = IconData(name="toggle_off", fontFamily="Material Symbols Rounded")
-    toggle_on_rounded = IconData(name="toggle_on", fontFamily="Material Symbols Rounded")
-    token_rounded = IconData(name="token", fontFamily="Material Symbols Rounded")
-    toll_rounded = IconData(name="toll", fontFamily="Material Symbols Rounded")
-    tonality_rounded = IconData(name="tonality", fontFamily="Material Symbols Rounded")
-    toolbar_rounded = IconData(name="toolbar", fontFamily="Material Symbols Rounded")
-    tools_flat_head_rounded = IconData(name="tools_flat_head", fontFamily="Material Symbols Rounded")
-    tools_installation_kit_rounded = IconData(name="tools_installation_kit", fontFamily="Material Symbols Rounded")
-    tools_ladder_rounded = IconData(name="tools_ladder", fontFamily="Material Symbols Rounded")
-    tools_level_rounded = IconData(name="tools_level", fontFamily="Material Symbols Rounded")
-    tools_phillips_rounded = IconData(name="tools_phillips", fontFamily="Material Symbols Rounded")
-    tools_pliers_wire_stripper_rounded = IconData(name="tools_pliers_wire_stripper", fontFamily="Material Symbols Rounded")
-    tools_power_drill_rounded = IconData(name="tools_power_drill", fontFamily="Material Symbols Rounded")
-    tools_wrench_rounded = IconData(name="tools_wrench", fontFamily="Material Symbols Rounded")
-    tooltip_rounded = IconData(name="tooltip", fontFamily="Material Symbols Rounded")
-    tooltip_2_rounded = IconData(name="tooltip_2", fontFamily="Material Symbols Rounded")
-    top_panel_close_rounded = IconData(name="top_panel_close", fontFamily="Material Symbols Rounded")
-    top_panel_open_rounded = IconData(name="top_panel_open", fontFamily="Material Symbols Rounded")
-    topic_rounded = IconData(name="topic", fontFamily="Material Symbols Rounded")
-    tornado_rounded = IconData(name="tornado", fontFamily="Material Symbols Rounded")
-    total_dissolved_solids_rounded = IconData(name="total_dissolved_solids", fontFamily="Material Symbols Rounded")
-    touch_app_rounded = IconData(name="touch_app", fontFamily="Material Symbols Rounded")
-    touch_double_rounded = IconData(name="touch_double", fontFamily="Material Symbols Rounded")
-    touch_long_rounded = IconData(name="touch_long", fontFamily="Material Symbols Rounded")
-    touch_triple_rounded = IconData(name="touch_triple", fontFamily="Material Symbols Rounded")
-    touchpad_mouse_rounded = IconData(name="touchpad_mouse", fontFamily="Material Symbols Rounded")
-    touchpad_mouse_off_rounded = IconData(name="touchpad_mouse_off", fontFamily="Material Symbols Rounded")
-    tour_rounded = IconData(name="tour", fontFamily="Material Symbols Rounded")
-    toys_rounded = IconData(name="toys", fontFamily="Material Symbols Rounded")
-    toys_and_games_rounded = IconData(name="toys_and_games", fontFamily="Material Symbols Rounded")
-    toys_fan_rounded = IconData(name="toys_fan", fontFamily="Material Symbols Rounded")
-    track_changes_rounded = IconData(name="track_changes", fontFamily="Material Symbols Rounded")
-    trackpad_input_rounded = IconData(name="trackpad_input", fontFamily="Material Symbols Rounded")
-    trackpad_input_2_rounded = IconData(name="trackpad_input_2", fontFamily="Material Symbols Rounded")
-    trackpad_input_3_rounded = IconData(name="trackpad_input_3", fontFamily="Material Symbols Rounded")
-    traffic_rounded = IconData(name="traffic", fontFamily="Material Symbols Rounded")
-    traffic_jam_rounded = IconData(name="traffic_jam", fontFamily="Material Symbols Rounded")
-    trail_length_rounded = IconData(name="trail_length", fontFamily="Material Symbols Rounded")
-    trail_length_medium_rounded = IconData(name="trail_length_medium", fontFamily="Material Symbols Rounded")
-    trail_length_short_rounded = IconData(name="trail_length_short", fontFamily="Material Symbols Rounded")
-    train_rounded = IconData(name="train", fontFamily="Material Symbols Rounded")
-    tram_rounded = IconData(name="tram", fontFamily="Material Symbols Rounded")
-    transcribe_rounded = IconData(name="transcribe", fontFamily="Material Symbols Rounded")
-    transfer_within_a_station_rounded = IconData(name="transfer_within_a_station", fontFamily="Material Symbols Rounded")
-    transform_rounded = IconData(name="transform", fontFamily="Material Symbols Rounded")
-    transgender_rounded = IconData(name="transgender", fontFamily="Material Symbols Rounded")
-    transit_enterexit_rounded = IconData(name="transit_enterexit", fontFamily="Material Symbols Rounded")
-    transit_ticket_rounded = IconData(name="transit_ticket", fontFamily="Material Symbols Rounded")
-    transition_chop_rounded = IconData(name="transition_chop", fontFamily="Material Symbols Rounded")
-    transition_dissolve_rounded = IconData(name="transition_dissolve", fontFamily="Material Symbols Rounded")
-    transition_fade_rounded = IconData(name="transition_fade", fontFamily="Material Symbols Rounded")
-    transition_push_rounded = IconData(name="transition_push", fontFamily="Material Symbols Rounded")
-    transition_slide_rounded = IconData(name="transition_slide", fontFamily="Material Symbols Rounded")
-    translate_rounded = IconData(name="translate", fontFamily="Material Symbols Rounded")
-    transportation_rounded = IconData(name="transportation", fontFamily="Material Symbols Rounded")
-    travel_rounded = IconData(name="travel", fontFamily="Material Symbols Rounded")
-    travel_explore_rounded = IconData(name="travel_explore", fontFamily="Material Symbols Rounded")
-    travel_luggage_and_bags_rounded = IconData(name="travel_luggage_and_bags", fontFamily="Material Symbols Rounded")
-    trending_down_rounded = IconData(name="trending_down", fontFamily="Material Symbols Rounded")
-    trending_flat_rounded = IconData(name="trending_flat", fontFamily="Material Symbols Rounded")
-    trending_up_rounded = IconData(name="trending_up", fontFamily="Material Symbols Rounded")
-    trip_rounded = IconData(name="trip", fontFamily="Material Symbols Rounded")
-    trip_origin_rounded = IconData(name="trip_origin", fontFamily="Material Symbols Rounded")
-    trolley_rounded = IconData(name="trolley", fontFamily="Material Symbols Rounded")
-    trolley_cable_car_rounded = IconData(name="trolley_cable_car", fontFamily="Material Symbols Rounded")
-    trophy_rounded = IconData(name="trophy", fontFamily="Material Symbols Rounded")
-    troubleshoot_rounded = IconData(name="troubleshoot", fontFamily="Material Symbols Rounded")
-    try_rounded = IconData(name="try", fontFamily="Material Symbols Rounded")
-    tsunami_rounded = IconData(name="tsunami", fontFamily="Material Symbols Rounded")
-    tsv_rounded = IconData(name="tsv", fontFamily="Material Symbols Rounded")
-    tty_rounded = IconData(name="tty", fontFamily="Material Symbols Rounded")
-    tune_rounded = IconData(name="tune", fontFamily="Material Symbols Rounded")
-    tungsten_rounded = IconData(name="tungsten", fontFamily="Material Symbols Rounded")
-    turn_left_rounded = IconData(name="turn_left", fontFamily="Material Symbols Rounded")
-    turn_right_rounded = IconData(name="turn_right", fontFamily="Material Symbols Rounded")
-    turn_sharp_left_rounded = IconData(name="turn_sharp_left", fontFamily="Material Symbols Rounded")
-    turn_sharp_right_rounded = IconData(name="turn_sharp_right", fontFamily="Material Symbols Rounded")
-    turn_slight_left_rounded = IconData(name="turn_slight_left", fontFamily="Material Symbols Rounded")
-    turn_slight_right_rounded = IconData(name="turn_slight_right", fontFamily="Material Symbols Rounded")
-    turned_in_rounded = IconData(name="turned_in", fontFamily="Material Symbols Rounded")
-    turned_in_not_rounded = IconData(name="turned_in_not", fontFamily="Material Symbols Rounded")
-    tv_rounded = IconData(name="tv", fontFamily="Material Symbols Rounded")
-    tv_displays_rounded = IconData(name="tv_displays", fontFamily="Material Symbols Rounded")
-    tv_gen_rounded = IconData(name="tv_gen", fontFamily="Material Symbols Rounded")
-    tv_guide_rounded = IconData(name="tv_guide", fontFamily="Material Symbols Rounded")
-    tv_next_rounded = IconData(name="tv_next", fontFamily="Material Symbols Rounded")
-    tv_off_rounded = IconData(name="tv_off", fontFamily="Material Symbols Rounded")
-    tv_options_edit_channels_rounded = IconData(name="tv_options_edit_channels", fontFamily="Material Symbols Rounded")
-    tv_options_input_settings_rounded = IconData(name="tv_options_input_settings", fontFamily="Material Symbols Rounded")
-    tv_remote_rounded = IconData(name="tv_remote", fontFamily="Material Symbols Rounded")
-    tv_signin_rounded = IconData(name="tv_signin", fontFamily="Material Symbols Rounded")
-    tv_with_assistant_rounded = IconData(name="tv_with_assistant", fontFamily="Material Symbols Rounded")
-    two_pager_rounded = IconData(name="two_pager", fontFamily="Material Symbols Rounded")
-    two_pager_store_rounded = IconData(name="two_pager_store", fontFamily="Material Symbols Rounded")
-    two_wheeler_rounded = IconData(name="two_wheeler", fontFamily="Material Symbols Rounded")
-    type_specimen_rounded = IconData(name="type_specimen", fontFamily="Material Symbols Rounded")
-    u_turn_left_rounded = IconData(name="u_turn_left", fontFamily="Material Symbols Rounded")
-    u_turn_right_rounded = IconData(name="u_turn_right", fontFamily="Material Symbols Rounded")
-    ulna_radius_rounded = IconData(name="ulna_radius", fontFamily="Material Symbols Rounded")
-    ulna_radius_alt_rounded = IconData(name="ulna_radius_alt", fontFamily="Material Symbols Rounded")
-    umbrella_rounded = IconData(name="umbrella", fontFamily="Material Symbols Rounded")
-    unarchive_rounded = IconData(name="unarchive", fontFamily="Material Symbols Rounded")
-    undo_rounded = IconData(name="undo", fontFamily="Material Symbols Rounded")
-    unfold_less_rounded = IconData(name="unfold_less", fontFamily="Material Symbols Rounded")
-    unfold_less_double_rounded = IconData(name="unfold_less_double", fontFamily="Material Symbols Rounded")
-    unfold_more_rounded = IconData(name="unfold_more", fontFamily="Material Symbols Rounded")
-    unfold_more_double_rounded = IconData(name="unfold_more_double", fontFamily="Material Symbols Rounded")
-    ungroup_rounded = IconData(name="ungroup", fontFamily="Material Symbols Rounded")
-    universal_currency_rounded = IconData(name="universal_currency", fontFamily="Material Symbols Rounded")
-    universal_currency_alt_rounded = IconData(name="universal_currency_alt", fontFamily="Material Symbols Rounded")
-    universal_local_rounded = IconData(name="universal_local", fontFamily="Material Symbols Rounded")
-    unknown_2_rounded = IconData(name="unknown_2", fontFamily="Material Symbols Rounded")
-    unknown_5_rounded = IconData(name="unknown_5", fontFamily="Material Symbols Rounded")
-    unknown_7_rounded = IconData(name="unknown_7", fontFamily="Material Symbols Rounded")
-    unknown_document_rounded = IconData(name="unknown_document", fontFamily="Material Symbols Rounded")
-    unknown_med_rounded = IconData(name="unknown_med", fontFamily="Material Symbols Rounded")
-    unlicense_rounded = IconData(name="unlicense", fontFamily="Material Symbols Rounded")
-    unpaved_road_rounded = IconData(name="unpaved_road", fontFamily="Material Symbols Rounded")
-    unpin_rounded = IconData(name="unpin", fontFamily="Material Symbols Rounded")
-    unpublished_rounded = IconData(name="unpublished", fontFamily="Material Symbols Rounded")
-    unsubscribe_rounded = IconData(name="unsubscribe", fontFamily="Material Symbols Rounded")
-    upcoming_rounded = IconData(name="upcoming", fontFamily="Material Symbols Rounded")
-    update_rounded = IconData(name="update", fontFamily="Material Symbols Rounded")
-    update_disabled_rounded = IconData(name="update_disabled", fontFamily="Material Symbols Rounded")
-    upgrade_rounded = IconData(name="upgrade", fontFamily="Material Symbols Rounded")
-    upi_pay_rounded = IconData(name="upi_pay", fontFamily="Material Symbols Rounded")
-    upload_rounded = IconData(name="upload", fontFamily="Material Symbols Rounded")
-    upload_2_rounded = IconData(name="upload_2", fontFamily="Material Symbols Rounded")
-    upload_file_rounded = IconData(name="upload_file", fontFamily="Material Symbols Rounded")
-    uppercase_rounded = IconData(name="uppercase", fontFamily="Material Symbols Rounded")
-    urology_rounded = IconData(name="urology", fontFamily="Material Symbols Rounded")
-    usb_rounded = IconData(name="usb", fontFamily="Material Symbols Rounded")
-    usb_off_rounded = IconData(name="usb_off", fontFamily="Material Symbols Rounded")
-    user_attributes_rounded = IconData(name="user_attributes", fontFamily="Material Symbols Rounded")
-    vaccines_rounded = IconData(name="vaccines", fontFamily="Material Symbols Rounded")
-    vacuum_rounded = IconData(name="vacuum", fontFamily="Material Symbols Rounded")
-    valve_rounded = IconData(name="valve", fontFamily="Material Symbols Rounded")
-    vape_free_rounded = IconData(name="vape_free", fontFamily="Material Symbols Rounded")
-    vaping_rooms_rounded = IconData(name="vaping_rooms", fontFamily="Material Symbols Rounded")
-    variable_add_rounded = IconData(name="variable_add", fontFamily="Material Symbols Rounded")
-    variable_insert_rounded = IconData(name="variable_insert", fontFamily="Material Symbols Rounded")
-    variable_remove_rounded = IconData(name="variable_remove", fontFamily="Material Symbols Rounded")
-    variables_rounded = IconData(name="variables", fontFamily="Material Symbols Rounded")
-    ventilator_rounded = IconData(name="ventilator", fontFamily="Material Symbols Rounded")
-    verified_rounded = IconData(name="verified", fontFamily="Material Symbols Rounded")
-    verified_off_rounded = IconData(name="verified_off", fontFamily="Material Symbols Rounded")
-    verified_user_rounded = IconData(name="verified_user", fontFamily="Material Symbols Rounded")
-    vertical_align_bottom_rounded = IconData(name="vertical_align_bottom", fontFamily="Material Symbols Rounded")
-    vertical_align_center_rounded = IconData(name="vertical_align_center", fontFamily="Material Symbols Rounded")
-    vertical_align_top_rounded = IconData(name="vertical_align_top", fontFamily="Material Symbols Rounded")
-    vertical_distribute_rounded = IconData(name="vertical_distribute", fontFamily="Material Symbols Rounded")
-    vertical_shades_rounded = IconData(name="vertical_shades", fontFamily="Material Symbols Rounded")
-    vertical_shades_closed_rounded = IconData(name="vertical_shades_closed", fontFamily="Material Symbols Rounded")
-    vertical_split_rounded = IconData(name="vertical_split", fontFamily="Material Symbols Rounded")
-    vibration_rounded = IconData(name="vibration", fontFamily="Material Symbols Rounded")
-    video_call_rounded = IconData(name="video_call", fontFamily="Material Symbols Rounded")
-    video_camera_back_rounded = IconData(name="video_camera_back", fontFamily="Material Symbols Rounded")
-    video_camera_back_add_rounded = IconData(name="video_camera_back_add", fontFamily="Material Symbols Rounded")
-    video_camera_front_rounded = IconData(name="video_camera_front", fontFamily="Material Symbols Rounded")
-    video_camera_front_off_rounded = IconData(name="video_camera_front_off", fontFamily="Material Symbols Rounded")
-    video_chat_rounded = IconData(name="video_chat", fontFamily="Material Symbols Rounded")
-    video_file_rounded = IconData(name="video_file", fontFamily="Material Symbols Rounded")
-    video_label_rounded = IconData(name="video_label", fontFamily="Material Symbols Rounded")
-    video_library_rounded = IconData(name="video_library", fontFamily="Material Symbols Rounded")
-    video_search_rounded = IconData(name="video_search", fontFamily="Material Symbols Rounded")
-    video_settings_rounded = IconData(name="video_settings", fontFamily="Material Symbols Rounded")
-    video_stable_rounded = IconData(name="video_stable", fontFamily="Material Symbols Rounded")
-    videocam_rounded = IconData(name="videocam", fontFamily="Material Symbols Rounded")
-    videocam_alert_rounded = IconData(name="videocam_alert", fontFamily="Material Symbols Rounded")
-    videocam_off_rounded = IconData(name="videocam_off", fontFamily="Material Symbols Rounded")
-    videogame_asset_rounded = IconData(name="videogame_asset", fontFamily="Material Symbols Rounded")
-    videogame_asset_off_rounded = IconData(name="videogame_asset_off", fontFamily="Material Symbols Rounded")
-    view_agenda_rounded = IconData(name="view_agenda", fontFamily="Material Symbols Rounded")
-    view_apps_rounded = IconData(name="view_apps", fontFamily="Material Symbols Rounded")
-    view_array_rounded = IconData(name="view_array", fontFamily="Material Symbols Rounded")
-    view_carousel_rounded = IconData(name="view_carousel", fontFamily="Material Symbols Rounded")
-    view_column_rounded = IconData(name="view_column", fontFamily="Material Symbols Rounded")
-    view_column_2_rounded = IconData(name="view_column_2", fontFamily="Material Symbols Rounded")
-    view_comfy_rounded = IconData(name="view_comfy", fontFamily="Material Symbols Rounded")
-    view_comfy_alt_rounded = IconData(name="view_comfy_alt", fontFamily="Material Symbols Rounded")
-    view_compact_rounded = IconData(name="view_compact", fontFamily="Material Symbols Rounded")
-    view_compact_alt_rounded = IconData(name="view_compact_alt", fontFamily="Material Symbols Rounded")
-    view_cozy_rounded = IconData(name="view_cozy", fontFamily="Material Symbols Rounded")
-    view_day_rounded = IconData(name="view_day", fontFamily="Material Symbols Rounded")
-    view_headline_rounded = IconData(name="view_headline", fontFamily="Material Symbols Rounded")
-    view_in_ar_rounded = IconData(name="view_in_ar", fontFamily="Material Symbols Rounded")
-    view_in_ar_new_rounded = IconData(name="view_in_ar_new", fontFamily="Material Symbols Rounded")
-    view_in_ar_off_rounded = IconData(name="view_in_ar_off", fontFamily="Material Symbols Rounded")
-    view_kanban_rounded = IconData(name="view_kanban", fontFamily="Material Symbols Rounded")
-    view_list_rounded = IconData(name="view_list", fontFamily="Material Symbols Rounded")
-    view_module_rounded = IconData(name="view_module", fontFamily="Material Symbols Rounded")
-    view_object_track_rounded = IconData(name="view_object_track", fontFamily="Material Symbols Rounded")
-    view_quilt_rounded = IconData(name="view_quilt", fontFamily="Material Symbols Rounded")
-    view_real_size_rounded = IconData(name="view_real_size", fontFamily="Material Symbols Rounded")
-    view_sidebar_rounded = IconData(name="view_sidebar", fontFamily="Material Symbols Rounded")
-    view_stream_rounded = IconData(name="view_stream", fontFamily="Material Symbols Rounded")
-    view_timeline_rounded = IconData(name="view_timeline", fontFamily="Material Symbols Rounded")
-    view_week_rounded = IconData(name="view_week", fontFamily="Material Symbols Rounded")
-    vignette_rounded = IconData(name="vignette", fontFamily="Material Symbols Rounded")
-    villa_rounded = IconData(name="villa", fontFamily="Material Symbols Rounded")
-    visibility_rounded = IconData(name="visibility", fontFamily="Material Symbols Rounded")
-    visibility_lock_rounded = IconData(name="visibility_lock", fontFamily="Material Symbols Rounded")
-    visibility_off_rounded = IconData(name="visibility_off", fontFamily="Material Symbols Rounded")
-    vital_signs_rounded = IconData(name="vital_signs", fontFamily="Material Symbols Rounded")
-    vitals_rounded = IconData(name="vitals", fontFamily="Material Symbols Rounded")
-    vo2_max_rounded = IconData(name="vo2_max", fontFamily="Material Symbols Rounded")
-    voice_chat_rounded = IconData(name="voice_chat", fontFamily="Material Symbols Rounded")
-    voice_over_off_rounded = IconData(name="voice_over_off", fontFamily="Material Symbols Rounded")
-    voice_selection_rounded = IconData(name="voice_selection", fontFamily="Material Symbols Rounded")
-    voice_selection_off_rounded = IconData(name="voice_selection_off", fontFamily="Material Symbols Rounded")
-    voicemail_rounded = IconData(name="voicemail", fontFamily="Material Symbols Rounded")
-    voicemail_2_rounded = IconData(name="voicemail_2", fontFamily="Material Symbols Rounded")
-    volcano_rounded = IconData(name="volcano", fontFamily="Material Symbols Rounded")
-    volume_down_rounded = IconData(name="volume_down", fontFamily="Material Symbols Rounded")
-    volume_down_alt_rounded = IconData(name="volume_down_alt", fontFamily="Material Symbols Rounded")
-    volume_mute_rounded = IconData(name="volume_mute", fontFamily="Material Symbols Rounded")
-    volume_off_rounded = IconData(name="volume_off", fontFamily="Material Symbols Rounded")
-    volume_up_rounded = IconData(name="volume_up", fontFamily="Material Symbols Rounded")
-    volunteer_activism_rounded = IconData(name="volunteer_activism", fontFamily="Material Symbols Rounded")
-    voting_chip_rounded = IconData(name="voting_chip", fontFamily="Material Symbols Rounded")
-    vpn_key_rounded = IconData(name="vpn_key", fontFamily="Material Symbols Rounded")
-    vpn_key_alert_rounded = IconData(name="vpn_key_alert", fontFamily="Material Symbols Rounded")
-    vpn_key_off_rounded = IconData(name="vpn_key_off", fontFamily="Material Symbols Rounded")
-    vpn_lock_rounded = IconData(name="vpn_lock", fontFamily="Material Symbols Rounded")
-    vpn_lock_2_rounded = IconData(name="vpn_lock_2", fontFamily="Material Symbols Rounded")
-    vr180_create2d_rounded = IconData(name="vr180_create2d", fontFamily="Material Symbols Rounded")
-    vr180_create2d_off_rounded = IconData(name="vr180_create2d_off", fontFamily="Material Symbols Rounded")
-    vrpano_rounded = IconData(name="vrpano", fontFamily="Material Symbols Rounded")
-    wall_art_rounded = IconData(name="wall_art", fontFamily="Material Symbols Rounded")
-    wall_lamp_rounded = IconData(name="wall_lamp", fontFamily="Material Symbols Rounded")
-    wallet_rounded = IconData(name="wallet", fontFamily="Material Symbols Rounded")
-    wallpaper_rounded = IconData(name="wallpaper", fontFamily="Material Symbols Rounded")
-    wallpaper_slideshow_rounded = IconData(name="wallpaper_slideshow", fontFamily="Material Symbols Rounded")
-    wand_shine_rounded = IconData(name="wand_shine", fontFamily="Material Symbols Rounded")
-    wand_stars_rounded = IconData(name="wand_stars", fontFamily="Material Symbols Rounded")
-    ward_rounded = IconData(name="ward", fontFamily="Material Symbols Rounded")
-    warehouse_rounded = IconData(name="warehouse", fontFamily="Material Symbols Rounded")
-    warning_rounded = IconData(name="warning", fontFamily="Material Symbols Rounded")
-    warning_amber_rounded = IconData(name="warning_amber", fontFamily="Material Symbols Rounded")
-    warning_off_rounded = IconData(name="warning_off", fontFamily="Material Symbols Rounded")
-    wash_rounded = IconData(name="wash", fontFamily="Material Symbols Rounded")
-    watch_rounded = IconData(name="watch", fontFamily="Material Symbols Rounded")
-    watch_button_press_rounded = IconData(name="watch_button_press", fontFamily="Material Symbols Rounded")
-    watch_check_rounded = IconData(name="watch_check", fontFamily="Material Symbols Rounded")
-    watch_later_rounded = IconData(name="watch_later", fontFamily="Material Symbols Rounded")
-    watch_off_rounded = IconData(name="watch_off", fontFamily="Material Symbols Rounded")
-    watch_screentime_rounded = IconData(name="watch_screentime", fontFamily="Material Symbols Rounded")
-    watch_vibration_rounded = IconData(name="watch_vibration", fontFamily="Material Symbols Rounded")
-    watch_wake_rounded = IconData(name="watch_wake", fontFamily="Material Symbols Rounded")
-    water_rounded = IconData(name="water", fontFamily="Material Symbols Rounded")
-    water_bottle_rounded = IconData(name="water_bottle", fontFamily="Material Symbols Rounded")
-    water_bottle_large_rounded = IconData(name="water_bottle_large", fontFamily="Material Symbols Rounded")
-    water_damage_rounded = IconData(name="water_damage", fontFamily="Material Symbols Rounded")
-    water_do_rounded = IconData(name="water_do", fontFamily="Material Symbols Rounded")
-    water_drop_rounded = IconData(name="water_drop", fontFamily="Material Symbols Rounded")
-    water_ec_rounded = IconData(name="water_ec", fontFamily="Material Symbols Rounded")
-    water_full_rounded = IconData(name="water_full", fontFamily="Material Symbols Rounded")
-    water_heater_rounded = IconData(name="water_heater", fontFamily="Material Symbols Rounded")
-    water_lock_rounded = IconData(name="water_lock", fontFamily="Material Symbols Rounded")
-    water_loss_rounded = IconData(name="water_loss", fontFamily="Material Symbols Rounded")
-    water_lux_rounded = IconData(name="water_lux", fontFamily="Material Symbols Rounded")
-    water_medium_rounded = IconData(name="water_medium", fontFamily="Material Symbols Rounded")
-    water_orp_rounded = IconData(name="water_orp", fontFamily="Material Symbols Rounded")
-    water_ph_rounded = IconData(name="water_ph", fontFamily="Material Symbols Rounded")
-    water_pump_rounded = IconData(name="water_pump", fontFamily="Material Symbols Rounded")
-    water_voc_rounded = IconData(name="water_voc", fontFamily="Material Symbols Rounded")
-    waterfall_chart_rounded = IconData(name="waterfall_chart", fontFamily="Material Symbols Rounded")
-    waves_rounded = IconData(name="waves", fontFamily="Material Symbols Rounded")
-    waving_hand_rounded = IconData(name="waving_hand", fontFamily="Material Symbols Rounded")
-    wb_auto_rounded = IconData(name="wb_auto", fontFamily="Material Symbols Rounded")
-    wb_cloudy_rounded = IconData(name="wb_cloudy", fontFamily="Material Symbols Rounded")
-    wb_incandescent_rounded = IconData(name="wb_incandescent", fontFamily="Material Symbols Rounded")
-    wb_iridescent_rounded = IconData(name="wb_iridescent", fontFamily="Material Symbols Rounded")
-    wb_shade_rounded = IconData(name="wb_shade", fontFamily="Material Symbols Rounded")
-    wb_sunny_rounded = IconData(name="wb_sunny", fontFamily="Material Symbols Rounded")
-    wb_twilight_rounded = IconData(name="wb_twilight", fontFamily="Material Symbols Rounded")
-    wc_rounded = IconData(name="wc", fontFamily="Material Symbols Rounded")
-    weather_hail_rounded = IconData(name="weather_hail", fontFamily="Material Symbols Rounded")
-    weather_mix_rounded = IconData(name="weather_mix", fontFamily="Material Symbols Rounded")
-    weather_snowy_rounded = IconData(name="weather_snowy", fontFamily="Material Symbols Rounded")
-    web_rounded = IconData(name="web", fontFamily="Material Symbols Rounded")
-    web_asset_rounded = IconData(name="web_asset", fontFamily="Material Symbols Rounded")
-    web_asset_off_rounded = IconData(name="web_asset_off", fontFamily="Material Symbols Rounded")
-    web_stories_rounded = IconData(name="web_stories", fontFamily="Material Symbols Rounded")
-    web_traffic_rounded = IconData(name="web_traffic", fontFamily="Material Symbols Rounded")
-    webhook_rounded = IconData(name="webhook", fontFamily="Material Symbols Rounded")
-    weekend_rounded = IconData(name="weekend", fontFamily="Material Symbols Rounded")
-    weight_rounded = IconData(name="weight", fontFamily="Material Symbols Rounded")
-    west_rounded = IconData(name="west", fontFamily="Material Symbols Rounded")
-    whatshot_rounded = IconData(name="whatshot", fontFamily="Material Symbols Rounded")
-    wheelchair_pickup_rounded = IconData(name="wheelchair_pickup", fontFamily="Material Symbols Rounded")
-    where_to_vote_rounded = IconData(name="where_to_vote", fontFamily="Material Symbols Rounded")
-    widget_medium_rounded = IconData(name="widget_medium", fontFamily="Material Symbols Rounded")
-    widget_small_rounded = IconData(name="widget_small", fontFamily="Material Symbols Rounded")
-    widget_width_rounded = IconData(name="widget_width", fontFamily="Material Symbols Rounded")
-    widgets_rounded = IconData(name="widgets", fontFamily="Material Symbols Rounded")
-    width_rounded = IconData(name="width", fontFamily="Material Symbols Rounded")
-    width_full_rounded = IconData(name="width_full", fontFamily="Material Symbols Rounded")
-    width_normal_rounded = IconData(name="width_normal", fontFamily="Material Symbols Rounded")
-    width_wide_rounded = IconData(name="width_wide", fontFamily="Material Symbols Rounded")
-    wifi_rounded = IconData(name="wifi", fontFamily="Material Symbols Rounded")
-    wifi_1_bar_rounded = IconData(name="wifi_1_bar", fontFamily="Material Symbols Rounded")
-    wifi_2_bar_rounded = IconData(name="wifi_2_bar", fontFamily="Material Symbols Rounded")
-    wifi_add_rounded = IconData(name="wifi_add", fontFamily="Material Symbols Rounded")
-    wifi_calling_rounded = IconData(name="wifi_calling", fontFamily="Material Symbols Rounded")
-    wifi_calling_1_rounded = IconData(name="wifi_calling_1", fontFamily="Material Symbols Rounded")
-    wifi_calling_2_rounded = IconData(name="wifi_calling_2", fontFamily="Material Symbols Rounded")
-    wifi_calling_3_rounded = IconData(name="wifi_calling_3", fontFamily="Material Symbols Rounded")
-    wifi_calling_bar_1_rounded = IconData(name="wifi_calling_bar_1", fontFamily="Material Symbols Rounded")
-    wifi_calling_bar_2_rounded = IconData(name="wifi_calling_bar_2", fontFamily="Material Symbols Rounded")
-    wifi_calling_bar_3_rounded = IconData(name="wifi_calling_bar_3", fontFamily="Material Symbols Rounded")
-    wifi_channel_rounded = IconData(name="wifi_channel", fontFamily="Material Symbols Rounded")
-    wifi_find_rounded = IconData(name="wifi_find", fontFamily="Material Symbols Rounded")
-    wifi_home_rounded = IconData(name="wifi_home", fontFamily="Material Symbols Rounded")
-    wifi_lock_rounded = IconData(name="wifi_lock", fontFamily="Material Symbols Rounded")
-    wifi_notification_rounded = IconData(name="wifi_notification", fontFamily="Material Symbols Rounded")
-    wifi_off_rounded = IconData(name="wifi_off", fontFamily="Material Symbols Rounded")
-    wifi_password_rounded = IconData(name="wifi_password", fontFamily="Material Symbols Rounded")
-    wifi_protected_setup_rounded = IconData(name="wifi_protected_setup", fontFamily="Material Symbols Rounded")
-    wifi_proxy_rounded = IconData(name="wifi_proxy", fontFamily="Material Symbols Rounded")
-    wifi_tethering_rounded = IconData(name="wifi_tethering", fontFamily="Material Symbols Rounded")
-    wifi_tethering_error_rounded = IconData(name="wifi_tethering_error", fontFamily="Material Symbols Rounded")
-    wifi_tethering_off_rounded = IconData(name="wifi_tethering_off", fontFamily="Material Symbols Rounded")
-    wind_power_rounded = IconData(name="wind_power", fontFamily="Material Symbols Rounded")
-    window_rounded = IconData(name="window", fontFamily="Material Symbols Rounded")
-    window_closed_rounded = IconData(name="window_closed", fontFamily="Material Symbols Rounded")
-    window_open_rounded = IconData(name="window_open", fontFamily="Material Symbols Rounded")
-    window_sensor_rounded = IconData(name="window_sensor", fontFamily="Material Symbols Rounded")
-    windshield_defrost_front_rounded = IconData(name="windshield_defrost_front", fontFamily="Material Symbols Rounded")
-    windshield_defrost_rear_rounded = IconData(name="windshield_defrost_rear", fontFamily="Material Symbols Rounded")
-    windshield_heat_front_rounded = IconData(name="windshield_heat_front", fontFamily="Material Symbols Rounded")
-    wine_bar_rounded = IconData(name="wine_bar", fontFamily="Material Symbols Rounded")
-    woman_rounded = IconData(name="woman", fontFamily="Material Symbols Rounded")
-    woman_2_rounded = IconData(name="woman_2", fontFamily="Material Symbols Rounded")
-    work_rounded = IconData(name="work", fontFamily="Material Symbols Rounded")
-    work_alert_rounded = IconData(name="work_alert", fontFamily="Material Symbols Rounded")
-    work_history_rounded = IconData(name="work_history", fontFamily="Material Symbols Rounded")
-    work_off_rounded = IconData(name="work_off", fontFamily="Material Symbols Rounded")
-    work_outline_rounded = IconData(name="work_outline", fontFamily="Material Symbols Rounded")
-    work_update_rounded = IconData(name="work_update", fontFamily="Material Symbols Rounded")
-    workflow_rounded = IconData(name="workflow", fontFamily="Material Symbols Rounded")
-    workspace_premium_rounded = IconData(name="workspace_premium", fontFamily="Material Symbols Rounded")
-    workspaces_rounded = IconData(name="workspaces", fontFamily="Material Symbols Rounded")
-    workspaces_outline_rounded = IconData(name="workspaces_outline", fontFamily="Material Symbols Rounded")
-    wounds_injuries_rounded = IconData(name="wounds_injuries", fontFamily="Material Symbols Rounded")
-    wrap_text_rounded = IconData(name="wrap_text", fontFamily="Material Symbols Rounded")
-    wrist_rounded = IconData(name="wrist", fontFamily="Material Symbols Rounded")
-    wrong_location_rounded = IconData(name="wrong_location", fontFamily="Material Symbols Rounded")
-    wysiwyg_rounded = IconData(name="wysiwyg", fontFamily="Material Symbols Rounded")
-    yard_rounded = IconData(name="yard", fontFamily="Material Symbols Rounded")
-    your_trips_rounded = IconData(name="your_trips", fontFamily="Material Symbols Rounded")
-    youtube_activity_rounded = IconData(name="youtube_activity", fontFamily="Material Symbols Rounded")
-    youtube_searched_for_rounded = IconData(name="youtube_searched_for", fontFamily="Material Symbols Rounded")
-    zone_person_alert_rounded = IconData(name="zone_person_alert", fontFamily="Material Symbols Rounded")
-    zone_person_idle_rounded = IconData(name="zone_person_idle", fontFamily="Material Symbols Rounded")
-    zone_person_urgent_rounded = IconData(name="zone_person_urgent", fontFamily="Material Symbols Rounded")
-    zoom_in_rounded = IconData(name="zoom_in", fontFamily="Material Symbols Rounded")
-    zoom_in_map_rounded = IconData(name="zoom_in_map", fontFamily="Material Symbols Rounded")
-    zoom_out_rounded = IconData(name="zoom_out", fontFamily="Material Symbols Rounded")
-    zoom_out_map_rounded = IconData(name="zoom_out_map", fontFamily="Material Symbols Rounded")
\ No newline at end of file
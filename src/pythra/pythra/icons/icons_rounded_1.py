@@ -1,1836 +0,0 @@
-
-
-from .base import IconData
-
-class IconsRounded1:
-    _10k_rounded = IconData(name="10k", fontFamily="Material Symbols Rounded")
-    _10mp_rounded = IconData(name="10mp", fontFamily="Material Symbols Rounded")
-    _11mp_rounded = IconData(name="11mp", fontFamily="Material Symbols Rounded")
-    _123_rounded = IconData(name="123", fontFamily="Material Symbols Rounded")
-    _12mp_rounded = IconData(name="12mp", fontFamily="Material Symbols Rounded")
-    _13mp_rounded = IconData(name="13mp", fontFamily="Material Symbols Rounded")
-    _14mp_rounded = IconData(name="14mp", fontFamily="Material Symbols Rounded")
-    _15mp_rounded = IconData(name="15mp", fontFamily="Material Symbols Rounded")
-    _16mp_rounded = IconData(name="16mp", fontFamily="Material Symbols Rounded")
-    _17mp_rounded = IconData(name="17mp", fontFamily="Material Symbols Rounded")
-    _18_up_rating_rounded = IconData(name="18_up_rating", fontFamily="Material Symbols Rounded")
-    _18mp_rounded = IconData(name="18mp", fontFamily="Material Symbols Rounded")
-    _19mp_rounded = IconData(name="19mp", fontFamily="Material Symbols Rounded")
-    _1k_rounded = IconData(name="1k", fontFamily="Material Symbols Rounded")
-    _1k_plus_rounded = IconData(name="1k_plus", fontFamily="Material Symbols Rounded")
-    _1x_mobiledata_rounded = IconData(name="1x_mobiledata", fontFamily="Material Symbols Rounded")
-    _1x_mobiledata_badge_rounded = IconData(name="1x_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    _20mp_rounded = IconData(name="20mp", fontFamily="Material Symbols Rounded")
-    _21mp_rounded = IconData(name="21mp", fontFamily="Material Symbols Rounded")
-    _22mp_rounded = IconData(name="22mp", fontFamily="Material Symbols Rounded")
-    _23mp_rounded = IconData(name="23mp", fontFamily="Material Symbols Rounded")
-    _24fps_select_rounded = IconData(name="24fps_select", fontFamily="Material Symbols Rounded")
-    _24mp_rounded = IconData(name="24mp", fontFamily="Material Symbols Rounded")
-    _2d_rounded = IconData(name="2d", fontFamily="Material Symbols Rounded")
-    _2k_rounded = IconData(name="2k", fontFamily="Material Symbols Rounded")
-    _2k_plus_rounded = IconData(name="2k_plus", fontFamily="Material Symbols Rounded")
-    _2mp_rounded = IconData(name="2mp", fontFamily="Material Symbols Rounded")
-    _30fps_rounded = IconData(name="30fps", fontFamily="Material Symbols Rounded")
-    _30fps_select_rounded = IconData(name="30fps_select", fontFamily="Material Symbols Rounded")
-    _360_rounded = IconData(name="360", fontFamily="Material Symbols Rounded")
-    _3d_rounded = IconData(name="3d", fontFamily="Material Symbols Rounded")
-    _3d_rotation_rounded = IconData(name="3d_rotation", fontFamily="Material Symbols Rounded")
-    _3g_mobiledata_rounded = IconData(name="3g_mobiledata", fontFamily="Material Symbols Rounded")
-    _3g_mobiledata_badge_rounded = IconData(name="3g_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    _3k_rounded = IconData(name="3k", fontFamily="Material Symbols Rounded")
-    _3k_plus_rounded = IconData(name="3k_plus", fontFamily="Material Symbols Rounded")
-    _3mp_rounded = IconData(name="3mp", fontFamily="Material Symbols Rounded")
-    _3p_rounded = IconData(name="3p", fontFamily="Material Symbols Rounded")
-    _4g_mobiledata_rounded = IconData(name="4g_mobiledata", fontFamily="Material Symbols Rounded")
-    _4g_mobiledata_badge_rounded = IconData(name="4g_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    _4g_plus_mobiledata_rounded = IconData(name="4g_plus_mobiledata", fontFamily="Material Symbols Rounded")
-    _4k_rounded = IconData(name="4k", fontFamily="Material Symbols Rounded")
-    _4k_plus_rounded = IconData(name="4k_plus", fontFamily="Material Symbols Rounded")
-    _4mp_rounded = IconData(name="4mp", fontFamily="Material Symbols Rounded")
-    _50mp_rounded = IconData(name="50mp", fontFamily="Material Symbols Rounded")
-    _5g_rounded = IconData(name="5g", fontFamily="Material Symbols Rounded")
-    _5g_mobiledata_badge_rounded = IconData(name="5g_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    _5k_rounded = IconData(name="5k", fontFamily="Material Symbols Rounded")
-    _5k_plus_rounded = IconData(name="5k_plus", fontFamily="Material Symbols Rounded")
-    _5mp_rounded = IconData(name="5mp", fontFamily="Material Symbols Rounded")
-    _60fps_rounded = IconData(name="60fps", fontFamily="Material Symbols Rounded")
-    _60fps_select_rounded = IconData(name="60fps_select", fontFamily="Material Symbols Rounded")
-    _6_ft_apart_rounded = IconData(name="6_ft_apart", fontFamily="Material Symbols Rounded")
-    _6k_rounded = IconData(name="6k", fontFamily="Material Symbols Rounded")
-    _6k_plus_rounded = IconData(name="6k_plus", fontFamily="Material Symbols Rounded")
-    _6mp_rounded = IconData(name="6mp", fontFamily="Material Symbols Rounded")
-    _7k_rounded = IconData(name="7k", fontFamily="Material Symbols Rounded")
-    _7k_plus_rounded = IconData(name="7k_plus", fontFamily="Material Symbols Rounded")
-    _7mp_rounded = IconData(name="7mp", fontFamily="Material Symbols Rounded")
-    _8k_rounded = IconData(name="8k", fontFamily="Material Symbols Rounded")
-    _8k_plus_rounded = IconData(name="8k_plus", fontFamily="Material Symbols Rounded")
-    _8mp_rounded = IconData(name="8mp", fontFamily="Material Symbols Rounded")
-    _9k_rounded = IconData(name="9k", fontFamily="Material Symbols Rounded")
-    _9k_plus_rounded = IconData(name="9k_plus", fontFamily="Material Symbols Rounded")
-    _9mp_rounded = IconData(name="9mp", fontFamily="Material Symbols Rounded")
-    abc_rounded = IconData(name="abc", fontFamily="Material Symbols Rounded")
-    ac_unit_rounded = IconData(name="ac_unit", fontFamily="Material Symbols Rounded")
-    access_alarm_rounded = IconData(name="access_alarm", fontFamily="Material Symbols Rounded")
-    access_alarms_rounded = IconData(name="access_alarms", fontFamily="Material Symbols Rounded")
-    access_time_rounded = IconData(name="access_time", fontFamily="Material Symbols Rounded")
-    access_time_filled_rounded = IconData(name="access_time_filled", fontFamily="Material Symbols Rounded")
-    accessibility_rounded = IconData(name="accessibility", fontFamily="Material Symbols Rounded")
-    accessibility_new_rounded = IconData(name="accessibility_new", fontFamily="Material Symbols Rounded")
-    accessible_rounded = IconData(name="accessible", fontFamily="Material Symbols Rounded")
-    accessible_forward_rounded = IconData(name="accessible_forward", fontFamily="Material Symbols Rounded")
-    accessible_menu_rounded = IconData(name="accessible_menu", fontFamily="Material Symbols Rounded")
-    account_balance_rounded = IconData(name="account_balance", fontFamily="Material Symbols Rounded")
-    account_balance_wallet_rounded = IconData(name="account_balance_wallet", fontFamily="Material Symbols Rounded")
-    account_box_rounded = IconData(name="account_box", fontFamily="Material Symbols Rounded")
-    account_child_rounded = IconData(name="account_child", fontFamily="Material Symbols Rounded")
-    account_child_invert_rounded = IconData(name="account_child_invert", fontFamily="Material Symbols Rounded")
-    account_circle_rounded = IconData(name="account_circle", fontFamily="Material Symbols Rounded")
-    account_circle_filled_rounded = IconData(name="account_circle_filled", fontFamily="Material Symbols Rounded")
-    account_circle_off_rounded = IconData(name="account_circle_off", fontFamily="Material Symbols Rounded")
-    account_tree_rounded = IconData(name="account_tree", fontFamily="Material Symbols Rounded")
-    action_key_rounded = IconData(name="action_key", fontFamily="Material Symbols Rounded")
-    activity_zone_rounded = IconData(name="activity_zone", fontFamily="Material Symbols Rounded")
-    acute_rounded = IconData(name="acute", fontFamily="Material Symbols Rounded")
-    ad_rounded = IconData(name="ad", fontFamily="Material Symbols Rounded")
-    ad_group_rounded = IconData(name="ad_group", fontFamily="Material Symbols Rounded")
-    ad_group_off_rounded = IconData(name="ad_group_off", fontFamily="Material Symbols Rounded")
-    ad_off_rounded = IconData(name="ad_off", fontFamily="Material Symbols Rounded")
-    ad_units_rounded = IconData(name="ad_units", fontFamily="Material Symbols Rounded")
-    adaptive_audio_mic_rounded = IconData(name="adaptive_audio_mic", fontFamily="Material Symbols Rounded")
-    adaptive_audio_mic_off_rounded = IconData(name="adaptive_audio_mic_off", fontFamily="Material Symbols Rounded")
-    adb_rounded = IconData(name="adb", fontFamily="Material Symbols Rounded")
-    add_rounded = IconData(name="add", fontFamily="Material Symbols Rounded")
-    add_2_rounded = IconData(name="add_2", fontFamily="Material Symbols Rounded")
-    add_a_photo_rounded = IconData(name="add_a_photo", fontFamily="Material Symbols Rounded")
-    add_ad_rounded = IconData(name="add_ad", fontFamily="Material Symbols Rounded")
-    add_alarm_rounded = IconData(name="add_alarm", fontFamily="Material Symbols Rounded")
-    add_alert_rounded = IconData(name="add_alert", fontFamily="Material Symbols Rounded")
-    add_box_rounded = IconData(name="add_box", fontFamily="Material Symbols Rounded")
-    add_business_rounded = IconData(name="add_business", fontFamily="Material Symbols Rounded")
-    add_call_rounded = IconData(name="add_call", fontFamily="Material Symbols Rounded")
-    add_card_rounded = IconData(name="add_card", fontFamily="Material Symbols Rounded")
-    add_chart_rounded = IconData(name="add_chart", fontFamily="Material Symbols Rounded")
-    add_circle_rounded = IconData(name="add_circle", fontFamily="Material Symbols Rounded")
-    add_circle_outline_rounded = IconData(name="add_circle_outline", fontFamily="Material Symbols Rounded")
-    add_column_left_rounded = IconData(name="add_column_left", fontFamily="Material Symbols Rounded")
-    add_column_right_rounded = IconData(name="add_column_right", fontFamily="Material Symbols Rounded")
-    add_comment_rounded = IconData(name="add_comment", fontFamily="Material Symbols Rounded")
-    add_diamond_rounded = IconData(name="add_diamond", fontFamily="Material Symbols Rounded")
-    add_home_rounded = IconData(name="add_home", fontFamily="Material Symbols Rounded")
-    add_home_work_rounded = IconData(name="add_home_work", fontFamily="Material Symbols Rounded")
-    add_ic_call_rounded = IconData(name="add_ic_call", fontFamily="Material Symbols Rounded")
-    add_link_rounded = IconData(name="add_link", fontFamily="Material Symbols Rounded")
-    add_location_rounded = IconData(name="add_location", fontFamily="Material Symbols Rounded")
-    add_location_alt_rounded = IconData(name="add_location_alt", fontFamily="Material Symbols Rounded")
-    add_moderator_rounded = IconData(name="add_moderator", fontFamily="Material Symbols Rounded")
-    add_notes_rounded = IconData(name="add_notes", fontFamily="Material Symbols Rounded")
-    add_photo_alternate_rounded = IconData(name="add_photo_alternate", fontFamily="Material Symbols Rounded")
-    add_reaction_rounded = IconData(name="add_reaction", fontFamily="Material Symbols Rounded")
-    add_road_rounded = IconData(name="add_road", fontFamily="Material Symbols Rounded")
-    add_row_above_rounded = IconData(name="add_row_above", fontFamily="Material Symbols Rounded")
-    add_row_below_rounded = IconData(name="add_row_below", fontFamily="Material Symbols Rounded")
-    add_shopping_cart_rounded = IconData(name="add_shopping_cart", fontFamily="Material Symbols Rounded")
-    add_task_rounded = IconData(name="add_task", fontFamily="Material Symbols Rounded")
-    add_to_drive_rounded = IconData(name="add_to_drive", fontFamily="Material Symbols Rounded")
-    add_to_home_screen_rounded = IconData(name="add_to_home_screen", fontFamily="Material Symbols Rounded")
-    add_to_photos_rounded = IconData(name="add_to_photos", fontFamily="Material Symbols Rounded")
-    add_to_queue_rounded = IconData(name="add_to_queue", fontFamily="Material Symbols Rounded")
-    add_triangle_rounded = IconData(name="add_triangle", fontFamily="Material Symbols Rounded")
-    addchart_rounded = IconData(name="addchart", fontFamily="Material Symbols Rounded")
-    adf_scanner_rounded = IconData(name="adf_scanner", fontFamily="Material Symbols Rounded")
-    adjust_rounded = IconData(name="adjust", fontFamily="Material Symbols Rounded")
-    admin_meds_rounded = IconData(name="admin_meds", fontFamily="Material Symbols Rounded")
-    admin_panel_settings_rounded = IconData(name="admin_panel_settings", fontFamily="Material Symbols Rounded")
-    ads_click_rounded = IconData(name="ads_click", fontFamily="Material Symbols Rounded")
-    agender_rounded = IconData(name="agender", fontFamily="Material Symbols Rounded")
-    agriculture_rounded = IconData(name="agriculture", fontFamily="Material Symbols Rounded")
-    air_rounded = IconData(name="air", fontFamily="Material Symbols Rounded")
-    air_freshener_rounded = IconData(name="air_freshener", fontFamily="Material Symbols Rounded")
-    air_purifier_rounded = IconData(name="air_purifier", fontFamily="Material Symbols Rounded")
-    air_purifier_gen_rounded = IconData(name="air_purifier_gen", fontFamily="Material Symbols Rounded")
-    airline_seat_flat_rounded = IconData(name="airline_seat_flat", fontFamily="Material Symbols Rounded")
-    airline_seat_flat_angled_rounded = IconData(name="airline_seat_flat_angled", fontFamily="Material Symbols Rounded")
-    airline_seat_individual_suite_rounded = IconData(name="airline_seat_individual_suite", fontFamily="Material Symbols Rounded")
-    airline_seat_legroom_extra_rounded = IconData(name="airline_seat_legroom_extra", fontFamily="Material Symbols Rounded")
-    airline_seat_legroom_normal_rounded = IconData(name="airline_seat_legroom_normal", fontFamily="Material Symbols Rounded")
-    airline_seat_legroom_reduced_rounded = IconData(name="airline_seat_legroom_reduced", fontFamily="Material Symbols Rounded")
-    airline_seat_recline_extra_rounded = IconData(name="airline_seat_recline_extra", fontFamily="Material Symbols Rounded")
-    airline_seat_recline_normal_rounded = IconData(name="airline_seat_recline_normal", fontFamily="Material Symbols Rounded")
-    airline_stops_rounded = IconData(name="airline_stops", fontFamily="Material Symbols Rounded")
-    airlines_rounded = IconData(name="airlines", fontFamily="Material Symbols Rounded")
-    airplane_ticket_rounded = IconData(name="airplane_ticket", fontFamily="Material Symbols Rounded")
-    airplanemode_active_rounded = IconData(name="airplanemode_active", fontFamily="Material Symbols Rounded")
-    airplanemode_inactive_rounded = IconData(name="airplanemode_inactive", fontFamily="Material Symbols Rounded")
-    airplay_rounded = IconData(name="airplay", fontFamily="Material Symbols Rounded")
-    airport_shuttle_rounded = IconData(name="airport_shuttle", fontFamily="Material Symbols Rounded")
-    airware_rounded = IconData(name="airware", fontFamily="Material Symbols Rounded")
-    airwave_rounded = IconData(name="airwave", fontFamily="Material Symbols Rounded")
-    alarm_rounded = IconData(name="alarm", fontFamily="Material Symbols Rounded")
-    alarm_add_rounded = IconData(name="alarm_add", fontFamily="Material Symbols Rounded")
-    alarm_off_rounded = IconData(name="alarm_off", fontFamily="Material Symbols Rounded")
-    alarm_on_rounded = IconData(name="alarm_on", fontFamily="Material Symbols Rounded")
-    alarm_pause_rounded = IconData(name="alarm_pause", fontFamily="Material Symbols Rounded")
-    alarm_smart_wake_rounded = IconData(name="alarm_smart_wake", fontFamily="Material Symbols Rounded")
-    album_rounded = IconData(name="album", fontFamily="Material Symbols Rounded")
-    align_center_rounded = IconData(name="align_center", fontFamily="Material Symbols Rounded")
-    align_end_rounded = IconData(name="align_end", fontFamily="Material Symbols Rounded")
-    align_flex_center_rounded = IconData(name="align_flex_center", fontFamily="Material Symbols Rounded")
-    align_flex_end_rounded = IconData(name="align_flex_end", fontFamily="Material Symbols Rounded")
-    align_flex_start_rounded = IconData(name="align_flex_start", fontFamily="Material Symbols Rounded")
-    align_horizontal_center_rounded = IconData(name="align_horizontal_center", fontFamily="Material Symbols Rounded")
-    align_horizontal_left_rounded = IconData(name="align_horizontal_left", fontFamily="Material Symbols Rounded")
-    align_horizontal_right_rounded = IconData(name="align_horizontal_right", fontFamily="Material Symbols Rounded")
-    align_items_stretch_rounded = IconData(name="align_items_stretch", fontFamily="Material Symbols Rounded")
-    align_justify_center_rounded = IconData(name="align_justify_center", fontFamily="Material Symbols Rounded")
-    align_justify_flex_end_rounded = IconData(name="align_justify_flex_end", fontFamily="Material Symbols Rounded")
-    align_justify_flex_start_rounded = IconData(name="align_justify_flex_start", fontFamily="Material Symbols Rounded")
-    align_justify_space_around_rounded = IconData(name="align_justify_space_around", fontFamily="Material Symbols Rounded")
-    align_justify_space_between_rounded = IconData(name="align_justify_space_between", fontFamily="Material Symbols Rounded")
-    align_justify_space_even_rounded = IconData(name="align_justify_space_even", fontFamily="Material Symbols Rounded")
-    align_justify_stretch_rounded = IconData(name="align_justify_stretch", fontFamily="Material Symbols Rounded")
-    align_self_stretch_rounded = IconData(name="align_self_stretch", fontFamily="Material Symbols Rounded")
-    align_space_around_rounded = IconData(name="align_space_around", fontFamily="Material Symbols Rounded")
-    align_space_between_rounded = IconData(name="align_space_between", fontFamily="Material Symbols Rounded")
-    align_space_even_rounded = IconData(name="align_space_even", fontFamily="Material Symbols Rounded")
-    align_start_rounded = IconData(name="align_start", fontFamily="Material Symbols Rounded")
-    align_stretch_rounded = IconData(name="align_stretch", fontFamily="Material Symbols Rounded")
-    align_vertical_bottom_rounded = IconData(name="align_vertical_bottom", fontFamily="Material Symbols Rounded")
-    align_vertical_center_rounded = IconData(name="align_vertical_center", fontFamily="Material Symbols Rounded")
-    align_vertical_top_rounded = IconData(name="align_vertical_top", fontFamily="Material Symbols Rounded")
-    all_inbox_rounded = IconData(name="all_inbox", fontFamily="Material Symbols Rounded")
-    all_inclusive_rounded = IconData(name="all_inclusive", fontFamily="Material Symbols Rounded")
-    all_match_rounded = IconData(name="all_match", fontFamily="Material Symbols Rounded")
-    all_out_rounded = IconData(name="all_out", fontFamily="Material Symbols Rounded")
-    allergies_rounded = IconData(name="allergies", fontFamily="Material Symbols Rounded")
-    allergy_rounded = IconData(name="allergy", fontFamily="Material Symbols Rounded")
-    alt_route_rounded = IconData(name="alt_route", fontFamily="Material Symbols Rounded")
-    alternate_email_rounded = IconData(name="alternate_email", fontFamily="Material Symbols Rounded")
-    altitude_rounded = IconData(name="altitude", fontFamily="Material Symbols Rounded")
-    ambient_screen_rounded = IconData(name="ambient_screen", fontFamily="Material Symbols Rounded")
-    ambulance_rounded = IconData(name="ambulance", fontFamily="Material Symbols Rounded")
-    amend_rounded = IconData(name="amend", fontFamily="Material Symbols Rounded")
-    amp_stories_rounded = IconData(name="amp_stories", fontFamily="Material Symbols Rounded")
-    analytics_rounded = IconData(name="analytics", fontFamily="Material Symbols Rounded")
-    anchor_rounded = IconData(name="anchor", fontFamily="Material Symbols Rounded")
-    android_rounded = IconData(name="android", fontFamily="Material Symbols Rounded")
-    animated_images_rounded = IconData(name="animated_images", fontFamily="Material Symbols Rounded")
-    animation_rounded = IconData(name="animation", fontFamily="Material Symbols Rounded")
-    announcement_rounded = IconData(name="announcement", fontFamily="Material Symbols Rounded")
-    aod_rounded = IconData(name="aod", fontFamily="Material Symbols Rounded")
-    aod_tablet_rounded = IconData(name="aod_tablet", fontFamily="Material Symbols Rounded")
-    aod_watch_rounded = IconData(name="aod_watch", fontFamily="Material Symbols Rounded")
-    apartment_rounded = IconData(name="apartment", fontFamily="Material Symbols Rounded")
-    api_rounded = IconData(name="api", fontFamily="Material Symbols Rounded")
-    apk_document_rounded = IconData(name="apk_document", fontFamily="Material Symbols Rounded")
-    apk_install_rounded = IconData(name="apk_install", fontFamily="Material Symbols Rounded")
-    app_badging_rounded = IconData(name="app_badging", fontFamily="Material Symbols Rounded")
-    app_blocking_rounded = IconData(name="app_blocking", fontFamily="Material Symbols Rounded")
-    app_promo_rounded = IconData(name="app_promo", fontFamily="Material Symbols Rounded")
-    app_registration_rounded = IconData(name="app_registration", fontFamily="Material Symbols Rounded")
-    app_settings_alt_rounded = IconData(name="app_settings_alt", fontFamily="Material Symbols Rounded")
-    app_shortcut_rounded = IconData(name="app_shortcut", fontFamily="Material Symbols Rounded")
-    apparel_rounded = IconData(name="apparel", fontFamily="Material Symbols Rounded")
-    approval_rounded = IconData(name="approval", fontFamily="Material Symbols Rounded")
-    approval_delegation_rounded = IconData(name="approval_delegation", fontFamily="Material Symbols Rounded")
-    apps_rounded = IconData(name="apps", fontFamily="Material Symbols Rounded")
-    apps_outage_rounded = IconData(name="apps_outage", fontFamily="Material Symbols Rounded")
-    aq_rounded = IconData(name="aq", fontFamily="Material Symbols Rounded")
-    aq_indoor_rounded = IconData(name="aq_indoor", fontFamily="Material Symbols Rounded")
-    ar_on_you_rounded = IconData(name="ar_on_you", fontFamily="Material Symbols Rounded")
-    ar_stickers_rounded = IconData(name="ar_stickers", fontFamily="Material Symbols Rounded")
-    architecture_rounded = IconData(name="architecture", fontFamily="Material Symbols Rounded")
-    archive_rounded = IconData(name="archive", fontFamily="Material Symbols Rounded")
-    area_chart_rounded = IconData(name="area_chart", fontFamily="Material Symbols Rounded")
-    arming_countdown_rounded = IconData(name="arming_countdown", fontFamily="Material Symbols Rounded")
-    arrow_and_edge_rounded = IconData(name="arrow_and_edge", fontFamily="Material Symbols Rounded")
-    arrow_back_rounded = IconData(name="arrow_back", fontFamily="Material Symbols Rounded")
-    arrow_back_2_rounded = IconData(name="arrow_back_2", fontFamily="Material Symbols Rounded")
-    arrow_back_ios_rounded = IconData(name="arrow_back_ios", fontFamily="Material Symbols Rounded")
-    arrow_back_ios_new_rounded = IconData(name="arrow_back_ios_new", fontFamily="Material Symbols Rounded")
-    arrow_circle_down_rounded = IconData(name="arrow_circle_down", fontFamily="Material Symbols Rounded")
-    arrow_circle_left_rounded = IconData(name="arrow_circle_left", fontFamily="Material Symbols Rounded")
-    arrow_circle_right_rounded = IconData(name="arrow_circle_right", fontFamily="Material Symbols Rounded")
-    arrow_circle_up_rounded = IconData(name="arrow_circle_up", fontFamily="Material Symbols Rounded")
-    arrow_cool_down_rounded = IconData(name="arrow_cool_down", fontFamily="Material Symbols Rounded")
-    arrow_downward_rounded = IconData(name="arrow_downward", fontFamily="Material Symbols Rounded")
-    arrow_downward_alt_rounded = IconData(name="arrow_downward_alt", fontFamily="Material Symbols Rounded")
-    arrow_drop_down_rounded = IconData(name="arrow_drop_down", fontFamily="Material Symbols Rounded")
-    arrow_drop_down_circle_rounded = IconData(name="arrow_drop_down_circle", fontFamily="Material Symbols Rounded")
-    arrow_drop_up_rounded = IconData(name="arrow_drop_up", fontFamily="Material Symbols Rounded")
-    arrow_forward_rounded = IconData(name="arrow_forward", fontFamily="Material Symbols Rounded")
-    arrow_forward_ios_rounded = IconData(name="arrow_forward_ios", fontFamily="Material Symbols Rounded")
-    arrow_insert_rounded = IconData(name="arrow_insert", fontFamily="Material Symbols Rounded")
-    arrow_left_rounded = IconData(name="arrow_left", fontFamily="Material Symbols Rounded")
-    arrow_left_alt_rounded = IconData(name="arrow_left_alt", fontFamily="Material Symbols Rounded")
-    arrow_menu_close_rounded = IconData(name="arrow_menu_close", fontFamily="Material Symbols Rounded")
-    arrow_menu_open_rounded = IconData(name="arrow_menu_open", fontFamily="Material Symbols Rounded")
-    arrow_or_edge_rounded = IconData(name="arrow_or_edge", fontFamily="Material Symbols Rounded")
-    arrow_outward_rounded = IconData(name="arrow_outward", fontFamily="Material Symbols Rounded")
-    arrow_range_rounded = IconData(name="arrow_range", fontFamily="Material Symbols Rounded")
-    arrow_right_rounded = IconData(name="arrow_right", fontFamily="Material Symbols Rounded")
-    arrow_right_alt_rounded = IconData(name="arrow_right_alt", fontFamily="Material Symbols Rounded")
-    arrow_selector_tool_rounded = IconData(name="arrow_selector_tool", fontFamily="Material Symbols Rounded")
-    arrow_split_rounded = IconData(name="arrow_split", fontFamily="Material Symbols Rounded")
-    arrow_top_left_rounded = IconData(name="arrow_top_left", fontFamily="Material Symbols Rounded")
-    arrow_top_right_rounded = IconData(name="arrow_top_right", fontFamily="Material Symbols Rounded")
-    arrow_upload_progress_rounded = IconData(name="arrow_upload_progress", fontFamily="Material Symbols Rounded")
-    arrow_upload_ready_rounded = IconData(name="arrow_upload_ready", fontFamily="Material Symbols Rounded")
-    arrow_upward_rounded = IconData(name="arrow_upward", fontFamily="Material Symbols Rounded")
-    arrow_upward_alt_rounded = IconData(name="arrow_upward_alt", fontFamily="Material Symbols Rounded")
-    arrow_warm_up_rounded = IconData(name="arrow_warm_up", fontFamily="Material Symbols Rounded")
-    arrows_input_rounded = IconData(name="arrows_input", fontFamily="Material Symbols Rounded")
-    arrows_more_down_rounded = IconData(name="arrows_more_down", fontFamily="Material Symbols Rounded")
-    arrows_more_up_rounded = IconData(name="arrows_more_up", fontFamily="Material Symbols Rounded")
-    arrows_output_rounded = IconData(name="arrows_output", fontFamily="Material Symbols Rounded")
-    arrows_outward_rounded = IconData(name="arrows_outward", fontFamily="Material Symbols Rounded")
-    art_track_rounded = IconData(name="art_track", fontFamily="Material Symbols Rounded")
-    article_rounded = IconData(name="article", fontFamily="Material Symbols Rounded")
-    article_person_rounded = IconData(name="article_person", fontFamily="Material Symbols Rounded")
-    article_shortcut_rounded = IconData(name="article_shortcut", fontFamily="Material Symbols Rounded")
-    artist_rounded = IconData(name="artist", fontFamily="Material Symbols Rounded")
-    aspect_ratio_rounded = IconData(name="aspect_ratio", fontFamily="Material Symbols Rounded")
-    assessment_rounded = IconData(name="assessment", fontFamily="Material Symbols Rounded")
-    assignment_rounded = IconData(name="assignment", fontFamily="Material Symbols Rounded")
-    assignment_add_rounded = IconData(name="assignment_add", fontFamily="Material Symbols Rounded")
-    assignment_ind_rounded = IconData(name="assignment_ind", fontFamily="Material Symbols Rounded")
-    assignment_late_rounded = IconData(name="assignment_late", fontFamily="Material Symbols Rounded")
-    assignment_return_rounded = IconData(name="assignment_return", fontFamily="Material Symbols Rounded")
-    assignment_returned_rounded = IconData(name="assignment_returned", fontFamily="Material Symbols Rounded")
-    assignment_turned_in_rounded = IconData(name="assignment_turned_in", fontFamily="Material Symbols Rounded")
-    assist_walker_rounded = IconData(name="assist_walker", fontFamily="Material Symbols Rounded")
-    assistant_rounded = IconData(name="assistant", fontFamily="Material Symbols Rounded")
-    assistant_device_rounded = IconData(name="assistant_device", fontFamily="Material Symbols Rounded")
-    assistant_direction_rounded = IconData(name="assistant_direction", fontFamily="Material Symbols Rounded")
-    assistant_navigation_rounded = IconData(name="assistant_navigation", fontFamily="Material Symbols Rounded")
-    assistant_on_hub_rounded = IconData(name="assistant_on_hub", fontFamily="Material Symbols Rounded")
-    assistant_photo_rounded = IconData(name="assistant_photo", fontFamily="Material Symbols Rounded")
-    assured_workload_rounded = IconData(name="assured_workload", fontFamily="Material Symbols Rounded")
-    asterisk_rounded = IconData(name="asterisk", fontFamily="Material Symbols Rounded")
-    astrophotography_auto_rounded = IconData(name="astrophotography_auto", fontFamily="Material Symbols Rounded")
-    astrophotography_off_rounded = IconData(name="astrophotography_off", fontFamily="Material Symbols Rounded")
-    atm_rounded = IconData(name="atm", fontFamily="Material Symbols Rounded")
-    atr_rounded = IconData(name="atr", fontFamily="Material Symbols Rounded")
-    attach_email_rounded = IconData(name="attach_email", fontFamily="Material Symbols Rounded")
-    attach_file_rounded = IconData(name="attach_file", fontFamily="Material Symbols Rounded")
-    attach_file_add_rounded = IconData(name="attach_file_add", fontFamily="Material Symbols Rounded")
-    attach_file_off_rounded = IconData(name="attach_file_off", fontFamily="Material Symbols Rounded")
-    attach_money_rounded = IconData(name="attach_money", fontFamily="Material Symbols Rounded")
-    attachment_rounded = IconData(name="attachment", fontFamily="Material Symbols Rounded")
-    attractions_rounded = IconData(name="attractions", fontFamily="Material Symbols Rounded")
-    attribution_rounded = IconData(name="attribution", fontFamily="Material Symbols Rounded")
-    audio_description_rounded = IconData(name="audio_description", fontFamily="Material Symbols Rounded")
-    audio_file_rounded = IconData(name="audio_file", fontFamily="Material Symbols Rounded")
-    audio_video_receiver_rounded = IconData(name="audio_video_receiver", fontFamily="Material Symbols Rounded")
-    audiotrack_rounded = IconData(name="audiotrack", fontFamily="Material Symbols Rounded")
-    auto_activity_zone_rounded = IconData(name="auto_activity_zone", fontFamily="Material Symbols Rounded")
-    auto_awesome_rounded = IconData(name="auto_awesome", fontFamily="Material Symbols Rounded")
-    auto_awesome_mosaic_rounded = IconData(name="auto_awesome_mosaic", fontFamily="Material Symbols Rounded")
-    auto_awesome_motion_rounded = IconData(name="auto_awesome_motion", fontFamily="Material Symbols Rounded")
-    auto_delete_rounded = IconData(name="auto_delete", fontFamily="Material Symbols Rounded")
-    auto_detect_voice_rounded = IconData(name="auto_detect_voice", fontFamily="Material Symbols Rounded")
-    auto_draw_solid_rounded = IconData(name="auto_draw_solid", fontFamily="Material Symbols Rounded")
-    auto_fix_rounded = IconData(name="auto_fix", fontFamily="Material Symbols Rounded")
-    auto_fix_high_rounded = IconData(name="auto_fix_high", fontFamily="Material Symbols Rounded")
-    auto_fix_normal_rounded = IconData(name="auto_fix_normal", fontFamily="Material Symbols Rounded")
-    auto_fix_off_rounded = IconData(name="auto_fix_off", fontFamily="Material Symbols Rounded")
-    auto_graph_rounded = IconData(name="auto_graph", fontFamily="Material Symbols Rounded")
-    auto_label_rounded = IconData(name="auto_label", fontFamily="Material Symbols Rounded")
-    auto_meeting_room_rounded = IconData(name="auto_meeting_room", fontFamily="Material Symbols Rounded")
-    auto_mode_rounded = IconData(name="auto_mode", fontFamily="Material Symbols Rounded")
-    auto_read_pause_rounded = IconData(name="auto_read_pause", fontFamily="Material Symbols Rounded")
-    auto_read_play_rounded = IconData(name="auto_read_play", fontFamily="Material Symbols Rounded")
-    auto_schedule_rounded = IconData(name="auto_schedule", fontFamily="Material Symbols Rounded")
-    auto_stories_rounded = IconData(name="auto_stories", fontFamily="Material Symbols Rounded")
-    auto_timer_rounded = IconData(name="auto_timer", fontFamily="Material Symbols Rounded")
-    auto_towing_rounded = IconData(name="auto_towing", fontFamily="Material Symbols Rounded")
-    auto_transmission_rounded = IconData(name="auto_transmission", fontFamily="Material Symbols Rounded")
-    auto_videocam_rounded = IconData(name="auto_videocam", fontFamily="Material Symbols Rounded")
-    autofps_select_rounded = IconData(name="autofps_select", fontFamily="Material Symbols Rounded")
-    automation_rounded = IconData(name="automation", fontFamily="Material Symbols Rounded")
-    autopause_rounded = IconData(name="autopause", fontFamily="Material Symbols Rounded")
-    autopay_rounded = IconData(name="autopay", fontFamily="Material Symbols Rounded")
-    autoplay_rounded = IconData(name="autoplay", fontFamily="Material Symbols Rounded")
-    autorenew_rounded = IconData(name="autorenew", fontFamily="Material Symbols Rounded")
-    autostop_rounded = IconData(name="autostop", fontFamily="Material Symbols Rounded")
-    av1_rounded = IconData(name="av1", fontFamily="Material Symbols Rounded")
-    av_timer_rounded = IconData(name="av_timer", fontFamily="Material Symbols Rounded")
-    avc_rounded = IconData(name="avc", fontFamily="Material Symbols Rounded")
-    avg_pace_rounded = IconData(name="avg_pace", fontFamily="Material Symbols Rounded")
-    avg_time_rounded = IconData(name="avg_time", fontFamily="Material Symbols Rounded")
-    award_star_rounded = IconData(name="award_star", fontFamily="Material Symbols Rounded")
-    azm_rounded = IconData(name="azm", fontFamily="Material Symbols Rounded")
-    baby_changing_station_rounded = IconData(name="baby_changing_station", fontFamily="Material Symbols Rounded")
-    back_hand_rounded = IconData(name="back_hand", fontFamily="Material Symbols Rounded")
-    back_to_tab_rounded = IconData(name="back_to_tab", fontFamily="Material Symbols Rounded")
-    background_dot_large_rounded = IconData(name="background_dot_large", fontFamily="Material Symbols Rounded")
-    background_dot_small_rounded = IconData(name="background_dot_small", fontFamily="Material Symbols Rounded")
-    background_grid_small_rounded = IconData(name="background_grid_small", fontFamily="Material Symbols Rounded")
-    background_replace_rounded = IconData(name="background_replace", fontFamily="Material Symbols Rounded")
-    backlight_high_rounded = IconData(name="backlight_high", fontFamily="Material Symbols Rounded")
-    backlight_high_off_rounded = IconData(name="backlight_high_off", fontFamily="Material Symbols Rounded")
-    backlight_low_rounded = IconData(name="backlight_low", fontFamily="Material Symbols Rounded")
-    backpack_rounded = IconData(name="backpack", fontFamily="Material Symbols Rounded")
-    backspace_rounded = IconData(name="backspace", fontFamily="Material Symbols Rounded")
-    backup_rounded = IconData(name="backup", fontFamily="Material Symbols Rounded")
-    backup_table_rounded = IconData(name="backup_table", fontFamily="Material Symbols Rounded")
-    badge_rounded = IconData(name="badge", fontFamily="Material Symbols Rounded")
-    badge_critical_battery_rounded = IconData(name="badge_critical_battery", fontFamily="Material Symbols Rounded")
-    bakery_dining_rounded = IconData(name="bakery_dining", fontFamily="Material Symbols Rounded")
-    balance_rounded = IconData(name="balance", fontFamily="Material Symbols Rounded")
-    balcony_rounded = IconData(name="balcony", fontFamily="Material Symbols Rounded")
-    ballot_rounded = IconData(name="ballot", fontFamily="Material Symbols Rounded")
-    bar_chart_rounded = IconData(name="bar_chart", fontFamily="Material Symbols Rounded")
-    bar_chart_4_bars_rounded = IconData(name="bar_chart_4_bars", fontFamily="Material Symbols Rounded")
-    bar_chart_off_rounded = IconData(name="bar_chart_off", fontFamily="Material Symbols Rounded")
-    barcode_rounded = IconData(name="barcode", fontFamily="Material Symbols Rounded")
-    barcode_reader_rounded = IconData(name="barcode_reader", fontFamily="Material Symbols Rounded")
-    barcode_scanner_rounded = IconData(name="barcode_scanner", fontFamily="Material Symbols Rounded")
-    barefoot_rounded = IconData(name="barefoot", fontFamily="Material Symbols Rounded")
-    batch_prediction_rounded = IconData(name="batch_prediction", fontFamily="Material Symbols Rounded")
-    bath_outdoor_rounded = IconData(name="bath_outdoor", fontFamily="Material Symbols Rounded")
-    bath_private_rounded = IconData(name="bath_private", fontFamily="Material Symbols Rounded")
-    bath_public_large_rounded = IconData(name="bath_public_large", fontFamily="Material Symbols Rounded")
-    bathroom_rounded = IconData(name="bathroom", fontFamily="Material Symbols Rounded")
-    bathtub_rounded = IconData(name="bathtub", fontFamily="Material Symbols Rounded")
-    battery_0_bar_rounded = IconData(name="battery_0_bar", fontFamily="Material Symbols Rounded")
-    battery_1_bar_rounded = IconData(name="battery_1_bar", fontFamily="Material Symbols Rounded")
-    battery_20_rounded = IconData(name="battery_20", fontFamily="Material Symbols Rounded")
-    battery_2_bar_rounded = IconData(name="battery_2_bar", fontFamily="Material Symbols Rounded")
-    battery_30_rounded = IconData(name="battery_30", fontFamily="Material Symbols Rounded")
-    battery_3_bar_rounded = IconData(name="battery_3_bar", fontFamily="Material Symbols Rounded")
-    battery_4_bar_rounded = IconData(name="battery_4_bar", fontFamily="Material Symbols Rounded")
-    battery_50_rounded = IconData(name="battery_50", fontFamily="Material Symbols Rounded")
-    battery_5_bar_rounded = IconData(name="battery_5_bar", fontFamily="Material Symbols Rounded")
-    battery_60_rounded = IconData(name="battery_60", fontFamily="Material Symbols Rounded")
-    battery_6_bar_rounded = IconData(name="battery_6_bar", fontFamily="Material Symbols Rounded")
-    battery_80_rounded = IconData(name="battery_80", fontFamily="Material Symbols Rounded")
-    battery_90_rounded = IconData(name="battery_90", fontFamily="Material Symbols Rounded")
-    battery_alert_rounded = IconData(name="battery_alert", fontFamily="Material Symbols Rounded")
-    battery_android_0_rounded = IconData(name="battery_android_0", fontFamily="Material Symbols Rounded")
-    battery_android_1_rounded = IconData(name="battery_android_1", fontFamily="Material Symbols Rounded")
-    battery_android_2_rounded = IconData(name="battery_android_2", fontFamily="Material Symbols Rounded")
-    battery_android_3_rounded = IconData(name="battery_android_3", fontFamily="Material Symbols Rounded")
-    battery_android_4_rounded = IconData(name="battery_android_4", fontFamily="Material Symbols Rounded")
-    battery_android_5_rounded = IconData(name="battery_android_5", fontFamily="Material Symbols Rounded")
-    battery_android_6_rounded = IconData(name="battery_android_6", fontFamily="Material Symbols Rounded")
-    battery_android_alert_rounded = IconData(name="battery_android_alert", fontFamily="Material Symbols Rounded")
-    battery_android_bolt_rounded = IconData(name="battery_android_bolt", fontFamily="Material Symbols Rounded")
-    battery_android_full_rounded = IconData(name="battery_android_full", fontFamily="Material Symbols Rounded")
-    battery_android_plus_rounded = IconData(name="battery_android_plus", fontFamily="Material Symbols Rounded")
-    battery_android_question_rounded = IconData(name="battery_android_question", fontFamily="Material Symbols Rounded")
-    battery_android_share_rounded = IconData(name="battery_android_share", fontFamily="Material Symbols Rounded")
-    battery_android_shield_rounded = IconData(name="battery_android_shield", fontFamily="Material Symbols Rounded")
-    battery_change_rounded = IconData(name="battery_change", fontFamily="Material Symbols Rounded")
-    battery_charging_20_rounded = IconData(name="battery_charging_20", fontFamily="Material Symbols Rounded")
-    battery_charging_30_rounded = IconData(name="battery_charging_30", fontFamily="Material Symbols Rounded")
-    battery_charging_50_rounded = IconData(name="battery_charging_50", fontFamily="Material Symbols Rounded")
-    battery_charging_60_rounded = IconData(name="battery_charging_60", fontFamily="Material Symbols Rounded")
-    battery_charging_80_rounded = IconData(name="battery_charging_80", fontFamily="Material Symbols Rounded")
-    battery_charging_90_rounded = IconData(name="battery_charging_90", fontFamily="Material Symbols Rounded")
-    battery_charging_full_rounded = IconData(name="battery_charging_full", fontFamily="Material Symbols Rounded")
-    battery_error_rounded = IconData(name="battery_error", fontFamily="Material Symbols Rounded")
-    battery_full_rounded = IconData(name="battery_full", fontFamily="Material Symbols Rounded")
-    battery_full_alt_rounded = IconData(name="battery_full_alt", fontFamily="Material Symbols Rounded")
-    battery_horiz_000_rounded = IconData(name="battery_horiz_000", fontFamily="Material Symbols Rounded")
-    battery_horiz_050_rounded = IconData(name="battery_horiz_050", fontFamily="Material Symbols Rounded")
-    battery_horiz_075_rounded = IconData(name="battery_horiz_075", fontFamily="Material Symbols Rounded")
-    battery_low_rounded = IconData(name="battery_low", fontFamily="Material Symbols Rounded")
-    battery_plus_rounded = IconData(name="battery_plus", fontFamily="Material Symbols Rounded")
-    battery_profile_rounded = IconData(name="battery_profile", fontFamily="Material Symbols Rounded")
-    battery_saver_rounded = IconData(name="battery_saver", fontFamily="Material Symbols Rounded")
-    battery_share_rounded = IconData(name="battery_share", fontFamily="Material Symbols Rounded")
-    battery_status_good_rounded = IconData(name="battery_status_good", fontFamily="Material Symbols Rounded")
-    battery_std_rounded = IconData(name="battery_std", fontFamily="Material Symbols Rounded")
-    battery_unknown_rounded = IconData(name="battery_unknown", fontFamily="Material Symbols Rounded")
-    battery_vert_005_rounded = IconData(name="battery_vert_005", fontFamily="Material Symbols Rounded")
-    battery_vert_020_rounded = IconData(name="battery_vert_020", fontFamily="Material Symbols Rounded")
-    battery_vert_050_rounded = IconData(name="battery_vert_050", fontFamily="Material Symbols Rounded")
-    battery_very_low_rounded = IconData(name="battery_very_low", fontFamily="Material Symbols Rounded")
-    beach_access_rounded = IconData(name="beach_access", fontFamily="Material Symbols Rounded")
-    bed_rounded = IconData(name="bed", fontFamily="Material Symbols Rounded")
-    bedroom_baby_rounded = IconData(name="bedroom_baby", fontFamily="Material Symbols Rounded")
-    bedroom_child_rounded = IconData(name="bedroom_child", fontFamily="Material Symbols Rounded")
-    bedroom_parent_rounded = IconData(name="bedroom_parent", fontFamily="Material Symbols Rounded")
-    bedtime_rounded = IconData(name="bedtime", fontFamily="Material Symbols Rounded")
-    bedtime_off_rounded = IconData(name="bedtime_off", fontFamily="Material Symbols Rounded")
-    beenhere_rounded = IconData(name="beenhere", fontFamily="Material Symbols Rounded")
-    bento_rounded = IconData(name="bento", fontFamily="Material Symbols Rounded")
-    bia_rounded = IconData(name="bia", fontFamily="Material Symbols Rounded")
-    bid_landscape_rounded = IconData(name="bid_landscape", fontFamily="Material Symbols Rounded")
-    bid_landscape_disabled_rounded = IconData(name="bid_landscape_disabled", fontFamily="Material Symbols Rounded")
-    bigtop_updates_rounded = IconData(name="bigtop_updates", fontFamily="Material Symbols Rounded")
-    bike_dock_rounded = IconData(name="bike_dock", fontFamily="Material Symbols Rounded")
-    bike_lane_rounded = IconData(name="bike_lane", fontFamily="Material Symbols Rounded")
-    bike_scooter_rounded = IconData(name="bike_scooter", fontFamily="Material Symbols Rounded")
-    biotech_rounded = IconData(name="biotech", fontFamily="Material Symbols Rounded")
-    blanket_rounded = IconData(name="blanket", fontFamily="Material Symbols Rounded")
-    blender_rounded = IconData(name="blender", fontFamily="Material Symbols Rounded")
-    blind_rounded = IconData(name="blind", fontFamily="Material Symbols Rounded")
-    blinds_rounded = IconData(name="blinds", fontFamily="Material Symbols Rounded")
-    blinds_closed_rounded = IconData(name="blinds_closed", fontFamily="Material Symbols Rounded")
-    block_rounded = IconData(name="block", fontFamily="Material Symbols Rounded")
-    blood_pressure_rounded = IconData(name="blood_pressure", fontFamily="Material Symbols Rounded")
-    bloodtype_rounded = IconData(name="bloodtype", fontFamily="Material Symbols Rounded")
-    bluetooth_rounded = IconData(name="bluetooth", fontFamily="Material Symbols Rounded")
-    bluetooth_audio_rounded = IconData(name="bluetooth_audio", fontFamily="Material Symbols Rounded")
-    bluetooth_connected_rounded = IconData(name="bluetooth_connected", fontFamily="Material Symbols Rounded")
-    bluetooth_disabled_rounded = IconData(name="bluetooth_disabled", fontFamily="Material Symbols Rounded")
-    bluetooth_drive_rounded = IconData(name="bluetooth_drive", fontFamily="Material Symbols Rounded")
-    bluetooth_searching_rounded = IconData(name="bluetooth_searching", fontFamily="Material Symbols Rounded")
-    blur_circular_rounded = IconData(name="blur_circular", fontFamily="Material Symbols Rounded")
-    blur_linear_rounded = IconData(name="blur_linear", fontFamily="Material Symbols Rounded")
-    blur_medium_rounded = IconData(name="blur_medium", fontFamily="Material Symbols Rounded")
-    blur_off_rounded = IconData(name="blur_off", fontFamily="Material Symbols Rounded")
-    blur_on_rounded = IconData(name="blur_on", fontFamily="Material Symbols Rounded")
-    blur_short_rounded = IconData(name="blur_short", fontFamily="Material Symbols Rounded")
-    boat_bus_rounded = IconData(name="boat_bus", fontFamily="Material Symbols Rounded")
-    boat_railway_rounded = IconData(name="boat_railway", fontFamily="Material Symbols Rounded")
-    body_fat_rounded = IconData(name="body_fat", fontFamily="Material Symbols Rounded")
-    body_system_rounded = IconData(name="body_system", fontFamily="Material Symbols Rounded")
-    bolt_rounded = IconData(name="bolt", fontFamily="Material Symbols Rounded")
-    bomb_rounded = IconData(name="bomb", fontFamily="Material Symbols Rounded")
-    book_rounded = IconData(name="book", fontFamily="Material Symbols Rounded")
-    book_2_rounded = IconData(name="book_2", fontFamily="Material Symbols Rounded")
-    book_3_rounded = IconData(name="book_3", fontFamily="Material Symbols Rounded")
-    book_4_rounded = IconData(name="book_4", fontFamily="Material Symbols Rounded")
-    book_5_rounded = IconData(name="book_5", fontFamily="Material Symbols Rounded")
-    book_6_rounded = IconData(name="book_6", fontFamily="Material Symbols Rounded")
-    book_online_rounded = IconData(name="book_online", fontFamily="Material Symbols Rounded")
-    book_ribbon_rounded = IconData(name="book_ribbon", fontFamily="Material Symbols Rounded")
-    bookmark_rounded = IconData(name="bookmark", fontFamily="Material Symbols Rounded")
-    bookmark_add_rounded = IconData(name="bookmark_add", fontFamily="Material Symbols Rounded")
-    bookmark_added_rounded = IconData(name="bookmark_added", fontFamily="Material Symbols Rounded")
-    bookmark_bag_rounded = IconData(name="bookmark_bag", fontFamily="Material Symbols Rounded")
-    bookmark_border_rounded = IconData(name="bookmark_border", fontFamily="Material Symbols Rounded")
-    bookmark_check_rounded = IconData(name="bookmark_check", fontFamily="Material Symbols Rounded")
-    bookmark_flag_rounded = IconData(name="bookmark_flag", fontFamily="Material Symbols Rounded")
-    bookmark_heart_rounded = IconData(name="bookmark_heart", fontFamily="Material Symbols Rounded")
-    bookmark_manager_rounded = IconData(name="bookmark_manager", fontFamily="Material Symbols Rounded")
-    bookmark_remove_rounded = IconData(name="bookmark_remove", fontFamily="Material Symbols Rounded")
-    bookmark_star_rounded = IconData(name="bookmark_star", fontFamily="Material Symbols Rounded")
-    bookmarks_rounded = IconData(name="bookmarks", fontFamily="Material Symbols Rounded")
-    books_movies_and_music_rounded = IconData(name="books_movies_and_music", fontFamily="Material Symbols Rounded")
-    border_all_rounded = IconData(name="border_all", fontFamily="Material Symbols Rounded")
-    border_bottom_rounded = IconData(name="border_bottom", fontFamily="Material Symbols Rounded")
-    border_clear_rounded = IconData(name="border_clear", fontFamily="Material Symbols Rounded")
-    border_color_rounded = IconData(name="border_color", fontFamily="Material Symbols Rounded")
-    border_horizontal_rounded = IconData(name="border_horizontal", fontFamily="Material Symbols Rounded")
-    border_inner_rounded = IconData(name="border_inner", fontFamily="Material Symbols Rounded")
-    border_left_rounded = IconData(name="border_left", fontFamily="Material Symbols Rounded")
-    border_outer_rounded = IconData(name="border_outer", fontFamily="Material Symbols Rounded")
-    border_right_rounded = IconData(name="border_right", fontFamily="Material Symbols Rounded")
-    border_style_rounded = IconData(name="border_style", fontFamily="Material Symbols Rounded")
-    border_top_rounded = IconData(name="border_top", fontFamily="Material Symbols Rounded")
-    border_vertical_rounded = IconData(name="border_vertical", fontFamily="Material Symbols Rounded")
-    borg_rounded = IconData(name="borg", fontFamily="Material Symbols Rounded")
-    bottom_app_bar_rounded = IconData(name="bottom_app_bar", fontFamily="Material Symbols Rounded")
-    bottom_drawer_rounded = IconData(name="bottom_drawer", fontFamily="Material Symbols Rounded")
-    bottom_navigation_rounded = IconData(name="bottom_navigation", fontFamily="Material Symbols Rounded")
-    bottom_panel_close_rounded = IconData(name="bottom_panel_close", fontFamily="Material Symbols Rounded")
-    bottom_panel_open_rounded = IconData(name="bottom_panel_open", fontFamily="Material Symbols Rounded")
-    bottom_right_click_rounded = IconData(name="bottom_right_click", fontFamily="Material Symbols Rounded")
-    bottom_sheets_rounded = IconData(name="bottom_sheets", fontFamily="Material Symbols Rounded")
-    box_rounded = IconData(name="box", fontFamily="Material Symbols Rounded")
-    box_add_rounded = IconData(name="box_add", fontFamily="Material Symbols Rounded")
-    box_edit_rounded = IconData(name="box_edit", fontFamily="Material Symbols Rounded")
-    boy_rounded = IconData(name="boy", fontFamily="Material Symbols Rounded")
-    brand_awareness_rounded = IconData(name="brand_awareness", fontFamily="Material Symbols Rounded")
-    brand_family_rounded = IconData(name="brand_family", fontFamily="Material Symbols Rounded")
-    branding_watermark_rounded = IconData(name="branding_watermark", fontFamily="Material Symbols Rounded")
-    breakfast_dining_rounded = IconData(name="breakfast_dining", fontFamily="Material Symbols Rounded")
-    breaking_news_rounded = IconData(name="breaking_news", fontFamily="Material Symbols Rounded")
-    breaking_news_alt_1_rounded = IconData(name="breaking_news_alt_1", fontFamily="Material Symbols Rounded")
-    breastfeeding_rounded = IconData(name="breastfeeding", fontFamily="Material Symbols Rounded")
-    brick_rounded = IconData(name="brick", fontFamily="Material Symbols Rounded")
-    brightness_1_rounded = IconData(name="brightness_1", fontFamily="Material Symbols Rounded")
-    brightness_2_rounded = IconData(name="brightness_2", fontFamily="Material Symbols Rounded")
-    brightness_3_rounded = IconData(name="brightness_3", fontFamily="Material Symbols Rounded")
-    brightness_4_rounded = IconData(name="brightness_4", fontFamily="Material Symbols Rounded")
-    brightness_5_rounded = IconData(name="brightness_5", fontFamily="Material Symbols Rounded")
-    brightness_6_rounded = IconData(name="brightness_6", fontFamily="Material Symbols Rounded")
-    brightness_7_rounded = IconData(name="brightness_7", fontFamily="Material Symbols Rounded")
-    brightness_alert_rounded = IconData(name="brightness_alert", fontFamily="Material Symbols Rounded")
-    brightness_auto_rounded = IconData(name="brightness_auto", fontFamily="Material Symbols Rounded")
-    brightness_empty_rounded = IconData(name="brightness_empty", fontFamily="Material Symbols Rounded")
-    brightness_high_rounded = IconData(name="brightness_high", fontFamily="Material Symbols Rounded")
-    brightness_low_rounded = IconData(name="brightness_low", fontFamily="Material Symbols Rounded")
-    brightness_medium_rounded = IconData(name="brightness_medium", fontFamily="Material Symbols Rounded")
-    bring_your_own_ip_rounded = IconData(name="bring_your_own_ip", fontFamily="Material Symbols Rounded")
-    broadcast_on_home_rounded = IconData(name="broadcast_on_home", fontFamily="Material Symbols Rounded")
-    broadcast_on_personal_rounded = IconData(name="broadcast_on_personal", fontFamily="Material Symbols Rounded")
-    broken_image_rounded = IconData(name="broken_image", fontFamily="Material Symbols Rounded")
-    browse_rounded = IconData(name="browse", fontFamily="Material Symbols Rounded")
-    browse_activity_rounded = IconData(name="browse_activity", fontFamily="Material Symbols Rounded")
-    browse_gallery_rounded = IconData(name="browse_gallery", fontFamily="Material Symbols Rounded")
-    browser_not_supported_rounded = IconData(name="browser_not_supported", fontFamily="Material Symbols Rounded")
-    browser_updated_rounded = IconData(name="browser_updated", fontFamily="Material Symbols Rounded")
-    brunch_dining_rounded = IconData(name="brunch_dining", fontFamily="Material Symbols Rounded")
-    brush_rounded = IconData(name="brush", fontFamily="Material Symbols Rounded")
-    bubble_rounded = IconData(name="bubble", fontFamily="Material Symbols Rounded")
-    bubble_chart_rounded = IconData(name="bubble_chart", fontFamily="Material Symbols Rounded")
-    bubbles_rounded = IconData(name="bubbles", fontFamily="Material Symbols Rounded")
-    bug_report_rounded = IconData(name="bug_report", fontFamily="Material Symbols Rounded")
-    build_rounded = IconData(name="build", fontFamily="Material Symbols Rounded")
-    build_circle_rounded = IconData(name="build_circle", fontFamily="Material Symbols Rounded")
-    bungalow_rounded = IconData(name="bungalow", fontFamily="Material Symbols Rounded")
-    burst_mode_rounded = IconData(name="burst_mode", fontFamily="Material Symbols Rounded")
-    bus_alert_rounded = IconData(name="bus_alert", fontFamily="Material Symbols Rounded")
-    bus_railway_rounded = IconData(name="bus_railway", fontFamily="Material Symbols Rounded")
-    business_rounded = IconData(name="business", fontFamily="Material Symbols Rounded")
-    business_center_rounded = IconData(name="business_center", fontFamily="Material Symbols Rounded")
-    business_chip_rounded = IconData(name="business_chip", fontFamily="Material Symbols Rounded")
-    business_messages_rounded = IconData(name="business_messages", fontFamily="Material Symbols Rounded")
-    buttons_alt_rounded = IconData(name="buttons_alt", fontFamily="Material Symbols Rounded")
-    cabin_rounded = IconData(name="cabin", fontFamily="Material Symbols Rounded")
-    cable_rounded = IconData(name="cable", fontFamily="Material Symbols Rounded")
-    cable_car_rounded = IconData(name="cable_car", fontFamily="Material Symbols Rounded")
-    cached_rounded = IconData(name="cached", fontFamily="Material Symbols Rounded")
-    cadence_rounded = IconData(name="cadence", fontFamily="Material Symbols Rounded")
-    cake_rounded = IconData(name="cake", fontFamily="Material Symbols Rounded")
-    cake_add_rounded = IconData(name="cake_add", fontFamily="Material Symbols Rounded")
-    calculate_rounded = IconData(name="calculate", fontFamily="Material Symbols Rounded")
-    calendar_add_on_rounded = IconData(name="calendar_add_on", fontFamily="Material Symbols Rounded")
-    calendar_apps_script_rounded = IconData(name="calendar_apps_script", fontFamily="Material Symbols Rounded")
-    calendar_clock_rounded = IconData(name="calendar_clock", fontFamily="Material Symbols Rounded")
-    calendar_month_rounded = IconData(name="calendar_month", fontFamily="Material Symbols Rounded")
-    calendar_today_rounded = IconData(name="calendar_today", fontFamily="Material Symbols Rounded")
-    calendar_view_day_rounded = IconData(name="calendar_view_day", fontFamily="Material Symbols Rounded")
-    calendar_view_month_rounded = IconData(name="calendar_view_month", fontFamily="Material Symbols Rounded")
-    calendar_view_week_rounded = IconData(name="calendar_view_week", fontFamily="Material Symbols Rounded")
-    call_rounded = IconData(name="call", fontFamily="Material Symbols Rounded")
-    call_end_rounded = IconData(name="call_end", fontFamily="Material Symbols Rounded")
-    call_end_alt_rounded = IconData(name="call_end_alt", fontFamily="Material Symbols Rounded")
-    call_log_rounded = IconData(name="call_log", fontFamily="Material Symbols Rounded")
-    call_made_rounded = IconData(name="call_made", fontFamily="Material Symbols Rounded")
-    call_merge_rounded = IconData(name="call_merge", fontFamily="Material Symbols Rounded")
-    call_missed_rounded = IconData(name="call_missed", fontFamily="Material Symbols Rounded")
-    call_missed_outgoing_rounded = IconData(name="call_missed_outgoing", fontFamily="Material Symbols Rounded")
-    call_quality_rounded = IconData(name="call_quality", fontFamily="Material Symbols Rounded")
-    call_received_rounded = IconData(name="call_received", fontFamily="Material Symbols Rounded")
-    call_split_rounded = IconData(name="call_split", fontFamily="Material Symbols Rounded")
-    call_to_action_rounded = IconData(name="call_to_action", fontFamily="Material Symbols Rounded")
-    camera_rounded = IconData(name="camera", fontFamily="Material Symbols Rounded")
-    camera_alt_rounded = IconData(name="camera_alt", fontFamily="Material Symbols Rounded")
-    camera_enhance_rounded = IconData(name="camera_enhance", fontFamily="Material Symbols Rounded")
-    camera_front_rounded = IconData(name="camera_front", fontFamily="Material Symbols Rounded")
-    camera_indoor_rounded = IconData(name="camera_indoor", fontFamily="Material Symbols Rounded")
-    camera_outdoor_rounded = IconData(name="camera_outdoor", fontFamily="Material Symbols Rounded")
-    camera_rear_rounded = IconData(name="camera_rear", fontFamily="Material Symbols Rounded")
-    camera_roll_rounded = IconData(name="camera_roll", fontFamily="Material Symbols Rounded")
-    camera_video_rounded = IconData(name="camera_video", fontFamily="Material Symbols Rounded")
-    cameraswitch_rounded = IconData(name="cameraswitch", fontFamily="Material Symbols Rounded")
-    campaign_rounded = IconData(name="campaign", fontFamily="Material Symbols Rounded")
-    camping_rounded = IconData(name="camping", fontFamily="Material Symbols Rounded")
-    cancel_rounded = IconData(name="cancel", fontFamily="Material Symbols Rounded")
-    cancel_presentation_rounded = IconData(name="cancel_presentation", fontFamily="Material Symbols Rounded")
-    cancel_schedule_send_rounded = IconData(name="cancel_schedule_send", fontFamily="Material Symbols Rounded")
-    candle_rounded = IconData(name="candle", fontFamily="Material Symbols Rounded")
-    candlestick_chart_rounded = IconData(name="candlestick_chart", fontFamily="Material Symbols Rounded")
-    cannabis_rounded = IconData(name="cannabis", fontFamily="Material Symbols Rounded")
-    captive_portal_rounded = IconData(name="captive_portal", fontFamily="Material Symbols Rounded")
-    capture_rounded = IconData(name="capture", fontFamily="Material Symbols Rounded")
-    car_crash_rounded = IconData(name="car_crash", fontFamily="Material Symbols Rounded")
-    car_defrost_left_rounded = IconData(name="car_defrost_left", fontFamily="Material Symbols Rounded")
-    car_defrost_low_left_rounded = IconData(name="car_defrost_low_left", fontFamily="Material Symbols Rounded")
-    car_defrost_low_right_rounded = IconData(name="car_defrost_low_right", fontFamily="Material Symbols Rounded")
-    car_defrost_mid_low_left_rounded = IconData(name="car_defrost_mid_low_left", fontFamily="Material Symbols Rounded")
-    car_defrost_mid_right_rounded = IconData(name="car_defrost_mid_right", fontFamily="Material Symbols Rounded")
-    car_defrost_right_rounded = IconData(name="car_defrost_right", fontFamily="Material Symbols Rounded")
-    car_fan_low_left_rounded = IconData(name="car_fan_low_left", fontFamily="Material Symbols Rounded")
-    car_fan_low_mid_left_rounded = IconData(name="car_fan_low_mid_left", fontFamily="Material Symbols Rounded")
-    car_fan_low_right_rounded = IconData(name="car_fan_low_right", fontFamily="Material Symbols Rounded")
-    car_fan_mid_left_rounded = IconData(name="car_fan_mid_left", fontFamily="Material Symbols Rounded")
-    car_fan_mid_low_right_rounded = IconData(name="car_fan_mid_low_right", fontFamily="Material Symbols Rounded")
-    car_fan_mid_right_rounded = IconData(name="car_fan_mid_right", fontFamily="Material Symbols Rounded")
-    car_fan_recirculate_rounded = IconData(name="car_fan_recirculate", fontFamily="Material Symbols Rounded")
-    car_gear_rounded = IconData(name="car_gear", fontFamily="Material Symbols Rounded")
-    car_lock_rounded = IconData(name="car_lock", fontFamily="Material Symbols Rounded")
-    car_mirror_heat_rounded = IconData(name="car_mirror_heat", fontFamily="Material Symbols Rounded")
-    car_rental_rounded = IconData(name="car_rental", fontFamily="Material Symbols Rounded")
-    car_repair_rounded = IconData(name="car_repair", fontFamily="Material Symbols Rounded")
-    car_tag_rounded = IconData(name="car_tag", fontFamily="Material Symbols Rounded")
-    card_giftcard_rounded = IconData(name="card_giftcard", fontFamily="Material Symbols Rounded")
-    card_membership_rounded = IconData(name="card_membership", fontFamily="Material Symbols Rounded")
-    card_travel_rounded = IconData(name="card_travel", fontFamily="Material Symbols Rounded")
-    cardio_load_rounded = IconData(name="cardio_load", fontFamily="Material Symbols Rounded")
-    cardiology_rounded = IconData(name="cardiology", fontFamily="Material Symbols Rounded")
-    cards_rounded = IconData(name="cards", fontFamily="Material Symbols Rounded")
-    cards_star_rounded = IconData(name="cards_star", fontFamily="Material Symbols Rounded")
-    carpenter_rounded = IconData(name="carpenter", fontFamily="Material Symbols Rounded")
-    carry_on_bag_rounded = IconData(name="carry_on_bag", fontFamily="Material Symbols Rounded")
-    carry_on_bag_checked_rounded = IconData(name="carry_on_bag_checked", fontFamily="Material Symbols Rounded")
-    carry_on_bag_inactive_rounded = IconData(name="carry_on_bag_inactive", fontFamily="Material Symbols Rounded")
-    carry_on_bag_question_rounded = IconData(name="carry_on_bag_question", fontFamily="Material Symbols Rounded")
-    cases_rounded = IconData(name="cases", fontFamily="Material Symbols Rounded")
-    casino_rounded = IconData(name="casino", fontFamily="Material Symbols Rounded")
-    cast_rounded = IconData(name="cast", fontFamily="Material Symbols Rounded")
-    cast_connected_rounded = IconData(name="cast_connected", fontFamily="Material Symbols Rounded")
-    cast_for_education_rounded = IconData(name="cast_for_education", fontFamily="Material Symbols Rounded")
-    cast_pause_rounded = IconData(name="cast_pause", fontFamily="Material Symbols Rounded")
-    cast_warning_rounded = IconData(name="cast_warning", fontFamily="Material Symbols Rounded")
-    castle_rounded = IconData(name="castle", fontFamily="Material Symbols Rounded")
-    category_rounded = IconData(name="category", fontFamily="Material Symbols Rounded")
-    category_search_rounded = IconData(name="category_search", fontFamily="Material Symbols Rounded")
-    celebration_rounded = IconData(name="celebration", fontFamily="Material Symbols Rounded")
-    cell_merge_rounded = IconData(name="cell_merge", fontFamily="Material Symbols Rounded")
-    cell_tower_rounded = IconData(name="cell_tower", fontFamily="Material Symbols Rounded")
-    cell_wifi_rounded = IconData(name="cell_wifi", fontFamily="Material Symbols Rounded")
-    center_focus_strong_rounded = IconData(name="center_focus_strong", fontFamily="Material Symbols Rounded")
-    center_focus_weak_rounded = IconData(name="center_focus_weak", fontFamily="Material Symbols Rounded")
-    chair_rounded = IconData(name="chair", fontFamily="Material Symbols Rounded")
-    chair_alt_rounded = IconData(name="chair_alt", fontFamily="Material Symbols Rounded")
-    chalet_rounded = IconData(name="chalet", fontFamily="Material Symbols Rounded")
-    change_circle_rounded = IconData(name="change_circle", fontFamily="Material Symbols Rounded")
-    change_history_rounded = IconData(name="change_history", fontFamily="Material Symbols Rounded")
-    charger_rounded = IconData(name="charger", fontFamily="Material Symbols Rounded")
-    charging_station_rounded = IconData(name="charging_station", fontFamily="Material Symbols Rounded")
-    chart_data_rounded = IconData(name="chart_data", fontFamily="Material Symbols Rounded")
-    chat_rounded = IconData(name="chat", fontFamily="Material Symbols Rounded")
-    chat_add_on_rounded = IconData(name="chat_add_on", fontFamily="Material Symbols Rounded")
-    chat_apps_script_rounded = IconData(name="chat_apps_script", fontFamily="Material Symbols Rounded")
-    chat_bubble_rounded = IconData(name="chat_bubble", fontFamily="Material Symbols Rounded")
-    chat_bubble_outline_rounded = IconData(name="chat_bubble_outline", fontFamily="Material Symbols Rounded")
-    chat_error_rounded = IconData(name="chat_error", fontFamily="Material Symbols Rounded")
-    chat_info_rounded = IconData(name="chat_info", fontFamily="Material Symbols Rounded")
-    chat_paste_go_rounded = IconData(name="chat_paste_go", fontFamily="Material Symbols Rounded")
-    chat_paste_go_2_rounded = IconData(name="chat_paste_go_2", fontFamily="Material Symbols Rounded")
-    check_rounded = IconData(name="check", fontFamily="Material Symbols Rounded")
-    check_box_rounded = IconData(name="check_box", fontFamily="Material Symbols Rounded")
-    check_box_outline_blank_rounded = IconData(name="check_box_outline_blank", fontFamily="Material Symbols Rounded")
-    check_circle_rounded = IconData(name="check_circle", fontFamily="Material Symbols Rounded")
-    check_circle_filled_rounded = IconData(name="check_circle_filled", fontFamily="Material Symbols Rounded")
-    check_circle_outline_rounded = IconData(name="check_circle_outline", fontFamily="Material Symbols Rounded")
-    check_in_out_rounded = IconData(name="check_in_out", fontFamily="Material Symbols Rounded")
-    check_indeterminate_small_rounded = IconData(name="check_indeterminate_small", fontFamily="Material Symbols Rounded")
-    check_small_rounded = IconData(name="check_small", fontFamily="Material Symbols Rounded")
-    checkbook_rounded = IconData(name="checkbook", fontFamily="Material Symbols Rounded")
-    checked_bag_rounded = IconData(name="checked_bag", fontFamily="Material Symbols Rounded")
-    checked_bag_question_rounded = IconData(name="checked_bag_question", fontFamily="Material Symbols Rounded")
-    checklist_rounded = IconData(name="checklist", fontFamily="Material Symbols Rounded")
-    checklist_rtl_rounded = IconData(name="checklist_rtl", fontFamily="Material Symbols Rounded")
-    checkroom_rounded = IconData(name="checkroom", fontFamily="Material Symbols Rounded")
-    cheer_rounded = IconData(name="cheer", fontFamily="Material Symbols Rounded")
-    chef_hat_rounded = IconData(name="chef_hat", fontFamily="Material Symbols Rounded")
-    chess_rounded = IconData(name="chess", fontFamily="Material Symbols Rounded")
-    chess_pawn_rounded = IconData(name="chess_pawn", fontFamily="Material Symbols Rounded")
-    chevron_backward_rounded = IconData(name="chevron_backward", fontFamily="Material Symbols Rounded")
-    chevron_forward_rounded = IconData(name="chevron_forward", fontFamily="Material Symbols Rounded")
-    chevron_left_rounded = IconData(name="chevron_left", fontFamily="Material Symbols Rounded")
-    chevron_right_rounded = IconData(name="chevron_right", fontFamily="Material Symbols Rounded")
-    child_care_rounded = IconData(name="child_care", fontFamily="Material Symbols Rounded")
-    child_friendly_rounded = IconData(name="child_friendly", fontFamily="Material Symbols Rounded")
-    chip_extraction_rounded = IconData(name="chip_extraction", fontFamily="Material Symbols Rounded")
-    chips_rounded = IconData(name="chips", fontFamily="Material Symbols Rounded")
-    chrome_reader_mode_rounded = IconData(name="chrome_reader_mode", fontFamily="Material Symbols Rounded")
-    chromecast_2_rounded = IconData(name="chromecast_2", fontFamily="Material Symbols Rounded")
-    chromecast_device_rounded = IconData(name="chromecast_device", fontFamily="Material Symbols Rounded")
-    chronic_rounded = IconData(name="chronic", fontFamily="Material Symbols Rounded")
-    church_rounded = IconData(name="church", fontFamily="Material Symbols Rounded")
-    cinematic_blur_rounded = IconData(name="cinematic_blur", fontFamily="Material Symbols Rounded")
-    circle_rounded = IconData(name="circle", fontFamily="Material Symbols Rounded")
-    circle_notifications_rounded = IconData(name="circle_notifications", fontFamily="Material Symbols Rounded")
-    circles_rounded = IconData(name="circles", fontFamily="Material Symbols Rounded")
-    circles_ext_rounded = IconData(name="circles_ext", fontFamily="Material Symbols Rounded")
-    clarify_rounded = IconData(name="clarify", fontFamily="Material Symbols Rounded")
-    class_rounded = IconData(name="class", fontFamily="Material Symbols Rounded")
-    clean_hands_rounded = IconData(name="clean_hands", fontFamily="Material Symbols Rounded")
-    cleaning_rounded = IconData(name="cleaning", fontFamily="Material Symbols Rounded")
-    cleaning_bucket_rounded = IconData(name="cleaning_bucket", fontFamily="Material Symbols Rounded")
-    cleaning_services_rounded = IconData(name="cleaning_services", fontFamily="Material Symbols Rounded")
-    clear_rounded = IconData(name="clear", fontFamily="Material Symbols Rounded")
-    clear_all_rounded = IconData(name="clear_all", fontFamily="Material Symbols Rounded")
-    clear_day_rounded = IconData(name="clear_day", fontFamily="Material Symbols Rounded")
-    clear_night_rounded = IconData(name="clear_night", fontFamily="Material Symbols Rounded")
-    climate_mini_split_rounded = IconData(name="climate_mini_split", fontFamily="Material Symbols Rounded")
-    clinical_notes_rounded = IconData(name="clinical_notes", fontFamily="Material Symbols Rounded")
-    clock_arrow_down_rounded = IconData(name="clock_arrow_down", fontFamily="Material Symbols Rounded")
-    clock_arrow_up_rounded = IconData(name="clock_arrow_up", fontFamily="Material Symbols Rounded")
-    clock_loader_10_rounded = IconData(name="clock_loader_10", fontFamily="Material Symbols Rounded")
-    clock_loader_20_rounded = IconData(name="clock_loader_20", fontFamily="Material Symbols Rounded")
-    clock_loader_40_rounded = IconData(name="clock_loader_40", fontFamily="Material Symbols Rounded")
-    clock_loader_60_rounded = IconData(name="clock_loader_60", fontFamily="Material Symbols Rounded")
-    clock_loader_80_rounded = IconData(name="clock_loader_80", fontFamily="Material Symbols Rounded")
-    clock_loader_90_rounded = IconData(name="clock_loader_90", fontFamily="Material Symbols Rounded")
-    close_rounded = IconData(name="close", fontFamily="Material Symbols Rounded")
-    close_fullscreen_rounded = IconData(name="close_fullscreen", fontFamily="Material Symbols Rounded")
-    close_small_rounded = IconData(name="close_small", fontFamily="Material Symbols Rounded")
-    closed_caption_rounded = IconData(name="closed_caption", fontFamily="Material Symbols Rounded")
-    closed_caption_add_rounded = IconData(name="closed_caption_add", fontFamily="Material Symbols Rounded")
-    closed_caption_disabled_rounded = IconData(name="closed_caption_disabled", fontFamily="Material Symbols Rounded")
-    closed_caption_off_rounded = IconData(name="closed_caption_off", fontFamily="Material Symbols Rounded")
-    cloud_rounded = IconData(name="cloud", fontFamily="Material Symbols Rounded")
-    cloud_alert_rounded = IconData(name="cloud_alert", fontFamily="Material Symbols Rounded")
-    cloud_circle_rounded = IconData(name="cloud_circle", fontFamily="Material Symbols Rounded")
-    cloud_done_rounded = IconData(name="cloud_done", fontFamily="Material Symbols Rounded")
-    cloud_download_rounded = IconData(name="cloud_download", fontFamily="Material Symbols Rounded")
-    cloud_lock_rounded = IconData(name="cloud_lock", fontFamily="Material Symbols Rounded")
-    cloud_off_rounded = IconData(name="cloud_off", fontFamily="Material Symbols Rounded")
-    cloud_queue_rounded = IconData(name="cloud_queue", fontFamily="Material Symbols Rounded")
-    cloud_sync_rounded = IconData(name="cloud_sync", fontFamily="Material Symbols Rounded")
-    cloud_upload_rounded = IconData(name="cloud_upload", fontFamily="Material Symbols Rounded")
-    cloudy_rounded = IconData(name="cloudy", fontFamily="Material Symbols Rounded")
-    cloudy_filled_rounded = IconData(name="cloudy_filled", fontFamily="Material Symbols Rounded")
-    cloudy_snowing_rounded = IconData(name="cloudy_snowing", fontFamily="Material Symbols Rounded")
-    co2_rounded = IconData(name="co2", fontFamily="Material Symbols Rounded")
-    co_present_rounded = IconData(name="co_present", fontFamily="Material Symbols Rounded")
-    code_rounded = IconData(name="code", fontFamily="Material Symbols Rounded")
-    code_blocks_rounded = IconData(name="code_blocks", fontFamily="Material Symbols Rounded")
-    code_off_rounded = IconData(name="code_off", fontFamily="Material Symbols Rounded")
-    coffee_rounded = IconData(name="coffee", fontFamily="Material Symbols Rounded")
-    coffee_maker_rounded = IconData(name="coffee_maker", fontFamily="Material Symbols Rounded")
-    cognition_rounded = IconData(name="cognition", fontFamily="Material Symbols Rounded")
-    cognition_2_rounded = IconData(name="cognition_2", fontFamily="Material Symbols Rounded")
-    collapse_all_rounded = IconData(name="collapse_all", fontFamily="Material Symbols Rounded")
-    collapse_content_rounded = IconData(name="collapse_content", fontFamily="Material Symbols Rounded")
-    collections_rounded = IconData(name="collections", fontFamily="Material Symbols Rounded")
-    collections_bookmark_rounded = IconData(name="collections_bookmark", fontFamily="Material Symbols Rounded")
-    color_lens_rounded = IconData(name="color_lens", fontFamily="Material Symbols Rounded")
-    colorize_rounded = IconData(name="colorize", fontFamily="Material Symbols Rounded")
-    colors_rounded = IconData(name="colors", fontFamily="Material Symbols Rounded")
-    combine_columns_rounded = IconData(name="combine_columns", fontFamily="Material Symbols Rounded")
-    comedy_mask_rounded = IconData(name="comedy_mask", fontFamily="Material Symbols Rounded")
-    comic_bubble_rounded = IconData(name="comic_bubble", fontFamily="Material Symbols Rounded")
-    comment_rounded = IconData(name="comment", fontFamily="Material Symbols Rounded")
-    comment_bank_rounded = IconData(name="comment_bank", fontFamily="Material Symbols Rounded")
-    comments_disabled_rounded = IconData(name="comments_disabled", fontFamily="Material Symbols Rounded")
-    commit_rounded = IconData(name="commit", fontFamily="Material Symbols Rounded")
-    communication_rounded = IconData(name="communication", fontFamily="Material Symbols Rounded")
-    communities_rounded = IconData(name="communities", fontFamily="Material Symbols Rounded")
-    communities_filled_rounded = IconData(name="communities_filled", fontFamily="Material Symbols Rounded")
-    commute_rounded = IconData(name="commute", fontFamily="Material Symbols Rounded")
-    compare_rounded = IconData(name="compare", fontFamily="Material Symbols Rounded")
-    compare_arrows_rounded = IconData(name="compare_arrows", fontFamily="Material Symbols Rounded")
-    compass_calibration_rounded = IconData(name="compass_calibration", fontFamily="Material Symbols Rounded")
-    component_exchange_rounded = IconData(name="component_exchange", fontFamily="Material Symbols Rounded")
-    compost_rounded = IconData(name="compost", fontFamily="Material Symbols Rounded")
-    compress_rounded = IconData(name="compress", fontFamily="Material Symbols Rounded")
-    computer_rounded = IconData(name="computer", fontFamily="Material Symbols Rounded")
-    computer_arrow_up_rounded = IconData(name="computer_arrow_up", fontFamily="Material Symbols Rounded")
-    computer_cancel_rounded = IconData(name="computer_cancel", fontFamily="Material Symbols Rounded")
-    concierge_rounded = IconData(name="concierge", fontFamily="Material Symbols Rounded")
-    conditions_rounded = IconData(name="conditions", fontFamily="Material Symbols Rounded")
-    confirmation_number_rounded = IconData(name="confirmation_number", fontFamily="Material Symbols Rounded")
-    congenital_rounded = IconData(name="congenital", fontFamily="Material Symbols Rounded")
-    connect_without_contact_rounded = IconData(name="connect_without_contact", fontFamily="Material Symbols Rounded")
-    connected_tv_rounded = IconData(name="connected_tv", fontFamily="Material Symbols Rounded")
-    connecting_airports_rounded = IconData(name="connecting_airports", fontFamily="Material Symbols Rounded")
-    construction_rounded = IconData(name="construction", fontFamily="Material Symbols Rounded")
-    contact_emergency_rounded = IconData(name="contact_emergency", fontFamily="Material Symbols Rounded")
-    contact_mail_rounded = IconData(name="contact_mail", fontFamily="Material Symbols Rounded")
-    contact_page_rounded = IconData(name="contact_page", fontFamily="Material Symbols Rounded")
-    contact_phone_rounded = IconData(name="contact_phone", fontFamily="Material Symbols Rounded")
-    contact_phone_filled_rounded = IconData(name="contact_phone_filled", fontFamily="Material Symbols Rounded")
-    contact_support_rounded = IconData(name="contact_support", fontFamily="Material Symbols Rounded")
-    contactless_rounded = IconData(name="contactless", fontFamily="Material Symbols Rounded")
-    contactless_off_rounded = IconData(name="contactless_off", fontFamily="Material Symbols Rounded")
-    contacts_rounded = IconData(name="contacts", fontFamily="Material Symbols Rounded")
-    contacts_product_rounded = IconData(name="contacts_product", fontFamily="Material Symbols Rounded")
-    content_copy_rounded = IconData(name="content_copy", fontFamily="Material Symbols Rounded")
-    content_cut_rounded = IconData(name="content_cut", fontFamily="Material Symbols Rounded")
-    content_paste_rounded = IconData(name="content_paste", fontFamily="Material Symbols Rounded")
-    content_paste_go_rounded = IconData(name="content_paste_go", fontFamily="Material Symbols Rounded")
-    content_paste_off_rounded = IconData(name="content_paste_off", fontFamily="Material Symbols Rounded")
-    content_paste_search_rounded = IconData(name="content_paste_search", fontFamily="Material Symbols Rounded")
-    contextual_token_rounded = IconData(name="contextual_token", fontFamily="Material Symbols Rounded")
-    contextual_token_add_rounded = IconData(name="contextual_token_add", fontFamily="Material Symbols Rounded")
-    contract_rounded = IconData(name="contract", fontFamily="Material Symbols Rounded")
-    contract_delete_rounded = IconData(name="contract_delete", fontFamily="Material Symbols Rounded")
-    contract_edit_rounded = IconData(name="contract_edit", fontFamily="Material Symbols Rounded")
-    contrast_rounded = IconData(name="contrast", fontFamily="Material Symbols Rounded")
-    contrast_circle_rounded = IconData(name="contrast_circle", fontFamily="Material Symbols Rounded")
-    contrast_rtl_off_rounded = IconData(name="contrast_rtl_off", fontFamily="Material Symbols Rounded")
-    contrast_square_rounded = IconData(name="contrast_square", fontFamily="Material Symbols Rounded")
-    control_camera_rounded = IconData(name="control_camera", fontFamily="Material Symbols Rounded")
-    control_point_rounded = IconData(name="control_point", fontFamily="Material Symbols Rounded")
-    control_point_duplicate_rounded = IconData(name="control_point_duplicate", fontFamily="Material Symbols Rounded")
-    controller_gen_rounded = IconData(name="controller_gen", fontFamily="Material Symbols Rounded")
-    conversion_path_rounded = IconData(name="conversion_path", fontFamily="Material Symbols Rounded")
-    conversion_path_off_rounded = IconData(name="conversion_path_off", fontFamily="Material Symbols Rounded")
-    convert_to_text_rounded = IconData(name="convert_to_text", fontFamily="Material Symbols Rounded")
-    conveyor_belt_rounded = IconData(name="conveyor_belt", fontFamily="Material Symbols Rounded")
-    cookie_rounded = IconData(name="cookie", fontFamily="Material Symbols Rounded")
-    cookie_off_rounded = IconData(name="cookie_off", fontFamily="Material Symbols Rounded")
-    cooking_rounded = IconData(name="cooking", fontFamily="Material Symbols Rounded")
-    cool_to_dry_rounded = IconData(name="cool_to_dry", fontFamily="Material Symbols Rounded")
-    copy_all_rounded = IconData(name="copy_all", fontFamily="Material Symbols Rounded")
-    copyright_rounded = IconData(name="copyright", fontFamily="Material Symbols Rounded")
-    coronavirus_rounded = IconData(name="coronavirus", fontFamily="Material Symbols Rounded")
-    corporate_fare_rounded = IconData(name="corporate_fare", fontFamily="Material Symbols Rounded")
-    cottage_rounded = IconData(name="cottage", fontFamily="Material Symbols Rounded")
-    counter_0_rounded = IconData(name="counter_0", fontFamily="Material Symbols Rounded")
-    counter_1_rounded = IconData(name="counter_1", fontFamily="Material Symbols Rounded")
-    counter_2_rounded = IconData(name="counter_2", fontFamily="Material Symbols Rounded")
-    counter_3_rounded = IconData(name="counter_3", fontFamily="Material Symbols Rounded")
-    counter_4_rounded = IconData(name="counter_4", fontFamily="Material Symbols Rounded")
-    counter_5_rounded = IconData(name="counter_5", fontFamily="Material Symbols Rounded")
-    counter_6_rounded = IconData(name="counter_6", fontFamily="Material Symbols Rounded")
-    counter_7_rounded = IconData(name="counter_7", fontFamily="Material Symbols Rounded")
-    counter_8_rounded = IconData(name="counter_8", fontFamily="Material Symbols Rounded")
-    counter_9_rounded = IconData(name="counter_9", fontFamily="Material Symbols Rounded")
-    countertops_rounded = IconData(name="countertops", fontFamily="Material Symbols Rounded")
-    create_rounded = IconData(name="create", fontFamily="Material Symbols Rounded")
-    create_new_folder_rounded = IconData(name="create_new_folder", fontFamily="Material Symbols Rounded")
-    credit_card_rounded = IconData(name="credit_card", fontFamily="Material Symbols Rounded")
-    credit_card_clock_rounded = IconData(name="credit_card_clock", fontFamily="Material Symbols Rounded")
-    credit_card_gear_rounded = IconData(name="credit_card_gear", fontFamily="Material Symbols Rounded")
-    credit_card_heart_rounded = IconData(name="credit_card_heart", fontFamily="Material Symbols Rounded")
-    credit_card_off_rounded = IconData(name="credit_card_off", fontFamily="Material Symbols Rounded")
-    credit_score_rounded = IconData(name="credit_score", fontFamily="Material Symbols Rounded")
-    crib_rounded = IconData(name="crib", fontFamily="Material Symbols Rounded")
-    crisis_alert_rounded = IconData(name="crisis_alert", fontFamily="Material Symbols Rounded")
-    crop_rounded = IconData(name="crop", fontFamily="Material Symbols Rounded")
-    crop_16_9_rounded = IconData(name="crop_16_9", fontFamily="Material Symbols Rounded")
-    crop_3_2_rounded = IconData(name="crop_3_2", fontFamily="Material Symbols Rounded")
-    crop_5_4_rounded = IconData(name="crop_5_4", fontFamily="Material Symbols Rounded")
-    crop_7_5_rounded = IconData(name="crop_7_5", fontFamily="Material Symbols Rounded")
-    crop_9_16_rounded = IconData(name="crop_9_16", fontFamily="Material Symbols Rounded")
-    crop_din_rounded = IconData(name="crop_din", fontFamily="Material Symbols Rounded")
-    crop_free_rounded = IconData(name="crop_free", fontFamily="Material Symbols Rounded")
-    crop_landscape_rounded = IconData(name="crop_landscape", fontFamily="Material Symbols Rounded")
-    crop_original_rounded = IconData(name="crop_original", fontFamily="Material Symbols Rounded")
-    crop_portrait_rounded = IconData(name="crop_portrait", fontFamily="Material Symbols Rounded")
-    crop_rotate_rounded = IconData(name="crop_rotate", fontFamily="Material Symbols Rounded")
-    crop_square_rounded = IconData(name="crop_square", fontFamily="Material Symbols Rounded")
-    crossword_rounded = IconData(name="crossword", fontFamily="Material Symbols Rounded")
-    crowdsource_rounded = IconData(name="crowdsource", fontFamily="Material Symbols Rounded")
-    crown_rounded = IconData(name="crown", fontFamily="Material Symbols Rounded")
-    cruelty_free_rounded = IconData(name="cruelty_free", fontFamily="Material Symbols Rounded")
-    css_rounded = IconData(name="css", fontFamily="Material Symbols Rounded")
-    csv_rounded = IconData(name="csv", fontFamily="Material Symbols Rounded")
-    currency_bitcoin_rounded = IconData(name="currency_bitcoin", fontFamily="Material Symbols Rounded")
-    currency_exchange_rounded = IconData(name="currency_exchange", fontFamily="Material Symbols Rounded")
-    currency_franc_rounded = IconData(name="currency_franc", fontFamily="Material Symbols Rounded")
-    currency_lira_rounded = IconData(name="currency_lira", fontFamily="Material Symbols Rounded")
-    currency_pound_rounded = IconData(name="currency_pound", fontFamily="Material Symbols Rounded")
-    currency_ruble_rounded = IconData(name="currency_ruble", fontFamily="Material Symbols Rounded")
-    currency_rupee_rounded = IconData(name="currency_rupee", fontFamily="Material Symbols Rounded")
-    currency_rupee_circle_rounded = IconData(name="currency_rupee_circle", fontFamily="Material Symbols Rounded")
-    currency_yen_rounded = IconData(name="currency_yen", fontFamily="Material Symbols Rounded")
-    currency_yuan_rounded = IconData(name="currency_yuan", fontFamily="Material Symbols Rounded")
-    curtains_rounded = IconData(name="curtains", fontFamily="Material Symbols Rounded")
-    curtains_closed_rounded = IconData(name="curtains_closed", fontFamily="Material Symbols Rounded")
-    custom_typography_rounded = IconData(name="custom_typography", fontFamily="Material Symbols Rounded")
-    cut_rounded = IconData(name="cut", fontFamily="Material Symbols Rounded")
-    cycle_rounded = IconData(name="cycle", fontFamily="Material Symbols Rounded")
-    cyclone_rounded = IconData(name="cyclone", fontFamily="Material Symbols Rounded")
-    dangerous_rounded = IconData(name="dangerous", fontFamily="Material Symbols Rounded")
-    dark_mode_rounded = IconData(name="dark_mode", fontFamily="Material Symbols Rounded")
-    dashboard_rounded = IconData(name="dashboard", fontFamily="Material Symbols Rounded")
-    dashboard_2_rounded = IconData(name="dashboard_2", fontFamily="Material Symbols Rounded")
-    dashboard_customize_rounded = IconData(name="dashboard_customize", fontFamily="Material Symbols Rounded")
-    data_alert_rounded = IconData(name="data_alert", fontFamily="Material Symbols Rounded")
-    data_array_rounded = IconData(name="data_array", fontFamily="Material Symbols Rounded")
-    data_check_rounded = IconData(name="data_check", fontFamily="Material Symbols Rounded")
-    data_exploration_rounded = IconData(name="data_exploration", fontFamily="Material Symbols Rounded")
-    data_info_alert_rounded = IconData(name="data_info_alert", fontFamily="Material Symbols Rounded")
-    data_loss_prevention_rounded = IconData(name="data_loss_prevention", fontFamily="Material Symbols Rounded")
-    data_object_rounded = IconData(name="data_object", fontFamily="Material Symbols Rounded")
-    data_saver_off_rounded = IconData(name="data_saver_off", fontFamily="Material Symbols Rounded")
-    data_saver_on_rounded = IconData(name="data_saver_on", fontFamily="Material Symbols Rounded")
-    data_table_rounded = IconData(name="data_table", fontFamily="Material Symbols Rounded")
-    data_thresholding_rounded = IconData(name="data_thresholding", fontFamily="Material Symbols Rounded")
-    data_usage_rounded = IconData(name="data_usage", fontFamily="Material Symbols Rounded")
-    database_rounded = IconData(name="database", fontFamily="Material Symbols Rounded")
-    database_off_rounded = IconData(name="database_off", fontFamily="Material Symbols Rounded")
-    database_search_rounded = IconData(name="database_search", fontFamily="Material Symbols Rounded")
-    database_upload_rounded = IconData(name="database_upload", fontFamily="Material Symbols Rounded")
-    dataset_rounded = IconData(name="dataset", fontFamily="Material Symbols Rounded")
-    dataset_linked_rounded = IconData(name="dataset_linked", fontFamily="Material Symbols Rounded")
-    date_range_rounded = IconData(name="date_range", fontFamily="Material Symbols Rounded")
-    deblur_rounded = IconData(name="deblur", fontFamily="Material Symbols Rounded")
-    deceased_rounded = IconData(name="deceased", fontFamily="Material Symbols Rounded")
-    decimal_decrease_rounded = IconData(name="decimal_decrease", fontFamily="Material Symbols Rounded")
-    decimal_increase_rounded = IconData(name="decimal_increase", fontFamily="Material Symbols Rounded")
-    deck_rounded = IconData(name="deck", fontFamily="Material Symbols Rounded")
-    dehaze_rounded = IconData(name="dehaze", fontFamily="Material Symbols Rounded")
-    delete_rounded = IconData(name="delete", fontFamily="Material Symbols Rounded")
-    delete_forever_rounded = IconData(name="delete_forever", fontFamily="Material Symbols Rounded")
-    delete_history_rounded = IconData(name="delete_history", fontFamily="Material Symbols Rounded")
-    delete_outline_rounded = IconData(name="delete_outline", fontFamily="Material Symbols Rounded")
-    delete_sweep_rounded = IconData(name="delete_sweep", fontFamily="Material Symbols Rounded")
-    delivery_dining_rounded = IconData(name="delivery_dining", fontFamily="Material Symbols Rounded")
-    delivery_truck_bolt_rounded = IconData(name="delivery_truck_bolt", fontFamily="Material Symbols Rounded")
-    delivery_truck_speed_rounded = IconData(name="delivery_truck_speed", fontFamily="Material Symbols Rounded")
-    demography_rounded = IconData(name="demography", fontFamily="Material Symbols Rounded")
-    density_large_rounded = IconData(name="density_large", fontFamily="Material Symbols Rounded")
-    density_medium_rounded = IconData(name="density_medium", fontFamily="Material Symbols Rounded")
-    density_small_rounded = IconData(name="density_small", fontFamily="Material Symbols Rounded")
-    dentistry_rounded = IconData(name="dentistry", fontFamily="Material Symbols Rounded")
-    departure_board_rounded = IconData(name="departure_board", fontFamily="Material Symbols Rounded")
-    deployed_code_rounded = IconData(name="deployed_code", fontFamily="Material Symbols Rounded")
-    deployed_code_account_rounded = IconData(name="deployed_code_account", fontFamily="Material Symbols Rounded")
-    deployed_code_alert_rounded = IconData(name="deployed_code_alert", fontFamily="Material Symbols Rounded")
-    deployed_code_history_rounded = IconData(name="deployed_code_history", fontFamily="Material Symbols Rounded")
-    deployed_code_update_rounded = IconData(name="deployed_code_update", fontFamily="Material Symbols Rounded")
-    dermatology_rounded = IconData(name="dermatology", fontFamily="Material Symbols Rounded")
-    description_rounded = IconData(name="description", fontFamily="Material Symbols Rounded")
-    deselect_rounded = IconData(name="deselect", fontFamily="Material Symbols Rounded")
-    design_services_rounded = IconData(name="design_services", fontFamily="Material Symbols Rounded")
-    desk_rounded = IconData(name="desk", fontFamily="Material Symbols Rounded")
-    deskphone_rounded = IconData(name="deskphone", fontFamily="Material Symbols Rounded")
-    desktop_access_disabled_rounded = IconData(name="desktop_access_disabled", fontFamily="Material Symbols Rounded")
-    desktop_cloud_rounded = IconData(name="desktop_cloud", fontFamily="Material Symbols Rounded")
-    desktop_cloud_stack_rounded = IconData(name="desktop_cloud_stack", fontFamily="Material Symbols Rounded")
-    desktop_landscape_rounded = IconData(name="desktop_landscape", fontFamily="Material Symbols Rounded")
-    desktop_landscape_add_rounded = IconData(name="desktop_landscape_add", fontFamily="Material Symbols Rounded")
-    desktop_mac_rounded = IconData(name="desktop_mac", fontFamily="Material Symbols Rounded")
-    desktop_portrait_rounded = IconData(name="desktop_portrait", fontFamily="Material Symbols Rounded")
-    desktop_windows_rounded = IconData(name="desktop_windows", fontFamily="Material Symbols Rounded")
-    destruction_rounded = IconData(name="destruction", fontFamily="Material Symbols Rounded")
-    details_rounded = IconData(name="details", fontFamily="Material Symbols Rounded")
-    detection_and_zone_rounded = IconData(name="detection_and_zone", fontFamily="Material Symbols Rounded")
-    detector_rounded = IconData(name="detector", fontFamily="Material Symbols Rounded")
-    detector_alarm_rounded = IconData(name="detector_alarm", fontFamily="Material Symbols Rounded")
-    detector_battery_rounded = IconData(name="detector_battery", fontFamily="Material Symbols Rounded")
-    detector_co_rounded = IconData(name="detector_co", fontFamily="Material Symbols Rounded")
-    detector_offline_rounded = IconData(name="detector_offline", fontFamily="Material Symbols Rounded")
-    detector_smoke_rounded = IconData(name="detector_smoke", fontFamily="Material Symbols Rounded")
-    detector_status_rounded = IconData(name="detector_status", fontFamily="Material Symbols Rounded")
-    developer_board_rounded = IconData(name="developer_board", fontFamily="Material Symbols Rounded")
-    developer_board_off_rounded = IconData(name="developer_board_off", fontFamily="Material Symbols Rounded")
-    developer_guide_rounded = IconData(name="developer_guide", fontFamily="Material Symbols Rounded")
-    developer_mode_rounded = IconData(name="developer_mode", fontFamily="Material Symbols Rounded")
-    developer_mode_tv_rounded = IconData(name="developer_mode_tv", fontFamily="Material Symbols Rounded")
-    device_band_rounded = IconData(name="device_band", fontFamily="Material Symbols Rounded")
-    device_hub_rounded = IconData(name="device_hub", fontFamily="Material Symbols Rounded")
-    device_reset_rounded = IconData(name="device_reset", fontFamily="Material Symbols Rounded")
-    device_thermostat_rounded = IconData(name="device_thermostat", fontFamily="Material Symbols Rounded")
-    device_unknown_rounded = IconData(name="device_unknown", fontFamily="Material Symbols Rounded")
-    devices_rounded = IconData(name="devices", fontFamily="Material Symbols Rounded")
-    devices_fold_rounded = IconData(name="devices_fold", fontFamily="Material Symbols Rounded")
-    devices_fold_2_rounded = IconData(name="devices_fold_2", fontFamily="Material Symbols Rounded")
-    devices_off_rounded = IconData(name="devices_off", fontFamily="Material Symbols Rounded")
-    devices_other_rounded = IconData(name="devices_other", fontFamily="Material Symbols Rounded")
-    devices_wearables_rounded = IconData(name="devices_wearables", fontFamily="Material Symbols Rounded")
-    dew_point_rounded = IconData(name="dew_point", fontFamily="Material Symbols Rounded")
-    diagnosis_rounded = IconData(name="diagnosis", fontFamily="Material Symbols Rounded")
-    diagonal_line_rounded = IconData(name="diagonal_line", fontFamily="Material Symbols Rounded")
-    dialer_sip_rounded = IconData(name="dialer_sip", fontFamily="Material Symbols Rounded")
-    dialogs_rounded = IconData(name="dialogs", fontFamily="Material Symbols Rounded")
-    dialpad_rounded = IconData(name="dialpad", fontFamily="Material Symbols Rounded")
-    diamond_rounded = IconData(name="diamond", fontFamily="Material Symbols Rounded")
-    dictionary_rounded = IconData(name="dictionary", fontFamily="Material Symbols Rounded")
-    difference_rounded = IconData(name="difference", fontFamily="Material Symbols Rounded")
-    digital_out_of_home_rounded = IconData(name="digital_out_of_home", fontFamily="Material Symbols Rounded")
-    digital_wellbeing_rounded = IconData(name="digital_wellbeing", fontFamily="Material Symbols Rounded")
-    dining_rounded = IconData(name="dining", fontFamily="Material Symbols Rounded")
-    dinner_dining_rounded = IconData(name="dinner_dining", fontFamily="Material Symbols Rounded")
-    directions_rounded = IconData(name="directions", fontFamily="Material Symbols Rounded")
-    directions_alt_rounded = IconData(name="directions_alt", fontFamily="Material Symbols Rounded")
-    directions_alt_off_rounded = IconData(name="directions_alt_off", fontFamily="Material Symbols Rounded")
-    directions_bike_rounded = IconData(name="directions_bike", fontFamily="Material Symbols Rounded")
-    directions_boat_rounded = IconData(name="directions_boat", fontFamily="Material Symbols Rounded")
-    directions_boat_filled_rounded = IconData(name="directions_boat_filled", fontFamily="Material Symbols Rounded")
-    directions_bus_rounded = IconData(name="directions_bus", fontFamily="Material Symbols Rounded")
-    directions_bus_filled_rounded = IconData(name="directions_bus_filled", fontFamily="Material Symbols Rounded")
-    directions_car_rounded = IconData(name="directions_car", fontFamily="Material Symbols Rounded")
-    directions_car_filled_rounded = IconData(name="directions_car_filled", fontFamily="Material Symbols Rounded")
-    directions_off_rounded = IconData(name="directions_off", fontFamily="Material Symbols Rounded")
-    directions_railway_rounded = IconData(name="directions_railway", fontFamily="Material Symbols Rounded")
-    directions_railway_2_rounded = IconData(name="directions_railway_2", fontFamily="Material Symbols Rounded")
-    directions_railway_filled_rounded = IconData(name="directions_railway_filled", fontFamily="Material Symbols Rounded")
-    directions_run_rounded = IconData(name="directions_run", fontFamily="Material Symbols Rounded")
-    directions_subway_rounded = IconData(name="directions_subway", fontFamily="Material Symbols Rounded")
-    directions_subway_filled_rounded = IconData(name="directions_subway_filled", fontFamily="Material Symbols Rounded")
-    directions_transit_rounded = IconData(name="directions_transit", fontFamily="Material Symbols Rounded")
-    directions_transit_filled_rounded = IconData(name="directions_transit_filled", fontFamily="Material Symbols Rounded")
-    directions_walk_rounded = IconData(name="directions_walk", fontFamily="Material Symbols Rounded")
-    directory_sync_rounded = IconData(name="directory_sync", fontFamily="Material Symbols Rounded")
-    dirty_lens_rounded = IconData(name="dirty_lens", fontFamily="Material Symbols Rounded")
-    disabled_by_default_rounded = IconData(name="disabled_by_default", fontFamily="Material Symbols Rounded")
-    disabled_visible_rounded = IconData(name="disabled_visible", fontFamily="Material Symbols Rounded")
-    disc_full_rounded = IconData(name="disc_full", fontFamily="Material Symbols Rounded")
-    discover_tune_rounded = IconData(name="discover_tune", fontFamily="Material Symbols Rounded")
-    dishwasher_rounded = IconData(name="dishwasher", fontFamily="Material Symbols Rounded")
-    dishwasher_gen_rounded = IconData(name="dishwasher_gen", fontFamily="Material Symbols Rounded")
-    display_external_input_rounded = IconData(name="display_external_input", fontFamily="Material Symbols Rounded")
-    display_settings_rounded = IconData(name="display_settings", fontFamily="Material Symbols Rounded")
-    distance_rounded = IconData(name="distance", fontFamily="Material Symbols Rounded")
-    diversity_1_rounded = IconData(name="diversity_1", fontFamily="Material Symbols Rounded")
-    diversity_2_rounded = IconData(name="diversity_2", fontFamily="Material Symbols Rounded")
-    diversity_3_rounded = IconData(name="diversity_3", fontFamily="Material Symbols Rounded")
-    diversity_4_rounded = IconData(name="diversity_4", fontFamily="Material Symbols Rounded")
-    dns_rounded = IconData(name="dns", fontFamily="Material Symbols Rounded")
-    do_disturb_rounded = IconData(name="do_disturb", fontFamily="Material Symbols Rounded")
-    do_disturb_alt_rounded = IconData(name="do_disturb_alt", fontFamily="Material Symbols Rounded")
-    do_disturb_off_rounded = IconData(name="do_disturb_off", fontFamily="Material Symbols Rounded")
-    do_disturb_on_rounded = IconData(name="do_disturb_on", fontFamily="Material Symbols Rounded")
-    do_not_disturb_rounded = IconData(name="do_not_disturb", fontFamily="Material Symbols Rounded")
-    do_not_disturb_alt_rounded = IconData(name="do_not_disturb_alt", fontFamily="Material Symbols Rounded")
-    do_not_disturb_off_rounded = IconData(name="do_not_disturb_off", fontFamily="Material Symbols Rounded")
-    do_not_disturb_on_rounded = IconData(name="do_not_disturb_on", fontFamily="Material Symbols Rounded")
-    do_not_disturb_on_total_silence_rounded = IconData(name="do_not_disturb_on_total_silence", fontFamily="Material Symbols Rounded")
-    do_not_step_rounded = IconData(name="do_not_step", fontFamily="Material Symbols Rounded")
-    do_not_touch_rounded = IconData(name="do_not_touch", fontFamily="Material Symbols Rounded")
-    dock_rounded = IconData(name="dock", fontFamily="Material Symbols Rounded")
-    dock_to_bottom_rounded = IconData(name="dock_to_bottom", fontFamily="Material Symbols Rounded")
-    dock_to_left_rounded = IconData(name="dock_to_left", fontFamily="Material Symbols Rounded")
-    dock_to_right_rounded = IconData(name="dock_to_right", fontFamily="Material Symbols Rounded")
-    docs_rounded = IconData(name="docs", fontFamily="Material Symbols Rounded")
-    docs_add_on_rounded = IconData(name="docs_add_on", fontFamily="Material Symbols Rounded")
-    docs_apps_script_rounded = IconData(name="docs_apps_script", fontFamily="Material Symbols Rounded")
-    document_scanner_rounded = IconData(name="document_scanner", fontFamily="Material Symbols Rounded")
-    document_search_rounded = IconData(name="document_search", fontFamily="Material Symbols Rounded")
-    domain_rounded = IconData(name="domain", fontFamily="Material Symbols Rounded")
-    domain_add_rounded = IconData(name="domain_add", fontFamily="Material Symbols Rounded")
-    domain_disabled_rounded = IconData(name="domain_disabled", fontFamily="Material Symbols Rounded")
-    domain_verification_rounded = IconData(name="domain_verification", fontFamily="Material Symbols Rounded")
-    domain_verification_off_rounded = IconData(name="domain_verification_off", fontFamily="Material Symbols Rounded")
-    domino_mask_rounded = IconData(name="domino_mask", fontFamily="Material Symbols Rounded")
-    done_rounded = IconData(name="done", fontFamily="Material Symbols Rounded")
-    done_all_rounded = IconData(name="done_all", fontFamily="Material Symbols Rounded")
-    done_outline_rounded = IconData(name="done_outline", fontFamily="Material Symbols Rounded")
-    donut_large_rounded = IconData(name="donut_large", fontFamily="Material Symbols Rounded")
-    donut_small_rounded = IconData(name="donut_small", fontFamily="Material Symbols Rounded")
-    door_back_rounded = IconData(name="door_back", fontFamily="Material Symbols Rounded")
-    door_front_rounded = IconData(name="door_front", fontFamily="Material Symbols Rounded")
-    door_open_rounded = IconData(name="door_open", fontFamily="Material Symbols Rounded")
-    door_sensor_rounded = IconData(name="door_sensor", fontFamily="Material Symbols Rounded")
-    door_sliding_rounded = IconData(name="door_sliding", fontFamily="Material Symbols Rounded")
-    doorbell_rounded = IconData(name="doorbell", fontFamily="Material Symbols Rounded")
-    doorbell_3p_rounded = IconData(name="doorbell_3p", fontFamily="Material Symbols Rounded")
-    doorbell_chime_rounded = IconData(name="doorbell_chime", fontFamily="Material Symbols Rounded")
-    double_arrow_rounded = IconData(name="double_arrow", fontFamily="Material Symbols Rounded")
-    downhill_skiing_rounded = IconData(name="downhill_skiing", fontFamily="Material Symbols Rounded")
-    download_rounded = IconData(name="download", fontFamily="Material Symbols Rounded")
-    download_2_rounded = IconData(name="download_2", fontFamily="Material Symbols Rounded")
-    download_done_rounded = IconData(name="download_done", fontFamily="Material Symbols Rounded")
-    download_for_offline_rounded = IconData(name="download_for_offline", fontFamily="Material Symbols Rounded")
-    downloading_rounded = IconData(name="downloading", fontFamily="Material Symbols Rounded")
-    draft_rounded = IconData(name="draft", fontFamily="Material Symbols Rounded")
-    draft_orders_rounded = IconData(name="draft_orders", fontFamily="Material Symbols Rounded")
-    drafts_rounded = IconData(name="drafts", fontFamily="Material Symbols Rounded")
-    drag_click_rounded = IconData(name="drag_click", fontFamily="Material Symbols Rounded")
-    drag_handle_rounded = IconData(name="drag_handle", fontFamily="Material Symbols Rounded")
-    drag_indicator_rounded = IconData(name="drag_indicator", fontFamily="Material Symbols Rounded")
-    drag_pan_rounded = IconData(name="drag_pan", fontFamily="Material Symbols Rounded")
-    draw_rounded = IconData(name="draw", fontFamily="Material Symbols Rounded")
-    draw_abstract_rounded = IconData(name="draw_abstract", fontFamily="Material Symbols Rounded")
-    draw_collage_rounded = IconData(name="draw_collage", fontFamily="Material Symbols Rounded")
-    drawing_recognition_rounded = IconData(name="drawing_recognition", fontFamily="Material Symbols Rounded")
-    dresser_rounded = IconData(name="dresser", fontFamily="Material Symbols Rounded")
-    drive_eta_rounded = IconData(name="drive_eta", fontFamily="Material Symbols Rounded")
-    drive_export_rounded = IconData(name="drive_export", fontFamily="Material Symbols Rounded")
-    drive_file_move_rounded = IconData(name="drive_file_move", fontFamily="Material Symbols Rounded")
-    drive_file_move_outline_rounded = IconData(name="drive_file_move_outline", fontFamily="Material Symbols Rounded")
-    drive_file_move_rtl_rounded = IconData(name="drive_file_move_rtl", fontFamily="Material Symbols Rounded")
-    drive_file_rename_outline_rounded = IconData(name="drive_file_rename_outline", fontFamily="Material Symbols Rounded")
-    drive_folder_upload_rounded = IconData(name="drive_folder_upload", fontFamily="Material Symbols Rounded")
-    drive_fusiontable_rounded = IconData(name="drive_fusiontable", fontFamily="Material Symbols Rounded")
-    dropdown_rounded = IconData(name="dropdown", fontFamily="Material Symbols Rounded")
-    dropper_eye_rounded = IconData(name="dropper_eye", fontFamily="Material Symbols Rounded")
-    dry_rounded = IconData(name="dry", fontFamily="Material Symbols Rounded")
-    dry_cleaning_rounded = IconData(name="dry_cleaning", fontFamily="Material Symbols Rounded")
-    dual_screen_rounded = IconData(name="dual_screen", fontFamily="Material Symbols Rounded")
-    duo_rounded = IconData(name="duo", fontFamily="Material Symbols Rounded")
-    dvr_rounded = IconData(name="dvr", fontFamily="Material Symbols Rounded")
-    dynamic_feed_rounded = IconData(name="dynamic_feed", fontFamily="Material Symbols Rounded")
-    dynamic_form_rounded = IconData(name="dynamic_form", fontFamily="Material Symbols Rounded")
-    e911_avatar_rounded = IconData(name="e911_avatar", fontFamily="Material Symbols Rounded")
-    e911_emergency_rounded = IconData(name="e911_emergency", fontFamily="Material Symbols Rounded")
-    e_mobiledata_rounded = IconData(name="e_mobiledata", fontFamily="Material Symbols Rounded")
-    e_mobiledata_badge_rounded = IconData(name="e_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    ear_sound_rounded = IconData(name="ear_sound", fontFamily="Material Symbols Rounded")
-    earbud_case_rounded = IconData(name="earbud_case", fontFamily="Material Symbols Rounded")
-    earbud_left_rounded = IconData(name="earbud_left", fontFamily="Material Symbols Rounded")
-    earbud_right_rounded = IconData(name="earbud_right", fontFamily="Material Symbols Rounded")
-    earbuds_rounded = IconData(name="earbuds", fontFamily="Material Symbols Rounded")
-    earbuds_2_rounded = IconData(name="earbuds_2", fontFamily="Material Symbols Rounded")
-    earbuds_battery_rounded = IconData(name="earbuds_battery", fontFamily="Material Symbols Rounded")
-    early_on_rounded = IconData(name="early_on", fontFamily="Material Symbols Rounded")
-    earthquake_rounded = IconData(name="earthquake", fontFamily="Material Symbols Rounded")
-    east_rounded = IconData(name="east", fontFamily="Material Symbols Rounded")
-    ecg_rounded = IconData(name="ecg", fontFamily="Material Symbols Rounded")
-    ecg_heart_rounded = IconData(name="ecg_heart", fontFamily="Material Symbols Rounded")
-    eco_rounded = IconData(name="eco", fontFamily="Material Symbols Rounded")
-    eda_rounded = IconData(name="eda", fontFamily="Material Symbols Rounded")
-    edgesensor_high_rounded = IconData(name="edgesensor_high", fontFamily="Material Symbols Rounded")
-    edgesensor_low_rounded = IconData(name="edgesensor_low", fontFamily="Material Symbols Rounded")
-    edit_rounded = IconData(name="edit", fontFamily="Material Symbols Rounded")
-    edit_arrow_down_rounded = IconData(name="edit_arrow_down", fontFamily="Material Symbols Rounded")
-    edit_arrow_up_rounded = IconData(name="edit_arrow_up", fontFamily="Material Symbols Rounded")
-    edit_attributes_rounded = IconData(name="edit_attributes", fontFamily="Material Symbols Rounded")
-    edit_audio_rounded = IconData(name="edit_audio", fontFamily="Material Symbols Rounded")
-    edit_calendar_rounded = IconData(name="edit_calendar", fontFamily="Material Symbols Rounded")
-    edit_document_rounded = IconData(name="edit_document", fontFamily="Material Symbols Rounded")
-    edit_location_rounded = IconData(name="edit_location", fontFamily="Material Symbols Rounded")
-    edit_location_alt_rounded = IconData(name="edit_location_alt", fontFamily="Material Symbols Rounded")
-    edit_note_rounded = IconData(name="edit_note", fontFamily="Material Symbols Rounded")
-    edit_notifications_rounded = IconData(name="edit_notifications", fontFamily="Material Symbols Rounded")
-    edit_off_rounded = IconData(name="edit_off", fontFamily="Material Symbols Rounded")
-    edit_road_rounded = IconData(name="edit_road", fontFamily="Material Symbols Rounded")
-    edit_square_rounded = IconData(name="edit_square", fontFamily="Material Symbols Rounded")
-    editor_choice_rounded = IconData(name="editor_choice", fontFamily="Material Symbols Rounded")
-    egg_rounded = IconData(name="egg", fontFamily="Material Symbols Rounded")
-    egg_alt_rounded = IconData(name="egg_alt", fontFamily="Material Symbols Rounded")
-    eject_rounded = IconData(name="eject", fontFamily="Material Symbols Rounded")
-    elderly_rounded = IconData(name="elderly", fontFamily="Material Symbols Rounded")
-    elderly_woman_rounded = IconData(name="elderly_woman", fontFamily="Material Symbols Rounded")
-    electric_bike_rounded = IconData(name="electric_bike", fontFamily="Material Symbols Rounded")
-    electric_bolt_rounded = IconData(name="electric_bolt", fontFamily="Material Symbols Rounded")
-    electric_car_rounded = IconData(name="electric_car", fontFamily="Material Symbols Rounded")
-    electric_meter_rounded = IconData(name="electric_meter", fontFamily="Material Symbols Rounded")
-    electric_moped_rounded = IconData(name="electric_moped", fontFamily="Material Symbols Rounded")
-    electric_rickshaw_rounded = IconData(name="electric_rickshaw", fontFamily="Material Symbols Rounded")
-    electric_scooter_rounded = IconData(name="electric_scooter", fontFamily="Material Symbols Rounded")
-    electrical_services_rounded = IconData(name="electrical_services", fontFamily="Material Symbols Rounded")
-    elevation_rounded = IconData(name="elevation", fontFamily="Material Symbols Rounded")
-    elevator_rounded = IconData(name="elevator", fontFamily="Material Symbols Rounded")
-    email_rounded = IconData(name="email", fontFamily="Material Symbols Rounded")
-    emergency_rounded = IconData(name="emergency", fontFamily="Material Symbols Rounded")
-    emergency_heat_rounded = IconData(name="emergency_heat", fontFamily="Material Symbols Rounded")
-    emergency_heat_2_rounded = IconData(name="emergency_heat_2", fontFamily="Material Symbols Rounded")
-    emergency_home_rounded = IconData(name="emergency_home", fontFamily="Material Symbols Rounded")
-    emergency_recording_rounded = IconData(name="emergency_recording", fontFamily="Material Symbols Rounded")
-    emergency_share_rounded = IconData(name="emergency_share", fontFamily="Material Symbols Rounded")
-    emergency_share_off_rounded = IconData(name="emergency_share_off", fontFamily="Material Symbols Rounded")
-    emoji_emotions_rounded = IconData(name="emoji_emotions", fontFamily="Material Symbols Rounded")
-    emoji_events_rounded = IconData(name="emoji_events", fontFamily="Material Symbols Rounded")
-    emoji_flags_rounded = IconData(name="emoji_flags", fontFamily="Material Symbols Rounded")
-    emoji_food_beverage_rounded = IconData(name="emoji_food_beverage", fontFamily="Material Symbols Rounded")
-    emoji_language_rounded = IconData(name="emoji_language", fontFamily="Material Symbols Rounded")
-    emoji_nature_rounded = IconData(name="emoji_nature", fontFamily="Material Symbols Rounded")
-    emoji_objects_rounded = IconData(name="emoji_objects", fontFamily="Material Symbols Rounded")
-    emoji_people_rounded = IconData(name="emoji_people", fontFamily="Material Symbols Rounded")
-    emoji_symbols_rounded = IconData(name="emoji_symbols", fontFamily="Material Symbols Rounded")
-    emoji_transportation_rounded = IconData(name="emoji_transportation", fontFamily="Material Symbols Rounded")
-    emoticon_rounded = IconData(name="emoticon", fontFamily="Material Symbols Rounded")
-    empty_dashboard_rounded = IconData(name="empty_dashboard", fontFamily="Material Symbols Rounded")
-    enable_rounded = IconData(name="enable", fontFamily="Material Symbols Rounded")
-    encrypted_rounded = IconData(name="encrypted", fontFamily="Material Symbols Rounded")
-    encrypted_add_rounded = IconData(name="encrypted_add", fontFamily="Material Symbols Rounded")
-    encrypted_add_circle_rounded = IconData(name="encrypted_add_circle", fontFamily="Material Symbols Rounded")
-    encrypted_minus_circle_rounded = IconData(name="encrypted_minus_circle", fontFamily="Material Symbols Rounded")
-    encrypted_off_rounded = IconData(name="encrypted_off", fontFamily="Material Symbols Rounded")
-    endocrinology_rounded = IconData(name="endocrinology", fontFamily="Material Symbols Rounded")
-    energy_rounded = IconData(name="energy", fontFamily="Material Symbols Rounded")
-    energy_program_saving_rounded = IconData(name="energy_program_saving", fontFamily="Material Symbols Rounded")
-    energy_program_time_used_rounded = IconData(name="energy_program_time_used", fontFamily="Material Symbols Rounded")
-    energy_savings_leaf_rounded = IconData(name="energy_savings_leaf", fontFamily="Material Symbols Rounded")
-    engineering_rounded = IconData(name="engineering", fontFamily="Material Symbols Rounded")
-    enhanced_encryption_rounded = IconData(name="enhanced_encryption", fontFamily="Material Symbols Rounded")
-    ent_rounded = IconData(name="ent", fontFamily="Material Symbols Rounded")
-    enterprise_rounded = IconData(name="enterprise", fontFamily="Material Symbols Rounded")
-    enterprise_off_rounded = IconData(name="enterprise_off", fontFamily="Material Symbols Rounded")
-    equal_rounded = IconData(name="equal", fontFamily="Material Symbols Rounded")
-    equalizer_rounded = IconData(name="equalizer", fontFamily="Material Symbols Rounded")
-    eraser_size_1_rounded = IconData(name="eraser_size_1", fontFamily="Material Symbols Rounded")
-    eraser_size_2_rounded = IconData(name="eraser_size_2", fontFamily="Material Symbols Rounded")
-    eraser_size_3_rounded = IconData(name="eraser_size_3", fontFamily="Material Symbols Rounded")
-    eraser_size_4_rounded = IconData(name="eraser_size_4", fontFamily="Material Symbols Rounded")
-    eraser_size_5_rounded = IconData(name="eraser_size_5", fontFamily="Material Symbols Rounded")
-    error_rounded = IconData(name="error", fontFamily="Material Symbols Rounded")
-    error_circle_rounded_rounded = IconData(name="error_circle_rounded", fontFamily="Material Symbols Rounded")
-    error_med_rounded = IconData(name="error_med", fontFamily="Material Symbols Rounded")
-    error_outline_rounded = IconData(name="error_outline", fontFamily="Material Symbols Rounded")
-    escalator_rounded = IconData(name="escalator", fontFamily="Material Symbols Rounded")
-    escalator_warning_rounded = IconData(name="escalator_warning", fontFamily="Material Symbols Rounded")
-    euro_rounded = IconData(name="euro", fontFamily="Material Symbols Rounded")
-    euro_symbol_rounded = IconData(name="euro_symbol", fontFamily="Material Symbols Rounded")
-    ev_charger_rounded = IconData(name="ev_charger", fontFamily="Material Symbols Rounded")
-    ev_mobiledata_badge_rounded = IconData(name="ev_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    ev_shadow_rounded = IconData(name="ev_shadow", fontFamily="Material Symbols Rounded")
-    ev_shadow_add_rounded = IconData(name="ev_shadow_add", fontFamily="Material Symbols Rounded")
-    ev_shadow_minus_rounded = IconData(name="ev_shadow_minus", fontFamily="Material Symbols Rounded")
-    ev_station_rounded = IconData(name="ev_station", fontFamily="Material Symbols Rounded")
-    event_rounded = IconData(name="event", fontFamily="Material Symbols Rounded")
-    event_available_rounded = IconData(name="event_available", fontFamily="Material Symbols Rounded")
-    event_busy_rounded = IconData(name="event_busy", fontFamily="Material Symbols Rounded")
-    event_list_rounded = IconData(name="event_list", fontFamily="Material Symbols Rounded")
-    event_note_rounded = IconData(name="event_note", fontFamily="Material Symbols Rounded")
-    event_repeat_rounded = IconData(name="event_repeat", fontFamily="Material Symbols Rounded")
-    event_seat_rounded = IconData(name="event_seat", fontFamily="Material Symbols Rounded")
-    event_upcoming_rounded = IconData(name="event_upcoming", fontFamily="Material Symbols Rounded")
-    exclamation_rounded = IconData(name="exclamation", fontFamily="Material Symbols Rounded")
-    exercise_rounded = IconData(name="exercise", fontFamily="Material Symbols Rounded")
-    exit_to_app_rounded = IconData(name="exit_to_app", fontFamily="Material Symbols Rounded")
-    expand_rounded = IconData(name="expand", fontFamily="Material Symbols Rounded")
-    expand_all_rounded = IconData(name="expand_all", fontFamily="Material Symbols Rounded")
-    expand_circle_down_rounded = IconData(name="expand_circle_down", fontFamily="Material Symbols Rounded")
-    expand_circle_right_rounded = IconData(name="expand_circle_right", fontFamily="Material Symbols Rounded")
-    expand_circle_up_rounded = IconData(name="expand_circle_up", fontFamily="Material Symbols Rounded")
-    expand_content_rounded = IconData(name="expand_content", fontFamily="Material Symbols Rounded")
-    expand_less_rounded = IconData(name="expand_less", fontFamily="Material Symbols Rounded")
-    expand_more_rounded = IconData(name="expand_more", fontFamily="Material Symbols Rounded")
-    expansion_panels_rounded = IconData(name="expansion_panels", fontFamily="Material Symbols Rounded")
-    expension_panels_rounded = IconData(name="expension_panels", fontFamily="Material Symbols Rounded")
-    experiment_rounded = IconData(name="experiment", fontFamily="Material Symbols Rounded")
-    explicit_rounded = IconData(name="explicit", fontFamily="Material Symbols Rounded")
-    explore_rounded = IconData(name="explore", fontFamily="Material Symbols Rounded")
-    explore_nearby_rounded = IconData(name="explore_nearby", fontFamily="Material Symbols Rounded")
-    explore_off_rounded = IconData(name="explore_off", fontFamily="Material Symbols Rounded")
-    explosion_rounded = IconData(name="explosion", fontFamily="Material Symbols Rounded")
-    export_notes_rounded = IconData(name="export_notes", fontFamily="Material Symbols Rounded")
-    exposure_rounded = IconData(name="exposure", fontFamily="Material Symbols Rounded")
-    exposure_neg_1_rounded = IconData(name="exposure_neg_1", fontFamily="Material Symbols Rounded")
-    exposure_neg_2_rounded = IconData(name="exposure_neg_2", fontFamily="Material Symbols Rounded")
-    exposure_plus_1_rounded = IconData(name="exposure_plus_1", fontFamily="Material Symbols Rounded")
-    exposure_plus_2_rounded = IconData(name="exposure_plus_2", fontFamily="Material Symbols Rounded")
-    exposure_zero_rounded = IconData(name="exposure_zero", fontFamily="Material Symbols Rounded")
-    extension_rounded = IconData(name="extension", fontFamily="Material Symbols Rounded")
-    extension_off_rounded = IconData(name="extension_off", fontFamily="Material Symbols Rounded")
-    eye_tracking_rounded = IconData(name="eye_tracking", fontFamily="Material Symbols Rounded")
-    eyeglasses_rounded = IconData(name="eyeglasses", fontFamily="Material Symbols Rounded")
-    face_rounded = IconData(name="face", fontFamily="Material Symbols Rounded")
-    face_2_rounded = IconData(name="face_2", fontFamily="Material Symbols Rounded")
-    face_3_rounded = IconData(name="face_3", fontFamily="Material Symbols Rounded")
-    face_4_rounded = IconData(name="face_4", fontFamily="Material Symbols Rounded")
-    face_5_rounded = IconData(name="face_5", fontFamily="Material Symbols Rounded")
-    face_6_rounded = IconData(name="face_6", fontFamily="Material Symbols Rounded")
-    face_down_rounded = IconData(name="face_down", fontFamily="Material Symbols Rounded")
-    face_left_rounded = IconData(name="face_left", fontFamily="Material Symbols Rounded")
-    face_nod_rounded = IconData(name="face_nod", fontFamily="Material Symbols Rounded")
-    face_retouching_natural_rounded = IconData(name="face_retouching_natural", fontFamily="Material Symbols Rounded")
-    face_retouching_off_rounded = IconData(name="face_retouching_off", fontFamily="Material Symbols Rounded")
-    face_right_rounded = IconData(name="face_right", fontFamily="Material Symbols Rounded")
-    face_shake_rounded = IconData(name="face_shake", fontFamily="Material Symbols Rounded")
-    face_unlock_rounded = IconData(name="face_unlock", fontFamily="Material Symbols Rounded")
-    face_up_rounded = IconData(name="face_up", fontFamily="Material Symbols Rounded")
-    fact_check_rounded = IconData(name="fact_check", fontFamily="Material Symbols Rounded")
-    factory_rounded = IconData(name="factory", fontFamily="Material Symbols Rounded")
-    falling_rounded = IconData(name="falling", fontFamily="Material Symbols Rounded")
-    familiar_face_and_zone_rounded = IconData(name="familiar_face_and_zone", fontFamily="Material Symbols Rounded")
-    family_history_rounded = IconData(name="family_history", fontFamily="Material Symbols Rounded")
-    family_home_rounded = IconData(name="family_home", fontFamily="Material Symbols Rounded")
-    family_link_rounded = IconData(name="family_link", fontFamily="Material Symbols Rounded")
-    family_restroom_rounded = IconData(name="family_restroom", fontFamily="Material Symbols Rounded")
-    family_star_rounded = IconData(name="family_star", fontFamily="Material Symbols Rounded")
-    fan_focus_rounded = IconData(name="fan_focus", fontFamily="Material Symbols Rounded")
-    fan_indirect_rounded = IconData(name="fan_indirect", fontFamily="Material Symbols Rounded")
-    farsight_digital_rounded = IconData(name="farsight_digital", fontFamily="Material Symbols Rounded")
-    fast_forward_rounded = IconData(name="fast_forward", fontFamily="Material Symbols Rounded")
-    fast_rewind_rounded = IconData(name="fast_rewind", fontFamily="Material Symbols Rounded")
-    fastfood_rounded = IconData(name="fastfood", fontFamily="Material Symbols Rounded")
-    faucet_rounded = IconData(name="faucet", fontFamily="Material Symbols Rounded")
-    favorite_rounded = IconData(name="favorite", fontFamily="Material Symbols Rounded")
-    favorite_border_rounded = IconData(name="favorite_border", fontFamily="Material Symbols Rounded")
-    fax_rounded = IconData(name="fax", fontFamily="Material Symbols Rounded")
-    feature_search_rounded = IconData(name="feature_search", fontFamily="Material Symbols Rounded")
-    featured_play_list_rounded = IconData(name="featured_play_list", fontFamily="Material Symbols Rounded")
-    featured_seasonal_and_gifts_rounded = IconData(name="featured_seasonal_and_gifts", fontFamily="Material Symbols Rounded")
-    featured_video_rounded = IconData(name="featured_video", fontFamily="Material Symbols Rounded")
-    feed_rounded = IconData(name="feed", fontFamily="Material Symbols Rounded")
-    feedback_rounded = IconData(name="feedback", fontFamily="Material Symbols Rounded")
-    female_rounded = IconData(name="female", fontFamily="Material Symbols Rounded")
-    femur_rounded = IconData(name="femur", fontFamily="Material Symbols Rounded")
-    femur_alt_rounded = IconData(name="femur_alt", fontFamily="Material Symbols Rounded")
-    fence_rounded = IconData(name="fence", fontFamily="Material Symbols Rounded")
-    fertile_rounded = IconData(name="fertile", fontFamily="Material Symbols Rounded")
-    festival_rounded = IconData(name="festival", fontFamily="Material Symbols Rounded")
-    fiber_dvr_rounded = IconData(name="fiber_dvr", fontFamily="Material Symbols Rounded")
-    fiber_manual_record_rounded = IconData(name="fiber_manual_record", fontFamily="Material Symbols Rounded")
-    fiber_new_rounded = IconData(name="fiber_new", fontFamily="Material Symbols Rounded")
-    fiber_pin_rounded = IconData(name="fiber_pin", fontFamily="Material Symbols Rounded")
-    fiber_smart_record_rounded = IconData(name="fiber_smart_record", fontFamily="Material Symbols Rounded")
-    file_copy_rounded = IconData(name="file_copy", fontFamily="Material Symbols Rounded")
-    file_copy_off_rounded = IconData(name="file_copy_off", fontFamily="Material Symbols Rounded")
-    file_download_rounded = IconData(name="file_download", fontFamily="Material Symbols Rounded")
-    file_download_done_rounded = IconData(name="file_download_done", fontFamily="Material Symbols Rounded")
-    file_download_off_rounded = IconData(name="file_download_off", fontFamily="Material Symbols Rounded")
-    file_export_rounded = IconData(name="file_export", fontFamily="Material Symbols Rounded")
-    file_json_rounded = IconData(name="file_json", fontFamily="Material Symbols Rounded")
-    file_map_rounded = IconData(name="file_map", fontFamily="Material Symbols Rounded")
-    file_map_stack_rounded = IconData(name="file_map_stack", fontFamily="Material Symbols Rounded")
-    file_open_rounded = IconData(name="file_open", fontFamily="Material Symbols Rounded")
-    file_png_rounded = IconData(name="file_png", fontFamily="Material Symbols Rounded")
-    file_present_rounded = IconData(name="file_present", fontFamily="Material Symbols Rounded")
-    file_save_rounded = IconData(name="file_save", fontFamily="Material Symbols Rounded")
-    file_save_off_rounded = IconData(name="file_save_off", fontFamily="Material Symbols Rounded")
-    file_upload_rounded = IconData(name="file_upload", fontFamily="Material Symbols Rounded")
-    file_upload_off_rounded = IconData(name="file_upload_off", fontFamily="Material Symbols Rounded")
-    files_rounded = IconData(name="files", fontFamily="Material Symbols Rounded")
-    filter_rounded = IconData(name="filter", fontFamily="Material Symbols Rounded")
-    filter_1_rounded = IconData(name="filter_1", fontFamily="Material Symbols Rounded")
-    filter_2_rounded = IconData(name="filter_2", fontFamily="Material Symbols Rounded")
-    filter_3_rounded = IconData(name="filter_3", fontFamily="Material Symbols Rounded")
-    filter_4_rounded = IconData(name="filter_4", fontFamily="Material Symbols Rounded")
-    filter_5_rounded = IconData(name="filter_5", fontFamily="Material Symbols Rounded")
-    filter_6_rounded = IconData(name="filter_6", fontFamily="Material Symbols Rounded")
-    filter_7_rounded = IconData(name="filter_7", fontFamily="Material Symbols Rounded")
-    filter_8_rounded = IconData(name="filter_8", fontFamily="Material Symbols Rounded")
-    filter_9_rounded = IconData(name="filter_9", fontFamily="Material Symbols Rounded")
-    filter_9_plus_rounded = IconData(name="filter_9_plus", fontFamily="Material Symbols Rounded")
-    filter_alt_rounded = IconData(name="filter_alt", fontFamily="Material Symbols Rounded")
-    filter_alt_off_rounded = IconData(name="filter_alt_off", fontFamily="Material Symbols Rounded")
-    filter_arrow_right_rounded = IconData(name="filter_arrow_right", fontFamily="Material Symbols Rounded")
-    filter_b_and_w_rounded = IconData(name="filter_b_and_w", fontFamily="Material Symbols Rounded")
-    filter_center_focus_rounded = IconData(name="filter_center_focus", fontFamily="Material Symbols Rounded")
-    filter_drama_rounded = IconData(name="filter_drama", fontFamily="Material Symbols Rounded")
-    filter_frames_rounded = IconData(name="filter_frames", fontFamily="Material Symbols Rounded")
-    filter_hdr_rounded = IconData(name="filter_hdr", fontFamily="Material Symbols Rounded")
-    filter_list_rounded = IconData(name="filter_list", fontFamily="Material Symbols Rounded")
-    filter_list_alt_rounded = IconData(name="filter_list_alt", fontFamily="Material Symbols Rounded")
-    filter_list_off_rounded = IconData(name="filter_list_off", fontFamily="Material Symbols Rounded")
-    filter_none_rounded = IconData(name="filter_none", fontFamily="Material Symbols Rounded")
-    filter_retrolux_rounded = IconData(name="filter_retrolux", fontFamily="Material Symbols Rounded")
-    filter_tilt_shift_rounded = IconData(name="filter_tilt_shift", fontFamily="Material Symbols Rounded")
-    filter_vintage_rounded = IconData(name="filter_vintage", fontFamily="Material Symbols Rounded")
-    finance_rounded = IconData(name="finance", fontFamily="Material Symbols Rounded")
-    finance_chip_rounded = IconData(name="finance_chip", fontFamily="Material Symbols Rounded")
-    finance_mode_rounded = IconData(name="finance_mode", fontFamily="Material Symbols Rounded")
-    find_in_page_rounded = IconData(name="find_in_page", fontFamily="Material Symbols Rounded")
-    find_replace_rounded = IconData(name="find_replace", fontFamily="Material Symbols Rounded")
-    fingerprint_rounded = IconData(name="fingerprint", fontFamily="Material Symbols Rounded")
-    fingerprint_off_rounded = IconData(name="fingerprint_off", fontFamily="Material Symbols Rounded")
-    fire_extinguisher_rounded = IconData(name="fire_extinguisher", fontFamily="Material Symbols Rounded")
-    fire_hydrant_rounded = IconData(name="fire_hydrant", fontFamily="Material Symbols Rounded")
-    fire_truck_rounded = IconData(name="fire_truck", fontFamily="Material Symbols Rounded")
-    fireplace_rounded = IconData(name="fireplace", fontFamily="Material Symbols Rounded")
-    first_page_rounded = IconData(name="first_page", fontFamily="Material Symbols Rounded")
-    fit_page_rounded = IconData(name="fit_page", fontFamily="Material Symbols Rounded")
-    fit_page_height_rounded = IconData(name="fit_page_height", fontFamily="Material Symbols Rounded")
-    fit_page_width_rounded = IconData(name="fit_page_width", fontFamily="Material Symbols Rounded")
-    fit_screen_rounded = IconData(name="fit_screen", fontFamily="Material Symbols Rounded")
-    fit_width_rounded = IconData(name="fit_width", fontFamily="Material Symbols Rounded")
-    fitness_center_rounded = IconData(name="fitness_center", fontFamily="Material Symbols Rounded")
-    fitness_tracker_rounded = IconData(name="fitness_tracker", fontFamily="Material Symbols Rounded")
-    flag_rounded = IconData(name="flag", fontFamily="Material Symbols Rounded")
-    flag_2_rounded = IconData(name="flag_2", fontFamily="Material Symbols Rounded")
-    flag_check_rounded = IconData(name="flag_check", fontFamily="Material Symbols Rounded")
-    flag_circle_rounded = IconData(name="flag_circle", fontFamily="Material Symbols Rounded")
-    flag_filled_rounded = IconData(name="flag_filled", fontFamily="Material Symbols Rounded")
-    flaky_rounded = IconData(name="flaky", fontFamily="Material Symbols Rounded")
-    flare_rounded = IconData(name="flare", fontFamily="Material Symbols Rounded")
-    flash_auto_rounded = IconData(name="flash_auto", fontFamily="Material Symbols Rounded")
-    flash_off_rounded = IconData(name="flash_off", fontFamily="Material Symbols Rounded")
-    flash_on_rounded = IconData(name="flash_on", fontFamily="Material Symbols Rounded")
-    flashlight_off_rounded = IconData(name="flashlight_off", fontFamily="Material Symbols Rounded")
-    flashlight_on_rounded = IconData(name="flashlight_on", fontFamily="Material Symbols Rounded")
-    flatware_rounded = IconData(name="flatware", fontFamily="Material Symbols Rounded")
-    flex_direction_rounded = IconData(name="flex_direction", fontFamily="Material Symbols Rounded")
-    flex_no_wrap_rounded = IconData(name="flex_no_wrap", fontFamily="Material Symbols Rounded")
-    flex_wrap_rounded = IconData(name="flex_wrap", fontFamily="Material Symbols Rounded")
-    flight_rounded = IconData(name="flight", fontFamily="Material Symbols Rounded")
-    flight_class_rounded = IconData(name="flight_class", fontFamily="Material Symbols Rounded")
-    flight_land_rounded = IconData(name="flight_land", fontFamily="Material Symbols Rounded")
-    flight_takeoff_rounded = IconData(name="flight_takeoff", fontFamily="Material Symbols Rounded")
-    flights_and_hotels_rounded = IconData(name="flights_and_hotels", fontFamily="Material Symbols Rounded")
-    flightsmode_rounded = IconData(name="flightsmode", fontFamily="Material Symbols Rounded")
-    flip_rounded = IconData(name="flip", fontFamily="Material Symbols Rounded")
-    flip_camera_android_rounded = IconData(name="flip_camera_android", fontFamily="Material Symbols Rounded")
-    flip_camera_ios_rounded = IconData(name="flip_camera_ios", fontFamily="Material Symbols Rounded")
-    flip_to_back_rounded = IconData(name="flip_to_back", fontFamily="Material Symbols Rounded")
-    flip_to_front_rounded = IconData(name="flip_to_front", fontFamily="Material Symbols Rounded")
-    float_landscape_2_rounded = IconData(name="float_landscape_2", fontFamily="Material Symbols Rounded")
-    float_portrait_2_rounded = IconData(name="float_portrait_2", fontFamily="Material Symbols Rounded")
-    flood_rounded = IconData(name="flood", fontFamily="Material Symbols Rounded")
-    floor_rounded = IconData(name="floor", fontFamily="Material Symbols Rounded")
-    floor_lamp_rounded = IconData(name="floor_lamp", fontFamily="Material Symbols Rounded")
-    flourescent_rounded = IconData(name="flourescent", fontFamily="Material Symbols Rounded")
-    flowchart_rounded = IconData(name="flowchart", fontFamily="Material Symbols Rounded")
-    flowsheet_rounded = IconData(name="flowsheet", fontFamily="Material Symbols Rounded")
-    fluid_rounded = IconData(name="fluid", fontFamily="Material Symbols Rounded")
-    fluid_balance_rounded = IconData(name="fluid_balance", fontFamily="Material Symbols Rounded")
-    fluid_med_rounded = IconData(name="fluid_med", fontFamily="Material Symbols Rounded")
-    fluorescent_rounded = IconData(name="fluorescent", fontFamily="Material Symbols Rounded")
-    flutter_rounded = IconData(name="flutter", fontFamily="Material Symbols Rounded")
-    flutter_dash_rounded = IconData(name="flutter_dash", fontFamily="Material Symbols Rounded")
-    flyover_rounded = IconData(name="flyover", fontFamily="Material Symbols Rounded")
-    fmd_bad_rounded = IconData(name="fmd_bad", fontFamily="Material Symbols Rounded")
-    fmd_good_rounded = IconData(name="fmd_good", fontFamily="Material Symbols Rounded")
-    foggy_rounded = IconData(name="foggy", fontFamily="Material Symbols Rounded")
-    folded_hands_rounded = IconData(name="folded_hands", fontFamily="Material Symbols Rounded")
-    folder_rounded = IconData(name="folder", fontFamily="Material Symbols Rounded")
-    folder_check_rounded = IconData(name="folder_check", fontFamily="Material Symbols Rounded")
-    folder_check_2_rounded = IconData(name="folder_check_2", fontFamily="Material Symbols Rounded")
-    folder_code_rounded = IconData(name="folder_code", fontFamily="Material Symbols Rounded")
-    folder_copy_rounded = IconData(name="folder_copy", fontFamily="Material Symbols Rounded")
-    folder_data_rounded = IconData(name="folder_data", fontFamily="Material Symbols Rounded")
-    folder_delete_rounded = IconData(name="folder_delete", fontFamily="Material Symbols Rounded")
-    folder_eye_rounded = IconData(name="folder_eye", fontFamily="Material Symbols Rounded")
-    folder_info_rounded = IconData(name="folder_info", fontFamily="Material Symbols Rounded")
-    folder_limited_rounded = IconData(name="folder_limited", fontFamily="Material Symbols Rounded")
-    folder_managed_rounded = IconData(name="folder_managed", fontFamily="Material Symbols Rounded")
-    folder_match_rounded = IconData(name="folder_match", fontFamily="Material Symbols Rounded")
-    folder_off_rounded = IconData(name="folder_off", fontFamily="Material Symbols Rounded")
-    folder_open_rounded = IconData(name="folder_open", fontFamily="Material Symbols Rounded")
-    folder_shared_rounded = IconData(name="folder_shared", fontFamily="Material Symbols Rounded")
-    folder_special_rounded = IconData(name="folder_special", fontFamily="Material Symbols Rounded")
-    folder_supervised_rounded = IconData(name="folder_supervised", fontFamily="Material Symbols Rounded")
-    folder_zip_rounded = IconData(name="folder_zip", fontFamily="Material Symbols Rounded")
-    follow_the_signs_rounded = IconData(name="follow_the_signs", fontFamily="Material Symbols Rounded")
-    font_download_rounded = IconData(name="font_download", fontFamily="Material Symbols Rounded")
-    font_download_off_rounded = IconData(name="font_download_off", fontFamily="Material Symbols Rounded")
-    food_bank_rounded = IconData(name="food_bank", fontFamily="Material Symbols Rounded")
-    foot_bones_rounded = IconData(name="foot_bones", fontFamily="Material Symbols Rounded")
-    footprint_rounded = IconData(name="footprint", fontFamily="Material Symbols Rounded")
-    for_you_rounded = IconData(name="for_you", fontFamily="Material Symbols Rounded")
-    forest_rounded = IconData(name="forest", fontFamily="Material Symbols Rounded")
-    fork_left_rounded = IconData(name="fork_left", fontFamily="Material Symbols Rounded")
-    fork_right_rounded = IconData(name="fork_right", fontFamily="Material Symbols Rounded")
-    fork_spoon_rounded = IconData(name="fork_spoon", fontFamily="Material Symbols Rounded")
-    forklift_rounded = IconData(name="forklift", fontFamily="Material Symbols Rounded")
-    format_align_center_rounded = IconData(name="format_align_center", fontFamily="Material Symbols Rounded")
-    format_align_justify_rounded = IconData(name="format_align_justify", fontFamily="Material Symbols Rounded")
-    format_align_left_rounded = IconData(name="format_align_left", fontFamily="Material Symbols Rounded")
-    format_align_right_rounded = IconData(name="format_align_right", fontFamily="Material Symbols Rounded")
-    format_bold_rounded = IconData(name="format_bold", fontFamily="Material Symbols Rounded")
-    format_clear_rounded = IconData(name="format_clear", fontFamily="Material Symbols Rounded")
-    format_color_fill_rounded = IconData(name="format_color_fill", fontFamily="Material Symbols Rounded")
-    format_color_reset_rounded = IconData(name="format_color_reset", fontFamily="Material Symbols Rounded")
-    format_color_text_rounded = IconData(name="format_color_text", fontFamily="Material Symbols Rounded")
-    format_h1_rounded = IconData(name="format_h1", fontFamily="Material Symbols Rounded")
-    format_h2_rounded = IconData(name="format_h2", fontFamily="Material Symbols Rounded")
-    format_h3_rounded = IconData(name="format_h3", fontFamily="Material Symbols Rounded")
-    format_h4_rounded = IconData(name="format_h4", fontFamily="Material Symbols Rounded")
-    format_h5_rounded = IconData(name="format_h5", fontFamily="Material Symbols Rounded")
-    format_h6_rounded = IconData(name="format_h6", fontFamily="Material Symbols Rounded")
-    format_image_left_rounded = IconData(name="format_image_left", fontFamily="Material Symbols Rounded")
-    format_image_right_rounded = IconData(name="format_image_right", fontFamily="Material Symbols Rounded")
-    format_indent_decrease_rounded = IconData(name="format_indent_decrease", fontFamily="Material Symbols Rounded")
-    format_indent_increase_rounded = IconData(name="format_indent_increase", fontFamily="Material Symbols Rounded")
-    format_ink_highlighter_rounded = IconData(name="format_ink_highlighter", fontFamily="Material Symbols Rounded")
-    format_italic_rounded = IconData(name="format_italic", fontFamily="Material Symbols Rounded")
-    format_letter_spacing_rounded = IconData(name="format_letter_spacing", fontFamily="Material Symbols Rounded")
-    format_letter_spacing_2_rounded = IconData(name="format_letter_spacing_2", fontFamily="Material Symbols Rounded")
-    format_letter_spacing_standard_rounded = IconData(name="format_letter_spacing_standard", fontFamily="Material Symbols Rounded")
-    format_letter_spacing_wide_rounded = IconData(name="format_letter_spacing_wide", fontFamily="Material Symbols Rounded")
-    format_letter_spacing_wider_rounded = IconData(name="format_letter_spacing_wider", fontFamily="Material Symbols Rounded")
-    format_line_spacing_rounded = IconData(name="format_line_spacing", fontFamily="Material Symbols Rounded")
-    format_list_bulleted_rounded = IconData(name="format_list_bulleted", fontFamily="Material Symbols Rounded")
-    format_list_bulleted_add_rounded = IconData(name="format_list_bulleted_add", fontFamily="Material Symbols Rounded")
-    format_list_numbered_rounded = IconData(name="format_list_numbered", fontFamily="Material Symbols Rounded")
-    format_list_numbered_rtl_rounded = IconData(name="format_list_numbered_rtl", fontFamily="Material Symbols Rounded")
-    format_overline_rounded = IconData(name="format_overline", fontFamily="Material Symbols Rounded")
-    format_paint_rounded = IconData(name="format_paint", fontFamily="Material Symbols Rounded")
-    format_paragraph_rounded = IconData(name="format_paragraph", fontFamily="Material Symbols Rounded")
-    format_quote_rounded = IconData(name="format_quote", fontFamily="Material Symbols Rounded")
-    format_quote_off_rounded = IconData(name="format_quote_off", fontFamily="Material Symbols Rounded")
-    format_shapes_rounded = IconData(name="format_shapes", fontFamily="Material Symbols Rounded")
-    format_size_rounded = IconData(name="format_size", fontFamily="Material Symbols Rounded")
-    format_strikethrough_rounded = IconData(name="format_strikethrough", fontFamily="Material Symbols Rounded")
-    format_text_clip_rounded = IconData(name="format_text_clip", fontFamily="Material Symbols Rounded")
-    format_text_overflow_rounded = IconData(name="format_text_overflow", fontFamily="Material Symbols Rounded")
-    format_text_wrap_rounded = IconData(name="format_text_wrap", fontFamily="Material Symbols Rounded")
-    format_textdirection_l_to_r_rounded = IconData(name="format_textdirection_l_to_r", fontFamily="Material Symbols Rounded")
-    format_textdirection_r_to_l_rounded = IconData(name="format_textdirection_r_to_l", fontFamily="Material Symbols Rounded")
-    format_textdirection_vertical_rounded = IconData(name="format_textdirection_vertical", fontFamily="Material Symbols Rounded")
-    format_underlined_rounded = IconData(name="format_underlined", fontFamily="Material Symbols Rounded")
-    format_underlined_squiggle_rounded = IconData(name="format_underlined_squiggle", fontFamily="Material Symbols Rounded")
-    forms_add_on_rounded = IconData(name="forms_add_on", fontFamily="Material Symbols Rounded")
-    forms_apps_script_rounded = IconData(name="forms_apps_script", fontFamily="Material Symbols Rounded")
-    fort_rounded = IconData(name="fort", fontFamily="Material Symbols Rounded")
-    forum_rounded = IconData(name="forum", fontFamily="Material Symbols Rounded")
-    forward_rounded = IconData(name="forward", fontFamily="Material Symbols Rounded")
-    forward_10_rounded = IconData(name="forward_10", fontFamily="Material Symbols Rounded")
-    forward_30_rounded = IconData(name="forward_30", fontFamily="Material Symbols Rounded")
-    forward_5_rounded = IconData(name="forward_5", fontFamily="Material Symbols Rounded")
-    forward_circle_rounded = IconData(name="forward_circle", fontFamily="Material Symbols Rounded")
-    forward_media_rounded = IconData(name="forward_media", fontFamily="Material Symbols Rounded")
-    forward_to_inbox_rounded = IconData(name="forward_to_inbox", fontFamily="Material Symbols Rounded")
-    foundation_rounded = IconData(name="foundation", fontFamily="Material Symbols Rounded")
-    fragrance_rounded = IconData(name="fragrance", fontFamily="Material Symbols Rounded")
-    frame_inspect_rounded = IconData(name="frame_inspect", fontFamily="Material Symbols Rounded")
-    frame_person_rounded = IconData(name="frame_person", fontFamily="Material Symbols Rounded")
-    frame_person_mic_rounded = IconData(name="frame_person_mic", fontFamily="Material Symbols Rounded")
-    frame_person_off_rounded = IconData(name="frame_person_off", fontFamily="Material Symbols Rounded")
-    frame_reload_rounded = IconData(name="frame_reload", fontFamily="Material Symbols Rounded")
-    frame_source_rounded = IconData(name="frame_source", fontFamily="Material Symbols Rounded")
-    free_breakfast_rounded = IconData(name="free_breakfast", fontFamily="Material Symbols Rounded")
-    free_cancellation_rounded = IconData(name="free_cancellation", fontFamily="Material Symbols Rounded")
-    front_hand_rounded = IconData(name="front_hand", fontFamily="Material Symbols Rounded")
-    front_loader_rounded = IconData(name="front_loader", fontFamily="Material Symbols Rounded")
-    full_coverage_rounded = IconData(name="full_coverage", fontFamily="Material Symbols Rounded")
-    full_hd_rounded = IconData(name="full_hd", fontFamily="Material Symbols Rounded")
-    full_stacked_bar_chart_rounded = IconData(name="full_stacked_bar_chart", fontFamily="Material Symbols Rounded")
-    fullscreen_rounded = IconData(name="fullscreen", fontFamily="Material Symbols Rounded")
-    fullscreen_exit_rounded = IconData(name="fullscreen_exit", fontFamily="Material Symbols Rounded")
-    fullscreen_portrait_rounded = IconData(name="fullscreen_portrait", fontFamily="Material Symbols Rounded")
-    function_rounded = IconData(name="function", fontFamily="Material Symbols Rounded")
-    functions_rounded = IconData(name="functions", fontFamily="Material Symbols Rounded")
-    funicular_rounded = IconData(name="funicular", fontFamily="Material Symbols Rounded")
-    g_mobiledata_rounded = IconData(name="g_mobiledata", fontFamily="Material Symbols Rounded")
-    g_mobiledata_badge_rounded = IconData(name="g_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    g_translate_rounded = IconData(name="g_translate", fontFamily="Material Symbols Rounded")
-    gallery_thumbnail_rounded = IconData(name="gallery_thumbnail", fontFamily="Material Symbols Rounded")
-    gamepad_rounded = IconData(name="gamepad", fontFamily="Material Symbols Rounded")
-    games_rounded = IconData(name="games", fontFamily="Material Symbols Rounded")
-    garage_rounded = IconData(name="garage", fontFamily="Material Symbols Rounded")
-    garage_door_rounded = IconData(name="garage_door", fontFamily="Material Symbols Rounded")
-    garage_home_rounded = IconData(name="garage_home", fontFamily="Material Symbols Rounded")
-    garden_cart_rounded = IconData(name="garden_cart", fontFamily="Material Symbols Rounded")
-    gas_meter_rounded = IconData(name="gas_meter", fontFamily="Material Symbols Rounded")
-    gastroenterology_rounded = IconData(name="gastroenterology", fontFamily="Material Symbols Rounded")
-    gate_rounded = IconData(name="gate", fontFamily="Material Symbols Rounded")
-    gavel_rounded = IconData(name="gavel", fontFamily="Material Symbols Rounded")
-    general_device_rounded = IconData(name="general_device", fontFamily="Material Symbols Rounded")
-    generating_tokens_rounded = IconData(name="generating_tokens", fontFamily="Material Symbols Rounded")
-    genetics_rounded = IconData(name="genetics", fontFamily="Material Symbols Rounded")
-    genres_rounded = IconData(name="genres", fontFamily="Material Symbols Rounded")
-    gesture_rounded = IconData(name="gesture", fontFamily="Material Symbols Rounded")
-    gesture_select_rounded = IconData(name="gesture_select", fontFamily="Material Symbols Rounded")
-    get_app_rounded = IconData(name="get_app", fontFamily="Material Symbols Rounded")
-    gif_rounded = IconData(name="gif", fontFamily="Material Symbols Rounded")
-    gif_2_rounded = IconData(name="gif_2", fontFamily="Material Symbols Rounded")
-    gif_box_rounded = IconData(name="gif_box", fontFamily="Material Symbols Rounded")
-    girl_rounded = IconData(name="girl", fontFamily="Material Symbols Rounded")
-    gite_rounded = IconData(name="gite", fontFamily="Material Symbols Rounded")
-    glass_cup_rounded = IconData(name="glass_cup", fontFamily="Material Symbols Rounded")
-    globe_rounded = IconData(name="globe", fontFamily="Material Symbols Rounded")
-    globe_asia_rounded = IconData(name="globe_asia", fontFamily="Material Symbols Rounded")
-    globe_book_rounded = IconData(name="globe_book", fontFamily="Material Symbols Rounded")
-    globe_location_pin_rounded = IconData(name="globe_location_pin", fontFamily="Material Symbols Rounded")
-    globe_uk_rounded = IconData(name="globe_uk", fontFamily="Material Symbols Rounded")
-    glucose_rounded = IconData(name="glucose", fontFamily="Material Symbols Rounded")
-    glyphs_rounded = IconData(name="glyphs", fontFamily="Material Symbols Rounded")
-    go_to_line_rounded = IconData(name="go_to_line", fontFamily="Material Symbols Rounded")
-    golf_course_rounded = IconData(name="golf_course", fontFamily="Material Symbols Rounded")
-    gondola_lift_rounded = IconData(name="gondola_lift", fontFamily="Material Symbols Rounded")
-    google_home_devices_rounded = IconData(name="google_home_devices", fontFamily="Material Symbols Rounded")
-    google_plus_reshare_rounded = IconData(name="google_plus_reshare", fontFamily="Material Symbols Rounded")
-    google_tv_remote_rounded = IconData(name="google_tv_remote", fontFamily="Material Symbols Rounded")
-    google_wifi_rounded = IconData(name="google_wifi", fontFamily="Material Symbols Rounded")
-    gpp_bad_rounded = IconData(name="gpp_bad", fontFamily="Material Symbols Rounded")
-    gpp_good_rounded = IconData(name="gpp_good", fontFamily="Material Symbols Rounded")
-    gpp_maybe_rounded = IconData(name="gpp_maybe", fontFamily="Material Symbols Rounded")
-    gps_fixed_rounded = IconData(name="gps_fixed", fontFamily="Material Symbols Rounded")
-    gps_not_fixed_rounded = IconData(name="gps_not_fixed", fontFamily="Material Symbols Rounded")
-    gps_off_rounded = IconData(name="gps_off", fontFamily="Material Symbols Rounded")
-    grade_rounded = IconData(name="grade", fontFamily="Material Symbols Rounded")
-    gradient_rounded = IconData(name="gradient", fontFamily="Material Symbols Rounded")
-    grading_rounded = IconData(name="grading", fontFamily="Material Symbols Rounded")
-    grain_rounded = IconData(name="grain", fontFamily="Material Symbols Rounded")
-    graph_1_rounded = IconData(name="graph_1", fontFamily="Material Symbols Rounded")
-    graph_2_rounded = IconData(name="graph_2", fontFamily="Material Symbols Rounded")
-    graph_3_rounded = IconData(name="graph_3", fontFamily="Material Symbols Rounded")
-    graph_4_rounded = IconData(name="graph_4", fontFamily="Material Symbols Rounded")
-    graph_5_rounded = IconData(name="graph_5", fontFamily="Material Symbols Rounded")
-    graph_6_rounded = IconData(name="graph_6", fontFamily="Material Symbols Rounded")
-    graph_7_rounded = IconData(name="graph_7", fontFamily="Material Symbols Rounded")
-    graphic_eq_rounded = IconData(name="graphic_eq", fontFamily="Material Symbols Rounded")
-    grass_rounded = IconData(name="grass", fontFamily="Material Symbols Rounded")
-    grid_3x3_rounded = IconData(name="grid_3x3", fontFamily="Material Symbols Rounded")
-    grid_3x3_off_rounded = IconData(name="grid_3x3_off", fontFamily="Material Symbols Rounded")
-    grid_4x4_rounded = IconData(name="grid_4x4", fontFamily="Material Symbols Rounded")
-    grid_goldenratio_rounded = IconData(name="grid_goldenratio", fontFamily="Material Symbols Rounded")
-    grid_guides_rounded = IconData(name="grid_guides", fontFamily="Material Symbols Rounded")
-    grid_off_rounded = IconData(name="grid_off", fontFamily="Material Symbols Rounded")
-    grid_on_rounded = IconData(name="grid_on", fontFamily="Material Symbols Rounded")
-    grid_view_rounded = IconData(name="grid_view", fontFamily="Material Symbols Rounded")
-    grocery_rounded = IconData(name="grocery", fontFamily="Material Symbols Rounded")
-    group_rounded = IconData(name="group", fontFamily="Material Symbols Rounded")
-    group_add_rounded = IconData(name="group_add", fontFamily="Material Symbols Rounded")
-    group_off_rounded = IconData(name="group_off", fontFamily="Material Symbols Rounded")
-    group_remove_rounded = IconData(name="group_remove", fontFamily="Material Symbols Rounded")
-    group_search_rounded = IconData(name="group_search", fontFamily="Material Symbols Rounded")
-    group_work_rounded = IconData(name="group_work", fontFamily="Material Symbols Rounded")
-    grouped_bar_chart_rounded = IconData(name="grouped_bar_chart", fontFamily="Material Symbols Rounded")
-    groups_rounded = IconData(name="groups", fontFamily="Material Symbols Rounded")
-    groups_2_rounded = IconData(name="groups_2", fontFamily="Material Symbols Rounded")
-    groups_3_rounded = IconData(name="groups_3", fontFamily="Material Symbols Rounded")
-    guardian_rounded = IconData(name="guardian", fontFamily="Material Symbols Rounded")
-    gynecology_rounded = IconData(name="gynecology", fontFamily="Material Symbols Rounded")
-    h_mobiledata_rounded = IconData(name="h_mobiledata", fontFamily="Material Symbols Rounded")
-    h_mobiledata_badge_rounded = IconData(name="h_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    h_plus_mobiledata_rounded = IconData(name="h_plus_mobiledata", fontFamily="Material Symbols Rounded")
-    h_plus_mobiledata_badge_rounded = IconData(name="h_plus_mobiledata_badge", fontFamily="Material Symbols Rounded")
-    hail_rounded = IconData(name="hail", fontFamily="Material Symbols Rounded")
-    hallway_rounded = IconData(name="hallway", fontFamily="Material Symbols Rounded")
-    hand_bones_rounded = IconData(name="hand_bones", fontFamily="Material Symbols Rounded")
-    hand_gesture_rounded = IconData(name="hand_gesture", fontFamily="Material Symbols Rounded")
-    hand_gesture_off_rounded = IconData(name="hand_gesture_off", fontFamily="Material Symbols Rounded")
-    handheld_controller_rounded = IconData(name="handheld_controller", fontFamily="Material Symbols Rounded")
-    handshake_rounded = IconData(name="handshake", fontFamily="Material Symbols Rounded")
-    handwriting_recognition_rounded = IconData(name="handwriting_recognition", fontFamily="Material Symbols Rounded")
-    handyman_rounded = IconData(name="handyman", fontFamily="Material Symbols Rounded")
-    hangout_video_rounded = IconData(name="hangout_video", fontFamily="Material Symbols Rounded")
-    hangout_video_off_rounded = IconData(name="hangout_video_off", fontFamily="Material Symbols Rounded")
-    hard_disk_rounded = IconData(name="hard_disk", fontFamily="Material Symbols Rounded")
-    hard_drive_rounded = IconData(name="hard_drive", fontFamily="Material Symbols Rounded")
-    hard_drive_2_rounded = IconData(name="hard_drive_2", fontFamily="Material Symbols Rounded")
-    hardware_rounded = IconData(name="hardware", fontFamily="Material Symbols Rounded")
-    hd_rounded = IconData(name="hd", fontFamily="Material Symbols Rounded")
-    hdr_auto_rounded = IconData(name="hdr_auto", fontFamily="Material Symbols Rounded")
-    hdr_auto_select_rounded = IconData(name="hdr_auto_select", fontFamily="Material Symbols Rounded")
-    hdr_enhanced_select_rounded = IconData(name="hdr_enhanced_select", fontFamily="Material Symbols Rounded")
-    hdr_off_rounded = IconData(name="hdr_off", fontFamily="Material Symbols Rounded")
-    hdr_off_select_rounded = IconData(name="hdr_off_select", fontFamily="Material Symbols Rounded")
-    hdr_on_rounded = IconData(name="hdr_on", fontFamily="Material Symbols Rounded")
-    hdr_on_select_rounded = IconData(name="hdr_on_select", fontFamily="Material Symbols Rounded")
-    hdr_plus_rounded = IconData(name="hdr_plus", fontFamily="Material Symbols Rounded")
-    hdr_plus_off_rounded = IconData(name="hdr_plus_off", fontFamily="Material Symbols Rounded")
-    hdr_strong_rounded = IconData(name="hdr_strong", fontFamily="Material Symbols Rounded")
-    hdr_weak_rounded = IconData(name="hdr_weak", fontFamily="Material Symbols Rounded")
-    head_mounted_device_rounded = IconData(name="head_mounted_device", fontFamily="Material Symbols Rounded")
-    headphones_rounded = IconData(name="headphones", fontFamily="Material Symbols Rounded")
-    headphones_battery_rounded = IconData(name="headphones_battery", fontFamily="Material Symbols Rounded")
-    headset_rounded = IconData(name="headset", fontFamily="Material Symbols Rounded")
-    headset_mic_rounded = IconData(name="headset_mic", fontFamily="Material Symbols Rounded")
-    headset_off_rounded = IconData(name="headset_off", fontFamily="Material Symbols Rounded")
-    healing_rounded = IconData(name="healing", fontFamily="Material Symbols Rounded")
-    health_and_beauty_rounded = IconData(name="health_and_beauty", fontFamily="Material Symbols Rounded")
-    health_and_safety_rounded = IconData(name="health_and_safety", fontFamily="Material Symbols Rounded")
-    health_metrics_rounded = IconData(name="health_metrics", fontFamily="Material Symbols Rounded")
-    heap_snapshot_large_rounded = IconData(name="heap_snapshot_large", fontFamily="Material Symbols Rounded")
-    heap_snapshot_multiple_rounded = IconData(name="heap_snapshot_multiple", fontFamily="Material Symbols Rounded")
-    heap_snapshot_thumbnail_rounded = IconData(name="heap_snapshot_thumbnail", fontFamily="Material Symbols Rounded")
-    hearing_rounded = IconData(name="hearing", fontFamily="Material Symbols Rounded")
-    hearing_aid_rounded = IconData(name="hearing_aid", fontFamily="Material Symbols Rounded")
-    hearing_aid_disabled_rounded = IconData(name="hearing_aid_disabled", fontFamily="Material Symbols Rounded")
-    hearing_disabled_rounded = IconData(name="hearing_disabled", fontFamily="Material Symbols Rounded")
-    heart_broken_rounded = IconData(name="heart_broken", fontFamily="Material Symbols Rounded")
-    heart_check_rounded = IconData(name="heart_check", fontFamily="Material Symbols Rounded")
-    heart_minus_rounded = IconData(name="heart_minus", fontFamily="Material Symbols Rounded")
-    heart_plus_rounded = IconData(name="heart_plus", fontFamily="Material Symbols Rounded")
-    heat_rounded = IconData(name="heat", fontFamily="Material Symbols Rounded")
-    heat_pump_rounded = IconData(name="heat_pump", fontFamily="Material Symbols Rounded")
-    heat_pump_balance_rounded = IconData(name="heat_pump_balance", fontFamily="Material Symbols Rounded")
-    height_rounded = IconData(name="height", fontFamily="Material Symbols Rounded")
-    helicopter_rounded = IconData(name="helicopter", fontFamily="Material Symbols Rounded")
-    help_rounded = IconData(name="help", fontFamily="Material Symbols Rounded")
-    help_center_rounded = IconData(name="help_center", fontFamily="Material Symbols Rounded")
-    help_clinic_rounded = IconData(name="help_clinic", fontFamily="Material Symbols Rounded")
-    help_outline_rounded = IconData(name="help_outline", fontFamily="Material Symbols Rounded")
-    hematology_rounded = IconData(name="hematology", fontFamily="Material Symbols Rounded")
-    hevc_rounded = IconData(name="hevc", fontFamily="Material Symbols Rounded")
-    hexagon_rounded = IconData(name="hexagon", fontFamily="Material Symbols Rounded")
-    hide_rounded = IconData(name="hide", fontFamily="Material Symbols Rounded")
-    hide_image_rounded = IconData(name="hide_image", fontFamily="Material Symbols Rounded")
-    hide_source_rounded = IconData(name="hide_source", fontFamily="Material Symbols Rounded")
-    high_density_rounded = IconData(name="high_density", fontFamily="Material Symbols Rounded")
-    high_quality_rounded = IconData(name="high_quality", fontFamily="Material Symbols Rounded")
-    high_res_rounded = IconData(name="high_res", fontFamily="Material Symbols Rounded")
-    highlight_rounded = IconData(name="highlight", fontFamily="Material Symbols Rounded")
-    highlight_alt_rounded = IconData(name="highlight_alt", fontFamily="Material Symbols Rounded")
-    highlight_keyboard_focus_rounded = IconData(name="highlight_keyboard_focus", fontFamily="Material Symbols Rounded")
-    highlight_mouse_cursor_rounded = IconData(name="highlight_mouse_cursor", fontFamily="Material Symbols Rounded")
-    highlight_off_rounded = IconData(name="highlight_off", fontFamily="Material Symbols Rounded")
-    highlight_text_cursor_rounded = IconData(name="highlight_text_cursor", fontFamily="Material Symbols Rounded")
-    highlighter_size_1_rounded = IconData(name="highlighter_size_1", fontFamily="Material Symbols Rounded")
-    highlighter_size_2_rounded = IconData(name="highlighter_size_2", fontFamily="Material Symbols Rounded")
-    highlighter_size_3_rounded = IconData(name="highlighter_size_3", fontFamily="Material Symbols Rounded")
-    highlighter_size_4_rounded = IconData(name="highlighter_size_4", fontFamily="Material Symbols Rounded")
-    highlighter_size_5_rounded = IconData(name="highlighter_size_5", fontFamily="Material Symbols Rounded")
-    hiking_rounded = IconData(name="hiking", fontFamily="Material Symbols Rounded")
-    history_rounded = IconData(name="history", fontFamily="Material Symbols Rounded")
-    history_2_rounded = IconData(name="history_2", fontFamily="Material Symbols Rounded")
-    history_edu_rounded = IconData(name="history_edu", fontFamily="Material Symbols Rounded")
-    history_off_rounded = IconData(name="history_off", fontFamily="Material Symbols Rounded")
-    history_toggle_off_rounded = IconData(name="history_toggle_off", fontFamily="Material Symbols Rounded")
-    hive_rounded = IconData(name="hive", fontFamily="Material Symbols Rounded")
-    hls_rounded = IconData(name="hls", fontFamily="Material Symbols Rounded")
-    hls_off_rounded = IconData(name="hls_off", fontFamily="Material Symbols Rounded")
-    holiday_village_rounded = IconData(name="holiday_village", fontFamily="Material Symbols Rounded")
-    home_rounded = IconData(name="home", fontFamily="Material Symbols Rounded")
-    home_and_garden_rounded = IconData(name="home_and_garden", fontFamily="Material Symbols Rounded")
-    home_app_logo_rounded = IconData(name="home_app_logo", fontFamily="Material Symbols Rounded")
-    home_filled_rounded = IconData(name="home_filled", fontFamily="Material Symbols Rounded")
-    home_health_rounded = IconData(name="home_health", fontFamily="Material Symbols Rounded")
-    home_improvement_and_tools_rounded = IconData(name="home_improvement_and_tools", fontFamily="Material Symbols Rounded")
-    home_iot_device_rounded = IconData(name="home_iot_device", fontFamily="Material Symbols Rounded")
-    home_max_rounded = IconData(name="home_max", fontFamily="Material Symbols Rounded")
-    home_max_dots_rounded = IconData(name="home_max_dots", fontFamily="Material Symbols Rounded")
-    home_mini_rounded = IconData(name="home_mini", fontFamily="Material Symbols Rounded")
-    home_pin_rounded = IconData(name="home_pin", fontFamily="Material Symbols Rounded")
-    home_repair_service_rounded = IconData(name="home_repair_service", fontFamily="Material Symbols Rounded")
-    home_speaker_rounded = IconData(name="home_speaker", fontFamily="Material Symbols Rounded")
-    home_storage_rounded = IconData(name="home_storage", fontFamily="Material Symbols Rounded")
-    home_work_rounded = IconData(name="home_work", fontFamily="Material Symbols Rounded")
-    horizontal_distribute_rounded = IconData(name="horizontal_distribute", fontFamily="Material Symbols Rounded")
-    horizontal_rule_rounded = IconData(name="horizontal_rule", fontFamily="Material Symbols Rounded")
-    horizontal_split_rounded = IconData(name="horizontal_split", fontFamily="Material Symbols Rounded")
-    host_rounded = IconData(name="host", fontFamily="Material Symbols Rounded")
-    hot_tub_rounded = IconData(name="hot_tub", fontFamily="Material Symbols Rounded")
-    hotel_rounded = IconData(name="hotel", fontFamily="Material Symbols Rounded")
-    hotel_class_rounded = IconData(name="hotel_class", fontFamily="Material Symbols Rounded")
-    hourglass_rounded = IconData(name="hourglass", fontFamily="Material Symbols Rounded")
-    hourglass_arrow_down_rounded = IconData(name="hourglass_arrow_down", fontFamily="Material Symbols Rounded")
-    hourglass_arrow_up_rounded = IconData(name="hourglass_arrow_up", fontFamily="Material Symbols Rounded")
-    hourglass_bottom_rounded = IconData(name="hourglass_bottom", fontFamily="Material Symbols Rounded")
-    hourglass_disabled_rounded = IconData(name="hourglass_disabled", fontFamily="Material Symbols Rounded")
-    hourglass_empty_rounded = IconData(name="hourglass_empty", fontFamily="Material Symbols Rounded")
-    hourglass_full_rounded = IconData(name="hourglass_full", fontFamily="Material Symbols Rounded")
-    hourglass_pause_rounded = IconData(name="hourglass_pause", fontFamily="Material Symbols Rounded")
-    hourglass_top_rounded = IconData(name="hourglass_top", fontFamily="Material Symbols Rounded")
-    house_rounded = IconData(name="house", fontFamily="Material Symbols Rounded")
-    house_siding_rounded = IconData(name="house_siding", fontFamily="Material Symbols Rounded")
-    house_with_shield_rounded = IconData(name="house_with_shield", fontFamily="Material Symbols Rounded")
-    houseboat_rounded = IconData(name="houseboat", fontFamily="Material Symbols Rounded")
-    household_supplies_rounded = IconData(name="household_supplies", fontFamily="Material Symbols Rounded")
-    hov_rounded = IconData(name="hov", fontFamily="Material Symbols Rounded")
-    how_to_reg_rounded = IconData(name="how_to_reg", fontFamily="Material Symbols Rounded")
-    how_to_vote_rounded = IconData(name="how_to_vote", fontFamily="Material Symbols Rounded")
-    hr_resting_rounded = IconData(name="hr_resting", fontFamily="Material Symbols Rounded")
-    html_rounded = IconData(name="html", fontFamily="Material Symbols Rounded")
-    http_rounded = IconData(name="http", fontFamily="Material Symbols Rounded")
-    https_rounded = IconData(name="https", fontFamily="Material Symbols Rounded")
-    hub_rounded = IconData(name="hub", fontFamily="Material Symbols Rounded")
-    humerus_rounded = IconData(name="humerus", fontFamily="Material Symbols Rounded")
-    humerus_alt_rounded = IconData(name="humerus_alt", fontFamily="Material Symbols Rounded")
-    humidity_high_rounded = IconData(name="humidity_high", fontFamily="Material Symbols Rounded")
-    humidity_indoor_rounded = IconData(name="humidity_indoor", fontFamily="Material Symbols Rounded")
-    humidity_low_rounded = IconData(name="humidity_low", fontFamily="Material Symbols Rounded")
-    humidity_mid_rounded = IconData(name="humidity_mid", fontFamily="Material Symbols Rounded")
-    humidity_percentage_rounded = IconData(name="humidity_percentage", fontFamily="Material Symbols Rounded")
-    hvac_rounded = IconData(name="hvac", fontFamily="Material Symbols Rounded")
-    hvac_max_defrost_rounded = IconData(name="hvac_max_defrost", fontFamily="Material Symbols Rounded")
-    ice_skating_rounded = IconData(name="ice_skating", fontFamily="Material Symbols Rounded")
-    icecream_rounded = IconData(name="icecream", fontFamily="Material Symbols Rounded")
-    id_card_rounded = IconData(name="id_card", fontFamily="Material Symbols Rounded")
-    identity_aware_proxy_rounded = IconData(name="identity_aware_proxy", fontFamily="Material Symbols Rounded")
-    identity_platform_rounded = IconData(name="identity_platform", fontFamily="Material Symbols Rounded")
-    ifl_rounded = IconData(name="ifl", fontFamily="Material Symbols Rounded")
-    iframe_rounded = IconData(name="iframe", fontFamily="Material Symbols Rounded")
-    iframe_off_rounded = IconData(name="iframe_off", fontFamily="Material Symbols Rounded")
-    image_rounded = IconData(name="image", fontFamily="Material Symbols Rounded")
-    image_arrow_up_rounded = IconData(name="image_arrow_up", fontFamily="Material Symbols Rounded")
-    image_aspect_ratio_rounded = IconData(name="image_aspect_ratio", fontFamily="Material Symbols Rounded")
-    image_not_supported_rounded = IconData(name="image_not_supported", fontFamily="Material Symbols Rounded")
-    image_search_rounded = IconData(name="image_search", fontFamily="Material Symbols Rounded")
-    imagesearch_roller_rounded = IconData(name="imagesearch_roller", fontFamily="Material Symbols Rounded")
-    imagesmode_rounded = IconData(name="imagesmode", fontFamily="Material Symbols Rounded")
-    immunology_rounded = IconData(name="immunology", fontFamily="Material Symbols Rounded")
-    import_contacts_rounded = IconData(name="import_contacts", fontFamily="Material Symbols Rounded")
-    import_export_rounded = IconData(name="import_export", fontFamily="Material Symbols Rounded")
-    important_devices_rounded = IconData(name="important_devices", fontFamily="Material Symbols Rounded")
-    in_home_mode_rounded = IconData(name="in_home_mode", fontFamily="Material Symbols Rounded")
-    inactive_order_rounded = IconData(name="inactive_order", fontFamily="Material Symbols Rounded")
-    inbox_rounded = IconData(name="inbox", fontFamily="Material Symbols Rounded")
-    inbox_customize_rounded = IconData(name="inbox_customize", fontFamily="Material Symbols Rounded")
-    inbox_text_rounded = IconData(name="inbox_text", fontFamily="Material Symbols Rounded")
-    inbox_text_asterisk_rounded = IconData(name="inbox_text_asterisk", fontFamily="Material Symbols Rounded")
-    inbox_text_person_rounded = IconData(name="inbox_text_person", fontFamily="Material Symbols Rounded")
-    inbox_text_share_rounded = IconData(name="inbox_text_share", fontFamily="Material Symbols Rounded")
-    incomplete_circle_rounded = IconData(name="incomplete_circle", fontFamily="Material Symbols Rounded")
-    indeterminate_check_box_rounded = IconData(name="indeterminate_check_box", fontFamily="Material Symbols Rounded")
-    indeterminate_question_box_rounded = IconData(name="indeterminate_question_box", fontFamily="Material Symbols Rounded")
-    info_rounded = IconData(name="info", fontFamily="Material Symbols Rounded")
-    info_i_rounded = IconData(name="info_i", fontFamily="Material Symbols Rounded")
-    infrared_rounded = IconData(name="infrared", fontFamily="Material Symbols Rounded")
-    ink_eraser_rounded = IconData(name="ink_eraser", fontFamily="Material Symbols Rounded")
-    ink_eraser_off_rounded = IconData(name="ink_eraser_off", fontFamily="Material Symbols Rounded")
-    ink_highlighter_rounded = IconData(name="ink_highlighter", fontFamily="Material Symbols Rounded")
-    ink_highlighter_move_rounded = IconData(name="ink_highlighter_move", fontFamily="Material Symbols Rounded")
-    ink_marker_rounded = IconData(name="ink_marker", fontFamily="Material Symbols Rounded")
-    ink_pen_rounded = IconData(name="ink_pen", fontFamily="Material Symbols Rounded")
-    ink_selection_rounded = IconData(name="ink_selection", fontFamily="Material Symbols Rounded")
-    inpatient_rounded = IconData(name="inpatient", fontFamily="Material Symbols Rounded")
-    input_rounded = IconData(name="input", fontFamily="Material Symbols Rounded")
-    input_circle_rounded = IconData(name="input_circle", fontFamily="Material Symbols Rounded")
-    insert_chart_rounded = IconData(name="insert_chart", fontFamily="Material Symbols Rounded")
-    insert_chart_filled_rounded = IconData(name="insert_chart_filled", fontFamily="Material Symbols Rounded")
-    insert_chart_outlined_rounded = IconData(name="insert_chart_outlined", fontFamily="Material Symbols Rounded")
-    insert_comment_rounded = IconData(name="insert_comment", fontFamily="Material Symbols Rounded")
-    insert_drive_file_rounded = IconData(name="insert_drive_file", fontFamily="Material Symbols Rounded")
-    insert_emoticon_rounded = IconData(name="insert_emoticon", fontFamily="Material Symbols Rounded")
-    insert_invitation_rounded = IconData(name="insert_invitation", fontFamily="Material Symbols Rounded")
-    insert_link_rounded = IconData(name="insert_link", fontFamily="Material Symbols Rounded")
-    insert_page_break_rounded = IconData(name="insert_page_break", fontFamily="Material Symbols Rounded")
-    insert_photo_rounded = IconData(name="insert_photo", fontFamily="Material Symbols Rounded")
-    insert_text_rounded = IconData(name="insert_text", fontFamily="Material Symbols Rounded")
-    insights_rounded = IconData(name="insights", fontFamily="Material Symbols Rounded")
-    install_desktop_rounded = IconData(name="install_desktop", fontFamily="Material Symbols Rounded")
-    install_mobile_rounded = IconData(name="install_mobile", fontFamily="Material Symbols Rounded")
-    instant_mix_rounded = IconData(name="instant_mix", fontFamily="Material Symbols Rounded")
-    integration_instructions_rounded = IconData(name="integration_instructions", fontFamily="Material Symbols Rounded")
-    interactive_space_rounded = IconData(name="interactive_space", fontFamily="Material Symbols Rounded")
-    interests_rounded = IconData(name="interests", fontFamily="Material Symbols Rounded")
-    interpreter_mode_rounded = IconData(name="interpreter_mode", fontFamily="Material Symbols Rounded")
-    inventory_rounded = IconData(name="inventory", fontFamily="Material Symbols Rounded")
-    inventory_2_rounded = IconData(name="inventory_2", fontFamily="Material Symbols Rounded")
-    invert_colors_rounded = IconData(name="invert_colors", fontFamily="Material Symbols Rounded")
-    invert_colors_off_rounded = IconData(name="invert_colors_off", fontFamily="Material Symbols Rounded")
-    ios_rounded = IconData(name="ios", fontFamily="Material Symbols Rounded")
-    ios_share_rounded = IconData(name="ios_share", fontFamily="Material Symbols Rounded")
-    iron_rounded = IconData(name="iron", fontFamily="Material Symbols Rounded")
-    iso_rounded = IconData(name="iso", fontFamily="Material Symbols Rounded")
\ No newline at end of file
@@ -1,2075 +0,0 @@
-from .base import IconData
-
-
-class IconsSharp:
-    """A helper class containing static references to sharp Material Symbols."""
-    jamboard_kiosk_sharp = IconData(name="jamboard_kiosk", fontFamily="Material Symbols Sharp")
-    javascript_sharp = IconData(name="javascript", fontFamily="Material Symbols Sharp")
-    join_sharp = IconData(name="join", fontFamily="Material Symbols Sharp")
-    join_full_sharp = IconData(name="join_full", fontFamily="Material Symbols Sharp")
-    join_inner_sharp = IconData(name="join_inner", fontFamily="Material Symbols Sharp")
-    join_left_sharp = IconData(name="join_left", fontFamily="Material Symbols Sharp")
-    join_right_sharp = IconData(name="join_right", fontFamily="Material Symbols Sharp")
-    joystick_sharp = IconData(name="joystick", fontFamily="Material Symbols Sharp")
-    jump_to_element_sharp = IconData(name="jump_to_element", fontFamily="Material Symbols Sharp")
-    kayaking_sharp = IconData(name="kayaking", fontFamily="Material Symbols Sharp")
-    kebab_dining_sharp = IconData(name="kebab_dining", fontFamily="Material Symbols Sharp")
-    keep_sharp = IconData(name="keep", fontFamily="Material Symbols Sharp")
-    keep_off_sharp = IconData(name="keep_off", fontFamily="Material Symbols Sharp")
-    keep_pin_sharp = IconData(name="keep_pin", fontFamily="Material Symbols Sharp")
-    keep_public_sharp = IconData(name="keep_public", fontFamily="Material Symbols Sharp")
-    kettle_sharp = IconData(name="kettle", fontFamily="Material Symbols Sharp")
-    key_sharp = IconData(name="key", fontFamily="Material Symbols Sharp")
-    key_off_sharp = IconData(name="key_off", fontFamily="Material Symbols Sharp")
-    key_vertical_sharp = IconData(name="key_vertical", fontFamily="Material Symbols Sharp")
-    key_visualizer_sharp = IconData(name="key_visualizer", fontFamily="Material Symbols Sharp")
-    keyboard_sharp = IconData(name="keyboard", fontFamily="Material Symbols Sharp")
-    keyboard_alt_sharp = IconData(name="keyboard_alt", fontFamily="Material Symbols Sharp")
-    keyboard_arrow_down_sharp = IconData(name="keyboard_arrow_down", fontFamily="Material Symbols Sharp")
-    keyboard_arrow_left_sharp = IconData(name="keyboard_arrow_left", fontFamily="Material Symbols Sharp")
-    keyboard_arrow_right_sharp = IconData(name="keyboard_arrow_right", fontFamily="Material Symbols Sharp")
-    keyboard_arrow_up_sharp = IconData(name="keyboard_arrow_up", fontFamily="Material Symbols Sharp")
-    keyboard_backspace_sharp = IconData(name="keyboard_backspace", fontFamily="Material Symbols Sharp")
-    keyboard_capslock_sharp = IconData(name="keyboard_capslock", fontFamily="Material Symbols Sharp")
-    keyboard_capslock_badge_sharp = IconData(name="keyboard_capslock_badge", fontFamily="Material Symbols Sharp")
-    keyboard_command_key_sharp = IconData(name="keyboard_command_key", fontFamily="Material Symbols Sharp")
-    keyboard_control_key_sharp = IconData(name="keyboard_control_key", fontFamily="Material Symbols Sharp")
-    keyboard_double_arrow_down_sharp = IconData(name="keyboard_double_arrow_down", fontFamily="Material Symbols Sharp")
-    keyboard_double_arrow_left_sharp = IconData(name="keyboard_double_arrow_left", fontFamily="Material Symbols Sharp")
-    keyboard_double_arrow_right_sharp = IconData(name="keyboard_double_arrow_right", fontFamily="Material Symbols Sharp")
-    keyboard_double_arrow_up_sharp = IconData(name="keyboard_double_arrow_up", fontFamily="Material Symbols Sharp")
-    keyboard_external_input_sharp = IconData(name="keyboard_external_input", fontFamily="Material Symbols Sharp")
-    keyboard_full_sharp = IconData(name="keyboard_full", fontFamily="Material Symbols Sharp")
-    keyboard_hide_sharp = IconData(name="keyboard_hide", fontFamily="Material Symbols Sharp")
-    keyboard_keys_sharp = IconData(name="keyboard_keys", fontFamily="Material Symbols Sharp")
-    keyboard_lock_sharp = IconData(name="keyboard_lock", fontFamily="Material Symbols Sharp")
-    keyboard_lock_off_sharp = IconData(name="keyboard_lock_off", fontFamily="Material Symbols Sharp")
-    keyboard_off_sharp = IconData(name="keyboard_off", fontFamily="Material Symbols Sharp")
-    keyboard_onscreen_sharp = IconData(name="keyboard_onscreen", fontFamily="Material Symbols Sharp")
-    keyboard_option_key_sharp = IconData(name="keyboard_option_key", fontFamily="Material Symbols Sharp")
-    keyboard_previous_language_sharp = IconData(name="keyboard_previous_language", fontFamily="Material Symbols Sharp")
-    keyboard_return_sharp = IconData(name="keyboard_return", fontFamily="Material Symbols Sharp")
-    keyboard_tab_sharp = IconData(name="keyboard_tab", fontFamily="Material Symbols Sharp")
-    keyboard_tab_rtl_sharp = IconData(name="keyboard_tab_rtl", fontFamily="Material Symbols Sharp")
-    keyboard_voice_sharp = IconData(name="keyboard_voice", fontFamily="Material Symbols Sharp")
-    kid_star_sharp = IconData(name="kid_star", fontFamily="Material Symbols Sharp")
-    king_bed_sharp = IconData(name="king_bed", fontFamily="Material Symbols Sharp")
-    kitchen_sharp = IconData(name="kitchen", fontFamily="Material Symbols Sharp")
-    kitesurfing_sharp = IconData(name="kitesurfing", fontFamily="Material Symbols Sharp")
-    lab_panel_sharp = IconData(name="lab_panel", fontFamily="Material Symbols Sharp")
-    lab_profile_sharp = IconData(name="lab_profile", fontFamily="Material Symbols Sharp")
-    lab_research_sharp = IconData(name="lab_research", fontFamily="Material Symbols Sharp")
-    label_sharp = IconData(name="label", fontFamily="Material Symbols Sharp")
-    label_important_sharp = IconData(name="label_important", fontFamily="Material Symbols Sharp")
-    label_important_outline_sharp = IconData(name="label_important_outline", fontFamily="Material Symbols Sharp")
-    label_off_sharp = IconData(name="label_off", fontFamily="Material Symbols Sharp")
-    label_outline_sharp = IconData(name="label_outline", fontFamily="Material Symbols Sharp")
-    labs_sharp = IconData(name="labs", fontFamily="Material Symbols Sharp")
-    lan_sharp = IconData(name="lan", fontFamily="Material Symbols Sharp")
-    landscape_sharp = IconData(name="landscape", fontFamily="Material Symbols Sharp")
-    landscape_2_sharp = IconData(name="landscape_2", fontFamily="Material Symbols Sharp")
-    landscape_2_edit_sharp = IconData(name="landscape_2_edit", fontFamily="Material Symbols Sharp")
-    landscape_2_off_sharp = IconData(name="landscape_2_off", fontFamily="Material Symbols Sharp")
-    landslide_sharp = IconData(name="landslide", fontFamily="Material Symbols Sharp")
-    language_sharp = IconData(name="language", fontFamily="Material Symbols Sharp")
-    language_chinese_array_sharp = IconData(name="language_chinese_array", fontFamily="Material Symbols Sharp")
-    language_chinese_cangjie_sharp = IconData(name="language_chinese_cangjie", fontFamily="Material Symbols Sharp")
-    language_chinese_dayi_sharp = IconData(name="language_chinese_dayi", fontFamily="Material Symbols Sharp")
-    language_chinese_pinyin_sharp = IconData(name="language_chinese_pinyin", fontFamily="Material Symbols Sharp")
-    language_chinese_quick_sharp = IconData(name="language_chinese_quick", fontFamily="Material Symbols Sharp")
-    language_chinese_wubi_sharp = IconData(name="language_chinese_wubi", fontFamily="Material Symbols Sharp")
-    language_french_sharp = IconData(name="language_french", fontFamily="Material Symbols Sharp")
-    language_gb_english_sharp = IconData(name="language_gb_english", fontFamily="Material Symbols Sharp")
-    language_international_sharp = IconData(name="language_international", fontFamily="Material Symbols Sharp")
-    language_japanese_kana_sharp = IconData(name="language_japanese_kana", fontFamily="Material Symbols Sharp")
-    language_korean_latin_sharp = IconData(name="language_korean_latin", fontFamily="Material Symbols Sharp")
-    language_pinyin_sharp = IconData(name="language_pinyin", fontFamily="Material Symbols Sharp")
-    language_spanish_sharp = IconData(name="language_spanish", fontFamily="Material Symbols Sharp")
-    language_us_sharp = IconData(name="language_us", fontFamily="Material Symbols Sharp")
-    language_us_colemak_sharp = IconData(name="language_us_colemak", fontFamily="Material Symbols Sharp")
-    language_us_dvorak_sharp = IconData(name="language_us_dvorak", fontFamily="Material Symbols Sharp")
-    laps_sharp = IconData(name="laps", fontFamily="Material Symbols Sharp")
-    laptop_sharp = IconData(name="laptop", fontFamily="Material Symbols Sharp")
-    laptop_car_sharp = IconData(name="laptop_car", fontFamily="Material Symbols Sharp")
-    laptop_chromebook_sharp = IconData(name="laptop_chromebook", fontFamily="Material Symbols Sharp")
-    laptop_mac_sharp = IconData(name="laptop_mac", fontFamily="Material Symbols Sharp")
-    laptop_windows_sharp = IconData(name="laptop_windows", fontFamily="Material Symbols Sharp")
-    lasso_select_sharp = IconData(name="lasso_select", fontFamily="Material Symbols Sharp")
-    last_page_sharp = IconData(name="last_page", fontFamily="Material Symbols Sharp")
-    launch_sharp = IconData(name="launch", fontFamily="Material Symbols Sharp")
-    laundry_sharp = IconData(name="laundry", fontFamily="Material Symbols Sharp")
-    layers_sharp = IconData(name="layers", fontFamily="Material Symbols Sharp")
-    layers_clear_sharp = IconData(name="layers_clear", fontFamily="Material Symbols Sharp")
-    lda_sharp = IconData(name="lda", fontFamily="Material Symbols Sharp")
-    leaderboard_sharp = IconData(name="leaderboard", fontFamily="Material Symbols Sharp")
-    leak_add_sharp = IconData(name="leak_add", fontFamily="Material Symbols Sharp")
-    leak_remove_sharp = IconData(name="leak_remove", fontFamily="Material Symbols Sharp")
-    left_click_sharp = IconData(name="left_click", fontFamily="Material Symbols Sharp")
-    left_panel_close_sharp = IconData(name="left_panel_close", fontFamily="Material Symbols Sharp")
-    left_panel_open_sharp = IconData(name="left_panel_open", fontFamily="Material Symbols Sharp")
-    legend_toggle_sharp = IconData(name="legend_toggle", fontFamily="Material Symbols Sharp")
-    lens_sharp = IconData(name="lens", fontFamily="Material Symbols Sharp")
-    lens_blur_sharp = IconData(name="lens_blur", fontFamily="Material Symbols Sharp")
-    letter_switch_sharp = IconData(name="letter_switch", fontFamily="Material Symbols Sharp")
-    library_add_sharp = IconData(name="library_add", fontFamily="Material Symbols Sharp")
-    library_add_check_sharp = IconData(name="library_add_check", fontFamily="Material Symbols Sharp")
-    library_books_sharp = IconData(name="library_books", fontFamily="Material Symbols Sharp")
-    library_music_sharp = IconData(name="library_music", fontFamily="Material Symbols Sharp")
-    license_sharp = IconData(name="license", fontFamily="Material Symbols Sharp")
-    lift_to_talk_sharp = IconData(name="lift_to_talk", fontFamily="Material Symbols Sharp")
-    light_sharp = IconData(name="light", fontFamily="Material Symbols Sharp")
-    light_group_sharp = IconData(name="light_group", fontFamily="Material Symbols Sharp")
-    light_mode_sharp = IconData(name="light_mode", fontFamily="Material Symbols Sharp")
-    light_off_sharp = IconData(name="light_off", fontFamily="Material Symbols Sharp")
-    lightbulb_sharp = IconData(name="lightbulb", fontFamily="Material Symbols Sharp")
-    lightbulb_2_sharp = IconData(name="lightbulb_2", fontFamily="Material Symbols Sharp")
-    lightbulb_circle_sharp = IconData(name="lightbulb_circle", fontFamily="Material Symbols Sharp")
-    lightbulb_outline_sharp = IconData(name="lightbulb_outline", fontFamily="Material Symbols Sharp")
-    lightning_stand_sharp = IconData(name="lightning_stand", fontFamily="Material Symbols Sharp")
-    line_axis_sharp = IconData(name="line_axis", fontFamily="Material Symbols Sharp")
-    line_curve_sharp = IconData(name="line_curve", fontFamily="Material Symbols Sharp")
-    line_end_sharp = IconData(name="line_end", fontFamily="Material Symbols Sharp")
-    line_end_arrow_sharp = IconData(name="line_end_arrow", fontFamily="Material Symbols Sharp")
-    line_end_arrow_notch_sharp = IconData(name="line_end_arrow_notch", fontFamily="Material Symbols Sharp")
-    line_end_circle_sharp = IconData(name="line_end_circle", fontFamily="Material Symbols Sharp")
-    line_end_diamond_sharp = IconData(name="line_end_diamond", fontFamily="Material Symbols Sharp")
-    line_end_square_sharp = IconData(name="line_end_square", fontFamily="Material Symbols Sharp")
-    line_start_sharp = IconData(name="line_start", fontFamily="Material Symbols Sharp")
-    line_start_arrow_sharp = IconData(name="line_start_arrow", fontFamily="Material Symbols Sharp")
-    line_start_arrow_notch_sharp = IconData(name="line_start_arrow_notch", fontFamily="Material Symbols Sharp")
-    line_start_circle_sharp = IconData(name="line_start_circle", fontFamily="Material Symbols Sharp")
-    line_start_diamond_sharp = IconData(name="line_start_diamond", fontFamily="Material Symbols Sharp")
-    line_start_square_sharp = IconData(name="line_start_square", fontFamily="Material Symbols Sharp")
-    line_style_sharp = IconData(name="line_style", fontFamily="Material Symbols Sharp")
-    line_weight_sharp = IconData(name="line_weight", fontFamily="Material Symbols Sharp")
-    linear_scale_sharp = IconData(name="linear_scale", fontFamily="Material Symbols Sharp")
-    link_sharp = IconData(name="link", fontFamily="Material Symbols Sharp")
-    link_off_sharp = IconData(name="link_off", fontFamily="Material Symbols Sharp")
-    linked_camera_sharp = IconData(name="linked_camera", fontFamily="Material Symbols Sharp")
-    linked_services_sharp = IconData(name="linked_services", fontFamily="Material Symbols Sharp")
-    liquor_sharp = IconData(name="liquor", fontFamily="Material Symbols Sharp")
-    list_sharp = IconData(name="list", fontFamily="Material Symbols Sharp")
-    list_alt_sharp = IconData(name="list_alt", fontFamily="Material Symbols Sharp")
-    list_alt_add_sharp = IconData(name="list_alt_add", fontFamily="Material Symbols Sharp")
-    list_alt_check_sharp = IconData(name="list_alt_check", fontFamily="Material Symbols Sharp")
-    lists_sharp = IconData(name="lists", fontFamily="Material Symbols Sharp")
-    live_help_sharp = IconData(name="live_help", fontFamily="Material Symbols Sharp")
-    live_tv_sharp = IconData(name="live_tv", fontFamily="Material Symbols Sharp")
-    living_sharp = IconData(name="living", fontFamily="Material Symbols Sharp")
-    local_activity_sharp = IconData(name="local_activity", fontFamily="Material Symbols Sharp")
-    local_airport_sharp = IconData(name="local_airport", fontFamily="Material Symbols Sharp")
-    local_atm_sharp = IconData(name="local_atm", fontFamily="Material Symbols Sharp")
-    local_bar_sharp = IconData(name="local_bar", fontFamily="Material Symbols Sharp")
-    local_cafe_sharp = IconData(name="local_cafe", fontFamily="Material Symbols Sharp")
-    local_car_wash_sharp = IconData(name="local_car_wash", fontFamily="Material Symbols Sharp")
-    local_convenience_store_sharp = IconData(name="local_convenience_store", fontFamily="Material Symbols Sharp")
-    local_dining_sharp = IconData(name="local_dining", fontFamily="Material Symbols Sharp")
-    local_drink_sharp = IconData(name="local_drink", fontFamily="Material Symbols Sharp")
-    local_fire_department_sharp = IconData(name="local_fire_department", fontFamily="Material Symbols Sharp")
-    local_florist_sharp = IconData(name="local_florist", fontFamily="Material Symbols Sharp")
-    local_gas_station_sharp = IconData(name="local_gas_station", fontFamily="Material Symbols Sharp")
-    local_grocery_store_sharp = IconData(name="local_grocery_store", fontFamily="Material Symbols Sharp")
-    local_hospital_sharp = IconData(name="local_hospital", fontFamily="Material Symbols Sharp")
-    local_hotel_sharp = IconData(name="local_hotel", fontFamily="Material Symbols Sharp")
-    local_laundry_service_sharp = IconData(name="local_laundry_service", fontFamily="Material Symbols Sharp")
-    local_library_sharp = IconData(name="local_library", fontFamily="Material Symbols Sharp")
-    local_mall_sharp = IconData(name="local_mall", fontFamily="Material Symbols Sharp")
-    local_movies_sharp = IconData(name="local_movies", fontFamily="Material Symbols Sharp")
-    local_offer_sharp = IconData(name="local_offer", fontFamily="Material Symbols Sharp")
-    local_parking_sharp = IconData(name="local_parking", fontFamily="Material Symbols Sharp")
-    local_pharmacy_sharp = IconData(name="local_pharmacy", fontFamily="Material Symbols Sharp")
-    local_phone_sharp = IconData(name="local_phone", fontFamily="Material Symbols Sharp")
-    local_pizza_sharp = IconData(name="local_pizza", fontFamily="Material Symbols Sharp")
-    local_play_sharp = IconData(name="local_play", fontFamily="Material Symbols Sharp")
-    local_police_sharp = IconData(name="local_police", fontFamily="Material Symbols Sharp")
-    local_post_office_sharp = IconData(name="local_post_office", fontFamily="Material Symbols Sharp")
-    local_printshop_sharp = IconData(name="local_printshop", fontFamily="Material Symbols Sharp")
-    local_see_sharp = IconData(name="local_see", fontFamily="Material Symbols Sharp")
-    local_shipping_sharp = IconData(name="local_shipping", fontFamily="Material Symbols Sharp")
-    local_taxi_sharp = IconData(name="local_taxi", fontFamily="Material Symbols Sharp")
-    location_automation_sharp = IconData(name="location_automation", fontFamily="Material Symbols Sharp")
-    location_away_sharp = IconData(name="location_away", fontFamily="Material Symbols Sharp")
-    location_chip_sharp = IconData(name="location_chip", fontFamily="Material Symbols Sharp")
-    location_city_sharp = IconData(name="location_city", fontFamily="Material Symbols Sharp")
-    location_disabled_sharp = IconData(name="location_disabled", fontFamily="Material Symbols Sharp")
-    location_home_sharp = IconData(name="location_home", fontFamily="Material Symbols Sharp")
-    location_off_sharp = IconData(name="location_off", fontFamily="Material Symbols Sharp")
-    location_on_sharp = IconData(name="location_on", fontFamily="Material Symbols Sharp")
-    location_pin_sharp = IconData(name="location_pin", fontFamily="Material Symbols Sharp")
-    location_searching_sharp = IconData(name="location_searching", fontFamily="Material Symbols Sharp")
-    locator_tag_sharp = IconData(name="locator_tag", fontFamily="Material Symbols Sharp")
-    lock_sharp = IconData(name="lock", fontFamily="Material Symbols Sharp")
-    lock_clock_sharp = IconData(name="lock_clock", fontFamily="Material Symbols Sharp")
-    lock_open_sharp = IconData(name="lock_open", fontFamily="Material Symbols Sharp")
-    lock_open_circle_sharp = IconData(name="lock_open_circle", fontFamily="Material Symbols Sharp")
-    lock_open_right_sharp = IconData(name="lock_open_right", fontFamily="Material Symbols Sharp")
-    lock_outline_sharp = IconData(name="lock_outline", fontFamily="Material Symbols Sharp")
-    lock_person_sharp = IconData(name="lock_person", fontFamily="Material Symbols Sharp")
-    lock_reset_sharp = IconData(name="lock_reset", fontFamily="Material Symbols Sharp")
-    login_sharp = IconData(name="login", fontFamily="Material Symbols Sharp")
-    logo_dev_sharp = IconData(name="logo_dev", fontFamily="Material Symbols Sharp")
-    logout_sharp = IconData(name="logout", fontFamily="Material Symbols Sharp")
-    looks_sharp = IconData(name="looks", fontFamily="Material Symbols Sharp")
-    looks_3_sharp = IconData(name="looks_3", fontFamily="Material Symbols Sharp")
-    looks_4_sharp = IconData(name="looks_4", fontFamily="Material Symbols Sharp")
-    looks_5_sharp = IconData(name="looks_5", fontFamily="Material Symbols Sharp")
-    looks_6_sharp = IconData(name="looks_6", fontFamily="Material Symbols Sharp")
-    looks_one_sharp = IconData(name="looks_one", fontFamily="Material Symbols Sharp")
-    looks_two_sharp = IconData(name="looks_two", fontFamily="Material Symbols Sharp")
-    loop_sharp = IconData(name="loop", fontFamily="Material Symbols Sharp")
-    loupe_sharp = IconData(name="loupe", fontFamily="Material Symbols Sharp")
-    low_density_sharp = IconData(name="low_density", fontFamily="Material Symbols Sharp")
-    low_priority_sharp = IconData(name="low_priority", fontFamily="Material Symbols Sharp")
-    lowercase_sharp = IconData(name="lowercase", fontFamily="Material Symbols Sharp")
-    loyalty_sharp = IconData(name="loyalty", fontFamily="Material Symbols Sharp")
-    lte_mobiledata_sharp = IconData(name="lte_mobiledata", fontFamily="Material Symbols Sharp")
-    lte_mobiledata_badge_sharp = IconData(name="lte_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    lte_plus_mobiledata_sharp = IconData(name="lte_plus_mobiledata", fontFamily="Material Symbols Sharp")
-    lte_plus_mobiledata_badge_sharp = IconData(name="lte_plus_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    luggage_sharp = IconData(name="luggage", fontFamily="Material Symbols Sharp")
-    lunch_dining_sharp = IconData(name="lunch_dining", fontFamily="Material Symbols Sharp")
-    lyrics_sharp = IconData(name="lyrics", fontFamily="Material Symbols Sharp")
-    macro_auto_sharp = IconData(name="macro_auto", fontFamily="Material Symbols Sharp")
-    macro_off_sharp = IconData(name="macro_off", fontFamily="Material Symbols Sharp")
-    magic_button_sharp = IconData(name="magic_button", fontFamily="Material Symbols Sharp")
-    magic_exchange_sharp = IconData(name="magic_exchange", fontFamily="Material Symbols Sharp")
-    magic_tether_sharp = IconData(name="magic_tether", fontFamily="Material Symbols Sharp")
-    magnification_large_sharp = IconData(name="magnification_large", fontFamily="Material Symbols Sharp")
-    magnification_small_sharp = IconData(name="magnification_small", fontFamily="Material Symbols Sharp")
-    magnify_docked_sharp = IconData(name="magnify_docked", fontFamily="Material Symbols Sharp")
-    magnify_fullscreen_sharp = IconData(name="magnify_fullscreen", fontFamily="Material Symbols Sharp")
-    mail_sharp = IconData(name="mail", fontFamily="Material Symbols Sharp")
-    mail_lock_sharp = IconData(name="mail_lock", fontFamily="Material Symbols Sharp")
-    mail_off_sharp = IconData(name="mail_off", fontFamily="Material Symbols Sharp")
-    mail_outline_sharp = IconData(name="mail_outline", fontFamily="Material Symbols Sharp")
-    male_sharp = IconData(name="male", fontFamily="Material Symbols Sharp")
-    man_sharp = IconData(name="man", fontFamily="Material Symbols Sharp")
-    man_2_sharp = IconData(name="man_2", fontFamily="Material Symbols Sharp")
-    man_3_sharp = IconData(name="man_3", fontFamily="Material Symbols Sharp")
-    man_4_sharp = IconData(name="man_4", fontFamily="Material Symbols Sharp")
-    manage_accounts_sharp = IconData(name="manage_accounts", fontFamily="Material Symbols Sharp")
-    manage_history_sharp = IconData(name="manage_history", fontFamily="Material Symbols Sharp")
-    manage_search_sharp = IconData(name="manage_search", fontFamily="Material Symbols Sharp")
-    manga_sharp = IconData(name="manga", fontFamily="Material Symbols Sharp")
-    manufacturing_sharp = IconData(name="manufacturing", fontFamily="Material Symbols Sharp")
-    map_sharp = IconData(name="map", fontFamily="Material Symbols Sharp")
-    map_search_sharp = IconData(name="map_search", fontFamily="Material Symbols Sharp")
-    maps_home_work_sharp = IconData(name="maps_home_work", fontFamily="Material Symbols Sharp")
-    maps_ugc_sharp = IconData(name="maps_ugc", fontFamily="Material Symbols Sharp")
-    margin_sharp = IconData(name="margin", fontFamily="Material Symbols Sharp")
-    mark_as_unread_sharp = IconData(name="mark_as_unread", fontFamily="Material Symbols Sharp")
-    mark_chat_read_sharp = IconData(name="mark_chat_read", fontFamily="Material Symbols Sharp")
-    mark_chat_unread_sharp = IconData(name="mark_chat_unread", fontFamily="Material Symbols Sharp")
-    mark_email_read_sharp = IconData(name="mark_email_read", fontFamily="Material Symbols Sharp")
-    mark_email_unread_sharp = IconData(name="mark_email_unread", fontFamily="Material Symbols Sharp")
-    mark_unread_chat_alt_sharp = IconData(name="mark_unread_chat_alt", fontFamily="Material Symbols Sharp")
-    markdown_sharp = IconData(name="markdown", fontFamily="Material Symbols Sharp")
-    markdown_copy_sharp = IconData(name="markdown_copy", fontFamily="Material Symbols Sharp")
-    markdown_paste_sharp = IconData(name="markdown_paste", fontFamily="Material Symbols Sharp")
-    markunread_sharp = IconData(name="markunread", fontFamily="Material Symbols Sharp")
-    markunread_mailbox_sharp = IconData(name="markunread_mailbox", fontFamily="Material Symbols Sharp")
-    masked_transitions_sharp = IconData(name="masked_transitions", fontFamily="Material Symbols Sharp")
-    masked_transitions_add_sharp = IconData(name="masked_transitions_add", fontFamily="Material Symbols Sharp")
-    masks_sharp = IconData(name="masks", fontFamily="Material Symbols Sharp")
-    match_case_sharp = IconData(name="match_case", fontFamily="Material Symbols Sharp")
-    match_case_off_sharp = IconData(name="match_case_off", fontFamily="Material Symbols Sharp")
-    match_word_sharp = IconData(name="match_word", fontFamily="Material Symbols Sharp")
-    matter_sharp = IconData(name="matter", fontFamily="Material Symbols Sharp")
-    maximize_sharp = IconData(name="maximize", fontFamily="Material Symbols Sharp")
-    measuring_tape_sharp = IconData(name="measuring_tape", fontFamily="Material Symbols Sharp")
-    media_bluetooth_off_sharp = IconData(name="media_bluetooth_off", fontFamily="Material Symbols Sharp")
-    media_bluetooth_on_sharp = IconData(name="media_bluetooth_on", fontFamily="Material Symbols Sharp")
-    media_link_sharp = IconData(name="media_link", fontFamily="Material Symbols Sharp")
-    media_output_sharp = IconData(name="media_output", fontFamily="Material Symbols Sharp")
-    media_output_off_sharp = IconData(name="media_output_off", fontFamily="Material Symbols Sharp")
-    mediation_sharp = IconData(name="mediation", fontFamily="Material Symbols Sharp")
-    medical_information_sharp = IconData(name="medical_information", fontFamily="Material Symbols Sharp")
-    medical_mask_sharp = IconData(name="medical_mask", fontFamily="Material Symbols Sharp")
-    medical_services_sharp = IconData(name="medical_services", fontFamily="Material Symbols Sharp")
-    medication_sharp = IconData(name="medication", fontFamily="Material Symbols Sharp")
-    medication_liquid_sharp = IconData(name="medication_liquid", fontFamily="Material Symbols Sharp")
-    meeting_room_sharp = IconData(name="meeting_room", fontFamily="Material Symbols Sharp")
-    memory_sharp = IconData(name="memory", fontFamily="Material Symbols Sharp")
-    memory_alt_sharp = IconData(name="memory_alt", fontFamily="Material Symbols Sharp")
-    menstrual_health_sharp = IconData(name="menstrual_health", fontFamily="Material Symbols Sharp")
-    menu_sharp = IconData(name="menu", fontFamily="Material Symbols Sharp")
-    menu_book_sharp = IconData(name="menu_book", fontFamily="Material Symbols Sharp")
-    menu_open_sharp = IconData(name="menu_open", fontFamily="Material Symbols Sharp")
-    merge_sharp = IconData(name="merge", fontFamily="Material Symbols Sharp")
-    merge_type_sharp = IconData(name="merge_type", fontFamily="Material Symbols Sharp")
-    message_sharp = IconData(name="message", fontFamily="Material Symbols Sharp")
-    metabolism_sharp = IconData(name="metabolism", fontFamily="Material Symbols Sharp")
-    metro_sharp = IconData(name="metro", fontFamily="Material Symbols Sharp")
-    mfg_nest_yale_lock_sharp = IconData(name="mfg_nest_yale_lock", fontFamily="Material Symbols Sharp")
-    mic_sharp = IconData(name="mic", fontFamily="Material Symbols Sharp")
-    mic_alert_sharp = IconData(name="mic_alert", fontFamily="Material Symbols Sharp")
-    mic_double_sharp = IconData(name="mic_double", fontFamily="Material Symbols Sharp")
-    mic_external_off_sharp = IconData(name="mic_external_off", fontFamily="Material Symbols Sharp")
-    mic_external_on_sharp = IconData(name="mic_external_on", fontFamily="Material Symbols Sharp")
-    mic_none_sharp = IconData(name="mic_none", fontFamily="Material Symbols Sharp")
-    mic_off_sharp = IconData(name="mic_off", fontFamily="Material Symbols Sharp")
-    microbiology_sharp = IconData(name="microbiology", fontFamily="Material Symbols Sharp")
-    microwave_sharp = IconData(name="microwave", fontFamily="Material Symbols Sharp")
-    microwave_gen_sharp = IconData(name="microwave_gen", fontFamily="Material Symbols Sharp")
-    military_tech_sharp = IconData(name="military_tech", fontFamily="Material Symbols Sharp")
-    mimo_sharp = IconData(name="mimo", fontFamily="Material Symbols Sharp")
-    mimo_disconnect_sharp = IconData(name="mimo_disconnect", fontFamily="Material Symbols Sharp")
-    mindfulness_sharp = IconData(name="mindfulness", fontFamily="Material Symbols Sharp")
-    minimize_sharp = IconData(name="minimize", fontFamily="Material Symbols Sharp")
-    minor_crash_sharp = IconData(name="minor_crash", fontFamily="Material Symbols Sharp")
-    mintmark_sharp = IconData(name="mintmark", fontFamily="Material Symbols Sharp")
-    missed_video_call_sharp = IconData(name="missed_video_call", fontFamily="Material Symbols Sharp")
-    missed_video_call_filled_sharp = IconData(name="missed_video_call_filled", fontFamily="Material Symbols Sharp")
-    missing_controller_sharp = IconData(name="missing_controller", fontFamily="Material Symbols Sharp")
-    mist_sharp = IconData(name="mist", fontFamily="Material Symbols Sharp")
-    mitre_sharp = IconData(name="mitre", fontFamily="Material Symbols Sharp")
-    mixture_med_sharp = IconData(name="mixture_med", fontFamily="Material Symbols Sharp")
-    mms_sharp = IconData(name="mms", fontFamily="Material Symbols Sharp")
-    mobile_friendly_sharp = IconData(name="mobile_friendly", fontFamily="Material Symbols Sharp")
-    mobile_hand_sharp = IconData(name="mobile_hand", fontFamily="Material Symbols Sharp")
-    mobile_hand_left_sharp = IconData(name="mobile_hand_left", fontFamily="Material Symbols Sharp")
-    mobile_hand_left_off_sharp = IconData(name="mobile_hand_left_off", fontFamily="Material Symbols Sharp")
-    mobile_hand_off_sharp = IconData(name="mobile_hand_off", fontFamily="Material Symbols Sharp")
-    mobile_loupe_sharp = IconData(name="mobile_loupe", fontFamily="Material Symbols Sharp")
-    mobile_off_sharp = IconData(name="mobile_off", fontFamily="Material Symbols Sharp")
-    mobile_screen_share_sharp = IconData(name="mobile_screen_share", fontFamily="Material Symbols Sharp")
-    mobile_screensaver_sharp = IconData(name="mobile_screensaver", fontFamily="Material Symbols Sharp")
-    mobile_sound_2_sharp = IconData(name="mobile_sound_2", fontFamily="Material Symbols Sharp")
-    mobile_speaker_sharp = IconData(name="mobile_speaker", fontFamily="Material Symbols Sharp")
-    mobiledata_off_sharp = IconData(name="mobiledata_off", fontFamily="Material Symbols Sharp")
-    mode_sharp = IconData(name="mode", fontFamily="Material Symbols Sharp")
-    mode_comment_sharp = IconData(name="mode_comment", fontFamily="Material Symbols Sharp")
-    mode_cool_sharp = IconData(name="mode_cool", fontFamily="Material Symbols Sharp")
-    mode_cool_off_sharp = IconData(name="mode_cool_off", fontFamily="Material Symbols Sharp")
-    mode_dual_sharp = IconData(name="mode_dual", fontFamily="Material Symbols Sharp")
-    mode_edit_sharp = IconData(name="mode_edit", fontFamily="Material Symbols Sharp")
-    mode_edit_outline_sharp = IconData(name="mode_edit_outline", fontFamily="Material Symbols Sharp")
-    mode_fan_sharp = IconData(name="mode_fan", fontFamily="Material Symbols Sharp")
-    mode_fan_off_sharp = IconData(name="mode_fan_off", fontFamily="Material Symbols Sharp")
-    mode_heat_sharp = IconData(name="mode_heat", fontFamily="Material Symbols Sharp")
-    mode_heat_cool_sharp = IconData(name="mode_heat_cool", fontFamily="Material Symbols Sharp")
-    mode_heat_off_sharp = IconData(name="mode_heat_off", fontFamily="Material Symbols Sharp")
-    mode_night_sharp = IconData(name="mode_night", fontFamily="Material Symbols Sharp")
-    mode_of_travel_sharp = IconData(name="mode_of_travel", fontFamily="Material Symbols Sharp")
-    mode_off_on_sharp = IconData(name="mode_off_on", fontFamily="Material Symbols Sharp")
-    mode_standby_sharp = IconData(name="mode_standby", fontFamily="Material Symbols Sharp")
-    model_training_sharp = IconData(name="model_training", fontFamily="Material Symbols Sharp")
-    modeling_sharp = IconData(name="modeling", fontFamily="Material Symbols Sharp")
-    monetization_on_sharp = IconData(name="monetization_on", fontFamily="Material Symbols Sharp")
-    money_sharp = IconData(name="money", fontFamily="Material Symbols Sharp")
-    money_bag_sharp = IconData(name="money_bag", fontFamily="Material Symbols Sharp")
-    money_off_sharp = IconData(name="money_off", fontFamily="Material Symbols Sharp")
-    money_off_csred_sharp = IconData(name="money_off_csred", fontFamily="Material Symbols Sharp")
-    monitor_sharp = IconData(name="monitor", fontFamily="Material Symbols Sharp")
-    monitor_heart_sharp = IconData(name="monitor_heart", fontFamily="Material Symbols Sharp")
-    monitor_weight_sharp = IconData(name="monitor_weight", fontFamily="Material Symbols Sharp")
-    monitor_weight_gain_sharp = IconData(name="monitor_weight_gain", fontFamily="Material Symbols Sharp")
-    monitor_weight_loss_sharp = IconData(name="monitor_weight_loss", fontFamily="Material Symbols Sharp")
-    monitoring_sharp = IconData(name="monitoring", fontFamily="Material Symbols Sharp")
-    monochrome_photos_sharp = IconData(name="monochrome_photos", fontFamily="Material Symbols Sharp")
-    monorail_sharp = IconData(name="monorail", fontFamily="Material Symbols Sharp")
-    mood_sharp = IconData(name="mood", fontFamily="Material Symbols Sharp")
-    mood_bad_sharp = IconData(name="mood_bad", fontFamily="Material Symbols Sharp")
-    moon_stars_sharp = IconData(name="moon_stars", fontFamily="Material Symbols Sharp")
-    mop_sharp = IconData(name="mop", fontFamily="Material Symbols Sharp")
-    moped_sharp = IconData(name="moped", fontFamily="Material Symbols Sharp")
-    more_sharp = IconData(name="more", fontFamily="Material Symbols Sharp")
-    more_down_sharp = IconData(name="more_down", fontFamily="Material Symbols Sharp")
-    more_horiz_sharp = IconData(name="more_horiz", fontFamily="Material Symbols Sharp")
-    more_time_sharp = IconData(name="more_time", fontFamily="Material Symbols Sharp")
-    more_up_sharp = IconData(name="more_up", fontFamily="Material Symbols Sharp")
-    more_vert_sharp = IconData(name="more_vert", fontFamily="Material Symbols Sharp")
-    mosque_sharp = IconData(name="mosque", fontFamily="Material Symbols Sharp")
-    motion_blur_sharp = IconData(name="motion_blur", fontFamily="Material Symbols Sharp")
-    motion_mode_sharp = IconData(name="motion_mode", fontFamily="Material Symbols Sharp")
-    motion_photos_auto_sharp = IconData(name="motion_photos_auto", fontFamily="Material Symbols Sharp")
-    motion_photos_off_sharp = IconData(name="motion_photos_off", fontFamily="Material Symbols Sharp")
-    motion_photos_on_sharp = IconData(name="motion_photos_on", fontFamily="Material Symbols Sharp")
-    motion_photos_pause_sharp = IconData(name="motion_photos_pause", fontFamily="Material Symbols Sharp")
-    motion_photos_paused_sharp = IconData(name="motion_photos_paused", fontFamily="Material Symbols Sharp")
-    motion_play_sharp = IconData(name="motion_play", fontFamily="Material Symbols Sharp")
-    motion_sensor_active_sharp = IconData(name="motion_sensor_active", fontFamily="Material Symbols Sharp")
-    motion_sensor_alert_sharp = IconData(name="motion_sensor_alert", fontFamily="Material Symbols Sharp")
-    motion_sensor_idle_sharp = IconData(name="motion_sensor_idle", fontFamily="Material Symbols Sharp")
-    motion_sensor_urgent_sharp = IconData(name="motion_sensor_urgent", fontFamily="Material Symbols Sharp")
-    motorcycle_sharp = IconData(name="motorcycle", fontFamily="Material Symbols Sharp")
-    mountain_flag_sharp = IconData(name="mountain_flag", fontFamily="Material Symbols Sharp")
-    mouse_sharp = IconData(name="mouse", fontFamily="Material Symbols Sharp")
-    mouse_lock_sharp = IconData(name="mouse_lock", fontFamily="Material Symbols Sharp")
-    mouse_lock_off_sharp = IconData(name="mouse_lock_off", fontFamily="Material Symbols Sharp")
-    move_sharp = IconData(name="move", fontFamily="Material Symbols Sharp")
-    move_down_sharp = IconData(name="move_down", fontFamily="Material Symbols Sharp")
-    move_group_sharp = IconData(name="move_group", fontFamily="Material Symbols Sharp")
-    move_item_sharp = IconData(name="move_item", fontFamily="Material Symbols Sharp")
-    move_location_sharp = IconData(name="move_location", fontFamily="Material Symbols Sharp")
-    move_selection_down_sharp = IconData(name="move_selection_down", fontFamily="Material Symbols Sharp")
-    move_selection_left_sharp = IconData(name="move_selection_left", fontFamily="Material Symbols Sharp")
-    move_selection_right_sharp = IconData(name="move_selection_right", fontFamily="Material Symbols Sharp")
-    move_selection_up_sharp = IconData(name="move_selection_up", fontFamily="Material Symbols Sharp")
-    move_to_inbox_sharp = IconData(name="move_to_inbox", fontFamily="Material Symbols Sharp")
-    move_up_sharp = IconData(name="move_up", fontFamily="Material Symbols Sharp")
-    moved_location_sharp = IconData(name="moved_location", fontFamily="Material Symbols Sharp")
-    movie_sharp = IconData(name="movie", fontFamily="Material Symbols Sharp")
-    movie_creation_sharp = IconData(name="movie_creation", fontFamily="Material Symbols Sharp")
-    movie_edit_sharp = IconData(name="movie_edit", fontFamily="Material Symbols Sharp")
-    movie_filter_sharp = IconData(name="movie_filter", fontFamily="Material Symbols Sharp")
-    movie_info_sharp = IconData(name="movie_info", fontFamily="Material Symbols Sharp")
-    movie_off_sharp = IconData(name="movie_off", fontFamily="Material Symbols Sharp")
-    moving_sharp = IconData(name="moving", fontFamily="Material Symbols Sharp")
-    moving_beds_sharp = IconData(name="moving_beds", fontFamily="Material Symbols Sharp")
-    moving_ministry_sharp = IconData(name="moving_ministry", fontFamily="Material Symbols Sharp")
-    mp_sharp = IconData(name="mp", fontFamily="Material Symbols Sharp")
-    multicooker_sharp = IconData(name="multicooker", fontFamily="Material Symbols Sharp")
-    multiline_chart_sharp = IconData(name="multiline_chart", fontFamily="Material Symbols Sharp")
-    multimodal_hand_eye_sharp = IconData(name="multimodal_hand_eye", fontFamily="Material Symbols Sharp")
-    multiple_airports_sharp = IconData(name="multiple_airports", fontFamily="Material Symbols Sharp")
-    multiple_stop_sharp = IconData(name="multiple_stop", fontFamily="Material Symbols Sharp")
-    museum_sharp = IconData(name="museum", fontFamily="Material Symbols Sharp")
-    music_cast_sharp = IconData(name="music_cast", fontFamily="Material Symbols Sharp")
-    music_note_sharp = IconData(name="music_note", fontFamily="Material Symbols Sharp")
-    music_note_add_sharp = IconData(name="music_note_add", fontFamily="Material Symbols Sharp")
-    music_off_sharp = IconData(name="music_off", fontFamily="Material Symbols Sharp")
-    music_video_sharp = IconData(name="music_video", fontFamily="Material Symbols Sharp")
-    my_location_sharp = IconData(name="my_location", fontFamily="Material Symbols Sharp")
-    mystery_sharp = IconData(name="mystery", fontFamily="Material Symbols Sharp")
-    nat_sharp = IconData(name="nat", fontFamily="Material Symbols Sharp")
-    nature_sharp = IconData(name="nature", fontFamily="Material Symbols Sharp")
-    nature_people_sharp = IconData(name="nature_people", fontFamily="Material Symbols Sharp")
-    navigate_before_sharp = IconData(name="navigate_before", fontFamily="Material Symbols Sharp")
-    navigate_next_sharp = IconData(name="navigate_next", fontFamily="Material Symbols Sharp")
-    navigation_sharp = IconData(name="navigation", fontFamily="Material Symbols Sharp")
-    near_me_sharp = IconData(name="near_me", fontFamily="Material Symbols Sharp")
-    near_me_disabled_sharp = IconData(name="near_me_disabled", fontFamily="Material Symbols Sharp")
-    nearby_sharp = IconData(name="nearby", fontFamily="Material Symbols Sharp")
-    nearby_error_sharp = IconData(name="nearby_error", fontFamily="Material Symbols Sharp")
-    nearby_off_sharp = IconData(name="nearby_off", fontFamily="Material Symbols Sharp")
-    nephrology_sharp = IconData(name="nephrology", fontFamily="Material Symbols Sharp")
-    nest_audio_sharp = IconData(name="nest_audio", fontFamily="Material Symbols Sharp")
-    nest_cam_floodlight_sharp = IconData(name="nest_cam_floodlight", fontFamily="Material Symbols Sharp")
-    nest_cam_indoor_sharp = IconData(name="nest_cam_indoor", fontFamily="Material Symbols Sharp")
-    nest_cam_iq_sharp = IconData(name="nest_cam_iq", fontFamily="Material Symbols Sharp")
-    nest_cam_iq_outdoor_sharp = IconData(name="nest_cam_iq_outdoor", fontFamily="Material Symbols Sharp")
-    nest_cam_magnet_mount_sharp = IconData(name="nest_cam_magnet_mount", fontFamily="Material Symbols Sharp")
-    nest_cam_outdoor_sharp = IconData(name="nest_cam_outdoor", fontFamily="Material Symbols Sharp")
-    nest_cam_stand_sharp = IconData(name="nest_cam_stand", fontFamily="Material Symbols Sharp")
-    nest_cam_wall_mount_sharp = IconData(name="nest_cam_wall_mount", fontFamily="Material Symbols Sharp")
-    nest_cam_wired_stand_sharp = IconData(name="nest_cam_wired_stand", fontFamily="Material Symbols Sharp")
-    nest_clock_farsight_analog_sharp = IconData(name="nest_clock_farsight_analog", fontFamily="Material Symbols Sharp")
-    nest_clock_farsight_digital_sharp = IconData(name="nest_clock_farsight_digital", fontFamily="Material Symbols Sharp")
-    nest_connect_sharp = IconData(name="nest_connect", fontFamily="Material Symbols Sharp")
-    nest_detect_sharp = IconData(name="nest_detect", fontFamily="Material Symbols Sharp")
-    nest_display_sharp = IconData(name="nest_display", fontFamily="Material Symbols Sharp")
-    nest_display_max_sharp = IconData(name="nest_display_max", fontFamily="Material Symbols Sharp")
-    nest_doorbell_visitor_sharp = IconData(name="nest_doorbell_visitor", fontFamily="Material Symbols Sharp")
-    nest_eco_leaf_sharp = IconData(name="nest_eco_leaf", fontFamily="Material Symbols Sharp")
-    nest_farsight_weather_sharp = IconData(name="nest_farsight_weather", fontFamily="Material Symbols Sharp")
-    nest_found_savings_sharp = IconData(name="nest_found_savings", fontFamily="Material Symbols Sharp")
-    nest_gale_wifi_sharp = IconData(name="nest_gale_wifi", fontFamily="Material Symbols Sharp")
-    nest_heat_link_e_sharp = IconData(name="nest_heat_link_e", fontFamily="Material Symbols Sharp")
-    nest_heat_link_gen_3_sharp = IconData(name="nest_heat_link_gen_3", fontFamily="Material Symbols Sharp")
-    nest_hello_doorbell_sharp = IconData(name="nest_hello_doorbell", fontFamily="Material Symbols Sharp")
-    nest_locator_tag_sharp = IconData(name="nest_locator_tag", fontFamily="Material Symbols Sharp")
-    nest_mini_sharp = IconData(name="nest_mini", fontFamily="Material Symbols Sharp")
-    nest_multi_room_sharp = IconData(name="nest_multi_room", fontFamily="Material Symbols Sharp")
-    nest_protect_sharp = IconData(name="nest_protect", fontFamily="Material Symbols Sharp")
-    nest_remote_sharp = IconData(name="nest_remote", fontFamily="Material Symbols Sharp")
-    nest_remote_comfort_sensor_sharp = IconData(name="nest_remote_comfort_sensor", fontFamily="Material Symbols Sharp")
-    nest_secure_alarm_sharp = IconData(name="nest_secure_alarm", fontFamily="Material Symbols Sharp")
-    nest_sunblock_sharp = IconData(name="nest_sunblock", fontFamily="Material Symbols Sharp")
-    nest_tag_sharp = IconData(name="nest_tag", fontFamily="Material Symbols Sharp")
-    nest_thermostat_sharp = IconData(name="nest_thermostat", fontFamily="Material Symbols Sharp")
-    nest_thermostat_e_eu_sharp = IconData(name="nest_thermostat_e_eu", fontFamily="Material Symbols Sharp")
-    nest_thermostat_gen_3_sharp = IconData(name="nest_thermostat_gen_3", fontFamily="Material Symbols Sharp")
-    nest_thermostat_sensor_sharp = IconData(name="nest_thermostat_sensor", fontFamily="Material Symbols Sharp")
-    nest_thermostat_sensor_eu_sharp = IconData(name="nest_thermostat_sensor_eu", fontFamily="Material Symbols Sharp")
-    nest_thermostat_zirconium_eu_sharp = IconData(name="nest_thermostat_zirconium_eu", fontFamily="Material Symbols Sharp")
-    nest_true_radiant_sharp = IconData(name="nest_true_radiant", fontFamily="Material Symbols Sharp")
-    nest_wake_on_approach_sharp = IconData(name="nest_wake_on_approach", fontFamily="Material Symbols Sharp")
-    nest_wake_on_press_sharp = IconData(name="nest_wake_on_press", fontFamily="Material Symbols Sharp")
-    nest_wifi_gale_sharp = IconData(name="nest_wifi_gale", fontFamily="Material Symbols Sharp")
-    nest_wifi_mistral_sharp = IconData(name="nest_wifi_mistral", fontFamily="Material Symbols Sharp")
-    nest_wifi_point_sharp = IconData(name="nest_wifi_point", fontFamily="Material Symbols Sharp")
-    nest_wifi_point_vento_sharp = IconData(name="nest_wifi_point_vento", fontFamily="Material Symbols Sharp")
-    nest_wifi_pro_sharp = IconData(name="nest_wifi_pro", fontFamily="Material Symbols Sharp")
-    nest_wifi_pro_2_sharp = IconData(name="nest_wifi_pro_2", fontFamily="Material Symbols Sharp")
-    nest_wifi_router_sharp = IconData(name="nest_wifi_router", fontFamily="Material Symbols Sharp")
-    network_cell_sharp = IconData(name="network_cell", fontFamily="Material Symbols Sharp")
-    network_check_sharp = IconData(name="network_check", fontFamily="Material Symbols Sharp")
-    network_intel_node_sharp = IconData(name="network_intel_node", fontFamily="Material Symbols Sharp")
-    network_intelligence_sharp = IconData(name="network_intelligence", fontFamily="Material Symbols Sharp")
-    network_intelligence_history_sharp = IconData(name="network_intelligence_history", fontFamily="Material Symbols Sharp")
-    network_intelligence_update_sharp = IconData(name="network_intelligence_update", fontFamily="Material Symbols Sharp")
-    network_locked_sharp = IconData(name="network_locked", fontFamily="Material Symbols Sharp")
-    network_manage_sharp = IconData(name="network_manage", fontFamily="Material Symbols Sharp")
-    network_node_sharp = IconData(name="network_node", fontFamily="Material Symbols Sharp")
-    network_ping_sharp = IconData(name="network_ping", fontFamily="Material Symbols Sharp")
-    network_wifi_sharp = IconData(name="network_wifi", fontFamily="Material Symbols Sharp")
-    network_wifi_1_bar_sharp = IconData(name="network_wifi_1_bar", fontFamily="Material Symbols Sharp")
-    network_wifi_1_bar_locked_sharp = IconData(name="network_wifi_1_bar_locked", fontFamily="Material Symbols Sharp")
-    network_wifi_2_bar_sharp = IconData(name="network_wifi_2_bar", fontFamily="Material Symbols Sharp")
-    network_wifi_2_bar_locked_sharp = IconData(name="network_wifi_2_bar_locked", fontFamily="Material Symbols Sharp")
-    network_wifi_3_bar_sharp = IconData(name="network_wifi_3_bar", fontFamily="Material Symbols Sharp")
-    network_wifi_3_bar_locked_sharp = IconData(name="network_wifi_3_bar_locked", fontFamily="Material Symbols Sharp")
-    network_wifi_locked_sharp = IconData(name="network_wifi_locked", fontFamily="Material Symbols Sharp")
-    neurology_sharp = IconData(name="neurology", fontFamily="Material Symbols Sharp")
-    new_label_sharp = IconData(name="new_label", fontFamily="Material Symbols Sharp")
-    new_releases_sharp = IconData(name="new_releases", fontFamily="Material Symbols Sharp")
-    new_window_sharp = IconData(name="new_window", fontFamily="Material Symbols Sharp")
-    news_sharp = IconData(name="news", fontFamily="Material Symbols Sharp")
-    newsmode_sharp = IconData(name="newsmode", fontFamily="Material Symbols Sharp")
-    newspaper_sharp = IconData(name="newspaper", fontFamily="Material Symbols Sharp")
-    newsstand_sharp = IconData(name="newsstand", fontFamily="Material Symbols Sharp")
-    next_plan_sharp = IconData(name="next_plan", fontFamily="Material Symbols Sharp")
-    next_week_sharp = IconData(name="next_week", fontFamily="Material Symbols Sharp")
-    nfc_sharp = IconData(name="nfc", fontFamily="Material Symbols Sharp")
-    nfc_off_sharp = IconData(name="nfc_off", fontFamily="Material Symbols Sharp")
-    night_shelter_sharp = IconData(name="night_shelter", fontFamily="Material Symbols Sharp")
-    night_sight_auto_sharp = IconData(name="night_sight_auto", fontFamily="Material Symbols Sharp")
-    night_sight_auto_off_sharp = IconData(name="night_sight_auto_off", fontFamily="Material Symbols Sharp")
-    night_sight_max_sharp = IconData(name="night_sight_max", fontFamily="Material Symbols Sharp")
-    nightlife_sharp = IconData(name="nightlife", fontFamily="Material Symbols Sharp")
-    nightlight_sharp = IconData(name="nightlight", fontFamily="Material Symbols Sharp")
-    nightlight_round_sharp = IconData(name="nightlight_round", fontFamily="Material Symbols Sharp")
-    nights_stay_sharp = IconData(name="nights_stay", fontFamily="Material Symbols Sharp")
-    no_accounts_sharp = IconData(name="no_accounts", fontFamily="Material Symbols Sharp")
-    no_adult_content_sharp = IconData(name="no_adult_content", fontFamily="Material Symbols Sharp")
-    no_backpack_sharp = IconData(name="no_backpack", fontFamily="Material Symbols Sharp")
-    no_crash_sharp = IconData(name="no_crash", fontFamily="Material Symbols Sharp")
-    no_drinks_sharp = IconData(name="no_drinks", fontFamily="Material Symbols Sharp")
-    no_encryption_sharp = IconData(name="no_encryption", fontFamily="Material Symbols Sharp")
-    no_encryption_gmailerrorred_sharp = IconData(name="no_encryption_gmailerrorred", fontFamily="Material Symbols Sharp")
-    no_flash_sharp = IconData(name="no_flash", fontFamily="Material Symbols Sharp")
-    no_food_sharp = IconData(name="no_food", fontFamily="Material Symbols Sharp")
-    no_luggage_sharp = IconData(name="no_luggage", fontFamily="Material Symbols Sharp")
-    no_meals_sharp = IconData(name="no_meals", fontFamily="Material Symbols Sharp")
-    no_meeting_room_sharp = IconData(name="no_meeting_room", fontFamily="Material Symbols Sharp")
-    no_photography_sharp = IconData(name="no_photography", fontFamily="Material Symbols Sharp")
-    no_sim_sharp = IconData(name="no_sim", fontFamily="Material Symbols Sharp")
-    no_sound_sharp = IconData(name="no_sound", fontFamily="Material Symbols Sharp")
-    no_stroller_sharp = IconData(name="no_stroller", fontFamily="Material Symbols Sharp")
-    no_transfer_sharp = IconData(name="no_transfer", fontFamily="Material Symbols Sharp")
-    noise_aware_sharp = IconData(name="noise_aware", fontFamily="Material Symbols Sharp")
-    noise_control_off_sharp = IconData(name="noise_control_off", fontFamily="Material Symbols Sharp")
-    noise_control_on_sharp = IconData(name="noise_control_on", fontFamily="Material Symbols Sharp")
-    nordic_walking_sharp = IconData(name="nordic_walking", fontFamily="Material Symbols Sharp")
-    north_sharp = IconData(name="north", fontFamily="Material Symbols Sharp")
-    north_east_sharp = IconData(name="north_east", fontFamily="Material Symbols Sharp")
-    north_west_sharp = IconData(name="north_west", fontFamily="Material Symbols Sharp")
-    not_accessible_sharp = IconData(name="not_accessible", fontFamily="Material Symbols Sharp")
-    not_accessible_forward_sharp = IconData(name="not_accessible_forward", fontFamily="Material Symbols Sharp")
-    not_interested_sharp = IconData(name="not_interested", fontFamily="Material Symbols Sharp")
-    not_listed_location_sharp = IconData(name="not_listed_location", fontFamily="Material Symbols Sharp")
-    not_started_sharp = IconData(name="not_started", fontFamily="Material Symbols Sharp")
-    note_sharp = IconData(name="note", fontFamily="Material Symbols Sharp")
-    note_add_sharp = IconData(name="note_add", fontFamily="Material Symbols Sharp")
-    note_alt_sharp = IconData(name="note_alt", fontFamily="Material Symbols Sharp")
-    note_stack_sharp = IconData(name="note_stack", fontFamily="Material Symbols Sharp")
-    note_stack_add_sharp = IconData(name="note_stack_add", fontFamily="Material Symbols Sharp")
-    notes_sharp = IconData(name="notes", fontFamily="Material Symbols Sharp")
-    notification_add_sharp = IconData(name="notification_add", fontFamily="Material Symbols Sharp")
-    notification_important_sharp = IconData(name="notification_important", fontFamily="Material Symbols Sharp")
-    notification_multiple_sharp = IconData(name="notification_multiple", fontFamily="Material Symbols Sharp")
-    notification_settings_sharp = IconData(name="notification_settings", fontFamily="Material Symbols Sharp")
-    notification_sound_sharp = IconData(name="notification_sound", fontFamily="Material Symbols Sharp")
-    notifications_sharp = IconData(name="notifications", fontFamily="Material Symbols Sharp")
-    notifications_active_sharp = IconData(name="notifications_active", fontFamily="Material Symbols Sharp")
-    notifications_none_sharp = IconData(name="notifications_none", fontFamily="Material Symbols Sharp")
-    notifications_off_sharp = IconData(name="notifications_off", fontFamily="Material Symbols Sharp")
-    notifications_paused_sharp = IconData(name="notifications_paused", fontFamily="Material Symbols Sharp")
-    notifications_unread_sharp = IconData(name="notifications_unread", fontFamily="Material Symbols Sharp")
-    numbers_sharp = IconData(name="numbers", fontFamily="Material Symbols Sharp")
-    nutrition_sharp = IconData(name="nutrition", fontFamily="Material Symbols Sharp")
-    ods_sharp = IconData(name="ods", fontFamily="Material Symbols Sharp")
-    odt_sharp = IconData(name="odt", fontFamily="Material Symbols Sharp")
-    offline_bolt_sharp = IconData(name="offline_bolt", fontFamily="Material Symbols Sharp")
-    offline_pin_sharp = IconData(name="offline_pin", fontFamily="Material Symbols Sharp")
-    offline_pin_off_sharp = IconData(name="offline_pin_off", fontFamily="Material Symbols Sharp")
-    offline_share_sharp = IconData(name="offline_share", fontFamily="Material Symbols Sharp")
-    oil_barrel_sharp = IconData(name="oil_barrel", fontFamily="Material Symbols Sharp")
-    on_device_training_sharp = IconData(name="on_device_training", fontFamily="Material Symbols Sharp")
-    on_hub_device_sharp = IconData(name="on_hub_device", fontFamily="Material Symbols Sharp")
-    oncology_sharp = IconData(name="oncology", fontFamily="Material Symbols Sharp")
-    ondemand_video_sharp = IconData(name="ondemand_video", fontFamily="Material Symbols Sharp")
-    online_prediction_sharp = IconData(name="online_prediction", fontFamily="Material Symbols Sharp")
-    onsen_sharp = IconData(name="onsen", fontFamily="Material Symbols Sharp")
-    opacity_sharp = IconData(name="opacity", fontFamily="Material Symbols Sharp")
-    open_in_browser_sharp = IconData(name="open_in_browser", fontFamily="Material Symbols Sharp")
-    open_in_full_sharp = IconData(name="open_in_full", fontFamily="Material Symbols Sharp")
-    open_in_new_sharp = IconData(name="open_in_new", fontFamily="Material Symbols Sharp")
-    open_in_new_down_sharp = IconData(name="open_in_new_down", fontFamily="Material Symbols Sharp")
-    open_in_new_off_sharp = IconData(name="open_in_new_off", fontFamily="Material Symbols Sharp")
-    open_in_phone_sharp = IconData(name="open_in_phone", fontFamily="Material Symbols Sharp")
-    open_jam_sharp = IconData(name="open_jam", fontFamily="Material Symbols Sharp")
-    open_run_sharp = IconData(name="open_run", fontFamily="Material Symbols Sharp")
-    open_with_sharp = IconData(name="open_with", fontFamily="Material Symbols Sharp")
-    ophthalmology_sharp = IconData(name="ophthalmology", fontFamily="Material Symbols Sharp")
-    oral_disease_sharp = IconData(name="oral_disease", fontFamily="Material Symbols Sharp")
-    orbit_sharp = IconData(name="orbit", fontFamily="Material Symbols Sharp")
-    order_approve_sharp = IconData(name="order_approve", fontFamily="Material Symbols Sharp")
-    order_play_sharp = IconData(name="order_play", fontFamily="Material Symbols Sharp")
-    orders_sharp = IconData(name="orders", fontFamily="Material Symbols Sharp")
-    orthopedics_sharp = IconData(name="orthopedics", fontFamily="Material Symbols Sharp")
-    other_admission_sharp = IconData(name="other_admission", fontFamily="Material Symbols Sharp")
-    other_houses_sharp = IconData(name="other_houses", fontFamily="Material Symbols Sharp")
-    outbound_sharp = IconData(name="outbound", fontFamily="Material Symbols Sharp")
-    outbox_sharp = IconData(name="outbox", fontFamily="Material Symbols Sharp")
-    outbox_alt_sharp = IconData(name="outbox_alt", fontFamily="Material Symbols Sharp")
-    outdoor_garden_sharp = IconData(name="outdoor_garden", fontFamily="Material Symbols Sharp")
-    outdoor_grill_sharp = IconData(name="outdoor_grill", fontFamily="Material Symbols Sharp")
-    outgoing_mail_sharp = IconData(name="outgoing_mail", fontFamily="Material Symbols Sharp")
-    outlet_sharp = IconData(name="outlet", fontFamily="Material Symbols Sharp")
-    outlined_flag_sharp = IconData(name="outlined_flag", fontFamily="Material Symbols Sharp")
-    outpatient_sharp = IconData(name="outpatient", fontFamily="Material Symbols Sharp")
-    outpatient_med_sharp = IconData(name="outpatient_med", fontFamily="Material Symbols Sharp")
-    output_sharp = IconData(name="output", fontFamily="Material Symbols Sharp")
-    output_circle_sharp = IconData(name="output_circle", fontFamily="Material Symbols Sharp")
-    oven_sharp = IconData(name="oven", fontFamily="Material Symbols Sharp")
-    oven_gen_sharp = IconData(name="oven_gen", fontFamily="Material Symbols Sharp")
-    overview_sharp = IconData(name="overview", fontFamily="Material Symbols Sharp")
-    overview_key_sharp = IconData(name="overview_key", fontFamily="Material Symbols Sharp")
-    owl_sharp = IconData(name="owl", fontFamily="Material Symbols Sharp")
-    oxygen_saturation_sharp = IconData(name="oxygen_saturation", fontFamily="Material Symbols Sharp")
-    p2p_sharp = IconData(name="p2p", fontFamily="Material Symbols Sharp")
-    pace_sharp = IconData(name="pace", fontFamily="Material Symbols Sharp")
-    pacemaker_sharp = IconData(name="pacemaker", fontFamily="Material Symbols Sharp")
-    package_sharp = IconData(name="package", fontFamily="Material Symbols Sharp")
-    package_2_sharp = IconData(name="package_2", fontFamily="Material Symbols Sharp")
-    padding_sharp = IconData(name="padding", fontFamily="Material Symbols Sharp")
-    page_control_sharp = IconData(name="page_control", fontFamily="Material Symbols Sharp")
-    page_footer_sharp = IconData(name="page_footer", fontFamily="Material Symbols Sharp")
-    page_header_sharp = IconData(name="page_header", fontFamily="Material Symbols Sharp")
-    page_info_sharp = IconData(name="page_info", fontFamily="Material Symbols Sharp")
-    pageless_sharp = IconData(name="pageless", fontFamily="Material Symbols Sharp")
-    pages_sharp = IconData(name="pages", fontFamily="Material Symbols Sharp")
-    pageview_sharp = IconData(name="pageview", fontFamily="Material Symbols Sharp")
-    paid_sharp = IconData(name="paid", fontFamily="Material Symbols Sharp")
-    palette_sharp = IconData(name="palette", fontFamily="Material Symbols Sharp")
-    pallet_sharp = IconData(name="pallet", fontFamily="Material Symbols Sharp")
-    pan_tool_sharp = IconData(name="pan_tool", fontFamily="Material Symbols Sharp")
-    pan_tool_alt_sharp = IconData(name="pan_tool_alt", fontFamily="Material Symbols Sharp")
-    pan_zoom_sharp = IconData(name="pan_zoom", fontFamily="Material Symbols Sharp")
-    panorama_sharp = IconData(name="panorama", fontFamily="Material Symbols Sharp")
-    panorama_fish_eye_sharp = IconData(name="panorama_fish_eye", fontFamily="Material Symbols Sharp")
-    panorama_horizontal_sharp = IconData(name="panorama_horizontal", fontFamily="Material Symbols Sharp")
-    panorama_photosphere_sharp = IconData(name="panorama_photosphere", fontFamily="Material Symbols Sharp")
-    panorama_vertical_sharp = IconData(name="panorama_vertical", fontFamily="Material Symbols Sharp")
-    panorama_wide_angle_sharp = IconData(name="panorama_wide_angle", fontFamily="Material Symbols Sharp")
-    paragliding_sharp = IconData(name="paragliding", fontFamily="Material Symbols Sharp")
-    park_sharp = IconData(name="park", fontFamily="Material Symbols Sharp")
-    partly_cloudy_day_sharp = IconData(name="partly_cloudy_day", fontFamily="Material Symbols Sharp")
-    partly_cloudy_night_sharp = IconData(name="partly_cloudy_night", fontFamily="Material Symbols Sharp")
-    partner_exchange_sharp = IconData(name="partner_exchange", fontFamily="Material Symbols Sharp")
-    partner_reports_sharp = IconData(name="partner_reports", fontFamily="Material Symbols Sharp")
-    party_mode_sharp = IconData(name="party_mode", fontFamily="Material Symbols Sharp")
-    passkey_sharp = IconData(name="passkey", fontFamily="Material Symbols Sharp")
-    password_sharp = IconData(name="password", fontFamily="Material Symbols Sharp")
-    password_2_sharp = IconData(name="password_2", fontFamily="Material Symbols Sharp")
-    password_2_off_sharp = IconData(name="password_2_off", fontFamily="Material Symbols Sharp")
-    patient_list_sharp = IconData(name="patient_list", fontFamily="Material Symbols Sharp")
-    pattern_sharp = IconData(name="pattern", fontFamily="Material Symbols Sharp")
-    pause_sharp = IconData(name="pause", fontFamily="Material Symbols Sharp")
-    pause_circle_sharp = IconData(name="pause_circle", fontFamily="Material Symbols Sharp")
-    pause_circle_filled_sharp = IconData(name="pause_circle_filled", fontFamily="Material Symbols Sharp")
-    pause_circle_outline_sharp = IconData(name="pause_circle_outline", fontFamily="Material Symbols Sharp")
-    pause_presentation_sharp = IconData(name="pause_presentation", fontFamily="Material Symbols Sharp")
-    payment_sharp = IconData(name="payment", fontFamily="Material Symbols Sharp")
-    payments_sharp = IconData(name="payments", fontFamily="Material Symbols Sharp")
-    pedal_bike_sharp = IconData(name="pedal_bike", fontFamily="Material Symbols Sharp")
-    pediatrics_sharp = IconData(name="pediatrics", fontFamily="Material Symbols Sharp")
-    pen_size_1_sharp = IconData(name="pen_size_1", fontFamily="Material Symbols Sharp")
-    pen_size_2_sharp = IconData(name="pen_size_2", fontFamily="Material Symbols Sharp")
-    pen_size_3_sharp = IconData(name="pen_size_3", fontFamily="Material Symbols Sharp")
-    pen_size_4_sharp = IconData(name="pen_size_4", fontFamily="Material Symbols Sharp")
-    pen_size_5_sharp = IconData(name="pen_size_5", fontFamily="Material Symbols Sharp")
-    pending_sharp = IconData(name="pending", fontFamily="Material Symbols Sharp")
-    pending_actions_sharp = IconData(name="pending_actions", fontFamily="Material Symbols Sharp")
-    pentagon_sharp = IconData(name="pentagon", fontFamily="Material Symbols Sharp")
-    people_sharp = IconData(name="people", fontFamily="Material Symbols Sharp")
-    people_alt_sharp = IconData(name="people_alt", fontFamily="Material Symbols Sharp")
-    people_outline_sharp = IconData(name="people_outline", fontFamily="Material Symbols Sharp")
-    percent_sharp = IconData(name="percent", fontFamily="Material Symbols Sharp")
-    performance_max_sharp = IconData(name="performance_max", fontFamily="Material Symbols Sharp")
-    pergola_sharp = IconData(name="pergola", fontFamily="Material Symbols Sharp")
-    perm_camera_mic_sharp = IconData(name="perm_camera_mic", fontFamily="Material Symbols Sharp")
-    perm_contact_calendar_sharp = IconData(name="perm_contact_calendar", fontFamily="Material Symbols Sharp")
-    perm_data_setting_sharp = IconData(name="perm_data_setting", fontFamily="Material Symbols Sharp")
-    perm_device_information_sharp = IconData(name="perm_device_information", fontFamily="Material Symbols Sharp")
-    perm_identity_sharp = IconData(name="perm_identity", fontFamily="Material Symbols Sharp")
-    perm_media_sharp = IconData(name="perm_media", fontFamily="Material Symbols Sharp")
-    perm_phone_msg_sharp = IconData(name="perm_phone_msg", fontFamily="Material Symbols Sharp")
-    perm_scan_wifi_sharp = IconData(name="perm_scan_wifi", fontFamily="Material Symbols Sharp")
-    person_sharp = IconData(name="person", fontFamily="Material Symbols Sharp")
-    person_2_sharp = IconData(name="person_2", fontFamily="Material Symbols Sharp")
-    person_3_sharp = IconData(name="person_3", fontFamily="Material Symbols Sharp")
-    person_4_sharp = IconData(name="person_4", fontFamily="Material Symbols Sharp")
-    person_add_sharp = IconData(name="person_add", fontFamily="Material Symbols Sharp")
-    person_add_alt_sharp = IconData(name="person_add_alt", fontFamily="Material Symbols Sharp")
-    person_add_disabled_sharp = IconData(name="person_add_disabled", fontFamily="Material Symbols Sharp")
-    person_alert_sharp = IconData(name="person_alert", fontFamily="Material Symbols Sharp")
-    person_apron_sharp = IconData(name="person_apron", fontFamily="Material Symbols Sharp")
-    person_book_sharp = IconData(name="person_book", fontFamily="Material Symbols Sharp")
-    person_cancel_sharp = IconData(name="person_cancel", fontFamily="Material Symbols Sharp")
-    person_celebrate_sharp = IconData(name="person_celebrate", fontFamily="Material Symbols Sharp")
-    person_check_sharp = IconData(name="person_check", fontFamily="Material Symbols Sharp")
-    person_edit_sharp = IconData(name="person_edit", fontFamily="Material Symbols Sharp")
-    person_filled_sharp = IconData(name="person_filled", fontFamily="Material Symbols Sharp")
-    person_off_sharp = IconData(name="person_off", fontFamily="Material Symbols Sharp")
-    person_outline_sharp = IconData(name="person_outline", fontFamily="Material Symbols Sharp")
-    person_pin_sharp = IconData(name="person_pin", fontFamily="Material Symbols Sharp")
-    person_pin_circle_sharp = IconData(name="person_pin_circle", fontFamily="Material Symbols Sharp")
-    person_play_sharp = IconData(name="person_play", fontFamily="Material Symbols Sharp")
-    person_raised_hand_sharp = IconData(name="person_raised_hand", fontFamily="Material Symbols Sharp")
-    person_remove_sharp = IconData(name="person_remove", fontFamily="Material Symbols Sharp")
-    person_search_sharp = IconData(name="person_search", fontFamily="Material Symbols Sharp")
-    person_shield_sharp = IconData(name="person_shield", fontFamily="Material Symbols Sharp")
-    personal_bag_sharp = IconData(name="personal_bag", fontFamily="Material Symbols Sharp")
-    personal_bag_off_sharp = IconData(name="personal_bag_off", fontFamily="Material Symbols Sharp")
-    personal_bag_question_sharp = IconData(name="personal_bag_question", fontFamily="Material Symbols Sharp")
-    personal_injury_sharp = IconData(name="personal_injury", fontFamily="Material Symbols Sharp")
-    personal_places_sharp = IconData(name="personal_places", fontFamily="Material Symbols Sharp")
-    personal_video_sharp = IconData(name="personal_video", fontFamily="Material Symbols Sharp")
-    pest_control_sharp = IconData(name="pest_control", fontFamily="Material Symbols Sharp")
-    pest_control_rodent_sharp = IconData(name="pest_control_rodent", fontFamily="Material Symbols Sharp")
-    pet_supplies_sharp = IconData(name="pet_supplies", fontFamily="Material Symbols Sharp")
-    pets_sharp = IconData(name="pets", fontFamily="Material Symbols Sharp")
-    phishing_sharp = IconData(name="phishing", fontFamily="Material Symbols Sharp")
-    phone_sharp = IconData(name="phone", fontFamily="Material Symbols Sharp")
-    phone_alt_sharp = IconData(name="phone_alt", fontFamily="Material Symbols Sharp")
-    phone_android_sharp = IconData(name="phone_android", fontFamily="Material Symbols Sharp")
-    phone_bluetooth_speaker_sharp = IconData(name="phone_bluetooth_speaker", fontFamily="Material Symbols Sharp")
-    phone_callback_sharp = IconData(name="phone_callback", fontFamily="Material Symbols Sharp")
-    phone_disabled_sharp = IconData(name="phone_disabled", fontFamily="Material Symbols Sharp")
-    phone_enabled_sharp = IconData(name="phone_enabled", fontFamily="Material Symbols Sharp")
-    phone_forwarded_sharp = IconData(name="phone_forwarded", fontFamily="Material Symbols Sharp")
-    phone_in_talk_sharp = IconData(name="phone_in_talk", fontFamily="Material Symbols Sharp")
-    phone_iphone_sharp = IconData(name="phone_iphone", fontFamily="Material Symbols Sharp")
-    phone_locked_sharp = IconData(name="phone_locked", fontFamily="Material Symbols Sharp")
-    phone_missed_sharp = IconData(name="phone_missed", fontFamily="Material Symbols Sharp")
-    phone_paused_sharp = IconData(name="phone_paused", fontFamily="Material Symbols Sharp")
-    phonelink_sharp = IconData(name="phonelink", fontFamily="Material Symbols Sharp")
-    phonelink_erase_sharp = IconData(name="phonelink_erase", fontFamily="Material Symbols Sharp")
-    phonelink_lock_sharp = IconData(name="phonelink_lock", fontFamily="Material Symbols Sharp")
-    phonelink_off_sharp = IconData(name="phonelink_off", fontFamily="Material Symbols Sharp")
-    phonelink_ring_sharp = IconData(name="phonelink_ring", fontFamily="Material Symbols Sharp")
-    phonelink_ring_off_sharp = IconData(name="phonelink_ring_off", fontFamily="Material Symbols Sharp")
-    phonelink_setup_sharp = IconData(name="phonelink_setup", fontFamily="Material Symbols Sharp")
-    photo_sharp = IconData(name="photo", fontFamily="Material Symbols Sharp")
-    photo_album_sharp = IconData(name="photo_album", fontFamily="Material Symbols Sharp")
-    photo_auto_merge_sharp = IconData(name="photo_auto_merge", fontFamily="Material Symbols Sharp")
-    photo_camera_sharp = IconData(name="photo_camera", fontFamily="Material Symbols Sharp")
-    photo_camera_back_sharp = IconData(name="photo_camera_back", fontFamily="Material Symbols Sharp")
-    photo_camera_front_sharp = IconData(name="photo_camera_front", fontFamily="Material Symbols Sharp")
-    photo_filter_sharp = IconData(name="photo_filter", fontFamily="Material Symbols Sharp")
-    photo_frame_sharp = IconData(name="photo_frame", fontFamily="Material Symbols Sharp")
-    photo_library_sharp = IconData(name="photo_library", fontFamily="Material Symbols Sharp")
-    photo_prints_sharp = IconData(name="photo_prints", fontFamily="Material Symbols Sharp")
-    photo_size_select_actual_sharp = IconData(name="photo_size_select_actual", fontFamily="Material Symbols Sharp")
-    photo_size_select_large_sharp = IconData(name="photo_size_select_large", fontFamily="Material Symbols Sharp")
-    photo_size_select_small_sharp = IconData(name="photo_size_select_small", fontFamily="Material Symbols Sharp")
-    php_sharp = IconData(name="php", fontFamily="Material Symbols Sharp")
-    physical_therapy_sharp = IconData(name="physical_therapy", fontFamily="Material Symbols Sharp")
-    piano_sharp = IconData(name="piano", fontFamily="Material Symbols Sharp")
-    piano_off_sharp = IconData(name="piano_off", fontFamily="Material Symbols Sharp")
-    picture_as_pdf_sharp = IconData(name="picture_as_pdf", fontFamily="Material Symbols Sharp")
-    picture_in_picture_sharp = IconData(name="picture_in_picture", fontFamily="Material Symbols Sharp")
-    picture_in_picture_alt_sharp = IconData(name="picture_in_picture_alt", fontFamily="Material Symbols Sharp")
-    picture_in_picture_center_sharp = IconData(name="picture_in_picture_center", fontFamily="Material Symbols Sharp")
-    picture_in_picture_large_sharp = IconData(name="picture_in_picture_large", fontFamily="Material Symbols Sharp")
-    picture_in_picture_medium_sharp = IconData(name="picture_in_picture_medium", fontFamily="Material Symbols Sharp")
-    picture_in_picture_mobile_sharp = IconData(name="picture_in_picture_mobile", fontFamily="Material Symbols Sharp")
-    picture_in_picture_off_sharp = IconData(name="picture_in_picture_off", fontFamily="Material Symbols Sharp")
-    picture_in_picture_small_sharp = IconData(name="picture_in_picture_small", fontFamily="Material Symbols Sharp")
-    pie_chart_sharp = IconData(name="pie_chart", fontFamily="Material Symbols Sharp")
-    pie_chart_filled_sharp = IconData(name="pie_chart_filled", fontFamily="Material Symbols Sharp")
-    pie_chart_outline_sharp = IconData(name="pie_chart_outline", fontFamily="Material Symbols Sharp")
-    pie_chart_outlined_sharp = IconData(name="pie_chart_outlined", fontFamily="Material Symbols Sharp")
-    pill_sharp = IconData(name="pill", fontFamily="Material Symbols Sharp")
-    pill_off_sharp = IconData(name="pill_off", fontFamily="Material Symbols Sharp")
-    pin_sharp = IconData(name="pin", fontFamily="Material Symbols Sharp")
-    pin_drop_sharp = IconData(name="pin_drop", fontFamily="Material Symbols Sharp")
-    pin_end_sharp = IconData(name="pin_end", fontFamily="Material Symbols Sharp")
-    pin_invoke_sharp = IconData(name="pin_invoke", fontFamily="Material Symbols Sharp")
-    pinboard_sharp = IconData(name="pinboard", fontFamily="Material Symbols Sharp")
-    pinboard_unread_sharp = IconData(name="pinboard_unread", fontFamily="Material Symbols Sharp")
-    pinch_sharp = IconData(name="pinch", fontFamily="Material Symbols Sharp")
-    pinch_zoom_in_sharp = IconData(name="pinch_zoom_in", fontFamily="Material Symbols Sharp")
-    pinch_zoom_out_sharp = IconData(name="pinch_zoom_out", fontFamily="Material Symbols Sharp")
-    pip_sharp = IconData(name="pip", fontFamily="Material Symbols Sharp")
-    pip_exit_sharp = IconData(name="pip_exit", fontFamily="Material Symbols Sharp")
-    pivot_table_chart_sharp = IconData(name="pivot_table_chart", fontFamily="Material Symbols Sharp")
-    place_sharp = IconData(name="place", fontFamily="Material Symbols Sharp")
-    place_item_sharp = IconData(name="place_item", fontFamily="Material Symbols Sharp")
-    plagiarism_sharp = IconData(name="plagiarism", fontFamily="Material Symbols Sharp")
-    planet_sharp = IconData(name="planet", fontFamily="Material Symbols Sharp")
-    planner_banner_ad_pt_sharp = IconData(name="planner_banner_ad_pt", fontFamily="Material Symbols Sharp")
-    planner_review_sharp = IconData(name="planner_review", fontFamily="Material Symbols Sharp")
-    play_arrow_sharp = IconData(name="play_arrow", fontFamily="Material Symbols Sharp")
-    play_circle_sharp = IconData(name="play_circle", fontFamily="Material Symbols Sharp")
-    play_disabled_sharp = IconData(name="play_disabled", fontFamily="Material Symbols Sharp")
-    play_for_work_sharp = IconData(name="play_for_work", fontFamily="Material Symbols Sharp")
-    play_lesson_sharp = IconData(name="play_lesson", fontFamily="Material Symbols Sharp")
-    play_music_sharp = IconData(name="play_music", fontFamily="Material Symbols Sharp")
-    play_pause_sharp = IconData(name="play_pause", fontFamily="Material Symbols Sharp")
-    play_shapes_sharp = IconData(name="play_shapes", fontFamily="Material Symbols Sharp")
-    playing_cards_sharp = IconData(name="playing_cards", fontFamily="Material Symbols Sharp")
-    playlist_add_sharp = IconData(name="playlist_add", fontFamily="Material Symbols Sharp")
-    playlist_add_check_sharp = IconData(name="playlist_add_check", fontFamily="Material Symbols Sharp")
-    playlist_add_check_circle_sharp = IconData(name="playlist_add_check_circle", fontFamily="Material Symbols Sharp")
-    playlist_add_circle_sharp = IconData(name="playlist_add_circle", fontFamily="Material Symbols Sharp")
-    playlist_play_sharp = IconData(name="playlist_play", fontFamily="Material Symbols Sharp")
-    playlist_remove_sharp = IconData(name="playlist_remove", fontFamily="Material Symbols Sharp")
-    plug_connect_sharp = IconData(name="plug_connect", fontFamily="Material Symbols Sharp")
-    plumbing_sharp = IconData(name="plumbing", fontFamily="Material Symbols Sharp")
-    plus_one_sharp = IconData(name="plus_one", fontFamily="Material Symbols Sharp")
-    podcasts_sharp = IconData(name="podcasts", fontFamily="Material Symbols Sharp")
-    podiatry_sharp = IconData(name="podiatry", fontFamily="Material Symbols Sharp")
-    podium_sharp = IconData(name="podium", fontFamily="Material Symbols Sharp")
-    point_of_sale_sharp = IconData(name="point_of_sale", fontFamily="Material Symbols Sharp")
-    point_scan_sharp = IconData(name="point_scan", fontFamily="Material Symbols Sharp")
-    poker_chip_sharp = IconData(name="poker_chip", fontFamily="Material Symbols Sharp")
-    policy_sharp = IconData(name="policy", fontFamily="Material Symbols Sharp")
-    policy_alert_sharp = IconData(name="policy_alert", fontFamily="Material Symbols Sharp")
-    poll_sharp = IconData(name="poll", fontFamily="Material Symbols Sharp")
-    polyline_sharp = IconData(name="polyline", fontFamily="Material Symbols Sharp")
-    polymer_sharp = IconData(name="polymer", fontFamily="Material Symbols Sharp")
-    pool_sharp = IconData(name="pool", fontFamily="Material Symbols Sharp")
-    portable_wifi_off_sharp = IconData(name="portable_wifi_off", fontFamily="Material Symbols Sharp")
-    portrait_sharp = IconData(name="portrait", fontFamily="Material Symbols Sharp")
-    position_bottom_left_sharp = IconData(name="position_bottom_left", fontFamily="Material Symbols Sharp")
-    position_bottom_right_sharp = IconData(name="position_bottom_right", fontFamily="Material Symbols Sharp")
-    position_top_right_sharp = IconData(name="position_top_right", fontFamily="Material Symbols Sharp")
-    post_sharp = IconData(name="post", fontFamily="Material Symbols Sharp")
-    post_add_sharp = IconData(name="post_add", fontFamily="Material Symbols Sharp")
-    potted_plant_sharp = IconData(name="potted_plant", fontFamily="Material Symbols Sharp")
-    power_sharp = IconData(name="power", fontFamily="Material Symbols Sharp")
-    power_input_sharp = IconData(name="power_input", fontFamily="Material Symbols Sharp")
-    power_off_sharp = IconData(name="power_off", fontFamily="Material Symbols Sharp")
-    power_rounded_sharp = IconData(name="power_rounded", fontFamily="Material Symbols Sharp")
-    power_settings_circle_sharp = IconData(name="power_settings_circle", fontFamily="Material Symbols Sharp")
-    power_settings_new_sharp = IconData(name="power_settings_new", fontFamily="Material Symbols Sharp")
-    prayer_times_sharp = IconData(name="prayer_times", fontFamily="Material Symbols Sharp")
-    precision_manufacturing_sharp = IconData(name="precision_manufacturing", fontFamily="Material Symbols Sharp")
-    pregnancy_sharp = IconData(name="pregnancy", fontFamily="Material Symbols Sharp")
-    pregnant_woman_sharp = IconData(name="pregnant_woman", fontFamily="Material Symbols Sharp")
-    preliminary_sharp = IconData(name="preliminary", fontFamily="Material Symbols Sharp")
-    prescriptions_sharp = IconData(name="prescriptions", fontFamily="Material Symbols Sharp")
-    present_to_all_sharp = IconData(name="present_to_all", fontFamily="Material Symbols Sharp")
-    preview_sharp = IconData(name="preview", fontFamily="Material Symbols Sharp")
-    preview_off_sharp = IconData(name="preview_off", fontFamily="Material Symbols Sharp")
-    price_change_sharp = IconData(name="price_change", fontFamily="Material Symbols Sharp")
-    price_check_sharp = IconData(name="price_check", fontFamily="Material Symbols Sharp")
-    print_sharp = IconData(name="print", fontFamily="Material Symbols Sharp")
-    print_add_sharp = IconData(name="print_add", fontFamily="Material Symbols Sharp")
-    print_connect_sharp = IconData(name="print_connect", fontFamily="Material Symbols Sharp")
-    print_disabled_sharp = IconData(name="print_disabled", fontFamily="Material Symbols Sharp")
-    print_error_sharp = IconData(name="print_error", fontFamily="Material Symbols Sharp")
-    print_lock_sharp = IconData(name="print_lock", fontFamily="Material Symbols Sharp")
-    priority_sharp = IconData(name="priority", fontFamily="Material Symbols Sharp")
-    priority_high_sharp = IconData(name="priority_high", fontFamily="Material Symbols Sharp")
-    privacy_sharp = IconData(name="privacy", fontFamily="Material Symbols Sharp")
-    privacy_tip_sharp = IconData(name="privacy_tip", fontFamily="Material Symbols Sharp")
-    private_connectivity_sharp = IconData(name="private_connectivity", fontFamily="Material Symbols Sharp")
-    problem_sharp = IconData(name="problem", fontFamily="Material Symbols Sharp")
-    procedure_sharp = IconData(name="procedure", fontFamily="Material Symbols Sharp")
-    process_chart_sharp = IconData(name="process_chart", fontFamily="Material Symbols Sharp")
-    production_quantity_limits_sharp = IconData(name="production_quantity_limits", fontFamily="Material Symbols Sharp")
-    productivity_sharp = IconData(name="productivity", fontFamily="Material Symbols Sharp")
-    progress_activity_sharp = IconData(name="progress_activity", fontFamily="Material Symbols Sharp")
-    prompt_suggestion_sharp = IconData(name="prompt_suggestion", fontFamily="Material Symbols Sharp")
-    propane_sharp = IconData(name="propane", fontFamily="Material Symbols Sharp")
-    propane_tank_sharp = IconData(name="propane_tank", fontFamily="Material Symbols Sharp")
-    psychiatry_sharp = IconData(name="psychiatry", fontFamily="Material Symbols Sharp")
-    psychology_sharp = IconData(name="psychology", fontFamily="Material Symbols Sharp")
-    psychology_alt_sharp = IconData(name="psychology_alt", fontFamily="Material Symbols Sharp")
-    public_sharp = IconData(name="public", fontFamily="Material Symbols Sharp")
-    public_off_sharp = IconData(name="public_off", fontFamily="Material Symbols Sharp")
-    publish_sharp = IconData(name="publish", fontFamily="Material Symbols Sharp")
-    published_with_changes_sharp = IconData(name="published_with_changes", fontFamily="Material Symbols Sharp")
-    pulmonology_sharp = IconData(name="pulmonology", fontFamily="Material Symbols Sharp")
-    pulse_alert_sharp = IconData(name="pulse_alert", fontFamily="Material Symbols Sharp")
-    punch_clock_sharp = IconData(name="punch_clock", fontFamily="Material Symbols Sharp")
-    push_pin_sharp = IconData(name="push_pin", fontFamily="Material Symbols Sharp")
-    qr_code_sharp = IconData(name="qr_code", fontFamily="Material Symbols Sharp")
-    qr_code_2_sharp = IconData(name="qr_code_2", fontFamily="Material Symbols Sharp")
-    qr_code_2_add_sharp = IconData(name="qr_code_2_add", fontFamily="Material Symbols Sharp")
-    qr_code_scanner_sharp = IconData(name="qr_code_scanner", fontFamily="Material Symbols Sharp")
-    query_builder_sharp = IconData(name="query_builder", fontFamily="Material Symbols Sharp")
-    query_stats_sharp = IconData(name="query_stats", fontFamily="Material Symbols Sharp")
-    question_answer_sharp = IconData(name="question_answer", fontFamily="Material Symbols Sharp")
-    question_exchange_sharp = IconData(name="question_exchange", fontFamily="Material Symbols Sharp")
-    question_mark_sharp = IconData(name="question_mark", fontFamily="Material Symbols Sharp")
-    queue_sharp = IconData(name="queue", fontFamily="Material Symbols Sharp")
-    queue_music_sharp = IconData(name="queue_music", fontFamily="Material Symbols Sharp")
-    queue_play_next_sharp = IconData(name="queue_play_next", fontFamily="Material Symbols Sharp")
-    quick_phrases_sharp = IconData(name="quick_phrases", fontFamily="Material Symbols Sharp")
-    quick_reference_sharp = IconData(name="quick_reference", fontFamily="Material Symbols Sharp")
-    quick_reference_all_sharp = IconData(name="quick_reference_all", fontFamily="Material Symbols Sharp")
-    quick_reorder_sharp = IconData(name="quick_reorder", fontFamily="Material Symbols Sharp")
-    quickreply_sharp = IconData(name="quickreply", fontFamily="Material Symbols Sharp")
-    quiet_time_sharp = IconData(name="quiet_time", fontFamily="Material Symbols Sharp")
-    quiet_time_active_sharp = IconData(name="quiet_time_active", fontFamily="Material Symbols Sharp")
-    quiz_sharp = IconData(name="quiz", fontFamily="Material Symbols Sharp")
-    r_mobiledata_sharp = IconData(name="r_mobiledata", fontFamily="Material Symbols Sharp")
-    radar_sharp = IconData(name="radar", fontFamily="Material Symbols Sharp")
-    radio_sharp = IconData(name="radio", fontFamily="Material Symbols Sharp")
-    radio_button_checked_sharp = IconData(name="radio_button_checked", fontFamily="Material Symbols Sharp")
-    radio_button_partial_sharp = IconData(name="radio_button_partial", fontFamily="Material Symbols Sharp")
-    radio_button_unchecked_sharp = IconData(name="radio_button_unchecked", fontFamily="Material Symbols Sharp")
-    radiology_sharp = IconData(name="radiology", fontFamily="Material Symbols Sharp")
-    railway_alert_sharp = IconData(name="railway_alert", fontFamily="Material Symbols Sharp")
-    railway_alert_2_sharp = IconData(name="railway_alert_2", fontFamily="Material Symbols Sharp")
-    rainy_sharp = IconData(name="rainy", fontFamily="Material Symbols Sharp")
-    rainy_heavy_sharp = IconData(name="rainy_heavy", fontFamily="Material Symbols Sharp")
-    rainy_light_sharp = IconData(name="rainy_light", fontFamily="Material Symbols Sharp")
-    rainy_snow_sharp = IconData(name="rainy_snow", fontFamily="Material Symbols Sharp")
-    ramen_dining_sharp = IconData(name="ramen_dining", fontFamily="Material Symbols Sharp")
-    ramp_left_sharp = IconData(name="ramp_left", fontFamily="Material Symbols Sharp")
-    ramp_right_sharp = IconData(name="ramp_right", fontFamily="Material Symbols Sharp")
-    range_hood_sharp = IconData(name="range_hood", fontFamily="Material Symbols Sharp")
-    rate_review_sharp = IconData(name="rate_review", fontFamily="Material Symbols Sharp")
-    rate_review_rtl_sharp = IconData(name="rate_review_rtl", fontFamily="Material Symbols Sharp")
-    raven_sharp = IconData(name="raven", fontFamily="Material Symbols Sharp")
-    raw_off_sharp = IconData(name="raw_off", fontFamily="Material Symbols Sharp")
-    raw_on_sharp = IconData(name="raw_on", fontFamily="Material Symbols Sharp")
-    read_more_sharp = IconData(name="read_more", fontFamily="Material Symbols Sharp")
-    readiness_score_sharp = IconData(name="readiness_score", fontFamily="Material Symbols Sharp")
-    real_estate_agent_sharp = IconData(name="real_estate_agent", fontFamily="Material Symbols Sharp")
-    rear_camera_sharp = IconData(name="rear_camera", fontFamily="Material Symbols Sharp")
-    rebase_sharp = IconData(name="rebase", fontFamily="Material Symbols Sharp")
-    rebase_edit_sharp = IconData(name="rebase_edit", fontFamily="Material Symbols Sharp")
-    receipt_sharp = IconData(name="receipt", fontFamily="Material Symbols Sharp")
-    receipt_long_sharp = IconData(name="receipt_long", fontFamily="Material Symbols Sharp")
-    receipt_long_off_sharp = IconData(name="receipt_long_off", fontFamily="Material Symbols Sharp")
-    recent_actors_sharp = IconData(name="recent_actors", fontFamily="Material Symbols Sharp")
-    recent_patient_sharp = IconData(name="recent_patient", fontFamily="Material Symbols Sharp")
-    recenter_sharp = IconData(name="recenter", fontFamily="Material Symbols Sharp")
-    recommend_sharp = IconData(name="recommend", fontFamily="Material Symbols Sharp")
-    record_voice_over_sharp = IconData(name="record_voice_over", fontFamily="Material Symbols Sharp")
-    rectangle_sharp = IconData(name="rectangle", fontFamily="Material Symbols Sharp")
-    recycling_sharp = IconData(name="recycling", fontFamily="Material Symbols Sharp")
-    redeem_sharp = IconData(name="redeem", fontFamily="Material Symbols Sharp")
-    redo_sharp = IconData(name="redo", fontFamily="Material Symbols Sharp")
-    reduce_capacity_sharp = IconData(name="reduce_capacity", fontFamily="Material Symbols Sharp")
-    refresh_sharp = IconData(name="refresh", fontFamily="Material Symbols Sharp")
-    regular_expression_sharp = IconData(name="regular_expression", fontFamily="Material Symbols Sharp")
-    relax_sharp = IconData(name="relax", fontFamily="Material Symbols Sharp")
-    release_alert_sharp = IconData(name="release_alert", fontFamily="Material Symbols Sharp")
-    remember_me_sharp = IconData(name="remember_me", fontFamily="Material Symbols Sharp")
-    reminder_sharp = IconData(name="reminder", fontFamily="Material Symbols Sharp")
-    reminders_alt_sharp = IconData(name="reminders_alt", fontFamily="Material Symbols Sharp")
-    remote_gen_sharp = IconData(name="remote_gen", fontFamily="Material Symbols Sharp")
-    remove_sharp = IconData(name="remove", fontFamily="Material Symbols Sharp")
-    remove_circle_sharp = IconData(name="remove_circle", fontFamily="Material Symbols Sharp")
-    remove_circle_outline_sharp = IconData(name="remove_circle_outline", fontFamily="Material Symbols Sharp")
-    remove_done_sharp = IconData(name="remove_done", fontFamily="Material Symbols Sharp")
-    remove_from_queue_sharp = IconData(name="remove_from_queue", fontFamily="Material Symbols Sharp")
-    remove_moderator_sharp = IconData(name="remove_moderator", fontFamily="Material Symbols Sharp")
-    remove_red_eye_sharp = IconData(name="remove_red_eye", fontFamily="Material Symbols Sharp")
-    remove_road_sharp = IconData(name="remove_road", fontFamily="Material Symbols Sharp")
-    remove_selection_sharp = IconData(name="remove_selection", fontFamily="Material Symbols Sharp")
-    remove_shopping_cart_sharp = IconData(name="remove_shopping_cart", fontFamily="Material Symbols Sharp")
-    reopen_window_sharp = IconData(name="reopen_window", fontFamily="Material Symbols Sharp")
-    reorder_sharp = IconData(name="reorder", fontFamily="Material Symbols Sharp")
-    repartition_sharp = IconData(name="repartition", fontFamily="Material Symbols Sharp")
-    repeat_sharp = IconData(name="repeat", fontFamily="Material Symbols Sharp")
-    repeat_on_sharp = IconData(name="repeat_on", fontFamily="Material Symbols Sharp")
-    repeat_one_sharp = IconData(name="repeat_one", fontFamily="Material Symbols Sharp")
-    repeat_one_on_sharp = IconData(name="repeat_one_on", fontFamily="Material Symbols Sharp")
-    replace_audio_sharp = IconData(name="replace_audio", fontFamily="Material Symbols Sharp")
-    replace_image_sharp = IconData(name="replace_image", fontFamily="Material Symbols Sharp")
-    replace_video_sharp = IconData(name="replace_video", fontFamily="Material Symbols Sharp")
-    replay_sharp = IconData(name="replay", fontFamily="Material Symbols Sharp")
-    replay_10_sharp = IconData(name="replay_10", fontFamily="Material Symbols Sharp")
-    replay_30_sharp = IconData(name="replay_30", fontFamily="Material Symbols Sharp")
-    replay_5_sharp = IconData(name="replay_5", fontFamily="Material Symbols Sharp")
-    replay_circle_filled_sharp = IconData(name="replay_circle_filled", fontFamily="Material Symbols Sharp")
-    reply_sharp = IconData(name="reply", fontFamily="Material Symbols Sharp")
-    reply_all_sharp = IconData(name="reply_all", fontFamily="Material Symbols Sharp")
-    report_sharp = IconData(name="report", fontFamily="Material Symbols Sharp")
-    report_gmailerrorred_sharp = IconData(name="report_gmailerrorred", fontFamily="Material Symbols Sharp")
-    report_off_sharp = IconData(name="report_off", fontFamily="Material Symbols Sharp")
-    report_problem_sharp = IconData(name="report_problem", fontFamily="Material Symbols Sharp")
-    request_page_sharp = IconData(name="request_page", fontFamily="Material Symbols Sharp")
-    request_quote_sharp = IconData(name="request_quote", fontFamily="Material Symbols Sharp")
-    reset_brightness_sharp = IconData(name="reset_brightness", fontFamily="Material Symbols Sharp")
-    reset_focus_sharp = IconData(name="reset_focus", fontFamily="Material Symbols Sharp")
-    reset_image_sharp = IconData(name="reset_image", fontFamily="Material Symbols Sharp")
-    reset_iso_sharp = IconData(name="reset_iso", fontFamily="Material Symbols Sharp")
-    reset_settings_sharp = IconData(name="reset_settings", fontFamily="Material Symbols Sharp")
-    reset_shadow_sharp = IconData(name="reset_shadow", fontFamily="Material Symbols Sharp")
-    reset_shutter_speed_sharp = IconData(name="reset_shutter_speed", fontFamily="Material Symbols Sharp")
-    reset_tv_sharp = IconData(name="reset_tv", fontFamily="Material Symbols Sharp")
-    reset_white_balance_sharp = IconData(name="reset_white_balance", fontFamily="Material Symbols Sharp")
-    reset_wrench_sharp = IconData(name="reset_wrench", fontFamily="Material Symbols Sharp")
-    resize_sharp = IconData(name="resize", fontFamily="Material Symbols Sharp")
-    respiratory_rate_sharp = IconData(name="respiratory_rate", fontFamily="Material Symbols Sharp")
-    responsive_layout_sharp = IconData(name="responsive_layout", fontFamily="Material Symbols Sharp")
-    restart_alt_sharp = IconData(name="restart_alt", fontFamily="Material Symbols Sharp")
-    restaurant_sharp = IconData(name="restaurant", fontFamily="Material Symbols Sharp")
-    restaurant_menu_sharp = IconData(name="restaurant_menu", fontFamily="Material Symbols Sharp")
-    restore_sharp = IconData(name="restore", fontFamily="Material Symbols Sharp")
-    restore_from_trash_sharp = IconData(name="restore_from_trash", fontFamily="Material Symbols Sharp")
-    restore_page_sharp = IconData(name="restore_page", fontFamily="Material Symbols Sharp")
-    resume_sharp = IconData(name="resume", fontFamily="Material Symbols Sharp")
-    reviews_sharp = IconData(name="reviews", fontFamily="Material Symbols Sharp")
-    rewarded_ads_sharp = IconData(name="rewarded_ads", fontFamily="Material Symbols Sharp")
-    rheumatology_sharp = IconData(name="rheumatology", fontFamily="Material Symbols Sharp")
-    rib_cage_sharp = IconData(name="rib_cage", fontFamily="Material Symbols Sharp")
-    rice_bowl_sharp = IconData(name="rice_bowl", fontFamily="Material Symbols Sharp")
-    right_click_sharp = IconData(name="right_click", fontFamily="Material Symbols Sharp")
-    right_panel_close_sharp = IconData(name="right_panel_close", fontFamily="Material Symbols Sharp")
-    right_panel_open_sharp = IconData(name="right_panel_open", fontFamily="Material Symbols Sharp")
-    ring_volume_sharp = IconData(name="ring_volume", fontFamily="Material Symbols Sharp")
-    ring_volume_filled_sharp = IconData(name="ring_volume_filled", fontFamily="Material Symbols Sharp")
-    ripples_sharp = IconData(name="ripples", fontFamily="Material Symbols Sharp")
-    road_sharp = IconData(name="road", fontFamily="Material Symbols Sharp")
-    robot_sharp = IconData(name="robot", fontFamily="Material Symbols Sharp")
-    robot_2_sharp = IconData(name="robot_2", fontFamily="Material Symbols Sharp")
-    rocket_sharp = IconData(name="rocket", fontFamily="Material Symbols Sharp")
-    rocket_launch_sharp = IconData(name="rocket_launch", fontFamily="Material Symbols Sharp")
-    roller_shades_sharp = IconData(name="roller_shades", fontFamily="Material Symbols Sharp")
-    roller_shades_closed_sharp = IconData(name="roller_shades_closed", fontFamily="Material Symbols Sharp")
-    roller_skating_sharp = IconData(name="roller_skating", fontFamily="Material Symbols Sharp")
-    roofing_sharp = IconData(name="roofing", fontFamily="Material Symbols Sharp")
-    room_sharp = IconData(name="room", fontFamily="Material Symbols Sharp")
-    room_preferences_sharp = IconData(name="room_preferences", fontFamily="Material Symbols Sharp")
-    room_service_sharp = IconData(name="room_service", fontFamily="Material Symbols Sharp")
-    rotate_90_degrees_ccw_sharp = IconData(name="rotate_90_degrees_ccw", fontFamily="Material Symbols Sharp")
-    rotate_90_degrees_cw_sharp = IconData(name="rotate_90_degrees_cw", fontFamily="Material Symbols Sharp")
-    rotate_auto_sharp = IconData(name="rotate_auto", fontFamily="Material Symbols Sharp")
-    rotate_left_sharp = IconData(name="rotate_left", fontFamily="Material Symbols Sharp")
-    rotate_right_sharp = IconData(name="rotate_right", fontFamily="Material Symbols Sharp")
-    roundabout_left_sharp = IconData(name="roundabout_left", fontFamily="Material Symbols Sharp")
-    roundabout_right_sharp = IconData(name="roundabout_right", fontFamily="Material Symbols Sharp")
-    rounded_corner_sharp = IconData(name="rounded_corner", fontFamily="Material Symbols Sharp")
-    route_sharp = IconData(name="route", fontFamily="Material Symbols Sharp")
-    router_sharp = IconData(name="router", fontFamily="Material Symbols Sharp")
-    router_off_sharp = IconData(name="router_off", fontFamily="Material Symbols Sharp")
-    routine_sharp = IconData(name="routine", fontFamily="Material Symbols Sharp")
-    rowing_sharp = IconData(name="rowing", fontFamily="Material Symbols Sharp")
-    rss_feed_sharp = IconData(name="rss_feed", fontFamily="Material Symbols Sharp")
-    rsvp_sharp = IconData(name="rsvp", fontFamily="Material Symbols Sharp")
-    rtt_sharp = IconData(name="rtt", fontFamily="Material Symbols Sharp")
-    rubric_sharp = IconData(name="rubric", fontFamily="Material Symbols Sharp")
-    rule_sharp = IconData(name="rule", fontFamily="Material Symbols Sharp")
-    rule_folder_sharp = IconData(name="rule_folder", fontFamily="Material Symbols Sharp")
-    rule_settings_sharp = IconData(name="rule_settings", fontFamily="Material Symbols Sharp")
-    run_circle_sharp = IconData(name="run_circle", fontFamily="Material Symbols Sharp")
-    running_with_errors_sharp = IconData(name="running_with_errors", fontFamily="Material Symbols Sharp")
-    rv_hookup_sharp = IconData(name="rv_hookup", fontFamily="Material Symbols Sharp")
-    safety_check_sharp = IconData(name="safety_check", fontFamily="Material Symbols Sharp")
-    safety_check_off_sharp = IconData(name="safety_check_off", fontFamily="Material Symbols Sharp")
-    safety_divider_sharp = IconData(name="safety_divider", fontFamily="Material Symbols Sharp")
-    sailing_sharp = IconData(name="sailing", fontFamily="Material Symbols Sharp")
-    salinity_sharp = IconData(name="salinity", fontFamily="Material Symbols Sharp")
-    sanitizer_sharp = IconData(name="sanitizer", fontFamily="Material Symbols Sharp")
-    satellite_sharp = IconData(name="satellite", fontFamily="Material Symbols Sharp")
-    satellite_alt_sharp = IconData(name="satellite_alt", fontFamily="Material Symbols Sharp")
-    sauna_sharp = IconData(name="sauna", fontFamily="Material Symbols Sharp")
-    save_sharp = IconData(name="save", fontFamily="Material Symbols Sharp")
-    save_alt_sharp = IconData(name="save_alt", fontFamily="Material Symbols Sharp")
-    save_as_sharp = IconData(name="save_as", fontFamily="Material Symbols Sharp")
-    save_clock_sharp = IconData(name="save_clock", fontFamily="Material Symbols Sharp")
-    saved_search_sharp = IconData(name="saved_search", fontFamily="Material Symbols Sharp")
-    savings_sharp = IconData(name="savings", fontFamily="Material Symbols Sharp")
-    scale_sharp = IconData(name="scale", fontFamily="Material Symbols Sharp")
-    scan_sharp = IconData(name="scan", fontFamily="Material Symbols Sharp")
-    scan_delete_sharp = IconData(name="scan_delete", fontFamily="Material Symbols Sharp")
-    scanner_sharp = IconData(name="scanner", fontFamily="Material Symbols Sharp")
-    scatter_plot_sharp = IconData(name="scatter_plot", fontFamily="Material Symbols Sharp")
-    scene_sharp = IconData(name="scene", fontFamily="Material Symbols Sharp")
-    schedule_sharp = IconData(name="schedule", fontFamily="Material Symbols Sharp")
-    schedule_send_sharp = IconData(name="schedule_send", fontFamily="Material Symbols Sharp")
-    schema_sharp = IconData(name="schema", fontFamily="Material Symbols Sharp")
-    school_sharp = IconData(name="school", fontFamily="Material Symbols Sharp")
-    science_sharp = IconData(name="science", fontFamily="Material Symbols Sharp")
-    science_off_sharp = IconData(name="science_off", fontFamily="Material Symbols Sharp")
-    scooter_sharp = IconData(name="scooter", fontFamily="Material Symbols Sharp")
-    score_sharp = IconData(name="score", fontFamily="Material Symbols Sharp")
-    scoreboard_sharp = IconData(name="scoreboard", fontFamily="Material Symbols Sharp")
-    screen_lock_landscape_sharp = IconData(name="screen_lock_landscape", fontFamily="Material Symbols Sharp")
-    screen_lock_portrait_sharp = IconData(name="screen_lock_portrait", fontFamily="Material Symbols Sharp")
-    screen_lock_rotation_sharp = IconData(name="screen_lock_rotation", fontFamily="Material Symbols Sharp")
-    screen_record_sharp = IconData(name="screen_record", fontFamily="Material Symbols Sharp")
-    screen_rotation_sharp = IconData(name="screen_rotation", fontFamily="Material Symbols Sharp")
-    screen_rotation_alt_sharp = IconData(name="screen_rotation_alt", fontFamily="Material Symbols Sharp")
-    screen_rotation_up_sharp = IconData(name="screen_rotation_up", fontFamily="Material Symbols Sharp")
-    screen_search_desktop_sharp = IconData(name="screen_search_desktop", fontFamily="Material Symbols Sharp")
-    screen_share_sharp = IconData(name="screen_share", fontFamily="Material Symbols Sharp")
-    screenshot_sharp = IconData(name="screenshot", fontFamily="Material Symbols Sharp")
-    screenshot_frame_sharp = IconData(name="screenshot_frame", fontFamily="Material Symbols Sharp")
-    screenshot_frame_2_sharp = IconData(name="screenshot_frame_2", fontFamily="Material Symbols Sharp")
-    screenshot_keyboard_sharp = IconData(name="screenshot_keyboard", fontFamily="Material Symbols Sharp")
-    screenshot_monitor_sharp = IconData(name="screenshot_monitor", fontFamily="Material Symbols Sharp")
-    screenshot_region_sharp = IconData(name="screenshot_region", fontFamily="Material Symbols Sharp")
-    screenshot_tablet_sharp = IconData(name="screenshot_tablet", fontFamily="Material Symbols Sharp")
-    script_sharp = IconData(name="script", fontFamily="Material Symbols Sharp")
-    scrollable_header_sharp = IconData(name="scrollable_header", fontFamily="Material Symbols Sharp")
-    scuba_diving_sharp = IconData(name="scuba_diving", fontFamily="Material Symbols Sharp")
-    sd_sharp = IconData(name="sd", fontFamily="Material Symbols Sharp")
-    sd_card_sharp = IconData(name="sd_card", fontFamily="Material Symbols Sharp")
-    sd_card_alert_sharp = IconData(name="sd_card_alert", fontFamily="Material Symbols Sharp")
-    sd_storage_sharp = IconData(name="sd_storage", fontFamily="Material Symbols Sharp")
-    sdk_sharp = IconData(name="sdk", fontFamily="Material Symbols Sharp")
-    search_sharp = IconData(name="search", fontFamily="Material Symbols Sharp")
-    search_activity_sharp = IconData(name="search_activity", fontFamily="Material Symbols Sharp")
-    search_check_sharp = IconData(name="search_check", fontFamily="Material Symbols Sharp")
-    search_check_2_sharp = IconData(name="search_check_2", fontFamily="Material Symbols Sharp")
-    search_hands_free_sharp = IconData(name="search_hands_free", fontFamily="Material Symbols Sharp")
-    search_insights_sharp = IconData(name="search_insights", fontFamily="Material Symbols Sharp")
-    search_off_sharp = IconData(name="search_off", fontFamily="Material Symbols Sharp")
-    seat_cool_left_sharp = IconData(name="seat_cool_left", fontFamily="Material Symbols Sharp")
-    seat_cool_right_sharp = IconData(name="seat_cool_right", fontFamily="Material Symbols Sharp")
-    seat_heat_left_sharp = IconData(name="seat_heat_left", fontFamily="Material Symbols Sharp")
-    seat_heat_right_sharp = IconData(name="seat_heat_right", fontFamily="Material Symbols Sharp")
-    seat_vent_left_sharp = IconData(name="seat_vent_left", fontFamily="Material Symbols Sharp")
-    seat_vent_right_sharp = IconData(name="seat_vent_right", fontFamily="Material Symbols Sharp")
-    security_sharp = IconData(name="security", fontFamily="Material Symbols Sharp")
-    security_key_sharp = IconData(name="security_key", fontFamily="Material Symbols Sharp")
-    security_update_sharp = IconData(name="security_update", fontFamily="Material Symbols Sharp")
-    security_update_good_sharp = IconData(name="security_update_good", fontFamily="Material Symbols Sharp")
-    security_update_warning_sharp = IconData(name="security_update_warning", fontFamily="Material Symbols Sharp")
-    segment_sharp = IconData(name="segment", fontFamily="Material Symbols Sharp")
-    select_sharp = IconData(name="select", fontFamily="Material Symbols Sharp")
-    select_all_sharp = IconData(name="select_all", fontFamily="Material Symbols Sharp")
-    select_check_box_sharp = IconData(name="select_check_box", fontFamily="Material Symbols Sharp")
-    select_to_speak_sharp = IconData(name="select_to_speak", fontFamily="Material Symbols Sharp")
-    select_window_sharp = IconData(name="select_window", fontFamily="Material Symbols Sharp")
-    select_window_2_sharp = IconData(name="select_window_2", fontFamily="Material Symbols Sharp")
-    select_window_off_sharp = IconData(name="select_window_off", fontFamily="Material Symbols Sharp")
-    self_care_sharp = IconData(name="self_care", fontFamily="Material Symbols Sharp")
-    self_improvement_sharp = IconData(name="self_improvement", fontFamily="Material Symbols Sharp")
-    sell_sharp = IconData(name="sell", fontFamily="Material Symbols Sharp")
-    send_sharp = IconData(name="send", fontFamily="Material Symbols Sharp")
-    send_and_archive_sharp = IconData(name="send_and_archive", fontFamily="Material Symbols Sharp")
-    send_money_sharp = IconData(name="send_money", fontFamily="Material Symbols Sharp")
-    send_time_extension_sharp = IconData(name="send_time_extension", fontFamily="Material Symbols Sharp")
-    send_to_mobile_sharp = IconData(name="send_to_mobile", fontFamily="Material Symbols Sharp")
-    sensor_door_sharp = IconData(name="sensor_door", fontFamily="Material Symbols Sharp")
-    sensor_occupied_sharp = IconData(name="sensor_occupied", fontFamily="Material Symbols Sharp")
-    sensor_window_sharp = IconData(name="sensor_window", fontFamily="Material Symbols Sharp")
-    sensors_sharp = IconData(name="sensors", fontFamily="Material Symbols Sharp")
-    sensors_krx_sharp = IconData(name="sensors_krx", fontFamily="Material Symbols Sharp")
-    sensors_krx_off_sharp = IconData(name="sensors_krx_off", fontFamily="Material Symbols Sharp")
-    sensors_off_sharp = IconData(name="sensors_off", fontFamily="Material Symbols Sharp")
-    sentiment_calm_sharp = IconData(name="sentiment_calm", fontFamily="Material Symbols Sharp")
-    sentiment_content_sharp = IconData(name="sentiment_content", fontFamily="Material Symbols Sharp")
-    sentiment_dissatisfied_sharp = IconData(name="sentiment_dissatisfied", fontFamily="Material Symbols Sharp")
-    sentiment_excited_sharp = IconData(name="sentiment_excited", fontFamily="Material Symbols Sharp")
-    sentiment_extremely_dissatisfied_sharp = IconData(name="sentiment_extremely_dissatisfied", fontFamily="Material Symbols Sharp")
-    sentiment_frustrated_sharp = IconData(name="sentiment_frustrated", fontFamily="Material Symbols Sharp")
-    sentiment_neutral_sharp = IconData(name="sentiment_neutral", fontFamily="Material Symbols Sharp")
-    sentiment_sad_sharp = IconData(name="sentiment_sad", fontFamily="Material Symbols Sharp")
-    sentiment_satisfied_sharp = IconData(name="sentiment_satisfied", fontFamily="Material Symbols Sharp")
-    sentiment_satisfied_alt_sharp = IconData(name="sentiment_satisfied_alt", fontFamily="Material Symbols Sharp")
-    sentiment_stressed_sharp = IconData(name="sentiment_stressed", fontFamily="Material Symbols Sharp")
-    sentiment_very_dissatisfied_sharp = IconData(name="sentiment_very_dissatisfied", fontFamily="Material Symbols Sharp")
-    sentiment_very_satisfied_sharp = IconData(name="sentiment_very_satisfied", fontFamily="Material Symbols Sharp")
-    sentiment_worried_sharp = IconData(name="sentiment_worried", fontFamily="Material Symbols Sharp")
-    serif_sharp = IconData(name="serif", fontFamily="Material Symbols Sharp")
-    server_person_sharp = IconData(name="server_person", fontFamily="Material Symbols Sharp")
-    service_toolbox_sharp = IconData(name="service_toolbox", fontFamily="Material Symbols Sharp")
-    set_meal_sharp = IconData(name="set_meal", fontFamily="Material Symbols Sharp")
-    settings_sharp = IconData(name="settings", fontFamily="Material Symbols Sharp")
-    settings_accessibility_sharp = IconData(name="settings_accessibility", fontFamily="Material Symbols Sharp")
-    settings_account_box_sharp = IconData(name="settings_account_box", fontFamily="Material Symbols Sharp")
-    settings_alert_sharp = IconData(name="settings_alert", fontFamily="Material Symbols Sharp")
-    settings_applications_sharp = IconData(name="settings_applications", fontFamily="Material Symbols Sharp")
-    settings_b_roll_sharp = IconData(name="settings_b_roll", fontFamily="Material Symbols Sharp")
-    settings_backup_restore_sharp = IconData(name="settings_backup_restore", fontFamily="Material Symbols Sharp")
-    settings_bluetooth_sharp = IconData(name="settings_bluetooth", fontFamily="Material Symbols Sharp")
-    settings_brightness_sharp = IconData(name="settings_brightness", fontFamily="Material Symbols Sharp")
-    settings_cell_sharp = IconData(name="settings_cell", fontFamily="Material Symbols Sharp")
-    settings_cinematic_blur_sharp = IconData(name="settings_cinematic_blur", fontFamily="Material Symbols Sharp")
-    settings_ethernet_sharp = IconData(name="settings_ethernet", fontFamily="Material Symbols Sharp")
-    settings_heart_sharp = IconData(name="settings_heart", fontFamily="Material Symbols Sharp")
-    settings_input_antenna_sharp = IconData(name="settings_input_antenna", fontFamily="Material Symbols Sharp")
-    settings_input_component_sharp = IconData(name="settings_input_component", fontFamily="Material Symbols Sharp")
-    settings_input_composite_sharp = IconData(name="settings_input_composite", fontFamily="Material Symbols Sharp")
-    settings_input_hdmi_sharp = IconData(name="settings_input_hdmi", fontFamily="Material Symbols Sharp")
-    settings_input_svideo_sharp = IconData(name="settings_input_svideo", fontFamily="Material Symbols Sharp")
-    settings_motion_mode_sharp = IconData(name="settings_motion_mode", fontFamily="Material Symbols Sharp")
-    settings_night_sight_sharp = IconData(name="settings_night_sight", fontFamily="Material Symbols Sharp")
-    settings_overscan_sharp = IconData(name="settings_overscan", fontFamily="Material Symbols Sharp")
-    settings_panorama_sharp = IconData(name="settings_panorama", fontFamily="Material Symbols Sharp")
-    settings_phone_sharp = IconData(name="settings_phone", fontFamily="Material Symbols Sharp")
-    settings_photo_camera_sharp = IconData(name="settings_photo_camera", fontFamily="Material Symbols Sharp")
-    settings_power_sharp = IconData(name="settings_power", fontFamily="Material Symbols Sharp")
-    settings_remote_sharp = IconData(name="settings_remote", fontFamily="Material Symbols Sharp")
-    settings_slow_motion_sharp = IconData(name="settings_slow_motion", fontFamily="Material Symbols Sharp")
-    settings_suggest_sharp = IconData(name="settings_suggest", fontFamily="Material Symbols Sharp")
-    settings_system_daydream_sharp = IconData(name="settings_system_daydream", fontFamily="Material Symbols Sharp")
-    settings_timelapse_sharp = IconData(name="settings_timelapse", fontFamily="Material Symbols Sharp")
-    settings_video_camera_sharp = IconData(name="settings_video_camera", fontFamily="Material Symbols Sharp")
-    settings_voice_sharp = IconData(name="settings_voice", fontFamily="Material Symbols Sharp")
-    settop_component_sharp = IconData(name="settop_component", fontFamily="Material Symbols Sharp")
-    severe_cold_sharp = IconData(name="severe_cold", fontFamily="Material Symbols Sharp")
-    shadow_sharp = IconData(name="shadow", fontFamily="Material Symbols Sharp")
-    shadow_add_sharp = IconData(name="shadow_add", fontFamily="Material Symbols Sharp")
-    shadow_minus_sharp = IconData(name="shadow_minus", fontFamily="Material Symbols Sharp")
-    shape_line_sharp = IconData(name="shape_line", fontFamily="Material Symbols Sharp")
-    shape_recognition_sharp = IconData(name="shape_recognition", fontFamily="Material Symbols Sharp")
-    shapes_sharp = IconData(name="shapes", fontFamily="Material Symbols Sharp")
-    share_sharp = IconData(name="share", fontFamily="Material Symbols Sharp")
-    share_eta_sharp = IconData(name="share_eta", fontFamily="Material Symbols Sharp")
-    share_location_sharp = IconData(name="share_location", fontFamily="Material Symbols Sharp")
-    share_off_sharp = IconData(name="share_off", fontFamily="Material Symbols Sharp")
-    share_reviews_sharp = IconData(name="share_reviews", fontFamily="Material Symbols Sharp")
-    share_windows_sharp = IconData(name="share_windows", fontFamily="Material Symbols Sharp")
-    sheets_rtl_sharp = IconData(name="sheets_rtl", fontFamily="Material Symbols Sharp")
-    shelf_auto_hide_sharp = IconData(name="shelf_auto_hide", fontFamily="Material Symbols Sharp")
-    shelf_position_sharp = IconData(name="shelf_position", fontFamily="Material Symbols Sharp")
-    shelves_sharp = IconData(name="shelves", fontFamily="Material Symbols Sharp")
-    shield_sharp = IconData(name="shield", fontFamily="Material Symbols Sharp")
-    shield_lock_sharp = IconData(name="shield_lock", fontFamily="Material Symbols Sharp")
-    shield_locked_sharp = IconData(name="shield_locked", fontFamily="Material Symbols Sharp")
-    shield_moon_sharp = IconData(name="shield_moon", fontFamily="Material Symbols Sharp")
-    shield_person_sharp = IconData(name="shield_person", fontFamily="Material Symbols Sharp")
-    shield_question_sharp = IconData(name="shield_question", fontFamily="Material Symbols Sharp")
-    shield_watch_sharp = IconData(name="shield_watch", fontFamily="Material Symbols Sharp")
-    shield_with_heart_sharp = IconData(name="shield_with_heart", fontFamily="Material Symbols Sharp")
-    shield_with_house_sharp = IconData(name="shield_with_house", fontFamily="Material Symbols Sharp")
-    shift_sharp = IconData(name="shift", fontFamily="Material Symbols Sharp")
-    shift_lock_sharp = IconData(name="shift_lock", fontFamily="Material Symbols Sharp")
-    shift_lock_off_sharp = IconData(name="shift_lock_off", fontFamily="Material Symbols Sharp")
-    shop_sharp = IconData(name="shop", fontFamily="Material Symbols Sharp")
-    shop_2_sharp = IconData(name="shop_2", fontFamily="Material Symbols Sharp")
-    shop_two_sharp = IconData(name="shop_two", fontFamily="Material Symbols Sharp")
-    shopping_bag_sharp = IconData(name="shopping_bag", fontFamily="Material Symbols Sharp")
-    shopping_bag_speed_sharp = IconData(name="shopping_bag_speed", fontFamily="Material Symbols Sharp")
-    shopping_basket_sharp = IconData(name="shopping_basket", fontFamily="Material Symbols Sharp")
-    shopping_cart_sharp = IconData(name="shopping_cart", fontFamily="Material Symbols Sharp")
-    shopping_cart_checkout_sharp = IconData(name="shopping_cart_checkout", fontFamily="Material Symbols Sharp")
-    shopping_cart_off_sharp = IconData(name="shopping_cart_off", fontFamily="Material Symbols Sharp")
-    shoppingmode_sharp = IconData(name="shoppingmode", fontFamily="Material Symbols Sharp")
-    short_stay_sharp = IconData(name="short_stay", fontFamily="Material Symbols Sharp")
-    short_text_sharp = IconData(name="short_text", fontFamily="Material Symbols Sharp")
-    shortcut_sharp = IconData(name="shortcut", fontFamily="Material Symbols Sharp")
-    show_chart_sharp = IconData(name="show_chart", fontFamily="Material Symbols Sharp")
-    shower_sharp = IconData(name="shower", fontFamily="Material Symbols Sharp")
-    shuffle_sharp = IconData(name="shuffle", fontFamily="Material Symbols Sharp")
-    shuffle_on_sharp = IconData(name="shuffle_on", fontFamily="Material Symbols Sharp")
-    shutter_speed_sharp = IconData(name="shutter_speed", fontFamily="Material Symbols Sharp")
-    shutter_speed_add_sharp = IconData(name="shutter_speed_add", fontFamily="Material Symbols Sharp")
-    shutter_speed_minus_sharp = IconData(name="shutter_speed_minus", fontFamily="Material Symbols Sharp")
-    sick_sharp = IconData(name="sick", fontFamily="Material Symbols Sharp")
-    side_navigation_sharp = IconData(name="side_navigation", fontFamily="Material Symbols Sharp")
-    sign_language_sharp = IconData(name="sign_language", fontFamily="Material Symbols Sharp")
-    signal_cellular_0_bar_sharp = IconData(name="signal_cellular_0_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_1_bar_sharp = IconData(name="signal_cellular_1_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_2_bar_sharp = IconData(name="signal_cellular_2_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_3_bar_sharp = IconData(name="signal_cellular_3_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_4_bar_sharp = IconData(name="signal_cellular_4_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_add_sharp = IconData(name="signal_cellular_add", fontFamily="Material Symbols Sharp")
-    signal_cellular_alt_sharp = IconData(name="signal_cellular_alt", fontFamily="Material Symbols Sharp")
-    signal_cellular_alt_1_bar_sharp = IconData(name="signal_cellular_alt_1_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_alt_2_bar_sharp = IconData(name="signal_cellular_alt_2_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_connected_no_internet_0_bar_sharp = IconData(name="signal_cellular_connected_no_internet_0_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_connected_no_internet_4_bar_sharp = IconData(name="signal_cellular_connected_no_internet_4_bar", fontFamily="Material Symbols Sharp")
-    signal_cellular_no_sim_sharp = IconData(name="signal_cellular_no_sim", fontFamily="Material Symbols Sharp")
-    signal_cellular_nodata_sharp = IconData(name="signal_cellular_nodata", fontFamily="Material Symbols Sharp")
-    signal_cellular_null_sharp = IconData(name="signal_cellular_null", fontFamily="Material Symbols Sharp")
-    signal_cellular_off_sharp = IconData(name="signal_cellular_off", fontFamily="Material Symbols Sharp")
-    signal_cellular_pause_sharp = IconData(name="signal_cellular_pause", fontFamily="Material Symbols Sharp")
-    signal_disconnected_sharp = IconData(name="signal_disconnected", fontFamily="Material Symbols Sharp")
-    signal_wifi_0_bar_sharp = IconData(name="signal_wifi_0_bar", fontFamily="Material Symbols Sharp")
-    signal_wifi_4_bar_sharp = IconData(name="signal_wifi_4_bar", fontFamily="Material Symbols Sharp")
-    signal_wifi_4_bar_lock_sharp = IconData(name="signal_wifi_4_bar_lock", fontFamily="Material Symbols Sharp")
-    signal_wifi_bad_sharp = IconData(name="signal_wifi_bad", fontFamily="Material Symbols Sharp")
-    signal_wifi_connected_no_internet_4_sharp = IconData(name="signal_wifi_connected_no_internet_4", fontFamily="Material Symbols Sharp")
-    signal_wifi_off_sharp = IconData(name="signal_wifi_off", fontFamily="Material Symbols Sharp")
-    signal_wifi_statusbar_4_bar_sharp = IconData(name="signal_wifi_statusbar_4_bar", fontFamily="Material Symbols Sharp")
-    signal_wifi_statusbar_not_connected_sharp = IconData(name="signal_wifi_statusbar_not_connected", fontFamily="Material Symbols Sharp")
-    signal_wifi_statusbar_null_sharp = IconData(name="signal_wifi_statusbar_null", fontFamily="Material Symbols Sharp")
-    signature_sharp = IconData(name="signature", fontFamily="Material Symbols Sharp")
-    signpost_sharp = IconData(name="signpost", fontFamily="Material Symbols Sharp")
-    sim_card_sharp = IconData(name="sim_card", fontFamily="Material Symbols Sharp")
-    sim_card_alert_sharp = IconData(name="sim_card_alert", fontFamily="Material Symbols Sharp")
-    sim_card_download_sharp = IconData(name="sim_card_download", fontFamily="Material Symbols Sharp")
-    simulation_sharp = IconData(name="simulation", fontFamily="Material Symbols Sharp")
-    single_bed_sharp = IconData(name="single_bed", fontFamily="Material Symbols Sharp")
-    sip_sharp = IconData(name="sip", fontFamily="Material Symbols Sharp")
-    siren_sharp = IconData(name="siren", fontFamily="Material Symbols Sharp")
-    siren_check_sharp = IconData(name="siren_check", fontFamily="Material Symbols Sharp")
-    siren_open_sharp = IconData(name="siren_open", fontFamily="Material Symbols Sharp")
-    siren_question_sharp = IconData(name="siren_question", fontFamily="Material Symbols Sharp")
-    skateboarding_sharp = IconData(name="skateboarding", fontFamily="Material Symbols Sharp")
-    skeleton_sharp = IconData(name="skeleton", fontFamily="Material Symbols Sharp")
-    skillet_sharp = IconData(name="skillet", fontFamily="Material Symbols Sharp")
-    skillet_cooktop_sharp = IconData(name="skillet_cooktop", fontFamily="Material Symbols Sharp")
-    skip_next_sharp = IconData(name="skip_next", fontFamily="Material Symbols Sharp")
-    skip_previous_sharp = IconData(name="skip_previous", fontFamily="Material Symbols Sharp")
-    skull_sharp = IconData(name="skull", fontFamily="Material Symbols Sharp")
-    skull_list_sharp = IconData(name="skull_list", fontFamily="Material Symbols Sharp")
-    slab_serif_sharp = IconData(name="slab_serif", fontFamily="Material Symbols Sharp")
-    sledding_sharp = IconData(name="sledding", fontFamily="Material Symbols Sharp")
-    sleep_sharp = IconData(name="sleep", fontFamily="Material Symbols Sharp")
-    sleep_score_sharp = IconData(name="sleep_score", fontFamily="Material Symbols Sharp")
-    slide_library_sharp = IconData(name="slide_library", fontFamily="Material Symbols Sharp")
-    sliders_sharp = IconData(name="sliders", fontFamily="Material Symbols Sharp")
-    slideshow_sharp = IconData(name="slideshow", fontFamily="Material Symbols Sharp")
-    slow_motion_video_sharp = IconData(name="slow_motion_video", fontFamily="Material Symbols Sharp")
-    smart_button_sharp = IconData(name="smart_button", fontFamily="Material Symbols Sharp")
-    smart_card_reader_sharp = IconData(name="smart_card_reader", fontFamily="Material Symbols Sharp")
-    smart_card_reader_off_sharp = IconData(name="smart_card_reader_off", fontFamily="Material Symbols Sharp")
-    smart_display_sharp = IconData(name="smart_display", fontFamily="Material Symbols Sharp")
-    smart_outlet_sharp = IconData(name="smart_outlet", fontFamily="Material Symbols Sharp")
-    smart_screen_sharp = IconData(name="smart_screen", fontFamily="Material Symbols Sharp")
-    smart_toy_sharp = IconData(name="smart_toy", fontFamily="Material Symbols Sharp")
-    smartphone_sharp = IconData(name="smartphone", fontFamily="Material Symbols Sharp")
-    smartphone_camera_sharp = IconData(name="smartphone_camera", fontFamily="Material Symbols Sharp")
-    smb_share_sharp = IconData(name="smb_share", fontFamily="Material Symbols Sharp")
-    smoke_free_sharp = IconData(name="smoke_free", fontFamily="Material Symbols Sharp")
-    smoking_rooms_sharp = IconData(name="smoking_rooms", fontFamily="Material Symbols Sharp")
-    sms_sharp = IconData(name="sms", fontFamily="Material Symbols Sharp")
-    sms_failed_sharp = IconData(name="sms_failed", fontFamily="Material Symbols Sharp")
-    snippet_folder_sharp = IconData(name="snippet_folder", fontFamily="Material Symbols Sharp")
-    snooze_sharp = IconData(name="snooze", fontFamily="Material Symbols Sharp")
-    snowboarding_sharp = IconData(name="snowboarding", fontFamily="Material Symbols Sharp")
-    snowing_sharp = IconData(name="snowing", fontFamily="Material Symbols Sharp")
-    snowing_heavy_sharp = IconData(name="snowing_heavy", fontFamily="Material Symbols Sharp")
-    snowmobile_sharp = IconData(name="snowmobile", fontFamily="Material Symbols Sharp")
-    snowshoeing_sharp = IconData(name="snowshoeing", fontFamily="Material Symbols Sharp")
-    soap_sharp = IconData(name="soap", fontFamily="Material Symbols Sharp")
-    social_distance_sharp = IconData(name="social_distance", fontFamily="Material Symbols Sharp")
-    social_leaderboard_sharp = IconData(name="social_leaderboard", fontFamily="Material Symbols Sharp")
-    solar_power_sharp = IconData(name="solar_power", fontFamily="Material Symbols Sharp")
-    sort_sharp = IconData(name="sort", fontFamily="Material Symbols Sharp")
-    sort_by_alpha_sharp = IconData(name="sort_by_alpha", fontFamily="Material Symbols Sharp")
-    sos_sharp = IconData(name="sos", fontFamily="Material Symbols Sharp")
-    sound_detection_dog_barking_sharp = IconData(name="sound_detection_dog_barking", fontFamily="Material Symbols Sharp")
-    sound_detection_glass_break_sharp = IconData(name="sound_detection_glass_break", fontFamily="Material Symbols Sharp")
-    sound_detection_loud_sound_sharp = IconData(name="sound_detection_loud_sound", fontFamily="Material Symbols Sharp")
-    sound_sampler_sharp = IconData(name="sound_sampler", fontFamily="Material Symbols Sharp")
-    soup_kitchen_sharp = IconData(name="soup_kitchen", fontFamily="Material Symbols Sharp")
-    source_sharp = IconData(name="source", fontFamily="Material Symbols Sharp")
-    source_environment_sharp = IconData(name="source_environment", fontFamily="Material Symbols Sharp")
-    source_notes_sharp = IconData(name="source_notes", fontFamily="Material Symbols Sharp")
-    south_sharp = IconData(name="south", fontFamily="Material Symbols Sharp")
-    south_america_sharp = IconData(name="south_america", fontFamily="Material Symbols Sharp")
-    south_east_sharp = IconData(name="south_east", fontFamily="Material Symbols Sharp")
-    south_west_sharp = IconData(name="south_west", fontFamily="Material Symbols Sharp")
-    spa_sharp = IconData(name="spa", fontFamily="Material Symbols Sharp")
-    space_bar_sharp = IconData(name="space_bar", fontFamily="Material Symbols Sharp")
-    space_dashboard_sharp = IconData(name="space_dashboard", fontFamily="Material Symbols Sharp")
-    spatial_audio_sharp = IconData(name="spatial_audio", fontFamily="Material Symbols Sharp")
-    spatial_audio_off_sharp = IconData(name="spatial_audio_off", fontFamily="Material Symbols Sharp")
-    spatial_speaker_sharp = IconData(name="spatial_speaker", fontFamily="Material Symbols Sharp")
-    spatial_tracking_sharp = IconData(name="spatial_tracking", fontFamily="Material Symbols Sharp")
-    speaker_sharp = IconData(name="speaker", fontFamily="Material Symbols Sharp")
-    speaker_group_sharp = IconData(name="speaker_group", fontFamily="Material Symbols Sharp")
-    speaker_notes_sharp = IconData(name="speaker_notes", fontFamily="Material Symbols Sharp")
-    speaker_notes_off_sharp = IconData(name="speaker_notes_off", fontFamily="Material Symbols Sharp")
-    speaker_phone_sharp = IconData(name="speaker_phone", fontFamily="Material Symbols Sharp")
-    special_character_sharp = IconData(name="special_character", fontFamily="Material Symbols Sharp")
-    specific_gravity_sharp = IconData(name="specific_gravity", fontFamily="Material Symbols Sharp")
-    speech_to_text_sharp = IconData(name="speech_to_text", fontFamily="Material Symbols Sharp")
-    speed_sharp = IconData(name="speed", fontFamily="Material Symbols Sharp")
-    speed_0_25_sharp = IconData(name="speed_0_25", fontFamily="Material Symbols Sharp")
-    speed_0_2x_sharp = IconData(name="speed_0_2x", fontFamily="Material Symbols Sharp")
-    speed_0_5_sharp = IconData(name="speed_0_5", fontFamily="Material Symbols Sharp")
-    speed_0_5x_sharp = IconData(name="speed_0_5x", fontFamily="Material Symbols Sharp")
-    speed_0_75_sharp = IconData(name="speed_0_75", fontFamily="Material Symbols Sharp")
-    speed_0_7x_sharp = IconData(name="speed_0_7x", fontFamily="Material Symbols Sharp")
-    speed_1_2_sharp = IconData(name="speed_1_2", fontFamily="Material Symbols Sharp")
-    speed_1_25_sharp = IconData(name="speed_1_25", fontFamily="Material Symbols Sharp")
-    speed_1_2x_sharp = IconData(name="speed_1_2x", fontFamily="Material Symbols Sharp")
-    speed_1_5_sharp = IconData(name="speed_1_5", fontFamily="Material Symbols Sharp")
-    speed_1_5x_sharp = IconData(name="speed_1_5x", fontFamily="Material Symbols Sharp")
-    speed_1_75_sharp = IconData(name="speed_1_75", fontFamily="Material Symbols Sharp")
-    speed_1_7x_sharp = IconData(name="speed_1_7x", fontFamily="Material Symbols Sharp")
-    speed_2x_sharp = IconData(name="speed_2x", fontFamily="Material Symbols Sharp")
-    speed_camera_sharp = IconData(name="speed_camera", fontFamily="Material Symbols Sharp")
-    spellcheck_sharp = IconData(name="spellcheck", fontFamily="Material Symbols Sharp")
-    split_scene_sharp = IconData(name="split_scene", fontFamily="Material Symbols Sharp")
-    split_scene_down_sharp = IconData(name="split_scene_down", fontFamily="Material Symbols Sharp")
-    split_scene_left_sharp = IconData(name="split_scene_left", fontFamily="Material Symbols Sharp")
-    split_scene_right_sharp = IconData(name="split_scene_right", fontFamily="Material Symbols Sharp")
-    split_scene_up_sharp = IconData(name="split_scene_up", fontFamily="Material Symbols Sharp")
-    splitscreen_sharp = IconData(name="splitscreen", fontFamily="Material Symbols Sharp")
-    splitscreen_add_sharp = IconData(name="splitscreen_add", fontFamily="Material Symbols Sharp")
-    splitscreen_bottom_sharp = IconData(name="splitscreen_bottom", fontFamily="Material Symbols Sharp")
-    splitscreen_landscape_sharp = IconData(name="splitscreen_landscape", fontFamily="Material Symbols Sharp")
-    splitscreen_left_sharp = IconData(name="splitscreen_left", fontFamily="Material Symbols Sharp")
-    splitscreen_portrait_sharp = IconData(name="splitscreen_portrait", fontFamily="Material Symbols Sharp")
-    splitscreen_right_sharp = IconData(name="splitscreen_right", fontFamily="Material Symbols Sharp")
-    splitscreen_top_sharp = IconData(name="splitscreen_top", fontFamily="Material Symbols Sharp")
-    splitscreen_vertical_add_sharp = IconData(name="splitscreen_vertical_add", fontFamily="Material Symbols Sharp")
-    spo2_sharp = IconData(name="spo2", fontFamily="Material Symbols Sharp")
-    spoke_sharp = IconData(name="spoke", fontFamily="Material Symbols Sharp")
-    sports_sharp = IconData(name="sports", fontFamily="Material Symbols Sharp")
-    sports_and_outdoors_sharp = IconData(name="sports_and_outdoors", fontFamily="Material Symbols Sharp")
-    sports_bar_sharp = IconData(name="sports_bar", fontFamily="Material Symbols Sharp")
-    sports_baseball_sharp = IconData(name="sports_baseball", fontFamily="Material Symbols Sharp")
-    sports_basketball_sharp = IconData(name="sports_basketball", fontFamily="Material Symbols Sharp")
-    sports_cricket_sharp = IconData(name="sports_cricket", fontFamily="Material Symbols Sharp")
-    sports_esports_sharp = IconData(name="sports_esports", fontFamily="Material Symbols Sharp")
-    sports_football_sharp = IconData(name="sports_football", fontFamily="Material Symbols Sharp")
-    sports_golf_sharp = IconData(name="sports_golf", fontFamily="Material Symbols Sharp")
-    sports_gymnastics_sharp = IconData(name="sports_gymnastics", fontFamily="Material Symbols Sharp")
-    sports_handball_sharp = IconData(name="sports_handball", fontFamily="Material Symbols Sharp")
-    sports_hockey_sharp = IconData(name="sports_hockey", fontFamily="Material Symbols Sharp")
-    sports_kabaddi_sharp = IconData(name="sports_kabaddi", fontFamily="Material Symbols Sharp")
-    sports_martial_arts_sharp = IconData(name="sports_martial_arts", fontFamily="Material Symbols Sharp")
-    sports_mma_sharp = IconData(name="sports_mma", fontFamily="Material Symbols Sharp")
-    sports_motorsports_sharp = IconData(name="sports_motorsports", fontFamily="Material Symbols Sharp")
-    sports_rugby_sharp = IconData(name="sports_rugby", fontFamily="Material Symbols Sharp")
-    sports_score_sharp = IconData(name="sports_score", fontFamily="Material Symbols Sharp")
-    sports_soccer_sharp = IconData(name="sports_soccer", fontFamily="Material Symbols Sharp")
-    sports_tennis_sharp = IconData(name="sports_tennis", fontFamily="Material Symbols Sharp")
-    sports_volleyball_sharp = IconData(name="sports_volleyball", fontFamily="Material Symbols Sharp")
-    sprinkler_sharp = IconData(name="sprinkler", fontFamily="Material Symbols Sharp")
-    sprint_sharp = IconData(name="sprint", fontFamily="Material Symbols Sharp")
-    square_sharp = IconData(name="square", fontFamily="Material Symbols Sharp")
-    square_dot_sharp = IconData(name="square_dot", fontFamily="Material Symbols Sharp")
-    square_foot_sharp = IconData(name="square_foot", fontFamily="Material Symbols Sharp")
-    ssid_chart_sharp = IconData(name="ssid_chart", fontFamily="Material Symbols Sharp")
-    stack_sharp = IconData(name="stack", fontFamily="Material Symbols Sharp")
-    stack_group_sharp = IconData(name="stack_group", fontFamily="Material Symbols Sharp")
-    stack_hexagon_sharp = IconData(name="stack_hexagon", fontFamily="Material Symbols Sharp")
-    stack_off_sharp = IconData(name="stack_off", fontFamily="Material Symbols Sharp")
-    stack_star_sharp = IconData(name="stack_star", fontFamily="Material Symbols Sharp")
-    stacked_bar_chart_sharp = IconData(name="stacked_bar_chart", fontFamily="Material Symbols Sharp")
-    stacked_email_sharp = IconData(name="stacked_email", fontFamily="Material Symbols Sharp")
-    stacked_inbox_sharp = IconData(name="stacked_inbox", fontFamily="Material Symbols Sharp")
-    stacked_line_chart_sharp = IconData(name="stacked_line_chart", fontFamily="Material Symbols Sharp")
-    stacks_sharp = IconData(name="stacks", fontFamily="Material Symbols Sharp")
-    stadia_controller_sharp = IconData(name="stadia_controller", fontFamily="Material Symbols Sharp")
-    stadium_sharp = IconData(name="stadium", fontFamily="Material Symbols Sharp")
-    stairs_sharp = IconData(name="stairs", fontFamily="Material Symbols Sharp")
-    stairs_2_sharp = IconData(name="stairs_2", fontFamily="Material Symbols Sharp")
-    star_sharp = IconData(name="star", fontFamily="Material Symbols Sharp")
-    star_border_sharp = IconData(name="star_border", fontFamily="Material Symbols Sharp")
-    star_border_purple500_sharp = IconData(name="star_border_purple500", fontFamily="Material Symbols Sharp")
-    star_half_sharp = IconData(name="star_half", fontFamily="Material Symbols Sharp")
-    star_outline_sharp = IconData(name="star_outline", fontFamily="Material Symbols Sharp")
-    star_purple500_sharp = IconData(name="star_purple500", fontFamily="Material Symbols Sharp")
-    star_rate_sharp = IconData(name="star_rate", fontFamily="Material Symbols Sharp")
-    star_rate_half_sharp = IconData(name="star_rate_half", fontFamily="Material Symbols Sharp")
-    star_shine_sharp = IconData(name="star_shine", fontFamily="Material Symbols Sharp")
-    stars_sharp = IconData(name="stars", fontFamily="Material Symbols Sharp")
-    stars_2_sharp = IconData(name="stars_2", fontFamily="Material Symbols Sharp")
-    start_sharp = IconData(name="start", fontFamily="Material Symbols Sharp")
-    stat_0_sharp = IconData(name="stat_0", fontFamily="Material Symbols Sharp")
-    stat_1_sharp = IconData(name="stat_1", fontFamily="Material Symbols Sharp")
-    stat_2_sharp = IconData(name="stat_2", fontFamily="Material Symbols Sharp")
-    stat_3_sharp = IconData(name="stat_3", fontFamily="Material Symbols Sharp")
-    stat_minus_1_sharp = IconData(name="stat_minus_1", fontFamily="Material Symbols Sharp")
-    stat_minus_2_sharp = IconData(name="stat_minus_2", fontFamily="Material Symbols Sharp")
-    stat_minus_3_sharp = IconData(name="stat_minus_3", fontFamily="Material Symbols Sharp")
-    stay_current_landscape_sharp = IconData(name="stay_current_landscape", fontFamily="Material Symbols Sharp")
-    stay_current_portrait_sharp = IconData(name="stay_current_portrait", fontFamily="Material Symbols Sharp")
-    stay_primary_landscape_sharp = IconData(name="stay_primary_landscape", fontFamily="Material Symbols Sharp")
-    stay_primary_portrait_sharp = IconData(name="stay_primary_portrait", fontFamily="Material Symbols Sharp")
-    steering_wheel_heat_sharp = IconData(name="steering_wheel_heat", fontFamily="Material Symbols Sharp")
-    step_sharp = IconData(name="step", fontFamily="Material Symbols Sharp")
-    step_into_sharp = IconData(name="step_into", fontFamily="Material Symbols Sharp")
-    step_out_sharp = IconData(name="step_out", fontFamily="Material Symbols Sharp")
-    step_over_sharp = IconData(name="step_over", fontFamily="Material Symbols Sharp")
-    steppers_sharp = IconData(name="steppers", fontFamily="Material Symbols Sharp")
-    steps_sharp = IconData(name="steps", fontFamily="Material Symbols Sharp")
-    stethoscope_sharp = IconData(name="stethoscope", fontFamily="Material Symbols Sharp")
-    stethoscope_arrow_sharp = IconData(name="stethoscope_arrow", fontFamily="Material Symbols Sharp")
-    stethoscope_check_sharp = IconData(name="stethoscope_check", fontFamily="Material Symbols Sharp")
-    sticky_note_sharp = IconData(name="sticky_note", fontFamily="Material Symbols Sharp")
-    sticky_note_2_sharp = IconData(name="sticky_note_2", fontFamily="Material Symbols Sharp")
-    stock_media_sharp = IconData(name="stock_media", fontFamily="Material Symbols Sharp")
-    stockpot_sharp = IconData(name="stockpot", fontFamily="Material Symbols Sharp")
-    stop_sharp = IconData(name="stop", fontFamily="Material Symbols Sharp")
-    stop_circle_sharp = IconData(name="stop_circle", fontFamily="Material Symbols Sharp")
-    stop_screen_share_sharp = IconData(name="stop_screen_share", fontFamily="Material Symbols Sharp")
-    storage_sharp = IconData(name="storage", fontFamily="Material Symbols Sharp")
-    store_sharp = IconData(name="store", fontFamily="Material Symbols Sharp")
-    store_mall_directory_sharp = IconData(name="store_mall_directory", fontFamily="Material Symbols Sharp")
-    storefront_sharp = IconData(name="storefront", fontFamily="Material Symbols Sharp")
-    storm_sharp = IconData(name="storm", fontFamily="Material Symbols Sharp")
-    straight_sharp = IconData(name="straight", fontFamily="Material Symbols Sharp")
-    straighten_sharp = IconData(name="straighten", fontFamily="Material Symbols Sharp")
-    strategy_sharp = IconData(name="strategy", fontFamily="Material Symbols Sharp")
-    stream_sharp = IconData(name="stream", fontFamily="Material Symbols Sharp")
-    stream_apps_sharp = IconData(name="stream_apps", fontFamily="Material Symbols Sharp")
-    streetview_sharp = IconData(name="streetview", fontFamily="Material Symbols Sharp")
-    stress_management_sharp = IconData(name="stress_management", fontFamily="Material Symbols Sharp")
-    strikethrough_s_sharp = IconData(name="strikethrough_s", fontFamily="Material Symbols Sharp")
-    stroke_full_sharp = IconData(name="stroke_full", fontFamily="Material Symbols Sharp")
-    stroke_partial_sharp = IconData(name="stroke_partial", fontFamily="Material Symbols Sharp")
-    stroller_sharp = IconData(name="stroller", fontFamily="Material Symbols Sharp")
-    style_sharp = IconData(name="style", fontFamily="Material Symbols Sharp")
-    styler_sharp = IconData(name="styler", fontFamily="Material Symbols Sharp")
-    stylus_sharp = IconData(name="stylus", fontFamily="Material Symbols Sharp")
-    stylus_brush_sharp = IconData(name="stylus_brush", fontFamily="Material Symbols Sharp")
-    stylus_fountain_pen_sharp = IconData(name="stylus_fountain_pen", fontFamily="Material Symbols Sharp")
-    stylus_highlighter_sharp = IconData(name="stylus_highlighter", fontFamily="Material Symbols Sharp")
-    stylus_laser_pointer_sharp = IconData(name="stylus_laser_pointer", fontFamily="Material Symbols Sharp")
-    stylus_note_sharp = IconData(name="stylus_note", fontFamily="Material Symbols Sharp")
-    stylus_pen_sharp = IconData(name="stylus_pen", fontFamily="Material Symbols Sharp")
-    stylus_pencil_sharp = IconData(name="stylus_pencil", fontFamily="Material Symbols Sharp")
-    subdirectory_arrow_left_sharp = IconData(name="subdirectory_arrow_left", fontFamily="Material Symbols Sharp")
-    subdirectory_arrow_right_sharp = IconData(name="subdirectory_arrow_right", fontFamily="Material Symbols Sharp")
-    subheader_sharp = IconData(name="subheader", fontFamily="Material Symbols Sharp")
-    subject_sharp = IconData(name="subject", fontFamily="Material Symbols Sharp")
-    subscript_sharp = IconData(name="subscript", fontFamily="Material Symbols Sharp")
-    subscriptions_sharp = IconData(name="subscriptions", fontFamily="Material Symbols Sharp")
-    subtitles_sharp = IconData(name="subtitles", fontFamily="Material Symbols Sharp")
-    subtitles_gear_sharp = IconData(name="subtitles_gear", fontFamily="Material Symbols Sharp")
-    subtitles_off_sharp = IconData(name="subtitles_off", fontFamily="Material Symbols Sharp")
-    subway_sharp = IconData(name="subway", fontFamily="Material Symbols Sharp")
-    summarize_sharp = IconData(name="summarize", fontFamily="Material Symbols Sharp")
-    sunny_sharp = IconData(name="sunny", fontFamily="Material Symbols Sharp")
-    sunny_snowing_sharp = IconData(name="sunny_snowing", fontFamily="Material Symbols Sharp")
-    superscript_sharp = IconData(name="superscript", fontFamily="Material Symbols Sharp")
-    supervised_user_circle_sharp = IconData(name="supervised_user_circle", fontFamily="Material Symbols Sharp")
-    supervised_user_circle_off_sharp = IconData(name="supervised_user_circle_off", fontFamily="Material Symbols Sharp")
-    supervisor_account_sharp = IconData(name="supervisor_account", fontFamily="Material Symbols Sharp")
-    support_sharp = IconData(name="support", fontFamily="Material Symbols Sharp")
-    support_agent_sharp = IconData(name="support_agent", fontFamily="Material Symbols Sharp")
-    surfing_sharp = IconData(name="surfing", fontFamily="Material Symbols Sharp")
-    surgical_sharp = IconData(name="surgical", fontFamily="Material Symbols Sharp")
-    surround_sound_sharp = IconData(name="surround_sound", fontFamily="Material Symbols Sharp")
-    swap_calls_sharp = IconData(name="swap_calls", fontFamily="Material Symbols Sharp")
-    swap_driving_apps_sharp = IconData(name="swap_driving_apps", fontFamily="Material Symbols Sharp")
-    swap_driving_apps_wheel_sharp = IconData(name="swap_driving_apps_wheel", fontFamily="Material Symbols Sharp")
-    swap_horiz_sharp = IconData(name="swap_horiz", fontFamily="Material Symbols Sharp")
-    swap_horizontal_circle_sharp = IconData(name="swap_horizontal_circle", fontFamily="Material Symbols Sharp")
-    swap_vert_sharp = IconData(name="swap_vert", fontFamily="Material Symbols Sharp")
-    swap_vertical_circle_sharp = IconData(name="swap_vertical_circle", fontFamily="Material Symbols Sharp")
-    sweep_sharp = IconData(name="sweep", fontFamily="Material Symbols Sharp")
-    swipe_sharp = IconData(name="swipe", fontFamily="Material Symbols Sharp")
-    swipe_down_sharp = IconData(name="swipe_down", fontFamily="Material Symbols Sharp")
-    swipe_down_alt_sharp = IconData(name="swipe_down_alt", fontFamily="Material Symbols Sharp")
-    swipe_left_sharp = IconData(name="swipe_left", fontFamily="Material Symbols Sharp")
-    swipe_left_alt_sharp = IconData(name="swipe_left_alt", fontFamily="Material Symbols Sharp")
-    swipe_right_sharp = IconData(name="swipe_right", fontFamily="Material Symbols Sharp")
-    swipe_right_alt_sharp = IconData(name="swipe_right_alt", fontFamily="Material Symbols Sharp")
-    swipe_up_sharp = IconData(name="swipe_up", fontFamily="Material Symbols Sharp")
-    swipe_up_alt_sharp = IconData(name="swipe_up_alt", fontFamily="Material Symbols Sharp")
-    swipe_vertical_sharp = IconData(name="swipe_vertical", fontFamily="Material Symbols Sharp")
-    switch_sharp = IconData(name="switch", fontFamily="Material Symbols Sharp")
-    switch_access_sharp = IconData(name="switch_access", fontFamily="Material Symbols Sharp")
-    switch_access_2_sharp = IconData(name="switch_access_2", fontFamily="Material Symbols Sharp")
-    switch_access_3_sharp = IconData(name="switch_access_3", fontFamily="Material Symbols Sharp")
-    switch_access_shortcut_sharp = IconData(name="switch_access_shortcut", fontFamily="Material Symbols Sharp")
-    switch_access_shortcut_add_sharp = IconData(name="switch_access_shortcut_add", fontFamily="Material Symbols Sharp")
-    switch_account_sharp = IconData(name="switch_account", fontFamily="Material Symbols Sharp")
-    switch_camera_sharp = IconData(name="switch_camera", fontFamily="Material Symbols Sharp")
-    switch_left_sharp = IconData(name="switch_left", fontFamily="Material Symbols Sharp")
-    switch_right_sharp = IconData(name="switch_right", fontFamily="Material Symbols Sharp")
-    switch_video_sharp = IconData(name="switch_video", fontFamily="Material Symbols Sharp")
-    switches_sharp = IconData(name="switches", fontFamily="Material Symbols Sharp")
-    sword_rose_sharp = IconData(name="sword_rose", fontFamily="Material Symbols Sharp")
-    swords_sharp = IconData(name="swords", fontFamily="Material Symbols Sharp")
-    symptoms_sharp = IconData(name="symptoms", fontFamily="Material Symbols Sharp")
-    synagogue_sharp = IconData(name="synagogue", fontFamily="Material Symbols Sharp")
-    sync_sharp = IconData(name="sync", fontFamily="Material Symbols Sharp")
-    sync_alt_sharp = IconData(name="sync_alt", fontFamily="Material Symbols Sharp")
-    sync_arrow_down_sharp = IconData(name="sync_arrow_down", fontFamily="Material Symbols Sharp")
-    sync_arrow_up_sharp = IconData(name="sync_arrow_up", fontFamily="Material Symbols Sharp")
-    sync_desktop_sharp = IconData(name="sync_desktop", fontFamily="Material Symbols Sharp")
-    sync_disabled_sharp = IconData(name="sync_disabled", fontFamily="Material Symbols Sharp")
-    sync_lock_sharp = IconData(name="sync_lock", fontFamily="Material Symbols Sharp")
-    sync_problem_sharp = IconData(name="sync_problem", fontFamily="Material Symbols Sharp")
-    sync_saved_locally_sharp = IconData(name="sync_saved_locally", fontFamily="Material Symbols Sharp")
-    syringe_sharp = IconData(name="syringe", fontFamily="Material Symbols Sharp")
-    system_security_update_sharp = IconData(name="system_security_update", fontFamily="Material Symbols Sharp")
-    system_security_update_good_sharp = IconData(name="system_security_update_good", fontFamily="Material Symbols Sharp")
-    system_security_update_warning_sharp = IconData(name="system_security_update_warning", fontFamily="Material Symbols Sharp")
-    system_update_sharp = IconData(name="system_update", fontFamily="Material Symbols Sharp")
-    system_update_alt_sharp = IconData(name="system_update_alt", fontFamily="Material Symbols Sharp")
-    tab_sharp = IconData(name="tab", fontFamily="Material Symbols Sharp")
-    tab_close_sharp = IconData(name="tab_close", fontFamily="Material Symbols Sharp")
-    tab_close_inactive_sharp = IconData(name="tab_close_inactive", fontFamily="Material Symbols Sharp")
-    tab_close_right_sharp = IconData(name="tab_close_right", fontFamily="Material Symbols Sharp")
-    tab_duplicate_sharp = IconData(name="tab_duplicate", fontFamily="Material Symbols Sharp")
-    tab_group_sharp = IconData(name="tab_group", fontFamily="Material Symbols Sharp")
-    tab_inactive_sharp = IconData(name="tab_inactive", fontFamily="Material Symbols Sharp")
-    tab_move_sharp = IconData(name="tab_move", fontFamily="Material Symbols Sharp")
-    tab_new_right_sharp = IconData(name="tab_new_right", fontFamily="Material Symbols Sharp")
-    tab_recent_sharp = IconData(name="tab_recent", fontFamily="Material Symbols Sharp")
-    tab_search_sharp = IconData(name="tab_search", fontFamily="Material Symbols Sharp")
-    tab_unselected_sharp = IconData(name="tab_unselected", fontFamily="Material Symbols Sharp")
-    table_sharp = IconData(name="table", fontFamily="Material Symbols Sharp")
-    table_bar_sharp = IconData(name="table_bar", fontFamily="Material Symbols Sharp")
-    table_chart_sharp = IconData(name="table_chart", fontFamily="Material Symbols Sharp")
-    table_chart_view_sharp = IconData(name="table_chart_view", fontFamily="Material Symbols Sharp")
-    table_convert_sharp = IconData(name="table_convert", fontFamily="Material Symbols Sharp")
-    table_edit_sharp = IconData(name="table_edit", fontFamily="Material Symbols Sharp")
-    table_eye_sharp = IconData(name="table_eye", fontFamily="Material Symbols Sharp")
-    table_lamp_sharp = IconData(name="table_lamp", fontFamily="Material Symbols Sharp")
-    table_restaurant_sharp = IconData(name="table_restaurant", fontFamily="Material Symbols Sharp")
-    table_rows_sharp = IconData(name="table_rows", fontFamily="Material Symbols Sharp")
-    table_rows_narrow_sharp = IconData(name="table_rows_narrow", fontFamily="Material Symbols Sharp")
-    table_view_sharp = IconData(name="table_view", fontFamily="Material Symbols Sharp")
-    tablet_sharp = IconData(name="tablet", fontFamily="Material Symbols Sharp")
-    tablet_android_sharp = IconData(name="tablet_android", fontFamily="Material Symbols Sharp")
-    tablet_camera_sharp = IconData(name="tablet_camera", fontFamily="Material Symbols Sharp")
-    tablet_mac_sharp = IconData(name="tablet_mac", fontFamily="Material Symbols Sharp")
-    tabs_sharp = IconData(name="tabs", fontFamily="Material Symbols Sharp")
-    tactic_sharp = IconData(name="tactic", fontFamily="Material Symbols Sharp")
-    tag_sharp = IconData(name="tag", fontFamily="Material Symbols Sharp")
-    tag_faces_sharp = IconData(name="tag_faces", fontFamily="Material Symbols Sharp")
-    takeout_dining_sharp = IconData(name="takeout_dining", fontFamily="Material Symbols Sharp")
-    tamper_detection_off_sharp = IconData(name="tamper_detection_off", fontFamily="Material Symbols Sharp")
-    tamper_detection_on_sharp = IconData(name="tamper_detection_on", fontFamily="Material Symbols Sharp")
-    tap_and_play_sharp = IconData(name="tap_and_play", fontFamily="Material Symbols Sharp")
-    tapas_sharp = IconData(name="tapas", fontFamily="Material Symbols Sharp")
-    target_sharp = IconData(name="target", fontFamily="Material Symbols Sharp")
-    task_sharp = IconData(name="task", fontFamily="Material Symbols Sharp")
-    task_alt_sharp = IconData(name="task_alt", fontFamily="Material Symbols Sharp")
-    taunt_sharp = IconData(name="taunt", fontFamily="Material Symbols Sharp")
-    taxi_alert_sharp = IconData(name="taxi_alert", fontFamily="Material Symbols Sharp")
-    team_dashboard_sharp = IconData(name="team_dashboard", fontFamily="Material Symbols Sharp")
-    temp_preferences_custom_sharp = IconData(name="temp_preferences_custom", fontFamily="Material Symbols Sharp")
-    temp_preferences_eco_sharp = IconData(name="temp_preferences_eco", fontFamily="Material Symbols Sharp")
-    temple_buddhist_sharp = IconData(name="temple_buddhist", fontFamily="Material Symbols Sharp")
-    temple_hindu_sharp = IconData(name="temple_hindu", fontFamily="Material Symbols Sharp")
-    tenancy_sharp = IconData(name="tenancy", fontFamily="Material Symbols Sharp")
-    terminal_sharp = IconData(name="terminal", fontFamily="Material Symbols Sharp")
-    terrain_sharp = IconData(name="terrain", fontFamily="Material Symbols Sharp")
-    text_ad_sharp = IconData(name="text_ad", fontFamily="Material Symbols Sharp")
-    text_compare_sharp = IconData(name="text_compare", fontFamily="Material Symbols Sharp")
-    text_decrease_sharp = IconData(name="text_decrease", fontFamily="Material Symbols Sharp")
-    text_fields_sharp = IconData(name="text_fields", fontFamily="Material Symbols Sharp")
-    text_fields_alt_sharp = IconData(name="text_fields_alt", fontFamily="Material Symbols Sharp")
-    text_format_sharp = IconData(name="text_format", fontFamily="Material Symbols Sharp")
-    text_increase_sharp = IconData(name="text_increase", fontFamily="Material Symbols Sharp")
-    text_rotate_up_sharp = IconData(name="text_rotate_up", fontFamily="Material Symbols Sharp")
-    text_rotate_vertical_sharp = IconData(name="text_rotate_vertical", fontFamily="Material Symbols Sharp")
-    text_rotation_angledown_sharp = IconData(name="text_rotation_angledown", fontFamily="Material Symbols Sharp")
-    text_rotation_angleup_sharp = IconData(name="text_rotation_angleup", fontFamily="Material Symbols Sharp")
-    text_rotation_down_sharp = IconData(name="text_rotation_down", fontFamily="Material Symbols Sharp")
-    text_rotation_none_sharp = IconData(name="text_rotation_none", fontFamily="Material Symbols Sharp")
-    text_select_end_sharp = IconData(name="text_select_end", fontFamily="Material Symbols Sharp")
-    text_select_jump_to_beginning_sharp = IconData(name="text_select_jump_to_beginning", fontFamily="Material Symbols Sharp")
-    text_select_jump_to_end_sharp = IconData(name="text_select_jump_to_end", fontFamily="Material Symbols Sharp")
-    text_select_move_back_character_sharp = IconData(name="text_select_move_back_character", fontFamily="Material Symbols Sharp")
-    text_select_move_back_word_sharp = IconData(name="text_select_move_back_word", fontFamily="Material Symbols Sharp")
-    text_select_move_down_sharp = IconData(name="text_select_move_down", fontFamily="Material Symbols Sharp")
-    text_select_move_forward_character_sharp = IconData(name="text_select_move_forward_character", fontFamily="Material Symbols Sharp")
-    text_select_move_forward_word_sharp = IconData(name="text_select_move_forward_word", fontFamily="Material Symbols Sharp")
-    text_select_move_up_sharp = IconData(name="text_select_move_up", fontFamily="Material Symbols Sharp")
-    text_select_start_sharp = IconData(name="text_select_start", fontFamily="Material Symbols Sharp")
-    text_snippet_sharp = IconData(name="text_snippet", fontFamily="Material Symbols Sharp")
-    text_to_speech_sharp = IconData(name="text_to_speech", fontFamily="Material Symbols Sharp")
-    text_up_sharp = IconData(name="text_up", fontFamily="Material Symbols Sharp")
-    textsms_sharp = IconData(name="textsms", fontFamily="Material Symbols Sharp")
-    texture_sharp = IconData(name="texture", fontFamily="Material Symbols Sharp")
-    texture_add_sharp = IconData(name="texture_add", fontFamily="Material Symbols Sharp")
-    texture_minus_sharp = IconData(name="texture_minus", fontFamily="Material Symbols Sharp")
-    theater_comedy_sharp = IconData(name="theater_comedy", fontFamily="Material Symbols Sharp")
-    theaters_sharp = IconData(name="theaters", fontFamily="Material Symbols Sharp")
-    thermometer_sharp = IconData(name="thermometer", fontFamily="Material Symbols Sharp")
-    thermometer_add_sharp = IconData(name="thermometer_add", fontFamily="Material Symbols Sharp")
-    thermometer_gain_sharp = IconData(name="thermometer_gain", fontFamily="Material Symbols Sharp")
-    thermometer_loss_sharp = IconData(name="thermometer_loss", fontFamily="Material Symbols Sharp")
-    thermometer_minus_sharp = IconData(name="thermometer_minus", fontFamily="Material Symbols Sharp")
-    thermostat_sharp = IconData(name="thermostat", fontFamily="Material Symbols Sharp")
-    thermostat_arrow_down_sharp = IconData(name="thermostat_arrow_down", fontFamily="Material Symbols Sharp")
-    thermostat_arrow_up_sharp = IconData(name="thermostat_arrow_up", fontFamily="Material Symbols Sharp")
-    thermostat_auto_sharp = IconData(name="thermostat_auto", fontFamily="Material Symbols Sharp")
-    thermostat_carbon_sharp = IconData(name="thermostat_carbon", fontFamily="Material Symbols Sharp")
-    things_to_do_sharp = IconData(name="things_to_do", fontFamily="Material Symbols Sharp")
-    thread_unread_sharp = IconData(name="thread_unread", fontFamily="Material Symbols Sharp")
-    threat_intelligence_sharp = IconData(name="threat_intelligence", fontFamily="Material Symbols Sharp")
-    thumb_down_sharp = IconData(name="thumb_down", fontFamily="Material Symbols Sharp")
-    thumb_down_alt_sharp = IconData(name="thumb_down_alt", fontFamily="Material Symbols Sharp")
-    thumb_down_filled_sharp = IconData(name="thumb_down_filled", fontFamily="Material Symbols Sharp")
-    thumb_down_off_sharp = IconData(name="thumb_down_off", fontFamily="Material Symbols Sharp")
-    thumb_down_off_alt_sharp = IconData(name="thumb_down_off_alt", fontFamily="Material Symbols Sharp")
-    thumb_up_sharp = IconData(name="thumb_up", fontFamily="Material Symbols Sharp")
-    thumb_up_alt_sharp = IconData(name="thumb_up_alt", fontFamily="Material Symbols Sharp")
-    thumb_up_filled_sharp = IconData(name="thumb_up_filled", fontFamily="Material Symbols Sharp")
-    thumb_up_off_sharp = IconData(name="thumb_up_off", fontFamily="Material Symbols Sharp")
-    thumb_up_off_alt_sharp = IconData(name="thumb_up_off_alt", fontFamily="Material Symbols Sharp")
-    thumbnail_bar_sharp = IconData(name="thumbnail_bar", fontFamily="Material Symbols Sharp")
-    thumbs_up_down_sharp = IconData(name="thumbs_up_down", fontFamily="Material Symbols Sharp")
-    thunderstorm_sharp = IconData(name="thunderstorm", fontFamily="Material Symbols Sharp")
-    tibia_sharp = IconData(name="tibia", fontFamily="Material Symbols Sharp")
-    tibia_alt_sharp = IconData(name="tibia_alt", fontFamily="Material Symbols Sharp")
-    tile_large_sharp = IconData(name="tile_large", fontFamily="Material Symbols Sharp")
-    tile_medium_sharp = IconData(name="tile_medium", fontFamily="Material Symbols Sharp")
-    tile_small_sharp = IconData(name="tile_small", fontFamily="Material Symbols Sharp")
-    time_auto_sharp = IconData(name="time_auto", fontFamily="Material Symbols Sharp")
-    time_to_leave_sharp = IconData(name="time_to_leave", fontFamily="Material Symbols Sharp")
-    timelapse_sharp = IconData(name="timelapse", fontFamily="Material Symbols Sharp")
-    timeline_sharp = IconData(name="timeline", fontFamily="Material Symbols Sharp")
-    timer_sharp = IconData(name="timer", fontFamily="Material Symbols Sharp")
-    timer_10_sharp = IconData(name="timer_10", fontFamily="Material Symbols Sharp")
-    timer_10_alt_1_sharp = IconData(name="timer_10_alt_1", fontFamily="Material Symbols Sharp")
-    timer_10_select_sharp = IconData(name="timer_10_select", fontFamily="Material Symbols Sharp")
-    timer_3_sharp = IconData(name="timer_3", fontFamily="Material Symbols Sharp")
-    timer_3_alt_1_sharp = IconData(name="timer_3_alt_1", fontFamily="Material Symbols Sharp")
-    timer_3_select_sharp = IconData(name="timer_3_select", fontFamily="Material Symbols Sharp")
-    timer_5_sharp = IconData(name="timer_5", fontFamily="Material Symbols Sharp")
-    timer_5_shutter_sharp = IconData(name="timer_5_shutter", fontFamily="Material Symbols Sharp")
-    timer_arrow_down_sharp = IconData(name="timer_arrow_down", fontFamily="Material Symbols Sharp")
-    timer_arrow_up_sharp = IconData(name="timer_arrow_up", fontFamily="Material Symbols Sharp")
-    timer_off_sharp = IconData(name="timer_off", fontFamily="Material Symbols Sharp")
-    timer_pause_sharp = IconData(name="timer_pause", fontFamily="Material Symbols Sharp")
-    timer_play_sharp = IconData(name="timer_play", fontFamily="Material Symbols Sharp")
-    tips_and_updates_sharp = IconData(name="tips_and_updates", fontFamily="Material Symbols Sharp")
-    tire_repair_sharp = IconData(name="tire_repair", fontFamily="Material Symbols Sharp")
-    title_sharp = IconData(name="title", fontFamily="Material Symbols Sharp")
-    titlecase_sharp = IconData(name="titlecase", fontFamily="Material Symbols Sharp")
-    toast_sharp = IconData(name="toast", fontFamily="Material Symbols Sharp")
-    toc_sharp = IconData(name="toc", fontFamily="Material Symbols Sharp")
-    today_sharp = IconData(name="today", fontFamily="Material Symbols Sharp")
-    toggle_off_sharp = IconData(name="toggle_off", fontFamily="Material Symbols Sharp")
-    toggle_on_sharp = IconData(name="toggle_on", fontFamily="Material Symbols Sharp")
-    token_sharp = IconData(name="token", fontFamily="Material Symbols Sharp")
-    toll_sharp = IconData(name="toll", fontFamily="Material Symbols Sharp")
-    tonality_sharp = IconData(name="tonality", fontFamily="Material Symbols Sharp")
-    toolbar_sharp = IconData(name="toolbar", fontFamily="Material Symbols Sharp")
-    tools_flat_head_sharp = IconData(name="tools_flat_head", fontFamily="Material Symbols Sharp")
-    tools_installation_kit_sharp = IconData(name="tools_installation_kit", fontFamily="Material Symbols Sharp")
-    tools_ladder_sharp = IconData(name="tools_ladder", fontFamily="Material Symbols Sharp")
-    tools_level_sharp = IconData(name="tools_level", fontFamily="Material Symbols Sharp")
-    tools_phillips_sharp = IconData(name="tools_phillips", fontFamily="Material Symbols Sharp")
-    tools_pliers_wire_stripper_sharp = IconData(name="tools_pliers_wire_stripper", fontFamily="Material Symbols Sharp")
-    tools_power_drill_sharp = IconData(name="tools_power_drill", fontFamily="Material Symbols Sharp")
-    tools_wrench_sharp = IconData(name="tools_wrench", fontFamily="Material Symbols Sharp")
-    tooltip_sharp = IconData(name="tooltip", fontFamily="Material Symbols Sharp")
-    tooltip_2_sharp = IconData(name="tooltip_2", fontFamily="Material Symbols Sharp")
-    top_panel_close_sharp = IconData(name="top_panel_close", fontFamily="Material Symbols Sharp")
-    top_panel_open_sharp = IconData(name="top_panel_open", fontFamily="Material Symbols Sharp")
-    topic_sharp = IconData(name="topic", fontFamily="Material Symbols Sharp")
-    tornado_sharp = IconData(name="tornado", fontFamily="Material Symbols Sharp")
-    total_dissolved_solids_sharp = IconData(name="total_dissolved_solids", fontFamily="Material Symbols Sharp")
-    touch_app_sharp = IconData(name="touch_app", fontFamily="Material Symbols Sharp")
-    touch_double_sharp = IconData(name="touch_double", fontFamily="Material Symbols Sharp")
-    touch_long_sharp = IconData(name="touch_long", fontFamily="Material Symbols Sharp")
-    touch_triple_sharp = IconData(name="touch_triple", fontFamily="Material Symbols Sharp")
-    touchpad_mouse_sharp = IconData(name="touchpad_mouse", fontFamily="Material Symbols Sharp")
-    touchpad_mouse_off_sharp = IconData(name="touchpad_mouse_off", fontFamily="Material Symbols Sharp")
-    tour_sharp = IconData(name="tour", fontFamily="Material Symbols Sharp")
-    toys_sharp = IconData(name="toys", fontFamily="Material Symbols Sharp")
-    toys_and_games_sharp = IconData(name="toys_and_games", fontFamily="Material Symbols Sharp")
-    toys_fan_sharp = IconData(name="toys_fan", fontFamily="Material Symbols Sharp")
-    track_changes_sharp = IconData(name="track_changes", fontFamily="Material Symbols Sharp")
-    trackpad_input_sharp = IconData(name="trackpad_input", fontFamily="Material Symbols Sharp")
-    trackpad_input_2_sharp = IconData(name="trackpad_input_2", fontFamily="Material Symbols Sharp")
-    trackpad_input_3_sharp = IconData(name="trackpad_input_3", fontFamily="Material Symbols Sharp")
-    traffic_sharp = IconData(name="traffic", fontFamily="Material Symbols Sharp")
-    traffic_jam_sharp = IconData(name="traffic_jam", fontFamily="Material Symbols Sharp")
-    trail_length_sharp = IconData(name="trail_length", fontFamily="Material Symbols Sharp")
-    trail_length_medium_sharp = IconData(name="trail_length_medium", fontFamily="Material Symbols Sharp")
-    trail_length_short_sharp = IconData(name="trail_length_short", fontFamily="Material Symbols Sharp")
-    train_sharp = IconData(name="train", fontFamily="Material Symbols Sharp")
-    tram_sharp = IconData(name="tram", fontFamily="Material Symbols Sharp")
-    transcribe_sharp = IconData(name="transcribe", fontFamily="Material Symbols Sharp")
-    transfer_within_a_station_sharp = IconData(name="transfer_within_a_station", fontFamily="Material Symbols Sharp")
-    transform_sharp = IconData(name="transform", fontFamily="Material Symbols Sharp")
-    transgender_sharp = IconData(name="transgender", fontFamily="Material Symbols Sharp")
-    transit_enterexit_sharp = IconData(name="transit_enterexit", fontFamily="Material Symbols Sharp")
-    transit_ticket_sharp = IconData(name="transit_ticket", fontFamily="Material Symbols Sharp")
-    transition_chop_sharp = IconData(name="transition_chop", fontFamily="Material Symbols Sharp")
-    transition_dissolve_sharp = IconData(name="transition_dissolve", fontFamily="Material Symbols Sharp")
-    transition_fade_sharp = IconData(name="transition_fade", fontFamily="Material Symbols Sharp")
-    transition_push_sharp = IconData(name="transition_push", fontFamily="Material Symbols Sharp")
-    transition_slide_sharp = IconData(name="transition_slide", fontFamily="Material Symbols Sharp")
-    translate_sharp = IconData(name="translate", fontFamily="Material Symbols Sharp")
-    transportation_sharp = IconData(name="transportation", fontFamily="Material Symbols Sharp")
-    travel_sharp = IconData(name="travel", fontFamily="Material Symbols Sharp")
-    travel_explore_sharp = IconData(name="travel_explore", fontFamily="Material Symbols Sharp")
-    travel_luggage_and_bags_sharp = IconData(name="travel_luggage_and_bags", fontFamily="Material Symbols Sharp")
-    trending_down_sharp = IconData(name="trending_down", fontFamily="Material Symbols Sharp")
-    trending_flat_sharp = IconData(name="trending_flat", fontFamily="Material Symbols Sharp")
-    trending_up_sharp = IconData(name="trending_up", fontFamily="Material Symbols Sharp")
-    trip_sharp = IconData(name="trip", fontFamily="Material Symbols Sharp")
-    trip_origin_sharp = IconData(name="trip_origin", fontFamily="Material Symbols Sharp")
-    trolley_sharp = IconData(name="trolley", fontFamily="Material Symbols Sharp")
-    trolley_cable_car_sharp = IconData(name="trolley_cable_car", fontFamily="Material Symbols Sharp")
-    trophy_sharp = IconData(name="trophy", fontFamily="Material Symbols Sharp")
-    troubleshoot_sharp = IconData(name="troubleshoot", fontFamily="Material Symbols Sharp")
-    try_sharp = IconData(name="try", fontFamily="Material Symbols Sharp")
-    tsunami_sharp = IconData(name="tsunami", fontFamily="Material Symbols Sharp")
-    tsv_sharp = IconData(name="tsv", fontFamily="Material Symbols Sharp")
-    tty_sharp = IconData(name="tty", fontFamily="Material Symbols Sharp")
-    tune_sharp = IconData(name="tune", fontFamily="Material Symbols Sharp")
-    tungsten_sharp = IconData(name="tungsten", fontFamily="Material Symbols Sharp")
-    turn_left_sharp = IconData(name="turn_left", fontFamily="Material Symbols Sharp")
-    turn_right_sharp = IconData(name="turn_right", fontFamily="Material Symbols Sharp")
-    turn_sharp_left_sharp = IconData(name="turn_sharp_left", fontFamily="Material Symbols Sharp")
-    turn_sharp_right_sharp = IconData(name="turn_sharp_right", fontFamily="Material Symbols Sharp")
-    turn_slight_left_sharp = IconData(name="turn_slight_left", fontFamily="Material Symbols Sharp")
-    turn_slight_right_sharp = IconData(name="turn_slight_right", fontFamily="Material Symbols Sharp")
-    turned_in_sharp = IconData(name="turned_in", fontFamily="Material Symbols Sharp")
-    turned_in_not_sharp = IconData(name="turned_in_not", fontFamily="Material Symbols Sharp")
-    tv_sharp = IconData(name="tv", fontFamily="Material Symbols Sharp")
-    tv_displays_sharp = IconData(name="tv_displays", fontFamily="Material Symbols Sharp")
-    tv_gen_sharp = IconData(name="tv_gen", fontFamily="Material Symbols Sharp")
-    tv_guide_sharp = IconData(name="tv_guide", fontFamily="Material Symbols Sharp")
-    tv_next_sharp = IconData(name="tv_next", fontFamily="Material Symbols Sharp")
-    tv_off_sharp = IconData(name="tv_off", fontFamily="Material Symbols Sharp")
-    tv_options_edit_channels_sharp = IconData(name="tv_options_edit_channels", fontFamily="Material Symbols Sharp")
-    tv_options_input_settings_sharp = IconData(name="tv_options_input_settings", fontFamily="Material Symbols Sharp")
-    tv_remote_sharp = IconData(name="tv_remote", fontFamily="Material Symbols Sharp")
-    tv_signin_sharp = IconData(name="tv_signin", fontFamily="Material Symbols Sharp")
-    tv_with_assistant_sharp = IconData(name="tv_with_assistant", fontFamily="Material Symbols Sharp")
-    two_pager_sharp = IconData(name="two_pager", fontFamily="Material Symbols Sharp")
-    two_pager_store_sharp = IconData(name="two_pager_store", fontFamily="Material Symbols Sharp")
-    two_wheeler_sharp = IconData(name="two_wheeler", fontFamily="Material Symbols Sharp")
-    type_specimen_sharp = IconData(name="type_specimen", fontFamily="Material Symbols Sharp")
-    u_turn_left_sharp = IconData(name="u_turn_left", fontFamily="Material Symbols Sharp")
-    u_turn_right_sharp = IconData(name="u_turn_right", fontFamily="Material Symbols Sharp")
-    ulna_radius_sharp = IconData(name="ulna_radius", fontFamily="Material Symbols Sharp")
-    ulna_radius_alt_sharp = IconData(name="ulna_radius_alt", fontFamily="Material Symbols Sharp")
-    umbrella_sharp = IconData(name="umbrella", fontFamily="Material Symbols Sharp")
-    unarchive_sharp = IconData(name="unarchive", fontFamily="Material Symbols Sharp")
-    undo_sharp = IconData(name="undo", fontFamily="Material Symbols Sharp")
-    unfold_less_sharp = IconData(name="unfold_less", fontFamily="Material Symbols Sharp")
-    unfold_less_double_sharp = IconData(name="unfold_less_double", fontFamily="Material Symbols Sharp")
-    unfold_more_sharp = IconData(name="unfold_more", fontFamily="Material Symbols Sharp")
-    unfold_more_double_sharp = IconData(name="unfold_more_double", fontFamily="Material Symbols Sharp")
-    ungroup_sharp = IconData(name="ungroup", fontFamily="Material Symbols Sharp")
-    universal_currency_sharp = IconData(name="universal_currency", fontFamily="Material Symbols Sharp")
-    universal_currency_alt_sharp = IconData(name="universal_currency_alt", fontFamily="Material Symbols Sharp")
-    universal_local_sharp = IconData(name="universal_local", fontFamily="Material Symbols Sharp")
-    unknown_2_sharp = IconData(name="unknown_2", fontFamily="Material Symbols Sharp")
-    unknown_5_sharp = IconData(name="unknown_5", fontFamily="Material Symbols Sharp")
-    unknown_7_sharp = IconData(name="unknown_7", fontFamily="Material Symbols Sharp")
-    unknown_document_sharp = IconData(name="unknown_document", fontFamily="Material Symbols Sharp")
-    unknown_med_sharp = IconData(name="unknown_med", fontFamily="Material Symbols Sharp")
-    unlicense_sharp = IconData(name="unlicense", fontFamily="Material Symbols Sharp")
-    unpaved_road_sharp = IconData(name="unpaved_road", fontFamily="Material Symbols Sharp")
-    unpin_sharp = IconData(name="unpin", fontFamily="Material Symbols Sharp")
-    unpublished_sharp = IconData(name="unpublished", fontFamily="Material Symbols Sharp")
-    unsubscribe_sharp = IconData(name="unsubscribe", fontFamily="Material Symbols Sharp")
-    upcoming_sharp = IconData(name="upcoming", fontFamily="Material Symbols Sharp")
-    update_sharp = IconData(name="update", fontFamily="Material Symbols Sharp")
-    update_disabled_sharp = IconData(name="update_disabled", fontFamily="Material Symbols Sharp")
-    upgrade_sharp = IconData(name="upgrade", fontFamily="Material Symbols Sharp")
-    upi_pay_sharp = IconData(name="upi_pay", fontFamily="Material Symbols Sharp")
-    upload_sharp = IconData(name="upload", fontFamily="Material Symbols Sharp")
-    upload_2_sharp = IconData(name="upload_2", fontFamily="Material Symbols Sharp")
-    upload_file_sharp = IconData(name="upload_file", fontFamily="Material Symbols Sharp")
-    uppercase_sharp = IconData(name="uppercase", fontFamily="Material Symbols Sharp")
-    urology_sharp = IconData(name="urology", fontFamily="Material Symbols Sharp")
-    usb_sharp = IconData(name="usb", fontFamily="Material Symbols Sharp")
-    usb_off_sharp = IconData(name="usb_off", fontFamily="Material Symbols Sharp")
-    user_attributes_sharp = IconData(name="user_attributes", fontFamily="Material Symbols Sharp")
-    vaccines_sharp = IconData(name="vaccines", fontFamily="Material Symbols Sharp")
-    vacuum_sharp = IconData(name="vacuum", fontFamily="Material Symbols Sharp")
-    valve_sharp = IconData(name="valve", fontFamily="Material Symbols Sharp")
-    vape_free_sharp = IconData(name="vape_free", fontFamily="Material Symbols Sharp")
-    vaping_rooms_sharp = IconData(name="vaping_rooms", fontFamily="Material Symbols Sharp")
-    variable_add_sharp = IconData(name="variable_add", fontFamily="Material Symbols Sharp")
-    variable_insert_sharp = IconData(name="variable_insert", fontFamily="Material Symbols Sharp")
-    variable_remove_sharp = IconData(name="variable_remove", fontFamily="Material Symbols Sharp")
-    variables_sharp = IconData(name="variables", fontFamily="Material Symbols Sharp")
-    ventilator_sharp = IconData(name="ventilator", fontFamily="Material Symbols Sharp")
-    verified_sharp = IconData(name="verified", fontFamily="Material Symbols Sharp")
-    verified_off_sharp = IconData(name="verified_off", fontFamily="Material Symbols Sharp")
-    verified_user_sharp = IconData(name="verified_user", fontFamily="Material Symbols Sharp")
-    vertical_align_bottom_sharp = IconData(name="vertical_align_bottom", fontFamily="Material Symbols Sharp")
-    vertical_align_center_sharp = IconData(name="vertical_align_center", fontFamily="Material Symbols Sharp")
-    vertical_align_top_sharp = IconData(name="vertical_align_top", fontFamily="Material Symbols Sharp")
-    vertical_distribute_sharp = IconData(name="vertical_distribute", fontFamily="Material Symbols Sharp")
-    vertical_shades_sharp = IconData(name="vertical_shades", fontFamily="Material Symbols Sharp")
-    vertical_shades_closed_sharp = IconData(name="vertical_shades_closed", fontFamily="Material Symbols Sharp")
-    vertical_split_sharp = IconData(name="vertical_split", fontFamily="Material Symbols Sharp")
-    vibration_sharp = IconData(name="vibration", fontFamily="Material Symbols Sharp")
-    video_call_sharp = IconData(name="video_call", fontFamily="Material Symbols Sharp")
-    video_camera_back_sharp = IconData(name="video_camera_back", fontFamily="Material Symbols Sharp")
-    video_camera_back_add_sharp = IconData(name="video_camera_back_add", fontFamily="Material Symbols Sharp")
-    video_camera_front_sharp = IconData(name="video_camera_front", fontFamily="Material Symbols Sharp")
-    video_camera_front_off_sharp = IconData(name="video_camera_front_off", fontFamily="Material Symbols Sharp")
-    video_chat_sharp = IconData(name="video_chat", fontFamily="Material Symbols Sharp")
-    video_file_sharp = IconData(name="video_file", fontFamily="Material Symbols Sharp")
-    video_label_sharp = IconData(name="video_label", fontFamily="Material Symbols Sharp")
-    video_library_sharp = IconData(name="video_library", fontFamily="Material Symbols Sharp")
-    video_search_sharp = IconData(name="video_search", fontFamily="Material Symbols Sharp")
-    video_settings_sharp = IconData(name="video_settings", fontFamily="Material Symbols Sharp")
-    video_stable_sharp = IconData(name="video_stable", fontFamily="Material Symbols Sharp")
-    videocam_sharp = IconData(name="videocam", fontFamily="Material Symbols Sharp")
-    videocam_alert_sharp = IconData(name="videocam_alert", fontFamily="Material Symbols Sharp")
-    videocam_off_sharp = IconData(name="videocam_off", fontFamily="Material Symbols Sharp")
-    videogame_asset_sharp = IconData(name="videogame_asset", fontFamily="Material Symbols Sharp")
-    videogame_asset_off_sharp = IconData(name="videogame_asset_off", fontFamily="Material Symbols Sharp")
-    view_agenda_sharp = IconData(name="view_agenda", fontFamily="Material Symbols Sharp")
-    view_apps_sharp = IconData(name="view_apps", fontFamily="Material Symbols Sharp")
-    view_array_sharp = IconData(name="view_array", fontFamily="Material Symbols Sharp")
-    view_carousel_sharp = IconData(name="view_carousel", fontFamily="Material Symbols Sharp")
-    view_column_sharp = IconData(name="view_column", fontFamily="Material Symbols Sharp")
-    view_column_2_sharp = IconData(name="view_column_2", fontFamily="Material Symbols Sharp")
-    view_comfy_sharp = IconData(name="view_comfy", fontFamily="Material Symbols Sharp")
-    view_comfy_alt_sharp = IconData(name="view_comfy_alt", fontFamily="Material Symbols Sharp")
-    view_compact_sharp = IconData(name="view_compact", fontFamily="Material Symbols Sharp")
-    view_compact_alt_sharp = IconData(name="view_compact_alt", fontFamily="Material Symbols Sharp")
-    view_cozy_sharp = IconData(name="view_cozy", fontFamily="Material Symbols Sharp")
-    view_day_sharp = IconData(name="view_day", fontFamily="Material Symbols Sharp")
-    view_headline_sharp = IconData(name="view_headline", fontFamily="Material Symbols Sharp")
-    view_in_ar_sharp = IconData(name="view_in_ar", fontFamily="Material Symbols Sharp")
-    view_in_ar_new_sharp = IconData(name="view_in_ar_new", fontFamily="Material Symbols Sharp")
-    view_in_ar_off_sharp = IconData(name="view_in_ar_off", fontFamily="Material Symbols Sharp")
-    view_kanban_sharp = IconData(name="view_kanban", fontFamily="Material Symbols Sharp")
-    view_list_sharp = IconData(name="view_list", fontFamily="Material Symbols Sharp")
-    view_module_sharp = IconData(name="view_module", fontFamily="Material Symbols Sharp")
-    view_object_track_sharp = IconData(name="view_object_track", fontFamily="Material Symbols Sharp")
-    view_quilt_sharp = IconData(name="view_quilt", fontFamily="Material Symbols Sharp")
-    view_real_size_sharp = IconData(name="view_real_size", fontFamily="Material Symbols Sharp")
-    view_sidebar_sharp = IconData(name="view_sidebar", fontFamily="Material Symbols Sharp")
-    view_stream_sharp = IconData(name="view_stream", fontFamily="Material Symbols Sharp")
-    view_timeline_sharp = IconData(name="view_timeline", fontFamily="Material Symbols Sharp")
-    view_week_sharp = IconData(name="view_week", fontFamily="Material Symbols Sharp")
-    vignette_sharp = IconData(name="vignette", fontFamily="Material Symbols Sharp")
-    villa_sharp = IconData(name="villa", fontFamily="Material Symbols Sharp")
-    visibility_sharp = IconData(name="visibility", fontFamily="Material Symbols Sharp")
-    visibility_lock_sharp = IconData(name="visibility_lock", fontFamily="Material Symbols Sharp")
-    visibility_off_sharp = IconData(name="visibility_off", fontFamily="Material Symbols Sharp")
-    vital_signs_sharp = IconData(name="vital_signs", fontFamily="Material Symbols Sharp")
-    vitals_sharp = IconData(name="vitals", fontFamily="Material Symbols Sharp")
-    vo2_max_sharp = IconData(name="vo2_max", fontFamily="Material Symbols Sharp")
-    voice_chat_sharp = IconData(name="voice_chat", fontFamily="Material Symbols Sharp")
-    voice_over_off_sharp = IconData(name="voice_over_off", fontFamily="Material Symbols Sharp")
-    voice_selection_sharp = IconData(name="voice_selection", fontFamily="Material Symbols Sharp")
-    voice_selection_off_sharp = IconData(name="voice_selection_off", fontFamily="Material Symbols Sharp")
-    voicemail_sharp = IconData(name="voicemail", fontFamily="Material Symbols Sharp")
-    voicemail_2_sharp = IconData(name="voicemail_2", fontFamily="Material Symbols Sharp")
-    volcano_sharp = IconData(name="volcano", fontFamily="Material Symbols Sharp")
-    volume_down_sharp = IconData(name="volume_down", fontFamily="Material Symbols Sharp")
-    volume_down_alt_sharp = IconData(name="volume_down_alt", fontFamily="Material Symbols Sharp")
-    volume_mute_sharp = IconData(name="volume_mute", fontFamily="Material Symbols Sharp")
-    volume_off_sharp = IconData(name="volume_off", fontFamily="Material Symbols Sharp")
-    volume_up_sharp = IconData(name="volume_up", fontFamily="Material Symbols Sharp")
-    volunteer_activism_sharp = IconData(name="volunteer_activism", fontFamily="Material Symbols Sharp")
-    voting_chip_sharp = IconData(name="voting_chip", fontFamily="Material Symbols Sharp")
-    vpn_key_sharp = IconData(name="vpn_key", fontFamily="Material Symbols Sharp")
-    vpn_key_alert_sharp = IconData(name="vpn_key_alert", fontFamily="Material Symbols Sharp")
-    vpn_key_off_sharp = IconData(name="vpn_key_off", fontFamily="Material Symbols Sharp")
-    vpn_lock_sharp = IconData(name="vpn_lock", fontFamily="Material Symbols Sharp")
-    vpn_lock_2_sharp = IconData(name="vpn_lock_2", fontFamily="Material Symbols Sharp")
-    vr180_create2d_sharp = IconData(name="vr180_create2d", fontFamily="Material Symbols Sharp")
-    vr180_create2d_off_sharp = IconData(name="vr180_create2d_off", fontFamily="Material Symbols Sharp")
-    vrpano_sharp = IconData(name="vrpano", fontFamily="Material Symbols Sharp")
-    wall_art_sharp = IconData(name="wall_art", fontFamily="Material Symbols Sharp")
-    wall_lamp_sharp = IconData(name="wall_lamp", fontFamily="Material Symbols Sharp")
-    wallet_sharp = IconData(name="wallet", fontFamily="Material Symbols Sharp")
-    wallpaper_sharp = IconData(name="wallpaper", fontFamily="Material Symbols Sharp")
-    wallpaper_slideshow_sharp = IconData(name="wallpaper_slideshow", fontFamily="Material Symbols Sharp")
-    wand_shine_sharp = IconData(name="wand_shine", fontFamily="Material Symbols Sharp")
-    wand_stars_sharp = IconData(name="wand_stars", fontFamily="Material Symbols Sharp")
-    ward_sharp = IconData(name="ward", fontFamily="Material Symbols Sharp")
-    warehouse_sharp = IconData(name="warehouse", fontFamily="Material Symbols Sharp")
-    warning_sharp = IconData(name="warning", fontFamily="Material Symbols Sharp")
-    warning_amber_sharp = IconData(name="warning_amber", fontFamily="Material Symbols Sharp")
-    warning_off_sharp = IconData(name="warning_off", fontFamily="Material Symbols Sharp")
-    wash_sharp = IconData(name="wash", fontFamily="Material Symbols Sharp")
-    watch_sharp = IconData(name="watch", fontFamily="Material Symbols Sharp")
-    watch_button_press_sharp = IconData(name="watch_button_press", fontFamily="Material Symbols Sharp")
-    watch_check_sharp = IconData(name="watch_check", fontFamily="Material Symbols Sharp")
-    watch_later_sharp = IconData(name="watch_later", fontFamily="Material Symbols Sharp")
-    watch_off_sharp = IconData(name="watch_off", fontFamily="Material Symbols Sharp")
-    watch_screentime_sharp = IconData(name="watch_screentime", fontFamily="Material Symbols Sharp")
-    watch_vibration_sharp = IconData(name="watch_vibration", fontFamily="Material Symbols Sharp")
-    watch_wake_sharp = IconData(name="watch_wake", fontFamily="Material Symbols Sharp")
-    water_sharp = IconData(name="water", fontFamily="Material Symbols Sharp")
-    water_bottle_sharp = IconData(name="water_bottle", fontFamily="Material Symbols Sharp")
-    water_bottle_large_sharp = IconData(name="water_bottle_large", fontFamily="Material Symbols Sharp")
-    water_damage_sharp = IconData(name="water_damage", fontFamily="Material Symbols Sharp")
-    water_do_sharp = IconData(name="water_do", fontFamily="Material Symbols Sharp")
-    water_drop_sharp = IconData(name="water_drop", fontFamily="Material Symbols Sharp")
-    water_ec_sharp = IconData(name="water_ec", fontFamily="Material Symbols Sharp")
-    water_full_sharp = IconData(name="water_full", fontFamily="Material Symbols Sharp")
-    water_heater_sharp = IconData(name="water_heater", fontFamily="Material Symbols Sharp")
-    water_lock_sharp = IconData(name="water_lock", fontFamily="Material Symbols Sharp")
-    water_loss_sharp = IconData(name="water_loss", fontFamily="Material Symbols Sharp")
-    water_lux_sharp = IconData(name="water_lux", fontFamily="Material Symbols Sharp")
-    water_medium_sharp = IconData(name="water_medium", fontFamily="Material Symbols Sharp")
-    water_orp_sharp = IconData(name="water_orp", fontFamily="Material Symbols Sharp")
-    water_ph_sharp = IconData(name="water_ph", fontFamily="Material Symbols Sharp")
-    water_pump_sharp = IconData(name="water_pump", fontFamily="Material Symbols Sharp")
-    water_voc_sharp = IconData(name="water_voc", fontFamily="Material Symbols Sharp")
-    waterfall_chart_sharp = IconData(name="waterfall_chart", fontFamily="Material Symbols Sharp")
-    waves_sharp = IconData(name="waves", fontFamily="Material Symbols Sharp")
-    waving_hand_sharp = IconData(name="waving_hand", fontFamily="Material Symbols Sharp")
-    wb_auto_sharp = IconData(name="wb_auto", fontFamily="Material Symbols Sharp")
-    wb_cloudy_sharp = IconData(name="wb_cloudy", fontFamily="Material Symbols Sharp")
-    wb_incandescent_sharp = IconData(name="wb_incandescent", fontFamily="Material Symbols Sharp")
-    wb_iridescent_sharp = IconData(name="wb_iridescent", fontFamily="Material Symbols Sharp")
-    wb_shade_sharp = IconData(name="wb_shade", fontFamily="Material Symbols Sharp")
-    wb_sunny_sharp = IconData(name="wb_sunny", fontFamily="Material Symbols Sharp")
-    wb_twilight_sharp = IconData(name="wb_twilight", fontFamily="Material Symbols Sharp")
-    wc_sharp = IconData(name="wc", fontFamily="Material Symbols Sharp")
-    weather_hail_sharp = IconData(name="weather_hail", fontFamily="Material Symbols Sharp")
-    weather_mix_sharp = IconData(name="weather_mix", fontFamily="Material Symbols Sharp")
-    weather_snowy_sharp = IconData(name="weather_snowy", fontFamily="Material Symbols Sharp")
-    web_sharp = IconData(name="web", fontFamily="Material Symbols Sharp")
-    web_asset_sharp = IconData(name="web_asset", fontFamily="Material Symbols Sharp")
-    web_asset_off_sharp = IconData(name="web_asset_off", fontFamily="Material Symbols Sharp")
-    web_stories_sharp = IconData(name="web_stories", fontFamily="Material Symbols Sharp")
-    web_traffic_sharp = IconData(name="web_traffic", fontFamily="Material Symbols Sharp")
-    webhook_sharp = IconData(name="webhook", fontFamily="Material Symbols Sharp")
-    weekend_sharp = IconData(name="weekend", fontFamily="Material Symbols Sharp")
-    weight_sharp = IconData(name="weight", fontFamily="Material Symbols Sharp")
-    west_sharp = IconData(name="west", fontFamily="Material Symbols Sharp")
-    whatshot_sharp = IconData(name="whatshot", fontFamily="Material Symbols Sharp")
-    wheelchair_pickup_sharp = IconData(name="wheelchair_pickup", fontFamily="Material Symbols Sharp")
-    where_to_vote_sharp = IconData(name="where_to_vote", fontFamily="Material Symbols Sharp")
-    widget_medium_sharp = IconData(name="widget_medium", fontFamily="Material Symbols Sharp")
-    widget_small_sharp = IconData(name="widget_small", fontFamily="Material Symbols Sharp")
-    widget_width_sharp = IconData(name="widget_width", fontFamily="Material Symbols Sharp")
-    widgets_sharp = IconData(name="widgets", fontFamily="Material Symbols Sharp")
-    width_sharp = IconData(name="width", fontFamily="Material Symbols Sharp")
-    width_full_sharp = IconData(name="width_full", fontFamily="Material Symbols Sharp")
-    width_normal_sharp = IconData(name="width_normal", fontFamily="Material Symbols Sharp")
-    width_wide_sharp = IconData(name="width_wide", fontFamily="Material Symbols Sharp")
-    wifi_sharp = IconData(name="wifi", fontFamily="Material Symbols Sharp")
-    wifi_1_bar_sharp = IconData(name="wifi_1_bar", fontFamily="Material Symbols Sharp")
-    wifi_2_bar_sharp = IconData(name="wifi_2_bar", fontFamily="Material Symbols Sharp")
-    wifi_add_sharp = IconData(name="wifi_add", fontFamily="Material Symbols Sharp")
-    wifi_calling_sharp = IconData(name="wifi_calling", fontFamily="Material Symbols Sharp")
-    wifi_calling_1_sharp = IconData(name="wifi_calling_1", fontFamily="Material Symbols Sharp")
-    wifi_calling_2_sharp = IconData(name="wifi_calling_2", fontFamily="Material Symbols Sharp")
-    wifi_calling_3_sharp = IconData(name="wifi_calling_3", fontFamily="Material Symbols Sharp")
-    wifi_calling_bar_1_sharp = IconData(name="wifi_calling_bar_1", fontFamily="Material Symbols Sharp")
-    wifi_calling_bar_2_sharp = IconData(name="wifi_calling_bar_2", fontFamily="Material Symbols Sharp")
-    wifi_calling_bar_3_sharp = IconData(name="wifi_calling_bar_3", fontFamily="Material Symbols Sharp")
-    wifi_channel_sharp = IconData(name="wifi_channel", fontFamily="Material Symbols Sharp")
-    wifi_find_sharp = IconData(name="wifi_find", fontFamily="Material Symbols Sharp")
-    wifi_home_sharp = IconData(name="wifi_home", fontFamily="Material Symbols Sharp")
-    wifi_lock_sharp = IconData(name="wifi_lock", fontFamily="Material Symbols Sharp")
-    wifi_notification_sharp = IconData(name="wifi_notification", fontFamily="Material Symbols Sharp")
-    wifi_off_sharp = IconData(name="wifi_off", fontFamily="Material Symbols Sharp")
-    wifi_password_sharp = IconData(name="wifi_password", fontFamily="Material Symbols Sharp")
-    wifi_protected_setup_sharp = IconData(name="wifi_protected_setup", fontFamily="Material Symbols Sharp")
-    wifi_proxy_sharp = IconData(name="wifi_proxy", fontFamily="Material Symbols Sharp")
-    wifi_tethering_sharp = IconData(name="wifi_tethering", fontFamily="Material Symbols Sharp")
-    wifi_tethering_error_sharp = IconData(name="wifi_tethering_error", fontFamily="Material Symbols Sharp")
-    wifi_tethering_off_sharp = IconData(name="wifi_tethering_off", fontFamily="Material Symbols Sharp")
-    wind_power_sharp = IconData(name="wind_power", fontFamily="Material Symbols Sharp")
-    window_sharp = IconData(name="window", fontFamily="Material Symbols Sharp")
-    window_closed_sharp = IconData(name="window_closed", fontFamily="Material Symbols Sharp")
-    window_open_sharp = IconData(name="window_open", fontFamily="Material Symbols Sharp")
-    window_sensor_sharp = IconData(name="window_sensor", fontFamily="Material Symbols Sharp")
-    windshield_defrost_front_sharp = IconData(name="windshield_defrost_front", fontFamily="Material Symbols Sharp")
-    windshield_defrost_rear_sharp = IconData(name="windshield_defrost_rear", fontFamily="Material Symbols Sharp")
-    windshield_heat_front_sharp = IconData(name="windshield_heat_front", fontFamily="Material Symbols Sharp")
-    wine_bar_sharp = IconData(name="wine_bar", fontFamily="Material Symbols Sharp")
-    woman_sharp = IconData(name="woman", fontFamily="Material Symbols Sharp")
-    woman_2_sharp = IconData(name="woman_2", fontFamily="Material Symbols Sharp")
-    work_sharp = IconData(name="work", fontFamily="Material Symbols Sharp")
-    work_alert_sharp = IconData(name="work_alert", fontFamily="Material Symbols Sharp")
-    work_history_sharp = IconData(name="work_history", fontFamily="Material Symbols Sharp")
-    work_off_sharp = IconData(name="work_off", fontFamily="Material Symbols Sharp")
-    work_outline_sharp = IconData(name="work_outline", fontFamily="Material Symbols Sharp")
-    work_update_sharp = IconData(name="work_update", fontFamily="Material Symbols Sharp")
-    workflow_sharp = IconData(name="workflow", fontFamily="Material Symbols Sharp")
-    workspace_premium_sharp = IconData(name="workspace_premium", fontFamily="Material Symbols Sharp")
-    workspaces_sharp = IconData(name="workspaces", fontFamily="Material Symbols Sharp")
-    workspaces_outline_sharp = IconData(name="workspaces_outline", fontFamily="Material Symbols Sharp")
-    wounds_injuries_sharp = IconData(name="wounds_injuries", fontFamily="Material Symbols Sharp")
-    wrap_text_sharp = IconData(name="wrap_text", fontFamily="Material Symbols Sharp")
-    wrist_sharp = IconData(name="wrist", fontFamily="Material Symbols Sharp")
-    wrong_location_sharp = IconData(name="wrong_location", fontFamily="Material Symbols Sharp")
-    wysiwyg_sharp = IconData(name="wysiwyg", fontFamily="Material Symbols Sharp")
-    yard_sharp = IconData(name="yard", fontFamily="Material Symbols Sharp")
-    your_trips_sharp = IconData(name="your_trips", fontFamily="Material Symbols Sharp")
-    youtube_activity_sharp = IconData(name="youtube_activity", fontFamily="Material Symbols Sharp")
-    youtube_searched_for_sharp = IconData(name="youtube_searched_for", fontFamily="Material Symbols Sharp")
-    zone_person_alert_sharp = IconData(name="zone_person_alert", fontFamily="Material Symbols Sharp")
-    zone_person_idle_sharp = IconData(name="zone_person_idle", fontFamily="Material Symbols Sharp")
-    zone_person_urgent_sharp = IconData(name="zone_person_urgent", fontFamily="Material Symbols Sharp")
-    zoom_in_sharp = IconData(name="zoom_in", fontFamily="Material Symbols Sharp")
-    zoom_in_map_sharp = IconData(name="zoom_in_map", fontFamily="Material Symbols Sharp")
-    zoom_out_sharp = IconData(name="zoom_out", fontFamily="Material Symbols Sharp")
-    zoom_out_map_sharp = IconData(name="zoom_out_map", fontFamily="Material Symbols Sharp")
\ No newline at end of file
@@ -1,1834 +0,0 @@
-from .base import IconData
-
-class IconsSharp1:
-    _10k_sharp = IconData(name="10k", fontFamily="Material Symbols Sharp")
-    _10mp_sharp = IconData(name="10mp", fontFamily="Material Symbols Sharp")
-    _11mp_sharp = IconData(name="11mp", fontFamily="Material Symbols Sharp")
-    _123_sharp = IconData(name="123", fontFamily="Material Symbols Sharp")
-    _12mp_sharp = IconData(name="12mp", fontFamily="Material Symbols Sharp")
-    _13mp_sharp = IconData(name="13mp", fontFamily="Material Symbols Sharp")
-    _14mp_sharp = IconData(name="14mp", fontFamily="Material Symbols Sharp")
-    _15mp_sharp = IconData(name="15mp", fontFamily="Material Symbols Sharp")
-    _16mp_sharp = IconData(name="16mp", fontFamily="Material Symbols Sharp")
-    _17mp_sharp = IconData(name="17mp", fontFamily="Material Symbols Sharp")
-    _18_up_rating_sharp = IconData(name="18_up_rating", fontFamily="Material Symbols Sharp")
-    _18mp_sharp = IconData(name="18mp", fontFamily="Material Symbols Sharp")
-    _19mp_sharp = IconData(name="19mp", fontFamily="Material Symbols Sharp")
-    _1k_sharp = IconData(name="1k", fontFamily="Material Symbols Sharp")
-    _1k_plus_sharp = IconData(name="1k_plus", fontFamily="Material Symbols Sharp")
-    _1x_mobiledata_sharp = IconData(name="1x_mobiledata", fontFamily="Material Symbols Sharp")
-    _1x_mobiledata_badge_sharp = IconData(name="1x_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    _20mp_sharp = IconData(name="20mp", fontFamily="Material Symbols Sharp")
-    _21mp_sharp = IconData(name="21mp", fontFamily="Material Symbols Sharp")
-    _22mp_sharp = IconData(name="22mp", fontFamily="Material Symbols Sharp")
-    _23mp_sharp = IconData(name="23mp", fontFamily="Material Symbols Sharp")
-    _24fps_select_sharp = IconData(name="24fps_select", fontFamily="Material Symbols Sharp")
-    _24mp_sharp = IconData(name="24mp", fontFamily="Material Symbols Sharp")
-    _2d_sharp = IconData(name="2d", fontFamily="Material Symbols Sharp")
-    _2k_sharp = IconData(name="2k", fontFamily="Material Symbols Sharp")
-    _2k_plus_sharp = IconData(name="2k_plus", fontFamily="Material Symbols Sharp")
-    _2mp_sharp = IconData(name="2mp", fontFamily="Material Symbols Sharp")
-    _30fps_sharp = IconData(name="30fps", fontFamily="Material Symbols Sharp")
-    _30fps_select_sharp = IconData(name="30fps_select", fontFamily="Material Symbols Sharp")
-    _360_sharp = IconData(name="360", fontFamily="Material Symbols Sharp")
-    _3d_sharp = IconData(name="3d", fontFamily="Material Symbols Sharp")
-    _3d_rotation_sharp = IconData(name="3d_rotation", fontFamily="Material Symbols Sharp")
-    _3g_mobiledata_sharp = IconData(name="3g_mobiledata", fontFamily="Material Symbols Sharp")
-    _3g_mobiledata_badge_sharp = IconData(name="3g_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    _3k_sharp = IconData(name="3k", fontFamily="Material Symbols Sharp")
-    _3k_plus_sharp = IconData(name="3k_plus", fontFamily="Material Symbols Sharp")
-    _3mp_sharp = IconData(name="3mp", fontFamily="Material Symbols Sharp")
-    _3p_sharp = IconData(name="3p", fontFamily="Material Symbols Sharp")
-    _4g_mobiledata_sharp = IconData(name="4g_mobiledata", fontFamily="Material Symbols Sharp")
-    _4g_mobiledata_badge_sharp = IconData(name="4g_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    _4g_plus_mobiledata_sharp = IconData(name="4g_plus_mobiledata", fontFamily="Material Symbols Sharp")
-    _4k_sharp = IconData(name="4k", fontFamily="Material Symbols Sharp")
-    _4k_plus_sharp = IconData(name="4k_plus", fontFamily="Material Symbols Sharp")
-    _4mp_sharp = IconData(name="4mp", fontFamily="Material Symbols Sharp")
-    _50mp_sharp = IconData(name="50mp", fontFamily="Material Symbols Sharp")
-    _5g_sharp = IconData(name="5g", fontFamily="Material Symbols Sharp")
-    _5g_mobiledata_badge_sharp = IconData(name="5g_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    _5k_sharp = IconData(name="5k", fontFamily="Material Symbols Sharp")
-    _5k_plus_sharp = IconData(name="5k_plus", fontFamily="Material Symbols Sharp")
-    _5mp_sharp = IconData(name="5mp", fontFamily="Material Symbols Sharp")
-    _60fps_sharp = IconData(name="60fps", fontFamily="Material Symbols Sharp")
-    _60fps_select_sharp = IconData(name="60fps_select", fontFamily="Material Symbols Sharp")
-    _6_ft_apart_sharp = IconData(name="6_ft_apart", fontFamily="Material Symbols Sharp")
-    _6k_sharp = IconData(name="6k", fontFamily="Material Symbols Sharp")
-    _6k_plus_sharp = IconData(name="6k_plus", fontFamily="Material Symbols Sharp")
-    _6mp_sharp = IconData(name="6mp", fontFamily="Material Symbols Sharp")
-    _7k_sharp = IconData(name="7k", fontFamily="Material Symbols Sharp")
-    _7k_plus_sharp = IconData(name="7k_plus", fontFamily="Material Symbols Sharp")
-    _7mp_sharp = IconData(name="7mp", fontFamily="Material Symbols Sharp")
-    _8k_sharp = IconData(name="8k", fontFamily="Material Symbols Sharp")
-    _8k_plus_sharp = IconData(name="8k_plus", fontFamily="Material Symbols Sharp")
-    _8mp_sharp = IconData(name="8mp", fontFamily="Material Symbols Sharp")
-    _9k_sharp = IconData(name="9k", fontFamily="Material Symbols Sharp")
-    _9k_plus_sharp = IconData(name="9k_plus", fontFamily="Material Symbols Sharp")
-    _9mp_sharp = IconData(name="9mp", fontFamily="Material Symbols Sharp")
-    abc_sharp = IconData(name="abc", fontFamily="Material Symbols Sharp")
-    ac_unit_sharp = IconData(name="ac_unit", fontFamily="Material Symbols Sharp")
-    access_alarm_sharp = IconData(name="access_alarm", fontFamily="Material Symbols Sharp")
-    access_alarms_sharp = IconData(name="access_alarms", fontFamily="Material Symbols Sharp")
-    access_time_sharp = IconData(name="access_time", fontFamily="Material Symbols Sharp")
-    access_time_filled_sharp = IconData(name="access_time_filled", fontFamily="Material Symbols Sharp")
-    accessibility_sharp = IconData(name="accessibility", fontFamily="Material Symbols Sharp")
-    accessibility_new_sharp = IconData(name="accessibility_new", fontFamily="Material Symbols Sharp")
-    accessible_sharp = IconData(name="accessible", fontFamily="Material Symbols Sharp")
-    accessible_forward_sharp = IconData(name="accessible_forward", fontFamily="Material Symbols Sharp")
-    accessible_menu_sharp = IconData(name="accessible_menu", fontFamily="Material Symbols Sharp")
-    account_balance_sharp = IconData(name="account_balance", fontFamily="Material Symbols Sharp")
-    account_balance_wallet_sharp = IconData(name="account_balance_wallet", fontFamily="Material Symbols Sharp")
-    account_box_sharp = IconData(name="account_box", fontFamily="Material Symbols Sharp")
-    account_child_sharp = IconData(name="account_child", fontFamily="Material Symbols Sharp")
-    account_child_invert_sharp = IconData(name="account_child_invert", fontFamily="Material Symbols Sharp")
-    account_circle_sharp = IconData(name="account_circle", fontFamily="Material Symbols Sharp")
-    account_circle_filled_sharp = IconData(name="account_circle_filled", fontFamily="Material Symbols Sharp")
-    account_circle_off_sharp = IconData(name="account_circle_off", fontFamily="Material Symbols Sharp")
-    account_tree_sharp = IconData(name="account_tree", fontFamily="Material Symbols Sharp")
-    action_key_sharp = IconData(name="action_key", fontFamily="Material Symbols Sharp")
-    activity_zone_sharp = IconData(name="activity_zone", fontFamily="Material Symbols Sharp")
-    acute_sharp = IconData(name="acute", fontFamily="Material Symbols Sharp")
-    ad_sharp = IconData(name="ad", fontFamily="Material Symbols Sharp")
-    ad_group_sharp = IconData(name="ad_group", fontFamily="Material Symbols Sharp")
-    ad_group_off_sharp = IconData(name="ad_group_off", fontFamily="Material Symbols Sharp")
-    ad_off_sharp = IconData(name="ad_off", fontFamily="Material Symbols Sharp")
-    ad_units_sharp = IconData(name="ad_units", fontFamily="Material Symbols Sharp")
-    adaptive_audio_mic_sharp = IconData(name="adaptive_audio_mic", fontFamily="Material Symbols Sharp")
-    adaptive_audio_mic_off_sharp = IconData(name="adaptive_audio_mic_off", fontFamily="Material Symbols Sharp")
-    adb_sharp = IconData(name="adb", fontFamily="Material Symbols Sharp")
-    add_sharp = IconData(name="add", fontFamily="Material Symbols Sharp")
-    add_2_sharp = IconData(name="add_2", fontFamily="Material Symbols Sharp")
-    add_a_photo_sharp = IconData(name="add_a_photo", fontFamily="Material Symbols Sharp")
-    add_ad_sharp = IconData(name="add_ad", fontFamily="Material Symbols Sharp")
-    add_alarm_sharp = IconData(name="add_alarm", fontFamily="Material Symbols Sharp")
-    add_alert_sharp = IconData(name="add_alert", fontFamily="Material Symbols Sharp")
-    add_box_sharp = IconData(name="add_box", fontFamily="Material Symbols Sharp")
-    add_business_sharp = IconData(name="add_business", fontFamily="Material Symbols Sharp")
-    add_call_sharp = IconData(name="add_call", fontFamily="Material Symbols Sharp")
-    add_card_sharp = IconData(name="add_card", fontFamily="Material Symbols Sharp")
-    add_chart_sharp = IconData(name="add_chart", fontFamily="Material Symbols Sharp")
-    add_circle_sharp = IconData(name="add_circle", fontFamily="Material Symbols Sharp")
-    add_circle_outline_sharp = IconData(name="add_circle_outline", fontFamily="Material Symbols Sharp")
-    add_column_left_sharp = IconData(name="add_column_left", fontFamily="Material Symbols Sharp")
-    add_column_right_sharp = IconData(name="add_column_right", fontFamily="Material Symbols Sharp")
-    add_comment_sharp = IconData(name="add_comment", fontFamily="Material Symbols Sharp")
-    add_diamond_sharp = IconData(name="add_diamond", fontFamily="Material Symbols Sharp")
-    add_home_sharp = IconData(name="add_home", fontFamily="Material Symbols Sharp")
-    add_home_work_sharp = IconData(name="add_home_work", fontFamily="Material Symbols Sharp")
-    add_ic_call_sharp = IconData(name="add_ic_call", fontFamily="Material Symbols Sharp")
-    add_link_sharp = IconData(name="add_link", fontFamily="Material Symbols Sharp")
-    add_location_sharp = IconData(name="add_location", fontFamily="Material Symbols Sharp")
-    add_location_alt_sharp = IconData(name="add_location_alt", fontFamily="Material Symbols Sharp")
-    add_moderator_sharp = IconData(name="add_moderator", fontFamily="Material Symbols Sharp")
-    add_notes_sharp = IconData(name="add_notes", fontFamily="Material Symbols Sharp")
-    add_photo_alternate_sharp = IconData(name="add_photo_alternate", fontFamily="Material Symbols Sharp")
-    add_reaction_sharp = IconData(name="add_reaction", fontFamily="Material Symbols Sharp")
-    add_road_sharp = IconData(name="add_road", fontFamily="Material Symbols Sharp")
-    add_row_above_sharp = IconData(name="add_row_above", fontFamily="Material Symbols Sharp")
-    add_row_below_sharp = IconData(name="add_row_below", fontFamily="Material Symbols Sharp")
-    add_shopping_cart_sharp = IconData(name="add_shopping_cart", fontFamily="Material Symbols Sharp")
-    add_task_sharp = IconData(name="add_task", fontFamily="Material Symbols Sharp")
-    add_to_drive_sharp = IconData(name="add_to_drive", fontFamily="Material Symbols Sharp")
-    add_to_home_screen_sharp = IconData(name="add_to_home_screen", fontFamily="Material Symbols Sharp")
-    add_to_photos_sharp = IconData(name="add_to_photos", fontFamily="Material Symbols Sharp")
-    add_to_queue_sharp = IconData(name="add_to_queue", fontFamily="Material Symbols Sharp")
-    add_triangle_sharp = IconData(name="add_triangle", fontFamily="Material Symbols Sharp")
-    addchart_sharp = IconData(name="addchart", fontFamily="Material Symbols Sharp")
-    adf_scanner_sharp = IconData(name="adf_scanner", fontFamily="Material Symbols Sharp")
-    adjust_sharp = IconData(name="adjust", fontFamily="Material Symbols Sharp")
-    admin_meds_sharp = IconData(name="admin_meds", fontFamily="Material Symbols Sharp")
-    admin_panel_settings_sharp = IconData(name="admin_panel_settings", fontFamily="Material Symbols Sharp")
-    ads_click_sharp = IconData(name="ads_click", fontFamily="Material Symbols Sharp")
-    agender_sharp = IconData(name="agender", fontFamily="Material Symbols Sharp")
-    agriculture_sharp = IconData(name="agriculture", fontFamily="Material Symbols Sharp")
-    air_sharp = IconData(name="air", fontFamily="Material Symbols Sharp")
-    air_freshener_sharp = IconData(name="air_freshener", fontFamily="Material Symbols Sharp")
-    air_purifier_sharp = IconData(name="air_purifier", fontFamily="Material Symbols Sharp")
-    air_purifier_gen_sharp = IconData(name="air_purifier_gen", fontFamily="Material Symbols Sharp")
-    airline_seat_flat_sharp = IconData(name="airline_seat_flat", fontFamily="Material Symbols Sharp")
-    airline_seat_flat_angled_sharp = IconData(name="airline_seat_flat_angled", fontFamily="Material Symbols Sharp")
-    airline_seat_individual_suite_sharp = IconData(name="airline_seat_individual_suite", fontFamily="Material Symbols Sharp")
-    airline_seat_legroom_extra_sharp = IconData(name="airline_seat_legroom_extra", fontFamily="Material Symbols Sharp")
-    airline_seat_legroom_normal_sharp = IconData(name="airline_seat_legroom_normal", fontFamily="Material Symbols Sharp")
-    airline_seat_legroom_reduced_sharp = IconData(name="airline_seat_legroom_reduced", fontFamily="Material Symbols Sharp")
-    airline_seat_recline_extra_sharp = IconData(name="airline_seat_recline_extra", fontFamily="Material Symbols Sharp")
-    airline_seat_recline_normal_sharp = IconData(name="airline_seat_recline_normal", fontFamily="Material Symbols Sharp")
-    airline_stops_sharp = IconData(name="airline_stops", fontFamily="Material Symbols Sharp")
-    airlines_sharp = IconData(name="airlines", fontFamily="Material Symbols Sharp")
-    airplane_ticket_sharp = IconData(name="airplane_ticket", fontFamily="Material Symbols Sharp")
-    airplanemode_active_sharp = IconData(name="airplanemode_active", fontFamily="Material Symbols Sharp")
-    airplanemode_inactive_sharp = IconData(name="airplanemode_inactive", fontFamily="Material Symbols Sharp")
-    airplay_sharp = IconData(name="airplay", fontFamily="Material Symbols Sharp")
-    airport_shuttle_sharp = IconData(name="airport_shuttle", fontFamily="Material Symbols Sharp")
-    airware_sharp = IconData(name="airware", fontFamily="Material Symbols Sharp")
-    airwave_sharp = IconData(name="airwave", fontFamily="Material Symbols Sharp")
-    alarm_sharp = IconData(name="alarm", fontFamily="Material Symbols Sharp")
-    alarm_add_sharp = IconData(name="alarm_add", fontFamily="Material Symbols Sharp")
-    alarm_off_sharp = IconData(name="alarm_off", fontFamily="Material Symbols Sharp")
-    alarm_on_sharp = IconData(name="alarm_on", fontFamily="Material Symbols Sharp")
-    alarm_pause_sharp = IconData(name="alarm_pause", fontFamily="Material Symbols Sharp")
-    alarm_smart_wake_sharp = IconData(name="alarm_smart_wake", fontFamily="Material Symbols Sharp")
-    album_sharp = IconData(name="album", fontFamily="Material Symbols Sharp")
-    align_center_sharp = IconData(name="align_center", fontFamily="Material Symbols Sharp")
-    align_end_sharp = IconData(name="align_end", fontFamily="Material Symbols Sharp")
-    align_flex_center_sharp = IconData(name="align_flex_center", fontFamily="Material Symbols Sharp")
-    align_flex_end_sharp = IconData(name="align_flex_end", fontFamily="Material Symbols Sharp")
-    align_flex_start_sharp = IconData(name="align_flex_start", fontFamily="Material Symbols Sharp")
-    align_horizontal_center_sharp = IconData(name="align_horizontal_center", fontFamily="Material Symbols Sharp")
-    align_horizontal_left_sharp = IconData(name="align_horizontal_left", fontFamily="Material Symbols Sharp")
-    align_horizontal_right_sharp = IconData(name="align_horizontal_right", fontFamily="Material Symbols Sharp")
-    align_items_stretch_sharp = IconData(name="align_items_stretch", fontFamily="Material Symbols Sharp")
-    align_justify_center_sharp = IconData(name="align_justify_center", fontFamily="Material Symbols Sharp")
-    align_justify_flex_end_sharp = IconData(name="align_justify_flex_end", fontFamily="Material Symbols Sharp")
-    align_justify_flex_start_sharp = IconData(name="align_justify_flex_start", fontFamily="Material Symbols Sharp")
-    align_justify_space_around_sharp = IconData(name="align_justify_space_around", fontFamily="Material Symbols Sharp")
-    align_justify_space_between_sharp = IconData(name="align_justify_space_between", fontFamily="Material Symbols Sharp")
-    align_justify_space_even_sharp = IconData(name="align_justify_space_even", fontFamily="Material Symbols Sharp")
-    align_justify_stretch_sharp = IconData(name="align_justify_stretch", fontFamily="Material Symbols Sharp")
-    align_self_stretch_sharp = IconData(name="align_self_stretch", fontFamily="Material Symbols Sharp")
-    align_space_around_sharp = IconData(name="align_space_around", fontFamily="Material Symbols Sharp")
-    align_space_between_sharp = IconData(name="align_space_between", fontFamily="Material Symbols Sharp")
-    align_space_even_sharp = IconData(name="align_space_even", fontFamily="Material Symbols Sharp")
-    align_start_sharp = IconData(name="align_start", fontFamily="Material Symbols Sharp")
-    align_stretch_sharp = IconData(name="align_stretch", fontFamily="Material Symbols Sharp")
-    align_vertical_bottom_sharp = IconData(name="align_vertical_bottom", fontFamily="Material Symbols Sharp")
-    align_vertical_center_sharp = IconData(name="align_vertical_center", fontFamily="Material Symbols Sharp")
-    align_vertical_top_sharp = IconData(name="align_vertical_top", fontFamily="Material Symbols Sharp")
-    all_inbox_sharp = IconData(name="all_inbox", fontFamily="Material Symbols Sharp")
-    all_inclusive_sharp = IconData(name="all_inclusive", fontFamily="Material Symbols Sharp")
-    all_match_sharp = IconData(name="all_match", fontFamily="Material Symbols Sharp")
-    all_out_sharp = IconData(name="all_out", fontFamily="Material Symbols Sharp")
-    allergies_sharp = IconData(name="allergies", fontFamily="Material Symbols Sharp")
-    allergy_sharp = IconData(name="allergy", fontFamily="Material Symbols Sharp")
-    alt_route_sharp = IconData(name="alt_route", fontFamily="Material Symbols Sharp")
-    alternate_email_sharp = IconData(name="alternate_email", fontFamily="Material Symbols Sharp")
-    altitude_sharp = IconData(name="altitude", fontFamily="Material Symbols Sharp")
-    ambient_screen_sharp = IconData(name="ambient_screen", fontFamily="Material Symbols Sharp")
-    ambulance_sharp = IconData(name="ambulance", fontFamily="Material Symbols Sharp")
-    amend_sharp = IconData(name="amend", fontFamily="Material Symbols Sharp")
-    amp_stories_sharp = IconData(name="amp_stories", fontFamily="Material Symbols Sharp")
-    analytics_sharp = IconData(name="analytics", fontFamily="Material Symbols Sharp")
-    anchor_sharp = IconData(name="anchor", fontFamily="Material Symbols Sharp")
-    android_sharp = IconData(name="android", fontFamily="Material Symbols Sharp")
-    animated_images_sharp = IconData(name="animated_images", fontFamily="Material Symbols Sharp")
-    animation_sharp = IconData(name="animation", fontFamily="Material Symbols Sharp")
-    announcement_sharp = IconData(name="announcement", fontFamily="Material Symbols Sharp")
-    aod_sharp = IconData(name="aod", fontFamily="Material Symbols Sharp")
-    aod_tablet_sharp = IconData(name="aod_tablet", fontFamily="Material Symbols Sharp")
-    aod_watch_sharp = IconData(name="aod_watch", fontFamily="Material Symbols Sharp")
-    apartment_sharp = IconData(name="apartment", fontFamily="Material Symbols Sharp")
-    api_sharp = IconData(name="api", fontFamily="Material Symbols Sharp")
-    apk_document_sharp = IconData(name="apk_document", fontFamily="Material Symbols Sharp")
-    apk_install_sharp = IconData(name="apk_install", fontFamily="Material Symbols Sharp")
-    app_badging_sharp = IconData(name="app_badging", fontFamily="Material Symbols Sharp")
-    app_blocking_sharp = IconData(name="app_blocking", fontFamily="Material Symbols Sharp")
-    app_promo_sharp = IconData(name="app_promo", fontFamily="Material Symbols Sharp")
-    app_registration_sharp = IconData(name="app_registration", fontFamily="Material Symbols Sharp")
-    app_settings_alt_sharp = IconData(name="app_settings_alt", fontFamily="Material Symbols Sharp")
-    app_shortcut_sharp = IconData(name="app_shortcut", fontFamily="Material Symbols Sharp")
-    apparel_sharp = IconData(name="apparel", fontFamily="Material Symbols Sharp")
-    approval_sharp = IconData(name="approval", fontFamily="Material Symbols Sharp")
-    approval_delegation_sharp = IconData(name="approval_delegation", fontFamily="Material Symbols Sharp")
-    apps_sharp = IconData(name="apps", fontFamily="Material Symbols Sharp")
-    apps_outage_sharp = IconData(name="apps_outage", fontFamily="Material Symbols Sharp")
-    aq_sharp = IconData(name="aq", fontFamily="Material Symbols Sharp")
-    aq_indoor_sharp = IconData(name="aq_indoor", fontFamily="Material Symbols Sharp")
-    ar_on_you_sharp = IconData(name="ar_on_you", fontFamily="Material Symbols Sharp")
-    ar_stickers_sharp = IconData(name="ar_stickers", fontFamily="Material Symbols Sharp")
-    architecture_sharp = IconData(name="architecture", fontFamily="Material Symbols Sharp")
-    archive_sharp = IconData(name="archive", fontFamily="Material Symbols Sharp")
-    area_chart_sharp = IconData(name="area_chart", fontFamily="Material Symbols Sharp")
-    arming_countdown_sharp = IconData(name="arming_countdown", fontFamily="Material Symbols Sharp")
-    arrow_and_edge_sharp = IconData(name="arrow_and_edge", fontFamily="Material Symbols Sharp")
-    arrow_back_sharp = IconData(name="arrow_back", fontFamily="Material Symbols Sharp")
-    arrow_back_2_sharp = IconData(name="arrow_back_2", fontFamily="Material Symbols Sharp")
-    arrow_back_ios_sharp = IconData(name="arrow_back_ios", fontFamily="Material Symbols Sharp")
-    arrow_back_ios_new_sharp = IconData(name="arrow_back_ios_new", fontFamily="Material Symbols Sharp")
-    arrow_circle_down_sharp = IconData(name="arrow_circle_down", fontFamily="Material Symbols Sharp")
-    arrow_circle_left_sharp = IconData(name="arrow_circle_left", fontFamily="Material Symbols Sharp")
-    arrow_circle_right_sharp = IconData(name="arrow_circle_right", fontFamily="Material Symbols Sharp")
-    arrow_circle_up_sharp = IconData(name="arrow_circle_up", fontFamily="Material Symbols Sharp")
-    arrow_cool_down_sharp = IconData(name="arrow_cool_down", fontFamily="Material Symbols Sharp")
-    arrow_downward_sharp = IconData(name="arrow_downward", fontFamily="Material Symbols Sharp")
-    arrow_downward_alt_sharp = IconData(name="arrow_downward_alt", fontFamily="Material Symbols Sharp")
-    arrow_drop_down_sharp = IconData(name="arrow_drop_down", fontFamily="Material Symbols Sharp")
-    arrow_drop_down_circle_sharp = IconData(name="arrow_drop_down_circle", fontFamily="Material Symbols Sharp")
-    arrow_drop_up_sharp = IconData(name="arrow_drop_up", fontFamily="Material Symbols Sharp")
-    arrow_forward_sharp = IconData(name="arrow_forward", fontFamily="Material Symbols Sharp")
-    arrow_forward_ios_sharp = IconData(name="arrow_forward_ios", fontFamily="Material Symbols Sharp")
-    arrow_insert_sharp = IconData(name="arrow_insert", fontFamily="Material Symbols Sharp")
-    arrow_left_sharp = IconData(name="arrow_left", fontFamily="Material Symbols Sharp")
-    arrow_left_alt_sharp = IconData(name="arrow_left_alt", fontFamily="Material Symbols Sharp")
-    arrow_menu_close_sharp = IconData(name="arrow_menu_close", fontFamily="Material Symbols Sharp")
-    arrow_menu_open_sharp = IconData(name="arrow_menu_open", fontFamily="Material Symbols Sharp")
-    arrow_or_edge_sharp = IconData(name="arrow_or_edge", fontFamily="Material Symbols Sharp")
-    arrow_outward_sharp = IconData(name="arrow_outward", fontFamily="Material Symbols Sharp")
-    arrow_range_sharp = IconData(name="arrow_range", fontFamily="Material Symbols Sharp")
-    arrow_right_sharp = IconData(name="arrow_right", fontFamily="Material Symbols Sharp")
-    arrow_right_alt_sharp = IconData(name="arrow_right_alt", fontFamily="Material Symbols Sharp")
-    arrow_selector_tool_sharp = IconData(name="arrow_selector_tool", fontFamily="Material Symbols Sharp")
-    arrow_split_sharp = IconData(name="arrow_split", fontFamily="Material Symbols Sharp")
-    arrow_top_left_sharp = IconData(name="arrow_top_left", fontFamily="Material Symbols Sharp")
-    arrow_top_right_sharp = IconData(name="arrow_top_right", fontFamily="Material Symbols Sharp")
-    arrow_upload_progress_sharp = IconData(name="arrow_upload_progress", fontFamily="Material Symbols Sharp")
-    arrow_upload_ready_sharp = IconData(name="arrow_upload_ready", fontFamily="Material Symbols Sharp")
-    arrow_upward_sharp = IconData(name="arrow_upward", fontFamily="Material Symbols Sharp")
-    arrow_upward_alt_sharp = IconData(name="arrow_upward_alt", fontFamily="Material Symbols Sharp")
-    arrow_warm_up_sharp = IconData(name="arrow_warm_up", fontFamily="Material Symbols Sharp")
-    arrows_input_sharp = IconData(name="arrows_input", fontFamily="Material Symbols Sharp")
-    arrows_more_down_sharp = IconData(name="arrows_more_down", fontFamily="Material Symbols Sharp")
-    arrows_more_up_sharp = IconData(name="arrows_more_up", fontFamily="Material Symbols Sharp")
-    arrows_output_sharp = IconData(name="arrows_output", fontFamily="Material Symbols Sharp")
-    arrows_outward_sharp = IconData(name="arrows_outward", fontFamily="Material Symbols Sharp")
-    art_track_sharp = IconData(name="art_track", fontFamily="Material Symbols Sharp")
-    article_sharp = IconData(name="article", fontFamily="Material Symbols Sharp")
-    article_person_sharp = IconData(name="article_person", fontFamily="Material Symbols Sharp")
-    article_shortcut_sharp = IconData(name="article_shortcut", fontFamily="Material Symbols Sharp")
-    artist_sharp = IconData(name="artist", fontFamily="Material Symbols Sharp")
-    aspect_ratio_sharp = IconData(name="aspect_ratio", fontFamily="Material Symbols Sharp")
-    assessment_sharp = IconData(name="assessment", fontFamily="Material Symbols Sharp")
-    assignment_sharp = IconData(name="assignment", fontFamily="Material Symbols Sharp")
-    assignment_add_sharp = IconData(name="assignment_add", fontFamily="Material Symbols Sharp")
-    assignment_ind_sharp = IconData(name="assignment_ind", fontFamily="Material Symbols Sharp")
-    assignment_late_sharp = IconData(name="assignment_late", fontFamily="Material Symbols Sharp")
-    assignment_return_sharp = IconData(name="assignment_return", fontFamily="Material Symbols Sharp")
-    assignment_returned_sharp = IconData(name="assignment_returned", fontFamily="Material Symbols Sharp")
-    assignment_turned_in_sharp = IconData(name="assignment_turned_in", fontFamily="Material Symbols Sharp")
-    assist_walker_sharp = IconData(name="assist_walker", fontFamily="Material Symbols Sharp")
-    assistant_sharp = IconData(name="assistant", fontFamily="Material Symbols Sharp")
-    assistant_device_sharp = IconData(name="assistant_device", fontFamily="Material Symbols Sharp")
-    assistant_direction_sharp = IconData(name="assistant_direction", fontFamily="Material Symbols Sharp")
-    assistant_navigation_sharp = IconData(name="assistant_navigation", fontFamily="Material Symbols Sharp")
-    assistant_on_hub_sharp = IconData(name="assistant_on_hub", fontFamily="Material Symbols Sharp")
-    assistant_photo_sharp = IconData(name="assistant_photo", fontFamily="Material Symbols Sharp")
-    assured_workload_sharp = IconData(name="assured_workload", fontFamily="Material Symbols Sharp")
-    asterisk_sharp = IconData(name="asterisk", fontFamily="Material Symbols Sharp")
-    astrophotography_auto_sharp = IconData(name="astrophotography_auto", fontFamily="Material Symbols Sharp")
-    astrophotography_off_sharp = IconData(name="astrophotography_off", fontFamily="Material Symbols Sharp")
-    atm_sharp = IconData(name="atm", fontFamily="Material Symbols Sharp")
-    atr_sharp = IconData(name="atr", fontFamily="Material Symbols Sharp")
-    attach_email_sharp = IconData(name="attach_email", fontFamily="Material Symbols Sharp")
-    attach_file_sharp = IconData(name="attach_file", fontFamily="Material Symbols Sharp")
-    attach_file_add_sharp = IconData(name="attach_file_add", fontFamily="Material Symbols Sharp")
-    attach_file_off_sharp = IconData(name="attach_file_off", fontFamily="Material Symbols Sharp")
-    attach_money_sharp = IconData(name="attach_money", fontFamily="Material Symbols Sharp")
-    attachment_sharp = IconData(name="attachment", fontFamily="Material Symbols Sharp")
-    attractions_sharp = IconData(name="attractions", fontFamily="Material Symbols Sharp")
-    attribution_sharp = IconData(name="attribution", fontFamily="Material Symbols Sharp")
-    audio_description_sharp = IconData(name="audio_description", fontFamily="Material Symbols Sharp")
-    audio_file_sharp = IconData(name="audio_file", fontFamily="Material Symbols Sharp")
-    audio_video_receiver_sharp = IconData(name="audio_video_receiver", fontFamily="Material Symbols Sharp")
-    audiotrack_sharp = IconData(name="audiotrack", fontFamily="Material Symbols Sharp")
-    auto_activity_zone_sharp = IconData(name="auto_activity_zone", fontFamily="Material Symbols Sharp")
-    auto_awesome_sharp = IconData(name="auto_awesome", fontFamily="Material Symbols Sharp")
-    auto_awesome_mosaic_sharp = IconData(name="auto_awesome_mosaic", fontFamily="Material Symbols Sharp")
-    auto_awesome_motion_sharp = IconData(name="auto_awesome_motion", fontFamily="Material Symbols Sharp")
-    auto_delete_sharp = IconData(name="auto_delete", fontFamily="Material Symbols Sharp")
-    auto_detect_voice_sharp = IconData(name="auto_detect_voice", fontFamily="Material Symbols Sharp")
-    auto_draw_solid_sharp = IconData(name="auto_draw_solid", fontFamily="Material Symbols Sharp")
-    auto_fix_sharp = IconData(name="auto_fix", fontFamily="Material Symbols Sharp")
-    auto_fix_high_sharp = IconData(name="auto_fix_high", fontFamily="Material Symbols Sharp")
-    auto_fix_normal_sharp = IconData(name="auto_fix_normal", fontFamily="Material Symbols Sharp")
-    auto_fix_off_sharp = IconData(name="auto_fix_off", fontFamily="Material Symbols Sharp")
-    auto_graph_sharp = IconData(name="auto_graph", fontFamily="Material Symbols Sharp")
-    auto_label_sharp = IconData(name="auto_label", fontFamily="Material Symbols Sharp")
-    auto_meeting_room_sharp = IconData(name="auto_meeting_room", fontFamily="Material Symbols Sharp")
-    auto_mode_sharp = IconData(name="auto_mode", fontFamily="Material Symbols Sharp")
-    auto_read_pause_sharp = IconData(name="auto_read_pause", fontFamily="Material Symbols Sharp")
-    auto_read_play_sharp = IconData(name="auto_read_play", fontFamily="Material Symbols Sharp")
-    auto_schedule_sharp = IconData(name="auto_schedule", fontFamily="Material Symbols Sharp")
-    auto_stories_sharp = IconData(name="auto_stories", fontFamily="Material Symbols Sharp")
-    auto_timer_sharp = IconData(name="auto_timer", fontFamily="Material Symbols Sharp")
-    auto_towing_sharp = IconData(name="auto_towing", fontFamily="Material Symbols Sharp")
-    auto_transmission_sharp = IconData(name="auto_transmission", fontFamily="Material Symbols Sharp")
-    auto_videocam_sharp = IconData(name="auto_videocam", fontFamily="Material Symbols Sharp")
-    autofps_select_sharp = IconData(name="autofps_select", fontFamily="Material Symbols Sharp")
-    automation_sharp = IconData(name="automation", fontFamily="Material Symbols Sharp")
-    autopause_sharp = IconData(name="autopause", fontFamily="Material Symbols Sharp")
-    autopay_sharp = IconData(name="autopay", fontFamily="Material Symbols Sharp")
-    autoplay_sharp = IconData(name="autoplay", fontFamily="Material Symbols Sharp")
-    autorenew_sharp = IconData(name="autorenew", fontFamily="Material Symbols Sharp")
-    autostop_sharp = IconData(name="autostop", fontFamily="Material Symbols Sharp")
-    av1_sharp = IconData(name="av1", fontFamily="Material Symbols Sharp")
-    av_timer_sharp = IconData(name="av_timer", fontFamily="Material Symbols Sharp")
-    avc_sharp = IconData(name="avc", fontFamily="Material Symbols Sharp")
-    avg_pace_sharp = IconData(name="avg_pace", fontFamily="Material Symbols Sharp")
-    avg_time_sharp = IconData(name="avg_time", fontFamily="Material Symbols Sharp")
-    award_star_sharp = IconData(name="award_star", fontFamily="Material Symbols Sharp")
-    azm_sharp = IconData(name="azm", fontFamily="Material Symbols Sharp")
-    baby_changing_station_sharp = IconData(name="baby_changing_station", fontFamily="Material Symbols Sharp")
-    back_hand_sharp = IconData(name="back_hand", fontFamily="Material Symbols Sharp")
-    back_to_tab_sharp = IconData(name="back_to_tab", fontFamily="Material Symbols Sharp")
-    background_dot_large_sharp = IconData(name="background_dot_large", fontFamily="Material Symbols Sharp")
-    background_dot_small_sharp = IconData(name="background_dot_small", fontFamily="Material Symbols Sharp")
-    background_grid_small_sharp = IconData(name="background_grid_small", fontFamily="Material Symbols Sharp")
-    background_replace_sharp = IconData(name="background_replace", fontFamily="Material Symbols Sharp")
-    backlight_high_sharp = IconData(name="backlight_high", fontFamily="Material Symbols Sharp")
-    backlight_high_off_sharp = IconData(name="backlight_high_off", fontFamily="Material Symbols Sharp")
-    backlight_low_sharp = IconData(name="backlight_low", fontFamily="Material Symbols Sharp")
-    backpack_sharp = IconData(name="backpack", fontFamily="Material Symbols Sharp")
-    backspace_sharp = IconData(name="backspace", fontFamily="Material Symbols Sharp")
-    backup_sharp = IconData(name="backup", fontFamily="Material Symbols Sharp")
-    backup_table_sharp = IconData(name="backup_table", fontFamily="Material Symbols Sharp")
-    badge_sharp = IconData(name="badge", fontFamily="Material Symbols Sharp")
-    badge_critical_battery_sharp = IconData(name="badge_critical_battery", fontFamily="Material Symbols Sharp")
-    bakery_dining_sharp = IconData(name="bakery_dining", fontFamily="Material Symbols Sharp")
-    balance_sharp = IconData(name="balance", fontFamily="Material Symbols Sharp")
-    balcony_sharp = IconData(name="balcony", fontFamily="Material Symbols Sharp")
-    ballot_sharp = IconData(name="ballot", fontFamily="Material Symbols Sharp")
-    bar_chart_sharp = IconData(name="bar_chart", fontFamily="Material Symbols Sharp")
-    bar_chart_4_bars_sharp = IconData(name="bar_chart_4_bars", fontFamily="Material Symbols Sharp")
-    bar_chart_off_sharp = IconData(name="bar_chart_off", fontFamily="Material Symbols Sharp")
-    barcode_sharp = IconData(name="barcode", fontFamily="Material Symbols Sharp")
-    barcode_reader_sharp = IconData(name="barcode_reader", fontFamily="Material Symbols Sharp")
-    barcode_scanner_sharp = IconData(name="barcode_scanner", fontFamily="Material Symbols Sharp")
-    barefoot_sharp = IconData(name="barefoot", fontFamily="Material Symbols Sharp")
-    batch_prediction_sharp = IconData(name="batch_prediction", fontFamily="Material Symbols Sharp")
-    bath_outdoor_sharp = IconData(name="bath_outdoor", fontFamily="Material Symbols Sharp")
-    bath_private_sharp = IconData(name="bath_private", fontFamily="Material Symbols Sharp")
-    bath_public_large_sharp = IconData(name="bath_public_large", fontFamily="Material Symbols Sharp")
-    bathroom_sharp = IconData(name="bathroom", fontFamily="Material Symbols Sharp")
-    bathtub_sharp = IconData(name="bathtub", fontFamily="Material Symbols Sharp")
-    battery_0_bar_sharp = IconData(name="battery_0_bar", fontFamily="Material Symbols Sharp")
-    battery_1_bar_sharp = IconData(name="battery_1_bar", fontFamily="Material Symbols Sharp")
-    battery_20_sharp = IconData(name="battery_20", fontFamily="Material Symbols Sharp")
-    battery_2_bar_sharp = IconData(name="battery_2_bar", fontFamily="Material Symbols Sharp")
-    battery_30_sharp = IconData(name="battery_30", fontFamily="Material Symbols Sharp")
-    battery_3_bar_sharp = IconData(name="battery_3_bar", fontFamily="Material Symbols Sharp")
-    battery_4_bar_sharp = IconData(name="battery_4_bar", fontFamily="Material Symbols Sharp")
-    battery_50_sharp = IconData(name="battery_50", fontFamily="Material Symbols Sharp")
-    battery_5_bar_sharp = IconData(name="battery_5_bar", fontFamily="Material Symbols Sharp")
-    battery_60_sharp = IconData(name="battery_60", fontFamily="Material Symbols Sharp")
-    battery_6_bar_sharp = IconData(name="battery_6_bar", fontFamily="Material Symbols Sharp")
-    battery_80_sharp = IconData(name="battery_80", fontFamily="Material Symbols Sharp")
-    battery_90_sharp = IconData(name="battery_90", fontFamily="Material Symbols Sharp")
-    battery_alert_sharp = IconData(name="battery_alert", fontFamily="Material Symbols Sharp")
-    battery_android_0_sharp = IconData(name="battery_android_0", fontFamily="Material Symbols Sharp")
-    battery_android_1_sharp = IconData(name="battery_android_1", fontFamily="Material Symbols Sharp")
-    battery_android_2_sharp = IconData(name="battery_android_2", fontFamily="Material Symbols Sharp")
-    battery_android_3_sharp = IconData(name="battery_android_3", fontFamily="Material Symbols Sharp")
-    battery_android_4_sharp = IconData(name="battery_android_4", fontFamily="Material Symbols Sharp")
-    battery_android_5_sharp = IconData(name="battery_android_5", fontFamily="Material Symbols Sharp")
-    battery_android_6_sharp = IconData(name="battery_android_6", fontFamily="Material Symbols Sharp")
-    battery_android_alert_sharp = IconData(name="battery_android_alert", fontFamily="Material Symbols Sharp")
-    battery_android_bolt_sharp = IconData(name="battery_android_bolt", fontFamily="Material Symbols Sharp")
-    battery_android_full_sharp = IconData(name="battery_android_full", fontFamily="Material Symbols Sharp")
-    battery_android_plus_sharp = IconData(name="battery_android_plus", fontFamily="Material Symbols Sharp")
-    battery_android_question_sharp = IconData(name="battery_android_question", fontFamily="Material Symbols Sharp")
-    battery_android_share_sharp = IconData(name="battery_android_share", fontFamily="Material Symbols Sharp")
-    battery_android_shield_sharp = IconData(name="battery_android_shield", fontFamily="Material Symbols Sharp")
-    battery_change_sharp = IconData(name="battery_change", fontFamily="Material Symbols Sharp")
-    battery_charging_20_sharp = IconData(name="battery_charging_20", fontFamily="Material Symbols Sharp")
-    battery_charging_30_sharp = IconData(name="battery_charging_30", fontFamily="Material Symbols Sharp")
-    battery_charging_50_sharp = IconData(name="battery_charging_50", fontFamily="Material Symbols Sharp")
-    battery_charging_60_sharp = IconData(name="battery_charging_60", fontFamily="Material Symbols Sharp")
-    battery_charging_80_sharp = IconData(name="battery_charging_80", fontFamily="Material Symbols Sharp")
-    battery_charging_90_sharp = IconData(name="battery_charging_90", fontFamily="Material Symbols Sharp")
-    battery_charging_full_sharp = IconData(name="battery_charging_full", fontFamily="Material Symbols Sharp")
-    battery_error_sharp = IconData(name="battery_error", fontFamily="Material Symbols Sharp")
-    battery_full_sharp = IconData(name="battery_full", fontFamily="Material Symbols Sharp")
-    battery_full_alt_sharp = IconData(name="battery_full_alt", fontFamily="Material Symbols Sharp")
-    battery_horiz_000_sharp = IconData(name="battery_horiz_000", fontFamily="Material Symbols Sharp")
-    battery_horiz_050_sharp = IconData(name="battery_horiz_050", fontFamily="Material Symbols Sharp")
-    battery_horiz_075_sharp = IconData(name="battery_horiz_075", fontFamily="Material Symbols Sharp")
-    battery_low_sharp = IconData(name="battery_low", fontFamily="Material Symbols Sharp")
-    battery_plus_sharp = IconData(name="battery_plus", fontFamily="Material Symbols Sharp")
-    battery_profile_sharp = IconData(name="battery_profile", fontFamily="Material Symbols Sharp")
-    battery_saver_sharp = IconData(name="battery_saver", fontFamily="Material Symbols Sharp")
-    battery_share_sharp = IconData(name="battery_share", fontFamily="Material Symbols Sharp")
-    battery_status_good_sharp = IconData(name="battery_status_good", fontFamily="Material Symbols Sharp")
-    battery_std_sharp = IconData(name="battery_std", fontFamily="Material Symbols Sharp")
-    battery_unknown_sharp = IconData(name="battery_unknown", fontFamily="Material Symbols Sharp")
-    battery_vert_005_sharp = IconData(name="battery_vert_005", fontFamily="Material Symbols Sharp")
-    battery_vert_020_sharp = IconData(name="battery_vert_020", fontFamily="Material Symbols Sharp")
-    battery_vert_050_sharp = IconData(name="battery_vert_050", fontFamily="Material Symbols Sharp")
-    battery_very_low_sharp = IconData(name="battery_very_low", fontFamily="Material Symbols Sharp")
-    beach_access_sharp = IconData(name="beach_access", fontFamily="Material Symbols Sharp")
-    bed_sharp = IconData(name="bed", fontFamily="Material Symbols Sharp")
-    bedroom_baby_sharp = IconData(name="bedroom_baby", fontFamily="Material Symbols Sharp")
-    bedroom_child_sharp = IconData(name="bedroom_child", fontFamily="Material Symbols Sharp")
-    bedroom_parent_sharp = IconData(name="bedroom_parent", fontFamily="Material Symbols Sharp")
-    bedtime_sharp = IconData(name="bedtime", fontFamily="Material Symbols Sharp")
-    bedtime_off_sharp = IconData(name="bedtime_off", fontFamily="Material Symbols Sharp")
-    beenhere_sharp = IconData(name="beenhere", fontFamily="Material Symbols Sharp")
-    bento_sharp = IconData(name="bento", fontFamily="Material Symbols Sharp")
-    bia_sharp = IconData(name="bia", fontFamily="Material Symbols Sharp")
-    bid_landscape_sharp = IconData(name="bid_landscape", fontFamily="Material Symbols Sharp")
-    bid_landscape_disabled_sharp = IconData(name="bid_landscape_disabled", fontFamily="Material Symbols Sharp")
-    bigtop_updates_sharp = IconData(name="bigtop_updates", fontFamily="Material Symbols Sharp")
-    bike_dock_sharp = IconData(name="bike_dock", fontFamily="Material Symbols Sharp")
-    bike_lane_sharp = IconData(name="bike_lane", fontFamily="Material Symbols Sharp")
-    bike_scooter_sharp = IconData(name="bike_scooter", fontFamily="Material Symbols Sharp")
-    biotech_sharp = IconData(name="biotech", fontFamily="Material Symbols Sharp")
-    blanket_sharp = IconData(name="blanket", fontFamily="Material Symbols Sharp")
-    blender_sharp = IconData(name="blender", fontFamily="Material Symbols Sharp")
-    blind_sharp = IconData(name="blind", fontFamily="Material Symbols Sharp")
-    blinds_sharp = IconData(name="blinds", fontFamily="Material Symbols Sharp")
-    blinds_closed_sharp = IconData(name="blinds_closed", fontFamily="Material Symbols Sharp")
-    block_sharp = IconData(name="block", fontFamily="Material Symbols Sharp")
-    blood_pressure_sharp = IconData(name="blood_pressure", fontFamily="Material Symbols Sharp")
-    bloodtype_sharp = IconData(name="bloodtype", fontFamily="Material Symbols Sharp")
-    bluetooth_sharp = IconData(name="bluetooth", fontFamily="Material Symbols Sharp")
-    bluetooth_audio_sharp = IconData(name="bluetooth_audio", fontFamily="Material Symbols Sharp")
-    bluetooth_connected_sharp = IconData(name="bluetooth_connected", fontFamily="Material Symbols Sharp")
-    bluetooth_disabled_sharp = IconData(name="bluetooth_disabled", fontFamily="Material Symbols Sharp")
-    bluetooth_drive_sharp = IconData(name="bluetooth_drive", fontFamily="Material Symbols Sharp")
-    bluetooth_searching_sharp = IconData(name="bluetooth_searching", fontFamily="Material Symbols Sharp")
-    blur_circular_sharp = IconData(name="blur_circular", fontFamily="Material Symbols Sharp")
-    blur_linear_sharp = IconData(name="blur_linear", fontFamily="Material Symbols Sharp")
-    blur_medium_sharp = IconData(name="blur_medium", fontFamily="Material Symbols Sharp")
-    blur_off_sharp = IconData(name="blur_off", fontFamily="Material Symbols Sharp")
-    blur_on_sharp = IconData(name="blur_on", fontFamily="Material Symbols Sharp")
-    blur_short_sharp = IconData(name="blur_short", fontFamily="Material Symbols Sharp")
-    boat_bus_sharp = IconData(name="boat_bus", fontFamily="Material Symbols Sharp")
-    boat_railway_sharp = IconData(name="boat_railway", fontFamily="Material Symbols Sharp")
-    body_fat_sharp = IconData(name="body_fat", fontFamily="Material Symbols Sharp")
-    body_system_sharp = IconData(name="body_system", fontFamily="Material Symbols Sharp")
-    bolt_sharp = IconData(name="bolt", fontFamily="Material Symbols Sharp")
-    bomb_sharp = IconData(name="bomb", fontFamily="Material Symbols Sharp")
-    book_sharp = IconData(name="book", fontFamily="Material Symbols Sharp")
-    book_2_sharp = IconData(name="book_2", fontFamily="Material Symbols Sharp")
-    book_3_sharp = IconData(name="book_3", fontFamily="Material Symbols Sharp")
-    book_4_sharp = IconData(name="book_4", fontFamily="Material Symbols Sharp")
-    book_5_sharp = IconData(name="book_5", fontFamily="Material Symbols Sharp")
-    book_6_sharp = IconData(name="book_6", fontFamily="Material Symbols Sharp")
-    book_online_sharp = IconData(name="book_online", fontFamily="Material Symbols Sharp")
-    book_ribbon_sharp = IconData(name="book_ribbon", fontFamily="Material Symbols Sharp")
-    bookmark_sharp = IconData(name="bookmark", fontFamily="Material Symbols Sharp")
-    bookmark_add_sharp = IconData(name="bookmark_add", fontFamily="Material Symbols Sharp")
-    bookmark_added_sharp = IconData(name="bookmark_added", fontFamily="Material Symbols Sharp")
-    bookmark_bag_sharp = IconData(name="bookmark_bag", fontFamily="Material Symbols Sharp")
-    bookmark_border_sharp = IconData(name="bookmark_border", fontFamily="Material Symbols Sharp")
-    bookmark_check_sharp = IconData(name="bookmark_check", fontFamily="Material Symbols Sharp")
-    bookmark_flag_sharp = IconData(name="bookmark_flag", fontFamily="Material Symbols Sharp")
-    bookmark_heart_sharp = IconData(name="bookmark_heart", fontFamily="Material Symbols Sharp")
-    bookmark_manager_sharp = IconData(name="bookmark_manager", fontFamily="Material Symbols Sharp")
-    bookmark_remove_sharp = IconData(name="bookmark_remove", fontFamily="Material Symbols Sharp")
-    bookmark_star_sharp = IconData(name="bookmark_star", fontFamily="Material Symbols Sharp")
-    bookmarks_sharp = IconData(name="bookmarks", fontFamily="Material Symbols Sharp")
-    books_movies_and_music_sharp = IconData(name="books_movies_and_music", fontFamily="Material Symbols Sharp")
-    border_all_sharp = IconData(name="border_all", fontFamily="Material Symbols Sharp")
-    border_bottom_sharp = IconData(name="border_bottom", fontFamily="Material Symbols Sharp")
-    border_clear_sharp = IconData(name="border_clear", fontFamily="Material Symbols Sharp")
-    border_color_sharp = IconData(name="border_color", fontFamily="Material Symbols Sharp")
-    border_horizontal_sharp = IconData(name="border_horizontal", fontFamily="Material Symbols Sharp")
-    border_inner_sharp = IconData(name="border_inner", fontFamily="Material Symbols Sharp")
-    border_left_sharp = IconData(name="border_left", fontFamily="Material Symbols Sharp")
-    border_outer_sharp = IconData(name="border_outer", fontFamily="Material Symbols Sharp")
-    border_right_sharp = IconData(name="border_right", fontFamily="Material Symbols Sharp")
-    border_style_sharp = IconData(name="border_style", fontFamily="Material Symbols Sharp")
-    border_top_sharp = IconData(name="border_top", fontFamily="Material Symbols Sharp")
-    border_vertical_sharp = IconData(name="border_vertical", fontFamily="Material Symbols Sharp")
-    borg_sharp = IconData(name="borg", fontFamily="Material Symbols Sharp")
-    bottom_app_bar_sharp = IconData(name="bottom_app_bar", fontFamily="Material Symbols Sharp")
-    bottom_drawer_sharp = IconData(name="bottom_drawer", fontFamily="Material Symbols Sharp")
-    bottom_navigation_sharp = IconData(name="bottom_navigation", fontFamily="Material Symbols Sharp")
-    bottom_panel_close_sharp = IconData(name="bottom_panel_close", fontFamily="Material Symbols Sharp")
-    bottom_panel_open_sharp = IconData(name="bottom_panel_open", fontFamily="Material Symbols Sharp")
-    bottom_right_click_sharp = IconData(name="bottom_right_click", fontFamily="Material Symbols Sharp")
-    bottom_sheets_sharp = IconData(name="bottom_sheets", fontFamily="Material Symbols Sharp")
-    box_sharp = IconData(name="box", fontFamily="Material Symbols Sharp")
-    box_add_sharp = IconData(name="box_add", fontFamily="Material Symbols Sharp")
-    box_edit_sharp = IconData(name="box_edit", fontFamily="Material Symbols Sharp")
-    boy_sharp = IconData(name="boy", fontFamily="Material Symbols Sharp")
-    brand_awareness_sharp = IconData(name="brand_awareness", fontFamily="Material Symbols Sharp")
-    brand_family_sharp = IconData(name="brand_family", fontFamily="Material Symbols Sharp")
-    branding_watermark_sharp = IconData(name="branding_watermark", fontFamily="Material Symbols Sharp")
-    breakfast_dining_sharp = IconData(name="breakfast_dining", fontFamily="Material Symbols Sharp")
-    breaking_news_sharp = IconData(name="breaking_news", fontFamily="Material Symbols Sharp")
-    breaking_news_alt_1_sharp = IconData(name="breaking_news_alt_1", fontFamily="Material Symbols Sharp")
-    breastfeeding_sharp = IconData(name="breastfeeding", fontFamily="Material Symbols Sharp")
-    brick_sharp = IconData(name="brick", fontFamily="Material Symbols Sharp")
-    brightness_1_sharp = IconData(name="brightness_1", fontFamily="Material Symbols Sharp")
-    brightness_2_sharp = IconData(name="brightness_2", fontFamily="Material Symbols Sharp")
-    brightness_3_sharp = IconData(name="brightness_3", fontFamily="Material Symbols Sharp")
-    brightness_4_sharp = IconData(name="brightness_4", fontFamily="Material Symbols Sharp")
-    brightness_5_sharp = IconData(name="brightness_5", fontFamily="Material Symbols Sharp")
-    brightness_6_sharp = IconData(name="brightness_6", fontFamily="Material Symbols Sharp")
-    brightness_7_sharp = IconData(name="brightness_7", fontFamily="Material Symbols Sharp")
-    brightness_alert_sharp = IconData(name="brightness_alert", fontFamily="Material Symbols Sharp")
-    brightness_auto_sharp = IconData(name="brightness_auto", fontFamily="Material Symbols Sharp")
-    brightness_empty_sharp = IconData(name="brightness_empty", fontFamily="Material Symbols Sharp")
-    brightness_high_sharp = IconData(name="brightness_high", fontFamily="Material Symbols Sharp")
-    brightness_low_sharp = IconData(name="brightness_low", fontFamily="Material Symbols Sharp")
-    brightness_medium_sharp = IconData(name="brightness_medium", fontFamily="Material Symbols Sharp")
-    bring_your_own_ip_sharp = IconData(name="bring_your_own_ip", fontFamily="Material Symbols Sharp")
-    broadcast_on_home_sharp = IconData(name="broadcast_on_home", fontFamily="Material Symbols Sharp")
-    broadcast_on_personal_sharp = IconData(name="broadcast_on_personal", fontFamily="Material Symbols Sharp")
-    broken_image_sharp = IconData(name="broken_image", fontFamily="Material Symbols Sharp")
-    browse_sharp = IconData(name="browse", fontFamily="Material Symbols Sharp")
-    browse_activity_sharp = IconData(name="browse_activity", fontFamily="Material Symbols Sharp")
-    browse_gallery_sharp = IconData(name="browse_gallery", fontFamily="Material Symbols Sharp")
-    browser_not_supported_sharp = IconData(name="browser_not_supported", fontFamily="Material Symbols Sharp")
-    browser_updated_sharp = IconData(name="browser_updated", fontFamily="Material Symbols Sharp")
-    brunch_dining_sharp = IconData(name="brunch_dining", fontFamily="Material Symbols Sharp")
-    brush_sharp = IconData(name="brush", fontFamily="Material Symbols Sharp")
-    bubble_sharp = IconData(name="bubble", fontFamily="Material Symbols Sharp")
-    bubble_chart_sharp = IconData(name="bubble_chart", fontFamily="Material Symbols Sharp")
-    bubbles_sharp = IconData(name="bubbles", fontFamily="Material Symbols Sharp")
-    bug_report_sharp = IconData(name="bug_report", fontFamily="Material Symbols Sharp")
-    build_sharp = IconData(name="build", fontFamily="Material Symbols Sharp")
-    build_circle_sharp = IconData(name="build_circle", fontFamily="Material Symbols Sharp")
-    bungalow_sharp = IconData(name="bungalow", fontFamily="Material Symbols Sharp")
-    burst_mode_sharp = IconData(name="burst_mode", fontFamily="Material Symbols Sharp")
-    bus_alert_sharp = IconData(name="bus_alert", fontFamily="Material Symbols Sharp")
-    bus_railway_sharp = IconData(name="bus_railway", fontFamily="Material Symbols Sharp")
-    business_sharp = IconData(name="business", fontFamily="Material Symbols Sharp")
-    business_center_sharp = IconData(name="business_center", fontFamily="Material Symbols Sharp")
-    business_chip_sharp = IconData(name="business_chip", fontFamily="Material Symbols Sharp")
-    business_messages_sharp = IconData(name="business_messages", fontFamily="Material Symbols Sharp")
-    buttons_alt_sharp = IconData(name="buttons_alt", fontFamily="Material Symbols Sharp")
-    cabin_sharp = IconData(name="cabin", fontFamily="Material Symbols Sharp")
-    cable_sharp = IconData(name="cable", fontFamily="Material Symbols Sharp")
-    cable_car_sharp = IconData(name="cable_car", fontFamily="Material Symbols Sharp")
-    cached_sharp = IconData(name="cached", fontFamily="Material Symbols Sharp")
-    cadence_sharp = IconData(name="cadence", fontFamily="Material Symbols Sharp")
-    cake_sharp = IconData(name="cake", fontFamily="Material Symbols Sharp")
-    cake_add_sharp = IconData(name="cake_add", fontFamily="Material Symbols Sharp")
-    calculate_sharp = IconData(name="calculate", fontFamily="Material Symbols Sharp")
-    calendar_add_on_sharp = IconData(name="calendar_add_on", fontFamily="Material Symbols Sharp")
-    calendar_apps_script_sharp = IconData(name="calendar_apps_script", fontFamily="Material Symbols Sharp")
-    calendar_clock_sharp = IconData(name="calendar_clock", fontFamily="Material Symbols Sharp")
-    calendar_month_sharp = IconData(name="calendar_month", fontFamily="Material Symbols Sharp")
-    calendar_today_sharp = IconData(name="calendar_today", fontFamily="Material Symbols Sharp")
-    calendar_view_day_sharp = IconData(name="calendar_view_day", fontFamily="Material Symbols Sharp")
-    calendar_view_month_sharp = IconData(name="calendar_view_month", fontFamily="Material Symbols Sharp")
-    calendar_view_week_sharp = IconData(name="calendar_view_week", fontFamily="Material Symbols Sharp")
-    call_sharp = IconData(name="call", fontFamily="Material Symbols Sharp")
-    call_end_sharp = IconData(name="call_end", fontFamily="Material Symbols Sharp")
-    call_end_alt_sharp = IconData(name="call_end_alt", fontFamily="Material Symbols Sharp")
-    call_log_sharp = IconData(name="call_log", fontFamily="Material Symbols Sharp")
-    call_made_sharp = IconData(name="call_made", fontFamily="Material Symbols Sharp")
-    call_merge_sharp = IconData(name="call_merge", fontFamily="Material Symbols Sharp")
-    call_missed_sharp = IconData(name="call_missed", fontFamily="Material Symbols Sharp")
-    call_missed_outgoing_sharp = IconData(name="call_missed_outgoing", fontFamily="Material Symbols Sharp")
-    call_quality_sharp = IconData(name="call_quality", fontFamily="Material Symbols Sharp")
-    call_received_sharp = IconData(name="call_received", fontFamily="Material Symbols Sharp")
-    call_split_sharp = IconData(name="call_split", fontFamily="Material Symbols Sharp")
-    call_to_action_sharp = IconData(name="call_to_action", fontFamily="Material Symbols Sharp")
-    camera_sharp = IconData(name="camera", fontFamily="Material Symbols Sharp")
-    camera_alt_sharp = IconData(name="camera_alt", fontFamily="Material Symbols Sharp")
-    camera_enhance_sharp = IconData(name="camera_enhance", fontFamily="Material Symbols Sharp")
-    camera_front_sharp = IconData(name="camera_front", fontFamily="Material Symbols Sharp")
-    camera_indoor_sharp = IconData(name="camera_indoor", fontFamily="Material Symbols Sharp")
-    camera_outdoor_sharp = IconData(name="camera_outdoor", fontFamily="Material Symbols Sharp")
-    camera_rear_sharp = IconData(name="camera_rear", fontFamily="Material Symbols Sharp")
-    camera_roll_sharp = IconData(name="camera_roll", fontFamily="Material Symbols Sharp")
-    camera_video_sharp = IconData(name="camera_video", fontFamily="Material Symbols Sharp")
-    cameraswitch_sharp = IconData(name="cameraswitch", fontFamily="Material Symbols Sharp")
-    campaign_sharp = IconData(name="campaign", fontFamily="Material Symbols Sharp")
-    camping_sharp = IconData(name="camping", fontFamily="Material Symbols Sharp")
-    cancel_sharp = IconData(name="cancel", fontFamily="Material Symbols Sharp")
-    cancel_presentation_sharp = IconData(name="cancel_presentation", fontFamily="Material Symbols Sharp")
-    cancel_schedule_send_sharp = IconData(name="cancel_schedule_send", fontFamily="Material Symbols Sharp")
-    candle_sharp = IconData(name="candle", fontFamily="Material Symbols Sharp")
-    candlestick_chart_sharp = IconData(name="candlestick_chart", fontFamily="Material Symbols Sharp")
-    cannabis_sharp = IconData(name="cannabis", fontFamily="Material Symbols Sharp")
-    captive_portal_sharp = IconData(name="captive_portal", fontFamily="Material Symbols Sharp")
-    capture_sharp = IconData(name="capture", fontFamily="Material Symbols Sharp")
-    car_crash_sharp = IconData(name="car_crash", fontFamily="Material Symbols Sharp")
-    car_defrost_left_sharp = IconData(name="car_defrost_left", fontFamily="Material Symbols Sharp")
-    car_defrost_low_left_sharp = IconData(name="car_defrost_low_left", fontFamily="Material Symbols Sharp")
-    car_defrost_low_right_sharp = IconData(name="car_defrost_low_right", fontFamily="Material Symbols Sharp")
-    car_defrost_mid_low_left_sharp = IconData(name="car_defrost_mid_low_left", fontFamily="Material Symbols Sharp")
-    car_defrost_mid_right_sharp = IconData(name="car_defrost_mid_right", fontFamily="Material Symbols Sharp")
-    car_defrost_right_sharp = IconData(name="car_defrost_right", fontFamily="Material Symbols Sharp")
-    car_fan_low_left_sharp = IconData(name="car_fan_low_left", fontFamily="Material Symbols Sharp")
-    car_fan_low_mid_left_sharp = IconData(name="car_fan_low_mid_left", fontFamily="Material Symbols Sharp")
-    car_fan_low_right_sharp = IconData(name="car_fan_low_right", fontFamily="Material Symbols Sharp")
-    car_fan_mid_left_sharp = IconData(name="car_fan_mid_left", fontFamily="Material Symbols Sharp")
-    car_fan_mid_low_right_sharp = IconData(name="car_fan_mid_low_right", fontFamily="Material Symbols Sharp")
-    car_fan_mid_right_sharp = IconData(name="car_fan_mid_right", fontFamily="Material Symbols Sharp")
-    car_fan_recirculate_sharp = IconData(name="car_fan_recirculate", fontFamily="Material Symbols Sharp")
-    car_gear_sharp = IconData(name="car_gear", fontFamily="Material Symbols Sharp")
-    car_lock_sharp = IconData(name="car_lock", fontFamily="Material Symbols Sharp")
-    car_mirror_heat_sharp = IconData(name="car_mirror_heat", fontFamily="Material Symbols Sharp")
-    car_rental_sharp = IconData(name="car_rental", fontFamily="Material Symbols Sharp")
-    car_repair_sharp = IconData(name="car_repair", fontFamily="Material Symbols Sharp")
-    car_tag_sharp = IconData(name="car_tag", fontFamily="Material Symbols Sharp")
-    card_giftcard_sharp = IconData(name="card_giftcard", fontFamily="Material Symbols Sharp")
-    card_membership_sharp = IconData(name="card_membership", fontFamily="Material Symbols Sharp")
-    card_travel_sharp = IconData(name="card_travel", fontFamily="Material Symbols Sharp")
-    cardio_load_sharp = IconData(name="cardio_load", fontFamily="Material Symbols Sharp")
-    cardiology_sharp = IconData(name="cardiology", fontFamily="Material Symbols Sharp")
-    cards_sharp = IconData(name="cards", fontFamily="Material Symbols Sharp")
-    cards_star_sharp = IconData(name="cards_star", fontFamily="Material Symbols Sharp")
-    carpenter_sharp = IconData(name="carpenter", fontFamily="Material Symbols Sharp")
-    carry_on_bag_sharp = IconData(name="carry_on_bag", fontFamily="Material Symbols Sharp")
-    carry_on_bag_checked_sharp = IconData(name="carry_on_bag_checked", fontFamily="Material Symbols Sharp")
-    carry_on_bag_inactive_sharp = IconData(name="carry_on_bag_inactive", fontFamily="Material Symbols Sharp")
-    carry_on_bag_question_sharp = IconData(name="carry_on_bag_question", fontFamily="Material Symbols Sharp")
-    cases_sharp = IconData(name="cases", fontFamily="Material Symbols Sharp")
-    casino_sharp = IconData(name="casino", fontFamily="Material Symbols Sharp")
-    cast_sharp = IconData(name="cast", fontFamily="Material Symbols Sharp")
-    cast_connected_sharp = IconData(name="cast_connected", fontFamily="Material Symbols Sharp")
-    cast_for_education_sharp = IconData(name="cast_for_education", fontFamily="Material Symbols Sharp")
-    cast_pause_sharp = IconData(name="cast_pause", fontFamily="Material Symbols Sharp")
-    cast_warning_sharp = IconData(name="cast_warning", fontFamily="Material Symbols Sharp")
-    castle_sharp = IconData(name="castle", fontFamily="Material Symbols Sharp")
-    category_sharp = IconData(name="category", fontFamily="Material Symbols Sharp")
-    category_search_sharp = IconData(name="category_search", fontFamily="Material Symbols Sharp")
-    celebration_sharp = IconData(name="celebration", fontFamily="Material Symbols Sharp")
-    cell_merge_sharp = IconData(name="cell_merge", fontFamily="Material Symbols Sharp")
-    cell_tower_sharp = IconData(name="cell_tower", fontFamily="Material Symbols Sharp")
-    cell_wifi_sharp = IconData(name="cell_wifi", fontFamily="Material Symbols Sharp")
-    center_focus_strong_sharp = IconData(name="center_focus_strong", fontFamily="Material Symbols Sharp")
-    center_focus_weak_sharp = IconData(name="center_focus_weak", fontFamily="Material Symbols Sharp")
-    chair_sharp = IconData(name="chair", fontFamily="Material Symbols Sharp")
-    chair_alt_sharp = IconData(name="chair_alt", fontFamily="Material Symbols Sharp")
-    chalet_sharp = IconData(name="chalet", fontFamily="Material Symbols Sharp")
-    change_circle_sharp = IconData(name="change_circle", fontFamily="Material Symbols Sharp")
-    change_history_sharp = IconData(name="change_history", fontFamily="Material Symbols Sharp")
-    charger_sharp = IconData(name="charger", fontFamily="Material Symbols Sharp")
-    charging_station_sharp = IconData(name="charging_station", fontFamily="Material Symbols Sharp")
-    chart_data_sharp = IconData(name="chart_data", fontFamily="Material Symbols Sharp")
-    chat_sharp = IconData(name="chat", fontFamily="Material Symbols Sharp")
-    chat_add_on_sharp = IconData(name="chat_add_on", fontFamily="Material Symbols Sharp")
-    chat_apps_script_sharp = IconData(name="chat_apps_script", fontFamily="Material Symbols Sharp")
-    chat_bubble_sharp = IconData(name="chat_bubble", fontFamily="Material Symbols Sharp")
-    chat_bubble_outline_sharp = IconData(name="chat_bubble_outline", fontFamily="Material Symbols Sharp")
-    chat_error_sharp = IconData(name="chat_error", fontFamily="Material Symbols Sharp")
-    chat_info_sharp = IconData(name="chat_info", fontFamily="Material Symbols Sharp")
-    chat_paste_go_sharp = IconData(name="chat_paste_go", fontFamily="Material Symbols Sharp")
-    chat_paste_go_2_sharp = IconData(name="chat_paste_go_2", fontFamily="Material Symbols Sharp")
-    check_sharp = IconData(name="check", fontFamily="Material Symbols Sharp")
-    check_box_sharp = IconData(name="check_box", fontFamily="Material Symbols Sharp")
-    check_box_outline_blank_sharp = IconData(name="check_box_outline_blank", fontFamily="Material Symbols Sharp")
-    check_circle_sharp = IconData(name="check_circle", fontFamily="Material Symbols Sharp")
-    check_circle_filled_sharp = IconData(name="check_circle_filled", fontFamily="Material Symbols Sharp")
-    check_circle_outline_sharp = IconData(name="check_circle_outline", fontFamily="Material Symbols Sharp")
-    check_in_out_sharp = IconData(name="check_in_out", fontFamily="Material Symbols Sharp")
-    check_indeterminate_small_sharp = IconData(name="check_indeterminate_small", fontFamily="Material Symbols Sharp")
-    check_small_sharp = IconData(name="check_small", fontFamily="Material Symbols Sharp")
-    checkbook_sharp = IconData(name="checkbook", fontFamily="Material Symbols Sharp")
-    checked_bag_sharp = IconData(name="checked_bag", fontFamily="Material Symbols Sharp")
-    checked_bag_question_sharp = IconData(name="checked_bag_question", fontFamily="Material Symbols Sharp")
-    checklist_sharp = IconData(name="checklist", fontFamily="Material Symbols Sharp")
-    checklist_rtl_sharp = IconData(name="checklist_rtl", fontFamily="Material Symbols Sharp")
-    checkroom_sharp = IconData(name="checkroom", fontFamily="Material Symbols Sharp")
-    cheer_sharp = IconData(name="cheer", fontFamily="Material Symbols Sharp")
-    chef_hat_sharp = IconData(name="chef_hat", fontFamily="Material Symbols Sharp")
-    chess_sharp = IconData(name="chess", fontFamily="Material Symbols Sharp")
-    chess_pawn_sharp = IconData(name="chess_pawn", fontFamily="Material Symbols Sharp")
-    chevron_backward_sharp = IconData(name="chevron_backward", fontFamily="Material Symbols Sharp")
-    chevron_forward_sharp = IconData(name="chevron_forward", fontFamily="Material Symbols Sharp")
-    chevron_left_sharp = IconData(name="chevron_left", fontFamily="Material Symbols Sharp")
-    chevron_right_sharp = IconData(name="chevron_right", fontFamily="Material Symbols Sharp")
-    child_care_sharp = IconData(name="child_care", fontFamily="Material Symbols Sharp")
-    child_friendly_sharp = IconData(name="child_friendly", fontFamily="Material Symbols Sharp")
-    chip_extraction_sharp = IconData(name="chip_extraction", fontFamily="Material Symbols Sharp")
-    chips_sharp = IconData(name="chips", fontFamily="Material Symbols Sharp")
-    chrome_reader_mode_sharp = IconData(name="chrome_reader_mode", fontFamily="Material Symbols Sharp")
-    chromecast_2_sharp = IconData(name="chromecast_2", fontFamily="Material Symbols Sharp")
-    chromecast_device_sharp = IconData(name="chromecast_device", fontFamily="Material Symbols Sharp")
-    chronic_sharp = IconData(name="chronic", fontFamily="Material Symbols Sharp")
-    church_sharp = IconData(name="church", fontFamily="Material Symbols Sharp")
-    cinematic_blur_sharp = IconData(name="cinematic_blur", fontFamily="Material Symbols Sharp")
-    circle_sharp = IconData(name="circle", fontFamily="Material Symbols Sharp")
-    circle_notifications_sharp = IconData(name="circle_notifications", fontFamily="Material Symbols Sharp")
-    circles_sharp = IconData(name="circles", fontFamily="Material Symbols Sharp")
-    circles_ext_sharp = IconData(name="circles_ext", fontFamily="Material Symbols Sharp")
-    clarify_sharp = IconData(name="clarify", fontFamily="Material Symbols Sharp")
-    class_sharp = IconData(name="class", fontFamily="Material Symbols Sharp")
-    clean_hands_sharp = IconData(name="clean_hands", fontFamily="Material Symbols Sharp")
-    cleaning_sharp = IconData(name="cleaning", fontFamily="Material Symbols Sharp")
-    cleaning_bucket_sharp = IconData(name="cleaning_bucket", fontFamily="Material Symbols Sharp")
-    cleaning_services_sharp = IconData(name="cleaning_services", fontFamily="Material Symbols Sharp")
-    clear_sharp = IconData(name="clear", fontFamily="Material Symbols Sharp")
-    clear_all_sharp = IconData(name="clear_all", fontFamily="Material Symbols Sharp")
-    clear_day_sharp = IconData(name="clear_day", fontFamily="Material Symbols Sharp")
-    clear_night_sharp = IconData(name="clear_night", fontFamily="Material Symbols Sharp")
-    climate_mini_split_sharp = IconData(name="climate_mini_split", fontFamily="Material Symbols Sharp")
-    clinical_notes_sharp = IconData(name="clinical_notes", fontFamily="Material Symbols Sharp")
-    clock_arrow_down_sharp = IconData(name="clock_arrow_down", fontFamily="Material Symbols Sharp")
-    clock_arrow_up_sharp = IconData(name="clock_arrow_up", fontFamily="Material Symbols Sharp")
-    clock_loader_10_sharp = IconData(name="clock_loader_10", fontFamily="Material Symbols Sharp")
-    clock_loader_20_sharp = IconData(name="clock_loader_20", fontFamily="Material Symbols Sharp")
-    clock_loader_40_sharp = IconData(name="clock_loader_40", fontFamily="Material Symbols Sharp")
-    clock_loader_60_sharp = IconData(name="clock_loader_60", fontFamily="Material Symbols Sharp")
-    clock_loader_80_sharp = IconData(name="clock_loader_80", fontFamily="Material Symbols Sharp")
-    clock_loader_90_sharp = IconData(name="clock_loader_90", fontFamily="Material Symbols Sharp")
-    close_sharp = IconData(name="close", fontFamily="Material Symbols Sharp")
-    close_fullscreen_sharp = IconData(name="close_fullscreen", fontFamily="Material Symbols Sharp")
-    close_small_sharp = IconData(name="close_small", fontFamily="Material Symbols Sharp")
-    closed_caption_sharp = IconData(name="closed_caption", fontFamily="Material Symbols Sharp")
-    closed_caption_add_sharp = IconData(name="closed_caption_add", fontFamily="Material Symbols Sharp")
-    closed_caption_disabled_sharp = IconData(name="closed_caption_disabled", fontFamily="Material Symbols Sharp")
-    closed_caption_off_sharp = IconData(name="closed_caption_off", fontFamily="Material Symbols Sharp")
-    cloud_sharp = IconData(name="cloud", fontFamily="Material Symbols Sharp")
-    cloud_alert_sharp = IconData(name="cloud_alert", fontFamily="Material Symbols Sharp")
-    cloud_circle_sharp = IconData(name="cloud_circle", fontFamily="Material Symbols Sharp")
-    cloud_done_sharp = IconData(name="cloud_done", fontFamily="Material Symbols Sharp")
-    cloud_download_sharp = IconData(name="cloud_download", fontFamily="Material Symbols Sharp")
-    cloud_lock_sharp = IconData(name="cloud_lock", fontFamily="Material Symbols Sharp")
-    cloud_off_sharp = IconData(name="cloud_off", fontFamily="Material Symbols Sharp")
-    cloud_queue_sharp = IconData(name="cloud_queue", fontFamily="Material Symbols Sharp")
-    cloud_sync_sharp = IconData(name="cloud_sync", fontFamily="Material Symbols Sharp")
-    cloud_upload_sharp = IconData(name="cloud_upload", fontFamily="Material Symbols Sharp")
-    cloudy_sharp = IconData(name="cloudy", fontFamily="Material Symbols Sharp")
-    cloudy_filled_sharp = IconData(name="cloudy_filled", fontFamily="Material Symbols Sharp")
-    cloudy_snowing_sharp = IconData(name="cloudy_snowing", fontFamily="Material Symbols Sharp")
-    co2_sharp = IconData(name="co2", fontFamily="Material Symbols Sharp")
-    co_present_sharp = IconData(name="co_present", fontFamily="Material Symbols Sharp")
-    code_sharp = IconData(name="code", fontFamily="Material Symbols Sharp")
-    code_blocks_sharp = IconData(name="code_blocks", fontFamily="Material Symbols Sharp")
-    code_off_sharp = IconData(name="code_off", fontFamily="Material Symbols Sharp")
-    coffee_sharp = IconData(name="coffee", fontFamily="Material Symbols Sharp")
-    coffee_maker_sharp = IconData(name="coffee_maker", fontFamily="Material Symbols Sharp")
-    cognition_sharp = IconData(name="cognition", fontFamily="Material Symbols Sharp")
-    cognition_2_sharp = IconData(name="cognition_2", fontFamily="Material Symbols Sharp")
-    collapse_all_sharp = IconData(name="collapse_all", fontFamily="Material Symbols Sharp")
-    collapse_content_sharp = IconData(name="collapse_content", fontFamily="Material Symbols Sharp")
-    collections_sharp = IconData(name="collections", fontFamily="Material Symbols Sharp")
-    collections_bookmark_sharp = IconData(name="collections_bookmark", fontFamily="Material Symbols Sharp")
-    color_lens_sharp = IconData(name="color_lens", fontFamily="Material Symbols Sharp")
-    colorize_sharp = IconData(name="colorize", fontFamily="Material Symbols Sharp")
-    colors_sharp = IconData(name="colors", fontFamily="Material Symbols Sharp")
-    combine_columns_sharp = IconData(name="combine_columns", fontFamily="Material Symbols Sharp")
-    comedy_mask_sharp = IconData(name="comedy_mask", fontFamily="Material Symbols Sharp")
-    comic_bubble_sharp = IconData(name="comic_bubble", fontFamily="Material Symbols Sharp")
-    comment_sharp = IconData(name="comment", fontFamily="Material Symbols Sharp")
-    comment_bank_sharp = IconData(name="comment_bank", fontFamily="Material Symbols Sharp")
-    comments_disabled_sharp = IconData(name="comments_disabled", fontFamily="Material Symbols Sharp")
-    commit_sharp = IconData(name="commit", fontFamily="Material Symbols Sharp")
-    communication_sharp = IconData(name="communication", fontFamily="Material Symbols Sharp")
-    communities_sharp = IconData(name="communities", fontFamily="Material Symbols Sharp")
-    communities_filled_sharp = IconData(name="communities_filled", fontFamily="Material Symbols Sharp")
-    commute_sharp = IconData(name="commute", fontFamily="Material Symbols Sharp")
-    compare_sharp = IconData(name="compare", fontFamily="Material Symbols Sharp")
-    compare_arrows_sharp = IconData(name="compare_arrows", fontFamily="Material Symbols Sharp")
-    compass_calibration_sharp = IconData(name="compass_calibration", fontFamily="Material Symbols Sharp")
-    component_exchange_sharp = IconData(name="component_exchange", fontFamily="Material Symbols Sharp")
-    compost_sharp = IconData(name="compost", fontFamily="Material Symbols Sharp")
-    compress_sharp = IconData(name="compress", fontFamily="Material Symbols Sharp")
-    computer_sharp = IconData(name="computer", fontFamily="Material Symbols Sharp")
-    computer_arrow_up_sharp = IconData(name="computer_arrow_up", fontFamily="Material Symbols Sharp")
-    computer_cancel_sharp = IconData(name="computer_cancel", fontFamily="Material Symbols Sharp")
-    concierge_sharp = IconData(name="concierge", fontFamily="Material Symbols Sharp")
-    conditions_sharp = IconData(name="conditions", fontFamily="Material Symbols Sharp")
-    confirmation_number_sharp = IconData(name="confirmation_number", fontFamily="Material Symbols Sharp")
-    congenital_sharp = IconData(name="congenital", fontFamily="Material Symbols Sharp")
-    connect_without_contact_sharp = IconData(name="connect_without_contact", fontFamily="Material Symbols Sharp")
-    connected_tv_sharp = IconData(name="connected_tv", fontFamily="Material Symbols Sharp")
-    connecting_airports_sharp = IconData(name="connecting_airports", fontFamily="Material Symbols Sharp")
-    construction_sharp = IconData(name="construction", fontFamily="Material Symbols Sharp")
-    contact_emergency_sharp = IconData(name="contact_emergency", fontFamily="Material Symbols Sharp")
-    contact_mail_sharp = IconData(name="contact_mail", fontFamily="Material Symbols Sharp")
-    contact_page_sharp = IconData(name="contact_page", fontFamily="Material Symbols Sharp")
-    contact_phone_sharp = IconData(name="contact_phone", fontFamily="Material Symbols Sharp")
-    contact_phone_filled_sharp = IconData(name="contact_phone_filled", fontFamily="Material Symbols Sharp")
-    contact_support_sharp = IconData(name="contact_support", fontFamily="Material Symbols Sharp")
-    contactless_sharp = IconData(name="contactless", fontFamily="Material Symbols Sharp")
-    contactless_off_sharp = IconData(name="contactless_off", fontFamily="Material Symbols Sharp")
-    contacts_sharp = IconData(name="contacts", fontFamily="Material Symbols Sharp")
-    contacts_product_sharp = IconData(name="contacts_product", fontFamily="Material Symbols Sharp")
-    content_copy_sharp = IconData(name="content_copy", fontFamily="Material Symbols Sharp")
-    content_cut_sharp = IconData(name="content_cut", fontFamily="Material Symbols Sharp")
-    content_paste_sharp = IconData(name="content_paste", fontFamily="Material Symbols Sharp")
-    content_paste_go_sharp = IconData(name="content_paste_go", fontFamily="Material Symbols Sharp")
-    content_paste_off_sharp = IconData(name="content_paste_off", fontFamily="Material Symbols Sharp")
-    content_paste_search_sharp = IconData(name="content_paste_search", fontFamily="Material Symbols Sharp")
-    contextual_token_sharp = IconData(name="contextual_token", fontFamily="Material Symbols Sharp")
-    contextual_token_add_sharp = IconData(name="contextual_token_add", fontFamily="Material Symbols Sharp")
-    contract_sharp = IconData(name="contract", fontFamily="Material Symbols Sharp")
-    contract_delete_sharp = IconData(name="contract_delete", fontFamily="Material Symbols Sharp")
-    contract_edit_sharp = IconData(name="contract_edit", fontFamily="Material Symbols Sharp")
-    contrast_sharp = IconData(name="contrast", fontFamily="Material Symbols Sharp")
-    contrast_circle_sharp = IconData(name="contrast_circle", fontFamily="Material Symbols Sharp")
-    contrast_rtl_off_sharp = IconData(name="contrast_rtl_off", fontFamily="Material Symbols Sharp")
-    contrast_square_sharp = IconData(name="contrast_square", fontFamily="Material Symbols Sharp")
-    control_camera_sharp = IconData(name="control_camera", fontFamily="Material Symbols Sharp")
-    control_point_sharp = IconData(name="control_point", fontFamily="Material Symbols Sharp")
-    control_point_duplicate_sharp = IconData(name="control_point_duplicate", fontFamily="Material Symbols Sharp")
-    controller_gen_sharp = IconData(name="controller_gen", fontFamily="Material Symbols Sharp")
-    conversion_path_sharp = IconData(name="conversion_path", fontFamily="Material Symbols Sharp")
-    conversion_path_off_sharp = IconData(name="conversion_path_off", fontFamily="Material Symbols Sharp")
-    convert_to_text_sharp = IconData(name="convert_to_text", fontFamily="Material Symbols Sharp")
-    conveyor_belt_sharp = IconData(name="conveyor_belt", fontFamily="Material Symbols Sharp")
-    cookie_sharp = IconData(name="cookie", fontFamily="Material Symbols Sharp")
-    cookie_off_sharp = IconData(name="cookie_off", fontFamily="Material Symbols Sharp")
-    cooking_sharp = IconData(name="cooking", fontFamily="Material Symbols Sharp")
-    cool_to_dry_sharp = IconData(name="cool_to_dry", fontFamily="Material Symbols Sharp")
-    copy_all_sharp = IconData(name="copy_all", fontFamily="Material Symbols Sharp")
-    copyright_sharp = IconData(name="copyright", fontFamily="Material Symbols Sharp")
-    coronavirus_sharp = IconData(name="coronavirus", fontFamily="Material Symbols Sharp")
-    corporate_fare_sharp = IconData(name="corporate_fare", fontFamily="Material Symbols Sharp")
-    cottage_sharp = IconData(name="cottage", fontFamily="Material Symbols Sharp")
-    counter_0_sharp = IconData(name="counter_0", fontFamily="Material Symbols Sharp")
-    counter_1_sharp = IconData(name="counter_1", fontFamily="Material Symbols Sharp")
-    counter_2_sharp = IconData(name="counter_2", fontFamily="Material Symbols Sharp")
-    counter_3_sharp = IconData(name="counter_3", fontFamily="Material Symbols Sharp")
-    counter_4_sharp = IconData(name="counter_4", fontFamily="Material Symbols Sharp")
-    counter_5_sharp = IconData(name="counter_5", fontFamily="Material Symbols Sharp")
-    counter_6_sharp = IconData(name="counter_6", fontFamily="Material Symbols Sharp")
-    counter_7_sharp = IconData(name="counter_7", fontFamily="Material Symbols Sharp")
-    counter_8_sharp = IconData(name="counter_8", fontFamily="Material Symbols Sharp")
-    counter_9_sharp = IconData(name="counter_9", fontFamily="Material Symbols Sharp")
-    countertops_sharp = IconData(name="countertops", fontFamily="Material Symbols Sharp")
-    create_sharp = IconData(name="create", fontFamily="Material Symbols Sharp")
-    create_new_folder_sharp = IconData(name="create_new_folder", fontFamily="Material Symbols Sharp")
-    credit_card_sharp = IconData(name="credit_card", fontFamily="Material Symbols Sharp")
-    credit_card_clock_sharp = IconData(name="credit_card_clock", fontFamily="Material Symbols Sharp")
-    credit_card_gear_sharp = IconData(name="credit_card_gear", fontFamily="Material Symbols Sharp")
-    credit_card_heart_sharp = IconData(name="credit_card_heart", fontFamily="Material Symbols Sharp")
-    credit_card_off_sharp = IconData(name="credit_card_off", fontFamily="Material Symbols Sharp")
-    credit_score_sharp = IconData(name="credit_score", fontFamily="Material Symbols Sharp")
-    crib_sharp = IconData(name="crib", fontFamily="Material Symbols Sharp")
-    crisis_alert_sharp = IconData(name="crisis_alert", fontFamily="Material Symbols Sharp")
-    crop_sharp = IconData(name="crop", fontFamily="Material Symbols Sharp")
-    crop_16_9_sharp = IconData(name="crop_16_9", fontFamily="Material Symbols Sharp")
-    crop_3_2_sharp = IconData(name="crop_3_2", fontFamily="Material Symbols Sharp")
-    crop_5_4_sharp = IconData(name="crop_5_4", fontFamily="Material Symbols Sharp")
-    crop_7_5_sharp = IconData(name="crop_7_5", fontFamily="Material Symbols Sharp")
-    crop_9_16_sharp = IconData(name="crop_9_16", fontFamily="Material Symbols Sharp")
-    crop_din_sharp = IconData(name="crop_din", fontFamily="Material Symbols Sharp")
-    crop_free_sharp = IconData(name="crop_free", fontFamily="Material Symbols Sharp")
-    crop_landscape_sharp = IconData(name="crop_landscape", fontFamily="Material Symbols Sharp")
-    crop_original_sharp = IconData(name="crop_original", fontFamily="Material Symbols Sharp")
-    crop_portrait_sharp = IconData(name="crop_portrait", fontFamily="Material Symbols Sharp")
-    crop_rotate_sharp = IconData(name="crop_rotate", fontFamily="Material Symbols Sharp")
-    crop_square_sharp = IconData(name="crop_square", fontFamily="Material Symbols Sharp")
-    crossword_sharp = IconData(name="crossword", fontFamily="Material Symbols Sharp")
-    crowdsource_sharp = IconData(name="crowdsource", fontFamily="Material Symbols Sharp")
-    crown_sharp = IconData(name="crown", fontFamily="Material Symbols Sharp")
-    cruelty_free_sharp = IconData(name="cruelty_free", fontFamily="Material Symbols Sharp")
-    css_sharp = IconData(name="css", fontFamily="Material Symbols Sharp")
-    csv_sharp = IconData(name="csv", fontFamily="Material Symbols Sharp")
-    currency_bitcoin_sharp = IconData(name="currency_bitcoin", fontFamily="Material Symbols Sharp")
-    currency_exchange_sharp = IconData(name="currency_exchange", fontFamily="Material Symbols Sharp")
-    currency_franc_sharp = IconData(name="currency_franc", fontFamily="Material Symbols Sharp")
-    currency_lira_sharp = IconData(name="currency_lira", fontFamily="Material Symbols Sharp")
-    currency_pound_sharp = IconData(name="currency_pound", fontFamily="Material Symbols Sharp")
-    currency_ruble_sharp = IconData(name="currency_ruble", fontFamily="Material Symbols Sharp")
-    currency_rupee_sharp = IconData(name="currency_rupee", fontFamily="Material Symbols Sharp")
-    currency_rupee_circle_sharp = IconData(name="currency_rupee_circle", fontFamily="Material Symbols Sharp")
-    currency_yen_sharp = IconData(name="currency_yen", fontFamily="Material Symbols Sharp")
-    currency_yuan_sharp = IconData(name="currency_yuan", fontFamily="Material Symbols Sharp")
-    curtains_sharp = IconData(name="curtains", fontFamily="Material Symbols Sharp")
-    curtains_closed_sharp = IconData(name="curtains_closed", fontFamily="Material Symbols Sharp")
-    custom_typography_sharp = IconData(name="custom_typography", fontFamily="Material Symbols Sharp")
-    cut_sharp = IconData(name="cut", fontFamily="Material Symbols Sharp")
-    cycle_sharp = IconData(name="cycle", fontFamily="Material Symbols Sharp")
-    cyclone_sharp = IconData(name="cyclone", fontFamily="Material Symbols Sharp")
-    dangerous_sharp = IconData(name="dangerous", fontFamily="Material Symbols Sharp")
-    dark_mode_sharp = IconData(name="dark_mode", fontFamily="Material Symbols Sharp")
-    dashboard_sharp = IconData(name="dashboard", fontFamily="Material Symbols Sharp")
-    dashboard_2_sharp = IconData(name="dashboard_2", fontFamily="Material Symbols Sharp")
-    dashboard_customize_sharp = IconData(name="dashboard_customize", fontFamily="Material Symbols Sharp")
-    data_alert_sharp = IconData(name="data_alert", fontFamily="Material Symbols Sharp")
-    data_array_sharp = IconData(name="data_array", fontFamily="Material Symbols Sharp")
-    data_check_sharp = IconData(name="data_check", fontFamily="Material Symbols Sharp")
-    data_exploration_sharp = IconData(name="data_exploration", fontFamily="Material Symbols Sharp")
-    data_info_alert_sharp = IconData(name="data_info_alert", fontFamily="Material Symbols Sharp")
-    data_loss_prevention_sharp = IconData(name="data_loss_prevention", fontFamily="Material Symbols Sharp")
-    data_object_sharp = IconData(name="data_object", fontFamily="Material Symbols Sharp")
-    data_saver_off_sharp = IconData(name="data_saver_off", fontFamily="Material Symbols Sharp")
-    data_saver_on_sharp = IconData(name="data_saver_on", fontFamily="Material Symbols Sharp")
-    data_table_sharp = IconData(name="data_table", fontFamily="Material Symbols Sharp")
-    data_thresholding_sharp = IconData(name="data_thresholding", fontFamily="Material Symbols Sharp")
-    data_usage_sharp = IconData(name="data_usage", fontFamily="Material Symbols Sharp")
-    database_sharp = IconData(name="database", fontFamily="Material Symbols Sharp")
-    database_off_sharp = IconData(name="database_off", fontFamily="Material Symbols Sharp")
-    database_search_sharp = IconData(name="database_search", fontFamily="Material Symbols Sharp")
-    database_upload_sharp = IconData(name="database_upload", fontFamily="Material Symbols Sharp")
-    dataset_sharp = IconData(name="dataset", fontFamily="Material Symbols Sharp")
-    dataset_linked_sharp = IconData(name="dataset_linked", fontFamily="Material Symbols Sharp")
-    date_range_sharp = IconData(name="date_range", fontFamily="Material Symbols Sharp")
-    deblur_sharp = IconData(name="deblur", fontFamily="Material Symbols Sharp")
-    deceased_sharp = IconData(name="deceased", fontFamily="Material Symbols Sharp")
-    decimal_decrease_sharp = IconData(name="decimal_decrease", fontFamily="Material Symbols Sharp")
-    decimal_increase_sharp = IconData(name="decimal_increase", fontFamily="Material Symbols Sharp")
-    deck_sharp = IconData(name="deck", fontFamily="Material Symbols Sharp")
-    dehaze_sharp = IconData(name="dehaze", fontFamily="Material Symbols Sharp")
-    delete_sharp = IconData(name="delete", fontFamily="Material Symbols Sharp")
-    delete_forever_sharp = IconData(name="delete_forever", fontFamily="Material Symbols Sharp")
-    delete_history_sharp = IconData(name="delete_history", fontFamily="Material Symbols Sharp")
-    delete_outline_sharp = IconData(name="delete_outline", fontFamily="Material Symbols Sharp")
-    delete_sweep_sharp = IconData(name="delete_sweep", fontFamily="Material Symbols Sharp")
-    delivery_dining_sharp = IconData(name="delivery_dining", fontFamily="Material Symbols Sharp")
-    delivery_truck_bolt_sharp = IconData(name="delivery_truck_bolt", fontFamily="Material Symbols Sharp")
-    delivery_truck_speed_sharp = IconData(name="delivery_truck_speed", fontFamily="Material Symbols Sharp")
-    demography_sharp = IconData(name="demography", fontFamily="Material Symbols Sharp")
-    density_large_sharp = IconData(name="density_large", fontFamily="Material Symbols Sharp")
-    density_medium_sharp = IconData(name="density_medium", fontFamily="Material Symbols Sharp")
-    density_small_sharp = IconData(name="density_small", fontFamily="Material Symbols Sharp")
-    dentistry_sharp = IconData(name="dentistry", fontFamily="Material Symbols Sharp")
-    departure_board_sharp = IconData(name="departure_board", fontFamily="Material Symbols Sharp")
-    deployed_code_sharp = IconData(name="deployed_code", fontFamily="Material Symbols Sharp")
-    deployed_code_account_sharp = IconData(name="deployed_code_account", fontFamily="Material Symbols Sharp")
-    deployed_code_alert_sharp = IconData(name="deployed_code_alert", fontFamily="Material Symbols Sharp")
-    deployed_code_history_sharp = IconData(name="deployed_code_history", fontFamily="Material Symbols Sharp")
-    deployed_code_update_sharp = IconData(name="deployed_code_update", fontFamily="Material Symbols Sharp")
-    dermatology_sharp = IconData(name="dermatology", fontFamily="Material Symbols Sharp")
-    description_sharp = IconData(name="description", fontFamily="Material Symbols Sharp")
-    deselect_sharp = IconData(name="deselect", fontFamily="Material Symbols Sharp")
-    design_services_sharp = IconData(name="design_services", fontFamily="Material Symbols Sharp")
-    desk_sharp = IconData(name="desk", fontFamily="Material Symbols Sharp")
-    deskphone_sharp = IconData(name="deskphone", fontFamily="Material Symbols Sharp")
-    desktop_access_disabled_sharp = IconData(name="desktop_access_disabled", fontFamily="Material Symbols Sharp")
-    desktop_cloud_sharp = IconData(name="desktop_cloud", fontFamily="Material Symbols Sharp")
-    desktop_cloud_stack_sharp = IconData(name="desktop_cloud_stack", fontFamily="Material Symbols Sharp")
-    desktop_landscape_sharp = IconData(name="desktop_landscape", fontFamily="Material Symbols Sharp")
-    desktop_landscape_add_sharp = IconData(name="desktop_landscape_add", fontFamily="Material Symbols Sharp")
-    desktop_mac_sharp = IconData(name="desktop_mac", fontFamily="Material Symbols Sharp")
-    desktop_portrait_sharp = IconData(name="desktop_portrait", fontFamily="Material Symbols Sharp")
-    desktop_windows_sharp = IconData(name="desktop_windows", fontFamily="Material Symbols Sharp")
-    destruction_sharp = IconData(name="destruction", fontFamily="Material Symbols Sharp")
-    details_sharp = IconData(name="details", fontFamily="Material Symbols Sharp")
-    detection_and_zone_sharp = IconData(name="detection_and_zone", fontFamily="Material Symbols Sharp")
-    detector_sharp = IconData(name="detector", fontFamily="Material Symbols Sharp")
-    detector_alarm_sharp = IconData(name="detector_alarm", fontFamily="Material Symbols Sharp")
-    detector_battery_sharp = IconData(name="detector_battery", fontFamily="Material Symbols Sharp")
-    detector_co_sharp = IconData(name="detector_co", fontFamily="Material Symbols Sharp")
-    detector_offline_sharp = IconData(name="detector_offline", fontFamily="Material Symbols Sharp")
-    detector_smoke_sharp = IconData(name="detector_smoke", fontFamily="Material Symbols Sharp")
-    detector_status_sharp = IconData(name="detector_status", fontFamily="Material Symbols Sharp")
-    developer_board_sharp = IconData(name="developer_board", fontFamily="Material Symbols Sharp")
-    developer_board_off_sharp = IconData(name="developer_board_off", fontFamily="Material Symbols Sharp")
-    developer_guide_sharp = IconData(name="developer_guide", fontFamily="Material Symbols Sharp")
-    developer_mode_sharp = IconData(name="developer_mode", fontFamily="Material Symbols Sharp")
-    developer_mode_tv_sharp = IconData(name="developer_mode_tv", fontFamily="Material Symbols Sharp")
-    device_band_sharp = IconData(name="device_band", fontFamily="Material Symbols Sharp")
-    device_hub_sharp = IconData(name="device_hub", fontFamily="Material Symbols Sharp")
-    device_reset_sharp = IconData(name="device_reset", fontFamily="Material Symbols Sharp")
-    device_thermostat_sharp = IconData(name="device_thermostat", fontFamily="Material Symbols Sharp")
-    device_unknown_sharp = IconData(name="device_unknown", fontFamily="Material Symbols Sharp")
-    devices_sharp = IconData(name="devices", fontFamily="Material Symbols Sharp")
-    devices_fold_sharp = IconData(name="devices_fold", fontFamily="Material Symbols Sharp")
-    devices_fold_2_sharp = IconData(name="devices_fold_2", fontFamily="Material Symbols Sharp")
-    devices_off_sharp = IconData(name="devices_off", fontFamily="Material Symbols Sharp")
-    devices_other_sharp = IconData(name="devices_other", fontFamily="Material Symbols Sharp")
-    devices_wearables_sharp = IconData(name="devices_wearables", fontFamily="Material Symbols Sharp")
-    dew_point_sharp = IconData(name="dew_point", fontFamily="Material Symbols Sharp")
-    diagnosis_sharp = IconData(name="diagnosis", fontFamily="Material Symbols Sharp")
-    diagonal_line_sharp = IconData(name="diagonal_line", fontFamily="Material Symbols Sharp")
-    dialer_sip_sharp = IconData(name="dialer_sip", fontFamily="Material Symbols Sharp")
-    dialogs_sharp = IconData(name="dialogs", fontFamily="Material Symbols Sharp")
-    dialpad_sharp = IconData(name="dialpad", fontFamily="Material Symbols Sharp")
-    diamond_sharp = IconData(name="diamond", fontFamily="Material Symbols Sharp")
-    dictionary_sharp = IconData(name="dictionary", fontFamily="Material Symbols Sharp")
-    difference_sharp = IconData(name="difference", fontFamily="Material Symbols Sharp")
-    digital_out_of_home_sharp = IconData(name="digital_out_of_home", fontFamily="Material Symbols Sharp")
-    digital_wellbeing_sharp = IconData(name="digital_wellbeing", fontFamily="Material Symbols Sharp")
-    dining_sharp = IconData(name="dining", fontFamily="Material Symbols Sharp")
-    dinner_dining_sharp = IconData(name="dinner_dining", fontFamily="Material Symbols Sharp")
-    directions_sharp = IconData(name="directions", fontFamily="Material Symbols Sharp")
-    directions_alt_sharp = IconData(name="directions_alt", fontFamily="Material Symbols Sharp")
-    directions_alt_off_sharp = IconData(name="directions_alt_off", fontFamily="Material Symbols Sharp")
-    directions_bike_sharp = IconData(name="directions_bike", fontFamily="Material Symbols Sharp")
-    directions_boat_sharp = IconData(name="directions_boat", fontFamily="Material Symbols Sharp")
-    directions_boat_filled_sharp = IconData(name="directions_boat_filled", fontFamily="Material Symbols Sharp")
-    directions_bus_sharp = IconData(name="directions_bus", fontFamily="Material Symbols Sharp")
-    directions_bus_filled_sharp = IconData(name="directions_bus_filled", fontFamily="Material Symbols Sharp")
-    directions_car_sharp = IconData(name="directions_car", fontFamily="Material Symbols Sharp")
-    directions_car_filled_sharp = IconData(name="directions_car_filled", fontFamily="Material Symbols Sharp")
-    directions_off_sharp = IconData(name="directions_off", fontFamily="Material Symbols Sharp")
-    directions_railway_sharp = IconData(name="directions_railway", fontFamily="Material Symbols Sharp")
-    directions_railway_2_sharp = IconData(name="directions_railway_2", fontFamily="Material Symbols Sharp")
-    directions_railway_filled_sharp = IconData(name="directions_railway_filled", fontFamily="Material Symbols Sharp")
-    directions_run_sharp = IconData(name="directions_run", fontFamily="Material Symbols Sharp")
-    directions_subway_sharp = IconData(name="directions_subway", fontFamily="Material Symbols Sharp")
-    directions_subway_filled_sharp = IconData(name="directions_subway_filled", fontFamily="Material Symbols Sharp")
-    directions_transit_sharp = IconData(name="directions_transit", fontFamily="Material Symbols Sharp")
-    directions_transit_filled_sharp = IconData(name="directions_transit_filled", fontFamily="Material Symbols Sharp")
-    directions_walk_sharp = IconData(name="directions_walk", fontFamily="Material Symbols Sharp")
-    directory_sync_sharp = IconData(name="directory_sync", fontFamily="Material Symbols Sharp")
-    dirty_lens_sharp = IconData(name="dirty_lens", fontFamily="Material Symbols Sharp")
-    disabled_by_default_sharp = IconData(name="disabled_by_default", fontFamily="Material Symbols Sharp")
-    disabled_visible_sharp = IconData(name="disabled_visible", fontFamily="Material Symbols Sharp")
-    disc_full_sharp = IconData(name="disc_full", fontFamily="Material Symbols Sharp")
-    discover_tune_sharp = IconData(name="discover_tune", fontFamily="Material Symbols Sharp")
-    dishwasher_sharp = IconData(name="dishwasher", fontFamily="Material Symbols Sharp")
-    dishwasher_gen_sharp = IconData(name="dishwasher_gen", fontFamily="Material Symbols Sharp")
-    display_external_input_sharp = IconData(name="display_external_input", fontFamily="Material Symbols Sharp")
-    display_settings_sharp = IconData(name="display_settings", fontFamily="Material Symbols Sharp")
-    distance_sharp = IconData(name="distance", fontFamily="Material Symbols Sharp")
-    diversity_1_sharp = IconData(name="diversity_1", fontFamily="Material Symbols Sharp")
-    diversity_2_sharp = IconData(name="diversity_2", fontFamily="Material Symbols Sharp")
-    diversity_3_sharp = IconData(name="diversity_3", fontFamily="Material Symbols Sharp")
-    diversity_4_sharp = IconData(name="diversity_4", fontFamily="Material Symbols Sharp")
-    dns_sharp = IconData(name="dns", fontFamily="Material Symbols Sharp")
-    do_disturb_sharp = IconData(name="do_disturb", fontFamily="Material Symbols Sharp")
-    do_disturb_alt_sharp = IconData(name="do_disturb_alt", fontFamily="Material Symbols Sharp")
-    do_disturb_off_sharp = IconData(name="do_disturb_off", fontFamily="Material Symbols Sharp")
-    do_disturb_on_sharp = IconData(name="do_disturb_on", fontFamily="Material Symbols Sharp")
-    do_not_disturb_sharp = IconData(name="do_not_disturb", fontFamily="Material Symbols Sharp")
-    do_not_disturb_alt_sharp = IconData(name="do_not_disturb_alt", fontFamily="Material Symbols Sharp")
-    do_not_disturb_off_sharp = IconData(name="do_not_disturb_off", fontFamily="Material Symbols Sharp")
-    do_not_disturb_on_sharp = IconData(name="do_not_disturb_on", fontFamily="Material Symbols Sharp")
-    do_not_disturb_on_total_silence_sharp = IconData(name="do_not_disturb_on_total_silence", fontFamily="Material Symbols Sharp")
-    do_not_step_sharp = IconData(name="do_not_step", fontFamily="Material Symbols Sharp")
-    do_not_touch_sharp = IconData(name="do_not_touch", fontFamily="Material Symbols Sharp")
-    dock_sharp = IconData(name="dock", fontFamily="Material Symbols Sharp")
-    dock_to_bottom_sharp = IconData(name="dock_to_bottom", fontFamily="Material Symbols Sharp")
-    dock_to_left_sharp = IconData(name="dock_to_left", fontFamily="Material Symbols Sharp")
-    dock_to_right_sharp = IconData(name="dock_to_right", fontFamily="Material Symbols Sharp")
-    docs_sharp = IconData(name="docs", fontFamily="Material Symbols Sharp")
-    docs_add_on_sharp = IconData(name="docs_add_on", fontFamily="Material Symbols Sharp")
-    docs_apps_script_sharp = IconData(name="docs_apps_script", fontFamily="Material Symbols Sharp")
-    document_scanner_sharp = IconData(name="document_scanner", fontFamily="Material Symbols Sharp")
-    document_search_sharp = IconData(name="document_search", fontFamily="Material Symbols Sharp")
-    domain_sharp = IconData(name="domain", fontFamily="Material Symbols Sharp")
-    domain_add_sharp = IconData(name="domain_add", fontFamily="Material Symbols Sharp")
-    domain_disabled_sharp = IconData(name="domain_disabled", fontFamily="Material Symbols Sharp")
-    domain_verification_sharp = IconData(name="domain_verification", fontFamily="Material Symbols Sharp")
-    domain_verification_off_sharp = IconData(name="domain_verification_off", fontFamily="Material Symbols Sharp")
-    domino_mask_sharp = IconData(name="domino_mask", fontFamily="Material Symbols Sharp")
-    done_sharp = IconData(name="done", fontFamily="Material Symbols Sharp")
-    done_all_sharp = IconData(name="done_all", fontFamily="Material Symbols Sharp")
-    done_outline_sharp = IconData(name="done_outline", fontFamily="Material Symbols Sharp")
-    donut_large_sharp = IconData(name="donut_large", fontFamily="Material Symbols Sharp")
-    donut_small_sharp = IconData(name="donut_small", fontFamily="Material Symbols Sharp")
-    door_back_sharp = IconData(name="door_back", fontFamily="Material Symbols Sharp")
-    door_front_sharp = IconData(name="door_front", fontFamily="Material Symbols Sharp")
-    door_open_sharp = IconData(name="door_open", fontFamily="Material Symbols Sharp")
-    door_sensor_sharp = IconData(name="door_sensor", fontFamily="Material Symbols Sharp")
-    door_sliding_sharp = IconData(name="door_sliding", fontFamily="Material Symbols Sharp")
-    doorbell_sharp = IconData(name="doorbell", fontFamily="Material Symbols Sharp")
-    doorbell_3p_sharp = IconData(name="doorbell_3p", fontFamily="Material Symbols Sharp")
-    doorbell_chime_sharp = IconData(name="doorbell_chime", fontFamily="Material Symbols Sharp")
-    double_arrow_sharp = IconData(name="double_arrow", fontFamily="Material Symbols Sharp")
-    downhill_skiing_sharp = IconData(name="downhill_skiing", fontFamily="Material Symbols Sharp")
-    download_sharp = IconData(name="download", fontFamily="Material Symbols Sharp")
-    download_2_sharp = IconData(name="download_2", fontFamily="Material Symbols Sharp")
-    download_done_sharp = IconData(name="download_done", fontFamily="Material Symbols Sharp")
-    download_for_offline_sharp = IconData(name="download_for_offline", fontFamily="Material Symbols Sharp")
-    downloading_sharp = IconData(name="downloading", fontFamily="Material Symbols Sharp")
-    draft_sharp = IconData(name="draft", fontFamily="Material Symbols Sharp")
-    draft_orders_sharp = IconData(name="draft_orders", fontFamily="Material Symbols Sharp")
-    drafts_sharp = IconData(name="drafts", fontFamily="Material Symbols Sharp")
-    drag_click_sharp = IconData(name="drag_click", fontFamily="Material Symbols Sharp")
-    drag_handle_sharp = IconData(name="drag_handle", fontFamily="Material Symbols Sharp")
-    drag_indicator_sharp = IconData(name="drag_indicator", fontFamily="Material Symbols Sharp")
-    drag_pan_sharp = IconData(name="drag_pan", fontFamily="Material Symbols Sharp")
-    draw_sharp = IconData(name="draw", fontFamily="Material Symbols Sharp")
-    draw_abstract_sharp = IconData(name="draw_abstract", fontFamily="Material Symbols Sharp")
-    draw_collage_sharp = IconData(name="draw_collage", fontFamily="Material Symbols Sharp")
-    drawing_recognition_sharp = IconData(name="drawing_recognition", fontFamily="Material Symbols Sharp")
-    dresser_sharp = IconData(name="dresser", fontFamily="Material Symbols Sharp")
-    drive_eta_sharp = IconData(name="drive_eta", fontFamily="Material Symbols Sharp")
-    drive_export_sharp = IconData(name="drive_export", fontFamily="Material Symbols Sharp")
-    drive_file_move_sharp = IconData(name="drive_file_move", fontFamily="Material Symbols Sharp")
-    drive_file_move_outline_sharp = IconData(name="drive_file_move_outline", fontFamily="Material Symbols Sharp")
-    drive_file_move_rtl_sharp = IconData(name="drive_file_move_rtl", fontFamily="Material Symbols Sharp")
-    drive_file_rename_outline_sharp = IconData(name="drive_file_rename_outline", fontFamily="Material Symbols Sharp")
-    drive_folder_upload_sharp = IconData(name="drive_folder_upload", fontFamily="Material Symbols Sharp")
-    drive_fusiontable_sharp = IconData(name="drive_fusiontable", fontFamily="Material Symbols Sharp")
-    dropdown_sharp = IconData(name="dropdown", fontFamily="Material Symbols Sharp")
-    dropper_eye_sharp = IconData(name="dropper_eye", fontFamily="Material Symbols Sharp")
-    dry_sharp = IconData(name="dry", fontFamily="Material Symbols Sharp")
-    dry_cleaning_sharp = IconData(name="dry_cleaning", fontFamily="Material Symbols Sharp")
-    dual_screen_sharp = IconData(name="dual_screen", fontFamily="Material Symbols Sharp")
-    duo_sharp = IconData(name="duo", fontFamily="Material Symbols Sharp")
-    dvr_sharp = IconData(name="dvr", fontFamily="Material Symbols Sharp")
-    dynamic_feed_sharp = IconData(name="dynamic_feed", fontFamily="Material Symbols Sharp")
-    dynamic_form_sharp = IconData(name="dynamic_form", fontFamily="Material Symbols Sharp")
-    e911_avatar_sharp = IconData(name="e911_avatar", fontFamily="Material Symbols Sharp")
-    e911_emergency_sharp = IconData(name="e911_emergency", fontFamily="Material Symbols Sharp")
-    e_mobiledata_sharp = IconData(name="e_mobiledata", fontFamily="Material Symbols Sharp")
-    e_mobiledata_badge_sharp = IconData(name="e_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    ear_sound_sharp = IconData(name="ear_sound", fontFamily="Material Symbols Sharp")
-    earbud_case_sharp = IconData(name="earbud_case", fontFamily="Material Symbols Sharp")
-    earbud_left_sharp = IconData(name="earbud_left", fontFamily="Material Symbols Sharp")
-    earbud_right_sharp = IconData(name="earbud_right", fontFamily="Material Symbols Sharp")
-    earbuds_sharp = IconData(name="earbuds", fontFamily="Material Symbols Sharp")
-    earbuds_2_sharp = IconData(name="earbuds_2", fontFamily="Material Symbols Sharp")
-    earbuds_battery_sharp = IconData(name="earbuds_battery", fontFamily="Material Symbols Sharp")
-    early_on_sharp = IconData(name="early_on", fontFamily="Material Symbols Sharp")
-    earthquake_sharp = IconData(name="earthquake", fontFamily="Material Symbols Sharp")
-    east_sharp = IconData(name="east", fontFamily="Material Symbols Sharp")
-    ecg_sharp = IconData(name="ecg", fontFamily="Material Symbols Sharp")
-    ecg_heart_sharp = IconData(name="ecg_heart", fontFamily="Material Symbols Sharp")
-    eco_sharp = IconData(name="eco", fontFamily="Material Symbols Sharp")
-    eda_sharp = IconData(name="eda", fontFamily="Material Symbols Sharp")
-    edgesensor_high_sharp = IconData(name="edgesensor_high", fontFamily="Material Symbols Sharp")
-    edgesensor_low_sharp = IconData(name="edgesensor_low", fontFamily="Material Symbols Sharp")
-    edit_sharp = IconData(name="edit", fontFamily="Material Symbols Sharp")
-    edit_arrow_down_sharp = IconData(name="edit_arrow_down", fontFamily="Material Symbols Sharp")
-    edit_arrow_up_sharp = IconData(name="edit_arrow_up", fontFamily="Material Symbols Sharp")
-    edit_attributes_sharp = IconData(name="edit_attributes", fontFamily="Material Symbols Sharp")
-    edit_audio_sharp = IconData(name="edit_audio", fontFamily="Material Symbols Sharp")
-    edit_calendar_sharp = IconData(name="edit_calendar", fontFamily="Material Symbols Sharp")
-    edit_document_sharp = IconData(name="edit_document", fontFamily="Material Symbols Sharp")
-    edit_location_sharp = IconData(name="edit_location", fontFamily="Material Symbols Sharp")
-    edit_location_alt_sharp = IconData(name="edit_location_alt", fontFamily="Material Symbols Sharp")
-    edit_note_sharp = IconData(name="edit_note", fontFamily="Material Symbols Sharp")
-    edit_notifications_sharp = IconData(name="edit_notifications", fontFamily="Material Symbols Sharp")
-    edit_off_sharp = IconData(name="edit_off", fontFamily="Material Symbols Sharp")
-    edit_road_sharp = IconData(name="edit_road", fontFamily="Material Symbols Sharp")
-    edit_square_sharp = IconData(name="edit_square", fontFamily="Material Symbols Sharp")
-    editor_choice_sharp = IconData(name="editor_choice", fontFamily="Material Symbols Sharp")
-    egg_sharp = IconData(name="egg", fontFamily="Material Symbols Sharp")
-    egg_alt_sharp = IconData(name="egg_alt", fontFamily="Material Symbols Sharp")
-    eject_sharp = IconData(name="eject", fontFamily="Material Symbols Sharp")
-    elderly_sharp = IconData(name="elderly", fontFamily="Material Symbols Sharp")
-    elderly_woman_sharp = IconData(name="elderly_woman", fontFamily="Material Symbols Sharp")
-    electric_bike_sharp = IconData(name="electric_bike", fontFamily="Material Symbols Sharp")
-    electric_bolt_sharp = IconData(name="electric_bolt", fontFamily="Material Symbols Sharp")
-    electric_car_sharp = IconData(name="electric_car", fontFamily="Material Symbols Sharp")
-    electric_meter_sharp = IconData(name="electric_meter", fontFamily="Material Symbols Sharp")
-    electric_moped_sharp = IconData(name="electric_moped", fontFamily="Material Symbols Sharp")
-    electric_rickshaw_sharp = IconData(name="electric_rickshaw", fontFamily="Material Symbols Sharp")
-    electric_scooter_sharp = IconData(name="electric_scooter", fontFamily="Material Symbols Sharp")
-    electrical_services_sharp = IconData(name="electrical_services", fontFamily="Material Symbols Sharp")
-    elevation_sharp = IconData(name="elevation", fontFamily="Material Symbols Sharp")
-    elevator_sharp = IconData(name="elevator", fontFamily="Material Symbols Sharp")
-    email_sharp = IconData(name="email", fontFamily="Material Symbols Sharp")
-    emergency_sharp = IconData(name="emergency", fontFamily="Material Symbols Sharp")
-    emergency_heat_sharp = IconData(name="emergency_heat", fontFamily="Material Symbols Sharp")
-    emergency_heat_2_sharp = IconData(name="emergency_heat_2", fontFamily="Material Symbols Sharp")
-    emergency_home_sharp = IconData(name="emergency_home", fontFamily="Material Symbols Sharp")
-    emergency_recording_sharp = IconData(name="emergency_recording", fontFamily="Material Symbols Sharp")
-    emergency_share_sharp = IconData(name="emergency_share", fontFamily="Material Symbols Sharp")
-    emergency_share_off_sharp = IconData(name="emergency_share_off", fontFamily="Material Symbols Sharp")
-    emoji_emotions_sharp = IconData(name="emoji_emotions", fontFamily="Material Symbols Sharp")
-    emoji_events_sharp = IconData(name="emoji_events", fontFamily="Material Symbols Sharp")
-    emoji_flags_sharp = IconData(name="emoji_flags", fontFamily="Material Symbols Sharp")
-    emoji_food_beverage_sharp = IconData(name="emoji_food_beverage", fontFamily="Material Symbols Sharp")
-    emoji_language_sharp = IconData(name="emoji_language", fontFamily="Material Symbols Sharp")
-    emoji_nature_sharp = IconData(name="emoji_nature", fontFamily="Material Symbols Sharp")
-    emoji_objects_sharp = IconData(name="emoji_objects", fontFamily="Material Symbols Sharp")
-    emoji_people_sharp = IconData(name="emoji_people", fontFamily="Material Symbols Sharp")
-    emoji_symbols_sharp = IconData(name="emoji_symbols", fontFamily="Material Symbols Sharp")
-    emoji_transportation_sharp = IconData(name="emoji_transportation", fontFamily="Material Symbols Sharp")
-    emoticon_sharp = IconData(name="emoticon", fontFamily="Material Symbols Sharp")
-    empty_dashboard_sharp = IconData(name="empty_dashboard", fontFamily="Material Symbols Sharp")
-    enable_sharp = IconData(name="enable", fontFamily="Material Symbols Sharp")
-    encrypted_sharp = IconData(name="encrypted", fontFamily="Material Symbols Sharp")
-    encrypted_add_sharp = IconData(name="encrypted_add", fontFamily="Material Symbols Sharp")
-    encrypted_add_circle_sharp = IconData(name="encrypted_add_circle", fontFamily="Material Symbols Sharp")
-    encrypted_minus_circle_sharp = IconData(name="encrypted_minus_circle", fontFamily="Material Symbols Sharp")
-    encrypted_off_sharp = IconData(name="encrypted_off", fontFamily="Material Symbols Sharp")
-    endocrinology_sharp = IconData(name="endocrinology", fontFamily="Material Symbols Sharp")
-    energy_sharp = IconData(name="energy", fontFamily="Material Symbols Sharp")
-    energy_program_saving_sharp = IconData(name="energy_program_saving", fontFamily="Material Symbols Sharp")
-    energy_program_time_used_sharp = IconData(name="energy_program_time_used", fontFamily="Material Symbols Sharp")
-    energy_savings_leaf_sharp = IconData(name="energy_savings_leaf", fontFamily="Material Symbols Sharp")
-    engineering_sharp = IconData(name="engineering", fontFamily="Material Symbols Sharp")
-    enhanced_encryption_sharp = IconData(name="enhanced_encryption", fontFamily="Material Symbols Sharp")
-    ent_sharp = IconData(name="ent", fontFamily="Material Symbols Sharp")
-    enterprise_sharp = IconData(name="enterprise", fontFamily="Material Symbols Sharp")
-    enterprise_off_sharp = IconData(name="enterprise_off", fontFamily="Material Symbols Sharp")
-    equal_sharp = IconData(name="equal", fontFamily="Material Symbols Sharp")
-    equalizer_sharp = IconData(name="equalizer", fontFamily="Material Symbols Sharp")
-    eraser_size_1_sharp = IconData(name="eraser_size_1", fontFamily="Material Symbols Sharp")
-    eraser_size_2_sharp = IconData(name="eraser_size_2", fontFamily="Material Symbols Sharp")
-    eraser_size_3_sharp = IconData(name="eraser_size_3", fontFamily="Material Symbols Sharp")
-    eraser_size_4_sharp = IconData(name="eraser_size_4", fontFamily="Material Symbols Sharp")
-    eraser_size_5_sharp = IconData(name="eraser_size_5", fontFamily="Material Symbols Sharp")
-    error_sharp = IconData(name="error", fontFamily="Material Symbols Sharp")
-    error_circle_rounded_sharp = IconData(name="error_circle_rounded", fontFamily="Material Symbols Sharp")
-    error_med_sharp = IconData(name="error_med", fontFamily="Material Symbols Sharp")
-    error_outline_sharp = IconData(name="error_outline", fontFamily="Material Symbols Sharp")
-    escalator_sharp = IconData(name="escalator", fontFamily="Material Symbols Sharp")
-    escalator_warning_sharp = IconData(name="escalator_warning", fontFamily="Material Symbols Sharp")
-    euro_sharp = IconData(name="euro", fontFamily="Material Symbols Sharp")
-    euro_symbol_sharp = IconData(name="euro_symbol", fontFamily="Material Symbols Sharp")
-    ev_charger_sharp = IconData(name="ev_charger", fontFamily="Material Symbols Sharp")
-    ev_mobiledata_badge_sharp = IconData(name="ev_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    ev_shadow_sharp = IconData(name="ev_shadow", fontFamily="Material Symbols Sharp")
-    ev_shadow_add_sharp = IconData(name="ev_shadow_add", fontFamily="Material Symbols Sharp")
-    ev_shadow_minus_sharp = IconData(name="ev_shadow_minus", fontFamily="Material Symbols Sharp")
-    ev_station_sharp = IconData(name="ev_station", fontFamily="Material Symbols Sharp")
-    event_sharp = IconData(name="event", fontFamily="Material Symbols Sharp")
-    event_available_sharp = IconData(name="event_available", fontFamily="Material Symbols Sharp")
-    event_busy_sharp = IconData(name="event_busy", fontFamily="Material Symbols Sharp")
-    event_list_sharp = IconData(name="event_list", fontFamily="Material Symbols Sharp")
-    event_note_sharp = IconData(name="event_note", fontFamily="Material Symbols Sharp")
-    event_repeat_sharp = IconData(name="event_repeat", fontFamily="Material Symbols Sharp")
-    event_seat_sharp = IconData(name="event_seat", fontFamily="Material Symbols Sharp")
-    event_upcoming_sharp = IconData(name="event_upcoming", fontFamily="Material Symbols Sharp")
-    exclamation_sharp = IconData(name="exclamation", fontFamily="Material Symbols Sharp")
-    exercise_sharp = IconData(name="exercise", fontFamily="Material Symbols Sharp")
-    exit_to_app_sharp = IconData(name="exit_to_app", fontFamily="Material Symbols Sharp")
-    expand_sharp = IconData(name="expand", fontFamily="Material Symbols Sharp")
-    expand_all_sharp = IconData(name="expand_all", fontFamily="Material Symbols Sharp")
-    expand_circle_down_sharp = IconData(name="expand_circle_down", fontFamily="Material Symbols Sharp")
-    expand_circle_right_sharp = IconData(name="expand_circle_right", fontFamily="Material Symbols Sharp")
-    expand_circle_up_sharp = IconData(name="expand_circle_up", fontFamily="Material Symbols Sharp")
-    expand_content_sharp = IconData(name="expand_content", fontFamily="Material Symbols Sharp")
-    expand_less_sharp = IconData(name="expand_less", fontFamily="Material Symbols Sharp")
-    expand_more_sharp = IconData(name="expand_more", fontFamily="Material Symbols Sharp")
-    expansion_panels_sharp = IconData(name="expansion_panels", fontFamily="Material Symbols Sharp")
-    expension_panels_sharp = IconData(name="expension_panels", fontFamily="Material Symbols Sharp")
-    experiment_sharp = IconData(name="experiment", fontFamily="Material Symbols Sharp")
-    explicit_sharp = IconData(name="explicit", fontFamily="Material Symbols Sharp")
-    explore_sharp = IconData(name="explore", fontFamily="Material Symbols Sharp")
-    explore_nearby_sharp = IconData(name="explore_nearby", fontFamily="Material Symbols Sharp")
-    explore_off_sharp = IconData(name="explore_off", fontFamily="Material Symbols Sharp")
-    explosion_sharp = IconData(name="explosion", fontFamily="Material Symbols Sharp")
-    export_notes_sharp = IconData(name="export_notes", fontFamily="Material Symbols Sharp")
-    exposure_sharp = IconData(name="exposure", fontFamily="Material Symbols Sharp")
-    exposure_neg_1_sharp = IconData(name="exposure_neg_1", fontFamily="Material Symbols Sharp")
-    exposure_neg_2_sharp = IconData(name="exposure_neg_2", fontFamily="Material Symbols Sharp")
-    exposure_plus_1_sharp = IconData(name="exposure_plus_1", fontFamily="Material Symbols Sharp")
-    exposure_plus_2_sharp = IconData(name="exposure_plus_2", fontFamily="Material Symbols Sharp")
-    exposure_zero_sharp = IconData(name="exposure_zero", fontFamily="Material Symbols Sharp")
-    extension_sharp = IconData(name="extension", fontFamily="Material Symbols Sharp")
-    extension_off_sharp = IconData(name="extension_off", fontFamily="Material Symbols Sharp")
-    eye_tracking_sharp = IconData(name="eye_tracking", fontFamily="Material Symbols Sharp")
-    eyeglasses_sharp = IconData(name="eyeglasses", fontFamily="Material Symbols Sharp")
-    face_sharp = IconData(name="face", fontFamily="Material Symbols Sharp")
-    face_2_sharp = IconData(name="face_2", fontFamily="Material Symbols Sharp")
-    face_3_sharp = IconData(name="face_3", fontFamily="Material Symbols Sharp")
-    face_4_sharp = IconData(name="face_4", fontFamily="Material Symbols Sharp")
-    face_5_sharp = IconData(name="face_5", fontFamily="Material Symbols Sharp")
-    face_6_sharp = IconData(name="face_6", fontFamily="Material Symbols Sharp")
-    face_down_sharp = IconData(name="face_down", fontFamily="Material Symbols Sharp")
-    face_left_sharp = IconData(name="face_left", fontFamily="Material Symbols Sharp")
-    face_nod_sharp = IconData(name="face_nod", fontFamily="Material Symbols Sharp")
-    face_retouching_natural_sharp = IconData(name="face_retouching_natural", fontFamily="Material Symbols Sharp")
-    face_retouching_off_sharp = IconData(name="face_retouching_off", fontFamily="Material Symbols Sharp")
-    face_right_sharp = IconData(name="face_right", fontFamily="Material Symbols Sharp")
-    face_shake_sharp = IconData(name="face_shake", fontFamily="Material Symbols Sharp")
-    face_unlock_sharp = IconData(name="face_unlock", fontFamily="Material Symbols Sharp")
-    face_up_sharp = IconData(name="face_up", fontFamily="Material Symbols Sharp")
-    fact_check_sharp = IconData(name="fact_check", fontFamily="Material Symbols Sharp")
-    factory_sharp = IconData(name="factory", fontFamily="Material Symbols Sharp")
-    falling_sharp = IconData(name="falling", fontFamily="Material Symbols Sharp")
-    familiar_face_and_zone_sharp = IconData(name="familiar_face_and_zone", fontFamily="Material Symbols Sharp")
-    family_history_sharp = IconData(name="family_history", fontFamily="Material Symbols Sharp")
-    family_home_sharp = IconData(name="family_home", fontFamily="Material Symbols Sharp")
-    family_link_sharp = IconData(name="family_link", fontFamily="Material Symbols Sharp")
-    family_restroom_sharp = IconData(name="family_restroom", fontFamily="Material Symbols Sharp")
-    family_star_sharp = IconData(name="family_star", fontFamily="Material Symbols Sharp")
-    fan_focus_sharp = IconData(name="fan_focus", fontFamily="Material Symbols Sharp")
-    fan_indirect_sharp = IconData(name="fan_indirect", fontFamily="Material Symbols Sharp")
-    farsight_digital_sharp = IconData(name="farsight_digital", fontFamily="Material Symbols Sharp")
-    fast_forward_sharp = IconData(name="fast_forward", fontFamily="Material Symbols Sharp")
-    fast_rewind_sharp = IconData(name="fast_rewind", fontFamily="Material Symbols Sharp")
-    fastfood_sharp = IconData(name="fastfood", fontFamily="Material Symbols Sharp")
-    faucet_sharp = IconData(name="faucet", fontFamily="Material Symbols Sharp")
-    favorite_sharp = IconData(name="favorite", fontFamily="Material Symbols Sharp")
-    favorite_border_sharp = IconData(name="favorite_border", fontFamily="Material Symbols Sharp")
-    fax_sharp = IconData(name="fax", fontFamily="Material Symbols Sharp")
-    feature_search_sharp = IconData(name="feature_search", fontFamily="Material Symbols Sharp")
-    featured_play_list_sharp = IconData(name="featured_play_list", fontFamily="Material Symbols Sharp")
-    featured_seasonal_and_gifts_sharp = IconData(name="featured_seasonal_and_gifts", fontFamily="Material Symbols Sharp")
-    featured_video_sharp = IconData(name="featured_video", fontFamily="Material Symbols Sharp")
-    feed_sharp = IconData(name="feed", fontFamily="Material Symbols Sharp")
-    feedback_sharp = IconData(name="feedback", fontFamily="Material Symbols Sharp")
-    female_sharp = IconData(name="female", fontFamily="Material Symbols Sharp")
-    femur_sharp = IconData(name="femur", fontFamily="Material Symbols Sharp")
-    femur_alt_sharp = IconData(name="femur_alt", fontFamily="Material Symbols Sharp")
-    fence_sharp = IconData(name="fence", fontFamily="Material Symbols Sharp")
-    fertile_sharp = IconData(name="fertile", fontFamily="Material Symbols Sharp")
-    festival_sharp = IconData(name="festival", fontFamily="Material Symbols Sharp")
-    fiber_dvr_sharp = IconData(name="fiber_dvr", fontFamily="Material Symbols Sharp")
-    fiber_manual_record_sharp = IconData(name="fiber_manual_record", fontFamily="Material Symbols Sharp")
-    fiber_new_sharp = IconData(name="fiber_new", fontFamily="Material Symbols Sharp")
-    fiber_pin_sharp = IconData(name="fiber_pin", fontFamily="Material Symbols Sharp")
-    fiber_smart_record_sharp = IconData(name="fiber_smart_record", fontFamily="Material Symbols Sharp")
-    file_copy_sharp = IconData(name="file_copy", fontFamily="Material Symbols Sharp")
-    file_copy_off_sharp = IconData(name="file_copy_off", fontFamily="Material Symbols Sharp")
-    file_download_sharp = IconData(name="file_download", fontFamily="Material Symbols Sharp")
-    file_download_done_sharp = IconData(name="file_download_done", fontFamily="Material Symbols Sharp")
-    file_download_off_sharp = IconData(name="file_download_off", fontFamily="Material Symbols Sharp")
-    file_export_sharp = IconData(name="file_export", fontFamily="Material Symbols Sharp")
-    file_json_sharp = IconData(name="file_json", fontFamily="Material Symbols Sharp")
-    file_map_sharp = IconData(name="file_map", fontFamily="Material Symbols Sharp")
-    file_map_stack_sharp = IconData(name="file_map_stack", fontFamily="Material Symbols Sharp")
-    file_open_sharp = IconData(name="file_open", fontFamily="Material Symbols Sharp")
-    file_png_sharp = IconData(name="file_png", fontFamily="Material Symbols Sharp")
-    file_present_sharp = IconData(name="file_present", fontFamily="Material Symbols Sharp")
-    file_save_sharp = IconData(name="file_save", fontFamily="Material Symbols Sharp")
-    file_save_off_sharp = IconData(name="file_save_off", fontFamily="Material Symbols Sharp")
-    file_upload_sharp = IconData(name="file_upload", fontFamily="Material Symbols Sharp")
-    file_upload_off_sharp = IconData(name="file_upload_off", fontFamily="Material Symbols Sharp")
-    files_sharp = IconData(name="files", fontFamily="Material Symbols Sharp")
-    filter_sharp = IconData(name="filter", fontFamily="Material Symbols Sharp")
-    filter_1_sharp = IconData(name="filter_1", fontFamily="Material Symbols Sharp")
-    filter_2_sharp = IconData(name="filter_2", fontFamily="Material Symbols Sharp")
-    filter_3_sharp = IconData(name="filter_3", fontFamily="Material Symbols Sharp")
-    filter_4_sharp = IconData(name="filter_4", fontFamily="Material Symbols Sharp")
-    filter_5_sharp = IconData(name="filter_5", fontFamily="Material Symbols Sharp")
-    filter_6_sharp = IconData(name="filter_6", fontFamily="Material Symbols Sharp")
-    filter_7_sharp = IconData(name="filter_7", fontFamily="Material Symbols Sharp")
-    filter_8_sharp = IconData(name="filter_8", fontFamily="Material Symbols Sharp")
-    filter_9_sharp = IconData(name="filter_9", fontFamily="Material Symbols Sharp")
-    filter_9_plus_sharp = IconData(name="filter_9_plus", fontFamily="Material Symbols Sharp")
-    filter_alt_sharp = IconData(name="filter_alt", fontFamily="Material Symbols Sharp")
-    filter_alt_off_sharp = IconData(name="filter_alt_off", fontFamily="Material Symbols Sharp")
-    filter_arrow_right_sharp = IconData(name="filter_arrow_right", fontFamily="Material Symbols Sharp")
-    filter_b_and_w_sharp = IconData(name="filter_b_and_w", fontFamily="Material Symbols Sharp")
-    filter_center_focus_sharp = IconData(name="filter_center_focus", fontFamily="Material Symbols Sharp")
-    filter_drama_sharp = IconData(name="filter_drama", fontFamily="Material Symbols Sharp")
-    filter_frames_sharp = IconData(name="filter_frames", fontFamily="Material Symbols Sharp")
-    filter_hdr_sharp = IconData(name="filter_hdr", fontFamily="Material Symbols Sharp")
-    filter_list_sharp = IconData(name="filter_list", fontFamily="Material Symbols Sharp")
-    filter_list_alt_sharp = IconData(name="filter_list_alt", fontFamily="Material Symbols Sharp")
-    filter_list_off_sharp = IconData(name="filter_list_off", fontFamily="Material Symbols Sharp")
-    filter_none_sharp = IconData(name="filter_none", fontFamily="Material Symbols Sharp")
-    filter_retrolux_sharp = IconData(name="filter_retrolux", fontFamily="Material Symbols Sharp")
-    filter_tilt_shift_sharp = IconData(name="filter_tilt_shift", fontFamily="Material Symbols Sharp")
-    filter_vintage_sharp = IconData(name="filter_vintage", fontFamily="Material Symbols Sharp")
-    finance_sharp = IconData(name="finance", fontFamily="Material Symbols Sharp")
-    finance_chip_sharp = IconData(name="finance_chip", fontFamily="Material Symbols Sharp")
-    finance_mode_sharp = IconData(name="finance_mode", fontFamily="Material Symbols Sharp")
-    find_in_page_sharp = IconData(name="find_in_page", fontFamily="Material Symbols Sharp")
-    find_replace_sharp = IconData(name="find_replace", fontFamily="Material Symbols Sharp")
-    fingerprint_sharp = IconData(name="fingerprint", fontFamily="Material Symbols Sharp")
-    fingerprint_off_sharp = IconData(name="fingerprint_off", fontFamily="Material Symbols Sharp")
-    fire_extinguisher_sharp = IconData(name="fire_extinguisher", fontFamily="Material Symbols Sharp")
-    fire_hydrant_sharp = IconData(name="fire_hydrant", fontFamily="Material Symbols Sharp")
-    fire_truck_sharp = IconData(name="fire_truck", fontFamily="Material Symbols Sharp")
-    fireplace_sharp = IconData(name="fireplace", fontFamily="Material Symbols Sharp")
-    first_page_sharp = IconData(name="first_page", fontFamily="Material Symbols Sharp")
-    fit_page_sharp = IconData(name="fit_page", fontFamily="Material Symbols Sharp")
-    fit_page_height_sharp = IconData(name="fit_page_height", fontFamily="Material Symbols Sharp")
-    fit_page_width_sharp = IconData(name="fit_page_width", fontFamily="Material Symbols Sharp")
-    fit_screen_sharp = IconData(name="fit_screen", fontFamily="Material Symbols Sharp")
-    fit_width_sharp = IconData(name="fit_width", fontFamily="Material Symbols Sharp")
-    fitness_center_sharp = IconData(name="fitness_center", fontFamily="Material Symbols Sharp")
-    fitness_tracker_sharp = IconData(name="fitness_tracker", fontFamily="Material Symbols Sharp")
-    flag_sharp = IconData(name="flag", fontFamily="Material Symbols Sharp")
-    flag_2_sharp = IconData(name="flag_2", fontFamily="Material Symbols Sharp")
-    flag_check_sharp = IconData(name="flag_check", fontFamily="Material Symbols Sharp")
-    flag_circle_sharp = IconData(name="flag_circle", fontFamily="Material Symbols Sharp")
-    flag_filled_sharp = IconData(name="flag_filled", fontFamily="Material Symbols Sharp")
-    flaky_sharp = IconData(name="flaky", fontFamily="Material Symbols Sharp")
-    flare_sharp = IconData(name="flare", fontFamily="Material Symbols Sharp")
-    flash_auto_sharp = IconData(name="flash_auto", fontFamily="Material Symbols Sharp")
-    flash_off_sharp = IconData(name="flash_off", fontFamily="Material Symbols Sharp")
-    flash_on_sharp = IconData(name="flash_on", fontFamily="Material Symbols Sharp")
-    flashlight_off_sharp = IconData(name="flashlight_off", fontFamily="Material Symbols Sharp")
-    flashlight_on_sharp = IconData(name="flashlight_on", fontFamily="Material Symbols Sharp")
-    flatware_sharp = IconData(name="flatware", fontFamily="Material Symbols Sharp")
-    flex_direction_sharp = IconData(name="flex_direction", fontFamily="Material Symbols Sharp")
-    flex_no_wrap_sharp = IconData(name="flex_no_wrap", fontFamily="Material Symbols Sharp")
-    flex_wrap_sharp = IconData(name="flex_wrap", fontFamily="Material Symbols Sharp")
-    flight_sharp = IconData(name="flight", fontFamily="Material Symbols Sharp")
-    flight_class_sharp = IconData(name="flight_class", fontFamily="Material Symbols Sharp")
-    flight_land_sharp = IconData(name="flight_land", fontFamily="Material Symbols Sharp")
-    flight_takeoff_sharp = IconData(name="flight_takeoff", fontFamily="Material Symbols Sharp")
-    flights_and_hotels_sharp = IconData(name="flights_and_hotels", fontFamily="Material Symbols Sharp")
-    flightsmode_sharp = IconData(name="flightsmode", fontFamily="Material Symbols Sharp")
-    flip_sharp = IconData(name="flip", fontFamily="Material Symbols Sharp")
-    flip_camera_android_sharp = IconData(name="flip_camera_android", fontFamily="Material Symbols Sharp")
-    flip_camera_ios_sharp = IconData(name="flip_camera_ios", fontFamily="Material Symbols Sharp")
-    flip_to_back_sharp = IconData(name="flip_to_back", fontFamily="Material Symbols Sharp")
-    flip_to_front_sharp = IconData(name="flip_to_front", fontFamily="Material Symbols Sharp")
-    float_landscape_2_sharp = IconData(name="float_landscape_2", fontFamily="Material Symbols Sharp")
-    float_portrait_2_sharp = IconData(name="float_portrait_2", fontFamily="Material Symbols Sharp")
-    flood_sharp = IconData(name="flood", fontFamily="Material Symbols Sharp")
-    floor_sharp = IconData(name="floor", fontFamily="Material Symbols Sharp")
-    floor_lamp_sharp = IconData(name="floor_lamp", fontFamily="Material Symbols Sharp")
-    flourescent_sharp = IconData(name="flourescent", fontFamily="Material Symbols Sharp")
-    flowchart_sharp = IconData(name="flowchart", fontFamily="Material Symbols Sharp")
-    flowsheet_sharp = IconData(name="flowsheet", fontFamily="Material Symbols Sharp")
-    fluid_sharp = IconData(name="fluid", fontFamily="Material Symbols Sharp")
-    fluid_balance_sharp = IconData(name="fluid_balance", fontFamily="Material Symbols Sharp")
-    fluid_med_sharp = IconData(name="fluid_med", fontFamily="Material Symbols Sharp")
-    fluorescent_sharp = IconData(name="fluorescent", fontFamily="Material Symbols Sharp")
-    flutter_sharp = IconData(name="flutter", fontFamily="Material Symbols Sharp")
-    flutter_dash_sharp = IconData(name="flutter_dash", fontFamily="Material Symbols Sharp")
-    flyover_sharp = IconData(name="flyover", fontFamily="Material Symbols Sharp")
-    fmd_bad_sharp = IconData(name="fmd_bad", fontFamily="Material Symbols Sharp")
-    fmd_good_sharp = IconData(name="fmd_good", fontFamily="Material Symbols Sharp")
-    foggy_sharp = IconData(name="foggy", fontFamily="Material Symbols Sharp")
-    folded_hands_sharp = IconData(name="folded_hands", fontFamily="Material Symbols Sharp")
-    folder_sharp = IconData(name="folder", fontFamily="Material Symbols Sharp")
-    folder_check_sharp = IconData(name="folder_check", fontFamily="Material Symbols Sharp")
-    folder_check_2_sharp = IconData(name="folder_check_2", fontFamily="Material Symbols Sharp")
-    folder_code_sharp = IconData(name="folder_code", fontFamily="Material Symbols Sharp")
-    folder_copy_sharp = IconData(name="folder_copy", fontFamily="Material Symbols Sharp")
-    folder_data_sharp = IconData(name="folder_data", fontFamily="Material Symbols Sharp")
-    folder_delete_sharp = IconData(name="folder_delete", fontFamily="Material Symbols Sharp")
-    folder_eye_sharp = IconData(name="folder_eye", fontFamily="Material Symbols Sharp")
-    folder_info_sharp = IconData(name="folder_info", fontFamily="Material Symbols Sharp")
-    folder_limited_sharp = IconData(name="folder_limited", fontFamily="Material Symbols Sharp")
-    folder_managed_sharp = IconData(name="folder_managed", fontFamily="Material Symbols Sharp")
-    folder_match_sharp = IconData(name="folder_match", fontFamily="Material Symbols Sharp")
-    folder_off_sharp = IconData(name="folder_off", fontFamily="Material Symbols Sharp")
-    folder_open_sharp = IconData(name="folder_open", fontFamily="Material Symbols Sharp")
-    folder_shared_sharp = IconData(name="folder_shared", fontFamily="Material Symbols Sharp")
-    folder_special_sharp = IconData(name="folder_special", fontFamily="Material Symbols Sharp")
-    folder_supervised_sharp = IconData(name="folder_supervised", fontFamily="Material Symbols Sharp")
-    folder_zip_sharp = IconData(name="folder_zip", fontFamily="Material Symbols Sharp")
-    follow_the_signs_sharp = IconData(name="follow_the_signs", fontFamily="Material Symbols Sharp")
-    font_download_sharp = IconData(name="font_download", fontFamily="Material Symbols Sharp")
-    font_download_off_sharp = IconData(name="font_download_off", fontFamily="Material Symbols Sharp")
-    food_bank_sharp = IconData(name="food_bank", fontFamily="Material Symbols Sharp")
-    foot_bones_sharp = IconData(name="foot_bones", fontFamily="Material Symbols Sharp")
-    footprint_sharp = IconData(name="footprint", fontFamily="Material Symbols Sharp")
-    for_you_sharp = IconData(name="for_you", fontFamily="Material Symbols Sharp")
-    forest_sharp = IconData(name="forest", fontFamily="Material Symbols Sharp")
-    fork_left_sharp = IconData(name="fork_left", fontFamily="Material Symbols Sharp")
-    fork_right_sharp = IconData(name="fork_right", fontFamily="Material Symbols Sharp")
-    fork_spoon_sharp = IconData(name="fork_spoon", fontFamily="Material Symbols Sharp")
-    forklift_sharp = IconData(name="forklift", fontFamily="Material Symbols Sharp")
-    format_align_center_sharp = IconData(name="format_align_center", fontFamily="Material Symbols Sharp")
-    format_align_justify_sharp = IconData(name="format_align_justify", fontFamily="Material Symbols Sharp")
-    format_align_left_sharp = IconData(name="format_align_left", fontFamily="Material Symbols Sharp")
-    format_align_right_sharp = IconData(name="format_align_right", fontFamily="Material Symbols Sharp")
-    format_bold_sharp = IconData(name="format_bold", fontFamily="Material Symbols Sharp")
-    format_clear_sharp = IconData(name="format_clear", fontFamily="Material Symbols Sharp")
-    format_color_fill_sharp = IconData(name="format_color_fill", fontFamily="Material Symbols Sharp")
-    format_color_reset_sharp = IconData(name="format_color_reset", fontFamily="Material Symbols Sharp")
-    format_color_text_sharp = IconData(name="format_color_text", fontFamily="Material Symbols Sharp")
-    format_h1_sharp = IconData(name="format_h1", fontFamily="Material Symbols Sharp")
-    format_h2_sharp = IconData(name="format_h2", fontFamily="Material Symbols Sharp")
-    format_h3_sharp = IconData(name="format_h3", fontFamily="Material Symbols Sharp")
-    format_h4_sharp = IconData(name="format_h4", fontFamily="Material Symbols Sharp")
-    format_h5_sharp = IconData(name="format_h5", fontFamily="Material Symbols Sharp")
-    format_h6_sharp = IconData(name="format_h6", fontFamily="Material Symbols Sharp")
-    format_image_left_sharp = IconData(name="format_image_left", fontFamily="Material Symbols Sharp")
-    format_image_right_sharp = IconData(name="format_image_right", fontFamily="Material Symbols Sharp")
-    format_indent_decrease_sharp = IconData(name="format_indent_decrease", fontFamily="Material Symbols Sharp")
-    format_indent_increase_sharp = IconData(name="format_indent_increase", fontFamily="Material Symbols Sharp")
-    format_ink_highlighter_sharp = IconData(name="format_ink_highlighter", fontFamily="Material Symbols Sharp")
-    format_italic_sharp = IconData(name="format_italic", fontFamily="Material Symbols Sharp")
-    format_letter_spacing_sharp = IconData(name="format_letter_spacing", fontFamily="Material Symbols Sharp")
-    format_letter_spacing_2_sharp = IconData(name="format_letter_spacing_2", fontFamily="Material Symbols Sharp")
-    format_letter_spacing_standard_sharp = IconData(name="format_letter_spacing_standard", fontFamily="Material Symbols Sharp")
-    format_letter_spacing_wide_sharp = IconData(name="format_letter_spacing_wide", fontFamily="Material Symbols Sharp")
-    format_letter_spacing_wider_sharp = IconData(name="format_letter_spacing_wider", fontFamily="Material Symbols Sharp")
-    format_line_spacing_sharp = IconData(name="format_line_spacing", fontFamily="Material Symbols Sharp")
-    format_list_bulleted_sharp = IconData(name="format_list_bulleted", fontFamily="Material Symbols Sharp")
-    format_list_bulleted_add_sharp = IconData(name="format_list_bulleted_add", fontFamily="Material Symbols Sharp")
-    format_list_numbered_sharp = IconData(name="format_list_numbered", fontFamily="Material Symbols Sharp")
-    format_list_numbered_rtl_sharp = IconData(name="format_list_numbered_rtl", fontFamily="Material Symbols Sharp")
-    format_overline_sharp = IconData(name="format_overline", fontFamily="Material Symbols Sharp")
-    format_paint_sharp = IconData(name="format_paint", fontFamily="Material Symbols Sharp")
-    format_paragraph_sharp = IconData(name="format_paragraph", fontFamily="Material Symbols Sharp")
-    format_quote_sharp = IconData(name="format_quote", fontFamily="Material Symbols Sharp")
-    format_quote_off_sharp = IconData(name="format_quote_off", fontFamily="Material Symbols Sharp")
-    format_shapes_sharp = IconData(name="format_shapes", fontFamily="Material Symbols Sharp")
-    format_size_sharp = IconData(name="format_size", fontFamily="Material Symbols Sharp")
-    format_strikethrough_sharp = IconData(name="format_strikethrough", fontFamily="Material Symbols Sharp")
-    format_text_clip_sharp = IconData(name="format_text_clip", fontFamily="Material Symbols Sharp")
-    format_text_overflow_sharp = IconData(name="format_text_overflow", fontFamily="Material Symbols Sharp")
-    format_text_wrap_sharp = IconData(name="format_text_wrap", fontFamily="Material Symbols Sharp")
-    format_textdirection_l_to_r_sharp = IconData(name="format_textdirection_l_to_r", fontFamily="Material Symbols Sharp")
-    format_textdirection_r_to_l_sharp = IconData(name="format_textdirection_r_to_l", fontFamily="Material Symbols Sharp")
-    format_textdirection_vertical_sharp = IconData(name="format_textdirection_vertical", fontFamily="Material Symbols Sharp")
-    format_underlined_sharp = IconData(name="format_underlined", fontFamily="Material Symbols Sharp")
-    format_underlined_squiggle_sharp = IconData(name="format_underlined_squiggle", fontFamily="Material Symbols Sharp")
-    forms_add_on_sharp = IconData(name="forms_add_on", fontFamily="Material Symbols Sharp")
-    forms_apps_script_sharp = IconData(name="forms_apps_script", fontFamily="Material Symbols Sharp")
-    fort_sharp = IconData(name="fort", fontFamily="Material Symbols Sharp")
-    forum_sharp = IconData(name="forum", fontFamily="Material Symbols Sharp")
-    forward_sharp = IconData(name="forward", fontFamily="Material Symbols Sharp")
-    forward_10_sharp = IconData(name="forward_10", fontFamily="Material Symbols Sharp")
-    forward_30_sharp = IconData(name="forward_30", fontFamily="Material Symbols Sharp")
-    forward_5_sharp = IconData(name="forward_5", fontFamily="Material Symbols Sharp")
-    forward_circle_sharp = IconData(name="forward_circle", fontFamily="Material Symbols Sharp")
-    forward_media_sharp = IconData(name="forward_media", fontFamily="Material Symbols Sharp")
-    forward_to_inbox_sharp = IconData(name="forward_to_inbox", fontFamily="Material Symbols Sharp")
-    foundation_sharp = IconData(name="foundation", fontFamily="Material Symbols Sharp")
-    fragrance_sharp = IconData(name="fragrance", fontFamily="Material Symbols Sharp")
-    frame_inspect_sharp = IconData(name="frame_inspect", fontFamily="Material Symbols Sharp")
-    frame_person_sharp = IconData(name="frame_person", fontFamily="Material Symbols Sharp")
-    frame_person_mic_sharp = IconData(name="frame_person_mic", fontFamily="Material Symbols Sharp")
-    frame_person_off_sharp = IconData(name="frame_person_off", fontFamily="Material Symbols Sharp")
-    frame_reload_sharp = IconData(name="frame_reload", fontFamily="Material Symbols Sharp")
-    frame_source_sharp = IconData(name="frame_source", fontFamily="Material Symbols Sharp")
-    free_breakfast_sharp = IconData(name="free_breakfast", fontFamily="Material Symbols Sharp")
-    free_cancellation_sharp = IconData(name="free_cancellation", fontFamily="Material Symbols Sharp")
-    front_hand_sharp = IconData(name="front_hand", fontFamily="Material Symbols Sharp")
-    front_loader_sharp = IconData(name="front_loader", fontFamily="Material Symbols Sharp")
-    full_coverage_sharp = IconData(name="full_coverage", fontFamily="Material Symbols Sharp")
-    full_hd_sharp = IconData(name="full_hd", fontFamily="Material Symbols Sharp")
-    full_stacked_bar_chart_sharp = IconData(name="full_stacked_bar_chart", fontFamily="Material Symbols Sharp")
-    fullscreen_sharp = IconData(name="fullscreen", fontFamily="Material Symbols Sharp")
-    fullscreen_exit_sharp = IconData(name="fullscreen_exit", fontFamily="Material Symbols Sharp")
-    fullscreen_portrait_sharp = IconData(name="fullscreen_portrait", fontFamily="Material Symbols Sharp")
-    function_sharp = IconData(name="function", fontFamily="Material Symbols Sharp")
-    functions_sharp = IconData(name="functions", fontFamily="Material Symbols Sharp")
-    funicular_sharp = IconData(name="funicular", fontFamily="Material Symbols Sharp")
-    g_mobiledata_sharp = IconData(name="g_mobiledata", fontFamily="Material Symbols Sharp")
-    g_mobiledata_badge_sharp = IconData(name="g_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    g_translate_sharp = IconData(name="g_translate", fontFamily="Material Symbols Sharp")
-    gallery_thumbnail_sharp = IconData(name="gallery_thumbnail", fontFamily="Material Symbols Sharp")
-    gamepad_sharp = IconData(name="gamepad", fontFamily="Material Symbols Sharp")
-    games_sharp = IconData(name="games", fontFamily="Material Symbols Sharp")
-    garage_sharp = IconData(name="garage", fontFamily="Material Symbols Sharp")
-    garage_door_sharp = IconData(name="garage_door", fontFamily="Material Symbols Sharp")
-    garage_home_sharp = IconData(name="garage_home", fontFamily="Material Symbols Sharp")
-    garden_cart_sharp = IconData(name="garden_cart", fontFamily="Material Symbols Sharp")
-    gas_meter_sharp = IconData(name="gas_meter", fontFamily="Material Symbols Sharp")
-    gastroenterology_sharp = IconData(name="gastroenterology", fontFamily="Material Symbols Sharp")
-    gate_sharp = IconData(name="gate", fontFamily="Material Symbols Sharp")
-    gavel_sharp = IconData(name="gavel", fontFamily="Material Symbols Sharp")
-    general_device_sharp = IconData(name="general_device", fontFamily="Material Symbols Sharp")
-    generating_tokens_sharp = IconData(name="generating_tokens", fontFamily="Material Symbols Sharp")
-    genetics_sharp = IconData(name="genetics", fontFamily="Material Symbols Sharp")
-    genres_sharp = IconData(name="genres", fontFamily="Material Symbols Sharp")
-    gesture_sharp = IconData(name="gesture", fontFamily="Material Symbols Sharp")
-    gesture_select_sharp = IconData(name="gesture_select", fontFamily="Material Symbols Sharp")
-    get_app_sharp = IconData(name="get_app", fontFamily="Material Symbols Sharp")
-    gif_sharp = IconData(name="gif", fontFamily="Material Symbols Sharp")
-    gif_2_sharp = IconData(name="gif_2", fontFamily="Material Symbols Sharp")
-    gif_box_sharp = IconData(name="gif_box", fontFamily="Material Symbols Sharp")
-    girl_sharp = IconData(name="girl", fontFamily="Material Symbols Sharp")
-    gite_sharp = IconData(name="gite", fontFamily="Material Symbols Sharp")
-    glass_cup_sharp = IconData(name="glass_cup", fontFamily="Material Symbols Sharp")
-    globe_sharp = IconData(name="globe", fontFamily="Material Symbols Sharp")
-    globe_asia_sharp = IconData(name="globe_asia", fontFamily="Material Symbols Sharp")
-    globe_book_sharp = IconData(name="globe_book", fontFamily="Material Symbols Sharp")
-    globe_location_pin_sharp = IconData(name="globe_location_pin", fontFamily="Material Symbols Sharp")
-    globe_uk_sharp = IconData(name="globe_uk", fontFamily="Material Symbols Sharp")
-    glucose_sharp = IconData(name="glucose", fontFamily="Material Symbols Sharp")
-    glyphs_sharp = IconData(name="glyphs", fontFamily="Material Symbols Sharp")
-    go_to_line_sharp = IconData(name="go_to_line", fontFamily="Material Symbols Sharp")
-    golf_course_sharp = IconData(name="golf_course", fontFamily="Material Symbols Sharp")
-    gondola_lift_sharp = IconData(name="gondola_lift", fontFamily="Material Symbols Sharp")
-    google_home_devices_sharp = IconData(name="google_home_devices", fontFamily="Material Symbols Sharp")
-    google_plus_reshare_sharp = IconData(name="google_plus_reshare", fontFamily="Material Symbols Sharp")
-    google_tv_remote_sharp = IconData(name="google_tv_remote", fontFamily="Material Symbols Sharp")
-    google_wifi_sharp = IconData(name="google_wifi", fontFamily="Material Symbols Sharp")
-    gpp_bad_sharp = IconData(name="gpp_bad", fontFamily="Material Symbols Sharp")
-    gpp_good_sharp = IconData(name="gpp_good", fontFamily="Material Symbols Sharp")
-    gpp_maybe_sharp = IconData(name="gpp_maybe", fontFamily="Material Symbols Sharp")
-    gps_fixed_sharp = IconData(name="gps_fixed", fontFamily="Material Symbols Sharp")
-    gps_not_fixed_sharp = IconData(name="gps_not_fixed", fontFamily="Material Symbols Sharp")
-    gps_off_sharp = IconData(name="gps_off", fontFamily="Material Symbols Sharp")
-    grade_sharp = IconData(name="grade", fontFamily="Material Symbols Sharp")
-    gradient_sharp = IconData(name="gradient", fontFamily="Material Symbols Sharp")
-    grading_sharp = IconData(name="grading", fontFamily="Material Symbols Sharp")
-    grain_sharp = IconData(name="grain", fontFamily="Material Symbols Sharp")
-    graph_1_sharp = IconData(name="graph_1", fontFamily="Material Symbols Sharp")
-    graph_2_sharp = IconData(name="graph_2", fontFamily="Material Symbols Sharp")
-    graph_3_sharp = IconData(name="graph_3", fontFamily="Material Symbols Sharp")
-    graph_4_sharp = IconData(name="graph_4", fontFamily="Material Symbols Sharp")
-    graph_5_sharp = IconData(name="graph_5", fontFamily="Material Symbols Sharp")
-    graph_6_sharp = IconData(name="graph_6", fontFamily="Material Symbols Sharp")
-    graph_7_sharp = IconData(name="graph_7", fontFamily="Material Symbols Sharp")
-    graphic_eq_sharp = IconData(name="graphic_eq", fontFamily="Material Symbols Sharp")
-    grass_sharp = IconData(name="grass", fontFamily="Material Symbols Sharp")
-    grid_3x3_sharp = IconData(name="grid_3x3", fontFamily="Material Symbols Sharp")
-    grid_3x3_off_sharp = IconData(name="grid_3x3_off", fontFamily="Material Symbols Sharp")
-    grid_4x4_sharp = IconData(name="grid_4x4", fontFamily="Material Symbols Sharp")
-    grid_goldenratio_sharp = IconData(name="grid_goldenratio", fontFamily="Material Symbols Sharp")
-    grid_guides_sharp = IconData(name="grid_guides", fontFamily="Material Symbols Sharp")
-    grid_off_sharp = IconData(name="grid_off", fontFamily="Material Symbols Sharp")
-    grid_on_sharp = IconData(name="grid_on", fontFamily="Material Symbols Sharp")
-    grid_view_sharp = IconData(name="grid_view", fontFamily="Material Symbols Sharp")
-    grocery_sharp = IconData(name="grocery", fontFamily="Material Symbols Sharp")
-    group_sharp = IconData(name="group", fontFamily="Material Symbols Sharp")
-    group_add_sharp = IconData(name="group_add", fontFamily="Material Symbols Sharp")
-    group_off_sharp = IconData(name="group_off", fontFamily="Material Symbols Sharp")
-    group_remove_sharp = IconData(name="group_remove", fontFamily="Material Symbols Sharp")
-    group_search_sharp = IconData(name="group_search", fontFamily="Material Symbols Sharp")
-    group_work_sharp = IconData(name="group_work", fontFamily="Material Symbols Sharp")
-    grouped_bar_chart_sharp = IconData(name="grouped_bar_chart", fontFamily="Material Symbols Sharp")
-    groups_sharp = IconData(name="groups", fontFamily="Material Symbols Sharp")
-    groups_2_sharp = IconData(name="groups_2", fontFamily="Material Symbols Sharp")
-    groups_3_sharp = IconData(name="groups_3", fontFamily="Material Symbols Sharp")
-    guardian_sharp = IconData(name="guardian", fontFamily="Material Symbols Sharp")
-    gynecology_sharp = IconData(name="gynecology", fontFamily="Material Symbols Sharp")
-    h_mobiledata_sharp = IconData(name="h_mobiledata", fontFamily="Material Symbols Sharp")
-    h_mobiledata_badge_sharp = IconData(name="h_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    h_plus_mobiledata_sharp = IconData(name="h_plus_mobiledata", fontFamily="Material Symbols Sharp")
-    h_plus_mobiledata_badge_sharp = IconData(name="h_plus_mobiledata_badge", fontFamily="Material Symbols Sharp")
-    hail_sharp = IconData(name="hail", fontFamily="Material Symbols Sharp")
-    hallway_sharp = IconData(name="hallway", fontFamily="Material Symbols Sharp")
-    hand_bones_sharp = IconData(name="hand_bones", fontFamily="Material Symbols Sharp")
-    hand_gesture_sharp = IconData(name="hand_gesture", fontFamily="Material Symbols Sharp")
-    hand_gesture_off_sharp = IconData(name="hand_gesture_off", fontFamily="Material Symbols Sharp")
-    handheld_controller_sharp = IconData(name="handheld_controller", fontFamily="Material Symbols Sharp")
-    handshake_sharp = IconData(name="handshake", fontFamily="Material Symbols Sharp")
-    handwriting_recognition_sharp = IconData(name="handwriting_recognition", fontFamily="Material Symbols Sharp")
-    handyman_sharp = IconData(name="handyman", fontFamily="Material Symbols Sharp")
-    hangout_video_sharp = IconData(name="hangout_video", fontFamily="Material Symbols Sharp")
-    hangout_video_off_sharp = IconData(name="hangout_video_off", fontFamily="Material Symbols Sharp")
-    hard_disk_sharp = IconData(name="hard_disk", fontFamily="Material Symbols Sharp")
-    hard_drive_sharp = IconData(name="hard_drive", fontFamily="Material Symbols Sharp")
-    hard_drive_2_sharp = IconData(name="hard_drive_2", fontFamily="Material Symbols Sharp")
-    hardware_sharp = IconData(name="hardware", fontFamily="Material Symbols Sharp")
-    hd_sharp = IconData(name="hd", fontFamily="Material Symbols Sharp")
-    hdr_auto_sharp = IconData(name="hdr_auto", fontFamily="Material Symbols Sharp")
-    hdr_auto_select_sharp = IconData(name="hdr_auto_select", fontFamily="Material Symbols Sharp")
-    hdr_enhanced_select_sharp = IconData(name="hdr_enhanced_select", fontFamily="Material Symbols Sharp")
-    hdr_off_sharp = IconData(name="hdr_off", fontFamily="Material Symbols Sharp")
-    hdr_off_select_sharp = IconData(name="hdr_off_select", fontFamily="Material Symbols Sharp")
-    hdr_on_sharp = IconData(name="hdr_on", fontFamily="Material Symbols Sharp")
-    hdr_on_select_sharp = IconData(name="hdr_on_select", fontFamily="Material Symbols Sharp")
-    hdr_plus_sharp = IconData(name="hdr_plus", fontFamily="Material Symbols Sharp")
-    hdr_plus_off_sharp = IconData(name="hdr_plus_off", fontFamily="Material Symbols Sharp")
-    hdr_strong_sharp = IconData(name="hdr_strong", fontFamily="Material Symbols Sharp")
-    hdr_weak_sharp = IconData(name="hdr_weak", fontFamily="Material Symbols Sharp")
-    head_mounted_device_sharp = IconData(name="head_mounted_device", fontFamily="Material Symbols Sharp")
-    headphones_sharp = IconData(name="headphones", fontFamily="Material Symbols Sharp")
-    headphones_battery_sharp = IconData(name="headphones_battery", fontFamily="Material Symbols Sharp")
-    headset_sharp = IconData(name="headset", fontFamily="Material Symbols Sharp")
-    headset_mic_sharp = IconData(name="headset_mic", fontFamily="Material Symbols Sharp")
-    headset_off_sharp = IconData(name="headset_off", fontFamily="Material Symbols Sharp")
-    healing_sharp = IconData(name="healing", fontFamily="Material Symbols Sharp")
-    health_and_beauty_sharp = IconData(name="health_and_beauty", fontFamily="Material Symbols Sharp")
-    health_and_safety_sharp = IconData(name="health_and_safety", fontFamily="Material Symbols Sharp")
-    health_metrics_sharp = IconData(name="health_metrics", fontFamily="Material Symbols Sharp")
-    heap_snapshot_large_sharp = IconData(name="heap_snapshot_large", fontFamily="Material Symbols Sharp")
-    heap_snapshot_multiple_sharp = IconData(name="heap_snapshot_multiple", fontFamily="Material Symbols Sharp")
-    heap_snapshot_thumbnail_sharp = IconData(name="heap_snapshot_thumbnail", fontFamily="Material Symbols Sharp")
-    hearing_sharp = IconData(name="hearing", fontFamily="Material Symbols Sharp")
-    hearing_aid_sharp = IconData(name="hearing_aid", fontFamily="Material Symbols Sharp")
-    hearing_aid_disabled_sharp = IconData(name="hearing_aid_disabled", fontFamily="Material Symbols Sharp")
-    hearing_disabled_sharp = IconData(name="hearing_disabled", fontFamily="Material Symbols Sharp")
-    heart_broken_sharp = IconData(name="heart_broken", fontFamily="Material Symbols Sharp")
-    heart_check_sharp = IconData(name="heart_check", fontFamily="Material Symbols Sharp")
-    heart_minus_sharp = IconData(name="heart_minus", fontFamily="Material Symbols Sharp")
-    heart_plus_sharp = IconData(name="heart_plus", fontFamily="Material Symbols Sharp")
-    heat_sharp = IconData(name="heat", fontFamily="Material Symbols Sharp")
-    heat_pump_sharp = IconData(name="heat_pump", fontFamily="Material Symbols Sharp")
-    heat_pump_balance_sharp = IconData(name="heat_pump_balance", fontFamily="Material Symbols Sharp")
-    height_sharp = IconData(name="height", fontFamily="Material Symbols Sharp")
-    helicopter_sharp = IconData(name="helicopter", fontFamily="Material Symbols Sharp")
-    help_sharp = IconData(name="help", fontFamily="Material Symbols Sharp")
-    help_center_sharp = IconData(name="help_center", fontFamily="Material Symbols Sharp")
-    help_clinic_sharp = IconData(name="help_clinic", fontFamily="Material Symbols Sharp")
-    help_outline_sharp = IconData(name="help_outline", fontFamily="Material Symbols Sharp")
-    hematology_sharp = IconData(name="hematology", fontFamily="Material Symbols Sharp")
-    hevc_sharp = IconData(name="hevc", fontFamily="Material Symbols Sharp")
-    hexagon_sharp = IconData(name="hexagon", fontFamily="Material Symbols Sharp")
-    hide_sharp = IconData(name="hide", fontFamily="Material Symbols Sharp")
-    hide_image_sharp = IconData(name="hide_image", fontFamily="Material Symbols Sharp")
-    hide_source_sharp = IconData(name="hide_source", fontFamily="Material Symbols Sharp")
-    high_density_sharp = IconData(name="high_density", fontFamily="Material Symbols Sharp")
-    high_quality_sharp = IconData(name="high_quality", fontFamily="Material Symbols Sharp")
-    high_res_sharp = IconData(name="high_res", fontFamily="Material Symbols Sharp")
-    highlight_sharp = IconData(name="highlight", fontFamily="Material Symbols Sharp")
-    highlight_alt_sharp = IconData(name="highlight_alt", fontFamily="Material Symbols Sharp")
-    highlight_keyboard_focus_sharp = IconData(name="highlight_keyboard_focus", fontFamily="Material Symbols Sharp")
-    highlight_mouse_cursor_sharp = IconData(name="highlight_mouse_cursor", fontFamily="Material Symbols Sharp")
-    highlight_off_sharp = IconData(name="highlight_off", fontFamily="Material Symbols Sharp")
-    highlight_text_cursor_sharp = IconData(name="highlight_text_cursor", fontFamily="Material Symbols Sharp")
-    highlighter_size_1_sharp = IconData(name="highlighter_size_1", fontFamily="Material Symbols Sharp")
-    highlighter_size_2_sharp = IconData(name="highlighter_size_2", fontFamily="Material Symbols Sharp")
-    highlighter_size_3_sharp = IconData(name="highlighter_size_3", fontFamily="Material Symbols Sharp")
-    highlighter_size_4_sharp = IconData(name="highlighter_size_4", fontFamily="Material Symbols Sharp")
-    highlighter_size_5_sharp = IconData(name="highlighter_size_5", fontFamily="Material Symbols Sharp")
-    hiking_sharp = IconData(name="hiking", fontFamily="Material Symbols Sharp")
-    history_sharp = IconData(name="history", fontFamily="Material Symbols Sharp")
-    history_2_sharp = IconData(name="history_2", fontFamily="Material Symbols Sharp")
-    history_edu_sharp = IconData(name="history_edu", fontFamily="Material Symbols Sharp")
-    history_off_sharp = IconData(name="history_off", fontFamily="Material Symbols Sharp")
-    history_toggle_off_sharp = IconData(name="history_toggle_off", fontFamily="Material Symbols Sharp")
-    hive_sharp = IconData(name="hive", fontFamily="Material Symbols Sharp")
-    hls_sharp = IconData(name="hls", fontFamily="Material Symbols Sharp")
-    hls_off_sharp = IconData(name="hls_off", fontFamily="Material Symbols Sharp")
-    holiday_village_sharp = IconData(name="holiday_village", fontFamily="Material Symbols Sharp")
-    home_sharp = IconData(name="home", fontFamily="Material Symbols Sharp")
-    home_and_garden_sharp = IconData(name="home_and_garden", fontFamily="Material Symbols Sharp")
-    home_app_logo_sharp = IconData(name="home_app_logo", fontFamily="Material Symbols Sharp")
-    home_filled_sharp = IconData(name="home_filled", fontFamily="Material Symbols Sharp")
-    home_health_sharp = IconData(name="home_health", fontFamily="Material Symbols Sharp")
-    home_improvement_and_tools_sharp = IconData(name="home_improvement_and_tools", fontFamily="Material Symbols Sharp")
-    home_iot_device_sharp = IconData(name="home_iot_device", fontFamily="Material Symbols Sharp")
-    home_max_sharp = IconData(name="home_max", fontFamily="Material Symbols Sharp")
-    home_max_dots_sharp = IconData(name="home_max_dots", fontFamily="Material Symbols Sharp")
-    home_mini_sharp = IconData(name="home_mini", fontFamily="Material Symbols Sharp")
-    home_pin_sharp = IconData(name="home_pin", fontFamily="Material Symbols Sharp")
-    home_repair_service_sharp = IconData(name="home_repair_service", fontFamily="Material Symbols Sharp")
-    home_speaker_sharp = IconData(name="home_speaker", fontFamily="Material Symbols Sharp")
-    home_storage_sharp = IconData(name="home_storage", fontFamily="Material Symbols Sharp")
-    home_work_sharp = IconData(name="home_work", fontFamily="Material Symbols Sharp")
-    horizontal_distribute_sharp = IconData(name="horizontal_distribute", fontFamily="Material Symbols Sharp")
-    horizontal_rule_sharp = IconData(name="horizontal_rule", fontFamily="Material Symbols Sharp")
-    horizontal_split_sharp = IconData(name="horizontal_split", fontFamily="Material Symbols Sharp")
-    host_sharp = IconData(name="host", fontFamily="Material Symbols Sharp")
-    hot_tub_sharp = IconData(name="hot_tub", fontFamily="Material Symbols Sharp")
-    hotel_sharp = IconData(name="hotel", fontFamily="Material Symbols Sharp")
-    hotel_class_sharp = IconData(name="hotel_class", fontFamily="Material Symbols Sharp")
-    hourglass_sharp = IconData(name="hourglass", fontFamily="Material Symbols Sharp")
-    hourglass_arrow_down_sharp = IconData(name="hourglass_arrow_down", fontFamily="Material Symbols Sharp")
-    hourglass_arrow_up_sharp = IconData(name="hourglass_arrow_up", fontFamily="Material Symbols Sharp")
-    hourglass_bottom_sharp = IconData(name="hourglass_bottom", fontFamily="Material Symbols Sharp")
-    hourglass_disabled_sharp = IconData(name="hourglass_disabled", fontFamily="Material Symbols Sharp")
-    hourglass_empty_sharp = IconData(name="hourglass_empty", fontFamily="Material Symbols Sharp")
-    hourglass_full_sharp = IconData(name="hourglass_full", fontFamily="Material Symbols Sharp")
-    hourglass_pause_sharp = IconData(name="hourglass_pause", fontFamily="Material Symbols Sharp")
-    hourglass_top_sharp = IconData(name="hourglass_top", fontFamily="Material Symbols Sharp")
-    house_sharp = IconData(name="house", fontFamily="Material Symbols Sharp")
-    house_siding_sharp = IconData(name="house_siding", fontFamily="Material Symbols Sharp")
-    house_with_shield_sharp = IconData(name="house_with_shield", fontFamily="Material Symbols Sharp")
-    houseboat_sharp = IconData(name="houseboat", fontFamily="Material Symbols Sharp")
-    household_supplies_sharp = IconData(name="household_supplies", fontFamily="Material Symbols Sharp")
-    hov_sharp = IconData(name="hov", fontFamily="Material Symbols Sharp")
-    how_to_reg_sharp = IconData(name="how_to_reg", fontFamily="Material Symbols Sharp")
-    how_to_vote_sharp = IconData(name="how_to_vote", fontFamily="Material Symbols Sharp")
-    hr_resting_sharp = IconData(name="hr_resting", fontFamily="Material Symbols Sharp")
-    html_sharp = IconData(name="html", fontFamily="Material Symbols Sharp")
-    http_sharp = IconData(name="http", fontFamily="Material Symbols Sharp")
-    https_sharp = IconData(name="https", fontFamily="Material Symbols Sharp")
-    hub_sharp = IconData(name="hub", fontFamily="Material Symbols Sharp")
-    humerus_sharp = IconData(name="humerus", fontFamily="Material Symbols Sharp")
-    humerus_alt_sharp = IconData(name="humerus_alt", fontFamily="Material Symbols Sharp")
-    humidity_high_sharp = IconData(name="humidity_high", fontFamily="Material Symbols Sharp")
-    humidity_indoor_sharp = IconData(name="humidity_indoor", fontFamily="Material Symbols Sharp")
-    humidity_low_sharp = IconData(name="humidity_low", fontFamily="Material Symbols Sharp")
-    humidity_mid_sharp = IconData(name="humidity_mid", fontFamily="Material Symbols Sharp")
-    humidity_percentage_sharp = IconData(name="humidity_percentage", fontFamily="Material Symbols Sharp")
-    hvac_sharp = IconData(name="hvac", fontFamily="Material Symbols Sharp")
-    hvac_max_defrost_sharp = IconData(name="hvac_max_defrost", fontFamily="Material Symbols Sharp")
-    ice_skating_sharp = IconData(name="ice_skating", fontFamily="Material Symbols Sharp")
-    icecream_sharp = IconData(name="icecream", fontFamily="Material Symbols Sharp")
-    id_card_sharp = IconData(name="id_card", fontFamily="Material Symbols Sharp")
-    identity_aware_proxy_sharp = IconData(name="identity_aware_proxy", fontFamily="Material Symbols Sharp")
-    identity_platform_sharp = IconData(name="identity_platform", fontFamily="Material Symbols Sharp")
-    ifl_sharp = IconData(name="ifl", fontFamily="Material Symbols Sharp")
-    iframe_sharp = IconData(name="iframe", fontFamily="Material Symbols Sharp")
-    iframe_off_sharp = IconData(name="iframe_off", fontFamily="Material Symbols Sharp")
-    image_sharp = IconData(name="image", fontFamily="Material Symbols Sharp")
-    image_arrow_up_sharp = IconData(name="image_arrow_up", fontFamily="Material Symbols Sharp")
-    image_aspect_ratio_sharp = IconData(name="image_aspect_ratio", fontFamily="Material Symbols Sharp")
-    image_not_supported_sharp = IconData(name="image_not_supported", fontFamily="Material Symbols Sharp")
-    image_search_sharp = IconData(name="image_search", fontFamily="Material Symbols Sharp")
-    imagesearch_roller_sharp = IconData(name="imagesearch_roller", fontFamily="Material Symbols Sharp")
-    imagesmode_sharp = IconData(name="imagesmode", fontFamily="Material Symbols Sharp")
-    immunology_sharp = IconData(name="immunology", fontFamily="Material Symbols Sharp")
-    import_contacts_sharp = IconData(name="import_contacts", fontFamily="Material Symbols Sharp")
-    import_export_sharp = IconData(name="import_export", fontFamily="Material Symbols Sharp")
-    important_devices_sharp = IconData(name="important_devices", fontFamily="Material Symbols Sharp")
-    in_home_mode_sharp = IconData(name="in_home_mode", fontFamily="Material Symbols Sharp")
-    inactive_order_sharp = IconData(name="inactive_order", fontFamily="Material Symbols Sharp")
-    inbox_sharp = IconData(name="inbox", fontFamily="Material Symbols Sharp")
-    inbox_customize_sharp = IconData(name="inbox_customize", fontFamily="Material Symbols Sharp")
-    inbox_text_sharp = IconData(name="inbox_text", fontFamily="Material Symbols Sharp")
-    inbox_text_asterisk_sharp = IconData(name="inbox_text_asterisk", fontFamily="Material Symbols Sharp")
-    inbox_text_person_sharp = IconData(name="inbox_text_person", fontFamily="Material Symbols Sharp")
-    inbox_text_share_sharp = IconData(name="inbox_text_share", fontFamily="Material Symbols Sharp")
-    incomplete_circle_sharp = IconData(name="incomplete_circle", fontFamily="Material Symbols Sharp")
-    indeterminate_check_box_sharp = IconData(name="indeterminate_check_box", fontFamily="Material Symbols Sharp")
-    indeterminate_question_box_sharp = IconData(name="indeterminate_question_box", fontFamily="Material Symbols Sharp")
-    info_sharp = IconData(name="info", fontFamily="Material Symbols Sharp")
-    info_i_sharp = IconData(name="info_i", fontFamily="Material Symbols Sharp")
-    infrared_sharp = IconData(name="infrared", fontFamily="Material Symbols Sharp")
-    ink_eraser_sharp = IconData(name="ink_eraser", fontFamily="Material Symbols Sharp")
-    ink_eraser_off_sharp = IconData(name="ink_eraser_off", fontFamily="Material Symbols Sharp")
-    ink_highlighter_sharp = IconData(name="ink_highlighter", fontFamily="Material Symbols Sharp")
-    ink_highlighter_move_sharp = IconData(name="ink_highlighter_move", fontFamily="Material Symbols Sharp")
-    ink_marker_sharp = IconData(name="ink_marker", fontFamily="Material Symbols Sharp")
-    ink_pen_sharp = IconData(name="ink_pen", fontFamily="Material Symbols Sharp")
-    ink_selection_sharp = IconData(name="ink_selection", fontFamily="Material Symbols Sharp")
-    inpatient_sharp = IconData(name="inpatient", fontFamily="Material Symbols Sharp")
-    input_sharp = IconData(name="input", fontFamily="Material Symbols Sharp")
-    input_circle_sharp = IconData(name="input_circle", fontFamily="Material Symbols Sharp")
-    insert_chart_sharp = IconData(name="insert_chart", fontFamily="Material Symbols Sharp")
-    insert_chart_filled_sharp = IconData(name="insert_chart_filled", fontFamily="Material Symbols Sharp")
-    insert_chart_outlined_sharp = IconData(name="insert_chart_outlined", fontFamily="Material Symbols Sharp")
-    insert_comment_sharp = IconData(name="insert_comment", fontFamily="Material Symbols Sharp")
-    insert_drive_file_sharp = IconData(name="insert_drive_file", fontFamily="Material Symbols Sharp")
-    insert_emoticon_sharp = IconData(name="insert_emoticon", fontFamily="Material Symbols Sharp")
-    insert_invitation_sharp = IconData(name="insert_invitation", fontFamily="Material Symbols Sharp")
-    insert_link_sharp = IconData(name="insert_link", fontFamily="Material Symbols Sharp")
-    insert_page_break_sharp = IconData(name="insert_page_break", fontFamily="Material Symbols Sharp")
-    insert_photo_sharp = IconData(name="insert_photo", fontFamily="Material Symbols Sharp")
-    insert_text_sharp = IconData(name="insert_text", fontFamily="Material Symbols Sharp")
-    insights_sharp = IconData(name="insights", fontFamily="Material Symbols Sharp")
-    install_desktop_sharp = IconData(name="install_desktop", fontFamily="Material Symbols Sharp")
-    install_mobile_sharp = IconData(name="install_mobile", fontFamily="Material Symbols Sharp")
-    instant_mix_sharp = IconData(name="instant_mix", fontFamily="Material Symbols Sharp")
-    integration_instructions_sharp = IconData(name="integration_instructions", fontFamily="Material Symbols Sharp")
-    interactive_space_sharp = IconData(name="interactive_space", fontFamily="Material Symbols Sharp")
-    interests_sharp = IconData(name="interests", fontFamily="Material Symbols Sharp")
-    interpreter_mode_sharp = IconData(name="interpreter_mode", fontFamily="Material Symbols Sharp")
-    inventory_sharp = IconData(name="inventory", fontFamily="Material Symbols Sharp")
-    inventory_2_sharp = IconData(name="inventory_2", fontFamily="Material Symbols Sharp")
-    invert_colors_sharp = IconData(name="invert_colors", fontFamily="Material Symbols Sharp")
-    invert_colors_off_sharp = IconData(name="invert_colors_off", fontFamily="Material Symbols Sharp")
-    ios_sharp = IconData(name="ios", fontFamily="Material Symbols Sharp")
-    ios_share_sharp = IconData(name="ios_share", fontFamily="Material Symbols Sharp")
-    iron_sharp = IconData(name="iron", fontFamily="Material Symbols Sharp")
-    iso_sharp = IconData(name="iso", fontFamily="Material Symbols Sharp")
\ No newline at end of file
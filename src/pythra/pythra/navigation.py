@@ -3,7 +3,30 @@ from pythra.pythra.styles import Colors
 from .state import StatefulWidget, State
 from .widgets import Container, Key, Text
 from .base import Widget
-from typing import Callable, List, Dict
+from typing import Any, Callable, List, Dict, Optional
+
+
+class _RouteStack(Widget):
+    """
+    Holds the mounted routes of a keep-alive Navigator. `display: contents`
+    keeps it out of layout, so the visible page sits where it always did.
+    """
+    def __init__(self, key: Key, children: List[Widget]):
+        super().__init__(key=key, children=children)
+
+    def render_props(self) -> Dict[str, Any]:
+        return {'style': {'display': 'contents'}}
+
+
+class _RouteSlot(Widget):
+    """One mounted route. Offstage slots stay in the DOM with `display: none`."""
+    def __init__(self, key: Key, child: Widget, onstage: bool):
+        super().__init__(key=key, children=[child])
+        self.onstage = onstage
+
+    def render_props(self) -> Dict[str, Any]:
+        return {'style': {'display': 'contents' if self.onstage else 'none'}}
+
 
 class PageRoute:
     # The builder now accepts the navigator state as an argument
@@ -21,25 +44,56 @@ class PageRoute:
 class NavigatorState(State):
     def initState(self):
         self.history: List[PageRoute] = [self.get_widget().initialRoute] # type: ignore
-        
+        # One keep-alive slot key per history entry (not per route: a route
+        # object can be pushed more than once).
+        self._next_slot = 0
+        self._slot_keys: List[Key] = [self._new_slot_key()]
+
+    def _new_slot_key(self) -> Key:
+        key = Key(f"pythra_route_{id(self)}_{self._next_slot}")
+        self._next_slot += 1
+        return key
+
     def push(self, route: PageRoute):
         self.history.append(route)
+        self._slot_keys.append(self._new_slot_key())
         self.setState()
 
     def pop(self):
         if len(self.history) > 1:
             self.history.pop()
+            self._slot_keys.pop()
             self.setState()
             
     def build(self) -> Widget:
         if not self.history:
             return Container(color=Colors.black, child=Text("Error: Navigation stack is empty."))
 
+        depth = getattr(self.get_widget(), 'keepAliveDepth', 0)
+        if depth > 0:
+            return self._build_keep_alive(depth)
+
         active_route = self.history[-1]
         
         # Pass `self` (the NavigatorState instance) to the route's build method
         return active_route.build(self)
 
+    def _build_keep_alive(self, depth: int) -> Widget:
+        """
+        Mounts the top route plus up to `depth` routes below it, hidden. Each
+        history entry keeps its slot key, so a pop only flips the uncovered
+        page's `display` instead of re-inserting its DOM; routes deeper than
+        `depth` are unmounted as usual. A route pushed again is mounted only
+        at its top-most entry, since its page can sit in one slot at a time.
+        """
+        mounted = list(zip(self.history, self._slot_keys))[-(depth + 1):]
+        slots = []
+        for index, (route, slot_key) in enumerate(mounted):
+            if any(later is route for later, _ in mounted[index + 1:]):
+                continue
+            slots.append(_RouteSlot(slot_key, route.build(self), onstage=index == len(mounted) - 1))
+        return _RouteStack(Key(f"pythra_routes_{id(self)}"), slots)
+
 class Navigator(StatefulWidget):
     # We no longer need the static state reference here.
 
@@ -55,9 +109,14 @@ class Navigator(StatefulWidget):
     #     # Ask the framework to find the state for us
     #     return widget.framework.find_ancestor_state_of_type(widget, NavigatorState)
 
-    def __init__(self, key: Key, initialRoute: PageRoute, routes: Dict[str, Callable[[], Widget]] = None): # type: ignore
+    # keepAliveDepth: how many routes below the top stay mounted offstage, so
+    # popping back to them is a visibility toggle. 0 (default) keeps only the top.
+    def __init__(self, key: Key, initialRoute: PageRoute, routes: Dict[str, Callable[[], Widget]] = None, keepAliveDepth: int = 0): # type: ignore
+        if keepAliveDepth < 0:
+            raise ValueError(f"keepAliveDepth must be >= 0, got {keepAliveDepth}.")
         self.initialRoute = initialRoute
         self.routes = routes or {}
+        self.keepAliveDepth = keepAliveDepth
         super().__init__(key=key)
 
     def createState(self) -> NavigatorState:
@@ -0,0 +1,206 @@
+# pythra/page_resources.py
+
+"""
+The resources behind the `pythra://` page.
+
+With `page_scheme: pythra` the window loads `pythra://app/index.html` and every
+request is answered from this store by the Qt scheme handler
+(window/scheme.py) instead of going through `render/` on disk and the
+localhost AssetServer:
+
+- generated documents (`index.html`, `styles.css`) live in memory, so the
+  first render never touches the disk;
+- mounted directories (the render template's `js/`, the project's `assets/`,
+  plugin asset dirs) are served from disk. Small text and page resources
+  (scripts, stylesheets, JSON, SVG, fonts) are kept in a bounded in-memory
+  cache until the file changes; anything larger, or media like images, audio
+  and video, is handed to the scheme handler as a path and streamed, so it is
+  never held in memory whole and the webview can seek in it;
+- JS engine modules, which the page imports by absolute filesystem path, are
+  served when they sit under an allowed root (the project, PyThra itself).
+
+This module has no Qt dependency, so it can be used and tested on its own.
+"""
+
+import mimetypes
+import os
+import threading
+import urllib.parse
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# Every page resource is served under this origin, e.g. `pythra://app/assets/logo.png`.
+PAGE_ORIGIN = 'pythra://app'
+
+_MIME_TYPES = {
+    '.html': 'text/html',
+    '.css': 'text/css',
+    '.js': 'text/javascript',  # Module scripts are refused without a JS MIME type.
+    '.mjs': 'text/javascript',
+    '.json': 'application/json',
+    '.svg': 'image/svg+xml',
+    '.wasm': 'application/wasm',
+    '.ttf': 'font/ttf',
+    '.otf': 'font/otf',
+    '.woff': 'font/woff',
+    '.woff2': 'font/woff2',
+}
+
+
+# Only files of these types are cached, and only up to MAX_CACHED_FILE_SIZE each.
+_CACHEABLE_MIME_TYPES = {
+    'application/json',
+    'application/wasm',
+    'image/svg+xml',
+}
+MAX_CACHED_FILE_SIZE = 512 * 1024
+MAX_CACHE_SIZE = 16 * 1024 * 1024
+
+
+def guess_mime_type(path: str) -> str:
+    extension = os.path.splitext(path)[1].lower()
+    return _MIME_TYPES.get(extension) or mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+def is_cacheable(mime_type: str, size: int) -> bool:
+    """Whether a file is small page text (kept in memory) rather than something to stream."""
+    if size > MAX_CACHED_FILE_SIZE:
+        return False
+    return (mime_type.startswith('text/') or mime_type.startswith('font/')
+            or mime_type in _CACHEABLE_MIME_TYPES)
+
+
+class Resource(NamedTuple):
+    """
+    What `PageResources.lookup()` found: either `data` (a document or a cached
+    file) or `file_path` (a file to stream from disk), never both.
+    """
+    data: Optional[bytes]
+    file_path: Optional[Path]
+    mime_type: str
+
+
+class PageResources:
+    """
+    Maps `pythra://app/<path>` to bytes.
+
+    Lookups try, in order: documents added with `put()`, mounted directories
+    (longest prefix first), then absolute paths under an allowed root.
+    `lookup()` may be called from Qt's IO thread, so the caches are locked.
+
+    Files are cached only when `is_cacheable()` says so, least recently used
+    first out once the cache holds more than `max_cache_size` bytes.
+    """
+
+    def __init__(self, max_cache_size: int = MAX_CACHE_SIZE):
+        self._documents: Dict[str, Tuple[bytes, str]] = {}
+        self._mounts: List[Tuple[str, Path]] = []
+        self._roots: List[Path] = []
+        # path -> (mtime_ns, size, data), most recently used last
+        self._file_cache: 'OrderedDict[str, Tuple[int, int, bytes]]' = OrderedDict()
+        self._cache_size = 0
+        self.max_cache_size = max_cache_size
+        self._lock = threading.Lock()
+
+    def put(self, path: str, data, mime_type: Optional[str] = None):
+        """Serves `data` (str or bytes) at `path`, e.g. `put('index.html', html)`."""
+        if isinstance(data, str):
+            data = data.encode('utf-8')
+        path = path.strip('/')
+        with self._lock:
+            self._documents[path] = (data, mime_type or guess_mime_type(path))
+
+    def mount(self, url_prefix: str, directory):
+        """Serves the files under `directory` at `<url_prefix>/...` ('' for the root)."""
+        prefix = url_prefix.strip('/')
+        with self._lock:
+            self._mounts = [(p, d) for p, d in self._mounts if p != prefix]
+            self._mounts.append((prefix, Path(directory).resolve()))
+            self._mounts.sort(key=lambda mount: len(mount[0]), reverse=True)
+
+    def allow_root(self, directory):
+        """Lets files under `directory` be requested by their absolute path."""
+        root = Path(directory).resolve()
+        with self._lock:
+            if root not in self._roots:
+                self._roots.append(root)
+
+    def get(self, url_path: str) -> Optional[Tuple[bytes, str]]:
+        """
+        Returns `(data, mime_type)` for a request path, or None if there is
+        nothing to serve. Files that `lookup()` would stream are read whole
+        (and not cached); the scheme handler uses `lookup()` instead.
+        """
+        resource = self.lookup(url_path)
+        if resource is None:
+            return None
+        if resource.data is not None:
+            return resource.data, resource.mime_type
+        try:
+            return resource.file_path.read_bytes(), resource.mime_type
+        except OSError:
+            return None
+
+    def lookup(self, url_path: str) -> Optional[Resource]:
+        """Finds what to serve for a request path, or None if there is nothing."""
+        path = urllib.parse.unquote(url_path).strip('/')
+        with self._lock:
+            document = self._documents.get(path)
+            mounts, roots = list(self._mounts), list(self._roots)
+        if document is not None:
+            return Resource(document[0], None, document[1])
+
+        parts = path.split('/')
+        if '..' in parts:
+            return None
+
+        for prefix, directory in mounts:
+            if prefix and path != prefix and not path.startswith(prefix + '/'):
+                continue
+            relative = path[len(prefix):].strip('/')
+            if relative:
+                resource = self._open(directory / relative, guess_mime_type(relative))
+                if resource is not None:
+                    return resource
+
+        # `import { Engine } from '/abs/path/engine.js'` arrives as that path.
+        absolute = Path('/' + path)
+        if any(root == absolute or root in absolute.parents for root in roots):
+            return self._open(absolute, guess_mime_type(path))
+        return None
+
+    def _open(self, file_path: Path, mime_type: str) -> Optional[Resource]:
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            return None
+        if not os.path.isfile(file_path):
+            return None
+        if not is_cacheable(mime_type, stat.st_size):
+            return Resource(None, file_path, mime_type)
+
+        key = str(file_path)
+        with self._lock:
+            cached = self._file_cache.get(key)
+            if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                self._file_cache.move_to_end(key)
+                return Resource(cached[2], None, mime_type)
+        try:
+            data = file_path.read_bytes()
+        except OSError:
+            return None
+        with self._lock:
+            self._store(key, (stat.st_mtime_ns, stat.st_size, data))
+        return Resource(data, None, mime_type)
+
+    def _store(self, key: str, entry: Tuple[int, int, bytes]):
+        """Caches `entry`, evicting the least recently used files past the budget. Lock held."""
+        previous = self._file_cache.pop(key, None)
+        if previous is not None:
+            self._cache_size -= len(previous[2])
+        self._file_cache[key] = entry
+        self._cache_size += len(entry[2])
+        while self._cache_size > self.max_cache_size and self._file_cache:
+            _, evicted = self._file_cache.popitem(last=False)
+            self._cache_size -= len(evicted[2])
@@ -0,0 +1,198 @@
+# =============================================================================
+# PYTHRA PATCH PROTOCOL - Reconciler Patches as Plain Data for the Browser
+# =============================================================================
+
+"""
+PyThra Patch Protocol
+
+Turns the reconciler's `Patch` objects into compact, JSON-safe records that the
+resident `applyPatches(batch)` function (render_template/js/patch_applier.js)
+applies in the page. Python ships data only; the browser never has to parse and
+compile a fresh script per frame.
+
+**Record format** (short keys keep batches small):
+```
+{"op": "INSERT",  "id": ..., "parent": ..., "before": ..., "html": ..., "dom": {...}, "init": [...]}
+{"op": "UPDATE",  "id": ..., "dom": {...}}      # changed props only
+{"op": "MOVE",    "id": ..., "parent": ..., "before": ...}
+{"op": "REMOVE",  "id": ...}
+{"op": "REPLACE", "id": ..., "html": ..., "init": [...]}
+{"op": "SVG_INSERT", "id": ..., "parent": ..., "html": ...}
+```
+
+`dom` holds only DOM writes, already resolved from widget props:
+`text`, `cls` (`{"remove": old, "add": [...]}`), `src`, `title`, `input`
+(TextField inner value), `helper` (TextField error text) and `style`
+(`{css-property: value}`).
+
+`init` lists JS engines to start on the new element, e.g.
+`{"engine": "PythraSlider", "instance": "fw_id_9", "options": {...}, "once": true}`.
+"""
+
+from typing import Any, Dict, List, Optional
+
+from .reconciler import Patch
+
+
+def _kebab(name: str) -> str:
+    return "".join("-" + c.lower() if c.isupper() else c for c in name)
+
+
+# TextField props mirrored onto its <input> as data-* attributes (dataset key -> value).
+_INPUT_DATASET = {
+    "commitOn": lambda value: value or "change",
+    "debounceMs": lambda value: str(value or 0),
+}
+
+
+def dom_props(props: Dict[str, Any], context: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """
+    Resolves widget props into the DOM writes `applyPatches` performs. Mirrors
+    the legacy `Framework._generate_prop_update_js` rules.
+
+    For UPDATE patches `props` is only the changed keys; `context` carries the
+    unchanged props (`css_class`, `isDragEnded`) needed to route those values.
+    Each CSS property is written once, even if both `style` and a direct prop
+    set it.
+    """
+    dom: Dict[str, Any] = {}
+    style_updates: Dict[str, Any] = {}
+    view = {**context, **props} if context else props
+    css_class = view.get("css_class", "") or ""
+
+    for key, value in props.items():
+        if key == "data":
+            dom["text"] = str(value)
+        elif key == "css_class":
+            dom["cls"] = {"remove": props.get("old_shared_class"), "add": [c for c in value.split(" ")]}
+        elif key == "src":
+            dom["src"] = value
+        elif key == "tooltip":
+            dom["title"] = value
+        elif key == "value" and "textfield" in css_class:
+            dom["input"] = str(value)
+        elif key == "errorText" and "textfield-root-container" in css_class:
+            dom["helper"] = str(value)
+        elif key in _INPUT_DATASET and "textfield-root-container" in css_class:
+            # Read by pythraInput on every keystroke, so an update takes effect at once.
+            dom.setdefault("inputData", {})[key] = _INPUT_DATASET[key](value)
+        elif key in ("color", "backgroundColor"):
+            style_updates[key] = value
+        elif key in ("width", "height") and value is not None:
+            style_updates[key] = f"{value}px" if isinstance(value, (int, float)) else value
+        elif key == "aspectRatio":
+            style_updates["aspect-ratio"] = value
+        elif key == "clip_path_string":
+            style_updates["clip-path"] = value
+
+    style: Dict[str, Any] = {}
+    inline_style = props.get("style")
+    if isinstance(inline_style, dict):
+        for key, value in inline_style.items():
+            prop = _kebab(key)
+            if prop == "--slider-percentage":
+                # Slider fill is only pushed from Python once the drag has ended.
+                if view.get("isDragEnded"):
+                    style[prop] = value
+            elif "isDragEnded" not in view:
+                style[prop] = value
+
+    widget_instance = props.get("widget_instance")
+    if widget_instance is not None and hasattr(widget_instance, "_style_override"):
+        style_updates.update(widget_instance._style_override)
+    if isinstance(inline_style, dict):
+        # Custom properties (`--x`) were routed above; stripping their dashes
+        # here would only produce a write to a non-existent property.
+        style_updates.update({k: v for k, v in inline_style.items() if not k.startswith("--")})
+    for key, value in style_updates.items():
+        style[_kebab(key).lstrip("-")] = value
+
+    if style:
+        dom["style"] = style
+    return dom
+
+
+def _engine(engine: str, instance: str, options: Any, **flags) -> Dict[str, Any]:
+    record = {"engine": engine, "instance": instance, "options": options}
+    record.update({k: v for k, v in flags.items() if v})
+    return record
+
+
+def insert_inits(target_id: str, props: Dict[str, Any], clip_target: Optional[str]) -> List[Dict[str, Any]]:
+    """JS engine initializers for a freshly inserted element, in legacy order."""
+    inits: List[Dict[str, Any]] = []
+    if props.get("init_gradient_clip_border"):
+        inits.append(_engine("PythraGradientClipPath", target_id, props.get("gradient_clip_options", {})))
+    if props.get("init_gesture_detector"):
+        inits.append(_engine("PythraGestureDetector", target_id, props.get("gesture_options", {})))
+    if props.get("init_dropdown"):
+        inits.append(_engine("PythraDropdown", target_id, props.get("dropdown_options", {}), once=True))
+    if props.get("init_slider"):
+        inits.append(_engine("PythraSlider", target_id, props.get("slider_options", {}), once=True))
+    if props.get("init_simplebar"):
+        inits.append({"engine": "SimpleBar", "options": props.get("simplebar_options", {}), "el": True})
+    if props.get("init_virtual_list"):
+        inits.append(_engine(
+            "PythraVirtualList", f"{target_id}_vlist", props.get("virtual_list_options", {}),
+            needs_simplebar=True,
+        ))
+    if "responsive_clip_path" in props:
+        clip = props["responsive_clip_path"]
+        inits.append({
+            "engine": "ResponsiveClipPath",
+            "instance": clip_target or target_id,
+            "points": clip["points"],
+            "radius": clip["radius"],
+            "viewBox": list(clip["viewBox"][:2]),
+        })
+    js_init = props.get("_js_init")
+    if js_init and isinstance(js_init, dict):
+        inits.append(_engine(
+            js_init.get("engine"), js_init.get("instance_name"), js_init.get("options", {}),
+            el=True, replace=True,
+        ))
+    return inits
+
+
+def serialize_patches(patches: List[Patch]) -> List[Dict[str, Any]]:
+    """Converts reconciler patches into `applyPatches` records."""
+    records: List[Dict[str, Any]] = []
+    # Legacy quirk preserved: a ResponsiveClipPath is attached to the previous
+    # clip-path INSERT's element when several arrive in one batch.
+    old_clip_id: Optional[str] = None
+    new_clip_id: Optional[str] = None
+
+    for patch in patches:
+        action, target_id, data = patch.action, patch.html_id, patch.data or {}
+
+        if action == "INSERT":
+            props = data.get("props", {})
+            record = {
+                "op": "INSERT", "id": target_id, "parent": data["parent_html_id"],
+                "before": data.get("before_id"), "html": data["html"], "dom": dom_props(props),
+            }
+            if "responsive_clip_path" in props and target_id != new_clip_id:
+                old_clip_id, new_clip_id = new_clip_id, target_id
+            inits = insert_inits(target_id, props, old_clip_id)
+            if inits:
+                record["init"] = inits
+        elif action == "UPDATE":
+            dom = dom_props(data["props"], data.get("context"))
+            if not dom:
+                continue
+            record = {"op": "UPDATE", "id": target_id, "dom": dom}
+        elif action == "REMOVE":
+            record = {"op": "REMOVE", "id": target_id}
+        elif action == "MOVE":
+            record = {"op": "MOVE", "id": target_id, "parent": data["parent_html_id"], "before": data["before_id"]}
+        elif action == "REPLACE":
+            record = {"op": "REPLACE", "id": target_id, "html": data["new_html"]}
+            new_props = data.get("new_props", {})
+            if new_props.get("init_dropdown"):
+                record["init"] = [_engine("PythraDropdown", target_id, new_props.get("dropdown_options", {}))]
+        elif action == "SVG_INSERT":
+            record = {"op": "SVG_INSERT", "id": target_id, "parent": data.get("parent_html_id"), "html": data.get("html")}
+        else:
+            continue
+        records.append(record)
+    return records
@@ -0,0 +1,216 @@
+# =============================================================================
+# PYTHRA PROFILING - Opt-in, Sampled Timing for UI Update Cycles
+# =============================================================================
+
+"""
+PyThra Update-Cycle Profiler
+
+Measures where the time goes in `Framework._process_reconciliation` without
+taxing every frame. It is OFF by default; when off, every hook is a no-op.
+
+**Enabling it**
+- `config.yaml`:   `profiling_enabled: true`
+- Environment:     `PYTHRA_PROFILE=1` (or `phases` / `cprofile`)
+
+**What it records**
+- `phases` mode (default): per-phase wall time for `build`, `reconcile`, `css`,
+  `patch_script` and `evaluate_js`, kept in a fixed-size ring buffer.
+- `cprofile` mode: the same phase timings, plus a `.prof` file per sampled
+  cycle (open it with `python -m pstats` or snakeviz).
+
+Only one in every `profiling_sample_every` cycles is measured.
+
+**Querying from Python**
+```python
+framework.profiler.recent(10)      # last 10 CycleSample objects
+framework.profiler.summary()       # {"build": {"avg_ms": ..., "max_ms": ...}, ...}
+```
+"""
+
+import os
+import time
+import cProfile
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional
+
+PROFILE_MODE_PHASES = "phases"
+PROFILE_MODE_CPROFILE = "cprofile"
+PROFILE_MODES = (PROFILE_MODE_PHASES, PROFILE_MODE_CPROFILE)
+
+# The phases `_process_reconciliation` reports, in execution order.
+CYCLE_PHASES = ("build", "reconcile", "css", "patch_script", "evaluate_js")
+
+ENV_PROFILE = "PYTHRA_PROFILE"
+ENV_SAMPLE_EVERY = "PYTHRA_PROFILE_SAMPLE_EVERY"
+
+
+class CycleSample:
+    """Timings for one sampled update cycle. Phases entered twice accumulate."""
+
+    __slots__ = ("cycle", "started_at", "total_ms", "phases", "prof_path")
+
+    def __init__(self, cycle: int):
+        self.cycle = cycle
+        self.started_at = time.time()
+        self.total_ms = 0.0
+        self.phases: Dict[str, float] = {}
+        self.prof_path: Optional[str] = None
+
+    @contextmanager
+    def phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000.0
+            self.phases[name] = self.phases.get(name, 0.0) + elapsed
+
+    def as_dict(self) -> Dict[str, Any]:
+        return {
+            "cycle": self.cycle,
+            "started_at": self.started_at,
+            "total_ms": self.total_ms,
+            "phases": dict(self.phases),
+            "prof_path": self.prof_path,
+        }
+
+    def __repr__(self) -> str:
+        phases = ", ".join(f"{k}={v:.2f}ms" for k, v in self.phases.items())
+        return f"CycleSample(#{self.cycle}, total={self.total_ms:.2f}ms, {phases})"
+
+
+class _NullSample:
+    """Stand-in used for unsampled cycles; `phase()` costs one call."""
+
+    __slots__ = ()
+
+    def phase(self, name: str):
+        return nullcontext()
+
+
+_NULL_SAMPLE = _NullSample()
+
+
+class CycleProfiler:
+    """
+    Samples 1 in `sample_every` update cycles and keeps the last `buffer_size`
+    samples in a ring buffer.
+
+    Usage inside the framework:
+    ```python
+    with self.profiler.cycle() as sample:
+        with sample.phase("build"):
+            ...
+    ```
+    """
+
+    def __init__(
+        self,
+        enabled: bool = False,
+        mode: str = PROFILE_MODE_PHASES,
+        sample_every: int = 1,
+        buffer_size: int = 120,
+        output_dir: Optional[str] = None,
+    ):
+        if mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profiling mode {mode!r}; expected one of {PROFILE_MODES}")
+        self.enabled = enabled
+        self.mode = mode
+        self.sample_every = max(1, int(sample_every))
+        self.output_dir = Path(output_dir) if output_dir else Path("profiles")
+        self._samples: Deque[CycleSample] = deque(maxlen=max(1, int(buffer_size)))
+        self._cycle_count = 0
+
+    @classmethod
+    def from_config(cls, config: Any, environ: Optional[Dict[str, str]] = None) -> "CycleProfiler":
+        """
+        Builds a profiler from `config.yaml` settings. `PYTHRA_PROFILE` overrides
+        `profiling_enabled` (and `profiling_mode` when set to a mode name), and
+        `PYTHRA_PROFILE_SAMPLE_EVERY` overrides `profiling_sample_every`.
+        """
+        environ = os.environ if environ is None else environ
+        enabled = bool(config.get("profiling_enabled", False))
+        mode = config.get("profiling_mode", PROFILE_MODE_PHASES) or PROFILE_MODE_PHASES
+        sample_every = config.get("profiling_sample_every", 1) or 1
+
+        env_flag = environ.get(ENV_PROFILE, "").strip().lower()
+        if env_flag:
+            if env_flag in PROFILE_MODES:
+                enabled, mode = True, env_flag
+            else:
+                enabled = env_flag not in ("0", "false", "no", "off")
+        env_sample = environ.get(ENV_SAMPLE_EVERY, "").strip()
+        if env_sample.isdigit():
+            sample_every = int(env_sample)
+
+        return cls(
+            enabled=enabled,
+            mode=mode,
+            sample_every=sample_every,
+            buffer_size=config.get("profiling_buffer_size", 120) or 120,
+            output_dir=config.get("profiling_output_dir", "profiles"),
+        )
+
+    @contextmanager
+    def cycle(self):
+        """
+        Wraps one update cycle. Yields a `CycleSample` when this cycle is sampled,
+        otherwise a no-op stand-in with the same `phase()` API.
+        """
+        if not self.enabled:
+            yield _NULL_SAMPLE
+            return
+
+        self._cycle_count += 1
+        if (self._cycle_count - 1) % self.sample_every:
+            yield _NULL_SAMPLE
+            return
+
+        sample = CycleSample(self._cycle_count)
+        profiler = cProfile.Profile() if self.mode == PROFILE_MODE_CPROFILE else None
+        start = time.perf_counter()
+        if profiler:
+            profiler.enable()
+        try:
+            yield sample
+        finally:
+            if profiler:
+                profiler.disable()
+            sample.total_ms = (time.perf_counter() - start) * 1000.0
+            if profiler:
+                sample.prof_path = self._dump(profiler, sample.cycle)
+            self._samples.append(sample)
+
+    def _dump(self, profiler: cProfile.Profile, cycle: int) -> Optional[str]:
+        try:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            path = self.output_dir / f"cycle_{cycle:06d}.prof"
+            profiler.dump_stats(str(path))
+            return str(path)
+        except OSError as e:
+            print(f"⚠️ PyThra Profiler | Could not write profile for cycle {cycle}: {e}")
+            return None
+
+    # --- Query API ---
+
+    def recent(self, n: Optional[int] = None) -> List[CycleSample]:
+        """Returns the last `n` samples (all buffered samples if `n` is None), oldest first."""
+        samples = list(self._samples)
+        return samples if n is None else samples[-n:]
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Average and max milliseconds per phase (plus `total`) over the buffered samples."""
+        buckets: Dict[str, List[float]] = {}
+        for sample in self._samples:
+            for name, ms in sample.phases.items():
+                buckets.setdefault(name, []).append(ms)
+            buckets.setdefault("total", []).append(sample.total_ms)
+        return {
+            name: {"count": len(values), "avg_ms": sum(values) / len(values), "max_ms": max(values)}
+            for name, values in buckets.items()
+        }
+
+    def clear(self) -> None:
+        self._samples.clear()
@@ -61,9 +61,10 @@ only those elements, leaving everything else untouched.
 import uuid
 import html
 import json
-from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Literal
+from typing import Any, Dict, List, Optional, Tuple, Union, Callable, Literal, Set
 from dataclasses import dataclass, field
 from collections import defaultdict, OrderedDict
+from contextlib import contextmanager
 # near top imports if not already present
 # from collections import defaultdict
 
@@ -135,6 +136,14 @@ class IDGenerator:
 
 PatchAction = Literal["INSERT", "REMOVE", "UPDATE", "MOVE", "REPLACE"]
 
+# How unkeyed widgets are matched between two builds.
+#   "uuid":       every unkeyed widget is new (its fresh `_internal_id` never matches).
+#   "positional": unkeyed children match the old child at the same sibling index
+#                 under the same parent when their types agree (Flutter-style).
+IDENTITY_MODE_UUID = "uuid"
+IDENTITY_MODE_POSITIONAL = "positional"
+IDENTITY_MODES = (IDENTITY_MODE_UUID, IDENTITY_MODE_POSITIONAL)
+
 
 @dataclass
 class Patch:
@@ -152,12 +161,56 @@ class ReconciliationResult:
     new_rendered_map: Dict[Union[Key, str], NodeData] = field(default_factory=dict)
     active_css_details: Dict[str, Tuple[Callable, Any]] = field(default_factory=dict)
     registered_callbacks: Dict[str, Callable] = field(default_factory=dict)
+    # callback name -> keys of the widgets that use it (for Api ownership tracking).
+    # Names come from `fn.__name__`, so several widgets often share one.
+    callback_owners: Dict[str, Set[Union[Key, str]]] = field(default_factory=dict)
+    # widget key -> callback names it used before this pass but no longer does
+    stale_callbacks: Dict[Union[Key, str], Set[str]] = field(default_factory=dict)
     js_initializers: List[Dict] = field(default_factory=list)
+    # Keys of old nodes this pass removed or replaced (roots only; descendants are implied).
+    removed_keys: List[Union[Key, str]] = field(default_factory=list)
+
+
+class PropsMemo:
+    """
+    Per-pass cache of `render_props()` results and `_collect_details()` visits,
+    keyed by node identity. One memo lives for exactly one reconcile pass, so a
+    node's props are built (and its callbacks registered) once per pass no matter
+    how many code paths (update, replace, insert, Rust translation) look at it.
+    """
+
+    __slots__ = ("_props", "_collected")
+
+    def __init__(self):
+        # id(widget) -> (widget, props); the widget is held so its id can't be reused mid-pass.
+        self._props: Dict[int, Tuple["Widget", Dict[str, Any]]] = {}
+        self._collected: set = set()
+
+    def props_for(self, widget: "Widget") -> Dict[str, Any]:
+        entry = self._props.get(id(widget))
+        if entry is None:
+            entry = (widget, widget.render_props())
+            self._props[id(widget)] = entry
+        return entry[1]
+
+    def mark_collected(self, widget: "Widget") -> bool:
+        """Returns True the first time a widget is seen in this pass."""
+        wid = id(widget)
+        if wid in self._collected:
+            return False
+        self._collected.add(wid)
+        return True
 
 
 # --- The Reconciler Class ---
 class Reconciler:
-    def __init__(self):
+    def __init__(self, identity_mode: str = IDENTITY_MODE_UUID):
+        if identity_mode not in IDENTITY_MODES:
+            raise ValueError(
+                f"Unknown identity mode {identity_mode!r}; expected one of {IDENTITY_MODES}"
+            )
+        self.identity_mode = identity_mode
+        self._props_memo: Optional[PropsMemo] = None
         self.context_maps: Dict[str, Dict[Union[Key, str], NodeData]] = {"main": {}}
         self.id_generator = IDGenerator()
         self._external_js_init_queue: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
@@ -193,6 +246,26 @@ class Reconciler:
         self.context_maps.clear()
         self.context_maps['main'] = {}
 
+    @contextmanager
+    def props_pass(self):
+        """
+        Scopes a fresh PropsMemo to one reconcile pass. Nested passes (e.g. a
+        virtual list building an item mid-cycle) get their own memo and restore
+        the outer one when they finish.
+        """
+        outer = self._props_memo
+        self._props_memo = PropsMemo()
+        try:
+            yield self._props_memo
+        finally:
+            self._props_memo = outer
+
+    def _render_props(self, widget: "Widget") -> Dict[str, Any]:
+        """`widget.render_props()`, computed at most once per reconcile pass."""
+        if self._props_memo is None:
+            return widget.render_props()
+        return self._props_memo.props_for(widget)
+
     def reconcile(
         self,
         previous_map: Dict,
@@ -204,6 +277,20 @@ class Reconciler:
         """
         Compares a new widget tree with the previous state and generates patches.
         """
+        with self.props_pass():
+            return self._reconcile(
+                previous_map, new_widget_root, parent_html_id,
+                old_root_key, is_partial_reconciliation
+            )
+
+    def _reconcile(
+        self,
+        previous_map: Dict,
+        new_widget_root: Optional["Widget"],
+        parent_html_id: str,
+        old_root_key: Optional[Union[Key, str]],
+        is_partial_reconciliation: bool,
+    ) -> ReconciliationResult:
         result = ReconciliationResult()
 
         # # Auto-delegate to Rust adapter if available for better performance.
@@ -237,12 +324,16 @@ class Reconciler:
                     old_root_key = key
                     break
         
-        # Start the recursive diffing process, passing `None` as the initial parent_key.
+        # Start the recursive diffing process. A full render's root has no parent;
+        # a partially rebuilt subtree keeps its old parent so ancestry stays intact.
+        root_parent_key = None
+        if is_partial_reconciliation and old_root_key in previous_map:
+            root_parent_key = previous_map[old_root_key].get("parent_key")
         self._diff_node_recursive(
             old_node_key=old_root_key,
             new_widget=new_widget_root,
             parent_html_id=parent_html_id,
-            parent_key=None,  # The root has no parent widget.
+            parent_key=root_parent_key,
             result=result,
             previous_map=previous_map
         )
@@ -259,6 +350,7 @@ class Reconciler:
                     if state: state.dispose()
                 if data.get("html_id"):
                     result.patches.append(Patch(action="REMOVE", html_id=data["html_id"], data={}))
+                result.removed_keys.append(key)
 
         # --- Inject any external JS initializers queued by register_js_initializer ---
         queued = self._external_js_init_queue.get("main", [])  # change context if you pass context
@@ -292,7 +384,7 @@ class Reconciler:
             
         new_type = type(new_widget).__name__
         old_type = old_data.get("widget_type")
-        new_props = new_widget.render_props()
+        new_props = self._render_props(new_widget)
         self._collect_details(new_widget, new_props, result)
         
         # If the type or key has changed, it's a replacement.
@@ -300,9 +392,6 @@ class Reconciler:
             # The reconciler will treat this as a REMOVE and an INSERT
             # during the child diffing phase. We generate a specific REPLACE patch
             # to handle this more efficiently.
-            new_props = new_widget.render_props()
-            self._collect_details(new_widget, new_props, result)
-            
             # Insert the new node and its children into the map first.
             self._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map)
 
@@ -314,13 +403,23 @@ class Reconciler:
                     "new_props": new_props
                 })
             )
+            result.removed_keys.extend(old_data.get("children_keys", []))
+            return
+
+        # --- MEMOIZED PATH ---
+        # A StatelessWidget whose build was skipped still holds its old subtree,
+        # so its rendered_map entries carry over verbatim and nothing is diffed.
+        if getattr(new_widget, "_reused_build", False) and old_data.get("parent_html_id") == parent_html_id:
+            self._reuse_memoized_subtree(old_node_key, new_widget, new_props, parent_key, result, previous_map)
             return
 
         # --- UPDATE PATH ---
         html_id = old_data["html_id"]
-        new_props = new_widget.render_props()
-        self._collect_details(new_widget, new_props, result)
         old_props_from_map = old_data.get("props", {})
+        # Same widget, different handler name: its claim on the old name ends here.
+        stale_names = self._callback_names(old_props_from_map) - self._callback_names(new_props)
+        if stale_names:
+            result.stale_callbacks[new_widget_key] = stale_names
         prop_changes = self._diff_props(old_props_from_map, new_props)
 
         widget_type_name = type(new_widget).__name__
@@ -336,14 +435,16 @@ class Reconciler:
 
         # ONLY generate an UPDATE patch for renderable widgets.
         if widget_type_name not in ["StatefulWidget", "StatelessWidget"]:
-            old_props_from_map = old_data.get("props", {})
-            prop_changes = self._diff_props(old_props_from_map, new_props)
-            if prop_changes:
-                patch_data = {"props": new_props, "old_props": old_props_from_map}
-                if 'css_class' in prop_changes:
-                    patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
+            patch_data = self._update_patch_data(old_props_from_map, new_props, prop_changes)
+            if patch_data:
                 result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))
-        
+
+        # Unkeyed children take over the identity of their old counterparts
+        # *before* children_keys is recorded, so the map stays consistent.
+        self._adopt_positional_identities(
+            old_data.get("children_keys", []), new_widget.get_children(), previous_map
+        )
+
         # Update the map with the new widget data, including the parent_key.
         result.new_rendered_map[new_widget_key] = {
             "html_id": html_id,
@@ -375,7 +476,7 @@ class Reconciler:
             return
 
         html_id = self.id_generator.next_id()
-        new_props = new_widget.render_props()
+        new_props = self._render_props(new_widget)
         self._collect_details(new_widget, new_props, result)
         key = new_widget.get_unique_id()
 
@@ -551,6 +652,7 @@ class Reconciler:
         for key in keys_to_remove:
             old_data = old_key_to_data[key]
             result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+            result.removed_keys.append(key)
             if isinstance(old_data.get("widget_instance"), StatefulWidget):
                 state = old_data["widget_instance"].get_state()
                 if state: state.dispose()
@@ -578,6 +680,69 @@ class Reconciler:
                 before_id = self._find_next_stable_html_id(i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map)
                 self._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map, before_id=before_id)
 
+    def _reuse_memoized_subtree(self, old_node_key, new_widget, new_props, parent_key, result, previous_map):
+        """
+        Carries a memoized subtree's rendered_map entries into the result without
+        diffing. CSS classes and callbacks are re-collected from the stored props
+        so the cycle's bookkeeping still sees them.
+        """
+        root_entry = dict(previous_map[old_node_key])
+        root_entry.update(widget_instance=new_widget, props=new_props, parent_key=parent_key)
+        result.new_rendered_map[new_widget.get_unique_id()] = root_entry
+
+        stack = list(root_entry.get("children_keys", []))
+        while stack:
+            key = stack.pop()
+            entry = previous_map.get(key)
+            if entry is None:
+                continue
+            result.new_rendered_map[key] = entry
+            instance = entry.get("widget_instance")
+            if instance is not None:
+                self._collect_details(instance, entry.get("props", {}), result)
+            stack.extend(entry.get("children_keys", []))
+
+    def _adopt_positional_identities(
+        self,
+        old_children_keys: List[Union[Key, str]],
+        new_children_widgets: List["Widget"],
+        previous_map: Dict,
+    ) -> None:
+        """
+        In positional identity mode, gives each unkeyed new child the identity of
+        the old child at the same sibling index, provided the old child was also
+        unkeyed and of the same type. The child is then diffed (UPDATE) instead of
+        being removed and re-inserted.
+        """
+        if self.identity_mode != IDENTITY_MODE_POSITIONAL or not old_children_keys:
+            return
+
+        claimed = {w.get_unique_id() for w in new_children_widgets if w is not None}
+        for index, new_widget in enumerate(new_children_widgets):
+            if index >= len(old_children_keys):
+                break
+            if new_widget is None or new_widget.key is not None:
+                continue
+            old_key = old_children_keys[index]
+            if old_key == new_widget._internal_id or old_key in claimed:
+                continue
+            old_data = previous_map.get(old_key)
+            if not old_data or old_data.get("key") is not None:
+                continue
+            if old_data.get("widget_type") != type(new_widget).__name__:
+                continue
+
+            # A rebuilt StatefulWidget comes with its own freshly built State,
+            # so the old one is released exactly as a REMOVE would have done.
+            old_instance = old_data.get("widget_instance")
+            if isinstance(old_instance, StatefulWidget) and old_instance is not new_widget:
+                state = old_instance.get_state()
+                if state: state.dispose()
+
+            claimed.discard(new_widget._internal_id)
+            new_widget._internal_id = old_key
+            claimed.add(old_key)
+
     def _find_next_stable_html_id(self, start_index, new_widgets, old_key_map, new_rendered_map):
         for j in range(start_index, len(new_widgets)):
             key = new_widgets[j].get_unique_id()
@@ -586,7 +751,9 @@ class Reconciler:
         return None
 
     def _collect_details(self, widget, props, result):
-        """Collects CSS classes and callbacks."""
+        """Collects CSS classes and callbacks (once per widget per pass)."""
+        if self._props_memo is not None and not self._props_memo.mark_collected(widget):
+            return
         # Collect CSS classes
         css_classes = props.get("css_class", "").split()
         if hasattr(widget, "get_required_css_classes"):
@@ -607,12 +774,14 @@ class Reconciler:
                     callback_function = getattr(widget, function_prop_name)
                     if callable(callback_function):
                         result.registered_callbacks[callback_name_value] = callback_function
+                        result.callback_owners.setdefault(callback_name_value, set()).add(widget.get_unique_id())
                         # print(f"Successfully registered callback for [{callback_name_value}] with function: [{callback_function}]\n")
                 if function_prop_name == 'onDrag':
                     callback_function = props[function_prop_name]
                     # print(f'callback_function: {callback_function}')
                     if callable(callback_function):
                         result.registered_callbacks[callback_name_value] = callback_function
+                        result.callback_owners.setdefault(callback_name_value, set()).add(widget.get_unique_id())
                         # print(f"Successfully registered callback for [{callback_name_value}] with function: [{callback_function}]\n")
 
 
@@ -627,6 +796,14 @@ class Reconciler:
         #     })
         # --- END OF NEW LOGIC ---
 
+    @staticmethod
+    def _callback_names(props) -> Set[str]:
+        """The callback names a node's props refer to (`onPressedName`, `onDragName`, ...)."""
+        return {
+            value for name, value in props.items()
+            if name.endswith("Name") and isinstance(value, str) and value
+        }
+
     # ... (the rest of your file: _get_widget_render_tag, _generate_html_stub, _diff_props) ...
     # No changes are needed in the methods below this point.
 
@@ -892,6 +1069,53 @@ class Reconciler:
                 changes[key] = new_val
         return changes if changes else None
 
+    # Props the patch generators need to interpret a delta without writing them.
+    _UPDATE_CONTEXT_KEYS = ("css_class", "isDragEnded")
+
+    def _update_patch_data(self, old_props: Dict, new_props: Dict, prop_changes: Optional[Dict]) -> Optional[Dict]:
+        """
+        Builds UPDATE patch data that carries only what changed:
+
+        - `props`: the changed keys, with `style` narrowed to the changed
+          entries and `old_shared_class` added when the class was swapped.
+        - `context`: unchanged props (`css_class`, `isDragEnded`) the patch
+          generators consult to decide *where* a value goes.
+
+        Widgets with a `_style_override` (inline per-instance dimensions) also
+        diff that, since their widget_instance is excluded from `_diff_props`.
+        A `value` equal to the widget's `client_value` (text the page sent us)
+        is dropped, so typing never round-trips. Returns None when there is
+        nothing to write.
+        """
+        delta = dict(prop_changes) if prop_changes else {}
+
+        old_style, new_style = old_props.get("style"), delta.get("style")
+        if isinstance(new_style, dict) and isinstance(old_style, dict):
+            delta["style"] = {k: v for k, v in new_style.items() if old_style.get(k) != v}
+            if not delta["style"]:
+                del delta["style"]
+
+        old_widget, new_widget = old_props.get("widget_instance"), new_props.get("widget_instance")
+        if new_widget is not None and hasattr(new_widget, "_style_override"):
+            old_override = getattr(old_widget, "_style_override", {}) if old_widget is not None else {}
+            override_changes = {
+                k: v for k, v in new_widget._style_override.items() if old_override.get(k) != v
+            }
+            if override_changes:
+                delta["style"] = {**override_changes, **delta.get("style", {})}
+
+        # A value the page itself reported (TextField typing) is already on screen.
+        client_value = delta.pop("client_value", None)
+        if "value" in delta and client_value is not None and delta["value"] == client_value:
+            del delta["value"]
+
+        if not delta:
+            return None
+        if "css_class" in delta:
+            delta["old_shared_class"] = old_props.get("css_class")
+        context = {k: new_props[k] for k in self._UPDATE_CONTEXT_KEYS if k in new_props and k not in delta}
+        return {"props": delta, "context": context}
+
     def register_js_initializer(self, initializer: Dict[str, Any], context_key: str = "main") -> str:
         """
         Register an external JS initializer to be emitted on the next reconcile call.
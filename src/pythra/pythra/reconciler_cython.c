@@ -2020,12 +2020,6 @@ static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_ve
 static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
 #endif
 
-/* PySequenceContains.proto */
-static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
-    int result = PySequence_Contains(seq, item);
-    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
-}
-
 /* ListCompAppend.proto */
 #if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
 static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
@@ -2439,7 +2433,7 @@ typedef struct {
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
   __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
   PyObject *__pyx_codeobj_tab[3];
-  PyObject *__pyx_string_tab[118];
+  PyObject *__pyx_string_tab[121];
 /* #### Code section: module_state_contents ### */
 /* CommonTypesMetaclass.module_state_decls */
 PyTypeObject *__pyx_CommonTypesMetaclassType;
@@ -2501,103 +2495,106 @@ static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_stati
 #define __pyx_n_u_UPDATE __pyx_string_tab[18]
 #define __pyx_n_u_Union __pyx_string_tab[19]
 #define __pyx_n_u_action __pyx_string_tab[20]
-#define __pyx_n_u_all_keys __pyx_string_tab[21]
-#define __pyx_n_u_append __pyx_string_tab[22]
-#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[23]
-#define __pyx_n_u_before_id __pyx_string_tab[24]
-#define __pyx_n_u_c __pyx_string_tab[25]
-#define __pyx_n_u_changes __pyx_string_tab[26]
-#define __pyx_n_u_child_parent_html_id __pyx_string_tab[27]
-#define __pyx_n_u_children_keys __pyx_string_tab[28]
-#define __pyx_n_u_class_getitem __pyx_string_tab[29]
-#define __pyx_n_u_cline_in_traceback __pyx_string_tab[30]
-#define __pyx_n_u_css_class __pyx_string_tab[31]
-#define __pyx_n_u_cython_diff_children_recursive __pyx_string_tab[32]
-#define __pyx_n_u_cython_diff_node_recursive __pyx_string_tab[33]
-#define __pyx_n_u_cython_diff_props __pyx_string_tab[34]
-#define __pyx_n_u_data __pyx_string_tab[35]
-#define __pyx_n_u_diff_children_recursive __pyx_string_tab[36]
-#define __pyx_n_u_diff_node_recursive __pyx_string_tab[37]
-#define __pyx_n_u_dispose __pyx_string_tab[38]
-#define __pyx_n_u_enumerate __pyx_string_tab[39]
-#define __pyx_n_u_find_next_stable_html_id __pyx_string_tab[40]
-#define __pyx_n_u_func __pyx_string_tab[41]
-#define __pyx_n_u_generate_html_stub __pyx_string_tab[42]
-#define __pyx_n_u_get __pyx_string_tab[43]
-#define __pyx_n_u_get_children __pyx_string_tab[44]
-#define __pyx_n_u_get_state __pyx_string_tab[45]
-#define __pyx_n_u_get_unique_id __pyx_string_tab[46]
-#define __pyx_n_u_html_id __pyx_string_tab[47]
-#define __pyx_n_u_i __pyx_string_tab[48]
-#define __pyx_n_u_ignored_keys __pyx_string_tab[49]
-#define __pyx_n_u_insert_node_recursive __pyx_string_tab[50]
-#define __pyx_n_u_is_coroutine __pyx_string_tab[51]
-#define __pyx_n_u_itemBuilder __pyx_string_tab[52]
-#define __pyx_n_u_items __pyx_string_tab[53]
-#define __pyx_n_u_key __pyx_string_tab[54]
-#define __pyx_n_u_keys __pyx_string_tab[55]
-#define __pyx_n_u_keys_to_remove __pyx_string_tab[56]
-#define __pyx_n_u_last_placed_old_idx __pyx_string_tab[57]
-#define __pyx_n_u_main __pyx_string_tab[58]
-#define __pyx_n_u_module __pyx_string_tab[59]
-#define __pyx_n_u_moved_html_id __pyx_string_tab[60]
-#define __pyx_n_u_name __pyx_string_tab[61]
-#define __pyx_n_u_new_children_widgets __pyx_string_tab[62]
-#define __pyx_n_u_new_html __pyx_string_tab[63]
-#define __pyx_n_u_new_html_stub __pyx_string_tab[64]
-#define __pyx_n_u_new_key __pyx_string_tab[65]
-#define __pyx_n_u_new_key_to_widget __pyx_string_tab[66]
-#define __pyx_n_u_new_keys_set __pyx_string_tab[67]
-#define __pyx_n_u_new_props __pyx_string_tab[68]
-#define __pyx_n_u_new_rendered_map __pyx_string_tab[69]
-#define __pyx_n_u_new_type __pyx_string_tab[70]
-#define __pyx_n_u_new_val __pyx_string_tab[71]
-#define __pyx_n_u_new_widget __pyx_string_tab[72]
-#define __pyx_n_u_new_widget_key __pyx_string_tab[73]
-#define __pyx_n_u_old_children_keys __pyx_string_tab[74]
-#define __pyx_n_u_old_data __pyx_string_tab[75]
-#define __pyx_n_u_old_idx __pyx_string_tab[76]
-#define __pyx_n_u_old_key_to_data __pyx_string_tab[77]
-#define __pyx_n_u_old_key_to_index __pyx_string_tab[78]
-#define __pyx_n_u_old_keys_set __pyx_string_tab[79]
-#define __pyx_n_u_old_node_key __pyx_string_tab[80]
-#define __pyx_n_u_old_props __pyx_string_tab[81]
-#define __pyx_n_u_old_props_from_map __pyx_string_tab[82]
-#define __pyx_n_u_old_shared_class __pyx_string_tab[83]
-#define __pyx_n_u_old_type __pyx_string_tab[84]
-#define __pyx_n_u_old_val __pyx_string_tab[85]
-#define __pyx_n_u_onChanged __pyx_string_tab[86]
-#define __pyx_n_u_onDrag __pyx_string_tab[87]
-#define __pyx_n_u_onPressed __pyx_string_tab[88]
-#define __pyx_n_u_onTap __pyx_string_tab[89]
-#define __pyx_n_u_parent_html_id __pyx_string_tab[90]
-#define __pyx_n_u_parent_key __pyx_string_tab[91]
-#define __pyx_n_u_patch_data __pyx_string_tab[92]
-#define __pyx_n_u_patches __pyx_string_tab[93]
-#define __pyx_n_u_pop __pyx_string_tab[94]
-#define __pyx_n_u_previous_map __pyx_string_tab[95]
-#define __pyx_n_u_prop_changes __pyx_string_tab[96]
-#define __pyx_n_u_props __pyx_string_tab[97]
-#define __pyx_n_u_pythra_pythra_reconciler_cython __pyx_string_tab[98]
-#define __pyx_n_u_pythra_reconciler __pyx_string_tab[99]
-#define __pyx_n_u_pythra_state __pyx_string_tab[100]
-#define __pyx_n_u_qualname __pyx_string_tab[101]
-#define __pyx_n_u_reconciler __pyx_string_tab[102]
-#define __pyx_n_u_render_props __pyx_string_tab[103]
-#define __pyx_n_u_result __pyx_string_tab[104]
-#define __pyx_n_u_return __pyx_string_tab[105]
-#define __pyx_n_u_set_name __pyx_string_tab[106]
-#define __pyx_n_u_setdefault __pyx_string_tab[107]
-#define __pyx_n_u_state __pyx_string_tab[108]
-#define __pyx_n_u_test __pyx_string_tab[109]
-#define __pyx_n_u_typing __pyx_string_tab[110]
-#define __pyx_n_u_values __pyx_string_tab[111]
-#define __pyx_n_u_widget __pyx_string_tab[112]
-#define __pyx_n_u_widget_instance __pyx_string_tab[113]
-#define __pyx_n_u_widget_type __pyx_string_tab[114]
-#define __pyx_kp_b_iso88591_9_0_MYbbc_z_A_q_AYe4r_AYe5_q_4q __pyx_string_tab[115]
-#define __pyx_kp_b_iso88591_Q_T_y_1_6FlRZZ_A_AQ_y_9Cz_c_Qa __pyx_string_tab[116]
-#define __pyx_kp_b_iso88591_t_T_Q_q_4s_1G_q_fA_3a_e1_3a_Q_m __pyx_string_tab[117]
+#define __pyx_n_u_adopt_positional_identities __pyx_string_tab[21]
+#define __pyx_n_u_all_keys __pyx_string_tab[22]
+#define __pyx_n_u_append __pyx_string_tab[23]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[24]
+#define __pyx_n_u_before_id __pyx_string_tab[25]
+#define __pyx_n_u_c __pyx_string_tab[26]
+#define __pyx_n_u_changes __pyx_string_tab[27]
+#define __pyx_n_u_child_parent_html_id __pyx_string_tab[28]
+#define __pyx_n_u_children_keys __pyx_string_tab[29]
+#define __pyx_n_u_class_getitem __pyx_string_tab[30]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[31]
+#define __pyx_n_u_collect_details __pyx_string_tab[32]
+#define __pyx_n_u_cython_diff_children_recursive __pyx_string_tab[33]
+#define __pyx_n_u_cython_diff_node_recursive __pyx_string_tab[34]
+#define __pyx_n_u_cython_diff_props __pyx_string_tab[35]
+#define __pyx_n_u_data __pyx_string_tab[36]
+#define __pyx_n_u_diff_children_recursive __pyx_string_tab[37]
+#define __pyx_n_u_diff_node_recursive __pyx_string_tab[38]
+#define __pyx_n_u_dispose __pyx_string_tab[39]
+#define __pyx_n_u_enumerate __pyx_string_tab[40]
+#define __pyx_n_u_extend __pyx_string_tab[41]
+#define __pyx_n_u_find_next_stable_html_id __pyx_string_tab[42]
+#define __pyx_n_u_func __pyx_string_tab[43]
+#define __pyx_n_u_generate_html_stub __pyx_string_tab[44]
+#define __pyx_n_u_get __pyx_string_tab[45]
+#define __pyx_n_u_get_children __pyx_string_tab[46]
+#define __pyx_n_u_get_state __pyx_string_tab[47]
+#define __pyx_n_u_get_unique_id __pyx_string_tab[48]
+#define __pyx_n_u_html_id __pyx_string_tab[49]
+#define __pyx_n_u_i __pyx_string_tab[50]
+#define __pyx_n_u_ignored_keys __pyx_string_tab[51]
+#define __pyx_n_u_insert_node_recursive __pyx_string_tab[52]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[53]
+#define __pyx_n_u_itemBuilder __pyx_string_tab[54]
+#define __pyx_n_u_items __pyx_string_tab[55]
+#define __pyx_n_u_key __pyx_string_tab[56]
+#define __pyx_n_u_keys __pyx_string_tab[57]
+#define __pyx_n_u_keys_to_remove __pyx_string_tab[58]
+#define __pyx_n_u_last_placed_old_idx __pyx_string_tab[59]
+#define __pyx_n_u_main __pyx_string_tab[60]
+#define __pyx_n_u_module __pyx_string_tab[61]
+#define __pyx_n_u_moved_html_id __pyx_string_tab[62]
+#define __pyx_n_u_name __pyx_string_tab[63]
+#define __pyx_n_u_new_children_widgets __pyx_string_tab[64]
+#define __pyx_n_u_new_html __pyx_string_tab[65]
+#define __pyx_n_u_new_html_stub __pyx_string_tab[66]
+#define __pyx_n_u_new_key __pyx_string_tab[67]
+#define __pyx_n_u_new_key_to_widget __pyx_string_tab[68]
+#define __pyx_n_u_new_keys_set __pyx_string_tab[69]
+#define __pyx_n_u_new_props __pyx_string_tab[70]
+#define __pyx_n_u_new_rendered_map __pyx_string_tab[71]
+#define __pyx_n_u_new_type __pyx_string_tab[72]
+#define __pyx_n_u_new_val __pyx_string_tab[73]
+#define __pyx_n_u_new_widget __pyx_string_tab[74]
+#define __pyx_n_u_new_widget_key __pyx_string_tab[75]
+#define __pyx_n_u_old_children_keys __pyx_string_tab[76]
+#define __pyx_n_u_old_data __pyx_string_tab[77]
+#define __pyx_n_u_old_idx __pyx_string_tab[78]
+#define __pyx_n_u_old_key_to_data __pyx_string_tab[79]
+#define __pyx_n_u_old_key_to_index __pyx_string_tab[80]
+#define __pyx_n_u_old_keys_set __pyx_string_tab[81]
+#define __pyx_n_u_old_node_key __pyx_string_tab[82]
+#define __pyx_n_u_old_props __pyx_string_tab[83]
+#define __pyx_n_u_old_props_from_map __pyx_string_tab[84]
+#define __pyx_n_u_old_type __pyx_string_tab[85]
+#define __pyx_n_u_old_val __pyx_string_tab[86]
+#define __pyx_n_u_onChanged __pyx_string_tab[87]
+#define __pyx_n_u_onDrag __pyx_string_tab[88]
+#define __pyx_n_u_onPressed __pyx_string_tab[89]
+#define __pyx_n_u_onTap __pyx_string_tab[90]
+#define __pyx_n_u_parent_html_id __pyx_string_tab[91]
+#define __pyx_n_u_parent_key __pyx_string_tab[92]
+#define __pyx_n_u_patch_data __pyx_string_tab[93]
+#define __pyx_n_u_patches __pyx_string_tab[94]
+#define __pyx_n_u_pop __pyx_string_tab[95]
+#define __pyx_n_u_previous_map __pyx_string_tab[96]
+#define __pyx_n_u_prop_changes __pyx_string_tab[97]
+#define __pyx_n_u_props __pyx_string_tab[98]
+#define __pyx_n_u_pythra_pythra_reconciler_cython __pyx_string_tab[99]
+#define __pyx_n_u_pythra_reconciler __pyx_string_tab[100]
+#define __pyx_n_u_pythra_state __pyx_string_tab[101]
+#define __pyx_n_u_qualname __pyx_string_tab[102]
+#define __pyx_n_u_reconciler __pyx_string_tab[103]
+#define __pyx_n_u_removed_keys __pyx_string_tab[104]
+#define __pyx_n_u_render_props __pyx_string_tab[105]
+#define __pyx_n_u_result __pyx_string_tab[106]
+#define __pyx_n_u_return __pyx_string_tab[107]
+#define __pyx_n_u_set_name __pyx_string_tab[108]
+#define __pyx_n_u_setdefault __pyx_string_tab[109]
+#define __pyx_n_u_state __pyx_string_tab[110]
+#define __pyx_n_u_test __pyx_string_tab[111]
+#define __pyx_n_u_typing __pyx_string_tab[112]
+#define __pyx_n_u_update_patch_data __pyx_string_tab[113]
+#define __pyx_n_u_values __pyx_string_tab[114]
+#define __pyx_n_u_widget __pyx_string_tab[115]
+#define __pyx_n_u_widget_instance __pyx_string_tab[116]
+#define __pyx_n_u_widget_type __pyx_string_tab[117]
+#define __pyx_kp_b_iso88591_9_0_MYbbc_z_A_q_AYe4r_AYe5_q_4q __pyx_string_tab[118]
+#define __pyx_kp_b_iso88591_Q_T_y_1_6FlRZZ_A_AQ_y_9Cz_c_Qa __pyx_string_tab[119]
+#define __pyx_kp_b_iso88591_t_T_Q_q_4s_1G_q_fA_3a_e1_3a_Q_m __pyx_string_tab[120]
 /* #### Code section: module_state_clear ### */
 #if CYTHON_USE_MODULE_STATE
 static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
@@ -2613,7 +2610,7 @@ static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
   __Pyx_State_RemoveModule(NULL);
   #endif
   for (int i=0; i<3; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<118; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<121; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
 /* #### Code section: module_state_clear_contents ### */
 /* CommonTypesMetaclass.module_state_clear */
 Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
@@ -2637,7 +2634,7 @@ static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
   __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
   for (int i=0; i<3; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
-  for (int i=0; i<118; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<121; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
 /* #### Code section: module_state_traverse_contents ### */
 /* CommonTypesMetaclass.module_state_traverse */
 Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
@@ -3442,7 +3439,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
  *     if old_type != new_type or new_widget.key != old_data.get("key"):
  *         # This is complex replacement logic; delegate to Python implementation
  *         reconciler._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map)             # <<<<<<<<<<<<<<
- *         new_props = new_widget.render_props()
+ *         new_props = reconciler._render_props(new_widget)
  *         new_html_stub = reconciler._generate_html_stub(new_widget, old_data["html_id"], new_props)
 */
     __pyx_t_3 = __pyx_v_reconciler;
@@ -3460,16 +3457,16 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
     /* "pythra/pythra/reconciler_cython.pyx":88
  *         # This is complex replacement logic; delegate to Python implementation
  *         reconciler._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map)
- *         new_props = new_widget.render_props()             # <<<<<<<<<<<<<<
+ *         new_props = reconciler._render_props(new_widget)             # <<<<<<<<<<<<<<
  *         new_html_stub = reconciler._generate_html_stub(new_widget, old_data["html_id"], new_props)
  *         from pythra.reconciler import Patch
 */
-    __pyx_t_3 = __pyx_v_new_widget;
+    __pyx_t_3 = __pyx_v_reconciler;
     __Pyx_INCREF(__pyx_t_3);
     __pyx_t_4 = 0;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_3, NULL};
-      __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_render_props, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_v_new_widget};
+      __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_render_props, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
       if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 88, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
@@ -3479,7 +3476,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
 
     /* "pythra/pythra/reconciler_cython.pyx":89
  *         reconciler._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map)
- *         new_props = new_widget.render_props()
+ *         new_props = reconciler._render_props(new_widget)
  *         new_html_stub = reconciler._generate_html_stub(new_widget, old_data["html_id"], new_props)             # <<<<<<<<<<<<<<
  *         from pythra.reconciler import Patch
  *         result.patches.append(
@@ -3505,7 +3502,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
     __pyx_t_6 = 0;
 
     /* "pythra/pythra/reconciler_cython.pyx":90
- *         new_props = new_widget.render_props()
+ *         new_props = reconciler._render_props(new_widget)
  *         new_html_stub = reconciler._generate_html_stub(new_widget, old_data["html_id"], new_props)
  *         from pythra.reconciler import Patch             # <<<<<<<<<<<<<<
  *         result.patches.append(
@@ -3623,6 +3620,38 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
     /* "pythra/pythra/reconciler_cython.pyx":97
  *             })
  *         )
+ *         result.removed_keys.extend(old_data.get("children_keys", []))             # <<<<<<<<<<<<<<
+ *         return
+ * 
+*/
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_removed_keys); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 97, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_6 = __pyx_t_9;
+    __Pyx_INCREF(__pyx_t_6);
+    if (unlikely(__pyx_v_old_data == Py_None)) {
+      PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+      __PYX_ERR(0, 97, __pyx_L1_error)
+    }
+    __pyx_t_12 = PyList_New(0); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 97, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_12);
+    __pyx_t_11 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_12); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 97, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_t_11};
+      __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_extend, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 97, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_2);
+    }
+    __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+    /* "pythra/pythra/reconciler_cython.pyx":98
+ *         )
+ *         result.removed_keys.extend(old_data.get("children_keys", []))
  *         return             # <<<<<<<<<<<<<<
  * 
  *     # UPDATE path: types match, so check for prop changes
@@ -3640,63 +3669,82 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
 */
   }
 
-  /* "pythra/pythra/reconciler_cython.pyx":100
+  /* "pythra/pythra/reconciler_cython.pyx":101
  * 
  *     # UPDATE path: types match, so check for prop changes
  *     cdef str html_id = old_data["html_id"]             # <<<<<<<<<<<<<<
- *     new_props = new_widget.render_props()
- *     old_props_from_map = old_data.get("props", {})
+ *     # Shared per-pass memo: the Python and Rust paths see the same props object
+ *     new_props = reconciler._render_props(new_widget)
 */
   if (unlikely(__pyx_v_old_data == Py_None)) {
     PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-    __PYX_ERR(0, 100, __pyx_L1_error)
+    __PYX_ERR(0, 101, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 100, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_GetItem(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_2))) __PYX_ERR(0, 100, __pyx_L1_error)
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_2))) __PYX_ERR(0, 101, __pyx_L1_error)
   __pyx_v_html_id = ((PyObject*)__pyx_t_2);
   __pyx_t_2 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":101
- *     # UPDATE path: types match, so check for prop changes
+  /* "pythra/pythra/reconciler_cython.pyx":103
  *     cdef str html_id = old_data["html_id"]
- *     new_props = new_widget.render_props()             # <<<<<<<<<<<<<<
+ *     # Shared per-pass memo: the Python and Rust paths see the same props object
+ *     new_props = reconciler._render_props(new_widget)             # <<<<<<<<<<<<<<
+ *     reconciler._collect_details(new_widget, new_props, result)
  *     old_props_from_map = old_data.get("props", {})
- * 
 */
-  __pyx_t_6 = __pyx_v_new_widget;
-  __Pyx_INCREF(__pyx_t_6);
+  __pyx_t_9 = __pyx_v_reconciler;
+  __Pyx_INCREF(__pyx_t_9);
   __pyx_t_4 = 0;
   {
-    PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
-    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_render_props, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-    __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 101, __pyx_L1_error)
+    PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_v_new_widget};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_render_props, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 103, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
   __pyx_v_new_props = __pyx_t_2;
   __pyx_t_2 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":102
- *     cdef str html_id = old_data["html_id"]
- *     new_props = new_widget.render_props()
+  /* "pythra/pythra/reconciler_cython.pyx":104
+ *     # Shared per-pass memo: the Python and Rust paths see the same props object
+ *     new_props = reconciler._render_props(new_widget)
+ *     reconciler._collect_details(new_widget, new_props, result)             # <<<<<<<<<<<<<<
+ *     old_props_from_map = old_data.get("props", {})
+ * 
+*/
+  __pyx_t_9 = __pyx_v_reconciler;
+  __Pyx_INCREF(__pyx_t_9);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[4] = {__pyx_t_9, __pyx_v_new_widget, __pyx_v_new_props, __pyx_v_result};
+    __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_collect_details, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 104, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "pythra/pythra/reconciler_cython.pyx":105
+ *     new_props = reconciler._render_props(new_widget)
+ *     reconciler._collect_details(new_widget, new_props, result)
  *     old_props_from_map = old_data.get("props", {})             # <<<<<<<<<<<<<<
  * 
  *     # Use cython_diff_props for fast prop diffing
 */
   if (unlikely(__pyx_v_old_data == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-    __PYX_ERR(0, 102, __pyx_L1_error)
+    __PYX_ERR(0, 105, __pyx_L1_error)
   }
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 102, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 105, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  __pyx_t_6 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_props, __pyx_t_2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 102, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_9 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_props, __pyx_t_2); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 105, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  __pyx_v_old_props_from_map = __pyx_t_6;
-  __pyx_t_6 = 0;
+  __pyx_v_old_props_from_map = __pyx_t_9;
+  __pyx_t_9 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":105
+  /* "pythra/pythra/reconciler_cython.pyx":108
  * 
  *     # Use cython_diff_props for fast prop diffing
  *     prop_changes = cython_diff_props(old_props_from_map, new_props)             # <<<<<<<<<<<<<<
@@ -3704,210 +3752,222 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
  *     # For non-renderable widgets, create UPDATE patch if props changed
 */
   __pyx_t_2 = NULL;
-  __Pyx_GetModuleGlobalName(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_cython_diff_props); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 105, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GetModuleGlobalName(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_cython_diff_props); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 108, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
   __pyx_t_4 = 1;
   #if CYTHON_UNPACK_METHODS
-  if (unlikely(PyMethod_Check(__pyx_t_9))) {
-    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_9);
+  if (unlikely(PyMethod_Check(__pyx_t_11))) {
+    __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_11);
     assert(__pyx_t_2);
-    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_9);
+    PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_11);
     __Pyx_INCREF(__pyx_t_2);
     __Pyx_INCREF(__pyx__function);
-    __Pyx_DECREF_SET(__pyx_t_9, __pyx__function);
+    __Pyx_DECREF_SET(__pyx_t_11, __pyx__function);
     __pyx_t_4 = 0;
   }
   #endif
   {
     PyObject *__pyx_callargs[3] = {__pyx_t_2, __pyx_v_old_props_from_map, __pyx_v_new_props};
-    __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_9, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __pyx_t_9 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_11, __pyx_callargs+__pyx_t_4, (3-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 105, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 108, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
   }
-  __pyx_v_prop_changes = __pyx_t_6;
-  __pyx_t_6 = 0;
+  __pyx_v_prop_changes = __pyx_t_9;
+  __pyx_t_9 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":108
+  /* "pythra/pythra/reconciler_cython.pyx":111
  * 
  *     # For non-renderable widgets, create UPDATE patch if props changed
  *     if new_type not in ["StatefulWidget", "StatelessWidget"]:             # <<<<<<<<<<<<<<
- *         if prop_changes:
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+ *         if patch_data:
 */
   __Pyx_INCREF(__pyx_v_new_type);
   __pyx_t_14 = __pyx_v_new_type;
-  __pyx_t_5 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatefulWidget, Py_NE)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_t_5 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatefulWidget, Py_NE)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 111, __pyx_L1_error)
   if (__pyx_t_5) {
   } else {
     __pyx_t_1 = __pyx_t_5;
     goto __pyx_L9_bool_binop_done;
   }
-  __pyx_t_5 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatelessWidget, Py_NE)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 108, __pyx_L1_error)
+  __pyx_t_5 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatelessWidget, Py_NE)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 111, __pyx_L1_error)
   __pyx_t_1 = __pyx_t_5;
   __pyx_L9_bool_binop_done:;
   __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
   __pyx_t_5 = __pyx_t_1;
   if (__pyx_t_5) {
 
-    /* "pythra/pythra/reconciler_cython.pyx":109
+    /* "pythra/pythra/reconciler_cython.pyx":112
  *     # For non-renderable widgets, create UPDATE patch if props changed
  *     if new_type not in ["StatefulWidget", "StatelessWidget"]:
- *         if prop_changes:             # <<<<<<<<<<<<<<
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
- *             if 'css_class' in prop_changes:
-*/
-    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_prop_changes); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 109, __pyx_L1_error)
-    if (__pyx_t_5) {
-
-      /* "pythra/pythra/reconciler_cython.pyx":110
- *     if new_type not in ["StatefulWidget", "StatelessWidget"]:
- *         if prop_changes:
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}             # <<<<<<<<<<<<<<
- *             if 'css_class' in prop_changes:
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
-*/
-      __pyx_t_6 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 110, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
-      if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_props, __pyx_v_new_props) < (0)) __PYX_ERR(0, 110, __pyx_L1_error)
-      if (PyDict_SetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_old_props, __pyx_v_old_props_from_map) < (0)) __PYX_ERR(0, 110, __pyx_L1_error)
-      __pyx_v_patch_data = ((PyObject*)__pyx_t_6);
-      __pyx_t_6 = 0;
-
-      /* "pythra/pythra/reconciler_cython.pyx":111
- *         if prop_changes:
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
- *             if 'css_class' in prop_changes:             # <<<<<<<<<<<<<<
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)             # <<<<<<<<<<<<<<
+ *         if patch_data:
  *             from pythra.reconciler import Patch
 */
-      __pyx_t_5 = (__Pyx_PySequence_ContainsTF(__pyx_mstate_global->__pyx_n_u_css_class, __pyx_v_prop_changes, Py_EQ)); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 111, __pyx_L1_error)
-      if (__pyx_t_5) {
+    __pyx_t_11 = __pyx_v_reconciler;
+    __Pyx_INCREF(__pyx_t_11);
+    __pyx_t_4 = 0;
+    {
+      PyObject *__pyx_callargs[4] = {__pyx_t_11, __pyx_v_old_props_from_map, __pyx_v_new_props, __pyx_v_prop_changes};
+      __pyx_t_9 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_update_patch_data, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
+      if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 112, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
+    }
+    __pyx_v_patch_data = __pyx_t_9;
+    __pyx_t_9 = 0;
 
-        /* "pythra/pythra/reconciler_cython.pyx":112
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
- *             if 'css_class' in prop_changes:
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")             # <<<<<<<<<<<<<<
+    /* "pythra/pythra/reconciler_cython.pyx":113
+ *     if new_type not in ["StatefulWidget", "StatelessWidget"]:
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+ *         if patch_data:             # <<<<<<<<<<<<<<
  *             from pythra.reconciler import Patch
  *             result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))
 */
-        __pyx_t_9 = __pyx_v_old_props_from_map;
-        __Pyx_INCREF(__pyx_t_9);
-        __pyx_t_4 = 0;
-        {
-          PyObject *__pyx_callargs[2] = {__pyx_t_9, __pyx_mstate_global->__pyx_n_u_css_class};
-          __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_4, (2-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-          __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
-          if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 112, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_6);
-        }
-        __pyx_t_9 = __Pyx_PyDict_GetItem(__pyx_v_patch_data, __pyx_mstate_global->__pyx_n_u_props); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 112, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
-        if (unlikely((PyObject_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_old_shared_class, __pyx_t_6) < 0))) __PYX_ERR(0, 112, __pyx_L1_error)
-        __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
-        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-
-        /* "pythra/pythra/reconciler_cython.pyx":111
- *         if prop_changes:
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
- *             if 'css_class' in prop_changes:             # <<<<<<<<<<<<<<
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
- *             from pythra.reconciler import Patch
-*/
-      }
+    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_v_patch_data); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 113, __pyx_L1_error)
+    if (__pyx_t_5) {
 
-      /* "pythra/pythra/reconciler_cython.pyx":113
- *             if 'css_class' in prop_changes:
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
+      /* "pythra/pythra/reconciler_cython.pyx":114
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+ *         if patch_data:
  *             from pythra.reconciler import Patch             # <<<<<<<<<<<<<<
  *             result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))
  * 
 */
       {
         PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Patch};
-        __pyx_t_7 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_reconciler, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 113, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_reconciler, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 114, __pyx_L1_error)
       }
-      __pyx_t_6 = __pyx_t_7;
-      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_9 = __pyx_t_7;
+      __Pyx_GOTREF(__pyx_t_9);
       {
         PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Patch};
         __pyx_t_8 = 0; {
-          __pyx_t_9 = __Pyx_ImportFrom(__pyx_t_6, __pyx_imported_names[__pyx_t_8]); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 113, __pyx_L1_error)
-          __Pyx_GOTREF(__pyx_t_9);
+          __pyx_t_11 = __Pyx_ImportFrom(__pyx_t_9, __pyx_imported_names[__pyx_t_8]); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 114, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_11);
           switch (__pyx_t_8) {
             case 0:
-            __Pyx_INCREF(__pyx_t_9);
-            __pyx_v_Patch = __pyx_t_9;
+            __Pyx_INCREF(__pyx_t_11);
+            __pyx_v_Patch = __pyx_t_11;
             break;
             default:;
           }
-          __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+          __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
         }
       }
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":114
- *                 patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
+      /* "pythra/pythra/reconciler_cython.pyx":115
+ *         if patch_data:
  *             from pythra.reconciler import Patch
  *             result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))             # <<<<<<<<<<<<<<
  * 
- *     # Update the rendered map
+ *     # Unkeyed children adopt their old identities before children_keys is recorded
 */
-      __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 114, __pyx_L1_error)
-      __Pyx_GOTREF(__pyx_t_6);
+      __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 115, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_9);
       __pyx_t_2 = NULL;
       __Pyx_INCREF(__pyx_v_Patch);
-      __pyx_t_12 = __pyx_v_Patch; 
+      __pyx_t_6 = __pyx_v_Patch; 
       __pyx_t_4 = 1;
       #if CYTHON_UNPACK_METHODS
-      if (unlikely(PyMethod_Check(__pyx_t_12))) {
-        __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_12);
+      if (unlikely(PyMethod_Check(__pyx_t_6))) {
+        __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_6);
         assert(__pyx_t_2);
-        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_12);
+        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_6);
         __Pyx_INCREF(__pyx_t_2);
         __Pyx_INCREF(__pyx__function);
-        __Pyx_DECREF_SET(__pyx_t_12, __pyx__function);
+        __Pyx_DECREF_SET(__pyx_t_6, __pyx__function);
         __pyx_t_4 = 0;
       }
       #endif
       {
         PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 3 : 0)] = {__pyx_t_2, NULL};
-        __pyx_t_11 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 114, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_11);
-        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_action, __pyx_mstate_global->__pyx_n_u_UPDATE, __pyx_t_11, __pyx_callargs+1, 0) < (0)) __PYX_ERR(0, 114, __pyx_L1_error)
-        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_html_id, __pyx_v_html_id, __pyx_t_11, __pyx_callargs+1, 1) < (0)) __PYX_ERR(0, 114, __pyx_L1_error)
-        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_data, __pyx_v_patch_data, __pyx_t_11, __pyx_callargs+1, 2) < (0)) __PYX_ERR(0, 114, __pyx_L1_error)
-        __pyx_t_9 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_12, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_11);
+        __pyx_t_12 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 115, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_12);
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_action, __pyx_mstate_global->__pyx_n_u_UPDATE, __pyx_t_12, __pyx_callargs+1, 0) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_html_id, __pyx_v_html_id, __pyx_t_12, __pyx_callargs+1, 1) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_data, __pyx_v_patch_data, __pyx_t_12, __pyx_callargs+1, 2) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+        __pyx_t_11 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_6, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (__pyx_t_4*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_12);
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
         __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-        if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 114, __pyx_L1_error)
-        __Pyx_GOTREF(__pyx_t_9);
+        __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+        if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 115, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_11);
       }
-      __pyx_t_13 = __Pyx_PyObject_Append(__pyx_t_6, __pyx_t_9); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 114, __pyx_L1_error)
-      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      __pyx_t_13 = __Pyx_PyObject_Append(__pyx_t_9, __pyx_t_11); if (unlikely(__pyx_t_13 == ((int)-1))) __PYX_ERR(0, 115, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":109
- *     # For non-renderable widgets, create UPDATE patch if props changed
+      /* "pythra/pythra/reconciler_cython.pyx":113
  *     if new_type not in ["StatefulWidget", "StatelessWidget"]:
- *         if prop_changes:             # <<<<<<<<<<<<<<
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
- *             if 'css_class' in prop_changes:
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+ *         if patch_data:             # <<<<<<<<<<<<<<
+ *             from pythra.reconciler import Patch
+ *             result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))
 */
     }
 
-    /* "pythra/pythra/reconciler_cython.pyx":108
+    /* "pythra/pythra/reconciler_cython.pyx":111
  * 
  *     # For non-renderable widgets, create UPDATE patch if props changed
  *     if new_type not in ["StatefulWidget", "StatelessWidget"]:             # <<<<<<<<<<<<<<
- *         if prop_changes:
- *             patch_data = {"props": new_props, "old_props": old_props_from_map}
+ *         patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+ *         if patch_data:
 */
   }
 
-  /* "pythra/pythra/reconciler_cython.pyx":117
+  /* "pythra/pythra/reconciler_cython.pyx":118
+ * 
+ *     # Unkeyed children adopt their old identities before children_keys is recorded
+ *     reconciler._adopt_positional_identities(             # <<<<<<<<<<<<<<
+ *         old_data.get("children_keys", []), new_widget.get_children(), previous_map
+ *     )
+*/
+  __pyx_t_9 = __pyx_v_reconciler;
+  __Pyx_INCREF(__pyx_t_9);
+
+  /* "pythra/pythra/reconciler_cython.pyx":119
+ *     # Unkeyed children adopt their old identities before children_keys is recorded
+ *     reconciler._adopt_positional_identities(
+ *         old_data.get("children_keys", []), new_widget.get_children(), previous_map             # <<<<<<<<<<<<<<
+ *     )
+ * 
+*/
+  if (unlikely(__pyx_v_old_data == Py_None)) {
+    PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
+    __PYX_ERR(0, 119, __pyx_L1_error)
+  }
+  __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_12 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_6); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_12);
+  __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+  __pyx_t_2 = __pyx_v_new_widget;
+  __Pyx_INCREF(__pyx_t_2);
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
+    __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_children, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 119, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+  }
+  __pyx_t_4 = 0;
+  {
+    PyObject *__pyx_callargs[4] = {__pyx_t_9, __pyx_t_12, __pyx_t_6, __pyx_v_previous_map};
+    __pyx_t_11 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_adopt_positional_identities, __pyx_callargs+__pyx_t_4, (4-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 118, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
+  }
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+
+  /* "pythra/pythra/reconciler_cython.pyx":123
  * 
  *     # Update the rendered map
  *     new_widget_key = new_widget.get_unique_id()             # <<<<<<<<<<<<<<
@@ -3919,146 +3979,146 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
   __pyx_t_4 = 0;
   {
     PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
-    __pyx_t_9 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __pyx_t_11 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 117, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
+    if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 123, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
   }
-  __pyx_v_new_widget_key = __pyx_t_9;
-  __pyx_t_9 = 0;
+  __pyx_v_new_widget_key = __pyx_t_11;
+  __pyx_t_11 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":119
+  /* "pythra/pythra/reconciler_cython.pyx":125
  *     new_widget_key = new_widget.get_unique_id()
  *     result.new_rendered_map[new_widget_key] = {
  *         "html_id": html_id,             # <<<<<<<<<<<<<<
  *         "widget_type": new_type,
  *         "key": new_widget.key,
 */
-  __pyx_t_9 = __Pyx_PyDict_NewPresized(8); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 119, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_9);
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_html_id, __pyx_v_html_id) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  __pyx_t_11 = __Pyx_PyDict_NewPresized(8); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 125, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_11);
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_html_id, __pyx_v_html_id) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "pythra/pythra/reconciler_cython.pyx":120
+  /* "pythra/pythra/reconciler_cython.pyx":126
  *     result.new_rendered_map[new_widget_key] = {
  *         "html_id": html_id,
  *         "widget_type": new_type,             # <<<<<<<<<<<<<<
  *         "key": new_widget.key,
  *         "widget_instance": new_widget,
 */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_widget_type, __pyx_v_new_type) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_widget_type, __pyx_v_new_type) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "pythra/pythra/reconciler_cython.pyx":121
+  /* "pythra/pythra/reconciler_cython.pyx":127
  *         "html_id": html_id,
  *         "widget_type": new_type,
  *         "key": new_widget.key,             # <<<<<<<<<<<<<<
  *         "widget_instance": new_widget,
  *         "props": new_props,
 */
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_new_widget, __pyx_mstate_global->__pyx_n_u_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 121, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_new_widget, __pyx_mstate_global->__pyx_n_u_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 127, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_key, __pyx_t_6) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_key, __pyx_t_6) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":122
+  /* "pythra/pythra/reconciler_cython.pyx":128
  *         "widget_type": new_type,
  *         "key": new_widget.key,
  *         "widget_instance": new_widget,             # <<<<<<<<<<<<<<
  *         "props": new_props,
  *         "parent_html_id": parent_html_id,
 */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_widget_instance, __pyx_v_new_widget) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_widget_instance, __pyx_v_new_widget) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "pythra/pythra/reconciler_cython.pyx":123
+  /* "pythra/pythra/reconciler_cython.pyx":129
  *         "key": new_widget.key,
  *         "widget_instance": new_widget,
  *         "props": new_props,             # <<<<<<<<<<<<<<
  *         "parent_html_id": parent_html_id,
  *         "parent_key": parent_key,
 */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_props, __pyx_v_new_props) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_props, __pyx_v_new_props) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "pythra/pythra/reconciler_cython.pyx":124
+  /* "pythra/pythra/reconciler_cython.pyx":130
  *         "widget_instance": new_widget,
  *         "props": new_props,
  *         "parent_html_id": parent_html_id,             # <<<<<<<<<<<<<<
  *         "parent_key": parent_key,
  *         "children_keys": [c.get_unique_id() for c in new_widget.get_children()],
 */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_parent_html_id, __pyx_v_parent_html_id) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_parent_html_id, __pyx_v_parent_html_id) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
 
-  /* "pythra/pythra/reconciler_cython.pyx":125
+  /* "pythra/pythra/reconciler_cython.pyx":131
  *         "props": new_props,
  *         "parent_html_id": parent_html_id,
  *         "parent_key": parent_key,             # <<<<<<<<<<<<<<
  *         "children_keys": [c.get_unique_id() for c in new_widget.get_children()],
  *     }
 */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_parent_key, __pyx_v_parent_key) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_parent_key, __pyx_v_parent_key) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
   { /* enter inner scope */
 
-    /* "pythra/pythra/reconciler_cython.pyx":126
+    /* "pythra/pythra/reconciler_cython.pyx":132
  *         "parent_html_id": parent_html_id,
  *         "parent_key": parent_key,
  *         "children_keys": [c.get_unique_id() for c in new_widget.get_children()],             # <<<<<<<<<<<<<<
  *     }
  * 
 */
-    __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 126, __pyx_L15_error)
+    __pyx_t_6 = PyList_New(0); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 132, __pyx_L14_error)
     __Pyx_GOTREF(__pyx_t_6);
-    __pyx_t_11 = __pyx_v_new_widget;
-    __Pyx_INCREF(__pyx_t_11);
+    __pyx_t_9 = __pyx_v_new_widget;
+    __Pyx_INCREF(__pyx_t_9);
     __pyx_t_4 = 0;
     {
-      PyObject *__pyx_callargs[2] = {__pyx_t_11, NULL};
+      PyObject *__pyx_callargs[2] = {__pyx_t_9, NULL};
       __pyx_t_12 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_children, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
-      __Pyx_XDECREF(__pyx_t_11); __pyx_t_11 = 0;
-      if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 126, __pyx_L15_error)
+      __Pyx_XDECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 132, __pyx_L14_error)
       __Pyx_GOTREF(__pyx_t_12);
     }
     if (likely(PyList_CheckExact(__pyx_t_12)) || PyTuple_CheckExact(__pyx_t_12)) {
-      __pyx_t_11 = __pyx_t_12; __Pyx_INCREF(__pyx_t_11);
+      __pyx_t_9 = __pyx_t_12; __Pyx_INCREF(__pyx_t_9);
       __pyx_t_8 = 0;
       __pyx_t_15 = NULL;
     } else {
-      __pyx_t_8 = -1; __pyx_t_11 = PyObject_GetIter(__pyx_t_12); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 126, __pyx_L15_error)
-      __Pyx_GOTREF(__pyx_t_11);
-      __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_11); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 126, __pyx_L15_error)
+      __pyx_t_8 = -1; __pyx_t_9 = PyObject_GetIter(__pyx_t_12); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 132, __pyx_L14_error)
+      __Pyx_GOTREF(__pyx_t_9);
+      __pyx_t_15 = (CYTHON_COMPILING_IN_LIMITED_API) ? PyIter_Next : __Pyx_PyObject_GetIterNextFunc(__pyx_t_9); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 132, __pyx_L14_error)
     }
     __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
     for (;;) {
       if (likely(!__pyx_t_15)) {
-        if (likely(PyList_CheckExact(__pyx_t_11))) {
+        if (likely(PyList_CheckExact(__pyx_t_9))) {
           {
-            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_11);
+            Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_9);
             #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 126, __pyx_L15_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 132, __pyx_L14_error)
             #endif
             if (__pyx_t_8 >= __pyx_temp) break;
           }
-          __pyx_t_12 = __Pyx_PyList_GetItemRefFast(__pyx_t_11, __pyx_t_8, __Pyx_ReferenceSharing_OwnStrongReference);
+          __pyx_t_12 = __Pyx_PyList_GetItemRefFast(__pyx_t_9, __pyx_t_8, __Pyx_ReferenceSharing_OwnStrongReference);
           ++__pyx_t_8;
         } else {
           {
-            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_11);
+            Py_ssize_t __pyx_temp = __Pyx_PyTuple_GET_SIZE(__pyx_t_9);
             #if !CYTHON_ASSUME_SAFE_SIZE
-            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 126, __pyx_L15_error)
+            if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 132, __pyx_L14_error)
             #endif
             if (__pyx_t_8 >= __pyx_temp) break;
           }
           #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
-          __pyx_t_12 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_11, __pyx_t_8));
+          __pyx_t_12 = __Pyx_NewRef(PyTuple_GET_ITEM(__pyx_t_9, __pyx_t_8));
           #else
-          __pyx_t_12 = __Pyx_PySequence_ITEM(__pyx_t_11, __pyx_t_8);
+          __pyx_t_12 = __Pyx_PySequence_ITEM(__pyx_t_9, __pyx_t_8);
           #endif
           ++__pyx_t_8;
         }
-        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 126, __pyx_L15_error)
+        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 132, __pyx_L14_error)
       } else {
-        __pyx_t_12 = __pyx_t_15(__pyx_t_11);
+        __pyx_t_12 = __pyx_t_15(__pyx_t_9);
         if (unlikely(!__pyx_t_12)) {
           PyObject* exc_type = PyErr_Occurred();
           if (exc_type) {
-            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 126, __pyx_L15_error)
+            if (unlikely(!__Pyx_PyErr_GivenExceptionMatches(exc_type, PyExc_StopIteration))) __PYX_ERR(0, 132, __pyx_L14_error)
             PyErr_Clear();
           }
           break;
@@ -4074,37 +4134,37 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
         PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
         __pyx_t_12 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 126, __pyx_L15_error)
+        if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 132, __pyx_L14_error)
         __Pyx_GOTREF(__pyx_t_12);
       }
-      if (unlikely(__Pyx_ListComp_Append(__pyx_t_6, (PyObject*)__pyx_t_12))) __PYX_ERR(0, 126, __pyx_L15_error)
+      if (unlikely(__Pyx_ListComp_Append(__pyx_t_6, (PyObject*)__pyx_t_12))) __PYX_ERR(0, 132, __pyx_L14_error)
       __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
     }
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __Pyx_XDECREF(__pyx_7genexpr__pyx_v_c); __pyx_7genexpr__pyx_v_c = 0;
-    goto __pyx_L19_exit_scope;
-    __pyx_L15_error:;
+    goto __pyx_L18_exit_scope;
+    __pyx_L14_error:;
     __Pyx_XDECREF(__pyx_7genexpr__pyx_v_c); __pyx_7genexpr__pyx_v_c = 0;
     goto __pyx_L1_error;
-    __pyx_L19_exit_scope:;
+    __pyx_L18_exit_scope:;
   } /* exit inner scope */
-  if (PyDict_SetItem(__pyx_t_9, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_6) < (0)) __PYX_ERR(0, 119, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_11, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_6) < (0)) __PYX_ERR(0, 125, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":118
+  /* "pythra/pythra/reconciler_cython.pyx":124
  *     # Update the rendered map
  *     new_widget_key = new_widget.get_unique_id()
  *     result.new_rendered_map[new_widget_key] = {             # <<<<<<<<<<<<<<
  *         "html_id": html_id,
  *         "widget_type": new_type,
 */
-  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 118, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  if (unlikely((PyObject_SetItem(__pyx_t_6, __pyx_v_new_widget_key, __pyx_t_9) < 0))) __PYX_ERR(0, 118, __pyx_L1_error)
+  if (unlikely((PyObject_SetItem(__pyx_t_6, __pyx_v_new_widget_key, __pyx_t_11) < 0))) __PYX_ERR(0, 124, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":130
+  /* "pythra/pythra/reconciler_cython.pyx":136
  * 
  *     # Recurse on children
  *     child_parent_html_id = html_id if new_type not in ["StatefulWidget", "StatelessWidget"] else parent_html_id             # <<<<<<<<<<<<<<
@@ -4113,28 +4173,28 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
 */
   __Pyx_INCREF(__pyx_v_new_type);
   __pyx_t_14 = __pyx_v_new_type;
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatefulWidget, Py_NE)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatefulWidget, Py_NE)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 136, __pyx_L1_error)
   if (__pyx_t_1) {
   } else {
     __pyx_t_5 = __pyx_t_1;
-    goto __pyx_L20_bool_binop_done;
+    goto __pyx_L19_bool_binop_done;
   }
-  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatelessWidget, Py_NE)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 130, __pyx_L1_error)
+  __pyx_t_1 = (__Pyx_PyUnicode_Equals(__pyx_t_14, __pyx_mstate_global->__pyx_n_u_StatelessWidget, Py_NE)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 136, __pyx_L1_error)
   __pyx_t_5 = __pyx_t_1;
-  __pyx_L20_bool_binop_done:;
+  __pyx_L19_bool_binop_done:;
   __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
   __pyx_t_1 = __pyx_t_5;
   if (__pyx_t_1) {
     __Pyx_INCREF(__pyx_v_html_id);
-    __pyx_t_9 = __pyx_v_html_id;
+    __pyx_t_11 = __pyx_v_html_id;
   } else {
     __Pyx_INCREF(__pyx_v_parent_html_id);
-    __pyx_t_9 = __pyx_v_parent_html_id;
+    __pyx_t_11 = __pyx_v_parent_html_id;
   }
-  __pyx_v_child_parent_html_id = ((PyObject*)__pyx_t_9);
-  __pyx_t_9 = 0;
+  __pyx_v_child_parent_html_id = ((PyObject*)__pyx_t_11);
+  __pyx_t_11 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":131
+  /* "pythra/pythra/reconciler_cython.pyx":137
  *     # Recurse on children
  *     child_parent_html_id = html_id if new_type not in ["StatefulWidget", "StatelessWidget"] else parent_html_id
  *     reconciler._diff_children_recursive(             # <<<<<<<<<<<<<<
@@ -4144,7 +4204,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
   __pyx_t_6 = __pyx_v_reconciler;
   __Pyx_INCREF(__pyx_t_6);
 
-  /* "pythra/pythra/reconciler_cython.pyx":132
+  /* "pythra/pythra/reconciler_cython.pyx":138
  *     child_parent_html_id = html_id if new_type not in ["StatefulWidget", "StatelessWidget"] else parent_html_id
  *     reconciler._diff_children_recursive(
  *         old_data.get("children_keys", []),             # <<<<<<<<<<<<<<
@@ -4153,15 +4213,15 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
 */
   if (unlikely(__pyx_v_old_data == Py_None)) {
     PyErr_Format(PyExc_AttributeError, "'NoneType' object has no attribute '%.30s'", "get");
-    __PYX_ERR(0, 132, __pyx_L1_error)
+    __PYX_ERR(0, 138, __pyx_L1_error)
   }
-  __pyx_t_11 = PyList_New(0); if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 132, __pyx_L1_error)
-  __Pyx_GOTREF(__pyx_t_11);
-  __pyx_t_12 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_11); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 132, __pyx_L1_error)
+  __pyx_t_9 = PyList_New(0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 138, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __pyx_t_12 = __Pyx_PyDict_GetItemDefault(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_children_keys, __pyx_t_9); if (unlikely(!__pyx_t_12)) __PYX_ERR(0, 138, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_12);
-  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":133
+  /* "pythra/pythra/reconciler_cython.pyx":139
  *     reconciler._diff_children_recursive(
  *         old_data.get("children_keys", []),
  *         new_widget.get_children(),             # <<<<<<<<<<<<<<
@@ -4173,13 +4233,13 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
   __pyx_t_4 = 0;
   {
     PyObject *__pyx_callargs[2] = {__pyx_t_2, NULL};
-    __pyx_t_11 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_children, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    __pyx_t_9 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_children, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 133, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_11);
+    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 139, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
   }
 
-  /* "pythra/pythra/reconciler_cython.pyx":135
+  /* "pythra/pythra/reconciler_cython.pyx":141
  *         new_widget.get_children(),
  *         child_parent_html_id,
  *         new_widget.get_unique_id(),             # <<<<<<<<<<<<<<
@@ -4193,11 +4253,11 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
     PyObject *__pyx_callargs[2] = {__pyx_t_10, NULL};
     __pyx_t_2 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_4, (1-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_10); __pyx_t_10 = 0;
-    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 135, __pyx_L1_error)
+    if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_2);
   }
 
-  /* "pythra/pythra/reconciler_cython.pyx":137
+  /* "pythra/pythra/reconciler_cython.pyx":143
  *         new_widget.get_unique_id(),
  *         result,
  *         previous_map,             # <<<<<<<<<<<<<<
@@ -4206,16 +4266,16 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
 */
   __pyx_t_4 = 0;
   {
-    PyObject *__pyx_callargs[7] = {__pyx_t_6, __pyx_t_12, __pyx_t_11, __pyx_v_child_parent_html_id, __pyx_t_2, __pyx_v_result, __pyx_v_previous_map};
-    __pyx_t_9 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_diff_children_recursive, __pyx_callargs+__pyx_t_4, (7-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+    PyObject *__pyx_callargs[7] = {__pyx_t_6, __pyx_t_12, __pyx_t_9, __pyx_v_child_parent_html_id, __pyx_t_2, __pyx_v_result, __pyx_v_previous_map};
+    __pyx_t_11 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_diff_children_recursive, __pyx_callargs+__pyx_t_4, (7-__pyx_t_4) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
     __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_12); __pyx_t_12 = 0;
-    __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
     __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-    if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 131, __pyx_L1_error)
-    __Pyx_GOTREF(__pyx_t_9);
+    if (unlikely(!__pyx_t_11)) __PYX_ERR(0, 137, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_11);
   }
-  __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+  __Pyx_DECREF(__pyx_t_11); __pyx_t_11 = 0;
 
   /* "pythra/pythra/reconciler_cython.pyx":53
  * 
@@ -4258,7 +4318,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_2cython_diff_node_
   return __pyx_r;
 }
 
-/* "pythra/pythra/reconciler_cython.pyx":141
+/* "pythra/pythra/reconciler_cython.pyx":147
  * 
  * 
  * def cython_diff_children_recursive(             # <<<<<<<<<<<<<<
@@ -4312,62 +4372,62 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   {
     PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_old_children_keys,&__pyx_mstate_global->__pyx_n_u_new_children_widgets,&__pyx_mstate_global->__pyx_n_u_parent_html_id,&__pyx_mstate_global->__pyx_n_u_parent_key,&__pyx_mstate_global->__pyx_n_u_result,&__pyx_mstate_global->__pyx_n_u_previous_map,&__pyx_mstate_global->__pyx_n_u_reconciler,0};
     const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
-    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 141, __pyx_L3_error)
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 147, __pyx_L3_error)
     if (__pyx_kwds_len > 0) {
       switch (__pyx_nargs) {
         case  7:
         values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  6:
         values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  5:
         values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  4:
         values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  3:
         values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  2:
         values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  1:
         values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 147, __pyx_L3_error)
         CYTHON_FALLTHROUGH;
         case  0: break;
         default: goto __pyx_L5_argtuple_error;
       }
       const Py_ssize_t kwd_pos_args = __pyx_nargs;
-      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "cython_diff_children_recursive", 0) < (0)) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "cython_diff_children_recursive", 0) < (0)) __PYX_ERR(0, 147, __pyx_L3_error)
       for (Py_ssize_t i = __pyx_nargs; i < 7; i++) {
-        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("cython_diff_children_recursive", 1, 7, 7, i); __PYX_ERR(0, 141, __pyx_L3_error) }
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("cython_diff_children_recursive", 1, 7, 7, i); __PYX_ERR(0, 147, __pyx_L3_error) }
       }
     } else if (unlikely(__pyx_nargs != 7)) {
       goto __pyx_L5_argtuple_error;
     } else {
       values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[2] = __Pyx_ArgRef_FASTCALL(__pyx_args, 2);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[3] = __Pyx_ArgRef_FASTCALL(__pyx_args, 3);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[4] = __Pyx_ArgRef_FASTCALL(__pyx_args, 4);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[5] = __Pyx_ArgRef_FASTCALL(__pyx_args, 5);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 147, __pyx_L3_error)
       values[6] = __Pyx_ArgRef_FASTCALL(__pyx_args, 6);
-      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 147, __pyx_L3_error)
     }
     __pyx_v_old_children_keys = ((PyObject*)values[0]);
     __pyx_v_new_children_widgets = ((PyObject*)values[1]);
@@ -4379,7 +4439,7 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   }
   goto __pyx_L6_skip;
   __pyx_L5_argtuple_error:;
-  __Pyx_RaiseArgtupleInvalid("cython_diff_children_recursive", 1, 7, 7, __pyx_nargs); __PYX_ERR(0, 141, __pyx_L3_error)
+  __Pyx_RaiseArgtupleInvalid("cython_diff_children_recursive", 1, 7, 7, __pyx_nargs); __PYX_ERR(0, 147, __pyx_L3_error)
   __pyx_L6_skip:;
   goto __pyx_L4_argument_unpacking_done;
   __pyx_L3_error:;
@@ -4390,10 +4450,10 @@ PyObject *__pyx_args, PyObject *__pyx_kwds
   __Pyx_RefNannyFinishContext();
   return NULL;
   __pyx_L4_argument_unpacking_done:;
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_old_children_keys), (&PyList_Type), 0, "old_children_keys", 2))) __PYX_ERR(0, 142, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_children_widgets), (&PyList_Type), 0, "new_children_widgets", 2))) __PYX_ERR(0, 143, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_parent_html_id), (&PyUnicode_Type), 1, "parent_html_id", 1))) __PYX_ERR(0, 144, __pyx_L1_error)
-  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_map), (&PyDict_Type), 1, "previous_map", 1))) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_old_children_keys), (&PyList_Type), 0, "old_children_keys", 2))) __PYX_ERR(0, 148, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_new_children_widgets), (&PyList_Type), 0, "new_children_widgets", 2))) __PYX_ERR(0, 149, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_parent_html_id), (&PyUnicode_Type), 1, "parent_html_id", 1))) __PYX_ERR(0, 150, __pyx_L1_error)
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_previous_map), (&PyDict_Type), 1, "previous_map", 1))) __PYX_ERR(0, 153, __pyx_L1_error)
   __pyx_r = __pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_children_recursive(__pyx_self, __pyx_v_old_children_keys, __pyx_v_new_children_widgets, __pyx_v_parent_html_id, __pyx_v_parent_key, __pyx_v_result, __pyx_v_previous_map, __pyx_v_reconciler);
 
   /* function exit code */
@@ -4463,7 +4523,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   int __pyx_clineno = 0;
   __Pyx_RefNannySetupContext("cython_diff_children_recursive", 0);
 
-  /* "pythra/pythra/reconciler_cython.pyx":157
+  /* "pythra/pythra/reconciler_cython.pyx":163
  *     """
  *     # Fast path: empty children
  *     if not old_children_keys and not new_children_widgets:             # <<<<<<<<<<<<<<
@@ -4472,7 +4532,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   {
     Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_v_old_children_keys);
-    if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 157, __pyx_L1_error)
+    if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 163, __pyx_L1_error)
     __pyx_t_2 = (__pyx_temp != 0);
   }
 
@@ -4484,7 +4544,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   {
     Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_v_new_children_widgets);
-    if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 157, __pyx_L1_error)
+    if (unlikely(((!CYTHON_ASSUME_SAFE_SIZE) && __pyx_temp < 0))) __PYX_ERR(0, 163, __pyx_L1_error)
     __pyx_t_3 = (__pyx_temp != 0);
   }
 
@@ -4493,7 +4553,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   __pyx_L4_bool_binop_done:;
   if (__pyx_t_1) {
 
-    /* "pythra/pythra/reconciler_cython.pyx":158
+    /* "pythra/pythra/reconciler_cython.pyx":164
  *     # Fast path: empty children
  *     if not old_children_keys and not new_children_widgets:
  *         return             # <<<<<<<<<<<<<<
@@ -4504,7 +4564,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
     __pyx_r = Py_None; __Pyx_INCREF(Py_None);
     goto __pyx_L0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":157
+    /* "pythra/pythra/reconciler_cython.pyx":163
  *     """
  *     # Fast path: empty children
  *     if not old_children_keys and not new_children_widgets:             # <<<<<<<<<<<<<<
@@ -4513,31 +4573,31 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   }
 
-  /* "pythra/pythra/reconciler_cython.pyx":160
+  /* "pythra/pythra/reconciler_cython.pyx":166
  *         return
  * 
  *     cdef dict old_key_to_data = {}             # <<<<<<<<<<<<<<
  *     cdef dict new_key_to_widget = {}
  *     cdef set old_keys_set
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 166, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_old_key_to_data = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":161
+  /* "pythra/pythra/reconciler_cython.pyx":167
  * 
  *     cdef dict old_key_to_data = {}
  *     cdef dict new_key_to_widget = {}             # <<<<<<<<<<<<<<
  *     cdef set old_keys_set
  *     cdef set new_keys_set
 */
-  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 161, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 167, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __pyx_v_new_key_to_widget = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":166
+  /* "pythra/pythra/reconciler_cython.pyx":172
  * 
  *     # Build lookup dictionaries efficiently
  *     for key in old_children_keys:             # <<<<<<<<<<<<<<
@@ -4550,18 +4610,18 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
     {
       Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
       #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 166, __pyx_L1_error)
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 172, __pyx_L1_error)
       #endif
       if (__pyx_t_5 >= __pyx_temp) break;
     }
     __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_5, __Pyx_ReferenceSharing_OwnStrongReference);
     ++__pyx_t_5;
-    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 166, __pyx_L1_error)
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 172, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":167
+    /* "pythra/pythra/reconciler_cython.pyx":173
  *     # Build lookup dictionaries efficiently
  *     for key in old_children_keys:
  *         if key in previous_map:             # <<<<<<<<<<<<<<
@@ -4570,12 +4630,12 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
     if (unlikely(__pyx_v_previous_map == Py_None)) {
       PyErr_SetString(PyExc_TypeError, "'NoneType' object is not iterable");
-      __PYX_ERR(0, 167, __pyx_L1_error)
+      __PYX_ERR(0, 173, __pyx_L1_error)
     }
-    __pyx_t_1 = (__Pyx_PyDict_ContainsTF(__pyx_v_key, __pyx_v_previous_map, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 167, __pyx_L1_error)
+    __pyx_t_1 = (__Pyx_PyDict_ContainsTF(__pyx_v_key, __pyx_v_previous_map, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 173, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "pythra/pythra/reconciler_cython.pyx":168
+      /* "pythra/pythra/reconciler_cython.pyx":174
  *     for key in old_children_keys:
  *         if key in previous_map:
  *             old_key_to_data[key] = previous_map[key]             # <<<<<<<<<<<<<<
@@ -4584,14 +4644,14 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
       if (unlikely(__pyx_v_previous_map == Py_None)) {
         PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
-        __PYX_ERR(0, 168, __pyx_L1_error)
+        __PYX_ERR(0, 174, __pyx_L1_error)
       }
-      __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_previous_map, __pyx_v_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 168, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_previous_map, __pyx_v_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 174, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      if (unlikely((PyDict_SetItem(__pyx_v_old_key_to_data, __pyx_v_key, __pyx_t_6) < 0))) __PYX_ERR(0, 168, __pyx_L1_error)
+      if (unlikely((PyDict_SetItem(__pyx_v_old_key_to_data, __pyx_v_key, __pyx_t_6) < 0))) __PYX_ERR(0, 174, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":167
+      /* "pythra/pythra/reconciler_cython.pyx":173
  *     # Build lookup dictionaries efficiently
  *     for key in old_children_keys:
  *         if key in previous_map:             # <<<<<<<<<<<<<<
@@ -4600,7 +4660,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
     }
 
-    /* "pythra/pythra/reconciler_cython.pyx":166
+    /* "pythra/pythra/reconciler_cython.pyx":172
  * 
  *     # Build lookup dictionaries efficiently
  *     for key in old_children_keys:             # <<<<<<<<<<<<<<
@@ -4610,7 +4670,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":170
+  /* "pythra/pythra/reconciler_cython.pyx":176
  *             old_key_to_data[key] = previous_map[key]
  * 
  *     for widget in new_children_widgets:             # <<<<<<<<<<<<<<
@@ -4623,18 +4683,18 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
     {
       Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
       #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 170, __pyx_L1_error)
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 176, __pyx_L1_error)
       #endif
       if (__pyx_t_5 >= __pyx_temp) break;
     }
     __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_5, __Pyx_ReferenceSharing_OwnStrongReference);
     ++__pyx_t_5;
-    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 170, __pyx_L1_error)
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 176, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_XDECREF_SET(__pyx_v_widget, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":171
+    /* "pythra/pythra/reconciler_cython.pyx":177
  * 
  *     for widget in new_children_widgets:
  *         new_key_to_widget[widget.get_unique_id()] = widget             # <<<<<<<<<<<<<<
@@ -4648,13 +4708,13 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
       __pyx_t_6 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 171, __pyx_L1_error)
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 177, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
     }
-    if (unlikely((PyDict_SetItem(__pyx_v_new_key_to_widget, __pyx_t_6, __pyx_v_widget) < 0))) __PYX_ERR(0, 171, __pyx_L1_error)
+    if (unlikely((PyDict_SetItem(__pyx_v_new_key_to_widget, __pyx_t_6, __pyx_v_widget) < 0))) __PYX_ERR(0, 177, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":170
+    /* "pythra/pythra/reconciler_cython.pyx":176
  *             old_key_to_data[key] = previous_map[key]
  * 
  *     for widget in new_children_widgets:             # <<<<<<<<<<<<<<
@@ -4664,50 +4724,50 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":173
+  /* "pythra/pythra/reconciler_cython.pyx":179
  *         new_key_to_widget[widget.get_unique_id()] = widget
  * 
  *     old_keys_set = set(old_key_to_data.keys())             # <<<<<<<<<<<<<<
  *     new_keys_set = set(new_key_to_widget.keys())
  * 
 */
-  __pyx_t_4 = __Pyx_PyDict_Keys(__pyx_v_old_key_to_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_PyDict_Keys(__pyx_v_old_key_to_data); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  __pyx_t_6 = PySet_New(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 173, __pyx_L1_error)
+  __pyx_t_6 = PySet_New(__pyx_t_4); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 179, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
   __pyx_v_old_keys_set = ((PyObject*)__pyx_t_6);
   __pyx_t_6 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":174
+  /* "pythra/pythra/reconciler_cython.pyx":180
  * 
  *     old_keys_set = set(old_key_to_data.keys())
  *     new_keys_set = set(new_key_to_widget.keys())             # <<<<<<<<<<<<<<
  * 
  *     # Handle removals
 */
-  __pyx_t_6 = __Pyx_PyDict_Keys(__pyx_v_new_key_to_widget); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_PyDict_Keys(__pyx_v_new_key_to_widget); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
-  __pyx_t_4 = PySet_New(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 174, __pyx_L1_error)
+  __pyx_t_4 = PySet_New(__pyx_t_6); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 180, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
   __pyx_v_new_keys_set = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":177
+  /* "pythra/pythra/reconciler_cython.pyx":183
  * 
  *     # Handle removals
  *     cdef set keys_to_remove = old_keys_set - new_keys_set             # <<<<<<<<<<<<<<
  *     from pythra.reconciler import Patch
  *     from pythra.state import StatefulWidget
 */
-  __pyx_t_4 = PyNumber_Subtract(__pyx_v_old_keys_set, __pyx_v_new_keys_set); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 177, __pyx_L1_error)
+  __pyx_t_4 = PyNumber_Subtract(__pyx_v_old_keys_set, __pyx_v_new_keys_set); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 183, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
-  if (!(likely(PySet_CheckExact(__pyx_t_4)) || __Pyx_RaiseUnexpectedTypeError("set", __pyx_t_4))) __PYX_ERR(0, 177, __pyx_L1_error)
+  if (!(likely(PySet_CheckExact(__pyx_t_4)) || __Pyx_RaiseUnexpectedTypeError("set", __pyx_t_4))) __PYX_ERR(0, 183, __pyx_L1_error)
   __pyx_v_keys_to_remove = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":178
+  /* "pythra/pythra/reconciler_cython.pyx":184
  *     # Handle removals
  *     cdef set keys_to_remove = old_keys_set - new_keys_set
  *     from pythra.reconciler import Patch             # <<<<<<<<<<<<<<
@@ -4716,14 +4776,14 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Patch};
-    __pyx_t_9 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_reconciler, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 178, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_reconciler, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 184, __pyx_L1_error)
   }
   __pyx_t_4 = __pyx_t_9;
   __Pyx_GOTREF(__pyx_t_4);
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_Patch};
     __pyx_t_5 = 0; {
-      __pyx_t_6 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_5]); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 178, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_5]); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 184, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       switch (__pyx_t_5) {
         case 0:
@@ -4737,7 +4797,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":179
+  /* "pythra/pythra/reconciler_cython.pyx":185
  *     cdef set keys_to_remove = old_keys_set - new_keys_set
  *     from pythra.reconciler import Patch
  *     from pythra.state import StatefulWidget             # <<<<<<<<<<<<<<
@@ -4746,14 +4806,14 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_StatefulWidget};
-    __pyx_t_9 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_state, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 179, __pyx_L1_error)
+    __pyx_t_9 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_pythra_state, __pyx_imported_names, 1, NULL, 0); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 185, __pyx_L1_error)
   }
   __pyx_t_4 = __pyx_t_9;
   __Pyx_GOTREF(__pyx_t_4);
   {
     PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_StatefulWidget};
     __pyx_t_5 = 0; {
-      __pyx_t_6 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_5]); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 179, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_ImportFrom(__pyx_t_4, __pyx_imported_names[__pyx_t_5]); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 185, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
       switch (__pyx_t_5) {
         case 0:
@@ -4767,7 +4827,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":180
+  /* "pythra/pythra/reconciler_cython.pyx":186
  *     from pythra.reconciler import Patch
  *     from pythra.state import StatefulWidget
  *     for key in keys_to_remove:             # <<<<<<<<<<<<<<
@@ -4775,7 +4835,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
  *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
 */
   __pyx_t_5 = 0;
-  __pyx_t_6 = __Pyx_set_iterator(__pyx_v_keys_to_remove, 1, (&__pyx_t_10), (&__pyx_t_11)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __pyx_t_6 = __Pyx_set_iterator(__pyx_v_keys_to_remove, 1, (&__pyx_t_10), (&__pyx_t_11)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 186, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_6);
   __Pyx_XDECREF(__pyx_t_4);
   __pyx_t_4 = __pyx_t_6;
@@ -4783,38 +4843,38 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   while (1) {
     __pyx_t_12 = __Pyx_set_iter_next(__pyx_t_4, __pyx_t_10, &__pyx_t_5, &__pyx_t_6, __pyx_t_11);
     if (unlikely(__pyx_t_12 == 0)) break;
-    if (unlikely(__pyx_t_12 == -1)) __PYX_ERR(0, 180, __pyx_L1_error)
+    if (unlikely(__pyx_t_12 == -1)) __PYX_ERR(0, 186, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_XDECREF_SET(__pyx_v_key, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":181
+    /* "pythra/pythra/reconciler_cython.pyx":187
  *     from pythra.state import StatefulWidget
  *     for key in keys_to_remove:
  *         old_data = old_key_to_data[key]             # <<<<<<<<<<<<<<
  *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
- *         widget_instance = old_data.get("widget_instance")
+ *         result.removed_keys.append(key)
 */
-    __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_old_key_to_data, __pyx_v_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 181, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyDict_GetItem(__pyx_v_old_key_to_data, __pyx_v_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 187, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __Pyx_XDECREF_SET(__pyx_v_old_data, __pyx_t_6);
     __pyx_t_6 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":182
+    /* "pythra/pythra/reconciler_cython.pyx":188
  *     for key in keys_to_remove:
  *         old_data = old_key_to_data[key]
  *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))             # <<<<<<<<<<<<<<
+ *         result.removed_keys.append(key)
  *         widget_instance = old_data.get("widget_instance")
- *         if isinstance(widget_instance, StatefulWidget):
 */
-    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 182, __pyx_L1_error)
+    __pyx_t_6 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_6);
     __pyx_t_13 = NULL;
     __Pyx_INCREF(__pyx_v_Patch);
     __pyx_t_14 = __pyx_v_Patch; 
-    __pyx_t_15 = __Pyx_PyObject_Dict_GetItem(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 182, __pyx_L1_error)
+    __pyx_t_15 = __Pyx_PyObject_Dict_GetItem(__pyx_v_old_data, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_15);
-    __pyx_t_16 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 182, __pyx_L1_error)
+    __pyx_t_16 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_16);
     __pyx_t_8 = 1;
     #if CYTHON_UNPACK_METHODS
@@ -4830,27 +4890,39 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
     #endif
     {
       PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 3 : 0)] = {__pyx_t_13, NULL};
-      __pyx_t_17 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 182, __pyx_L1_error)
+      __pyx_t_17 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 188, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_17);
-      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_action, __pyx_mstate_global->__pyx_n_u_REMOVE, __pyx_t_17, __pyx_callargs+1, 0) < (0)) __PYX_ERR(0, 182, __pyx_L1_error)
-      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_html_id, __pyx_t_15, __pyx_t_17, __pyx_callargs+1, 1) < (0)) __PYX_ERR(0, 182, __pyx_L1_error)
-      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_data, __pyx_t_16, __pyx_t_17, __pyx_callargs+1, 2) < (0)) __PYX_ERR(0, 182, __pyx_L1_error)
+      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_action, __pyx_mstate_global->__pyx_n_u_REMOVE, __pyx_t_17, __pyx_callargs+1, 0) < (0)) __PYX_ERR(0, 188, __pyx_L1_error)
+      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_html_id, __pyx_t_15, __pyx_t_17, __pyx_callargs+1, 1) < (0)) __PYX_ERR(0, 188, __pyx_L1_error)
+      if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_data, __pyx_t_16, __pyx_t_17, __pyx_callargs+1, 2) < (0)) __PYX_ERR(0, 188, __pyx_L1_error)
       __pyx_t_7 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_14, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_17);
       __Pyx_XDECREF(__pyx_t_13); __pyx_t_13 = 0;
       __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
       __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
       __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
       __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 182, __pyx_L1_error)
+      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 188, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
     }
-    __pyx_t_18 = __Pyx_PyObject_Append(__pyx_t_6, __pyx_t_7); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 182, __pyx_L1_error)
+    __pyx_t_18 = __Pyx_PyObject_Append(__pyx_t_6, __pyx_t_7); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 188, __pyx_L1_error)
     __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":183
+    /* "pythra/pythra/reconciler_cython.pyx":189
  *         old_data = old_key_to_data[key]
  *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+ *         result.removed_keys.append(key)             # <<<<<<<<<<<<<<
+ *         widget_instance = old_data.get("widget_instance")
+ *         if isinstance(widget_instance, StatefulWidget):
+*/
+    __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_removed_keys); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_7);
+    __pyx_t_18 = __Pyx_PyObject_Append(__pyx_t_7, __pyx_v_key); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 189, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+
+    /* "pythra/pythra/reconciler_cython.pyx":190
+ *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+ *         result.removed_keys.append(key)
  *         widget_instance = old_data.get("widget_instance")             # <<<<<<<<<<<<<<
  *         if isinstance(widget_instance, StatefulWidget):
  *             state = widget_instance.get_state()
@@ -4862,23 +4934,23 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_n_u_widget_instance};
       __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get, __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 183, __pyx_L1_error)
+      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 190, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
     }
     __Pyx_XDECREF_SET(__pyx_v_widget_instance, __pyx_t_7);
     __pyx_t_7 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":184
- *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+    /* "pythra/pythra/reconciler_cython.pyx":191
+ *         result.removed_keys.append(key)
  *         widget_instance = old_data.get("widget_instance")
  *         if isinstance(widget_instance, StatefulWidget):             # <<<<<<<<<<<<<<
  *             state = widget_instance.get_state()
  *             if state:
 */
-    __pyx_t_1 = PyObject_IsInstance(__pyx_v_widget_instance, __pyx_v_StatefulWidget); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 184, __pyx_L1_error)
+    __pyx_t_1 = PyObject_IsInstance(__pyx_v_widget_instance, __pyx_v_StatefulWidget); if (unlikely(__pyx_t_1 == ((int)-1))) __PYX_ERR(0, 191, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "pythra/pythra/reconciler_cython.pyx":185
+      /* "pythra/pythra/reconciler_cython.pyx":192
  *         widget_instance = old_data.get("widget_instance")
  *         if isinstance(widget_instance, StatefulWidget):
  *             state = widget_instance.get_state()             # <<<<<<<<<<<<<<
@@ -4892,23 +4964,23 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
         PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
         __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_state, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 185, __pyx_L1_error)
+        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 192, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
       }
       __Pyx_XDECREF_SET(__pyx_v_state, __pyx_t_7);
       __pyx_t_7 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":186
+      /* "pythra/pythra/reconciler_cython.pyx":193
  *         if isinstance(widget_instance, StatefulWidget):
  *             state = widget_instance.get_state()
  *             if state:             # <<<<<<<<<<<<<<
  *                 state.dispose()
  * 
 */
-      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_state); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 186, __pyx_L1_error)
+      __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_state); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 193, __pyx_L1_error)
       if (__pyx_t_1) {
 
-        /* "pythra/pythra/reconciler_cython.pyx":187
+        /* "pythra/pythra/reconciler_cython.pyx":194
  *             state = widget_instance.get_state()
  *             if state:
  *                 state.dispose()             # <<<<<<<<<<<<<<
@@ -4922,12 +4994,12 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
           PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
           __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_dispose, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
           __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 187, __pyx_L1_error)
+          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 194, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_7);
         }
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-        /* "pythra/pythra/reconciler_cython.pyx":186
+        /* "pythra/pythra/reconciler_cython.pyx":193
  *         if isinstance(widget_instance, StatefulWidget):
  *             state = widget_instance.get_state()
  *             if state:             # <<<<<<<<<<<<<<
@@ -4936,8 +5008,8 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
       }
 
-      /* "pythra/pythra/reconciler_cython.pyx":184
- *         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+      /* "pythra/pythra/reconciler_cython.pyx":191
+ *         result.removed_keys.append(key)
  *         widget_instance = old_data.get("widget_instance")
  *         if isinstance(widget_instance, StatefulWidget):             # <<<<<<<<<<<<<<
  *             state = widget_instance.get_state()
@@ -4947,7 +5019,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":190
+  /* "pythra/pythra/reconciler_cython.pyx":197
  * 
  *     # Handle updates, inserts, and moves
  *     cdef int last_placed_old_idx = -1             # <<<<<<<<<<<<<<
@@ -4956,7 +5028,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   __pyx_v_last_placed_old_idx = -1;
 
-  /* "pythra/pythra/reconciler_cython.pyx":191
+  /* "pythra/pythra/reconciler_cython.pyx":198
  *     # Handle updates, inserts, and moves
  *     cdef int last_placed_old_idx = -1
  *     cdef dict old_key_to_index = {key: i for i, key in enumerate(old_children_keys)}             # <<<<<<<<<<<<<<
@@ -4964,7 +5036,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
  *     cdef int i = 0
 */
   { /* enter inner scope */
-    __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 191, __pyx_L19_error)
+    __pyx_t_4 = PyDict_New(); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 198, __pyx_L19_error)
     __Pyx_GOTREF(__pyx_t_4);
     __pyx_t_11 = 0;
     __pyx_t_7 = __pyx_v_old_children_keys; __Pyx_INCREF(__pyx_t_7);
@@ -4973,21 +5045,21 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       {
         Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_7);
         #if !CYTHON_ASSUME_SAFE_SIZE
-        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 191, __pyx_L19_error)
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 198, __pyx_L19_error)
         #endif
         if (__pyx_t_10 >= __pyx_temp) break;
       }
       __pyx_t_6 = __Pyx_PyList_GetItemRefFast(__pyx_t_7, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
       ++__pyx_t_10;
-      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 191, __pyx_L19_error)
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L19_error)
       __Pyx_GOTREF(__pyx_t_6);
       __Pyx_XDECREF_SET(__pyx_8genexpr1__pyx_v_key, __pyx_t_6);
       __pyx_t_6 = 0;
       __pyx_8genexpr1__pyx_v_i = __pyx_t_11;
       __pyx_t_11 = (__pyx_t_11 + 1);
-      __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_8genexpr1__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 191, __pyx_L19_error)
+      __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_8genexpr1__pyx_v_i); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 198, __pyx_L19_error)
       __Pyx_GOTREF(__pyx_t_6);
-      if (unlikely(PyDict_SetItem(__pyx_t_4, (PyObject*)__pyx_8genexpr1__pyx_v_key, (PyObject*)__pyx_t_6))) __PYX_ERR(0, 191, __pyx_L19_error)
+      if (unlikely(PyDict_SetItem(__pyx_t_4, (PyObject*)__pyx_8genexpr1__pyx_v_key, (PyObject*)__pyx_t_6))) __PYX_ERR(0, 198, __pyx_L19_error)
       __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
     }
     __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
@@ -5001,7 +5073,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   __pyx_v_old_key_to_index = ((PyObject*)__pyx_t_4);
   __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":193
+  /* "pythra/pythra/reconciler_cython.pyx":200
  *     cdef dict old_key_to_index = {key: i for i, key in enumerate(old_children_keys)}
  *     cdef int old_idx
  *     cdef int i = 0             # <<<<<<<<<<<<<<
@@ -5010,7 +5082,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
   __pyx_v_i = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":196
+  /* "pythra/pythra/reconciler_cython.pyx":203
  *     cdef new_key
  * 
  *     for i, new_widget in enumerate(new_children_widgets):             # <<<<<<<<<<<<<<
@@ -5024,20 +5096,20 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
     {
       Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_4);
       #if !CYTHON_ASSUME_SAFE_SIZE
-      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 196, __pyx_L1_error)
+      if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 203, __pyx_L1_error)
       #endif
       if (__pyx_t_10 >= __pyx_temp) break;
     }
     __pyx_t_7 = __Pyx_PyList_GetItemRefFast(__pyx_t_4, __pyx_t_10, __Pyx_ReferenceSharing_OwnStrongReference);
     ++__pyx_t_10;
-    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 196, __pyx_L1_error)
+    if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 203, __pyx_L1_error)
     __Pyx_GOTREF(__pyx_t_7);
     __Pyx_XDECREF_SET(__pyx_v_new_widget, __pyx_t_7);
     __pyx_t_7 = 0;
     __pyx_v_i = __pyx_t_11;
     __pyx_t_11 = (__pyx_t_11 + 1);
 
-    /* "pythra/pythra/reconciler_cython.pyx":197
+    /* "pythra/pythra/reconciler_cython.pyx":204
  * 
  *     for i, new_widget in enumerate(new_children_widgets):
  *         new_key = new_widget.get_unique_id()             # <<<<<<<<<<<<<<
@@ -5051,23 +5123,23 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       PyObject *__pyx_callargs[2] = {__pyx_t_6, NULL};
       __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_get_unique_id, __pyx_callargs+__pyx_t_8, (1-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
       __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 197, __pyx_L1_error)
+      if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 204, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
     }
     __Pyx_XDECREF_SET(__pyx_v_new_key, __pyx_t_7);
     __pyx_t_7 = 0;
 
-    /* "pythra/pythra/reconciler_cython.pyx":199
+    /* "pythra/pythra/reconciler_cython.pyx":206
  *         new_key = new_widget.get_unique_id()
  * 
  *         if new_key in old_keys_set:             # <<<<<<<<<<<<<<
  *             # Existing widget: diff it
  *             reconciler._diff_node_recursive(
 */
-    __pyx_t_1 = (__Pyx_PySet_ContainsTF(__pyx_v_new_key, __pyx_v_old_keys_set, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 199, __pyx_L1_error)
+    __pyx_t_1 = (__Pyx_PySet_ContainsTF(__pyx_v_new_key, __pyx_v_old_keys_set, Py_EQ)); if (unlikely((__pyx_t_1 < 0))) __PYX_ERR(0, 206, __pyx_L1_error)
     if (__pyx_t_1) {
 
-      /* "pythra/pythra/reconciler_cython.pyx":201
+      /* "pythra/pythra/reconciler_cython.pyx":208
  *         if new_key in old_keys_set:
  *             # Existing widget: diff it
  *             reconciler._diff_node_recursive(             # <<<<<<<<<<<<<<
@@ -5077,7 +5149,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       __pyx_t_6 = __pyx_v_reconciler;
       __Pyx_INCREF(__pyx_t_6);
 
-      /* "pythra/pythra/reconciler_cython.pyx":202
+      /* "pythra/pythra/reconciler_cython.pyx":209
  *             # Existing widget: diff it
  *             reconciler._diff_node_recursive(
  *                 new_key, new_widget, parent_html_id, parent_key, result, previous_map             # <<<<<<<<<<<<<<
@@ -5089,25 +5161,25 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
         PyObject *__pyx_callargs[7] = {__pyx_t_6, __pyx_v_new_key, __pyx_v_new_widget, __pyx_v_parent_html_id, __pyx_v_parent_key, __pyx_v_result, __pyx_v_previous_map};
         __pyx_t_7 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_diff_node_recursive, __pyx_callargs+__pyx_t_8, (7-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
         __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 201, __pyx_L1_error)
+        if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
       }
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":206
+      /* "pythra/pythra/reconciler_cython.pyx":213
  * 
  *             # Check for moves (out-of-order children)
  *             old_idx = old_key_to_index[new_key]             # <<<<<<<<<<<<<<
  *             if old_idx < last_placed_old_idx:
  *                 moved_html_id = result.new_rendered_map[new_key]["html_id"]
 */
-      __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_v_old_key_to_index, __pyx_v_new_key); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 206, __pyx_L1_error)
+      __pyx_t_7 = __Pyx_PyDict_GetItem(__pyx_v_old_key_to_index, __pyx_v_new_key); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 213, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_7);
-      __pyx_t_12 = __Pyx_PyLong_As_int(__pyx_t_7); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 206, __pyx_L1_error)
+      __pyx_t_12 = __Pyx_PyLong_As_int(__pyx_t_7); if (unlikely((__pyx_t_12 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 213, __pyx_L1_error)
       __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
       __pyx_v_old_idx = __pyx_t_12;
 
-      /* "pythra/pythra/reconciler_cython.pyx":207
+      /* "pythra/pythra/reconciler_cython.pyx":214
  *             # Check for moves (out-of-order children)
  *             old_idx = old_key_to_index[new_key]
  *             if old_idx < last_placed_old_idx:             # <<<<<<<<<<<<<<
@@ -5117,25 +5189,25 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       __pyx_t_1 = (__pyx_v_old_idx < __pyx_v_last_placed_old_idx);
       if (__pyx_t_1) {
 
-        /* "pythra/pythra/reconciler_cython.pyx":208
+        /* "pythra/pythra/reconciler_cython.pyx":215
  *             old_idx = old_key_to_index[new_key]
  *             if old_idx < last_placed_old_idx:
  *                 moved_html_id = result.new_rendered_map[new_key]["html_id"]             # <<<<<<<<<<<<<<
  *                 before_id = reconciler._find_next_stable_html_id(
  *                     i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map
 */
-        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 215, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
-        __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_t_7, __pyx_v_new_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_PyObject_GetItem(__pyx_t_7, __pyx_v_new_key); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 215, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
-        __pyx_t_7 = __Pyx_PyObject_Dict_GetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 208, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_PyObject_Dict_GetItem(__pyx_t_6, __pyx_mstate_global->__pyx_n_u_html_id); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 215, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_XDECREF_SET(__pyx_v_moved_html_id, __pyx_t_7);
         __pyx_t_7 = 0;
 
-        /* "pythra/pythra/reconciler_cython.pyx":209
+        /* "pythra/pythra/reconciler_cython.pyx":216
  *             if old_idx < last_placed_old_idx:
  *                 moved_html_id = result.new_rendered_map[new_key]["html_id"]
  *                 before_id = reconciler._find_next_stable_html_id(             # <<<<<<<<<<<<<<
@@ -5145,16 +5217,16 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
         __pyx_t_6 = __pyx_v_reconciler;
         __Pyx_INCREF(__pyx_t_6);
 
-        /* "pythra/pythra/reconciler_cython.pyx":210
+        /* "pythra/pythra/reconciler_cython.pyx":217
  *                 moved_html_id = result.new_rendered_map[new_key]["html_id"]
  *                 before_id = reconciler._find_next_stable_html_id(
  *                     i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map             # <<<<<<<<<<<<<<
  *                 )
  *                 result.patches.append(Patch(
 */
-        __pyx_t_14 = __Pyx_PyLong_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 210, __pyx_L1_error)
+        __pyx_t_14 = __Pyx_PyLong_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_14)) __PYX_ERR(0, 217, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_14);
-        __pyx_t_17 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 210, __pyx_L1_error)
+        __pyx_t_17 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 217, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_17);
         __pyx_t_8 = 0;
         {
@@ -5163,36 +5235,36 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
           __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
           __Pyx_DECREF(__pyx_t_14); __pyx_t_14 = 0;
           __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
-          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 209, __pyx_L1_error)
+          if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 216, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_7);
         }
         __Pyx_XDECREF_SET(__pyx_v_before_id, __pyx_t_7);
         __pyx_t_7 = 0;
 
-        /* "pythra/pythra/reconciler_cython.pyx":212
+        /* "pythra/pythra/reconciler_cython.pyx":219
  *                     i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map
  *                 )
  *                 result.patches.append(Patch(             # <<<<<<<<<<<<<<
  *                     "MOVE", moved_html_id,
  *                     {"parent_html_id": parent_html_id, "before_id": before_id}
 */
-        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 212, __pyx_L1_error)
+        __pyx_t_7 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_patches); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 219, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_7);
         __pyx_t_14 = NULL;
         __Pyx_INCREF(__pyx_v_Patch);
         __pyx_t_6 = __pyx_v_Patch; 
 
-        /* "pythra/pythra/reconciler_cython.pyx":214
+        /* "pythra/pythra/reconciler_cython.pyx":221
  *                 result.patches.append(Patch(
  *                     "MOVE", moved_html_id,
  *                     {"parent_html_id": parent_html_id, "before_id": before_id}             # <<<<<<<<<<<<<<
  *                 ))
  *             last_placed_old_idx = max(last_placed_old_idx, old_idx)
 */
-        __pyx_t_16 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 214, __pyx_L1_error)
+        __pyx_t_16 = __Pyx_PyDict_NewPresized(2); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 221, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_16);
-        if (PyDict_SetItem(__pyx_t_16, __pyx_mstate_global->__pyx_n_u_parent_html_id, __pyx_v_parent_html_id) < (0)) __PYX_ERR(0, 214, __pyx_L1_error)
-        if (PyDict_SetItem(__pyx_t_16, __pyx_mstate_global->__pyx_n_u_before_id, __pyx_v_before_id) < (0)) __PYX_ERR(0, 214, __pyx_L1_error)
+        if (PyDict_SetItem(__pyx_t_16, __pyx_mstate_global->__pyx_n_u_parent_html_id, __pyx_v_parent_html_id) < (0)) __PYX_ERR(0, 221, __pyx_L1_error)
+        if (PyDict_SetItem(__pyx_t_16, __pyx_mstate_global->__pyx_n_u_before_id, __pyx_v_before_id) < (0)) __PYX_ERR(0, 221, __pyx_L1_error)
         __pyx_t_8 = 1;
         #if CYTHON_UNPACK_METHODS
         if (unlikely(PyMethod_Check(__pyx_t_6))) {
@@ -5211,22 +5283,22 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
           __Pyx_XDECREF(__pyx_t_14); __pyx_t_14 = 0;
           __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
           __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-          if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 212, __pyx_L1_error)
+          if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 219, __pyx_L1_error)
           __Pyx_GOTREF(__pyx_t_17);
         }
 
-        /* "pythra/pythra/reconciler_cython.pyx":212
+        /* "pythra/pythra/reconciler_cython.pyx":219
  *                     i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map
  *                 )
  *                 result.patches.append(Patch(             # <<<<<<<<<<<<<<
  *                     "MOVE", moved_html_id,
  *                     {"parent_html_id": parent_html_id, "before_id": before_id}
 */
-        __pyx_t_18 = __Pyx_PyObject_Append(__pyx_t_7, __pyx_t_17); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 212, __pyx_L1_error)
+        __pyx_t_18 = __Pyx_PyObject_Append(__pyx_t_7, __pyx_t_17); if (unlikely(__pyx_t_18 == ((int)-1))) __PYX_ERR(0, 219, __pyx_L1_error)
         __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
 
-        /* "pythra/pythra/reconciler_cython.pyx":207
+        /* "pythra/pythra/reconciler_cython.pyx":214
  *             # Check for moves (out-of-order children)
  *             old_idx = old_key_to_index[new_key]
  *             if old_idx < last_placed_old_idx:             # <<<<<<<<<<<<<<
@@ -5235,7 +5307,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
 */
       }
 
-      /* "pythra/pythra/reconciler_cython.pyx":216
+      /* "pythra/pythra/reconciler_cython.pyx":223
  *                     {"parent_html_id": parent_html_id, "before_id": before_id}
  *                 ))
  *             last_placed_old_idx = max(last_placed_old_idx, old_idx)             # <<<<<<<<<<<<<<
@@ -5252,7 +5324,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       }
       __pyx_v_last_placed_old_idx = __pyx_t_20;
 
-      /* "pythra/pythra/reconciler_cython.pyx":199
+      /* "pythra/pythra/reconciler_cython.pyx":206
  *         new_key = new_widget.get_unique_id()
  * 
  *         if new_key in old_keys_set:             # <<<<<<<<<<<<<<
@@ -5262,7 +5334,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       goto __pyx_L26;
     }
 
-    /* "pythra/pythra/reconciler_cython.pyx":219
+    /* "pythra/pythra/reconciler_cython.pyx":226
  *         else:
  *             # New widget: insert it
  *             before_id = reconciler._find_next_stable_html_id(             # <<<<<<<<<<<<<<
@@ -5273,16 +5345,16 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       __pyx_t_7 = __pyx_v_reconciler;
       __Pyx_INCREF(__pyx_t_7);
 
-      /* "pythra/pythra/reconciler_cython.pyx":220
+      /* "pythra/pythra/reconciler_cython.pyx":227
  *             # New widget: insert it
  *             before_id = reconciler._find_next_stable_html_id(
  *                 i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map             # <<<<<<<<<<<<<<
  *             )
  *             reconciler._insert_node_recursive(
 */
-      __pyx_t_6 = __Pyx_PyLong_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 220, __pyx_L1_error)
+      __pyx_t_6 = __Pyx_PyLong_From_long((__pyx_v_i + 1)); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 227, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_6);
-      __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 220, __pyx_L1_error)
+      __pyx_t_16 = __Pyx_PyObject_GetAttrStr(__pyx_v_result, __pyx_mstate_global->__pyx_n_u_new_rendered_map); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 227, __pyx_L1_error)
       __Pyx_GOTREF(__pyx_t_16);
       __pyx_t_8 = 0;
       {
@@ -5291,13 +5363,13 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
         __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
         __Pyx_DECREF(__pyx_t_16); __pyx_t_16 = 0;
-        if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 219, __pyx_L1_error)
+        if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 226, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_17);
       }
       __Pyx_XDECREF_SET(__pyx_v_before_id, __pyx_t_17);
       __pyx_t_17 = 0;
 
-      /* "pythra/pythra/reconciler_cython.pyx":222
+      /* "pythra/pythra/reconciler_cython.pyx":229
  *                 i + 1, new_children_widgets, old_key_to_index, result.new_rendered_map
  *             )
  *             reconciler._insert_node_recursive(             # <<<<<<<<<<<<<<
@@ -5307,7 +5379,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       __pyx_t_16 = __pyx_v_reconciler;
       __Pyx_INCREF(__pyx_t_16);
 
-      /* "pythra/pythra/reconciler_cython.pyx":223
+      /* "pythra/pythra/reconciler_cython.pyx":230
  *             )
  *             reconciler._insert_node_recursive(
  *                 new_widget, parent_html_id, parent_key, result, previous_map, before_id=before_id             # <<<<<<<<<<<<<<
@@ -5316,20 +5388,20 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
       __pyx_t_8 = 0;
       {
         PyObject *__pyx_callargs[6 + ((CYTHON_VECTORCALL) ? 1 : 0)] = {__pyx_t_16, __pyx_v_new_widget, __pyx_v_parent_html_id, __pyx_v_parent_key, __pyx_v_result, __pyx_v_previous_map};
-        __pyx_t_6 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 222, __pyx_L1_error)
+        __pyx_t_6 = __Pyx_MakeVectorcallBuilderKwds(1); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 229, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_6);
-        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_before_id, __pyx_v_before_id, __pyx_t_6, __pyx_callargs+6, 0) < (0)) __PYX_ERR(0, 222, __pyx_L1_error)
+        if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_before_id, __pyx_v_before_id, __pyx_t_6, __pyx_callargs+6, 0) < (0)) __PYX_ERR(0, 229, __pyx_L1_error)
         __pyx_t_17 = __Pyx_Object_VectorcallMethod_CallFromBuilder((PyObject*)__pyx_mstate_global->__pyx_n_u_insert_node_recursive, __pyx_callargs+__pyx_t_8, (6-__pyx_t_8) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_6);
         __Pyx_XDECREF(__pyx_t_16); __pyx_t_16 = 0;
         __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
-        if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 222, __pyx_L1_error)
+        if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 229, __pyx_L1_error)
         __Pyx_GOTREF(__pyx_t_17);
       }
       __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
     }
     __pyx_L26:;
 
-    /* "pythra/pythra/reconciler_cython.pyx":196
+    /* "pythra/pythra/reconciler_cython.pyx":203
  *     cdef new_key
  * 
  *     for i, new_widget in enumerate(new_children_widgets):             # <<<<<<<<<<<<<<
@@ -5339,7 +5411,7 @@ static PyObject *__pyx_pf_6pythra_6pythra_17reconciler_cython_4cython_diff_child
   }
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":141
+  /* "pythra/pythra/reconciler_cython.pyx":147
  * 
  * 
  * def cython_diff_children_recursive(             # <<<<<<<<<<<<<<
@@ -5799,26 +5871,26 @@ __Pyx_RefNannySetupContext("PyInit_reconciler_cython", 0);
   if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_cython_diff_node_recursive, __pyx_t_2) < (0)) __PYX_ERR(0, 53, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
 
-  /* "pythra/pythra/reconciler_cython.pyx":141
+  /* "pythra/pythra/reconciler_cython.pyx":147
  * 
  * 
  * def cython_diff_children_recursive(             # <<<<<<<<<<<<<<
  *     old_children_keys: List,
  *     new_children_widgets: List,
 */
-  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_2);
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_old_children_keys, __pyx_mstate_global->__pyx_n_u_List) < (0)) __PYX_ERR(0, 141, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_new_children_widgets, __pyx_mstate_global->__pyx_n_u_List) < (0)) __PYX_ERR(0, 141, __pyx_L1_error)
-  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_n_u_None) < (0)) __PYX_ERR(0, 141, __pyx_L1_error)
-  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_6pythra_6pythra_17reconciler_cython_5cython_diff_children_recursive, 0, __pyx_mstate_global->__pyx_n_u_cython_diff_children_recursive, NULL, __pyx_mstate_global->__pyx_n_u_pythra_pythra_reconciler_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_old_children_keys, __pyx_mstate_global->__pyx_n_u_List) < (0)) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_new_children_widgets, __pyx_mstate_global->__pyx_n_u_List) < (0)) __PYX_ERR(0, 147, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_return, __pyx_mstate_global->__pyx_n_u_None) < (0)) __PYX_ERR(0, 147, __pyx_L1_error)
+  __pyx_t_4 = __Pyx_CyFunction_New(&__pyx_mdef_6pythra_6pythra_17reconciler_cython_5cython_diff_children_recursive, 0, __pyx_mstate_global->__pyx_n_u_cython_diff_children_recursive, NULL, __pyx_mstate_global->__pyx_n_u_pythra_pythra_reconciler_cython, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_GOTREF(__pyx_t_4);
   #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
   PyUnstable_Object_EnableDeferredRefcount(__pyx_t_4);
   #endif
   __Pyx_CyFunction_SetAnnotationsDict(__pyx_t_4, __pyx_t_2);
   __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
-  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_cython_diff_children_recursive, __pyx_t_4) < (0)) __PYX_ERR(0, 141, __pyx_L1_error)
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_cython_diff_children_recursive, __pyx_t_4) < (0)) __PYX_ERR(0, 147, __pyx_L1_error)
   __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
 
   /* "pythra/pythra/reconciler_cython.pyx":1
@@ -5868,7 +5940,7 @@ __Pyx_RefNannySetupContext("PyInit_reconciler_cython", 0);
 
 static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
-  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 196, __pyx_L1_error)
+  __pyx_builtin_enumerate = __Pyx_GetBuiltinName(__pyx_mstate->__pyx_n_u_enumerate); if (!__pyx_builtin_enumerate) __PYX_ERR(0, 203, __pyx_L1_error)
 
   /* Cached unbound methods */
   __pyx_mstate->__pyx_umethod_PyDict_Type_get.type = (PyObject*)&PyDict_Type;
@@ -5899,31 +5971,31 @@ static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
 static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
   CYTHON_UNUSED_VAR(__pyx_mstate);
   {
-    const struct { const unsigned int length: 9; } index[] = {{1},{179},{14},{1},{8},{39},{3},{4},{4},{4},{4},{8},{5},{20},{6},{7},{14},{15},{6},{5},{6},{8},{6},{18},{9},{1},{7},{20},{13},{17},{18},{9},{30},{26},{17},{4},{24},{20},{7},{9},{25},{8},{19},{3},{12},{9},{13},{7},{1},{12},{22},{13},{11},{5},{3},{4},{14},{19},{8},{10},{13},{8},{20},{8},{13},{7},{17},{12},{9},{16},{8},{7},{10},{14},{17},{8},{7},{15},{16},{12},{12},{9},{18},{16},{8},{7},{9},{6},{9},{5},{14},{10},{10},{7},{3},{12},{12},{5},{31},{17},{12},{12},{10},{12},{6},{6},{12},{10},{5},{8},{6},{6},{6},{15},{11},{173},{505},{482}};
-    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1681 bytes) */
-const char* const cstring = "BZh91AY&SY\312$3q\000\000\347\377\377\377\377\377\376\377\377\377\375\377\367\377\376\277\377\377\377\300@@@@@@@@@@@@\000@\000P\005\2577WL\216\350\003u\262\034\036\274\032\231)\243D\322oSS\323\000\323)\246\312F\203#\324\362\236\223OQ\247\250\r\032\001\246\206\365@\310\375#D=54i\214\246\323\032\243\324\032\230\202\233\n\233'\251O(~\250\375$\320\032\000\000\006\201\240\000\000\000\000\000=A\241\240\000\032\247\204d\215\"O\022dh=F\206\201\243@\032\r\000d\000\032\000\r\000\0004\000\320\320\002\250\021\202\r\2410F&\t\2010\004\300\000\010\311\223\003SC\021\210\302`\000 \323\004\301\"I\246\201\rLSje=\220\223M2\006 \032\000\000\000\000\000\000\000\000\001\220\005\240\001\020\241\202B\305\014\2063\363BI\3470\016K\327\215\t\027o\244\336\277\200@\376\377\211\004@\203\033m\262R\246\224\005\367\177\311)\025Z\247<\305e\240\\\304\233H\335\026\351\177\374d\310\263\232(\250B.*\313I\332k\235\002\252^\260bc\035e\345\035y\310\202\253\257j\310\021T\341\005@\224\2466\207\"JJ\200\270\246\255w\244\014\256\315\206v&\031\347E\010g0OMVl\0105\201\010N\335O8\240\013,\030R\032\"\027M\254,\243\032\264N\0248ZTht\021\2021\254\321\330\354\203\255\223\010\227}1\244\357>^VFV\377\327\227\270^b6Z\346\250\373Nhq\2156/-\203\273E\324\322\031\020L\033\340\267\314i\261\211\213\355\002\007Z!Qf\216\372\232\020\340tUYU\024h\301\346\203:t\325\317\202+\342\252\253\370S,\315g\362\271\"\016\371\216\30490\254\036x\267\231\303R\200M\206\324\304\020\326\200\231<\210\240\206>\322c\204g\221\257\304\225\022\214\345\271\224l\317!$\263*\325}\325Yo\016Vk\nq\203\230$\275 \266\257\2632\264:\306\350S\250\305\367\223_\325\351\313q\237\203\331)\366\004\255\240\205\215\354\265\261\310wn\332x\217\220y6\275\003V\220f\034C\267\364\277\000\220\2700Y\004\233&\026\263Bb\032\014\230\320\251\341Cl0bP\366\273\010};+\020S\237\022\367{\331&\"\010\243\tG\340\024W\235,#\0372\265\213y\252\343\301\264hT1\t}\227\000f\253\323\003>PLk\030\323\023\"g\004m t\213`\310\210(:c\024Q\020\210N\252L\216\226]\003\022\203\254\035\006F\347\\\003\322D*\212""\211\006\220\250.\030\201I\231\222&\252V9\334)\232\242\357\326\177]Y\244\274\256\201\367\271-7\362aw\022V\034\3351>(f\026\2110\346\276\n\214`H\"\220\303As\341H0\315\003\013\307\022\242q\245\202\217\003\272\371i1R\016 \236\311\341\\\2214W\006\370\314\300\371|\374B\271\245;`\216\246\313j\241\275\r\260m\312/\224\nVX\253-\343\206L\364,u\210\242\035V\250\230\251\006\2738o\272\233\363c\233\223\321\267\\\363\006\231\243\236\321Q\226!\225G\223\205\217\246\267N\004\355\262SjO4#\205\227D\006\021<\3051\272\371\025\031\025'u\356\332\357\207\215\223Ci\264\333rn\200\263]\373\313\212\001\263}o\346\325\301\247\214\207\270\216\212\033z\360!\231M,\207=S\220S]|\006:\013\271\320j\222\200\030+\225\314;\242\315\336\331nL9\207P\224\"\304b\366lb\310\021\223=6\336J\215\302E%\245\256\010\277\243\256;}\312g{h\330U\316\302\3256\003|\267\265\235\361\321\235\231\354E\334\000m\2644\254\331\001Q;K\032\252\262'\330&YxT\247\210\035\355U\232\370\016\033-\235\360\207\304\205 \224C\0136\212l\240Z6j\tJ\374\220\231\356=\273\300\227\035\"\317U\020<Z\326\000a`\035\226\016\006\316\001\010\006\201~\252\251|u\344V\226\312\2163\305\023\262\341\"\251P\254\014ts\310+=8\2058\225n\302\330\275\266\363\270\367\024\305\020Ah\020b\200P\024\224Q\266\t\207\\\375bT\313\255q\266sb\\\250\341p1\223\343\357\006\350\265\362\244\266\264c\211\216-\034I\323U\\T]3j\265\260\226d\250\306\261jTB\302\324\n\365\354\305+\241\346\n\262[\315( \030\021x\247\n\314N\342\204\3243\257\223\314\235\t\022\021L\360\0302R\314\337\033\317I\020 \320\332\312-\277\206D\211E\303\033\315)\311W!\246\177\r\355IU\020\006Ul\260\236\001\210,\372\013s\226\321\357\001\n\302\320\207fJ\352\224\210*&\327\273\207B\263I\026~\334\235\355\224\307UX]\231\030)\034\216\"$\336\3275\202\245p\325\373fB\245\273\277\263F<\025\205\255jx\t\201\314\316\215\324\251\270\271\017)\310\313)Th'\217\253\337{B\204\317`\365\006\25486\321\270=$\004\301\260D\342/\327\233\361\300\241\204}1I\016 \315\322\326\310\2565-;\363\341\004H*@\256;\326\331\247j\241$\022$\212\2468\365L}e\021~\214\032""\366\021\310\367\000\340\262K\316]\360\272g\305\334\264N\230\324\014l\263\202\333\031\303v\265\217/\177\320cA;\263\3457\265\266\327L6\320\325\361S\204\034k-\257\306\365\006\363\033\250\2415\314VJ0\267\270T\340\345R\234D\235\351s\330\216(\365)H\032\354\375\3103\223\3743&)=v\366\032\322m\317\255\246\273\332\375R\362M\332\257\202nW\3024gq\342\364\"\223\326\355\343\346\034KZB\256\\\371r\326\322\031\271\316^\206\364>\235\242\377\366\200HJa\307\334K\030L\000t\351\r\335\335\244\016A\024\261\330^\240\227c_\013\211\340>\243\310\267\2309\363'{\364\365\226\031\t\304\303\211\355\317\321\201\333\036\312\2274`\331E\313\2717\350\211\033\n\270@\372K\025R\214T\t/\306K\240\334=2P\204\346\2628A\335DOM\262$\251\242\177\206\214 \225R\252\361\017\003\214\020\361\t\025ZbR\242P\212\241\343\223\013\257\n)\325\325K\322:\247\301b\377\213\271\"\234(He\022\031\270\200";
-    PyObject *data = __Pyx_DecompressString(cstring, 1681, 2);
+    const struct { const unsigned int length: 10; } index[] = {{1},{179},{14},{1},{8},{39},{3},{4},{4},{4},{4},{8},{5},{20},{6},{7},{14},{15},{6},{5},{6},{28},{8},{6},{18},{9},{1},{7},{20},{13},{17},{18},{16},{30},{26},{17},{4},{24},{20},{7},{9},{6},{25},{8},{19},{3},{12},{9},{13},{7},{1},{12},{22},{13},{11},{5},{3},{4},{14},{19},{8},{10},{13},{8},{20},{8},{13},{7},{17},{12},{9},{16},{8},{7},{10},{14},{17},{8},{7},{15},{16},{12},{12},{9},{18},{8},{7},{9},{6},{9},{5},{14},{10},{10},{7},{3},{12},{12},{5},{31},{17},{12},{12},{10},{12},{13},{6},{6},{12},{10},{5},{8},{6},{18},{6},{6},{15},{11},{173},{548},{493}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1729 bytes) */
+const char* const cstring = "BZh91AY&SY_\010\235\021\000\000\361\377\377\377\377\377\376\377\377\377\375\377\377\377\376\277\377\377\377\300@@@@@@@@@@@@\000@\000P\005\3578\326\264\322*\202\251C\000\301\251\222F\250\330\214ORzz\243=\032\004\2324d<S\323S\021\2464A\3524\365\003'\243MOS\311\2412i\351\2424\323\324\360\217Dj \300\0010\000C\023\004\300\000\021\200\023&\t\223\000\002211\030\010`\000\001\251\202h\t4eS\365#jm4!\352h\017D\311\352\r\000\000\001\240\000\014\023M\000\031\r\032\000\0100\000L\000\020\304\3010\000\004`\004\311\202d\300\000\214\214LF\002\030\000\000Ji\023\021\032\236ML\206CM&\210\310\311\232@\320\036\240\000\000\000\000\000\000\000\006\232\006\216\325\001\3519\004\034\023\2622\030\r\315\t+\273<\367\001s\364!\"\333I\007u\253\201^\236\242A\020\231\t$\221\002\023\3120b\263\246\314\320#[UU\304\232\266\013\020\002@\332\006\320b\351\226\332\330\032\363i\2165\204u\247Udd\020\225\215\2110\204\267Ll%-rH$\033:\t;\020-:&-\013\020\203\tVH\230a\013\215P\211`\315\255\001\226y1\236\026\017;B\010g`R\245q\3003\340\031\255\215D\2557P\0318M@\361\r\264o\202\336\326\323\3308\233\211B\323z\260\256\305\322<6\254\364\023\021.\264\340\335U\305\341\261\315\345\346\227Z\306j\226R\257\"\235\n\013N\\\244\333\267\276v\365cd\010\004\312\220L\210&\033\340\242\362>,x\021\033\335\372\211\254+\306\341q\207I\271\027}\251i\2236\331\215\300I\273\2739\367\224\034\353\315\253\263\364\357p}\332\223R\377\302\006.%\236R\037?\026H(\275B\354\"G\255~\342\271\261\346\370\264\2413\277\340\220\361\214\330y<N,\341\241\357NC5\201\322\213e^\214\360\177\223\342\376\034R\273\203\223@\240\233Y\006\3170\354\321c!_\225\3664\256RU\335^F\346u8\334\340\355\0077\351\236N!+AU[:\317<#\335=S\226\377H\342%\033\356\271\3657\224\024\3227\3734E\304\"\030BT4\036=3\003Q\223O{\263y\321\345\366\212h\335\242\r\034\021~\217I\256\310\202(N'\037\3000\271f{f:e\253\273\307\261\363Y\367\320M4V\377\304t\035*\250tqy\004\370\256'\305\214\265J\226\n0\220\370\214\243\241!A\3221E\021\010\205%\nN\222Ld\201\311A\340\016\023@i3\274D\334\210Vn\300\304\305Bv\241JQ""\243\244O\312f)\224j!\021\326\035z\215\366U\237\026\206\034\236\221\367\250\266i\362]\273\2305g>\307\320\027\206Z&9\261j\027E;%\235q\271&\247\374\2409\324\243\227\275\262m\341\321\206\372\331\247\201\033\363\341\001\3627#u\361\312\014T\304\237xE\300\271\3274\025N\315\0328\374\331\32236\310A\301\t;\331\007b\024\240g\231g\000_R\310NF\202\000\340\ti\t$D$c\255\236\325\252\373,@\231\017-qlX\241\234\202k\371LH\271:U?#\035\212\316\257\026h\025WHT\232\002\271\330|\316X\356\006\2626\001g\215P(\274\037K\326\305G\261\226\231\264\001\024(g\002\"%\"\220\r}_\274.\3450\034\275A\253&\316\374\370\030YX\334t\226\3566tk\031P\352\255\232\240\023\334\324_\256\326t\034v@ j5\020wD\364v\355\265S\034'1\231\330\256\2665\226\235(kB\370I\347\231[\023h\2018\031\223j|\\\022~-\251\340\267\322cI\036\206:\332\244\300\2279d\301q\331#\004aF\263P\033\010\02354\322\001Q*\346\253EIPyuL\211b\010\265W\201\336FM\244\323\252\225\325\211\330Y\234 \020s %\240\254\352\006\243\213\224\tK\253$'\226r\313\020\231\311\"\362\025\203wWF\003om\356\241F:\030c\"\202a\263\206\0311[\327%H\325\205\271\363j3i\312\262E\223\022\016\032<\310B<\014\23407+NC(k\312U\316K\236\362* \2522\006bD\301\001\025\026n\304\2073Z\337\250\204\356\316\034nW\nP\337\216\372q\010\343\313t6\306\323\312\203d\327\276\362\373\323\021\226\326\021\316\302\026\313s\361[\264\253\321\246,\330\310\221alle\2765\330\342\330Z\"L\200b!\264\304\325\3301\226\240\027(\r\365/C*\334\214\213#\" \206u\343\315HcB$KB}\353\267\340@\203\275\203\211]\033e\026\234];#\242\226H1\027v\013\232VF\331Z\027\203O\rr\226ZUK\252\334\002\ra\210\035Yt\243\010\016D\2517\273\255\322\221\224z~\274\235\3153\302\370\343,\271\214m\002Y\030\200\225\374(\032rt\326f1\221\014\372wp\277zAZm\205\214d\301\316\301\214\354\323\332nB\326\021/\323\220\330,\033<\331\322\242\020h!@l\002F\366\2627\367\320C\336H\305\037`E\260\206\2521B\343c\010\246\350\2219\006{`\247aT\037\336*\224\313\\\031 \244\002\257\267+rG\026Y$\022\027\031\306,|\314/\300_\24367\221k\224i\217\307\355\207\354(,\031\363M\252T\314|CP8""\272<\020\t5twu>\023Q\230\223\253\005x\273\233\3218\004a\215\024A\231|\006\314Xu\370\341D\307\211%\261C\306\353a\242\364]\364\234~\274lR#f\262\360\037\344\212\376(\321\327\024\231\374\220f\300(Y\347\004\265\344\2652\325\273\320\345\310\377v\345\352\265\231H\212k?}\332\3601\350\340\276}\270\361l%\211\244\327\315\273\203\224\225\253L\032\035\330\330\216\346\t\022tt\347jNf\352W\351\222\t\345\274\251\235W\236\377%\255\344\0368p\235^\325\224\347\326Q\364\336\322\032\3347\033\207\372\024DF\004\367\333C%\2104f\317\307z\022\342\363\211\371\332Q\361>\232\202}\232u\221g\2376\342\301z\217]\020~\234\t\017\013\260Q\t*\205ge\2503'n\346\254\024\025\r\252l\323\270[:YI\026$\254\312s\2223\010\251\262\241\356\022\022\254h%8M\242\250~Y8p\242]\221\322\224\225\007\300~,\313\377\027rE8P\220_\010\235\021";
+    PyObject *data = __Pyx_DecompressString(cstring, 1729, 2);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1635 bytes) */
-const char* const cstring = "x\332uTMW\033\307\022\205ga\217\260\300\022\222A\330\370\274\3011`;\201D\t\261\035\234\023?=\300\216s\210\215\260\023c;9sZ3-4\2114#\315\007A\316\307\363R\313^\366r\226\263\234\245\226Zj\331\313Y\352'\360\023^Uk0$q8\342tuuu\325\255[\267g\355\211\355Q\325\253\023O\335\354xu\333RMW5h\303\254R\207x\264\321Q]\3171u\217:\030d\251\273\333\273\253\353\367\326Ub\031\252C\177\242\272\347\252\256_\325\033\304u\251\253\3325\265\352\233\r\317\264T\257\323\242\356\232\372\270\246vl_\265(5T\317V[\020w\366\202W\247\226\352R\017\ru\205X\226\355\021\317\264-\r\256\233\326\301\212j\230\016\0241\017)\336~H\032.]{\332\302\010\322x\275\005\300~|@\014C\203k\324u\364\217[\320\203CN\026\270i[\272\331\240\216\246\313\346\326Z\235\243\262\325\301{;\246\353}\373\364\373\355'\266EO\022\356\022O\257k\332n\347\010\3761H{B\217\274=Z\333\333\306\320\275\355\335\235\362\346\3663@Hk~\343\205i\034PO\356\032\324uG\333\357v\267\312\317\267\277\2630\237>\312\332\320~\246\035\227\264Z\3242\210\333\001@\366\232n;\266\017,Q\267Jk\266C5\323\320u\340\367\200\272z\335l\030Z\2138\324\362\264\272\327l\340\031\372\300!3i\232$O\203j\246G\233\270\205D\232\t\2349D\247U\242\377\254\303\261\014\032\265\255\031f\255\246\275K\002\264\370\216\013\224\236=\265l\203\276\377\244\345\330-\327 \036\371\2474\357K`\230n\313v)\265\374\246\024\222V3-\030\023\320\251\271\036\2516\350Ik\232V\363-]\323\240\035k\024)\017\\\317\257B\203\360{W\020m\027\331F\303\267\314\266\217\264%iL\363\300\002\036\215\021C\246\345R\307\373\013$\315\004RNxG\346\376\013J5\250\203\246\013\327\360\246\274\355\331p\251i\037R`\320\323Z\r \325\320l\030\212i\034iZ\223\000\323\360\327\264\r\037\332\3200\3208\355\306\"MpZ\364\227S\242~\221\312p\321\207a'\253\354\0217P4Y\260\364(:q\270\232;\262\345\020\320\200\204\200\031*6I\013\367\370\314p=$2\361\351\355\221\205I\020\372\237\024\204\016\034h\322\023.I\361\023o\262\205\231\321\223c\t\005m\311j\222V\302zgh5\307n\"0\364\270u\2020\245\014q\217@q\005\240\266\265)\265n\330\326\226C\016lk\327\201\007\204\333\347""\360L\376\244\374d\007\345Z\362q\"@iQ\320W\253\345\320C\323\366]\254\211\010\264\344\rI4\243\217\300Z\262\374\355[\3607\177\342\220\022\323\264\266\017\204\312Y\236F\214\270\037\365\n\210\375\206\347P\317w@\016@M2y\260\014Z#p\226$\202\017\223\247%\2373\350\335\247\356h2\311|@\252\036\261t\232l\221%1\366E/w<=61\317\307\343\3245q\355\223\350R\357\367\301\267\342eUT\365\343\363c\023\312\3337,\317\312\261r\251\333\036\246\346y\236\227\371\313\200\206\353\241\023\345\243r\364\262G\373\237\017\3765X<\236\034\233Hw/t\333\2612\303n\361u\336\016\306\317\230\220+\235\351\336c\2371\022g\246\316\354\206\231K\3357<\307o\007\017\303\225\250\020\355\367\236\365\307\343l.\316\344Y\211=\342\245a\352b\367>k\006\245\267\343\307\331\261\363\027\216g\020\325\257\354\003V\211\2254bZ\010\236\207\271pq\004\267\303\316\261\022\024\0263\267\300\371\221\270\363\260\337\020{\257\304\253\327\020\215!\363<\005=\274\016\241\341\"W\202TP\016*\247W\277\340\233\374Mx9\324\243b\257\320\253\364\310\360\375\251\n\354\033\336\014\241P\221O\212\353w\"\022\375\326\2777(\rv\304\376\313X\231\022S\313\001\211\225\351n\235\035\360J\234\311\261\034[\341W\203\257\303\257\201\264\037\372\2718\273\300\313q\366\032\307\332\351I\004PdG\222\264T\226M\362\325\240\035Ck\305\240\020T\0023lc@A\344o\004e\261\2043K\000+\242x;\\\214\225\213\335R\234\271\302o\005\367\303f\017\314K\335\337\370g\234\304\331+|\221\337\013J\342\306\206\330\330\031l\211\335\212\250\354\001\036\221\303{\231\031v\223\257\004\271`)h\207\027\3027\275b\177~\2604\220\325f\331+\376GX\211S\223b\362*/\001Z%\217\314\316\2616\252\001f\026+\340\217\025\350-V\240N\254\314\302p\225y\030\346\"\377*\314\207[\321D\364\n\344T>V\306&\026\370}\350\343H\334},\036\023A\252qjZL\257@\227J\226\245XY\\\226\204\315\260U\016\2564Zk( \260\322o\307\343\271b|\345\352q\006\307\237\305\316=q\361\032\177\216\344H\r\250H\333\365\340\254\010/v\327\273.\203\026\021\373\243\340\313\260\035\215\017SJw\022|\022\343r0\035\326\242\3620\225G\031\262\377\201\250K\361h#\346n\206\023\241T""\305\277a\312\237\"\013i\221\206\002r\205\241\305\220I\226\311\263\007\301bPz7jN\203R\360(\334\000\035\357\367+\250\227\027\342\305>\362s3\270\021\220@\"\333`\0251\213\275g\n\354i\260\001\351a`\3558{\231\355K=L,\005\3458\265(\347\342\204\205\360Yt!\352\364\307\373\271a\n\310\306\200t\367\\\367+>?*=\303n\363'\341\342\0202'OjV\314~\010\335d\341m\210\245\317Ao\305A\016\20605'f\227%\010\250w\304\034\030aV\r\316\213\345\273Q\273\247`\001\224\3457b\371?\360\004\013\263\254\312\317\211\253%Q\332\354\337\031\344\206\331YV\347\007 G$\252\200\362\275\274\"V\356F\277\367\313\303\314RP\021\313\367{%\00075\217O\342\313\036\310{\206]g\233bnU\254>\350\035\366+\022\330*\264\233]\020\013\037\205;Psz\360\023\274\230\377\003\n\316\372=";
-    PyObject *data = __Pyx_DecompressString(cstring, 1635, 1);
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1691 bytes) */
+const char* const cstring = "x\332uT\315W\333V\026\207\211Idb\300\306\346\253!'\"\r\220f\nS\2674I\223\236f\\B\322t\322\004\223tB\310\364\274\363,=\203ZY\262\365$\212\323i\233\245\227o\251\245\226Zj\351\245\227^\276\245\226\376\023\370\023z\257,>:\315p\200w\357}\367\363w\177O\353\317l\227\251\356\001u\325\315\266{`[\252\301U\235\231F\2159\324ef[\345\256ch.s\320\311R\267\267\266\3276\356n\250\324\322U\207\375\3104\227\253\334\253i&\345\234q\325\256\2535\3170]\303R\335v\223\361u\365I]m\333\236j1\246\253\256\2556\301\357|\200{\300,\2253\027\005u\225Z\226\355R\327\260-\002\341\206\265\277\252\352\206\003E\214C\206\321\217\250\311\331\372\363&zP\363\315Ch\354\207\007T\327\t\2041\356h\377h\302\014\016=9 \322\2664\303d\016\321\222\341\326\233\355\243\212\325\306\270\247\006w\277{\376\357\255g\266\305N\022nSW; d\273}\004\177\350D\236\261#w\207\325w\266\320ugk\373ies\353\005t\310\352\236\371\312\320\367\231\233h&\343|\250~\277\375\260\362r\353{\013\363i\311 T\267\233.i\332\334\030\026!\206\316,\027\024\306\251i\222\237X\233\323f\223Y:\345mh\326^\327l\307\366\000A\306k\254n;\014\0024\r\260\337g\\;0L\2354\251\003\031\310\201\333\300d\211\r\014I&B\022`\ttb\270\254\201*$\"\006\340\351P\215\325\250\366\023\321l\323\004H\211\316\\j\230|\210\014\321\215z\235\234\346\002\344<\207\003\352\347o-[g\357\277i:v\223\353\324\245\377/\315\373\022\350\006\007T\030\263\274F\3025\200\032P u\003\376Y\240\020\356\322\232\311N\346$\244\356Y\032!0\233\225\370\017/\270\353\325`Z\370=-\2132\307\265\240\340YF\313C\014\3234\206\261o\001\250\372\020.\303\342\314q\377\2471bpr\272\004\204\361k\240\264\316\034\0249\204ad\022\355\332\020\324\260\017\031`\016+6\001a\235\330\260!C?\"\244A\001v\370i\330\272\007c\020t\324\317\246\261h\003\214\026\373\371\014\256\237\023\nq\264\241\333\311\231\314\210\n\024M\017,=\364N\r\234\360\241\234\254\002\005H\010=C\305\006m\242\216\357\021\317C\232$>\213\036J\230\004[\377\023\235\320\200kMg\302#-~bMU\330\031;\271NZA9A5M\233\264u*\220\272c7\2601\264`cxBc\266\265\231\020]\267\255\207\016\335\267\255m""\007^\026\252/\341\215\374\211\366\251\006\351\233\311\253\305\206\022\211\001\253\232M\207\035\032\266\307\261\006V$\351\003J\252\017\277\016\353\351\361\227\217\304_\354\251!\241\024!-\017\000Lvw\3461dA:\375\020\370\341\240\320\276g\272\016s=\007\270\000\270\244k\007Igu\nwiV\370|\271$\375\350\021\257\251\243\361l0\200\306c|\270\250t]\300\\\227Z\032KU\004Q\216|\321-\034O\216\214-\370\243q\346\252\274\372I4\325\375\265\377\235|]\2235\355\370\342\310\230\362\356\255(\212J\254LuZ\203\314\202_\364+\376\353\200\205\033\241\023\025\243J\364\272\313z\237\367\377\326_:\036\037\031\313v.uZ\2612->\3627\374V0zN\204\\\331\\\347\256\370L\32087qN\033\344\246:o\375\202\177+x\024\256F\245h\267\373\2427\032\347\013q\256(\312\342\261_\036d.w\356\213FP~7z\234\037\271x\351x\032\273\372E|(\252\261\222\305\236\026\203\227a!\\\032\266\333\026\027D\031\n\313\351\217\300\370\261\274\375\250g\312\235=\271\367\006\274\321e\301\317\300\014oB\030x\336W\202LP\t\252g\241_\370\233\376\333p&\324\242\371n\251[\355\322\301\373S\225\304\267\276\025VB\350a\336\037\227\327oG4\372o\357n\277\334\177*w_\307\312\204\234X\th\254Lv\016\304\276_\215s\005Q\020\253\376\225\340\233\360\033\200\355?\275B\234_\364+q\376\252\217\325\263S\235\206\177'X\n\356\002\262-\371I\005\356\207\355\316\213#\304o\220\311\213q\177=\034\r\013qfRN^\003c.\374W\324\212\001\200\371\240\024T\003#la@I\026o\004\025\271\214\233M\307R\344\374\255p)Vf\304\236\274\366i\264$?{\334\373E\356\274\210\225\313\2352\264&\013x\235\233\0267\375\325\240\020,\007\255\360R\370\266;\337[\350/\367\223\244Sr\362\357!\300\232\027\031Q\2213+\300\200{\321\017\275\033=z\254\214\214\315\212=\3777\200\"3.\307\257\370e\030K)\342\022\346D\013\211\003\353\215\025\260\307\n\200\020+\037\370\320\312,\360@Y\200\275/\371_\205\305\360a4\026\355\001\363*\230n\321\277\017\303\034\311;O\344\023*i-\031x5h\235+O\221Zk>\230\262(\255#\327@\312\276\033\215\347\346\343\017\256\034\347\220)y\034\337\225\227\257\372/\021\241\204.*\270f\256\007\347\371z\271\263\321\341\002\000""\300\336\037\007_\206\255\010\360V:\343`Kz\\\t&\303zT\031d\212\310X\361;L_\216\207\212\234\273\031\216\205\t\201\256\371\215\360SD!+\263P 9a\2731dJ\312\024\305\003Xp\371\224\023>\013\312\301c\300q\267\273\333\253\"\265^\311W\273x=\244B\031\241\272\031\334\010h\2204yOT\345,\302\220+\211\347\301=\250\004O\247\025\347g\304n\302\241\261\345\240\022g\226\222\005:a)|\021]\212\332\275\321^a\220\001\334\321!\333\271\320\371\312_\030\346\236\026\267\374g\341\322\0002\247\017qV\316\342\222\363\360\242\344\362\347\300\321\371~\001\36611'gW\222&\240\336\221p`\233y5\270(W\356D\255\256\202\005\220\312\337\312\225\177\302\303-\315\212\232\177A^)\313\362f\357v\2770\310\317\212\003\177\037\350\211\230\225\220\3623\253r\365N\364k\2572\310-\007U\271r\277[\206\346&\026\360\031}\331\205'1-\256\213M9\267&\327\036t\017{\325\244\2615\0307\277(\027?\016\237B\315\311\376\217\360\312\376\000\034\266&\016";
+    PyObject *data = __Pyx_DecompressString(cstring, 1691, 1);
     if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
     const char* const bytes = __Pyx_PyBytes_AsString(data);
     #if !CYTHON_ASSUME_SAFE_MACROS
     if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
     #endif
-    #else /* compression: none (2588 bytes) */
-const char* const bytes = ".Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Optional[Dict]?add_notesrc/pythra/pythra/reconciler_cython.pyxAnyDictListMOVENoneOptionalPatch__Pyx_PyDict_NextRefREMOVEREPLACEStatefulWidgetStatelessWidgetUPDATEUnionactionall_keysappendasyncio.coroutinesbefore_idcchangeschild_parent_html_idchildren_keys__class_getitem__cline_in_tracebackcss_classcython_diff_children_recursivecython_diff_node_recursivecython_diff_propsdata_diff_children_recursive_diff_node_recursivedisposeenumerate_find_next_stable_html_id__func___generate_html_stubgetget_childrenget_stateget_unique_idhtml_idiignored_keys_insert_node_recursive_is_coroutineitemBuilderitemskeykeyskeys_to_removelast_placed_old_idx__main____module__moved_html_id__name__new_children_widgetsnew_htmlnew_html_stubnew_keynew_key_to_widgetnew_keys_setnew_propsnew_rendered_mapnew_typenew_valnew_widgetnew_widget_keyold_children_keysold_dataold_idxold_key_to_dataold_key_to_indexold_keys_setold_node_keyold_propsold_props_from_mapold_shared_classold_typeold_valonChangedonDragonPressedonTapparent_html_idparent_keypatch_datapatchespopprevious_mapprop_changespropspythra.pythra.reconciler_cythonpythra.reconcilerpythra.state__qualname__reconcilerrender_propsresultreturn__set_name__setdefaultstate__test__typingvalueswidgetwidget_instancewidget_type\320\0009\270\021\360\016\000\005\031\230\001\330\004\035\320\0350\260\017\270}\310M\320Yb\320bc\360\006\000\005\010\200z\220\023\220A\330\010\017\210q\340\004\031\230\023\230A\230Y\240e\2504\250r\260\023\260A\260Y\270e\3005\310\002\310!\360\n\000\005\t\210\007\210q\330\010\022\220)\2304\230q\240\001\330\010\022\220)\2304\230q\240\001\360\006\000\t\014\2108\2203\220a\330\014\r\360\006\000\t\014\2108\2203\220a\340\014\017\210z\230\021\230*\240F\250'\260\024\260X\270S\300\001\330\020\021\330\014\023\2201\220G\2301\340\004\013\210;\220m\2401\200\001\360\020\000\006""\007\360\022\000\005\010\200{\220#\220Q\330\010\t\340\004\031\230\034\240T\250\021\250!\360\006\000\005\010\200y\220\003\2201\330\010\022\320\022)\250\021\250,\3206F\300l\320RZ\320Z[\330\010\t\360\006\000\005\031\230\004\230A\230[\250\001\330\004\030\230\010\240\004\240A\240Q\360\006\000\005\010\200y\220\003\2209\230C\230z\250\025\250c\260\030\270\024\270Q\270a\340\010\022\320\022)\250\021\250,\3206F\300l\320RZ\320Z[\330\010\024\220J\230m\2501\330\010\030\230\n\320\"6\260a\260|\3008\3101\310L\320XY\330\010\r\320\r&\240a\330\010\016\210h\220g\230Q\330\014\021\220\021\220'\230\033\240H\250H\260A\260\\\300\021\330\020\034\230A\330\020\035\230Q\360\006\000\t\n\360\006\000\005\030\220x\230q\240\001\330\004\020\220\n\230-\240q\330\004\031\230\030\240\024\240Q\240i\250q\360\006\000\005\024\320\023$\240A\320%9\270\021\360\006\000\005\010\200y\220\010\320\030*\250!\330\010\013\2101\330\014\032\230)\240;\250m\2701\330\014\017\210|\2303\230a\330\020\032\230!\2308\2401\320$:\320:L\310D\320PQ\320QR\330\014\021\320\021*\250!\330\014\022\220(\230'\240\021\240%\240q\250\007\250z\270\030\300\031\310%\310q\360\006\000\005\026\220Z\230~\250Q\330\004\n\320\n\033\2301\230A\330\010\023\2201\330\010\027\220q\330\010\017\210z\230\021\330\010\033\2301\330\010\021\220\021\330\010\032\230!\330\010\026\220a\330\010\031\230\021\230!\230>\250\023\250D\260\005\260Z\270}\310A\360\010\000\005\034\230;\240i\250x\3207I\320Ia\320ab\330\004\016\320\016'\240q\330\010\020\220\004\220A\320\025&\240a\330\010\022\220-\230q\330\010\t\330\010\022\220.\240\001\330\010\t\330\010\t\200\001\330\027\030\330\032\033\360\014\000\006\007\360\020\000\005\010\200t\320\013\035\230T\240\024\240Q\330\010\t\340\004 \240\001\330\004\"\240!\360\n\000\005\t\210\007\210q\330\010\013\2104\210s\220!\330\014\033\2301\230G\240<\250q\260\001\340\004\010\210\n\220!\330\010\031\230\021\230&\240\016\250f\260A\340\004\023\2203\220a\220\177\240e\2501\330\004\023\2203\220a\320\027(\250\005\250Q\360\006\000\005\037\230m\2502\250Q\330\004""\t\320\t\"\240!\330\004\t\320\t\035\230Q\330\004\010\210\007\210q\330\010\023\220?\240!\2401\330\010\016\210h\220g\230Q\230e\2401\240G\250:\260X\270X\300Q\300l\320RW\320WX\330\010\032\230(\240$\240a\240q\330\010\013\210:\220Q\320\026'\240q\330\014\024\220O\240:\250Q\330\014\017\210q\330\020\025\220X\230Q\360\006\000\005%\240A\330\004!\240\021\240%\240r\250\024\250S\260\007\260y\300\001\300\021\340\004\021\220\021\360\006\000\005\t\210\003\210>\230\031\240!\2401\330\010\022\220*\230N\250!\340\010\013\2108\2203\220a\340\014\026\320\026+\2501\330\020\031\230\034\320%5\260\\\300\030\310\021\360\010\000\r\027\320\026&\240a\240q\330\014\017\210x\220r\230\021\330\020 \240\006\320&7\260q\270\010\300\001\300\021\330\020\034\230J\320&@\300\001\330\024\026\220b\230\003\320\0331\3201C\3006\310\021\340\020\026\220h\230g\240Q\240e\2501\330\024\034\230A\330\025'\320'7\260}\300A\340\014%\240Q\320&;\2701\360\006\000\r\031\230\n\320\"<\270A\330\020\022\220\"\220C\320\027-\320-?\270v\300Q\340\014\026\320\026-\250Q\330\020\034\320\034,\250L\270\010\300\016\310j\320XY";
+    #else /* compression: none (2698 bytes) */
+const char* const bytes = ".Note that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.Optional[Dict]?add_notesrc/pythra/pythra/reconciler_cython.pyxAnyDictListMOVENoneOptionalPatch__Pyx_PyDict_NextRefREMOVEREPLACEStatefulWidgetStatelessWidgetUPDATEUnionaction_adopt_positional_identitiesall_keysappendasyncio.coroutinesbefore_idcchangeschild_parent_html_idchildren_keys__class_getitem__cline_in_traceback_collect_detailscython_diff_children_recursivecython_diff_node_recursivecython_diff_propsdata_diff_children_recursive_diff_node_recursivedisposeenumerateextend_find_next_stable_html_id__func___generate_html_stubgetget_childrenget_stateget_unique_idhtml_idiignored_keys_insert_node_recursive_is_coroutineitemBuilderitemskeykeyskeys_to_removelast_placed_old_idx__main____module__moved_html_id__name__new_children_widgetsnew_htmlnew_html_stubnew_keynew_key_to_widgetnew_keys_setnew_propsnew_rendered_mapnew_typenew_valnew_widgetnew_widget_keyold_children_keysold_dataold_idxold_key_to_dataold_key_to_indexold_keys_setold_node_keyold_propsold_props_from_mapold_typeold_valonChangedonDragonPressedonTapparent_html_idparent_keypatch_datapatchespopprevious_mapprop_changespropspythra.pythra.reconciler_cythonpythra.reconcilerpythra.state__qualname__reconcilerremoved_keys_render_propsresultreturn__set_name__setdefaultstate__test__typing_update_patch_datavalueswidgetwidget_instancewidget_type\320\0009\270\021\360\016\000\005\031\230\001\330\004\035\320\0350\260\017\270}\310M\320Yb\320bc\360\006\000\005\010\200z\220\023\220A\330\010\017\210q\340\004\031\230\023\230A\230Y\240e\2504\250r\260\023\260A\260Y\270e\3005\310\002\310!\360\n\000\005\t\210\007\210q\330\010\022\220)\2304\230q\240\001\330\010\022\220)\2304\230q\240\001\360\006\000\t\014\2108\2203\220a\330\014\r\360\006\000\t\014\2108\2203\220a\340\014\017\210z\230\021\230*\240F\250'\260\024\260X\270S\300\001\330\020\021\330\014\023\2201\220G""\2301\340\004\013\210;\220m\2401\200\001\360\020\000\006\007\360\022\000\005\010\200{\220#\220Q\330\010\t\340\004\031\230\034\240T\250\021\250!\360\006\000\005\010\200y\220\003\2201\330\010\022\320\022)\250\021\250,\3206F\300l\320RZ\320Z[\330\010\t\360\006\000\005\031\230\004\230A\230[\250\001\330\004\030\230\010\240\004\240A\240Q\360\006\000\005\010\200y\220\003\2209\230C\230z\250\025\250c\260\030\270\024\270Q\270a\340\010\022\320\022)\250\021\250,\3206F\300l\320RZ\320Z[\330\010\024\220J\230n\250A\250Q\330\010\030\230\n\320\"6\260a\260|\3008\3101\310L\320XY\330\010\r\320\r&\240a\330\010\016\210h\220g\230Q\330\014\021\220\021\220'\230\033\240H\250H\260A\260\\\300\021\330\020\034\230A\330\020\035\230Q\360\006\000\t\017\210m\2307\240!\2408\2504\250q\3200A\300\021\330\010\t\360\006\000\005\030\220x\230q\240\001\340\004\020\220\n\230.\250\001\250\021\330\004\016\320\016\037\230q\240\014\250K\260q\330\004\031\230\030\240\024\240Q\240i\250q\360\006\000\005\024\320\023$\240A\320%9\270\021\360\006\000\005\010\200y\220\010\320\030*\250!\330\010\025\220Z\320\0372\260!\3203G\300{\320RS\330\010\013\2101\330\014\021\320\021*\250!\330\014\022\220(\230'\240\021\240%\240q\250\007\250z\270\030\300\031\310%\310q\360\006\000\005\017\320\016+\2501\330\010\020\220\004\220A\320\025&\240e\250:\260]\300$\300a\360\010\000\005\026\220Z\230~\250Q\330\004\n\320\n\033\2301\230A\330\010\023\2201\330\010\027\220q\330\010\017\210z\230\021\330\010\033\2301\330\010\021\220\021\330\010\032\230!\330\010\026\220a\330\010\031\230\021\230!\230>\250\023\250D\260\005\260Z\270}\310A\360\010\000\005\034\230;\240i\250x\3207I\320Ia\320ab\330\004\016\320\016'\240q\330\010\020\220\004\220A\320\025&\240a\330\010\022\220-\230q\330\010\t\330\010\022\220.\240\001\330\010\t\330\010\t\200\001\330\027\030\330\032\033\360\014\000\006\007\360\020\000\005\010\200t\320\013\035\230T\240\024\240Q\330\010\t\340\004 \240\001\330\004\"\240!\360\n\000\005\t\210\007\210q\330\010\013\2104\210s\220!\330\014\033\2301\230G\240<\250q""\260\001\340\004\010\210\n\220!\330\010\031\230\021\230&\240\016\250f\260A\340\004\023\2203\220a\220\177\240e\2501\330\004\023\2203\220a\320\027(\250\005\250Q\360\006\000\005\037\230m\2502\250Q\330\004\t\320\t\"\240!\330\004\t\320\t\035\230Q\330\004\010\210\007\210q\330\010\023\220?\240!\2401\330\010\016\210h\220g\230Q\230e\2401\240G\250:\260X\270X\300Q\300l\320RW\320WX\330\010\016\210m\2307\240!\2401\330\010\032\230(\240$\240a\240q\330\010\013\210:\220Q\320\026'\240q\330\014\024\220O\240:\250Q\330\014\017\210q\330\020\025\220X\230Q\360\006\000\005%\240A\330\004!\240\021\240%\240r\250\024\250S\260\007\260y\300\001\300\021\340\004\021\220\021\360\006\000\005\t\210\003\210>\230\031\240!\2401\330\010\022\220*\230N\250!\340\010\013\2108\2203\220a\340\014\026\320\026+\2501\330\020\031\230\034\320%5\260\\\300\030\310\021\360\010\000\r\027\320\026&\240a\240q\330\014\017\210x\220r\230\021\330\020 \240\006\320&7\260q\270\010\300\001\300\021\330\020\034\230J\320&@\300\001\330\024\026\220b\230\003\320\0331\3201C\3006\310\021\340\020\026\220h\230g\240Q\240e\2501\330\024\034\230A\330\025'\320'7\260}\300A\340\014%\240Q\320&;\2701\360\006\000\r\031\230\n\320\"<\270A\330\020\022\220\"\220C\320\027-\320-?\270v\300Q\340\014\026\320\026-\250Q\330\020\034\320\034,\250L\270\010\300\016\310j\320XY";
     PyObject *data = NULL;
     CYTHON_UNUSED_VAR(__Pyx_DecompressString);
     #endif
     PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
     Py_ssize_t pos = 0;
-    for (int i = 0; i < 115; i++) {
+    for (int i = 0; i < 118; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
       if (likely(string) && i >= 6) PyUnicode_InternInPlace(&string);
@@ -5934,7 +6006,7 @@ const char* const bytes = ".Note that Cython is deliberately stricter than PEP-4
       stringtab[i] = string;
       pos += bytes_length;
     }
-    for (int i = 115; i < 118; i++) {
+    for (int i = 118; i < 121; i++) {
       Py_ssize_t bytes_length = index[i].length;
       PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
       stringtab[i] = string;
@@ -5945,14 +6017,14 @@ const char* const bytes = ".Note that Cython is deliberately stricter than PEP-4
       }
     }
     Py_XDECREF(data);
-    for (Py_ssize_t i = 0; i < 118; i++) {
+    for (Py_ssize_t i = 0; i < 121; i++) {
       if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
         __PYX_ERR(0, 1, __pyx_L1_error)
       }
     }
     #if CYTHON_IMMORTAL_CONSTANTS
     {
-      PyObject **table = stringtab + 115;
+      PyObject **table = stringtab + 118;
       for (Py_ssize_t i=0; i<3; ++i) {
         #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
         Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
@@ -6001,7 +6073,7 @@ static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
     __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_pythra_pythra_reconciler_cyt, __pyx_mstate->__pyx_n_u_cython_diff_node_recursive, __pyx_mstate->__pyx_kp_b_iso88591_Q_T_y_1_6FlRZZ_A_AQ_y_9Cz_c_Qa, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
   }
   {
-    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 29, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 141};
+    const __Pyx_PyCode_New_function_description descr = {7, 0, 0, 29, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 147};
     PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_old_children_keys, __pyx_mstate->__pyx_n_u_new_children_widgets, __pyx_mstate->__pyx_n_u_parent_html_id, __pyx_mstate->__pyx_n_u_parent_key, __pyx_mstate->__pyx_n_u_result, __pyx_mstate->__pyx_n_u_previous_map, __pyx_mstate->__pyx_n_u_reconciler, __pyx_mstate->__pyx_n_u_old_key_to_data, __pyx_mstate->__pyx_n_u_new_key_to_widget, __pyx_mstate->__pyx_n_u_old_keys_set, __pyx_mstate->__pyx_n_u_new_keys_set, __pyx_mstate->__pyx_n_u_key, __pyx_mstate->__pyx_n_u_widget, __pyx_mstate->__pyx_n_u_keys_to_remove, __pyx_mstate->__pyx_n_u_Patch, __pyx_mstate->__pyx_n_u_StatefulWidget, __pyx_mstate->__pyx_n_u_old_data, __pyx_mstate->__pyx_n_u_widget_instance, __pyx_mstate->__pyx_n_u_state, __pyx_mstate->__pyx_n_u_last_placed_old_idx, __pyx_mstate->__pyx_n_u_old_key_to_index, __pyx_mstate->__pyx_n_u_old_idx, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_new_key, __pyx_mstate->__pyx_n_u_new_widget, __pyx_mstate->__pyx_n_u_moved_html_id, __pyx_mstate->__pyx_n_u_before_id, __pyx_mstate->__pyx_n_u_i, __pyx_mstate->__pyx_n_u_key};
     __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_src_pythra_pythra_reconciler_cyt, __pyx_mstate->__pyx_n_u_cython_diff_children_recursive, __pyx_mstate->__pyx_kp_b_iso88591_t_T_Q_q_4s_1G_q_fA_3a_e1_3a_Q_m, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
   }
@@ -85,7 +85,7 @@ def cython_diff_node_recursive(
     if old_type != new_type or new_widget.key != old_data.get("key"):
         # This is complex replacement logic; delegate to Python implementation
         reconciler._insert_node_recursive(new_widget, parent_html_id, parent_key, result, previous_map)
-        new_props = new_widget.render_props()
+        new_props = reconciler._render_props(new_widget)
         new_html_stub = reconciler._generate_html_stub(new_widget, old_data["html_id"], new_props)
         from pythra.reconciler import Patch
         result.patches.append(
@@ -94,11 +94,14 @@ def cython_diff_node_recursive(
                 "new_props": new_props
             })
         )
+        result.removed_keys.extend(old_data.get("children_keys", []))
         return
     
     # UPDATE path: types match, so check for prop changes
     cdef str html_id = old_data["html_id"]
-    new_props = new_widget.render_props()
+    # Shared per-pass memo: the Python and Rust paths see the same props object
+    new_props = reconciler._render_props(new_widget)
+    reconciler._collect_details(new_widget, new_props, result)
     old_props_from_map = old_data.get("props", {})
     
     # Use cython_diff_props for fast prop diffing
@@ -106,13 +109,16 @@ def cython_diff_node_recursive(
     
     # For non-renderable widgets, create UPDATE patch if props changed
     if new_type not in ["StatefulWidget", "StatelessWidget"]:
-        if prop_changes:
-            patch_data = {"props": new_props, "old_props": old_props_from_map}
-            if 'css_class' in prop_changes:
-                patch_data["props"]["old_shared_class"] = old_props_from_map.get("css_class")
+        patch_data = reconciler._update_patch_data(old_props_from_map, new_props, prop_changes)
+        if patch_data:
             from pythra.reconciler import Patch
             result.patches.append(Patch(action="UPDATE", html_id=html_id, data=patch_data))
     
+    # Unkeyed children adopt their old identities before children_keys is recorded
+    reconciler._adopt_positional_identities(
+        old_data.get("children_keys", []), new_widget.get_children(), previous_map
+    )
+
     # Update the rendered map
     new_widget_key = new_widget.get_unique_id()
     result.new_rendered_map[new_widget_key] = {
@@ -180,6 +186,7 @@ def cython_diff_children_recursive(
     for key in keys_to_remove:
         old_data = old_key_to_data[key]
         result.patches.append(Patch(action="REMOVE", html_id=old_data["html_id"], data={}))
+        result.removed_keys.append(key)
         widget_instance = old_data.get("widget_instance")
         if isinstance(widget_instance, StatefulWidget):
             state = widget_instance.get_state()
@@ -0,0 +1,211 @@
+// =============================================================================
+// PYTHRA PATCH APPLIER - Resident DOM Patch Interpreter
+// =============================================================================
+//
+// Inlined once into every generated page. Python sends reconciler patches as
+// plain JSON records (see pythra/patch_protocol.py) and this file applies them,
+// so each update only costs a JSON.parse instead of compiling a new script.
+//
+//   window.applyPatches([{op: "UPDATE", id: "fw_id_12", dom: {text: "3"}}, ...]);
+//
+// It also owns the event queue going the other way: engines call
+//   window.pythraDispatch(callbackId, kind, args);
+// and everything queued in the same task reaches Python as one
+// Api.dispatch_events([[callbackId, kind, args], ...]) call.
+//
+
+(function () {
+    if (window.applyPatches) return;
+    window._pythra_instances = window._pythra_instances || {};
+
+    function byId(id) {
+        return id ? document.getElementById(id) : null;
+    }
+
+    function elementFromHtml(html) {
+        var scratch = document.createElement('div');
+        scratch.innerHTML = html.trim();
+        return scratch.firstElementChild;
+    }
+
+    // --- DOM writes resolved on the Python side ---
+    function applyDom(el, id, dom) {
+        if (!dom) return;
+        if ('text' in dom) el.textContent = dom.text;
+        if (dom.cls) {
+            var old = dom.cls.remove;
+            dom.cls.add.forEach(function (cls) {
+                if (old === cls) return;
+                if (old && el.classList.contains(old)) el.classList.remove(old);
+                if (cls) el.classList.add(cls);
+            });
+        }
+        if ('src' in dom) el.src = dom.src;
+        if ('title' in dom) el.title = dom.title;
+        if ('input' in dom) {
+            // Only write when different, so the caret does not jump while typing.
+            var input = document.getElementById(id + '_input');
+            if (input && input.value !== dom.input) input.value = dom.input;
+        }
+        if ('helper' in dom) {
+            var helper = document.getElementById(id + '_helper');
+            if (helper) helper.textContent = dom.helper;
+        }
+        if (dom.inputData) {
+            // e.g. a TextField's commitOn / debounceMs (data-commit-on, data-debounce-ms).
+            var field = document.getElementById(id + '_input');
+            if (field) {
+                for (var name in dom.inputData) field.dataset[name] = dom.inputData[name];
+            }
+        }
+        if (dom.style) {
+            for (var prop in dom.style) {
+                try {
+                    el.style.setProperty(prop, dom.style[prop]);
+                } catch (e) {
+                    console.warn('Failed to set style property ' + prop + ':', e);
+                }
+            }
+        }
+    }
+
+    // --- JS engine initializers for inserted / replaced elements ---
+    function runInit(id, init) {
+        var Engine = window[init.engine];
+        var el = document.getElementById(id);
+        if (init.engine === 'SimpleBar') {
+            if (el && !el.simplebar && typeof SimpleBar !== 'undefined') new SimpleBar(el, init.options);
+            return;
+        }
+        if (init.engine === 'ResponsiveClipPath') {
+            if (!Engine || !window.generateRoundedPath) return;
+            var points = init.points.map(function (p) { return { x: p[0], y: p[1] }; });
+            var path = window.generateRoundedPath(points, init.radius);
+            window._pythra_instances[init.instance] = new Engine(
+                init.instance, path, init.viewBox[0], init.viewBox[1], { uniformArc: true, decimalPlaces: 2 });
+            return;
+        }
+        if (typeof Engine === 'undefined') {
+            if (init.replace) console.error('Failed to initialize ' + init.instance + '. Class "' + init.engine + '" not found.');
+            return;
+        }
+        if (init.needs_simplebar && !(el && el.simplebar)) return;
+        if (init.el && !el) return;
+        var existing = window._pythra_instances[init.instance];
+        if (existing && init.once) return;
+        if (existing && init.replace && typeof existing.destroy === 'function') existing.destroy();
+        window._pythra_instances[init.instance] = new Engine(init.el ? el : id, init.options);
+    }
+
+    function scheduleInits(id, inits) {
+        if (!inits) return;
+        // Deferred like the legacy scripts, so the element is fully in the DOM.
+        setTimeout(function () {
+            inits.forEach(function (init) {
+                try { runInit(id, init); } catch (e) { console.error('Init ' + init.engine + ' failed for ' + id + ':', e); }
+            });
+        }, 0);
+    }
+
+    function insertAt(parent, el, beforeId) {
+        var before = byId(beforeId);
+        if (before && !parent.contains(before)) before = null;
+        parent.insertBefore(el, before);
+    }
+
+    var ops = {
+        INSERT: function (p) {
+            var parent = byId(p.parent);
+            if (!parent) return console.error('INSERT: Parent element ' + p.parent + ' not found for ' + p.id);
+            var el = elementFromHtml(p.html);
+            if (!el) return console.warn('INSERT: No valid element created from HTML for ' + p.id);
+            insertAt(parent, el, p.before);
+            applyDom(el, p.id, p.dom);
+            scheduleInits(p.id, p.init);
+        },
+        UPDATE: function (p) {
+            var el = byId(p.id);
+            if (!el) return console.error('UPDATE: Element ' + p.id + ' not found in DOM');
+            applyDom(el, p.id, p.dom);
+        },
+        MOVE: function (p) {
+            var el = byId(p.id), parent = byId(p.parent);
+            if (!el || !parent) return console.error('MOVE: Element ' + p.id + ' or parent ' + p.parent + ' not found');
+            insertAt(parent, el, p.before);
+        },
+        REMOVE: function (p) {
+            var el = byId(p.id);
+            if (!el) return;
+            // Release SimpleBar's ResizeObserver before the node goes away.
+            if (el.simplebar) el.simplebar.unMount();
+            el.remove();
+        },
+        REPLACE: function (p) {
+            var el = byId(p.id);
+            if (!el) return;
+            el.outerHTML = p.html;
+            scheduleInits(p.id, p.init);
+        },
+        SVG_INSERT: function (p) {
+            var defs = byId(p.parent);
+            if (!defs) return console.warn('SVG defs container #' + p.parent + ' not found for INSERT of ' + p.id);
+            if (!byId(p.id)) defs.insertAdjacentHTML('beforeend', p.html);
+        }
+    };
+
+    // --- Batched events to Python ---
+    var eventQueue = [];
+
+    function flushEvents() {
+        var batch = eventQueue;
+        eventQueue = [];
+        if (window.pywebview && window.pywebview.dispatch_events) window.pywebview.dispatch_events(batch);
+    }
+
+    window.pythraDispatch = function (callbackId, kind, args) {
+        // Flushed in a microtask: after the current event handler, before the next frame.
+        if (eventQueue.length === 0) Promise.resolve().then(flushEvents);
+        eventQueue.push([callbackId, kind, args || []]);
+    };
+
+    // --- TextField input: per-field debounce and commit mode ---
+    // The input carries data-commit-on ('change' | 'blur' | 'submit') and
+    // data-debounce-ms. Keystrokes only reach Python in 'change' mode; blur and
+    // Enter send at once whatever is pending, and commit in the other modes.
+    var inputTimers = {};
+
+    function sendInput(name, value) {
+        clearTimeout(inputTimers[name]);
+        delete inputTimers[name];
+        if (window.pythraDispatch) window.pythraDispatch(name, 'input', [value]);
+        else if (window.pywebview) window.pywebview.on_input_changed(name, value, function () {});
+    }
+
+    window.pythraInput = function (name, el, trigger) {
+        var commitOn = el.dataset.commitOn || 'change';
+        var debounceMs = parseInt(el.dataset.debounceMs, 10) || 0;
+        if (trigger === 'input') {
+            if (commitOn !== 'change') return;
+            if (debounceMs <= 0) return sendInput(name, el.value);
+            clearTimeout(inputTimers[name]);
+            inputTimers[name] = setTimeout(function () { sendInput(name, el.value); }, debounceMs);
+            return;
+        }
+        // 'blur' or 'submit'. Enter also commits a 'blur' field.
+        var pending = name in inputTimers;
+        if (pending || trigger === commitOn || (trigger === 'submit' && commitOn === 'blur')) {
+            sendInput(name, el.value);
+        }
+    };
+
+    window.applyPatches = function (batch) {
+        for (var i = 0; i < batch.length; i++) {
+            var patch = batch[i];
+            try {
+                ops[patch.op](patch);
+            } catch (e) {
+                console.error('Error applying patch ' + patch.op + ' ' + patch.id + ':', e);
+            }
+        }
+    };
+})();
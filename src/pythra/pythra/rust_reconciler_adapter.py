@@ -53,7 +53,7 @@ class RustReconcilerAdapter:
             if widget is None:
                 return
             key = widget.get_unique_id()
-            props = widget.render_props()
+            props = self.reconciler._render_props(widget)
             children = [c.get_unique_id() for c in widget.get_children()]
             
             new_tree[key] = {
@@ -89,6 +89,19 @@ class RustReconcilerAdapter:
                 old_root_key, is_partial_reconciliation
             )
 
+        # One props memo spans tree translation, the Rust diff and patch translation,
+        # so each widget's render_props() runs once per pass.
+        with self.reconciler.props_pass():
+            return self._reconcile_with_rust(
+                previous_map, new_widget_root, parent_html_id
+            )
+
+    def _reconcile_with_rust(
+        self,
+        previous_map: Dict,
+        new_widget_root: Widget,
+        parent_html_id: str,
+    ) -> ReconciliationResult:
         # Convert to Rust-compatible formats
         t0 = time.perf_counter()
         old_tree = self._build_old_tree_map(previous_map)
@@ -127,12 +140,13 @@ class RustReconcilerAdapter:
                     data={}
                 ))
                 result.new_rendered_map.pop(key, None)
+                result.removed_keys.append(key)
 
             elif action == "INSERT":
                 # Generate HTML stub and track new node
                 widget = widget_lookup[key]
                 new_html_id = self.reconciler.id_generator.next_id()
-                props = widget.render_props()
+                props = self.reconciler._render_props(widget)
                 
                 # Use framework's HTML generation
                 stub = self.reconciler._generate_html_stub(widget, new_html_id, props)
@@ -191,16 +205,17 @@ class RustReconcilerAdapter:
                 # Property updates - compute diffs using framework helper
                 html_id = previous_map[key]["html_id"]
                 widget = widget_lookup[key]
-                new_props = widget.render_props()
+                new_props = self.reconciler._render_props(widget)
                 old_props = previous_map[key].get("props", {})
                 
                 # Use framework's prop diffing
                 prop_changes = self.reconciler._diff_props(old_props, new_props)
-                if prop_changes:
+                patch_data = self.reconciler._update_patch_data(old_props, new_props, prop_changes)
+                if patch_data:
                     result.patches.append(Patch(
                         action="UPDATE",
                         html_id=html_id,
-                        data=prop_changes
+                        data=patch_data
                     ))
                     if key in result.new_rendered_map:
                         result.new_rendered_map[key]["props"] = new_props
@@ -222,7 +237,9 @@ class RustReconcilerAdapter:
         # Attach timings into result for programmatic inspection
         result.new_rendered_map["__rust_adapter_timing__"] = timings
         # Handle framework-specific updates (lifecycle, CSS, callbacks)
-        self.reconciler._collect_details(new_widget_root, new_widget_root.render_props(), result)
+        self.reconciler._collect_details(
+            new_widget_root, self.reconciler._render_props(new_widget_root), result
+        )
 
         # print(f'Result: {result}')
 
@@ -0,0 +1,158 @@
+# =============================================================================
+# PYTHRA FRAME SCHEDULER - Coalesced, Frame-Aligned UI Updates
+# =============================================================================
+
+"""
+PyThra Frame Scheduler
+
+`setState()` can fire hundreds of times per second during a slider drag or a
+pan gesture. Instead of running a reconciliation cycle (and a `runJavaScript`
+round-trip) per burst, the framework asks this scheduler for the next flush:
+
+- The first request after an idle period flushes on the next event-loop turn,
+  so a single click is not delayed.
+- Further requests are held until the next frame boundary
+  (`1000 / max_fps` ms after the previous flush), so at most one cycle runs
+  per display frame no matter how many `setState()` calls arrive.
+
+`topmost_dirty_states()` then collapses the dirty set: a State whose widget
+sits below another dirty State's widget is dropped, because rebuilding the
+ancestor rebuilds it anyway. That only holds if nothing in between is reused
+as-is, so `dirty_ancestor_keys()` lists the widgets above any dirty State;
+the framework never reuses a memoized StatelessWidget subtree from that set.
+
+```python
+# config.yaml
+max_fps: 60     # 0 = no cap (flush on every event-loop turn, the old behavior)
+```
+"""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
+
+from PySide6.QtCore import QTimer
+
+
+class FrameScheduler:
+    """Runs `flush` at most once per frame, for any number of `request()` calls."""
+
+    def __init__(
+        self,
+        flush: Callable[[], None],
+        max_fps: float = 60,
+        clock: Callable[[], float] = time.monotonic,
+        timer: Callable[[int, Callable[[], None]], Any] = QTimer.singleShot,
+    ):
+        self._flush = flush
+        self._clock = clock
+        self._timer = timer
+        self.frame_interval = 1.0 / max_fps if max_fps and max_fps > 0 else 0.0
+        self._scheduled = False
+        self._holds = 0
+        self._deferred = False
+        self._last_flush: Optional[float] = None
+        self.frames = 0
+        self.coalesced = 0
+
+    @property
+    def pending(self) -> bool:
+        return self._scheduled
+
+    def request(self) -> None:
+        """Schedules a flush at the next frame boundary, unless one is already queued."""
+        if self._scheduled:
+            self.coalesced += 1
+            return
+        if self._holds:
+            # Inside hold(): the flush is scheduled once, when the outermost hold exits.
+            if self._deferred:
+                self.coalesced += 1
+            self._deferred = True
+            return
+        self._scheduled = True
+        self._timer(self._delay_ms(), self._run)
+
+    @contextmanager
+    def hold(self):
+        """
+        Defers every `request()` made inside the block to a single flush after
+        it, e.g. while `Api.dispatch_events` runs a batch of event handlers.
+        """
+        self._holds += 1
+        try:
+            yield self
+        finally:
+            self._holds -= 1
+            if not self._holds and self._deferred:
+                self._deferred = False
+                self.request()
+
+    def _delay_ms(self) -> int:
+        if not self.frame_interval or self._last_flush is None:
+            return 0
+        remaining = self._last_flush + self.frame_interval - self._clock()
+        return max(0, int(round(remaining * 1000)))
+
+    def _run(self) -> None:
+        # Cleared first: setState() calls made while flushing queue the next frame.
+        self._scheduled = False
+        self._last_flush = self._clock()
+        self.frames += 1
+        self._flush()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "frames": self.frames,
+            "coalesced": self.coalesced,
+            "max_fps": round(1.0 / self.frame_interval, 2) if self.frame_interval else None,
+        }
+
+
+def topmost_dirty_states(states: Iterable[Any], rendered_map: Dict[Any, Dict[str, Any]]) -> List[Any]:
+    """
+    Drops every State whose widget has a dirty ancestor, walking `parent_key`
+    links in the rendered map. States whose widget is gone are passed through
+    (the cycle reports and skips them).
+    """
+    by_key: Dict[Any, Any] = {}
+    passthrough: List[Any] = []
+    for state in states:
+        widget = state.get_widget()
+        if widget is None:
+            passthrough.append(state)
+        else:
+            by_key.setdefault(widget.get_unique_id(), state)
+
+    topmost = []
+    for key, state in by_key.items():
+        entry = rendered_map.get(key)
+        parent = entry.get("parent_key") if entry else None
+        seen = set()
+        while parent is not None and parent not in by_key and parent not in seen:
+            seen.add(parent)
+            parent_entry = rendered_map.get(parent)
+            parent = parent_entry.get("parent_key") if parent_entry else None
+        if parent is None or parent in seen:
+            topmost.append(state)
+    return passthrough + topmost
+
+
+def dirty_ancestor_keys(states: Iterable[Any], rendered_map: Dict[Any, Dict[str, Any]]) -> Set[Any]:
+    """
+    Returns the keys of every rendered ancestor of a dirty State's widget.
+    A subtree rooted at one of these contains pending work, so it must be
+    rebuilt rather than reused from the previous frame.
+    """
+    ancestors: Set[Any] = set()
+    for state in states:
+        widget = state.get_widget()
+        if widget is None:
+            continue
+        entry = rendered_map.get(widget.get_unique_id())
+        parent = entry.get("parent_key") if entry else None
+        while parent is not None and parent not in ancestors:
+            ancestors.add(parent)
+            parent_entry = rendered_map.get(parent)
+            parent = parent_entry.get("parent_key") if parent_entry else None
+    return ancestors
@@ -1,13 +1,20 @@
 # pythra/server.py
 
+import email.utils
 import http.server
-import socketserver
 import threading
 import os
 import atexit
 import signal
+import urllib.parse
 from pathlib import Path
-from typing import Dict
+from typing import Dict, Iterable, Optional, Tuple
+
+from .debug_utils import is_debug_enabled
+
+# Pre-compressed variants, in order of preference: `app.js.br`, then `app.js.gz`.
+PRECOMPRESSED_ENCODINGS = (("br", ".br"), ("gzip", ".gz"))
+
 
 class MultiDirectoryRequestHandler(http.server.SimpleHTTPRequestHandler):
     """
@@ -16,13 +23,39 @@ class MultiDirectoryRequestHandler(http.server.SimpleHTTPRequestHandler):
 
     - Requests to `/` are served from the main `base_directory`.
     - Requests to `/<prefix>/...` are served from the corresponding extra directory.
+
+    On top of plain static serving it handles:
+    - conditional requests: every file gets an `ETag` and `Last-Modified`, and
+      a matching `If-None-Match` / `If-Modified-Since` is answered with 304;
+    - pre-compressed files: if the client accepts it and `<file>.br` or
+      `<file>.gz` exists (and is not older than `<file>`), that is sent with a
+      `Content-Encoding` header instead;
+    - single `Range: bytes=...` requests (206 / 416), so media can seek;
+    - zero-copy bodies via `socket.sendfile`;
+    - HTTP/1.1 keep-alive, and request logging only in debug mode.
     """
     base_directory: str = None
     extra_directories: Dict[str, str] = {}
+    # URL prefixes whose files never change under the same name (e.g. hashed
+    # font subsets); they are cached for a year instead of revalidated.
+    immutable_prefixes: Tuple[str, ...] = ()
+
+    protocol_version = "HTTP/1.1"
+    extensions_map = {
+        **http.server.SimpleHTTPRequestHandler.extensions_map,
+        '.js': 'text/javascript',
+        '.mjs': 'text/javascript',
+        '.wasm': 'application/wasm',
+        '.ttf': 'font/ttf',
+        '.otf': 'font/otf',
+        '.woff': 'font/woff',
+        '.woff2': 'font/woff2',
+    }
 
     def __init__(self, *args, **kwargs):
         # We need to set the base directory for the parent class to work.
         # The actual routing will happen in our overridden translate_path.
+        self._body_range: Tuple[int, Optional[int]] = (0, None)
         super().__init__(*args, directory=self.base_directory, **kwargs)
 
     def translate_path(self, path: str) -> str:
@@ -40,16 +73,175 @@ class MultiDirectoryRequestHandler(http.server.SimpleHTTPRequestHandler):
             if path.startswith(url_prefix):
                 # It's a plugin asset. Rebuild the path.
                 # Example: /plugins/editor/style.css -> C:/project/plugins/editor/public/style.css
-                relative_path = path[len(url_prefix):]
-                translated_path = os.path.join(fs_path, relative_path)
-                print(f"[AssetServer] Plugin request: '{path}' -> '{translated_path}'")
-                return translated_path
+                relative_path = urllib.parse.unquote(path[len(url_prefix):])
+                parts = [part for part in relative_path.split('/') if part not in ('', '.', '..')]
+                return os.path.join(fs_path, *parts)
 
         # If no prefix matched, it's a standard asset.
         # Let the parent class handle it relative to the base directory.
-        translated_path = super().translate_path(path)
-        print(f"[AssetServer] Base asset request: '{path}' -> '{translated_path}'")
-        return translated_path
+        return super().translate_path(path)
+
+    def send_head(self):
+        """
+        Sends the status line and headers for a file and returns it opened for
+        the body (or None when there is no body, e.g. 304 / 416 / errors).
+        """
+        path = self.translate_path(self.path)
+        if os.path.isdir(path) or not os.path.isfile(path):
+            # Directory redirects/listings and 404s are unchanged.
+            return super().send_head()
+
+        encoding, served_path = self._negotiate_encoding(path)
+        try:
+            f = open(served_path, 'rb')
+        except OSError:
+            self.send_error(http.HTTPStatus.NOT_FOUND, "File not found")
+            return None
+
+        try:
+            stat = os.fstat(f.fileno())
+            size = stat.st_size
+            etag = f'"{stat.st_mtime_ns:x}-{size:x}{"-" + encoding if encoding else ""}"'
+
+            if self._not_modified(etag, stat.st_mtime):
+                f.close()
+                self.send_response(http.HTTPStatus.NOT_MODIFIED)
+                self._send_cache_headers(etag, stat.st_mtime)
+                self.end_headers()
+                return None
+
+            byte_range = self._requested_range(size, etag, stat.st_mtime)
+            if byte_range == "unsatisfiable":
+                f.close()
+                self.send_response(http.HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE)
+                self.send_header("Content-Range", f"bytes */{size}")
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+                return None
+
+            if byte_range is None:
+                self.send_response(http.HTTPStatus.OK)
+                start, length = 0, size
+            else:
+                start, end = byte_range
+                length = end - start + 1
+                self.send_response(http.HTTPStatus.PARTIAL_CONTENT)
+                self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+
+            self.send_header("Content-Type", self.guess_type(path))
+            if encoding:
+                self.send_header("Content-Encoding", encoding)
+            self.send_header("Content-Length", str(length))
+            self._send_cache_headers(etag, stat.st_mtime)
+            self.end_headers()
+            self._body_range = (start, length)
+            return f
+        except:
+            f.close()
+            raise
+
+    def copyfile(self, source, outputfile):
+        """Sends the (ranged) body straight from the file to the socket."""
+        offset, count = self._body_range
+        self._body_range = (0, None)
+        try:
+            # Uses os.sendfile where available, and falls back to send() otherwise.
+            self.connection.sendfile(source, offset, count)
+        except (BrokenPipeError, ConnectionResetError):
+            # The client went away mid-body (e.g. a video seek); nothing to do.
+            self.close_connection = True
+
+    def _negotiate_encoding(self, path: str) -> Tuple[Optional[str], str]:
+        """Picks a fresh pre-compressed variant the client accepts, if there is one."""
+        accepted = self._accepted_encodings()
+        if not accepted:
+            return None, path
+        original_mtime = os.stat(path).st_mtime
+        for encoding, suffix in PRECOMPRESSED_ENCODINGS:
+            if encoding not in accepted:
+                continue
+            variant = path + suffix
+            try:
+                # A variant older than its source is stale; ignore it.
+                if os.stat(variant).st_mtime >= original_mtime:
+                    return encoding, variant
+            except OSError:
+                continue
+        return None, path
+
+    def _accepted_encodings(self) -> set:
+        accepted = set()
+        for item in self.headers.get("Accept-Encoding", "").split(","):
+            name, _, params = item.strip().partition(";")
+            q = params.strip().lower()
+            if q.startswith("q="):
+                try:
+                    if float(q[2:]) == 0:
+                        continue
+                except ValueError:
+                    continue
+            accepted.add(name.strip().lower())
+        return accepted
+
+    def _not_modified(self, etag: str, mtime: float) -> bool:
+        if_none_match = self.headers.get("If-None-Match")
+        if if_none_match is not None:
+            # If-None-Match wins over If-Modified-Since when both are sent.
+            tags = [tag.strip() for tag in if_none_match.split(",")]
+            return "*" in tags or etag in tags or f"W/{etag}" in tags
+        return self._unchanged_since(self.headers.get("If-Modified-Since"), mtime)
+
+    def _requested_range(self, size: int, etag: str, mtime: float):
+        """
+        Returns (start, end) for a satisfiable single `Range: bytes=` request,
+        "unsatisfiable", or None to send the whole file (no/invalid/multi
+        range, or an `If-Range` that no longer matches).
+        """
+        header = self.headers.get("Range")
+        if not header or not header.startswith("bytes=") or "," in header:
+            return None
+        if_range = self.headers.get("If-Range")
+        if if_range and if_range != etag and not self._unchanged_since(if_range, mtime):
+            return None
+        first, _, last = header[len("bytes="):].strip().partition("-")
+        try:
+            if first:
+                start = int(first)
+                end = min(int(last), size - 1) if last else size - 1
+            elif last:
+                # "bytes=-500" is the last 500 bytes.
+                start, end = max(size - int(last), 0), size - 1
+            else:
+                return None
+        except ValueError:
+            return None
+        if start >= size or start > end:
+            return "unsatisfiable"
+        return start, end
+
+    @staticmethod
+    def _unchanged_since(value: Optional[str], mtime: float) -> bool:
+        if not value:
+            return False
+        try:
+            since = email.utils.parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return False
+        if since is None:
+            return False
+        # HTTP dates have whole-second precision.
+        return int(mtime) <= since.timestamp()
+
+    def _send_cache_headers(self, etag: str, mtime: float):
+        self.send_header("ETag", etag)
+        self.send_header("Last-Modified", self.date_time_string(mtime))
+        self.send_header("Vary", "Accept-Encoding")
+        path = self.path.split('?', 1)[0]
+        if any(path.startswith(f"/{prefix.strip('/')}/") for prefix in self.immutable_prefixes):
+            self.send_header("Cache-Control", "public, max-age=31536000, immutable")
+        else:
+            # Assets can change while developing: cache, but revalidate (cheap 304s).
+            self.send_header("Cache-Control", "no-cache")
 
     def end_headers(self):
         """Add CORS headers to allow cross-origin requests (e.g., for fonts)."""
@@ -58,20 +250,36 @@ class MultiDirectoryRequestHandler(http.server.SimpleHTTPRequestHandler):
         self.send_header('Accept-Ranges', 'bytes')
         super().end_headers()
 
+    def log_message(self, format, *args):
+        """Per-request logging is only printed in debug mode."""
+        if is_debug_enabled():
+            super().log_message(format, *args)
+
+
+class AssetHTTPServer(http.server.ThreadingHTTPServer):
+    """One thread per connection, so a page's images, fonts and media load in parallel."""
+    # The default listen backlog (5) overflows when the webview opens several
+    # connections at once, and dropped SYNs are only retried after ~1s.
+    request_queue_size = 128
+
 
 class AssetServer(threading.Thread):
     """
     A multi-directory static file server that runs in a background thread.
     It serves a main asset directory and additional directories for plugins.
     """
-    def __init__(self, directory: str, port: int = 8000, extra_serve_dirs: Dict[str, str] = None):
+    def __init__(self, directory: str, port: int = 8000, extra_serve_dirs: Dict[str, str] = None,
+                 immutable_prefixes: Iterable[str] = ()):
         """
         Args:
             directory (str): The main directory to serve files from (e.g., project's `assets`).
-            port (int): The port to listen on.
+            port (int): The port to listen on (0 picks a free port; see `self.port` once `ready` is set).
             extra_serve_dirs (Dict[str, str]): A mapping of URL prefixes to filesystem
                                               directories for plugins.
                                               e.g., {"plugins/editor": "/path/to/editor/public"}
+            immutable_prefixes (Iterable[str]): URL prefixes whose files never change
+                                                under the same name; browsers may cache
+                                                them without revalidating.
         """
         super().__init__()
         # Run the server thread as a daemon so it won't block interpreter exit
@@ -80,7 +288,9 @@ class AssetServer(threading.Thread):
         self.directory = directory
         self.port = port
         self.extra_serve_dirs = extra_serve_dirs or {}
+        self.immutable_prefixes = tuple(immutable_prefixes)
         self.server = None
+        self.ready = threading.Event()  # Set once the socket is bound
         self._shutdown_registered = False
 
     def run(self):
@@ -91,18 +301,19 @@ class AssetServer(threading.Thread):
         class Handler(MultiDirectoryRequestHandler):
             base_directory = self.directory
             extra_directories = self.extra_serve_dirs
+            immutable_prefixes = self.immutable_prefixes
 
         # Use a context manager for robust server setup and teardown
-        # Use context manager for robust server setup and teardown
-
         try:
-            with socketserver.TCPServer(("", self.port), Handler) as httpd:
+            with AssetHTTPServer(("", self.port), Handler) as httpd:
+                self.port = httpd.server_address[1]
                 print(f"✅ Asset server started on http://localhost:{self.port}")
                 print(f"   Serving main assets from: {self.directory}")
                 for prefix, path in self.extra_serve_dirs.items():
                     print(f"   Serving plugin '{prefix}' from: {path}")
                 
                 self.server = httpd
+                self.ready.set()
                 httpd.serve_forever()
         except OSError as e:
             print(f"❌ FATAL: Could not start asset server on port {self.port}. Is it already in use?")
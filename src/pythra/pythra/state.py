@@ -25,7 +25,6 @@ remember things and change over time (like counters, form inputs, shopping carts
 
 import weakref
 import time
-from PySide6.QtCore import QTimer
 from typing import Optional, TYPE_CHECKING
 
 # Import base classes needed at runtime
@@ -142,9 +141,38 @@ class StatelessWidget(Widget):
     **Key principle:**
     The build() method should always return the same widget structure
     when given the same constructor parameters. No surprises, no changes!
+
+    **Skipping rebuilds (memoization):**
+    When the framework finds the previous instance of this widget (same key, or
+    the very same object reused across builds) it asks `shouldRebuild(oldWidget)`.
+    If that returns False, the old built subtree is reused as-is and the
+    reconciler skips diffing it. Two ways to opt in:
+    ```python
+    AppSidebar(key=Key("sidebar"), const=True)      # inputs never change
+
+    class Title(StatelessWidget):
+        def shouldRebuild(self, oldWidget):          # or define __eq__
+            return self.text != oldWidget.text
+    ```
     """
-    def __init__(self, key: Optional[Key] = None):
+    def __init__(self, key: Optional[Key] = None, const: bool = False):
         super().__init__(key=key)
+        self.const = const
+        # Set by the framework on each build: True when the previous subtree was reused.
+        self._reused_build: bool = False
+
+    def shouldRebuild(self, oldWidget: "StatelessWidget") -> bool:
+        """
+        Whether build() must run again, given the previous instance at this position.
+
+        Default: `const` widgets never rebuild; widgets whose class defines
+        `__eq__` rebuild only when `self != oldWidget`; everything else rebuilds.
+        """
+        if getattr(self, "const", False):  # subclasses may skip super().__init__
+            return False
+        if type(self).__eq__ is not object.__eq__:
+            return self != oldWidget
+        return True
 
     def build(self) -> Widget:
         """
@@ -366,6 +394,7 @@ class State:
          snack_bar_widget.toggle(True) # Assuming this triggers JS show
          duration_sec = getattr(snack_bar_widget, 'duration', 3)
          duration_ms = int(duration_sec * 1000)
+         from PySide6.QtCore import QTimer  # Local: importing state must not pull in Qt.
          QTimer.singleShot(duration_ms, lambda: self._schedule_snackbar_hide(snack_bar_id))
 
 
@@ -0,0 +1,118 @@
+# =============================================================================
+# PYTHRA STYLE REGISTRY - Bounded, Garbage-Collected shared_styles Tables
+# =============================================================================
+
+"""
+PyThra Shared Style Registry
+
+Every styled widget class keeps a class-level `shared_styles` table mapping a
+`style_key` to a generated class name such as `shared-container-7`. Animated
+widths, colors and transforms mint a new key on almost every frame, so without
+collection those tables (and the live stylesheet) grow forever.
+
+`SharedStyleTable` is a drop-in `dict` for those tables that:
+- registers itself with the central `style_registry`,
+- mints names from a monotonic counter (`next_index()`), so evicting an entry
+  never lets a new style reuse a name that may still be on screen.
+
+The framework reference-counts classes through `StylesheetManager`, releasing
+them as the reconciler reports removals. When a class loses its last reference
+its rule is deleted from the page and `style_registry.collect()` evicts the
+table entry here as well.
+
+```python
+style_registry.metrics()
+# {"live": 412, "collected": 9381, "tables": {"Container": 300, "Text": 112, ...}}
+```
+"""
+
+import weakref
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+
+class SharedStyleTable(dict):
+    """`style_key -> css_class` for one widget class, tracked by `style_registry`."""
+
+    def __init__(self, name: Optional[str] = None):
+        super().__init__()
+        self.name = name
+        self._minted = 0
+        self._class_to_key: Dict[str, Any] = {}
+        style_registry.register(self)
+
+    def __set_name__(self, owner, attr_name):
+        # Declared as a class attribute: name the table after its widget class.
+        if self.name is None:
+            self.name = owner.__name__
+
+    def next_index(self) -> int:
+        """A class-name suffix that has never been handed out by this table."""
+        index = self._minted
+        self._minted += 1
+        return index
+
+    def __setitem__(self, style_key, css_class):
+        super().__setitem__(style_key, css_class)
+        self._class_to_key[css_class] = style_key
+
+    def evict(self, css_class: str) -> bool:
+        """Forgets the style_key that minted `css_class`. Returns True if it was present."""
+        style_key = self._class_to_key.pop(css_class, None)
+        if style_key is None or self.get(style_key) != css_class:
+            return False
+        super().__delitem__(style_key)
+        return True
+
+
+class StyleRegistry:
+    """Central index of every `SharedStyleTable`, with eviction and metrics."""
+
+    def __init__(self):
+        # Weak refs: tables are unhashable dicts, and die with their widget class.
+        self._table_refs: List["weakref.ref[SharedStyleTable]"] = []
+        self.collected = 0
+
+    def register(self, table: SharedStyleTable) -> None:
+        self._table_refs.append(weakref.ref(table))
+
+    @property
+    def _tables(self) -> List[SharedStyleTable]:
+        tables = [ref() for ref in self._table_refs]
+        if None in tables:
+            self._table_refs = [ref for ref in self._table_refs if ref() is not None]
+        return [table for table in tables if table is not None]
+
+    def collect(self, css_classes: Iterable[str]) -> int:
+        """Evicts the given (now unreferenced) classes from every table."""
+        pending: Set[str] = set(css_classes)
+        evicted = 0
+        if not pending:
+            return 0
+        for table in self._tables:
+            for css_class in [c for c in pending if c in table._class_to_key]:
+                if table.evict(css_class):
+                    evicted += 1
+                pending.discard(css_class)
+        self.collected += evicted
+        return evicted
+
+    def sweep(self, live_classes: Iterable[str]) -> int:
+        """Evicts every table entry whose class is not in `live_classes`."""
+        live = set(live_classes)
+        stale = [
+            css_class
+            for table in self._tables
+            for css_class in table._class_to_key
+            if css_class not in live
+        ]
+        return self.collect(stale)
+
+    def size(self) -> int:
+        return sum(len(table) for table in self._tables)
+
+    def metrics(self) -> Dict[str, Any]:
+        tables = {table.name or "?": len(table) for table in self._tables if len(table)}
+        return {"live": sum(tables.values()), "collected": self.collected, "tables": tables}
+
+
+style_registry = StyleRegistry()
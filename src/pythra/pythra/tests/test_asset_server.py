@@ -0,0 +1,277 @@
+"""Tests for the threaded, cache-aware AssetServer, plus a parallel-load benchmark."""
+
+import gzip
+import http.client
+import http.server
+import io
+import os
+import shutil
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stderr
+from unittest import mock
+
+from .. import server as server_module
+from ..server import AssetServer
+
+
+def start_server(directory, **kwargs):
+    server = AssetServer(directory, port=0, **kwargs)
+    server._shutdown_registered = True  # Keep the test runner's signal handlers.
+    server.start()
+    assert server.ready.wait(5)
+    return server
+
+
+class AssetServerTestCase(unittest.TestCase):
+    # One server per class: stopping one waits out serve_forever's poll interval.
+    @classmethod
+    def setUpClass(cls):
+        cls._tmp = tempfile.TemporaryDirectory()
+        cls.root = cls._tmp.name
+        cls.plugin_dir = os.path.join(cls.root, "plugin")
+        cls.server = start_server(
+            cls.root,
+            extra_serve_dirs={"plugins/editor": cls.plugin_dir},
+            immutable_prefixes=["plugins/editor"],
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        cls._tmp.cleanup()
+
+    def setUp(self):
+        shutil.rmtree(self.root)
+        os.makedirs(self.plugin_dir)
+        self.write("app.js", b"console.log('hello');\n" * 100)
+        self.write("video.mp4", bytes(range(256)) * 4)
+        self.write("plugin/style.css", b"body {}")
+
+    def write(self, name, data, mtime=None):
+        path = os.path.join(self.root, name)
+        with open(path, "wb") as f:
+            f.write(data)
+        if mtime is not None:
+            os.utime(path, (mtime, mtime))
+        return path
+
+    def request(self, path, headers=None, method="GET"):
+        connection = http.client.HTTPConnection("localhost", self.server.port, timeout=5)
+        connection.request(method, path, headers=headers or {})
+        response = connection.getresponse()
+        body = response.read()
+        connection.close()
+        return response, body
+
+
+class TestConditionalRequests(AssetServerTestCase):
+    def test_full_response_has_validators(self):
+        response, body = self.request("/app.js")
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(body), int(response.getheader("Content-Length")))
+        self.assertTrue(response.getheader("ETag"))
+        self.assertTrue(response.getheader("Last-Modified"))
+        self.assertEqual(response.getheader("Cache-Control"), "no-cache")
+        self.assertEqual(response.getheader("Content-Type"), "text/javascript")
+
+    def test_matching_etag_is_not_modified(self):
+        etag = self.request("/app.js")[0].getheader("ETag")
+        response, body = self.request("/app.js", {"If-None-Match": etag})
+        self.assertEqual(response.status, 304)
+        self.assertEqual(body, b"")
+        self.assertEqual(response.getheader("ETag"), etag)
+
+    def test_if_modified_since(self):
+        last_modified = self.request("/app.js")[0].getheader("Last-Modified")
+        self.assertEqual(self.request("/app.js", {"If-Modified-Since": last_modified})[0].status, 304)
+        self.assertEqual(
+            self.request("/app.js", {"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"})[0].status, 200
+        )
+
+    def test_changed_file_gets_a_new_etag(self):
+        etag = self.request("/app.js")[0].getheader("ETag")
+        self.write("app.js", b"changed", mtime=time.time() + 10)
+        response, body = self.request("/app.js", {"If-None-Match": etag})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(body, b"changed")
+
+    def test_immutable_prefixes_are_cached_for_long(self):
+        response, body = self.request("/plugins/editor/style.css")
+        self.assertEqual(body, b"body {}")
+        self.assertIn("immutable", response.getheader("Cache-Control"))
+
+
+class TestPrecompressed(AssetServerTestCase):
+    def test_gzip_variant_is_sent_when_accepted(self):
+        original = open(os.path.join(self.root, "app.js"), "rb").read()
+        self.write("app.js.gz", gzip.compress(original))
+        response, body = self.request("/app.js", {"Accept-Encoding": "gzip, deflate"})
+        self.assertEqual(response.getheader("Content-Encoding"), "gzip")
+        self.assertEqual(response.getheader("Content-Type"), "text/javascript")
+        self.assertEqual(gzip.decompress(body), original)
+        self.assertEqual(response.getheader("Vary"), "Accept-Encoding")
+
+    def test_brotli_is_preferred(self):
+        self.write("app.js.gz", b"gz")
+        self.write("app.js.br", b"br")
+        response, body = self.request("/app.js", {"Accept-Encoding": "gzip, br"})
+        self.assertEqual((response.getheader("Content-Encoding"), body), ("br", b"br"))
+
+    def test_identity_without_accept_encoding_or_with_q0(self):
+        self.write("app.js.gz", b"gz")
+        for headers in ({}, {"Accept-Encoding": "gzip;q=0"}):
+            response, _ = self.request("/app.js", headers)
+            self.assertIsNone(response.getheader("Content-Encoding"))
+
+    def test_stale_variant_is_ignored(self):
+        self.write("app.js.gz", b"old", mtime=time.time() - 100)
+        response, _ = self.request("/app.js", {"Accept-Encoding": "gzip"})
+        self.assertIsNone(response.getheader("Content-Encoding"))
+
+    def test_variants_have_their_own_etag(self):
+        self.write("app.js.gz", b"gz")
+        plain = self.request("/app.js")[0].getheader("ETag")
+        encoded = self.request("/app.js", {"Accept-Encoding": "gzip"})[0].getheader("ETag")
+        self.assertNotEqual(plain, encoded)
+
+
+class TestRanges(AssetServerTestCase):
+    def test_byte_range(self):
+        response, body = self.request("/video.mp4", {"Range": "bytes=10-19"})
+        self.assertEqual(response.status, 206)
+        self.assertEqual(body, bytes(range(10, 20)))
+        self.assertEqual(response.getheader("Content-Range"), "bytes 10-19/1024")
+
+    def test_open_ended_and_suffix_ranges(self):
+        self.assertEqual(self.request("/video.mp4", {"Range": "bytes=1020-"})[1], bytes(range(252, 256)))
+        self.assertEqual(self.request("/video.mp4", {"Range": "bytes=-2"})[1], bytes([254, 255]))
+
+    def test_unsatisfiable_range(self):
+        response, _ = self.request("/video.mp4", {"Range": "bytes=5000-"})
+        self.assertEqual(response.status, 416)
+        self.assertEqual(response.getheader("Content-Range"), "bytes */1024")
+
+    def test_stale_if_range_sends_the_whole_file(self):
+        response, body = self.request("/video.mp4", {"Range": "bytes=0-1", "If-Range": '"old"'})
+        self.assertEqual(response.status, 200)
+        self.assertEqual(len(body), 1024)
+
+    def test_head_sends_no_body(self):
+        response, body = self.request("/video.mp4", method="HEAD")
+        self.assertEqual((response.status, body), (200, b""))
+        self.assertEqual(response.getheader("Content-Length"), "1024")
+
+
+class TestServing(AssetServerTestCase):
+    def test_missing_file_is_404(self):
+        self.assertEqual(self.request("/nope.png")[0].status, 404)
+
+    def test_plugin_prefix_cannot_escape_its_directory(self):
+        self.assertEqual(self.request("/plugins/editor/../app.js")[0].status, 404)
+        self.assertEqual(self.request("/plugins/editor/%2e%2e/app.js")[0].status, 404)
+
+    def test_keep_alive_connection_serves_several_requests(self):
+        connection = http.client.HTTPConnection("localhost", self.server.port, timeout=5)
+        for path in ("/app.js", "/video.mp4", "/app.js"):
+            connection.request("GET", path)
+            response = connection.getresponse()
+            response.read()
+            self.assertEqual(response.status, 200)
+        connection.close()
+
+    def test_stalled_client_does_not_block_others(self):
+        stalled = socket.create_connection(("localhost", self.server.port))
+        stalled.sendall(b"GET /app.js HTTP/1.1\r\n")  # Never finishes its headers.
+        try:
+            start = time.perf_counter()
+            self.assertEqual(self.request("/video.mp4")[0].status, 200)
+            self.assertLess(time.perf_counter() - start, 1)
+        finally:
+            stalled.close()
+
+    def test_requests_are_only_logged_in_debug_mode(self):
+        for debug, expected in ((False, ""), (True, "GET /app.js")):
+            log = io.StringIO()
+            with mock.patch.object(server_module, "is_debug_enabled", return_value=debug), redirect_stderr(log):
+                self.request("/app.js")
+            self.assertIn(expected, log.getvalue())
+            if not debug:
+                self.assertEqual(log.getvalue(), "")
+
+
+class QuietSimpleHandler(http.server.SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+class AssetServerBenchmark(unittest.TestCase):
+    """Prints the time to fetch a page's worth of assets in parallel, old server vs new.
+
+    Uses 127.0.0.1 so name resolution is not part of the numbers.
+    """
+
+    FILES = 40
+    CLIENTS = 8
+
+    def test_parallel_asset_load(self):
+        with tempfile.TemporaryDirectory() as root:
+            for i in range(self.FILES):
+                with open(os.path.join(root, f"image{i}.png"), "wb") as f:
+                    f.write(os.urandom(64 * 1024))
+
+            # The previous setup: one request at a time, a new connection each.
+            handler = lambda *args, **kwargs: QuietSimpleHandler(*args, directory=root, **kwargs)
+            old = socketserver.TCPServer(("localhost", 0), handler)
+            threading.Thread(target=old.serve_forever, daemon=True).start()
+            try:
+                old_ms = self.load(old.server_address[1], keep_alive=False)
+            finally:
+                old.shutdown()
+                old.server_close()
+
+            new = start_server(root)
+            try:
+                new_ms = self.load(new.port, keep_alive=True)
+                revalidate_ms = self.load(new.port, keep_alive=True, revalidate=True)
+            finally:
+                new.stop()
+
+        print(f"\n[asset server benchmark] {self.FILES} x 64 KiB over {self.CLIENTS} clients | "
+              f"single-threaded: {old_ms:.1f} ms | threaded keep-alive: {new_ms:.1f} ms | "
+              f"304 revalidation: {revalidate_ms:.1f} ms")
+
+    def load(self, port, keep_alive, revalidate=False):
+        etags = {}
+
+        def client(names, revalidate=False):
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+            for name in names:
+                if not keep_alive:
+                    connection = http.client.HTTPConnection("127.0.0.1", port, timeout=10)
+                headers = {"If-None-Match": etags[name]} if revalidate else {}
+                connection.request("GET", "/" + name, headers=headers)
+                response = connection.getresponse()
+                response.read()
+                etags[name] = response.getheader("ETag")
+                if not keep_alive:
+                    connection.close()
+            connection.close()
+
+        names = [f"image{i}.png" for i in range(self.FILES)]
+        if revalidate:
+            client(names)  # Collect the ETags first.
+        batches = [names[i::self.CLIENTS] for i in range(self.CLIENTS)]
+        start = time.perf_counter()
+        with ThreadPoolExecutor(self.CLIENTS) as pool:
+            list(pool.map(lambda batch: client(batch, revalidate), batches))
+        return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    unittest.main()
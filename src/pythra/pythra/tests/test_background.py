@@ -0,0 +1,236 @@
+"""Tests for async / background handlers and GUI-thread marshalling of setState."""
+
+import asyncio
+import threading
+import time
+import unittest
+
+from PySide6.QtCore import QCoreApplication
+
+from ..background import AsyncLoop, GuiDispatcher, in_background
+from ..core import Framework
+from ..window.webwidget import Api
+
+
+def qt_app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+
+def process_events_until(condition, timeout=2.0):
+    app = qt_app()
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.001)
+    return condition()
+
+
+class ManualTimer:
+    """Collects scheduled callbacks so a test can run them one turn at a time."""
+
+    def __init__(self):
+        self.queue = []
+
+    def __call__(self, delay_ms, callback):
+        self.queue.append(callback)
+
+    def run_all(self, limit=100):
+        turns = 0
+        while self.queue and turns < limit:
+            self.queue.pop(0)()
+            turns += 1
+        return turns
+
+
+class TestAsyncLoop(unittest.TestCase):
+    def setUp(self):
+        self.timer = ManualTimer()
+        self.loop = AsyncLoop(pump_ms=0, timer=self.timer)
+
+    def tearDown(self):
+        self.loop.close()
+
+    def test_coroutine_runs_across_pumps_on_the_calling_thread(self):
+        steps = []
+
+        async def handler():
+            steps.append(threading.get_ident())
+            await asyncio.sleep(0)
+            steps.append(threading.get_ident())
+
+        self.loop.create_task(handler())
+        self.assertEqual(steps, [])  # Nothing runs inside the slot itself.
+        self.timer.run_all()
+        self.assertEqual(steps, [threading.get_ident()] * 2)
+
+    def test_pumping_stops_when_idle(self):
+        async def handler():
+            await asyncio.sleep(0)
+
+        self.loop.create_task(handler())
+        self.timer.run_all()
+        self.assertEqual(self.loop.pending, 0)
+        self.assertEqual(self.timer.queue, [])
+
+    def test_failures_do_not_break_the_loop(self):
+        done = []
+
+        async def boom():
+            raise RuntimeError("boom")
+
+        async def fine():
+            done.append(True)
+
+        self.loop.create_task(boom())
+        self.loop.create_task(fine())
+        self.timer.run_all()
+        self.assertEqual(done, [True])
+
+    def test_close_cancels_pending_tasks(self):
+        cancelled = []
+
+        async def forever():
+            try:
+                await asyncio.sleep(3600)
+            except asyncio.CancelledError:
+                cancelled.append(True)
+                raise
+
+        self.loop.create_task(forever())
+        self.timer.queue.pop(0)()
+        self.loop.close()
+        self.assertEqual(cancelled, [True])
+        self.loop = AsyncLoop(pump_ms=0, timer=self.timer)
+
+
+class TestApiAsyncHandlers(unittest.TestCase):
+    def setUp(self):
+        self.api = Api()
+        self.api.clear_callbacks()
+        self.scheduled = []
+        self.api.run_coroutine = self.scheduled.append
+
+    def tearDown(self):
+        for coro in self.scheduled:
+            coro.close()
+        self.api.clear_callbacks()
+        self.api.run_coroutine = None
+
+    def test_coroutines_from_handlers_are_scheduled(self):
+        async def on_tap(details):
+            pass
+
+        self.api.register_callback("tap", on_tap)
+        self.api.register_callback("value", lambda value: None)
+        self.api.dispatch_events([["tap", "tap", [{}]], ["value", "input", ["x"]]])
+        self.assertEqual(len(self.scheduled), 1)
+        self.assertTrue(asyncio.iscoroutine(self.scheduled[0]))
+
+    def test_input_slot_schedules_async_handlers(self):
+        async def on_changed(value):
+            pass
+
+        self.api.register_callback("field", on_changed)
+        self.api.on_input_changed("field", "abc")
+        self.assertEqual(len(self.scheduled), 1)
+
+
+class TestGuiDispatcher(unittest.TestCase):
+    def setUp(self):
+        qt_app()
+        self.dispatcher = GuiDispatcher()
+
+    def test_calls_on_the_gui_thread_run_at_once(self):
+        ran = []
+        self.dispatcher.call(ran.append, 1)
+        self.assertEqual(ran, [1])
+
+    def test_calls_from_workers_run_on_the_gui_thread(self):
+        ran = []
+        worker = threading.Thread(target=lambda: self.dispatcher.call(lambda: ran.append(threading.get_ident())))
+        worker.start()
+        worker.join()
+        self.assertEqual(ran, [])  # Queued, not run on the worker.
+        self.assertTrue(process_events_until(lambda: ran))
+        self.assertEqual(ran, [threading.get_ident()])
+
+
+class FakeScheduler:
+    def __init__(self):
+        self.requests = []
+
+    def request(self):
+        self.requests.append(threading.get_ident())
+
+
+class FakeState:
+    pass
+
+
+class TestSetStateMarshalling(unittest.TestCase):
+    def setUp(self):
+        qt_app()
+        self.framework = Framework.__new__(Framework)
+        self.framework._pending_state_updates = set()
+        self.framework._reconciliation_requested = False
+        self.framework.frame_scheduler = FakeScheduler()
+        self.framework.gui_dispatcher = GuiDispatcher()
+
+    def test_worker_set_state_joins_the_next_frame_on_the_gui_thread(self):
+        states = [FakeState() for _ in range(3)]
+
+        @in_background
+        def scan(state):
+            time.sleep(0.01)
+            self.framework.request_reconciliation(state)
+
+        futures = [scan(state) for state in states]
+        for future in futures:
+            future.result(timeout=2)
+        self.assertEqual(self.framework._pending_state_updates, set())
+        self.assertTrue(process_events_until(lambda: len(self.framework._pending_state_updates) == 3))
+        self.assertEqual(set(self.framework.frame_scheduler.requests), {threading.get_ident()})
+
+
+class TestInBackground(unittest.TestCase):
+    def test_returns_a_future_and_runs_off_the_calling_thread(self):
+        @in_background
+        def work(x):
+            return x * 2, threading.get_ident()
+
+        value, thread_id = work(21).result(timeout=2)
+        self.assertEqual(value, 42)
+        self.assertNotEqual(thread_id, threading.get_ident())
+
+    def test_slow_handler_does_not_block_dispatch(self):
+        api = Api()
+        api.clear_callbacks()
+        release = threading.Event()
+
+        @in_background
+        def slow_query():
+            release.wait(2)
+
+        api.register_callback("query", slow_query)
+        start = time.perf_counter()
+        api.dispatch_events([["query", "press", []]])
+        elapsed = time.perf_counter() - start
+        release.set()
+        api.clear_callbacks()
+        self.assertLess(elapsed, 0.1)
+
+    def test_exceptions_stay_on_the_future(self):
+        @in_background
+        def boom():
+            raise ValueError("bad")
+
+        with self.assertRaises(ValueError):
+            boom().result(timeout=2)
+
+    def test_rejects_unknown_executor(self):
+        with self.assertRaises(ValueError):
+            in_background(executor="gpu")
+
+
+if __name__ == "__main__":
+    unittest.main()
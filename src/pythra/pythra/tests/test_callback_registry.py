@@ -0,0 +1,116 @@
+"""Tests for callback ownership and release in the Api bridge."""
+
+import unittest
+
+from ..window.webwidget import Api
+from ..reconciler import Reconciler
+from ..base import Widget, Key
+
+
+class Tappable(Widget):
+    def __init__(self, name, key=None):
+        super().__init__(key=key)
+        self.name = name
+        self.onTap = lambda: None
+
+    def render_props(self):
+        return {"onTapName": self.name, "onTapArg": []}
+
+
+class Box(Widget):
+    def __init__(self, key=None, children=None):
+        super().__init__(key=key, children=children)
+
+
+class TestCallbackOwnership(unittest.TestCase):
+    def setUp(self):
+        self.api = Api()
+        self.api.clear_callbacks()
+
+    def tearDown(self):
+        self.api.clear_callbacks()
+
+    def test_singleton_reinit_keeps_registry(self):
+        self.api.register_callback("cb", print, owner="w1")
+        self.assertIs(Api(), self.api)
+        self.assertIn("cb", Api().callbacks)
+
+    def test_release_owner_drops_its_callbacks(self):
+        self.api.register_callback("a", print, owner="w1")
+        self.api.register_callback("b", print, owner="w1")
+        self.api.register_callback("keep", print)
+        self.assertEqual(self.api.release_owner("w1"), 2)
+        self.assertEqual(set(self.api.callbacks), {"keep"})
+        stats = self.api.callback_registry_stats()
+        self.assertEqual((stats["callbacks"], stats["unowned"], stats["released"]), (1, 1, 2))
+
+    def test_shared_callback_survives_until_last_owner_goes(self):
+        self.api.register_callback("shared", print, owner="w1")
+        self.api.register_callback("shared", print, owner="w2")
+        self.api.release_owners(["w1"])
+        self.assertIn("shared", self.api.callbacks)
+        self.api.release_owners(["w2"])
+        self.assertNotIn("shared", self.api.callbacks)
+
+    def test_reconciler_records_owners_and_removals(self):
+        reconciler = Reconciler()
+        first = reconciler.reconcile({}, Box(key=Key("root"), children=[
+            Tappable("tap_a", key=Key("a")), Tappable("tap_b", key=Key("b")),
+        ]), "root-container")
+        self.assertEqual(first.callback_owners, {"tap_a": {Key("a")}, "tap_b": {Key("b")}})
+        self.api.register_owned_callbacks(first.registered_callbacks, first.callback_owners)
+
+        second = reconciler.reconcile(
+            first.new_rendered_map, Box(key=Key("root"), children=[Tappable("tap_b", key=Key("b"))]),
+            "root-container", old_root_key=Key("root"), is_partial_reconciliation=True,
+        )
+        self.api.release_owners(second.removed_keys)
+        self.assertEqual(set(self.api.callbacks), {"tap_b"})
+
+    def test_shared_name_survives_partial_removal_of_one_user(self):
+        reconciler = Reconciler()
+        first = reconciler.reconcile({}, Box(key=Key("root"), children=[
+            Tappable("increment", key=Key("a")),
+            Box(key=Key("s"), children=[Tappable("increment", key=Key("b"))]),
+        ]), "root-container")
+        self.assertEqual(first.callback_owners, {"increment": {Key("a"), Key("b")}})
+        self.api.register_owned_callbacks(first.registered_callbacks, first.callback_owners)
+
+        second = reconciler.reconcile(
+            first.new_rendered_map, Box(key=Key("s"), children=[]),
+            first.new_rendered_map[Key("s")]["parent_html_id"],
+            old_root_key=Key("s"), is_partial_reconciliation=True,
+        )
+        self.api.register_owned_callbacks(second.registered_callbacks, second.callback_owners)
+        self.api.release_owners(second.removed_keys)
+        self.assertIn("increment", self.api.callbacks)  # Key("a") still uses it
+
+        self.api.release_owners([Key("a")])
+        self.assertNotIn("increment", self.api.callbacks)
+
+    def test_renamed_callback_releases_the_old_name(self):
+        reconciler = Reconciler()
+        first = reconciler.reconcile({}, Box(key=Key("root"), children=[
+            Tappable("increment", key=Key("a")), Tappable("increment", key=Key("b")),
+        ]), "root-container")
+        self.api.register_owned_callbacks(first.registered_callbacks, first.callback_owners)
+
+        second = reconciler.reconcile(first.new_rendered_map, Box(key=Key("root"), children=[
+            Tappable("decrement", key=Key("a")), Tappable("increment", key=Key("b")),
+        ]), "root-container", old_root_key=Key("root"), is_partial_reconciliation=True)
+        self.assertEqual(second.stale_callbacks, {Key("a"): {"increment"}})
+        self.api.register_owned_callbacks(second.registered_callbacks, second.callback_owners)
+        self.api.release_stale_callbacks(second.stale_callbacks)
+        self.assertEqual(set(self.api.callbacks), {"increment", "decrement"})  # b still uses increment
+
+        third = reconciler.reconcile(second.new_rendered_map, Box(key=Key("root"), children=[
+            Tappable("decrement", key=Key("a")), Tappable("reset", key=Key("b")),
+        ]), "root-container", old_root_key=Key("root"), is_partial_reconciliation=True)
+        self.api.register_owned_callbacks(third.registered_callbacks, third.callback_owners)
+        self.assertEqual(self.api.release_stale_callbacks(third.stale_callbacks), 1)
+        self.assertEqual(set(self.api.callbacks), {"decrement", "reset"})
+        self.assertEqual(self.api.callback_registry_stats()["unowned"], 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
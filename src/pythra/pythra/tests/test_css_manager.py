@@ -0,0 +1,76 @@
+"""Tests for the incremental, reference-counted stylesheet manager."""
+
+import unittest
+
+from ..css_manager import StylesheetManager, css_details_for_entry
+
+
+class Styled:
+    generated = 0
+
+    def __init__(self, css_class, style_key):
+        self.css_class = css_class
+        self.style_key = style_key
+
+    def get_required_css_classes(self):
+        return {self.css_class}
+
+    @staticmethod
+    def generate_css_rule(style_key, css_class):
+        Styled.generated += 1
+        return f".{css_class} {{ color: {style_key}; }}"
+
+
+def entry(css_class, color, extra=""):
+    return {
+        "widget_instance": Styled(css_class, color),
+        "props": {"css_class": f"{css_class} {extra}".strip()},
+    }
+
+
+class TestStylesheetManager(unittest.TestCase):
+    def setUp(self):
+        Styled.generated = 0
+
+    def test_entry_details_include_required_and_prop_classes(self):
+        details = css_details_for_entry(entry("shared-a", "red", extra="custom"))
+        self.assertEqual(set(details), {"shared-a", "custom"})
+        self.assertEqual(css_details_for_entry({"widget_instance": object(), "props": {}}), {})
+
+    def test_reset_returns_one_rule_per_class(self):
+        manager = StylesheetManager()
+        css = manager.reset({"w1": entry("shared-a", "red"), "w2": entry("shared-a", "red")})
+        self.assertEqual(css, ".shared-a { color: red; }")
+        self.assertEqual(manager.refcount("shared-a"), 2)
+        self.assertFalse(manager.flush())
+
+    def test_delta_contains_only_changed_classes(self):
+        manager = StylesheetManager()
+        manager.reset({"w1": entry("shared-a", "red"), "w2": entry("shared-b", "blue")})
+
+        manager.update_entries({"w2": entry("shared-c", "green")})
+        delta = manager.flush()
+        self.assertEqual(delta.added, {"shared-c": ".shared-c { color: green; }"})
+        self.assertEqual(delta.removed, ["shared-b"])
+        self.assertEqual(manager.live_classes, {"shared-a", "shared-c"})
+
+    def test_class_survives_while_referenced(self):
+        manager = StylesheetManager()
+        manager.reset({"w1": entry("shared-a", "red"), "w2": entry("shared-a", "red")})
+        manager.release_entries(["w1"])
+        self.assertFalse(manager.flush())
+        manager.release_entries(["w2"])
+        self.assertEqual(manager.flush().removed, ["shared-a"])
+
+    def test_rule_text_is_cached_per_style_key(self):
+        manager = StylesheetManager()
+        manager.reset({"w1": entry("shared-a", "red")})
+        manager.release_entries(["w1"])
+        manager.flush()
+        manager.update_entries({"w1": entry("shared-a", "red")})
+        self.assertEqual(list(manager.flush().added), ["shared-a"])
+        self.assertEqual(Styled.generated, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+"""Tests for the batched `Api.dispatch_events` slot, plus a per-event vs batched microbenchmark."""
+
+import time
+import unittest
+from contextlib import nullcontext
+
+from ..events import TapDetails, PanUpdateDetails
+from ..scheduler import FrameScheduler
+from ..window.webwidget import Api
+
+
+class ImmediateTimer:
+    """Runs each scheduled flush at once, as if every bridge call got its own event-loop turn."""
+
+    def __call__(self, delay_ms, callback):
+        callback()
+
+
+class DispatchTestCase(unittest.TestCase):
+    def setUp(self):
+        self.api = Api()
+        self.api.clear_callbacks()
+        self.flushes = 0
+        self.scheduler = FrameScheduler(self._flush, max_fps=0, timer=ImmediateTimer())
+        self.api.batch_updates = self.scheduler.hold
+
+    def tearDown(self):
+        self.api.clear_callbacks()
+        self.api.batch_updates = nullcontext
+
+    def _flush(self):
+        self.flushes += 1
+
+    def set_state(self, *args):
+        """Stands in for a handler that calls setState."""
+        self.scheduler.request()
+
+
+class TestDispatchEvents(DispatchTestCase):
+    def test_kinds_shape_the_callback_arguments(self):
+        received = []
+        self.api.register_callback("tap", lambda d: received.append(type(d)))
+        self.api.register_callback("pan", lambda d: received.append((d.dx, d.dy)))
+        self.api.register_callback("drag", lambda v, ended: received.append((v, ended)))
+        self.api.register_callback("press", lambda *a: received.append(a))
+        self.api.register_callback("end", lambda: received.append("end"))
+        count = self.api.dispatch_events([
+            ["tap", "tap", [{}]],
+            ["pan", "pan_update", [{"dx": 3, "dy": -1}]],
+            ["drag", "drag", [0.25, False]],
+            ["press", "press", ["a", 1]],
+            ["end", "gesture", [{}]],
+        ])
+        self.assertEqual(count, 5)
+        self.assertEqual(received, [TapDetails, (3, -1), (0.25, False), ("a", 1), "end"])
+
+    def test_bad_events_do_not_stop_the_batch(self):
+        received = []
+        self.api.register_callback("ok", lambda *a: received.append(a))
+        self.api.register_callback("boom", lambda *a: 1 / 0)
+        count = self.api.dispatch_events([
+            ["missing", "press", []], ["ok", "unknown-kind", []], ["boom", "press", []],
+            ["malformed"], ["ok", "press", [1]],
+        ])
+        self.assertEqual((count, received), (1, [(1,)]))
+
+    def test_batch_runs_one_reconciliation_cycle(self):
+        for name in ("a", "b", "c"):
+            self.api.register_callback(name, self.set_state)
+        self.api.dispatch_events([[name, "press", []] for name in ("a", "b", "c", "a")])
+        self.assertEqual(self.flushes, 1)
+        self.assertEqual(self.scheduler.coalesced, 3)
+
+
+class DispatchEventsBenchmark(DispatchTestCase):
+    """Prints time and reconciliation cycles for 2000 pan/drag events, per-event slots vs one batch."""
+
+    def test_per_event_vs_batched(self):
+        self.api.register_callback("gd_pupdate_1", self.set_state)
+        self.api.register_callback("slider_update_1", self.set_state)
+        count = 1000
+        details = [{"dx": i, "dy": 0} for i in range(count)]
+
+        start = time.perf_counter()
+        for i in range(count):
+            self.api.on_gesture_event("gd_pupdate_1", details[i])
+            self.api.on_drag_update("slider_update_1", i / count, False)
+        per_event = time.perf_counter() - start
+        per_event_flushes, self.flushes = self.flushes, 0
+
+        events = []
+        for i in range(count):
+            events.append(["gd_pupdate_1", "pan_update", [details[i]]])
+            events.append(["slider_update_1", "drag", [i / count, False]])
+        start = time.perf_counter()
+        self.api.dispatch_events(events)
+        batched = time.perf_counter() - start
+
+        print(f"\n[dispatch benchmark] per-event slots: {2 * count} calls, {per_event * 1000:.2f} ms, "
+              f"{per_event_flushes} cycles | dispatch_events: 1 call, {batched * 1000:.2f} ms, {self.flushes} cycle")
+        self.assertEqual(self.flushes, 1)
+        self.assertLess(self.flushes, per_event_flushes)
+
+
+if __name__ == '__main__':
+    unittest.main()
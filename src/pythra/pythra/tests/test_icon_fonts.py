@@ -0,0 +1,277 @@
+"""Tests for icon font subsetting, the font CSS cache and serve mode."""
+
+import io
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from .. import icon_fonts
+from ..core import Framework
+from ..icon_fonts import (
+    ICON_FONT_URL_PREFIX, IconFontBuilder, scan_icon_references, scan_icon_usage, subset_icon_font,
+)
+from ..icons import _codepoints
+from ..page_resources import PAGE_ORIGIN
+
+try:
+    from fontTools.ttLib import TTFont
+    HAVE_FONTTOOLS = True
+except ImportError:
+    HAVE_FONTTOOLS = False
+
+ICONS = ("home", "star", "search", "settings", "10k")
+
+
+def build_icon_font(names=ICONS) -> bytes:
+    """A tiny ligature font shaped like Material Symbols: letters + one glyph per icon."""
+    from fontTools.feaLib.builder import addOpenTypeFeaturesFromString
+    from fontTools.fontBuilder import FontBuilder
+    from fontTools.pens.ttGlyphPen import TTGlyphPen
+
+    table = _codepoints()
+    chars = sorted({char for name in names for char in name})
+    char_glyph = {char: f"uni{ord(char):04X}" for char in chars}
+    icon_glyph = {name: f"icon_{name}" for name in names}
+    glyph_order = [".notdef", *char_glyph.values(), *icon_glyph.values()]
+
+    def box(size):
+        pen = TTGlyphPen(None)
+        pen.moveTo((0, 0))
+        pen.lineTo((0, size))
+        pen.lineTo((size, size))
+        pen.lineTo((size, 0))
+        pen.closePath()
+        return pen.glyph()
+
+    builder = FontBuilder(1000, isTTF=True)
+    builder.setupGlyphOrder(glyph_order)
+    cmap = {ord(char): glyph for char, glyph in char_glyph.items()}
+    cmap.update({table[name]: glyph for name, glyph in icon_glyph.items()})
+    builder.setupCharacterMap(cmap)
+    builder.setupGlyf({glyph: box(100 + 10 * i) for i, glyph in enumerate(glyph_order)})
+    builder.setupHorizontalMetrics({glyph: (600, 0) for glyph in glyph_order})
+    builder.setupHorizontalHeader(ascent=800, descent=-200)
+    builder.setupNameTable({"familyName": "Test Symbols", "styleName": "Regular"})
+    builder.setupOS2()
+    builder.setupPost()
+    rules = "\n".join(
+        f"    sub {' '.join(char_glyph[char] for char in name)} by {icon_glyph[name]};" for name in names
+    )
+    addOpenTypeFeaturesFromString(builder.font, f"languagesystem DFLT dflt;\nfeature liga {{\n{rules}\n}} liga;\n")
+    out = io.BytesIO()
+    builder.save(out)
+    return out.getvalue()
+
+
+def ligatures(font):
+    return {
+        ligature.LigGlyph
+        for subtable in icon_fonts._ligature_lookups(font)
+        for ligature_set in subtable.ligatures.values()
+        for ligature in ligature_set
+    }
+
+
+class TestScanIconReferences(unittest.TestCase):
+    def test_resolves_styles_like_icons_does(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "main.py").write_text(
+                "Icon(Icons.home)\nIcon(Icons.settings_rounded)\nIcon(Icons._10k_sharp)\nIcons.not_an_icon\n"
+            )
+            references = scan_icon_references([root])
+        self.assertEqual(references["Material Symbols Outlined"], {"home"})
+        self.assertEqual(references["Material Symbols Rounded"], {"settings"})
+        self.assertEqual(references["Material Symbols Sharp"], {"10k"})
+
+    def test_skips_generated_and_hidden_directories(self):
+        with tempfile.TemporaryDirectory() as root:
+            for folder in ("render", ".venv", "lib"):
+                os.makedirs(os.path.join(root, folder))
+            Path(root, "render", "x.py").write_text("Icons.star")
+            Path(root, ".venv", "x.py").write_text("Icons.search")
+            Path(root, "lib", "main.py").write_text("Icons.home")
+            references = scan_icon_references([root])
+        self.assertEqual(references["Material Symbols Outlined"], {"home"})
+
+    def test_extra_icons_are_added(self):
+        references = scan_icon_references([], extra_icons=["star_sharp"])
+        self.assertEqual(references["Material Symbols Sharp"], {"star"})
+
+    def test_flags_icons_picked_at_runtime(self):
+        with tempfile.TemporaryDirectory() as root:
+            Path(root, "static.py").write_text("Icon(Icons.home)\n")
+            Path(root, "menu.py").write_text("Icon(getattr(Icons, entry.icon))\n")
+            Path(root, "custom.py").write_text("Icon(IconData(name=icon_name))\n")
+            scan = scan_icon_usage([root])
+        self.assertEqual(sorted(path.name for path in scan.dynamic_files), ["custom.py", "menu.py"])
+        # PyThra's own registry and docs mention both; they are not app picks.
+        self.assertEqual(scan_icon_usage([Path(icon_fonts.__file__).parent]).dynamic_files, [])
+
+    def test_cached_scan_only_rereads_changed_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            cache_path = Path(root, ".pythra", "icon-scan.json")
+            app = Path(root, "app")
+            app.mkdir()
+            Path(app, "a.py").write_text("Icons.home")
+            Path(app, "b.py").write_text("Icons.star")
+            scan_icon_usage([app], cache_path=cache_path)
+
+            changed = Path(app, "b.py")
+            changed.write_text("Icons.search_rounded")
+            os.utime(changed, ns=(changed.stat().st_mtime_ns + 10**9,) * 2)
+            with mock.patch.object(Path, "read_text", autospec=True, side_effect=Path.read_text) as read_text:
+                scan = scan_icon_usage([app], cache_path=cache_path)
+            read = [call.args[0] for call in read_text.call_args_list]
+        self.assertEqual(read, [cache_path, changed])
+        self.assertEqual(scan.references["Material Symbols Outlined"], {"home"})
+        self.assertEqual(scan.references["Material Symbols Rounded"], {"search"})
+
+
+class TestSubsetSetting(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.framework = Framework.__new__(Framework)
+        self.framework._cached_font_css = None
+        self.framework.project_root = self.root
+        self.framework.assets_dir = self.root / "assets"
+        self.framework.icon_font_cache_dir = self.root / ".pythra" / "fonts"
+        self.framework.page_scheme = "file"
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def references_for(self, subset):
+        self.framework._cached_font_css = None
+        self.framework.config = {"icon_font_subset": subset, "icon_font_mode": "embed", "assets_server_port": 8008}
+        with mock.patch.object(IconFontBuilder, "build_css", return_value="") as build_css:
+            self.framework._generate_embedded_font_css()
+        return build_css.call_args.args[0]
+
+    def test_auto_keeps_full_fonts_when_icons_are_picked_at_runtime(self):
+        Path(self.root, "main.py").write_text("Icon(Icons.home)\n")
+        self.assertIn("home", self.references_for("auto")["Material Symbols Outlined"])
+        Path(self.root, "menu.py").write_text("Icon(getattr(Icons, name))\n")
+        self.assertIsNone(self.references_for("auto"))
+        self.assertIn("home", self.references_for(True)["Material Symbols Outlined"])
+        self.assertIsNone(self.references_for(False))
+
+    def test_font_urls_follow_the_page_scheme(self):
+        self.framework.config = {"icon_font_mode": "serve", "assets_server_port": 8008}
+        for scheme, base_url in (("file", "http://localhost:8008"), ("pythra", PAGE_ORIGIN)):
+            self.framework._cached_font_css = None
+            self.framework.page_scheme = scheme
+            with mock.patch.object(IconFontBuilder, "build_css", autospec=True, return_value="") as build_css:
+                self.framework._generate_embedded_font_css()
+            self.assertEqual(build_css.call_args.args[0].base_url, base_url)
+
+
+@unittest.skipUnless(HAVE_FONTTOOLS, "fontTools not installed")
+class TestSubsetIconFont(unittest.TestCase):
+    def test_keeps_only_the_referenced_icons(self):
+        full = build_icon_font()
+        subset = TTFont(io.BytesIO(subset_icon_font(full, {"home", "10k"})))
+        cmap, table = subset.getBestCmap(), _codepoints()
+        # Glyph names are not stored in the font, so go through the codepoints.
+        self.assertEqual(ligatures(subset), {cmap[table["home"]], cmap[table["10k"]]})
+        self.assertNotIn(table["star"], cmap)
+        self.assertLess(len(subset.getGlyphOrder()), len(TTFont(io.BytesIO(full)).getGlyphOrder()))
+
+    def test_keeps_the_letters_and_codepoints(self):
+        subset = TTFont(io.BytesIO(subset_icon_font(build_icon_font(), {"home"})))
+        cmap = subset.getBestCmap()
+        self.assertEqual({chr(code) for code in cmap if code < 0x80}, set("home"))
+        self.assertIn(_codepoints()["home"], cmap)
+        self.assertEqual(len(subset.getGlyphOrder()), 1 + len("home") + 1)  # .notdef, letters, icon
+
+    def test_without_fonttools_returns_none(self):
+        with mock.patch.object(icon_fonts, "FONTTOOLS_AVAILABLE", False), \
+                mock.patch.object(icon_fonts, "_warned_missing_fonttools", True):
+            self.assertIsNone(subset_icon_font(b"", {"home"}))
+
+
+@unittest.skipUnless(HAVE_FONTTOOLS, "fontTools not installed")
+class TestIconFontBuilder(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        root = Path(self._tmp.name)
+        self.fonts_dir = root / "fonts"
+        self.cache_dir = root / "cache"
+        self.fonts_dir.mkdir()
+        self.font = build_icon_font()
+        (self.fonts_dir / "MaterialSymbolsOutlined.ttf").write_bytes(self.font)
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def build(self, names=frozenset({"home"}), mode="embed", **options):
+        builder = IconFontBuilder(self.fonts_dir, self.cache_dir, mode=mode, port=8008, **options)
+        return builder.font_face_css("Material Symbols Outlined", "MaterialSymbolsOutlined.ttf", set(names))
+
+    def test_embedded_css_is_smaller_than_the_full_font(self):
+        css = self.build()
+        self.assertIn("data:font/truetype;charset=utf-8;base64,", css)
+        self.assertIn("font-family: 'Material Symbols Outlined';", css)
+        self.assertLess(len(css), len(self.font) * 4 / 3)
+
+    def test_warm_start_reads_the_cache(self):
+        first = self.build()
+        with mock.patch.object(icon_fonts, "subset_icon_font") as subset:
+            self.assertEqual(self.build(), first)
+        subset.assert_not_called()
+        self.assertEqual(len(list(self.cache_dir.glob("*.css"))), 1)
+
+    def test_cache_key_follows_the_font_and_the_icon_set(self):
+        self.build()
+        self.build(names={"home", "star"})
+        (self.fonts_dir / "MaterialSymbolsOutlined.ttf").write_bytes(build_icon_font(("home", "star")))
+        self.build()
+        self.assertEqual(len(list(self.cache_dir.glob("*.css"))), 3)
+
+    def test_serve_mode_writes_the_font_for_the_asset_server(self):
+        css = self.build(mode="serve")
+        fonts = list(self.cache_dir.glob("*.ttf"))
+        self.assertEqual(len(fonts), 1)
+        self.assertIn(f"url(http://localhost:8008/{ICON_FONT_URL_PREFIX}/{fonts[0].name})", css)
+        self.assertNotIn("base64", css)
+        # A cached rule whose font file is gone is rebuilt, not served broken.
+        fonts[0].unlink()
+        self.build(mode="serve")
+        self.assertTrue(fonts[0].exists())
+
+    def test_serve_mode_urls_use_the_page_base(self):
+        css = self.build(mode="serve", base_url=PAGE_ORIGIN)
+        font = next(self.cache_dir.glob("*.ttf"))
+        self.assertIn(f"url({PAGE_ORIGIN}/{ICON_FONT_URL_PREFIX}/{font.name})", css)
+        # The URL is part of the cached rule, so the localhost rule is a different entry.
+        self.assertIn("url(http://localhost:8008/", self.build(mode="serve"))
+
+    def test_build_prunes_stale_entries(self):
+        builder = IconFontBuilder(self.fonts_dir, self.cache_dir, mode="serve", port=8008)
+        builder.build_css({"Material Symbols Outlined": {"home"}})
+        first = {path.name for path in self.cache_dir.iterdir()}
+        (self.cache_dir / "icon-scan.json").write_text("{}")
+        (self.cache_dir / "MaterialSymbolsOutlined-0123456789abcdef.ttf.tmp").write_bytes(b"")
+        builder.build_css({"Material Symbols Outlined": {"home", "star"}})
+        left = {path.name for path in self.cache_dir.iterdir()}
+        self.assertFalse(first & left)
+        self.assertIn("icon-scan.json", left)
+        self.assertEqual(len([name for name in left if name.endswith(".ttf")]), 1)
+
+    def test_missing_font_falls_back_to_the_network(self):
+        builder = IconFontBuilder(self.fonts_dir, self.cache_dir, port=8008)
+        css = builder.font_face_css("Material Symbols Sharp", "MaterialSymbolsSharp.ttf", {"home"})
+        self.assertIn("url(http://localhost:8008/fonts/MaterialSymbolsSharp.ttf)", css)
+        builder = IconFontBuilder(self.fonts_dir, self.cache_dir, assets_url=f"{PAGE_ORIGIN}/assets")
+        css = builder.font_face_css("Material Symbols Sharp", "MaterialSymbolsSharp.ttf", {"home"})
+        self.assertIn(f"url({PAGE_ORIGIN}/assets/fonts/MaterialSymbolsSharp.ttf)", css)
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            IconFontBuilder(self.fonts_dir, self.cache_dir, mode="inline")
+
+
+if __name__ == "__main__":
+    unittest.main()
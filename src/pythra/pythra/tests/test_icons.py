@@ -0,0 +1,101 @@
+"""Tests for the lazy icon registry, plus an import-time/memory benchmark."""
+
+import json
+import os
+import subprocess
+import sys
+import unittest
+
+from ..icons import Icons, IconData, icon_names
+
+ICONS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "icons")
+
+# Runs in a fresh interpreter: loads only pythra/icons (not the whole framework)
+# and reports the import cost, then the cost of materialising every icon up
+# front, which is what the old generated classes did at import time.
+BENCHMARK_SCRIPT = r"""
+import importlib.util, json, sys, time, tracemalloc
+tracemalloc.start()
+start = time.perf_counter()
+spec = importlib.util.spec_from_file_location("icons", sys.argv[1] + "/__init__.py", submodule_search_locations=[sys.argv[1]])
+icons = importlib.util.module_from_spec(spec)
+sys.modules["icons"] = icons
+spec.loader.exec_module(icons)
+import_ms = (time.perf_counter() - start) * 1000
+import_kib = tracemalloc.get_traced_memory()[0] / 1024
+
+start = time.perf_counter()
+first = icons.Icons.home
+first_ms = (time.perf_counter() - start) * 1000
+
+start = time.perf_counter()
+count = sum(1 for name in dir(icons.Icons) if isinstance(getattr(icons.Icons, name), icons.IconData))
+eager_ms = (time.perf_counter() - start) * 1000
+eager_kib = tracemalloc.get_traced_memory()[0] / 1024
+print(json.dumps({"import_ms": import_ms, "import_kib": import_kib, "first_ms": first_ms,
+                  "eager_ms": eager_ms, "eager_kib": eager_kib, "count": count}))
+"""
+
+
+class TestIconLookup(unittest.TestCase):
+    def test_bare_name_is_outlined(self):
+        self.assertEqual(Icons.home, IconData(name="home", fontFamily="Material Symbols Outlined"))
+        self.assertEqual(Icons.home, Icons.home_outlined)
+
+    def test_style_suffixes(self):
+        self.assertEqual(Icons.settings_rounded.fontFamily, "Material Symbols Rounded")
+        self.assertEqual(Icons.settings_sharp.fontFamily, "Material Symbols Sharp")
+        self.assertEqual(Icons.settings_sharp.name, "settings")
+
+    def test_escaped_identifiers(self):
+        self.assertEqual(Icons._10k.name, "10k")
+        self.assertEqual(Icons._3d_rotation_rounded.name, "3d_rotation")
+        self.assertEqual(Icons.class_.name, "class")
+
+    def test_names_that_end_in_a_style(self):
+        # Kept exactly as the old generated classes resolved them.
+        self.assertEqual(Icons.pie_chart_outlined.name, "pie_chart_outlined")
+        self.assertEqual(Icons.power_rounded, IconData(name="power", fontFamily="Material Symbols Rounded"))
+
+    def test_codepoint_comes_from_the_table(self):
+        self.assertEqual(Icons._10k.codePoint, 0xE951)
+
+    def test_first_access_is_cached_on_the_class(self):
+        icon = Icons.zoom_out_map_sharp
+        self.assertIs(vars(Icons)["zoom_out_map_sharp"], icon)
+        self.assertIs(Icons.zoom_out_map_sharp, icon)
+
+    def test_unknown_names_raise_attribute_error(self):
+        self.assertFalse(hasattr(Icons, "definitely_not_an_icon"))
+        with self.assertRaises(AttributeError):
+            Icons.home_glossy
+
+    def test_dir_lists_every_icon(self):
+        names = set(dir(Icons))
+        self.assertIn("home_rounded", names)
+        self.assertIn("_10k_sharp", names)
+        for name in ("home", "class_", "_10k"):
+            for suffix in ("", "_outlined", "_rounded", "_sharp"):
+                self.assertIn(name + suffix, names)
+        self.assertGreater(len(names), 3 * sum(1 for _ in icon_names()))
+
+
+class IconImportBenchmark(unittest.TestCase):
+    """Prints the icons package's import time and memory, against building every icon eagerly."""
+
+    def test_import_cost(self):
+        output = subprocess.run(
+            [sys.executable, "-c", BENCHMARK_SCRIPT, ICONS_DIR],
+            capture_output=True, text=True, check=True,
+        ).stdout
+        stats = json.loads(output.strip().splitlines()[-1])
+        print(f"\n[icon import benchmark] lazy import: {stats['import_ms']:.1f} ms, {stats['import_kib']:.0f} KiB | "
+              f"first icon: {stats['first_ms']:.2f} ms | all {stats['count']} icons eagerly: "
+              f"{stats['eager_ms']:.1f} ms, {stats['eager_kib']:.0f} KiB")
+        self.assertGreater(stats["count"], 15000)
+        self.assertLess(stats["import_ms"], stats["eager_ms"])
+        self.assertLess(stats["import_kib"], stats["eager_kib"])
+
+
+if __name__ == "__main__":
+    unittest.main()
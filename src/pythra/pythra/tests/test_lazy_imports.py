@@ -0,0 +1,83 @@
+"""Tests for the package's lazy (PEP 562) exports, plus an `import pythra` timing benchmark."""
+
+import importlib
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+
+from ... import pythra as package
+from .. import core, widgets
+
+SRC_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+# Runs in a fresh interpreter. Any attempt to import PySide6 is recorded (and
+# refused), so the numbers are for the Qt-free paths only.
+BENCHMARK_SCRIPT = r"""
+import importlib.abc, json, sys, time
+attempted = []
+class NoQt(importlib.abc.MetaPathFinder):
+    def find_spec(self, name, path, target=None):
+        if name.split(".")[0] == "PySide6":
+            attempted.append(name)
+            raise ImportError(name)
+sys.meta_path.insert(0, NoQt())
+timings = {}
+for module in ("pythra", "pythra.pythra.widgets", "pythra.pythra.reconciler"):
+    start = time.perf_counter()
+    __import__(module)
+    timings[module] = (time.perf_counter() - start) * 1000
+print(json.dumps({"timings": timings, "qt": attempted}))
+"""
+
+
+class TestLazyExports(unittest.TestCase):
+    def test_exports_resolve_to_their_definitions(self):
+        self.assertIs(package.Framework, core.Framework)
+        self.assertIs(package.Container, widgets.Container)
+
+    def test_resolved_names_are_cached(self):
+        package.Text
+        self.assertIn("Text", vars(package))
+
+    def test_every_public_name_resolves(self):
+        for name in package.__all__:
+            self.assertIsNotNone(getattr(package, name), name)
+
+    def test_unknown_names_raise_attribute_error(self):
+        with self.assertRaises(AttributeError):
+            package.NotAWidget
+
+    def test_dir_lists_lazy_names(self):
+        self.assertIn("Framework", dir(package))
+
+    def test_outer_package_re_exports_lazily(self):
+        outer = importlib.import_module(package.__name__.rpartition(".")[0])
+        self.assertIs(outer.Framework, core.Framework)
+        self.assertEqual(outer.__all__, package.__all__)
+
+
+class ImportTimeBenchmark(unittest.TestCase):
+    """Prints `import pythra` (and widgets/reconciler) time in a fresh interpreter, without Qt."""
+
+    def test_import_pythra(self):
+        env = dict(os.environ, PYTHONPATH=SRC_ROOT)
+        # Widgets read (and create) config.yaml in the working directory.
+        with tempfile.TemporaryDirectory() as cwd:
+            result = subprocess.run(
+                [sys.executable, "-c", BENCHMARK_SCRIPT],
+                capture_output=True, text=True, cwd=cwd, env=env,
+            )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        stats = json.loads(result.stdout.strip().splitlines()[-1])
+        timings = stats["timings"]
+        print(f"\n[import benchmark] import pythra: {timings['pythra']:.1f} ms | "
+              f"+ widgets: {timings['pythra.pythra.widgets']:.1f} ms | "
+              f"+ reconciler: {timings['pythra.pythra.reconciler']:.1f} ms | Qt imported: {stats['qt'] or 'no'}")
+        self.assertEqual(stats["qt"], [])
+
+
+if __name__ == "__main__":
+    unittest.main()
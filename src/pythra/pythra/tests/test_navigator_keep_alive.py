@@ -0,0 +1,147 @@
+"""Tests for Navigator's offstage keep-alive route stack."""
+
+import unittest
+
+from ..core import Framework
+from ..reconciler import Reconciler
+from ..base import Widget, Key
+from ..state import StatefulWidget
+from ..navigation import Navigator, PageRoute, _RouteSlot
+
+
+class Page(Widget):
+    builds = 0
+
+    def __init__(self, name):
+        super().__init__(key=Key(f"page_{name}"), children=[
+            Field(key=Key(f"{name}_field_{i}")) for i in range(20)
+        ])
+        self.name = name
+        Page.builds += 1
+
+    def render_props(self):
+        return {"data": self.name}
+
+
+class Field(Widget):
+    def render_props(self):
+        return {"data": "field"}
+
+
+def route(name):
+    return PageRoute(lambda navigator: Page(name), name=name)
+
+
+def make_framework():
+    framework = Framework.__new__(Framework)
+    framework.reconciler = Reconciler()
+    # Tests render the whole tree themselves after each push/pop.
+    framework.request_reconciliation = lambda state: None
+    return framework
+
+
+class NavigatorTestCase(unittest.TestCase):
+    def setUp(self):
+        self.framework = make_framework()
+        self._saved_refs = (Widget._framework_ref, StatefulWidget._framework_ref)
+        Widget.set_framework(self.framework)
+        StatefulWidget.set_framework(self.framework)
+
+    def tearDown(self):
+        Widget._framework_ref, StatefulWidget._framework_ref = self._saved_refs
+
+    def mount(self, keep_alive_depth):
+        self.navigator = Navigator(key=Key("nav"), initialRoute=route("home"), keepAliveDepth=keep_alive_depth)
+        self.render()
+        return self.navigator.get_state()
+
+    def render(self):
+        tree = self.framework._build_widget_tree(self.navigator)
+        main_map = self.framework.reconciler.get_map_for_context("main")
+        result = self.framework.reconciler.reconcile(
+            dict(main_map), tree, "root-container",
+            old_root_key=Key("nav") if main_map else None,
+            is_partial_reconciliation=bool(main_map),
+        )
+        main_map.clear()
+        main_map.update(result.new_rendered_map)
+        return result.patches
+
+    def render_after(self, action):
+        action()
+        return self.render()
+
+    def mounted_pages(self):
+        main_map = self.framework.reconciler.get_map_for_context("main")
+        return sorted(key.value for key in main_map if isinstance(key, Key) and str(key.value).startswith("page_"))
+
+
+def ops(patches):
+    return [patch.action for patch in patches]
+
+
+class TestKeepAlive(NavigatorTestCase):
+    def test_default_keeps_only_the_top_route(self):
+        state = self.mount(keep_alive_depth=0)
+        state.push(route("details"))
+        self.render()
+        self.assertEqual(self.mounted_pages(), ["page_details"])
+        state.pop()
+        self.assertIn("INSERT", ops(self.render()))
+
+    def test_pop_is_a_visibility_toggle(self):
+        state = self.mount(keep_alive_depth=1)
+        state.push(route("details"))
+        push_patches = self.render()
+        self.assertEqual(self.mounted_pages(), ["page_details", "page_home"])
+        self.assertIn("INSERT", ops(push_patches))
+
+        pop_patches = self.render_after(state.pop)
+        self.assertNotIn("INSERT", ops(pop_patches))
+        self.assertEqual(self.mounted_pages(), ["page_home"])
+        updates = [p for p in pop_patches if p.action == "UPDATE"]
+        self.assertEqual([p.data["props"]["style"] for p in updates], [{"display": "contents"}])
+
+    def test_depth_bounds_the_mounted_routes(self):
+        state = self.mount(keep_alive_depth=2)
+        for name in ("a", "b", "c", "d"):
+            state.push(route(name))
+            self.render()
+        self.assertEqual(self.mounted_pages(), ["page_b", "page_c", "page_d"])
+
+    def test_routes_are_not_rebuilt_when_uncovered(self):
+        state = self.mount(keep_alive_depth=1)
+        state.push(route("details"))
+        self.render()
+        builds = Page.builds
+        state.pop()
+        self.render()
+        self.assertEqual(Page.builds, builds)
+
+    def test_route_pushed_twice_gets_its_own_slot(self):
+        state = self.mount(keep_alive_depth=2)
+        home = state.history[0]
+        state.push(route("details"))
+        self.render()
+        patches = self.render_after(lambda: state.push(home))
+        self.assertNotIn("MOVE", ops(patches))
+
+        main_map = self.framework.reconciler.get_map_for_context("main")
+        slots = [entry["widget_instance"] for entry in main_map.values()
+                 if isinstance(entry["widget_instance"], _RouteSlot)]
+        keys = [slot.get_unique_id() for slot in slots]
+        self.assertEqual(len(keys), len(set(keys)))
+        self.assertEqual([slot.onstage for slot in slots].count(True), 1)
+        self.assertEqual(len(set(state._slot_keys)), 3)
+
+        # Popping back uncovers "details" and re-mounts home below it.
+        self.render_after(state.pop)
+        self.assertEqual(self.mounted_pages(), ["page_details", "page_home"])
+
+    def test_rejects_negative_depth(self):
+        with self.assertRaises(ValueError):
+            Navigator(key=Key("nav"), initialRoute=route("home"), keepAliveDepth=-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,272 @@
+"""Tests for serving the page over pythra:// from memory, plus a start-up path benchmark."""
+
+import http.client
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from PySide6.QtCore import QObject, QUrl
+
+from .. import widgets
+from ..core import Framework
+from ..page_resources import MAX_CACHED_FILE_SIZE, PageResources
+from ..server import AssetServer
+from ..window import webwidget
+from ..window.scheme import PythraSchemeHandler
+
+
+class TestPageResources(unittest.TestCase):
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = Path(self._tmp.name)
+        self.resources = PageResources()
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def write(self, relative, data=b"x"):
+        path = self.root / relative
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_bytes(data)
+        return path
+
+    def test_documents_are_served_from_memory(self):
+        self.resources.put("index.html", "<html></html>")
+        self.assertEqual(self.resources.get("/index.html"), (b"<html></html>", "text/html"))
+
+    def test_mounts_prefer_the_longest_prefix(self):
+        self.write("render/js/app.js", b"render")
+        self.write("assets/js/app.js", b"assets")
+        self.resources.mount("", self.root / "render")
+        self.resources.mount("assets", self.root / "assets")
+        self.assertEqual(self.resources.get("/js/app.js"), (b"render", "text/javascript"))
+        self.assertEqual(self.resources.get("/assets/js/app.js"), (b"assets", "text/javascript"))
+
+    def test_root_mount_falls_through_to_allowed_absolute_paths(self):
+        engine = self.write("plugins/editor/engine.js", b"export class Editor {}")
+        self.resources.mount("", self.root / "render")
+        self.assertIsNone(self.resources.get(str(engine)))
+        self.resources.allow_root(engine.parent)
+        self.assertEqual(self.resources.get(str(engine))[0], b"export class Editor {}")
+
+    def test_paths_cannot_escape(self):
+        self.write("secret.txt")
+        self.write("render/index.css")
+        self.resources.mount("", self.root / "render")
+        self.resources.allow_root(self.root / "render")
+        self.assertIsNone(self.resources.get("/../secret.txt"))
+        self.assertIsNone(self.resources.get("/%2e%2e/secret.txt"))
+        self.assertIsNone(self.resources.get(str(self.root / "render" / ".." / "secret.txt")))
+
+    def test_changed_files_are_reread(self):
+        path = self.write("render/a.css", b"old")
+        self.resources.mount("", self.root / "render")
+        self.assertEqual(self.resources.get("a.css")[0], b"old")
+        path.write_bytes(b"newer")
+        os.utime(path, (time.time() + 5, time.time() + 5))
+        self.assertEqual(self.resources.get("a.css")[0], b"newer")
+
+    def test_missing_files(self):
+        self.resources.mount("", self.root)
+        self.assertIsNone(self.resources.get("/nope.js"))
+        self.assertIsNone(self.resources.get("/"))
+        self.assertIsNone(self.resources.lookup("/nope.js"))
+
+    def test_small_page_resources_are_cached(self):
+        self.write("render/app.js", b"export {}")
+        self.resources.mount("", self.root / "render")
+        resource = self.resources.lookup("/app.js")
+        self.assertEqual((resource.data, resource.file_path), (b"export {}", None))
+        self.assertIn(str(self.root / "render" / "app.js"), self.resources._file_cache)
+
+    def test_media_and_large_files_are_streamed(self):
+        self.write("assets/clip.mp4", b"\0" * 64)
+        self.write("assets/big.js", b"x" * (MAX_CACHED_FILE_SIZE + 1))
+        self.resources.mount("assets", self.root / "assets")
+        for name in ("clip.mp4", "big.js"):
+            resource = self.resources.lookup(f"/assets/{name}")
+            self.assertIsNone(resource.data)
+            self.assertEqual(resource.file_path, self.root / "assets" / name)
+        self.assertEqual(self.resources._file_cache, {})
+        # get() still returns the bytes, it just doesn't keep them.
+        self.assertEqual(self.resources.get("/assets/clip.mp4"), (b"\0" * 64, "video/mp4"))
+        self.assertEqual(self.resources._file_cache, {})
+
+    def test_cache_evicts_least_recently_used_past_its_budget(self):
+        resources = PageResources(max_cache_size=250)
+        for name in ("a", "b", "c"):
+            self.write(f"render/{name}.css", name.encode() * 100)
+        resources.mount("", self.root / "render")
+        resources.get("a.css")
+        resources.get("b.css")
+        resources.get("a.css")  # b is now the least recently used
+        resources.get("c.css")
+        cached = {Path(key).name for key in resources._file_cache}
+        self.assertEqual(cached, {"a.css", "c.css"})
+        self.assertEqual(resources._cache_size, 200)
+
+
+def make_framework(root, page_scheme):
+    framework = Framework.__new__(Framework)
+    framework.plugins = {}
+    framework._cached_font_css = "@font-face { font-family: 'Test'; }"
+    framework._js_file_content_cache = {}
+    framework._initial_files_written = False
+    framework._cached_initial_css = framework._cached_initial_html = None
+    framework.render_dir = Path(root)
+    framework.html_file_path = framework.render_dir / "index.html"
+    framework.css_file_path = framework.render_dir / "styles.css"
+    framework.page_scheme = page_scheme
+    framework.page_resources = PageResources()
+    framework.page_resources.mount("", framework.render_dir)
+    return framework
+
+
+class TestInitialFiles(unittest.TestCase):
+    def test_pythra_scheme_keeps_the_page_in_memory(self):
+        with tempfile.TemporaryDirectory() as root:
+            framework = make_framework(root, "pythra")
+            framework._write_initial_files("App", "<div>hi</div>", ".a{}", "")
+            self.assertEqual(os.listdir(root), [])
+            html, mime = framework.page_resources.get("index.html")
+            self.assertIn(b"<div>hi</div>", html)
+            self.assertEqual(mime, "text/html")
+            self.assertIn(b"font-family: 'Test'", framework.page_resources.get("styles.css")[0])
+
+    def test_file_scheme_still_writes_render_files(self):
+        with tempfile.TemporaryDirectory() as root:
+            framework = make_framework(root, "file")
+            framework._write_initial_files("App", "<div>hi</div>", ".a{}", "")
+            self.assertEqual(sorted(os.listdir(root)), ["index.html", "styles.css"])
+
+    def test_asset_urls_follow_the_page_scheme(self):
+        with mock.patch.dict(widgets.config._config, {"page_scheme": "pythra"}):
+            self.assertEqual(widgets.AssetImage("/logo.png").src, "pythra://app/assets/logo.png")
+        with mock.patch.dict(widgets.config._config, {"page_scheme": "file"}):
+            self.assertTrue(widgets.AssetImage("logo.png").src.startswith("http://localhost:"))
+
+    def test_asset_urls_follow_the_framework_fallback(self):
+        # Config asks for pythra://, but the framework fell back to file:// (no scheme support).
+        saved = widgets.Widget._framework_ref
+        try:
+            with tempfile.TemporaryDirectory() as root:
+                framework = make_framework(root, "file")
+                widgets.Widget.set_framework(framework)
+                with mock.patch.dict(widgets.config._config, {"page_scheme": "pythra"}):
+                    self.assertTrue(widgets.AssetImage("logo.png").src.startswith("http://localhost:"))
+                    self.assertTrue(widgets.AssetIcon("add.svg").src.startswith("http://localhost:"))
+        finally:
+            widgets.Widget._framework_ref = saved
+
+
+class FakeJob(QObject):
+    def __init__(self, url):
+        super().__init__()
+        self.url = QUrl(url)
+        self.replied = self.failed = None
+
+    def requestUrl(self):
+        return self.url
+
+    def reply(self, mime_type, device):
+        self.replied = (bytes(mime_type), bytes(device.readAll()))
+
+    def fail(self, error):
+        self.failed = error
+
+
+@unittest.skipUnless(webwidget.SCHEME_AVAILABLE, "Qt WebEngine with custom schemes not available")
+class TestSchemeHandler(unittest.TestCase):
+    def test_replies_from_the_store(self):
+        resources = PageResources()
+        resources.put("index.html", "<p>ok</p>")
+        handler = PythraSchemeHandler(resources)
+        job = FakeJob("pythra://app/index.html")
+        handler.requestStarted(job)
+        self.assertEqual(job.replied, (b"text/html", b"<p>ok</p>"))
+
+    def test_streams_files_that_are_not_cached(self):
+        with tempfile.TemporaryDirectory() as root:
+            (Path(root) / "song.mp3").write_bytes(b"ID3" + b"\0" * 32)
+            resources = PageResources()
+            resources.mount("assets", root)
+            handler = PythraSchemeHandler(resources)
+            job = FakeJob("pythra://app/assets/song.mp3")
+            handler.requestStarted(job)
+            self.assertEqual(job.replied, (b"audio/mpeg", b"ID3" + b"\0" * 32))
+            self.assertEqual(resources._file_cache, {})
+
+    def test_unknown_paths_fail(self):
+        handler = PythraSchemeHandler(PageResources())
+        job = FakeJob("pythra://app/missing.js")
+        handler.requestStarted(job)
+        self.assertIsNone(job.replied)
+        self.assertIsNotNone(job.failed)
+
+
+class StartupPathBenchmark(unittest.TestCase):
+    """
+    Prints what the page costs Python-side on a cold start: writing render/ and
+    loading it (from disk, assets over localhost) against the in-memory store.
+    The webview's own parse/paint time is the same either way and isn't measured.
+    """
+
+    ASSETS = 12
+
+    def test_file_vs_scheme(self):
+        with tempfile.TemporaryDirectory() as root:
+            root = Path(root)
+            (root / "render").mkdir()
+            (root / "assets").mkdir()
+            for i in range(self.ASSETS):
+                (root / "assets" / f"image{i}.png").write_bytes(os.urandom(32 * 1024))
+            html = "".join(f'<div class="c{i}">{i}</div>' for i in range(2000))
+            css = "".join(f".c{i}{{color:red}}" for i in range(2000))
+            font_css = "@font-face { src: url(data:font/truetype;base64,%s); }" % ("A" * 256 * 1024)
+
+            server = AssetServer(str(root / "assets"), port=0)
+            server._shutdown_registered = True
+            server.start()
+            self.assertTrue(server.ready.wait(5))
+            try:
+                file_ms = self.file_path(root / "render", server.port, html, css, font_css)
+            finally:
+                server.stop()
+
+            scheme_ms = self.scheme_path(root, html, css, font_css)
+
+        print(f"\n[page scheme benchmark] index.html + styles.css + {self.ASSETS} x 32 KiB assets | "
+              f"file:// + localhost: {file_ms:.1f} ms | pythra:// from memory: {scheme_ms:.1f} ms")
+
+    def file_path(self, render_dir, port, html, css, font_css):
+        framework = make_framework(render_dir, "file")
+        framework._cached_font_css = font_css
+        start = time.perf_counter()
+        framework._write_initial_files("App", html, css, "")
+        framework.html_file_path.read_bytes()
+        framework.css_file_path.read_bytes()
+        for i in range(self.ASSETS):
+            connection = http.client.HTTPConnection("127.0.0.1", port, timeout=5)
+            connection.request("GET", f"/image{i}.png")
+            connection.getresponse().read()
+            connection.close()
+        return (time.perf_counter() - start) * 1000
+
+    def scheme_path(self, root, html, css, font_css):
+        framework = make_framework(root / "render", "pythra")
+        framework._cached_font_css = font_css
+        framework.page_resources.mount("assets", root / "assets")
+        start = time.perf_counter()
+        framework._write_initial_files("App", html, css, "")
+        framework.page_resources.get("/index.html")
+        framework.page_resources.get("/styles.css")
+        for i in range(self.ASSETS):
+            framework.page_resources.get(f"/assets/image{i}.png")
+        return (time.perf_counter() - start) * 1000
+
+
+if __name__ == "__main__":
+    unittest.main()
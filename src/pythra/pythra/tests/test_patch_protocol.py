@@ -0,0 +1,170 @@
+"""Tests for the JSON patch protocol, plus a script-size/generation-time benchmark."""
+
+import json
+import time
+import unittest
+
+from ..core import Framework
+from ..patch_protocol import dom_props, serialize_patches
+from ..reconciler import Patch, Reconciler
+from ..base import Widget, Key
+
+
+class Box(Widget):
+    def __init__(self, key=None, props=None, children=None):
+        super().__init__(key=key, children=children)
+        self._props = props or {}
+
+    def render_props(self):
+        return dict(self._props)
+
+
+BASE_PROPS = {
+    "data": "Hello", "css_class": "shared-text-1", "tooltip": "tip",
+    "style": {"color": "red", "padding": "4px"},
+}
+
+
+def update_patches(old_props, new_props):
+    reconciler = Reconciler()
+    first = reconciler.reconcile({}, Box(key=Key("root"), props=old_props), "root-container")
+    result = reconciler.reconcile(
+        first.new_rendered_map, Box(key=Key("root"), props=new_props), "root-container",
+        old_root_key=Key("root"), is_partial_reconciliation=True,
+    )
+    return first, result.patches
+
+
+def dom_writes(record):
+    """Number of element properties applyPatches touches for one record."""
+    dom = record["dom"]
+    return sum(len(v) if k == "style" else 1 for k, v in dom.items())
+
+
+def make_framework(protocol):
+    framework = Framework.__new__(Framework)
+    framework.config = {"patch_protocol": protocol, "Debug": False}
+    framework.called = True
+    return framework
+
+
+def sample_patches(n):
+    patches = []
+    for i in range(n):
+        patches.append(Patch("UPDATE", f"fw_id_{i}", {
+            "props": {"data": f"Row {i}", "css_class": "shared-text-3", "old_shared_class": "shared-text-2",
+                      "style": {"backgroundColor": "#eee"}},
+        }))
+        patches.append(Patch("INSERT", f"fw_id_new_{i}", {
+            "parent_html_id": f"fw_id_{i}", "before_id": None,
+            "html": f'<div id="fw_id_new_{i}" class="shared-container-1">`item` ${i}</div>',
+            "props": {"css_class": "shared-container-1", "init_gesture_detector": True,
+                      "gesture_options": {"onTapName": f"tap_{i}"}},
+        }))
+    return patches
+
+
+class TestPatchProtocol(unittest.TestCase):
+    def test_update_resolves_dom_writes(self):
+        dom = dom_props({"data": 3, "tooltip": "hi", "width": 10, "style": {"backgroundColor": "red"}})
+        self.assertEqual(dom, {
+            "text": "3", "title": "hi",
+            "style": {"background-color": "red", "width": "10px"},
+        })
+
+    def test_textfield_value_targets_inner_input(self):
+        dom = dom_props({"value": "abc", "css_class": "textfield-root-container"})
+        self.assertEqual(dom["input"], "abc")
+
+    def test_slider_percentage_waits_for_drag_end(self):
+        dragging = dom_props({"style": {"--slider-percentage": "40%"}, "isDragEnded": False})
+        self.assertNotIn("--slider-percentage", dragging.get("style", {}))
+        ended = dom_props({"style": {"--slider-percentage": "40%"}, "isDragEnded": True})
+        self.assertEqual(ended["style"]["--slider-percentage"], "40%")
+
+    def test_batch_is_plain_json(self):
+        batch = serialize_patches(sample_patches(2) + [
+            Patch("REMOVE", "fw_id_9", {}),
+            Patch("MOVE", "fw_id_8", {"parent_html_id": "root", "before_id": "fw_id_1"}),
+        ])
+        self.assertEqual(json.loads(json.dumps(batch)), batch)
+        self.assertEqual([r["op"] for r in batch], ["UPDATE", "INSERT", "UPDATE", "INSERT", "REMOVE", "MOVE"])
+        self.assertEqual(batch[1]["init"], [{
+            "engine": "PythraGestureDetector", "instance": "fw_id_new_0", "options": {"onTapName": "tap_0"},
+        }])
+
+    def test_noop_update_is_dropped(self):
+        self.assertEqual(serialize_patches([Patch("UPDATE", "fw_id_1", {"props": {"onTapName": "x"}})]), [])
+
+    def test_framework_emits_single_apply_call(self):
+        script = make_framework("json")._generate_dom_patch_script(sample_patches(1))
+        self.assertTrue(script.startswith("window.applyPatches(["))
+        self.assertEqual(make_framework("json")._generate_dom_patch_script([]), "")
+
+    def test_script_protocol_uses_legacy_generator(self):
+        script = make_framework("script")._generate_dom_patch_script(sample_patches(1))
+        self.assertIn("document.getElementById", script)
+        self.assertNotIn("applyPatches", script)
+
+
+class TestUpdateDelta(unittest.TestCase):
+    def test_one_prop_change_is_one_dom_write(self):
+        _, patches = update_patches(BASE_PROPS, {**BASE_PROPS, "data": "World"})
+        self.assertEqual(patches[0].data, {"props": {"data": "World"}, "context": {"css_class": "shared-text-1"}})
+        [record] = serialize_patches(patches)
+        self.assertEqual(record["dom"], {"text": "World"})
+        self.assertEqual(dom_writes(record), 1)
+
+    def test_style_delta_only_has_changed_entries(self):
+        _, patches = update_patches(BASE_PROPS, {**BASE_PROPS, "style": {"color": "blue", "padding": "4px"}})
+        [record] = serialize_patches(patches)
+        self.assertEqual(record["dom"], {"style": {"color": "blue"}})
+        self.assertEqual(dom_writes(record), 1)
+
+    def test_class_swap_does_not_leak_into_rendered_map(self):
+        first, patches = update_patches(BASE_PROPS, {**BASE_PROPS, "css_class": "shared-text-2"})
+        self.assertEqual(patches[0].data["props"], {"css_class": "shared-text-2", "old_shared_class": "shared-text-1"})
+        self.assertNotIn("old_shared_class", first.new_rendered_map[Key("root")]["props"])
+
+    def test_textfield_value_is_routed_by_context(self):
+        props = {"value": "a", "css_class": "textfield-root-container"}
+        _, patches = update_patches(props, {**props, "value": "ab"})
+        [record] = serialize_patches(patches)
+        self.assertEqual(record["dom"], {"input": "ab"})
+
+    def test_textfield_commit_mode_updates_the_input_dataset(self):
+        props = {"value": "a", "commitOn": "change", "debounceMs": None, "css_class": "textfield-root-container"}
+        _, patches = update_patches(props, {**props, "commitOn": "blur", "debounceMs": 250})
+        [record] = serialize_patches(patches)
+        self.assertEqual(record["dom"], {"inputData": {"commitOn": "blur", "debounceMs": "250"}})
+        script = make_framework("script")._generate_dom_patch_script(patches)
+        self.assertIn('fieldEl.dataset.commitOn = "blur"', script)
+        self.assertIn('fieldEl.dataset.debounceMs = "250"', script)
+
+    def test_legacy_script_writes_only_the_changed_prop(self):
+        _, patches = update_patches(BASE_PROPS, {**BASE_PROPS, "data": "World"})
+        script = make_framework("script")._generate_dom_patch_script(patches)
+        self.assertIn("textContent", script)
+        self.assertNotIn("classList", script)
+        self.assertNotIn("setProperty", script)
+
+
+class PatchScriptBenchmark(unittest.TestCase):
+    """Prints script size and generation time for 1000 patches, legacy vs JSON."""
+
+    def test_script_size_and_time(self):
+        patches = sample_patches(500)
+        sizes = {}
+        for protocol in ("script", "json"):
+            framework = make_framework(protocol)
+            start = time.perf_counter()
+            script = framework._generate_dom_patch_script(patches)
+            elapsed = time.perf_counter() - start
+            sizes[protocol] = len(script)
+            print(f"\n[patch protocol benchmark] {protocol:6}: {len(patches)} patches, "
+                  f"{len(script) / 1024:.1f} KiB, {elapsed * 1000:.2f} ms to generate")
+        self.assertLess(sizes["json"], sizes["script"])
+
+
+if __name__ == '__main__':
+    unittest.main()
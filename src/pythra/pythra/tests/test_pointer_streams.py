@@ -0,0 +1,53 @@
+"""Tests for the pointer-stream options (throttling, slider commit mode) passed to the JS engines."""
+
+import unittest
+
+from ..base import Key
+from ..controllers import SliderController
+from ..patch_protocol import insert_inits
+from ..widgets import Container
+from ..widgets_more import GestureDetector, Slider
+
+
+class TestThrottleOptions(unittest.TestCase):
+    def test_gesture_detector_passes_throttle(self):
+        props = GestureDetector(key=Key("pad"), child=Container(), onPanUpdate=lambda d: None, throttleMs=40).render_props()
+        self.assertEqual(props["gesture_options"]["throttleMs"], 40)
+        [init] = insert_inits("fw_id_1", props, None)
+        self.assertEqual(init["options"]["throttleMs"], 40)
+
+    def test_slider_passes_throttle(self):
+        props = Slider(key=Key("volume"), controller=SliderController(value=0.5), throttleMs=100).render_props()
+        self.assertEqual(props["slider_options"]["throttleMs"], 100)
+
+    def test_default_is_frame_coalescing_only(self):
+        props = Slider(key=Key("volume"), controller=SliderController(value=0.5)).render_props()
+        self.assertIsNone(props["slider_options"]["throttleMs"])
+
+
+class TestSliderCommitMode(unittest.TestCase):
+    def make_slider(self, **kwargs):
+        return Slider(key=Key("volume"), controller=SliderController(value=0.5), divisions=4, **kwargs)
+
+    def test_commit_on_end_reaches_engine(self):
+        options = self.make_slider(commitOn="end").render_props()["slider_options"]
+        self.assertEqual((options["commitOn"], options["divisions"]), ("end", 4))
+
+    def test_unknown_commit_mode_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.make_slider(commitOn="release")
+
+    def test_local_drag_position_wins_in_css(self):
+        slider = self.make_slider()
+        css = Slider.generate_css_rule(slider.style_key, slider.css_class)
+        self.assertIn("left: var(--slider-drag-percentage, var(--slider-percentage, 0%))", css)
+
+    def test_released_value_drives_both_callbacks_once(self):
+        changed, ended = [], []
+        slider = self.make_slider(commitOn="end", onChanged=changed.append, onChangeEnd=ended.append)
+        slider._handle_drag_update(0.6, True)
+        self.assertEqual((changed, ended), ([0.5], [0.5]))
+
+
+if __name__ == '__main__':
+    unittest.main()
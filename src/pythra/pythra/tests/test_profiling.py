@@ -0,0 +1,77 @@
+"""Tests for the opt-in, sampled update-cycle profiler."""
+
+import os
+import tempfile
+import unittest
+
+from ..profiling import CycleProfiler, CycleSample, PROFILE_MODE_CPROFILE, PROFILE_MODE_PHASES
+
+
+def run_cycles(profiler, count):
+    for _ in range(count):
+        with profiler.cycle() as sample:
+            with sample.phase("build"):
+                pass
+            with sample.phase("reconcile"):
+                pass
+
+
+class TestCycleProfiler(unittest.TestCase):
+    def test_disabled_by_default_records_nothing(self):
+        profiler = CycleProfiler.from_config({}, environ={})
+        self.assertFalse(profiler.enabled)
+        run_cycles(profiler, 5)
+        self.assertEqual(profiler.recent(), [])
+
+    def test_samples_one_in_n(self):
+        profiler = CycleProfiler(enabled=True, sample_every=3)
+        run_cycles(profiler, 7)
+        self.assertEqual([s.cycle for s in profiler.recent()], [1, 4, 7])
+
+    def test_ring_buffer_is_bounded(self):
+        profiler = CycleProfiler(enabled=True, buffer_size=4)
+        run_cycles(profiler, 10)
+        self.assertEqual([s.cycle for s in profiler.recent()], [7, 8, 9, 10])
+        self.assertEqual(len(profiler.recent(2)), 2)
+
+    def test_phases_accumulate_and_summarize(self):
+        profiler = CycleProfiler(enabled=True)
+        with profiler.cycle() as sample:
+            with sample.phase("build"):
+                pass
+            with sample.phase("build"):
+                pass
+        self.assertIsInstance(sample, CycleSample)
+        self.assertEqual(set(sample.phases), {"build"})
+        summary = profiler.summary()
+        self.assertEqual(summary["build"]["count"], 1)
+        self.assertEqual(summary["total"]["count"], 1)
+
+    def test_env_var_overrides_config(self):
+        profiler = CycleProfiler.from_config(
+            {"profiling_enabled": False},
+            environ={"PYTHRA_PROFILE": "cprofile", "PYTHRA_PROFILE_SAMPLE_EVERY": "10"},
+        )
+        self.assertTrue(profiler.enabled)
+        self.assertEqual(profiler.mode, PROFILE_MODE_CPROFILE)
+        self.assertEqual(profiler.sample_every, 10)
+
+        profiler = CycleProfiler.from_config({"profiling_enabled": True}, environ={"PYTHRA_PROFILE": "0"})
+        self.assertFalse(profiler.enabled)
+
+    def test_cprofile_mode_writes_prof_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            profiler = CycleProfiler(enabled=True, mode=PROFILE_MODE_CPROFILE, output_dir=tmp)
+            run_cycles(profiler, 2)
+            paths = [s.prof_path for s in profiler.recent()]
+            self.assertEqual(len(paths), 2)
+            self.assertTrue(all(p and os.path.exists(p) for p in paths))
+
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            CycleProfiler(enabled=True, mode="flamegraph")
+        self.assertEqual(CycleProfiler().mode, PROFILE_MODE_PHASES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+"""Tests and a patch-count benchmark for the Reconciler's positional identity mode."""
+
+import unittest
+from collections import Counter
+
+from ..reconciler import Reconciler, IDENTITY_MODE_POSITIONAL, IDENTITY_MODE_UUID
+from ..base import Widget, Key
+from ..state import StatefulWidget, State
+
+
+class Box(Widget):
+    def __init__(self, key=None, props=None, children=None):
+        super().__init__(key=key, children=children)
+        self._props = props or {}
+
+    def render_props(self):
+        return dict(self._props)
+
+
+class Label(Box):
+    pass
+
+
+class _TickerState(State):
+    def build(self):
+        return Label(props={"data": "ticker"})
+
+
+class Ticker(StatefulWidget):
+    def createState(self):
+        return _TickerState()
+
+
+def build_dashboard(rows, cols, highlight=None):
+    """A keyed root holding `rows` unkeyed rows of `cols` unkeyed labels."""
+    return Box(key=Key("dashboard"), children=[
+        Box(props={"css_class": "row"}, children=[
+            Label(props={"data": "X" if (r, c) == highlight else f"{r}:{c}"})
+            for c in range(cols)
+        ])
+        for r in range(rows)
+    ])
+
+
+def reconcile_pair(mode, old_tree, new_tree):
+    reconciler = Reconciler(identity_mode=mode)
+    first = reconciler.reconcile({}, old_tree, "root-container")
+    second = reconciler.reconcile(
+        first.new_rendered_map, new_tree, "root-container",
+        old_root_key=new_tree.get_unique_id(), is_partial_reconciliation=True,
+    )
+    return first, second
+
+
+class TestPositionalIdentity(unittest.TestCase):
+    def test_rejects_unknown_mode(self):
+        with self.assertRaises(ValueError):
+            Reconciler(identity_mode="bogus")
+
+    def test_uuid_mode_reinserts_unkeyed_children(self):
+        _, result = reconcile_pair(IDENTITY_MODE_UUID, build_dashboard(2, 2), build_dashboard(2, 2))
+        actions = Counter(p.action for p in result.patches)
+        self.assertEqual(actions["REMOVE"], 2)
+        self.assertEqual(actions["INSERT"], 6)
+
+    def test_positional_mode_only_updates_changed_text(self):
+        first, result = reconcile_pair(
+            IDENTITY_MODE_POSITIONAL, build_dashboard(2, 2), build_dashboard(2, 2, highlight=(1, 0))
+        )
+        self.assertEqual([p.action for p in result.patches], ["UPDATE"])
+        self.assertEqual(result.patches[0].data["props"]["data"], "X")
+        # html ids survive the rebuild
+        old_ids = {d["html_id"] for d in first.new_rendered_map.values()}
+        new_ids = {d["html_id"] for d in result.new_rendered_map.values()}
+        self.assertEqual(old_ids, new_ids)
+
+    def test_positional_mode_respects_type_changes(self):
+        old_tree = Box(key=Key("root"), children=[Label(props={"data": "a"})])
+        new_tree = Box(key=Key("root"), children=[Box(props={"data": "a"})])
+        _, result = reconcile_pair(IDENTITY_MODE_POSITIONAL, old_tree, new_tree)
+        self.assertEqual(sorted(p.action for p in result.patches), ["INSERT", "REMOVE"])
+
+    def test_positional_mode_leaves_keyed_children_alone(self):
+        old_tree = Box(key=Key("root"), children=[Label(key=Key("a")), Label()])
+        new_tree = Box(key=Key("root"), children=[Label(), Label(key=Key("a"))])
+        _, result = reconcile_pair(IDENTITY_MODE_POSITIONAL, old_tree, new_tree)
+        self.assertIn(Key("a"), result.new_rendered_map)
+        self.assertNotIn("REPLACE", [p.action for p in result.patches])
+
+    def test_replaced_stateful_child_disposes_old_state(self):
+        old_ticker = Ticker()
+        old_tree = Box(key=Key("root"), children=[old_ticker])
+        new_tree = Box(key=Key("root"), children=[Ticker()])
+        disposed = []
+        old_ticker.get_state().dispose = lambda: disposed.append(True)
+        reconcile_pair(IDENTITY_MODE_POSITIONAL, old_tree, new_tree)
+        self.assertEqual(disposed, [True])
+
+
+class PatchCountBenchmark(unittest.TestCase):
+    """Prints the patch count for a one-label change in a 50x20 dashboard."""
+
+    def test_patch_count_before_and_after(self):
+        counts = {}
+        for mode in (IDENTITY_MODE_UUID, IDENTITY_MODE_POSITIONAL):
+            _, result = reconcile_pair(mode, build_dashboard(50, 20), build_dashboard(50, 20, highlight=(7, 3)))
+            counts[mode] = Counter(p.action for p in result.patches)
+        print(f"\n[identity benchmark] uuid: {sum(counts[IDENTITY_MODE_UUID].values())} patches "
+              f"{dict(counts[IDENTITY_MODE_UUID])}, positional: "
+              f"{sum(counts[IDENTITY_MODE_POSITIONAL].values())} patches {dict(counts[IDENTITY_MODE_POSITIONAL])}")
+        self.assertEqual(dict(counts[IDENTITY_MODE_POSITIONAL]), {"UPDATE": 1})
+        self.assertGreater(sum(counts[IDENTITY_MODE_UUID].values()), 1000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,120 @@
+"""Tests and a per-node timing benchmark for the Reconciler's per-pass props memo."""
+
+import time
+import unittest
+
+from ..reconciler import Reconciler, PropsMemo
+from ..base import Widget, Key
+
+
+class CountingBox(Widget):
+    """Counts how often render_props() is called on each instance."""
+
+    def __init__(self, key=None, text="", on_tap=None, children=None):
+        super().__init__(key=key, children=children)
+        self.text = text
+        self.onTap = on_tap
+        self.render_calls = 0
+
+    def render_props(self):
+        self.render_calls += 1
+        props = {"data": self.text}
+        if self.onTap:
+            props["onTapName"] = f"tap_{self.text}"
+            props["onTapArg"] = []
+        return props
+
+    def get_required_css_classes(self):
+        return set()
+
+
+def build_tree(rows, cols, changed=None):
+    return CountingBox(key=Key("root"), children=[
+        CountingBox(key=Key(f"row-{r}"), children=[
+            CountingBox(
+                key=Key(f"cell-{r}-{c}"),
+                text="X" if (r, c) == changed else f"{r}:{c}",
+                on_tap=lambda: None,
+            )
+            for c in range(cols)
+        ])
+        for r in range(rows)
+    ])
+
+
+def walk(widget):
+    yield widget
+    for child in widget.get_children():
+        yield from walk(child)
+
+
+class TestPropsMemo(unittest.TestCase):
+    def test_memo_returns_same_props_object(self):
+        memo = PropsMemo()
+        box = CountingBox(text="a")
+        self.assertIs(memo.props_for(box), memo.props_for(box))
+        self.assertEqual(box.render_calls, 1)
+
+    def test_mark_collected_only_once(self):
+        memo = PropsMemo()
+        box = CountingBox()
+        self.assertTrue(memo.mark_collected(box))
+        self.assertFalse(memo.mark_collected(box))
+
+    def test_initial_render_calls_render_props_once_per_node(self):
+        tree = build_tree(3, 4)
+        Reconciler().reconcile({}, tree, "root-container")
+        self.assertEqual({w.render_calls for w in walk(tree)}, {1})
+
+    def test_update_pass_calls_render_props_once_per_node(self):
+        reconciler = Reconciler()
+        first = reconciler.reconcile({}, build_tree(3, 4), "root-container")
+        tree = build_tree(3, 4, changed=(1, 2))
+        result = reconciler.reconcile(
+            first.new_rendered_map, tree, "root-container",
+            old_root_key=tree.get_unique_id(), is_partial_reconciliation=True,
+        )
+        self.assertEqual({w.render_calls for w in walk(tree)}, {1})
+        self.assertEqual([p.action for p in result.patches], ["UPDATE"])
+        self.assertEqual(len(result.registered_callbacks), 12)
+
+    def test_memo_is_scoped_to_one_pass(self):
+        reconciler = Reconciler()
+        tree = build_tree(1, 2)
+        reconciler.reconcile({}, tree, "root-container")
+        reconciler.reconcile({}, tree, "root-container")
+        self.assertEqual({w.render_calls for w in walk(tree)}, {2})
+        self.assertIsNone(reconciler._props_memo)
+
+    def test_nested_pass_restores_outer_memo(self):
+        reconciler = Reconciler()
+        with reconciler.props_pass() as outer:
+            with reconciler.props_pass() as inner:
+                self.assertIsNot(inner, outer)
+            self.assertIs(reconciler._props_memo, outer)
+
+
+class ReconcileTimeBenchmark(unittest.TestCase):
+    """Prints reconcile time per node for an update pass over a 100x20 grid."""
+
+    def test_reconcile_time_per_node(self):
+        reconciler = Reconciler()
+        first = reconciler.reconcile({}, build_tree(100, 20), "root-container")
+        tree = build_tree(100, 20, changed=(50, 10))
+        nodes = sum(1 for _ in walk(tree))
+
+        start = time.perf_counter()
+        reconciler.reconcile(
+            first.new_rendered_map, tree, "root-container",
+            old_root_key=tree.get_unique_id(), is_partial_reconciliation=True,
+        )
+        elapsed = time.perf_counter() - start
+
+        calls = sum(w.render_calls for w in walk(tree))
+        print(f"\n[props memo benchmark] {nodes} nodes, {calls} render_props calls, "
+              f"{elapsed * 1e6 / nodes:.2f} us/node")
+        self.assertEqual(calls, nodes)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -144,7 +144,7 @@ class TestRustReconcilerAdapter(unittest.TestCase):
         patch = result.patches[0]
         self.assertEqual(patch.action, "UPDATE")
         self.assertEqual(patch.html_id, "root_1")
-        self.assertEqual(patch.data, {"color": "red"})
+        self.assertEqual(patch.data["props"], {"color": "red"})
 
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
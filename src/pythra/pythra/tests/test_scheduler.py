@@ -0,0 +1,134 @@
+"""Tests for the frame-aligned reconciliation scheduler and dirty-state collapsing."""
+
+import unittest
+
+from ..scheduler import FrameScheduler, dirty_ancestor_keys, topmost_dirty_states
+from ..reconciler import Reconciler
+from ..base import Widget, Key
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeTimer:
+    def __init__(self):
+        self.queued = []
+
+    def __call__(self, delay_ms, callback):
+        self.queued.append((delay_ms, callback))
+
+    def fire(self):
+        delay_ms, callback = self.queued.pop(0)
+        callback()
+        return delay_ms
+
+
+class FakeState:
+    def __init__(self, widget):
+        self.widget = widget
+
+    def get_widget(self):
+        return self.widget
+
+
+class Box(Widget):
+    def __init__(self, key=None, children=None):
+        super().__init__(key=key, children=children)
+
+
+def make_scheduler(max_fps=50):
+    clock, timer, flushes = FakeClock(), FakeTimer(), []
+    scheduler = FrameScheduler(lambda: flushes.append(clock.now), max_fps=max_fps, clock=clock, timer=timer)
+    return scheduler, clock, timer, flushes
+
+
+class TestFrameScheduler(unittest.TestCase):
+    def test_first_request_after_idle_is_immediate(self):
+        scheduler, _, timer, _ = make_scheduler()
+        scheduler.request()
+        self.assertEqual(timer.queued[0][0], 0)
+
+    def test_burst_of_requests_shares_one_flush(self):
+        scheduler, _, timer, flushes = make_scheduler()
+        for _ in range(100):
+            scheduler.request()
+        self.assertEqual(len(timer.queued), 1)
+        timer.fire()
+        self.assertEqual(len(flushes), 1)
+        self.assertEqual(scheduler.stats(), {"frames": 1, "coalesced": 99, "max_fps": 50.0})
+
+    def test_next_flush_waits_for_frame_boundary(self):
+        scheduler, clock, timer, _ = make_scheduler(max_fps=50)
+        scheduler.request()
+        timer.fire()
+        clock.now = 0.005
+        scheduler.request()
+        self.assertEqual(timer.queued[0][0], 15)
+        clock.now = 0.5
+        timer.fire()
+        scheduler.request()
+        self.assertEqual(timer.queued[0][0], 20)
+
+    def test_uncapped_never_delays(self):
+        scheduler, _, timer, _ = make_scheduler(max_fps=0)
+        scheduler.request()
+        timer.fire()
+        scheduler.request()
+        self.assertEqual(timer.queued[0][0], 0)
+
+    def test_hold_defers_requests_to_one_flush(self):
+        scheduler, _, timer, flushes = make_scheduler()
+        with scheduler.hold():
+            with scheduler.hold():
+                scheduler.request()
+            scheduler.request()
+            self.assertEqual(timer.queued, [])
+        timer.fire()
+        self.assertEqual((len(flushes), scheduler.coalesced), (1, 1))
+
+    def test_request_during_flush_queues_next_frame(self):
+        clock, timer = FakeClock(), FakeTimer()
+        scheduler = FrameScheduler(lambda: scheduler.request(), clock=clock, timer=timer)
+        scheduler.request()
+        timer.fire()
+        self.assertEqual(len(timer.queued), 1)
+
+
+class TestTopmostDirtyStates(unittest.TestCase):
+    def setUp(self):
+        self.leaf = Box(key=Key("leaf"))
+        self.mid = Box(key=Key("mid"), children=[self.leaf])
+        self.sibling = Box(key=Key("sibling"))
+        self.root = Box(key=Key("root"), children=[self.mid, self.sibling])
+        self.map = Reconciler().reconcile({}, self.root, "root-container").new_rendered_map
+
+    def test_descendants_of_a_dirty_state_are_dropped(self):
+        states = [FakeState(self.leaf), FakeState(self.mid), FakeState(self.sibling)]
+        kept = topmost_dirty_states(states, self.map)
+        self.assertEqual({s.widget.key for s in kept}, {Key("mid"), Key("sibling")})
+
+    def test_dirty_ancestor_keys_lists_the_path_above_each_state(self):
+        keys = dirty_ancestor_keys([FakeState(self.leaf), FakeState(self.sibling)], self.map)
+        self.assertEqual(keys, {Key("mid"), Key("root")})
+
+    def test_root_absorbs_everything(self):
+        states = [FakeState(w) for w in (self.leaf, self.sibling, self.root)]
+        self.assertEqual([s.widget for s in topmost_dirty_states(states, self.map)], [self.root])
+
+    def test_partial_reconcile_keeps_subtree_parent(self):
+        reconciler = Reconciler()
+        full = reconciler.reconcile({}, self.root, "root-container").new_rendered_map
+        result = reconciler.reconcile(
+            full, Box(key=Key("mid"), children=[Box(key=Key("leaf"))]), full[Key("mid")]["parent_html_id"],
+            old_root_key=Key("mid"), is_partial_reconciliation=True,
+        )
+        self.assertEqual(result.new_rendered_map[Key("mid")]["parent_key"], Key("root"))
+
+
+if __name__ == '__main__':
+    unittest.main()
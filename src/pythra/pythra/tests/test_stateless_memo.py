@@ -0,0 +1,225 @@
+"""Tests for StatelessWidget subtree memoization (const / shouldRebuild)."""
+
+import unittest
+
+from ..core import Framework
+from ..reconciler import Reconciler, IDENTITY_MODE_POSITIONAL, IDENTITY_MODE_UUID
+from ..css_manager import StylesheetManager
+from ..profiling import CycleProfiler
+from ..window.webwidget import Api
+from ..base import Widget, Key
+from ..state import State, StatefulWidget, StatelessWidget
+
+
+class Box(Widget):
+    def __init__(self, key=None, props=None, children=None):
+        super().__init__(key=key, children=children)
+        self._props = props or {}
+
+    def render_props(self):
+        return dict(self._props)
+
+
+class Sidebar(StatelessWidget):
+    builds = 0
+
+    def __init__(self, items, key=None, const=False):
+        super().__init__(key=key, const=const)
+        self.items = items
+
+    def build(self):
+        Sidebar.builds += 1
+        return Box(children=[Box(props={"data": item}) for item in self.items])
+
+
+class EqSidebar(Sidebar):
+    def __eq__(self, other):
+        return isinstance(other, EqSidebar) and self.items == other.items
+
+    __hash__ = Widget.__hash__
+
+
+def make_framework():
+    framework = Framework.__new__(Framework)
+    framework.reconciler = Reconciler()
+    return framework
+
+
+def render(framework, sidebar, title):
+    tree = framework._build_widget_tree(Box(key=Key("root"), children=[
+        sidebar, Box(key=Key("title"), props={"data": title}),
+    ]))
+    main_map = framework.reconciler.get_map_for_context("main")
+    result = framework.reconciler.reconcile(
+        dict(main_map), tree, "root-container",
+        old_root_key=Key("root") if main_map else None,
+        is_partial_reconciliation=bool(main_map),
+    )
+    main_map.update(result.new_rendered_map)
+    return result
+
+
+class TestStatelessMemo(unittest.TestCase):
+    def setUp(self):
+        Sidebar.builds = 0
+
+    def test_const_widget_skips_build_and_diff(self):
+        framework = make_framework()
+        items = [f"item {i}" for i in range(20)]
+        render(framework, Sidebar(items, key=Key("sidebar"), const=True), "A")
+        first_map = dict(framework.reconciler.get_map_for_context("main"))
+
+        result = render(framework, Sidebar(items, key=Key("sidebar"), const=True), "B")
+
+        self.assertEqual(Sidebar.builds, 1)
+        self.assertEqual([p.action for p in result.patches], ["UPDATE"])
+        self.assertEqual(result.patches[0].data["props"]["data"], "B")
+        # Every memoized entry survives with its old html_id.
+        for key, data in first_map.items():
+            self.assertEqual(result.new_rendered_map[key]["html_id"], data["html_id"])
+
+    def test_non_const_widget_rebuilds(self):
+        framework = make_framework()
+        render(framework, Sidebar(["a"], key=Key("sidebar")), "A")
+        render(framework, Sidebar(["a"], key=Key("sidebar")), "B")
+        self.assertEqual(Sidebar.builds, 2)
+
+    def test_eq_based_should_rebuild(self):
+        framework = make_framework()
+        render(framework, EqSidebar(["a"], key=Key("sidebar")), "A")
+        render(framework, EqSidebar(["a"], key=Key("sidebar")), "A")
+        self.assertEqual(Sidebar.builds, 1)
+        result = render(framework, EqSidebar(["b"], key=Key("sidebar")), "A")
+        self.assertEqual(Sidebar.builds, 2)
+        self.assertTrue(result.patches)
+
+    def test_reused_const_instance_is_memoized(self):
+        framework = make_framework()
+        sidebar = Sidebar(["a", "b"], const=True)
+        render(framework, sidebar, "A")
+        result = render(framework, sidebar, "B")
+        self.assertEqual(Sidebar.builds, 1)
+        self.assertEqual(len(result.patches), 1)
+
+
+class Counter(StatefulWidget):
+    def createState(self):
+        return CounterState()
+
+
+class CounterState(State):
+    def initState(self):
+        self.count = 0
+
+    def build(self):
+        return Box(props={"data": f"count {self.count}"})
+
+
+class Panel(StatelessWidget):
+    def __init__(self, child, key=None, const=False):
+        super().__init__(key=key, const=const)
+        self.child = child
+
+    def build(self):
+        return Box(children=[self.child])
+
+
+class Page(StatefulWidget):
+    def __init__(self, counter, key=None):
+        self.counter = counter
+        super().__init__(key=key)
+
+    def createState(self):
+        return PageState()
+
+
+class PageState(State):
+    def initState(self):
+        self.title = "A"
+
+    def build(self):
+        widget = self.get_widget()
+        return Box(children=[
+            Box(props={"data": self.title}),
+            Panel(widget.counter, key=Key("panel"), const=True),
+        ])
+
+
+class FakeWindow:
+    def __init__(self):
+        self.scripts = []
+
+    def evaluate_js(self, window_id, script):
+        self.scripts.append(script)
+
+
+class FakeScheduler:
+    def request(self):
+        pass
+
+
+def make_cycle_framework(identity_mode):
+    """A framework whose real `_process_reconciliation` runs against a FakeWindow."""
+    framework = Framework.__new__(Framework)
+    framework.reconciler = Reconciler(identity_mode)
+    framework.api = Api()
+    framework.css_manager = StylesheetManager()
+    framework.config = {}
+    framework.window, framework.id = FakeWindow(), "main"
+    framework.profiler = CycleProfiler()
+    framework.frame_scheduler = FakeScheduler()
+    framework._pending_state_updates = set()
+    framework._loaded_js_engines = set()
+    return framework
+
+
+class TestMemoWithDirtyDescendants(unittest.TestCase):
+    """A dirty State below a memoized StatelessWidget must not be collapsed away."""
+
+    def setUp(self):
+        self._saved_refs = (Widget._framework_ref, StatefulWidget._framework_ref)
+
+    def tearDown(self):
+        Widget._framework_ref, StatefulWidget._framework_ref = self._saved_refs
+        Api().clear_callbacks()
+
+    def check_mode(self, identity_mode):
+        framework = make_cycle_framework(identity_mode)
+        framework.api.clear_callbacks()
+        Widget.set_framework(framework)
+        StatefulWidget.set_framework(framework)
+
+        counter = Counter(key=Key("counter"))
+        page = Page(counter, key=Key("page"))
+        framework.root_widget = page
+        main_map = framework.reconciler.get_map_for_context("main")
+        main_map.update(framework.reconciler.reconcile(
+            {}, framework._build_widget_tree(page), "root-container").new_rendered_map)
+
+        page_state, counter_state = page.get_state(), counter.get_state()
+        page_state.title = "B"
+        page_state.setState()
+        counter_state.count = 1
+        counter_state.setState()
+        framework._process_reconciliation()
+
+        counter_text = main_map[counter.get_children()[0].get_unique_id()]["props"]["data"]
+        self.assertEqual(counter_text, "count 1")
+        self.assertIn("count 1", framework.window.scripts[-1])
+        self.assertEqual(framework._dirty_ancestor_keys, frozenset())
+
+        # With nothing dirty below it, the panel is reused again.
+        page_state.title = "C"
+        page_state.setState()
+        framework._process_reconciliation()
+        self.assertTrue(main_map[Key("panel")]["widget_instance"]._reused_build)
+
+    def test_uuid_mode(self):
+        self.check_mode(IDENTITY_MODE_UUID)
+
+    def test_positional_mode(self):
+        self.check_mode(IDENTITY_MODE_POSITIONAL)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,71 @@
+"""Tests for bounded shared_styles tables and REMOVE-driven style collection."""
+
+import unittest
+
+from ..style_registry import SharedStyleTable, StyleRegistry, style_registry
+from ..reconciler import Reconciler
+from ..base import Widget, Key
+
+
+class Swatch(Widget):
+    shared_styles: SharedStyleTable = SharedStyleTable()
+
+    def __init__(self, color, key=None):
+        super().__init__(key=key)
+        self.style_key = (color,)
+        if self.style_key not in Swatch.shared_styles:
+            self.css_class = f"shared-swatch-{Swatch.shared_styles.next_index()}"
+            Swatch.shared_styles[self.style_key] = self.css_class
+        else:
+            self.css_class = Swatch.shared_styles[self.style_key]
+
+    def render_props(self):
+        return {"css_class": self.css_class}
+
+
+class Box(Widget):
+    def __init__(self, key=None, children=None):
+        super().__init__(key=key, children=children)
+
+
+class TestSharedStyleTable(unittest.TestCase):
+    def test_table_is_named_after_owner_and_registered(self):
+        self.assertEqual(Swatch.shared_styles.name, "Swatch")
+        self.assertTrue(any(t is Swatch.shared_styles for t in style_registry._tables))
+
+    def test_names_are_never_reused_after_eviction(self):
+        registry = StyleRegistry()
+        table = SharedStyleTable("t")
+        registry.register(table)
+        table[("red",)] = f"c-{table.next_index()}"
+        table[("blue",)] = f"c-{table.next_index()}"
+        self.assertEqual(registry.collect(["c-0"]), 1)
+        self.assertNotIn(("red",), table)
+        table[("green",)] = f"c-{table.next_index()}"
+        self.assertEqual(table[("green",)], "c-2")
+
+    def test_metrics_and_sweep(self):
+        registry = StyleRegistry()
+        table = SharedStyleTable("t")
+        registry.register(table)
+        for i in range(5):
+            table[(i,)] = f"c-{table.next_index()}"
+        self.assertEqual(registry.sweep(live_classes={"c-1", "c-3"}), 3)
+        self.assertEqual(registry.metrics(), {"live": 2, "collected": 3, "tables": {"t": 2}})
+
+
+class TestRemovedKeys(unittest.TestCase):
+    def test_reconciler_reports_removed_children(self):
+        reconciler = Reconciler()
+        gone = Swatch("red", key=Key("gone"))
+        first = reconciler.reconcile({}, Box(key=Key("root"), children=[gone, Swatch("blue", key=Key("kept"))]), "root-container")
+        result = reconciler.reconcile(
+            first.new_rendered_map, Box(key=Key("root"), children=[Swatch("blue", key=Key("kept"))]),
+            "root-container", old_root_key=Key("root"), is_partial_reconciliation=True,
+        )
+        self.assertEqual(result.removed_keys, [Key("gone")])
+        self.assertEqual([p.action for p in result.patches], ["REMOVE"])
+
+
+if __name__ == '__main__':
+    unittest.main()
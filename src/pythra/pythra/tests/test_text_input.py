@@ -0,0 +1,81 @@
+"""Tests for the TextField input pipeline: commit modes, debounce and the echo skip."""
+
+import unittest
+
+from ..base import Key
+from ..controllers import TextEditingController
+from ..reconciler import Reconciler
+from ..widgets import TextField
+
+
+def field(controller, **options):
+    return TextField(key=Key("name"), controller=controller, **options)
+
+
+def rebuild_patches(controller, change):
+    """Renders a TextField, applies `change` to its controller and returns the rebuild's patches."""
+    reconciler = Reconciler()
+    first = reconciler.reconcile({}, field(controller), "root-container")
+    change()
+    result = reconciler.reconcile(
+        first.new_rendered_map, field(controller), "root-container",
+        old_root_key=Key("name"), is_partial_reconciliation=True,
+    )
+    return result.patches
+
+
+class TestEchoSkip(unittest.TestCase):
+    def test_typed_text_is_not_sent_back(self):
+        controller = TextEditingController(text="Ada")
+        patches = rebuild_patches(controller, lambda: field(controller).onChanged("Ada L"))
+        self.assertEqual(controller.text, "Ada L")
+        self.assertEqual(patches, [])
+
+    def test_programmatic_text_still_patches(self):
+        controller = TextEditingController(text="Ada")
+
+        def change():
+            field(controller).onChanged("Ada L")
+            controller.text = "Grace"
+
+        patches = rebuild_patches(controller, change)
+        self.assertEqual(len(patches), 1)
+        self.assertEqual(patches[0].data["props"]["value"], "Grace")
+
+    def test_clearing_typed_text_from_code_patches(self):
+        controller = TextEditingController()
+        controller._set_from_client("draft")
+        patches = rebuild_patches(controller, controller.clear)
+        self.assertEqual([p.data["props"]["value"] for p in patches], [""])
+
+    def test_listeners_fire_for_typed_text(self):
+        controller = TextEditingController()
+        seen = []
+        controller.add_listener(lambda: seen.append(controller.text))
+        field(controller).onChanged("hi")
+        field(controller).onChanged("hi")
+        self.assertEqual(seen, ["hi"])
+
+
+class TestCommitOptions(unittest.TestCase):
+    def test_defaults(self):
+        props = field(TextEditingController()).render_props()
+        self.assertEqual(props["commitOn"], "change")
+        self.assertIsNone(props["debounceMs"])
+
+    def test_rejects_unknown_commit_mode(self):
+        with self.assertRaises(ValueError):
+            field(TextEditingController(), commitOn="enter")
+
+    def test_stub_carries_options(self):
+        widget = field(TextEditingController(), debounceMs=250, commitOn="blur")
+        html = TextField._generate_html_stub(widget, "fw_id_1", widget.render_props())
+        self.assertIn('data-commit-on="blur"', html)
+        self.assertIn('data-debounce-ms="250"', html)
+        self.assertIn("handleInput('%s', this.value, this)" % widget.onChangedName, html)
+        self.assertIn("commitInput('%s', this, 'blur')" % widget.onChangedName, html)
+        self.assertIn("commitInput('%s', this, 'submit')" % widget.onChangedName, html)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+"""Tests for VirtualListView item fetching through the Api bridge."""
+
+import unittest
+
+from ..window.webwidget import Api
+
+
+class TestBuildListItems(unittest.TestCase):
+    def setUp(self):
+        self.api = Api()
+        self.api.clear_callbacks()
+
+    def tearDown(self):
+        self.api.clear_callbacks()
+
+    def test_batch_builder_is_preferred(self):
+        requested = []
+
+        def batch(indices):
+            requested.append(indices)
+            return {"items": {str(i): f"<p>{i}</p>" for i in indices}, "css": ".row{}"}
+
+        self.api.register_callback("rows", lambda i: {"html": "single"})
+        self.api.register_callback("rows_batch", batch)
+        result = self.api.build_list_items("rows", [3.0, 4.0, 5.0])
+        self.assertEqual(requested, [[3, 4, 5]])
+        self.assertEqual(result["items"]["4"], "<p>4</p>")
+
+    def test_falls_back_to_single_builder_with_deduplicated_css(self):
+        self.api.register_callback("rows", lambda i: {"html": f"<p>{i}</p>", "css": ".row{}"})
+        result = self.api.build_list_items("rows", [0, 1])
+        self.assertEqual(result, {"items": {"0": "<p>0</p>", "1": "<p>1</p>"}, "css": ".row{}"})
+
+    def test_unknown_builder_returns_empty_batch(self):
+        self.assertEqual(self.api.build_list_items("missing", [0]), {"items": {}, "css": ""})
+
+    def test_cache_stats_reach_their_receiver(self):
+        received = []
+        self.api.register_callback("rows_cache_stats", received.append)
+        self.api.on_list_cache_stats("rows", {"hits": 9, "misses": 1})
+        self.api.on_list_cache_stats("other", {"hits": 0})
+        self.assertEqual(received, [{"hits": 9, "misses": 1}])
+
+
+if __name__ == '__main__':
+    unittest.main()
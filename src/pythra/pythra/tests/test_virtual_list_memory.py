@@ -0,0 +1,317 @@
+"""Tests for VirtualListView's bounded item window, variable extents and page cache, plus a long-scroll memory benchmark."""
+
+import time
+import tracemalloc
+import unittest
+
+from ..core import Framework
+from ..reconciler import Reconciler
+from ..css_manager import StylesheetManager
+from ..profiling import CycleProfiler
+from ..window.webwidget import Api
+from ..base import Widget, Key
+from ..state import State, StatefulWidget
+from ..controllers import VirtualListController
+from ..navigation import Navigator, PageRoute
+from ..widgets import Text, TextStyle, VirtualListView
+
+
+class Row(Widget):
+    def __init__(self, index, key=None):
+        super().__init__(key=key)
+        self.index = index
+        self.onTap = lambda: None
+
+    def render_props(self):
+        return {"data": f"Row {self.index}", "onTapName": f"row_tap_{self.index}_{id(self)}", "onTapArg": []}
+
+
+def make_framework():
+    framework = Framework.__new__(Framework)
+    framework.reconciler = Reconciler()
+    framework.api = Api()
+    framework.css_manager = StylesheetManager()
+    framework.config = {}
+    return framework
+
+
+class VirtualListTestCase(unittest.TestCase):
+    def setUp(self):
+        self.framework = make_framework()
+        self.framework.api.clear_callbacks()
+        self._saved_refs = (Widget._framework_ref, StatefulWidget._framework_ref)
+        Widget.set_framework(self.framework)
+        StatefulWidget.set_framework(self.framework)
+
+    def tearDown(self):
+        Widget._framework_ref, StatefulWidget._framework_ref = self._saved_refs
+        self.framework.api.clear_callbacks()
+
+    def make_list(self, max_live_items=50, initial=5, **options):
+        # States hold their widget weakly; keep it alive like the rendered tree would.
+        self.widget = VirtualListView(
+            key=Key("feed"), controller=VirtualListController(), itemCount=1_000_000,
+            itemBuilder=lambda i: Row(i), itemExtent=20, initialItemCount=initial,
+            maxLiveItems=max_live_items, **options,
+        )
+        return self.widget.get_state()
+
+
+class TestOwnerLinks(unittest.TestCase):
+    def setUp(self):
+        self.api = Api()
+        self.api.clear_callbacks()
+
+    def tearDown(self):
+        self.api.clear_callbacks()
+
+    def test_releasing_a_parent_releases_linked_owners(self):
+        self.api.link_owner(("list", 1), "list")
+        self.api.link_owner("row", ("list", 1))
+        self.api.register_callback("tap", lambda: None, owner="row")
+        self.api.register_callback("other", lambda: None, owner="elsewhere")
+        self.api.release_owner("list")
+        self.assertEqual(list(self.api.callbacks), ["other"])
+        self.assertEqual(self.api.callback_registry_stats()["linked_owners"], 0)
+
+
+class TestItemWindow(VirtualListTestCase):
+    def test_items_stay_out_of_the_main_map(self):
+        state = self.make_list()
+        state.build_items_for_js(list(range(10, 20)))
+        self.assertEqual(self.framework.reconciler.get_map_for_context("main"), {})
+        self.assertEqual(state.live_item_stats(), {"items": 15, "map_entries": 15})
+
+    def test_eviction_drops_entries_and_callbacks(self):
+        state = self.make_list(max_live_items=10, initial=0)
+        first = state.build_items_for_js(list(range(0, 10)))
+        self.assertEqual(first["evicted"], [])
+        second = state.build_items_for_js(list(range(10, 14)))
+        self.assertEqual(second["evicted"], [0, 1, 2, 3])
+        self.assertEqual(state.live_item_stats(), {"items": 10, "map_entries": 10})
+        names = [n for n in self.framework.api.callbacks if n.startswith("row_tap_")]
+        self.assertEqual(sorted(int(n.split("_")[2]) for n in names), list(range(4, 14)))
+
+    def test_rebuilding_an_index_replaces_it(self):
+        state = self.make_list(initial=0)
+        state.build_items_for_js([7])
+        state.build_items_for_js([7])
+        self.assertEqual(state.live_item_stats(), {"items": 1, "map_entries": 1})
+        self.assertEqual(len([n for n in self.framework.api.callbacks if n.startswith("row_tap_")]), 1)
+
+    def test_css_is_keyed_by_class(self):
+        self.widget = VirtualListView(
+            key=Key("styled"), controller=VirtualListController(), itemCount=100,
+            itemBuilder=lambda i: Text(str(i), style=TextStyle(color="red" if i % 2 else "blue")),
+            itemExtent=20, initialItemCount=1,
+        )
+        state = self.widget.get_state()
+        initial = state._virtualization_options["initialItems"][0]["css"]
+        batch = state.build_items_for_js([1, 2, 3])["css"]
+        # One rule per class however many items share it, so the engine can skip classes it has.
+        self.assertEqual(len(batch), 2)
+        self.assertTrue(set(initial) < set(batch))
+        for css_class, rule in batch.items():
+            self.assertIn(f".{css_class}", rule)
+
+    def test_dispose_releases_everything(self):
+        state = self.make_list()
+        state.dispose()
+        self.assertEqual(state.live_item_stats(), {"items": 0, "map_entries": 0})
+        self.assertFalse([n for n in self.framework.api.callbacks if n.startswith("row_tap_")])
+
+
+class TestVariableExtent(VirtualListTestCase):
+    def test_fixed_extent_by_default(self):
+        options = self.make_list(initial=0)._virtualization_options
+        self.assertFalse(options["variableExtent"])
+        self.assertNotIn("extents", self.widget.get_state().build_items_for_js([1]))
+
+    def test_extent_builder_sizes_travel_with_items(self):
+        state = self.make_list(initial=2, itemExtentBuilder=lambda i: 20 + i % 3 * 10)
+        options = state._virtualization_options
+        self.assertTrue(options["variableExtent"])
+        self.assertEqual([options["initialItems"][i]["extent"] for i in range(2)], [20, 30])
+        self.assertEqual(state.build_items_for_js([4, 5])["extents"], {"4": 30, "5": 40})
+
+    def test_measured_mode_needs_no_builder(self):
+        options = self.make_list(initial=0, measureItems=True)._virtualization_options
+        self.assertTrue(options["variableExtent"])
+        self.assertTrue(options["measureItems"])
+
+
+class FakeWindow:
+    def __init__(self):
+        self.scripts = []
+
+    def evaluate_js(self, window_id, script):
+        self.scripts.append(script)
+
+
+class FakeScheduler:
+    def request(self):
+        pass
+
+
+def make_cycle_framework():
+    """A framework that can run `_process_reconciliation` against a FakeWindow."""
+    framework = make_framework()
+    framework.window, framework.id = FakeWindow(), "main"
+    framework.profiler = CycleProfiler()
+    framework.frame_scheduler = FakeScheduler()
+    framework._pending_state_updates = set()
+    framework._loaded_js_engines = set()
+    return framework
+
+
+class Label(Widget):
+    def __init__(self, text, key=None):
+        super().__init__(key=key)
+        self.text = text
+
+    def render_props(self):
+        return {"data": self.text}
+
+
+class Expandable(StatefulWidget):
+    def createState(self):
+        return ExpandableState()
+
+
+class ExpandableState(State):
+    disposed = 0
+
+    def initState(self):
+        self.lines = 1
+
+    def dispose(self):
+        ExpandableState.disposed += 1
+
+    def build(self):
+        return Label("row", key=None) if self.lines == 1 else _Column(
+            [Label(f"line {i}") for i in range(self.lines)]
+        )
+
+
+class _Column(Widget):
+    def __init__(self, children):
+        super().__init__(children=children)
+
+
+class CycleTestCase(VirtualListTestCase):
+    def setUp(self):
+        super().setUp()
+        self.framework = make_cycle_framework()
+        self.framework.api.clear_callbacks()
+        Widget.set_framework(self.framework)
+        StatefulWidget.set_framework(self.framework)
+
+    def mount(self, root):
+        self.framework.root_widget = root
+        tree = self.framework._build_widget_tree(root)
+        result = self.framework.reconciler.reconcile({}, tree, "root-container")
+        self.framework.reconciler.context_maps["main"] = result.new_rendered_map
+        self.framework.api.register_owned_callbacks(result.registered_callbacks, result.callback_owners)
+        self.framework._loaded_js_engines = self.framework._analyze_required_js_engines(tree, result)
+
+    def process(self):
+        self.framework._process_reconciliation()
+
+
+class TestItemLifecycle(CycleTestCase):
+    def test_evicting_a_grown_item_drops_everything_it_rendered(self):
+        ExpandableState.disposed = 0
+        items = {}
+
+        def build(index):
+            items[index] = Expandable(key=Key(f"row_{index}"))
+            return items[index]
+
+        self.widget = VirtualListView(
+            key=Key("feed"), controller=VirtualListController(), itemCount=100, itemBuilder=build, itemExtent=20,
+            initialItemCount=0, maxLiveItems=2,
+        )
+        state = self.widget.get_state()
+        state.build_items_for_js([0])
+        row = items[0].get_state()
+        row.lines = 3
+        row.setState()
+        self.process()
+        self.assertEqual(state.live_item_stats(), {"items": 1, "map_entries": 5})
+
+        state.build_items_for_js([1, 2])
+        self.assertEqual(state.live_item_stats(), {"items": 2, "map_entries": 4})
+        self.assertEqual(ExpandableState.disposed, 1)
+
+
+class TestListPageLifecycle(CycleTestCase):
+    def test_list_page_works_after_push_and_pop(self):
+        feed = VirtualListView(
+            key=Key("feed"), controller=VirtualListController(), itemCount=1000,
+            itemBuilder=lambda i: Row(i), itemExtent=20, initialItemCount=5,
+        )
+        navigator = Navigator(key=Key("nav"), initialRoute=PageRoute(lambda nav: feed, name="feed"))
+        self.mount(navigator)
+        state = feed.get_state()
+        builders = {state.item_builder_name, f"{state.item_builder_name}_batch"}
+        self.assertLessEqual(builders, set(self.framework.api.callbacks))
+
+        navigator.get_state().push(PageRoute(lambda nav: Label("details", key=Key("details")), name="details"))
+        self.process()
+        self.assertFalse(builders & set(self.framework.api.callbacks))
+
+        navigator.get_state().pop()
+        self.process()
+        self.assertIs(feed.get_state(), state)
+        self.assertIs(feed.controller._state, state)
+        self.assertLessEqual(builders, set(self.framework.api.callbacks))
+        self.assertEqual(state.live_item_stats(), {"items": 5, "map_entries": 5})
+        batch = self.framework.api.callbacks[f"{state.item_builder_name}_batch"]([40, 41])
+        self.assertEqual(sorted(batch["items"]), ["40", "41"])
+        taps = [name for name in self.framework.api.callbacks if name.startswith("row_tap_")]
+        self.assertEqual(len(taps), 5 + 2)
+
+
+class TestPageCache(VirtualListTestCase):
+    def test_cache_size_is_passed_to_the_engine(self):
+        self.assertEqual(self.make_list(initial=0)._virtualization_options["cacheSize"], 300)
+        self.assertIsNone(self.make_list(initial=0, cacheSize=None)._virtualization_options["cacheSize"])
+
+    def test_controller_requests_cache_stats(self):
+        self.framework.window, self.framework.id = FakeWindow(), "main"
+        state = self.make_list(initial=0)
+        received = []
+        self.widget.controller.requestCacheStats(received.append)
+        self.assertEqual(self.framework.window.scripts, ["window._pythra_instances['feed_vlist']?.reportCacheStats();"])
+        self.framework.api.on_list_cache_stats(state.item_builder_name, {"hits": 3})
+        self.assertEqual(received, [{"hits": 3}])
+
+
+class LongScrollMemoryBenchmark(VirtualListTestCase):
+    """Prints memory, map and callback sizes after fetching 6k rows in batches of 30."""
+
+    def test_memory_stays_flat(self):
+        state = self.make_list(max_live_items=200, initial=20)
+        tracemalloc.start()
+        start = time.perf_counter()
+        samples = []
+        for first in range(0, 6_000, 30):
+            state.build_items_for_js(list(range(first, first + 30)))
+            if first % 1_500 == 0:
+                samples.append(tracemalloc.get_traced_memory()[0])
+        elapsed = time.perf_counter() - start
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        stats = state.live_item_stats()
+        callbacks = len(self.framework.api.callbacks)
+        print(f"\n[virtual list memory benchmark] 6000 rows in {elapsed:.2f}s, "
+              f"live={stats}, callbacks={callbacks}, "
+              f"traced={current / 1024:.0f} KiB (peak {peak / 1024:.0f} KiB), "
+              f"samples={[round(s / 1024) for s in samples]} KiB")
+        self.assertEqual(stats, {"items": 200, "map_entries": 200})
+        self.assertLessEqual(callbacks, 200 + 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
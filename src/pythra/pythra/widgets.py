@@ -45,7 +45,6 @@ Column(children=[
 
 import html
 import json
-from .api import Api
 from .widgets_more import *
 from .base import *
 from .state import *
@@ -54,13 +53,38 @@ from .icons import *
 from .icons.base import IconData # Import the new data class
 from .controllers import *
 from .config import Config
+from .style_registry import SharedStyleTable
+from .page_resources import PAGE_ORIGIN
 import weakref
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
 
 
+def _api():
+    """The `Api` bridge singleton, imported on first use so widgets load without Qt."""
+    from .api import Api
+    return Api()
+
+
 config = Config()
 assets_dir = config.get('assets_dir', 'assets')
 port = config.get('assets_server_port')
+
+
+def _page_scheme() -> str:
+    """
+    The scheme the page is actually served with. The framework falls back to
+    'file' when pythra:// cannot be registered, so its value wins over config.
+    """
+    framework = Widget._framework_ref() if Widget._framework_ref else None
+    return getattr(framework, 'page_scheme', None) or config.get('page_scheme', 'file')
+
+
+def _asset_base_url() -> str:
+    """Where the page loads project assets from: the AssetServer, or pythra:// (`page_scheme: pythra`)."""
+    if _page_scheme() == 'pythra':
+        return f'{PAGE_ORIGIN}/assets'
+    return f'http://localhost:{port}'
 #Colors = Colors()
 
 
@@ -134,7 +158,7 @@ class Container(Widget):
     - decoration: Advanced styling (borders, shadows, etc.)
     - gradient: Animated gradient backgrounds
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Optional[Widget] = None,
@@ -186,7 +210,7 @@ class Container(Widget):
         ))
 
         if self.style_key not in Container.shared_styles:
-            self.css_class = f"shared-container-{len(Container.shared_styles)}"
+            self.css_class = f"shared-container-{Container.shared_styles.next_index()}"
             Container.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Container.shared_styles[self.style_key]
@@ -384,7 +408,7 @@ class Text(Widget):
     Text widget is smart about styling - if multiple Text widgets use the same style,
     they share the same CSS class to keep your app running fast!
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self, data: str, key: Optional[Key] = None, style=None, textAlign=None, overflow=None):
         super().__init__(key=key)
@@ -399,7 +423,7 @@ class Text(Widget):
         ))
 
         if self.style_key not in Text.shared_styles:
-            self.css_class = f"shared-text-{len(Text.shared_styles)}"
+            self.css_class = f"shared-text-{Text.shared_styles.next_index()}"
             Text.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Text.shared_styles[self.style_key]
@@ -512,7 +536,7 @@ class TextButton(Widget):
     - **style**: How the button should look (colors, padding, shape, etc.)
     - **onPressedName**: Custom name for the click handler (for debugging)
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  child: Widget, # Button usually requires a child (e.g., Text)
@@ -542,12 +566,12 @@ class TextButton(Widget):
         self.style_key = (make_hashable(self.style.to_css()),)
 
         if self.style_key not in TextButton.shared_styles:
-            self.css_class = f"shared-textbutton-{len(TextButton.shared_styles)}"
+            self.css_class = f"shared-textbutton-{TextButton.shared_styles.next_index()}"
             TextButton.shared_styles[self.style_key] = self.css_class
             # Register the actual callback function when the style/class is first created
             # This is one approach, another is during tree traversal in Framework
             if self.onPressed and self.onPressed_id:
-                Api().register_callback(self.onPressed_id, self.onPressed)
+                _api().register_callback(self.onPressed_id, self.onPressed)
                 # print(f"[TextButton] Registered callback '{self.onPressed_id}' on style creation.")
 
         else:
@@ -766,7 +790,7 @@ class ElevatedButton(Widget):
     **Visual hierarchy tip:**
     Use only ONE ElevatedButton per screen/section to maintain clear visual hierarchy!
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Widget,
@@ -799,11 +823,11 @@ class ElevatedButton(Widget):
         self.style_key = make_hashable(self.style) # Requires ButtonStyle -> hashable tuple/dict
 
         if self.style_key not in ElevatedButton.shared_styles:
-            self.css_class = f"shared-elevatedbutton-{len(ElevatedButton.shared_styles)}"
+            self.css_class = f"shared-elevatedbutton-{ElevatedButton.shared_styles.next_index()}"
             ElevatedButton.shared_styles[self.style_key] = self.css_class # type: ignore
             # Register callback - see note in TextButton about timing/location
             if self.onPressed and self.onPressed_id:
-                Api().register_callback(self.onPressed_id, self.onPressed)
+                _api().register_callback(self.onPressed_id, self.onPressed)
                 # print(f"[ElevatedButton] Registered callback '{self.onPressed_id}' on style creation.")
         else:
             self.css_class = ElevatedButton.shared_styles[self.style_key] # type: ignore
@@ -1076,7 +1100,7 @@ class IconButton(Widget):
     Always include a tooltip for IconButton to help users understand what it does!
     """
     # Class-level cache for mapping unique style definitions to a CSS class name.
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  icon: Widget,  # The Icon widget is the required child
@@ -1113,7 +1137,7 @@ class IconButton(Widget):
 
         # 2. Check the cache to reuse or create a new CSS class.
         if self.style_key not in IconButton.shared_styles:
-            self.css_class = f"shared-iconbutton-{len(IconButton.shared_styles)}"
+            self.css_class = f"shared-iconbutton-{IconButton.shared_styles.next_index()}"
             IconButton.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = IconButton.shared_styles[self.style_key]
@@ -1341,7 +1365,7 @@ class FloatingActionButton(Widget):
     FABs are lightweight and efficient since they're typically just a button with an icon.
     The floating positioning and shadows are handled efficiently by CSS.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Optional[Widget] = None, # Typically an Icon widget
@@ -1373,7 +1397,7 @@ class FloatingActionButton(Widget):
         self.style_key = make_hashable(self.style)
 
         if self.style_key not in FloatingActionButton.shared_styles:
-            self.css_class = f"shared-fab-{len(FloatingActionButton.shared_styles)}"
+            self.css_class = f"shared-fab-{FloatingActionButton.shared_styles.next_index()}"
             FloatingActionButton.shared_styles[self.style_key] = self.css_class # type: ignore
             # Register callback (Move to Framework recommended)
             # if self.onPressed and self.onPressed_id:
@@ -1623,7 +1647,7 @@ class SingleChildScrollView(Widget):
     Only use this for single widgets! For lists of items, use ListView which is optimized
     to only render visible items and can handle thousands of items efficiently.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Widget,
@@ -1656,7 +1680,7 @@ class SingleChildScrollView(Widget):
 
         # Use the standard pattern to get a shared CSS class
         if self.style_key not in SingleChildScrollView.shared_styles:
-            self.css_class = f"shared-scrollview-{len(SingleChildScrollView.shared_styles)}"
+            self.css_class = f"shared-scrollview-{SingleChildScrollView.shared_styles.next_index()}"
             SingleChildScrollView.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = SingleChildScrollView.shared_styles[self.style_key]
@@ -1802,7 +1826,7 @@ class GlobalScrollbarStyle(Widget):
     # Use a class-level cache to ensure the global style is only generated once
     # per unique theme. The key here can be simple, as there's only one global
     # scrollbar per window.
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self, key: Optional[Key] = None, theme: Optional[ScrollbarTheme] = None):
         # This widget has no children and renders nothing itself.
@@ -1818,7 +1842,7 @@ class GlobalScrollbarStyle(Widget):
         # triggering the static method.
         if self.style_key not in GlobalScrollbarStyle.shared_styles:
             # The class name is just a placeholder to trigger the generation
-            self.css_class = f"global-scrollbar-theme-{len(GlobalScrollbarStyle.shared_styles)}"
+            self.css_class = f"global-scrollbar-theme-{GlobalScrollbarStyle.shared_styles.next_index()}"
             GlobalScrollbarStyle.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = GlobalScrollbarStyle.shared_styles[self.style_key]
@@ -1957,7 +1981,7 @@ class Scrollbar(Widget):
     - For lists with hundreds or thousands of items, **virtualization is essential**. By providing `virtualization_options`, you switch to a mode that only renders the DOM nodes currently in view, resulting in massive performance gains and instant scrolling, regardless of list size.
     """
     # A class-level cache to share CSS for identical themes.
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Widget,
@@ -1990,7 +2014,7 @@ class Scrollbar(Widget):
         self.style_key = self.theme.to_tuple()
 
         if self.style_key not in Scrollbar.shared_styles:
-            self.css_class = f"simplebar-themed-{len(Scrollbar.shared_styles)}"
+            self.css_class = f"simplebar-themed-{Scrollbar.shared_styles.next_index()}"
             Scrollbar.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Scrollbar.shared_styles[self.style_key]
@@ -2189,7 +2213,7 @@ class Column(Widget):
     **Layout tip:**
     Column is perfect for mobile-first design since phones are taller than they are wide!
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  children: List[Widget], # Children are mandatory for Column usually
@@ -2228,7 +2252,7 @@ class Column(Widget):
         # Use shared_styles dictionary to manage CSS classes
         if self.style_key not in Column.shared_styles:
             # Assign a new shared class name if style combo is new
-            self.css_class = f"shared-column-{len(Column.shared_styles)}"
+            self.css_class = f"shared-column-{Column.shared_styles.next_index()}"
             Column.shared_styles[self.style_key] = self.css_class
         else:
             # Reuse existing class name for identical styles
@@ -2427,7 +2451,7 @@ class Row(Widget):
     **Layout tip:**
     Use Expanded widget around Row children to control how they share the available width!
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  children: List[Widget], # Children are usually expected for Row
@@ -2466,7 +2490,7 @@ class Row(Widget):
         # Use shared_styles dictionary to manage CSS classes
         if self.style_key not in Row.shared_styles:
             # Assign a new shared class name if style combo is new
-            self.css_class = f"shared-row-{len(Row.shared_styles)}"
+            self.css_class = f"shared-row-{Row.shared_styles.next_index()}"
             Row.shared_styles[self.style_key] = self.css_class
         else:
             # Reuse existing class name for identical styles
@@ -2595,7 +2619,7 @@ class AssetImage:
         # Basic check for leading slashes
         clean_file_name = file_name.lstrip('/')
         # TODO: Add more robust path joining and sanitization
-        self.src = f'http://localhost:{port}/{clean_file_name}'
+        self.src = f'{_asset_base_url()}/{clean_file_name}'
         # print("Asset image src: ", self.src)
 
     def get_source(self) -> str:
@@ -2619,7 +2643,7 @@ class AssetIcon:
         # Basic check for leading slashes
         clean_file_name = file_name.lstrip('/')
         # TODO: Add more robust path joining and sanitization
-        self.src = f'http://localhost:{port}/{assets_dir}/icons/{clean_file_name}'
+        self.src = f'{_asset_base_url()}/{assets_dir}/icons/{clean_file_name}'
 
     def get_source(self) -> str:
         return self.src
@@ -2762,7 +2786,7 @@ class Image(Widget):
     **Performance tip:**
     Always specify width and height to prevent layout jumps while images load!
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  image: Union[AssetImage, NetworkImage], # Image source object
@@ -2799,7 +2823,7 @@ class Image(Widget):
         )
 
         if self.style_key not in Image.shared_styles:
-            self.css_class = f"shared-image-{len(Image.shared_styles)}"
+            self.css_class = f"shared-image-{Image.shared_styles.next_index()}"
             Image.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Image.shared_styles[self.style_key]
@@ -2967,7 +2991,7 @@ class Icon(Widget):
     Icons are vector-based and super lightweight - use them liberally!
     They're much more efficient than image files for simple symbols.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  icon: IconData, # The required IconData object
@@ -3010,7 +3034,7 @@ class Icon(Widget):
         )
 
         if self.style_key not in Icon.shared_styles:
-            self.css_class = f"material-icon-{len(Icon.shared_styles)}"
+            self.css_class = f"material-icon-{Icon.shared_styles.next_index()}"
             Icon.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Icon.shared_styles[self.style_key]
@@ -3156,6 +3180,13 @@ class _VirtualListViewState(State):
         super().__init__()
         self.item_builder_name = None
         self._virtualization_options = None
+        # Items live in the list's own reconciler context, not the main map.
+        # index -> rendered-map key of that item's root, oldest build first.
+        self._context_key = None
+        self._list_key = None
+        self._live_items: "OrderedDict[int, Any]" = OrderedDict()
+        # Indices evicted since the last batch; JS drops their cached HTML.
+        self._evicted_indices: List[int] = []
 
     def initState(self):
         """
@@ -3170,8 +3201,26 @@ class _VirtualListViewState(State):
             widget.controller._attach(self) # type: ignore
 
         # --- MOVE ALL SETUP LOGIC HERE ---
+        self._context_key = f"vlist:{widget.key.value}" # type: ignore
+        self._list_key = widget.get_unique_id()
+        if self.framework:
+            # A rebuilt parent creates a fresh state for the same list; start from an empty window.
+            self.framework.reconciler.clear_context(self._context_key)
         self.item_builder_name = f"vlist_item_builder_{widget.key.value}" # type: ignore
-        Api().register_callback(self.item_builder_name, self.build_item_for_js)
+        self._prepare_list(widget)
+
+        # --- END OF MOVED LOGIC ---
+
+    def _prepare_list(self, widget):
+        """
+        Registers the item builder callbacks and pre-renders the initial items.
+        Runs from initState, and again from build() when the list comes back
+        after leaving the tree (e.g. its Navigator page was pushed over and
+        popped back to), since its callbacks were released when it left.
+        """
+        _api().register_callback(self.item_builder_name, self.build_item_for_js, owner=widget.get_unique_id())
+        # Batch variant looked up by the `build_list_items` slot: one bridge call per range.
+        _api().register_callback(f"{self.item_builder_name}_batch", self.build_items_for_js, owner=widget.get_unique_id())
 
         # Pre-render the initial items once during initialization.
         initial_items_html = {}
@@ -3183,19 +3232,33 @@ class _VirtualListViewState(State):
             "itemCount": widget.itemCount, # type: ignore
             "itemExtent": widget.itemExtent, # type: ignore
             "itemBuilderName": self.item_builder_name,
-            "initialItems": initial_items_html
+            "initialItems": initial_items_html,
+            "overscan": widget.overscan, # type: ignore
+            "prefetch": widget.prefetch, # type: ignore
+            "batchSize": widget.batchSize, # type: ignore
+            # itemExtent becomes the estimate for rows whose real size is not known yet.
+            "variableExtent": bool(widget.itemExtentBuilder or widget.measureItems), # type: ignore
+            "measureItems": widget.measureItems, # type: ignore
+            "cacheSize": widget.cacheSize, # type: ignore
         }
 
-        # --- END OF MOVED LOGIC ---
-
     
     def dispose(self):
         # Clean up the controller link to prevent memory leaks
         widget = self.get_widget()
-        if widget and widget.controller: # type: ignore
+        if widget and widget.controller and widget.controller._state is self: # type: ignore
             widget.controller._detach() # type: ignore
+        self._release_items()
         super().dispose()
 
+    def _release_items(self):
+        """Drops every live item's map entries and callbacks along with the context."""
+        if self.framework:
+            for index in list(self._live_items):
+                self._evict_item(index, report=False)
+            self.framework.reconciler.clear_context(self._context_key)
+        self._evicted_indices.clear()
+
 
     def refresh_js(self, indices: Optional[List[int]] = None):
         """
@@ -3218,6 +3281,22 @@ class _VirtualListViewState(State):
 
         self.framework.window.evaluate_js(self.framework.id, js_command)
 
+    def request_cache_stats_js(self, callback: Callable[[Dict[str, Any]], None]):
+        """
+        Asks the JS engine to report its item-cache statistics; they arrive via
+        the `on_list_cache_stats` slot and are passed to `callback`.
+        """
+        widget = self.get_widget()
+        if not (self.framework and self.framework.window and widget):
+            return
+        self.framework.api.register_callback(
+            f"{self.item_builder_name}_cache_stats", callback, owner=widget.get_unique_id()
+        )
+        instance_name = f"{widget.key.value}_vlist" # type: ignore
+        self.framework.window.evaluate_js(
+            self.framework.id, f"window._pythra_instances['{instance_name}']?.reportCacheStats();"
+        )
+
 
     def build_item_for_js(self, index: int) -> Dict[str, Any]:
         """
@@ -3226,34 +3305,133 @@ class _VirtualListViewState(State):
         widget = self.get_widget()
         # The check for widget and framework is still good practice here.
         if not widget or not self.framework:
-            return {"html": "<div>Error</div>", "css": "", "callbacks": {}}
-            
+            return {"html": "<div>Error</div>", "css": {}, "callbacks": {}}
+
+        html_string, css_details, callbacks = self._build_item(widget, index)
+        payload = {
+            "html": html_string,
+            "css": self._css_for_details(css_details),
+            "callback_names": list(callbacks.keys()),
+            "evicted": self._take_evicted(),
+        }
+        if widget.itemExtentBuilder: # type: ignore
+            payload["extent"] = widget.itemExtentBuilder(index) # type: ignore
+        return payload
+
+    def build_items_for_js(self, indices: List[int]) -> Dict[str, Any]:
+        """
+        Batch form of `build_item_for_js`, called through the `build_list_items`
+        slot with every index the JS engine is missing (visible range, overscan
+        and prefetch). Returns `{"items": {"<index>": html}, "css": {class: rule},
+        "evicted": [...]}` with the CSS for all items de-duplicated by class, and
+        the indices whose callbacks were dropped (see `_trim_window`).
+        With an `itemExtentBuilder`, `"extents": {"<index>": px}` carries the
+        real size of every built item.
+        """
+        widget = self.get_widget()
+        if not widget or not self.framework:
+            return {"items": {}, "css": {}, "evicted": []}
+
+        items: Dict[str, str] = {}
+        css_details: Dict[str, Tuple[Callable, Any]] = {}
+        for index in indices:
+            index = int(index)
+            if not 0 <= index < widget.itemCount: # type: ignore
+                continue
+            html_string, details, _ = self._build_item(widget, index)
+            items[str(index)] = html_string
+            css_details.update(details)
+        evicted = [i for i in self._take_evicted() if str(i) not in items]
+        payload = {"items": items, "css": self._css_for_details(css_details), "evicted": evicted}
+        if widget.itemExtentBuilder: # type: ignore
+            payload["extents"] = {key: widget.itemExtentBuilder(int(key)) for key in items} # type: ignore
+        return payload
+
+    def _css_for_details(self, css_details: Dict[str, Tuple[Callable, Any]]) -> Dict[str, str]:
+        # Keyed by class so the JS engine adds each class's rule to the list's
+        # <style> once, however many batches repeat it.
+        # Reuse the stylesheet manager's per-(class, style_key) rule cache.
+        rule_for = self.framework.css_manager.rule_for
+        rules = {css_class: rule_for(css_class, generator, style_key) for css_class, (generator, style_key) in css_details.items()}
+        return {css_class: rule for css_class, rule in rules.items() if rule}
+
+    def _build_item(self, widget, index: int):
+        """
+        Builds and reconciles one item into the list's own context. Returns
+        (html, css_details, callbacks).
+
+        Every node key of the item is linked (via `Api.link_owner`) under the
+        item's owner `(list key, index)`, which is linked under the list key, so
+        evicting the item or removing the list releases all of its callbacks.
+        """
         widget_to_build = widget.itemBuilder(index) # type: ignore
         built_tree = self.framework._build_widget_tree(widget_to_build)
-        
-        main_context_map = self.framework.reconciler.get_map_for_context("main")
+
+        # A rebuilt index (e.g. after refreshItem) replaces its previous entries.
+        self._evict_item(index, report=False)
         result = self.framework.reconciler.reconcile(
-            previous_map=main_context_map,
+            previous_map={},
             new_widget_root=built_tree,
             parent_html_id='__limbo__',
             is_partial_reconciliation=True
         )
-        
-        main_context_map.update(result.new_rendered_map)
-        
+        context_map = self.framework.reconciler.get_map_for_context(self._context_key)
+        context_map.update(result.new_rendered_map)
+
+        api = self.framework.api
+        item_owner = (self._list_key, index)
+        api.link_owner(item_owner, self._list_key)
+        for key, entry in result.new_rendered_map.items():
+            api.link_owner(key, entry.get("parent_key") or item_owner)
+        callbacks = result.registered_callbacks
+        api.register_owned_callbacks(callbacks, result.callback_owners, default_owner=item_owner)
+
         root_key = built_tree.get_unique_id() if built_tree else None
+        if root_key is not None:
+            self._live_items[index] = root_key
+        self._trim_window(widget.maxLiveItems) # type: ignore
+
         html_string = self.framework._generate_html_from_map(root_key, result.new_rendered_map)
-        css_string = self.framework._generate_css_from_details(result.active_css_details)
-        callbacks = result.registered_callbacks
-        
-        for name, func in callbacks.items():
-            self.framework.api.register_callback(name, func)
+        return html_string, result.active_css_details, callbacks
 
-        return {
-            "html": html_string,
-            "css": css_string,
-            "callback_names": list(callbacks.keys())
-        }
+    def _trim_window(self, max_live_items: int):
+        """Evicts the oldest-built items beyond `max_live_items`."""
+        while len(self._live_items) > max_live_items:
+            self._evict_item(next(iter(self._live_items)))
+
+    def _evict_item(self, index: int, report: bool = True):
+        """
+        Drops one item's context-map entries, style references and callbacks,
+        and disposes its States. The subtree is read from the live context map,
+        so nodes a setState inside the item added since its first build go too.
+        """
+        root_key = self._live_items.pop(index, None)
+        if root_key is None:
+            return
+        context_map = self.framework.reconciler.get_map_for_context(self._context_key)
+        keys, stack = [], [root_key]
+        while stack:
+            key = stack.pop()
+            entry = context_map.pop(key, None)
+            if entry is None:
+                continue
+            keys.append(key)
+            stack.extend(entry.get("children_keys", []))
+            self.framework._dispose_removed_entry(entry)
+        # Only nodes that were re-rendered by a setState inside the item hold references.
+        self.framework.css_manager.release_entries(keys)
+        self.framework.api.release_owner((self._list_key, index))
+        if report:
+            self._evicted_indices.append(index)
+
+    def _take_evicted(self) -> List[int]:
+        evicted, self._evicted_indices = self._evicted_indices, []
+        return evicted
+
+    def live_item_stats(self) -> Dict[str, int]:
+        """Live items and rendered-map entries held by this list, for memory checks."""
+        context_map = self.framework.reconciler.get_map_for_context(self._context_key) if self.framework else {}
+        return {"items": len(self._live_items), "map_entries": len(context_map)}
 
 
     def build(self) -> Widget:
@@ -3267,8 +3445,10 @@ class _VirtualListViewState(State):
             # Return a placeholder if the widget is somehow gone
             return Container(width=0, height=0)
 
-
-        # The options are now guaranteed to exist because initState ran first.
+        if self.framework and self.item_builder_name not in self.framework.api.callbacks:
+            # Released while the list was out of the tree: its items are stale.
+            self._release_items()
+            self._prepare_list(widget)
         return Scrollbar(
             key=widget.key, 
             width=widget.width, # type: ignore
@@ -3310,7 +3490,7 @@ class VirtualListView(StatefulWidget):
     **Key Concepts:**
     1.  **Virtualization**: The core technique. Only visible items exist in the DOM, keeping the app fast and lightweight.
     2.  **`itemBuilder`**: A function you provide that acts as a factory. The list calls it on-demand with an `index` to get the widget for that specific item.
-    3.  **`itemExtent`**: The fixed height (for vertical lists) of each item. This is **crucial** for the virtualization logic to calculate which items should be visible and where to position the scrollbar. All items *must* have the same size.
+    3.  **`itemExtent`**: The fixed height (for vertical lists) of each item. This is **crucial** for the virtualization logic to calculate which items should be visible and where to position the scrollbar. Rows of different heights need `itemExtentBuilder` or `measureItems`, in which case `itemExtent` is the estimate for rows not yet seen.
     4.  **`VirtualListController`**: An object you create to programmatically control the list, such as forcing it to refresh its data.
 
     **Examples:**
@@ -3344,11 +3524,32 @@ class VirtualListView(StatefulWidget):
     - **controller**: A **required** `VirtualListController` instance to manage the list.
     - **itemCount**: The total number of items in the list.
     - **itemBuilder**: A function that takes an `int` (index) and returns a `Widget`.
-    - **itemExtent**: The fixed size (usually height) in pixels of each item.
+    - **itemExtent**: The fixed size (usually height) in pixels of each item, or the
+      estimated size when `itemExtentBuilder` or `measureItems` is used.
     - **theme**: An optional `ScrollbarTheme` for the scrollbar's appearance.
     - **width**, **height**: The dimensions of the scrollable container.
+    - **overscan**: Items kept rendered beyond each edge of the viewport (default 3).
+    - **prefetch**: Extra items fetched ahead in the scroll direction (default 10).
+    - **batchSize**: Maximum items requested from Python in one bridge call (default 50).
+    - **maxLiveItems**: How many built items keep their rendered-map entries and callbacks
+      alive (default 500). Older items are evicted and rebuilt if scrolled back into view.
+    - **itemExtentBuilder**: Optional `Callable[[int], float]` returning the size of the item
+      at an index, for lists whose rows differ in height. It is called as items are built,
+      and `itemExtent` is used as the estimate for rows that have not been built yet.
+    - **measureItems**: If True, rows size themselves and the page measures each one after
+      it renders (use when heights are not known in Python, e.g. wrapped chat messages).
+      `itemExtent` is again the estimate. Either way the first visible row stays anchored
+      while estimates are corrected, so the content does not jump.
+    - **cacheSize**: How many items' HTML the page keeps (least recently used are dropped
+      first; default 300, `None` for no limit). Keep it at or below `maxLiveItems`, since
+      items evicted in Python are dropped from the page cache anyway. Use
+      `controller.requestCacheStats(callback)` to see the hit and miss counts.
 
     **Performance notes:**
+    Missing items are fetched in batches through one `build_list_items` call, and
+    queued requests for items that scrolled away before being sent are dropped.
+    Variable-height rows are positioned from a Fenwick tree of item extents, so finding
+    the row at a scroll offset is O(log n) even for a million rows.
     This is the definitive solution for performance with large lists. Its memory and CPU usage
     remain flat and low, regardless of whether `itemCount` is 100 or 1,000,000, because it
     only ever renders a small, constant number of DOM elements.
@@ -3363,13 +3564,27 @@ class VirtualListView(StatefulWidget):
                  initialItemCount: int = 20,
                  theme: Optional[ScrollbarTheme] = None,
                  width: Optional[Any] = '100%',
-                 height: Optional[Any] = '100%'):
+                 height: Optional[Any] = '100%',
+                 overscan: int = 3,
+                 prefetch: int = 10,
+                 batchSize: int = 50,
+                 maxLiveItems: int = 500,
+                 itemExtentBuilder: Optional[Callable[[int], float]] = None,
+                 measureItems: bool = False,
+                 cacheSize: Optional[int] = 300):
 
         self.controller = controller
         self.itemCount = itemCount
         self.itemBuilder = itemBuilder
         self.itemExtent = itemExtent
         self.initialItemCount = initialItemCount
+        self.overscan = overscan
+        self.prefetch = prefetch
+        self.batchSize = batchSize
+        self.maxLiveItems = maxLiveItems
+        self.itemExtentBuilder = itemExtentBuilder
+        self.measureItems = measureItems
+        self.cacheSize = cacheSize
         self.theme = theme
         self.width = width
         self.height = height
@@ -3448,7 +3663,7 @@ class ListView(Widget):
     building, laying out, and painting every widget can lead to a slow UI.
     **Always profile and switch to `VirtualListView` if performance suffers.**
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  children: List[Widget], # Children are core to ListView
@@ -3493,7 +3708,7 @@ class ListView(Widget):
         )
 
         if self.style_key not in ListView.shared_styles:
-            self.css_class = f"shared-listview-{len(ListView.shared_styles)}"
+            self.css_class = f"shared-listview-{ListView.shared_styles.next_index()}"
             ListView.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = ListView.shared_styles[self.style_key]
@@ -3670,7 +3885,7 @@ class GridView(Widget):
     **Performance notes:**
     Like `ListView`, the standard `GridView` renders all of its children at once. This is perfectly fine for dozens of items, but it can cause performance issues with hundreds or thousands of items. For very large grids, a virtualized version (`VirtualGridView`, if available) would be necessary to maintain a smooth user experience.
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  children: List[Widget], # Grid items
@@ -3722,7 +3937,7 @@ class GridView(Widget):
         )
 
         if self.style_key not in GridView.shared_styles:
-            self.css_class = f"shared-gridview-{len(GridView.shared_styles)}"
+            self.css_class = f"shared-gridview-{GridView.shared_styles.next_index()}"
             GridView.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = GridView.shared_styles[self.style_key]
@@ -3931,7 +4146,7 @@ class Stack(Widget):
     **Using with `Positioned`:**
     The true power of `Stack` is unlocked with the `Positioned` widget. Wrap any child of a `Stack` in `Positioned` and provide properties like `top`, `bottom`, `left`, or `right` to anchor it to the stack's edges.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  children: List[Widget],
@@ -3962,7 +4177,7 @@ class Stack(Widget):
         )
 
         if self.style_key not in Stack.shared_styles:
-            self.css_class = f"shared-stack-{len(Stack.shared_styles)}"
+            self.css_class = f"shared-stack-{Stack.shared_styles.next_index()}"
             Stack.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Stack.shared_styles[self.style_key]
@@ -4559,7 +4774,7 @@ class AppBar(Widget):
        slot wrappers like .appbar-leading, .appbar-title, .appbar-actions, .appbar-bottom
        which are styled by the generated CSS for predictable layout.
     """
-    shared_styles: Dict[Tuple, str] = {} # Class variable for shared CSS
+    shared_styles: SharedStyleTable = SharedStyleTable() # Class variable for shared CSS
 
     def __init__(self,
                  key: Optional[Key] = None,
@@ -4619,7 +4834,7 @@ class AppBar(Widget):
         )
 
         if self.style_key not in AppBar.shared_styles:
-            self.css_class = f"shared-appbar-{len(AppBar.shared_styles)}"
+            self.css_class = f"shared-appbar-{AppBar.shared_styles.next_index()}"
             AppBar.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = AppBar.shared_styles[self.style_key]
@@ -5014,7 +5229,7 @@ class BottomNavigationBar(Widget):
     - **elevation**: The z-axis elevation of the bar, which controls its shadow.
     - **height**: The height of the navigation bar container.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  items: List[BottomNavigationBarItem],
@@ -5094,7 +5309,7 @@ class BottomNavigationBar(Widget):
         )
 
         if self.style_key not in BottomNavigationBar.shared_styles:
-            self.css_class = f"shared-bottomnav-{len(BottomNavigationBar.shared_styles)}"
+            self.css_class = f"shared-bottomnav-{BottomNavigationBar.shared_styles.next_index()}"
             BottomNavigationBar.shared_styles[self.style_key] = self.css_class
              # Register callback centrally (Framework approach preferred)
              # if onTap and self.onTapName:
@@ -5245,7 +5460,7 @@ class Scaffold(Widget):
        .scaffold-scrim which are styled by generated CSS to ensure correct
        placement and interaction.
     """
-    shared_styles: Dict[Tuple, str] = {} # For Scaffold container styles
+    shared_styles: SharedStyleTable = SharedStyleTable() # For Scaffold container styles
 
     def __init__(self,
                  key: Optional[Key] = None,
@@ -5309,7 +5524,7 @@ class Scaffold(Widget):
         )
 
         if self.style_key not in Scaffold.shared_styles:
-            self.css_class = f"shared-scaffold-{len(Scaffold.shared_styles)}"
+            self.css_class = f"shared-scaffold-{Scaffold.shared_styles.next_index()}"
             Scaffold.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Scaffold.shared_styles[self.style_key]
@@ -5529,6 +5744,11 @@ class TextField(Widget):
     - **decoration**: InputDecoration that controls appearance (label, hints, colors, borders)
     - **obscureText**: True to hide text (for passwords)
     - **enabled**: False to make it read-only
+    - **debounceMs**: Wait this long after the last keystroke before sending the text to
+      Python (default: send on every keystroke). Blur and Enter send a pending value at once.
+    - **commitOn**: When the controller is updated: `'change'` (as you type, the default),
+      `'blur'` (when the field loses focus or on Enter) or `'submit'` (on Enter only).
+      Large forms stay responsive with `'blur'`, since typing causes no rebuilds.
     
     **Controller pattern:**
     TextField uses a "controller" to manage its content:
@@ -5560,7 +5780,7 @@ class TextField(Widget):
     3. **Validate input** and show errors using decoration.errorText
     4. **Consider accessibility** with proper labels and hints
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  # value: str,
@@ -5573,7 +5793,8 @@ class TextField(Widget):
                  trailing: Optional[Icon]= None,
                  enabled: bool = True,
                  obscureText: bool = False, # For passwords
-                 
+                 debounceMs: Optional[int] = None,
+                 commitOn: str = 'change',
                  ):
         
         super().__init__(key=key, children=[])
@@ -5582,27 +5803,31 @@ class TextField(Widget):
              raise TypeError("TextField requires a unique Key to preserve focus during rebuilds.")
         if not isinstance(controller, TextEditingController):
             raise TypeError("TextField requires a TextEditingController instance.")
+        if commitOn not in ('change', 'blur', 'submit'):
+            raise ValueError(f"TextField commitOn must be 'change', 'blur' or 'submit', got {commitOn!r}.")
 
         self.controller = controller
         self.decoration = decoration
         self.enabled = enabled
         self.obscureText = obscureText
         self.leading = leading
+        self.debounceMs = debounceMs
+        self.commitOn = commitOn
 
         # The name for the callback is now derived from the controller's object ID,
         # ensuring it's unique for each controller instance.
         self.onChangedName = f"ctrl_{id(self.controller)}"
         
-        # The actual callback function is a lambda that updates the controller.
-        # This is registered once with the API.
-        self.onChanged = lambda new_value: setattr(self.controller, 'text', new_value)
+        # The actual callback function updates the controller, remembering that the
+        # page already shows this text. This is registered once with the API.
+        self.onChanged = self.controller._set_from_client
         
         # --- CSS Class Management ---
         # The style key is now based entirely on the InputDecoration object.
         self.style_key = make_hashable(self.decoration)
 
         if self.style_key not in TextField.shared_styles:
-            self.css_class = f"shared-textfield-{len(TextField.shared_styles)}"
+            self.css_class = f"shared-textfield-{TextField.shared_styles.next_index()}"
             TextField.shared_styles[self.style_key] = self.css_class # type: ignore
         else:
             self.css_class = TextField.shared_styles[self.style_key] # type: ignore
@@ -5625,6 +5850,8 @@ class TextField(Widget):
         """Return properties needed by the Reconciler to generate HTML and JS."""
         return {
             'value': self.controller.text,
+            # Lets the reconciler skip echoing typed text back to the page.
+            'client_value': self.controller._client_text,
             'onChangedName': self.onChangedName,
             'onChanged': self.onChanged,
             'label': self.decoration.label,
@@ -5633,6 +5860,8 @@ class TextField(Widget):
             'errorText': '' if not self.decoration.errorText or None else self.decoration.errorText,
             'enabled': self.enabled,
             'obscureText': self.obscureText,
+            'debounceMs': self.debounceMs,
+            'commitOn': self.commitOn,
             'css_class': self.get_shared_css_class()#self.current_css_class,
         }
     
@@ -5664,7 +5893,14 @@ class TextField(Widget):
         # Get the error text, default to an empty string
         helper_text = props.get('errorText', '') 
         
-        on_input_handler = f"handleInput('{props.get('onChangedName', '')}', this.value)"
+        callback_name = props.get('onChangedName', '')
+        on_input_handler = f"handleInput('{callback_name}', this.value, this)"
+        # Blur and Enter flush a debounced value, and commit in 'blur' / 'submit' modes.
+        commit_handlers = (
+            f'onblur="commitInput(\'{callback_name}\', this, \'blur\')" '
+            f'onkeydown="if (event.key === \'Enter\') commitInput(\'{callback_name}\', this, \'submit\')" '
+            f'data-commit-on="{props.get("commitOn") or "change"}" data-debounce-ms="{props.get("debounceMs") or 0}"'
+        )
         input_type = "password" if props.get('obscureText', False) else "text"
         
         return f"""
@@ -5677,6 +5913,7 @@ class TextField(Widget):
                     value="{html.escape(str(props.get('value', '')), quote=True)}"
                     placeholder="{html.escape(str(props.get('placeholder', '')), quote=True)}"
                     oninput="{on_input_handler}"
+                    {commit_handlers}
                     {('disabled' if not props.get('enabled', True) else '').strip()}
                 >
                 <label for="{input_id}" class="textfield-label {css_class.replace('textfield-root-container', '')}">{html.escape(label_text) if label_text else ''}</label>
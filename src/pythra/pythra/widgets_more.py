@@ -42,7 +42,6 @@ import yaml
 import os
 import html
 import json
-from .api import Api
 from .base import *
 from .state import *
 from .styles import *
@@ -50,6 +49,7 @@ from .icons import *
 from .icons.base import IconData # Import the new data class
 from .controllers import *
 from .config import Config
+from .style_registry import SharedStyleTable
 from .events import TapDetails, PanUpdateDetails
 import weakref
 from typing import Any, Dict, List, Optional, Set, Tuple, Union, Callable
@@ -301,7 +301,7 @@ class Drawer(Widget):
     Keep drawer content organized and prioritize the most important navigation
     items at the top. Users' eyes naturally scan from top to bottom!
     """
-    shared_styles: Dict[Tuple, str] = {} # For shared Drawer styling
+    shared_styles: SharedStyleTable = SharedStyleTable() # For shared Drawer styling
 
     # Remove Singleton pattern (__new__) - Allow multiple instances
 
@@ -341,7 +341,7 @@ class Drawer(Widget):
         )
 
         if self.style_key not in Drawer.shared_styles:
-            self.css_class = f"shared-drawer-content-{len(Drawer.shared_styles)}" # Class for *content* styling
+            self.css_class = f"shared-drawer-content-{Drawer.shared_styles.next_index()}" # Class for *content* styling
             Drawer.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Drawer.shared_styles[self.style_key]
@@ -480,7 +480,7 @@ class EndDrawer(Widget):
     **Note on State:**
     You do not control the visibility of the `EndDrawer` directly with a boolean flag. The `Scaffold` manages its open/closed state internally. You interact with it programmatically through a `ScaffoldState` object.
     """
-    shared_styles: Dict[Tuple, str] = {} # For shared EndDrawer styling (if any distinct from Drawer)
+    shared_styles: SharedStyleTable = SharedStyleTable() # For shared EndDrawer styling (if any distinct from Drawer)
 
     # Remove Singleton pattern (__new__)
 
@@ -517,7 +517,7 @@ class EndDrawer(Widget):
 
         # Could reuse Drawer.shared_styles if styling is identical
         if self.style_key not in EndDrawer.shared_styles:
-            self.css_class = f"shared-enddrawer-content-{len(EndDrawer.shared_styles)}"
+            self.css_class = f"shared-enddrawer-content-{EndDrawer.shared_styles.next_index()}"
             EndDrawer.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = EndDrawer.shared_styles[self.style_key]
@@ -653,7 +653,7 @@ class BottomSheet(Widget):
     **Note on State:**
     Similar to a `Drawer`, the state (open/closed) of a `BottomSheet` is managed externally by its parent. You don't set an `is_open` property directly on the widget itself.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     # Remove Singleton pattern (__new__)
 
@@ -713,7 +713,7 @@ class BottomSheet(Widget):
         )
 
         if self.style_key not in BottomSheet.shared_styles:
-            self.css_class = f"shared-bottomsheet-{len(BottomSheet.shared_styles)}"
+            self.css_class = f"shared-bottomsheet-{BottomSheet.shared_styles.next_index()}"
             BottomSheet.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = BottomSheet.shared_styles[self.style_key]
@@ -887,7 +887,7 @@ class SnackBarAction(Widget):
     The styling of the `SnackBarAction` is heavily guided by Material Design principles to ensure it looks
     like a button and has adequate touch targets. You primarily control the label text and its color.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     # Remove Singleton pattern (__new__)
 
@@ -916,7 +916,7 @@ class SnackBarAction(Widget):
         )
 
         if self.style_key not in SnackBarAction.shared_styles:
-            self.css_class = f"shared-snackbar-action-{len(SnackBarAction.shared_styles)}"
+            self.css_class = f"shared-snackbar-action-{SnackBarAction.shared_styles.next_index()}"
             SnackBarAction.shared_styles[self.style_key] = self.css_class
             # Register callback centrally (Framework approach preferred)
             # if self.onPressed and self.onPressed_id:
@@ -1043,7 +1043,7 @@ class SnackBar(Widget):
     - **shapeRadius**: The roundness of the corners.
     - **elevation**: The z-axis elevation, which controls the shadow's prominence.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     # Remove Singleton pattern (__new__)
 
@@ -1102,7 +1102,7 @@ class SnackBar(Widget):
         )
 
         if self.style_key not in SnackBar.shared_styles:
-            self.css_class = f"shared-snackbar-{len(SnackBar.shared_styles)}"
+            self.css_class = f"shared-snackbar-{SnackBar.shared_styles.next_index()}"
             SnackBar.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = SnackBar.shared_styles[self.style_key]
@@ -1318,7 +1318,7 @@ class Center(Widget):
     - Empty states and placeholder content
     - Modal dialogs and popups
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  child: Widget, # Requires exactly one child
@@ -1336,7 +1336,7 @@ class Center(Widget):
         self.style_key = ('center-widget',) # Simple key, always the same style
 
         if self.style_key not in Center.shared_styles:
-            self.css_class = f"shared-center-{len(Center.shared_styles)}"
+            self.css_class = f"shared-center-{Center.shared_styles.next_index()}"
             Center.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Center.shared_styles[self.style_key]
@@ -1437,7 +1437,7 @@ class Placeholder(Widget):
     - **strokeWidth**: The thickness of the dashed border.
     - **fallbackText**: The text to display inside the placeholder box.
     """
-    shared_styles: Dict[Tuple, str] = {} # For the placeholder box style
+    shared_styles: SharedStyleTable = SharedStyleTable() # For the placeholder box style
 
     def __init__(self,
                  key: Optional[Key] = None,
@@ -1470,7 +1470,7 @@ class Placeholder(Widget):
         )
 
         if self.style_key not in Placeholder.shared_styles:
-            self.css_class = f"shared-placeholder-{len(Placeholder.shared_styles)}"
+            self.css_class = f"shared-placeholder-{Placeholder.shared_styles.next_index()}"
             Placeholder.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Placeholder.shared_styles[self.style_key]
@@ -2040,7 +2040,7 @@ class Flex(Widget):
     - **crossAxisAlignment**: How the children should be placed along the axis perpendicular to the `direction`. Options include `START`, `CENTER`, `END`, `STRETCH`.
     - **padding**: Optional `EdgeInsets` to create space around the flex container.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  children: List[Widget],
@@ -2072,7 +2072,7 @@ class Flex(Widget):
         )
 
         if self.style_key not in Flex.shared_styles:
-            self.css_class = f"shared-flex-{len(Flex.shared_styles)}"
+            self.css_class = f"shared-flex-{Flex.shared_styles.next_index()}"
             Flex.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Flex.shared_styles[self.style_key]
@@ -2190,7 +2190,7 @@ class Wrap(Widget):
     - **alignment**: How the children are aligned within a single run (e.g., `MainAxisAlignment.START`).
     - **runAlignment**: How the runs themselves are aligned within the `Wrap` (e.g., `MainAxisAlignment.CENTER`).
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  children: List[Widget],
@@ -2230,7 +2230,7 @@ class Wrap(Widget):
         )
 
         if self.style_key not in Wrap.shared_styles:
-            self.css_class = f"shared-wrap-{len(Wrap.shared_styles)}"
+            self.css_class = f"shared-wrap-{Wrap.shared_styles.next_index()}"
             Wrap.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Wrap.shared_styles[self.style_key]
@@ -2385,7 +2385,7 @@ class Dialog(Widget):
     - **shape**: The `BorderRadius` of the dialog's corners.
     - **barrierColor**: The color of the scrim that overlays the background content.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     # Remove Singleton pattern (__new__)
 
@@ -2460,7 +2460,7 @@ class Dialog(Widget):
         )
 
         if self.style_key not in Dialog.shared_styles:
-            self.css_class = f"shared-dialog-{len(Dialog.shared_styles)}"
+            self.css_class = f"shared-dialog-{Dialog.shared_styles.next_index()}"
             Dialog.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Dialog.shared_styles[self.style_key]
@@ -2802,7 +2802,7 @@ class ListTile(Widget):
     and `trailing` children. State changes (like `selected` or `disabled`) are handled by
     dynamically adding CSS classes, allowing for efficient and clean styling.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Optional[Key] = None,
@@ -2846,7 +2846,7 @@ class ListTile(Widget):
         self.style_key = (self.dense, make_hashable(self.contentPadding))
 
         if self.style_key not in ListTile.shared_styles:
-            self.css_class = f"shared-listtile-{len(ListTile.shared_styles)}"
+            self.css_class = f"shared-listtile-{ListTile.shared_styles.next_index()}"
             ListTile.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = ListTile.shared_styles[self.style_key]
@@ -3010,8 +3010,15 @@ class Slider(Widget):
     - **min**, **max**: The minimum and maximum values of the slider's range.
     - **divisions**: If set to an integer, the slider becomes discrete, snapping to a number of evenly spaced intervals.
     - **theme**: A `SliderTheme` object for comprehensive styling of the track, thumb, and overlay.
+    - **throttleMs**: Minimum time between drag updates sent to Python. The thumb always
+      follows the pointer in the page; updates are coalesced to at most one per animation
+      frame, and the release is always delivered (so `onChangeEnd` always fires).
+    - **commitOn**: `'drag'` (default) sends values while dragging, as above. `'end'` keeps
+      the whole drag in the page and sends only the released value, so `onChanged` and
+      `onChangeEnd` run once per drag. In both modes the thumb keeps its dragged position
+      until the rebuilt value arrives, so it never jumps back to an older value.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -3030,12 +3037,16 @@ class Slider(Widget):
                  thumbBorderColor: Optional[str] = None,
                  thumbBorderRadius: Optional[BorderRadius] = None,
                  # --- Theme ---
-                 theme: Optional[SliderTheme] = None):
+                 theme: Optional[SliderTheme] = None,
+                 throttleMs: Optional[int] = None,
+                 commitOn: str = 'drag'):
 
         super().__init__(key=key)
 
         if not isinstance(controller, SliderController):
             raise TypeError("Slider widget requires a SliderController instance.")
+        if commitOn not in ('drag', 'end'):
+            raise ValueError(f"Slider commitOn must be 'drag' or 'end', got {commitOn!r}.")
         
         # Initialize default theme if none provided
         theme = theme or SliderTheme()
@@ -3047,6 +3058,8 @@ class Slider(Widget):
         self.min = min
         self.max = max
         self.divisions = divisions
+        self.throttleMs = throttleMs
+        self.commitOn = commitOn
 
         # --- Style Precedence Logic ---
         # 1. Direct Prop > 2. Theme Prop > 3. Default
@@ -3077,7 +3090,7 @@ class Slider(Widget):
         )
         
         if self.style_key not in Slider.shared_styles:
-            self.css_class = f"shared-slider-{len(Slider.shared_styles)}"
+            self.css_class = f"shared-slider-{Slider.shared_styles.next_index()}"
             Slider.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Slider.shared_styles[self.style_key]
@@ -3116,7 +3129,11 @@ class Slider(Widget):
             "onDragName": self.on_drag_update_name,
             "onDrag": self._handle_drag_update,
             "isDragEnded" : isDragEnded,
-            "slider_options": { "min": self.min, "max": self.max, "onDragName": self.on_drag_update_name, "isDragEnded" : isDragEnded },
+            "slider_options": {
+                "min": self.min, "max": self.max, "onDragName": self.on_drag_update_name,
+                "isDragEnded" : isDragEnded, "throttleMs": self.throttleMs,
+                "commitOn": self.commitOn, "divisions": self.divisions,
+            },
             "style": { "--slider-percentage": f"{percentage}%" }
         }
 
@@ -3161,10 +3178,11 @@ class Slider(Widget):
         }}
         .{css_class} .slider-track {{ background-color: {inactive_color}; }}
         .{css_class} .slider-track-active {{
-            background-color: {active_color}; width: var(--slider-percentage, 0%);
+            background-color: {active_color};
+            width: var(--slider-drag-percentage, var(--slider-percentage, 0%));
         }}
         .{css_class} .slider-thumb {{
-            position: absolute; left: var(--slider-percentage, 0%);
+            position: absolute; left: var(--slider-drag-percentage, var(--slider-percentage, 0%));
             transform: translateX(-50%);
             width: {thumb_size}px;
             height: {thumb_size}px;
@@ -3302,7 +3320,7 @@ class Checkbox(Widget):
     This checkbox follows Material Design 3 guidelines with proper
     animations, ripple effects, and theming support.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -3348,7 +3366,7 @@ class Checkbox(Widget):
         )
 
         if self.style_key not in Checkbox.shared_styles:
-            self.css_class = f"shared-checkbox-{len(Checkbox.shared_styles)}"
+            self.css_class = f"shared-checkbox-{Checkbox.shared_styles.next_index()}"
             Checkbox.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Checkbox.shared_styles[self.style_key]
@@ -3585,7 +3603,7 @@ class Switch(Widget):
     Follows Material Design 3 guidelines with proper colors, animations,
     and interaction patterns for consistency across your app.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -3628,7 +3646,7 @@ class Switch(Widget):
         )
 
         if self.style_key not in Switch.shared_styles:
-            self.css_class = f"shared-switch-{len(Switch.shared_styles)}"
+            self.css_class = f"shared-switch-{Switch.shared_styles.next_index()}"
             Switch.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Switch.shared_styles[self.style_key]
@@ -3788,7 +3806,7 @@ class Radio(Widget):
     - **onChanged**: A callback function that is invoked with the radio's `value` when it is tapped.
     - **theme**: An optional `RadioTheme` to customize the colors and appearance.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -3831,7 +3849,7 @@ class Radio(Widget):
         )
 
         if self.style_key not in Radio.shared_styles:
-            self.css_class = f"shared-radio-{len(Radio.shared_styles)}"
+            self.css_class = f"shared-radio-{Radio.shared_styles.next_index()}"
             Radio.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Radio.shared_styles[self.style_key]
@@ -3983,7 +4001,7 @@ class Dropdown(Widget):
     - **hintText**: The placeholder text to display when no value is selected.
     - **theme**: An optional `DropdownTheme` for detailed styling of the button and the menu.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -4044,7 +4062,7 @@ class Dropdown(Widget):
                             self.dropdownMargin, self.itemPadding, self.dropDirection)
         
         if self.style_key not in Dropdown.shared_styles:
-            self.css_class = f"shared-dropdown-{len(Dropdown.shared_styles)}"
+            self.css_class = f"shared-dropdown-{Dropdown.shared_styles.next_index()}"
             Dropdown.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = Dropdown.shared_styles[self.style_key]
@@ -4263,8 +4281,11 @@ class GestureDetector(Widget):
     - **onDoubleTap**: Called when the user taps the same location twice in quick succession.
     - **onLongPress**: Called when the user holds their finger or mouse down for an extended period.
     - **onPanStart**, **onPanUpdate**, **onPanEnd**: A sequence of callbacks that fire when the user initiates, moves, and releases a drag gesture. `onPanUpdate` provides `PanUpdateDetails` with the delta (change in position).
+    - **throttleMs**: Minimum time between `onPanUpdate` calls. Pan updates are always
+      coalesced to at most one per animation frame, carrying the latest position; this
+      spaces them out further. The final update is always delivered before `onPanEnd`.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -4275,6 +4296,7 @@ class GestureDetector(Widget):
                  onPanStart: Optional[Callable[[], None]] = None,
                  onPanUpdate: Optional[Callable[[PanUpdateDetails], None]] = None,
                  onPanEnd: Optional[Callable[[], None]] = None,
+                 throttleMs: Optional[int] = None,
                  ):
 
         super().__init__(key=key, children=[child])
@@ -4286,6 +4308,7 @@ class GestureDetector(Widget):
         self.onPanStart = onPanStart
         self.onPanUpdate = onPanUpdate
         self.onPanEnd = onPanEnd
+        self.throttleMs = throttleMs
         
         # --- Unique callback names for this instance ---
         instance_id = id(self)
@@ -4303,7 +4326,7 @@ class GestureDetector(Widget):
         self.style_key = (has_tap, has_pan)
 
         if self.style_key not in GestureDetector.shared_styles:
-            self.css_class = f"shared-gesture-{len(GestureDetector.shared_styles)}"
+            self.css_class = f"shared-gesture-{GestureDetector.shared_styles.next_index()}"
             GestureDetector.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = GestureDetector.shared_styles[self.style_key]
@@ -4320,6 +4343,7 @@ class GestureDetector(Widget):
                 "onPanStartName": self.onPanStartName,
                 "onPanUpdateName": self.onPanUpdateName,
                 "onPanEndName": self.onPanEndName,
+                "throttleMs": self.throttleMs,
             },
             # Pass the actual callback functions for the reconciler to register
             "onTap": self.onTap,
@@ -4438,7 +4462,7 @@ class GradientBorderContainer(Widget):
     - **borderWidth**: The thickness of the gradient border in pixels.
     - **theme**: A `GradientBorderTheme` object that controls the `colors`, `direction`, `speed`, and animation `timing` of the gradient.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -4457,7 +4481,7 @@ class GradientBorderContainer(Widget):
         self.style_key = self.theme.to_tuple()
 
         if self.style_key not in GradientBorderContainer.shared_styles:
-            self.css_class = f"shared-gradient-border-{len(GradientBorderContainer.shared_styles)}"
+            self.css_class = f"shared-gradient-border-{GradientBorderContainer.shared_styles.next_index()}"
             GradientBorderContainer.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = GradientBorderContainer.shared_styles[self.style_key]
@@ -4606,7 +4630,7 @@ class GradientClipPathBorder(Widget):
     - **borderWidth**: The thickness of the animated gradient border in pixels.
     - **theme**: A `GradientBorderTheme` object that controls the `colors`, `direction`, `speed`, and animation `timing` of the gradient.
     """
-    shared_styles: Dict[Tuple, str] = {}
+    shared_styles: SharedStyleTable = SharedStyleTable()
 
     def __init__(self,
                  key: Key,
@@ -4631,7 +4655,7 @@ class GradientClipPathBorder(Widget):
         self.style_key = self.theme.to_tuple()
 
         if self.style_key not in GradientClipPathBorder.shared_styles:
-            self.css_class = f"shared-gradient-clip-{len(GradientClipPathBorder.shared_styles)}"
+            self.css_class = f"shared-gradient-clip-{GradientClipPathBorder.shared_styles.next_index()}"
             GradientClipPathBorder.shared_styles[self.style_key] = self.css_class
         else:
             self.css_class = GradientClipPathBorder.shared_styles[self.style_key]
@@ -0,0 +1,75 @@
+# pythra/window/scheme.py
+
+"""
+The `pythra://` URL scheme: serves the page from memory instead of file:// + localhost.
+
+`register_scheme()` has to run before the QApplication is created (webwidget
+does this on import); `install_scheme_handler()` then answers every
+`pythra://app/...` request from a `PageResources` store.
+"""
+
+from PySide6.QtCore import QBuffer, QByteArray, QFile, QIODevice
+from PySide6.QtWebEngineCore import (
+    QWebEngineProfile,
+    QWebEngineUrlRequestJob,
+    QWebEngineUrlScheme,
+    QWebEngineUrlSchemeHandler,
+)
+
+SCHEME_NAME = b"pythra"
+PAGE_URL = "pythra://app/index.html"
+
+
+def register_scheme() -> bool:
+    """Registers `pythra://` with Qt WebEngine. Returns False if this Qt build can't."""
+    try:
+        scheme = QWebEngineUrlScheme(SCHEME_NAME)
+        scheme.setSyntax(QWebEngineUrlScheme.Syntax.Host)
+        scheme.setFlags(
+            QWebEngineUrlScheme.Flag.SecureScheme           # Mixed-content rules treat it like https
+            | QWebEngineUrlScheme.Flag.LocalAccessAllowed   # The page may still reach file:// URLs
+            | QWebEngineUrlScheme.Flag.CorsEnabled          # Module scripts and fetch() work
+        )
+        QWebEngineUrlScheme.registerScheme(scheme)
+        return True
+    except Exception as e:
+        print(f"⚠️ PyThra | Could not register the pythra:// scheme: {e}")
+        return False
+
+
+class PythraSchemeHandler(QWebEngineUrlSchemeHandler):
+    """Answers `pythra://app/<path>` requests from a PageResources store."""
+
+    def __init__(self, resources, parent=None):
+        super().__init__(parent)
+        self.resources = resources
+
+    def requestStarted(self, job):
+        resource = self.resources.lookup(job.requestUrl().path())
+        if resource is None:
+            job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+            return
+        # Both devices are parented to the job, so they are freed when the request finishes.
+        if resource.file_path is not None:
+            # Streamed from disk rather than read into memory. A QFile is seekable,
+            # so WebEngine can answer Range requests and media can seek.
+            device = QFile(str(resource.file_path), job)
+            if not device.open(QIODevice.OpenModeFlag.ReadOnly):
+                job.fail(QWebEngineUrlRequestJob.Error.UrlNotFound)
+                return
+        else:
+            device = QBuffer(job)
+            device.setData(QByteArray(resource.data))
+            device.open(QIODevice.OpenModeFlag.ReadOnly)
+        job.reply(resource.mime_type.encode("ascii"), device)
+
+
+def install_scheme_handler(resources, profile=None) -> PythraSchemeHandler:
+    """
+    Installs a handler for `pythra://` on `profile` (the default profile, which
+    the window's QWebEngineView uses). Keep a reference to the returned handler.
+    """
+    profile = profile or QWebEngineProfile.defaultProfile()
+    handler = PythraSchemeHandler(resources, parent=profile)
+    profile.installUrlSchemeHandler(SCHEME_NAME, handler)
+    return handler
@@ -85,13 +85,15 @@ from PySide6.QtGui import QShortcut, QKeySequence, QGuiApplication  # Keyboard s
 import sys                                      # System-specific parameters and functions
 import re                                       # Regular expressions for pattern matching
 import io                                       # Input/Output operations
-from contextlib import redirect_stdout, redirect_stderr  # Context managers for stream redirection
+from contextlib import redirect_stdout, redirect_stderr, nullcontext  # Context managers for stream redirection
 
 import threading
+import inspect
 import wmi
 import platform
 
 from .window_manager import SystemSleepManager 
+from .scheme import PAGE_URL, install_scheme_handler, register_scheme
 
 # =============================================================================
 # PYTHRA FRAMEWORK IMPORTS
@@ -276,6 +278,11 @@ def custom_message_handler(msg_type, context, message):
 # APPLICATION INITIALIZATION AND FILTERING SETUP
 # =============================================================================
 
+# 🌐 REGISTER THE pythra:// SCHEME
+# Custom URL schemes must be known to Qt WebEngine before the QApplication
+# exists. Framework only uses it with `page_scheme: pythra` (see window/scheme.py).
+SCHEME_AVAILABLE = register_scheme()
+
 # 🚀 CREATE THE MAIN APPLICATION INSTANCE
 # QApplication is the heart of any Qt application - it manages the event loop,
 # system resources, and provides the foundation for all GUI operations
@@ -391,10 +398,68 @@ class WindowManager:
             print(f"Window ID {window_id} not found.")
 
 
+# =============================================================================
+# BATCHED EVENT DISPATCH - One bridge call for many events
+# =============================================================================
+# `Api.dispatch_events` receives `[callback_id, kind, args]` envelopes. The kind
+# picks how `args` are passed to the callback, once, from this table, instead
+# of each slot (or `on_gesture_event`'s substring checks) working it out per call.
+
+def _call_with_args(callback, args):
+    return callback(*args)
+
+
+def _call_without_args(callback, args):
+    return callback()
+
+
+def _call_drag(callback, args):
+    value, drag_ended = args
+    return callback(float(value), bool(drag_ended))
+
+
+def _call_tap(callback, args):
+    return callback(TapDetails())
+
+
+def _call_pan_update(callback, args):
+    details = args[0] if args else {}
+    return callback(PanUpdateDetails(dx=details.get('dx', 0), dy=details.get('dy', 0)))
+
+
+EVENT_DISPATCH = {
+    "press": _call_with_args,       # on_pressed / on_pressed_str
+    "input": _call_with_args,       # on_input_changed: [value]
+    "drag": _call_drag,             # on_drag_update: [value, drag_ended]
+    "tap": _call_tap,               # GestureDetector onTap
+    "pan_update": _call_pan_update, # GestureDetector onPanUpdate: [{dx, dy}]
+    "gesture": _call_without_args,  # double tap, long press, pan start/end
+}
+
+
 class Api(QObject):
     def __init__(self):
+        # Api is a singleton; `Api()` elsewhere must not wipe the live registry.
+        if getattr(self, "_registry_ready", False):
+            return
         super().__init__()
         self.callbacks = {}
+        # Ownership: a callback lives while at least one owner (a widget key or
+        # html_id) still references it. Callbacks registered without an owner
+        # are never released automatically.
+        self._callback_owners = {}  # name -> set(owner)
+        self._owned_callbacks = {}  # owner -> set(name)
+        # Owners can be nested (see link_owner); releasing a parent releases its subtree.
+        self._owner_parent = {}  # owner -> parent owner
+        self._owner_children = {}  # parent owner -> set(owner)
+        self._released_callbacks = 0
+        # Wraps a dispatch_events batch; the Framework sets it to FrameScheduler.hold
+        # so every setState in the batch lands in one reconciliation cycle.
+        self.batch_updates = nullcontext
+        # Schedules coroutines returned by `async def` handlers; the Framework
+        # points it at its AsyncLoop (see background.py).
+        self.run_coroutine = None
+        self._registry_ready = True
 
     _instance = None
 
@@ -403,15 +468,145 @@ class Api(QObject):
             cls._instance = super(Api, cls).__new__(cls)
         return cls._instance
 
-    def register_callback(self, name, callback):
+    def _settle(self, result):
+        """
+        Hands the coroutine an `async def` handler returned to the async loop,
+        so the slot returns at once. Any other result is passed through.
+        """
+        if inspect.iscoroutine(result):
+            if self.run_coroutine is None:
+                from ..background import AsyncLoop
+                self.run_coroutine = AsyncLoop().create_task
+            self.run_coroutine(result)
+        return result
+
+    def register_callback(self, name, callback, owner=None):
         self.callbacks[name] = callback
+        if owner is not None:
+            self._callback_owners.setdefault(name, set()).add(owner)
+            self._owned_callbacks.setdefault(owner, set()).add(name)
         #print("Callbacks: ", self.callbacks)
 
+    def register_owned_callbacks(self, callbacks, owners, default_owner=None):
+        """
+        Registers a reconcile's `registered_callbacks`, each claimed by every key
+        in `owners[name]` (its `callback_owners`). Names come from `fn.__name__`,
+        so one name is often shared by several widgets; it stays registered
+        until the last of them is released.
+        """
+        for name, callback in callbacks.items():
+            name_owners = owners.get(name) or (default_owner,)
+            for owner in name_owners:
+                self.register_callback(name, callback, owner=owner)
+
+    def release_callback(self, name, owner):
+        """
+        Drops one owner's claim on `name` (e.g. a widget now using a different
+        handler), deleting the callback if no owner is left. Returns 1 if it was
+        deleted, else 0.
+        """
+        names = self._owned_callbacks.get(owner)
+        if not names or name not in names:
+            return 0
+        names.discard(name)
+        if not names:
+            del self._owned_callbacks[owner]
+        owners = self._callback_owners.get(name)
+        if owners is None:
+            return 0
+        owners.discard(owner)
+        if owners:
+            return 0
+        del self._callback_owners[name]
+        if self.callbacks.pop(name, None) is None:
+            return 0
+        self._released_callbacks += 1
+        return 1
+
+    def release_stale_callbacks(self, stale_callbacks):
+        """`release_callback` for a reconcile's `stale_callbacks` (owner -> names it dropped)."""
+        return sum(
+            self.release_callback(name, owner)
+            for owner, names in stale_callbacks.items()
+            for name in names
+        )
+
+    def link_owner(self, owner, parent):
+        """
+        Nests `owner` under `parent`, so `release_owner(parent)` also releases
+        `owner` (and anything nested under it). Used for widget trees that live
+        outside the main rendered map, e.g. VirtualListView items.
+        """
+        previous = self._owner_parent.get(owner)
+        if previous is not None and previous != parent:
+            self._unlink_owner(owner)
+        self._owner_parent[owner] = parent
+        self._owner_children.setdefault(parent, set()).add(owner)
+
+    def _unlink_owner(self, owner):
+        parent = self._owner_parent.pop(owner, None)
+        siblings = self._owner_children.get(parent)
+        if siblings is not None:
+            siblings.discard(owner)
+            if not siblings:
+                del self._owner_children[parent]
+
+    def release_owner(self, owner):
+        """
+        Drops `owner`'s claim on its callbacks, deleting each callback whose last
+        owner this was. Owners linked under it are released too. Returns how
+        many callbacks were deleted.
+        """
+        self._unlink_owner(owner)
+        released = 0
+        stack = [owner]
+        while stack:
+            current = stack.pop()
+            for child in self._owner_children.pop(current, ()):
+                self._owner_parent.pop(child, None)
+                stack.append(child)
+            released += self._release_own_callbacks(current)
+        self._released_callbacks += released
+        return released
+
+    def _release_own_callbacks(self, owner):
+        released = 0
+        for name in self._owned_callbacks.pop(owner, ()):
+            owners = self._callback_owners.get(name)
+            if owners is None:
+                continue
+            owners.discard(owner)
+            if not owners:
+                del self._callback_owners[name]
+                if self.callbacks.pop(name, None) is not None:
+                    released += 1
+        return released
+
+    def release_owners(self, owners):
+        """`release_owner` for every owner in `owners` (e.g. a reconcile's removed keys)."""
+        return sum(self.release_owner(owner) for owner in owners)
+
+    def callback_registry_stats(self):
+        """Debug view of the registry size, to check memory stays flat in long sessions."""
+        return {
+            "callbacks": len(self.callbacks),
+            "owned": len(self._callback_owners),
+            "unowned": len(self.callbacks) - len(self._callback_owners),
+            "owners": len(self._owned_callbacks),
+            "linked_owners": len(self._owner_parent),
+            "released": self._released_callbacks,
+        }
+
     def clear_callbacks(self):
         """Removes all registered callbacks."""
         #print("API: Clearing all callbacks.")
         debug_print("API: Clearing all callbacks.")
         self.callbacks.clear()
+        self._callback_owners.clear()
+        self._owned_callbacks.clear()
+        self._owner_parent.clear()
+        self._owner_children.clear()
+        self._released_callbacks = 0
 
     @Slot(str, int, result=str)
     @Slot(str, str, result=str)
@@ -419,7 +614,7 @@ class Api(QObject):
     def on_pressed(self, callback_name, *args):
         if callback_name in self.callbacks:
             for x in args[0]: f"webwiget arg: {x}"
-            self.callbacks[callback_name](*args)
+            self._settle(self.callbacks[callback_name](*args))
 
             return f"Callback '{callback_name}' executed successfully."
         else:
@@ -429,7 +624,7 @@ class Api(QObject):
     def on_pressed_str(self, callback_name):
         if callback_name in self.callbacks:
             # #print("callbacks: ", self.callbacks)
-            self.callbacks[callback_name]()
+            self._settle(self.callbacks[callback_name]())
 
             return f"Callback '{callback_name}' executed successfully."
         else:
@@ -445,7 +640,7 @@ class Api(QObject):
         if callback:
             try:
                 # The callback will be the state method (e.g., self.on_username_changed)
-                callback(value)
+                self._settle(callback(value))
             except Exception as e:
                 #print(f"Error executing input callback '{callback_name}': {e}")
                 debug_print(f"Error executing input callback '{callback_name}': {e}")
@@ -465,7 +660,7 @@ class Api(QObject):
         debug_print("callback drag_ended: ", drag_ended)
         if callback:
             try:
-                callback(value, drag_ended)
+                self._settle(callback(value, drag_ended))
             except Exception as e:
                 #print(f"Error executing slider callback '{callback_name}': {e}")
                 debug_print(f"Error executing slider callback '{callback_name}': {e}")
@@ -508,6 +703,72 @@ class Api(QObject):
             debug_print(f"Warning: Item builder '{builder_name}' not found.")
             return {"html": "<div>Builder not found</div>", "css": ""}
 
+    @Slot(str, 'QVariantList', result='QVariantMap')
+    def build_list_items(self, builder_name, indices):
+        """
+        Batch version of `build_list_item`: builds every requested index in one
+        bridge round trip. Returns `{"items": {"<index>": html}, "css": rules}`.
+        Uses the list's `<builder>_batch` callback when registered, otherwise
+        calls the single-item builder once per index.
+        """
+        batch = self.callbacks.get(f"{builder_name}_batch")
+        try:
+            if batch and callable(batch):
+                return batch([int(i) for i in indices])
+            callback = self.callbacks.get(builder_name)
+            if not (callback and callable(callback)):
+                debug_print(f"Warning: Item builder '{builder_name}' not found.")
+                return {"items": {}, "css": ""}
+            items, css = {}, []
+            for index in indices:
+                payload = callback(int(index))
+                items[str(int(index))] = payload.get("html", "")
+                if payload.get("css") and payload["css"] not in css:
+                    css.append(payload["css"])
+            return {"items": items, "css": "\n".join(css)}
+        except Exception as e:
+            debug_print(f"Error executing batch item builder '{builder_name}' for {len(indices)} items: {e}")
+            return {"items": {}, "css": ""}
+
+    @Slot(str, 'QVariantMap', result=None)
+    def on_list_cache_stats(self, builder_name, stats):
+        """
+        Receives a virtual list's item-cache statistics (size, capacity, hits,
+        misses, evictions, hitRate) and hands them to the
+        `<builder_name>_cache_stats` callback.
+        """
+        callback = self.callbacks.get(f"{builder_name}_cache_stats")
+        if callback:
+            try:
+                callback(dict(stats))
+            except Exception as e:
+                debug_print(f"Error handling cache stats for '{builder_name}': {e}")
+        else:
+            debug_print(f"Warning: No cache stats receiver for '{builder_name}'.")
+
+    @Slot('QVariantList', result=int)
+    def dispatch_events(self, events):
+        """
+        Runs a batch of `[callback_id, kind, args]` events in order (see
+        `EVENT_DISPATCH` for the kinds) and returns how many were dispatched.
+        All setState calls they make are flushed in one reconciliation cycle.
+        """
+        dispatched = 0
+        callbacks = self.callbacks
+        with self.batch_updates():
+            for event in events:
+                try:
+                    callback_id, kind, args = event
+                    callback = callbacks.get(callback_id)
+                    if callback is None:
+                        debug_print(f"Warning: Event callback '{callback_id}' not found.")
+                        continue
+                    self._settle(EVENT_DISPATCH[kind](callback, args or ()))
+                    dispatched += 1
+                except Exception as e:
+                    debug_print(f"Error dispatching event {event!r}: {e}")
+        return dispatched
+
     # --- ADD THIS NEW GENERIC SLOT ---
     @Slot(str, 'QVariantMap', result=None)
     def on_gesture_event(self, callback_name, details):
@@ -522,12 +783,12 @@ class Api(QObject):
                 # Based on the callback name, we can construct the correct data class.
                 if "pupdate" in callback_name:
                     # For PanUpdate, details is a dict {'dx': float, 'dy': float}
-                    callback(PanUpdateDetails(dx=details.get('dx', 0), dy=details.get('dy', 0)))
+                    self._settle(callback(PanUpdateDetails(dx=details.get('dx', 0), dy=details.get('dy', 0))))
                 elif "tap" in callback_name and "dbtap" not in callback_name:
-                    callback(TapDetails())
+                    self._settle(callback(TapDetails()))
                 else:
                     # For DoubleTap, LongPress, PanStart, PanEnd, no details are needed.
-                    callback()
+                    self._settle(callback())
             except Exception as e:
                 #print(f"Error executing gesture callback '{callback_name}': {e}")
                 debug_print(f"Error executing gesture callback '{callback_name}': {e}")
@@ -564,6 +825,7 @@ class WebWindow(QWidget):
         on_top=False,
         maximized=False,
         fixed_size=False,
+        url=None,
     ):
         super().__init__()
         self.setWindowTitle(title)
@@ -615,7 +877,11 @@ class WebWindow(QWidget):
         self.layout.setContentsMargins(0, 0, 0, 0)
         self.layout.addWidget(self.webview)
 
-        if html_file:
+        if url:
+            # e.g. pythra://app/index.html, served from memory
+            self.webview.setUrl(QUrl(url))
+            debug_print("⚡ Page loaded from:", url)
+        elif html_file:
             self.webview.setUrl(QUrl.fromLocalFile(html_file))
             # #print(js_api.callbacks)
             #print("⚡ HTML loaded:")
@@ -1039,6 +1305,7 @@ def create_window(
     frameless: bool = True,
     maximized: bool =False,
         fixed_size: bool =False,
+    url: str = None,
 ):
     window = WebWindow(
         title,
@@ -1051,7 +1318,7 @@ def create_window(
         frameless=frameless,
         maximized=maximized,
         fixed_size=fixed_size,
-        
+        url=url,
     )
     if maximized:
         window.show_max_window()
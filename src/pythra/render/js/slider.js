@@ -1,6 +1,17 @@
 /**
  * PythraSlider: A client-side engine for handling slider interactions.
  * This is now a proper JavaScript module class.
+ *
+ * The thumb follows the pointer locally on every move, but drag updates sent
+ * to Python are coalesced: at most one `on_drag_update` per animation frame
+ * (or per `throttleMs`, when set), carrying the latest value. The release is
+ * always delivered as a final update with `drag_ended = true`. With
+ * `commitOn: 'end'` nothing but the release is sent.
+ *
+ * While dragging, the thumb is positioned by `--slider-drag-percentage`, which
+ * takes precedence over the Python-owned `--slider-percentage`. The override is
+ * kept after release until Python's value lands (or `settleMs` passes), so a
+ * rebuild carrying an older value never pulls the thumb back.
  */
 export class PythraSlider { // <-- ADD 'export' HERE
     constructor(elementId, options) {
@@ -13,15 +24,33 @@ export class PythraSlider { // <-- ADD 'export' HERE
         console.log(`✅ PythraSlider engine is initializing for #${elementId}`);
 
         this.options = options;
-        this.dragBool = false;
-        
-        // ... THE REST OF THE FILE REMAINS EXACTLY THE SAME ...
+        this.dragging = false;
+
+        // --- Drag update coalescing ---
+        this.throttleMs = this.options.throttleMs || 0;
+        this.pendingValue = null;
+        this.lastPosition = null;
+        this.lastSentAt = 0;
+        this.flushHandle = null;
+        this.commitOn = this.options.commitOn || 'drag';
+        this.settleMs = this.options.settleMs ?? 1000;
+        this.committedPercentage = null;
+        this.settleTimer = null;
+
         this.track = this.container.querySelector('.slider-track');
         this.thumb = this.container.querySelector('.slider-thumb');
-        
+
         this.handleDragStart = this.handleDragStart.bind(this);
         this.handleDragMove = this.handleDragMove.bind(this);
         this.handleDragEnd = this.handleDragEnd.bind(this);
+        this.flush = this.flush.bind(this);
+        this.releaseOverride = this.releaseOverride.bind(this);
+
+        // Watch Python's writes to --slider-percentage to know when a commit has landed.
+        if (typeof MutationObserver !== 'undefined') {
+            this.observer = new MutationObserver(() => this.checkCommitted());
+            this.observer.observe(this.container, { attributes: true, attributeFilter: ['style'] });
+        }
 
         this.container.addEventListener('mousedown', this.handleDragStart);
         this.container.addEventListener('touchstart', this.handleDragStart, { passive: false });
@@ -29,13 +58,19 @@ export class PythraSlider { // <-- ADD 'export' HERE
 
     handleDragStart(event) {
         event.preventDefault();
+        this.dragging = true;
+        this.committedPercentage = null;
+        this.lastPosition = null;
+        clearTimeout(this.settleTimer);
         this.container.classList.add('active');
-        
+
         document.addEventListener('mousemove', this.handleDragMove);
         document.addEventListener('mouseup', this.handleDragEnd);
         document.addEventListener('touchmove', this.handleDragMove);
         document.addEventListener('touchend', this.handleDragEnd);
-
+        document.addEventListener('touchcancel', this.handleDragEnd);
+        // A release outside the window never reaches us; end the drag when focus goes.
+        window.addEventListener('blur', this.handleDragEnd);
 
         this.updatePosition(event);
     }
@@ -45,43 +80,119 @@ export class PythraSlider { // <-- ADD 'export' HERE
     }
 
     handleDragEnd(event) {
+        if (!this.dragging) return;
+        this.dragging = false;
         this.container.classList.remove('active');
-        
+
         document.removeEventListener('mousemove', this.handleDragMove);
         document.removeEventListener('mouseup', this.handleDragEnd);
         document.removeEventListener('touchmove', this.handleDragMove);
         document.removeEventListener('touchend', this.handleDragEnd);
-        // console.log("drag ended")
-        this.dragBool = true;
-        console.log("drag ended", this.dragBool, event);
-        this.updatePosition(event);
+        document.removeEventListener('touchcancel', this.handleDragEnd);
+        window.removeEventListener('blur', this.handleDragEnd);
+
+        // The release point when there is one, otherwise wherever the last move left the thumb.
+        const position = (event && this.positionFromEvent(event)) || this.lastPosition;
+        this.cancelFlush();
+        this.pendingValue = null;
+        if (!position) {
+            this.releaseOverride();
+            return;
+        }
+        this.container.style.setProperty('--slider-drag-percentage', `${position.percentage}%`);
+        this.send(position.value, true);
+        this.awaitCommit(position.percentage);
     }
 
-    updatePosition(event) {
-        if (!this.track) return;
+    /** Keeps the local thumb position until Python reports the committed value. */
+    awaitCommit(percentage) {
+        this.committedPercentage = percentage;
+        clearTimeout(this.settleTimer);
+        // Python may keep (or change) the value; stop waiting after `settleMs` either way.
+        this.settleTimer = setTimeout(this.releaseOverride, this.settleMs);
+        this.checkCommitted();
+    }
+
+    checkCommitted() {
+        if (this.dragging || this.committedPercentage === null) return;
+        const current = parseFloat(this.container.style.getPropertyValue('--slider-percentage'));
+        if (Math.abs(current - this.committedPercentage) < 0.01) this.releaseOverride();
+    }
+
+    releaseOverride() {
+        clearTimeout(this.settleTimer);
+        this.settleTimer = null;
+        this.committedPercentage = null;
+        if (!this.dragging) this.container.style.removeProperty('--slider-drag-percentage');
+    }
+
+    /** Maps a mouse/touch event to `{percentage, value}`, or null if it has no position. */
+    positionFromEvent(event) {
+        if (!this.track) return null;
+        const point = event.touches && event.touches.length ? event.touches[0]
+            : event.changedTouches && event.changedTouches.length ? event.changedTouches[0]
+            : event;
+        if (typeof point.clientX !== 'number') return null;
+
         const rect = this.track.getBoundingClientRect();
-        const clientX = event.touches ? event.touches[0].clientX : event.clientX;
-        
-        let positionX = clientX - rect.left;
-        let percentage = (positionX / rect.width) * 100;
-        
+        let percentage = ((point.clientX - rect.left) / rect.width) * 100;
         percentage = Math.max(0, Math.min(100, percentage));
-        
-        this.container.style.setProperty('--slider-percentage', `${percentage}%`);
-        console.log(percentage, this.options.onDragName);
-        
-        const range = this.options.max - this.options.min;
-        const newValue = this.options.min + (percentage / 100) * range;
-        console.log(percentage, this.options.onDragName, newValue);
-        
-        if (window.pywebview && this.options.onDragName) {
-            window.pywebview.on_drag_update(this.options.onDragName, newValue, this.dragBool);
+
+        const divisions = this.options.divisions;
+        if (divisions > 0) {
+            // Snap like Python does, so the committed value matches the thumb.
+            percentage = (Math.round((percentage / 100) * divisions) / divisions) * 100;
         }
-        if (this.dragBool){
-            console.log("hasDrag: Ended")
-            this.dragBool = false
-        } else {
-            console.log("dragging")
+
+        const range = this.options.max - this.options.min;
+        return { percentage, value: this.options.min + (percentage / 100) * range };
+    }
+
+    updatePosition(event) {
+        const position = this.positionFromEvent(event);
+        if (!position) return;
+        this.lastPosition = position;
+        // The thumb moves now; Python hears about it at most once per frame (or on release).
+        this.container.style.setProperty('--slider-drag-percentage', `${position.percentage}%`);
+        if (this.commitOn === 'end') return;
+        this.pendingValue = position.value;
+        this.scheduleFlush();
+    }
+
+    /**
+     * Queues one flush of the latest value: on the next animation frame, or
+     * once `throttleMs` has passed since the previous message.
+     */
+    scheduleFlush() {
+        if (this.flushHandle) return;
+        const wait = this.throttleMs - (performance.now() - this.lastSentAt);
+        this.flushHandle = wait > 0
+            ? { timer: setTimeout(this.flush, wait) }
+            : { frame: requestAnimationFrame(this.flush) };
+    }
+
+    cancelFlush() {
+        if (!this.flushHandle) return;
+        if (this.flushHandle.timer !== undefined) clearTimeout(this.flushHandle.timer);
+        else cancelAnimationFrame(this.flushHandle.frame);
+        this.flushHandle = null;
+    }
+
+    flush() {
+        this.flushHandle = null;
+        if (this.pendingValue === null) return;
+        const value = this.pendingValue;
+        this.pendingValue = null;
+        this.send(value, false);
+    }
+
+    send(value, dragEnded) {
+        this.lastSentAt = performance.now();
+        if (!this.options.onDragName) return;
+        if (window.pythraDispatch) {
+            window.pythraDispatch(this.options.onDragName, 'drag', [value, dragEnded]);
+        } else if (window.pywebview) {
+            window.pywebview.on_drag_update(this.options.onDragName, value, dragEnded);
         }
     }
 
@@ -90,5 +201,8 @@ export class PythraSlider { // <-- ADD 'export' HERE
         this.container.removeEventListener('mousedown', this.handleDragStart);
         this.container.removeEventListener('touchstart', this.handleDragStart);
         this.handleDragEnd();
+        this.cancelFlush();
+        clearTimeout(this.settleTimer);
+        if (this.observer) this.observer.disconnect();
     }
-}
\ No newline at end of file
+}